@@ -1,4 +1,4 @@
-by#!/usr/bin/env python
+#!/usr/bin/env python
 """
 Fetch patients from Tebra (formerly Kareo) via SOAP API.
 
@@ -9,8 +9,13 @@ Requirements:
     pip install zeep
 """
 
+import hashlib
+import json
 import os
-from time import sleep
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from time import monotonic, sleep
 
 from lxml import etree
 from zeep import Client
@@ -18,12 +23,14 @@ from zeep.exceptions import Fault, XMLParseError
 from zeep.helpers import serialize_object
 from zeep.plugins import HistoryPlugin
 
-from data_migrations.utils import fetch_from_json, write_to_json
+from data_migrations.utils import fetch_from_json
 
 
 RETRYABLE_RATE_LIMIT_SUBSTRING = "endpoint requested more than allowed"
 MAX_RETRIES = 5
 BACKOFF_SECONDS = 1.5
+MAX_BACKOFF_SECONDS = 60.0
+WORKERS = 4
 
 WSDL_URL = "https://webservice.kareo.com/services/soap/2.1/KareoServices.svc?wsdl"
 
@@ -567,6 +574,49 @@ def _extract_error_message(envelope: etree._Element | None) -> str | None:
     return matches[0] if matches else None
 
 
+class AdaptiveRateLimiter:
+    """
+    Spaces out calls shared by all workers and learns the allowed rate from Tebra's
+    rate limit faults: the interval between calls doubles on every fault and shrinks
+    back slowly (by `recovery`) on every successful call.
+    """
+
+    def __init__(
+        self,
+        initial_interval: float = 0.0,
+        min_interval: float = 0.0,
+        backoff_seconds: float = BACKOFF_SECONDS,
+        max_interval: float = MAX_BACKOFF_SECONDS,
+        recovery: float = 0.9,
+    ) -> None:
+        self.interval = initial_interval
+        self.min_interval = min_interval
+        self.backoff_seconds = backoff_seconds
+        self.max_interval = max_interval
+        self.recovery = recovery
+        self.next_call_at = monotonic()
+        self.lock = threading.Lock()
+
+    def wait(self) -> None:
+        with self.lock:
+            now = monotonic()
+            call_at = max(now, self.next_call_at)
+            self.next_call_at = call_at + self.interval
+        if call_at > now:
+            sleep(call_at - now)
+
+    def succeeded(self) -> None:
+        with self.lock:
+            self.interval = max(self.min_interval, self.interval * self.recovery)
+
+    def rate_limited(self) -> float:
+        """Slow down every worker and return the new interval between calls."""
+        with self.lock:
+            self.interval = min(self.max_interval, max(self.backoff_seconds, self.interval * 2))
+            self.next_call_at = max(self.next_call_at, monotonic() + self.interval)
+            return self.interval
+
+
 class TebraSoapClient:
     """Reusable SOAP client for interacting with the Tebra API."""
 
@@ -580,6 +630,7 @@ class TebraSoapClient:
         max_retries: int = MAX_RETRIES,
         backoff_seconds: float = BACKOFF_SECONDS,
         log_envelopes: bool | None = None,
+        workers: int = WORKERS,
     ) -> None:
         self.username = username
         self.password = password
@@ -593,8 +644,25 @@ class TebraSoapClient:
             if log_envelopes is not None
             else env_debug is not None and env_debug.lower() in {"1", "true", "yes"}
         )
-        self.history = HistoryPlugin()
-        self.client = Client(wsdl, plugins=[self.history])
+        self.workers = workers
+        self.rate_limiter = AdaptiveRateLimiter(backoff_seconds=backoff_seconds)
+        # zeep clients and their HistoryPlugin aren't thread safe, each worker gets its own
+        self.local = threading.local()
+        self._thread_state()
+
+    def _thread_state(self) -> threading.local:
+        if not hasattr(self.local, "client"):
+            self.local.history = HistoryPlugin()
+            self.local.client = Client(self.wsdl, plugins=[self.local.history])
+        return self.local
+
+    @property
+    def client(self) -> Client:
+        return self._thread_state().client
+
+    @property
+    def history(self) -> HistoryPlugin:
+        return self._thread_state().history
 
     def call(
         self,
@@ -625,9 +693,12 @@ class TebraSoapClient:
 
         while True:
             attempt += 1
+            self.rate_limiter.wait()
             try:
                 operation_fn = getattr(self.client.service, operation)
-                return operation_fn(request=request)
+                response = operation_fn(request=request)
+                self.rate_limiter.succeeded()
+                return response
             except XMLParseError as exc:
                 error_message = _extract_error_message(
                     self.history.last_received.get("envelope")
@@ -641,12 +712,11 @@ class TebraSoapClient:
                     and RETRYABLE_RATE_LIMIT_SUBSTRING in error_message
                     and attempt < max_attempts
                 ):
-                    backoff = self.backoff_seconds * attempt
+                    backoff = self.rate_limiter.rate_limited()
                     print(
                         f"Rate limit encountered for {operation} (attempt {attempt}/{max_attempts}). "
-                        f"Sleeping {backoff:.1f}s before retrying."
+                        f"Spacing calls {backoff:.1f}s apart before retrying."
                     )
-                    sleep(backoff)
                     print(f"Retrying {operation} (attempt {attempt}/{max_attempts})...")
                     continue
 
@@ -675,54 +745,151 @@ class TebraSoapClient:
         filters: list[dict] | None = None,
         fields: dict[str, bool] | None = None,
         operation: str,
-        special_data_name: str | None = None
-    ) -> list[dict]:
+        special_data_name: str | None = None,
+        workers: int | None = None,
+        stream: bool = False,
+    ):
         """
         Fetch data from Tebra SOAP API.
+
+        Each entry of `filters` is fetched as its own partition, up to `workers` at a time.
+        Finished partitions are checkpointed under PHI/<operation>s.parts/ so an interrupted
+        pull only refetches the partitions that hadn't completed. Once all are done they are
+        combined, in filter order, into PHI/<operation>s.jsonl with one record per line.
+
+        Returns a list of records, or a generator over the JSONL file when `stream` is set.
         """
-        output_file = f"PHI/{operation.lower()}s.json"
-        if os.path.exists(output_file):
-            print(f"Grabbing data from {output_file}")
-            return fetch_from_json(output_file)
-        
-        try:
-            data: list[dict] = []
-            iterable_filters = filters or [{}]
-            for request_payload in iterable_filters:
-                if isinstance(request_payload, dict) and any(
-                    key in request_payload for key in ("filter", "fields", "extra_request")
-                ):
-                    filter_payload = request_payload.get("filter")
-                    fields_payload = request_payload.get("fields", fields)
-                    extra_request = request_payload.get("extra_request")
-                else:
-                    filter_payload = request_payload
-                    fields_payload = fields
-                    extra_request = None
-
-                response = self.call(
-                    f"Get{operation}s",
-                    filter=filter_payload,
-                    fields=fields_payload,
-                    extra_request=extra_request,
+        output_file = f"PHI/{operation.lower()}s.jsonl"
+        legacy_output_file = f"PHI/{operation.lower()}s.json"
+        if os.path.exists(legacy_output_file) and not os.path.exists(output_file):
+            print(f"Grabbing data from {legacy_output_file}")
+            data = fetch_from_json(legacy_output_file)
+            return iter(data) if stream else data
+
+        if not os.path.exists(output_file):
+            try:
+                self._fetch_partitions(
+                    operation,
+                    filters or [{}],
+                    fields,
+                    special_data_name,
+                    output_file,
+                    workers or self.workers,
                 )
-                data_container = getattr(response, f"{operation}s", None)
-                if data_container is None and special_data_name:
-                    data_data = getattr(response, special_data_name, None)
-                else:
-                    data_data = getattr(data_container, special_data_name or f"{operation}Data", None)
-                if data_data:
-                    data.extend([serialize_object(item, dict) for item in data_data])
-            write_to_json(output_file, data)
-            print(f"Wrote {len(data)} data to {output_file}")
-            return data
-        except Fault as fault:
-            print(f"SOAP Fault: {fault}")
-            raise
-        except Exception as err:
-            print(f"Error: {err}")
-            raise
+            except Fault as fault:
+                print(f"SOAP Fault: {fault}")
+                raise
+            except Exception as err:
+                print(f"Error: {err}")
+                raise
+        else:
+            print(f"Grabbing data from {output_file}")
 
+        records = self.iter_jsonl(output_file)
+        return records if stream else list(records)
+
+    @staticmethod
+    def iter_jsonl(filename: str):
+        with open(filename, "r", encoding="utf-8") as file:
+            for line in file:
+                if line.strip():
+                    yield json.loads(line)
+
+    @staticmethod
+    def _partition_file(parts_dir: str, index: int, request_payload) -> str:
+        # the payload hash makes sure a changed filter list never reuses a stale partition
+        digest = hashlib.sha1(
+            json.dumps(request_payload, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()[:12]
+        return os.path.join(parts_dir, f"{index:05d}-{digest}.jsonl")
+
+    def _fetch_partitions(
+        self,
+        operation: str,
+        filters: list,
+        fields: dict[str, bool] | None,
+        special_data_name: str | None,
+        output_file: str,
+        workers: int,
+    ) -> None:
+        parts_dir = f"{output_file[:-len('.jsonl')]}.parts"
+        os.makedirs(parts_dir, exist_ok=True)
+
+        partitions = [
+            (index, request_payload, self._partition_file(parts_dir, index, request_payload))
+            for index, request_payload in enumerate(filters)
+        ]
+        pending = [partition for partition in partitions if not os.path.exists(partition[2])]
+        if len(pending) < len(partitions):
+            print(f"Resuming {operation}s: {len(partitions) - len(pending)}/{len(partitions)} partitions already fetched")
+
+        def fetch(partition):
+            index, request_payload, partition_file = partition
+            count = self._fetch_partition(operation, request_payload, fields, special_data_name, partition_file)
+            print(f"Fetched {count} {operation}s for partition {index + 1}/{len(partitions)}")
+            return count
+
+        if workers <= 1 or len(pending) <= 1:
+            for partition in pending:
+                fetch(partition)
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                # list() re-raises the first failure after the other partitions are checkpointed
+                list(executor.map(fetch, pending))
+
+        total = 0
+        temp_file = f"{output_file}.tmp"
+        with open(temp_file, "w", encoding="utf-8") as output:
+            for _, _, partition_file in partitions:
+                with open(partition_file, "r", encoding="utf-8") as part:
+                    for line in part:
+                        output.write(line)
+                        total += 1
+        os.replace(temp_file, output_file)
+        shutil.rmtree(parts_dir, ignore_errors=True)
+        print(f"Wrote {total} data to {output_file}")
+
+    def _fetch_partition(
+        self,
+        operation: str,
+        request_payload,
+        fields: dict[str, bool] | None,
+        special_data_name: str | None,
+        partition_file: str,
+    ) -> int:
+        if isinstance(request_payload, dict) and any(
+            key in request_payload for key in ("filter", "fields", "extra_request")
+        ):
+            filter_payload = request_payload.get("filter")
+            fields_payload = request_payload.get("fields", fields)
+            extra_request = request_payload.get("extra_request")
+        else:
+            filter_payload = request_payload
+            fields_payload = fields
+            extra_request = None
+
+        response = self.call(
+            f"Get{operation}s",
+            filter=filter_payload,
+            fields=fields_payload,
+            extra_request=extra_request,
+        )
+        data_container = getattr(response, f"{operation}s", None)
+        if data_container is None and special_data_name:
+            data_data = getattr(response, special_data_name, None)
+        else:
+            data_data = getattr(data_container, special_data_name or f"{operation}Data", None)
+
+        count = 0
+        temp_file = f"{partition_file}.tmp"
+        with open(temp_file, "w", encoding="utf-8") as file:
+            for item in data_data or []:
+                file.write(json.dumps(serialize_object(item, dict), ensure_ascii=False, default=str))
+                file.write("\n")
+                count += 1
+        # only a fully written partition counts as checkpointed
+        os.replace(temp_file, partition_file)
+        return count
 
 
 def main():
@@ -756,17 +923,17 @@ def main():
     print(practice_id_filters)
 
     print("\nFetching patients from Tebra...")
-    patients = client.get_tebra_data(operation="Patient", filters=practice_id_filters, fields=PATIENT_FIELDS_TO_RETURN)
+    patients = client.get_tebra_data(operation="Patient", filters=practice_id_filters, fields=PATIENT_FIELDS_TO_RETURN, stream=True)
 
 
     print("\nFetching appointments from Tebra...")
-    appointments = client.get_tebra_data(operation="Appointment", filters=practice_name_filters, fields=APPOINTMENT_FIELDS_TO_RETURN)
+    appointments = client.get_tebra_data(operation="Appointment", filters=practice_name_filters, fields=APPOINTMENT_FIELDS_TO_RETURN, stream=True)
 
     print(f"\nFetching appointment reasons from Tebra...")
     appointment_reasons = client.get_tebra_data(operation="AppointmentReason", filters=appointment_reason_requests)
 
     print(f"\nFetching charges from Tebra...")
-    charges = client.get_tebra_data(operation="Charge", filters=practice_name_filters, fields=CHARGE_FIELDS_TO_RETURN)
+    charges = client.get_tebra_data(operation="Charge", filters=practice_name_filters, fields=CHARGE_FIELDS_TO_RETURN, stream=True)
 
     # print(f"\nFetching encounters from Tebra...")
     # encounter_id_filters = [{"EncounterID": int(charge["EncounterID"])} for charge in charges if charge.get("EncounterID") is not None]
@@ -785,7 +952,7 @@ def main():
     service_locations = client.get_tebra_data(operation="ServiceLocation", filters=practice_id_filters)
 
     print(f"\nFetching transactions from Tebra...")
-    transactions = client.get_tebra_data(operation="Transaction", filters=practice_name_filters)
+    transactions = client.get_tebra_data(operation="Transaction", filters=practice_name_filters, stream=True)
 
 if __name__ == "__main__":
     main()
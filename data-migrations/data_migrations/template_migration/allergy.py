@@ -3,17 +3,18 @@ from collections import defaultdict
 
 from data_migrations.utils import fetch_from_json, write_to_json
 from data_migrations.template_migration.utils import (
-    validate_header,
+    iter_validated_rows,
     validate_required,
     validate_date,
     validate_enum,
     MappingMixin,
     FileWriterMixin
 )
+from data_migrations.template_migration.loader import ConcurrentLoaderMixin, CreateEntry
 from data_migrations.template_migration.note import NoteMixin
 
 
-class AllergyLoaderMixin(MappingMixin, NoteMixin, FileWriterMixin):
+class AllergyLoaderMixin(MappingMixin, NoteMixin, FileWriterMixin, ConcurrentLoaderMixin):
     """
         Canvas has outlined a CSV template for ideal data migration that this Mixin will follow.
         It will confirm the headers it expects as outlined in the template and validate each column.
@@ -27,36 +28,28 @@ class AllergyLoaderMixin(MappingMixin, NoteMixin, FileWriterMixin):
             Recorded Provider: Staff Canvas key.  If omitted, defaults to Canvas Bot
     """
 
-    def validate(self, delimiter='|'):
+    def iter_validate(self, delimiter='|'):
         """
-            Loop throw the CSV file to validate each row has the correct columns and values
-            Append validated rows to a list to use to load.
-            Export errors to a file/console
-
+            Stream the CSV through validation, yielding each valid row.
+            Errors are written to self.validation_error_file as they are found.
         """
-        validated_rows = []
-        errors = defaultdict(list)
-        with open(self.csv_file, "r") as file:
-            reader = csv.DictReader(file, delimiter=delimiter)
-
-            validate_header(reader.fieldnames,
-                accepted_headers = {
-                    "ID",
-                    "Patient Identifier",
-                    "Clinical Status",
-                    "Type",
-                    "FDB Code",
-                    "Name",
-                    "Onset Date",
-                    "Free Text Note",
-                    "Reaction",
-                    "Recorded Provider",
-                    "Severity",
-                    "Original Name",
-                }
-            )
-
-            validations = {
+        return iter_validated_rows(
+            self.csv_file,
+            accepted_headers={
+                "ID",
+                "Patient Identifier",
+                "Clinical Status",
+                "Type",
+                "FDB Code",
+                "Name",
+                "Onset Date",
+                "Free Text Note",
+                "Reaction",
+                "Recorded Provider",
+                "Severity",
+                "Original Name",
+            },
+            validations={
                 "ID": [validate_required],
                 "Patient Identifier": [validate_required],
                 "Clinical Status": [validate_required, (validate_enum, {"possible_options": ['active', 'inactive']})],
@@ -65,37 +58,22 @@ class AllergyLoaderMixin(MappingMixin, NoteMixin, FileWriterMixin):
                 "Name": [validate_required],
                 "Onset Date": [validate_date],
                 "Severity": [(validate_enum, {'possible_options': ['mild', 'moderate', 'severe']})]
-            }
+            },
+            key_fields=("ID", "Patient Identifier"),
+            validation_error_file=self.validation_error_file,
+            delimiter=delimiter,
+        )
 
-            for row in reader:
-                error = False
-                key = f"{row['ID']} {row['Patient Identifier']}"
-
-                for field, validator_funcs in validations.items():
-                    for validator_func in validator_funcs:
-                        kwargs = {}
-                        if isinstance(validator_func, tuple):
-                            validator_func, kwargs = validator_func
-
-                        valid, value = validator_func(row[field].strip(), field, **kwargs)
-                        if valid:
-                            row[field] = value
-                        else:
-                            errors[key].append(value)
-                            error = True
-
-                if not error:
-                    validated_rows.append(row)
-
-        if errors:
-            print(f"Some rows contained errors, please see {self.validation_error_file}.")
-            write_to_json(self.validation_error_file, errors)
-        else:
-            print('All rows have passed validation!')
+    def validate(self, delimiter='|'):
+        """
+            Loop throw the CSV file to validate each row has the correct columns and values
+            Append validated rows to a list to use to load.
+            Export errors to a file/console
 
-        return validated_rows
+        """
+        return list(self.iter_validate(delimiter=delimiter))
 
-    def load(self, validated_rows, note_kwargs={}):
+    def load(self, validated_rows, note_kwargs={}, workers=None, batch_size=None):
         """
             Takes the validated rows from self.validate() and
             loops through to send them off the FHIR Create
@@ -106,111 +84,108 @@ class AllergyLoaderMixin(MappingMixin, NoteMixin, FileWriterMixin):
 
         self.patient_map = fetch_from_json(self.patient_map_file)
 
-        total_count = len(validated_rows)
-        print(f'      Found {len(validated_rows)} records')
-        ids = set()
-        for i, row in enumerate(validated_rows):
-            print(f'Ingesting ({i+1}/{total_count})')
-
-            if row['ID'] in ids or row['ID'] in self.done_records:
-                print(' Already did record')
-                continue
-
-            practitioner_key = ""
-            try:
-                practitioner_key = self.map_provider(row['Recorded Provider'])
-            except BaseException:
-                practitioner_key = "5eede137ecfe4124b8b773040e33be14" # canvas-bot
-
-            patient = row['Patient Identifier']
-            patient_key = ""
-            try:
-                patient_key = self.map_patient(patient)
-                note_id = row.get("Note ID") or self.get_or_create_historical_data_input_note(patient_key, **note_kwargs)
-            except BaseException as e:
-                self.ignore_row(row['ID'], e)
-                continue
-
-            # If an FDB code is delimited with "```", then we need to make 2 records - one for each code;
-            fdb_codes = row["FDB Code"].split("```")
-            for fdb in fdb_codes:
-                payload = {
-                    "resourceType": "AllergyIntolerance",
-                    "extension": [
+        if batch_size:
+            self.run_batched_load(validated_rows, lambda row: self.build_create_entries(row, note_kwargs), batch_size=batch_size, workers=workers)
+        else:
+            self.run_load(validated_rows, lambda row: self.load_row(row, note_kwargs), workers=workers)
+
+    def load_row(self, row, note_kwargs={}):
+        self.create_entries(self.build_create_entries(row, note_kwargs))
+
+    def build_create_entries(self, row, note_kwargs={}):
+        practitioner_key = ""
+        try:
+            practitioner_key = self.map_provider(row['Recorded Provider'])
+        except BaseException:
+            practitioner_key = "5eede137ecfe4124b8b773040e33be14" # canvas-bot
+
+        patient = row['Patient Identifier']
+        patient_key = ""
+        try:
+            patient_key = self.map_patient(patient)
+            note_id = row.get("Note ID") or self.get_or_create_historical_data_input_note(patient_key, **note_kwargs)
+        except BaseException as e:
+            self.ignore_row(row['ID'], e)
+            return []
+
+        entries = []
+        # If an FDB code is delimited with "```", then we need to make 2 records - one for each code;
+        fdb_codes = row["FDB Code"].split("```")
+        for fdb in fdb_codes:
+            payload = {
+                "resourceType": "AllergyIntolerance",
+                "extension": [
+                    {
+                        "url": "http://schemas.canvasmedical.com/fhir/extensions/note-id",
+                        "valueId": note_id,
+                    }
+                ],
+                "clinicalStatus": {
+                    "coding": [
                         {
-                            "url": "http://schemas.canvasmedical.com/fhir/extensions/note-id",
-                            "valueId": note_id,
+                            "system": "http://terminology.hl7.org/CodeSystem/allergyintolerance-clinical",
+                            "code": row['Clinical Status']
                         }
                     ],
-                    "clinicalStatus": {
-                        "coding": [
-                            {
-                                "system": "http://terminology.hl7.org/CodeSystem/allergyintolerance-clinical",
-                                "code": row['Clinical Status']
-                            }
-                        ],
-                    },
-                    "verificationStatus": {
-                        "coding": [
+                },
+                "verificationStatus": {
+                    "coding": [
+                        {
+                            "system": "http://terminology.hl7.org/CodeSystem/allergyintolerance-verification",
+                            "code": "confirmed",
+                            "display": "Confirmed"
+                        }
+                    ],
+                    "text": "Confirmed"
+                },
+                "type": row['Type'],
+                "code": {
+                    "coding": [
+                        {
+                            "system": "http://www.fdbhealth.com/",
+                            "code": fdb,
+                            "display": row["Name"] if fdb != '1-143' else "No Allergy Information Available"
+                        }
+                    ]
+                },
+                "patient": {
+                    "reference": f"Patient/{patient_key}"
+                },
+                "note": (
+                    ([{"text": row['Original Name']}] if row['Original Name'] else []) +
+                    ([{"text": row['Reaction']}] if row['Reaction'] else []) +
+                    ([{"text": f"Notes: {row['Free Text Note']}"}] if row['Free Text Note'] else [])
+                )
+            }
+
+            if onset := row['Onset Date']:
+                payload['onsetDateTime'] = onset
+            if practitioner_key:
+                payload['recorder'] = {
+                    "reference": f"Practitioner/{practitioner_key}"
+                }
+            if severity := row.get('Severity'):
+                payload["reaction"] = [
+                    {
+                        "manifestation": [
                             {
-                                "system": "http://terminology.hl7.org/CodeSystem/allergyintolerance-verification",
-                                "code": "confirmed",
-                                "display": "Confirmed"
+                                "coding": [
+                                    {
+                                        "system": "http://terminology.hl7.org/CodeSystem/data-absent-reason",
+                                        "code": "unknown",
+                                        "display": "Unknown"
+                                    }
+                                ],
+                                "text": "Unknown"
                             }
                         ],
-                        "text": "Confirmed"
-                    },
-                    "type": row['Type'],
-                    "code": {
-                        "coding": [
-                            {
-                                "system": "http://www.fdbhealth.com/",
-                                "code": fdb,
-                                "display": row["Name"] if fdb != '1-143' else "No Allergy Information Available"
-                            }
-                        ]
-                    },
-                    "patient": {
-                        "reference": f"Patient/{patient_key}"
-                    },
-                    "note": (
-                        ([{"text": row['Original Name']}] if row['Original Name'] else []) +
-                        ([{"text": row['Reaction']}] if row['Reaction'] else []) +
-                        ([{"text": f"Notes: {row['Free Text Note']}"}] if row['Free Text Note'] else [])
-                    )
-                }
-
-                if onset := row['Onset Date']:
-                    payload['onsetDateTime'] = onset
-                if practitioner_key:
-                    payload['recorder'] = {
-                        "reference": f"Practitioner/{practitioner_key}"
+                        "severity": severity
                     }
-                if severity := row.get('Severity'):
-                    payload["reaction"] = [
-                        {
-                            "manifestation": [
-                                {
-                                    "coding": [
-                                        {
-                                            "system": "http://terminology.hl7.org/CodeSystem/data-absent-reason",
-                                            "code": "unknown",
-                                            "display": "Unknown"
-                                        }
-                                    ],
-                                    "text": "Unknown"
-                                }
-                            ],
-                            "severity": severity
-                        }
-                    ]
+                ]
+
+            # print(json.dumps(payload, indent=2))
+            # return
 
-                # print(json.dumps(payload, indent=2))
-                # return
+            entries.append(CreateEntry(payload, f"{row['ID']}|{patient}|{patient_key}", f"|{fdb}"))
 
-                try:
-                    canvas_id = self.fumage_helper.perform_create(payload)
-                    self.done_row(f"{row['ID']}|{patient}|{patient_key}|{canvas_id}|{fdb}")
-                    ids.add(row['ID'])
-                except BaseException as e:
-                    self.error_row(f"{row['ID']}|{patient}|{patient_key}", e)
+        return entries
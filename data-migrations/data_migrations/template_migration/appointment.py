@@ -269,4 +269,6 @@ class AppointmentLoaderMixin(MappingMixin, NoteMixin, FileWriterMixin):
                 except BaseException as e:
                     self.error_row(f"{row['ID']}|{patient}|{patient_key}", e, file=self.errored_note_state_event_file)
 
+        self.export_result_files()
+
             # return
@@ -0,0 +1,198 @@
+import os, queue, sqlite3, threading, time
+
+
+class CheckpointStore:
+    """
+        Crash-safe record of every row a loader has finished, errored or ignored.
+
+        Replaces appending to the done/error/ignore pipe files on every row. Results are kept in a
+        sqlite database in WAL mode shared by all data types of a migration:
+
+            - writes from all workers are handed to a single writer thread and committed in
+              batches (group commit). done_row/error_row/ignore_row only return once their row
+              is committed, so a kill -9 never loses a row that was reported as complete
+            - `source_id in store` and claim() are indexed lookups, so restarting a 10M row
+              migration does not re-parse any csv
+            - progress() reports counts and throughput per data type
+
+        The done/error/ignored csv files can still be produced for auditing with export_csv().
+    """
+    STATUS_DONE = 'done'
+    STATUS_ERROR = 'error'
+    STATUS_IGNORED = 'ignored'
+
+    BATCH_SIZE = 500
+    # seconds record() waits for its row to be committed before giving up
+    COMMIT_TIMEOUT = 120
+
+    def __init__(self, filename, data_type, legacy_done_file=None):
+        self.filename = filename
+        self.data_type = data_type
+        self.started_at = time.monotonic()
+        self.session_counts = {self.STATUS_DONE: 0, self.STATUS_ERROR: 0, self.STATUS_IGNORED: 0}
+
+        directory = os.path.dirname(filename)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        # lookups happen on the thread submitting rows, writes on the writer thread
+        self.read_connection = self.connect()
+        self.read_lock = threading.Lock()
+        self.read_connection.executescript("""
+            PRAGMA journal_mode=WAL;
+            CREATE TABLE IF NOT EXISTS results (
+                data_type TEXT NOT NULL,
+                source_id TEXT NOT NULL,
+                status TEXT NOT NULL,
+                data TEXT NOT NULL,
+                message TEXT NOT NULL DEFAULT '',
+                created_at REAL NOT NULL,
+                UNIQUE (data_type, status, source_id, data, message)
+            );
+            CREATE INDEX IF NOT EXISTS results_lookup ON results (data_type, source_id, status);
+            CREATE TEMP TABLE IF NOT EXISTS claimed_ids (source_id TEXT PRIMARY KEY);
+        """)
+
+        if legacy_done_file:
+            self.import_legacy_done_file(legacy_done_file)
+
+        # totals from previous runs, counted once so progress reports stay cheap
+        self.initial_counts = dict(self.read_connection.execute(
+            "SELECT status, COUNT(*) FROM results WHERE data_type = ? GROUP BY status", (self.data_type,)
+        ).fetchall())
+
+        self.queue = queue.Queue()
+        self.writer = threading.Thread(target=self.write_loop, daemon=True)
+        self.writer.start()
+
+    def connect(self):
+        connection = sqlite3.connect(self.filename, isolation_level=None, check_same_thread=False, timeout=30)
+        # NORMAL is durable against process crashes in WAL mode, only an OS crash can drop the last commits
+        connection.execute("PRAGMA synchronous=NORMAL")
+        return connection
+
+    def import_legacy_done_file(self, done_file, delimiter='|'):
+        """ Seed the store from an existing done_*.csv the first time it is opened for this data type """
+        if not os.path.isfile(done_file):
+            return
+
+        with self.read_lock:
+            if self.read_connection.execute("SELECT 1 FROM results WHERE data_type = ? LIMIT 1", (self.data_type,)).fetchone():
+                return
+
+            with open(done_file, 'r') as file:
+                next(file, None)
+                rows = (
+                    (self.data_type, line.split(delimiter)[0], self.STATUS_DONE, line.rstrip('\r\n'), '', time.time())
+                    for line in file if line.strip()
+                )
+                self.read_connection.execute("BEGIN")
+                self.read_connection.executemany(
+                    "INSERT OR IGNORE INTO results (data_type, source_id, status, data, message, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+                    rows
+                )
+                self.read_connection.execute("COMMIT")
+        print(f'Imported existing {done_file} into {self.filename}')
+
+    def write_loop(self):
+        connection = self.connect()
+        while True:
+            batch = [self.queue.get()]
+            while len(batch) < self.BATCH_SIZE:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            records = [record for record, _ in batch]
+            error = None
+            try:
+                connection.execute("BEGIN")
+                connection.executemany(
+                    "INSERT OR IGNORE INTO results (data_type, source_id, status, data, message, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+                    records
+                )
+                connection.execute("COMMIT")
+            except Exception as e:
+                # hand the error to every caller waiting on this batch instead of dying silently
+                error = e
+                if connection.in_transaction:
+                    connection.execute("ROLLBACK")
+            else:
+                for record in records:
+                    self.session_counts[record[2]] += 1
+
+            for _, pending in batch:
+                pending['error'] = error
+                pending['committed'].set()
+
+    def record(self, status, source_id, data, message=''):
+        """ Queue a result row and block until it has been committed, raising if the write failed """
+        pending = {'committed': threading.Event(), 'error': None}
+        self.queue.put(((self.data_type, str(source_id), status, data, message, time.time()), pending))
+        if not pending['committed'].wait(self.COMMIT_TIMEOUT):
+            raise TimeoutError(f'{self.filename}: row {source_id} was not committed within {self.COMMIT_TIMEOUT}s')
+        if pending['error'] is not None:
+            raise pending['error']
+
+    def done(self, source_id, data):
+        self.record(self.STATUS_DONE, source_id, data)
+
+    def error(self, source_id, data, message):
+        self.record(self.STATUS_ERROR, source_id, data, message)
+
+    def ignore(self, source_id, message):
+        self.record(self.STATUS_IGNORED, source_id, str(source_id), message)
+
+    def __contains__(self, source_id):
+        with self.read_lock:
+            return self.read_connection.execute(
+                "SELECT 1 FROM results WHERE data_type = ? AND source_id = ? AND status = ? LIMIT 1",
+                (self.data_type, str(source_id), self.STATUS_DONE)
+            ).fetchone() is not None
+
+    def claim(self, source_id):
+        """ Returns False if the id is already done or claimed, otherwise claims it for this run """
+        if source_id in self:
+            return False
+        with self.read_lock:
+            cursor = self.read_connection.execute("INSERT OR IGNORE INTO claimed_ids (source_id) VALUES (?)", (str(source_id),))
+            return cursor.rowcount == 1
+
+    def progress(self):
+        """ Totals per status for this data type plus the throughput of the current run """
+        totals = {
+            status: self.initial_counts.get(status, 0) + count
+            for status, count in self.session_counts.items()
+        }
+        elapsed = max(time.monotonic() - self.started_at, 1e-6)
+        processed = sum(self.session_counts.values())
+        return {
+            'data_type': self.data_type,
+            'done': totals.get(self.STATUS_DONE, 0),
+            'error': totals.get(self.STATUS_ERROR, 0),
+            'ignored': totals.get(self.STATUS_IGNORED, 0),
+            'processed_this_run': processed,
+            'rows_per_second': processed / elapsed,
+        }
+
+    def print_progress(self):
+        progress = self.progress()
+        print(
+            f"[{progress['data_type']}] done={progress['done']} error={progress['error']} ignored={progress['ignored']} "
+            f"| this run {progress['processed_this_run']} rows at {progress['rows_per_second']:.1f} rows/s"
+        )
+
+    def export_csv(self, status, filename, header):
+        """ Write the rows with the given status out as the legacy pipe-delimited result file """
+        connection = self.connect()
+        try:
+            with open(filename, 'w') as file:
+                file.write(f"{header}\n")
+                for data, message in connection.execute(
+                    "SELECT data, message FROM results WHERE data_type = ? AND status = ? ORDER BY rowid",
+                    (self.data_type, status)
+                ):
+                    file.write(f"{data}|{message}\n" if status != self.STATUS_DONE else f"{data}\n")
+        finally:
+            connection.close()
@@ -1,5 +1,4 @@
 import json
-import requests
 
 
 class CommandMixin:
@@ -14,7 +13,7 @@ class CommandMixin:
         Create a command via Canvas Commands API
         """
         command_base_url = self.get_command_base_url()
-        response = requests.request("POST", command_base_url, headers=self.fumage_helper.headers, data=json.dumps(payload))
+        response = self.fumage_helper.request("POST", command_base_url, data=json.dumps(payload))
 
         if response.status_code != 201:
             raise Exception(f"Failed to perform {response.url}. \n {response.text}")
@@ -28,7 +27,7 @@ class CommandMixin:
         Commit a command via Canvas Command API
         """
         command_base_url = self.get_command_base_url()
-        response = requests.request("POST", f"{command_base_url}{uuid}/commit/", headers=self.fumage_helper.headers)
+        response = self.fumage_helper.request("POST", f"{command_base_url}{uuid}/commit/")
 
         if response.status_code != 200:
             raise Exception(f"Failed to perform {response.url}. \n {response.text}")
@@ -2,9 +2,10 @@ import re, pytz, arrow, csv, json
 from collections import defaultdict
 
 from data_migrations.utils import fetch_from_json, write_to_json
+from data_migrations.template_migration.loader import ConcurrentLoaderMixin, CreateEntry
 from data_migrations.template_migration.note import NoteMixin
 from data_migrations.template_migration.utils import (
-    validate_header,
+    iter_validated_rows,
     validate_required,
     validate_date,
     validate_enum,
@@ -13,7 +14,7 @@ from data_migrations.template_migration.utils import (
 )
 
 
-class ConditionLoaderMixin(MappingMixin, NoteMixin, FileWriterMixin):
+class ConditionLoaderMixin(MappingMixin, NoteMixin, FileWriterMixin, ConcurrentLoaderMixin):
     """
         Canvas has outlined a CSV template for ideal data migration that this Mixin will follow.
         It will confirm the headers it expects as outlined in the template and validate each column.
@@ -35,75 +36,55 @@ class ConditionLoaderMixin(MappingMixin, NoteMixin, FileWriterMixin):
 
         return True, f"Display lookup for ICD-10 {row['Name']}|{icd10_code} not found."
 
-    def validate(self, delimiter='|'):
-        """
-            Loop throw the CSV file to validate each row has the correct columns and values
-            Append validated rows to a list to use to load.
-            Export errors to a file/console
+    def validate_icd10_row(self, row):
+        """ Row level validator that fills in the ICD-10 Display from the icd10 map """
+        error, value = self.validate_icd10_display_name(row)
+        if error:
+            return [value]
+        row["ICD-10 Display"] = value
+        return []
 
+    def iter_validate(self, delimiter='|'):
         """
-        validated_rows = []
-        errors = defaultdict(list)
-        with open(self.csv_file, "r") as file:
-            reader = csv.DictReader(file, delimiter=delimiter)
-
-            validate_header(reader.fieldnames,
-                accepted_headers = {
-                    "ID",
-                    "Patient Identifier",
-                    "Clinical Status",
-                    "ICD-10 Code",
-                    "Onset Date",
-                    "Free text notes",
-                    "Resolved Date",
-                    "Recorded Provider",
-                    "Name"
-                }
-            )
-
-            validations = {
+            Stream the CSV through validation, yielding each valid row.
+            Errors are written to self.validation_error_file as they are found.
+        """
+        return iter_validated_rows(
+            self.csv_file,
+            accepted_headers={
+                "ID",
+                "Patient Identifier",
+                "Clinical Status",
+                "ICD-10 Code",
+                "Onset Date",
+                "Free text notes",
+                "Resolved Date",
+                "Recorded Provider",
+                "Name"
+            },
+            validations={
                 "Patient Identifier": [validate_required],
                 "ICD-10 Code": [validate_required],
                 "Onset Date": [validate_date],
                 "Resolved Date": [validate_date],
                 "Clinical Status": [validate_required, (validate_enum, {"possible_options": ['active', 'resolved']})]
-            }
+            },
+            key_fields=("ID", "Patient Identifier"),
+            validation_error_file=self.validation_error_file,
+            delimiter=delimiter,
+            row_validators=[self.validate_icd10_row],
+        )
 
-            for row in reader:
-                error = False
-                key = f"{row['ID']} {row['Patient Identifier']}"
-
-                for field, validator_funcs in validations.items():
-                    for validator_func in validator_funcs:
-                        kwargs = {}
-                        if isinstance(validator_func, tuple):
-                            validator_func, kwargs = validator_func
-
-                        valid, value = validator_func(row[field].strip(), field, **kwargs)
-                        if valid:
-                            row[field] = value
-                        else:
-                            errors[key].append(value)
-                            error = True
-
-                error, value = self.validate_icd10_display_name(row)
-                if error:
-                    errors[key].append(value)
-                else:
-                    row["ICD-10 Display"] = value
-
-                if not error:
-                    validated_rows.append(row)
-
-        if errors:
-            print(f"Some rows contained errors, please see {self.validation_error_file}.")
-            write_to_json(self.validation_error_file, errors)
-        else:
-            print('All rows have passed validation!')
+    def validate(self, delimiter='|'):
+        """
+            Loop throw the CSV file to validate each row has the correct columns and values
+            Append validated rows to a list to use to load.
+            Export errors to a file/console
 
-        return validated_rows
+        """
+        return list(self.iter_validate(delimiter=delimiter))
 
-    def load(self, validated_rows):
+    def load(self, validated_rows, workers=None, batch_size=None):
         """
             Takes the validated rows from self.validate() and
             loops through to send them off the FHIR Create
@@ -114,93 +95,87 @@ class ConditionLoaderMixin(MappingMixin, NoteMixin, FileWriterMixin):
 
         self.patient_map = fetch_from_json(self.patient_map_file)
 
-        total_count = len(validated_rows)
-        print(f'      Found {len(validated_rows)} records')
-        ids = set()
-        for i, row in enumerate(validated_rows):
-            print(f'Ingesting ({i+1}/{total_count})')
+        if batch_size:
+            self.run_batched_load(validated_rows, self.build_create_entries, batch_size=batch_size, workers=workers)
+        else:
+            self.run_load(validated_rows, self.load_row, workers=workers)
 
-            if row['ID'] in ids or row['ID'] in self.done_records:
-                print(' Already did record')
-                continue
+    def load_row(self, row):
+        self.create_entries(self.build_create_entries(row))
 
+    def build_create_entries(self, row):
+        practitioner_key = ""
+        try:
+            practitioner_key = self.map_provider(row['Recorded Provider'])
+        except BaseException:
             practitioner_key = ""
-            try:
-                practitioner_key = self.map_provider(row['Recorded Provider'])
-            except BaseException:
-                practitioner_key = ""
-
-            patient = row['Patient Identifier']
-            patient_key = ""
-            try:
-                # try mapping required Canvas identifiers
-                patient_key = self.map_patient(patient)
-                note_id = row.get("Note ID") or self.get_or_create_historical_data_input_note(patient_key)
-            except BaseException as e:
-                self.ignore_row(row['ID'], e)
-                continue
-
-            payload = {
-                "resourceType": "Condition",
-                "extension": [
+
+        patient = row['Patient Identifier']
+        patient_key = ""
+        try:
+            # try mapping required Canvas identifiers
+            patient_key = self.map_patient(patient)
+            note_id = row.get("Note ID") or self.get_or_create_historical_data_input_note(patient_key)
+        except BaseException as e:
+            self.ignore_row(row['ID'], e)
+            return []
+
+        payload = {
+            "resourceType": "Condition",
+            "extension": [
+                {
+                    "url": "http://schemas.canvasmedical.com/fhir/extensions/note-id",
+                    "valueId": note_id,
+                }
+            ],
+            "clinicalStatus": {
+                "coding": [
                     {
-                        "url": "http://schemas.canvasmedical.com/fhir/extensions/note-id",
-                        "valueId": note_id,
+                        "system": "http://terminology.hl7.org/CodeSystem/condition-clinical",
+                        "code": row['Clinical Status'],
                     }
-                ],
-                "clinicalStatus": {
+                ]
+            },
+            "category": [
+                {
                     "coding": [
                         {
-                            "system": "http://terminology.hl7.org/CodeSystem/condition-clinical",
-                            "code": row['Clinical Status'],
+                            "system": "http://terminology.hl7.org/CodeSystem/condition-category",
+                            "code": "encounter-diagnosis",
+                            "display": "Encounter Diagnosis"
                         }
                     ]
-                },
-                "category": [
-                    {
-                        "coding": [
-                            {
-                                "system": "http://terminology.hl7.org/CodeSystem/condition-category",
-                                "code": "encounter-diagnosis",
-                                "display": "Encounter Diagnosis"
-                            }
-                        ]
-                    }
-                ],
-                "code": {
-                    "coding": [{
-                        "system": "http://hl7.org/fhir/sid/icd-10-cm",
-                        "code": row['ICD-10 Code'],
-                        "display": row['ICD-10 Display']
-                    }]
-                },
-                "subject": {
-                    "reference": f"Patient/{patient_key}"
                 }
-
+            ],
+            "code": {
+                "coding": [{
+                    "system": "http://hl7.org/fhir/sid/icd-10-cm",
+                    "code": row['ICD-10 Code'],
+                    "display": row['ICD-10 Display']
+                }]
+            },
+            "subject": {
+                "reference": f"Patient/{patient_key}"
             }
 
-            if onset := row['Onset Date']:
-                payload['onsetDateTime'] = onset
-            if resolved_date := row['Resolved Date']:
-                payload['abatementDateTime'] = resolved_date
-            if notes := row['Free text notes']:
-                payload['note'] = [{"text": notes}]
-            if practitioner_key:
-                payload['recorder'] = {
-                    "reference": f"Practitioner/{practitioner_key}"
-                }
+        }
+
+        if onset := row['Onset Date']:
+            payload['onsetDateTime'] = onset
+        if resolved_date := row['Resolved Date']:
+            payload['abatementDateTime'] = resolved_date
+        if notes := row['Free text notes']:
+            payload['note'] = [{"text": notes}]
+        if practitioner_key:
+            payload['recorder'] = {
+                "reference": f"Practitioner/{practitioner_key}"
+            }
 
-            #print(json.dumps(payload, indent=2))
+        #print(json.dumps(payload, indent=2))
 
-            if 'note' in payload:
-                if len(payload['note'][0]['text']) > 1000:
-                    self.ignore_row(row['ID'], f"ignoring temporarily because of notes character limit {len(payload['note'][0]['text'])} > 1000")
-                    continue
+        if 'note' in payload:
+            if len(payload['note'][0]['text']) > 1000:
+                self.ignore_row(row['ID'], f"ignoring temporarily because of notes character limit {len(payload['note'][0]['text'])} > 1000")
+                return []
 
-            try:
-                canvas_id = self.fumage_helper.perform_create(payload)
-                self.done_row(f"{row['ID']}|{patient}|{patient_key}|{canvas_id}")
-                ids.add(row['ID'])
-            except BaseException as e:
-                self.error_row(f"{row['ID']}|{patient}|{patient_key}", e)
+        return [CreateEntry(payload, f"{row['ID']}|{patient}|{patient_key}")]
@@ -164,3 +164,5 @@ class ConsentLoaderMixin(MappingMixin, FileWriterMixin, DocumentEncoderMixin):
                 ids.add(row['ID'])
             except BaseException as e:
                 self.error_row(f"{row['ID']}|{patient}|{patient_key}", e)
+
+        self.export_result_files()
@@ -10,9 +10,10 @@ from data_migrations.template_migration.utils import (
     MappingMixin,
     FileWriterMixin,
 )
+from data_migrations.template_migration.loader import ConcurrentLoaderMixin, CreateEntry
 
 
-class CoverageLoaderMixin(MappingMixin, FileWriterMixin):
+class CoverageLoaderMixin(MappingMixin, FileWriterMixin, ConcurrentLoaderMixin):
     """
         Canvas has outlined a CSV template for ideal data migration that this Mixin will follow.
         It will confirm the headers it expects as outlined in the template and validate each column.
@@ -137,7 +138,7 @@ class CoverageLoaderMixin(MappingMixin, FileWriterMixin):
                 return self.reverse_patient_map.get(resource_id)
             return resource_id
 
-    def load(self, validated_rows, **kwargs):
+    def load(self, validated_rows, workers=None, batch_size=None, **kwargs):
         """
             Takes the validated rows from self.validate() and
             loops through to send them off the FHIR Create
@@ -148,96 +149,90 @@ class CoverageLoaderMixin(MappingMixin, FileWriterMixin):
 
         self.patient_map = fetch_from_json(self.patient_map_file)
 
-        total_count = len(validated_rows)
-        print(f'      Found {len(validated_rows)} records')
-        ids = set()
-        for i, row in enumerate(validated_rows):
-            print(f'Ingesting ({i+1}/{total_count})')
-
-            if row['ID'] in ids or row['ID'] in self.done_records:
-                print(' Already did record')
-                continue
-
-            patient = row['Patient Identifier']
-            patient_key = ""
-            try:
-                # try mapping required Canvas identifiers
-                patient_key = self.map_patient(patient)
-
-                if not kwargs.get('skip_subscriber_mapping'):
-                    subscriber_key = self.map_patient(row['Subscriber'])
-                else:
-                    subscriber_key = row['Subscriber']
-
-                if kwargs.get("map_payor") is False:
-                    payer_id = row['Payor ID']
-                else:
-                    payer_id = self.map_payor(row['Payor ID'])
-            except BaseException as e:
-                self.ignore_row(row['ID'], e)
-                continue
-
-            payload = {
-              "resourceType": "Coverage",
-              "order": row['Order'],
-              "status": "active",
-              "subscriber": {
-                "reference": f"Patient/{subscriber_key}"
-              },
-              "subscriberId": row['Member ID'],
-              "beneficiary": {
-                "reference": f"Patient/{patient_key}"
+        if batch_size:
+            self.run_batched_load(validated_rows, lambda row: self.build_create_entries(row, **kwargs), batch_size=batch_size, workers=workers)
+        else:
+            self.run_load(validated_rows, lambda row: self.load_row(row, **kwargs), workers=workers)
+
+    def load_row(self, row, **kwargs):
+        self.create_entries(self.build_create_entries(row, **kwargs))
+
+    def build_create_entries(self, row, **kwargs):
+        patient = row['Patient Identifier']
+        patient_key = ""
+        try:
+            # try mapping required Canvas identifiers
+            patient_key = self.map_patient(patient)
+
+            if not kwargs.get('skip_subscriber_mapping'):
+                subscriber_key = self.map_patient(row['Subscriber'])
+            else:
+                subscriber_key = row['Subscriber']
+
+            if kwargs.get("map_payor") is False:
+                payer_id = row['Payor ID']
+            else:
+                payer_id = self.map_payor(row['Payor ID'])
+        except BaseException as e:
+            self.ignore_row(row['ID'], e)
+            return []
+
+        payload = {
+          "resourceType": "Coverage",
+          "order": row['Order'],
+          "status": "active",
+          "subscriber": {
+            "reference": f"Patient/{subscriber_key}"
+          },
+          "subscriberId": row['Member ID'],
+          "beneficiary": {
+            "reference": f"Patient/{patient_key}"
+          },
+          "relationship": {
+            "coding": [
+              {
+                "system": "http://hl7.org/fhir/ValueSet/subscriber-relationship",
+                "code": row['Relationship to Subscriber']
+              }
+            ]
+          },
+          "payor": [
+           {
+             "identifier": {
+               "system": "https://www.claim.md/services/era/",
+               "value": payer_id
+             }
+           }
+         ],
+          "class": (
+            ([{
+              "type": {
+                "coding": [
+                  {
+                    "system": "http://hl7.org/fhir/ValueSet/coverage-class",
+                    "code": "plan"
+                  }
+                ]
               },
-              "relationship": {
+              "value": row['Plan Name']
+            }] if row['Plan Name'] else []) +
+            ([{
+              "type": {
                 "coding": [
                   {
-                    "system": "http://hl7.org/fhir/ValueSet/subscriber-relationship",
-                    "code": row['Relationship to Subscriber']
+                    "system": "http://hl7.org/fhir/ValueSet/coverage-class",
+                    "code": "group"
                   }
                 ]
               },
-              "payor": [
-               {
-                 "identifier": {
-                   "system": "https://www.claim.md/services/era/",
-                   "value": payer_id
-                 }
-               }
-             ],
-              "class": (
-                ([{
-                  "type": {
-                    "coding": [
-                      {
-                        "system": "http://hl7.org/fhir/ValueSet/coverage-class",
-                        "code": "plan"
-                      }
-                    ]
-                  },
-                  "value": row['Plan Name']
-                }] if row['Plan Name'] else []) +
-                ([{
-                  "type": {
-                    "coding": [
-                      {
-                        "system": "http://hl7.org/fhir/ValueSet/coverage-class",
-                        "code": "group"
-                      }
-                    ]
-                  },
-                  "value": row['Group Number']
-                }] if row['Group Number'] else [])
-              ),
-                "period": {
-                    "start": row["Coverage Start Date"]
-                }
+              "value": row['Group Number']
+            }] if row['Group Number'] else [])
+          ),
+            "period": {
+                "start": row["Coverage Start Date"]
             }
+        }
 
-            #print(json.dumps(payload, indent=2))
+        #print(json.dumps(payload, indent=2))
 
-            try:
-                canvas_id = self.fumage_helper.perform_create(payload)
-                self.done_row(f"{row['ID']}|{patient}|{patient_key}|{canvas_id}")
-                ids.add(row['ID'])
-            except BaseException as e:
-                self.error_row(f"{row['ID']}|{patient}|{patient_key}", e)
+        return [CreateEntry(payload, f"{row['ID']}|{patient}|{patient_key}")]
@@ -1,4 +1,4 @@
-import base64, csv, json, os
+import csv, json, os
 from collections import defaultdict
 
 from data_migrations.utils import fetch_from_json, write_to_json
@@ -120,17 +120,14 @@ class DocumentReferenceMixin(MappingMixin, FileWriterMixin, DocumentEncoderMixin
         headers = list(rows[0].keys())
         return self.validate_rows(headers, rows)
 
-    def base64_encode_file(self, file_path):
-        with open(file_path, "rb") as fhandle:
-            contents = fhandle.read()
-            encoded_contents = base64.b64encode(contents)
-            return encoded_contents.decode("utf-8")
-
-    def load(self, validated_rows, note_kwargs={}):
+    def load(self, validated_rows, note_kwargs={}, document_workers=None):
         """
             Takes the validated rows from self.validate() and
             loops through to send them off the FHIR Create
 
+            Documents are converted on a process pool (see DocumentEncoderMixin.encode_documents)
+            running ahead of the uploads, pass document_workers=1 to convert inline.
+
             Outputs to CSV to keep track of records
             If any  error, the error message will output to the errored file
         """
@@ -140,38 +137,45 @@ class DocumentReferenceMixin(MappingMixin, FileWriterMixin, DocumentEncoderMixin
         total_count = len(validated_rows)
         print(f'      Found {len(validated_rows)} records')
         ids = set()
-        for i, row in enumerate(validated_rows):
-            print(f'Ingesting ({i+1}/{total_count})')
 
-            if row['ID'] in ids or row['ID'] in self.done_records:
-                print(' Already did record')
-                continue
+        def documents_to_encode():
+            for i, row in enumerate(validated_rows):
+                print(f'Ingesting ({i+1}/{total_count})')
 
+                if row['ID'] in ids or row['ID'] in self.done_records:
+                    print(' Already did record')
+                    continue
 
-            patient = row['Patient Identifier']
-            patient_key = ""
-            try:
-                # try mapping required Canvas identifiers
-                patient_key = self.map_patient(patient)
-            except BaseException as e:
-                self.ignore_row(row['ID'], e)
-                continue
+                patient = row['Patient Identifier']
+                patient_key = ""
+                try:
+                    # try mapping required Canvas identifiers
+                    patient_key = self.map_patient(patient)
+                except BaseException as e:
+                    self.ignore_row(row['ID'], e)
+                    continue
 
-            file_list = json.loads(row["Document"])
-            b64_document_string = ""
+                file_list = json.loads(row["Document"])
 
-            missing_files_for_row = []
-            for fname in file_list:
-                print(f"{self.documents_files_dir}{fname}")
-                if not os.path.exists(f"{self.documents_files_dir}{fname}"):
-                    missing_files_for_row.append(fname)
+                missing_files_for_row = []
+                for fname in file_list:
+                    print(f"{self.documents_files_dir}{fname}")
+                    if not os.path.exists(f"{self.documents_files_dir}{fname}"):
+                        missing_files_for_row.append(fname)
 
-            if missing_files_for_row:
-                missing_files.extend(missing_files_for_row)
-                self.ignore_row(row['ID'], f"File(s) {', '.join(missing_files_for_row)} not found in supplied files.")
+                if missing_files_for_row:
+                    missing_files.extend(missing_files_for_row)
+                    self.ignore_row(row['ID'], f"File(s) {', '.join(missing_files_for_row)} not found in supplied files.")
+                    continue
+
+                ids.add(row['ID'])
+                yield (row, patient, patient_key), file_list
+
+        for (row, patient, patient_key), b64_document_string, error in self.encode_documents(documents_to_encode(), document_workers):
+            if error:
+                self.error_row(f"{row['ID']}|{patient}|{patient_key}", error)
                 continue
 
-            b64_document_string = self.get_b64_document_string(file_list)
             if not b64_document_string:
                 # This shouldn't ever happen with the current file set we have.
                 self.error_row(row["ID"], "Error converting document")
@@ -258,7 +262,6 @@ class DocumentReferenceMixin(MappingMixin, FileWriterMixin, DocumentEncoderMixin
             try:
                 canvas_id = self.fumage_helper.perform_create(payload)
                 self.done_row(f"{row['ID']}|{patient}|{patient_key}|{canvas_id}")
-                ids.add(row['ID'])
             except BaseException as e:
                 self.error_row(f"{row['ID']}|{patient}|{patient_key}", e)
 
@@ -266,3 +269,5 @@ class DocumentReferenceMixin(MappingMixin, FileWriterMixin, DocumentEncoderMixin
         if missing_files:
             print("Some Files were missing:")
             print(missing_files)
+
+        self.export_result_files()
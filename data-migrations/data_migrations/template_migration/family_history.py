@@ -201,3 +201,5 @@ class FamilyHistoryMixin(MappingMixin, NoteMixin, FileWriterMixin, CommandMixin)
                 ids.add(row['ID'])
             except BaseException as e:
                 self.error_row(f"{row['ID']}|{row['Patient Identifier']}|{canvas_patient_key}", e)
+
+        self.export_result_files()
@@ -136,3 +136,5 @@ class HPILoaderMixin(MappingMixin, NoteMixin, FileWriterMixin, CommandMixin):
                 ids.add(row['ID'])
             except BaseException as e:
                 self.error_row(f"{row['ID']}|{patient}|{patient_key}", e)
+
+        self.export_result_files()
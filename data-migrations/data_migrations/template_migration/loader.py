@@ -0,0 +1,186 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+class ConcurrentLoaderMixin:
+    """
+        Shared engine for the load() step of the template mixins.
+
+        Each loader moves the body of its per-row loop into a `load_row` callable and hands
+        the rows to run_load(). Rows run on a bounded thread pool so throughput scales with
+        `workers` instead of with the round trip latency of the Canvas APIs. The steps for
+        a single row (note -> command -> commit -> lock) still run in order on one worker.
+
+        Requests against the environment are paced by the FHIRHelper rate limiter
+        (see `requests_per_second` in config.ini), and the done/error/ignore writers
+        in FileWriterMixin are safe to call from any worker.
+
+        With the default of one worker rows are loaded sequentially on the calling thread.
+
+        Loaders that only do FHIR creates can instead return CreateEntry objects from a
+        `build_create_entries` method and use run_batched_load() to post them as batch Bundles.
+    """
+    load_workers = 1
+
+    # how many rows each worker may have queued ahead, keeps memory flat for large loads
+    pending_rows_per_worker = 4
+
+    # with a checkpoint store, print progress/throughput every N rows
+    progress_every = 1000
+
+    def run_load(self, rows, load_row, id_field='ID', workers=None, total_count=None):
+        """
+            `rows` may be a list or any iterable (e.g. iter_validate()), in which case rows
+            are pulled lazily and only a few per worker are held in memory at a time.
+        """
+        total_count = self.start_load(rows, total_count)
+
+        def process(i, row):
+            print(f'Ingesting ({i+1}/{total_count or "?"})')
+            try:
+                load_row(row)
+            except Exception as e:
+                self.error_row(f"{row[id_field]}||", e)
+
+        self.dispatch(self.claimed_rows(rows, id_field), process, workers)
+        self.finish_load()
+
+    def run_batched_load(self, rows, build_entries, id_field='ID', batch_size=50, workers=None, total_count=None):
+        """
+            Like run_load, but the FHIR creates of up to `batch_size` rows are posted as one
+            batch Bundle. build_entries(row) returns the CreateEntry list for a row, or an
+            empty list if the row was ignored.
+        """
+        total_count = self.start_load(rows, total_count)
+
+        def process(i, chunk):
+            print(f'Ingesting batch of {len(chunk)} ({i+1}/{total_count or "?"})')
+            entries = []
+            for row in chunk:
+                try:
+                    entries.extend(build_entries(row))
+                except Exception as e:
+                    self.error_row(f"{row[id_field]}||", e)
+            try:
+                self.create_entries_batch(entries)
+            except Exception as e:
+                # the whole request failed (retries exhausted, network error), so every row in it did
+                for entry in entries:
+                    self.entry_failed(entry, e)
+
+        self.dispatch(self.chunked(self.claimed_rows(rows, id_field), batch_size), process, workers)
+        self.finish_load()
+
+    def start_load(self, rows, total_count=None):
+        if total_count is None and hasattr(rows, '__len__'):
+            total_count = len(rows)
+        if total_count is not None:
+            print(f'      Found {total_count} records')
+        return total_count
+
+    def finish_load(self):
+        if checkpoint := getattr(self, 'checkpoint', None):
+            checkpoint.print_progress()
+            self.export_result_files()
+
+    def claimed_rows(self, rows, id_field):
+        """
+            Yield (index, row) for every row not already loaded by a previous run
+            or claimed earlier in this one.
+        """
+        checkpoint = getattr(self, 'checkpoint', None)
+        if hasattr(self.done_records, 'claim'):
+            # on-disk index, see CheckpointStore
+            claim = self.done_records.claim
+        else:
+            claimed_ids = set()
+
+            def claim(_id):
+                if _id in claimed_ids or _id in self.done_records:
+                    return False
+                claimed_ids.add(_id)
+                return True
+
+        for i, row in enumerate(rows):
+            if checkpoint and i and i % self.progress_every == 0:
+                checkpoint.print_progress()
+
+            if not claim(row[id_field]):
+                print(' Already did record')
+                continue
+            yield i, row
+
+    def chunked(self, indexed_rows, size):
+        """ Group (index, row) pairs into (index of the last row, [rows]) chunks """
+        chunk = []
+        for i, row in indexed_rows:
+            chunk.append(row)
+            if len(chunk) >= size:
+                yield i, chunk
+                chunk = []
+        if chunk:
+            yield i, chunk
+
+    def dispatch(self, items, process, workers=None):
+        """ Run process(i, item) for each item, on a bounded thread pool when workers > 1 """
+        workers = workers or self.load_workers
+        if workers <= 1:
+            for i, item in items:
+                process(i, item)
+            return
+
+        pending = threading.BoundedSemaphore(workers * self.pending_rows_per_worker)
+
+        def run(i, item):
+            try:
+                process(i, item)
+            finally:
+                pending.release()
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = []
+            for i, item in items:
+                pending.acquire()
+                futures.append(executor.submit(run, i, item))
+            # re-raise anything process() let through, as the sequential path would
+            for future in futures:
+                future.result()
+
+    def create_entries(self, entries):
+        """ Create each entry with its own FHIR request """
+        for entry in entries:
+            try:
+                self.entry_created(entry, self.fumage_helper.perform_create(entry.payload))
+            except BaseException as e:
+                self.entry_failed(entry, e)
+
+    def create_entries_batch(self, entries):
+        """ Create all the entries with one FHIR batch Bundle and record each result """
+        if not entries:
+            return
+
+        results = self.fumage_helper.perform_create_batch([entry.payload for entry in entries])
+        for entry, (canvas_id, error) in zip(entries, results):
+            if error:
+                self.entry_failed(entry, error)
+            else:
+                self.entry_created(entry, canvas_id)
+
+    def entry_created(self, entry, canvas_id):
+        self.done_row(f"{entry.row_key}|{canvas_id}{entry.done_suffix}")
+
+    def entry_failed(self, entry, error):
+        self.error_row(entry.row_key, error)
+
+
+class CreateEntry:
+    """
+        One FHIR resource to create for a source row.
+
+        row_key is the id|patient|patient_key prefix used in the result files,
+        done_suffix is appended after the canvas id in the done row.
+    """
+    def __init__(self, payload, row_key, done_suffix=''):
+        self.payload = payload
+        self.row_key = row_key
+        self.done_suffix = done_suffix
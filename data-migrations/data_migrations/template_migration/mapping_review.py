@@ -6,21 +6,97 @@ This refactored version eliminates code duplication and provides a cleaner,
 more maintainable structure for reviewing and mapping medical codes.
 """
 
+import json
 import os
+import re
+import sqlite3
+import threading
+import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any, Optional, Tuple
-from data_migrations.utils import fetch_from_json, write_to_json
+from data_migrations.utils import fetch_from_json, write_to_json, write_json_atomically
 from decouple import Config, RepositoryIni
 import requests
 
 
+def normalize_lookup_text(value: str) -> str:
+    """Lowercase and collapse whitespace so trivially different strings share a cache entry."""
+    return re.sub(r'\s+', ' ', str(value)).strip().lower()
+
+
+class OntologyLookupCache:
+    """
+    Persistent cache of ontologies API responses, keyed by the endpoint and the
+    normalized request parameters. Entries older than `ttl_seconds` are refetched.
+
+    Stored in sqlite so it is shared across runs and safe to use from the prefetch threads.
+    """
+
+    def __init__(self, filename: str, ttl_seconds: float):
+        self.filename = filename
+        self.ttl_seconds = ttl_seconds
+        directory = os.path.dirname(filename)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(filename, isolation_level=None, check_same_thread=False, timeout=30)
+        self.connection.executescript("""
+            PRAGMA journal_mode=WAL;
+            CREATE TABLE IF NOT EXISTS lookups (
+                url TEXT NOT NULL,
+                params TEXT NOT NULL,
+                response TEXT NOT NULL,
+                fetched_at REAL NOT NULL,
+                PRIMARY KEY (url, params)
+            );
+        """)
+
+    @staticmethod
+    def key(params: Dict[str, str]) -> str:
+        return json.dumps({k: normalize_lookup_text(v) for k, v in params.items()}, sort_keys=True)
+
+    def get(self, url: str, params: Dict[str, str]) -> Optional[Dict[str, Any]]:
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT response, fetched_at FROM lookups WHERE url = ? AND params = ?",
+                (url, self.key(params))
+            ).fetchone()
+        if row is None or time.time() - row[1] > self.ttl_seconds:
+            return None
+        return json.loads(row[0])
+
+    def set(self, url: str, params: Dict[str, str], response: Dict[str, Any]):
+        with self.lock:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO lookups (url, params, response, fetched_at) VALUES (?, ?, ?, ?)",
+                (url, self.key(params), json.dumps(response), time.time())
+            )
+
+
 class BaseReviewMixin(ABC):
     """Base class providing common functionality for all review classes."""
+
+    # ontologies API responses are cached on disk for this long
+    lookup_cache_ttl_days = 30
+
+    # concurrent requests used to prefetch candidates for the unmapped codes
+    lookup_workers = 8
+
+    # decisions made before the mapping file is rewritten
+    mapping_save_every = 100
     
     def __init__(self, *args, **kwargs):
         self._load_config()
         self._setup_mapping_file(kwargs)
         self.data = fetch_from_json(self.path_to_mapping_file)
+        self._unsaved_changes = 0
+        self.session = requests.Session()
+        self.lookup_cache = OntologyLookupCache(
+            os.path.join(os.path.dirname(self.path_to_mapping_file), 'ontology_lookup_cache.sqlite3'),
+            ttl_seconds=self.lookup_cache_ttl_days * 24 * 60 * 60,
+        )
     
     def _load_config(self):
         """Load configuration from config.ini."""
@@ -65,15 +141,46 @@ class BaseReviewMixin(ABC):
         pass
     
     def _make_api_request(self, params: Dict[str, str]) -> Dict[str, Any]:
-        """Make an API request with error handling."""
-        response = requests.get(self.url, headers=self.headers, params=params)
+        """Make an API request with error handling, answered from the lookup cache when possible."""
+        cached = self.lookup_cache.get(self.url, params)
+        if cached is not None:
+            return cached
+
+        response = self.session.get(self.url, headers=self.headers, params=params)
         if response.status_code != 200:
             raise Exception(f"API request failed: {response.text}")
-        return response.json()
-    
-    def _save_mapping(self):
-        """Save the current mapping data to file."""
-        write_to_json(self.path_to_mapping_file, self.data)
+        response_data = response.json()
+        self.lookup_cache.set(self.url, params, response_data)
+        return response_data
+
+    def _prefetch(self, requests_params: List[Dict[str, str]]):
+        """Warm the lookup cache for many requests at once, failures are retried when the request is made for real."""
+        unique = {OntologyLookupCache.key(params): params for params in requests_params}
+        missing = [params for params in unique.values() if self.lookup_cache.get(self.url, params) is None]
+        if not missing:
+            return
+
+        print(f'Prefetching {len(missing)} lookups ({len(unique) - len(missing)} cached)')
+
+        def fetch(params):
+            try:
+                self._make_api_request(params)
+            except Exception as e:
+                print(f"Error prefetching {params}: {e}")
+
+        with ThreadPoolExecutor(max_workers=self.lookup_workers) as executor:
+            list(executor.map(fetch, missing))
+
+    def _save_mapping(self, force: bool = False):
+        """Save the current mapping data to file, batching up to `mapping_save_every` changes per write."""
+        self._unsaved_changes += 1
+        if force or self._unsaved_changes >= self.mapping_save_every:
+            self._flush_mapping()
+
+    def _flush_mapping(self):
+        if self._unsaved_changes:
+            write_json_atomically(self.path_to_mapping_file, self.data)
+            self._unsaved_changes = 0
     
     def _get_user_input(self, prompt: str, valid_options: Optional[List[str]] = None) -> str:
         """Get user input with validation."""
@@ -144,13 +251,24 @@ class BaseReviewMixin(ABC):
                     _map[item.lower()] = []
         
         total = len(_map)
+        self._prefetch([
+            params
+            for key, item in _map.items() if not item
+            for params in self._candidate_requests(key, search_params, code_param)
+        ])
         
+        looked_up = 0
         for i, (key, item) in enumerate(_map.items()):
             print(f'\n{key} ({i+1}/{total})')
             
             if item:
                 print('Already mapped, skipping')
                 continue
+
+            # checkpoint in batches so an interrupted pass keeps its progress
+            if looked_up and looked_up % self.mapping_save_every == 0:
+                write_json_atomically(self.path_to_mapping_file, _map)
+            looked_up += 1
             
             name, code = key.split('|')
             options = []
@@ -222,6 +340,19 @@ class BaseReviewMixin(ABC):
         ordered = dict(sorted_items)
         write_to_json(self.path_to_mapping_file, ordered)
 
+    def _candidate_requests(self, key: str, search_params: Dict[str, str], code_param: str) -> List[Dict[str, str]]:
+        """The lookups _map_codes starts with for a key, so they can be prefetched together."""
+        name, code = key.split('|')
+        name = name.replace(':', '')
+        candidates = []
+        if self.data_type == 'medication' and code and name:
+            candidates.append({"rxnorm_code": code, "text": name})
+        if code:
+            candidates.append({code_param: code})
+        if name:
+            candidates.append({**search_params, "text": name})
+        return candidates
+
     def _is_exact_match(self, result: Dict[str, Any], name: str) -> bool:
         """Check if a result exactly matches the name."""
         display_text = result.get('text', result.get('display', ''))
@@ -270,6 +401,13 @@ class BaseReviewMixin(ABC):
 
     def _review_base(self, skip_done: bool = True, **kwargs):
         """Base review functionality shared across all review types."""
+        try:
+            self._review_items(skip_done=skip_done, **kwargs)
+        finally:
+            # decisions are saved in batches, make sure none are lost when stopping early
+            self._flush_mapping()
+
+    def _review_items(self, skip_done: bool = True, **kwargs):
         total = len(self.data)
         
         for i, (key, item) in enumerate(dict(self.data).items()):
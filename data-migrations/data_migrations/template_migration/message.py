@@ -122,3 +122,5 @@ class MessageLoaderMixin(MappingMixin, FileWriterMixin):
                 ids.add(row['ID'])
             except BaseException as e:
                 self.error_row(f"{row['ID']}|{row['Patient Identifier']}|{row['Patient Key']}", e)
+
+        self.export_result_files()
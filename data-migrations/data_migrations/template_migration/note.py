@@ -1,11 +1,16 @@
 import arrow
 import json
-import requests
+import threading
+from collections import defaultdict
 
 from data_migrations.utils import write_to_json
 
 
 class NoteMixin:
+    # guards note_map so concurrent loaders only create one historical note per patient
+    _note_map_lock = threading.Lock()
+    _patient_note_locks = defaultdict(threading.Lock)
+
     def get_base_url(self) -> None:
         uri = "/core/api/notes/v1/Note"
         if self.environment == "localhost":
@@ -24,10 +29,19 @@ class NoteMixin:
         if canvas_patient_key in self.note_map:
             return self.note_map[canvas_patient_key]
 
-        note_key = self.create_note(canvas_patient_key, **kwargs)
+        with self._note_map_lock:
+            patient_lock = self._patient_note_locks[canvas_patient_key]
+
+        with patient_lock:
+            # another worker may have created it while we waited
+            if canvas_patient_key in self.note_map:
+                return self.note_map[canvas_patient_key]
+
+            note_key = self.create_note(canvas_patient_key, **kwargs)
 
-        self.note_map[canvas_patient_key] = note_key
-        write_to_json(self.note_map_file, self.note_map)
+            with self._note_map_lock:
+                self.note_map[canvas_patient_key] = note_key
+                write_to_json(self.note_map_file, self.note_map)
 
         return note_key
 
@@ -41,7 +55,7 @@ class NoteMixin:
             "title": kwargs.get("note_title") or ""
         }
 
-        response = requests.request("POST", self.get_base_url(), headers=self.fumage_helper.headers, data=json.dumps(payload))
+        response = self.fumage_helper.request("POST", self.get_base_url(), data=json.dumps(payload))
 
         if response.status_code != 201:
             raise Exception(f"Failed to perform {response.url}. \n {response.text}")
@@ -50,6 +64,6 @@ class NoteMixin:
         return response_json['noteKey']
 
     def perform_note_state_change(self, note_id, state='LKD'):
-        response = requests.request("PATCH", f"{self.get_base_url()}/{note_id}", headers=self.fumage_helper.headers, data=json.dumps({"stateChange": state}))
+        response = self.fumage_helper.request("PATCH", f"{self.get_base_url()}/{note_id}", data=json.dumps({"stateChange": state}))
         if response.status_code != 200 and f"{state} -> {state}" not in response.text and "NEW -> ULK" not in response.text:
             raise Exception(f"Failed to perform {response.url}. \n {response.text}")
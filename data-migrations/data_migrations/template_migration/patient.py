@@ -198,16 +198,21 @@ class PatientLoaderMixin(FileWriterMixin):
         return response.json()
 
 
-    def load(self, validated_rows, system_unique_identifier, require_identifier=True):
+    def load(self, validated_rows, system_unique_identifier, require_identifier=True, batch_size=None):
         """
             Takes the validated rows from self.validate() and
             loops through to send them off the FHIR Create
 
+            With batch_size, patients are created in FHIR batch Bundles of that many resources.
+
             Outputs to CSV to keep track of records
             If any  error, the error message will output to the errored file
         """
 
         patient_map = fetch_from_json(self.patient_map_file)
+        pending = []
+        # identifiers queued in `pending` but not yet in the patient map
+        pending_identifiers = set()
 
         total_count = len(validated_rows)
         for i, row in enumerate(validated_rows):
@@ -238,6 +243,10 @@ class PatientLoaderMixin(FileWriterMixin):
                 print('  Skipping...patient already ingested')
                 continue
 
+            if patient_identifier and patient_identifier in pending_identifiers:
+                print('  Skipping...patient already queued in this batch')
+                continue
+
             payload = {
                 "resourceType": "Patient",
                 "extension":(
@@ -318,6 +327,16 @@ class PatientLoaderMixin(FileWriterMixin):
 
             # print(json.dumps(payload, indent=2))
 
+            if batch_size:
+                pending.append((row, patient_identifier, payload))
+                if patient_identifier:
+                    pending_identifiers.add(patient_identifier)
+                if len(pending) >= batch_size:
+                    self.create_patient_batch(pending, patient_map)
+                    pending = []
+                    pending_identifiers = set()
+                continue
+
             try:
                 patient_key = self.fumage_helper.perform_create(payload)
                 print(f"    Successfully made {row['First Name']} {row['Last Name']}: https://{self.environment}.canvasmedical.com/patient/{patient_key}")
@@ -327,3 +346,25 @@ class PatientLoaderMixin(FileWriterMixin):
                     write_to_json(self.patient_map_file, patient_map)
             except Exception as e:
                 self.error_row(f"{patient_identifier}|{row['First Name']}|{row['Last Name']}", e)
+
+        if pending:
+            self.create_patient_batch(pending, patient_map)
+
+        self.export_result_files()
+
+    def create_patient_batch(self, pending, patient_map):
+        """
+            Create a group of patients with one FHIR batch Bundle and
+            write the patient map once for the whole group
+        """
+        results = self.fumage_helper.perform_create_batch([payload for _, _, payload in pending])
+        for (row, patient_identifier, _), (patient_key, error) in zip(pending, results):
+            if error:
+                self.error_row(f"{patient_identifier}|{row['First Name']}|{row['Last Name']}", error)
+                continue
+
+            print(f"    Successfully made {row['First Name']} {row['Last Name']}: https://{self.environment}.canvasmedical.com/patient/{patient_key}")
+            if patient_identifier:
+                patient_map[patient_identifier] = patient_key
+
+        write_to_json(self.patient_map_file, patient_map)
@@ -138,3 +138,5 @@ class PlanLoaderMixin(MappingMixin, NoteMixin, FileWriterMixin, CommandMixin):
                 ids.add(row['ID'])
             except BaseException as e:
                 self.error_row(f"{row['ID']}|{patient}|{patient_key}", e)
+
+        self.export_result_files()
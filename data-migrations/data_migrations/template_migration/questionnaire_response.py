@@ -159,3 +159,5 @@ class QuestionnaireResponseLoaderMixin(MappingMixin, NoteMixin, FileWriterMixin)
             except BaseException as e:
                 self.error_row(f"{row['ID']}|{patient}|{patient_key}", e)
                 continue
+
+        self.export_result_files()
@@ -1,4 +1,6 @@
-import arrow, base64, pytz, os, re, uuid
+import arrow, base64, csv, hashlib, io, json, pytz, os, re, threading
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
 from PIL import Image, ImageSequence
 import pdfkit
 
@@ -160,6 +162,84 @@ def validate_enum(value, field, **kwargs):
 
     return value in possible_options, value
 
+def validate_row(row, validations):
+    """
+        Run each field's validators against the row, replacing values with their
+        normalized form. Returns the list of error messages (empty if the row is valid)
+    """
+    errors = []
+    for field, validator_funcs in validations.items():
+        for validator_func in validator_funcs:
+            kwargs = {}
+            if isinstance(validator_func, tuple):
+                validator_func, kwargs = validator_func
+
+            valid, value = validator_func(row[field].strip(), field, **kwargs)
+            if valid:
+                row[field] = value
+            else:
+                errors.append(value)
+    return errors
+
+class ValidationErrorWriter:
+    """
+        Writes validation errors to the JSON error file as they are found
+        instead of collecting them all in memory first.
+        The file is only created if there is at least one error.
+    """
+    def __init__(self, filename):
+        self.filename = filename
+        self.file = None
+        self.count = 0
+
+    def write(self, key, errors):
+        if self.file is None:
+            directory = os.path.dirname(self.filename)
+            if directory and not os.path.exists(directory):
+                os.makedirs(directory)
+            self.file = open(self.filename, 'w', encoding='utf-8')
+            self.file.write('{')
+
+        self.file.write(f'{"," if self.count else ""}\n    {json.dumps(key, ensure_ascii=False)}: {json.dumps(errors, ensure_ascii=False)}')
+        self.count += 1
+
+    def close(self):
+        if self.file is not None:
+            self.file.write('\n}\n')
+            self.file.close()
+            self.file = None
+
+def iter_validated_rows(csv_file, accepted_headers, validations, key_fields, validation_error_file, delimiter=',', row_validators=()):
+    """
+        Stream the rows of a template CSV through validation one at a time.
+
+        Valid rows are yielded, invalid rows are written straight to validation_error_file
+        keyed by the values of key_fields, so memory use does not depend on the size of the extract.
+        row_validators are extra callables taking the whole row and returning a list of errors.
+    """
+    error_writer = ValidationErrorWriter(validation_error_file)
+    try:
+        with open(csv_file, "r") as file:
+            reader = csv.DictReader(file, delimiter=delimiter)
+            validate_header(reader.fieldnames, accepted_headers=accepted_headers)
+
+            for row in reader:
+                errors = validate_row(row, validations)
+                for row_validator in row_validators:
+                    errors.extend(row_validator(row))
+
+                if errors:
+                    error_writer.write(" ".join(row[f] for f in key_fields), errors)
+                else:
+                    yield row
+    finally:
+        error_writer.close()
+
+    if error_writer.count:
+        print(f"Some rows contained errors, please see {validation_error_file}.")
+    else:
+        print('All rows have passed validation!')
+
 class MappingMixin:
 
     def map_patient(self, patient):
@@ -199,102 +279,268 @@ class MappingMixin:
         return location
 
 class FileWriterMixin:
+    """
+        Records the outcome of each row. When the loader has a `checkpoint` (CheckpointStore)
+        results go to it, otherwise they are appended to the pipe-delimited result files.
+    """
+    # result files are shared by every worker of a concurrent load
+    _result_file_lock = threading.Lock()
 
-    def ignore_row(self, _id, ignore_reason):
-        if not os.path.isfile(self.ignore_file):
-            with open(self.ignore_file, 'w') as f:
-                f.write('id|ignored_reason\n')
+    done_file_header = 'id|patient_id|patient_key|canvas_externally_exposable_id'
+    error_file_header = 'id|patient_id|patient_key|error_message'
+    ignore_file_header = 'id|ignored_reason'
 
+    def ignore_row(self, _id, ignore_reason):
         ignore_reason = str(ignore_reason).replace('\n', '')
-        with open(self.ignore_file, 'a') as file:
+        if getattr(self, 'checkpoint', None):
+            self.checkpoint.ignore(_id, ignore_reason)
             print(f' Ignoring row due to "{ignore_reason}')
-            file.write(f"{_id}|{ignore_reason}\n")
+            return
+
+        with self._result_file_lock:
+            if not os.path.isfile(self.ignore_file):
+                with open(self.ignore_file, 'w') as f:
+                    f.write(f'{self.ignore_file_header}\n')
+
+            with open(self.ignore_file, 'a') as file:
+                print(f' Ignoring row due to "{ignore_reason}')
+                file.write(f"{_id}|{ignore_reason}\n")
 
     def error_row(self, data, error, file=None):
         """If anything fails, output to file to go back and fix"""
-        if not os.path.isfile(self.error_file):
-            with open(self.error_file, 'w') as f:
-                f.write('id|patient_id|patient_key|error_message\n')
-
         error = str(error).replace('\n', '')
-        with open(file or self.error_file, 'a') as file:
+        if getattr(self, 'checkpoint', None) and not file:
+            self.checkpoint.error(data.split('|')[0], data, error)
             print(f' Errored row outputing error message to file...{error}')
-            file.write(f"{data}|{error}\n")
+            return
 
-    def done_row(self, data, file=None):
-        if not os.path.isfile(self.done_file):
-            with open(self.done_file, 'w') as f:
-                f.write('id|patient_id|patient_key|canvas_externally_exposable_id\n')
+        with self._result_file_lock:
+            if not os.path.isfile(self.error_file):
+                with open(self.error_file, 'w') as f:
+                    f.write(f'{self.error_file_header}\n')
 
-        with open(file or self.done_file, 'a') as done:
+            with open(file or self.error_file, 'a') as file:
+                print(f' Errored row outputing error message to file...{error}')
+                file.write(f"{data}|{error}\n")
+
+    def done_row(self, data, file=None):
+        if getattr(self, 'checkpoint', None) and not file:
+            self.checkpoint.done(data.split('|')[0], data)
             print(' Complete')
-            done.write(f"{data}\n")
+            return
+
+        with self._result_file_lock:
+            if not os.path.isfile(self.done_file):
+                with open(self.done_file, 'w') as f:
+                    f.write(f'{self.done_file_header}\n')
+
+            with open(file or self.done_file, 'a') as done:
+                print(' Complete')
+                done.write(f"{data}\n")
+
+    def export_result_files(self):
+        """ Write the checkpoint store back out as the done/error/ignored csv files for auditing """
+        if not getattr(self, 'checkpoint', None):
+            return
+
+        self.checkpoint.export_csv(self.checkpoint.STATUS_DONE, self.done_file, self.done_file_header)
+        self.checkpoint.export_csv(self.checkpoint.STATUS_ERROR, self.error_file, self.error_file_header)
+        self.checkpoint.export_csv(self.checkpoint.STATUS_IGNORED, self.ignore_file, self.ignore_file_header)
+
+
+WKHTMLTOPDF_PATH = "/usr/local/bin/wkhtmltopdf"  # adjust as needed
+
+# multiple of 3 so every chunk encodes to base64 without padding
+BASE64_CHUNK_SIZE = 3 * 256 * 1024
+
+TIFF_EXTENSIONS = ('.tiff', '.tif')
+IMAGE_EXTENSIONS = ('.png', '.jpeg', '.jpg')
+
+
+def base64_encode_stream(stream):
+    """ Base64 encode a binary stream chunk by chunk instead of reading it all into memory first """
+    encoded = []
+    while chunk := stream.read(BASE64_CHUNK_SIZE):
+        encoded.append(base64.b64encode(chunk).decode("utf-8"))
+    return "".join(encoded)
+
+
+def images_to_pdf(file_paths):
+    """ Combine every page of every image into one PDF, returned as bytes """
+    pages = []
+    for file_path in file_paths:
+        with Image.open(file_path) as image:
+            pages.extend(page.convert("RGB") for page in ImageSequence.Iterator(image))
+
+    buffer = io.BytesIO()
+    pages[0].save(buffer, "PDF", resolution=100.0, save_all=True, append_images=pages[1:])
+    return buffer.getvalue()
+
+
+def html_to_pdf(file_path):
+    config = pdfkit.configuration(wkhtmltopdf=WKHTMLTOPDF_PATH)
+    # output_path=False makes pdfkit return the PDF instead of writing a file
+    return pdfkit.from_file(str(file_path), False, configuration=config)
+
+
+def encode_document(file_paths):
+    """
+        Convert the files of one document to a single PDF and base64 encode it.
+        Returns None for file types we don't know how to convert.
+
+        Module level so it can run in a ProcessPoolExecutor worker.
+    """
+    if len(file_paths) == 1:
+        file_path = file_paths[0]
+        lower_path = file_path.lower()
+        if lower_path.endswith('.pdf'):
+            with open(file_path, "rb") as fhandle:
+                return base64_encode_stream(fhandle)
+        if lower_path.endswith('.html'):
+            return base64_encode_stream(io.BytesIO(html_to_pdf(file_path)))
+        if not lower_path.endswith(TIFF_EXTENSIONS + IMAGE_EXTENSIONS):
+            return None
+
+    return base64_encode_stream(io.BytesIO(images_to_pdf(file_paths)))
+
+
+def document_content_hash(file_paths):
+    """ sha256 over the contents of the files, so duplicate scans share one conversion """
+    digest = hashlib.sha256()
+    for file_path in file_paths:
+        digest.update(os.path.splitext(file_path)[1].lower().encode("utf-8"))
+        with open(file_path, "rb") as fhandle:
+            while chunk := fhandle.read(BASE64_CHUNK_SIZE):
+                digest.update(chunk)
+        digest.update(b"\0")
+    return digest.hexdigest()
 
 
 class DocumentEncoderMixin:
+    """
+        Converts the source documents (TIFF, PNG, JPEG, HTML or PDF) to a base64 encoded PDF.
+
+        Conversions happen in memory, and results are cached by the content hash of the
+        source files so duplicate scans are only converted once per run.
+
+        Loaders should use encode_documents() to convert on a process pool that runs
+        ahead of the upload loop instead of calling get_b64_document_string() per row.
+    """
+
+    # None uses one conversion process per CPU, 1 converts on the calling process
+    document_workers = None
+
+    # how many documents each worker may convert ahead of the uploads
+    documents_ahead_per_worker = 2
+
+    # upper bound on the size of the base64 strings kept in the content hash cache
+    document_cache_max_bytes = 256 * 1024 * 1024
+
     def base64_encode_file(self, file_path):
         with open(file_path, "rb") as fhandle:
-            contents = fhandle.read()
-            encoded_contents = base64.b64encode(contents)
-            return encoded_contents.decode("utf-8")
-
-    def tiff_to_pdf(self, tiff_path):
-        image = Image.open(tiff_path)
-        images = []
-        for page in ImageSequence.Iterator(image):
-            page = page.convert("RGB")
-            images.append(page)
-
-        output_path = f'{self.temp_pdf_dir}/{tiff_path.split("/")[-1]}'.replace(".tiff", ".pdf").replace(".tif", ".pdf")
-        if len(images) == 1:
-            images[0].save(output_path)
-        else:
-            images[0].save(output_path, save_all=True, append_images=images[1:])
-        return output_path
-
-    def convert_and_base64_encode(self, documents, custom_name=None):
-        images = [Image.open(img) for img in documents]
-        if custom_name:
-            output_path = f"{self.temp_pdf_dir}/{custom_name}.pdf"
-        else:
-            temp_uuid = str(uuid.uuid4())
-            output_path = f"{self.temp_pdf_dir}/{temp_uuid}.pdf"
-        images[0].save(output_path, "PDF", resolution=100.0, save_all=True, append_images=images[1:])
-        base64_encoded_string = self.base64_encode_file(output_path)
-        # clean up the temp file
-        os.remove(output_path)
-        return base64_encoded_string
-
-    def convert_html_to_pdf(self, input_file):
-        input_path = str(input_file)  # Make sure it's a string path
-        output_path = input_path.replace(".html", ".pdf")
-
-        config = pdfkit.configuration(wkhtmltopdf="/usr/local/bin/wkhtmltopdf")  # adjust as needed
-        pdfkit.from_file(input_path, output_path, configuration=config)
-
-        return output_path
+            return base64_encode_stream(fhandle)
 
-    def get_b64_document_string(self, file_list):
-        b64_document_string = None
-        if len(file_list) == 1:
-            file_path = file_list[0]
-            input_file = f"{self.documents_files_dir}{file_path}"
-            if file_path.endswith(".tiff") or file_path.endswith(".tif"):
-                pdf_output = self.tiff_to_pdf(input_file)
-                b64_document_string = self.base64_encode_file(pdf_output)
-                # clean up the file
-                os.remove(pdf_output)
-            elif file_path.lower().endswith(".pdf"):
-                b64_document_string = self.base64_encode_file(input_file)
-            elif file_path.endswith(".png"):
-                b64_document_string = self.convert_and_base64_encode([input_file])
-            elif file_path.endswith(".jpeg") or file_path.endswith(".jpg"):
-                b64_document_string = self.convert_and_base64_encode([input_file])
-            elif file_path.endswith('.html'):
-                pdf_file = self.convert_html_to_pdf(input_file)
-                b64_document_string = self.base64_encode_file(pdf_file)
-        elif len(file_list) > 1:
-            b64_document_string = self.convert_and_base64_encode([f"{self.documents_files_dir}{p}" for p in file_list])
+    def document_paths(self, file_list):
+        return [f"{self.documents_files_dir}{file_path}" for file_path in file_list]
+
+    @property
+    def document_cache(self):
+        if not hasattr(self, '_document_cache'):
+            self._document_cache = OrderedDict()
+            self._document_cache_bytes = 0
+        return self._document_cache
 
+    def cache_document(self, content_hash, b64_document_string):
+        cache = self.document_cache
+        if not b64_document_string or content_hash in cache:
+            return
+        cache[content_hash] = b64_document_string
+        self._document_cache_bytes += len(b64_document_string)
+        while self._document_cache_bytes > self.document_cache_max_bytes and len(cache) > 1:
+            _, evicted = cache.popitem(last=False)
+            self._document_cache_bytes -= len(evicted)
+
+    def cached_document(self, content_hash):
+        cache = self.document_cache
+        if content_hash in cache:
+            cache.move_to_end(content_hash)
+            return cache[content_hash]
+        return None
 
+    def get_b64_document_string(self, file_list):
+        if not file_list:
+            return None
+
+        file_paths = self.document_paths(file_list)
+        content_hash = document_content_hash(file_paths)
+        b64_document_string = self.cached_document(content_hash)
+        if b64_document_string is None:
+            b64_document_string = encode_document(file_paths)
+            self.cache_document(content_hash, b64_document_string)
         return b64_document_string
+
+    def encode_documents(self, items, workers=None):
+        """
+            `items` yields (item, file_list) pairs. Yields (item, b64_document_string, error)
+            in the same order, converting up to `workers` documents in parallel ahead of
+            the consumer. Documents with the same content are converted once.
+        """
+        workers = workers or self.document_workers or os.cpu_count() or 1
+        if workers <= 1:
+            for item, file_list in items:
+                try:
+                    yield item, self.get_b64_document_string(file_list), None
+                except Exception as e:
+                    yield item, None, e
+            return
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending = deque()
+            in_flight = {}
+
+            def submit(item, file_list):
+                try:
+                    file_paths = self.document_paths(file_list)
+                    content_hash = document_content_hash(file_paths) if file_list else None
+                except Exception as e:
+                    pending.append((item, file_list, None, None, e))
+                    return
+
+                if content_hash is None or self.cached_document(content_hash) is not None:
+                    future = None
+                elif content_hash in in_flight:
+                    future = in_flight[content_hash]
+                else:
+                    future = in_flight[content_hash] = executor.submit(encode_document, file_paths)
+                pending.append((item, file_list, content_hash, future, None))
+
+            def collect():
+                item, file_list, content_hash, future, error = pending.popleft()
+                if error is not None:
+                    return item, None, error
+                if content_hash is None:
+                    return item, None, None
+                if future is None:
+                    # already cached when submitted, get_b64_document_string re-converts if it was evicted since
+                    try:
+                        return item, self.get_b64_document_string(file_list), None
+                    except Exception as e:
+                        return item, None, e
+
+                try:
+                    b64_document_string = future.result()
+                except Exception as e:
+                    return item, None, e
+                finally:
+                    if in_flight.get(content_hash) is future:
+                        del in_flight[content_hash]
+                self.cache_document(content_hash, b64_document_string)
+                return item, b64_document_string, None
+
+            for item, file_list in items:
+                submit(item, file_list)
+                while len(pending) > workers * self.documents_ahead_per_worker:
+                    yield collect()
+
+            while pending:
+                yield collect()
@@ -154,3 +154,5 @@ class VisualExamFindingsMixin(MappingMixin, NoteMixin, FileWriterMixin, Document
                 ids.add(row['ID'])
             except BaseException as e:
                 self.error_row(f"{row['ID']}|{patient}|{patient_key}", e)
+
+        self.export_result_files()
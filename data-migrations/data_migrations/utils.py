@@ -1,9 +1,54 @@
-import csv, json, requests, os, re
+import arrow, csv, json, mmap, random, requests, os, re, threading, time
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 from urllib.parse import urlencode
 from decouple import Config, RepositoryIni
 from collections import defaultdict
 
 
+class TokenBucket:
+    """
+        Thread-safe token bucket used to cap the request rate against a Canvas environment.
+        `rate` tokens are added per second up to `capacity`; acquire() blocks until a token is free.
+        A rate of 0 (or None) disables limiting.
+    """
+    def __init__(self, rate, capacity=None):
+        self.rate = rate or 0
+        self.capacity = capacity or max(self.rate, 1)
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        if not self.rate:
+            return
+
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+                self.updated_at = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+_rate_limiters = {}
+_rate_limiters_lock = threading.Lock()
+
+def get_rate_limiter(environment, rate=None):
+    """
+        Return the shared TokenBucket for a Canvas environment so every helper and
+        loader talking to the same instance draws from the same budget.
+    """
+    with _rate_limiters_lock:
+        if environment not in _rate_limiters:
+            _rate_limiters[environment] = TokenBucket(rate)
+        return _rate_limiters[environment]
+
+
 def fetch_complete_csv_rows(filename, key='id', delimiter='|'):
     """
         Return a distinct set of all the unique identifiers of a csv.
@@ -37,6 +82,15 @@ def write_to_json(filename, data):
         json.dump(data, f, ensure_ascii=False, indent=4)
     print(f"Successfully created {filename}")
 
+def write_json_atomically(filename, data):
+    """
+        Write to a temp file and swap it in so a crash never leaves a half written file
+    """
+    temp_file = f"{filename}.tmp"
+    with open(temp_file, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=4)
+    os.replace(temp_file, filename)
+
 def fetch_from_csv(filename, key='patient', delimiter=','):
     """
         Load a CSV file and
@@ -55,42 +109,167 @@ def fetch_from_csv(filename, key='patient', delimiter=','):
 
     return data
 
-def read_json_file(path_to_file, is_fhir=False, list_attribute=None):
-    """ Each of the JSON files given has each line corresponding to
-    all the records related to one patient.
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    # orjson is optional, the stdlib parser also accepts bytes
+    json_loads = json.loads
+
+
+def json_line_key(line, is_fhir=False, list_attribute=None):
+    """ Returns (patient key, record) for one parsed line of a JSON lines extract """
+    if is_fhir:
+        _list = line.get(list_attribute, [])
+        new_list = []
+        key = None
+        for item in _list:
+            if 'subject' not in item and 'patient' not in item:
+                continue
+            key = (item.get('subject') or item.get('patient'))['reference']
+            new_list.append(item)
 
-    We want to return a dictionary with the patient's athenapatientid as the key,
-    so we can iterate over each patient when ingesting data
+        if not key:
+            raise Exception(f"No Patient key was found for row {_list}")
+        return key, new_list
+
+    patient_details = line.get('patientdetails', {})
+    key = patient_details.get('enterpriseid')
+
+    if not key:
+        raise Exception(f"No Patient key was found for row {line}")
+
+    return key, line
+
+
+class JsonLinesIndex:
     """
-    records = {}
-    with open(path_to_file, 'r') as file:
+        Read-only, dict-like view over a JSON lines extract where each line holds
+        all the records related to one patient.
+
+        The file is memory mapped and only the byte offset of each patient's line is kept
+        in memory; a record is parsed when it is looked up. The offsets are saved next to
+        the extract in `<file>.offsets.json` and reused as long as the extract's size and
+        modification time haven't changed, so reopening a large extract is instant.
+
+        JSON object keys are always strings, so keys are stored and looked up as str(key)
+        whether the offsets were just built or loaded from the cache.
+    """
+    def __init__(self, path_to_file, is_fhir=False, list_attribute=None):
+        self.path_to_file = path_to_file
+        self.is_fhir = is_fhir
+        self.list_attribute = list_attribute
+        self.offsets_file = f"{path_to_file}.offsets.json"
+
+        self.file = open(path_to_file, 'rb')
+        stat = os.fstat(self.file.fileno())
+        self.signature = [stat.st_size, stat.st_mtime_ns, is_fhir, list_attribute]
+        # mmap can't map an empty file
+        self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ) if stat.st_size else b''
+
+        self.offsets = self.load_offsets()
+        if self.offsets is None:
+            self.offsets = self.build_offsets()
+            self.save_offsets()
+
+    def iter_lines(self):
+        """ Yields (offset, end, line bytes) for every non blank line """
+        offset = 0
+        size = len(self.data)
+        while offset < size:
+            end = self.data.find(b'\n', offset)
+            if end == -1:
+                end = size
+            line = self.data[offset:end]
+            if line.strip():
+                yield offset, end, line
+            offset = end + 1
+
+    def build_offsets(self):
+        offsets = {}
+        for offset, end, line in self.iter_lines():
+            key, _ = json_line_key(json_loads(line), self.is_fhir, self.list_attribute)
+            # a patient appearing twice keeps their last line, like the old read_json_file
+            offsets[str(key)] = [offset, end]
+        return offsets
+
+    def load_offsets(self):
+        if not os.path.isfile(self.offsets_file):
+            return None
+        try:
+            saved = fetch_from_json(self.offsets_file)
+        except ValueError:
+            return None
+        if saved.get('signature') != self.signature:
+            return None
+        return saved['offsets']
+
+    def save_offsets(self):
+        try:
+            write_json_atomically(self.offsets_file, {'signature': self.signature, 'offsets': self.offsets})
+        except OSError as e:
+            # the index is only a cache, it is rebuilt next time
+            print(f'Unable to save {self.offsets_file}: {e}')
+
+    def __getitem__(self, key):
+        offset, end = self.offsets[str(key)]
+        _, record = json_line_key(json_loads(self.data[offset:end]), self.is_fhir, self.list_attribute)
+        return record
+
+    def get(self, key, default=None):
+        return self[key] if str(key) in self.offsets else default
+
+    def __contains__(self, key):
+        return str(key) in self.offsets
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def __iter__(self):
+        return iter(self.offsets)
+
+    def keys(self):
+        return self.offsets.keys()
+
+    def items(self):
+        for key in self.offsets:
+            yield key, self[key]
+
+    def values(self):
+        for _, record in self.items():
+            yield record
+
+    def close(self):
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def iter_json_file(path_to_file, is_fhir=False, list_attribute=None):
+    """ Stream (patient key, record) pairs from a JSON lines extract without holding it in memory """
+    with open(path_to_file, 'rb') as file:
         for line in file:
-            line = line.replace('true', 'True').replace('false', 'False')
-            line = eval(line)
-
-            if is_fhir:
-                _list = line.get(list_attribute, [])
-                new_list = []
-                key = None
-                for item in _list:
-                    if 'subject' not in item and 'patient' not in item:
-                        continue
-                    key = (item.get('subject') or item.get('patient'))['reference']
-                    new_list.append(item)
+            if line.strip():
+                yield json_line_key(json_loads(line), is_fhir, list_attribute)
 
-                if not key:
-                    raise Exception(f"No Patient key was found for row {_list}")
-                records[key] = new_list
-            else:
-                patient_details = line.get('patientdetails', {})
-                key = patient_details.get('enterpriseid')
 
-                if not key:
-                    raise Exception(f"No Patient key was found for row {line}")
+def read_json_file(path_to_file, is_fhir=False, list_attribute=None):
+    """ Each of the JSON files given has each line corresponding to
+    all the records related to one patient.
 
-                records[key] = line
+    We want to return a dictionary with the patient's athenapatientid as the key,
+    so we can iterate over each patient when ingesting data.
 
-    return records
+    The returned JsonLinesIndex only parses a patient's line when it is accessed,
+    use iter_json_file to stream through every patient once.
+    """
+    return JsonLinesIndex(path_to_file, is_fhir=is_fhir, list_attribute=list_attribute)
 
 def get_ontologies_token(environment):
     ini = RepositoryIni('../config.ini')
@@ -131,18 +310,74 @@ def load_fhir_settings(environment):
 
     client_id = config("client_id", cast=str)
     client_secret = config("client_secret", cast=str)
-
-    fumage = FHIRHelper({'INSTANCE_NAME': environment, 'CLIENT_ID': client_id, 'CLIENT_SECRET': client_secret})
+    # optional cap on API calls per second against this environment, 0 means unlimited
+    requests_per_second = config("requests_per_second", default=0, cast=float)
+    # number of keep-alive connections held open to each Canvas host
+    pool_size = config("pool_size", default=10, cast=int)
+
+    fumage = FHIRHelper({
+        'INSTANCE_NAME': environment,
+        'CLIENT_ID': client_id,
+        'CLIENT_SECRET': client_secret,
+        'REQUESTS_PER_SECOND': requests_per_second,
+        'POOL_SIZE': pool_size,
+    })
     return fumage
 
+def birthdate_partitions(start_year=1900, step=10):
+    """
+        Disjoint Patient search parameters covering every birthdate, in `step` year ranges,
+        used to split one large Patient search into chunks that can be fetched in parallel
+    """
+    end_year = arrow.now().year + 1
+    years = list(range(start_year, end_year, step)) + [end_year]
+    partitions = [{'birthdate': f'lt{start_year}-01-01'}]
+    for lower, upper in zip(years, years[1:]):
+        partitions.append({'birthdate': [f'ge{lower}-01-01', f'lt{upper}-01-01']})
+    partitions.append({'birthdate': f'ge{end_year}-01-01'})
+    # no range matches a patient without a birthDate
+    partitions.append({'birthdate:missing': 'true'})
+    return partitions
+
+
 class FHIRHelper:
     """
     Helper class to take care of all the FHIR auth and calls
+
+    Every call to Canvas (FHIR, Note API, Commands API) should go through request() so it
+    reuses the pooled keep-alive session, the shared bearer token and the retry policy.
     """
+    # statuses worth retrying with backoff, anything else is returned to the caller.
+    # A 5xx may come after the server acted on the request, so only idempotent methods
+    # retry those; a 429 was rejected before any work and is retried for every method.
+    RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+    ALWAYS_RETRY_STATUS_CODES = {429}
+    IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+    # statuses that mean the server does not take batch Bundles, rather than a passing failure
+    BATCH_UNSUPPORTED_STATUS_CODES = {400, 404, 405, 501}
+    MAX_RETRIES = 5
+    BACKOFF_BASE_SECONDS = 0.5
+    BACKOFF_MAX_SECONDS = 30
+
+    # refresh the token a little before the server expires it
+    TOKEN_EXPIRY_MARGIN_SECONDS = 60
+
     def __init__(self, settings):
         self.client_id = settings.get("CLIENT_ID")
         self.client_secret = settings.get("CLIENT_SECRET")
         self.instance_name = settings.get("INSTANCE_NAME")
+        self.rate_limiter = get_rate_limiter(self.instance_name, settings.get("REQUESTS_PER_SECOND"))
+        self.token_lock = threading.Lock()
+        self.token_expires_at = None
+
+        # None until the first batch Bundle tells us whether the server accepts them
+        self.batch_supported = None
+
+        pool_size = settings.get("POOL_SIZE") or 10
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
 
         if self.instance_name == "localhost":
             self.base_url = "http://localhost:8000"
@@ -156,13 +391,80 @@ class FHIRHelper:
             raise Exception(
                 f"Unable to perform FHIR API requests without CLIENT_ID, CLIENT_SECRET, and INSTANCE_NAME. \n"
             )
+
+    def throttle(self):
+        """
+        Block until the environment's rate limiter allows another API call.
+        """
+        self.rate_limiter.acquire()
+
+    def refresh_token(self, stale_token):
+        """
+        Refresh the bearer token after a 401. When several threads see the same
+        expired token only the first one requests a new one.
+        """
+        with self.token_lock:
+            if self.token == stale_token:
+                self.get_fhir_api_token()
+
+    def token_expired(self):
+        return self.token_expires_at is not None and time.monotonic() >= self.token_expires_at
+
+    def backoff(self, attempt, response):
+        """
+        Sleep before retrying a 429/5xx. Honors Retry-After when the server sends one,
+        otherwise uses exponential backoff with full jitter.
+        """
+        retry_after = response.headers.get("Retry-After")
+        if retry_after and retry_after.isdigit():
+            delay = int(retry_after)
+        else:
+            delay = random.uniform(0, min(self.BACKOFF_MAX_SECONDS, self.BACKOFF_BASE_SECONDS * 2 ** attempt))
+        print(f'    Received {response.status_code} from {response.url}, retrying in {delay:.1f}s')
+        time.sleep(delay)
+
+    def request(self, method, url, **kwargs) -> requests.Response:
+        """
+        Perform an authenticated call against Canvas on the pooled session.
+
+        Refreshes the bearer token when it has expired or the server answers 401,
+        and retries 429 responses, and 5xx responses to idempotent methods, with
+        jittered backoff.
+        """
+        retry_status_codes = (
+            self.RETRY_STATUS_CODES if method.upper() in self.IDEMPOTENT_METHODS
+            else self.ALWAYS_RETRY_STATUS_CODES
+        )
+        extra_headers = kwargs.pop("headers", None) or {}
+        attempt = 0
+        refreshed = False
+        while True:
+            if self.token_expired():
+                self.refresh_token(self.token)
+
+            token = self.token
+            self.throttle()
+            response = self.session.request(method, url, headers={**self.headers, **extra_headers}, **kwargs)
+
+            if response.status_code == 401 and not refreshed:
+                self.refresh_token(token)
+                refreshed = True
+                continue
+
+            if response.status_code in retry_status_codes and attempt < self.MAX_RETRIES:
+                self.backoff(attempt, response)
+                attempt += 1
+                continue
+
+            return response
+
     def get_fhir_api_token(self) -> str | None:
         """
         Requests and returns a bearer token for authentication to FHIR.
         """
         grant_type = "client_credentials"
 
-        token_response = requests.post(
+        token_response = self.session.post(
             f"{self.base_url}/auth/token/",
             headers={"Content-Type": "application/x-www-form-urlencoded"},
             data=f"grant_type={grant_type}&client_id={self.client_id}&client_secret={self.client_secret}",
@@ -175,8 +477,11 @@ class FHIRHelper:
                 f"match what is defined for your FHIR API third-party application (found here: {self.base_url}/auth/applications/)"
             )
 
-        token = token_response.json().get("access_token")
+        token_json = token_response.json()
+        token = token_json.get("access_token")
         self.token = token
+        if expires_in := token_json.get("expires_in"):
+            self.token_expires_at = time.monotonic() + int(expires_in) - self.TOKEN_EXPIRY_MARGIN_SECONDS
         self.headers = {
             "Authorization": f"Bearer {token}",
             "Accept": "application/json",
@@ -188,8 +493,8 @@ class FHIRHelper:
         """
         Given a resource_type (str) and resource_id (str), returns the requested FHIR resource.
         """
-        return requests.get(
-            f"{self.base_fhir_url}/{resource_type}/{resource_id}", headers=self.headers
+        return self.request(
+            "GET", f"{self.base_fhir_url}/{resource_type}/{resource_id}"
         )
 
     def search(
@@ -199,18 +504,18 @@ class FHIRHelper:
         Given a resource_type (str) and search_params (dict), searches and returns a bundle of FHIR resources.
         """
         params = urlencode(search_params, doseq=True) if search_params else ""
-        return requests.get(
-            f"{self.base_fhir_url}/{resource_type}?{params}", headers=self.headers
+        return self.request(
+            "GET", f"{self.base_fhir_url}/{resource_type}?{params}"
         )
 
     def create(self, resource_type: str, payload: dict) -> requests.Response:
         """
         Given a resource_type (str) and FHIR resource payload (dict), creates and returns a FHIR resource.
         """
-        return requests.post(
+        return self.request(
+            "POST",
             f"{self.base_fhir_url}/{resource_type}",
             json=payload,
-            headers=self.headers,
         )
 
     def perform_create(self, payload):
@@ -220,25 +525,80 @@ class FHIRHelper:
         """
         response = self.create(payload['resourceType'], payload)
 
-        if response.status_code == 401:
-            self.get_fhir_api_token()
-            return self.perform_create(payload)
-
         if response.status_code != 201:
             raise Exception(f"Failed to perform {response.url}. \n Fumage Correlation ID: {response.headers.get('fumage-correlation-id', '')} \n {response.text}")
 
         return response.headers['location'].replace(f'http://fumage-{self.instance_name}.canvasmedical.com/{payload["resourceType"]}/', '').replace('/_history/1', '').replace(f'http://localhost:8888/{payload["resourceType"]}/', '')
 
 
+    def perform_create_batch(self, payloads):
+        """
+        Create several resources with one FHIR batch Bundle instead of one request each.
+
+        Returns one (canvas_id, error) tuple per payload, in the same order, so callers
+        can map each entry back to its source row. Falls back to perform_create per payload
+        when the server does not accept batch Bundles, and raises if the Bundle failed for
+        any other reason (throttling, server errors).
+        """
+        if self.batch_supported is not False:
+            bundle = {
+                "resourceType": "Bundle",
+                "type": "batch",
+                "entry": [
+                    {
+                        "resource": payload,
+                        "request": {"method": "POST", "url": payload["resourceType"]}
+                    } for payload in payloads
+                ]
+            }
+            response = self.request("POST", self.base_fhir_url, json=bundle)
+
+            if response.status_code == 200:
+                self.batch_supported = True
+                entries = response.json().get("entry", [])
+                return [
+                    self.parse_batch_entry(payload, entries[i] if i < len(entries) else None)
+                    for i, payload in enumerate(payloads)
+                ]
+
+            if response.status_code not in self.BATCH_UNSUPPORTED_STATUS_CODES:
+                # throttled or a server error: falling back would resend every resource to a
+                # struggling server, and some of the Bundle may already have been created
+                raise Exception(f"Failed to perform batch Bundle ({response.status_code}). \n Fumage Correlation ID: {response.headers.get('fumage-correlation-id', '')} \n {response.text}")
+
+            if self.batch_supported is None:
+                print(f"    Batch Bundles are not accepted ({response.status_code}), creating resources one at a time")
+                self.batch_supported = False
+
+        results = []
+        for payload in payloads:
+            try:
+                results.append((self.perform_create(payload), None))
+            except Exception as e:
+                results.append((None, e))
+        return results
+
+    def parse_batch_entry(self, payload, entry):
+        """
+        Turn one entry of a batch-response Bundle into a (canvas_id, error) tuple
+        """
+        if not entry:
+            return None, Exception("No response entry returned for resource in batch Bundle")
+
+        entry_response = entry.get("response", {})
+        status = entry_response.get("status", "")
+        if not status.startswith("201"):
+            return None, Exception(f"Failed to create {payload['resourceType']} in batch Bundle. \n {status} {json.dumps(entry_response.get('outcome', ''))}")
+
+        # location looks like Patient/<id>/_history/1, possibly prefixed with the base url
+        location = entry_response.get("location", "")
+        return location.split(f"{payload['resourceType']}/", 1)[-1].split("/_history")[0], None
+
     def perform_create_lab_report(self, payload):
         """
         This has different endpoint and response requirements from a regular perform_create.
         """
         response = self.create("DiagnosticReport/$create-lab-report", payload)
-        if response.status_code == 401:
-            self.get_fhir_api_token()
-            return self.perform_create_lab_report(payload)
-
         if response.status_code != 201:
             raise Exception(f"Failed to perform {response.url}. \n Fumage Correlation ID: {response.headers.get('fumage-correlation-id', '')} \n {response.text}")
 
@@ -252,49 +612,111 @@ class FHIRHelper:
         """
         Given a resource_type (str), resource_id (str), and FHIR resource payload (dict), updates and returns a FHIR resource.
         """
-        return requests.put(
+        return self.request(
+            "PUT",
             f"{self.base_fhir_url}/{resource_type}/{resource_id}",
             json=payload,
-            headers=self.headers,
         )
 
-    def build_patient_external_identifier_map(self, system, output_file):
+    def build_patient_external_identifier_map(self, system, output_file, page_size=1000, workers=4, partitions=None):
         """ When ingesting patients from an EMR into Canvas, it is best that the
         unique identifier for that patient in the EMR is loaded as an identifier in the
         FHIR Patient Create endpoint. So this function will create a JSON
         map of the EMR identifier to the canvas patient key.
 
         This will help ensure all the historic records are added to the correct patient chart
-        """
 
-        search_parameters = {
-            '_sort': '_id',
-            '_count': 100,
-            '_offset': 0,
-            'identifier': f'{system}|'
-        }
+        The search is split into birthdate ranges (see birthdate_partitions) that are fetched
+        concurrently, each one following the server's `next` links instead of deep _offset paging.
+        Each finished partition is appended to a journal next to output_file, so an interrupted
+        build skips the partitions it already fetched when run again. The map itself is merged
+        and saved once, after every partition is done.
 
-        patients = {}
-        while True:
+        Once a build has completed, later builds only search patients updated since it
+        started (`_lastUpdated`), which is kept in `<output_file>.last_updated`.
+        """
+        patients = fetch_from_json(output_file) if os.path.isfile(output_file) else {}
+        known = len(patients)
+        journal_file = f"{output_file}.partial"
+        last_updated_file = f"{output_file}.last_updated"
+        lock = threading.Lock()
+
+        since = None
+        if patients and os.path.isfile(last_updated_file):
+            with open(last_updated_file, 'r') as f:
+                since = f.read().strip() or None
+
+        started_at = None
+        fetched_partitions = set()
+        if os.path.isfile(journal_file):
+            with open(journal_file, 'r') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        # the last line of an interrupted run may be cut short
+                        continue
+                    if 'started_at' in entry:
+                        started_at = entry['started_at']
+                    else:
+                        fetched_partitions.add(entry['partition'])
+                        patients.update(entry['patients'])
+            print(f'Resuming patient map build, {len(fetched_partitions)} partitions already fetched')
+
+        journal = open(journal_file, 'a', encoding='utf-8')
+        if started_at is None:
+            started_at = arrow.utcnow().format('YYYY-MM-DDTHH:mm:ss') + 'Z'
+            journal.write(json.dumps({'started_at': started_at}) + '\n')
+
+        def fetch_partition(partition_params):
+            partition = json.dumps(partition_params, sort_keys=True)
+            if partition in fetched_partitions:
+                return
+
+            search_parameters = {
+                '_sort': '_id',
+                '_count': page_size,
+                'identifier': f'{system}|',
+                **partition_params,
+            }
+            if since:
+                search_parameters['_lastUpdated'] = f'ge{since}'
+            found = {}
             response = self.search("Patient", search_parameters)
-
-            if response.status_code != 200:
-                raise Exception(f"Failed to perform {response.url}. \n Fumage Correlation ID: {response.headers['fumage-correlation-id']} \n {response.text}")
-
-            print(f'Performed search with url: {response.url}')
-            response_json = response.json()
-            for item in response_json['entry']:
-                for identifier in item['resource']['identifier']:
-                    if identifier['system'] == system:
-                        patients[identifier['value']] = item['resource']['id']
-
-            next = any([l['relation'] == 'next' for l in response_json['link']])
-            if not next:
-                break
-            search_parameters['_offset'] = search_parameters['_offset'] + search_parameters['_count']
-
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(patients, f, ensure_ascii=False, indent=4)
+            while True:
+                if response.status_code != 200:
+                    raise Exception(f"Failed to perform {response.url}. \n Fumage Correlation ID: {response.headers.get('fumage-correlation-id', '')} \n {response.text}")
+
+                print(f'Performed search with url: {response.url}')
+                response_json = response.json()
+                for item in response_json.get('entry', []):
+                    for identifier in item['resource'].get('identifier', []):
+                        if identifier.get('system') == system:
+                            found[identifier['value']] = item['resource']['id']
+
+                next_url = next((l['url'] for l in response_json.get('link', []) if l['relation'] == 'next'), None)
+                if not next_url:
+                    break
+                response = self.request("GET", next_url)
+
+            with lock:
+                patients.update(found)
+                journal.write(json.dumps({'partition': partition, 'patients': found}) + '\n')
+                journal.flush()
+
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                # list() re-raises the first failure
+                list(executor.map(fetch_partition, partitions or birthdate_partitions()))
+        finally:
+            journal.close()
+
+        write_json_atomically(output_file, patients)
+        with open(last_updated_file, 'w') as f:
+            f.write(started_at)
+        os.remove(journal_file)
+
+        print(f'Patient map has {len(patients)} patients ({len(patients) - known} new)')
 
     def does_appointment_already_exists(self, start_time, canvas_patient_key):
         """
@@ -331,11 +753,11 @@ class FHIRHelper:
 
         base_url = f"{self.base_url}/core/api/notes/v1/Note/{note_id}"
 
-        check_in_response = requests.request("PATCH", base_url, headers=self.headers, data=json.dumps({"stateChange": "CVD"}))
+        check_in_response = self.request("PATCH", base_url, data=json.dumps({"stateChange": "CVD"}))
         if check_in_response.status_code != 200 and 'CVD -> CVD' not in check_in_response.text:
             raise Exception(f"Failed to perform {check_in_response.url}. \n {check_in_response.text}")
 
-        lock_response = requests.request("PATCH", base_url, headers=self.headers, data=json.dumps({"stateChange": "LKD"}))
+        lock_response = self.request("PATCH", base_url, data=json.dumps({"stateChange": "LKD"}))
         if lock_response.status_code != 200:
             raise Exception(f"Failed to perform {lock_response.url}. \n {lock_response.text}")
 
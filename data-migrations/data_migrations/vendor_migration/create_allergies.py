@@ -1,5 +1,6 @@
 import csv
-from data_migrations.utils import fetch_from_json, fetch_complete_csv_rows, load_fhir_settings
+from data_migrations.utils import fetch_from_json, load_fhir_settings
+from data_migrations.template_migration.checkpoint import CheckpointStore
 from data_migrations.template_migration.allergy import AllergyLoaderMixin
 from data_migrations.template_migration.mapping_review import AllergyReview
 from utils import VendorHelper
@@ -27,6 +28,7 @@ class AllergyLoader(AllergyLoaderMixin, AllergyReview):
         self.error_file = f'results/errored_{self.data_type}.csv'
         self.done_file = f'results/done_{self.data_type}.csv'
         self.ignore_file = f'results/ignored_{self.data_type}.csv'
+        self.checkpoint_file = 'results/checkpoint.sqlite3'
 
         self.environment = environment
         self.fumage_helper = load_fhir_settings(environment)
@@ -35,7 +37,8 @@ class AllergyLoader(AllergyLoaderMixin, AllergyReview):
         # helper class to perform the extraction
         self.vendor_helper = VendorHelper(environment)
 
-        self.done_records = fetch_complete_csv_rows(self.done_file)
+        self.checkpoint = CheckpointStore(self.checkpoint_file, self.data_type, legacy_done_file=self.done_file)
+        self.done_records = self.checkpoint
         self.patient_map = fetch_from_json(self.patient_map_file)
         self.note_map = fetch_from_json(self.note_map_file)
         self.doctor_map = fetch_from_json("mappings/doctor_map.json")
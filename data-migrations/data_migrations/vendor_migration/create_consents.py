@@ -1,5 +1,6 @@
 import csv
-from data_migrations.utils import fetch_from_json, fetch_complete_csv_rows, load_fhir_settings
+from data_migrations.utils import fetch_from_json, load_fhir_settings
+from data_migrations.template_migration.checkpoint import CheckpointStore
 from data_migrations.template_migration.consent import ConsentLoaderMixin
 from utils import VendorHelper
 
@@ -19,6 +20,7 @@ class ConsentLoader(ConsentLoaderMixin):
         self.error_file = f'results/errored_{self.data_type}.csv'
         self.done_file = f'results/done_{self.data_type}.csv'
         self.ignore_file = f'results/ignored_{self.data_type}.csv'
+        self.checkpoint_file = 'results/checkpoint.sqlite3'
 
         self.environment = environment
         self.fumage_helper = load_fhir_settings(environment)
@@ -27,7 +29,8 @@ class ConsentLoader(ConsentLoaderMixin):
         # helper class to perform the extraction
         self.vendor_helper = VendorHelper(environment)
 
-        self.done_records = fetch_complete_csv_rows(self.done_file)
+        self.checkpoint = CheckpointStore(self.checkpoint_file, self.data_type, legacy_done_file=self.done_file)
+        self.done_records = self.checkpoint
         self.patient_map = fetch_from_json(self.patient_map_file)
         self.documents_dir = "PHI/consent_documents"
 
@@ -1,5 +1,6 @@
 import csv
-from data_migrations.utils import fetch_from_json, fetch_complete_csv_rows, load_fhir_settings
+from data_migrations.utils import fetch_from_json, load_fhir_settings
+from data_migrations.template_migration.checkpoint import CheckpointStore
 from data_migrations.template_migration.coverage import CoverageLoaderMixin
 from utils import VendorHelper
 
@@ -20,6 +21,7 @@ class CoverageLoader(CoverageLoaderMixin):
         self.error_file = f'results/errored_{self.data_type}.csv'
         self.done_file = f'results/done_{self.data_type}.csv'
         self.ignore_file = f'results/ignored_{self.data_type}.csv'
+        self.checkpoint_file = 'results/checkpoint.sqlite3'
 
         self.environment = environment
         self.fumage_helper = load_fhir_settings(environment)
@@ -28,7 +30,8 @@ class CoverageLoader(CoverageLoaderMixin):
         # helper class to perform the extraction
         self.vendor_helper = VendorHelper(environment)
 
-        self.done_records = fetch_complete_csv_rows(self.done_file)
+        self.checkpoint = CheckpointStore(self.checkpoint_file, self.data_type, legacy_done_file=self.done_file)
+        self.done_records = self.checkpoint
         self.patient_map = fetch_from_json(self.patient_map_file)
         self.payor_map = fetch_from_json(self.payor_map_file)
 
@@ -1,2 +1,7 @@
 from chart_command_search.context.patient_context import fetch_patient_context
 from chart_command_search.context.serialization import serialize_results
+from chart_command_search.context.snapshot import (
+    ContextSnapshot,
+    invalidate_context_sections,
+    patient_context_snapshot,
+)
@@ -0,0 +1,98 @@
+"""Cached, versioned patient context for AI chart search.
+
+Building the full patient context takes a couple of dozen queries, and the
+serialized result is the bulk of every AI search prompt. Each section's JSON
+is cached on its own; chart-change events (see handlers/patient_context_sync)
+drop just the sections they affect, so a repeat question re-fetches and
+re-serializes only what changed. Sections are joined in SECTIONS order — the
+rarely changing ones first — so unchanged charts give byte-identical prompt
+prefixes the LLM can serve from its prompt cache.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+from datetime import date
+from typing import Any, Iterable, NamedTuple
+
+from canvas_sdk.caching.plugins import get_cache
+
+from chart_command_search.context.patient_context import (
+    SECTIONS,
+    WINDOWED_SECTIONS,
+    fetch_context_section,
+)
+
+# Bump when a section's content or format changes; older entries are ignored.
+CONTEXT_VERSION = 1
+# Backstop for changes no event reports (e.g. patient settings)
+SECTION_TTL_SECONDS = 6 * 60 * 60
+
+
+class ContextSnapshot(NamedTuple):
+    version: str  # digest of `json`; equal versions mean an identical prompt prefix
+    json: str
+    rebuilt: tuple[str, ...]  # sections that weren't cached and were fetched
+
+
+def patient_context_snapshot(patient_id: str) -> ContextSnapshot:
+    """The patient's serialized AI context, fetching only sections not in the cache."""
+    cache = get_cache()
+    keys = {name: _section_key(patient_id, name) for name in SECTIONS}
+    cached = _get_many(cache, list(keys.values()))
+
+    fragments: list[str] = []
+    fresh: dict[str, str] = {}
+    rebuilt: list[str] = []
+    for name, key in keys.items():
+        fragment = cached.get(key)
+        if fragment is None:
+            part = fetch_context_section(patient_id, name)
+            rebuilt.append(name)
+            fragment = json.dumps(part or {}, separators=(",", ":"))[1:-1]
+            if part is not None:
+                # A section that failed to load is retried on the next request
+                fresh[key] = fragment
+        if fragment:
+            fragments.append(fragment)
+    if fresh:
+        cache.set_many(fresh, timeout_seconds=SECTION_TTL_SECONDS)
+
+    text = "{" + ",".join(fragments) + "}"
+    return ContextSnapshot(
+        version=hashlib.sha256(text.encode()).hexdigest()[:16],
+        json=text,
+        rebuilt=tuple(rebuilt),
+    )
+
+
+def invalidate_context_sections(patient_id: str, sections: Iterable[str]) -> None:
+    """Drop cached sections of a patient's context so the next search rebuilds them."""
+    cache = get_cache()
+    for name in sections:
+        cache.delete(_section_key(patient_id, name))
+
+
+def _get_many(cache: Any, keys: list[str]) -> dict[str, Any]:
+    """``cache.get_many`` keyed by the keys we asked for.
+
+    The plugin cache returns its keys with the plugin prefix prepended, so
+    strip leading segments until each one matches a requested key.
+    """
+    requested = set(keys)
+    result: dict[str, Any] = {}
+    for full_key, value in (cache.get_many(keys) or {}).items():
+        key = full_key
+        while key not in requested and ":" in key:
+            key = key.split(":", 1)[1]
+        if key in requested:
+            result[key] = value
+    return result
+
+
+def _section_key(patient_id: str, name: str) -> str:
+    key = f"patient_context:v{CONTEXT_VERSION}:{patient_id}:{name}"
+    if name in WINDOWED_SECTIONS:
+        # The window moves daily; yesterday's entry simply stops being read.
+        key += f":{date.today().isoformat()}"
+    return key
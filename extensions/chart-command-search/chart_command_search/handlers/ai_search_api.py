@@ -14,7 +14,7 @@ from canvas_sdk.handlers.simple_api import SimpleAPIRoute, StaffSessionAuthMixin
 from logger import log
 
 from chart_command_search.context import (
-    fetch_patient_context,
+    patient_context_snapshot,
     serialize_results,
 )
 from chart_command_search.context.patient_context import AI_DATE_RANGE_DAYS
@@ -199,6 +199,26 @@ CRITICAL: Your entire response must be parseable by JSON.parse(). \
 Do not write anything outside the JSON object."""
 
 
+class _PromptCachingAnthropic(LlmAnthropic):
+    """Anthropic client that marks the end of the stable prompt prefix for caching.
+
+    The system prompt and patient context are the same for every question on an
+    unchanged chart; a cache breakpoint after the context lets Anthropic serve
+    that prefix from its prompt cache instead of billing it again.
+    """
+
+    cache_breakpoint = ""
+
+    def to_dict(self) -> dict:
+        request = super().to_dict()
+        for message in request["messages"]:
+            for part in message["content"]:
+                if part.get("type") == "text" and part.get("text") == self.cache_breakpoint:
+                    part["cache_control"] = {"type": "ephemeral"}
+                    return request
+        return request
+
+
 class AIChartSearchAPI(StaffSessionAuthMixin, SimpleAPIRoute):
     """AI-powered natural language chart search endpoint."""
 
@@ -269,8 +289,7 @@ class AIChartSearchAPI(StaffSessionAuthMixin, SimpleAPIRoute):
                 )
             ]
 
-        patient_ctx = fetch_patient_context(patient_id)
-        ctx_json = json.dumps(patient_ctx, separators=(",", ":"))
+        snapshot = patient_context_snapshot(patient_id)
 
         today = date.today()
         date_from = str(today - timedelta(days=AI_DATE_RANGE_DAYS))
@@ -294,13 +313,16 @@ class AIChartSearchAPI(StaffSessionAuthMixin, SimpleAPIRoute):
 
         serialized = serialize_results(all_results) if all_results else "[]"
 
+        # The context block ends the prefix that stays identical between questions;
+        # the date and chart entries go after it so they don't invalidate it.
+        context_block = f"PATIENT CONTEXT:\n{snapshot.json}"
         data_message = (
             f"TODAY'S DATE: {today.isoformat()}\n\n"
-            f"PATIENT CONTEXT:\n{ctx_json}\n\n"
             f"CHART ENTRIES:\n{serialized}"
         )
 
         messages: list[dict[str, str]] = [
+            {"role": "user", "content": context_block},
             {"role": "user", "content": data_message},
             {"role": "assistant", "content": "I have the patient's chart data. What would you like to know?"},
         ]
@@ -314,12 +336,13 @@ class AIChartSearchAPI(StaffSessionAuthMixin, SimpleAPIRoute):
         messages.append({"role": "user", "content": query})
 
         try:
-            client = LlmAnthropic(LlmSettingsAnthropic(
+            client = _PromptCachingAnthropic(LlmSettingsAnthropic(
                 api_key=api_key,
                 model=CLAUDE_MODEL,
                 temperature=0.0,
                 max_tokens=2048,
             ))
+            client.cache_breakpoint = context_block
             client.set_system_prompt([SYSTEM_PROMPT])
             for msg in messages:
                 if msg["role"] == "user":
@@ -418,7 +441,9 @@ class AIChartSearchAPI(StaffSessionAuthMixin, SimpleAPIRoute):
             payload["search_errors"] = search_errors
         user_id = self.request.headers.get("canvas-logged-in-user-id", "")
         log.info(
-            "api_request endpoint=/ai-search patient_id=%s user=%s query=%s results=%d",
+            "api_request endpoint=/ai-search patient_id=%s user=%s query=%s results=%d "
+            "context_version=%s context_rebuilt=%s",
             patient_id, user_id, query[:100], len(ranked_results),
+            snapshot.version, ",".join(snapshot.rebuilt) or "-",
         )
         return [JSONResponse(payload)]
@@ -9,6 +9,9 @@ from canvas_sdk.v1.data.note import NoteType
 from canvas_sdk.v1.data.staff import Staff
 from logger import log
 
+from chart_command_search.searchers.constants import ALL_CATEGORY_LIMIT
+from chart_command_search.searchers.index import ensure_patient_index
+
 APP_CLASS_PATH = "chart_command_search.handlers.application:ChartSearchApp"
 
 
@@ -22,6 +25,9 @@ class ChartSearchApp(Application):
             return []
         app_id = base64.b64encode(APP_CLASS_PATH.encode()).decode()
 
+        # Index the chart before the first keystroke; searches scan until it exists
+        ensure_patient_index(patient_id)
+
         providers = []
         try:
             for s in Staff.objects.filter(active=True).order_by("last_name", "first_name")[:200]:
@@ -64,6 +70,7 @@ class ChartSearchApp(Application):
                 "note_types": note_types,
                 "practice_prompts": practice_prompts,
                 "ai_enabled": ai_enabled,
+                "all_category_limit": ALL_CATEGORY_LIMIT,
             },
         )
         return LaunchModalEffect(
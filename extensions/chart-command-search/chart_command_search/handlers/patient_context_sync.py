@@ -0,0 +1,84 @@
+"""Drop cached AI context sections as the chart data behind them changes.
+
+Each event maps to the context sections it can affect; only those are
+rebuilt on the next AI search. Sections no event covers fall back to the
+snapshot's TTL.
+"""
+
+from canvas_sdk.effects import Effect
+from canvas_sdk.events import EventType
+from canvas_sdk.handlers import BaseHandler
+
+from chart_command_search.context import invalidate_context_sections
+
+_COMMAND_EVENT_SUFFIXES = (
+    "_COMMAND__POST_COMMIT",
+    "_COMMAND__POST_ENTER_IN_ERROR",
+    "_COMMAND__POST_DELETE",
+)
+
+# Event name prefix -> context sections it invalidates
+_PREFIX_SECTIONS: dict[str, tuple[str, ...]] = {
+    "PATIENT_CREATED": ("demographics",),
+    "PATIENT_UPDATED": ("demographics",),
+    "PATIENT_CONTACT_POINT_": ("contacts",),
+    "PATIENT_ADDRESS_": ("addresses",),
+    "COVERAGE_CREATED": ("coverages",),
+    "COVERAGE_UPDATED": ("coverages",),
+    "CARE_TEAM_MEMBERSHIP_": ("care_team",),
+    "CONSENT_": ("consents",),
+    "ALLERGY_INTOLERANCE_": ("allergies",),
+    "CONDITION_": ("conditions", "assessments"),
+    "MEDICATION_LIST_ITEM_": ("medications",),
+    "IMMUNIZATION_": ("immunizations",),
+    "PRESCRIPTION_": ("prescriptions",),
+    "LAB_ORDER_CREATED": ("lab_orders",),
+    "LAB_ORDER_UPDATED": ("lab_orders",),
+    "LAB_REPORT_": ("labs",),
+    "OBSERVATION_": ("observations",),
+    "VITAL_SIGN_": ("observations",),
+    "CLAIM_CREATED": ("claims",),
+    "CLAIM_UPDATED": ("claims",),
+    "CLAIM_QUEUE_MOVED": ("claims",),
+    # Goals, referrals, imaging orders and assessments have no data events of
+    # their own; the commands that record them stand in.
+    "GOAL_COMMAND": ("goals",),
+    "UPDATE_GOAL_COMMAND": ("goals",),
+    "CLOSE_GOAL_COMMAND": ("goals",),
+    "REFER_COMMAND": ("referrals",),
+    "IMAGING_ORDER_COMMAND": ("imaging_orders",),
+    "ASSESS_COMMAND": ("assessments",),
+}
+
+
+def sections_for_event(name: str) -> tuple[str, ...]:
+    """Context sections affected by the event called `name`."""
+    sections: list[str] = []
+    for prefix, affected in _PREFIX_SECTIONS.items():
+        if not name.startswith(prefix):
+            continue
+        if "_COMMAND" in prefix:
+            if not name.endswith(_COMMAND_EVENT_SUFFIXES):
+                continue
+        elif "__" in name:
+            # Search and selection events of command fields, not data changes
+            continue
+        sections.extend(s for s in affected if s not in sections)
+    return tuple(sections)
+
+
+class InvalidatePatientContext(BaseHandler):
+    """Drop the cached AI context sections a chart change affects."""
+
+    RESPONDS_TO = [name for name in EventType.keys() if sections_for_event(name)]
+
+    def compute(self) -> list[Effect]:
+        name = EventType.Name(self.event.type)
+        if name in ("PATIENT_CREATED", "PATIENT_UPDATED"):
+            patient_id = self.event.target.id
+        else:
+            patient_id = (self.event.context.get("patient") or {}).get("id")
+        if not patient_id:
+            return []
+        invalidate_context_sections(patient_id, sections_for_event(name))
+        return []
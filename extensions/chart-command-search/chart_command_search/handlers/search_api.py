@@ -4,6 +4,7 @@ from __future__ import annotations
 import re
 from datetime import date as _date_cls
 from datetime import timedelta
+from typing import Any
 
 from canvas_sdk.effects import Effect
 from canvas_sdk.effects.simple_api import JSONResponse, Response
@@ -35,11 +36,17 @@ class ChartSearchAPI(StaffSessionAuthMixin, SimpleAPIRoute):
         date_from = str(params.get("date_from", "")).strip()
         date_to = str(params.get("date_to", "")).strip()
         provider_id = str(params.get("provider_id", "")).strip()
+        limit_raw = str(params.get("limit", "")).strip()
+        cursor_raw = str(params.get("cursor", "")).strip()
 
         if not patient_id:
             return [JSONResponse({"error": "patient_id is required"}, status_code=400)]
         if not _UUID_RE.match(patient_id):
             return [JSONResponse({"error": "Invalid patient_id"}, status_code=400)]
+        if limit_raw and not (limit_raw.isdigit() and 0 < int(limit_raw) <= MAX_RESULTS):
+            return [JSONResponse({"error": "Invalid limit"}, status_code=400)]
+        if cursor_raw and not cursor_raw.isdigit():
+            return [JSONResponse({"error": "Invalid cursor"}, status_code=400)]
 
         if date_to:
             try:
@@ -81,7 +88,17 @@ class ChartSearchAPI(StaffSessionAuthMixin, SimpleAPIRoute):
             results.sort(key=lambda r: r.get("date", ""), reverse=True)
             results = results[:MAX_RESULTS]
 
-        payload = {"results": results, "count": len(results)}
+        payload: dict[str, Any] = {}
+        if limit_raw and not is_multi:
+            # One page of a single category; the panel requests each category of an
+            # "all" search separately and merges the pages as they arrive.
+            start = int(cursor_raw or 0)
+            end = start + int(limit_raw)
+            payload["category"] = categories[0]
+            payload["next_cursor"] = str(end) if len(results) > end else None
+            results = results[start:end]
+
+        payload.update({"results": results, "count": len(results)})
         if search_errors:
             payload["search_errors"] = search_errors
         user_id = self.request.headers.get("canvas-logged-in-user-id", "")
@@ -0,0 +1,61 @@
+"""Keep the keyword search index current as chart documents change.
+
+Each handler reindexes the document behind its event (a command also
+refreshes the note it sits in, since notes are found by their commands'
+text). Patients whose chart hasn't been indexed yet are skipped; their index
+is built in full the next time the search app opens. Documents deleted before
+their event is handled are skipped too.
+"""
+
+from canvas_sdk.effects import Effect
+from canvas_sdk.events import EventType
+from canvas_sdk.handlers import BaseHandler
+
+from chart_command_search.searchers.index import (
+    reindex_command,
+    reindex_message,
+    reindex_note,
+)
+
+_COMMAND_EVENT_SUFFIXES = (
+    "_COMMAND__POST_ORIGINATE",
+    "_COMMAND__POST_UPDATE",
+    "_COMMAND__POST_COMMIT",
+    "_COMMAND__POST_ENTER_IN_ERROR",
+    "_COMMAND__POST_DELETE",
+)
+
+
+class IndexCommandChanges(BaseHandler):
+    """Reindex a command (and its note) after any command type changes."""
+
+    RESPONDS_TO = [
+        name for name in EventType.keys() if name.endswith(_COMMAND_EVENT_SUFFIXES)
+    ]
+
+    def compute(self) -> list[Effect]:
+        reindex_command(self.event.target.id)
+        return []
+
+
+class IndexNoteChanges(BaseHandler):
+    """Reindex a note's title and body after it is created or updated."""
+
+    RESPONDS_TO = [
+        EventType.Name(EventType.NOTE_CREATED),
+        EventType.Name(EventType.NOTE_UPDATED),
+    ]
+
+    def compute(self) -> list[Effect]:
+        reindex_note(self.event.target.id)
+        return []
+
+
+class IndexNewMessages(BaseHandler):
+    """Index a message when it is created."""
+
+    RESPONDS_TO = EventType.Name(EventType.MESSAGE_CREATED)
+
+    def compute(self) -> list[Effect]:
+        reindex_message(self.event.target.id)
+        return []
@@ -1,3 +1,4 @@
 from chart_command_search.models.feedback import CustomStaff, SearchFeedback
+from chart_command_search.models.search_index import SearchIndexStatus, SearchIndexTerm
 
-__all__ = ["CustomStaff", "SearchFeedback"]
+__all__ = ["CustomStaff", "SearchFeedback", "SearchIndexStatus", "SearchIndexTerm"]
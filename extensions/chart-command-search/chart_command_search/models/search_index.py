@@ -0,0 +1,42 @@
+from canvas_sdk.v1.data.base import CustomModel
+from django.db.models import (
+    DateTimeField,
+    Index,
+    IntegerField,
+    JSONField,
+    TextField,
+)
+
+
+class SearchIndexTerm(CustomModel):
+    """One token of one field of an indexed chart document (command, note, message).
+
+    `positions` holds the character offset of every occurrence of the token in
+    the field's text, so result snippets can be cut without rescanning it.
+    """
+
+    patient_id = TextField()
+    doc_kind = TextField()
+    doc_dbid = IntegerField()
+    field = TextField()
+    token = TextField()
+    positions = JSONField(default=list)
+
+    class Meta:
+        indexes = [
+            Index(fields=["patient_id", "doc_kind", "token"]),
+            Index(fields=["doc_kind", "doc_dbid"]),
+        ]
+
+
+class SearchIndexStatus(CustomModel):
+    """Marks a patient's chart as fully indexed with a given tokenizer version."""
+
+    patient_id = TextField()
+    version = IntegerField()
+    indexed_at = DateTimeField()
+
+    class Meta:
+        indexes = [
+            Index(fields=["patient_id"]),
+        ]
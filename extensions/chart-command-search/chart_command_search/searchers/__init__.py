@@ -16,6 +16,7 @@ from chart_command_search.searchers.helpers import (
     note_type_name,
     parse_multi,
     resolve_command_query,
+    snippet_at,
     staff_name,
     strip_html,
 )
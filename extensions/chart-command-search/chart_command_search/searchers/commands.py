@@ -32,6 +32,7 @@ from chart_command_search.searchers.helpers import (
     parse_multi,
     resolve_command_query,
 )
+from chart_command_search.searchers.index import KIND_COMMAND, by_rank, lookup
 from chart_command_search.searchers.types import Result
 
 
@@ -59,9 +60,10 @@ def search_commands(
             q_filter |= Q(entered_in_error=True)
         if q_filter:
             qs = qs.filter(q_filter)
+    hits = lookup(patient_id, KIND_COMMAND, q) if q else None
     if q:
         _, matched_keys = resolve_command_query(q)
-        q_match = Q(data__icontains=q)
+        q_match = Q(data__icontains=q) if hits is None else Q(dbid__in=list(hits))
         if matched_keys:
             q_match |= Q(schema_key__in=matched_keys)
         qs = qs.filter(q_match)
@@ -75,6 +77,8 @@ def search_commands(
     qs = qs.order_by("-note__datetime_of_service")[:MAX_RESULTS]
 
     cmds = list(qs)
+    if hits:
+        cmds = by_rank(cmds, hits)
 
     lab_note_dbids = [
         cmd.note.dbid
@@ -217,9 +221,10 @@ def search_medications(
 
     statuses = parse_multi(status)
 
+    hits = lookup(patient_id, KIND_COMMAND, q) if q else None
     if q:
         _, matched_keys = resolve_command_query(q)
-        q_match = Q(data__icontains=q)
+        q_match = Q(data__icontains=q) if hits is None else Q(dbid__in=list(hits))
         if matched_keys:
             q_match |= Q(schema_key__in=matched_keys & _MED_COMMAND_KEYS)
         qs = qs.filter(q_match)
@@ -235,6 +240,8 @@ def search_medications(
     commands = list(qs)
     if not commands:
         return []
+    if hits:
+        commands = by_rank(commands, hits)
 
     note_dbids = {cmd.note.dbid for cmd in commands if cmd.note}
     prescriptions_map: dict[int, list[Any]] = {}
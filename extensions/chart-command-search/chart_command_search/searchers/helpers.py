@@ -118,8 +118,15 @@ def match_snippet(q: str, text: str, max_len: int = 120) -> str:
     idx = lower.find(q.lower())
     if idx < 0:
         return ""
-    start = max(0, idx - 40)
-    end = min(len(text), idx + len(q) + 80)
+    return snippet_at(text, idx, len(q), max_len)
+
+
+def snippet_at(text: str, offset: int, length: int, max_len: int = 120) -> str:
+    """Snippet of `text` around the match at [offset, offset + length)."""
+    if not text or offset < 0 or offset >= len(text):
+        return ""
+    start = max(0, offset - 40)
+    end = min(len(text), offset + length + 80)
     snippet = text[start:end].strip()
     if start > 0:
         snippet = "..." + snippet
@@ -0,0 +1,314 @@
+"""Per-patient inverted index for keyword search.
+
+Scanning every command, note and message of a patient with `icontains` on each
+keystroke grows with the size of the chart, and JSON substring matches can't
+use a database index. Instead, the text of each document is split into
+lowercase word tokens, stored as SearchIndexTerm rows keyed by patient and
+token. A query becomes one prefix lookup per query word; documents are ranked
+by how often (and where) the words occur, and the searchers then load only the
+matching rows.
+
+The index for a patient is built when the search app opens on their chart, and
+rebuilt after REBUILD_AFTER as a backstop for missed events. The
+search_index_sync handlers keep it current in between. Until a patient is
+indexed, lookup() returns None and the searchers fall back to substring scans.
+"""
+from __future__ import annotations
+
+import re
+from datetime import datetime, timedelta, timezone
+from typing import Any, Iterable, TypedDict
+
+from canvas_sdk.v1.data.command import Command
+from canvas_sdk.v1.data.message import Message
+from canvas_sdk.v1.data.note import Note
+
+from chart_command_search.models.search_index import SearchIndexStatus, SearchIndexTerm
+from chart_command_search.searchers.helpers import extract_body_text, strip_html
+
+# Bump when tokenization or document fields change; stale indexes are rebuilt.
+INDEX_VERSION = 1
+REBUILD_AFTER = timedelta(days=7)
+# Best-ranked documents handed to a searcher's query per category
+MAX_CANDIDATES = 500
+
+KIND_COMMAND = "command"
+KIND_NOTE = "note"
+KIND_MESSAGE = "message"
+
+_TOKEN_RE = re.compile(r"\w+")
+_MAX_TOKEN_LEN = 64
+_BULK_CHUNK = 1000
+_FIELD_WEIGHTS: dict[str, int] = {"title": 3, "body": 2, "content": 2}
+# Staff names a message is found by, besides its content
+_MESSAGE_NAME_FIELDS = (
+    "sender__staff__first_name",
+    "sender__staff__last_name",
+    "recipient__staff__first_name",
+    "recipient__staff__last_name",
+)
+
+
+class IndexHit(TypedDict):
+    score: int
+    spans: dict[str, tuple[int, int]]  # field -> (offset, length) of the first match
+
+
+def tokenize(text: str) -> list[tuple[str, int]]:
+    """Lowercase word tokens of `text` with their character offsets."""
+    return [
+        (m.group().lower(), m.start())
+        for m in _TOKEN_RE.finditer(text)
+        if len(m.group()) <= _MAX_TOKEN_LEN
+    ]
+
+
+def lookup(
+    patient_id: str, kind: str, q: str, within: Iterable[int] | None = None
+) -> dict[int, IndexHit] | None:
+    """Documents of `kind` containing every word of `q` as a word prefix.
+
+    Keyed by document dbid, best first, at most MAX_CANDIDATES. `within`
+    limits the candidates to those dbids (e.g. a lazy queryset of one note
+    category), so documents the caller would filter out don't take up the cap.
+    None when the patient's chart isn't indexed (or `q` has no words): search
+    by scanning.
+    """
+    words = list(dict.fromkeys(token for token, _ in tokenize(q)))
+    if not words or not is_indexed(patient_id):
+        return None
+
+    filters: dict[str, Any] = {"patient_id": patient_id, "doc_kind": kind}
+    if within is not None:
+        filters["doc_dbid__in"] = list(within)
+
+    matched: dict[int, IndexHit] | None = None
+    for word in words:
+        word_hits: dict[int, IndexHit] = {}
+        for dbid, field, token, positions in SearchIndexTerm.objects.filter(
+            **filters, token__startswith=word
+        ).values_list("doc_dbid", "field", "token", "positions"):
+            if not positions:
+                continue
+            exact = 2 if token == word else 1
+            hit = word_hits.setdefault(dbid, IndexHit(score=0, spans={}))
+            hit["score"] += _FIELD_WEIGHTS.get(field, 1) * exact * len(positions)
+            span = hit["spans"].get(field)
+            if span is None or positions[0] < span[0]:
+                hit["spans"][field] = (positions[0], len(token))
+        if matched is None:
+            matched = word_hits
+        else:
+            for dbid in list(matched):
+                other = word_hits.get(dbid)
+                if other is None:
+                    del matched[dbid]
+                    continue
+                matched[dbid]["score"] += other["score"]
+                for field, span in other["spans"].items():
+                    matched[dbid]["spans"].setdefault(field, span)
+        if not matched:
+            return {}
+
+    ranked = sorted((matched or {}).items(), key=lambda item: -item[1]["score"])
+    return dict(ranked[:MAX_CANDIDATES])
+
+
+def by_rank(objects: list[Any], hits: dict[int, IndexHit]) -> list[Any]:
+    """Order loaded rows by index score; ties (and rows matched otherwise) keep their order."""
+    return sorted(
+        objects,
+        key=lambda obj: -hits[obj.dbid]["score"] if obj.dbid in hits else 0,
+    )
+
+
+def is_indexed(patient_id: str) -> bool:
+    return SearchIndexStatus.objects.filter(
+        patient_id=patient_id, version=INDEX_VERSION
+    ).exists()
+
+
+def ensure_patient_index(patient_id: str) -> bool:
+    """Build the patient's index unless a current one exists. Returns True if built."""
+    status = (
+        SearchIndexStatus.objects.filter(patient_id=patient_id)
+        .values_list("version", "indexed_at")
+        .first()
+    )
+    if status is not None:
+        version, indexed_at = status
+        if version == INDEX_VERSION and indexed_at > _now() - REBUILD_AFTER:
+            return False
+    build_patient_index(patient_id)
+    return True
+
+
+def build_patient_index(patient_id: str) -> int:
+    """(Re)index every command, note and message of a patient. Returns the term rows written."""
+    # No transactions in the sandbox: drop the status first so searches scan
+    # instead of reading a half-written index until the rebuild completes.
+    SearchIndexStatus.objects.filter(patient_id=patient_id).delete()
+    SearchIndexTerm.objects.filter(patient_id=patient_id).delete()
+
+    command_text: dict[int, list[str]] = {}
+    documents: list[tuple[str, int, dict[str, str]]] = []
+    for dbid, note_dbid, data in Command.objects.filter(
+        patient__id=patient_id
+    ).values_list("dbid", "note_id", "data").iterator():
+        text = _data_text(data)
+        documents.append((KIND_COMMAND, dbid, {"data": text}))
+        if note_dbid and text:
+            command_text.setdefault(note_dbid, []).append(text)
+
+    for dbid, title, body in Note.objects.filter(
+        patient__id=patient_id
+    ).values_list("dbid", "title", "body").iterator():
+        documents.append(
+            (KIND_NOTE, dbid, _note_fields(title, body, command_text.get(dbid, [])))
+        )
+
+    for dbid, content, *names in Message.objects.filter(
+        note__patient__id=patient_id
+    ).values_list("dbid", "content", *_MESSAGE_NAME_FIELDS).iterator():
+        documents.append((KIND_MESSAGE, dbid, _message_fields(content, names)))
+
+    written = _bulk_create(
+        term
+        for kind, dbid, fields in documents
+        for term in _terms(patient_id, kind, dbid, fields)
+    )
+    SearchIndexStatus.objects.update_or_create(
+        patient_id=patient_id,
+        defaults={"version": INDEX_VERSION, "indexed_at": _now()},
+    )
+    return written
+
+
+def reindex_command(command_id: str) -> None:
+    """Refresh a command and the note it belongs to, if its patient is indexed."""
+    row = (
+        Command.objects.filter(id=command_id)
+        .values_list("dbid", "patient__id", "note_id", "data")
+        .first()
+    )
+    if row is None:
+        return
+    dbid, patient_id, note_dbid, data = row
+    if not patient_id or not is_indexed(patient_id):
+        return
+    _replace(patient_id, KIND_COMMAND, dbid, {"data": _data_text(data)})
+    if note_dbid:
+        _reindex_note(Note.objects.filter(dbid=note_dbid))
+
+
+def reindex_note(note_id: str) -> None:
+    """Refresh a note, if its patient is indexed."""
+    _reindex_note(Note.objects.filter(id=note_id))
+
+
+def reindex_message(message_id: str) -> None:
+    """Refresh a message, if its patient is indexed."""
+    row = (
+        Message.objects.filter(id=message_id)
+        .values_list("dbid", "note__patient__id", "content", *_MESSAGE_NAME_FIELDS)
+        .first()
+    )
+    if row is None:
+        return
+    dbid, patient_id, content, *names = row
+    if not patient_id or not is_indexed(patient_id):
+        return
+    _replace(patient_id, KIND_MESSAGE, dbid, _message_fields(content, names))
+
+
+def _reindex_note(notes: Any) -> None:
+    row = notes.values_list("dbid", "patient__id", "title", "body").first()
+    if row is None:
+        return
+    dbid, patient_id, title, body = row
+    if not patient_id or not is_indexed(patient_id):
+        return
+    command_text = [
+        _data_text(data)
+        for data in Command.objects.filter(note__dbid=dbid).values_list("data", flat=True)
+    ]
+    _replace(patient_id, KIND_NOTE, dbid, _note_fields(title, body, command_text))
+
+
+def _replace(patient_id: str, kind: str, dbid: int, fields: dict[str, str]) -> None:
+    SearchIndexTerm.objects.filter(doc_kind=kind, doc_dbid=dbid).delete()
+    _bulk_create(_terms(patient_id, kind, dbid, fields))
+
+
+def _terms(
+    patient_id: str, kind: str, dbid: int, fields: dict[str, str]
+) -> Iterable[SearchIndexTerm]:
+    for field, text in fields.items():
+        positions: dict[str, list[int]] = {}
+        for token, offset in tokenize(text):
+            positions.setdefault(token, []).append(offset)
+        for token, offsets in positions.items():
+            yield SearchIndexTerm(
+                patient_id=patient_id,
+                doc_kind=kind,
+                doc_dbid=dbid,
+                field=field,
+                token=token,
+                positions=offsets,
+            )
+
+
+def _bulk_create(terms: Iterable[SearchIndexTerm]) -> int:
+    written = 0
+    chunk: list[SearchIndexTerm] = []
+    for term in terms:
+        chunk.append(term)
+        if len(chunk) >= _BULK_CHUNK:
+            SearchIndexTerm.objects.bulk_create(chunk)
+            written += len(chunk)
+            chunk = []
+    if chunk:
+        SearchIndexTerm.objects.bulk_create(chunk)
+        written += len(chunk)
+    return written
+
+
+def _note_fields(title: Any, body: Any, command_text: list[str]) -> dict[str, str]:
+    return {
+        "title": (title or "").strip(),
+        "body": extract_body_text(body),
+        "commands": " ".join(command_text),
+    }
+
+
+def _message_fields(content: Any, names: list[Any]) -> dict[str, str]:
+    return {
+        "content": strip_html(content or ""),
+        "people": " ".join(str(name) for name in names if name),
+    }
+
+
+def _data_text(data: Any) -> str:
+    """Every text and number value of a command's data, space-separated."""
+    return " ".join(_text_values(data))
+
+
+def _text_values(value: Any) -> Iterable[str]:
+    if isinstance(value, dict):
+        for item in value.values():
+            yield from _text_values(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from _text_values(item)
+    elif isinstance(value, bool) or value is None:
+        return
+    elif isinstance(value, (int, float)):
+        yield str(value)
+    elif isinstance(value, str):
+        # Skip encoded blobs (signatures, images) — long strings without spaces
+        if value.strip() and not (len(value) > 100 and " " not in value):
+            yield value.strip()
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
@@ -21,6 +21,7 @@ from chart_command_search.searchers.helpers import (
     staff_name,
     strip_html,
 )
+from chart_command_search.searchers.index import KIND_NOTE, by_rank, lookup
 from chart_command_search.searchers.types import Result
 
 
@@ -32,10 +33,19 @@ def search_letters(
     date_to: str = "",
     provider_id: str = "",
 ) -> list[Result]:
-    qs = Note.objects.filter(
+    letters = Note.objects.filter(
         patient__id=patient_id, note_type_version__category="letter"
-    ).select_related("provider", "note_type_version")
-    if q:
+    )
+    qs = letters.select_related("provider", "note_type_version")
+    # Rank only letters; the best notes overall could all be other kinds
+    hits = (
+        lookup(patient_id, KIND_NOTE, q, within=letters.values_list("dbid", flat=True))
+        if q
+        else None
+    )
+    if hits is not None:
+        qs = qs.filter(dbid__in=list(hits))
+    elif q:
         qs = qs.filter(Q(title__icontains=q) | Q(body__icontains=q))
     if date_from:
         qs = qs.filter(datetime_of_service__date__gte=date_from)
@@ -47,6 +57,8 @@ def search_letters(
     qs = qs.order_by("-datetime_of_service")[:MAX_RESULTS]
 
     notes = list(qs)
+    if hits:
+        notes = by_rank(notes, hits)
 
     note_dbids = [n.dbid for n in notes]
     letters_map: dict[int, Any] = {}
@@ -15,6 +15,7 @@ from chart_command_search.searchers.helpers import (
     staff_name,
     strip_html,
 )
+from chart_command_search.searchers.index import KIND_MESSAGE, by_rank, lookup
 from chart_command_search.searchers.types import Result
 
 
@@ -47,7 +48,10 @@ def search_messages(
         return qs
 
     base_qs = Message.objects.filter(note__patient__id=patient_id)
-    if q:
+    hits = lookup(patient_id, KIND_MESSAGE, q) if q else None
+    if hits is not None:
+        base_qs = base_qs.filter(dbid__in=list(hits))
+    elif q:
         base_qs = base_qs.filter(
             Q(content__icontains=q)
             | Q(sender__staff__first_name__icontains=q)
@@ -63,6 +67,8 @@ def search_messages(
         qs = _apply_msg_filters(base_qs)
         qs = qs.select_related("sender", "note", "note__provider")
         messages = list(qs.order_by("-created")[:MAX_RESULTS])
+    if hits:
+        messages = by_rank(messages, hits)
 
     results: list[Result] = []
     for msg in messages:
@@ -14,8 +14,10 @@ from chart_command_search.searchers.helpers import (
     match_snippet,
     note_type_name,
     parse_multi,
+    snippet_at,
     staff_name,
 )
+from chart_command_search.searchers.index import KIND_NOTE, by_rank, lookup
 from chart_command_search.searchers.types import Result
 
 
@@ -41,7 +43,10 @@ def search_notes(
                 nt_q |= Q(note_type_version__note_type__dbid=s.removeprefix("note_type_"))
         if nt_q:
             qs = qs.filter(nt_q)
-    if q:
+    hits = lookup(patient_id, KIND_NOTE, q) if q else None
+    if hits is not None:
+        qs = qs.filter(dbid__in=list(hits))
+    elif q:
         qs = qs.filter(
             Q(title__icontains=q)
             | Q(body__icontains=q)
@@ -54,10 +59,12 @@ def search_notes(
     provider_ids = parse_multi(provider_id)
     if provider_ids:
         qs = qs.filter(provider__id__in=provider_ids)
-    qs = qs.order_by("-datetime_of_service")[:MAX_RESULTS]
+    notes = list(qs.order_by("-datetime_of_service")[:MAX_RESULTS])
+    if hits:
+        notes = by_rank(notes, hits)
 
     results: list[Result] = []
-    for note in qs:
+    for note in notes:
         title = (getattr(note, "title", "") or "").strip()
         note_type = note_type_name(note)
         type_label = note_type or title or "Note"
@@ -84,7 +91,12 @@ def search_notes(
             details.append(detail("Title", title))
 
         if q and body_text:
-            snippet = match_snippet(q, body_text)
+            hit = hits.get(note.dbid) if hits else None
+            body_span = hit["spans"].get("body") if hit else None
+            if body_span:
+                snippet = snippet_at(body_text, *body_span)
+            else:
+                snippet = match_snippet(q, body_text)
             if snippet:
                 details.append(detail("Matched in", f"Body: {snippet}"))
 
@@ -236,49 +236,163 @@ function highlightClickedResult() {
   } catch(e) {}
 }
 
-function runSearch() {
+/* "All categories" searches request each category separately and paint
+   results as each one arrives, so quick categories show up without waiting
+   on the slowest. Each category gets a time budget and a cursor for more. */
+var CATEGORY_BUDGET_MS = 15000;
+var searchGeneration = 0;
+var categoryResults = {};
+var categoryParams = null;
+
+function searchParams() {
   var q = document.getElementById("q").value.trim();
-  var categories = categoryMs.getValues();
   var statuses = statusMs.getValues();
   var dateFrom = document.getElementById("date-from").value;
   var dateTo = document.getElementById("date-to").value;
   var providers = providerMs.getValues();
 
   var params = new URLSearchParams({ patient_id: PATIENT_ID });
-  params.set("category", categories.length > 0 ? categories.join(",") : "all");
   if (q) params.set("q", q);
   if (statuses.length > 0) params.set("status", statuses.join(","));
   if (dateFrom) params.set("date_from", dateFrom);
   if (dateTo) params.set("date_to", dateTo);
   if (providers.length > 0) params.set("provider_id", providers.join(","));
+  return params;
+}
+
+function fetchSearch(params, signal) {
+  return fetch("/plugin-io/api/chart_command_search/search?" + params.toString(), {
+    method: "GET",
+    credentials: "include",
+    headers: { "Accept": "application/json" },
+    signal: signal
+  }).then(function(res) {
+    if (!res.ok) throw new Error("Request failed: " + res.status);
+    return res.json();
+  });
+}
+
+function runSearch() {
+  var categories = categoryMs.getValues();
+  var params = searchParams();
 
   var spinner = document.getElementById("spinner");
   var statusBar = document.getElementById("status-bar");
   var container = document.getElementById("results-container");
 
+  searchGeneration++;
   spinner.classList.add("visible");
   container.innerHTML = "";
   statusBar.textContent = "";
 
-  fetch("/plugin-io/api/chart_command_search/search?" + params.toString(), {
-    method: "GET",
-    credentials: "include",
-    headers: { "Accept": "application/json" }
-  })
-    .then(function(res) {
-      if (!res.ok) throw new Error("Request failed: " + res.status);
-      return res.json();
+  if (categories.length !== 1) {
+    runCategorySearches(categories.length > 0 ? categories : CATEGORY_OPTIONS.map(function(o) { return o.v; }), params);
+    return;
+  }
+
+  var generation = searchGeneration;
+  params.set("category", categories[0]);
+  fetchSearch(params)
+    .then(function(data) {
+      if (generation !== searchGeneration) return;
+      renderResults(data); saveSearchState(); highlightClickedResult();
     })
-    .then(function(data) { renderResults(data); saveSearchState(); highlightClickedResult(); })
     .catch(function(err) {
+      if (generation !== searchGeneration) return;
       statusBar.textContent = "Search failed.";
       container.innerHTML = '<div class="empty-state"><p>' + escapeHtml(err.message) + '</p></div>';
     })
     .finally(function() {
-      spinner.classList.remove("visible");
+      if (generation === searchGeneration) spinner.classList.remove("visible");
+    });
+}
+
+function runCategorySearches(categories, params) {
+  categoryParams = params;
+  categoryResults = {};
+  categories.forEach(function(cat) {
+    categoryResults[cat] = { results: [], nextCursor: null, error: "", pending: true };
+  });
+  categories.forEach(function(cat) { fetchCategory(searchGeneration, cat, ""); });
+}
+
+function fetchCategory(generation, cat, cursor) {
+  var params = new URLSearchParams(categoryParams);
+  params.set("category", cat);
+  params.set("limit", String(ALL_CATEGORY_LIMIT));
+  if (cursor) params.set("cursor", cursor);
+
+  var controller = new AbortController();
+  var timer = setTimeout(function() { controller.abort(); }, CATEGORY_BUDGET_MS);
+  var state = categoryResults[cat];
+
+  fetchSearch(params, controller.signal)
+    .then(function(data) {
+      if (generation !== searchGeneration) return;
+      state.results = state.results.concat(data.results || []);
+      state.nextCursor = data.next_cursor || null;
+      if (data.search_errors && data.search_errors.length > 0) state.error = data.search_errors.join(", ");
+    })
+    .catch(function(err) {
+      if (generation !== searchGeneration) return;
+      state.error = cat + ": " + (err.name === "AbortError" ? "timed out" : err.message);
+    })
+    .finally(function() {
+      clearTimeout(timer);
+      if (generation !== searchGeneration) return;
+      state.pending = false;
+      renderCategoryResults();
     });
 }
 
+function loadMoreCategory(cat) {
+  var state = categoryResults[cat];
+  if (!state || state.pending || !state.nextCursor) return;
+  state.pending = true;
+  document.getElementById("spinner").classList.add("visible");
+  fetchCategory(searchGeneration, cat, state.nextCursor);
+}
+
+function renderCategoryResults() {
+  var names = Object.keys(categoryResults);
+  var pending = names.filter(function(cat) { return categoryResults[cat].pending; });
+  var results = [];
+  var errors = [];
+  names.forEach(function(cat) {
+    results = results.concat(categoryResults[cat].results);
+    if (categoryResults[cat].error) errors.push(categoryResults[cat].error);
+  });
+  results.sort(function(a, b) {
+    var da = a.date || "", db = b.date || "";
+    return da < db ? 1 : da > db ? -1 : 0;
+  });
+
+  if (results.length > 0 || pending.length === 0) {
+    renderResults({ results: results, count: results.length, search_errors: errors });
+  }
+
+  var container = document.getElementById("results-container");
+  var moreHtml = names.filter(function(cat) {
+    return categoryResults[cat].nextCursor && !categoryResults[cat].pending;
+  }).map(function(cat) {
+    var label = (CATEGORY_OPTIONS.filter(function(o) { return o.v === cat; })[0] || { l: cat }).l;
+    return '<button class="more-category-btn" onclick="loadMoreCategory(\'' + escapeHtml(cat) + '\')">More ' +
+      escapeHtml(label.toLowerCase()) + '</button>';
+  }).join("");
+  if (moreHtml && results.length > 0) {
+    container.insertAdjacentHTML("beforeend", '<div class="more-categories">' + moreHtml + '</div>');
+  }
+
+  var statusBar = document.getElementById("status-bar");
+  if (pending.length > 0) {
+    if (results.length > 0) statusBar.textContent += " \u2014 searching " + pending.join(", ") + "\u2026";
+    return;
+  }
+  document.getElementById("spinner").classList.remove("visible");
+  saveSearchState();
+  highlightClickedResult();
+}
+
 document.getElementById("q").addEventListener("keydown", function(e) {
   if (e.key === "Enter") runSearch();
 });
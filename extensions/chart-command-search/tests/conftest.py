@@ -0,0 +1,21 @@
+"""Shared fixtures for chart_command_search tests."""
+
+from collections.abc import Iterator
+from unittest.mock import patch
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _patients_not_indexed() -> Iterator[None]:
+    """Treat every patient as not yet indexed for keyword search.
+
+    The search index's custom model tables don't exist in the test database;
+    with no index the searchers take their substring-scan path. Tests of the
+    index itself patch its models and `is_indexed` explicitly.
+    """
+    with (
+        patch("chart_command_search.searchers.index.is_indexed", return_value=False),
+        patch("chart_command_search.handlers.application.ensure_patient_index", return_value=False),
+    ):
+        yield
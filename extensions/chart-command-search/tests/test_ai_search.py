@@ -13,6 +13,7 @@ from chart_command_search.handlers.ai_search_api import (
     MAX_QUERY_LENGTH,
     _sanitize_texts as _real_sanitize_texts,
 )
+from chart_command_search.context import ContextSnapshot
 
 
 # ---------------------------------------------------------------------------
@@ -20,6 +21,7 @@ from chart_command_search.handlers.ai_search_api import (
 # ---------------------------------------------------------------------------
 
 VALID_PATIENT_ID = "12345678-1234-1234-1234-123456789abc"
+_EMPTY_SNAPSHOT = ContextSnapshot(version="0" * 16, json="{}", rebuilt=())
 
 
 def _make_request(
@@ -207,9 +209,9 @@ class TestAIChartSearchAPIHistory:
         assert "ANTHROPIC_API_KEY" in data["error"]
 
     @patch("chart_command_search.handlers.ai_search_api.CATEGORY_SEARCHERS", {})
-    @patch("chart_command_search.handlers.ai_search_api.fetch_patient_context", return_value={})
+    @patch("chart_command_search.handlers.ai_search_api.patient_context_snapshot", return_value=_EMPTY_SNAPSHOT)
     @patch("chart_command_search.handlers.ai_search_api.serialize_results", return_value="[]")
-    @patch("chart_command_search.handlers.ai_search_api.LlmAnthropic")
+    @patch("chart_command_search.handlers.ai_search_api._PromptCachingAnthropic")
     def test_history_truncated_to_max_turns(
         self, mock_llm_cls: Any, mock_serialize: Any, mock_ctx: Any
     ) -> None:
@@ -233,9 +235,9 @@ class TestAIChartSearchAPIHistory:
         assert responses[0].status_code == 200
 
     @patch("chart_command_search.handlers.ai_search_api.CATEGORY_SEARCHERS", {})
-    @patch("chart_command_search.handlers.ai_search_api.fetch_patient_context", return_value={})
+    @patch("chart_command_search.handlers.ai_search_api.patient_context_snapshot", return_value=_EMPTY_SNAPSHOT)
     @patch("chart_command_search.handlers.ai_search_api.serialize_results", return_value="[]")
-    @patch("chart_command_search.handlers.ai_search_api.LlmAnthropic")
+    @patch("chart_command_search.handlers.ai_search_api._PromptCachingAnthropic")
     def test_history_within_limit_not_truncated(
         self, mock_llm_cls: Any, mock_serialize: Any, mock_ctx: Any
     ) -> None:
@@ -262,9 +264,9 @@ class TestAIChartSearchAPIHistory:
 
 class TestAIChartSearchAPILLMResponse:
     @patch("chart_command_search.handlers.ai_search_api.CATEGORY_SEARCHERS", {})
-    @patch("chart_command_search.handlers.ai_search_api.fetch_patient_context", return_value={})
+    @patch("chart_command_search.handlers.ai_search_api.patient_context_snapshot", return_value=_EMPTY_SNAPSHOT)
     @patch("chart_command_search.handlers.ai_search_api.serialize_results", return_value="[]")
-    @patch("chart_command_search.handlers.ai_search_api.LlmAnthropic")
+    @patch("chart_command_search.handlers.ai_search_api._PromptCachingAnthropic")
     def test_valid_json_response_has_expected_keys(
         self, mock_llm_cls: Any, mock_serialize: Any, mock_ctx: Any
     ) -> None:
@@ -286,9 +288,9 @@ class TestAIChartSearchAPILLMResponse:
         assert "count" in data
 
     @patch("chart_command_search.handlers.ai_search_api.CATEGORY_SEARCHERS", {})
-    @patch("chart_command_search.handlers.ai_search_api.fetch_patient_context", return_value={})
+    @patch("chart_command_search.handlers.ai_search_api.patient_context_snapshot", return_value=_EMPTY_SNAPSHOT)
     @patch("chart_command_search.handlers.ai_search_api.serialize_results", return_value="[]")
-    @patch("chart_command_search.handlers.ai_search_api.LlmAnthropic")
+    @patch("chart_command_search.handlers.ai_search_api._PromptCachingAnthropic")
     def test_markdown_wrapped_json_is_cleaned(
         self, mock_llm_cls: Any, mock_serialize: Any, mock_ctx: Any
     ) -> None:
@@ -307,9 +309,9 @@ class TestAIChartSearchAPILLMResponse:
         assert data["ai_summary"] == "Test summary"
 
     @patch("chart_command_search.handlers.ai_search_api.CATEGORY_SEARCHERS", {})
-    @patch("chart_command_search.handlers.ai_search_api.fetch_patient_context", return_value={})
+    @patch("chart_command_search.handlers.ai_search_api.patient_context_snapshot", return_value=_EMPTY_SNAPSHOT)
     @patch("chart_command_search.handlers.ai_search_api.serialize_results", return_value="[]")
-    @patch("chart_command_search.handlers.ai_search_api.LlmAnthropic")
+    @patch("chart_command_search.handlers.ai_search_api._PromptCachingAnthropic")
     def test_markdown_fence_without_language_tag_is_cleaned(
         self, mock_llm_cls: Any, mock_serialize: Any, mock_ctx: Any
     ) -> None:
@@ -328,9 +330,9 @@ class TestAIChartSearchAPILLMResponse:
         assert data["ai_summary"] == "Test summary"
 
     @patch("chart_command_search.handlers.ai_search_api.CATEGORY_SEARCHERS", {})
-    @patch("chart_command_search.handlers.ai_search_api.fetch_patient_context", return_value={})
+    @patch("chart_command_search.handlers.ai_search_api.patient_context_snapshot", return_value=_EMPTY_SNAPSHOT)
     @patch("chart_command_search.handlers.ai_search_api.serialize_results", return_value="[]")
-    @patch("chart_command_search.handlers.ai_search_api.LlmAnthropic")
+    @patch("chart_command_search.handlers.ai_search_api._PromptCachingAnthropic")
     def test_llm_non_200_code_returns_502(
         self, mock_llm_cls: Any, mock_serialize: Any, mock_ctx: Any
     ) -> None:
@@ -345,9 +347,9 @@ class TestAIChartSearchAPILLMResponse:
         assert responses[0].status_code == 502
 
     @patch("chart_command_search.handlers.ai_search_api.CATEGORY_SEARCHERS", {})
-    @patch("chart_command_search.handlers.ai_search_api.fetch_patient_context", return_value={})
+    @patch("chart_command_search.handlers.ai_search_api.patient_context_snapshot", return_value=_EMPTY_SNAPSHOT)
     @patch("chart_command_search.handlers.ai_search_api.serialize_results", return_value="[]")
-    @patch("chart_command_search.handlers.ai_search_api.LlmAnthropic")
+    @patch("chart_command_search.handlers.ai_search_api._PromptCachingAnthropic")
     def test_llm_empty_response_returns_502(
         self, mock_llm_cls: Any, mock_serialize: Any, mock_ctx: Any
     ) -> None:
@@ -362,9 +364,9 @@ class TestAIChartSearchAPILLMResponse:
         assert responses[0].status_code == 502
 
     @patch("chart_command_search.handlers.ai_search_api.CATEGORY_SEARCHERS", {})
-    @patch("chart_command_search.handlers.ai_search_api.fetch_patient_context", return_value={})
+    @patch("chart_command_search.handlers.ai_search_api.patient_context_snapshot", return_value=_EMPTY_SNAPSHOT)
     @patch("chart_command_search.handlers.ai_search_api.serialize_results", return_value="[]")
-    @patch("chart_command_search.handlers.ai_search_api.LlmAnthropic")
+    @patch("chart_command_search.handlers.ai_search_api._PromptCachingAnthropic")
     def test_generic_llm_exception_returns_502(
         self, mock_llm_cls: Any, mock_serialize: Any, mock_ctx: Any
     ) -> None:
@@ -382,9 +384,9 @@ class TestAIChartSearchAPILLMResponse:
         assert "connection error" not in data["error"]
 
     @patch("chart_command_search.handlers.ai_search_api.CATEGORY_SEARCHERS", {})
-    @patch("chart_command_search.handlers.ai_search_api.fetch_patient_context", return_value={})
+    @patch("chart_command_search.handlers.ai_search_api.patient_context_snapshot", return_value=_EMPTY_SNAPSHOT)
     @patch("chart_command_search.handlers.ai_search_api.serialize_results", return_value="[]")
-    @patch("chart_command_search.handlers.ai_search_api.LlmAnthropic")
+    @patch("chart_command_search.handlers.ai_search_api._PromptCachingAnthropic")
     def test_timeout_exception_returns_504(
         self, mock_llm_cls: Any, mock_serialize: Any, mock_ctx: Any
     ) -> None:
@@ -399,9 +401,9 @@ class TestAIChartSearchAPILLMResponse:
         assert responses[0].status_code == 504
 
     @patch("chart_command_search.handlers.ai_search_api.CATEGORY_SEARCHERS", {})
-    @patch("chart_command_search.handlers.ai_search_api.fetch_patient_context", return_value={})
+    @patch("chart_command_search.handlers.ai_search_api.patient_context_snapshot", return_value=_EMPTY_SNAPSHOT)
     @patch("chart_command_search.handlers.ai_search_api.serialize_results", return_value="[]")
-    @patch("chart_command_search.handlers.ai_search_api.LlmAnthropic")
+    @patch("chart_command_search.handlers.ai_search_api._PromptCachingAnthropic")
     def test_no_intent_or_task_in_response(
         self, mock_llm_cls: Any, mock_serialize: Any, mock_ctx: Any
     ) -> None:
@@ -426,9 +428,9 @@ class TestAIChartSearchAPILLMResponse:
 
 
 class TestAIChartSearchAPISearchErrors:
-    @patch("chart_command_search.handlers.ai_search_api.fetch_patient_context", return_value={})
+    @patch("chart_command_search.handlers.ai_search_api.patient_context_snapshot", return_value=_EMPTY_SNAPSHOT)
     @patch("chart_command_search.handlers.ai_search_api.serialize_results", return_value="[]")
-    @patch("chart_command_search.handlers.ai_search_api.LlmAnthropic")
+    @patch("chart_command_search.handlers.ai_search_api._PromptCachingAnthropic")
     def test_category_exception_populates_search_errors(
         self, mock_llm_cls: Any, mock_serialize: Any, mock_ctx: Any
     ) -> None:
@@ -454,9 +456,9 @@ class TestAIChartSearchAPISearchErrors:
         errors = data["search_errors"]
         assert any("broken_cat" in e for e in errors)
 
-    @patch("chart_command_search.handlers.ai_search_api.fetch_patient_context", return_value={})
+    @patch("chart_command_search.handlers.ai_search_api.patient_context_snapshot", return_value=_EMPTY_SNAPSHOT)
     @patch("chart_command_search.handlers.ai_search_api.serialize_results", return_value="[]")
-    @patch("chart_command_search.handlers.ai_search_api.LlmAnthropic")
+    @patch("chart_command_search.handlers.ai_search_api._PromptCachingAnthropic")
     def test_no_search_errors_key_when_all_succeed(
         self, mock_llm_cls: Any, mock_serialize: Any, mock_ctx: Any
     ) -> None:
@@ -501,9 +503,9 @@ class TestPromptSanitization:
         assert "rephrase" in data["error"].lower()
 
     @patch("chart_command_search.handlers.ai_search_api.CATEGORY_SEARCHERS", {})
-    @patch("chart_command_search.handlers.ai_search_api.fetch_patient_context", return_value={})
+    @patch("chart_command_search.handlers.ai_search_api.patient_context_snapshot", return_value=_EMPTY_SNAPSHOT)
     @patch("chart_command_search.handlers.ai_search_api.serialize_results", return_value="[]")
-    @patch("chart_command_search.handlers.ai_search_api.LlmAnthropic")
+    @patch("chart_command_search.handlers.ai_search_api._PromptCachingAnthropic")
     def test_clean_query_passes_through(
         self, mock_llm_cls: Any, mock_serialize: Any, mock_ctx: Any,
         monkeypatch: pytest.MonkeyPatch,
@@ -612,3 +614,34 @@ class TestPromptSanitization:
 
         assert is_safe is False
         assert reason == "sanitizer_malformed"
+
+
+# ---------------------------------------------------------------------------
+# AIChartSearchAPI — cached patient context
+# ---------------------------------------------------------------------------
+
+
+class TestAIChartSearchAPIPatientContext:
+    @patch("chart_command_search.handlers.ai_search_api.CATEGORY_SEARCHERS", {})
+    @patch(
+        "chart_command_search.handlers.ai_search_api.patient_context_snapshot",
+        return_value=ContextSnapshot(version="abc", json='{"goals":["walk"]}', rebuilt=()),
+    )
+    @patch("chart_command_search.handlers.ai_search_api._PromptCachingAnthropic")
+    def test_context_block_leads_the_prompt_and_is_the_cache_breakpoint(
+        self, mock_llm_cls: Any, mock_snapshot: Any
+    ) -> None:
+        mock_client = MagicMock()
+        mock_llm_cls.return_value = mock_client
+        mock_client.attempt_requests.return_value = [_make_llm_response(_valid_ai_response())]
+
+        handler = _make_ai_handler(body={"patient_id": VALID_PATIENT_ID, "query": "goals?"})
+        responses = handler.post()
+
+        assert responses[0].status_code == 200
+        mock_snapshot.assert_called_once_with(VALID_PATIENT_ID)
+        user_prompts = [c.args[0][0] for c in mock_client.set_user_prompt.call_args_list]
+        assert user_prompts[0] == 'PATIENT CONTEXT:\n{"goals":["walk"]}'
+        assert user_prompts[1].startswith("TODAY'S DATE:")
+        assert user_prompts[-1] == "goals?"
+        assert mock_client.cache_breakpoint == user_prompts[0]
@@ -6,6 +6,8 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from chart_command_search.searchers.constants import ALL_CATEGORY_LIMIT
+
 
 def _mock_obj(**kwargs: Any) -> MagicMock:
     obj = MagicMock()
@@ -59,6 +61,7 @@ class TestChartSearchApp:
         assert ctx["providers"][0]["name"] == "Jane Doe"
         assert len(ctx["note_types"]) == 1
         assert ctx["note_types"][0]["name"] == "Office Visit"
+        assert ctx["all_category_limit"] == ALL_CATEGORY_LIMIT
 
     def test_staff_query_error(
         self, mock_staff: Any, mock_nt: Any, mock_render: Any, mock_modal: Any
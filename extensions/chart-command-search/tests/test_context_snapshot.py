@@ -0,0 +1,276 @@
+from __future__ import annotations
+
+import json
+from datetime import date
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+from canvas_sdk.clients.llms.structures.settings import LlmSettingsAnthropic
+from canvas_sdk.events import EventType
+
+from chart_command_search.context.patient_context import SECTIONS, fetch_patient_context
+from chart_command_search.context.snapshot import (
+    CONTEXT_VERSION,
+    invalidate_context_sections,
+    patient_context_snapshot,
+)
+from chart_command_search.handlers.ai_search_api import _PromptCachingAnthropic
+from chart_command_search.handlers.patient_context_sync import (
+    InvalidatePatientContext,
+    sections_for_event,
+)
+
+SNAPSHOT = "chart_command_search.context.snapshot"
+
+
+class _FakeCache:
+    """Stores under prefixed keys and returns them from get_many, like the plugin cache."""
+
+    PREFIX = "plugin:chart_command_search"
+
+    def __init__(self) -> None:
+        self.data: dict[str, Any] = {}
+
+    def _make_key(self, key: str) -> str:
+        return f"{self.PREFIX}:{key}"
+
+    def get_many(self, keys: Any) -> dict[str, Any]:
+        full_keys = [self._make_key(k) for k in keys]
+        return {k: self.data[k] for k in full_keys if k in self.data}
+
+    def set_many(self, data: dict[str, Any], timeout_seconds: int | None = None) -> list[str]:
+        self.data.update({self._make_key(k): v for k, v in data.items()})
+        return []
+
+    def delete(self, key: str) -> None:
+        self.data.pop(self._make_key(key), None)
+
+
+def _section_fetcher(calls: list[str], failing: set[str] | None = None) -> Any:
+    """Serve {"<section>": "<section> data"} per section, recording each fetch."""
+
+    def _fetch(patient_id: str, name: str) -> dict[str, Any] | None:
+        calls.append(name)
+        if failing and name in failing:
+            return None
+        if name == "preferences":
+            return {}
+        return {name: f"{name} data"}
+
+    return _fetch
+
+
+@pytest.fixture
+def cache() -> Any:
+    fake = _FakeCache()
+    with patch(f"{SNAPSHOT}.get_cache", return_value=fake):
+        yield fake
+
+
+# ---------------------------------------------------------------------------
+# Section fetchers
+# ---------------------------------------------------------------------------
+
+
+class TestFetchPatientContextSections:
+    def test_fetches_only_requested_sections(self) -> None:
+        fetchers = {name: (label, MagicMock()) for name, (label, _) in SECTIONS.items()}
+        with patch.dict(SECTIONS, fetchers):
+            fetch_patient_context("p1", ["goals"])
+        called = [name for name, (_, fn) in fetchers.items() if fn.called]
+        assert called == ["goals"]
+
+    def test_failed_section_is_logged_and_skipped(self) -> None:
+        def _goals(patient_id: str, ctx: dict[str, Any]) -> None:
+            ctx["goals"] = ["walk daily"]
+
+        with (
+            patch.dict(SECTIONS, {
+                "goals": ("goals", _goals),
+                "claims": ("claims", MagicMock(side_effect=RuntimeError("db down"))),
+            }),
+            patch("chart_command_search.context.patient_context.log") as mock_log,
+        ):
+            ctx = fetch_patient_context("p1", ["goals", "claims"])
+        assert ctx == {"goals": ["walk daily"]}
+        mock_log.warning.assert_called_once()
+
+
+# ---------------------------------------------------------------------------
+# Snapshot caching
+# ---------------------------------------------------------------------------
+
+
+class TestPatientContextSnapshot:
+    def test_first_snapshot_fetches_every_section_in_order(self, cache: Any) -> None:
+        calls: list[str] = []
+        with patch(f"{SNAPSHOT}.fetch_context_section", side_effect=_section_fetcher(calls)):
+            snapshot = patient_context_snapshot("p1")
+        assert calls == list(SECTIONS)
+        assert snapshot.rebuilt == tuple(SECTIONS)
+        ctx = json.loads(snapshot.json)
+        assert list(ctx) == [name for name in SECTIONS if name != "preferences"]
+
+    def test_repeat_snapshot_is_served_from_cache(self, cache: Any) -> None:
+        calls: list[str] = []
+        with patch(f"{SNAPSHOT}.fetch_context_section", side_effect=_section_fetcher(calls)):
+            first = patient_context_snapshot("p1")
+            calls.clear()
+            second = patient_context_snapshot("p1")
+        assert calls == []
+        assert second.rebuilt == ()
+        assert second == first._replace(rebuilt=())
+
+    def test_invalidation_rebuilds_only_those_sections(self, cache: Any) -> None:
+        calls: list[str] = []
+        with patch(f"{SNAPSHOT}.fetch_context_section", side_effect=_section_fetcher(calls)):
+            first = patient_context_snapshot("p1")
+            invalidate_context_sections("p1", ["allergies", "labs"])
+            calls.clear()
+            second = patient_context_snapshot("p1")
+        assert calls == ["allergies", "labs"]
+        assert second.json == first.json
+        assert second.version == first.version
+
+    def test_other_patients_are_unaffected(self, cache: Any) -> None:
+        calls: list[str] = []
+        with patch(f"{SNAPSHOT}.fetch_context_section", side_effect=_section_fetcher(calls)):
+            patient_context_snapshot("p1")
+            patient_context_snapshot("p2")
+            invalidate_context_sections("p2", ["goals"])
+            calls.clear()
+            patient_context_snapshot("p1")
+        assert calls == []
+
+    def test_failed_section_is_not_cached(self, cache: Any) -> None:
+        calls: list[str] = []
+        fetch = _section_fetcher(calls, failing={"claims"})
+        with patch(f"{SNAPSHOT}.fetch_context_section", side_effect=fetch):
+            snapshot = patient_context_snapshot("p1")
+            calls.clear()
+            patient_context_snapshot("p1")
+        assert "claims" not in json.loads(snapshot.json)
+        assert calls == ["claims"]
+
+    def test_version_changes_with_content(self, cache: Any) -> None:
+        with patch(f"{SNAPSHOT}.fetch_context_section", side_effect=_section_fetcher([])):
+            first = patient_context_snapshot("p1")
+        invalidate_context_sections("p1", ["goals"])
+        with patch(
+            f"{SNAPSHOT}.fetch_context_section", return_value={"goals": "new goal"}
+        ):
+            second = patient_context_snapshot("p1")
+        assert second.rebuilt == ("goals",)
+        assert second.version != first.version
+
+    def test_windowed_sections_are_keyed_by_day(self, cache: Any) -> None:
+        with patch(f"{SNAPSHOT}.fetch_context_section", side_effect=_section_fetcher([])):
+            patient_context_snapshot("p1")
+        today = date.today().isoformat()
+        assert cache._make_key(f"patient_context:v{CONTEXT_VERSION}:p1:labs:{today}") in cache.data
+        assert cache._make_key(f"patient_context:v{CONTEXT_VERSION}:p1:conditions") in cache.data
+
+
+# ---------------------------------------------------------------------------
+# Event invalidation
+# ---------------------------------------------------------------------------
+
+
+class TestInvalidatePatientContext:
+    @pytest.mark.parametrize("event_name, sections", [
+        ("ALLERGY_INTOLERANCE_CREATED", ("allergies",)),
+        ("CONDITION_RESOLVED", ("conditions", "assessments")),
+        ("LAB_REPORT_UPDATED", ("labs",)),
+        ("PATIENT_UPDATED", ("demographics",)),
+        ("GOAL_COMMAND__POST_COMMIT", ("goals",)),
+        ("IMMUNIZATION_STATEMENT__STATEMENT__PRE_SEARCH", ()),
+        ("GOAL_COMMAND__PRE_COMMIT", ()),
+        ("NOTE_CREATED", ()),
+    ])
+    def test_sections_for_event(self, event_name: str, sections: tuple[str, ...]) -> None:
+        assert sections_for_event(event_name) == sections
+
+    def test_every_mapped_section_exists(self) -> None:
+        for name in InvalidatePatientContext.RESPONDS_TO:
+            assert set(sections_for_event(name)) <= set(SECTIONS)
+
+    def _handler(self, event_name: str, context: dict[str, Any]) -> InvalidatePatientContext:
+        handler = InvalidatePatientContext.__new__(InvalidatePatientContext)
+        handler.event = MagicMock()
+        handler.event.type = EventType.Value(event_name)
+        handler.event.target.id = "target-uuid"
+        handler.event.context = context
+        return handler
+
+    def test_invalidates_patient_from_event_context(self) -> None:
+        handler = self._handler("MEDICATION_LIST_ITEM_CREATED", {"patient": {"id": "p1"}})
+        with patch(
+            "chart_command_search.handlers.patient_context_sync.invalidate_context_sections"
+        ) as mock_invalidate:
+            assert handler.compute() == []
+        mock_invalidate.assert_called_once_with("p1", ("medications",))
+
+    def test_patient_events_use_the_target(self) -> None:
+        handler = self._handler("PATIENT_UPDATED", {})
+        with patch(
+            "chart_command_search.handlers.patient_context_sync.invalidate_context_sections"
+        ) as mock_invalidate:
+            handler.compute()
+        mock_invalidate.assert_called_once_with("target-uuid", ("demographics",))
+
+    def test_cache_errors_propagate(self) -> None:
+        handler = self._handler("LAB_REPORT_CREATED", {"patient": {"id": "p1"}})
+        with (
+            patch(
+                "chart_command_search.handlers.patient_context_sync.invalidate_context_sections",
+                side_effect=RuntimeError("cache down"),
+            ),
+            pytest.raises(RuntimeError),
+        ):
+            handler.compute()
+
+    def test_event_without_patient_is_ignored(self) -> None:
+        handler = self._handler("CLAIM_UPDATED", {})
+        with patch(
+            "chart_command_search.handlers.patient_context_sync.invalidate_context_sections"
+        ) as mock_invalidate:
+            assert handler.compute() == []
+        mock_invalidate.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# Prompt cache breakpoint
+# ---------------------------------------------------------------------------
+
+
+class TestPromptCachingAnthropic:
+    def _client(self) -> _PromptCachingAnthropic:
+        return _PromptCachingAnthropic(LlmSettingsAnthropic(
+            api_key="k", model="m", temperature=0.0, max_tokens=10,
+        ))
+
+    def test_marks_the_breakpoint_block(self) -> None:
+        client = self._client()
+        client.cache_breakpoint = "PATIENT CONTEXT:\n{}"
+        client.set_system_prompt(["system"])
+        client.set_user_prompt(["PATIENT CONTEXT:\n{}"])
+        client.set_user_prompt(["CHART ENTRIES:\n[]"])
+        client.set_model_prompt(["ok"])
+        client.set_user_prompt(["question"])
+
+        messages = client.to_dict()["messages"]
+        first = messages[0]["content"]
+        assert [part["text"] for part in first] == [
+            "system", "PATIENT CONTEXT:\n{}", "CHART ENTRIES:\n[]",
+        ]
+        assert [("cache_control" in part) for part in first] == [False, True, False]
+        assert all(
+            "cache_control" not in part for m in messages[1:] for part in m["content"]
+        )
+
+    def test_no_breakpoint_without_match(self) -> None:
+        client = self._client()
+        client.set_user_prompt(["question"])
+        messages = client.to_dict()["messages"]
+        assert "cache_control" not in messages[0]["content"][0]
@@ -251,6 +251,24 @@ class TestSearchLetters:
         results = search_letters("patient-1", "", "")
         assert len(results) == 1
 
+    def test_index_candidates_limited_to_letters(
+        self, mock_note: Any, mock_letter: Any, mock_evt: Any
+    ) -> None:
+        note = _make_note()
+        _setup_note_qs(mock_note, [note])
+        mock_letter.objects.filter.return_value.select_related.return_value = []
+        letter_dbids = mock_note.objects.filter.return_value.values_list.return_value
+
+        with patch(
+            "chart_command_search.searchers.letters.lookup", return_value={}
+        ) as mock_lookup:
+            search_letters("patient-1", "referral", "")
+
+        mock_note.objects.filter.return_value.values_list.assert_called_once_with(
+            "dbid", flat=True
+        )
+        assert mock_lookup.call_args.kwargs == {"within": letter_dbids}
+
     def test_date_and_provider_filters(
         self, mock_note: Any, mock_letter: Any, mock_evt: Any
     ) -> None:
@@ -191,6 +191,74 @@ class TestChartSearchAPIAllCategories:
         assert data["count"] == 2
 
 
+# ---------------------------------------------------------------------------
+# Paged single category (per-category requests of an "all" search)
+# ---------------------------------------------------------------------------
+
+
+class TestChartSearchAPIPaging:
+    def _page(self, extra: dict[str, str], count: int = 20) -> tuple[Any, dict[str, Any]]:
+        fake_results = [make_result("commands", f"Result {i}") for i in range(count)]
+        with patch.dict(
+            CATEGORY_SEARCHERS, {"commands": MagicMock(return_value=fake_results)}, clear=True
+        ):
+            handler = _make_handler(
+                query_params={"patient_id": VALID_PATIENT_ID, "category": "commands", **extra}
+            )
+            responses = handler.get()
+        return responses[0], _get_json(responses)
+
+    def test_first_page_has_next_cursor(self) -> None:
+        response, data = self._page({"limit": "8"})
+        assert response.status_code == 200
+        assert data["category"] == "commands"
+        assert [r["summary"] for r in data["results"]] == [f"Result {i}" for i in range(8)]
+        assert data["count"] == 8
+        assert data["next_cursor"] == "8"
+
+    def test_cursor_continues_where_page_ended(self) -> None:
+        _, data = self._page({"limit": "8", "cursor": "16"})
+        assert [r["summary"] for r in data["results"]] == [f"Result {i}" for i in range(16, 20)]
+        assert data["next_cursor"] is None
+
+    def test_exact_last_page_has_no_next_cursor(self) -> None:
+        _, data = self._page({"limit": "10", "cursor": "10"})
+        assert data["count"] == 10
+        assert data["next_cursor"] is None
+
+    def test_invalid_limit_returns_400(self) -> None:
+        for limit in ("abc", "0", "-1", "999"):
+            response, data = self._page({"limit": limit})
+            assert response.status_code == 400
+            assert data["error"] == "Invalid limit"
+
+    def test_invalid_cursor_returns_400(self) -> None:
+        response, data = self._page({"limit": "8", "cursor": "x"})
+        assert response.status_code == 400
+        assert data["error"] == "Invalid cursor"
+
+    def test_limit_ignored_for_multi_category(self) -> None:
+        mock_commands = MagicMock(return_value=[make_result("commands", "Cmd")])
+        mock_notes = MagicMock(return_value=[make_result("notes", "Note")])
+
+        with patch.dict(
+            CATEGORY_SEARCHERS,
+            {"commands": mock_commands, "notes": mock_notes},
+            clear=True,
+        ):
+            handler = _make_handler(
+                query_params={
+                    "patient_id": VALID_PATIENT_ID,
+                    "category": "commands,notes",
+                    "limit": "1",
+                }
+            )
+            data = _get_json(handler.get())
+
+        assert data["count"] == 2
+        assert "next_cursor" not in data
+
+
 # ---------------------------------------------------------------------------
 # Unknown category
 # ---------------------------------------------------------------------------
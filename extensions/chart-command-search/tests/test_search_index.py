@@ -0,0 +1,402 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from chart_command_search.handlers.search_index_sync import (
+    IndexCommandChanges,
+    IndexNewMessages,
+    IndexNoteChanges,
+)
+from chart_command_search.searchers.command_helpers import extract_command_heading
+from chart_command_search.searchers.helpers import snippet_at
+from chart_command_search.searchers.index import (
+    INDEX_VERSION,
+    KIND_COMMAND,
+    KIND_NOTE,
+    MAX_CANDIDATES,
+    IndexHit,
+    _data_text,
+    build_patient_index,
+    by_rank,
+    ensure_patient_index,
+    lookup,
+    reindex_command,
+    tokenize,
+)
+
+INDEX = "chart_command_search.searchers.index"
+
+
+def _mock_obj(**kwargs: Any) -> MagicMock:
+    obj = MagicMock()
+    for k, v in kwargs.items():
+        setattr(obj, k, v)
+    return obj
+
+
+def _term_rows(mock_term: Any, rows_by_word: dict[str, list[tuple]]) -> None:
+    """Serve (doc_dbid, field, token, positions) rows per prefix lookup."""
+
+    def _filter(**kwargs: Any) -> MagicMock:
+        qs = MagicMock()
+        qs.values_list.return_value = rows_by_word.get(kwargs["token__startswith"], [])
+        return qs
+
+    mock_term.objects.filter.side_effect = _filter
+
+
+def _terms_written(mock_term: Any) -> list[tuple[str, int, str, str, list[int]]]:
+    """(kind, dbid, field, token, positions) of every SearchIndexTerm constructed."""
+    assert mock_term.objects.bulk_create.called
+    return [
+        tuple(call.kwargs[k] for k in ("doc_kind", "doc_dbid", "field", "token", "positions"))
+        for call in mock_term.call_args_list
+    ]
+
+
+# ---------------------------------------------------------------------------
+# Tokenizing
+# ---------------------------------------------------------------------------
+
+
+class TestTokenize:
+    def test_lowercase_words_with_offsets(self) -> None:
+        assert tokenize("Essential Hypertension, I10") == [
+            ("essential", 0),
+            ("hypertension", 10),
+            ("i10", 24),
+        ]
+
+    def test_skips_overlong_tokens(self) -> None:
+        assert tokenize("a" * 65 + " ok") == [("ok", 66)]
+
+    def test_data_text_flattens_values(self) -> None:
+        data = {
+            "diagnose": {"text": "Hypertension", "value": "I10"},
+            "onset": 2020,
+            "flag": True,
+            "codes": [{"display": "HTN"}, None],
+            "signature": "x" * 200,
+        }
+        assert _data_text(data) == "Hypertension I10 2020 HTN"
+
+
+class TestSnippetAt:
+    def test_cuts_around_offset(self) -> None:
+        text = "a" * 100 + " headache " + "b" * 100
+        snippet = snippet_at(text, 101, 8)
+        assert snippet.startswith("...")
+        assert "headache" in snippet
+
+    def test_out_of_range(self) -> None:
+        assert snippet_at("short", 10, 3) == ""
+
+
+# ---------------------------------------------------------------------------
+# Lookup
+# ---------------------------------------------------------------------------
+
+
+@patch(f"{INDEX}.SearchIndexTerm")
+class TestLookup:
+    def test_not_indexed_returns_none(self, mock_term: Any) -> None:
+        assert lookup("patient-1", KIND_COMMAND, "hyper") is None
+        mock_term.objects.filter.assert_not_called()
+
+    def test_query_without_words_returns_none(self, mock_term: Any) -> None:
+        with patch(f"{INDEX}.is_indexed", return_value=True):
+            assert lookup("patient-1", KIND_COMMAND, "--") is None
+
+    def test_prefix_match_with_ranking(self, mock_term: Any) -> None:
+        _term_rows(mock_term, {
+            "hyper": [
+                (1, "data", "hypertension", [0]),
+                (2, "data", "hyper", [4, 20]),
+            ],
+        })
+        with patch(f"{INDEX}.is_indexed", return_value=True):
+            hits = lookup("patient-1", KIND_COMMAND, "Hyper")
+
+        assert hits is not None
+        assert list(hits) == [2, 1]  # exact token, twice, ranks first
+        assert hits[1]["spans"] == {"data": (0, 12)}
+        assert mock_term.objects.filter.call_args.kwargs == {
+            "patient_id": "patient-1",
+            "doc_kind": KIND_COMMAND,
+            "token__startswith": "hyper",
+        }
+
+    def test_every_word_must_match(self, mock_term: Any) -> None:
+        _term_rows(mock_term, {
+            "chest": [(1, "body", "chest", [10]), (2, "body", "chest", [0])],
+            "pain": [(1, "title", "pain", [0])],
+        })
+        with patch(f"{INDEX}.is_indexed", return_value=True):
+            hits = lookup("patient-1", KIND_NOTE, "chest pain")
+
+        assert hits is not None
+        assert list(hits) == [1]
+        assert hits[1]["spans"] == {"body": (10, 5), "title": (0, 4)}
+        assert hits[1]["score"] == 2 * 2 + 3 * 2
+
+    def test_within_limits_candidates(self, mock_term: Any) -> None:
+        rows = [(dbid, "body", "letter", [0]) for dbid in range(1, MAX_CANDIDATES + 10)]
+
+        def _filter(**kwargs: Any) -> MagicMock:
+            qs = MagicMock()
+            allowed = kwargs.get("doc_dbid__in")
+            qs.values_list.return_value = [
+                row for row in rows if allowed is None or row[0] in allowed
+            ]
+            return qs
+
+        mock_term.objects.filter.side_effect = _filter
+        with patch(f"{INDEX}.is_indexed", return_value=True):
+            capped = lookup("patient-1", KIND_NOTE, "letter")
+            hits = lookup("patient-1", KIND_NOTE, "letter", within=iter([3, MAX_CANDIDATES + 5]))
+
+        assert capped is not None and len(capped) == MAX_CANDIDATES
+        assert MAX_CANDIDATES + 5 not in capped
+        assert hits is not None and sorted(hits) == [3, MAX_CANDIDATES + 5]
+
+    def test_no_match(self, mock_term: Any) -> None:
+        _term_rows(mock_term, {})
+        with patch(f"{INDEX}.is_indexed", return_value=True):
+            assert lookup("patient-1", KIND_NOTE, "absent words") == {}
+        assert mock_term.objects.filter.call_count == 1
+
+
+class TestByRank:
+    def test_keeps_order_of_ties_and_unranked(self) -> None:
+        rows = [_mock_obj(dbid=d) for d in (1, 2, 3, 4)]
+        hits = {
+            3: IndexHit(score=5, spans={}),
+            2: IndexHit(score=1, spans={}),
+            4: IndexHit(score=1, spans={}),
+        }
+        assert [r.dbid for r in by_rank(rows, hits)] == [3, 2, 4, 1]
+
+
+# ---------------------------------------------------------------------------
+# Building and updating
+# ---------------------------------------------------------------------------
+
+
+@patch(f"{INDEX}.SearchIndexStatus")
+@patch(f"{INDEX}.SearchIndexTerm")
+@patch(f"{INDEX}.Message")
+@patch(f"{INDEX}.Note")
+@patch(f"{INDEX}.Command")
+class TestBuildPatientIndex:
+    def test_indexes_commands_notes_and_messages(
+        self, mock_cmd: Any, mock_note: Any, mock_msg: Any, mock_term: Any, mock_status: Any
+    ) -> None:
+        mock_cmd.objects.filter.return_value.values_list.return_value.iterator.return_value = [
+            (10, 1, {"diagnose": {"text": "Hypertension"}}),
+        ]
+        mock_note.objects.filter.return_value.values_list.return_value.iterator.return_value = [
+            (1, "Visit", [{"type": "text", "value": "Headache, headache"}]),
+        ]
+        mock_msg.objects.filter.return_value.values_list.return_value.iterator.return_value = [
+            (20, "<p>Refill</p>", "Jane", "Doe", None, None),
+        ]
+
+        written = build_patient_index("patient-1")
+
+        terms = _terms_written(mock_term)
+        assert written == len(terms)
+        assert ("command", 10, "data", "hypertension", [0]) in terms
+        assert ("note", 1, "title", "visit", [0]) in terms
+        assert ("note", 1, "body", "headache", [0, 10]) in terms
+        assert ("note", 1, "commands", "hypertension", [0]) in terms
+        assert ("message", 20, "content", "refill", [0]) in terms
+        assert ("message", 20, "people", "doe", [5]) in terms
+        mock_term.objects.filter.assert_called_with(patient_id="patient-1")
+        mock_status.objects.filter.assert_called_with(patient_id="patient-1")
+        mock_status.objects.filter.return_value.delete.assert_called_once()
+        mock_status.objects.update_or_create.assert_called_once()
+        assert mock_status.objects.update_or_create.call_args.kwargs["defaults"]["version"] == INDEX_VERSION
+
+    def test_ensure_skips_current_index(
+        self, mock_cmd: Any, mock_note: Any, mock_msg: Any, mock_term: Any, mock_status: Any
+    ) -> None:
+        recent = datetime.now(timezone.utc) - timedelta(days=1)
+        mock_status.objects.filter.return_value.values_list.return_value.first.return_value = (
+            INDEX_VERSION, recent,
+        )
+        assert ensure_patient_index("patient-1") is False
+        mock_term.objects.bulk_create.assert_not_called()
+
+    @pytest.mark.parametrize("status", [
+        None,
+        (INDEX_VERSION - 1, datetime.now(timezone.utc)),
+        (INDEX_VERSION, datetime.now(timezone.utc) - timedelta(days=30)),
+    ])
+    def test_ensure_rebuilds_missing_outdated_or_old_index(
+        self,
+        mock_cmd: Any,
+        mock_note: Any,
+        mock_msg: Any,
+        mock_term: Any,
+        mock_status: Any,
+        status: Any,
+    ) -> None:
+        mock_status.objects.filter.return_value.values_list.return_value.first.return_value = status
+        for mock_model in (mock_cmd, mock_note, mock_msg):
+            mock_model.objects.filter.return_value.values_list.return_value.iterator.return_value = []
+        assert ensure_patient_index("patient-1") is True
+        mock_status.objects.update_or_create.assert_called_once()
+
+
+@patch(f"{INDEX}.SearchIndexTerm")
+@patch(f"{INDEX}.Note")
+@patch(f"{INDEX}.Command")
+class TestReindexCommand:
+    def test_skips_patient_without_index(self, mock_cmd: Any, mock_note: Any, mock_term: Any) -> None:
+        mock_cmd.objects.filter.return_value.values_list.return_value.first.return_value = (
+            10, "patient-1", 1, {"text": "Asthma"},
+        )
+        reindex_command("cmd-uuid")
+        mock_term.objects.filter.assert_not_called()
+        mock_term.objects.bulk_create.assert_not_called()
+
+    def test_replaces_command_and_note_terms(self, mock_cmd: Any, mock_note: Any, mock_term: Any) -> None:
+        mock_cmd.objects.filter.return_value.values_list.return_value.first.return_value = (
+            10, "patient-1", 1, {"text": "Asthma"},
+        )
+        mock_cmd.objects.filter.return_value.values_list.return_value.__iter__ = (
+            lambda self: iter([{"text": "Asthma"}])
+        )
+        mock_note.objects.filter.return_value.values_list.return_value.first.return_value = (
+            1, "patient-1", "Visit", [],
+        )
+        with patch(f"{INDEX}.is_indexed", return_value=True):
+            reindex_command("cmd-uuid")
+
+        deleted = [call.kwargs for call in mock_term.objects.filter.call_args_list]
+        assert deleted == [
+            {"doc_kind": "command", "doc_dbid": 10},
+            {"doc_kind": "note", "doc_dbid": 1},
+        ]
+        terms = _terms_written(mock_term)
+        assert ("command", 10, "data", "asthma", [0]) in terms
+        assert ("note", 1, "commands", "asthma", [0]) in terms
+
+    def test_unknown_command(self, mock_cmd: Any, mock_note: Any, mock_term: Any) -> None:
+        mock_cmd.objects.filter.return_value.values_list.return_value.first.return_value = None
+        reindex_command("cmd-uuid")
+        mock_term.objects.bulk_create.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# Searchers
+# ---------------------------------------------------------------------------
+
+
+class TestSearchersUseIndex:
+    @patch("chart_command_search.searchers.commands.LabOrder")
+    @patch("chart_command_search.searchers.commands.Command")
+    def test_commands_filter_and_rank_by_hits(self, mock_cmd: Any, mock_lo: Any) -> None:
+        from chart_command_search.searchers.commands import search_commands
+
+        cmds = [
+            _mock_obj(
+                dbid=dbid,
+                schema_key="diagnose",
+                state="committed",
+                entered_in_error=False,
+                note=None,
+                anchor_object_dbid=dbid,
+                data={"diagnose": {"text": text}},
+            )
+            for dbid, text in ((1, "Hypertension"), (2, "Hyperlipidemia"))
+        ]
+        qs = mock_cmd.objects.filter.return_value.exclude.return_value
+        qs.select_related.return_value = qs
+        qs.filter.return_value = qs
+        qs.order_by.return_value.__getitem__ = lambda self, s: cmds
+        hits = {2: IndexHit(score=4, spans={}), 1: IndexHit(score=1, spans={})}
+
+        with patch("chart_command_search.searchers.commands.lookup", return_value=hits):
+            results = search_commands("patient-1", "hyperl", "")
+
+        q_filter = qs.filter.call_args.args[0]
+        assert ("dbid__in", [2, 1]) in q_filter.children
+        assert [r["summary"] for r in results] == [
+            extract_command_heading("diagnose", cmds[1].data),
+            extract_command_heading("diagnose", cmds[0].data),
+        ]
+
+    @patch("chart_command_search.searchers.notes.Note")
+    def test_notes_snippet_from_body_span(self, mock_note: Any) -> None:
+        from chart_command_search.searchers.notes import search_notes
+
+        body_text = "Follow-up. " + "x " * 60 + "Severe migraine since Monday."
+        note = _mock_obj(
+            dbid=7,
+            title="",
+            provider=None,
+            note_type_version=_mock_obj(display="Office Visit", name="Office Visit"),
+            current_state=None,
+            body=[{"type": "text", "value": body_text}],
+            datetime_of_service=datetime(2024, 3, 1),
+        )
+        note.commands.all.return_value = []
+        qs = mock_note.objects.filter.return_value
+        qs.select_related.return_value = qs
+        qs.prefetch_related.return_value = qs
+        qs.filter.return_value = qs
+        qs.order_by.return_value.__getitem__ = lambda self, s: [note]
+        hits = {7: IndexHit(score=2, spans={"body": (body_text.index("migraine"), 8)})}
+
+        with patch("chart_command_search.searchers.notes.lookup", return_value=hits):
+            results = search_notes("patient-1", "migr", "")
+
+        qs.filter.assert_called_with(dbid__in=[7])
+        qs.distinct.assert_not_called()
+        matched = [d["value"] for d in results[0]["details"] if d["label"] == "Matched in"]
+        assert len(matched) == 1
+        assert "Severe migraine since Monday." in matched[0]
+
+
+# ---------------------------------------------------------------------------
+# Event handlers
+# ---------------------------------------------------------------------------
+
+
+class TestIndexSyncHandlers:
+    def test_command_handler_responds_to_every_command_type(self) -> None:
+        responds_to = set(IndexCommandChanges.RESPONDS_TO)
+        assert "DIAGNOSE_COMMAND__POST_COMMIT" in responds_to
+        assert "PRESCRIBE_COMMAND__POST_UPDATE" in responds_to
+        assert "DIAGNOSE_COMMAND__PRE_COMMIT" not in responds_to
+
+    @pytest.mark.parametrize("handler_cls, reindex", [
+        (IndexCommandChanges, "reindex_command"),
+        (IndexNoteChanges, "reindex_note"),
+        (IndexNewMessages, "reindex_message"),
+    ])
+    def test_reindexes_event_target(self, handler_cls: Any, reindex: str) -> None:
+        handler = handler_cls.__new__(handler_cls)
+        handler.event = MagicMock()
+        handler.event.target.id = "target-uuid"
+        with patch(f"chart_command_search.handlers.search_index_sync.{reindex}") as mock_reindex:
+            assert handler.compute() == []
+        mock_reindex.assert_called_once_with("target-uuid")
+
+    def test_errors_propagate(self) -> None:
+        handler = IndexNoteChanges.__new__(IndexNoteChanges)
+        handler.event = MagicMock()
+        handler.event.target.id = "note-uuid"
+        with (
+            patch(
+                "chart_command_search.handlers.search_index_sync.reindex_note",
+                side_effect=RuntimeError("boom"),
+            ),
+            pytest.raises(RuntimeError),
+        ):
+            handler.compute()
@@ -10,11 +10,21 @@ path (``You may not access other URLs using this client.``). Errors raise :class
 carrying the HTTP status so callers can special-case ``410 Gone`` without parsing strings.
 """
 
+import json
+from typing import NamedTuple
 from urllib.parse import quote, urlencode
 
 from canvas_sdk.utils.http import Http
 
 API_BASE = "https://www.googleapis.com/calendar/v3"
+BATCH_URL = "https://www.googleapis.com/batch/calendar/v3"
+# Calendar API path prefix each batch part's request line carries.
+_API_PATH = "/calendar/v3"
+
+# Google accepts up to 1000 calls per batch request but advises that Calendar batches larger than 50
+# are more likely to be throttled, so ``execute_batch`` sends larger lists as several requests.
+MAX_BATCH_SIZE = 50
+_BATCH_BOUNDARY = "gcal_sync_batch"
 
 
 class GoogleApiError(RuntimeError):
@@ -57,8 +67,73 @@ def _error_for(status_code: int, body: str) -> GoogleApiError:
     return GoogleApiError(status_code, body)
 
 
+class BatchCall(NamedTuple):
+    """One call inside a multipart batch request (see :meth:`GoogleCalendarClient.execute_batch`)."""
+
+    method: str
+    path: str  # under API_BASE, including any query string
+    body: dict | None = None
+    ok_statuses: tuple = (200,)
+
+
+def _batch_payload(calls: list[BatchCall]) -> str:
+    """Encode calls as a ``multipart/mixed`` body, one ``application/http`` part per call."""
+    lines: list[str] = []
+    for index, call in enumerate(calls):
+        lines += [
+            f"--{_BATCH_BOUNDARY}",
+            "Content-Type: application/http",
+            f"Content-ID: <item{index}>",
+            "",
+            f"{call.method} {_API_PATH}{call.path} HTTP/1.1",
+        ]
+        if call.body is not None:
+            lines += ["Content-Type: application/json", "", json.dumps(call.body)]
+        lines.append("")
+    lines.append(f"--{_BATCH_BOUNDARY}--")
+    return "\r\n".join(lines) + "\r\n"
+
+
+def _batch_boundary(content_type: str, text: str) -> str:
+    """The response's multipart boundary, from its ``Content-Type`` or, failing that, its first line."""
+    for param in content_type.split(";"):
+        name, _, value = param.strip().partition("=")
+        if name.lower() == "boundary" and value:
+            return value.strip('"')
+    return text.lstrip().split("\n", 1)[0].strip().lstrip("-")
+
+
+def _parse_batch_response(content_type: str, text: str) -> dict[int, tuple[int, str]]:
+    """Map each part's ``Content-ID`` index to its ``(status_code, body)``.
+
+    A part is the outer MIME headers (carrying ``Content-ID: <response-itemN>``), a blank line, then
+    the embedded HTTP response: status line, headers, blank line, body.
+    """
+    text = text.replace("\r\n", "\n")
+    boundary = _batch_boundary(content_type, text)
+    parts: dict[int, tuple[int, str]] = {}
+    for part in text.split(f"--{boundary}"):
+        part = part.strip("\n")
+        if not part or part == "--":
+            continue
+        mime_headers, _, http_response = part.partition("\n\n")
+        content_id = ""
+        for header in mime_headers.split("\n"):
+            name, _, value = header.partition(":")
+            if name.strip().lower() == "content-id":
+                content_id = value.strip().strip("<>")
+        if not content_id.startswith("response-item"):
+            continue
+        head, _, body = http_response.partition("\n\n")
+        status_line = head.split("\n", 1)[0].split()
+        if len(status_line) < 2 or not status_line[1].isdigit():
+            continue
+        parts[int(content_id[len("response-item") :])] = (int(status_line[1]), body.strip())
+    return parts
+
+
 class GoogleCalendarClient:
-    """Calendar-event CRUD, watch-channel, and incremental-list operations for one access token."""
+    """Calendar-event CRUD (single or batched), watch-channel, and incremental-list operations for one access token."""
 
     def __init__(self, access_token: str) -> None:
         # No base_url: the SDK client only allows URLs under its base_url, and a base_url with
@@ -75,6 +150,11 @@ class GoogleCalendarClient:
         # Calendar ids are email addresses; the path segment must be percent-encoded.
         return quote(calendar_id, safe="")
 
+    @classmethod
+    def _event_path(cls, calendar_id: str, event_id: str = "") -> str:
+        path = f"/calendars/{cls._cal(calendar_id)}/events"
+        return f"{path}/{quote(event_id, safe='')}" if event_id else path
+
     def insert_event(self, calendar_id: str, body: dict) -> dict:
         """Create an event; returns the created Google event (including its ``id``)."""
         resp = self._http.post(
@@ -226,6 +306,62 @@ class GoogleCalendarClient:
                 break
         return events
 
+    @classmethod
+    def insert_call(cls, calendar_id: str, body: dict) -> BatchCall:
+        """The batch counterpart of :meth:`insert_event`."""
+        return BatchCall("POST", cls._event_path(calendar_id), body, (200, 201))
+
+    @classmethod
+    def patch_call(cls, calendar_id: str, event_id: str, body: dict) -> BatchCall:
+        """The batch counterpart of :meth:`patch_event`."""
+        return BatchCall("PATCH", cls._event_path(calendar_id, event_id), body)
+
+    @classmethod
+    def delete_call(cls, calendar_id: str, event_id: str) -> BatchCall:
+        """The batch counterpart of :meth:`delete_event` (an already-gone event is success)."""
+        return BatchCall("DELETE", cls._event_path(calendar_id, event_id), None, (200, 204, 404, 410))
+
+    @classmethod
+    def find_by_private_property_call(cls, calendar_id: str, key: str, value: str) -> BatchCall:
+        """The batch counterpart of :meth:`find_event_by_private_property`; the result is a list page."""
+        params = {"privateExtendedProperty": f"{key}={value}", "maxResults": "1"}
+        return BatchCall("GET", f"{cls._event_path(calendar_id)}?{urlencode(params)}")
+
+    def execute_batch(self, calls: list[BatchCall]) -> list[dict | GoogleApiError]:
+        """Send calls through Google's multipart batch endpoint, up to ``MAX_BATCH_SIZE`` per request.
+
+        Returns one result per call, in order: the response JSON (``{}`` when the body is empty) for
+        a status in the call's ``ok_statuses``, else the :class:`GoogleApiError` (or
+        :class:`GoogleRateLimitError`) that call would have raised on its own. Failures are returned,
+        not raised, because Google applies and throttles each part independently — the caller keeps
+        the parts that landed and retries only the rest. A failure of a whole batch request is
+        reported as the result of each of its calls.
+        """
+        results: list[dict | GoogleApiError] = []
+        headers = {
+            **self._headers,
+            "Content-Type": f"multipart/mixed; boundary={_BATCH_BOUNDARY}",
+        }
+        for start in range(0, len(calls), MAX_BATCH_SIZE):
+            chunk = calls[start : start + MAX_BATCH_SIZE]
+            resp = self._http.post(BATCH_URL, data=_batch_payload(chunk), headers=headers)
+            if resp.status_code != 200:
+                error = _error_for(resp.status_code, resp.text)
+                results.extend(error for _ in chunk)
+                continue
+            content_type = (getattr(resp, "headers", None) or {}).get("Content-Type", "")
+            parts = _parse_batch_response(content_type, resp.text)
+            for index, call in enumerate(chunk):
+                if index not in parts:
+                    results.append(GoogleApiError(500, "missing from batch response"))
+                    continue
+                status_code, body = parts[index]
+                if status_code not in call.ok_statuses:
+                    results.append(_error_for(status_code, body))
+                else:
+                    results.append(json.loads(body) if body else {})
+        return results
+
     def watch_events(
         self,
         calendar_id: str,
@@ -21,7 +21,7 @@ from gcal_sync.appointment_snapshot import (
 from gcal_sync.blocks import sync_all_blocks
 from gcal_sync.channels import ChannelConfigError
 from gcal_sync.google.auth import GoogleAuthError
-from gcal_sync.google.client import GoogleApiError, GoogleRateLimitError
+from gcal_sync.google.client import MAX_BATCH_SIZE, GoogleApiError
 from gcal_sync.inbound import InboundSync
 from gcal_sync.models import (
     AppointmentEventMapping,
@@ -237,35 +237,51 @@ def outbound_truth(
             # no-op re-checks of the already-synced prefix (which would otherwise wedge the drain).
             pushable = [a for a in pushable if str(a["id"]) not in mapping_cache]
         completed = True
-        for appt in pushable:
+        # Push in batches: one Google batch request carries up to MAX_BATCH_SIZE appointments'
+        # calls, so a provider's re-push costs a few requests instead of one per appointment.
+        while pushable:
             if max_pushes is not None and total_pushed >= max_pushes:
                 completed = False  # ran out of budget mid-provider -> retry it next run
                 break
+            size = MAX_BATCH_SIZE
+            if max_pushes is not None:
+                size = min(size, max_pushes - total_pushed)
+            chunk, pushable = pushable[:size], pushable[size:]
             try:
-                sync.push(
+                result = sync.push_batch(
                     mapping.google_calendar_id,
-                    snapshot_from_values(appt),
+                    [snapshot_from_values(appt) for appt in chunk],
                     mapping_cache,
                 )
-                total_pushed += 1
-            except GoogleRateLimitError:
-                # Google is throttling THIS calendar. Stop pushing it now rather than hammering it
-                # (and dropping the writes as errors) — leave it incomplete so it is retried on a
-                # later run. The sandbox can't sleep, so the run cadence is the backoff. Move on to
-                # the next provider, which is a different calendar with its own per-user limit.
-                completed = False
-                log.info(
-                    "Reconcile push throttled on %s — deferring rest to next run",
+            except (GoogleApiError, GoogleAuthError, RequestException) as exc:
+                log.error(
+                    "Reconcile push failed for %s appt(s) -> %s: %s",
+                    len(chunk),
                     mapping.google_calendar_id,
+                    exc,
                 )
-                break
-            except (GoogleApiError, GoogleAuthError, RequestException) as exc:
+                continue
+            total_pushed += len(result.pushed)
+            for appointment_id, error in result.failed.items():
                 log.error(
                     "Reconcile push failed for appt %s -> %s: %s",
-                    appt.get("id"),
+                    appointment_id,
                     mapping.google_calendar_id,
-                    exc,
+                    error,
+                )
+            if result.deferred:
+                # Google is throttling THIS calendar. The parts that landed are kept; stop pushing it
+                # now rather than hammering it — leave it incomplete so the throttled appointments
+                # are retried on a later run. The sandbox can't sleep, so the run cadence is the
+                # backoff. Move on to the next provider, which is a different calendar with its own
+                # per-user limit.
+                completed = False
+                log.info(
+                    "Reconcile push throttled on %s (%s appt(s)) — deferring rest to next run",
+                    mapping.google_calendar_id,
+                    len(result.deferred),
                 )
+                break
         if completed and hasattr(mapping, "last_outbound_synced_at"):
             mapping.last_outbound_synced_at = arrow.utcnow().datetime
             try:
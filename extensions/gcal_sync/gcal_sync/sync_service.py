@@ -7,12 +7,16 @@ factory is injectable) so it can be unit-tested with a fake client.
 """
 
 from collections import defaultdict
-from typing import Callable
+from typing import Callable, NamedTuple
 
 from logger import log
 
 from gcal_sync.google.auth import GoogleAuth
-from gcal_sync.google.client import GoogleApiError, GoogleCalendarClient
+from gcal_sync.google.client import (
+    GoogleApiError,
+    GoogleCalendarClient,
+    GoogleRateLimitError,
+)
 from gcal_sync.google.event_builder import (
     CANVAS_APPT_ID_KEY,
     AppointmentSnapshot,
@@ -25,6 +29,14 @@ from gcal_sync.models import AppointmentEventMapping
 ClientFactory = Callable[[str], GoogleCalendarClient]
 
 
+class BatchPushResult(NamedTuple):
+    """Per-appointment outcome of :meth:`SyncService.push_batch`."""
+
+    pushed: list  # appointment ids whose Google event now matches Canvas (including unchanged ones)
+    deferred: list  # appointment ids Google throttled — retry on a later run
+    failed: dict  # appointment id -> the GoogleApiError that stopped its push
+
+
 class SyncService:
     """Pushes Canvas appointment state into Google and maintains the mapping table."""
 
@@ -120,6 +132,87 @@ class SyncService:
         mapping.save()
         return mapping
 
+    def push_batch(
+        self,
+        calendar_id: str,
+        snapshots: list[AppointmentSnapshot],
+        mapping_cache: dict[str, AppointmentEventMapping] | None = None,
+    ) -> BatchPushResult:
+        """``push`` many appointments to one calendar through Google's batch endpoint.
+
+        Same decisions as :meth:`push` — skip unchanged, adopt-or-insert when unmapped, patch in
+        place, re-create a patch target deleted in Google — but the Google calls of each step go out
+        as one batch request per ``MAX_BATCH_SIZE`` calls instead of one request per appointment: the
+        adopt lookups of unmapped appointments, then the writes, then any self-heal inserts. Each
+        part's status is mapped back to that appointment's ``AppointmentEventMapping``; a throttled
+        part is deferred and a failed one reported, without holding back the rest of the batch. An
+        appointment re-mapped from another calendar needs a delete under that calendar's token, so it
+        goes through :meth:`push` on its own.
+        """
+        result = BatchPushResult(pushed=[], deferred=[], failed={})
+        client = self._client_factory(calendar_id)
+
+        # appointment id -> (event body, content hash, existing mapping or None)
+        pending: dict[str, tuple[dict, str, AppointmentEventMapping | None]] = {}
+        for snapshot in snapshots:
+            appointment_id = str(snapshot["appointment_id"])
+            mapping = self._resolve_mapping(appointment_id, mapping_cache)
+            body = build_event_body(snapshot)
+            new_hash = content_hash(body)
+            if mapping is not None and mapping.google_calendar_id != calendar_id:
+                self._push_one(calendar_id, snapshot, mapping_cache, result)
+            elif mapping is not None and mapping.last_pushed_hash == new_hash:
+                result.pushed.append(appointment_id)
+            else:
+                pending[appointment_id] = (body, new_hash, mapping)
+
+        # Adopt, don't duplicate (see ``push``): look up every unmapped appointment's stamped event.
+        unmapped = [a for a, (_, _, mapping) in pending.items() if mapping is None]
+        lookups = client.execute_batch(
+            [
+                client.find_by_private_property_call(calendar_id, CANVAS_APPT_ID_KEY, a)
+                for a in unmapped
+            ]
+        )
+        adopted: dict[str, str] = {}
+        for appointment_id, lookup in zip(unmapped, lookups):
+            if isinstance(lookup, GoogleApiError):
+                self._settle_failure(appointment_id, lookup, result)
+                del pending[appointment_id]
+            elif lookup.get("items"):
+                adopted[appointment_id] = lookup["items"][0]["id"]
+
+        # appointment id -> Google event id the write targets ("" for an insert)
+        targets = {
+            a: mapping.google_event_id if mapping is not None else adopted.get(a, "")
+            for a, (_, _, mapping) in pending.items()
+        }
+        event_ids = self._batch_write(client, calendar_id, pending, targets, result)
+
+        # Self-heal: a patch target the provider deleted in Google is re-created.
+        gone = [a for a, event_id in event_ids.items() if event_id == ""]
+        event_ids.update(self._batch_write(client, calendar_id, pending, dict.fromkeys(gone, ""), result))
+
+        for appointment_id, event_id in event_ids.items():
+            if not event_id:
+                continue
+            _body, new_hash, mapping = pending[appointment_id]
+            if mapping is None:
+                AppointmentEventMapping.objects.update_or_create(
+                    canvas_appointment_id=appointment_id,
+                    defaults={
+                        "google_calendar_id": calendar_id,
+                        "google_event_id": event_id,
+                        "last_pushed_hash": new_hash,
+                    },
+                )
+            else:
+                mapping.google_event_id = event_id
+                mapping.last_pushed_hash = new_hash
+                mapping.save()
+            result.pushed.append(appointment_id)
+        return result
+
     def remove(self, appointment_id: str) -> bool:
         """Delete the Google event for an appointment and drop the mapping. Returns whether one existed."""
         mapping = self._existing_mapping(str(appointment_id))
@@ -188,6 +281,64 @@ class SyncService:
             log.info("Sweep removed %s stale/duplicate event(s) from %s", deletes, calendar_id)
         return deletes
 
+    def _batch_write(
+        self,
+        client: GoogleCalendarClient,
+        calendar_id: str,
+        pending: dict,
+        targets: dict[str, str],
+        result: BatchPushResult,
+    ) -> dict[str, str]:
+        """Patch (or insert, for an empty target) each appointment's event in one batch.
+
+        Returns appointment id -> the event id now holding its content, or ``""`` for a patch whose
+        target is gone (404/410) and needs re-creating. Throttled and failed parts are settled into
+        ``result`` and left out.
+        """
+        ids = list(targets)
+        calls = [
+            client.patch_call(calendar_id, targets[a], pending[a][0])
+            if targets[a]
+            else client.insert_call(calendar_id, pending[a][0])
+            for a in ids
+        ]
+        event_ids: dict[str, str] = {}
+        for appointment_id, response in zip(ids, client.execute_batch(calls)):
+            if (
+                targets[appointment_id]
+                and isinstance(response, GoogleApiError)
+                and response.status_code in (404, 410)
+            ):
+                event_ids[appointment_id] = ""
+            elif isinstance(response, GoogleApiError):
+                self._settle_failure(appointment_id, response, result)
+            else:
+                event_ids[appointment_id] = targets[appointment_id] or response["id"]
+        return event_ids
+
+    def _push_one(
+        self,
+        calendar_id: str,
+        snapshot: AppointmentSnapshot,
+        mapping_cache: dict[str, AppointmentEventMapping] | None,
+        result: BatchPushResult,
+    ) -> None:
+        appointment_id = str(snapshot["appointment_id"])
+        try:
+            self.push(calendar_id, snapshot, mapping_cache)
+        except GoogleApiError as exc:
+            self._settle_failure(appointment_id, exc, result)
+        else:
+            result.pushed.append(appointment_id)
+
+    @staticmethod
+    def _settle_failure(appointment_id: str, error: GoogleApiError, result: BatchPushResult) -> None:
+        """Record a failed push as deferred (throttled, retry later) or failed."""
+        if isinstance(error, GoogleRateLimitError):
+            result.deferred.append(appointment_id)
+        else:
+            result.failed[appointment_id] = error
+
     def _safe_delete(self, calendar_id: str, event_id: str) -> None:
         client = self._client_factory(calendar_id)
         client.delete_event(calendar_id, event_id)
@@ -215,4 +366,4 @@ class SyncService:
             return None
 
 
-__all__ = ["SyncService", "GoogleApiError"]
+__all__ = ["BatchPushResult", "SyncService", "GoogleApiError"]
@@ -0,0 +1,132 @@
+"""Tests for GoogleCalendarClient batch requests: multipart encoding, per-part results, chunking."""
+
+import json
+from types import SimpleNamespace
+
+from gcal_sync.google.client import (
+    BATCH_URL,
+    MAX_BATCH_SIZE,
+    GoogleApiError,
+    GoogleCalendarClient,
+    GoogleRateLimitError,
+)
+
+BOUNDARY = "batch_abc"
+
+
+def _client(mocker):
+    http = mocker.patch("gcal_sync.google.client.Http").return_value
+    return GoogleCalendarClient("tok"), http
+
+
+def _part(index, status, body=None):
+    reason = {200: "OK", 204: "No Content", 404: "Not Found", 403: "Forbidden"}.get(status, "Error")
+    payload = json.dumps(body) if body is not None else ""
+    return (
+        f"--{BOUNDARY}\r\n"
+        "Content-Type: application/http\r\n"
+        f"Content-ID: <response-item{index}>\r\n"
+        "\r\n"
+        f"HTTP/1.1 {status} {reason}\r\n"
+        "Content-Type: application/json; charset=UTF-8\r\n"
+        "\r\n"
+        f"{payload}\r\n"
+    )
+
+
+def _batch_resp(*parts, status=200, headers=True):
+    return SimpleNamespace(
+        status_code=status,
+        text="".join(parts) + f"--{BOUNDARY}--\r\n",
+        headers={"Content-Type": f"multipart/mixed; boundary={BOUNDARY}"} if headers else {},
+    )
+
+
+def test_batch_encodes_each_call_as_an_http_part(mocker):
+    client, http = _client(mocker)
+    http.post.return_value = _batch_resp(_part(0, 200, {"id": "g-1"}), _part(1, 204))
+    client.execute_batch(
+        [
+            client.insert_call("dr@example.com", {"summary": "x"}),
+            client.delete_call("dr@example.com", "g-2"),
+        ]
+    )
+
+    url = http.post.call_args.args[0]
+    kwargs = http.post.call_args.kwargs
+    assert url == BATCH_URL
+    assert kwargs["headers"]["Authorization"] == "Bearer tok"
+    assert kwargs["headers"]["Content-Type"].startswith("multipart/mixed; boundary=")
+    payload = kwargs["data"]
+    assert "Content-ID: <item0>" in payload and "Content-ID: <item1>" in payload
+    assert "POST /calendar/v3/calendars/dr%40example.com/events HTTP/1.1" in payload
+    assert '{"summary": "x"}' in payload
+    assert "DELETE /calendar/v3/calendars/dr%40example.com/events/g-2 HTTP/1.1" in payload
+    assert payload.rstrip().endswith("--")
+
+
+def test_batch_maps_each_part_to_a_result_in_call_order(mocker):
+    client, http = _client(mocker)
+    # Google may answer parts out of order; Content-ID puts them back.
+    http.post.return_value = _batch_resp(
+        _part(2, 404, {"error": {"message": "Not Found"}}),
+        _part(0, 200, {"id": "g-1"}),
+        _part(1, 403, {"error": {"errors": [{"domain": "usageLimits", "reason": "rateLimitExceeded"}]}}),
+        _part(3, 404),
+    )
+    results = client.execute_batch(
+        [
+            client.insert_call("c", {}),
+            client.patch_call("c", "g-2", {}),
+            client.patch_call("c", "g-3", {}),
+            client.delete_call("c", "g-4"),
+        ]
+    )
+
+    assert results[0] == {"id": "g-1"}
+    assert isinstance(results[1], GoogleRateLimitError)
+    assert isinstance(results[2], GoogleApiError) and results[2].status_code == 404
+    assert results[3] == {}  # delete of an already-gone event is success
+
+
+def test_batch_boundary_falls_back_to_the_body(mocker):
+    client, http = _client(mocker)
+    http.post.return_value = _batch_resp(_part(0, 200, {"id": "g-1"}), headers=False)
+    assert client.execute_batch([client.insert_call("c", {})]) == [{"id": "g-1"}]
+
+
+def test_batch_part_missing_from_response_is_an_error(mocker):
+    client, http = _client(mocker)
+    http.post.return_value = _batch_resp(_part(0, 200, {"id": "g-1"}))
+    results = client.execute_batch([client.insert_call("c", {}), client.insert_call("c", {})])
+    assert results[0] == {"id": "g-1"}
+    assert isinstance(results[1], GoogleApiError)
+
+
+def test_batch_request_failure_is_each_calls_result(mocker):
+    client, http = _client(mocker)
+    http.post.return_value = SimpleNamespace(status_code=429, text="rateLimitExceeded", headers={})
+    results = client.execute_batch([client.insert_call("c", {}), client.delete_call("c", "g")])
+    assert len(results) == 2
+    assert all(isinstance(r, GoogleRateLimitError) for r in results)
+
+
+def test_batch_splits_at_max_batch_size(mocker):
+    client, http = _client(mocker)
+    sizes = []
+
+    def _post(url, data=None, headers=None):
+        count = data.count("Content-ID: <item")
+        sizes.append(count)
+        return _batch_resp(*(_part(i, 200, {"id": f"g-{i}"}) for i in range(count)))
+
+    http.post.side_effect = _post
+    results = client.execute_batch([client.insert_call("c", {}) for _ in range(MAX_BATCH_SIZE + 5)])
+    assert sizes == [MAX_BATCH_SIZE, 5]
+    assert len(results) == MAX_BATCH_SIZE + 5
+
+
+def test_empty_batch_sends_nothing(mocker):
+    client, http = _client(mocker)
+    assert client.execute_batch([]) == []
+    http.post.assert_not_called()
@@ -28,6 +28,12 @@ from gcal_sync.reconcile import (
     release_provider_lock,
     sweep_outbound,
 )
+from gcal_sync.sync_service import BatchPushResult
+
+
+def _push_all(calendar_id, snapshots, mapping_cache):
+    """A push_batch stand-in under which every appointment in the batch lands."""
+    return BatchPushResult(pushed=[str(i) for i in range(len(snapshots))], deferred=[], failed={})
 
 
 # --- provider locking -----------------------------------------------------------------------------
@@ -153,6 +159,7 @@ def test_pushable_skips_terminal_and_google_origin(mocker):
 
 def test_outbound_truth_respects_max_pushes(mocker):
     sync = mocker.patch("gcal_sync.reconcile.SyncService").return_value
+    sync.push_batch.side_effect = _push_all
     ext = mocker.patch("gcal_sync.reconcile.AppointmentExternalIdentifier")
     ext.objects.filter.return_value.values_list.return_value = []
     aem = mocker.patch("gcal_sync.reconcile.AppointmentEventMapping")
@@ -170,11 +177,14 @@ def test_outbound_truth_respects_max_pushes(mocker):
         max_pushes=2,
     )
     assert pushed == 2
-    assert sync.push.call_count == 2
+    # One batch, cut to the remaining budget.
+    sync.push_batch.assert_called_once()
+    assert sync.push_batch.call_args.args[1] == ["SNAP", "SNAP"]
 
 
 def test_outbound_truth_skip_mapped_drops_already_mapped(mocker):
     sync = mocker.patch("gcal_sync.reconcile.SyncService").return_value
+    sync.push_batch.side_effect = _push_all
     ext = mocker.patch("gcal_sync.reconcile.AppointmentExternalIdentifier")
     ext.objects.filter.return_value.values_list.return_value = []
     aem = mocker.patch("gcal_sync.reconcile.AppointmentEventMapping")
@@ -194,12 +204,13 @@ def test_outbound_truth_skip_mapped_drops_already_mapped(mocker):
     )
     # Only appt 2 is pushed (appt 1 is already mapped and skip_mapped=True)
     assert pushed == 1
-    sync.push.assert_called_once()
+    sync.push_batch.assert_called_once()
+    assert sync.push_batch.call_args.args[1] == ["SNAP"]
 
 
 def test_outbound_truth_handles_rate_limit(mocker):
     sync = mocker.patch("gcal_sync.reconcile.SyncService").return_value
-    sync.push.side_effect = GoogleRateLimitError(429, "rate limit")
+    sync.push_batch.side_effect = GoogleRateLimitError(429, "rate limit")
     ext = mocker.patch("gcal_sync.reconcile.AppointmentExternalIdentifier")
     ext.objects.filter.return_value.values_list.return_value = []
     aem = mocker.patch("gcal_sync.reconcile.AppointmentEventMapping")
@@ -222,7 +233,7 @@ def test_outbound_truth_handles_rate_limit(mocker):
 
 def test_outbound_truth_handles_api_error(mocker):
     sync = mocker.patch("gcal_sync.reconcile.SyncService").return_value
-    sync.push.side_effect = GoogleApiError(500, "server error")
+    sync.push_batch.side_effect = GoogleApiError(500, "server error")
     ext = mocker.patch("gcal_sync.reconcile.AppointmentExternalIdentifier")
     ext.objects.filter.return_value.values_list.return_value = []
     aem = mocker.patch("gcal_sync.reconcile.AppointmentEventMapping")
@@ -242,8 +253,50 @@ def test_outbound_truth_handles_api_error(mocker):
     assert pushed == 0
 
 
+
+def test_outbound_truth_defers_provider_on_throttled_parts(mocker):
+    sync = mocker.patch("gcal_sync.reconcile.SyncService").return_value
+    # Two parts landed, one was throttled: keep the landed ones, leave the provider incomplete.
+    sync.push_batch.return_value = BatchPushResult(pushed=["1", "2"], deferred=["3"], failed={})
+    ext = mocker.patch("gcal_sync.reconcile.AppointmentExternalIdentifier")
+    ext.objects.filter.return_value.values_list.return_value = []
+    aem = mocker.patch("gcal_sync.reconcile.AppointmentEventMapping")
+    aem.objects.filter.return_value = []
+    appt = mocker.patch("gcal_sync.reconcile.Appointment")
+    appt.objects.filter.return_value.values.return_value = [
+        {"id": i, "status": "confirmed"} for i in (1, 2, 3)
+    ]
+    mocker.patch("gcal_sync.reconcile.snapshot_from_values", return_value="SNAP")
+    mapping = SimpleNamespace(
+        canvas_staff_id="14",
+        google_calendar_id="c1",
+        last_outbound_synced_at=None,
+        save=mocker.Mock(),
+    )
+    assert outbound_truth({}, [mapping]) == 2
+    assert mapping.last_outbound_synced_at is None
+    mapping.save.assert_not_called()
+
+
+def test_outbound_truth_batches_by_max_batch_size(mocker):
+    sync = mocker.patch("gcal_sync.reconcile.SyncService").return_value
+    sync.push_batch.side_effect = _push_all
+    ext = mocker.patch("gcal_sync.reconcile.AppointmentExternalIdentifier")
+    ext.objects.filter.return_value.values_list.return_value = []
+    aem = mocker.patch("gcal_sync.reconcile.AppointmentEventMapping")
+    aem.objects.filter.return_value = []
+    appt = mocker.patch("gcal_sync.reconcile.Appointment")
+    appt.objects.filter.return_value.values.return_value = [
+        {"id": i, "status": "confirmed"} for i in range(120)
+    ]
+    mocker.patch("gcal_sync.reconcile.snapshot_from_values", return_value="SNAP")
+    mapping = SimpleNamespace(canvas_staff_id="14", google_calendar_id="c1")
+    assert outbound_truth({}, [mapping]) == 120
+    assert [len(c.args[1]) for c in sync.push_batch.call_args_list] == [50, 50, 20]
+
 def test_outbound_truth_stamps_synced_at_when_completed(mocker):
     sync = mocker.patch("gcal_sync.reconcile.SyncService").return_value
+    sync.push_batch.side_effect = _push_all
     ext = mocker.patch("gcal_sync.reconcile.AppointmentExternalIdentifier")
     ext.objects.filter.return_value.values_list.return_value = []
     aem = mocker.patch("gcal_sync.reconcile.AppointmentEventMapping")
@@ -266,6 +319,7 @@ def test_outbound_truth_stamps_synced_at_when_completed(mocker):
 
 def test_outbound_truth_save_failure_doesnt_abort(mocker):
     sync = mocker.patch("gcal_sync.reconcile.SyncService").return_value
+    sync.push_batch.side_effect = _push_all
     ext = mocker.patch("gcal_sync.reconcile.AppointmentExternalIdentifier")
     ext.objects.filter.return_value.values_list.return_value = []
     aem = mocker.patch("gcal_sync.reconcile.AppointmentEventMapping")
@@ -8,6 +8,7 @@ from gcal_sync.reconcile import (
     reconcile_all,
     reconcile_provider,
 )
+from gcal_sync.sync_service import BatchPushResult
 
 
 def test_inbound_recovery_pulls_each_calendar(mocker):
@@ -40,6 +41,7 @@ def test_inbound_recovery_caps_full_pulls_but_runs_all_deltas(mocker):
 
 def test_outbound_truth_pushes_only_live_non_origin(mocker):
     sync = mocker.patch("gcal_sync.reconcile.SyncService").return_value
+    sync.push_batch.return_value = BatchPushResult(pushed=["1"], deferred=[], failed={})
     ext = mocker.patch("gcal_sync.reconcile.AppointmentExternalIdentifier")
     ext.objects.filter.return_value.values_list.return_value = []  # no google-origin records
     aem = mocker.patch("gcal_sync.reconcile.AppointmentEventMapping")
@@ -52,7 +54,7 @@ def test_outbound_truth_pushes_only_live_non_origin(mocker):
     mocker.patch("gcal_sync.reconcile.snapshot_from_values", return_value="SNAP")
     pushed = outbound_truth({}, [SimpleNamespace(canvas_staff_id="14", google_calendar_id="c1")])
     assert pushed == 1
-    sync.push.assert_called_once_with("c1", "SNAP", {})
+    sync.push_batch.assert_called_once_with("c1", ["SNAP"], {})
 
 
 def test_outbound_truth_skips_google_origin(mocker):
@@ -63,7 +65,7 @@ def test_outbound_truth_skips_google_origin(mocker):
     appt.objects.filter.return_value.values.return_value = [{"id": 1, "status": "confirmed"}]
     mocker.patch("gcal_sync.reconcile.snapshot_from_values", return_value="SNAP")
     assert outbound_truth({}, [SimpleNamespace(canvas_staff_id="14", google_calendar_id="c1")]) == 0
-    sync.push.assert_not_called()
+    sync.push_batch.assert_not_called()
 
 
 def test_reconcile_provider_combines_inbound_outbound_blocks(mocker):
@@ -0,0 +1,186 @@
+"""Tests for SyncService.push_batch: per-part results mapped back to the mapping table."""
+
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+from gcal_sync.google.client import GoogleApiError, GoogleCalendarClient, GoogleRateLimitError
+from gcal_sync.google.event_builder import build_event_body, content_hash
+from gcal_sync.sync_service import SyncService
+
+VALID_SA = '{"client_email": "svc@x.iam", "private_key": "KEY"}'
+
+
+def _snapshot(appointment_id):
+    return {
+        "appointment_id": appointment_id,
+        "visit_type": "Visit",
+        "start_time": datetime(2026, 6, 10, 15, 0, tzinfo=timezone.utc),
+        "duration_minutes": 30,
+        "location": "Clinic",
+        "meeting_link": None,
+        "status": "confirmed",
+    }
+
+
+class FakeBatchClient:
+    """Answers each batch call through ``respond(call)``; records every batch sent."""
+
+    insert_call = staticmethod(GoogleCalendarClient.insert_call)
+    patch_call = staticmethod(GoogleCalendarClient.patch_call)
+    delete_call = staticmethod(GoogleCalendarClient.delete_call)
+    find_by_private_property_call = staticmethod(GoogleCalendarClient.find_by_private_property_call)
+
+    def __init__(self, respond):
+        self.respond = respond
+        self.batches = []
+
+    def execute_batch(self, calls):
+        if calls:
+            self.batches.append([(c.method, c.path) for c in calls])
+        return [self.respond(c) for c in calls]
+
+
+def _default_respond(call):
+    if call.method == "GET":
+        return {"items": []}
+    if call.method == "POST":
+        return {"id": "g-new"}
+    return {"id": call.path.rsplit("/", 1)[-1]}
+
+
+def _mapping(appointment_id, event_id, calendar_id="cal@x", last_hash="stale"):
+    return SimpleNamespace(
+        canvas_appointment_id=appointment_id,
+        google_calendar_id=calendar_id,
+        google_event_id=event_id,
+        last_pushed_hash=last_hash,
+        save=lambda: None,
+    )
+
+
+def _model(mocker):
+    return mocker.patch("gcal_sync.sync_service.AppointmentEventMapping")
+
+
+def test_push_batch_sends_lookups_then_writes_as_two_batches(mocker):
+    model = _model(mocker)
+    fake = FakeBatchClient(_default_respond)
+    service = SyncService(VALID_SA, client_factory=lambda cal: fake)
+    cache = {"a2": _mapping("a2", "g-2")}
+
+    result = service.push_batch("cal@x", [_snapshot("a1"), _snapshot("a2")], cache)
+
+    assert sorted(result.pushed) == ["a1", "a2"]
+    assert result.deferred == [] and result.failed == {}
+    # One lookup batch (only the unmapped appointment), then one write batch for both.
+    assert [m for m, _ in fake.batches[0]] == ["GET"]
+    assert sorted(m for m, _ in fake.batches[1]) == ["PATCH", "POST"]
+    assert len(fake.batches) == 2
+    model.objects.update_or_create.assert_called_once()
+    kwargs = model.objects.update_or_create.call_args.kwargs
+    assert kwargs["canvas_appointment_id"] == "a1"
+    assert kwargs["defaults"]["google_event_id"] == "g-new"
+    assert cache["a2"].last_pushed_hash == content_hash(build_event_body(_snapshot("a2")))
+
+
+def test_push_batch_skips_unchanged_without_calls(mocker):
+    _model(mocker)
+    fake = FakeBatchClient(_default_respond)
+    service = SyncService(VALID_SA, client_factory=lambda cal: fake)
+    current = content_hash(build_event_body(_snapshot("a1")))
+    cache = {"a1": _mapping("a1", "g-1", last_hash=current)}
+
+    result = service.push_batch("cal@x", [_snapshot("a1")], cache)
+
+    assert result.pushed == ["a1"]
+    assert fake.batches == []
+
+
+def test_push_batch_adopts_a_stamped_event(mocker):
+    model = _model(mocker)
+
+    def respond(call):
+        if call.method == "GET":
+            return {"items": [{"id": "g-existing"}]}
+        return _default_respond(call)
+
+    fake = FakeBatchClient(respond)
+    service = SyncService(VALID_SA, client_factory=lambda cal: fake)
+
+    service.push_batch("cal@x", [_snapshot("a1")], {})
+
+    assert fake.batches[1] == [("PATCH", "/calendars/cal%40x/events/g-existing")]
+    assert model.objects.update_or_create.call_args.kwargs["defaults"]["google_event_id"] == "g-existing"
+
+
+def test_push_batch_recreates_a_deleted_patch_target(mocker):
+    _model(mocker)
+
+    def respond(call):
+        if call.method == "PATCH":
+            return GoogleApiError(410, "gone")
+        return _default_respond(call)
+
+    fake = FakeBatchClient(respond)
+    service = SyncService(VALID_SA, client_factory=lambda cal: fake)
+    cache = {"a1": _mapping("a1", "g-old")}
+
+    result = service.push_batch("cal@x", [_snapshot("a1")], cache)
+
+    assert result.pushed == ["a1"]
+    assert [m for m, _ in fake.batches[-1]] == ["POST"]
+    assert cache["a1"].google_event_id == "g-new"
+
+
+def test_push_batch_defers_throttled_parts_and_keeps_the_rest(mocker):
+    _model(mocker)
+
+    def respond(call):
+        if call.method == "PATCH" and call.path.endswith("g-2"):
+            return GoogleRateLimitError(403, "rateLimitExceeded")
+        if call.method == "PATCH" and call.path.endswith("g-3"):
+            return GoogleApiError(400, "bad request")
+        return _default_respond(call)
+
+    fake = FakeBatchClient(respond)
+    service = SyncService(VALID_SA, client_factory=lambda cal: fake)
+    cache = {a: _mapping(a, f"g-{a[-1]}") for a in ("a1", "a2", "a3")}
+
+    result = service.push_batch("cal@x", [_snapshot(a) for a in ("a1", "a2", "a3")], cache)
+
+    assert result.pushed == ["a1"]
+    assert result.deferred == ["a2"]
+    assert list(result.failed) == ["a3"]
+    assert cache["a2"].last_pushed_hash == "stale"  # not recorded, so it is retried next run
+
+
+def test_push_batch_throttled_lookup_defers_without_writing(mocker):
+    model = _model(mocker)
+
+    def respond(call):
+        if call.method == "GET":
+            return GoogleRateLimitError(429, "rateLimitExceeded")
+        return _default_respond(call)
+
+    fake = FakeBatchClient(respond)
+    service = SyncService(VALID_SA, client_factory=lambda cal: fake)
+
+    result = service.push_batch("cal@x", [_snapshot("a1")], {})
+
+    assert result.deferred == ["a1"]
+    assert len(fake.batches) == 1
+    model.objects.update_or_create.assert_not_called()
+
+
+def test_push_batch_remapped_calendar_goes_through_push(mocker):
+    _model(mocker)
+    fake = FakeBatchClient(_default_respond)
+    service = SyncService(VALID_SA, client_factory=lambda cal: fake)
+    push = mocker.patch.object(service, "push")
+    cache = {"a1": _mapping("a1", "g-1", calendar_id="old@x")}
+
+    result = service.push_batch("cal@x", [_snapshot("a1")], cache)
+
+    push.assert_called_once_with("cal@x", _snapshot("a1"), cache)
+    assert result.pushed == ["a1"]
+    assert fake.batches == []
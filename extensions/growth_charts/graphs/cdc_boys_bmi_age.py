@@ -1,2191 +0,0 @@
-cdc_boys_bmi_age = [
- {'x': 24.0, 'y': 14.520953329, 'z': '3th'},
- {'x': 24.0, 'y': 14.737319472, 'z': '5th'},
- {'x': 24.0, 'y': 15.090328265, 'z': '10th'},
- {'x': 24.0, 'y': 15.74164233, 'z': '25th'},
- {'x': 24.0, 'y': 16.575027675, 'z': '50th'},
- {'x': 24.0, 'y': 17.55718781, 'z': '75th'},
- {'x': 24.0, 'y': 18.162194733, 'z': '85th'},
- {'x': 24.0, 'y': 18.609481276, 'z': '90th'},
- {'x': 24.0, 'y': 19.338010618, 'z': '95th'},
- {'x': 24.0, 'y': 19.859858115, 'z': '97th'},
- {'x': 24.5, 'y': 14.503476669, 'z': '3th'},
- {'x': 24.5, 'y': 14.719292573, 'z': '5th'},
- {'x': 24.5, 'y': 15.071174743, 'z': '10th'},
- {'x': 24.5, 'y': 15.71962876, 'z': '25th'},
- {'x': 24.5, 'y': 16.547774867, 'z': '50th'},
- {'x': 24.5, 'y': 17.521292788, 'z': '75th'},
- {'x': 24.5, 'y': 18.119549228, 'z': '85th'},
- {'x': 24.5, 'y': 18.561106338, 'z': '90th'},
- {'x': 24.5, 'y': 19.278898128, 'z': '95th'},
- {'x': 24.5, 'y': 19.791940141, 'z': '97th'},
- {'x': 25.5, 'y': 14.46882381, 'z': '3th'},
- {'x': 25.5, 'y': 14.683608414, 'z': '5th'},
- {'x': 25.5, 'y': 15.033357254, 'z': '10th'},
- {'x': 25.5, 'y': 15.676344635, 'z': '25th'},
- {'x': 25.5, 'y': 16.494427632, 'z': '50th'},
- {'x': 25.5, 'y': 17.451350388, 'z': '75th'},
- {'x': 25.5, 'y': 18.036680126, 'z': '85th'},
- {'x': 25.5, 'y': 18.467295933, 'z': '90th'},
- {'x': 25.5, 'y': 19.164659645, 'z': '95th'},
- {'x': 25.5, 'y': 19.66102345, 'z': '97th'},
- {'x': 26.5, 'y': 14.43459737, 'z': '3th'},
- {'x': 26.5, 'y': 14.648433294, 'z': '5th'},
- {'x': 26.5, 'y': 14.996195048, 'z': '10th'},
- {'x': 26.5, 'y': 15.634034999, 'z': '25th'},
- {'x': 26.5, 'y': 16.442595522, 'z': '50th'},
- {'x': 26.5, 'y': 17.383836555, 'z': '75th'},
- {'x': 26.5, 'y': 17.957002275, 'z': '85th'},
- {'x': 26.5, 'y': 18.377361906, 'z': '90th'},
- {'x': 26.5, 'y': 19.055674233, 'z': '95th'},
- {'x': 26.5, 'y': 19.536575397, 'z': '97th'},
- {'x': 27.5, 'y': 14.400828277, 'z': '3th'},
- {'x': 27.5, 'y': 14.613786255, 'z': '5th'},
- {'x': 27.5, 'y': 14.959690474, 'z': '10th'},
- {'x': 27.5, 'y': 15.592679796, 'z': '25th'},
- {'x': 27.5, 'y': 16.392243398, 'z': '50th'},
- {'x': 27.5, 'y': 17.318710201, 'z': '75th'},
- {'x': 27.5, 'y': 17.880471005, 'z': '85th'},
- {'x': 27.5, 'y': 18.29125345, 'z': '90th'},
- {'x': 27.5, 'y': 18.951867497, 'z': '95th'},
- {'x': 27.5, 'y': 19.418488052, 'z': '97th'},
- {'x': 28.5, 'y': 14.367547175, 'z': '3th'},
- {'x': 28.5, 'y': 14.579685777, 'z': '5th'},
- {'x': 28.5, 'y': 14.923845144, 'z': '10th'},
- {'x': 28.5, 'y': 15.552258528, 'z': '25th'},
- {'x': 28.5, 'y': 16.343336543, 'z': '50th'},
- {'x': 28.5, 'y': 17.255931298, 'z': '75th'},
- {'x': 28.5, 'y': 17.807042591, 'z': '85th'},
- {'x': 28.5, 'y': 18.208920408, 'z': '90th'},
- {'x': 28.5, 'y': 18.853165291, 'z': '95th'},
- {'x': 28.5, 'y': 19.306654105, 'z': '97th'},
- {'x': 29.5, 'y': 14.334784135, 'z': '3th'},
- {'x': 29.5, 'y': 14.546149661, 'z': '5th'},
- {'x': 29.5, 'y': 14.888660028, 'z': '10th'},
- {'x': 29.5, 'y': 15.512750567, 'z': '25th'},
- {'x': 29.5, 'y': 16.295840971, 'z': '50th'},
- {'x': 29.5, 'y': 17.195460929, 'z': '75th'},
- {'x': 29.5, 'y': 17.736674142, 'z': '85th'},
- {'x': 29.5, 'y': 18.130313102, 'z': '90th'},
- {'x': 29.5, 'y': 18.759493593, 'z': '95th'},
- {'x': 29.5, 'y': 19.200966909, 'z': '97th'},
- {'x': 30.5, 'y': 14.302568372, 'z': '3th'},
- {'x': 30.5, 'y': 14.513194923, 'z': '5th'},
- {'x': 30.5, 'y': 14.85413557, 'z': '10th'},
- {'x': 30.5, 'y': 15.474135486, 'z': '25th'},
- {'x': 30.5, 'y': 16.249723714, 'z': '50th'},
- {'x': 30.5, 'y': 17.137261294, 'z': '75th'},
- {'x': 30.5, 'y': 17.669323458, 'z': '85th'},
- {'x': 30.5, 'y': 18.055382142, 'z': '90th'},
- {'x': 30.5, 'y': 18.670778406, 'z': '95th'},
- {'x': 30.5, 'y': 19.10132056, 'z': '97th'},
- {'x': 31.5, 'y': 14.270928334, 'z': '3th'},
- {'x': 31.5, 'y': 14.480837948, 'z': '5th'},
- {'x': 31.5, 'y': 14.820271893, 'z': '10th'},
- {'x': 31.5, 'y': 15.436393188, 'z': '25th'},
- {'x': 31.5, 'y': 16.204952678, 'z': '50th'},
- {'x': 31.5, 'y': 17.081295301, 'z': '75th'},
- {'x': 31.5, 'y': 17.604948602, 'z': '85th'},
- {'x': 31.5, 'y': 17.984078116, 'z': '90th'},
- {'x': 31.5, 'y': 18.586945886, 'z': '95th'},
- {'x': 31.5, 'y': 19.007610506, 'z': '97th'},
- {'x': 32.5, 'y': 14.239889707, 'z': '3th'},
- {'x': 32.5, 'y': 14.449093293, 'z': '5th'},
- {'x': 32.5, 'y': 14.7870687, 'z': '10th'},
- {'x': 32.5, 'y': 15.399505213, 'z': '25th'},
- {'x': 32.5, 'y': 16.161498714, 'z': '50th'},
- {'x': 32.5, 'y': 17.027528307, 'z': '75th'},
- {'x': 32.5, 'y': 17.543508981, 'z': '85th'},
- {'x': 32.5, 'y': 17.916351977, 'z': '90th'},
- {'x': 32.5, 'y': 18.507921309, 'z': '95th'},
- {'x': 32.5, 'y': 18.919731254, 'z': '97th'},
- {'x': 33.5, 'y': 14.209478199, 'z': '3th'},
- {'x': 33.5, 'y': 14.417975614, 'z': '5th'},
- {'x': 33.5, 'y': 14.754525899, 'z': '10th'},
- {'x': 33.5, 'y': 15.363453352, 'z': '25th'},
- {'x': 33.5, 'y': 16.119332582, 'z': '50th'},
- {'x': 33.5, 'y': 16.975924854, 'z': '75th'},
- {'x': 33.5, 'y': 17.484962947, 'z': '85th'},
- {'x': 33.5, 'y': 17.852153836, 'z': '90th'},
- {'x': 33.5, 'y': 18.433630719, 'z': '95th'},
- {'x': 33.5, 'y': 18.837580724, 'z': '97th'},
- {'x': 34.5, 'y': 14.179716981, 'z': '3th'},
- {'x': 34.5, 'y': 14.387498109, 'z': '5th'},
- {'x': 34.5, 'y': 14.722643426, 'z': '10th'},
- {'x': 34.5, 'y': 15.328221247, 'z': '25th'},
- {'x': 34.5, 'y': 16.078427579, 'z': '50th'},
- {'x': 34.5, 'y': 16.926451011, 'z': '75th'},
- {'x': 34.5, 'y': 17.429269329, 'z': '85th'},
- {'x': 34.5, 'y': 17.791433588, 'z': '90th'},
- {'x': 34.5, 'y': 18.363999601, 'z': '95th'},
- {'x': 34.5, 'y': 18.761057109, 'z': '97th'},
- {'x': 35.5, 'y': 14.150627151, 'z': '3th'},
- {'x': 35.5, 'y': 14.357672932, 'z': '5th'},
- {'x': 35.5, 'y': 14.691421518, 'z': '10th'},
- {'x': 35.5, 'y': 15.293794298, 'z': '25th'},
- {'x': 35.5, 'y': 16.038758958, 'z': '50th'},
- {'x': 35.5, 'y': 16.879073565, 'z': '75th'},
- {'x': 35.5, 'y': 17.376386767, 'z': '85th'},
- {'x': 35.5, 'y': 17.734140533, 'z': '90th'},
- {'x': 35.5, 'y': 18.298953229, 'z': '95th'},
- {'x': 35.5, 'y': 18.690059923, 'z': '97th'},
- {'x': 36.5, 'y': 14.122227569, 'z': '3th'},
- {'x': 36.5, 'y': 14.328511189, 'z': '5th'},
- {'x': 36.5, 'y': 14.660860875, 'z': '10th'},
- {'x': 36.5, 'y': 15.260159883, 'z': '25th'},
- {'x': 36.5, 'y': 16.000304012, 'z': '50th'},
- {'x': 36.5, 'y': 16.833759903, 'z': '75th'},
- {'x': 36.5, 'y': 17.326273561, 'z': '85th'},
- {'x': 36.5, 'y': 17.680223246, 'z': '90th'},
- {'x': 36.5, 'y': 18.238416662, 'z': '95th'},
- {'x': 36.5, 'y': 18.624490107, 'z': '97th'},
- {'x': 37.5, 'y': 14.094534131, 'z': '3th'},
- {'x': 37.5, 'y': 14.300022559, 'z': '5th'},
- {'x': 37.5, 'y': 14.630962724, 'z': '10th'},
- {'x': 37.5, 'y': 15.22730791, 'z': '25th'},
- {'x': 37.5, 'y': 15.963042771, 'z': '50th'},
- {'x': 37.5, 'y': 16.79047852, 'z': '75th'},
- {'x': 37.5, 'y': 17.278887949, 'z': '85th'},
- {'x': 37.5, 'y': 17.62962965, 'z': '90th'},
- {'x': 37.5, 'y': 18.182314401, 'z': '95th'},
- {'x': 37.5, 'y': 18.564249301, 'z': '97th'},
- {'x': 38.5, 'y': 14.067563285, 'z': '3th'},
- {'x': 38.5, 'y': 14.27221761, 'z': '5th'},
- {'x': 38.5, 'y': 14.601729363, 'z': '10th'},
- {'x': 38.5, 'y': 15.1952288, 'z': '25th'},
- {'x': 38.5, 'y': 15.926954175, 'z': '50th'},
- {'x': 38.5, 'y': 16.749195248, 'z': '75th'},
- {'x': 38.5, 'y': 17.234185537, 'z': '85th'},
- {'x': 38.5, 'y': 17.582305867, 'z': '90th'},
- {'x': 38.5, 'y': 18.130572441, 'z': '95th'},
- {'x': 38.5, 'y': 18.509244783, 'z': '97th'},
- {'x': 39.5, 'y': 14.041322876, 'z': '3th'},
- {'x': 39.5, 'y': 14.245102016, 'z': '5th'},
- {'x': 39.5, 'y': 14.573163164, 'z': '10th'},
- {'x': 39.5, 'y': 15.163919012, 'z': '25th'},
- {'x': 39.5, 'y': 15.892025816, 'z': '50th'},
- {'x': 39.5, 'y': 16.709882467, 'z': '75th'},
- {'x': 39.5, 'y': 17.192125454, 'z': '85th'},
- {'x': 39.5, 'y': 17.538198877, 'z': '90th'},
- {'x': 39.5, 'y': 18.083113112, 'z': '95th'},
- {'x': 39.5, 'y': 18.459377192, 'z': '97th'},
- {'x': 40.5, 'y': 14.015824303, 'z': '3th'},
- {'x': 40.5, 'y': 14.218684325, 'z': '5th'},
- {'x': 40.5, 'y': 14.545268061, 'z': '10th'},
- {'x': 40.5, 'y': 15.133373821, 'z': '25th'},
- {'x': 40.5, 'y': 15.858240929, 'z': '50th'},
- {'x': 40.5, 'y': 16.672506675, 'z': '75th'},
- {'x': 40.5, 'y': 17.152662007, 'z': '85th'},
- {'x': 40.5, 'y': 17.497252885, 'z': '90th'},
- {'x': 40.5, 'y': 18.039861981, 'z': '95th'},
- {'x': 40.5, 'y': 18.414556972, 'z': '97th'},
- {'x': 41.5, 'y': 13.991073321, 'z': '3th'},
- {'x': 41.5, 'y': 14.192970112, 'z': '5th'},
- {'x': 41.5, 'y': 14.518048471, 'z': '10th'},
- {'x': 41.5, 'y': 15.103592813, 'z': '25th'},
- {'x': 41.5, 'y': 15.825588223, 'z': '50th'},
- {'x': 41.5, 'y': 16.637037867, 'z': '75th'},
- {'x': 41.5, 'y': 17.115750983, 'z': '85th'},
- {'x': 41.5, 'y': 17.459412067, 'z': '90th'},
- {'x': 41.5, 'y': 18.00074262, 'z': '95th'},
- {'x': 41.5, 'y': 18.374691868, 'z': '97th'},
- {'x': 42.5, 'y': 13.967074386, 'z': '3th'},
- {'x': 42.5, 'y': 14.167964724, 'z': '5th'},
- {'x': 42.5, 'y': 14.491509775, 'z': '10th'},
- {'x': 42.5, 'y': 15.074577279, 'z': '25th'},
- {'x': 42.5, 'y': 15.794057282, 'z': '50th'},
- {'x': 42.5, 'y': 16.603445205, 'z': '75th'},
- {'x': 42.5, 'y': 17.081346773, 'z': '85th'},
- {'x': 42.5, 'y': 17.424619345, 'z': '90th'},
- {'x': 42.5, 'y': 17.965679031, 'z': '95th'},
- {'x': 42.5, 'y': 18.339692642, 'z': '97th'},
- {'x': 43.5, 'y': 13.943826979, 'z': '3th'},
- {'x': 43.5, 'y': 14.143670894, 'z': '5th'},
- {'x': 43.5, 'y': 14.4656578, 'z': '10th'},
- {'x': 43.5, 'y': 15.046332352, 'z': '25th'},
- {'x': 43.5, 'y': 15.763642549, 'z': '50th'},
- {'x': 43.5, 'y': 16.571700922, 'z': '75th'},
- {'x': 43.5, 'y': 17.049405037, 'z': '85th'},
- {'x': 43.5, 'y': 17.392817585, 'z': '90th'},
- {'x': 43.5, 'y': 17.934593498, 'z': '95th'},
- {'x': 43.5, 'y': 18.309467847, 'z': '97th'},
- {'x': 44.5, 'y': 13.921331901, 'z': '3th'},
- {'x': 44.5, 'y': 14.120092688, 'z': '5th'},
- {'x': 44.5, 'y': 14.440499466, 'z': '10th'},
- {'x': 44.5, 'y': 15.018863186, 'z': '25th'},
- {'x': 44.5, 'y': 15.734336684, 'z': '50th'},
- {'x': 44.5, 'y': 16.541774116, 'z': '75th'},
- {'x': 44.5, 'y': 17.019878597, 'z': '85th'},
- {'x': 44.5, 'y': 17.363947848, 'z': '90th'},
- {'x': 44.5, 'y': 17.907410074, 'z': '95th'},
- {'x': 44.5, 'y': 18.283932044, 'z': '97th'},
- {'x': 45.5, 'y': 13.899586603, 'z': '3th'},
- {'x': 45.5, 'y': 14.097232459, 'z': '5th'},
- {'x': 45.5, 'y': 14.416042095, 'z': '10th'},
- {'x': 45.5, 'y': 14.992177659, 'z': '25th'},
- {'x': 45.5, 'y': 15.706135657, 'z': '50th'},
- {'x': 45.5, 'y': 16.513635771, 'z': '75th'},
- {'x': 45.5, 'y': 16.992720871, 'z': '85th'},
- {'x': 45.5, 'y': 17.337950949, 'z': '90th'},
- {'x': 45.5, 'y': 17.884051832, 'z': '95th'},
- {'x': 45.5, 'y': 18.262999112, 'z': '97th'},
- {'x': 46.5, 'y': 13.878583524, 'z': '3th'},
- {'x': 46.5, 'y': 14.075089663, 'z': '5th'},
- {'x': 46.5, 'y': 14.392292996, 'z': '10th'},
- {'x': 46.5, 'y': 14.966287194, 'z': '25th'},
- {'x': 46.5, 'y': 15.679040623, 'z': '50th'},
- {'x': 46.5, 'y': 16.487260819, 'z': '75th'},
- {'x': 46.5, 'y': 16.967887393, 'z': '85th'},
- {'x': 46.5, 'y': 17.314768223, 'z': '90th'},
- {'x': 46.5, 'y': 17.864439827, 'z': '95th'},
- {'x': 46.5, 'y': 18.246579487, 'z': '97th'},
- {'x': 47.5, 'y': 13.858315818, 'z': '3th'},
- {'x': 47.5, 'y': 14.053664432, 'z': '5th'},
- {'x': 47.5, 'y': 14.369260002, 'z': '10th'},
- {'x': 47.5, 'y': 14.941203248, 'z': '25th'},
- {'x': 47.5, 'y': 15.653051916, 'z': '50th'},
- {'x': 47.5, 'y': 16.462622584, 'z': '75th'},
- {'x': 47.5, 'y': 16.945332151, 'z': '85th'},
- {'x': 47.5, 'y': 17.294339986, 'z': '90th'},
- {'x': 47.5, 'y': 17.848496221, 'z': '95th'},
- {'x': 47.5, 'y': 18.234587502, 'z': '97th'},
- {'x': 48.5, 'y': 13.838774042, 'z': '3th'},
- {'x': 48.5, 'y': 14.032955327, 'z': '5th'},
- {'x': 48.5, 'y': 14.346950843, 'z': '10th'},
- {'x': 48.5, 'y': 14.916939107, 'z': '25th'},
- {'x': 48.5, 'y': 15.628172692, 'z': '50th'},
- {'x': 48.5, 'y': 16.439696571, 'z': '75th'},
- {'x': 48.5, 'y': 16.925010281, 'z': '85th'},
- {'x': 48.5, 'y': 17.276606839, 'z': '90th'},
- {'x': 48.5, 'y': 17.836142298, 'z': '95th'},
- {'x': 48.5, 'y': 18.226936331, 'z': '97th'},
- {'x': 49.5, 'y': 13.819947109, 'z': '3th'},
- {'x': 49.5, 'y': 14.012959844, 'z': '5th'},
- {'x': 49.5, 'y': 14.325373048, 'z': '10th'},
- {'x': 49.5, 'y': 14.893509134, 'z': '25th'},
- {'x': 49.5, 'y': 15.604407997, 'z': '50th'},
- {'x': 49.5, 'y': 16.418459852, 'z': '75th'},
- {'x': 49.5, 'y': 16.90687779, 'z': '85th'},
- {'x': 49.5, 'y': 17.261509659, 'z': '90th'},
- {'x': 49.5, 'y': 17.827298905, 'z': '95th'},
- {'x': 49.5, 'y': 18.223538751, 'z': '97th'},
- {'x': 50.5, 'y': 13.80182253, 'z': '3th'},
- {'x': 50.5, 'y': 13.993674447, 'z': '5th'},
- {'x': 50.5, 'y': 14.304533768, 'z': '10th'},
- {'x': 50.5, 'y': 14.870928451, 'z': '25th'},
- {'x': 50.5, 'y': 15.58176458, 'z': '50th'},
- {'x': 50.5, 'y': 16.398891192, 'z': '75th'},
- {'x': 50.5, 'y': 16.890891793, 'z': '85th'},
- {'x': 50.5, 'y': 17.24898984, 'z': '90th'},
- {'x': 50.5, 'y': 17.821886501, 'z': '95th'},
- {'x': 50.5, 'y': 18.224306914, 'z': '97th'},
- {'x': 51.5, 'y': 13.784386668, 'z': '3th'},
- {'x': 51.5, 'y': 13.975094635, 'z': '5th'},
- {'x': 51.5, 'y': 14.284439603, 'z': '10th'},
- {'x': 51.5, 'y': 14.849212593, 'z': '25th'},
- {'x': 51.5, 'y': 15.560250666, 'z': '50th'},
- {'x': 51.5, 'y': 16.380971128, 'z': '75th'},
- {'x': 51.5, 'y': 16.877010731, 'z': '85th'},
- {'x': 51.5, 'y': 17.238989524, 'z': '90th'},
- {'x': 51.5, 'y': 17.819825229, 'z': '95th'},
- {'x': 51.5, 'y': 18.22915216, 'z': '97th'},
- {'x': 52.5, 'y': 13.767626047, 'z': '3th'},
- {'x': 52.5, 'y': 13.957215715, 'z': '5th'},
- {'x': 52.5, 'y': 14.265096646, 'z': '10th'},
- {'x': 52.5, 'y': 14.828376619, 'z': '25th'},
- {'x': 52.5, 'y': 15.539874597, 'z': '50th'},
- {'x': 52.5, 'y': 16.364680878, 'z': '75th'},
- {'x': 52.5, 'y': 16.865193742, 'z': '85th'},
- {'x': 52.5, 'y': 17.231451424, 'z': '90th'},
- {'x': 52.5, 'y': 17.821035591, 'z': '95th'},
- {'x': 52.5, 'y': 18.237986374, 'z': '97th'},
- {'x': 53.5, 'y': 13.751522482, 'z': '3th'},
- {'x': 53.5, 'y': 13.940029469, 'z': '5th'},
- {'x': 53.5, 'y': 14.246509433, 'z': '10th'},
- {'x': 53.5, 'y': 14.808437487, 'z': '25th'},
- {'x': 53.5, 'y': 15.520649927, 'z': '50th'},
- {'x': 53.5, 'y': 16.350007898, 'z': '75th'},
- {'x': 53.5, 'y': 16.85540483, 'z': '85th'},
- {'x': 53.5, 'y': 17.226321051, 'z': '90th'},
- {'x': 53.5, 'y': 17.825435776, 'z': '95th'},
- {'x': 53.5, 'y': 18.250714444, 'z': '97th'},
- {'x': 54.5, 'y': 13.73606368, 'z': '3th'},
- {'x': 54.5, 'y': 13.923531161, 'z': '5th'},
- {'x': 54.5, 'y': 14.228682712, 'z': '10th'},
- {'x': 54.5, 'y': 14.7894083, 'z': '25th'},
- {'x': 54.5, 'y': 15.502584267, 'z': '50th'},
- {'x': 54.5, 'y': 16.336934616, 'z': '75th'},
- {'x': 54.5, 'y': 16.847604904, 'z': '85th'},
- {'x': 54.5, 'y': 17.223542858, 'z': '90th'},
- {'x': 54.5, 'y': 17.832947441, 'z': '95th'},
- {'x': 54.5, 'y': 18.26724918, 'z': '97th'},
- {'x': 55.5, 'y': 13.721233222, 'z': '3th'},
- {'x': 55.5, 'y': 13.907712809, 'z': '5th'},
- {'x': 55.5, 'y': 14.211619535, 'z': '10th'},
- {'x': 55.5, 'y': 14.771303434, 'z': '25th'},
- {'x': 55.5, 'y': 15.485689732, 'z': '50th'},
- {'x': 55.5, 'y': 16.325449456, 'z': '75th'},
- {'x': 55.5, 'y': 16.841759872, 'z': '85th'},
- {'x': 55.5, 'y': 17.223064431, 'z': '90th'},
- {'x': 55.5, 'y': 17.843490284, 'z': '95th'},
- {'x': 55.5, 'y': 18.287496428, 'z': '97th'},
- {'x': 56.5, 'y': 13.707015988, 'z': '3th'},
- {'x': 56.5, 'y': 13.892566777, 'z': '5th'},
- {'x': 56.5, 'y': 14.195322163, 'z': '10th'},
- {'x': 56.5, 'y': 14.754135564, 'z': '25th'},
- {'x': 56.5, 'y': 15.469977177, 'z': '50th'},
- {'x': 56.5, 'y': 16.315541055, 'z': '75th'},
- {'x': 56.5, 'y': 16.837836599, 'z': '85th'},
- {'x': 56.5, 'y': 17.224834583, 'z': '90th'},
- {'x': 56.5, 'y': 17.85698505, 'z': '95th'},
- {'x': 56.5, 'y': 18.311362645, 'z': '97th'},
- {'x': 57.5, 'y': 13.693397391, 'z': '3th'},
- {'x': 57.5, 'y': 13.878085253, 'z': '5th'},
- {'x': 57.5, 'y': 14.179791901, 'z': '10th'},
- {'x': 57.5, 'y': 14.737915992, 'z': '25th'},
- {'x': 57.5, 'y': 15.455456916, 'z': '50th'},
- {'x': 57.5, 'y': 16.307199139, 'z': '75th'},
- {'x': 57.5, 'y': 16.835803652, 'z': '85th'},
- {'x': 57.5, 'y': 17.228803834, 'z': '90th'},
- {'x': 57.5, 'y': 17.873353184, 'z': '95th'},
- {'x': 57.5, 'y': 18.338753563, 'z': '97th'},
- {'x': 58.5, 'y': 13.680362417, 'z': '3th'},
- {'x': 58.5, 'y': 13.864259589, 'z': '5th'},
- {'x': 58.5, 'y': 14.165028851, 'z': '10th'},
- {'x': 58.5, 'y': 14.722655011, 'z': '25th'},
- {'x': 58.5, 'y': 15.442139608, 'z': '50th'},
- {'x': 58.5, 'y': 16.300415606, 'z': '75th'},
- {'x': 58.5, 'y': 16.835632225, 'z': '85th'},
- {'x': 58.5, 'y': 17.234925022, 'z': '90th'},
- {'x': 58.5, 'y': 17.892516422, 'z': '95th'},
- {'x': 58.5, 'y': 18.369572559, 'z': '97th'},
- {'x': 59.5, 'y': 13.667899624, 'z': '3th'},
- {'x': 59.5, 'y': 13.851083083, 'z': '5th'},
- {'x': 59.5, 'y': 14.151032865, 'z': '10th'},
- {'x': 59.5, 'y': 14.70836004, 'z': '25th'},
- {'x': 59.5, 'y': 15.430032072, 'z': '50th'},
- {'x': 59.5, 'y': 16.295179938, 'z': '75th'},
- {'x': 59.5, 'y': 16.837292715, 'z': '85th'},
- {'x': 59.5, 'y': 17.243151475, 'z': '90th'},
- {'x': 59.5, 'y': 17.914398944, 'z': '95th'},
- {'x': 59.5, 'y': 18.403726711, 'z': '97th'},
- {'x': 60.5, 'y': 13.655996831, 'z': '3th'},
- {'x': 60.5, 'y': 13.838548037, 'z': '5th'},
- {'x': 60.5, 'y': 14.137802612, 'z': '10th'},
- {'x': 60.5, 'y': 14.695037644, 'z': '25th'},
- {'x': 60.5, 'y': 15.419141631, 'z': '50th'},
- {'x': 60.5, 'y': 16.291483974, 'z': '75th'},
- {'x': 60.5, 'y': 16.840758382, 'z': '85th'},
- {'x': 60.5, 'y': 17.253439085, 'z': '90th'},
- {'x': 60.5, 'y': 17.938925239, 'z': '95th'},
- {'x': 60.5, 'y': 18.441120211, 'z': '97th'},
- {'x': 61.5, 'y': 13.644643533, 'z': '3th'},
- {'x': 61.5, 'y': 13.82664746, 'z': '5th'},
- {'x': 61.5, 'y': 14.125336195, 'z': '10th'},
- {'x': 61.5, 'y': 14.682692443, 'z': '25th'},
- {'x': 61.5, 'y': 15.409473561, 'z': '50th'},
- {'x': 61.5, 'y': 16.289319042, 'z': '75th'},
- {'x': 61.5, 'y': 16.84600319, 'z': '85th'},
- {'x': 61.5, 'y': 17.265745146, 'z': '90th'},
- {'x': 61.5, 'y': 17.966021441, 'z': '95th'},
- {'x': 61.5, 'y': 18.481658125, 'z': '97th'},
- {'x': 62.5, 'y': 13.633830562, 'z': '3th'},
- {'x': 62.5, 'y': 13.815374889, 'z': '5th'},
- {'x': 62.5, 'y': 14.113631167, 'z': '10th'},
- {'x': 62.5, 'y': 14.671327346, 'z': '25th'},
- {'x': 62.5, 'y': 15.401031388, 'z': '50th'},
- {'x': 62.5, 'y': 16.288676194, 'z': '75th'},
- {'x': 62.5, 'y': 16.853001975, 'z': '85th'},
- {'x': 62.5, 'y': 17.280028455, 'z': '90th'},
- {'x': 62.5, 'y': 17.995615231, 'z': '95th'},
- {'x': 62.5, 'y': 18.52524599, 'z': '97th'},
- {'x': 63.5, 'y': 13.623549065, 'z': '3th'},
- {'x': 63.5, 'y': 13.804723699, 'z': '5th'},
- {'x': 63.5, 'y': 14.102684333, 'z': '10th'},
- {'x': 63.5, 'y': 14.660944025, 'z': '25th'},
- {'x': 63.5, 'y': 15.393817852, 'z': '50th'},
- {'x': 63.5, 'y': 16.289547231, 'z': '75th'},
- {'x': 63.5, 'y': 16.861731244, 'z': '85th'},
- {'x': 63.5, 'y': 17.296249805, 'z': '90th'},
- {'x': 63.5, 'y': 18.027635434, 'z': '95th'},
- {'x': 63.5, 'y': 18.571788322, 'z': '97th'},
- {'x': 64.5, 'y': 13.613794519, 'z': '3th'},
- {'x': 64.5, 'y': 13.794690036, 'z': '5th'},
- {'x': 64.5, 'y': 14.092492991, 'z': '10th'},
- {'x': 64.5, 'y': 14.651541441, 'z': '25th'},
- {'x': 64.5, 'y': 15.387830936, 'z': '50th'},
- {'x': 64.5, 'y': 16.291919818, 'z': '75th'},
- {'x': 64.5, 'y': 16.872165194, 'z': '85th'},
- {'x': 64.5, 'y': 17.314369537, 'z': '90th'},
- {'x': 64.5, 'y': 18.062013961, 'z': '95th'},
- {'x': 64.5, 'y': 18.621195327, 'z': '97th'},
- {'x': 65.5, 'y': 13.604561063, 'z': '3th'},
- {'x': 65.5, 'y': 13.785268816, 'z': '5th'},
- {'x': 65.5, 'y': 14.083053448, 'z': '10th'},
- {'x': 65.5, 'y': 14.643118207, 'z': '25th'},
- {'x': 65.5, 'y': 15.383069448, 'z': '50th'},
- {'x': 65.5, 'y': 16.295783957, 'z': '75th'},
- {'x': 65.5, 'y': 16.884280854, 'z': '85th'},
- {'x': 65.5, 'y': 17.334350628, 'z': '90th'},
- {'x': 65.5, 'y': 18.098683166, 'z': '95th'},
- {'x': 65.5, 'y': 18.673373954, 'z': '97th'},
- {'x': 66.5, 'y': 13.595844997, 'z': '3th'},
- {'x': 66.5, 'y': 13.776456272, 'z': '5th'},
- {'x': 66.5, 'y': 14.0743621, 'z': '10th'},
- {'x': 66.5, 'y': 14.635671305, 'z': '25th'},
- {'x': 66.5, 'y': 15.37952958, 'z': '50th'},
- {'x': 66.5, 'y': 16.301127727, 'z': '75th'},
- {'x': 66.5, 'y': 16.898054589, 'z': '85th'},
- {'x': 66.5, 'y': 17.356156525, 'z': '90th'},
- {'x': 66.5, 'y': 18.137577538, 'z': '95th'},
- {'x': 66.5, 'y': 18.728233788, 'z': '97th'},
- {'x': 67.5, 'y': 13.587643874, 'z': '3th'},
- {'x': 67.5, 'y': 13.76824936, 'z': '5th'},
- {'x': 67.5, 'y': 14.066415279, 'z': '10th'},
- {'x': 67.5, 'y': 14.629196563, 'z': '25th'},
- {'x': 67.5, 'y': 15.37720582, 'z': '50th'},
- {'x': 67.5, 'y': 16.307938189, 'z': '75th'},
- {'x': 67.5, 'y': 16.913462745, 'z': '85th'},
- {'x': 67.5, 'y': 17.379751483, 'z': '90th'},
- {'x': 67.5, 'y': 18.178633273, 'z': '95th'},
- {'x': 67.5, 'y': 18.785685832, 'z': '97th'},
- {'x': 68.5, 'y': 13.579956424, 'z': '3th'},
- {'x': 68.5, 'y': 13.760645736, 'z': '5th'},
- {'x': 68.5, 'y': 14.059209324, 'z': '10th'},
- {'x': 68.5, 'y': 14.623688807, 'z': '25th'},
- {'x': 68.5, 'y': 15.376091068, 'z': '50th'},
- {'x': 68.5, 'y': 16.316201353, 'z': '75th'},
- {'x': 68.5, 'y': 16.930481531, 'z': '85th'},
- {'x': 68.5, 'y': 17.405100424, 'z': '90th'},
- {'x': 68.5, 'y': 18.221788238, 'z': '95th'},
- {'x': 68.5, 'y': 18.845642613, 'z': '97th'},
- {'x': 69.5, 'y': 13.572782447, 'z': '3th'},
- {'x': 69.5, 'y': 13.75364373, 'z': '5th'},
- {'x': 69.5, 'y': 14.052740628, 'z': '10th'},
- {'x': 69.5, 'y': 14.619142, 'z': '25th'},
- {'x': 69.5, 'y': 15.376176765, 'z': '50th'},
- {'x': 69.5, 'y': 16.32590217, 'z': '75th'},
- {'x': 69.5, 'y': 16.949086925, 'z': '85th'},
- {'x': 69.5, 'y': 17.432168819, 'z': '90th'},
- {'x': 69.5, 'y': 18.266981906, 'z': '95th'},
- {'x': 69.5, 'y': 18.908018261, 'z': '97th'},
- {'x': 70.5, 'y': 13.566122717, 'z': '3th'},
- {'x': 70.5, 'y': 13.747242303, 'z': '5th'},
- {'x': 70.5, 'y': 14.047005689, 'z': '10th'},
- {'x': 70.5, 'y': 14.615549383, 'z': '25th'},
- {'x': 70.5, 'y': 15.37745304, 'z': '50th'},
- {'x': 70.5, 'y': 16.337024559, 'z': '75th'},
- {'x': 70.5, 'y': 16.969254612, 'z': '85th'},
- {'x': 70.5, 'y': 17.460922576, 'z': '90th'},
- {'x': 70.5, 'y': 18.314155288, 'z': '95th'},
- {'x': 70.5, 'y': 18.972728552, 'z': '97th'},
- {'x': 71.5, 'y': 13.559978867, 'z': '3th'},
- {'x': 71.5, 'y': 13.741440993, 'z': '5th'},
- {'x': 71.5, 'y': 14.04200114, 'z': '10th'},
- {'x': 71.5, 'y': 14.612903602, 'z': '25th'},
- {'x': 71.5, 'y': 15.379908859, 'z': '50th'},
- {'x': 71.5, 'y': 16.34955145, 'z': '75th'},
- {'x': 71.5, 'y': 16.990959933, 'z': '85th'},
- {'x': 71.5, 'y': 17.491327946, 'z': '90th'},
- {'x': 71.5, 'y': 18.363250846, 'z': '95th'},
- {'x': 71.5, 'y': 19.039690941, 'z': '97th'},
- {'x': 72.5, 'y': 13.554353286, 'z': '3th'},
- {'x': 72.5, 'y': 13.736239868, 'z': '5th'},
- {'x': 72.5, 'y': 14.037723763, 'z': '10th'},
- {'x': 72.5, 'y': 14.611196824, 'z': '25th'},
- {'x': 72.5, 'y': 15.383532169, 'z': '50th'},
- {'x': 72.5, 'y': 16.363464841, 'z': '75th'},
- {'x': 72.5, 'y': 17.01417786, 'z': '85th'},
- {'x': 72.5, 'y': 17.523351444, 'z': '90th'},
- {'x': 72.5, 'y': 18.414212415, 'z': '95th'},
- {'x': 72.5, 'y': 19.108824564, 'z': '97th'},
- {'x': 73.5, 'y': 13.549249014, 'z': '3th'},
- {'x': 73.5, 'y': 13.731639461, 'z': '5th'},
- {'x': 73.5, 'y': 14.034170513, 'z': '10th'},
- {'x': 73.5, 'y': 14.610420846, 'z': '25th'},
- {'x': 73.5, 'y': 15.388310046, 'z': '50th'},
- {'x': 73.5, 'y': 16.378745878, 'z': '75th'},
- {'x': 73.5, 'y': 17.038882985, 'z': '85th'},
- {'x': 73.5, 'y': 17.556959782, 'z': '90th'},
- {'x': 73.5, 'y': 18.46698511, 'z': '95th'},
- {'x': 73.5, 'y': 19.180050239, 'z': '97th'},
- {'x': 74.5, 'y': 13.544669635, 'z': '3th'},
- {'x': 74.5, 'y': 13.727640719, 'z': '5th'},
- {'x': 74.5, 'y': 14.031338512, 'z': '10th'},
- {'x': 74.5, 'y': 14.610567186, 'z': '25th'},
- {'x': 74.5, 'y': 15.39422883, 'z': '50th'},
- {'x': 74.5, 'y': 16.395374929, 'z': '75th'},
- {'x': 74.5, 'y': 17.065049527, 'z': '85th'},
- {'x': 74.5, 'y': 17.592119816, 'z': '90th'},
- {'x': 74.5, 'y': 18.52151524, 'z': '95th'},
- {'x': 74.5, 'y': 19.253290437, 'z': '97th'},
- {'x': 75.5, 'y': 13.540618386, 'z': '3th'},
- {'x': 75.5, 'y': 13.724244334, 'z': '5th'},
- {'x': 75.5, 'y': 14.029224753, 'z': '10th'},
- {'x': 75.5, 'y': 14.611627365, 'z': '25th'},
- {'x': 75.5, 'y': 15.40127496, 'z': '50th'},
- {'x': 75.5, 'y': 16.413332655, 'z': '75th'},
- {'x': 75.5, 'y': 17.092652232, 'z': '85th'},
- {'x': 75.5, 'y': 17.628799139, 'z': '90th'},
- {'x': 75.5, 'y': 18.577749955, 'z': '95th'},
- {'x': 75.5, 'y': 19.328467816, 'z': '97th'},
- {'x': 76.5, 'y': 13.537100973, 'z': '3th'},
- {'x': 76.5, 'y': 13.721452886, 'z': '5th'},
- {'x': 76.5, 'y': 14.027827183, 'z': '10th'},
- {'x': 76.5, 'y': 14.613592234, 'z': '25th'},
- {'x': 76.5, 'y': 15.40943252, 'z': '50th'},
- {'x': 76.5, 'y': 16.432596534, 'z': '75th'},
- {'x': 76.5, 'y': 17.121663187, 'z': '85th'},
- {'x': 76.5, 'y': 17.666963771, 'z': '90th'},
- {'x': 76.5, 'y': 18.635638156, 'z': '95th'},
- {'x': 76.5, 'y': 19.405510395, 'z': '97th'},
- {'x': 77.5, 'y': 13.534121468, 'z': '3th'},
- {'x': 77.5, 'y': 13.719267752, 'z': '5th'},
- {'x': 77.5, 'y': 14.027143187, 'z': '10th'},
- {'x': 77.5, 'y': 14.616453067, 'z': '25th'},
- {'x': 77.5, 'y': 15.418686911, 'z': '50th'},
- {'x': 77.5, 'y': 16.453145875, 'z': '75th'},
- {'x': 77.5, 'y': 17.152056291, 'z': '85th'},
- {'x': 77.5, 'y': 17.706581286, 'z': '90th'},
- {'x': 77.5, 'y': 18.695129036, 'z': '95th'},
- {'x': 77.5, 'y': 19.484344311, 'z': '97th'},
- {'x': 78.5, 'y': 13.531684723, 'z': '3th'},
- {'x': 78.5, 'y': 13.717690937, 'z': '5th'},
- {'x': 78.5, 'y': 14.027170504, 'z': '10th'},
- {'x': 78.5, 'y': 14.620200966, 'z': '25th'},
- {'x': 78.5, 'y': 15.429022732, 'z': '50th'},
- {'x': 78.5, 'y': 16.474958849, 'z': '75th'},
- {'x': 78.5, 'y': 17.18380454, 'z': '85th'},
- {'x': 78.5, 'y': 17.747618853, 'z': '90th'},
- {'x': 78.5, 'y': 18.756172877, 'z': '95th'},
- {'x': 78.5, 'y': 19.564898227, 'z': '97th'},
- {'x': 79.5, 'y': 13.529795725, 'z': '3th'},
- {'x': 79.5, 'y': 13.716724582, 'z': '5th'},
- {'x': 79.5, 'y': 14.027906997, 'z': '10th'},
- {'x': 79.5, 'y': 14.624827045, 'z': '25th'},
- {'x': 79.5, 'y': 15.440424387, 'z': '50th'},
- {'x': 79.5, 'y': 16.498013286, 'z': '75th'},
- {'x': 79.5, 'y': 17.216880721, 'z': '85th'},
- {'x': 79.5, 'y': 17.7900437, 'z': '90th'},
- {'x': 79.5, 'y': 18.818720783, 'z': '95th'},
- {'x': 79.5, 'y': 19.647102239, 'z': '97th'},
- {'x': 80.5, 'y': 13.528459943, 'z': '3th'},
- {'x': 80.5, 'y': 13.716371244, 'z': '5th'},
- {'x': 80.5, 'y': 14.029350805, 'z': '10th'},
- {'x': 80.5, 'y': 14.63032238, 'z': '25th'},
- {'x': 80.5, 'y': 15.452875806, 'z': '50th'},
- {'x': 80.5, 'y': 16.522286238, 'z': '75th'},
- {'x': 80.5, 'y': 17.251256966, 'z': '85th'},
- {'x': 80.5, 'y': 17.833822753, 'z': '90th'},
- {'x': 80.5, 'y': 18.882724739, 'z': '95th'},
- {'x': 80.5, 'y': 19.730888595, 'z': '97th'},
- {'x': 81.5, 'y': 13.527681304, 'z': '3th'},
- {'x': 81.5, 'y': 13.716632334, 'z': '5th'},
- {'x': 81.5, 'y': 14.03149952, 'z': '10th'},
- {'x': 81.5, 'y': 14.636678444, 'z': '25th'},
- {'x': 81.5, 'y': 15.466362178, 'z': '50th'},
- {'x': 81.5, 'y': 16.547756486, 'z': '75th'},
- {'x': 81.5, 'y': 17.286907078, 'z': '85th'},
- {'x': 81.5, 'y': 17.878924338, 'z': '90th'},
- {'x': 81.5, 'y': 18.948137004, 'z': '95th'},
- {'x': 81.5, 'y': 19.816187992, 'z': '97th'},
- {'x': 82.5, 'y': 13.527465647, 'z': '3th'},
- {'x': 82.5, 'y': 13.717510776, 'z': '5th'},
- {'x': 82.5, 'y': 14.034351593, 'z': '10th'},
- {'x': 82.5, 'y': 14.643886387, 'z': '25th'},
- {'x': 82.5, 'y': 15.480867041, 'z': '50th'},
- {'x': 82.5, 'y': 16.574400287, 'z': '75th'},
- {'x': 82.5, 'y': 17.323802541, 'z': '85th'},
- {'x': 82.5, 'y': 17.925315202, 'z': '90th'},
- {'x': 82.5, 'y': 19.014911065, 'z': '95th'},
- {'x': 82.5, 'y': 19.902936, 'z': '97th'},
- {'x': 83.5, 'y': 13.527817944, 'z': '3th'},
- {'x': 83.5, 'y': 13.719008868, 'z': '5th'},
- {'x': 83.5, 'y': 14.037905211, 'z': '10th'},
- {'x': 83.5, 'y': 14.651937633, 'z': '25th'},
- {'x': 83.5, 'y': 15.496374654, 'z': '50th'},
- {'x': 83.5, 'y': 16.602194804, 'z': '75th'},
- {'x': 83.5, 'y': 17.361915701, 'z': '85th'},
- {'x': 83.5, 'y': 17.972962857, 'z': '90th'},
- {'x': 83.5, 'y': 19.08300081, 'z': '95th'},
- {'x': 83.5, 'y': 19.991067967, 'z': '97th'},
- {'x': 84.5, 'y': 13.52874305, 'z': '3th'},
- {'x': 84.5, 'y': 13.72112886, 'z': '5th'},
- {'x': 84.5, 'y': 14.042158595, 'z': '10th'},
- {'x': 84.5, 'y': 14.660823717, 'z': '25th'},
- {'x': 84.5, 'y': 15.512869363, 'z': '50th'},
- {'x': 84.5, 'y': 16.631117196, 'z': '75th'},
- {'x': 84.5, 'y': 17.40121891, 'z': '85th'},
- {'x': 84.5, 'y': 18.02183493, 'z': '90th'},
- {'x': 84.5, 'y': 19.152360731, 'z': '95th'},
- {'x': 84.5, 'y': 20.080520424, 'z': '97th'},
- {'x': 85.5, 'y': 13.530245676, 'z': '3th'},
- {'x': 85.5, 'y': 13.723872927, 'z': '5th'},
- {'x': 85.5, 'y': 14.047109984, 'z': '10th'},
- {'x': 85.5, 'y': 14.67053629, 'z': '25th'},
- {'x': 85.5, 'y': 15.530335632, 'z': '50th'},
- {'x': 85.5, 'y': 16.661144655, 'z': '75th'},
- {'x': 85.5, 'y': 17.441684564, 'z': '85th'},
- {'x': 85.5, 'y': 18.071899185, 'z': '90th'},
- {'x': 85.5, 'y': 19.22294589, 'z': '95th'},
- {'x': 85.5, 'y': 20.171231041, 'z': '97th'},
- {'x': 86.5, 'y': 13.532330364, 'z': '3th'},
- {'x': 86.5, 'y': 13.727243152, 'z': '5th'},
- {'x': 86.5, 'y': 14.052757623, 'z': '10th'},
- {'x': 86.5, 'y': 14.68106712, 'z': '25th'},
- {'x': 86.5, 'y': 15.548758065, 'z': '50th'},
- {'x': 86.5, 'y': 16.692254452, 'z': '75th'},
- {'x': 86.5, 'y': 17.483285128, 'z': '85th'},
- {'x': 86.5, 'y': 18.123123533, 'z': '90th'},
- {'x': 86.5, 'y': 19.294711907, 'z': '95th'},
- {'x': 86.5, 'y': 20.263138602, 'z': '97th'},
- {'x': 87.5, 'y': 13.535001468, 'z': '3th'},
- {'x': 87.5, 'y': 13.731241504, 'z': '5th'},
- {'x': 87.5, 'y': 14.05909975, 'z': '10th'},
- {'x': 87.5, 'y': 14.692408091, 'z': '25th'},
- {'x': 87.5, 'y': 15.568121426, 'z': '50th'},
- {'x': 87.5, 'y': 16.724423964, 'z': '75th'},
- {'x': 87.5, 'y': 17.525993169, 'z': '85th'},
- {'x': 87.5, 'y': 18.175476054, 'z': '90th'},
- {'x': 87.5, 'y': 19.367614933, 'z': '95th'},
- {'x': 87.5, 'y': 20.356182971, 'z': '97th'},
- {'x': 88.5, 'y': 13.538263144, 'z': '3th'},
- {'x': 88.5, 'y': 13.73586983, 'z': '5th'},
- {'x': 88.5, 'y': 14.066134581, 'z': '10th'},
- {'x': 88.5, 'y': 14.704551202, 'z': '25th'},
- {'x': 88.5, 'y': 15.588410651, 'z': '50th'},
- {'x': 88.5, 'y': 16.757630703, 'z': '75th'},
- {'x': 88.5, 'y': 17.56978138, 'z': '85th'},
- {'x': 88.5, 'y': 18.228925008, 'z': '90th'},
- {'x': 88.5, 'y': 19.441611647, 'z': '95th'},
- {'x': 88.5, 'y': 20.450305073, 'z': '97th'},
- {'x': 89.5, 'y': 13.542119379, 'z': '3th'},
- {'x': 89.5, 'y': 13.741129903, 'z': '5th'},
- {'x': 89.5, 'y': 14.073860397, 'z': '10th'},
- {'x': 89.5, 'y': 14.71748869, 'z': '25th'},
- {'x': 89.5, 'y': 15.60961101, 'z': '50th'},
- {'x': 89.5, 'y': 16.791852464, 'z': '75th'},
- {'x': 89.5, 'y': 17.614622659, 'z': '85th'},
- {'x': 89.5, 'y': 18.283438818, 'z': '90th'},
- {'x': 89.5, 'y': 19.516658939, 'z': '95th'},
- {'x': 89.5, 'y': 20.545446242, 'z': '97th'},
- {'x': 90.5, 'y': 13.546573748, 'z': '3th'},
- {'x': 90.5, 'y': 13.747023092, 'z': '5th'},
- {'x': 90.5, 'y': 14.082275078, 'z': '10th'},
- {'x': 90.5, 'y': 14.731212383, 'z': '25th'},
- {'x': 90.5, 'y': 15.63170735, 'z': '50th'},
- {'x': 90.5, 'y': 16.827066717, 'z': '75th'},
- {'x': 90.5, 'y': 17.660489848, 'z': '85th'},
- {'x': 90.5, 'y': 18.338986255, 'z': '90th'},
- {'x': 90.5, 'y': 19.592715391, 'z': '95th'},
- {'x': 90.5, 'y': 20.641551322, 'z': '97th'},
- {'x': 91.5, 'y': 13.551629882, 'z': '3th'},
- {'x': 91.5, 'y': 13.753550999, 'z': '5th'},
- {'x': 91.5, 'y': 14.091376997, 'z': '10th'},
- {'x': 91.5, 'y': 14.74571498, 'z': '25th'},
- {'x': 91.5, 'y': 15.654685628, 'z': '50th'},
- {'x': 91.5, 'y': 16.863251882, 'z': '75th'},
- {'x': 91.5, 'y': 17.707356316, 'z': '85th'},
- {'x': 91.5, 'y': 18.395536111, 'z': '90th'},
- {'x': 91.5, 'y': 19.669738304, 'z': '95th'},
- {'x': 91.5, 'y': 20.738562414, 'z': '97th'},
- {'x': 92.5, 'y': 13.557290983, 'z': '3th'},
- {'x': 92.5, 'y': 13.760714804, 'z': '5th'},
- {'x': 92.5, 'y': 14.101164111, 'z': '10th'},
- {'x': 92.5, 'y': 14.760988761, 'z': '25th'},
- {'x': 92.5, 'y': 15.678531387, 'z': '50th'},
- {'x': 92.5, 'y': 16.900386085, 'z': '75th'},
- {'x': 92.5, 'y': 17.755195413, 'z': '85th'},
- {'x': 92.5, 'y': 18.453057555, 'z': '90th'},
- {'x': 92.5, 'y': 19.747686659, 'z': '95th'},
- {'x': 92.5, 'y': 20.836425089, 'z': '97th'},
- {'x': 93.5, 'y': 13.563560058, 'z': '3th'},
- {'x': 93.5, 'y': 13.76851558, 'z': '5th'},
- {'x': 93.5, 'y': 14.111634402, 'z': '10th'},
- {'x': 93.5, 'y': 14.777026222, 'z': '25th'},
- {'x': 93.5, 'y': 15.703230518, 'z': '50th'},
- {'x': 93.5, 'y': 16.938447804, 'z': '75th'},
- {'x': 93.5, 'y': 17.803980772, 'z': '85th'},
- {'x': 93.5, 'y': 18.511519978, 'z': '90th'},
- {'x': 93.5, 'y': 19.826519632, 'z': '95th'},
- {'x': 93.5, 'y': 20.935085251, 'z': '97th'},
- {'x': 94.5, 'y': 13.570439865, 'z': '3th'},
- {'x': 94.5, 'y': 13.776954225, 'z': '5th'},
- {'x': 94.5, 'y': 14.122785782, 'z': '10th'},
- {'x': 94.5, 'y': 14.793819942, 'z': '25th'},
- {'x': 94.5, 'y': 15.728769113, 'z': '50th'},
- {'x': 94.5, 'y': 16.977415752, 'z': '75th'},
- {'x': 94.5, 'y': 17.853686264, 'z': '85th'},
- {'x': 94.5, 'y': 18.57089304, 'z': '90th'},
- {'x': 94.5, 'y': 19.906196889, 'z': '95th'},
- {'x': 94.5, 'y': 21.034489746, 'z': '97th'},
- {'x': 95.5, 'y': 13.577932909, 'z': '3th'},
- {'x': 95.5, 'y': 13.786031452, 'z': '5th'},
- {'x': 95.5, 'y': 14.134616081, 'z': '10th'},
- {'x': 95.5, 'y': 14.811362575, 'z': '25th'},
- {'x': 95.5, 'y': 15.755133465, 'z': '50th'},
- {'x': 95.5, 'y': 17.017268893, 'z': '75th'},
- {'x': 95.5, 'y': 17.90428602, 'z': '85th'},
- {'x': 95.5, 'y': 18.631146689, 'z': '90th'},
- {'x': 95.5, 'y': 19.986678588, 'z': '95th'},
- {'x': 95.5, 'y': 21.13458634, 'z': '97th'},
- {'x': 96.5, 'y': 13.586041435, 'z': '3th'},
- {'x': 96.5, 'y': 13.795747785, 'z': '5th'},
- {'x': 96.5, 'y': 14.147123047, 'z': '10th'},
- {'x': 96.5, 'y': 14.829646845, 'z': '25th'},
- {'x': 96.5, 'y': 15.782310065, 'z': '50th'},
- {'x': 96.5, 'y': 17.057986451, 'z': '75th'},
- {'x': 96.5, 'y': 17.955754442, 'z': '85th'},
- {'x': 96.5, 'y': 18.692251173, 'z': '90th'},
- {'x': 96.5, 'y': 20.067925378, 'z': '95th'},
- {'x': 96.5, 'y': 21.2353237, 'z': '97th'},
- {'x': 97.5, 'y': 13.594767424, 'z': '3th'},
- {'x': 97.5, 'y': 13.806103553, 'z': '5th'},
- {'x': 97.5, 'y': 14.16030433, 'z': '10th'},
- {'x': 97.5, 'y': 14.848665539, 'z': '25th'},
- {'x': 97.5, 'y': 15.810285603, 'z': '50th'},
- {'x': 97.5, 'y': 17.099547917, 'z': '75th'},
- {'x': 97.5, 'y': 18.008066222, 'z': '85th'},
- {'x': 97.5, 'y': 18.754177053, 'z': '90th'},
- {'x': 97.5, 'y': 20.149898403, 'z': '95th'},
- {'x': 97.5, 'y': 21.336651377, 'z': '97th'},
- {'x': 98.5, 'y': 13.604112456, 'z': '3th'},
- {'x': 98.5, 'y': 13.817098777, 'z': '5th'},
- {'x': 98.5, 'y': 14.174157425, 'z': '10th'},
- {'x': 98.5, 'y': 14.868411527, 'z': '25th'},
- {'x': 98.5, 'y': 15.839047084, 'z': '50th'},
- {'x': 98.5, 'y': 17.141933246, 'z': '75th'},
- {'x': 98.5, 'y': 18.061196533, 'z': '85th'},
- {'x': 98.5, 'y': 18.816895369, 'z': '90th'},
- {'x': 98.5, 'y': 20.232559281, 'z': '95th'},
- {'x': 98.5, 'y': 21.438519498, 'z': '97th'},
- {'x': 99.5, 'y': 13.614078441, 'z': '3th'},
- {'x': 99.5, 'y': 13.828733753, 'z': '5th'},
- {'x': 99.5, 'y': 14.188679993, 'z': '10th'},
- {'x': 99.5, 'y': 14.888877644, 'z': '25th'},
- {'x': 99.5, 'y': 15.868581229, 'z': '50th'},
- {'x': 99.5, 'y': 17.185121912, 'z': '75th'},
- {'x': 99.5, 'y': 18.1151201, 'z': '85th'},
- {'x': 99.5, 'y': 18.880376895, 'z': '90th'},
- {'x': 99.5, 'y': 20.315870259, 'z': '95th'},
- {'x': 99.5, 'y': 21.540880323, 'z': '97th'},
- {'x': 100.5, 'y': 13.624666113, 'z': '3th'},
- {'x': 100.5, 'y': 13.841007841, 'z': '5th'},
- {'x': 100.5, 'y': 14.203869159, 'z': '10th'},
- {'x': 100.5, 'y': 14.910056866, 'z': '25th'},
- {'x': 100.5, 'y': 15.898875618, 'z': '50th'},
- {'x': 100.5, 'y': 17.229094753, 'z': '75th'},
- {'x': 100.5, 'y': 18.169813026, 'z': '85th'},
- {'x': 100.5, 'y': 18.944593573, 'z': '90th'},
- {'x': 100.5, 'y': 20.399793794, 'z': '95th'},
- {'x': 100.5, 'y': 21.643684934, 'z': '97th'},
- {'x': 101.5, 'y': 13.635876526, 'z': '3th'},
- {'x': 101.5, 'y': 13.853920676, 'z': '5th'},
- {'x': 101.5, 'y': 14.21972223, 'z': '10th'},
- {'x': 101.5, 'y': 14.931942184, 'z': '25th'},
- {'x': 101.5, 'y': 15.929917651, 'z': '50th'},
- {'x': 101.5, 'y': 17.273832301, 'z': '75th'},
- {'x': 101.5, 'y': 18.225251187, 'z': '85th'},
- {'x': 101.5, 'y': 19.009517329, 'z': '90th'},
- {'x': 101.5, 'y': 20.484293234, 'z': '95th'},
- {'x': 101.5, 'y': 21.746886771, 'z': '97th'},
- {'x': 102.5, 'y': 13.64771054, 'z': '3th'},
- {'x': 102.5, 'y': 13.867471738, 'z': '5th'},
- {'x': 102.5, 'y': 14.236236422, 'z': '10th'},
- {'x': 102.5, 'y': 14.954526592, 'z': '25th'},
- {'x': 102.5, 'y': 15.961694805, 'z': '50th'},
- {'x': 102.5, 'y': 17.319315191, 'z': '75th'},
- {'x': 102.5, 'y': 18.281410552, 'z': '85th'},
- {'x': 102.5, 'y': 19.075120191, 'z': '90th'},
- {'x': 102.5, 'y': 20.569332163, 'z': '95th'},
- {'x': 102.5, 'y': 21.850439867, 'z': '97th'},
- {'x': 103.5, 'y': 13.660168532, 'z': '3th'},
- {'x': 103.5, 'y': 13.881660126, 'z': '5th'},
- {'x': 103.5, 'y': 14.253408728, 'z': '10th'},
- {'x': 103.5, 'y': 14.977803131, 'z': '25th'},
- {'x': 103.5, 'y': 15.994194894, 'z': '50th'},
- {'x': 103.5, 'y': 17.365524631, 'z': '75th'},
- {'x': 103.5, 'y': 18.338267739, 'z': '85th'},
- {'x': 103.5, 'y': 19.141374853, 'z': '90th'},
- {'x': 103.5, 'y': 20.654874798, 'z': '95th'},
- {'x': 103.5, 'y': 21.954298871, 'z': '97th'},
- {'x': 104.5, 'y': 13.673250382, 'z': '3th'},
- {'x': 104.5, 'y': 13.896484539, 'z': '5th'},
- {'x': 104.5, 'y': 14.271235906, 'z': '10th'},
- {'x': 104.5, 'y': 15.001764881, 'z': '25th'},
- {'x': 104.5, 'y': 16.027406071, 'z': '50th'},
- {'x': 104.5, 'y': 17.412442399, 'z': '75th'},
- {'x': 104.5, 'y': 18.395799994, 'z': '85th'},
- {'x': 104.5, 'y': 19.20825462, 'z': '90th'},
- {'x': 104.5, 'y': 20.740885842, 'z': '95th'},
- {'x': 104.5, 'y': 22.058418781, 'z': '97th'},
- {'x': 105.5, 'y': 13.686956839, 'z': '3th'},
- {'x': 105.5, 'y': 13.911944391, 'z': '5th'},
- {'x': 105.5, 'y': 14.289715157, 'z': '10th'},
- {'x': 105.5, 'y': 15.02640489, 'z': '25th'},
- {'x': 105.5, 'y': 16.061315897, 'z': '50th'},
- {'x': 105.5, 'y': 17.460049252, 'z': '75th'},
- {'x': 105.5, 'y': 18.453983546, 'z': '85th'},
- {'x': 105.5, 'y': 19.275732052, 'z': '90th'},
- {'x': 105.5, 'y': 20.827330585, 'z': '95th'},
- {'x': 105.5, 'y': 22.162757423, 'z': '97th'},
- {'x': 106.5, 'y': 13.701287124, 'z': '3th'},
- {'x': 106.5, 'y': 13.928037855, 'z': '5th'},
- {'x': 106.5, 'y': 14.308842916, 'z': '10th'},
- {'x': 106.5, 'y': 15.051716263, 'z': '25th'},
- {'x': 106.5, 'y': 16.095912922, 'z': '50th'},
- {'x': 106.5, 'y': 17.508327678, 'z': '75th'},
- {'x': 106.5, 'y': 18.512796471, 'z': '85th'},
- {'x': 106.5, 'y': 19.343781354, 'z': '90th'},
- {'x': 106.5, 'y': 20.914174799, 'z': '95th'},
- {'x': 106.5, 'y': 22.267271227, 'z': '97th'},
- {'x': 107.5, 'y': 13.716241034, 'z': '3th'},
- {'x': 107.5, 'y': 13.944763576, 'z': '5th'},
- {'x': 107.5, 'y': 14.328615917, 'z': '10th'},
- {'x': 107.5, 'y': 15.07769209, 'z': '25th'},
- {'x': 107.5, 'y': 16.131185315, 'z': '50th'},
- {'x': 107.5, 'y': 17.557259509, 'z': '75th'},
- {'x': 107.5, 'y': 18.572216211, 'z': '85th'},
- {'x': 107.5, 'y': 19.412376307, 'z': '90th'},
- {'x': 107.5, 'y': 21.001384829, 'z': '95th'},
- {'x': 107.5, 'y': 22.371918873, 'z': '97th'},
- {'x': 108.5, 'y': 13.731816758, 'z': '3th'},
- {'x': 108.5, 'y': 13.962118903, 'z': '5th'},
- {'x': 108.5, 'y': 14.349030099, 'z': '10th'},
- {'x': 108.5, 'y': 15.104325557, 'z': '25th'},
- {'x': 108.5, 'y': 16.167122344, 'z': '50th'},
- {'x': 108.5, 'y': 17.60682848, 'z': '75th'},
- {'x': 108.5, 'y': 18.632222229, 'z': '85th'},
- {'x': 108.5, 'y': 19.481492476, 'z': '90th'},
- {'x': 108.5, 'y': 21.08892746, 'z': '95th'},
- {'x': 108.5, 'y': 22.47665729, 'z': '97th'},
- {'x': 109.5, 'y': 13.748014703, 'z': '3th'},
- {'x': 109.5, 'y': 13.98010297, 'z': '5th'},
- {'x': 109.5, 'y': 14.370082484, 'z': '10th'},
- {'x': 109.5, 'y': 15.131609676, 'z': '25th'},
- {'x': 109.5, 'y': 16.203711677, 'z': '50th'},
- {'x': 109.5, 'y': 17.657015633, 'z': '75th'},
- {'x': 109.5, 'y': 18.692791276, 'z': '85th'},
- {'x': 109.5, 'y': 19.551103293, 'z': '90th'},
- {'x': 109.5, 'y': 21.176770225, 'z': '95th'},
- {'x': 109.5, 'y': 22.581448926, 'z': '97th'},
- {'x': 110.5, 'y': 13.764833246, 'z': '3th'},
- {'x': 110.5, 'y': 13.998713275, 'z': '5th'},
- {'x': 110.5, 'y': 14.391769094, 'z': '10th'},
- {'x': 110.5, 'y': 15.159537588, 'z': '25th'},
- {'x': 110.5, 'y': 16.240942388, 'z': '50th'},
- {'x': 110.5, 'y': 17.707804437, 'z': '75th'},
- {'x': 110.5, 'y': 18.753902661, 'z': '85th'},
- {'x': 110.5, 'y': 19.621184428, 'z': '90th'},
- {'x': 110.5, 'y': 21.264881065, 'z': '95th'},
- {'x': 110.5, 'y': 22.686253626, 'z': '97th'},
- {'x': 111.5, 'y': 13.782270842, 'z': '3th'},
- {'x': 111.5, 'y': 14.017947378, 'z': '5th'},
- {'x': 111.5, 'y': 14.414085981, 'z': '10th'},
- {'x': 111.5, 'y': 15.188102404, 'z': '25th'},
- {'x': 111.5, 'y': 16.278803458, 'z': '50th'},
- {'x': 111.5, 'y': 17.759178251, 'z': '75th'},
- {'x': 111.5, 'y': 18.815535648, 'z': '85th'},
- {'x': 111.5, 'y': 19.691711629, 'z': '90th'},
- {'x': 111.5, 'y': 21.353228504, 'z': '95th'},
- {'x': 111.5, 'y': 22.791032645, 'z': '97th'},
- {'x': 112.5, 'y': 13.800325929, 'z': '3th'},
- {'x': 112.5, 'y': 14.037802816, 'z': '5th'},
- {'x': 112.5, 'y': 14.437029176, 'z': '10th'},
- {'x': 112.5, 'y': 15.217297215, 'z': '25th'},
- {'x': 112.5, 'y': 16.317283847, 'z': '50th'},
- {'x': 112.5, 'y': 17.811120439, 'z': '75th'},
- {'x': 112.5, 'y': 18.877669577, 'z': '85th'},
- {'x': 112.5, 'y': 19.762660826, 'z': '90th'},
- {'x': 112.5, 'y': 21.441781645, 'z': '95th'},
- {'x': 112.5, 'y': 22.895748466, 'z': '97th'},
- {'x': 113.5, 'y': 13.818996662, 'z': '3th'},
- {'x': 113.5, 'y': 14.058276901, 'z': '5th'},
- {'x': 113.5, 'y': 14.460594562, 'z': '10th'},
- {'x': 113.5, 'y': 15.247115104, 'z': '25th'},
- {'x': 113.5, 'y': 16.356372672, 'z': '50th'},
- {'x': 113.5, 'y': 17.863614688, 'z': '75th'},
- {'x': 113.5, 'y': 18.940284187, 'z': '85th'},
- {'x': 113.5, 'y': 19.834008407, 'z': '90th'},
- {'x': 113.5, 'y': 21.530510151, 'z': '95th'},
- {'x': 113.5, 'y': 23.00036429, 'z': '97th'},
- {'x': 114.5, 'y': 13.838280984, 'z': '3th'},
- {'x': 114.5, 'y': 14.079366766, 'z': '5th'},
- {'x': 114.5, 'y': 14.484777906, 'z': '10th'},
- {'x': 114.5, 'y': 15.27754914, 'z': '25th'},
- {'x': 114.5, 'y': 16.396059161, 'z': '50th'},
- {'x': 114.5, 'y': 17.916644925, 'z': '75th'},
- {'x': 114.5, 'y': 19.003359543, 'z': '85th'},
- {'x': 114.5, 'y': 19.905731151, 'z': '90th'},
- {'x': 114.5, 'y': 21.619384256, 'z': '95th'},
- {'x': 114.5, 'y': 23.104844159, 'z': '97th'},
- {'x': 115.5, 'y': 13.85817663, 'z': '3th'},
- {'x': 115.5, 'y': 14.101069371, 'z': '5th'},
- {'x': 115.5, 'y': 14.509574854, 'z': '10th'},
- {'x': 115.5, 'y': 15.308592377, 'z': '25th'},
- {'x': 115.5, 'y': 16.436332645, 'z': '50th'},
- {'x': 115.5, 'y': 17.970195317, 'z': '75th'},
- {'x': 115.5, 'y': 19.066876031, 'z': '85th'},
- {'x': 115.5, 'y': 19.977806231, 'z': '90th'},
- {'x': 115.5, 'y': 21.708374769, 'z': '95th'},
- {'x': 115.5, 'y': 23.209152956, 'z': '97th'},
- {'x': 116.5, 'y': 13.878681126, 'z': '3th'},
- {'x': 116.5, 'y': 14.123381501, 'z': '5th'},
- {'x': 116.5, 'y': 14.534980937, 'z': '10th'},
- {'x': 116.5, 'y': 15.340237847, 'z': '25th'},
- {'x': 116.5, 'y': 16.477182556, 'z': '50th'},
- {'x': 116.5, 'y': 18.024250263, 'z': '75th'},
- {'x': 116.5, 'y': 19.130814356, 'z': '85th'},
- {'x': 116.5, 'y': 20.050211213, 'z': '90th'},
- {'x': 116.5, 'y': 21.797453077, 'z': '95th'},
- {'x': 116.5, 'y': 23.313256408, 'z': '97th'},
- {'x': 117.5, 'y': 13.899791796, 'z': '3th'},
- {'x': 117.5, 'y': 14.146299772, 'z': '5th'},
- {'x': 117.5, 'y': 14.560991568, 'z': '10th'},
- {'x': 117.5, 'y': 15.372478564, 'z': '25th'},
- {'x': 117.5, 'y': 16.518598425, 'z': '50th'},
- {'x': 117.5, 'y': 18.078794399, 'z': '75th'},
- {'x': 117.5, 'y': 19.195155544, 'z': '85th'},
- {'x': 117.5, 'y': 20.122924059, 'z': '90th'},
- {'x': 117.5, 'y': 21.886591146, 'z': '95th'},
- {'x': 117.5, 'y': 23.417121085, 'z': '97th'},
- {'x': 118.5, 'y': 13.921505762, 'z': '3th'},
- {'x': 118.5, 'y': 14.169820633, 'z': '5th'},
- {'x': 118.5, 'y': 14.587602041, 'z': '10th'},
- {'x': 118.5, 'y': 15.405307515, 'z': '25th'},
- {'x': 118.5, 'y': 16.560569873, 'z': '50th'},
- {'x': 118.5, 'y': 18.133812583, 'z': '75th'},
- {'x': 118.5, 'y': 19.259880939, 'z': '85th'},
- {'x': 118.5, 'y': 20.195923127, 'z': '90th'},
- {'x': 118.5, 'y': 21.975761529, 'z': '95th'},
- {'x': 118.5, 'y': 23.520714402, 'z': '97th'},
- {'x': 119.5, 'y': 13.94381995, 'z': '3th'},
- {'x': 119.5, 'y': 14.193940365, 'z': '5th'},
- {'x': 119.5, 'y': 14.614807535, 'z': '10th'},
- {'x': 119.5, 'y': 15.438717663, 'z': '25th'},
- {'x': 119.5, 'y': 16.603086612, 'z': '50th'},
- {'x': 119.5, 'y': 18.189289902, 'z': '75th'},
- {'x': 119.5, 'y': 19.324972199, 'z': '85th'},
- {'x': 119.5, 'y': 20.269187171, 'z': '90th'},
- {'x': 119.5, 'y': 22.064937365, 'z': '95th'},
- {'x': 119.5, 'y': 23.624004623, 'z': '97th'},
- {'x': 120.5, 'y': 13.966731092, 'z': '3th'},
- {'x': 120.5, 'y': 14.218655083, 'z': '5th'},
- {'x': 120.5, 'y': 14.642603114, 'z': '10th'},
- {'x': 120.5, 'y': 15.472701945, 'z': '25th'},
- {'x': 120.5, 'y': 16.646138439, 'z': '50th'},
- {'x': 120.5, 'y': 18.245211664, 'z': '75th'},
- {'x': 120.5, 'y': 19.390411298, 'z': '85th'},
- {'x': 120.5, 'y': 20.342695338, 'z': '90th'},
- {'x': 120.5, 'y': 22.154092383, 'z': '95th'},
- {'x': 120.5, 'y': 23.726960857, 'z': '97th'},
- {'x': 121.5, 'y': 13.990235806, 'z': '3th'},
- {'x': 121.5, 'y': 14.243960805, 'z': '5th'},
- {'x': 121.5, 'y': 14.670983764, 'z': '10th'},
- {'x': 121.5, 'y': 15.507253261, 'z': '25th'},
- {'x': 121.5, 'y': 16.689715178, 'z': '50th'},
- {'x': 121.5, 'y': 18.301563299, 'z': '75th'},
- {'x': 121.5, 'y': 19.456180423, 'z': '85th'},
- {'x': 121.5, 'y': 20.416427092, 'z': '90th'},
- {'x': 121.5, 'y': 22.243200913, 'z': '95th'},
- {'x': 121.5, 'y': 23.829553219, 'z': '97th'},
- {'x': 122.5, 'y': 14.014330207, 'z': '3th'},
- {'x': 122.5, 'y': 14.269853131, 'z': '5th'},
- {'x': 122.5, 'y': 14.699944196, 'z': '10th'},
- {'x': 122.5, 'y': 15.542364501, 'z': '25th'},
- {'x': 122.5, 'y': 16.733806953, 'z': '50th'},
- {'x': 122.5, 'y': 18.358330838, 'z': '75th'},
- {'x': 122.5, 'y': 19.522262472, 'z': '85th'},
- {'x': 122.5, 'y': 20.490362625, 'z': '90th'},
- {'x': 122.5, 'y': 22.332237858, 'z': '95th'},
- {'x': 122.5, 'y': 23.931752057, 'z': '97th'},
- {'x': 123.5, 'y': 14.039010696, 'z': '3th'},
- {'x': 123.5, 'y': 14.296327886, 'z': '5th'},
- {'x': 123.5, 'y': 14.729479246, 'z': '10th'},
- {'x': 123.5, 'y': 15.578028494, 'z': '25th'},
- {'x': 123.5, 'y': 16.778403632, 'z': '50th'},
- {'x': 123.5, 'y': 18.415499949, 'z': '75th'},
- {'x': 123.5, 'y': 19.588640056, 'z': '85th'},
- {'x': 123.5, 'y': 20.564482024, 'z': '90th'},
- {'x': 123.5, 'y': 22.42117875, 'z': '95th'},
- {'x': 123.5, 'y': 24.033529496, 'z': '97th'},
- {'x': 124.5, 'y': 14.064273173, 'z': '3th'},
- {'x': 124.5, 'y': 14.323380481, 'z': '5th'},
- {'x': 124.5, 'y': 14.759583474, 'z': '10th'},
- {'x': 124.5, 'y': 15.614238053, 'z': '25th'},
- {'x': 124.5, 'y': 16.82349538, 'z': '50th'},
- {'x': 124.5, 'y': 18.473056895, 'z': '75th'},
- {'x': 124.5, 'y': 19.655296491, 'z': '85th'},
- {'x': 124.5, 'y': 20.63876611, 'z': '90th'},
- {'x': 124.5, 'y': 22.509999702, 'z': '95th'},
- {'x': 124.5, 'y': 24.134857897, 'z': '97th'},
- {'x': 125.5, 'y': 14.090113438, 'z': '3th'},
- {'x': 125.5, 'y': 14.351006234, 'z': '5th'},
- {'x': 125.5, 'y': 14.790251368, 'z': '10th'},
- {'x': 125.5, 'y': 15.650985952, 'z': '25th'},
- {'x': 125.5, 'y': 16.869072375, 'z': '50th'},
- {'x': 125.5, 'y': 18.530988051, 'z': '75th'},
- {'x': 125.5, 'y': 19.722215306, 'z': '85th'},
- {'x': 125.5, 'y': 20.713196016, 'z': '90th'},
- {'x': 125.5, 'y': 22.598677436, 'z': '95th'},
- {'x': 125.5, 'y': 24.235710627, 'z': '97th'},
- {'x': 126.5, 'y': 14.116527107, 'z': '3th'},
- {'x': 126.5, 'y': 14.379200308, 'z': '5th'},
- {'x': 126.5, 'y': 14.821477298, 'z': '10th'},
- {'x': 126.5, 'y': 15.68826493, 'z': '25th'},
- {'x': 126.5, 'y': 16.915124866, 'z': '50th'},
- {'x': 126.5, 'y': 18.589280001, 'z': '75th'},
- {'x': 126.5, 'y': 19.789380335, 'z': '85th'},
- {'x': 126.5, 'y': 20.787753272, 'z': '90th'},
- {'x': 126.5, 'y': 22.687189277, 'z': '95th'},
- {'x': 126.5, 'y': 24.336061908, 'z': '97th'},
- {'x': 127.5, 'y': 14.143509617, 'z': '3th'},
- {'x': 127.5, 'y': 14.407957708, 'z': '5th'},
- {'x': 127.5, 'y': 14.853255522, 'z': '10th'},
- {'x': 127.5, 'y': 15.726067684, 'z': '25th'},
- {'x': 127.5, 'y': 16.961643168, 'z': '50th'},
- {'x': 127.5, 'y': 18.647919531, 'z': '75th'},
- {'x': 127.5, 'y': 19.85677572, 'z': '85th'},
- {'x': 127.5, 'y': 20.862419807, 'z': '90th'},
- {'x': 127.5, 'y': 22.775513158, 'z': '95th'},
- {'x': 127.5, 'y': 24.435886814, 'z': '97th'},
- {'x': 128.5, 'y': 14.171056231, 'z': '3th'},
- {'x': 128.5, 'y': 14.43727329, 'z': '5th'},
- {'x': 128.5, 'y': 14.885580184, 'z': '10th'},
- {'x': 128.5, 'y': 15.764386877, 'z': '25th'},
- {'x': 128.5, 'y': 17.00861766, 'z': '50th'},
- {'x': 128.5, 'y': 18.706893635, 'z': '75th'},
- {'x': 128.5, 'y': 19.924385908, 'z': '85th'},
- {'x': 128.5, 'y': 20.937177951, 'z': '90th'},
- {'x': 128.5, 'y': 22.86362762, 'z': '95th'},
- {'x': 128.5, 'y': 24.535161274, 'z': '97th'},
- {'x': 129.5, 'y': 14.199162032, 'z': '3th'},
- {'x': 129.5, 'y': 14.467141754, 'z': '5th'},
- {'x': 129.5, 'y': 14.91844531, 'z': '10th'},
- {'x': 129.5, 'y': 15.80321513, 'z': '25th'},
- {'x': 129.5, 'y': 17.056038787, 'z': '50th'},
- {'x': 129.5, 'y': 18.766189505, 'z': '75th'},
- {'x': 129.5, 'y': 19.992195654, 'z': '85th'},
- {'x': 129.5, 'y': 21.01201043, 'z': '90th'},
- {'x': 129.5, 'y': 22.951511816, 'z': '95th'},
- {'x': 129.5, 'y': 24.633862067, 'z': '97th'},
- {'x': 130.5, 'y': 14.227821931, 'z': '3th'},
- {'x': 130.5, 'y': 14.497557648, 'z': '5th'},
- {'x': 130.5, 'y': 14.951844817, 'z': '10th'},
- {'x': 130.5, 'y': 15.842545024, 'z': '25th'},
- {'x': 130.5, 'y': 17.103897052, 'z': '50th'},
- {'x': 130.5, 'y': 18.825794538, 'z': '75th'},
- {'x': 130.5, 'y': 20.060190019, 'z': '85th'},
- {'x': 130.5, 'y': 21.086900371, 'z': '90th'},
- {'x': 130.5, 'y': 23.039145509, 'z': '95th'},
- {'x': 130.5, 'y': 24.731966828, 'z': '97th'},
- {'x': 131.5, 'y': 14.257030662, 'z': '3th'},
- {'x': 131.5, 'y': 14.528515371, 'z': '5th'},
- {'x': 131.5, 'y': 14.985772505, 'z': '10th'},
- {'x': 131.5, 'y': 15.882369097, 'z': '25th'},
- {'x': 131.5, 'y': 17.152183022, 'z': '50th'},
- {'x': 131.5, 'y': 18.885696327, 'z': '75th'},
- {'x': 131.5, 'y': 20.128354368, 'z': '85th'},
- {'x': 131.5, 'y': 21.161831304, 'z': '90th'},
- {'x': 131.5, 'y': 23.126509077, 'z': '95th'},
- {'x': 131.5, 'y': 24.829454043, 'z': '97th'},
- {'x': 132.5, 'y': 14.286782789, 'z': '3th'},
- {'x': 132.5, 'y': 14.560009167, 'z': '5th'},
- {'x': 132.5, 'y': 15.020222061, 'z': '10th'},
- {'x': 132.5, 'y': 15.922679848, 'z': '25th'},
- {'x': 132.5, 'y': 17.200887318, 'z': '50th'},
- {'x': 132.5, 'y': 18.945882667, 'z': '75th'},
- {'x': 132.5, 'y': 20.196674371, 'z': '85th'},
- {'x': 132.5, 'y': 21.236787157, 'z': '90th'},
- {'x': 132.5, 'y': 23.213583513, 'z': '95th'},
- {'x': 132.5, 'y': 24.926303052, 'z': '97th'},
- {'x': 133.5, 'y': 14.317072705, 'z': '3th'},
- {'x': 133.5, 'y': 14.592033134, 'z': '5th'},
- {'x': 133.5, 'y': 15.055187056, 'z': '10th'},
- {'x': 133.5, 'y': 15.963469729, 'z': '25th'},
- {'x': 133.5, 'y': 17.250000623, 'z': '50th'},
- {'x': 133.5, 'y': 19.006341548, 'z': '75th'},
- {'x': 133.5, 'y': 20.265136002, 'z': '85th'},
- {'x': 133.5, 'y': 21.311752258, 'z': '90th'},
- {'x': 133.5, 'y': 23.300350425, 'z': '95th'},
- {'x': 133.5, 'y': 25.022494046, 'z': '97th'},
- {'x': 134.5, 'y': 14.347894631, 'z': '3th'},
- {'x': 134.5, 'y': 14.62458122, 'z': '5th'},
- {'x': 134.5, 'y': 15.090660952, 'z': '10th'},
- {'x': 134.5, 'y': 16.004731153, 'z': '25th'},
- {'x': 134.5, 'y': 17.299513673, 'z': '50th'},
- {'x': 134.5, 'y': 19.067061157, 'z': '75th'},
- {'x': 134.5, 'y': 20.333725539, 'z': '85th'},
- {'x': 134.5, 'y': 21.386711339, 'z': '90th'},
- {'x': 134.5, 'y': 23.38679204, 'z': '95th'},
- {'x': 134.5, 'y': 25.118008072, 'z': '97th'},
- {'x': 135.5, 'y': 14.379242621, 'z': '3th'},
- {'x': 135.5, 'y': 14.657647224, 'z': '5th'},
- {'x': 135.5, 'y': 15.126637095, 'z': '10th'},
- {'x': 135.5, 'y': 16.046456484, 'z': '25th'},
- {'x': 135.5, 'y': 17.349417258, 'z': '50th'},
- {'x': 135.5, 'y': 19.128029874, 'z': '75th'},
- {'x': 135.5, 'y': 20.402429562, 'z': '85th'},
- {'x': 135.5, 'y': 21.46164953, 'z': '90th'},
- {'x': 135.5, 'y': 23.472891203, 'z': '95th'},
- {'x': 135.5, 'y': 25.21282703, 'z': '97th'},
- {'x': 136.5, 'y': 14.411109333, 'z': '3th'},
- {'x': 136.5, 'y': 14.691223806, 'z': '5th'},
- {'x': 136.5, 'y': 15.163108105, 'z': '10th'},
- {'x': 136.5, 'y': 16.088638115, 'z': '25th'},
- {'x': 136.5, 'y': 17.399703081, 'z': '50th'},
- {'x': 136.5, 'y': 19.189237763, 'z': '75th'},
- {'x': 136.5, 'y': 20.471236496, 'z': '85th'},
- {'x': 136.5, 'y': 21.536553648, 'z': '90th'},
- {'x': 136.5, 'y': 23.558631287, 'z': '95th'},
- {'x': 136.5, 'y': 25.306931298, 'z': '97th'},
- {'x': 137.5, 'y': 14.443490382, 'z': '3th'},
- {'x': 137.5, 'y': 14.725306007, 'z': '5th'},
- {'x': 137.5, 'y': 15.200068051, 'z': '10th'},
- {'x': 137.5, 'y': 16.131268213, 'z': '25th'},
- {'x': 137.5, 'y': 17.450360715, 'z': '50th'},
- {'x': 137.5, 'y': 19.250671291, 'z': '75th'},
- {'x': 137.5, 'y': 20.540131144, 'z': '85th'},
- {'x': 137.5, 'y': 21.611407641, 'z': '90th'},
- {'x': 137.5, 'y': 23.643996517, 'z': '95th'},
- {'x': 137.5, 'y': 25.40030815, 'z': '97th'},
- {'x': 138.5, 'y': 14.476378606, 'z': '3th'},
- {'x': 138.5, 'y': 14.759886606, 'z': '5th'},
- {'x': 138.5, 'y': 15.237509582, 'z': '10th'},
- {'x': 138.5, 'y': 16.174339049, 'z': '25th'},
- {'x': 138.5, 'y': 17.501381606, 'z': '50th'},
- {'x': 138.5, 'y': 19.312320288, 'z': '75th'},
- {'x': 138.5, 'y': 20.609101892, 'z': '85th'},
- {'x': 138.5, 'y': 21.686198596, 'z': '90th'},
- {'x': 138.5, 'y': 23.728971547, 'z': '95th'},
- {'x': 138.5, 'y': 25.492940659, 'z': '97th'},
- {'x': 139.5, 'y': 14.509767412, 'z': '3th'},
- {'x': 139.5, 'y': 14.794958832, 'z': '5th'},
- {'x': 139.5, 'y': 15.275425605, 'z': '10th'},
- {'x': 139.5, 'y': 16.217842806, 'z': '25th'},
- {'x': 139.5, 'y': 17.552756739, 'z': '50th'},
- {'x': 139.5, 'y': 19.374173878, 'z': '75th'},
- {'x': 139.5, 'y': 20.678136503, 'z': '85th'},
- {'x': 139.5, 'y': 21.760913228, 'z': '90th'},
- {'x': 139.5, 'y': 23.813541709, 'z': '95th'},
- {'x': 139.5, 'y': 25.584814177, 'z': '97th'},
- {'x': 140.5, 'y': 14.543650049, 'z': '3th'},
- {'x': 140.5, 'y': 14.830515777, 'z': '5th'},
- {'x': 140.5, 'y': 15.313808916, 'z': '10th'},
- {'x': 140.5, 'y': 16.261771619, 'z': '25th'},
- {'x': 140.5, 'y': 17.604477144, 'z': '50th'},
- {'x': 140.5, 'y': 19.43622137, 'z': '75th'},
- {'x': 140.5, 'y': 20.747223033, 'z': '85th'},
- {'x': 140.5, 'y': 21.835538651, 'z': '90th'},
- {'x': 140.5, 'y': 23.897692958, 'z': '95th'},
- {'x': 140.5, 'y': 25.675914917, 'z': '97th'},
- {'x': 141.5, 'y': 14.57801961, 'z': '3th'},
- {'x': 141.5, 'y': 14.86655039, 'z': '5th'},
- {'x': 141.5, 'y': 15.352652202, 'z': '10th'},
- {'x': 141.5, 'y': 16.306117576, 'z': '25th'},
- {'x': 141.5, 'y': 17.656533895, 'z': '50th'},
- {'x': 141.5, 'y': 19.498452255, 'z': '75th'},
- {'x': 141.5, 'y': 20.816349832, 'z': '85th'},
- {'x': 141.5, 'y': 21.910062372, 'z': '90th'},
- {'x': 141.5, 'y': 23.981411874, 'z': '95th'},
- {'x': 141.5, 'y': 25.76622996, 'z': '97th'},
- {'x': 142.5, 'y': 14.612869033, 'z': '3th'},
- {'x': 142.5, 'y': 14.903055485, 'z': '5th'},
- {'x': 142.5, 'y': 15.391948042, 'z': '10th'},
- {'x': 142.5, 'y': 16.350872717, 'z': '25th'},
- {'x': 142.5, 'y': 17.708918107, 'z': '50th'},
- {'x': 142.5, 'y': 19.560856203, 'z': '75th'},
- {'x': 142.5, 'y': 20.885505539, 'z': '85th'},
- {'x': 142.5, 'y': 21.984472294, 'z': '90th'},
- {'x': 142.5, 'y': 24.064685664, 'z': '95th'},
- {'x': 142.5, 'y': 25.855747252, 'z': '97th'},
- {'x': 143.5, 'y': 14.648191101, 'z': '3th'},
- {'x': 143.5, 'y': 14.940023736, 'z': '5th'},
- {'x': 143.5, 'y': 15.431688907, 'z': '10th'},
- {'x': 143.5, 'y': 16.396029033, 'z': '25th'},
- {'x': 143.5, 'y': 17.761620938, 'z': '50th'},
- {'x': 143.5, 'y': 19.623423062, 'z': '75th'},
- {'x': 143.5, 'y': 20.954679086, 'z': '85th'},
- {'x': 143.5, 'y': 22.058756716, 'z': '90th'},
- {'x': 143.5, 'y': 24.147502159, 'z': '95th'},
- {'x': 143.5, 'y': 25.944455605, 'z': '97th'},
- {'x': 144.5, 'y': 14.683978443, 'z': '3th'},
- {'x': 144.5, 'y': 14.977447683, 'z': '5th'},
- {'x': 144.5, 'y': 15.471867162, 'z': '10th'},
- {'x': 144.5, 'y': 16.441578466, 'z': '25th'},
- {'x': 144.5, 'y': 17.814633586, 'z': '50th'},
- {'x': 144.5, 'y': 19.686142859, 'z': '75th'},
- {'x': 144.5, 'y': 21.023859692, 'z': '85th'},
- {'x': 144.5, 'y': 22.132904327, 'z': '90th'},
- {'x': 144.5, 'y': 24.22984982, 'z': '95th'},
- {'x': 144.5, 'y': 26.032344701, 'z': '97th'},
- {'x': 145.5, 'y': 14.72022354, 'z': '3th'},
- {'x': 145.5, 'y': 15.01531973, 'z': '5th'},
- {'x': 145.5, 'y': 15.512475062, 'z': '10th'},
- {'x': 145.5, 'y': 16.487512909, 'z': '25th'},
- {'x': 145.5, 'y': 17.867947289, 'z': '50th'},
- {'x': 145.5, 'y': 19.749005793, 'z': '75th'},
- {'x': 145.5, 'y': 21.093036865, 'z': '85th'},
- {'x': 145.5, 'y': 22.206904214, 'z': '90th'},
- {'x': 145.5, 'y': 24.311717735, 'z': '95th'},
- {'x': 145.5, 'y': 26.119405091, 'z': '97th'},
- {'x': 146.5, 'y': 14.75691872, 'z': '3th'},
- {'x': 146.5, 'y': 15.053632148, 'z': '5th'},
- {'x': 146.5, 'y': 15.553504759, 'z': '10th'},
- {'x': 146.5, 'y': 16.533824207, 'z': '25th'},
- {'x': 146.5, 'y': 17.92155332, 'z': '50th'},
- {'x': 146.5, 'y': 19.812002241, 'z': '75th'},
- {'x': 146.5, 'y': 21.1622004, 'z': '85th'},
- {'x': 146.5, 'y': 22.280745854, 'z': '90th'},
- {'x': 146.5, 'y': 24.39309562, 'z': '95th'},
- {'x': 146.5, 'y': 26.205628194, 'z': '97th'},
- {'x': 147.5, 'y': 14.794056164, 'z': '3th'},
- {'x': 147.5, 'y': 15.092377074, 'z': '5th'},
- {'x': 147.5, 'y': 15.594948298, 'z': '10th'},
- {'x': 147.5, 'y': 16.580504153, 'z': '25th'},
- {'x': 147.5, 'y': 17.975442992, 'z': '50th'},
- {'x': 147.5, 'y': 19.87512275, 'z': '75th'},
- {'x': 147.5, 'y': 21.231340378, 'z': '85th'},
- {'x': 147.5, 'y': 22.354419119, 'z': '90th'},
- {'x': 147.5, 'y': 24.473973823, 'z': '95th'},
- {'x': 147.5, 'y': 26.291006302, 'z': '97th'},
- {'x': 148.5, 'y': 14.831627905, 'z': '3th'},
- {'x': 148.5, 'y': 15.131546514, 'z': '5th'},
- {'x': 148.5, 'y': 15.636797616, 'z': '10th'},
- {'x': 148.5, 'y': 16.627544491, 'z': '25th'},
- {'x': 148.5, 'y': 18.029607653, 'z': '50th'},
- {'x': 148.5, 'y': 19.93835804, 'z': '75th'},
- {'x': 148.5, 'y': 21.300447165, 'z': '85th'},
- {'x': 148.5, 'y': 22.427914271, 'z': '90th'},
- {'x': 148.5, 'y': 24.554343318, 'z': '95th'},
- {'x': 148.5, 'y': 26.375532577, 'z': '97th'},
- {'x': 149.5, 'y': 14.869625831, 'z': '3th'},
- {'x': 149.5, 'y': 15.171132342, 'z': '5th'},
- {'x': 149.5, 'y': 15.679044549, 'z': '10th'},
- {'x': 149.5, 'y': 16.674936915, 'z': '25th'},
- {'x': 149.5, 'y': 18.084038684, 'z': '50th'},
- {'x': 149.5, 'y': 20.001699, 'z': '75th'},
- {'x': 149.5, 'y': 21.369511412, 'z': '85th'},
- {'x': 149.5, 'y': 22.501221965, 'z': '90th'},
- {'x': 149.5, 'y': 24.634195716, 'z': '95th'},
- {'x': 149.5, 'y': 26.459201057, 'z': '97th'},
- {'x': 150.5, 'y': 14.908041684, 'z': '3th'},
- {'x': 150.5, 'y': 15.211126303, 'z': '5th'},
- {'x': 150.5, 'y': 15.721680827, 'z': '10th'},
- {'x': 150.5, 'y': 16.722673066, 'z': '25th'},
- {'x': 150.5, 'y': 18.138727501, 'z': '50th'},
- {'x': 150.5, 'y': 20.065136686, 'z': '75th'},
- {'x': 150.5, 'y': 21.438524051, 'z': '85th'},
- {'x': 150.5, 'y': 22.574333245, 'z': '90th'},
- {'x': 150.5, 'y': 24.713523254, 'z': '95th'},
- {'x': 150.5, 'y': 26.542006651, 'z': '97th'},
- {'x': 151.5, 'y': 14.946867065, 'z': '3th'},
- {'x': 151.5, 'y': 15.251520013, 'z': '5th'},
- {'x': 151.5, 'y': 15.764698077, 'z': '10th'},
- {'x': 151.5, 'y': 16.770744536, 'z': '25th'},
- {'x': 151.5, 'y': 18.193665552, 'z': '50th'},
- {'x': 151.5, 'y': 20.128662323, 'z': '75th'},
- {'x': 151.5, 'y': 21.507476296, 'z': '85th'},
- {'x': 151.5, 'y': 22.647239548, 'z': '90th'},
- {'x': 151.5, 'y': 24.792318805, 'z': '95th'},
- {'x': 151.5, 'y': 26.623945145, 'z': '97th'},
- {'x': 152.5, 'y': 14.986093432, 'z': '3th'},
- {'x': 152.5, 'y': 15.292304961, 'z': '5th'},
- {'x': 152.5, 'y': 15.808087821, 'z': '10th'},
- {'x': 152.5, 'y': 16.819142864, 'z': '25th'},
- {'x': 152.5, 'y': 18.248844314, 'z': '50th'},
- {'x': 152.5, 'y': 20.1922673, 'z': '75th'},
- {'x': 152.5, 'y': 21.576359641, 'z': '85th'},
- {'x': 152.5, 'y': 22.719932699, 'z': '90th'},
- {'x': 152.5, 'y': 24.870575873, 'z': '95th'},
- {'x': 152.5, 'y': 26.705013199, 'z': '97th'},
- {'x': 153.5, 'y': 15.025712104, 'z': '3th'},
- {'x': 153.5, 'y': 15.333472509, 'z': '5th'},
- {'x': 153.5, 'y': 15.851841481, 'z': '10th'},
- {'x': 153.5, 'y': 16.867859538, 'z': '25th'},
- {'x': 153.5, 'y': 18.304255296, 'z': '50th'},
- {'x': 153.5, 'y': 20.25594317, 'z': '75th'},
- {'x': 153.5, 'y': 21.645165861, 'z': '85th'},
- {'x': 153.5, 'y': 22.792404912, 'z': '90th'},
- {'x': 153.5, 'y': 24.948288599, 'z': '95th'},
- {'x': 153.5, 'y': 26.785208353, 'z': '97th'},
- {'x': 154.5, 'y': 15.065714261, 'z': '3th'},
- {'x': 154.5, 'y': 15.375013894, 'z': '5th'},
- {'x': 154.5, 'y': 15.895950376, 'z': '10th'},
- {'x': 154.5, 'y': 16.916885994, 'z': '25th'},
- {'x': 154.5, 'y': 18.359890034, 'z': '50th'},
- {'x': 154.5, 'y': 20.319681648, 'z': '75th'},
- {'x': 154.5, 'y': 21.713887007, 'z': '85th'},
- {'x': 154.5, 'y': 22.864648792, 'z': '90th'},
- {'x': 154.5, 'y': 25.025451754, 'z': '95th'},
- {'x': 154.5, 'y': 26.864529023, 'z': '97th'},
- {'x': 155.5, 'y': 15.106090947, 'z': '3th'},
- {'x': 155.5, 'y': 15.416920229, 'z': '5th'},
- {'x': 155.5, 'y': 15.940405724, 'z': '10th'},
- {'x': 155.5, 'y': 16.966213614, 'z': '25th'},
- {'x': 155.5, 'y': 18.415740092, 'z': '50th'},
- {'x': 155.5, 'y': 20.383474611, 'z': '75th'},
- {'x': 155.5, 'y': 21.782515408, 'z': '85th'},
- {'x': 155.5, 'y': 22.93665733, 'z': '90th'},
- {'x': 155.5, 'y': 25.10206075, 'z': '95th'},
- {'x': 155.5, 'y': 26.942974505, 'z': '97th'},
- {'x': 156.5, 'y': 15.146833068, 'z': '3th'},
- {'x': 156.5, 'y': 15.459182504, 'z': '5th'},
- {'x': 156.5, 'y': 15.98519864, 'z': '10th'},
- {'x': 156.5, 'y': 17.015833728, 'z': '25th'},
- {'x': 156.5, 'y': 18.471797059, 'z': '50th'},
- {'x': 156.5, 'y': 20.447314091, 'z': '75th'},
- {'x': 156.5, 'y': 21.851043669, 'z': '85th'},
- {'x': 156.5, 'y': 23.008423904, 'z': '90th'},
- {'x': 156.5, 'y': 25.17811163, 'z': '95th'},
- {'x': 156.5, 'y': 27.020544975, 'z': '97th'},
- {'x': 157.5, 'y': 15.1879314, 'z': '3th'},
- {'x': 157.5, 'y': 15.501791587, 'z': '5th'},
- {'x': 157.5, 'y': 16.030320143, 'z': '10th'},
- {'x': 157.5, 'y': 17.065737613, 'z': '25th'},
- {'x': 157.5, 'y': 18.528052549, 'z': '50th'},
- {'x': 157.5, 'y': 20.511192282, 'z': '75th'},
- {'x': 157.5, 'y': 21.919464668, 'z': '85th'},
- {'x': 157.5, 'y': 23.079942282, 'z': '90th'},
- {'x': 157.5, 'y': 25.253601077, 'z': '95th'},
- {'x': 157.5, 'y': 27.097241493, 'z': '97th'},
- {'x': 158.5, 'y': 15.229376584, 'z': '3th'},
- {'x': 158.5, 'y': 15.544738227, 'z': '5th'},
- {'x': 158.5, 'y': 16.075761148, 'z': '10th'},
- {'x': 158.5, 'y': 17.115916491, 'z': '25th'},
- {'x': 158.5, 'y': 18.584498199, 'z': '50th'},
- {'x': 158.5, 'y': 20.57510153, 'z': '75th'},
- {'x': 158.5, 'y': 21.987771559, 'z': '85th'},
- {'x': 158.5, 'y': 23.151206617, 'z': '90th'},
- {'x': 158.5, 'y': 25.328526412, 'z': '95th'},
- {'x': 158.5, 'y': 27.173065998, 'z': '97th'},
- {'x': 159.5, 'y': 15.271159134, 'z': '3th'},
- {'x': 159.5, 'y': 15.588013052, 'z': '5th'},
- {'x': 159.5, 'y': 16.121512475, 'z': '10th'},
- {'x': 159.5, 'y': 17.166361531, 'z': '25th'},
- {'x': 159.5, 'y': 18.641125665, 'z': '50th'},
- {'x': 159.5, 'y': 20.639034337, 'z': '75th'},
- {'x': 159.5, 'y': 22.055957764, 'z': '85th'},
- {'x': 159.5, 'y': 23.222211447, 'z': '90th'},
- {'x': 159.5, 'y': 25.402885595, 'z': '95th'},
- {'x': 159.5, 'y': 27.248021316, 'z': '97th'},
- {'x': 160.5, 'y': 15.313269432, 'z': '3th'},
- {'x': 160.5, 'y': 15.631606575, 'z': '5th'},
- {'x': 160.5, 'y': 16.167564844, 'z': '10th'},
- {'x': 160.5, 'y': 17.217063844, 'z': '25th'},
- {'x': 160.5, 'y': 18.697926627, 'z': '50th'},
- {'x': 160.5, 'y': 20.702983356, 'z': '75th'},
- {'x': 160.5, 'y': 22.12401698, 'z': '85th'},
- {'x': 160.5, 'y': 23.292951697, 'z': '90th'},
- {'x': 160.5, 'y': 25.476677223, 'z': '95th'},
- {'x': 160.5, 'y': 27.322111154, 'z': '97th'},
- {'x': 161.5, 'y': 15.355697735, 'z': '3th'},
- {'x': 161.5, 'y': 15.67550919, 'z': '5th'},
- {'x': 161.5, 'y': 16.213908876, 'z': '10th'},
- {'x': 161.5, 'y': 17.268014489, 'z': '25th'},
- {'x': 161.5, 'y': 18.754892781, 'z': '50th'},
- {'x': 161.5, 'y': 20.766941389, 'z': '75th'},
- {'x': 161.5, 'y': 22.191943172, 'z': '85th'},
- {'x': 161.5, 'y': 23.363422678, 'z': '90th'},
- {'x': 161.5, 'y': 25.549900538, 'z': '95th'},
- {'x': 161.5, 'y': 27.39534011, 'z': '97th'},
- {'x': 162.5, 'y': 15.398434176, 'z': '3th'},
- {'x': 162.5, 'y': 15.719711177, 'z': '5th'},
- {'x': 162.5, 'y': 16.260535098, 'z': '10th'},
- {'x': 162.5, 'y': 17.319204466, 'z': '25th'},
- {'x': 162.5, 'y': 18.812015839, 'z': '50th'},
- {'x': 162.5, 'y': 20.83090139, 'z': '75th'},
- {'x': 162.5, 'y': 22.259730572, 'z': '85th'},
- {'x': 162.5, 'y': 23.433620084, 'z': '90th'},
- {'x': 162.5, 'y': 25.62255542, 'z': '95th'},
- {'x': 162.5, 'y': 27.467713664, 'z': '97th'},
- {'x': 163.5, 'y': 15.441468765, 'z': '3th'},
- {'x': 163.5, 'y': 15.764202704, 'z': '5th'},
- {'x': 163.5, 'y': 16.307433937, 'z': '10th'},
- {'x': 163.5, 'y': 17.370624722, 'z': '25th'},
- {'x': 163.5, 'y': 18.869287528, 'z': '50th'},
- {'x': 163.5, 'y': 20.894856455, 'z': '75th'},
- {'x': 163.5, 'y': 22.327373681, 'z': '85th'},
- {'x': 163.5, 'y': 23.503539993, 'z': '90th'},
- {'x': 163.5, 'y': 25.694642395, 'z': '95th'},
- {'x': 163.5, 'y': 27.539238188, 'z': '97th'},
- {'x': 164.5, 'y': 15.484791389, 'z': '3th'},
- {'x': 164.5, 'y': 15.808973823, 'z': '5th'},
- {'x': 164.5, 'y': 16.354595727, 'z': '10th'},
- {'x': 164.5, 'y': 17.422266142, 'z': '25th'},
- {'x': 164.5, 'y': 18.92669959, 'z': '50th'},
- {'x': 164.5, 'y': 20.958799828, 'z': '75th'},
- {'x': 164.5, 'y': 22.394867265, 'z': '85th'},
- {'x': 164.5, 'y': 23.57317887, 'z': '90th'},
- {'x': 164.5, 'y': 25.766162632, 'z': '95th'},
- {'x': 164.5, 'y': 27.609920941, 'z': '97th'},
- {'x': 165.5, 'y': 15.52839182, 'z': '3th'},
- {'x': 165.5, 'y': 15.854014479, 'z': '5th'},
- {'x': 165.5, 'y': 16.402010707, 'z': '10th'},
- {'x': 165.5, 'y': 17.474119556, 'z': '25th'},
- {'x': 165.5, 'y': 18.984243775, 'z': '50th'},
- {'x': 165.5, 'y': 21.022724893, 'z': '75th'},
- {'x': 165.5, 'y': 22.462206356, 'z': '85th'},
- {'x': 165.5, 'y': 23.64253356, 'z': '90th'},
- {'x': 165.5, 'y': 25.837117943, 'z': '95th'},
- {'x': 165.5, 'y': 27.679770074, 'z': '97th'},
- {'x': 166.5, 'y': 15.572259709, 'z': '3th'},
- {'x': 166.5, 'y': 15.899314507, 'z': '5th'},
- {'x': 166.5, 'y': 16.449669019, 'z': '10th'},
- {'x': 166.5, 'y': 17.526175734, 'z': '25th'},
- {'x': 166.5, 'y': 19.041911845, 'z': '50th'},
- {'x': 166.5, 'y': 21.086625176, 'z': '75th'},
- {'x': 166.5, 'y': 22.529386247, 'z': '85th'},
- {'x': 166.5, 'y': 23.711601294, 'z': '90th'},
- {'x': 166.5, 'y': 25.90751079, 'z': '95th'},
- {'x': 166.5, 'y': 27.748794627, 'z': '97th'},
- {'x': 167.5, 'y': 15.616384596, 'z': '3th'},
- {'x': 167.5, 'y': 15.944863634, 'z': '5th'},
- {'x': 167.5, 'y': 16.497560713, 'z': '10th'},
- {'x': 167.5, 'y': 17.578425385, 'z': '25th'},
- {'x': 167.5, 'y': 19.099695568, 'z': '50th'},
- {'x': 167.5, 'y': 21.15049434, 'z': '75th'},
- {'x': 167.5, 'y': 22.596402495, 'z': '85th'},
- {'x': 167.5, 'y': 23.780379685, 'z': '90th'},
- {'x': 167.5, 'y': 25.977344281, 'z': '95th'},
- {'x': 167.5, 'y': 27.817004534, 'z': '97th'},
- {'x': 168.5, 'y': 15.660755908, 'z': '3th'},
- {'x': 168.5, 'y': 15.990651482, 'z': '5th'},
- {'x': 168.5, 'y': 16.545675744, 'z': '10th'},
- {'x': 168.5, 'y': 17.63085916, 'z': '25th'},
- {'x': 168.5, 'y': 19.157586716, 'z': '50th'},
- {'x': 168.5, 'y': 21.214326186, 'z': '75th'},
- {'x': 168.5, 'y': 22.663250919, 'z': '85th'},
- {'x': 168.5, 'y': 23.848866729, 'z': '90th'},
- {'x': 168.5, 'y': 26.046622172, 'z': '95th'},
- {'x': 168.5, 'y': 27.884410623, 'z': '97th'},
- {'x': 169.5, 'y': 15.70536296, 'z': '3th'},
- {'x': 169.5, 'y': 16.036667567, 'z': '5th'},
- {'x': 169.5, 'y': 16.594003977, 'z': '10th'},
- {'x': 169.5, 'y': 17.683467644, 'z': '25th'},
- {'x': 169.5, 'y': 19.215577065, 'z': '50th'},
- {'x': 169.5, 'y': 21.278114648, 'z': '75th'},
- {'x': 169.5, 'y': 22.729927595, 'z': '85th'},
- {'x': 169.5, 'y': 23.917060806, 'z': '90th'},
- {'x': 169.5, 'y': 26.115348872, 'z': '95th'},
- {'x': 169.5, 'y': 27.951024616, 'z': '97th'},
- {'x': 170.5, 'y': 15.750194963, 'z': '3th'},
- {'x': 170.5, 'y': 16.082901303, 'z': '5th'},
- {'x': 170.5, 'y': 16.642535182, 'z': '10th'},
- {'x': 170.5, 'y': 17.736241363, 'z': '25th'},
- {'x': 170.5, 'y': 19.27365839, 'z': '50th'},
- {'x': 170.5, 'y': 21.341853792, 'z': '75th'},
- {'x': 170.5, 'y': 22.79642886, 'z': '85th'},
- {'x': 170.5, 'y': 23.984960677, 'z': '90th'},
- {'x': 170.5, 'y': 26.183529439, 'z': '95th'},
- {'x': 170.5, 'y': 28.016859129, 'z': '97th'},
- {'x': 171.5, 'y': 15.795241019, 'z': '3th'},
- {'x': 171.5, 'y': 16.129342004, 'z': '5th'},
- {'x': 171.5, 'y': 16.691259039, 'z': '10th'},
- {'x': 171.5, 'y': 17.789170776, 'z': '25th'},
- {'x': 171.5, 'y': 19.331822466, 'z': '50th'},
- {'x': 171.5, 'y': 21.405537813, 'z': '75th'},
- {'x': 171.5, 'y': 22.862751308, 'z': '85th'},
- {'x': 171.5, 'y': 24.052565486, 'z': '90th'},
- {'x': 171.5, 'y': 26.251169587, 'z': '95th'},
- {'x': 171.5, 'y': 28.081927677, 'z': '97th'},
- {'x': 172.5, 'y': 15.840490131, 'z': '3th'},
- {'x': 172.5, 'y': 16.175978884, 'z': '5th'},
- {'x': 172.5, 'y': 16.740165136, 'z': '10th'},
- {'x': 172.5, 'y': 17.84224628, 'z': '25th'},
- {'x': 172.5, 'y': 19.390061061, 'z': '50th'},
- {'x': 172.5, 'y': 21.469161036, 'z': '75th'},
- {'x': 172.5, 'y': 22.928891788, 'z': '85th'},
- {'x': 172.5, 'y': 24.119874762, 'z': '90th'},
- {'x': 172.5, 'y': 26.318275685, 'z': '95th'},
- {'x': 172.5, 'y': 28.14624467, 'z': '97th'},
- {'x': 173.5, 'y': 15.885931199, 'z': '3th'},
- {'x': 173.5, 'y': 16.222801059, 'z': '5th'},
- {'x': 173.5, 'y': 16.789242971, 'z': '10th'},
- {'x': 173.5, 'y': 17.895458202, 'z': '25th'},
- {'x': 173.5, 'y': 19.448365938, 'z': '50th'},
- {'x': 173.5, 'y': 21.532717907, 'z': '75th'},
- {'x': 173.5, 'y': 22.994847407, 'z': '85th'},
- {'x': 173.5, 'y': 24.186888413, 'z': '90th'},
- {'x': 173.5, 'y': 26.384854755, 'z': '95th'},
- {'x': 173.5, 'y': 28.209825418, 'z': '97th'},
- {'x': 174.5, 'y': 15.931553027, 'z': '3th'},
- {'x': 174.5, 'y': 16.26979755, 'z': '5th'},
- {'x': 174.5, 'y': 16.838481952, 'z': '10th'},
- {'x': 174.5, 'y': 17.948796804, 'z': '25th'},
- {'x': 174.5, 'y': 19.506728848, 'z': '50th'},
- {'x': 174.5, 'y': 21.596202999, 'z': '75th'},
- {'x': 174.5, 'y': 23.060615524, 'z': '85th'},
- {'x': 174.5, 'y': 24.253606735, 'z': '90th'},
- {'x': 174.5, 'y': 26.450914482, 'z': '95th'},
- {'x': 174.5, 'y': 28.27268613, 'z': '97th'},
- {'x': 175.5, 'y': 15.977344323, 'z': '3th'},
- {'x': 175.5, 'y': 16.316957284, 'z': '5th'},
- {'x': 175.5, 'y': 16.887871397, 'z': '10th'},
- {'x': 175.5, 'y': 18.002252276, 'z': '25th'},
- {'x': 175.5, 'y': 19.565141532, 'z': '50th'},
- {'x': 175.5, 'y': 21.659611004, 'z': '75th'},
- {'x': 175.5, 'y': 23.126193753, 'z': '85th'},
- {'x': 175.5, 'y': 24.320030402, 'z': '90th'},
- {'x': 175.5, 'y': 26.516463208, 'z': '95th'},
- {'x': 175.5, 'y': 28.334843913, 'z': '97th'},
- {'x': 176.5, 'y': 16.023293705, 'z': '3th'},
- {'x': 176.5, 'y': 16.364269095, 'z': '5th'},
- {'x': 176.5, 'y': 16.937400535, 'z': '10th'},
- {'x': 176.5, 'y': 18.055814739, 'z': '25th'},
- {'x': 176.5, 'y': 19.623595714, 'z': '50th'},
- {'x': 176.5, 'y': 21.722936731, 'z': '75th'},
- {'x': 176.5, 'y': 23.191579959, 'z': '85th'},
- {'x': 176.5, 'y': 24.386160475, 'z': '90th'},
- {'x': 176.5, 'y': 26.581509939, 'z': '95th'},
- {'x': 176.5, 'y': 28.396316776, 'z': '97th'},
- {'x': 177.5, 'y': 16.069389698, 'z': '3th'},
- {'x': 177.5, 'y': 16.411721727, 'z': '5th'},
- {'x': 177.5, 'y': 16.987058507, 'z': '10th'},
- {'x': 177.5, 'y': 18.109474241, 'z': '25th'},
- {'x': 177.5, 'y': 19.682083101, 'z': '50th'},
- {'x': 177.5, 'y': 21.786175107, 'z': '75th'},
- {'x': 177.5, 'y': 23.256772259, 'z': '85th'},
- {'x': 177.5, 'y': 24.451998399, 'z': '90th'},
- {'x': 177.5, 'y': 26.646064342, 'z': '95th'},
- {'x': 177.5, 'y': 28.457123629, 'z': '97th'},
- {'x': 178.5, 'y': 16.115620744, 'z': '3th'},
- {'x': 178.5, 'y': 16.459303836, 'z': '5th'},
- {'x': 178.5, 'y': 17.036834365, 'z': '10th'},
- {'x': 178.5, 'y': 18.163220756, 'z': '25th'},
- {'x': 178.5, 'y': 19.740595376, 'z': '50th'},
- {'x': 178.5, 'y': 21.849321171, 'z': '75th'},
- {'x': 178.5, 'y': 23.321769021, 'z': '85th'},
- {'x': 178.5, 'y': 24.517546003, 'z': '90th'},
- {'x': 178.5, 'y': 26.71013675, 'z': '95th'},
- {'x': 178.5, 'y': 28.517284284, 'z': '97th'},
- {'x': 179.5, 'y': 16.161975197, 'z': '3th'},
- {'x': 179.5, 'y': 16.507003989, 'z': '5th'},
- {'x': 179.5, 'y': 17.086717072, 'z': '10th'},
- {'x': 179.5, 'y': 18.217044182, 'z': '25th'},
- {'x': 179.5, 'y': 19.799124201, 'z': '50th'},
- {'x': 179.5, 'y': 21.912370075, 'z': '75th'},
- {'x': 179.5, 'y': 23.386568863, 'z': '85th'},
- {'x': 179.5, 'y': 24.582805501, 'z': '90th'},
- {'x': 179.5, 'y': 26.773738166, 'z': '95th'},
- {'x': 179.5, 'y': 28.576819455, 'z': '97th'},
- {'x': 180.5, 'y': 16.208441335, 'z': '3th'},
- {'x': 180.5, 'y': 16.55481067, 'z': '5th'},
- {'x': 180.5, 'y': 17.136695505, 'z': '10th'},
- {'x': 180.5, 'y': 18.270934339, 'z': '25th'},
- {'x': 180.5, 'y': 19.857661209, 'z': '50th'},
- {'x': 180.5, 'y': 21.975317079, 'z': '75th'},
- {'x': 180.5, 'y': 23.451170652, 'z': '85th'},
- {'x': 180.5, 'y': 24.647779492, 'z': '90th'},
- {'x': 180.5, 'y': 26.83688026, 'z': '95th'},
- {'x': 180.5, 'y': 28.635750759, 'z': '97th'},
- {'x': 181.5, 'y': 16.255007353, 'z': '3th'},
- {'x': 181.5, 'y': 16.60271228, 'z': '5th'},
- {'x': 181.5, 'y': 17.186758453, 'z': '10th'},
- {'x': 181.5, 'y': 18.324880969, 'z': '25th'},
- {'x': 181.5, 'y': 19.916198004, 'z': '50th'},
- {'x': 181.5, 'y': 22.038157551, 'z': '75th'},
- {'x': 181.5, 'y': 23.515573503, 'z': '85th'},
- {'x': 181.5, 'y': 24.712470965, 'z': '90th'},
- {'x': 181.5, 'y': 26.899575372, 'z': '95th'},
- {'x': 181.5, 'y': 28.694100716, 'z': '97th'},
- {'x': 182.5, 'y': 16.301661372, 'z': '3th'},
- {'x': 182.5, 'y': 16.650697137, 'z': '5th'},
- {'x': 182.5, 'y': 17.236894617, 'z': '10th'},
- {'x': 182.5, 'y': 18.378873731, 'z': '25th'},
- {'x': 182.5, 'y': 19.974726154, 'z': '50th'},
- {'x': 182.5, 'y': 22.100886964, 'z': '75th'},
- {'x': 182.5, 'y': 23.579776782, 'z': '85th'},
- {'x': 182.5, 'y': 24.776883292, 'z': '90th'},
- {'x': 182.5, 'y': 26.961836518, 'z': '95th'},
- {'x': 182.5, 'y': 28.751892748, 'z': '97th'},
- {'x': 183.5, 'y': 16.348391441, 'z': '3th'},
- {'x': 183.5, 'y': 16.698753478, 'z': '5th'},
- {'x': 183.5, 'y': 17.287092613, 'z': '10th'},
- {'x': 183.5, 'y': 18.432902201, 'z': '25th'},
- {'x': 183.5, 'y': 20.033237194, 'z': '50th'},
- {'x': 183.5, 'y': 22.163500892, 'z': '75th'},
- {'x': 183.5, 'y': 23.6437801, 'z': '85th'},
- {'x': 183.5, 'y': 24.841020237, 'z': '90th'},
- {'x': 183.5, 'y': 27.023677386, 'z': '95th'},
- {'x': 183.5, 'y': 28.809151183, 'z': '97th'},
- {'x': 184.5, 'y': 16.395185538, 'z': '3th'},
- {'x': 184.5, 'y': 16.746869466, 'z': '5th'},
- {'x': 184.5, 'y': 17.337340967, 'z': '10th'},
- {'x': 184.5, 'y': 18.486955869, 'z': '25th'},
- {'x': 184.5, 'y': 20.091722615, 'z': '50th'},
- {'x': 184.5, 'y': 22.225995012, 'z': '75th'},
- {'x': 184.5, 'y': 23.707583317, 'z': '85th'},
- {'x': 184.5, 'y': 24.904885952, 'z': '90th'},
- {'x': 184.5, 'y': 27.085112342, 'z': '95th'},
- {'x': 184.5, 'y': 28.86590125, 'z': '97th'},
- {'x': 185.5, 'y': 16.442031574, 'z': '3th'},
- {'x': 185.5, 'y': 16.795033183, 'z': '5th'},
- {'x': 185.5, 'y': 17.387628119, 'z': '10th'},
- {'x': 185.5, 'y': 18.541024138, 'z': '25th'},
- {'x': 185.5, 'y': 20.15017387, 'z': '50th'},
- {'x': 185.5, 'y': 22.288365099, 'z': '75th'},
- {'x': 185.5, 'y': 23.771186541, 'z': '85th'},
- {'x': 185.5, 'y': 24.96848498, 'z': '90th'},
- {'x': 185.5, 'y': 27.146156433, 'z': '95th'},
- {'x': 185.5, 'y': 28.922169082, 'z': '97th'},
- {'x': 186.5, 'y': 16.488917395, 'z': '3th'},
- {'x': 186.5, 'y': 16.843232639, 'z': '5th'},
- {'x': 186.5, 'y': 17.437942424, 'z': '10th'},
- {'x': 186.5, 'y': 18.595096322, 'z': '25th'},
- {'x': 186.5, 'y': 20.208582361, 'z': '50th'},
- {'x': 186.5, 'y': 22.350607027, 'z': '75th'},
- {'x': 186.5, 'y': 23.834590127, 'z': '85th'},
- {'x': 186.5, 'y': 25.031822258, 'z': '90th'},
- {'x': 186.5, 'y': 27.206825382, 'z': '95th'},
- {'x': 186.5, 'y': 28.977981716, 'z': '97th'},
- {'x': 187.5, 'y': 16.535830787, 'z': '3th'},
- {'x': 187.5, 'y': 16.891455767, 'z': '5th'},
- {'x': 187.5, 'y': 17.488272148, 'z': '10th'},
- {'x': 187.5, 'y': 18.649161641, 'z': '25th'},
- {'x': 187.5, 'y': 20.266939444, 'z': '50th'},
- {'x': 187.5, 'y': 22.412716764, 'z': '75th'},
- {'x': 187.5, 'y': 23.897794676, 'z': '85th'},
- {'x': 187.5, 'y': 25.094903112, 'z': '90th'},
- {'x': 187.5, 'y': 27.267135598, 'z': '95th'},
- {'x': 187.5, 'y': 29.033367089, 'z': '97th'},
- {'x': 188.5, 'y': 16.582759472, 'z': '3th'},
- {'x': 188.5, 'y': 16.939690432, 'z': '5th'},
- {'x': 188.5, 'y': 17.538605469, 'z': '10th'},
- {'x': 188.5, 'y': 18.703209223, 'z': '25th'},
- {'x': 188.5, 'y': 20.325236424, 'z': '50th'},
- {'x': 188.5, 'y': 22.474690373, 'z': '75th'},
- {'x': 188.5, 'y': 23.960801041, 'z': '85th'},
- {'x': 188.5, 'y': 25.157733267, 'z': '90th'},
- {'x': 188.5, 'y': 27.327104173, 'z': '95th'},
- {'x': 188.5, 'y': 29.088354044, 'z': '97th'},
- {'x': 189.5, 'y': 16.62969112, 'z': '3th'},
- {'x': 189.5, 'y': 16.987924425, 'z': '5th'},
- {'x': 189.5, 'y': 17.588930479, 'z': '10th'},
- {'x': 189.5, 'y': 18.757228099, 'z': '25th'},
- {'x': 189.5, 'y': 20.383464548, 'z': '50th'},
- {'x': 189.5, 'y': 22.53652401, 'z': '75th'},
- {'x': 189.5, 'y': 24.023610321, 'z': '85th'},
- {'x': 189.5, 'y': 25.220318842, 'z': '90th'},
- {'x': 189.5, 'y': 27.386748884, 'z': '95th'},
- {'x': 189.5, 'y': 29.142972321, 'z': '97th'},
- {'x': 190.5, 'y': 16.67661334, 'z': '3th'},
- {'x': 190.5, 'y': 17.036145468, 'z': '5th'},
- {'x': 190.5, 'y': 17.639235182, 'z': '10th'},
- {'x': 190.5, 'y': 18.811207202, 'z': '25th'},
- {'x': 190.5, 'y': 20.441615008, 'z': '50th'},
- {'x': 190.5, 'y': 22.598213923, 'z': '75th'},
- {'x': 190.5, 'y': 24.086223863, 'z': '85th'},
- {'x': 190.5, 'y': 25.282666355, 'z': '90th'},
- {'x': 190.5, 'y': 27.446088197, 'z': '95th'},
- {'x': 190.5, 'y': 29.197252563, 'z': '97th'},
- {'x': 191.5, 'y': 16.723513693, 'z': '3th'},
- {'x': 191.5, 'y': 17.084341215, 'z': '5th'},
- {'x': 191.5, 'y': 17.689507494, 'z': '10th'},
- {'x': 191.5, 'y': 18.865135365, 'z': '25th'},
- {'x': 191.5, 'y': 20.499678935, 'z': '50th'},
- {'x': 191.5, 'y': 22.659756452, 'z': '75th'},
- {'x': 191.5, 'y': 24.148643267, 'z': '85th'},
- {'x': 191.5, 'y': 25.344782724, 'z': '90th'},
- {'x': 191.5, 'y': 27.505141264, 'z': '95th'},
- {'x': 191.5, 'y': 29.251226312, 'z': '97th'},
- {'x': 192.5, 'y': 16.770379686, 'z': '3th'},
- {'x': 192.5, 'y': 17.132499251, 'z': '5th'},
- {'x': 192.5, 'y': 17.73973524, 'z': '10th'},
- {'x': 192.5, 'y': 18.919001316, 'z': '25th'},
- {'x': 192.5, 'y': 20.557647399, 'z': '50th'},
- {'x': 192.5, 'y': 22.721148026, 'z': '75th'},
- {'x': 192.5, 'y': 24.21087038, 'z': '85th'},
- {'x': 192.5, 'y': 25.406675267, 'z': '90th'},
- {'x': 192.5, 'y': 27.563927929, 'z': '95th'},
- {'x': 192.5, 'y': 29.304926008, 'z': '97th'},
- {'x': 193.5, 'y': 16.817198778, 'z': '3th'},
- {'x': 193.5, 'y': 17.180607093, 'z': '5th'},
- {'x': 193.5, 'y': 17.789906158, 'z': '10th'},
- {'x': 193.5, 'y': 18.972793682, 'z': '25th'},
- {'x': 193.5, 'y': 20.615511404, 'z': '50th'},
- {'x': 193.5, 'y': 22.782385166, 'z': '75th'},
- {'x': 193.5, 'y': 24.272907303, 'z': '85th'},
- {'x': 193.5, 'y': 25.468351706, 'z': '90th'},
- {'x': 193.5, 'y': 27.622468728, 'z': '95th'},
- {'x': 193.5, 'y': 29.358384987, 'z': '97th'},
- {'x': 194.5, 'y': 16.863958377, 'z': '3th'},
- {'x': 194.5, 'y': 17.228652193, 'z': '5th'},
- {'x': 194.5, 'y': 17.840007896, 'z': '10th'},
- {'x': 194.5, 'y': 19.026500982, 'z': '25th'},
- {'x': 194.5, 'y': 20.673261889, 'z': '50th'},
- {'x': 194.5, 'y': 22.843464482, 'z': '75th'},
- {'x': 194.5, 'y': 24.334756391, 'z': '85th'},
- {'x': 194.5, 'y': 25.529820168, 'z': '90th'},
- {'x': 194.5, 'y': 27.680784887, 'z': '95th'},
- {'x': 194.5, 'y': 29.411637482, 'z': '97th'},
- {'x': 195.5, 'y': 16.910646682, 'z': '3th'},
- {'x': 195.5, 'y': 17.276622589, 'z': '5th'},
- {'x': 195.5, 'y': 17.890028371, 'z': '10th'},
- {'x': 195.5, 'y': 19.080111485, 'z': '25th'},
- {'x': 195.5, 'y': 20.730889051, 'z': '50th'},
- {'x': 195.5, 'y': 22.904381668, 'z': '75th'},
- {'x': 195.5, 'y': 24.396419305, 'z': '85th'},
- {'x': 195.5, 'y': 25.591088482, 'z': '90th'},
- {'x': 195.5, 'y': 27.738898541, 'z': '95th'},
- {'x': 195.5, 'y': 29.464720074, 'z': '97th'},
- {'x': 196.5, 'y': 16.957249256, 'z': '3th'},
- {'x': 196.5, 'y': 17.324504231, 'z': '5th'},
- {'x': 196.5, 'y': 17.939954292, 'z': '10th'},
- {'x': 196.5, 'y': 19.133613789, 'z': '25th'},
- {'x': 196.5, 'y': 20.788385102, 'z': '50th'},
- {'x': 196.5, 'y': 22.965135628, 'z': '75th'},
- {'x': 196.5, 'y': 24.457900896, 'z': '85th'},
- {'x': 196.5, 'y': 25.652167072, 'z': '90th'},
- {'x': 196.5, 'y': 27.796831854, 'z': '95th'},
- {'x': 196.5, 'y': 29.517665722, 'z': '97th'},
- {'x': 197.5, 'y': 17.003754296, 'z': '3th'},
- {'x': 197.5, 'y': 17.372285093, 'z': '5th'},
- {'x': 197.5, 'y': 17.989773433, 'z': '10th'},
- {'x': 197.5, 'y': 19.186995929, 'z': '25th'},
- {'x': 197.5, 'y': 20.845740029, 'z': '50th'},
- {'x': 197.5, 'y': 23.025722128, 'z': '75th'},
- {'x': 197.5, 'y': 24.519203235, 'z': '85th'},
- {'x': 197.5, 'y': 25.713064507, 'z': '90th'},
- {'x': 197.5, 'y': 27.854608369, 'z': '95th'},
- {'x': 197.5, 'y': 29.570512949, 'z': '97th'},
- {'x': 198.5, 'y': 17.050149023, 'z': '3th'},
- {'x': 198.5, 'y': 17.41995236, 'z': '5th'},
- {'x': 198.5, 'y': 18.039473074, 'z': '10th'},
- {'x': 198.5, 'y': 19.240245984, 'z': '25th'},
- {'x': 198.5, 'y': 20.902944494, 'z': '50th'},
- {'x': 198.5, 'y': 23.086138147, 'z': '75th'},
- {'x': 198.5, 'y': 24.580329706, 'z': '85th'},
- {'x': 198.5, 'y': 25.773790554, 'z': '90th'},
- {'x': 198.5, 'y': 27.912252088, 'z': '95th'},
- {'x': 198.5, 'y': 29.623299547, 'z': '97th'},
- {'x': 199.5, 'y': 17.096420616, 'z': '3th'},
- {'x': 199.5, 'y': 17.46749315, 'z': '5th'},
- {'x': 199.5, 'y': 18.089040401, 'z': '10th'},
- {'x': 199.5, 'y': 19.293351918, 'z': '25th'},
- {'x': 199.5, 'y': 20.959989088, 'z': '50th'},
- {'x': 199.5, 'y': 23.146380755, 'z': '75th'},
- {'x': 199.5, 'y': 24.641283953, 'z': '85th'},
- {'x': 199.5, 'y': 25.834355394, 'z': '90th'},
- {'x': 199.5, 'y': 27.969787706, 'z': '95th'},
- {'x': 199.5, 'y': 29.676064193, 'z': '97th'},
- {'x': 200.5, 'y': 17.142556204, 'z': '3th'},
- {'x': 200.5, 'y': 17.514894512, 'z': '5th'},
- {'x': 200.5, 'y': 18.138462504, 'z': '10th'},
- {'x': 200.5, 'y': 19.346301583, 'z': '25th'},
- {'x': 200.5, 'y': 21.01686433, 'z': '50th'},
- {'x': 200.5, 'y': 23.206447122, 'z': '75th'},
- {'x': 200.5, 'y': 24.702069886, 'z': '85th'},
- {'x': 200.5, 'y': 25.894769625, 'z': '90th'},
- {'x': 200.5, 'y': 28.027240611, 'z': '95th'},
- {'x': 200.5, 'y': 29.728846443, 'z': '97th'},
- {'x': 201.5, 'y': 17.188542869, 'z': '3th'},
- {'x': 201.5, 'y': 17.562143423, 'z': '5th'},
- {'x': 201.5, 'y': 18.187726378, 'z': '10th'},
- {'x': 201.5, 'y': 19.399082715, 'z': '25th'},
- {'x': 201.5, 'y': 21.073560674, 'z': '50th'},
- {'x': 201.5, 'y': 23.266334514, 'z': '75th'},
- {'x': 201.5, 'y': 24.76269168, 'z': '85th'},
- {'x': 201.5, 'y': 25.955044263, 'z': '90th'},
- {'x': 201.5, 'y': 28.084636885, 'z': '95th'},
- {'x': 201.5, 'y': 29.781686736, 'z': '97th'},
- {'x': 202.5, 'y': 17.234367642, 'z': '3th'},
- {'x': 202.5, 'y': 17.609226793, 'z': '5th'},
- {'x': 202.5, 'y': 18.236818921, 'z': '10th'},
- {'x': 202.5, 'y': 19.451682936, 'z': '25th'},
- {'x': 202.5, 'y': 21.130068501, 'z': '50th'},
- {'x': 202.5, 'y': 23.326040301, 'z': '75th'},
- {'x': 202.5, 'y': 24.823153782, 'z': '85th'},
- {'x': 202.5, 'y': 26.015190744, 'z': '90th'},
- {'x': 202.5, 'y': 28.1420033, 'z': '95th'},
- {'x': 202.5, 'y': 29.834626382, 'z': '97th'},
- {'x': 203.5, 'y': 17.280017501, 'z': '3th'},
- {'x': 203.5, 'y': 17.656131455, 'z': '5th'},
- {'x': 203.5, 'y': 18.28572693, 'z': '10th'},
- {'x': 203.5, 'y': 19.504089753, 'z': '25th'},
- {'x': 203.5, 'y': 21.186378131, 'z': '50th'},
- {'x': 203.5, 'y': 23.385561957, 'z': '75th'},
- {'x': 203.5, 'y': 24.883460908, 'z': '85th'},
- {'x': 203.5, 'y': 26.075220925, 'z': '90th'},
- {'x': 203.5, 'y': 28.199367319, 'z': '95th'},
- {'x': 203.5, 'y': 29.887707567, 'z': '97th'},
- {'x': 204.5, 'y': 17.325479371, 'z': '3th'},
- {'x': 204.5, 'y': 17.702844168, 'z': '5th'},
- {'x': 204.5, 'y': 18.334437103, 'z': '10th'},
- {'x': 204.5, 'y': 19.556290562, 'z': '25th'},
- {'x': 204.5, 'y': 21.242479819, 'z': '50th'},
- {'x': 204.5, 'y': 23.444897063, 'z': '75th'},
- {'x': 204.5, 'y': 24.943618051, 'z': '85th'},
- {'x': 204.5, 'y': 26.135147086, 'z': '90th'},
- {'x': 204.5, 'y': 28.256757094, 'z': '95th'},
- {'x': 204.5, 'y': 29.940973346, 'z': '97th'},
- {'x': 205.5, 'y': 17.370740117, 'z': '3th'},
- {'x': 205.5, 'y': 17.749351612, 'z': '5th'},
- {'x': 205.5, 'y': 18.382936039, 'z': '10th'},
- {'x': 205.5, 'y': 19.608272642, 'z': '25th'},
- {'x': 205.5, 'y': 21.298363759, 'z': '50th'},
- {'x': 205.5, 'y': 23.504043317, 'z': '75th'},
- {'x': 205.5, 'y': 25.003630482, 'z': '85th'},
- {'x': 205.5, 'y': 26.194981933, 'z': '90th'},
- {'x': 205.5, 'y': 28.314201462, 'z': '95th'},
- {'x': 205.5, 'y': 29.994467636, 'z': '97th'},
- {'x': 206.5, 'y': 17.415786538, 'z': '3th'},
- {'x': 206.5, 'y': 17.795640388, 'z': '5th'},
- {'x': 206.5, 'y': 18.431210231, 'z': '10th'},
- {'x': 206.5, 'y': 19.660023163, 'z': '25th'},
- {'x': 206.5, 'y': 21.354020094, 'z': '50th'},
- {'x': 206.5, 'y': 23.562998531, 'z': '75th'},
- {'x': 206.5, 'y': 25.063503754, 'z': '85th'},
- {'x': 206.5, 'y': 26.254738597, 'z': '90th'},
- {'x': 206.5, 'y': 28.371729945, 'z': '95th'},
- {'x': 206.5, 'y': 30.048235218, 'z': '97th'},
- {'x': 207.5, 'y': 17.46060537, 'z': '3th'},
- {'x': 207.5, 'y': 17.841697008, 'z': '5th'},
- {'x': 207.5, 'y': 18.47924607, 'z': '10th'},
- {'x': 207.5, 'y': 19.711529188, 'z': '25th'},
- {'x': 207.5, 'y': 21.409438911, 'z': '50th'},
- {'x': 207.5, 'y': 23.621760642, 'z': '75th'},
- {'x': 207.5, 'y': 25.123243703, 'z': '85th'},
- {'x': 207.5, 'y': 26.314430634, 'z': '90th'},
- {'x': 207.5, 'y': 28.429372744, 'z': '95th'},
- {'x': 207.5, 'y': 30.102321732, 'z': '97th'},
- {'x': 208.5, 'y': 17.505183272, 'z': '3th'},
- {'x': 208.5, 'y': 17.8875079, 'z': '5th'},
- {'x': 208.5, 'y': 18.527029841, 'z': '10th'},
- {'x': 208.5, 'y': 19.762777669, 'z': '25th'},
- {'x': 208.5, 'y': 21.464610257, 'z': '50th'},
- {'x': 208.5, 'y': 23.680327713, 'z': '75th'},
- {'x': 208.5, 'y': 25.182856454, 'z': '85th'},
- {'x': 208.5, 'y': 26.37407203, 'z': '90th'},
- {'x': 208.5, 'y': 28.487160738, 'z': '95th'},
- {'x': 208.5, 'y': 30.156773669, 'z': '97th'},
- {'x': 209.5, 'y': 17.549506825, 'z': '3th'},
- {'x': 209.5, 'y': 17.933059395, 'z': '5th'},
- {'x': 209.5, 'y': 18.574547721, 'z': '10th'},
- {'x': 209.5, 'y': 19.813755456, 'z': '25th'},
- {'x': 209.5, 'y': 21.519524136, 'z': '50th'},
- {'x': 209.5, 'y': 23.738697944, 'z': '75th'},
- {'x': 209.5, 'y': 25.242348423, 'z': '85th'},
- {'x': 209.5, 'y': 26.433677198, 'z': '90th'},
- {'x': 209.5, 'y': 28.545125479, 'z': '95th'},
- {'x': 209.5, 'y': 30.211638371, 'z': '97th'},
- {'x': 210.5, 'y': 17.593562522, 'z': '3th'},
- {'x': 210.5, 'y': 17.978337728, 'z': '5th'},
- {'x': 210.5, 'y': 18.62178578, 'z': '10th'},
- {'x': 210.5, 'y': 19.864449301, 'z': '25th'},
- {'x': 210.5, 'y': 21.574170525, 'z': '50th'},
- {'x': 210.5, 'y': 23.796869674, 'z': '75th'},
- {'x': 210.5, 'y': 25.301726323, 'z': '85th'},
- {'x': 210.5, 'y': 26.49326098, 'z': '90th'},
- {'x': 210.5, 'y': 28.60329919, 'z': '95th'},
- {'x': 210.5, 'y': 30.266964025, 'z': '97th'},
- {'x': 211.5, 'y': 17.637336764, 'z': '3th'},
- {'x': 211.5, 'y': 18.023329032, 'z': '5th'},
- {'x': 211.5, 'y': 18.668729979, 'z': '10th'},
- {'x': 211.5, 'y': 19.914845857, 'z': '25th'},
- {'x': 211.5, 'y': 21.628539373, 'z': '50th'},
- {'x': 211.5, 'y': 23.854841392, 'z': '75th'},
- {'x': 211.5, 'y': 25.360997164, 'z': '85th'},
- {'x': 211.5, 'y': 26.552838649, 'z': '90th'},
- {'x': 211.5, 'y': 28.661714756, 'z': '95th'},
- {'x': 211.5, 'y': 30.322799658, 'z': '97th'},
- {'x': 212.5, 'y': 17.680815846, 'z': '3th'},
- {'x': 212.5, 'y': 18.068019329, 'z': '5th'},
- {'x': 212.5, 'y': 18.715366166, 'z': '10th'},
- {'x': 212.5, 'y': 19.964931686, 'z': '25th'},
- {'x': 212.5, 'y': 21.682620618, 'z': '50th'},
- {'x': 212.5, 'y': 23.912611742, 'z': '75th'},
- {'x': 212.5, 'y': 25.42016826, 'z': '85th'},
- {'x': 212.5, 'y': 26.612425903, 'z': '90th'},
- {'x': 212.5, 'y': 28.720405723, 'z': '95th'},
- {'x': 212.5, 'y': 30.379195135, 'z': '97th'},
- {'x': 213.5, 'y': 17.723985953, 'z': '3th'},
- {'x': 213.5, 'y': 18.112394528, 'z': '5th'},
- {'x': 213.5, 'y': 18.761680078, 'z': '10th'},
- {'x': 213.5, 'y': 20.014693265, 'z': '25th'},
- {'x': 213.5, 'y': 21.736404191, 'z': '50th'},
- {'x': 213.5, 'y': 23.97017953, 'z': '75th'},
- {'x': 213.5, 'y': 25.479247229, 'z': '85th'},
- {'x': 213.5, 'y': 26.672038872, 'z': '90th'},
- {'x': 213.5, 'y': 28.779406289, 'z': '95th'},
- {'x': 213.5, 'y': 30.436201152, 'z': '97th'},
- {'x': 214.5, 'y': 17.766833147, 'z': '3th'},
- {'x': 214.5, 'y': 18.156440415, 'z': '5th'},
- {'x': 214.5, 'y': 18.807657336, 'z': '10th'},
- {'x': 214.5, 'y': 20.064116992, 'z': '25th'},
- {'x': 214.5, 'y': 21.789880029, 'z': '50th'},
- {'x': 214.5, 'y': 24.027543736, 'z': '75th'},
- {'x': 214.5, 'y': 25.538242002, 'z': '85th'},
- {'x': 214.5, 'y': 26.731694113, 'z': '90th'},
- {'x': 214.5, 'y': 28.838751302, 'z': '95th'},
- {'x': 214.5, 'y': 30.493869233, 'z': '97th'},
- {'x': 215.5, 'y': 17.809343234, 'z': '3th'},
- {'x': 215.5, 'y': 18.200142556, 'z': '5th'},
- {'x': 215.5, 'y': 18.853283398, 'z': '10th'},
- {'x': 215.5, 'y': 20.113189213, 'z': '25th'},
- {'x': 215.5, 'y': 21.843038191, 'z': '50th'},
- {'x': 215.5, 'y': 24.084703667, 'z': '75th'},
- {'x': 215.5, 'y': 25.597160953, 'z': '85th'},
- {'x': 215.5, 'y': 26.791408705, 'z': '90th'},
- {'x': 215.5, 'y': 28.898476211, 'z': '95th'},
- {'x': 215.5, 'y': 30.552251518, 'z': '97th'},
- {'x': 216.5, 'y': 17.851502186, 'z': '3th'},
- {'x': 216.5, 'y': 18.243486617, 'z': '5th'},
- {'x': 216.5, 'y': 18.898543729, 'z': '10th'},
- {'x': 216.5, 'y': 20.161896146, 'z': '25th'},
- {'x': 216.5, 'y': 21.895868501, 'z': '50th'},
- {'x': 216.5, 'y': 24.141658453, 'z': '75th'},
- {'x': 216.5, 'y': 25.656012444, 'z': '85th'},
- {'x': 216.5, 'y': 26.851199913, 'z': '90th'},
- {'x': 216.5, 'y': 28.958617197, 'z': '95th'},
- {'x': 216.5, 'y': 30.611401484, 'z': '97th'},
- {'x': 217.5, 'y': 17.893294718, 'z': '3th'},
- {'x': 217.5, 'y': 18.286457268, 'z': '5th'},
- {'x': 217.5, 'y': 18.943423209, 'z': '10th'},
- {'x': 217.5, 'y': 20.210224137, 'z': '25th'},
- {'x': 217.5, 'y': 21.948361684, 'z': '50th'},
- {'x': 217.5, 'y': 24.198408662, 'z': '75th'},
- {'x': 217.5, 'y': 25.714806292, 'z': '85th'},
- {'x': 217.5, 'y': 26.911086259, 'z': '90th'},
- {'x': 217.5, 'y': 29.019210796, 'z': '95th'},
- {'x': 217.5, 'y': 30.671371759, 'z': '97th'},
- {'x': 218.5, 'y': 17.934708987, 'z': '3th'},
- {'x': 218.5, 'y': 18.329041829, 'z': '5th'},
- {'x': 218.5, 'y': 18.98790813, 'z': '10th'},
- {'x': 218.5, 'y': 20.258158849, 'z': '25th'},
- {'x': 218.5, 'y': 22.00050569, 'z': '50th'},
- {'x': 218.5, 'y': 24.254950982, 'z': '75th'},
- {'x': 218.5, 'y': 25.773548883, 'z': '85th'},
- {'x': 218.5, 'y': 26.971083943, 'z': '90th'},
- {'x': 218.5, 'y': 29.080295026, 'z': '95th'},
- {'x': 218.5, 'y': 30.732221216, 'z': '97th'},
- {'x': 219.5, 'y': 17.975728091, 'z': '3th'},
- {'x': 219.5, 'y': 18.371223685, 'z': '5th'},
- {'x': 219.5, 'y': 19.031982616, 'z': '10th'},
- {'x': 219.5, 'y': 20.305686799, 'z': '25th'},
- {'x': 219.5, 'y': 22.052292423, 'z': '50th'},
- {'x': 219.5, 'y': 24.311287915, 'z': '75th'},
- {'x': 219.5, 'y': 25.832252068, 'z': '85th'},
- {'x': 219.5, 'y': 27.031213333, 'z': '90th'},
- {'x': 219.5, 'y': 29.141907344, 'z': '95th'},
- {'x': 219.5, 'y': 30.794002112, 'z': '97th'},
- {'x': 220.5, 'y': 18.01633608, 'z': '3th'},
- {'x': 220.5, 'y': 18.412986957, 'z': '5th'},
- {'x': 220.5, 'y': 19.07563119, 'z': '10th'},
- {'x': 220.5, 'y': 20.352794329, 'z': '25th'},
- {'x': 220.5, 'y': 22.103713048, 'z': '50th'},
- {'x': 220.5, 'y': 24.367420965, 'z': '75th'},
- {'x': 220.5, 'y': 25.890926872, 'z': '85th'},
- {'x': 220.5, 'y': 27.091494342, 'z': '90th'},
- {'x': 220.5, 'y': 29.204085991, 'z': '95th'},
- {'x': 220.5, 'y': 30.856769055, 'z': '97th'},
- {'x': 221.5, 'y': 18.056519892, 'z': '3th'},
- {'x': 221.5, 'y': 18.454317938, 'z': '5th'},
- {'x': 221.5, 'y': 19.118839426, 'z': '10th'},
- {'x': 221.5, 'y': 20.399466948, 'z': '25th'},
- {'x': 221.5, 'y': 22.154756029, 'z': '50th'},
- {'x': 221.5, 'y': 24.42334799, 'z': '75th'},
- {'x': 221.5, 'y': 25.949581158, 'z': '85th'},
- {'x': 221.5, 'y': 27.151944818, 'z': '90th'},
- {'x': 221.5, 'y': 29.266870788, 'z': '95th'},
- {'x': 221.5, 'y': 30.920582776, 'z': '97th'},
- {'x': 222.5, 'y': 18.09626344, 'z': '3th'},
- {'x': 222.5, 'y': 18.495200616, 'z': '5th'},
- {'x': 222.5, 'y': 19.161591719, 'z': '10th'},
- {'x': 222.5, 'y': 20.445690891, 'z': '25th'},
- {'x': 222.5, 'y': 22.205412485, 'z': '50th'},
- {'x': 222.5, 'y': 24.479070625, 'z': '75th'},
- {'x': 222.5, 'y': 26.008226305, 'z': '85th'},
- {'x': 222.5, 'y': 27.212585282, 'z': '90th'},
- {'x': 222.5, 'y': 29.330301268, 'z': '95th'},
- {'x': 222.5, 'y': 30.985499998, 'z': '97th'},
- {'x': 223.5, 'y': 18.135551117, 'z': '3th'},
- {'x': 223.5, 'y': 18.535619323, 'z': '5th'},
- {'x': 223.5, 'y': 19.203872602, 'z': '10th'},
- {'x': 223.5, 'y': 20.491452188, 'z': '25th'},
- {'x': 223.5, 'y': 22.255673, 'z': '50th'},
- {'x': 223.5, 'y': 24.534589849, 'z': '75th'},
- {'x': 223.5, 'y': 26.066873207, 'z': '85th'},
- {'x': 223.5, 'y': 27.273436078, 'z': '90th'},
- {'x': 223.5, 'y': 29.394417774, 'z': '95th'},
- {'x': 223.5, 'y': 31.051579489, 'z': '97th'},
- {'x': 224.5, 'y': 18.174367057, 'z': '3th'},
- {'x': 224.5, 'y': 18.575558186, 'z': '5th'},
- {'x': 224.5, 'y': 19.245666485, 'z': '10th'},
- {'x': 224.5, 'y': 20.536736874, 'z': '25th'},
- {'x': 224.5, 'y': 22.305528306, 'z': '50th'},
- {'x': 224.5, 'y': 24.589906919, 'z': '75th'},
- {'x': 224.5, 'y': 26.125533104, 'z': '85th'},
- {'x': 224.5, 'y': 27.334517958, 'z': '90th'},
- {'x': 224.5, 'y': 29.459261215, 'z': '95th'},
- {'x': 224.5, 'y': 31.118880803, 'z': '97th'},
- {'x': 225.5, 'y': 18.212695116, 'z': '3th'},
- {'x': 225.5, 'y': 18.615001112, 'z': '5th'},
- {'x': 225.5, 'y': 19.286957644, 'z': '10th'},
- {'x': 225.5, 'y': 20.581531003, 'z': '25th'},
- {'x': 225.5, 'y': 22.354969299, 'z': '50th'},
- {'x': 225.5, 'y': 24.645023377, 'z': '75th'},
- {'x': 225.5, 'y': 26.184217589, 'z': '85th'},
- {'x': 225.5, 'y': 27.395852082, 'z': '90th'},
- {'x': 225.5, 'y': 29.524873058, 'z': '95th'},
- {'x': 225.5, 'y': 31.187464273, 'z': '97th'},
- {'x': 226.5, 'y': 18.250518862, 'z': '3th'},
- {'x': 226.5, 'y': 18.653931783, 'z': '5th'},
- {'x': 226.5, 'y': 19.327730231, 'z': '10th'},
- {'x': 226.5, 'y': 20.625820657, 'z': '25th'},
- {'x': 226.5, 'y': 22.403987057, 'z': '50th'},
- {'x': 226.5, 'y': 24.699941066, 'z': '75th'},
- {'x': 226.5, 'y': 26.242938608, 'z': '85th'},
- {'x': 226.5, 'y': 27.457460009, 'z': '90th'},
- {'x': 226.5, 'y': 29.591295323, 'z': '95th'},
- {'x': 226.5, 'y': 31.257391016, 'z': '97th'},
- {'x': 227.5, 'y': 18.287822536, 'z': '3th'},
- {'x': 227.5, 'y': 18.692334366, 'z': '5th'},
- {'x': 227.5, 'y': 19.367968582, 'z': '10th'},
- {'x': 227.5, 'y': 20.669591593, 'z': '25th'},
- {'x': 227.5, 'y': 22.452571818, 'z': '50th'},
- {'x': 227.5, 'y': 24.754660754, 'z': '75th'},
- {'x': 227.5, 'y': 26.301707228, 'z': '85th'},
- {'x': 227.5, 'y': 27.519362828, 'z': '90th'},
- {'x': 227.5, 'y': 29.658570912, 'z': '95th'},
- {'x': 227.5, 'y': 31.328724775, 'z': '97th'},
- {'x': 228.5, 'y': 18.3245866, 'z': '3th'},
- {'x': 228.5, 'y': 18.730190245, 'z': '5th'},
- {'x': 228.5, 'y': 19.407655808, 'z': '10th'},
- {'x': 228.5, 'y': 20.712830948, 'z': '25th'},
- {'x': 228.5, 'y': 22.500717781, 'z': '50th'},
- {'x': 228.5, 'y': 24.809188521, 'z': '75th'},
- {'x': 228.5, 'y': 26.360539323, 'z': '85th'},
- {'x': 228.5, 'y': 27.581585159, 'z': '90th'},
- {'x': 228.5, 'y': 29.726742037, 'z': '95th'},
- {'x': 228.5, 'y': 31.401523441, 'z': '97th'},
- {'x': 229.5, 'y': 18.360795645, 'z': '3th'},
- {'x': 229.5, 'y': 18.767483802, 'z': '5th'},
- {'x': 229.5, 'y': 19.446776244, 'z': '10th'},
- {'x': 229.5, 'y': 20.755524086, 'z': '25th'},
- {'x': 229.5, 'y': 22.548414372, 'z': '50th'},
- {'x': 229.5, 'y': 24.863524151, 'z': '75th'},
- {'x': 229.5, 'y': 26.419445233, 'z': '85th'},
- {'x': 229.5, 'y': 27.644147851, 'z': '90th'},
- {'x': 229.5, 'y': 29.79585303, 'z': '95th'},
- {'x': 229.5, 'y': 31.475854413, 'z': '97th'},
- {'x': 230.5, 'y': 18.396431373, 'z': '3th'},
- {'x': 230.5, 'y': 18.804197322, 'z': '5th'},
- {'x': 230.5, 'y': 19.485313359, 'z': '10th'},
- {'x': 230.5, 'y': 20.797657557, 'z': '25th'},
- {'x': 230.5, 'y': 22.595654215, 'z': '50th'},
- {'x': 230.5, 'y': 24.917671662, 'z': '75th'},
- {'x': 230.5, 'y': 26.478439122, 'z': '85th'},
- {'x': 230.5, 'y': 27.707074586, 'z': '90th'},
- {'x': 230.5, 'y': 29.865947819, 'z': '95th'},
- {'x': 230.5, 'y': 31.55178078, 'z': '97th'},
- {'x': 231.5, 'y': 18.431475639, 'z': '3th'},
- {'x': 231.5, 'y': 18.840313184, 'z': '5th'},
- {'x': 231.5, 'y': 19.523250621, 'z': '10th'},
- {'x': 231.5, 'y': 20.839217729, 'z': '25th'},
- {'x': 231.5, 'y': 22.642429557, 'z': '50th'},
- {'x': 231.5, 'y': 24.971634592, 'z': '75th'},
- {'x': 231.5, 'y': 26.537534783, 'z': '85th'},
- {'x': 231.5, 'y': 27.770388909, 'z': '90th'},
- {'x': 231.5, 'y': 29.93707103, 'z': '95th'},
- {'x': 231.5, 'y': 31.629367479, 'z': '97th'},
- {'x': 232.5, 'y': 18.465909907, 'z': '3th'},
- {'x': 232.5, 'y': 18.875813476, 'z': '5th'},
- {'x': 232.5, 'y': 19.560571356, 'z': '10th'},
- {'x': 232.5, 'y': 20.88019106, 'z': '25th'},
- {'x': 232.5, 'y': 22.688732921, 'z': '50th'},
- {'x': 232.5, 'y': 25.025416852, 'z': '75th'},
- {'x': 232.5, 'y': 26.596746393, 'z': '85th'},
- {'x': 232.5, 'y': 27.834114754, 'z': '90th'},
- {'x': 232.5, 'y': 30.009267783, 'z': '95th'},
- {'x': 232.5, 'y': 31.708680201, 'z': '97th'},
- {'x': 233.5, 'y': 18.499715238, 'z': '3th'},
- {'x': 233.5, 'y': 18.910679987, 'z': '5th'},
- {'x': 233.5, 'y': 19.597258745, 'z': '10th'},
- {'x': 233.5, 'y': 20.920564098, 'z': '25th'},
- {'x': 233.5, 'y': 22.734557126, 'z': '50th'},
- {'x': 233.5, 'y': 25.079022735, 'z': '75th'},
- {'x': 233.5, 'y': 26.656088513, 'z': '85th'},
- {'x': 233.5, 'y': 27.898276446, 'z': '90th'},
- {'x': 233.5, 'y': 30.082583688, 'z': '95th'},
- {'x': 233.5, 'y': 31.789785392, 'z': '97th'},
- {'x': 234.5, 'y': 18.532872277, 'z': '3th'},
- {'x': 234.5, 'y': 18.944894195, 'z': '5th'},
- {'x': 234.5, 'y': 19.633295823, 'z': '10th'},
- {'x': 234.5, 'y': 20.960323489, 'z': '25th'},
- {'x': 234.5, 'y': 22.779895295, 'z': '50th'},
- {'x': 234.5, 'y': 25.132456931, 'z': '75th'},
- {'x': 234.5, 'y': 26.715576094, 'z': '85th'},
- {'x': 234.5, 'y': 27.962898694, 'z': '90th'},
- {'x': 234.5, 'y': 30.157064835, 'z': '95th'},
- {'x': 234.5, 'y': 31.872750249, 'z': '97th'},
- {'x': 235.5, 'y': 18.565361241, 'z': '3th'},
- {'x': 235.5, 'y': 18.978437264, 'z': '5th'},
- {'x': 235.5, 'y': 19.668665474, 'z': '10th'},
- {'x': 235.5, 'y': 20.999455987, 'z': '25th'},
- {'x': 235.5, 'y': 22.824740868, 'z': '50th'},
- {'x': 235.5, 'y': 25.185724534, 'z': '75th'},
- {'x': 235.5, 'y': 26.775224484, 'z': '85th'},
- {'x': 235.5, 'y': 28.028006597, 'z': '90th'},
- {'x': 235.5, 'y': 30.232757788, 'z': '95th'},
- {'x': 235.5, 'y': 31.957642718, 'z': '97th'},
- {'x': 236.5, 'y': 18.597160159, 'z': '3th'},
- {'x': 236.5, 'y': 19.011288695, 'z': '5th'},
- {'x': 236.5, 'y': 19.703349738, 'z': '10th'},
- {'x': 236.5, 'y': 21.037948851, 'z': '25th'},
- {'x': 236.5, 'y': 22.869089116, 'z': '50th'},
- {'x': 236.5, 'y': 25.238833149, 'z': '75th'},
- {'x': 236.5, 'y': 26.835051321, 'z': '85th'},
- {'x': 236.5, 'y': 28.093626974, 'z': '90th'},
- {'x': 236.5, 'y': 30.309709009, 'z': '95th'},
- {'x': 236.5, 'y': 32.044528529, 'z': '97th'},
- {'x': 237.5, 'y': 18.628251422, 'z': '3th'},
- {'x': 237.5, 'y': 19.043431335, 'z': '5th'},
- {'x': 237.5, 'y': 19.7373324, 'z': '10th'},
- {'x': 237.5, 'y': 21.075788351, 'z': '25th'},
- {'x': 237.5, 'y': 22.912931508, 'z': '50th'},
- {'x': 237.5, 'y': 25.291785022, 'z': '75th'},
- {'x': 237.5, 'y': 26.895069442, 'z': '85th'},
- {'x': 237.5, 'y': 28.159783363, 'z': '90th'},
- {'x': 237.5, 'y': 30.387967, 'z': '95th'},
- {'x': 237.5, 'y': 32.13348232, 'z': '97th'},
- {'x': 238.5, 'y': 18.658612451, 'z': '3th'},
- {'x': 238.5, 'y': 19.074844245, 'z': '5th'},
- {'x': 238.5, 'y': 19.770595302, 'z': '10th'},
- {'x': 238.5, 'y': 21.112961907, 'z': '25th'},
- {'x': 238.5, 'y': 22.956263733, 'z': '50th'},
- {'x': 238.5, 'y': 25.34458825, 'z': '75th'},
- {'x': 238.5, 'y': 26.955296972, 'z': '85th'},
- {'x': 238.5, 'y': 28.226503126, 'z': '90th'},
- {'x': 238.5, 'y': 30.467579243, 'z': '95th'},
- {'x': 238.5, 'y': 32.224571824, 'z': '97th'},
- {'x': 239.5, 'y': 18.688221612, 'z': '3th'},
- {'x': 239.5, 'y': 19.105507218, 'z': '5th'},
- {'x': 239.5, 'y': 19.803120682, 'z': '10th'},
- {'x': 239.5, 'y': 21.149456727, 'z': '25th'},
- {'x': 239.5, 'y': 22.999080616, 'z': '50th'},
- {'x': 239.5, 'y': 25.397249669, 'z': '75th'},
- {'x': 239.5, 'y': 27.015750924, 'z': '85th'},
- {'x': 239.5, 'y': 28.293812944, 'z': '90th'},
- {'x': 239.5, 'y': 30.548594139, 'z': '95th'},
- {'x': 239.5, 'y': 32.317867911, 'z': '97th'},
- {'x': 240.0, 'y': 18.702737405, 'z': '3th'},
- {'x': 240.0, 'y': 19.120551107, 'z': '5th'},
- {'x': 240.0, 'y': 19.819101225, 'z': '10th'},
- {'x': 240.0, 'y': 21.167445634, 'z': '25th'},
- {'x': 240.0, 'y': 23.020294238, 'z': '50th'},
- {'x': 240.0, 'y': 25.423529396, 'z': '75th'},
- {'x': 240.0, 'y': 27.046068183, 'z': '85th'},
- {'x': 240.0, 'y': 28.327697528, 'z': '90th'},
- {'x': 240.0, 'y': 30.589642847, 'z': '95th'},
- {'x': 240.0, 'y': 32.36536586, 'z': '97th'},
- {'x': 240.5, 'y': 18.717056794, 'z': '3th'},
- {'x': 240.5, 'y': 19.13539969, 'z': '5th'},
- {'x': 240.5, 'y': 19.834890606, 'z': '10th'},
- {'x': 240.5, 'y': 21.185260137, 'z': '25th'},
- {'x': 240.5, 'y': 23.041377338, 'z': '50th'},
- {'x': 240.5, 'y': 25.449776571, 'z': '75th'},
- {'x': 240.5, 'y': 27.076448741, 'z': '85th'},
- {'x': 240.5, 'y': 28.361739896, 'z': '90th'},
- {'x': 240.5, 'y': 30.631060541, 'z': '95th'},
- {'x': 240.5, 'y': 32.413442178, 'z': '97th'}]
@@ -1,344 +0,0 @@
-cdc_boys_head_age = [
-    { "x": 0, "y": 31.48762321, "z": "3rd" },
-    { "x": 0.5, "y": 33.25005839, "z": "3rd" },
-    { "x": 1.5, "y": 35.78126227, "z": "3rd" },
-    { "x": 2.5, "y": 37.55879748, "z": "3rd" },
-    { "x": 3.5, "y": 38.89944028, "z": "3rd" },
-    { "x": 4.5, "y": 39.956733, "z": "3rd" },
-    { "x": 5.5, "y": 40.8164238, "z": "3rd" },
-    { "x": 6.5, "y": 41.53109397, "z": "3rd" },
-    { "x": 7.5, "y": 42.13520784, "z": "3rd" },
-    { "x": 8.5, "y": 42.65252672, "z": "3rd" },
-    { "x": 9.5, "y": 43.1000854, "z": "3rd" },
-    { "x": 10.5, "y": 43.49049033, "z": "3rd" },
-    { "x": 11.5, "y": 43.83331672, "z": "3rd" },
-    { "x": 12.5, "y": 44.1359978, "z": "3rd" },
-    { "x": 13.5, "y": 44.40441201, "z": "3rd" },
-    { "x": 14.5, "y": 44.6432831, "z": "3rd" },
-    { "x": 15.5, "y": 44.85646007, "z": "3rd" },
-    { "x": 16.5, "y": 45.0471177, "z": "3rd" },
-    { "x": 17.5, "y": 45.21790307, "z": "3rd" },
-    { "x": 18.5, "y": 45.37104465, "z": "3rd" },
-    { "x": 19.5, "y": 45.50843477, "z": "3rd" },
-    { "x": 20.5, "y": 45.63169289, "z": "3rd" },
-    { "x": 21.5, "y": 45.74221477, "z": "3rd" },
-    { "x": 22.5, "y": 45.84121112, "z": "3rd" },
-    { "x": 23.5, "y": 45.92973857, "z": "3rd" },
-    { "x": 24.5, "y": 46.00872286, "z": "3rd" },
-    { "x": 25.5, "y": 46.07898233, "z": "3rd" },
-    { "x": 26.5, "y": 46.14123974, "z": "3rd" },
-    { "x": 27.5, "y": 46.19613885, "z": "3rd" },
-    { "x": 28.5, "y": 46.24425435, "z": "3rd" },
-    { "x": 29.5, "y": 46.28610129, "z": "3rd" },
-    { "x": 30.5, "y": 46.32214286, "z": "3rd" },
-    { "x": 31.5, "y": 46.35279696, "z": "3rd" },
-    { "x": 32.5, "y": 46.37844176, "z": "3rd" },
-    { "x": 33.5, "y": 46.39942043, "z": "3rd" },
-    { "x": 34.5, "y": 46.41604524, "z": "3rd" },
-    { "x": 35.5, "y": 46.42860105, "z": "3rd" },
-    { "x": 36, "y": 46.43343534, "z": "3rd" },
-    { "x": 0, "y": 32.14881105, "z": "5th" },
-    { "x": 0.5, "y": 33.83391575, "z": "5th" },
-    { "x": 1.5, "y": 36.26427603, "z": "5th" },
-    { "x": 2.5, "y": 37.97958783, "z": "5th" },
-    { "x": 3.5, "y": 39.27893049, "z": "5th" },
-    { "x": 4.5, "y": 40.30765556, "z": "5th" },
-    { "x": 5.5, "y": 41.14714268, "z": "5th" },
-    { "x": 6.5, "y": 41.84741554, "z": "5th" },
-    { "x": 7.5, "y": 42.44134027, "z": "5th" },
-    { "x": 8.5, "y": 42.95162383, "z": "5th" },
-    { "x": 9.5, "y": 43.39457866, "z": "5th" },
-    { "x": 10.5, "y": 43.78229887, "z": "5th" },
-    { "x": 11.5, "y": 44.12398596, "z": "5th" },
-    { "x": 12.5, "y": 44.42679395, "z": "5th" },
-    { "x": 13.5, "y": 44.69638826, "z": "5th" },
-    { "x": 14.5, "y": 44.93732702, "z": "5th" },
-    { "x": 15.5, "y": 45.1533284, "z": "5th" },
-    { "x": 16.5, "y": 45.34746216, "z": "5th" },
-    { "x": 17.5, "y": 45.52229008, "z": "5th" },
-    { "x": 18.5, "y": 45.67997038, "z": "5th" },
-    { "x": 19.5, "y": 45.82233697, "z": "5th" },
-    { "x": 20.5, "y": 45.95096016, "z": "5th" },
-    { "x": 21.5, "y": 46.06719402, "z": "5th" },
-    { "x": 22.5, "y": 46.17221358, "z": "5th" },
-    { "x": 23.5, "y": 46.26704456, "z": "5th" },
-    { "x": 24.5, "y": 46.35258644, "z": "5th" },
-    { "x": 25.5, "y": 46.42963351, "z": "5th" },
-    { "x": 26.5, "y": 46.49888834, "z": "5th" },
-    { "x": 27.5, "y": 46.56097639, "z": "5th" },
-    { "x": 28.5, "y": 46.61645615, "z": "5th" },
-    { "x": 29.5, "y": 46.66582817, "z": "5th" },
-    { "x": 30.5, "y": 46.70954267, "z": "5th" },
-    { "x": 31.5, "y": 46.7480058, "z": "5th" },
-    { "x": 32.5, "y": 46.78158515, "z": "5th" },
-    { "x": 33.5, "y": 46.81061427, "z": "5th" },
-    { "x": 34.5, "y": 46.83539667, "z": "5th" },
-    { "x": 35.5, "y": 46.85620919, "z": "5th" },
-    { "x": 36, "y": 46.86520671, "z": "5th" },
-    { "x": 0, "y": 33.08389492, "z": "10th" },
-    { "x": 0.5, "y": 34.67252717, "z": "10th" },
-    { "x": 1.5, "y": 36.97376845, "z": "10th" },
-    { "x": 2.5, "y": 38.60724429, "z": "10th" },
-    { "x": 3.5, "y": 39.85122805, "z": "10th" },
-    { "x": 4.5, "y": 40.8411358, "z": "10th" },
-    { "x": 5.5, "y": 41.65290563, "z": "10th" },
-    { "x": 6.5, "y": 42.33330145, "z": "10th" },
-    { "x": 7.5, "y": 42.91311128, "z": "10th" },
-    { "x": 8.5, "y": 43.41364704, "z": "10th" },
-    { "x": 9.5, "y": 43.85025055, "z": "10th" },
-    { "x": 10.5, "y": 44.23431798, "z": "10th" },
-    { "x": 11.5, "y": 44.57453557, "z": "10th" },
-    { "x": 12.5, "y": 44.87766812, "z": "10th" },
-    { "x": 13.5, "y": 45.14908116, "z": "10th" },
-    { "x": 14.5, "y": 45.39309769, "z": "10th" },
-    { "x": 15.5, "y": 45.61324855, "z": "10th" },
-    { "x": 16.5, "y": 45.81245227, "z": "10th" },
-    { "x": 17.5, "y": 45.99314685, "z": "10th" },
-    { "x": 18.5, "y": 46.1573882, "z": "10th" },
-    { "x": 19.5, "y": 46.30692463, "z": "10th" },
-    { "x": 20.5, "y": 46.4432543, "z": "10th" },
-    { "x": 21.5, "y": 46.56766983, "z": "10th" },
-    { "x": 22.5, "y": 46.68129357, "z": "10th" },
-    { "x": 23.5, "y": 46.78510558, "z": "10th" },
-    { "x": 24.5, "y": 46.87996641, "z": "10th" },
-    { "x": 25.5, "y": 46.96663488, "z": "10th" },
-    { "x": 26.5, "y": 47.0457837, "z": "10th" },
-    { "x": 27.5, "y": 47.11801133, "z": "10th" },
-    { "x": 28.5, "y": 47.18385241, "z": "10th" },
-    { "x": 29.5, "y": 47.24378625, "z": "10th" },
-    { "x": 30.5, "y": 47.29824404, "z": "10th" },
-    { "x": 31.5, "y": 47.34761489, "z": "10th" },
-    { "x": 32.5, "y": 47.39225099, "z": "10th" },
-    { "x": 33.5, "y": 47.43247203, "z": "10th" },
-    { "x": 34.5, "y": 47.46856894, "z": "10th" },
-    { "x": 35.5, "y": 47.50080715, "z": "10th" },
-    { "x": 36, "y": 47.51555592, "z": "10th" },
-    { "x": 0, "y": 34.46951803, "z": "25th" },
-    { "x": 0.5, "y": 35.93986771, "z": "25th" },
-    { "x": 1.5, "y": 38.07877607, "z": "25th" },
-    { "x": 2.5, "y": 39.60636994, "z": "25th" },
-    { "x": 3.5, "y": 40.77712846, "z": "25th" },
-    { "x": 4.5, "y": 41.71483367, "z": "25th" },
-    { "x": 5.5, "y": 42.48888872, "z": "25th" },
-    { "x": 6.5, "y": 43.14204136, "z": "25th" },
-    { "x": 7.5, "y": 43.70245428, "z": "25th" },
-    { "x": 8.5, "y": 44.18963565, "z": "25th" },
-    { "x": 9.5, "y": 44.61764431, "z": "25th" },
-    { "x": 10.5, "y": 44.99693519, "z": "25th" },
-    { "x": 11.5, "y": 45.33548679, "z": "25th" },
-    { "x": 12.5, "y": 45.6395204, "z": "25th" },
-    { "x": 13.5, "y": 45.91397652, "z": "25th" },
-    { "x": 14.5, "y": 46.16284044, "z": "25th" },
-    { "x": 15.5, "y": 46.38937093, "z": "25th" },
-    { "x": 16.5, "y": 46.5962646, "z": "25th" },
-    { "x": 17.5, "y": 46.78577645, "z": "25th" },
-    { "x": 18.5, "y": 46.95980996, "z": "25th" },
-    { "x": 19.5, "y": 47.1199854, "z": "25th" },
-    { "x": 20.5, "y": 47.2676925, "z": "25th" },
-    { "x": 21.5, "y": 47.4041314, "z": "25th" },
-    { "x": 22.5, "y": 47.53034509, "z": "25th" },
-    { "x": 23.5, "y": 47.64724492, "z": "25th" },
-    { "x": 24.5, "y": 47.75563267, "z": "25th" },
-    { "x": 25.5, "y": 47.85621436, "z": "25th" },
-    { "x": 26.5, "y": 47.9496179, "z": "25th" },
-    { "x": 27.5, "y": 48.03640172, "z": "25th" },
-    { "x": 28.5, "y": 48.11706526, "z": "25th" },
-    { "x": 29.5, "y": 48.19205668, "z": "25th" },
-    { "x": 30.5, "y": 48.26177952, "z": "25th" },
-    { "x": 31.5, "y": 48.32659828, "z": "25th" },
-    { "x": 32.5, "y": 48.38684322, "z": "25th" },
-    { "x": 33.5, "y": 48.44281439, "z": "25th" },
-    { "x": 34.5, "y": 48.49478513, "z": "25th" },
-    { "x": 35.5, "y": 48.54300509, "z": "25th" },
-    { "x": 36, "y": 48.56578071, "z": "25th" },
-    { "x": 0, "y": 35.81366835, "z": "50th" },
-    { "x": 0.5, "y": 37.19361054, "z": "50th" },
-    { "x": 1.5, "y": 39.20742929, "z": "50th" },
-    { "x": 2.5, "y": 40.65233195, "z": "50th" },
-    { "x": 3.5, "y": 41.76516959, "z": "50th" },
-    { "x": 4.5, "y": 42.66116148, "z": "50th" },
-    { "x": 5.5, "y": 43.40488731, "z": "50th" },
-    { "x": 6.5, "y": 44.03609923, "z": "50th" },
-    { "x": 7.5, "y": 44.58096912, "z": "50th" },
-    { "x": 8.5, "y": 45.05761215, "z": "50th" },
-    { "x": 9.5, "y": 45.4790756, "z": "50th" },
-    { "x": 10.5, "y": 45.85505706, "z": "50th" },
-    { "x": 11.5, "y": 46.19295427, "z": "50th" },
-    { "x": 12.5, "y": 46.49853438, "z": "50th" },
-    { "x": 13.5, "y": 46.77637684, "z": "50th" },
-    { "x": 14.5, "y": 47.03017599, "z": "50th" },
-    { "x": 15.5, "y": 47.2629533, "z": "50th" },
-    { "x": 16.5, "y": 47.47720989, "z": "50th" },
-    { "x": 17.5, "y": 47.67503833, "z": "50th" },
-    { "x": 18.5, "y": 47.85820606, "z": "50th" },
-    { "x": 19.5, "y": 48.02821867, "z": "50th" },
-    { "x": 20.5, "y": 48.18636864, "z": "50th" },
-    { "x": 21.5, "y": 48.3337732, "z": "50th" },
-    { "x": 22.5, "y": 48.47140432, "z": "50th" },
-    { "x": 23.5, "y": 48.60011223, "z": "50th" },
-    { "x": 24.5, "y": 48.72064621, "z": "50th" },
-    { "x": 25.5, "y": 48.83366629, "z": "50th" },
-    { "x": 26.5, "y": 48.93976089, "z": "50th" },
-    { "x": 27.5, "y": 49.03945383, "z": "50th" },
-    { "x": 28.5, "y": 49.13321432, "z": "50th" },
-    { "x": 29.5, "y": 49.22146409, "z": "50th" },
-    { "x": 30.5, "y": 49.30458348, "z": "50th" },
-    { "x": 31.5, "y": 49.38291658, "z": "50th" },
-    { "x": 32.5, "y": 49.45677569, "z": "50th" },
-    { "x": 33.5, "y": 49.526445, "z": "50th" },
-    { "x": 34.5, "y": 49.59218385, "z": "50th" },
-    { "x": 35.5, "y": 49.65422952, "z": "50th" },
-    { "x": 36, "y": 49.68393611, "z": "50th" },
-    { "x": 0, "y": 37.00426196, "z": "75th" },
-    { "x": 0.5, "y": 38.3212548, "z": "75th" },
-    { "x": 1.5, "y": 40.2498675, "z": "75th" },
-    { "x": 2.5, "y": 41.63967944, "z": "75th" },
-    { "x": 3.5, "y": 42.71454952, "z": "75th" },
-    { "x": 4.5, "y": 43.58358267, "z": "75th" },
-    { "x": 5.5, "y": 44.30801, "z": "75th" },
-    { "x": 6.5, "y": 44.92554888, "z": "75th" },
-    { "x": 7.5, "y": 45.46103549, "z": "75th" },
-    { "x": 8.5, "y": 45.93165855, "z": "75th" },
-    { "x": 9.5, "y": 46.34979269, "z": "75th" },
-    { "x": 10.5, "y": 46.72463077, "z": "75th" },
-    { "x": 11.5, "y": 47.06318161, "z": "75th" },
-    { "x": 12.5, "y": 47.37090639, "z": "75th" },
-    { "x": 13.5, "y": 47.65213989, "z": "75th" },
-    { "x": 14.5, "y": 47.9103782, "z": "75th" },
-    { "x": 15.5, "y": 48.14848042, "z": "75th" },
-    { "x": 16.5, "y": 48.36881356, "z": "75th" },
-    { "x": 17.5, "y": 48.57335854, "z": "75th" },
-    { "x": 18.5, "y": 48.76378933, "z": "75th" },
-    { "x": 19.5, "y": 48.94153284, "z": "75th" },
-    { "x": 20.5, "y": 49.10781495, "z": "75th" },
-    { "x": 21.5, "y": 49.26369641, "z": "75th" },
-    { "x": 22.5, "y": 49.41010098, "z": "75th" },
-    { "x": 23.5, "y": 49.54783776, "z": "75th" },
-    { "x": 24.5, "y": 49.67762038, "z": "75th" },
-    { "x": 25.5, "y": 49.80007885, "z": "75th" },
-    { "x": 26.5, "y": 49.91577508, "z": "75th" },
-    { "x": 27.5, "y": 50.02521023, "z": "75th" },
-    { "x": 28.5, "y": 50.12883385, "z": "75th" },
-    { "x": 29.5, "y": 50.22705052, "z": "75th" },
-    { "x": 30.5, "y": 50.32022568, "z": "75th" },
-    { "x": 31.5, "y": 50.4086904, "z": "75th" },
-    { "x": 32.5, "y": 50.49274559, "z": "75th" },
-    { "x": 33.5, "y": 50.57266545, "z": "75th" },
-    { "x": 34.5, "y": 50.64870057, "z": "75th" },
-    { "x": 35.5, "y": 50.72108047, "z": "75th" },
-    { "x": 36, "y": 50.75596627, "z": "75th" },
-    { "x": 0, "y": 37.97379421, "z": "90th" },
-    { "x": 0.5, "y": 39.24988502, "z": "90th" },
-    { "x": 1.5, "y": 41.12605049, "z": "90th" },
-    { "x": 2.5, "y": 42.48435504, "z": "90th" },
-    { "x": 3.5, "y": 43.5390162, "z": "90th" },
-    { "x": 4.5, "y": 44.39471535, "z": "90th" },
-    { "x": 5.5, "y": 45.11034335, "z": "90th" },
-    { "x": 6.5, "y": 45.72225458, "z": "90th" },
-    { "x": 7.5, "y": 46.25442887, "z": "90th" },
-    { "x": 8.5, "y": 46.72349076, "z": "90th" },
-    { "x": 9.5, "y": 47.14142337, "z": "90th" },
-    { "x": 10.5, "y": 47.5171388, "z": "90th" },
-    { "x": 11.5, "y": 47.85743833, "z": "90th" },
-    { "x": 12.5, "y": 48.1676259, "z": "90th" },
-    { "x": 13.5, "y": 48.4519147, "z": "90th" },
-    { "x": 14.5, "y": 48.71370522, "z": "90th" },
-    { "x": 15.5, "y": 48.95578033, "z": "90th" },
-    { "x": 16.5, "y": 49.18044547, "z": "90th" },
-    { "x": 17.5, "y": 49.38963138, "z": "90th" },
-    { "x": 18.5, "y": 49.58497069, "z": "90th" },
-    { "x": 19.5, "y": 49.767856, "z": "90th" },
-    { "x": 20.5, "y": 49.93948448, "z": "90th" },
-    { "x": 21.5, "y": 50.10089268, "z": "90th" },
-    { "x": 22.5, "y": 50.25298383, "z": "90th" },
-    { "x": 23.5, "y": 50.39654965, "z": "90th" },
-    { "x": 24.5, "y": 50.53228805, "z": "90th" },
-    { "x": 25.5, "y": 50.6608169, "z": "90th" },
-    { "x": 26.5, "y": 50.78268619, "z": "90th" },
-    { "x": 27.5, "y": 50.89838727, "z": "90th" },
-    { "x": 28.5, "y": 51.00836092, "z": "90th" },
-    { "x": 29.5, "y": 51.11300399, "z": "90th" },
-    { "x": 30.5, "y": 51.212675, "z": "90th" },
-    { "x": 31.5, "y": 51.30769888, "z": "90th" },
-    { "x": 32.5, "y": 51.39837096, "z": "90th" },
-    { "x": 33.5, "y": 51.48496048, "z": "90th" },
-    { "x": 34.5, "y": 51.56771347, "z": "90th" },
-    { "x": 35.5, "y": 51.64685536, "z": "90th" },
-    { "x": 36, "y": 51.68513749, "z": "90th" },
-    { "x": 0, "y": 38.51574, "z": "95th" },
-    { "x": 0.5, "y": 39.77261565, "z": "95th" },
-    { "x": 1.5, "y": 41.62581415, "z": "95th" },
-    { "x": 2.5, "y": 42.97189144, "z": "95th" },
-    { "x": 3.5, "y": 44.01984454, "z": "95th" },
-    { "x": 4.5, "y": 44.87197284, "z": "95th" },
-    { "x": 5.5, "y": 45.58592624, "z": "95th" },
-    { "x": 6.5, "y": 46.19735808, "z": "95th" },
-    { "x": 7.5, "y": 46.7298272, "z": "95th" },
-    { "x": 8.5, "y": 47.19970004, "z": "95th" },
-    { "x": 9.5, "y": 47.61879558, "z": "95th" },
-    { "x": 10.5, "y": 47.99592075, "z": "95th" },
-    { "x": 11.5, "y": 48.33780885, "z": "95th" },
-    { "x": 12.5, "y": 48.64971976, "z": "95th" },
-    { "x": 13.5, "y": 48.93583823, "z": "95th" },
-    { "x": 14.5, "y": 49.19954641, "z": "95th" },
-    { "x": 15.5, "y": 49.44361553, "z": "95th" },
-    { "x": 16.5, "y": 49.67034368, "z": "95th" },
-    { "x": 17.5, "y": 49.88165697, "z": "95th" },
-    { "x": 18.5, "y": 50.07918514, "z": "95th" },
-    { "x": 19.5, "y": 50.26431891, "z": "95th" },
-    { "x": 20.5, "y": 50.43825419, "z": "95th" },
-    { "x": 21.5, "y": 50.60202648, "z": "95th" },
-    { "x": 22.5, "y": 50.75653813, "z": "95th" },
-    { "x": 23.5, "y": 50.90258011, "z": "95th" },
-    { "x": 24.5, "y": 51.04084871, "z": "95th" },
-    { "x": 25.5, "y": 51.17196156, "z": "95th" },
-    { "x": 26.5, "y": 51.29646691, "z": "95th" },
-    { "x": 27.5, "y": 51.41485491, "z": "95th" },
-    { "x": 28.5, "y": 51.52756491, "z": "95th" },
-    { "x": 29.5, "y": 51.63499226, "z": "95th" },
-    { "x": 30.5, "y": 51.73749389, "z": "95th" },
-    { "x": 31.5, "y": 51.83539311, "z": "95th" },
-    { "x": 32.5, "y": 51.92898358, "z": "95th" },
-    { "x": 33.5, "y": 52.01853284, "z": "95th" },
-    { "x": 34.5, "y": 52.10428523, "z": "95th" },
-    { "x": 35.5, "y": 52.18646448, "z": "95th" },
-    { "x": 36, "y": 52.22627901, "z": "95th" },
-    { "x": 0, "y": 38.85417217, "z": "97th" },
-    { "x": 0.5, "y": 40.10028445, "z": "97th" },
-    { "x": 1.5, "y": 41.94137873, "z": "97th" },
-    { "x": 2.5, "y": 43.28180775, "z": "97th" },
-    { "x": 3.5, "y": 44.3273323, "z": "97th" },
-    { "x": 4.5, "y": 45.17876946, "z": "97th" },
-    { "x": 5.5, "y": 45.89299742, "z": "97th" },
-    { "x": 6.5, "y": 46.50523827, "z": "97th" },
-    { "x": 7.5, "y": 47.03879825, "z": "97th" },
-    { "x": 8.5, "y": 47.50989695, "z": "97th" },
-    { "x": 9.5, "y": 47.93026746, "z": "97th" },
-    { "x": 10.5, "y": 48.30866909, "z": "97th" },
-    { "x": 11.5, "y": 48.65181107, "z": "97th" },
-    { "x": 12.5, "y": 48.96494367, "z": "97th" },
-    { "x": 13.5, "y": 49.25225076, "z": "97th" },
-    { "x": 14.5, "y": 49.51711865, "z": "97th" },
-    { "x": 15.5, "y": 49.76232529, "z": "97th" },
-    { "x": 16.5, "y": 49.99017661, "z": "97th" },
-    { "x": 17.5, "y": 50.20260675, "z": "97th" },
-    { "x": 18.5, "y": 50.40125302, "z": "97th" },
-    { "x": 19.5, "y": 50.58751304, "z": "97th" },
-    { "x": 20.5, "y": 50.76258871, "z": "97th" },
-    { "x": 21.5, "y": 50.92752068, "z": "97th" },
-    { "x": 22.5, "y": 51.0832155, "z": "97th" },
-    { "x": 23.5, "y": 51.23046767, "z": "97th" },
-    { "x": 24.5, "y": 51.36997568, "z": "97th" },
-    { "x": 25.5, "y": 51.50235977, "z": "97th" },
-    { "x": 26.5, "y": 51.62816923, "z": "97th" },
-    { "x": 27.5, "y": 51.74789519, "z": "97th" },
-    { "x": 28.5, "y": 51.8619775, "z": "97th" },
-    { "x": 29.5, "y": 51.97081164, "z": "97th" },
-    { "x": 30.5, "y": 52.0747544, "z": "97th" },
-    { "x": 31.5, "y": 52.17412868, "z": "97th" },
-    { "x": 32.5, "y": 52.26922758, "z": "97th" },
-    { "x": 33.5, "y": 52.36031789, "z": "97th" },
-    { "x": 34.5, "y": 52.44764311, "z": "97th" },
-    { "x": 35.5, "y": 52.53142603, "z": "97th" },
-    { "x": 36, "y": 52.57205364, "z": "97th" }
-]
@@ -1,335 +0,0 @@
-cdc_boys_length_age = [
-    { "x": 0, "y": 44.9250977976054, "z": "3rd" },
-    { "x": 0.5, "y": 47.9781237289086, "z": "3rd" },
-    { "x": 1.5, "y": 52.1985946900997, "z": "3rd" },
-    { "x": 2.5, "y": 55.2632177988627, "z": "3rd" },
-    { "x": 3.5, "y": 57.7304929347406, "z": "3rd" },
-    { "x": 4.5, "y": 59.8256861622673, "z": "3rd" },
-    { "x": 5.5, "y": 61.6638370896265, "z": "3rd" },
-    { "x": 6.5, "y": 63.312242388854, "z": "3rd" },
-    { "x": 7.5, "y": 64.8139541988347, "z": "3rd" },
-    { "x": 8.5, "y": 66.1983256978706, "z": "3rd" },
-    { "x": 9.5, "y": 67.4863482409871, "z": "3rd" },
-    { "x": 10.5, "y": 68.693603040503, "z": "3rd" },
-    { "x": 11.5, "y": 69.8320014339409, "z": "3rd" },
-    { "x": 12.5, "y": 70.9108782371828, "z": "3rd" },
-    { "x": 13.5, "y": 71.9376972069369, "z": "3rd" },
-    { "x": 14.5, "y": 72.9185302489553, "z": "3rd" },
-    { "x": 15.5, "y": 73.8583906008274, "z": "3rd" },
-    { "x": 16.5, "y": 74.7614707523533, "z": "3rd" },
-    { "x": 17.5, "y": 75.63131645364, "z": "3rd" },
-    { "x": 18.5, "y": 76.4709562790104, "z": "3rd" },
-    { "x": 19.5, "y": 77.2830000089799, "z": "3rd" },
-    { "x": 20.5, "y": 78.0697142878296, "z": "3rd" },
-    { "x": 21.5, "y": 78.8330817172154, "z": "3rd" },
-    { "x": 22.5, "y": 79.5748455580292, "z": "3rd" },
-    { "x": 23.5, "y": 80.2965565913491, "z": "3rd" },
-    { "x": 24.5, "y": 80.9995872983678, "z": "3rd" },
-    { "x": 25.5, "y": 81.7446395330885, "z": "3rd" },
-    { "x": 26.5, "y": 82.4736527307001, "z": "3rd" },
-    { "x": 27.5, "y": 83.188122057027, "z": "3rd" },
-    { "x": 28.5, "y": 83.8893068413842, "z": "3rd" },
-    { "x": 29.5, "y": 84.5782638893427, "z": "3rd" },
-    { "x": 30.5, "y": 85.2558869161821, "z": "3rd" },
-    { "x": 31.5, "y": 85.9229395984847, "z": "3rd" },
-    { "x": 32.5, "y": 86.5800851110585, "z": "3rd" },
-    { "x": 33.5, "y": 87.2279127412898, "z": "3rd" },
-    { "x": 34.5, "y": 87.8669617158391, "z": "3rd" },
-    { "x": 35.5, "y": 88.4977409604969, "z": "3rd" },
-    { "x": 0, "y": 45.5684090997953, "z": "5th" },
-    { "x": 0.5, "y": 48.5580920591964, "z": "5th" },
-    { "x": 1.5, "y": 52.7261065869033, "z": "5th" },
-    { "x": 2.5, "y": 55.7734505006415, "z": "5th" },
-    { "x": 3.5, "y": 58.2374433948044, "z": "5th" },
-    { "x": 4.5, "y": 60.3364690517742, "z": "5th" },
-    { "x": 5.5, "y": 62.1826080663385, "z": "5th" },
-    { "x": 6.5, "y": 63.8416613064386, "z": "5th" },
-    { "x": 7.5, "y": 65.3558384891164, "z": "5th" },
-    { "x": 8.5, "y": 66.7539798471866, "z": "5th" },
-    { "x": 9.5, "y": 68.0567455477914, "z": "5th" },
-    { "x": 10.5, "y": 69.2794921906571, "z": "5th" },
-    { "x": 11.5, "y": 70.4339743086492, "z": "5th" },
-    { "x": 12.5, "y": 71.5294120412332, "z": "5th" },
-    { "x": 13.5, "y": 72.573183808992, "z": "5th" },
-    { "x": 14.5, "y": 73.5712963119119, "z": "5th" },
-    { "x": 15.5, "y": 74.5287118963997, "z": "5th" },
-    { "x": 16.5, "y": 75.4495825856131, "z": "5th" },
-    { "x": 17.5, "y": 76.3374213958132, "z": "5th" },
-    { "x": 18.5, "y": 77.1952300188364, "z": "5th" },
-    { "x": 19.5, "y": 78.0255958397382, "z": "5th" },
-    { "x": 20.5, "y": 78.8307666113033, "z": "5th" },
-    { "x": 21.5, "y": 79.612708816061, "z": "5th" },
-    { "x": 22.5, "y": 80.3731528544819, "z": "5th" },
-    { "x": 23.5, "y": 81.1136348241789, "z": "5th" },
-    { "x": 24.5, "y": 81.835518175749, "z": "5th" },
-    { "x": 25.5, "y": 82.581353443818, "z": "5th" },
-    { "x": 26.5, "y": 83.3110528286648, "z": "5th" },
-    { "x": 27.5, "y": 84.0260900564991, "z": "5th" },
-    { "x": 28.5, "y": 84.7276916167264, "z": "5th" },
-    { "x": 29.5, "y": 85.4168802715866, "z": "5th" },
-    { "x": 30.5, "y": 86.0945174468316, "z": "5th" },
-    { "x": 31.5, "y": 86.7613389249827, "z": "5th" },
-    { "x": 32.5, "y": 87.4179858742151, "z": "5th" },
-    { "x": 33.5, "y": 88.0650320338, "z": "5th" },
-    { "x": 34.5, "y": 88.7030074483648, "z": "5th" },
-    { "x": 35.5, "y": 89.3324183664647, "z": "5th" },
-    { "x": 0, "y": 46.5542930191283, "z": "10th" },
-    { "x": 0.5, "y": 49.4578038295636, "z": "10th" },
-    { "x": 1.5, "y": 53.5536465659792, "z": "10th" },
-    { "x": 2.5, "y": 56.5777214480317, "z": "10th" },
-    { "x": 3.5, "y": 59.0383022664733, "z": "10th" },
-    { "x": 4.5, "y": 61.1440960517707, "z": "10th" },
-    { "x": 5.5, "y": 63.002959620743, "z": "10th" },
-    { "x": 6.5, "y": 64.6785365049069, "z": "10th" },
-    { "x": 7.5, "y": 66.2118122523828, "z": "10th" },
-    { "x": 8.5, "y": 67.6308774877649, "z": "10th" },
-    { "x": 9.5, "y": 68.9559062937649, "z": "10th" },
-    { "x": 10.5, "y": 70.2019246073148, "z": "10th" },
-    { "x": 11.5, "y": 71.3804554654194, "z": "10th" },
-    { "x": 12.5, "y": 72.5005495820495, "z": "10th" },
-    { "x": 13.5, "y": 73.5694592157624, "z": "10th" },
-    { "x": 14.5, "y": 74.5930947130448, "z": "10th" },
-    { "x": 15.5, "y": 75.5763433306313, "z": "10th" },
-    { "x": 16.5, "y": 76.5232975362633, "z": "10th" },
-    { "x": 17.5, "y": 77.4374223484628, "z": "10th" },
-    { "x": 18.5, "y": 78.3216802341811, "z": "10th" },
-    { "x": 19.5, "y": 79.1786261007151, "z": "10th" },
-    { "x": 20.5, "y": 80.0104805083643, "z": "10th" },
-    { "x": 21.5, "y": 80.8191869414724, "z": "10th" },
-    { "x": 22.5, "y": 81.6064574952835, "z": "10th" },
-    { "x": 23.5, "y": 82.3738080633518, "z": "10th" },
-    { "x": 24.5, "y": 83.1225894944865, "z": "10th" },
-    { "x": 25.5, "y": 83.8724497800876, "z": "10th" },
-    { "x": 26.5, "y": 84.6057624632736, "z": "10th" },
-    { "x": 27.5, "y": 85.3239891157348, "z": "10th" },
-    { "x": 28.5, "y": 86.0283299569244, "z": "10th" },
-    { "x": 29.5, "y": 86.7197799432531, "z": "10th" },
-    { "x": 30.5, "y": 87.3991747668398, "z": "10th" },
-    { "x": 31.5, "y": 88.0672298826861, "z": "10th" },
-    { "x": 32.5, "y": 88.7245734534635, "z": "10th" },
-    { "x": 33.5, "y": 89.3717742721354, "z": "10th" },
-    { "x": 34.5, "y": 90.0093653632044, "z": "10th" },
-    { "x": 35.5, "y": 90.6378640422833, "z": "10th" },
-    { "x": 0, "y": 48.1893738140463, "z": "25th" },
-    { "x": 0.5, "y": 50.979188894577, "z": "25th" },
-    { "x": 1.5, "y": 54.9791044093995, "z": "25th" },
-    { "x": 2.5, "y": 57.9743988163658, "z": "25th" },
-    { "x": 3.5, "y": 60.4343343865457, "z": "25th" },
-    { "x": 4.5, "y": 62.5540884936898, "z": "25th" },
-    { "x": 5.5, "y": 64.4354633830482, "z": "25th" },
-    { "x": 6.5, "y": 66.1389573500098, "z": "25th" },
-    { "x": 7.5, "y": 67.7037500029861, "z": "25th" },
-    { "x": 8.5, "y": 69.1568171782938, "z": "25th" },
-    { "x": 9.5, "y": 70.5176063572942, "z": "25th" },
-    { "x": 10.5, "y": 71.8006481524649, "z": "25th" },
-    { "x": 11.5, "y": 73.0171184560636, "z": "25th" },
-    { "x": 12.5, "y": 74.1758148300991, "z": "25th" },
-    { "x": 13.5, "y": 75.2838018914029, "z": "25th" },
-    { "x": 14.5, "y": 76.3468477709515, "z": "25th" },
-    { "x": 15.5, "y": 77.3697300415551, "z": "25th" },
-    { "x": 16.5, "y": 78.3564553342004, "z": "25th" },
-    { "x": 17.5, "y": 79.3104206167123, "z": "25th" },
-    { "x": 18.5, "y": 80.2345338332348, "z": "25th" },
-    { "x": 19.5, "y": 81.1313057809738, "z": "25th" },
-    { "x": 20.5, "y": 82.0029210701211, "z": "25th" },
-    { "x": 21.5, "y": 82.8512937059361, "z": "25th" },
-    { "x": 22.5, "y": 83.6781129605404, "z": "25th" },
-    { "x": 23.5, "y": 84.484870913977, "z": "25th" },
-    { "x": 24.5, "y": 85.2729040435318, "z": "25th" },
-    { "x": 25.5, "y": 86.0370290207216, "z": "25th" },
-    { "x": 26.5, "y": 86.7832934580158, "z": "25th" },
-    { "x": 27.5, "y": 87.5131740027243, "z": "25th" },
-    { "x": 28.5, "y": 88.227875866497, "z": "25th" },
-    { "x": 29.5, "y": 88.9284011706542, "z": "25th" },
-    { "x": 30.5, "y": 89.6155978698257, "z": "25th" },
-    { "x": 31.5, "y": 90.2902017684162, "z": "25th" },
-    { "x": 32.5, "y": 90.9528710722229, "z": "25th" },
-    { "x": 33.5, "y": 91.6042146714144, "z": "25th" },
-    { "x": 34.5, "y": 92.2448151465021, "z": "25th" },
-    { "x": 35.5, "y": 92.8752486107173, "z": "25th" },
-    { "x": 0, "y": 49.988884079, "z": "50th" },
-    { "x": 0.5, "y": 52.695975301, "z": "50th" },
-    { "x": 1.5, "y": 56.628428552, "z": "50th" },
-    { "x": 2.5, "y": 59.608953427, "z": "50th" },
-    { "x": 3.5, "y": 62.077000266, "z": "50th" },
-    { "x": 4.5, "y": 64.216864104, "z": "50th" },
-    { "x": 5.5, "y": 66.125314898, "z": "50th" },
-    { "x": 6.5, "y": 67.860179904, "z": "50th" },
-    { "x": 7.5, "y": 69.459084582, "z": "50th" },
-    { "x": 8.5, "y": 70.948039123, "z": "50th" },
-    { "x": 9.5, "y": 72.345861109, "z": "50th" },
-    { "x": 10.5, "y": 73.666654103, "z": "50th" },
-    { "x": 11.5, "y": 74.921297174, "z": "50th" },
-    { "x": 12.5, "y": 76.118375358, "z": "50th" },
-    { "x": 13.5, "y": 77.264799111, "z": "50th" },
-    { "x": 14.5, "y": 78.366223087, "z": "50th" },
-    { "x": 15.5, "y": 79.427340501, "z": "50th" },
-    { "x": 16.5, "y": 80.452094919, "z": "50th" },
-    { "x": 17.5, "y": 81.443836034, "z": "50th" },
-    { "x": 18.5, "y": 82.405436434, "z": "50th" },
-    { "x": 19.5, "y": 83.339380627, "z": "50th" },
-    { "x": 20.5, "y": 84.247833944, "z": "50th" },
-    { "x": 21.5, "y": 85.132696575, "z": "50th" },
-    { "x": 22.5, "y": 85.995648803, "z": "50th" },
-    { "x": 23.5, "y": 86.838175097, "z": "50th" },
-    { "x": 24.5, "y": 87.661609339, "z": "50th" },
-    { "x": 25.5, "y": 88.452472817, "z": "50th" },
-    { "x": 26.5, "y": 89.223264339, "z": "50th" },
-    { "x": 27.5, "y": 89.975492278, "z": "50th" },
-    { "x": 28.5, "y": 90.710408526, "z": "50th" },
-    { "x": 29.5, "y": 91.429077621, "z": "50th" },
-    { "x": 30.5, "y": 92.132423789, "z": "50th" },
-    { "x": 31.5, "y": 92.821271673, "z": "50th" },
-    { "x": 32.5, "y": 93.496379457, "z": "50th" },
-    { "x": 33.5, "y": 94.158465459, "z": "50th" },
-    { "x": 34.5, "y": 94.808229231, "z": "50th" },
-    { "x": 35.5, "y": 95.446369813, "z": "50th" },
-    { "x": 0, "y": 51.7712574852631, "z": "75th" },
-    { "x": 0.5, "y": 54.4405431340853, "z": "75th" },
-    { "x": 1.5, "y": 58.3505940783497, "z": "75th" },
-    { "x": 2.5, "y": 61.33788093201, "z": "75th" },
-    { "x": 3.5, "y": 63.8254260405793, "z": "75th" },
-    { "x": 4.5, "y": 65.9913066287385, "z": "75th" },
-    { "x": 5.5, "y": 67.9293475879754, "z": "75th" },
-    { "x": 6.5, "y": 69.6957947027878, "z": "75th" },
-    { "x": 7.5, "y": 71.3273536202234, "z": "75th" },
-    { "x": 8.5, "y": 72.8494700064575, "z": "75th" },
-    { "x": 9.5, "y": 74.2806018978287, "z": "75th" },
-    { "x": 10.5, "y": 75.6346184545689, "z": "75th" },
-    { "x": 11.5, "y": 76.9222432757408, "z": "75th" },
-    { "x": 12.5, "y": 78.1519584863021, "z": "75th" },
-    { "x": 13.5, "y": 79.3306066926996, "z": "75th" },
-    { "x": 14.5, "y": 80.4637989233865, "z": "75th" },
-    { "x": 15.5, "y": 81.5562016910643, "z": "75th" },
-    { "x": 16.5, "y": 82.6117438683462, "z": "75th" },
-    { "x": 17.5, "y": 83.6337690011812, "z": "75th" },
-    { "x": 18.5, "y": 84.625149679001, "z": "75th" },
-    { "x": 19.5, "y": 85.5883747924065, "z": "75th" },
-    { "x": 20.5, "y": 86.5256171998123, "z": "75th" },
-    { "x": 21.5, "y": 87.4387868475588, "z": "75th" },
-    { "x": 22.5, "y": 88.3295747071967, "z": "75th" },
-    { "x": 23.5, "y": 89.1994789390605, "z": "75th" },
-    { "x": 24.5, "y": 90.0498454931164, "z": "75th" },
-    { "x": 25.5, "y": 90.8787005572373, "z": "75th" },
-    { "x": 26.5, "y": 91.6846760256571, "z": "75th" },
-    { "x": 27.5, "y": 92.4692889214632, "z": "75th" },
-    { "x": 28.5, "y": 93.2338474937995, "z": "75th" },
-    { "x": 29.5, "y": 93.9795084259939, "z": "75th" },
-    { "x": 30.5, "y": 94.7073165354158, "z": "75th" },
-    { "x": 31.5, "y": 95.4182388451418, "z": "75th" },
-    { "x": 32.5, "y": 96.1131921689973, "z": "75th" },
-    { "x": 33.5, "y": 96.7930650441201, "z": "75th" },
-    { "x": 34.5, "y": 97.4587349014246, "z": "75th" },
-    { "x": 35.5, "y": 98.1110826134703, "z": "75th" },
-    { "x": 0, "y": 53.3615347489539, "z": "90th" },
-    { "x": 0.5, "y": 56.0344409944283, "z": "90th" },
-    { "x": 1.5, "y": 59.9664032927709, "z": "90th" },
-    { "x": 2.5, "y": 62.9815810038618, "z": "90th" },
-    { "x": 3.5, "y": 65.4985800404481, "z": "90th" },
-    { "x": 4.5, "y": 67.6940478686016, "z": "90th" },
-    { "x": 5.5, "y": 69.6612233008438, "z": "90th" },
-    { "x": 6.5, "y": 71.4560916317014, "z": "90th" },
-    { "x": 7.5, "y": 73.1152468262671, "z": "90th" },
-    { "x": 8.5, "y": 74.6640975696173, "z": "90th" },
-    { "x": 9.5, "y": 76.1211038001601, "z": "90th" },
-    { "x": 10.5, "y": 77.5001582544642, "z": "90th" },
-    { "x": 11.5, "y": 78.8120169668475, "z": "90th" },
-    { "x": 12.5, "y": 80.0652015503418, "z": "90th" },
-    { "x": 13.5, "y": 81.2665956603052, "z": "90th" },
-    { "x": 14.5, "y": 82.4218515364754, "z": "90th" },
-    { "x": 15.5, "y": 83.5356759291034, "z": "90th" },
-    { "x": 16.5, "y": 84.6120363751048, "z": "90th" },
-    { "x": 17.5, "y": 85.6543131460014, "z": "90th" },
-    { "x": 18.5, "y": 86.6654134890358, "z": "90th" },
-    { "x": 19.5, "y": 87.6478588148759, "z": "90th" },
-    { "x": 20.5, "y": 88.6038524153657, "z": "90th" },
-    { "x": 21.5, "y": 89.5353326608376, "z": "90th" },
-    { "x": 22.5, "y": 90.4440154924459, "z": "90th" },
-    { "x": 23.5, "y": 91.3314274071703, "z": "90th" },
-    { "x": 24.5, "y": 92.1989349712012, "z": "90th" },
-    { "x": 25.5, "y": 93.0714335250574, "z": "90th" },
-    { "x": 26.5, "y": 93.9181746482636, "z": "90th" },
-    { "x": 27.5, "y": 94.7406366331136, "z": "90th" },
-    { "x": 28.5, "y": 95.5401622624724, "z": "90th" },
-    { "x": 29.5, "y": 96.3179956489321, "z": "90th" },
-    { "x": 30.5, "y": 97.0753111049134, "z": "90th" },
-    { "x": 31.5, "y": 97.8132366010555, "z": "90th" },
-    { "x": 32.5, "y": 98.5328725420431, "z": "90th" },
-    { "x": 33.5, "y": 99.2353065322745, "z": "90th" },
-    { "x": 34.5, "y": 99.9216248249548, "z": "90th" },
-    { "x": 35.5, "y": 100.592921223266, "z": "90th" },
-    { "x": 0, "y": 54.3072119715771, "z": "95th" },
-    { "x": 0.5, "y": 56.9990773731045, "z": "95th" },
-    { "x": 1.5, "y": 60.9646537916633, "z": "95th" },
-    { "x": 2.5, "y": 64.0078854888541, "z": "95th" },
-    { "x": 3.5, "y": 66.5488903032389, "z": "95th" },
-    { "x": 4.5, "y": 68.7653775717319, "z": "95th" },
-    { "x": 5.5, "y": 70.7512829895234, "z": "95th" },
-    { "x": 6.5, "y": 72.5630679790426, "z": "95th" },
-    { "x": 7.5, "y": 74.2376674565529, "z": "95th" },
-    { "x": 8.5, "y": 75.8007440832438, "z": "95th" },
-    { "x": 9.5, "y": 77.2709525026483, "z": "95th" },
-    { "x": 10.5, "y": 78.6623393606722, "z": "95th" },
-    { "x": 11.5, "y": 79.9857821808662, "z": "95th" },
-    { "x": 12.5, "y": 81.2499031578935, "z": "95th" },
-    { "x": 13.5, "y": 82.4616686472545, "z": "95th" },
-    { "x": 14.5, "y": 83.6268000285099, "z": "95th" },
-    { "x": 15.5, "y": 84.7500624094899, "z": "95th" },
-    { "x": 16.5, "y": 85.8354730177395, "z": "95th" },
-    { "x": 17.5, "y": 86.8864547305889, "z": "95th" },
-    { "x": 18.5, "y": 87.9059515746162, "z": "95th" },
-    { "x": 19.5, "y": 88.8965168737897, "z": "95th" },
-    { "x": 20.5, "y": 89.8603817616653, "z": "95th" },
-    { "x": 21.5, "y": 90.7995090121291, "z": "95th" },
-    { "x": 22.5, "y": 91.7156346758992, "z": "95th" },
-    { "x": 23.5, "y": 92.6103075004739, "z": "95th" },
-    { "x": 24.5, "y": 93.4849087336022, "z": "95th" },
-    { "x": 25.5, "y": 94.3877452248001, "z": "95th" },
-    { "x": 26.5, "y": 95.2630007597693, "z": "95th" },
-    { "x": 27.5, "y": 96.1121011988834, "z": "95th" },
-    { "x": 28.5, "y": 96.9363947623564, "z": "95th" },
-    { "x": 29.5, "y": 97.7371728943947, "z": "95th" },
-    { "x": 30.5, "y": 98.5156910420506, "z": "95th" },
-    { "x": 31.5, "y": 99.2731837770055, "z": "95th" },
-    { "x": 32.5, "y": 100.010876547669, "z": "95th" },
-    { "x": 33.5, "y": 100.729994719356, "z": "95th" },
-    { "x": 34.5, "y": 101.431770491437, "z": "95th" },
-    { "x": 35.5, "y": 102.117447218662, "z": "95th" },
-    { "x": 0, "y": 54.9190044535762, "z": "97th" },
-    { "x": 0.5, "y": 57.6298432273064, "z": "97th" },
-    { "x": 1.5, "y": 61.6259148751262, "z": "97th" },
-    { "x": 2.5, "y": 64.6924090907813, "z": "97th" },
-    { "x": 3.5, "y": 67.2518959664659, "z": "97th" },
-    { "x": 4.5, "y": 69.4835396581404, "z": "97th" },
-    { "x": 5.5, "y": 71.4821822482071, "z": "97th" },
-    { "x": 6.5, "y": 73.3048834934378, "z": "97th" },
-    { "x": 7.5, "y": 74.9889928197064, "z": "97th" },
-    { "x": 8.5, "y": 76.56047112136, "z": "97th" },
-    { "x": 9.5, "y": 78.0381936701244, "z": "97th" },
-    { "x": 10.5, "y": 79.4363749829669, "z": "97th" },
-    { "x": 11.5, "y": 80.7660206662514, "z": "97th" },
-    { "x": 12.5, "y": 82.0358547387811, "z": "97th" },
-    { "x": 13.5, "y": 83.2529242781077, "z": "97th" },
-    { "x": 14.5, "y": 84.423015699161, "z": "97th" },
-    { "x": 15.5, "y": 85.5509470424253, "z": "97th" },
-    { "x": 16.5, "y": 86.6407790212955, "z": "97th" },
-    { "x": 17.5, "y": 87.6959705150485, "z": "97th" },
-    { "x": 18.5, "y": 88.719495577574, "z": "97th" },
-    { "x": 19.5, "y": 89.7139327257165, "z": "97th" },
-    { "x": 20.5, "y": 90.6815343572731, "z": "97th" },
-    { "x": 21.5, "y": 91.6242812892597, "z": "97th" },
-    { "x": 22.5, "y": 92.5439238858898, "z": "97th" },
-    { "x": 23.5, "y": 93.4420266333203, "z": "97th" },
-    { "x": 24.5, "y": 94.3199804224951, "z": "97th" },
-    { "x": 25.5, "y": 95.244192989933, "z": "97th" },
-    { "x": 26.5, "y": 96.1396161063495, "z": "97th" },
-    { "x": 27.5, "y": 97.0076278952572, "z": "97th" },
-    { "x": 28.5, "y": 97.8495720091331, "z": "97th" },
-    { "x": 29.5, "y": 98.6667667910477, "z": "97th" },
-    { "x": 30.5, "y": 99.460520266677, "z": "97th" },
-    { "x": 31.5, "y": 100.232139112685, "z": "97th" },
-    { "x": 32.5, "y": 100.982935160837, "z": "97th" },
-    { "x": 33.5, "y": 101.714230134913, "z": "97th" },
-    { "x": 34.5, "y": 102.427359159181, "z": "97th" },
-    { "x": 35.5, "y": 103.12367158862, "z": "97th" }
-]
@@ -1,1964 +0,0 @@
-cdc_boys_stature_age = [
-    {'x': 24.0, 'y': 79.91084447, 'z': '3rd'},
-    {'x': 24.0, 'y': 80.72977321, 'z': '5th'},
-    {'x': 24.0, 'y': 81.99171445, 'z': '10th'},
-    {'x': 24.0, 'y': 84.10289217, 'z': '25th'},
-    {'x': 24.0, 'y': 86.45220101, 'z': '50th'},
-    {'x': 24.0, 'y': 88.80524943, 'z': '75th'},
-    {'x': 24.0, 'y': 90.92619137, 'z': '90th'},
-    {'x': 24.0, 'y': 92.19687928, 'z': '95th'},
-    {'x': 24.0, 'y': 93.02265441, 'z': '97th'},
-    {'x': 24.5, 'y': 80.26037074, 'z': '3rd'},
-    {'x': 24.5, 'y': 81.08868489, 'z': '5th'},
-    {'x': 24.5, 'y': 82.36400989, 'z': '10th'},
-    {'x': 24.5, 'y': 84.49470553, 'z': '25th'},
-    {'x': 24.5, 'y': 86.86160934, 'z': '50th'},
-    {'x': 24.5, 'y': 89.22804829, 'z': '75th'},
-    {'x': 24.5, 'y': 91.35753004, 'z': '90th'},
-    {'x': 24.5, 'y': 92.63176749, 'z': '95th'},
-    {'x': 24.5, 'y': 93.45923029, 'z': '97th'},
-    {'x': 25.5, 'y': 81.0052937, 'z': '3rd'},
-    {'x': 25.5, 'y': 81.83445202, 'z': '5th'},
-    {'x': 25.5, 'y': 83.11387064, 'z': '10th'},
-    {'x': 25.5, 'y': 85.25887745, 'z': '25th'},
-    {'x': 25.5, 'y': 87.65247282, 'z': '50th'},
-    {'x': 25.5, 'y': 90.05675457, 'z': '75th'},
-    {'x': 25.5, 'y': 92.22966054, 'z': '90th'},
-    {'x': 25.5, 'y': 93.53406648, 'z': '95th'},
-    {'x': 25.5, 'y': 94.38278047, 'z': '97th'},
-    {'x': 26.5, 'y': 81.7341574, 'z': '3rd'},
-    {'x': 26.5, 'y': 82.56406112, 'z': '5th'},
-    {'x': 26.5, 'y': 83.84716151, 'z': '10th'},
-    {'x': 26.5, 'y': 86.0051731, 'z': '25th'},
-    {'x': 26.5, 'y': 88.42326434, 'z': '50th'},
-    {'x': 26.5, 'y': 90.8626041, 'z': '75th'},
-    {'x': 26.5, 'y': 93.07608163, 'z': '90th'},
-    {'x': 26.5, 'y': 94.40884914, 'z': '95th'},
-    {'x': 26.5, 'y': 95.27761711, 'z': '97th'},
-    {'x': 27.5, 'y': 82.44845648, 'z': '3rd'},
-    {'x': 27.5, 'y': 83.27898582, 'z': '5th'},
-    {'x': 27.5, 'y': 84.56534433, 'z': '10th'},
-    {'x': 27.5, 'y': 86.73506945, 'z': '25th'},
-    {'x': 27.5, 'y': 89.17549228, 'z': '50th'},
-    {'x': 27.5, 'y': 91.64711353, 'z': '75th'},
-    {'x': 27.5, 'y': 93.89827114, 'z': '90th'},
-    {'x': 27.5, 'y': 95.25754106, 'z': '95th'},
-    {'x': 27.5, 'y': 96.14511823, 'z': '97th'},
-    {'x': 28.5, 'y': 83.14944982, 'z': '3rd'},
-    {'x': 28.5, 'y': 83.98045262, 'z': '5th'},
-    {'x': 28.5, 'y': 85.26961974, 'z': '10th'},
-    {'x': 28.5, 'y': 87.44977223, 'z': '25th'},
-    {'x': 28.5, 'y': 89.91040853, 'z': '50th'},
-    {'x': 28.5, 'y': 92.41159029, 'z': '75th'},
-    {'x': 28.5, 'y': 94.69757027, 'z': '90th'},
-    {'x': 28.5, 'y': 96.08148848, 'z': '95th'},
-    {'x': 28.5, 'y': 96.98662531, 'z': '97th'},
-    {'x': 29.5, 'y': 83.83819399, 'z': '3rd'},
-    {'x': 29.5, 'y': 84.66948449, 'z': '5th'},
-    {'x': 29.5, 'y': 85.96098331, 'z': '10th'},
-    {'x': 29.5, 'y': 88.15028421, 'z': '25th'},
-    {'x': 29.5, 'y': 90.62907762, 'z': '50th'},
-    {'x': 29.5, 'y': 93.15718995, 'z': '75th'},
-    {'x': 29.5, 'y': 95.47522083, 'z': '90th'},
-    {'x': 29.5, 'y': 96.88197981, 'z': '95th'},
-    {'x': 29.5, 'y': 97.8034532, 'z': '97th'},
-    {'x': 30.5, 'y': 84.51558277, 'z': '3rd'},
-    {'x': 30.5, 'y': 85.3469433, 'z': '5th'},
-    {'x': 30.5, 'y': 86.64027154, 'z': '10th'},
-    {'x': 30.5, 'y': 88.83745411, 'z': '25th'},
-    {'x': 30.5, 'y': 91.33242379, 'z': '50th'},
-    {'x': 30.5, 'y': 93.88495599, 'z': '75th'},
-    {'x': 30.5, 'y': 96.23239427, 'z': '90th'},
-    {'x': 30.5, 'y': 97.66026663, 'z': '95th'},
-    {'x': 30.5, 'y': 98.59690538, 'z': '97th'},
-    {'x': 31.5, 'y': 85.18238019, 'z': '3rd'},
-    {'x': 31.5, 'y': 86.01356554, 'z': '5th'},
-    {'x': 31.5, 'y': 87.30820085, 'z': '10th'},
-    {'x': 31.5, 'y': 89.5120186, 'z': '25th'},
-    {'x': 31.5, 'y': 92.02127167, 'z': '50th'},
-    {'x': 31.5, 'y': 94.59585394, 'z': '75th'},
-    {'x': 31.5, 'y': 96.97021533, 'z': '90th'},
-    {'x': 31.5, 'y': 98.4175791, 'z': '95th'},
-    {'x': 31.5, 'y': 99.36828331, 'z': '97th'},
-    {'x': 32.5, 'y': 85.83925011, 'z': '3rd'},
-    {'x': 32.5, 'y': 86.66999332, 'z': '5th'},
-    {'x': 32.5, 'y': 87.96540055, 'z': '10th'},
-    {'x': 32.5, 'y': 90.17463683, 'z': '25th'},
-    {'x': 32.5, 'y': 92.69637946, 'z': '50th'},
-    {'x': 32.5, 'y': 95.29079906, 'z': '75th'},
-    {'x': 32.5, 'y': 97.68978097, 'z': '90th'},
-    {'x': 32.5, 'y': 99.15513792, 'z': '95th'},
-    {'x': 32.5, 'y': 100.1188932, 'z': '97th'},
-    {'x': 33.5, 'y': 86.48678276, 'z': '3rd'},
-    {'x': 33.5, 'y': 87.31680155, 'z': '5th'},
-    {'x': 33.5, 'y': 88.61244073, 'z': '10th'},
-    {'x': 33.5, 'y': 90.82591867, 'z': '25th'},
-    {'x': 33.5, 'y': 93.35846546, 'z': '50th'},
-    {'x': 33.5, 'y': 95.97067824, 'z': '75th'},
-    {'x': 33.5, 'y': 98.39217521, 'z': '90th'},
-    {'x': 33.5, 'y': 99.87416352, 'z': '95th'},
-    {'x': 33.5, 'y': 100.8500508, 'z': '97th'},
-    {'x': 34.5, 'y': 87.12551862, 'z': '3rd'},
-    {'x': 34.5, 'y': 87.95452162, 'z': '5th'},
-    {'x': 34.5, 'y': 89.24985581, 'z': '10th'},
-    {'x': 34.5, 'y': 91.46644774, 'z': '25th'},
-    {'x': 34.5, 'y': 94.00822923, 'z': '50th'},
-    {'x': 34.5, 'y': 96.63636727, 'z': '75th'},
-    {'x': 34.5, 'y': 99.0784807, 'z': '90th'},
-    {'x': 34.5, 'y': 100.5758831, 'z': '95th'},
-    {'x': 34.5, 'y': 101.5630853, 'z': '97th'},
-    {'x': 35.5, 'y': 87.75596799, 'z': '3rd'},
-    {'x': 35.5, 'y': 88.58366128, 'z': '5th'},
-    {'x': 35.5, 'y': 89.87816458, 'z': '10th'},
-    {'x': 35.5, 'y': 92.09680119, 'z': '25th'},
-    {'x': 35.5, 'y': 94.64636981, 'z': '50th'},
-    {'x': 35.5, 'y': 97.28874542, 'z': '75th'},
-    {'x': 35.5, 'y': 99.74978771, 'z': '90th'},
-    {'x': 35.5, 'y': 101.2615351, 'z': '95th'},
-    {'x': 35.5, 'y': 102.2593402, 'z': '97th'},
-    {'x': 36.5, 'y': 88.37863651, 'z': '3rd'},
-    {'x': 36.5, 'y': 89.20472611, 'z': '5th'},
-    {'x': 36.5, 'y': 90.49788649, 'z': '10th'},
-    {'x': 36.5, 'y': 92.71755946, 'z': '25th'},
-    {'x': 36.5, 'y': 95.27359106, 'z': '50th'},
-    {'x': 36.5, 'y': 97.92869928, 'z': '75th'},
-    {'x': 36.5, 'y': 100.4071992, 'z': '90th'},
-    {'x': 36.5, 'y': 101.9323762, 'z': '95th'},
-    {'x': 36.5, 'y': 102.940182, 'z': '97th'},
-    {'x': 37.5, 'y': 88.93297086, 'z': '3rd'},
-    {'x': 37.5, 'y': 89.77301106, 'z': '5th'},
-    {'x': 37.5, 'y': 91.08607735, 'z': '10th'},
-    {'x': 37.5, 'y': 93.33440049, 'z': '25th'},
-    {'x': 37.5, 'y': 95.91474929, 'z': '50th'},
-    {'x': 37.5, 'y': 98.58524582, 'z': '75th'},
-    {'x': 37.5, 'y': 101.0690065, 'z': '90th'},
-    {'x': 37.5, 'y': 102.5930445, 'z': '95th'},
-    {'x': 37.5, 'y': 103.5982668, 'z': '97th'},
-    {'x': 38.5, 'y': 89.47916294, 'z': '3rd'},
-    {'x': 38.5, 'y': 90.33305814, 'z': '5th'},
-    {'x': 38.5, 'y': 91.66588835, 'z': '10th'},
-    {'x': 38.5, 'y': 93.94268367, 'z': '25th'},
-    {'x': 38.5, 'y': 96.54734328, 'z': '50th'},
-    {'x': 38.5, 'y': 99.23357783, 'z': '75th'},
-    {'x': 38.5, 'y': 101.7233762, 'z': '90th'},
-    {'x': 38.5, 'y': 103.2470198, 'z': '95th'},
-    {'x': 38.5, 'y': 104.2502776, 'z': '97th'},
-    {'x': 39.5, 'y': 90.01765704, 'z': '3rd'},
-    {'x': 39.5, 'y': 90.88532031, 'z': '5th'},
-    {'x': 39.5, 'y': 92.23778882, 'z': '10th'},
-    {'x': 39.5, 'y': 94.54291151, 'z': '25th'},
-    {'x': 39.5, 'y': 97.17191309, 'z': '50th'},
-    {'x': 39.5, 'y': 99.87425862, 'z': '75th'},
-    {'x': 39.5, 'y': 102.3708617, 'z': '90th'},
-    {'x': 39.5, 'y': 103.8948257, 'z': '95th'},
-    {'x': 39.5, 'y': 104.8967054, 'z': '97th'},
-    {'x': 40.5, 'y': 90.54890623, 'z': '3rd'},
-    {'x': 40.5, 'y': 91.43025486, 'z': '5th'},
-    {'x': 40.5, 'y': 92.80224597, 'z': '10th'},
-    {'x': 40.5, 'y': 95.1355744, 'z': '25th'},
-    {'x': 40.5, 'y': 97.78897727, 'z': '50th'},
-    {'x': 40.5, 'y': 100.5078239, 'z': '75th'},
-    {'x': 40.5, 'y': 103.011988, 'z': '90th'},
-    {'x': 40.5, 'y': 104.5369608, 'z': '95th'},
-    {'x': 40.5, 'y': 105.5380208, 'z': '97th'},
-    {'x': 41.5, 'y': 91.07337426, 'z': '3rd'},
-    {'x': 41.5, 'y': 91.96832362, 'z': '5th'},
-    {'x': 41.5, 'y': 93.35972283, 'z': '10th'},
-    {'x': 41.5, 'y': 95.72114636, 'z': '25th'},
-    {'x': 41.5, 'y': 98.3990283, 'z': '50th'},
-    {'x': 41.5, 'y': 101.1347788, 'z': '75th'},
-    {'x': 41.5, 'y': 103.6472524, 'z': '90th'},
-    {'x': 41.5, 'y': 105.1739016, 'z': '95th'},
-    {'x': 41.5, 'y': 106.1746779, 'z': '97th'},
-    {'x': 42.5, 'y': 91.59152368, 'z': '3rd'},
-    {'x': 42.5, 'y': 92.4999858, 'z': '5th'},
-    {'x': 42.5, 'y': 93.91067749, 'z': '10th'},
-    {'x': 42.5, 'y': 96.30009195, 'z': '25th'},
-    {'x': 42.5, 'y': 99.00254338, 'z': '50th'},
-    {'x': 42.5, 'y': 101.7556073, 'z': '75th'},
-    {'x': 42.5, 'y': 104.2771267, 'z': '90th'},
-    {'x': 42.5, 'y': 105.8060983, 'z': '95th'},
-    {'x': 42.5, 'y': 106.8071048, 'z': '97th'},
-    {'x': 43.5, 'y': 92.10382052, 'z': '3rd'},
-    {'x': 43.5, 'y': 93.02569976, 'z': '5th'},
-    {'x': 43.5, 'y': 94.45556109, 'z': '10th'},
-    {'x': 43.5, 'y': 96.87286014, 'z': '25th'},
-    {'x': 43.5, 'y': 99.599977, 'z': '50th'},
-    {'x': 43.5, 'y': 102.370767, 'z': '75th'},
-    {'x': 43.5, 'y': 104.9020571, 'z': '90th'},
-    {'x': 43.5, 'y': 106.4339786, 'z': '95th'},
-    {'x': 43.5, 'y': 107.4357106, 'z': '97th'},
-    {'x': 44.5, 'y': 92.6107295, 'z': '3rd'},
-    {'x': 44.5, 'y': 93.54591978, 'z': '5th'},
-    {'x': 44.5, 'y': 94.99481672, 'z': '10th'},
-    {'x': 44.5, 'y': 97.43988586, 'z': '25th'},
-    {'x': 44.5, 'y': 100.191764, 'z': '50th'},
-    {'x': 44.5, 'y': 102.9806917, 'z': '75th'},
-    {'x': 44.5, 'y': 105.5224653, 'z': '90th'},
-    {'x': 44.5, 'y': 107.0579468, 'z': '95th'},
-    {'x': 44.5, 'y': 108.0608826, 'z': '97th'},
-    {'x': 45.5, 'y': 93.11271174, 'z': '3rd'},
-    {'x': 45.5, 'y': 94.06109422, 'z': '5th'},
-    {'x': 45.5, 'y': 95.52887815, 'z': '10th'},
-    {'x': 45.5, 'y': 98.00158958, 'z': '25th'},
-    {'x': 45.5, 'y': 100.7783198, 'z': '50th'},
-    {'x': 45.5, 'y': 103.5857927, 'z': '75th'},
-    {'x': 45.5, 'y': 106.1387493, 'z': '90th'},
-    {'x': 45.5, 'y': 107.6783842, 'z': '95th'},
-    {'x': 45.5, 'y': 108.6829866, 'z': '97th'},
-    {'x': 46.5, 'y': 93.61022262, 'z': '3rd'},
-    {'x': 46.5, 'y': 94.57166376, 'z': '5th'},
-    {'x': 46.5, 'y': 96.05816868, 'z': '10th'},
-    {'x': 46.5, 'y': 98.55837705, 'z': '25th'},
-    {'x': 46.5, 'y': 101.3600411, 'z': '50th'},
-    {'x': 46.5, 'y': 104.186459, 'z': '75th'},
-    {'x': 46.5, 'y': 106.7512837, 'z': '90th'},
-    {'x': 46.5, 'y': 108.2956497, 'z': '95th'},
-    {'x': 46.5, 'y': 109.3023669, 'z': '97th'},
-    {'x': 47.5, 'y': 94.10370972, 'z': '3rd'},
-    {'x': 47.5, 'y': 95.07805975, 'z': '5th'},
-    {'x': 47.5, 'y': 96.58310008, 'z': '10th'},
-    {'x': 47.5, 'y': 99.11063889, 'z': '25th'},
-    {'x': 47.5, 'y': 101.9373058, 'z': '50th'},
-    {'x': 47.5, 'y': 104.7830584, 'z': '75th'},
-    {'x': 47.5, 'y': 107.3604207, 'z': '90th'},
-    {'x': 47.5, 'y': 108.9100797, 'z': '95th'},
-    {'x': 47.5, 'y': 109.9193463, 'z': '97th'},
-    {'x': 48.5, 'y': 94.59361093, 'z': '3rd'},
-    {'x': 48.5, 'y': 95.58070273, 'z': '5th'},
-    {'x': 48.5, 'y': 97.1040715, 'z': '10th'},
-    {'x': 48.5, 'y': 99.65875031, 'z': '25th'},
-    {'x': 48.5, 'y': 102.5104735, 'z': '50th'},
-    {'x': 48.5, 'y': 105.3759377, 'z': '75th'},
-    {'x': 48.5, 'y': 107.9664906, 'z': '90th'},
-    {'x': 48.5, 'y': 109.5219891, 'z': '95th'},
-    {'x': 48.5, 'y': 110.5342263, 'z': '97th'},
-    {'x': 49.5, 'y': 95.08035263, 'z': '3rd'},
-    {'x': 49.5, 'y': 96.08000091, 'z': '5th'},
-    {'x': 49.5, 'y': 97.62146857, 'z': '10th'},
-    {'x': 49.5, 'y': 100.2030707, 'z': '25th'},
-    {'x': 49.5, 'y': 103.0798852, 'z': '50th'},
-    {'x': 49.5, 'y': 105.9654232, 'z': '75th'},
-    {'x': 49.5, 'y': 108.569802, 'z': '90th'},
-    {'x': 49.5, 'y': 110.1316713, 'z': '95th'},
-    {'x': 49.5, 'y': 111.1472879, 'z': '97th'},
-    {'x': 50.5, 'y': 95.56434805, 'z': '3rd'},
-    {'x': 50.5, 'y': 96.57634888, 'z': '5th'},
-    {'x': 50.5, 'y': 98.13566246, 'z': '10th'},
-    {'x': 50.5, 'y': 100.7439435, 'z': '25th'},
-    {'x': 50.5, 'y': 103.645864, 'z': '50th'},
-    {'x': 50.5, 'y': 106.5518212, 'z': '75th'},
-    {'x': 50.5, 'y': 109.1706428, 'z': '90th'},
-    {'x': 50.5, 'y': 110.7393989, 'z': '95th'},
-    {'x': 50.5, 'y': 111.7587911, 'z': '97th'},
-    {'x': 51.5, 'y': 96.04599748, 'z': '3rd'},
-    {'x': 51.5, 'y': 97.07012724, 'z': '5th'},
-    {'x': 51.5, 'y': 98.64700876, 'z': '10th'},
-    {'x': 51.5, 'y': 101.281694, 'z': '25th'},
-    {'x': 51.5, 'y': 104.208713, 'z': '50th'},
-    {'x': 51.5, 'y': 107.1354171, 'z': '75th'},
-    {'x': 51.5, 'y': 109.76928, 'z': '90th'},
-    {'x': 51.5, 'y': 111.3454248, 'z': '95th'},
-    {'x': 51.5, 'y': 112.3689778, 'z': '97th'},
-    {'x': 52.5, 'y': 96.52567713, 'z': '3rd'},
-    {'x': 52.5, 'y': 97.56169654, 'z': '5th'},
-    {'x': 52.5, 'y': 99.15584797, 'z': '10th'},
-    {'x': 52.5, 'y': 101.8166373, 'z': '25th'},
-    {'x': 52.5, 'y': 104.7687256, 'z': '50th'},
-    {'x': 52.5, 'y': 107.7164829, 'z': '75th'},
-    {'x': 52.5, 'y': 110.3659614, 'z': '90th'},
-    {'x': 52.5, 'y': 111.9499779, 'z': '95th'},
-    {'x': 52.5, 'y': 112.9780622, 'z': '97th'},
-    {'x': 53.5, 'y': 97.00375833, 'z': '3rd'},
-    {'x': 53.5, 'y': 98.05140652, 'z': '5th'},
-    {'x': 53.5, 'y': 99.66250203, 'z': '10th'},
-    {'x': 53.5, 'y': 102.3490611, 'z': '25th'},
-    {'x': 53.5, 'y': 105.3261638, 'z': '50th'},
-    {'x': 53.5, 'y': 108.2952617, 'z': '75th'},
-    {'x': 53.5, 'y': 110.9609139, 'z': '90th'},
-    {'x': 53.5, 'y': 112.5532737, 'z': '95th'},
-    {'x': 53.5, 'y': 113.5862516, 'z': '97th'},
-    {'x': 54.5, 'y': 97.48058355, 'z': '3rd'},
-    {'x': 54.5, 'y': 98.53958366, 'z': '5th'},
-    {'x': 54.5, 'y': 100.1672766, 'z': '10th'},
-    {'x': 54.5, 'y': 102.8792439, 'z': '25th'},
-    {'x': 54.5, 'y': 105.8812823, 'z': '50th'},
-    {'x': 54.5, 'y': 108.8719858, 'z': '75th'},
-    {'x': 54.5, 'y': 111.5543461, 'z': '90th'},
-    {'x': 54.5, 'y': 113.1555037, 'z': '95th'},
-    {'x': 54.5, 'y': 114.1937245, 'z': '97th'},
-    {'x': 55.5, 'y': 97.95647862, 'z': '3rd'},
-    {'x': 55.5, 'y': 99.026537, 'z': '5th'},
-    {'x': 55.5, 'y': 100.6704587, 'z': '10th'},
-    {'x': 55.5, 'y': 103.4074438, 'z': '25th'},
-    {'x': 55.5, 'y': 106.4343146, 'z': '50th'},
-    {'x': 55.5, 'y': 109.4468665, 'z': '75th'},
-    {'x': 55.5, 'y': 112.1464475, 'z': '90th'},
-    {'x': 55.5, 'y': 113.7568423, 'z': '95th'},
-    {'x': 55.5, 'y': 114.800644, 'z': '97th'},
-    {'x': 56.5, 'y': 98.43174768, 'z': '3rd'},
-    {'x': 56.5, 'y': 99.51255522, 'z': '5th'},
-    {'x': 56.5, 'y': 101.1723164, 'z': '10th'},
-    {'x': 56.5, 'y': 103.9339016, 'z': '25th'},
-    {'x': 56.5, 'y': 106.9854769, 'z': '50th'},
-    {'x': 56.5, 'y': 110.0200973, 'z': '75th'},
-    {'x': 56.5, 'y': 112.7373894, 'z': '90th'},
-    {'x': 56.5, 'y': 114.3574452, 'z': '95th'},
-    {'x': 56.5, 'y': 115.4071549, 'z': '97th'},
-    {'x': 57.5, 'y': 98.90667254, 'z': '3rd'},
-    {'x': 57.5, 'y': 99.99790605, 'z': '5th'},
-    {'x': 57.5, 'y': 101.6730987, 'z': '10th'},
-    {'x': 57.5, 'y': 104.4588401, 'z': '25th'},
-    {'x': 57.5, 'y': 107.534968, 'z': '50th'},
-    {'x': 57.5, 'y': 110.5918541, 'z': '75th'},
-    {'x': 57.5, 'y': 113.327325, 'z': '90th'},
-    {'x': 57.5, 'y': 114.9574502, 'z': '95th'},
-    {'x': 57.5, 'y': 116.0133837, 'z': '97th'},
-    {'x': 58.5, 'y': 99.3815118, 'z': '3rd'},
-    {'x': 58.5, 'y': 100.4828356, 'z': '5th'},
-    {'x': 58.5, 'y': 102.1730346, 'z': '10th'},
-    {'x': 58.5, 'y': 104.9824642, 'z': '25th'},
-    {'x': 58.5, 'y': 108.0829695, 'z': '50th'},
-    {'x': 58.5, 'y': 111.1622955, 'z': '75th'},
-    {'x': 58.5, 'y': 113.9163901, 'z': '90th'},
-    {'x': 58.5, 'y': 115.5569776, 'z': '95th'},
-    {'x': 58.5, 'y': 116.6194398, 'z': '97th'},
-    {'x': 59.5, 'y': 99.85650001, 'z': '3rd'},
-    {'x': 59.5, 'y': 100.9675675, 'z': '5th'},
-    {'x': 59.5, 'y': 102.6723326, 'z': '10th'},
-    {'x': 59.5, 'y': 105.5049607, 'z': '25th'},
-    {'x': 59.5, 'y': 108.6296457, 'z': '50th'},
-    {'x': 59.5, 'y': 111.731563, 'z': '75th'},
-    {'x': 59.5, 'y': 114.5047033, 'z': '90th'},
-    {'x': 59.5, 'y': 116.1561304, 'z': '95th'},
-    {'x': 59.5, 'y': 117.2254154, 'z': '97th'},
-    {'x': 60.5, 'y': 100.331847, 'z': '3rd'},
-    {'x': 60.5, 'y': 101.4523027, 'z': '5th'},
-    {'x': 60.5, 'y': 103.171181, 'z': '10th'},
-    {'x': 60.5, 'y': 106.026498, 'z': '25th'},
-    {'x': 60.5, 'y': 109.1751441, 'z': '50th'},
-    {'x': 60.5, 'y': 112.2997816, 'z': '75th'},
-    {'x': 60.5, 'y': 115.0923665, 'z': '90th'},
-    {'x': 60.5, 'y': 116.7549954, 'z': '95th'},
-    {'x': 60.5, 'y': 117.831386, 'z': '97th'},
-    {'x': 61.5, 'y': 100.8077371, 'z': '3rd'},
-    {'x': 61.5, 'y': 101.9372185, 'z': '5th'},
-    {'x': 61.5, 'y': 103.6697469, 'z': '10th'},
-    {'x': 61.5, 'y': 106.5472265, 'z': '25th'},
-    {'x': 61.5, 'y': 109.7195954, 'z': '50th'},
-    {'x': 61.5, 'y': 112.86706, 'z': '75th'},
-    {'x': 61.5, 'y': 115.6794655, 'z': '90th'},
-    {'x': 61.5, 'y': 117.3536426, 'z': '95th'},
-    {'x': 61.5, 'y': 118.4374113, 'z': '97th'},
-    {'x': 62.5, 'y': 101.2843288, 'z': '3rd'},
-    {'x': 62.5, 'y': 102.4224687, 'z': '5th'},
-    {'x': 62.5, 'y': 104.1681762, 'z': '10th'},
-    {'x': 62.5, 'y': 107.0672782, 'z': '25th'},
-    {'x': 62.5, 'y': 110.2631136, 'z': '50th'},
-    {'x': 62.5, 'y': 113.4334909, 'z': '75th'},
-    {'x': 62.5, 'y': 116.2660704, 'z': '90th'},
-    {'x': 62.5, 'y': 117.9521268, 'z': '95th'},
-    {'x': 62.5, 'y': 119.0435349, 'z': '97th'},
-    {'x': 63.5, 'y': 101.7617545, 'z': '3rd'},
-    {'x': 63.5, 'y': 102.908183, 'z': '5th'},
-    {'x': 63.5, 'y': 104.6665937, 'z': '10th'},
-    {'x': 63.5, 'y': 107.5867669, 'z': '25th'},
-    {'x': 63.5, 'y': 110.8057967, 'z': '50th'},
-    {'x': 63.5, 'y': 113.9991516, 'z': '75th'},
-    {'x': 63.5, 'y': 116.8522359, 'z': '90th'},
-    {'x': 63.5, 'y': 118.5504872, 'z': '95th'},
-    {'x': 63.5, 'y': 119.6497853, 'z': '97th'},
-    {'x': 64.5, 'y': 102.2401199, 'z': '3rd'},
-    {'x': 64.5, 'y': 103.3944666, 'z': '5th'},
-    {'x': 64.5, 'y': 105.1651027, 'z': '10th'},
-    {'x': 64.5, 'y': 108.1057886, 'z': '25th'},
-    {'x': 64.5, 'y': 111.3477265, 'z': '50th'},
-    {'x': 64.5, 'y': 114.5641044, 'z': '75th'},
-    {'x': 64.5, 'y': 117.4380018, 'z': '90th'},
-    {'x': 64.5, 'y': 119.1487482, 'z': '95th'},
-    {'x': 64.5, 'y': 120.2561762, 'z': '97th'},
-    {'x': 65.5, 'y': 102.719504, 'z': '3rd'},
-    {'x': 65.5, 'y': 103.8814006, 'z': '5th'},
-    {'x': 65.5, 'y': 105.6637849, 'z': '10th'},
-    {'x': 65.5, 'y': 108.6244211, 'z': '25th'},
-    {'x': 65.5, 'y': 111.8889694, 'z': '50th'},
-    {'x': 65.5, 'y': 115.128397, 'z': '75th'},
-    {'x': 65.5, 'y': 118.0233939, 'z': '90th'},
-    {'x': 65.5, 'y': 119.7469201, 'z': '95th'},
-    {'x': 65.5, 'y': 120.8627069, 'z': '97th'},
-    {'x': 66.5, 'y': 103.1999595, 'z': '3rd'},
-    {'x': 66.5, 'y': 104.3690418, 'z': '5th'},
-    {'x': 66.5, 'y': 106.1627011, 'z': '10th'},
-    {'x': 66.5, 'y': 109.1427246, 'z': '25th'},
-    {'x': 66.5, 'y': 112.4295761, 'z': '50th'},
-    {'x': 66.5, 'y': 115.6920629, 'z': '75th'},
-    {'x': 66.5, 'y': 118.6084238, 'z': '90th'},
-    {'x': 66.5, 'y': 120.3449993, 'z': '95th'},
-    {'x': 66.5, 'y': 121.4693629, 'z': '97th'},
-    {'x': 67.5, 'y': 103.6815122, 'z': '3rd'},
-    {'x': 67.5, 'y': 104.8574227, 'z': '5th'},
-    {'x': 67.5, 'y': 106.6618905, 'z': '10th'},
-    {'x': 67.5, 'y': 109.6607418, 'z': '25th'},
-    {'x': 67.5, 'y': 112.9695827, 'z': '50th'},
-    {'x': 67.5, 'y': 116.2551221, 'z': '75th'},
-    {'x': 67.5, 'y': 119.1930903, 'z': '90th'},
-    {'x': 67.5, 'y': 120.9429688, 'z': '95th'},
-    {'x': 67.5, 'y': 122.0761162, 'z': '97th'},
-    {'x': 68.5, 'y': 104.164162, 'z': '3rd'},
-    {'x': 68.5, 'y': 105.3465519, 'z': '5th'},
-    {'x': 68.5, 'y': 107.1613717, 'z': '10th'},
-    {'x': 68.5, 'y': 110.1784984, 'z': '25th'},
-    {'x': 68.5, 'y': 113.5090108, 'z': '50th'},
-    {'x': 68.5, 'y': 116.8175812, 'z': '75th'},
-    {'x': 68.5, 'y': 119.777379, 'z': '90th'},
-    {'x': 68.5, 'y': 121.540799, 'z': '95th'},
-    {'x': 68.5, 'y': 122.682926, 'z': '97th'},
-    {'x': 69.5, 'y': 104.6478827, 'z': '3rd'},
-    {'x': 69.5, 'y': 105.8364145, 'z': '5th'},
-    {'x': 69.5, 'y': 107.6611426, 'z': '10th'},
-    {'x': 69.5, 'y': 110.6960031, 'z': '25th'},
-    {'x': 69.5, 'y': 114.0478678, 'z': '50th'},
-    {'x': 69.5, 'y': 117.3794345, 'z': '75th'},
-    {'x': 69.5, 'y': 120.3612638, 'z': '90th'},
-    {'x': 69.5, 'y': 122.1384479, 'z': '95th'},
-    {'x': 69.5, 'y': 123.2897392, 'z': '97th'},
-    {'x': 70.5, 'y': 105.1326221, 'z': '3rd'},
-    {'x': 70.5, 'y': 106.3269721, 'z': '5th'},
-    {'x': 70.5, 'y': 108.1611811, 'z': '10th'},
-    {'x': 70.5, 'y': 111.2132492, 'z': '25th'},
-    {'x': 70.5, 'y': 114.5861486, 'z': '50th'},
-    {'x': 70.5, 'y': 117.9406648, 'z': '75th'},
-    {'x': 70.5, 'y': 120.9447067, 'z': '90th'},
-    {'x': 70.5, 'y': 122.7358617, 'z': '95th'},
-    {'x': 70.5, 'y': 123.8964899, 'z': '97th'},
-    {'x': 71.5, 'y': 105.6183068, 'z': '3rd'},
-    {'x': 71.5, 'y': 106.8181654, 'z': '5th'},
-    {'x': 71.5, 'y': 108.6614449, 'z': '10th'},
-    {'x': 71.5, 'y': 111.7302112, 'z': '25th'},
-    {'x': 71.5, 'y': 115.1238315, 'z': '50th'},
-    {'x': 71.5, 'y': 118.5012409, 'z': '75th'},
-    {'x': 71.5, 'y': 121.5276587, 'z': '90th'},
-    {'x': 71.5, 'y': 123.3329768, 'z': '95th'},
-    {'x': 71.5, 'y': 124.5031042, 'z': '97th'},
-    {'x': 72.5, 'y': 106.1048359, 'z': '3rd'},
-    {'x': 72.5, 'y': 107.3099116, 'z': '5th'},
-    {'x': 72.5, 'y': 109.1618735, 'z': '10th'},
-    {'x': 72.5, 'y': 112.2468516, 'z': '25th'},
-    {'x': 72.5, 'y': 115.6608862, 'z': '50th'},
-    {'x': 72.5, 'y': 119.0611237, 'z': '75th'},
-    {'x': 72.5, 'y': 122.1100607, 'z': '90th'},
-    {'x': 72.5, 'y': 123.9297176, 'z': '95th'},
-    {'x': 72.5, 'y': 125.1094938, 'z': '97th'},
-    {'x': 73.5, 'y': 106.592087, 'z': '3rd'},
-    {'x': 73.5, 'y': 107.8021076, 'z': '5th'},
-    {'x': 73.5, 'y': 109.6623876, 'z': '10th'},
-    {'x': 73.5, 'y': 112.7631168, 'z': '25th'},
-    {'x': 73.5, 'y': 116.1972691, 'z': '50th'},
-    {'x': 73.5, 'y': 119.6202624, 'z': '75th'},
-    {'x': 73.5, 'y': 122.6918435, 'z': '90th'},
-    {'x': 73.5, 'y': 124.5259991, 'z': '95th'},
-    {'x': 73.5, 'y': 125.7155618, 'z': '97th'},
-    {'x': 74.5, 'y': 107.0799166, 'z': '3rd'},
-    {'x': 74.5, 'y': 108.2946307, 'z': '5th'},
-    {'x': 74.5, 'y': 110.1628906, 'z': '10th'},
-    {'x': 74.5, 'y': 113.2789389, 'z': '25th'},
-    {'x': 74.5, 'y': 116.732925, 'z': '50th'},
-    {'x': 74.5, 'y': 120.1785968, 'z': '75th'},
-    {'x': 74.5, 'y': 123.272929, 'z': '90th'},
-    {'x': 74.5, 'y': 125.1217272, 'z': '95th'},
-    {'x': 74.5, 'y': 126.3212019, 'z': '97th'},
-    {'x': 75.5, 'y': 107.5681606, 'z': '3rd'},
-    {'x': 75.5, 'y': 108.7873391, 'z': '5th'},
-    {'x': 75.5, 'y': 110.6632694, 'z': '10th'},
-    {'x': 75.5, 'y': 113.7942368, 'z': '25th'},
-    {'x': 75.5, 'y': 117.2677879, 'z': '50th'},
-    {'x': 75.5, 'y': 120.7360574, 'z': '75th'},
-    {'x': 75.5, 'y': 123.8532304, 'z': '90th'},
-    {'x': 75.5, 'y': 125.7167992, 'z': '95th'},
-    {'x': 75.5, 'y': 126.926299, 'z': '97th'},
-    {'x': 76.5, 'y': 108.0566359, 'z': '3rd'},
-    {'x': 76.5, 'y': 109.2800738, 'z': '5th'},
-    {'x': 76.5, 'y': 111.1633949, 'z': '10th'},
-    {'x': 76.5, 'y': 114.3089166, 'z': '25th'},
-    {'x': 76.5, 'y': 117.8017819, 'z': '50th'},
-    {'x': 76.5, 'y': 121.2925663, 'z': '75th'},
-    {'x': 76.5, 'y': 124.4326533, 'z': '90th'},
-    {'x': 76.5, 'y': 126.3111047, 'z': '95th'},
-    {'x': 76.5, 'y': 127.5307299, 'z': '97th'},
-    {'x': 77.5, 'y': 108.5451423, 'z': '3rd'},
-    {'x': 77.5, 'y': 109.7726591, 'z': '5th'},
-    {'x': 77.5, 'y': 111.6631239, 'z': '10th'},
-    {'x': 77.5, 'y': 114.8228726, 'z': '25th'},
-    {'x': 77.5, 'y': 118.3348215, 'z': '50th'},
-    {'x': 77.5, 'y': 121.8480376, 'z': '75th'},
-    {'x': 77.5, 'y': 125.0110959, 'z': '90th'},
-    {'x': 77.5, 'y': 126.9045258, 'z': '95th'},
-    {'x': 77.5, 'y': 128.134364, 'z': '97th'},
-    {'x': 78.5, 'y': 109.0334636, 'z': '3rd'},
-    {'x': 78.5, 'y': 110.2649049, 'z': '5th'},
-    {'x': 78.5, 'y': 112.1622995, 'z': '10th'},
-    {'x': 78.5, 'y': 115.335988, 'z': '25th'},
-    {'x': 78.5, 'y': 118.8668123, 'z': '50th'},
-    {'x': 78.5, 'y': 122.4023786, 'z': '75th'},
-    {'x': 78.5, 'y': 125.5884499, 'z': '90th'},
-    {'x': 78.5, 'y': 127.4969382, 'z': '95th'},
-    {'x': 78.5, 'y': 128.737064, 'z': '97th'},
-    {'x': 79.5, 'y': 109.5213695, 'z': '3rd'},
-    {'x': 79.5, 'y': 110.7566073, 'z': '5th'},
-    {'x': 79.5, 'y': 112.6607528, 'z': '10th'},
-    {'x': 79.5, 'y': 115.8481358, 'z': '25th'},
-    {'x': 79.5, 'y': 119.397652, 'z': '50th'},
-    {'x': 79.5, 'y': 122.9554895, 'z': '75th'},
-    {'x': 79.5, 'y': 126.1646012, 'z': '90th'},
-    {'x': 79.5, 'y': 128.0882119, 'z': '95th'},
-    {'x': 79.5, 'y': 129.3386866, 'z': '97th'},
-    {'x': 80.5, 'y': 110.0086174, 'z': '3rd'},
-    {'x': 80.5, 'y': 111.247551, 'z': '5th'},
-    {'x': 80.5, 'y': 113.158304, 'z': '10th'},
-    {'x': 80.5, 'y': 116.3591802, 'z': '25th'},
-    {'x': 80.5, 'y': 119.9272309, 'z': '50th'},
-    {'x': 80.5, 'y': 123.5072652, 'z': '75th'},
-    {'x': 80.5, 'y': 126.7394306, 'z': '90th'},
-    {'x': 80.5, 'y': 128.6782115, 'z': '95th'},
-    {'x': 80.5, 'y': 129.9390834, 'z': '97th'},
-    {'x': 81.5, 'y': 110.4949545, 'z': '3rd'},
-    {'x': 81.5, 'y': 111.7375104, 'z': '5th'},
-    {'x': 81.5, 'y': 113.654764, 'z': '10th'},
-    {'x': 81.5, 'y': 116.8689769, 'z': '25th'},
-    {'x': 81.5, 'y': 120.455433, 'z': '50th'},
-    {'x': 81.5, 'y': 124.057595, 'z': '75th'},
-    {'x': 81.5, 'y': 127.3128143, 'z': '90th'},
-    {'x': 81.5, 'y': 129.2667977, 'z': '95th'},
-    {'x': 81.5, 'y': 130.5381015, 'z': '97th'},
-    {'x': 82.5, 'y': 110.9801192, 'z': '3rd'},
-    {'x': 82.5, 'y': 112.2262515, 'z': '5th'},
-    {'x': 82.5, 'y': 114.1499353, 'z': '10th'},
-    {'x': 82.5, 'y': 117.3773747, 'z': '25th'},
-    {'x': 82.5, 'y': 120.9821362, 'z': '50th'},
-    {'x': 82.5, 'y': 124.6063638, 'z': '75th'},
-    {'x': 82.5, 'y': 127.8846249, 'z': '90th'},
-    {'x': 82.5, 'y': 129.8538272, 'z': '95th'},
-    {'x': 82.5, 'y': 131.1355844, 'z': '97th'},
-    {'x': 83.5, 'y': 111.4638437, 'z': '3rd'},
-    {'x': 83.5, 'y': 112.7135338, 'z': '5th'},
-    {'x': 83.5, 'y': 114.6436141, 'z': '10th'},
-    {'x': 83.5, 'y': 117.8842164, 'z': '25th'},
-    {'x': 83.5, 'y': 121.5072136, 'z': '50th'},
-    {'x': 83.5, 'y': 125.1534527, 'z': '75th'},
-    {'x': 83.5, 'y': 128.4547316, 'z': '90th'},
-    {'x': 83.5, 'y': 130.4391542, 'z': '95th'},
-    {'x': 83.5, 'y': 131.7313729, 'z': '97th'},
-    {'x': 84.5, 'y': 111.9458554, 'z': '3rd'},
-    {'x': 84.5, 'y': 113.1991118, 'z': '5th'},
-    {'x': 84.5, 'y': 115.1355915, 'z': '10th'},
-    {'x': 84.5, 'y': 118.3893397, 'z': '25th'},
-    {'x': 84.5, 'y': 122.0305342, 'z': '50th'},
-    {'x': 84.5, 'y': 125.6987395, 'z': '75th'},
-    {'x': 84.5, 'y': 129.0230015, 'z': '90th'},
-    {'x': 84.5, 'y': 131.0226304, 'z': '95th'},
-    {'x': 84.5, 'y': 132.3253057, 'z': '97th'},
-    {'x': 85.5, 'y': 112.4258796, 'z': '3rd'},
-    {'x': 85.5, 'y': 113.6827373, 'z': '5th'},
-    {'x': 85.5, 'y': 115.625655, 'z': '10th'},
-    {'x': 85.5, 'y': 118.8925788, 'z': '25th'},
-    {'x': 85.5, 'y': 122.5519634, 'z': '50th'},
-    {'x': 85.5, 'y': 126.2420996, 'z': '75th'},
-    {'x': 85.5, 'y': 129.5892999, 'z': '90th'},
-    {'x': 85.5, 'y': 131.6041067, 'z': '95th'},
-    {'x': 85.5, 'y': 132.9172205, 'z': '97th'},
-    {'x': 86.5, 'y': 112.9036412, 'z': '3rd'},
-    {'x': 86.5, 'y': 114.1641607, 'z': '5th'},
-    {'x': 86.5, 'y': 116.1135904, 'z': '10th'},
-    {'x': 86.5, 'y': 119.3937653, 'z': '25th'},
-    {'x': 86.5, 'y': 123.0713645, 'z': '50th'},
-    {'x': 86.5, 'y': 126.7834065, 'z': '75th'},
-    {'x': 86.5, 'y': 130.153491, 'z': '90th'},
-    {'x': 86.5, 'y': 132.183433, 'z': '95th'},
-    {'x': 86.5, 'y': 133.5069548, 'z': '97th'},
-    {'x': 87.5, 'y': 113.3788664, 'z': '3rd'},
-    {'x': 87.5, 'y': 114.6431334, 'z': '5th'},
-    {'x': 87.5, 'y': 116.5991827, 'z': '10th'},
-    {'x': 87.5, 'y': 119.8927292, 'z': '25th'},
-    {'x': 87.5, 'y': 123.588599, 'z': '50th'},
-    {'x': 87.5, 'y': 127.3225327, 'z': '75th'},
-    {'x': 87.5, 'y': 130.7154389, 'z': '90th'},
-    {'x': 87.5, 'y': 132.7604599, 'z': '95th'},
-    {'x': 87.5, 'y': 134.0943467, 'z': '97th'},
-    {'x': 88.5, 'y': 113.8512827, 'z': '3rd'},
-    {'x': 88.5, 'y': 115.1194078, 'z': '5th'},
-    {'x': 88.5, 'y': 117.0822191, 'z': '10th'},
-    {'x': 88.5, 'y': 120.3893032, 'z': '25th'},
-    {'x': 88.5, 'y': 124.1035312, 'z': '50th'},
-    {'x': 88.5, 'y': 127.8593529, 'z': '75th'},
-    {'x': 88.5, 'y': 131.2750083, 'z': '90th'},
-    {'x': 88.5, 'y': 133.335037, 'z': '95th'},
-    {'x': 88.5, 'y': 134.6792321, 'z': '97th'},
-    {'x': 89.5, 'y': 114.3206308, 'z': '3rd'},
-    {'x': 89.5, 'y': 115.5927447, 'z': '5th'},
-    {'x': 89.5, 'y': 117.562488, 'z': '10th'},
-    {'x': 89.5, 'y': 120.8833137, 'z': '25th'},
-    {'x': 89.5, 'y': 124.6160161, 'z': '50th'},
-    {'x': 89.5, 'y': 128.393735, 'z': '75th'},
-    {'x': 89.5, 'y': 131.8320643, 'z': '90th'},
-    {'x': 89.5, 'y': 133.9070206, 'z': '95th'},
-    {'x': 89.5, 'y': 135.2614591, 'z': '97th'},
-    {'x': 90.5, 'y': 114.7866522, 'z': '3rd'},
-    {'x': 90.5, 'y': 116.0629074, 'z': '5th'},
-    {'x': 90.5, 'y': 118.0397834, 'z': '10th'},
-    {'x': 90.5, 'y': 121.3745956, 'z': '25th'},
-    {'x': 90.5, 'y': 125.1259182, 'z': '50th'},
-    {'x': 90.5, 'y': 128.9255543, 'z': '75th'},
-    {'x': 90.5, 'y': 132.3864745, 'z': '90th'},
-    {'x': 90.5, 'y': 134.4762655, 'z': '95th'},
-    {'x': 90.5, 'y': 135.8408704, 'z': '97th'},
-    {'x': 91.5, 'y': 115.2491001, 'z': '3rd'},
-    {'x': 91.5, 'y': 116.5296686, 'z': '5th'},
-    {'x': 91.5, 'y': 118.5139049, 'z': '10th'},
-    {'x': 91.5, 'y': 121.8629855, 'z': '25th'},
-    {'x': 91.5, 'y': 125.6331012, 'z': '50th'},
-    {'x': 91.5, 'y': 129.4546858, 'z': '75th'},
-    {'x': 91.5, 'y': 132.9381089, 'z': '90th'},
-    {'x': 91.5, 'y': 135.0426312, 'z': '95th'},
-    {'x': 91.5, 'y': 136.4173156, 'z': '97th'},
-    {'x': 92.5, 'y': 115.7077388, 'z': '3rd'},
-    {'x': 92.5, 'y': 116.9928104, 'z': '5th'},
-    {'x': 92.5, 'y': 118.9846594, 'z': '10th'},
-    {'x': 92.5, 'y': 122.3483243, 'z': '25th'},
-    {'x': 92.5, 'y': 126.1374319, 'z': '50th'},
-    {'x': 92.5, 'y': 129.9810071, 'z': '75th'},
-    {'x': 92.5, 'y': 133.4868407, 'z': '90th'},
-    {'x': 92.5, 'y': 135.6059815, 'z': '95th'},
-    {'x': 92.5, 'y': 136.9906494, 'z': '97th'},
-    {'x': 93.5, 'y': 116.1623461, 'z': '3rd'},
-    {'x': 93.5, 'y': 117.4521263, 'z': '5th'},
-    {'x': 93.5, 'y': 119.4518627, 'z': '10th'},
-    {'x': 93.5, 'y': 122.8304588, 'z': '25th'},
-    {'x': 93.5, 'y': 126.6387804, 'z': '50th'},
-    {'x': 93.5, 'y': 130.504399, 'z': '75th'},
-    {'x': 93.5, 'y': 134.0325473, 'z': '90th'},
-    {'x': 93.5, 'y': 136.1661852, 'z': '95th'},
-    {'x': 93.5, 'y': 137.5607324, 'z': '97th'},
-    {'x': 94.5, 'y': 116.6127146, 'z': '3rd'},
-    {'x': 94.5, 'y': 117.9074226, 'z': '5th'},
-    {'x': 94.5, 'y': 119.9153408, 'z': '10th'},
-    {'x': 94.5, 'y': 123.3092425, 'z': '25th'},
-    {'x': 94.5, 'y': 127.1370217, 'z': '50th'},
-    {'x': 94.5, 'y': 131.024746, 'z': '75th'},
-    {'x': 94.5, 'y': 134.5751108, 'z': '90th'},
-    {'x': 94.5, 'y': 136.7231173, 'z': '95th'},
-    {'x': 94.5, 'y': 138.1274323, 'z': '97th'},
-    {'x': 95.5, 'y': 117.0586529, 'z': '3rd'},
-    {'x': 95.5, 'y': 118.3585201, 'z': '5th'},
-    {'x': 95.5, 'y': 120.3749315, 'z': '10th'},
-    {'x': 95.5, 'y': 123.784537, 'z': '25th'},
-    {'x': 95.5, 'y': 127.6320362, 'z': '50th'},
-    {'x': 95.5, 'y': 131.5419375, 'z': '75th'},
-    {'x': 95.5, 'y': 135.1144188, 'z': '90th'},
-    {'x': 95.5, 'y': 137.2766592, 'z': '95th'},
-    {'x': 95.5, 'y': 138.6906245, 'z': '97th'},
-    {'x': 96.5, 'y': 117.4999879, 'z': '3rd'},
-    {'x': 96.5, 'y': 118.8052553, 'z': '5th'},
-    {'x': 96.5, 'y': 120.830485, 'z': '10th'},
-    {'x': 96.5, 'y': 124.2562127, 'z': '25th'},
-    {'x': 96.5, 'y': 128.1237104, 'z': '50th'},
-    {'x': 96.5, 'y': 132.0558684, 'z': '75th'},
-    {'x': 96.5, 'y': 135.6503652, 'z': '90th'},
-    {'x': 96.5, 'y': 137.8267001, 'z': '95th'},
-    {'x': 96.5, 'y': 139.2501934, 'z': '97th'},
-    {'x': 97.5, 'y': 117.9365657, 'z': '3rd'},
-    {'x': 97.5, 'y': 119.2474816, 'z': '5th'},
-    {'x': 97.5, 'y': 121.281866, 'z': '10th'},
-    {'x': 97.5, 'y': 124.7241502, 'z': '25th'},
-    {'x': 97.5, 'y': 128.6119383, 'z': '50th'},
-    {'x': 97.5, 'y': 132.5664397, 'z': '75th'},
-    {'x': 97.5, 'y': 136.1828511, 'z': '90th'},
-    {'x': 97.5, 'y': 138.3731376, 'z': '95th'},
-    {'x': 97.5, 'y': 139.8060325, 'z': '97th'},
-    {'x': 98.5, 'y': 118.3682526, 'z': '3rd'},
-    {'x': 98.5, 'y': 119.6850711, 'z': '5th'},
-    {'x': 98.5, 'y': 121.7289543, 'z': '10th'},
-    {'x': 98.5, 'y': 125.1882412, 'z': '25th'},
-    {'x': 98.5, 'y': 129.096622, 'z': '50th'},
-    {'x': 98.5, 'y': 133.0735595, 'z': '75th'},
-    {'x': 98.5, 'y': 136.7117853, 'z': '90th'},
-    {'x': 98.5, 'y': 138.9158785, 'z': '95th'},
-    {'x': 98.5, 'y': 140.3580462, 'z': '97th'},
-    {'x': 99.5, 'y': 118.794937, 'z': '3rd'},
-    {'x': 99.5, 'y': 120.1179149, 'z': '5th'},
-    {'x': 99.5, 'y': 122.1716458, 'z': '10th'},
-    {'x': 99.5, 'y': 125.6483893, 'z': '25th'},
-    {'x': 99.5, 'y': 129.5776723, 'z': '50th'},
-    {'x': 99.5, 'y': 133.5771438, 'z': '75th'},
-    {'x': 99.5, 'y': 137.2370854, 'z': '90th'},
-    {'x': 99.5, 'y': 139.4548395, 'z': '95th'},
-    {'x': 99.5, 'y': 140.9061502, 'z': '97th'},
-    {'x': 100.5, 'y': 119.2165297, 'z': '3rd'},
-    {'x': 100.5, 'y': 120.5459248, 'z': '5th'},
-    {'x': 100.5, 'y': 122.6098539, 'z': '10th'},
-    {'x': 100.5, 'y': 126.1045113, 'z': '25th'},
-    {'x': 100.5, 'y': 130.0550101, 'z': '50th'},
-    {'x': 100.5, 'y': 134.0771172, 'z': '75th'},
-    {'x': 100.5, 'y': 137.7586784, 'z': '90th'},
-    {'x': 100.5, 'y': 139.9899485, 'z': '95th'},
-    {'x': 100.5, 'y': 141.4502723, 'z': '97th'},
-    {'x': 101.5, 'y': 119.6329654, 'z': '3rd'},
-    {'x': 101.5, 'y': 120.9690339, 'z': '5th'},
-    {'x': 101.5, 'y': 123.04351, 'z': '10th'},
-    {'x': 101.5, 'y': 126.5565377, 'z': '25th'},
-    {'x': 101.5, 'y': 130.5285669, 'z': '50th'},
-    {'x': 101.5, 'y': 134.5734138, 'z': '75th'},
-    {'x': 101.5, 'y': 138.2765017, 'z': '90th'},
-    {'x': 101.5, 'y': 140.5211451, 'z': '95th'},
-    {'x': 101.5, 'y': 141.9903534, 'z': '97th'},
-    {'x': 102.5, 'y': 120.0442031, 'z': '3rd'},
-    {'x': 102.5, 'y': 121.3871973, 'z': '5th'},
-    {'x': 102.5, 'y': 123.4725646, 'z': '10th'},
-    {'x': 102.5, 'y': 127.0044134, 'z': '25th'},
-    {'x': 102.5, 'y': 130.9982857, 'z': '50th'},
-    {'x': 102.5, 'y': 135.065978, 'z': '75th'},
-    {'x': 102.5, 'y': 138.7905039, 'z': '90th'},
-    {'x': 102.5, 'y': 141.0483813, 'z': '95th'},
-    {'x': 102.5, 'y': 142.5263486, 'z': '97th'},
-    {'x': 103.5, 'y': 120.450227, 'z': '3rd'},
-    {'x': 103.5, 'y': 121.8003934, 'z': '5th'},
-    {'x': 103.5, 'y': 123.896988, 'z': '10th'},
-    {'x': 103.5, 'y': 127.4480994, 'z': '25th'},
-    {'x': 103.5, 'y': 131.4641218, 'z': '50th'},
-    {'x': 103.5, 'y': 135.5547656, 'z': '75th'},
-    {'x': 103.5, 'y': 139.3006456, 'z': '90th'},
-    {'x': 103.5, 'y': 141.5716229, 'z': '95th'},
-    {'x': 103.5, 'y': 143.0582274, 'z': '97th'},
-    {'x': 104.5, 'y': 120.8510473, 'z': '3rd'},
-    {'x': 104.5, 'y': 122.2086239, 'z': '5th'},
-    {'x': 104.5, 'y': 124.3167709, 'z': '10th'},
-    {'x': 104.5, 'y': 127.8875724, 'z': '25th'},
-    {'x': 104.5, 'y': 131.9260439, 'z': '50th'},
-    {'x': 104.5, 'y': 136.0397444, 'z': '75th'},
-    {'x': 104.5, 'y': 139.8069003, 'z': '90th'},
-    {'x': 104.5, 'y': 142.0908498, 'z': '95th'},
-    {'x': 104.5, 'y': 143.5859753, 'z': '97th'},
-    {'x': 105.5, 'y': 121.2467001, 'z': '3rd'},
-    {'x': 105.5, 'y': 122.6119145, 'z': '5th'},
-    {'x': 105.5, 'y': 124.7319249, 'z': '10th'},
-    {'x': 105.5, 'y': 128.3228265, 'z': '25th'},
-    {'x': 105.5, 'y': 132.3840348, 'z': '50th'},
-    {'x': 105.5, 'y': 136.5208952, 'z': '75th'},
-    {'x': 105.5, 'y': 140.3092555, 'z': '90th'},
-    {'x': 105.5, 'y': 142.6060571, 'z': '95th'},
-    {'x': 105.5, 'y': 144.109594, 'z': '97th'},
-    {'x': 106.5, 'y': 121.6372483, 'z': '3rd'},
-    {'x': 106.5, 'y': 123.0103156, 'z': '5th'},
-    {'x': 106.5, 'y': 125.1424835, 'z': '10th'},
-    {'x': 106.5, 'y': 128.7538732, 'z': '25th'},
-    {'x': 106.5, 'y': 132.838092, 'z': '50th'},
-    {'x': 106.5, 'y': 136.9982129, 'z': '75th'},
-    {'x': 106.5, 'y': 140.8077133, 'z': '90th'},
-    {'x': 106.5, 'y': 143.1172562, 'z': '95th'},
-    {'x': 106.5, 'y': 144.6291028, 'z': '97th'},
-    {'x': 107.5, 'y': 122.0227817, 'z': '3rd'},
-    {'x': 107.5, 'y': 123.4039024, 'z': '5th'},
-    {'x': 107.5, 'y': 125.5485022, 'z': '10th'},
-    {'x': 107.5, 'y': 129.1807426, 'z': '25th'},
-    {'x': 107.5, 'y': 133.2882291, 'z': '50th'},
-    {'x': 107.5, 'y': 137.4717069, 'z': '75th'},
-    {'x': 107.5, 'y': 141.3022916, 'z': '90th'},
-    {'x': 107.5, 'y': 143.6244753, 'z': '95th'},
-    {'x': 107.5, 'y': 145.1445387, 'z': '97th'},
-    {'x': 108.5, 'y': 122.4034171, 'z': '3rd'},
-    {'x': 108.5, 'y': 123.7927752, 'z': '5th'},
-    {'x': 108.5, 'y': 125.9500588, 'z': '10th'},
-    {'x': 108.5, 'y': 129.6034839, 'z': '25th'},
-    {'x': 108.5, 'y': 133.7344759, 'z': '50th'},
-    {'x': 108.5, 'y': 137.9414029, 'z': '75th'},
-    {'x': 108.5, 'y': 141.793025, 'z': '90th'},
-    {'x': 108.5, 'y': 144.1277605, 'z': '95th'},
-    {'x': 108.5, 'y': 145.6559581, 'z': '97th'},
-    {'x': 109.5, 'y': 122.7792983, 'z': '3rd'},
-    {'x': 109.5, 'y': 124.1770596, 'z': '5th'},
-    {'x': 109.5, 'y': 126.3472542, 'z': '10th'},
-    {'x': 109.5, 'y': 130.0221657, 'z': '25th'},
-    {'x': 109.5, 'y': 134.1768801, 'z': '50th'},
-    {'x': 109.5, 'y': 138.4073433, 'z': '75th'},
-    {'x': 109.5, 'y': 142.2799654, 'z': '90th'},
-    {'x': 109.5, 'y': 144.6271767, 'z': '95th'},
-    {'x': 109.5, 'y': 146.1634368, 'z': '97th'},
-    {'x': 110.5, 'y': 123.1505962, 'z': '3rd'},
-    {'x': 110.5, 'y': 124.5569064, 'z': '5th'},
-    {'x': 110.5, 'y': 126.7402123, 'z': '10th'},
-    {'x': 110.5, 'y': 130.436877, 'z': '25th'},
-    {'x': 110.5, 'y': 134.6155076, 'z': '50th'},
-    {'x': 110.5, 'y': 138.8695881, 'z': '75th'},
-    {'x': 110.5, 'y': 142.7631838, 'z': '90th'},
-    {'x': 110.5, 'y': 145.1228083, 'z': '95th'},
-    {'x': 110.5, 'y': 146.6670713, 'z': '97th'},
-    {'x': 111.5, 'y': 123.5175084, 'z': '3rd'},
-    {'x': 111.5, 'y': 124.9324922, 'z': '5th'},
-    {'x': 111.5, 'y': 127.1290805, 'z': '10th'},
-    {'x': 111.5, 'y': 130.8477278, 'z': '25th'},
-    {'x': 111.5, 'y': 135.0504433, 'z': '50th'},
-    {'x': 111.5, 'y': 139.3282163, 'z': '75th'},
-    {'x': 111.5, 'y': 143.2427702, 'z': '90th'},
-    {'x': 111.5, 'y': 145.6147602, 'z': '95th'},
-    {'x': 111.5, 'y': 147.1669794, 'z': '97th'},
-    {'x': 112.5, 'y': 123.8802592, 'z': '3rd'},
-    {'x': 112.5, 'y': 125.3040185, 'z': '5th'},
-    {'x': 112.5, 'y': 127.5140299, 'z': '10th'},
-    {'x': 112.5, 'y': 131.2548494, 'z': '25th'},
-    {'x': 112.5, 'y': 135.4817925, 'z': '50th'},
-    {'x': 112.5, 'y': 139.7833266, 'z': '75th'},
-    {'x': 112.5, 'y': 143.7188356, 'z': '90th'},
-    {'x': 112.5, 'y': 146.103159, 'z': '95th'},
-    {'x': 112.5, 'y': 147.6633011, 'z': '97th'},
-    {'x': 113.5, 'y': 124.2390993, 'z': '3rd'},
-    {'x': 113.5, 'y': 125.6717122, 'z': '5th'},
-    {'x': 113.5, 'y': 127.8952551, 'z': '10th'},
-    {'x': 113.5, 'y': 131.6583952, 'z': '25th'},
-    {'x': 113.5, 'y': 135.9096813, 'z': '50th'},
-    {'x': 113.5, 'y': 140.2350389, 'z': '75th'},
-    {'x': 113.5, 'y': 144.1915122, 'z': '90th'},
-    {'x': 113.5, 'y': 146.5881531, 'z': '95th'},
-    {'x': 113.5, 'y': 148.1561991, 'z': '97th'},
-    {'x': 114.5, 'y': 124.5943049, 'z': '3rd'},
-    {'x': 114.5, 'y': 126.035825, 'z': '5th'},
-    {'x': 114.5, 'y': 128.2729746, 'z': '10th'},
-    {'x': 114.5, 'y': 132.0585409, 'z': '25th'},
-    {'x': 114.5, 'y': 136.3342577, 'z': '50th'},
-    {'x': 114.5, 'y': 140.6834944, 'z': '75th'},
-    {'x': 114.5, 'y': 144.6609548, 'z': '90th'},
-    {'x': 114.5, 'y': 147.0699143, 'z': '95th'},
-    {'x': 114.5, 'y': 148.6458598, 'z': '97th'},
-    {'x': 115.5, 'y': 124.9461775, 'z': '3rd'},
-    {'x': 115.5, 'y': 126.3966334, 'z': '5th'},
-    {'x': 115.5, 'y': 128.6474311, 'z': '10th'},
-    {'x': 115.5, 'y': 132.4554857, 'z': '25th'},
-    {'x': 115.5, 'y': 136.7556923, 'z': '50th'},
-    {'x': 115.5, 'y': 141.1288576, 'z': '75th'},
-    {'x': 115.5, 'y': 145.1273417, 'z': '90th'},
-    {'x': 115.5, 'y': 147.5486382, 'z': '95th'},
-    {'x': 115.5, 'y': 149.132494, 'z': '97th'},
-    {'x': 116.5, 'y': 125.2950434, 'z': '3rd'},
-    {'x': 116.5, 'y': 126.7544381, 'z': '5th'},
-    {'x': 116.5, 'y': 129.0188908, 'z': '10th'},
-    {'x': 116.5, 'y': 132.8494521, 'z': '25th'},
-    {'x': 116.5, 'y': 137.1741794, 'z': '50th'},
-    {'x': 116.5, 'y': 141.5713168, 'z': '75th'},
-    {'x': 116.5, 'y': 145.5908755, 'z': '90th'},
-    {'x': 116.5, 'y': 148.0245452, 'z': '95th'},
-    {'x': 116.5, 'y': 149.6163372, 'z': '97th'},
-    {'x': 117.5, 'y': 125.6412524, 'z': '3rd'},
-    {'x': 117.5, 'y': 127.1095636, 'z': '5th'},
-    {'x': 117.5, 'y': 129.3876441, 'z': '10th'},
-    {'x': 117.5, 'y': 133.2406866, 'z': '25th'},
-    {'x': 117.5, 'y': 137.5899378, 'z': '50th'},
-    {'x': 117.5, 'y': 142.011085, 'z': '75th'},
-    {'x': 117.5, 'y': 146.0517839, 'z': '90th'},
-    {'x': 117.5, 'y': 148.4978811, 'z': '95th'},
-    {'x': 117.5, 'y': 150.0976507, 'z': '97th'},
-    {'x': 118.5, 'y': 125.9851773, 'z': '3rd'},
-    {'x': 118.5, 'y': 127.4623576, 'z': '5th'},
-    {'x': 118.5, 'y': 129.7540048, 'z': '10th'},
-    {'x': 118.5, 'y': 133.6294604, 'z': '25th'},
-    {'x': 118.5, 'y': 138.0032114, 'z': '50th'},
-    {'x': 118.5, 'y': 142.4484014, 'z': '75th'},
-    {'x': 118.5, 'y': 146.510321, 'z': '90th'},
-    {'x': 118.5, 'y': 148.9689178, 'z': '95th'},
-    {'x': 118.5, 'y': 150.5767217, 'z': '97th'},
-    {'x': 119.5, 'y': 126.3272131, 'z': '3rd'},
-    {'x': 119.5, 'y': 127.8131904, 'z': '5th'},
-    {'x': 119.5, 'y': 130.1183106, 'z': '10th'},
-    {'x': 119.5, 'y': 134.0160697, 'z': '25th'},
-    {'x': 119.5, 'y': 138.4142703, 'z': '50th'},
-    {'x': 119.5, 'y': 142.8835317, 'z': '75th'},
-    {'x': 119.5, 'y': 146.9667676, 'z': '90th'},
-    {'x': 119.5, 'y': 149.4379538, 'z': '95th'},
-    {'x': 119.5, 'y': 151.0538639, 'z': '97th'},
-    {'x': 120.5, 'y': 126.6677753, 'z': '3rd'},
-    {'x': 120.5, 'y': 128.1624542, 'z': '5th'},
-    {'x': 120.5, 'y': 130.4809221, 'z': '10th'},
-    {'x': 120.5, 'y': 134.4008357, 'z': '25th'},
-    {'x': 120.5, 'y': 138.8234114, 'z': '50th'},
-    {'x': 120.5, 'y': 143.3167691, 'z': '75th'},
-    {'x': 120.5, 'y': 147.421432, 'z': '90th'},
-    {'x': 120.5, 'y': 149.9053151, 'z': '95th'},
-    {'x': 120.5, 'y': 151.5294179, 'z': '97th'},
-    {'x': 121.5, 'y': 127.0072991, 'z': '3rd'},
-    {'x': 121.5, 'y': 128.5105623, 'z': '5th'},
-    {'x': 121.5, 'y': 130.8422234, 'z': '10th'},
-    {'x': 121.5, 'y': 134.7841054, 'z': '25th'},
-    {'x': 121.5, 'y': 139.2309592, 'z': '50th'},
-    {'x': 121.5, 'y': 143.7484354, 'z': '75th'},
-    {'x': 121.5, 'y': 147.8746507, 'z': '90th'},
-    {'x': 121.5, 'y': 150.3713549, 'z': '95th'},
-    {'x': 121.5, 'y': 152.0037511, 'z': '97th'},
-    {'x': 122.5, 'y': 127.3462381, 'z': '3rd'},
-    {'x': 122.5, 'y': 128.857948, 'z': '5th'},
-    {'x': 122.5, 'y': 131.2026207, 'z': '10th'},
-    {'x': 122.5, 'y': 135.1662516, 'z': '25th'},
-    {'x': 122.5, 'y': 139.6372663, 'z': '50th'},
-    {'x': 122.5, 'y': 144.1788815, 'z': '75th'},
-    {'x': 122.5, 'y': 148.326789, 'z': '90th'},
-    {'x': 122.5, 'y': 150.8364543, 'z': '95th'},
-    {'x': 122.5, 'y': 152.4772579, 'z': '97th'},
-    {'x': 123.5, 'y': 127.6850624, 'z': '3rd'},
-    {'x': 123.5, 'y': 129.2050634, 'z': '5th'},
-    {'x': 123.5, 'y': 131.5625423, 'z': '10th'},
-    {'x': 123.5, 'y': 135.5476732, 'z': '25th'},
-    {'x': 123.5, 'y': 140.042714, 'z': '50th'},
-    {'x': 123.5, 'y': 144.6084877, 'z': '75th'},
-    {'x': 123.5, 'y': 148.7782409, 'z': '90th'},
-    {'x': 123.5, 'y': 151.3010223, 'z': '95th'},
-    {'x': 123.5, 'y': 152.9503596, 'z': '97th'},
-    {'x': 124.5, 'y': 128.0242572, 'z': '3rd'},
-    {'x': 124.5, 'y': 129.5523785, 'z': '5th'},
-    {'x': 124.5, 'y': 131.9224379, 'z': '10th'},
-    {'x': 124.5, 'y': 135.9287948, 'z': '25th'},
-    {'x': 124.5, 'y': 140.4477127, 'z': '50th'},
-    {'x': 124.5, 'y': 145.0376645, 'z': '75th'},
-    {'x': 124.5, 'y': 149.2294296, 'z': '90th'},
-    {'x': 124.5, 'y': 151.7654951, 'z': '95th'},
-    {'x': 124.5, 'y': 153.4235035, 'z': '97th'},
-    {'x': 125.5, 'y': 128.3643208, 'z': '3rd'},
-    {'x': 125.5, 'y': 129.9003795, 'z': '5th'},
-    {'x': 125.5, 'y': 132.2827776, 'z': '10th'},
-    {'x': 125.5, 'y': 136.3100669, 'z': '25th'},
-    {'x': 125.5, 'y': 140.8527022, 'z': '50th'},
-    {'x': 125.5, 'y': 145.4668527, 'z': '75th'},
-    {'x': 125.5, 'y': 149.6808068, 'z': '90th'},
-    {'x': 125.5, 'y': 152.2303363, 'z': '95th'},
-    {'x': 125.5, 'y': 153.8971624, 'z': '97th'},
-    {'x': 126.5, 'y': 128.7057627, 'z': '3rd'},
-    {'x': 126.5, 'y': 130.2495672, 'z': '5th'},
-    {'x': 126.5, 'y': 132.6440511, 'z': '10th'},
-    {'x': 126.5, 'y': 136.6919657, 'z': '25th'},
-    {'x': 126.5, 'y': 141.2581515, 'z': '50th'},
-    {'x': 126.5, 'y': 145.8965233, 'z': '75th'},
-    {'x': 126.5, 'y': 150.1328531, 'z': '90th'},
-    {'x': 126.5, 'y': 152.6960355, 'z': '95th'},
-    {'x': 126.5, 'y': 154.3718335, 'z': '97th'},
-    {'x': 127.5, 'y': 129.0491015, 'z': '3rd'},
-    {'x': 127.5, 'y': 130.6004555, 'z': '5th'},
-    {'x': 127.5, 'y': 133.0067661, 'z': '10th'},
-    {'x': 127.5, 'y': 137.0749922, 'z': '25th'},
-    {'x': 127.5, 'y': 141.6645592, 'z': '50th'},
-    {'x': 127.5, 'y': 146.3271773, 'z': '75th'},
-    {'x': 127.5, 'y': 150.5860767, 'z': '90th'},
-    {'x': 127.5, 'y': 153.1631074, 'z': '95th'},
-    {'x': 127.5, 'y': 154.8480367, 'z': '97th'},
-    {'x': 128.5, 'y': 129.394862, 'z': '3rd'},
-    {'x': 128.5, 'y': 130.9535693, 'z': '5th'},
-    {'x': 128.5, 'y': 133.3714475, 'z': '10th'},
-    {'x': 128.5, 'y': 137.4596717, 'z': '25th'},
-    {'x': 128.5, 'y': 142.072452, 'z': '50th'},
-    {'x': 128.5, 'y': 146.7593449, 'z': '75th'},
-    {'x': 128.5, 'y': 151.0410123, 'z': '90th'},
-    {'x': 128.5, 'y': 153.6320904, 'z': '95th'},
-    {'x': 128.5, 'y': 155.3263129, 'z': '97th'},
-    {'x': 129.5, 'y': 129.7435732, 'z': '3rd'},
-    {'x': 129.5, 'y': 131.309442, 'z': '5th'},
-    {'x': 129.5, 'y': 133.738635, 'z': '10th'},
-    {'x': 129.5, 'y': 137.8465525, 'z': '25th'},
-    {'x': 129.5, 'y': 142.4823852, 'z': '50th'},
-    {'x': 129.5, 'y': 147.1935849, 'z': '75th'},
-    {'x': 129.5, 'y': 151.4982199, 'z': '90th'},
-    {'x': 129.5, 'y': 154.103544, 'z': '95th'},
-    {'x': 129.5, 'y': 155.8072211, 'z': '97th'},
-    {'x': 130.5, 'y': 130.095765, 'z': '3rd'},
-    {'x': 130.5, 'y': 131.6686134, 'z': '5th'},
-    {'x': 130.5, 'y': 134.1088817, 'z': '10th'},
-    {'x': 130.5, 'y': 138.2362048, 'z': '25th'},
-    {'x': 130.5, 'y': 142.8949403, 'z': '50th'},
-    {'x': 130.5, 'y': 147.630483, 'z': '75th'},
-    {'x': 130.5, 'y': 151.9582822, 'z': '90th'},
-    {'x': 130.5, 'y': 154.5780465, 'z': '95th'},
-    {'x': 130.5, 'y': 156.2913356, 'z': '97th'},
-    {'x': 131.5, 'y': 130.4519655, 'z': '3rd'},
-    {'x': 131.5, 'y': 132.031627, 'z': '5th'},
-    {'x': 131.5, 'y': 134.4827517, 'z': '10th'},
-    {'x': 131.5, 'y': 138.6292185, 'z': '25th'},
-    {'x': 131.5, 'y': 143.3107241, 'z': '50th'},
-    {'x': 131.5, 'y': 148.07065, 'z': '75th'},
-    {'x': 131.5, 'y': 152.4218027, 'z': '90th'},
-    {'x': 131.5, 'y': 155.0561919, 'z': '95th'},
-    {'x': 131.5, 'y': 156.7792423, 'z': '97th'},
-    {'x': 132.5, 'y': 130.8126976, 'z': '3rd'},
-    {'x': 132.5, 'y': 132.3990267, 'z': '5th'},
-    {'x': 132.5, 'y': 134.8608171, 'z': '10th'},
-    {'x': 132.5, 'y': 139.0262015, 'z': '25th'},
-    {'x': 132.5, 'y': 143.7303663, 'z': '50th'},
-    {'x': 132.5, 'y': 148.5147188, 'z': '75th'},
-    {'x': 132.5, 'y': 152.8894016, 'z': '90th'},
-    {'x': 132.5, 'y': 155.5385858, 'z': '95th'},
-    {'x': 132.5, 'y': 157.2715342, 'z': '97th'},
-    {'x': 133.5, 'y': 131.1784756, 'z': '3rd'},
-    {'x': 133.5, 'y': 132.771354, 'z': '5th'},
-    {'x': 133.5, 'y': 135.2436555, 'z': '10th'},
-    {'x': 133.5, 'y': 139.4277761, 'z': '25th'},
-    {'x': 133.5, 'y': 144.1545167, 'z': '50th'},
-    {'x': 133.5, 'y': 148.9633421, 'z': '75th'},
-    {'x': 133.5, 'y': 153.3617127, 'z': '90th'},
-    {'x': 133.5, 'y': 156.0258407, 'z': '95th'},
-    {'x': 133.5, 'y': 157.7688063, 'z': '97th'},
-    {'x': 134.5, 'y': 131.5498015, 'z': '3rd'},
-    {'x': 134.5, 'y': 133.1491442, 'z': '5th'},
-    {'x': 134.5, 'y': 135.6318463, 'z': '10th'},
-    {'x': 134.5, 'y': 139.8345767, 'z': '25th'},
-    {'x': 134.5, 'y': 144.5838414, 'z': '50th'},
-    {'x': 134.5, 'y': 149.4171874, 'z': '75th'},
-    {'x': 134.5, 'y': 153.839378, 'z': '90th'},
-    {'x': 134.5, 'y': 156.5185711, 'z': '95th'},
-    {'x': 134.5, 'y': 158.27165, 'z': '97th'},
-    {'x': 135.5, 'y': 131.9271616, 'z': '3rd'},
-    {'x': 135.5, 'y': 133.5329226, 'z': '5th'},
-    {'x': 135.5, 'y': 136.0259671, 'z': '10th'},
-    {'x': 135.5, 'y': 140.2472448, 'z': '25th'},
-    {'x': 135.5, 'y': 145.0190192, 'z': '50th'},
-    {'x': 135.5, 'y': 149.876933, 'z': '75th'},
-    {'x': 135.5, 'y': 154.3230425, 'z': '90th'},
-    {'x': 135.5, 'y': 157.0173867, 'z': '95th'},
-    {'x': 135.5, 'y': 158.7806462, 'z': '97th'},
-    {'x': 136.5, 'y': 132.311022, 'z': '3rd'},
-    {'x': 136.5, 'y': 133.9232006, 'z': '5th'},
-    {'x': 136.5, 'y': 136.4265892, 'z': '10th'},
-    {'x': 136.5, 'y': 140.6664253, 'z': '25th'},
-    {'x': 136.5, 'y': 145.4607359, 'z': '50th'},
-    {'x': 136.5, 'y': 150.3432618, 'z': '75th'},
-    {'x': 136.5, 'y': 154.8133474, 'z': '90th'},
-    {'x': 136.5, 'y': 157.522886, 'z': '95th'},
-    {'x': 136.5, 'y': 159.2963578, 'z': '97th'},
-    {'x': 137.5, 'y': 132.7018251, 'z': '3rd'},
-    {'x': 137.5, 'y': 134.3204714, 'z': '5th'},
-    {'x': 137.5, 'y': 136.8342729, 'z': '10th'},
-    {'x': 137.5, 'y': 141.0927603, 'z': '25th'},
-    {'x': 137.5, 'y': 145.9096784, 'z': '50th'},
-    {'x': 137.5, 'y': 150.8168546, 'z': '75th'},
-    {'x': 137.5, 'y': 155.3109233, 'z': '90th'},
-    {'x': 137.5, 'y': 158.0356481, 'z': '95th'},
-    {'x': 137.5, 'y': 159.8193221, 'z': '97th'},
-    {'x': 138.5, 'y': 133.0999854, 'z': '3rd'},
-    {'x': 138.5, 'y': 134.7252055, 'z': '5th'},
-    {'x': 138.5, 'y': 137.2495627, 'z': '10th'},
-    {'x': 138.5, 'y': 141.5268837, 'z': '25th'},
-    {'x': 138.5, 'y': 146.3665278, 'z': '50th'},
-    {'x': 138.5, 'y': 151.2983826, 'z': '75th'},
-    {'x': 138.5, 'y': 155.8163811, 'z': '90th'},
-    {'x': 138.5, 'y': 158.5562242, 'z': '95th'},
-    {'x': 138.5, 'y': 160.3500415, 'z': '97th'},
-    {'x': 139.5, 'y': 133.5058853, 'z': '3rd'},
-    {'x': 139.5, 'y': 135.1378458, 'z': '5th'},
-    {'x': 139.5, 'y': 137.6729811, 'z': '10th'},
-    {'x': 139.5, 'y': 141.9694138, 'z': '25th'},
-    {'x': 139.5, 'y': 146.8319513, 'z': '50th'},
-    {'x': 139.5, 'y': 151.7884983, 'z': '75th'},
-    {'x': 139.5, 'y': 156.3303034, 'z': '90th'},
-    {'x': 139.5, 'y': 159.085128, 'z': '95th'},
-    {'x': 139.5, 'y': 160.8889743, 'z': '97th'},
-    {'x': 140.5, 'y': 133.9198714, 'z': '3rd'},
-    {'x': 140.5, 'y': 135.5588028, 'z': '5th'},
-    {'x': 140.5, 'y': 138.1050231, 'z': '10th'},
-    {'x': 140.5, 'y': 142.4209457, 'z': '25th'},
-    {'x': 140.5, 'y': 147.3065929, 'z': '50th'},
-    {'x': 140.5, 'y': 152.2878255, 'z': '75th'},
-    {'x': 140.5, 'y': 156.8532337, 'z': '90th'},
-    {'x': 140.5, 'y': 159.622826, 'z': '95th'},
-    {'x': 140.5, 'y': 161.4365245, 'z': '97th'},
-    {'x': 141.5, 'y': 134.34225, 'z': '3rd'},
-    {'x': 141.5, 'y': 135.9884501, 'z': '5th'},
-    {'x': 141.5, 'y': 138.5461496, 'z': '10th'},
-    {'x': 141.5, 'y': 142.8820429, 'z': '25th'},
-    {'x': 141.5, 'y': 147.7910635, 'z': '50th'},
-    {'x': 141.5, 'y': 152.7969484, 'z': '75th'},
-    {'x': 141.5, 'y': 157.3856659, 'z': '90th'},
-    {'x': 141.5, 'y': 160.1697263, 'z': '95th'},
-    {'x': 141.5, 'y': 161.993032, 'z': '97th'},
-    {'x': 142.5, 'y': 134.773284, 'z': '3rd'},
-    {'x': 142.5, 'y': 136.4271185, 'z': '5th'},
-    {'x': 142.5, 'y': 138.9967803, 'z': '10th'},
-    {'x': 142.5, 'y': 143.353228, 'z': '25th'},
-    {'x': 142.5, 'y': 148.2859294, 'z': '50th'},
-    {'x': 142.5, 'y': 153.3163996, 'z': '75th'},
-    {'x': 142.5, 'y': 157.9280318, 'z': '90th'},
-    {'x': 142.5, 'y': 160.7261679, 'z': '95th'},
-    {'x': 142.5, 'y': 162.5587616, 'z': '97th'},
-    {'x': 143.5, 'y': 135.2131887, 'z': '3rd'},
-    {'x': 143.5, 'y': 136.8750919, 'z': '5th'},
-    {'x': 143.5, 'y': 139.4572873, 'z': '10th'},
-    {'x': 143.5, 'y': 143.8349727, 'z': '25th'},
-    {'x': 143.5, 'y': 148.7917006, 'z': '50th'},
-    {'x': 143.5, 'y': 153.8466466, 'z': '75th'},
-    {'x': 143.5, 'y': 158.4806894, 'z': '90th'},
-    {'x': 143.5, 'y': 161.2924091, 'z': '95th'},
-    {'x': 143.5, 'y': 163.133893, 'z': '97th'},
-    {'x': 144.5, 'y': 135.6621289, 'z': '3rd'},
-    {'x': 144.5, 'y': 137.3326017, 'z': '5th'},
-    {'x': 144.5, 'y': 139.9279871, 'z': '10th'},
-    {'x': 144.5, 'y': 144.3276874, 'z': '25th'},
-    {'x': 144.5, 'y': 149.3088178, 'z': '50th'},
-    {'x': 144.5, 'y': 154.3880792, 'z': '75th'},
-    {'x': 144.5, 'y': 159.0439098, 'z': '90th'},
-    {'x': 144.5, 'y': 161.8686162, 'z': '95th'},
-    {'x': 144.5, 'y': 163.7185106, 'z': '97th'},
-    {'x': 145.5, 'y': 136.1202156, 'z': '3rd'},
-    {'x': 145.5, 'y': 137.7998222, 'z': '5th'},
-    {'x': 145.5, 'y': 140.409134, 'z': '10th'},
-    {'x': 145.5, 'y': 144.8317108, 'z': '25th'},
-    {'x': 145.5, 'y': 149.8376391, 'z': '50th'},
-    {'x': 145.5, 'y': 154.9409947, 'z': '75th'},
-    {'x': 145.5, 'y': 159.6178646, 'z': '90th'},
-    {'x': 145.5, 'y': 162.4548526, 'z': '95th'},
-    {'x': 145.5, 'y': 164.3125939, 'z': '97th'},
-    {'x': 146.5, 'y': 136.5875035, 'z': '3rd'},
-    {'x': 146.5, 'y': 138.2768661, 'z': '5th'},
-    {'x': 146.5, 'y': 140.9009122, 'z': '10th'},
-    {'x': 146.5, 'y': 145.3472981, 'z': '25th'},
-    {'x': 146.5, 'y': 150.3784267, 'z': '50th'},
-    {'x': 146.5, 'y': 155.505584, 'z': '75th'},
-    {'x': 146.5, 'y': 160.2026132, 'z': '90th'},
-    {'x': 146.5, 'y': 163.0510679, 'z': '95th'},
-    {'x': 146.5, 'y': 164.9160089, 'z': '97th'},
-    {'x': 147.5, 'y': 137.0639883, 'z': '3rd'},
-    {'x': 147.5, 'y': 138.7637799, 'z': '5th'},
-    {'x': 147.5, 'y': 141.403429, 'z': '10th'},
-    {'x': 147.5, 'y': 145.8746111, 'z': '25th'},
-    {'x': 147.5, 'y': 150.9313331, 'z': '50th'},
-    {'x': 147.5, 'y': 156.0819181, 'z': '75th'},
-    {'x': 147.5, 'y': 160.7980913, 'z': '90th'},
-    {'x': 147.5, 'y': 163.657089, 'z': '95th'},
-    {'x': 147.5, 'y': 165.5285004, 'z': '97th'},
-    {'x': 148.5, 'y': 137.5496052, 'z': '3rd'},
-    {'x': 148.5, 'y': 139.2605402, 'z': '5th'},
-    {'x': 148.5, 'y': 141.9167079, 'z': '10th'},
-    {'x': 148.5, 'y': 146.4137069, 'z': '25th'},
-    {'x': 148.5, 'y': 151.4963887, 'z': '50th'},
-    {'x': 148.5, 'y': 156.6699351, 'z': '75th'},
-    {'x': 148.5, 'y': 161.4041, 'z': '90th'},
-    {'x': 148.5, 'y': 164.2726114, 'z': '95th'},
-    {'x': 148.5, 'y': 166.1496863, 'z': '97th'},
-    {'x': 149.5, 'y': 138.0442266, 'z': '3rd'},
-    {'x': 149.5, 'y': 139.7670498, 'z': '5th'},
-    {'x': 149.5, 'y': 142.4406823, 'z': '10th'},
-    {'x': 149.5, 'y': 146.9645285, 'z': '25th'},
-    {'x': 149.5, 'y': 152.0734897, 'z': '50th'},
-    {'x': 149.5, 'y': 157.2694285, 'z': '75th'},
-    {'x': 149.5, 'y': 162.0202967, 'z': '90th'},
-    {'x': 149.5, 'y': 164.897193, 'z': '95th'},
-    {'x': 149.5, 'y': 166.7790531, 'z': '97th'},
-    {'x': 150.5, 'y': 138.5476617, 'z': '3rd'},
-    {'x': 150.5, 'y': 140.2831346, 'z': '5th'},
-    {'x': 150.5, 'y': 142.9751899, 'z': '10th'},
-    {'x': 150.5, 'y': 147.5268957, 'z': '25th'},
-    {'x': 150.5, 'y': 152.6623878, 'z': '50th'},
-    {'x': 150.5, 'y': 157.8800378, 'z': '75th'},
-    {'x': 150.5, 'y': 162.6461885, 'z': '90th'},
-    {'x': 150.5, 'y': 165.5302497, 'z': '95th'},
-    {'x': 150.5, 'y': 167.4159536, 'z': '97th'},
-    {'x': 151.5, 'y': 139.0596548, 'z': '3rd'},
-    {'x': 151.5, 'y': 140.8085414, 'z': '5th'},
-    {'x': 151.5, 'y': 143.5199675, 'z': '10th'},
-    {'x': 151.5, 'y': 148.1004983, 'z': '25th'},
-    {'x': 151.5, 'y': 153.2626819, 'z': '50th'},
-    {'x': 151.5, 'y': 158.5012409, 'z': '75th'},
-    {'x': 151.5, 'y': 163.2811271, 'z': '90th'},
-    {'x': 151.5, 'y': 166.1710534, 'z': '95th'},
-    {'x': 151.5, 'y': 168.0596069, 'z': '97th'},
-    {'x': 152.5, 'y': 139.5798855, 'z': '3rd'},
-    {'x': 152.5, 'y': 141.3429356, 'z': '5th'},
-    {'x': 152.5, 'y': 144.0746481, 'z': '10th'},
-    {'x': 152.5, 'y': 148.6848902, 'z': '25th'},
-    {'x': 152.5, 'y': 153.8738124, 'z': '50th'},
-    {'x': 152.5, 'y': 159.1323501, 'z': '75th'},
-    {'x': 152.5, 'y': 163.9243081, 'z': '90th'},
-    {'x': 152.5, 'y': 166.8187329, 'z': '95th'},
-    {'x': 152.5, 'y': 168.7091009, 'z': '97th'},
-    {'x': 153.5, 'y': 140.1079685, 'z': '3rd'},
-    {'x': 153.5, 'y': 141.8859002, 'z': '5th'},
-    {'x': 153.5, 'y': 144.6387576, 'z': '10th'},
-    {'x': 153.5, 'y': 149.2794857, 'z': '25th'},
-    {'x': 153.5, 'y': 154.495058, 'z': '50th'},
-    {'x': 153.5, 'y': 159.7725112, 'z': '75th'},
-    {'x': 153.5, 'y': 164.5747721, 'z': '90th'},
-    {'x': 153.5, 'y': 167.4722776, 'z': '95th'},
-    {'x': 153.5, 'y': 169.3633976, 'z': '97th'},
-    {'x': 154.5, 'y': 140.6434536, 'z': '3rd'},
-    {'x': 154.5, 'y': 142.4369354, 'z': '5th'},
-    {'x': 154.5, 'y': 145.2117144, 'z': '10th'},
-    {'x': 154.5, 'y': 149.8835591, 'z': '25th'},
-    {'x': 154.5, 'y': 155.1255365, 'z': '50th'},
-    {'x': 154.5, 'y': 160.4207062, 'z': '75th'},
-    {'x': 154.5, 'y': 165.2314109, 'z': '90th'},
-    {'x': 154.5, 'y': 168.1305444, 'z': '95th'},
-    {'x': 154.5, 'y': 170.0213408, 'z': '97th'},
-    {'x': 155.5, 'y': 141.1858268, 'z': '3rd'},
-    {'x': 155.5, 'y': 142.9954591, 'z': '5th'},
-    {'x': 155.5, 'y': 145.7928297, 'z': '10th'},
-    {'x': 155.5, 'y': 150.4962462, 'z': '25th'},
-    {'x': 155.5, 'y': 155.7642086, 'z': '50th'},
-    {'x': 155.5, 'y': 161.0757603, 'z': '75th'},
-    {'x': 155.5, 'y': 165.892976, 'z': '90th'},
-    {'x': 155.5, 'y': 168.7922681, 'z': '95th'},
-    {'x': 155.5, 'y': 170.6816665, 'z': '97th'},
-    {'x': 156.5, 'y': 141.7345116, 'z': '3rd'},
-    {'x': 156.5, 'y': 143.5608087, 'z': '5th'},
-    {'x': 156.5, 'y': 146.3813098, 'z': '10th'},
-    {'x': 156.5, 'y': 151.1165487, 'z': '25th'},
-    {'x': 156.5, 'y': 156.4098858, 'z': '50th'},
-    {'x': 156.5, 'y': 161.7363527, 'z': '75th'},
-    {'x': 156.5, 'y': 166.5580917, 'z': '90th'},
-    {'x': 156.5, 'y': 169.4560742, 'z': '95th'},
-    {'x': 156.5, 'y': 171.3430163, 'z': '97th'},
-    {'x': 157.5, 'y': 142.2888712, 'z': '3rd'},
-    {'x': 157.5, 'y': 144.1322433, 'z': '5th'},
-    {'x': 157.5, 'y': 146.9762604, 'z': '10th'},
-    {'x': 157.5, 'y': 151.7433416, 'z': '25th'},
-    {'x': 157.5, 'y': 157.0612415, 'z': '50th'},
-    {'x': 157.5, 'y': 162.4010311, 'z': '75th'},
-    {'x': 157.5, 'y': 167.2252714, 'z': '90th'},
-    {'x': 157.5, 'y': 170.1204959, 'z': '95th'},
-    {'x': 157.5, 'y': 172.0039535, 'z': '97th'},
-    {'x': 158.5, 'y': 142.8482077, 'z': '3rd'},
-    {'x': 158.5, 'y': 144.7089466, 'z': '5th'},
-    {'x': 158.5, 'y': 147.576693, 'z': '10th'},
-    {'x': 158.5, 'y': 152.3753859, 'z': '25th'},
-    {'x': 158.5, 'y': 157.7168289, 'z': '50th'},
-    {'x': 158.5, 'y': 163.0682321, 'z': '75th'},
-    {'x': 158.5, 'y': 167.8929368, 'z': '90th'},
-    {'x': 158.5, 'y': 170.7839909, 'z': '95th'},
-    {'x': 158.5, 'y': 172.662978, 'z': '97th'},
-    {'x': 159.5, 'y': 143.4117718, 'z': '3rd'},
-    {'x': 159.5, 'y': 145.2900346, 'z': '5th'},
-    {'x': 159.5, 'y': 148.1815319, 'z': '10th'},
-    {'x': 159.5, 'y': 153.0113368, 'z': '25th'},
-    {'x': 159.5, 'y': 158.3750929, 'z': '50th'},
-    {'x': 159.5, 'y': 163.7362982, 'z': '75th'},
-    {'x': 159.5, 'y': 168.5594402, 'z': '90th'},
-    {'x': 159.5, 'y': 171.444966, 'z': '95th'},
-    {'x': 159.5, 'y': 173.3185527, 'z': '97th'},
-    {'x': 160.5, 'y': 143.9787585, 'z': '3rd'},
-    {'x': 160.5, 'y': 145.8745579, 'z': '5th'},
-    {'x': 160.5, 'y': 148.7896253, 'z': '10th'},
-    {'x': 160.5, 'y': 153.6497654, 'z': '25th'},
-    {'x': 160.5, 'y': 159.034399, 'z': '50th'},
-    {'x': 160.5, 'y': 164.4035075, 'z': '75th'},
-    {'x': 160.5, 'y': 169.2230883, 'z': '90th'},
-    {'x': 160.5, 'y': 172.1017957, 'z': '95th'},
-    {'x': 160.5, 'y': 173.9691164, 'z': '97th'},
-    {'x': 161.5, 'y': 144.5483179, 'z': '3rd'},
-    {'x': 161.5, 'y': 146.4615117, 'z': '5th'},
-    {'x': 161.5, 'y': 149.3997554, 'z': '10th'},
-    {'x': 161.5, 'y': 154.2891719, 'z': '25th'},
-    {'x': 161.5, 'y': 159.6930501, 'z': '50th'},
-    {'x': 161.5, 'y': 165.0680948, 'z': '75th'},
-    {'x': 161.5, 'y': 169.8821678, 'z': '90th'},
-    {'x': 161.5, 'y': 172.7528491, 'z': '95th'},
-    {'x': 161.5, 'y': 174.6131123, 'z': '97th'},
-    {'x': 162.5, 'y': 145.1195552, 'z': '3rd'},
-    {'x': 162.5, 'y': 147.0498421, 'z': '5th'},
-    {'x': 162.5, 'y': 150.0106525, 'z': '10th'},
-    {'x': 162.5, 'y': 154.9280091, 'z': '25th'},
-    {'x': 162.5, 'y': 160.3493168, 'z': '50th'},
-    {'x': 162.5, 'y': 165.7282823, 'z': '75th'},
-    {'x': 162.5, 'y': 170.5349712, 'z': '90th'},
-    {'x': 162.5, 'y': 173.3965112, 'z': '95th'},
-    {'x': 162.5, 'y': 175.2490052, 'z': '97th'},
-    {'x': 163.5, 'y': 145.6915401, 'z': '3rd'},
-    {'x': 163.5, 'y': 147.6384567, 'z': '5th'},
-    {'x': 163.5, 'y': 150.6210083, 'z': '10th'},
-    {'x': 163.5, 'y': 155.5647003, 'z': '25th'},
-    {'x': 163.5, 'y': 161.0014586, 'z': '50th'},
-    {'x': 163.5, 'y': 166.3823042, 'z': '75th'},
-    {'x': 163.5, 'y': 171.1798224, 'z': '90th'},
-    {'x': 163.5, 'y': 174.0312083, 'z': '95th'},
-    {'x': 163.5, 'y': 175.8753066, 'z': '97th'},
-    {'x': 164.5, 'y': 146.2633119, 'z': '3rd'},
-    {'x': 164.5, 'y': 148.226234, 'z': '5th'},
-    {'x': 164.5, 'y': 151.2294913, 'z': '10th'},
-    {'x': 164.5, 'y': 156.1976616, 'z': '25th'},
-    {'x': 164.5, 'y': 161.6477515, 'z': '50th'},
-    {'x': 164.5, 'y': 167.0284338, 'z': '75th'},
-    {'x': 164.5, 'y': 171.8151013, 'z': '90th'},
-    {'x': 164.5, 'y': 174.6554295, 'z': '95th'},
-    {'x': 164.5, 'y': 176.490594, 'z': '97th'},
-    {'x': 165.5, 'y': 146.8338868, 'z': '3rd'},
-    {'x': 165.5, 'y': 148.8120346, 'z': '5th'},
-    {'x': 165.5, 'y': 151.8347622, 'z': '10th'},
-    {'x': 165.5, 'y': 156.8253238, 'z': '25th'},
-    {'x': 165.5, 'y': 162.2865119, 'z': '50th'},
-    {'x': 165.5, 'y': 167.6650085, 'z': '75th'},
-    {'x': 165.5, 'y': 172.4392666, 'z': '90th'},
-    {'x': 165.5, 'y': 175.2677481, 'z': '95th'},
-    {'x': 165.5, 'y': 177.0935299, 'z': '97th'},
-    {'x': 166.5, 'y': 147.4022657, 'z': '3rd'},
-    {'x': 166.5, 'y': 149.394712, 'z': '5th'},
-    {'x': 166.5, 'y': 152.4354895, 'z': '10th'},
-    {'x': 166.5, 'y': 157.4461523, 'z': '25th'},
-    {'x': 166.5, 'y': 162.9161202, 'z': '50th'},
-    {'x': 166.5, 'y': 168.2904522, 'z': '75th'},
-    {'x': 166.5, 'y': 173.0508762, 'z': '90th'},
-    {'x': 166.5, 'y': 175.8668393, 'z': '95th'},
-    {'x': 166.5, 'y': 177.6828795, 'z': '97th'},
-    {'x': 167.5, 'y': 147.9674393, 'z': '3rd'},
-    {'x': 167.5, 'y': 149.9731226, 'z': '5th'},
-    {'x': 167.5, 'y': 153.0303654, 'z': '10th'},
-    {'x': 167.5, 'y': 158.0586697, 'z': '25th'},
-    {'x': 167.5, 'y': 163.535045, 'z': '50th'},
-    {'x': 167.5, 'y': 168.9032981, 'z': '75th'},
-    {'x': 167.5, 'y': 173.6486051, 'z': '90th'},
-    {'x': 167.5, 'y': 176.4514947, 'z': '95th'},
-    {'x': 167.5, 'y': 178.2575211, 'z': '97th'},
-    {'x': 168.5, 'y': 148.5284089, 'z': '3rd'},
-    {'x': 168.5, 'y': 150.5461431, 'z': '5th'},
-    {'x': 168.5, 'y': 153.6181187, 'z': '10th'},
-    {'x': 168.5, 'y': 158.6614636, 'z': '25th'},
-    {'x': 168.5, 'y': 164.1418486, 'z': '50th'},
-    {'x': 168.5, 'y': 169.5021963, 'z': '75th'},
-    {'x': 168.5, 'y': 174.2312589, 'z': '90th'},
-    {'x': 168.5, 'y': 177.0206409, 'z': '95th'},
-    {'x': 168.5, 'y': 178.8164693, 'z': '97th'},
-    {'x': 169.5, 'y': 149.0841789, 'z': '3rd'},
-    {'x': 169.5, 'y': 151.1126739, 'z': '5th'},
-    {'x': 169.5, 'y': 154.1975312, 'z': '10th'},
-    {'x': 169.5, 'y': 159.2532157, 'z': '25th'},
-    {'x': 169.5, 'y': 164.7352199, 'z': '50th'},
-    {'x': 169.5, 'y': 170.0859388, 'z': '75th'},
-    {'x': 169.5, 'y': 174.7977852, 'z': '90th'},
-    {'x': 169.5, 'y': 177.5733406, 'z': '95th'},
-    {'x': 169.5, 'y': 179.3588685, 'z': '97th'},
-    {'x': 170.5, 'y': 149.6337753, 'z': '3rd'},
-    {'x': 170.5, 'y': 151.6716544, 'z': '5th'},
-    {'x': 170.5, 'y': 154.7674484, 'z': '10th'},
-    {'x': 170.5, 'y': 159.8327068, 'z': '25th'},
-    {'x': 170.5, 'y': 165.3139755, 'z': '50th'},
-    {'x': 170.5, 'y': 170.6534628, 'z': '75th'},
-    {'x': 170.5, 'y': 175.347281, 'z': '90th'},
-    {'x': 170.5, 'y': 178.1088034, 'z': '95th'},
-    {'x': 170.5, 'y': 179.8840066, 'z': '97th'},
-    {'x': 171.5, 'y': 150.1762526, 'z': '3rd'},
-    {'x': 171.5, 'y': 152.2220718, 'z': '5th'},
-    {'x': 171.5, 'y': 155.3267913, 'z': '10th'},
-    {'x': 171.5, 'y': 160.3988301, 'z': '25th'},
-    {'x': 171.5, 'y': 165.8770715, 'z': '50th'},
-    {'x': 171.5, 'y': 171.2038574, 'z': '75th'},
-    {'x': 171.5, 'y': 175.8789961, 'z': '90th'},
-    {'x': 171.5, 'y': 178.6263873, 'z': '95th'},
-    {'x': 171.5, 'y': 180.3913154, 'z': '97th'},
-    {'x': 172.5, 'y': 150.7107013, 'z': '3rd'},
-    {'x': 172.5, 'y': 152.7629701, 'z': '5th'},
-    {'x': 172.5, 'y': 155.874565, 'z': '10th'},
-    {'x': 172.5, 'y': 160.9505985, 'z': '25th'},
-    {'x': 172.5, 'y': 166.4236087, 'z': '50th'},
-    {'x': 172.5, 'y': 171.7363673, 'z': '75th'},
-    {'x': 172.5, 'y': 176.392334, 'z': '90th'},
-    {'x': 172.5, 'y': 179.1255987, 'z': '95th'},
-    {'x': 172.5, 'y': 180.8803698, 'z': '97th'},
-    {'x': 173.5, 'y': 151.2362566, 'z': '3rd'},
-    {'x': 173.5, 'y': 153.2934582, 'z': '5th'},
-    {'x': 173.5, 'y': 156.4098665, 'z': '10th'},
-    {'x': 173.5, 'y': 161.4871507, 'z': '25th'},
-    {'x': 173.5, 'y': 166.9528354, 'z': '50th'},
-    {'x': 173.5, 'y': 172.2503918, 'z': '75th'},
-    {'x': 173.5, 'y': 176.8868489, 'z': '90th'},
-    {'x': 173.5, 'y': 179.6060885, 'z': '95th'},
-    {'x': 173.5, 'y': 181.3508837, 'z': '97th'},
-    {'x': 174.5, 'y': 151.7521046, 'z': '3rd'},
-    {'x': 174.5, 'y': 153.8127163, 'z': '5th'},
-    {'x': 174.5, 'y': 156.9318906, 'z': '10th'},
-    {'x': 174.5, 'y': 162.0077536, 'z': '25th'},
-    {'x': 174.5, 'y': 167.4641466, 'z': '50th'},
-    {'x': 174.5, 'y': 172.7454817, 'z': '75th'},
-    {'x': 174.5, 'y': 177.3622413, 'z': '90th'},
-    {'x': 174.5, 'y': 180.0676464, 'z': '95th'},
-    {'x': 174.5, 'y': 181.8027041, 'z': '97th'},
-    {'x': 175.5, 'y': 152.2574887, 'z': '3rd'},
-    {'x': 175.5, 'y': 154.3200013, 'z': '5th'},
-    {'x': 175.5, 'y': 157.4399327, 'z': '10th'},
-    {'x': 175.5, 'y': 162.5118031, 'z': '25th'},
-    {'x': 175.5, 'y': 167.9570814, 'z': '50th'},
-    {'x': 175.5, 'y': 173.2213335, 'z': '75th'},
-    {'x': 175.5, 'y': 177.8183499, 'z': '90th'},
-    {'x': 175.5, 'y': 180.5101936, 'z': '95th'},
-    {'x': 175.5, 'y': 182.2358034, 'z': '97th'},
-    {'x': 176.5, 'y': 152.7517151, 'z': '3rd'},
-    {'x': 176.5, 'y': 154.814651, 'z': '5th'},
-    {'x': 176.5, 'y': 157.9333914, 'z': '10th'},
-    {'x': 176.5, 'y': 162.9988222, 'z': '25th'},
-    {'x': 176.5, 'y': 168.4313175, 'z': '50th'},
-    {'x': 176.5, 'y': 173.6777819, 'z': '75th'},
-    {'x': 176.5, 'y': 178.2551431, 'z': '90th'},
-    {'x': 176.5, 'y': 180.9337725, 'z': '95th'},
-    {'x': 176.5, 'y': 182.6502694, 'z': '97th'},
-    {'x': 177.5, 'y': 153.2341567, 'z': '3rd'},
-    {'x': 177.5, 'y': 155.2960861, 'z': '5th'},
-    {'x': 177.5, 'y': 158.4117685, 'z': '10th'},
-    {'x': 177.5, 'y': 163.4684575, 'z': '25th'},
-    {'x': 177.5, 'y': 168.8866644, 'z': '50th'},
-    {'x': 177.5, 'y': 174.1147899, 'z': '75th'},
-    {'x': 177.5, 'y': 178.6727081, 'z': '90th'},
-    {'x': 177.5, 'y': 181.3385364, 'z': '95th'},
-    {'x': 177.5, 'y': 183.0462946, 'z': '97th'},
-    {'x': 178.5, 'y': 153.7042563, 'z': '3rd'},
-    {'x': 178.5, 'y': 155.7638123, 'z': '5th'},
-    {'x': 178.5, 'y': 158.8746672, 'z': '10th'},
-    {'x': 178.5, 'y': 163.9204738, 'z': '25th'},
-    {'x': 178.5, 'y': 169.3230548, 'z': '50th'},
-    {'x': 178.5, 'y': 174.5324388, 'z': '75th'},
-    {'x': 178.5, 'y': 179.0712394, 'z': '90th'},
-    {'x': 178.5, 'y': 181.7247376, 'z': '95th'},
-    {'x': 178.5, 'y': 183.4241646, 'z': '97th'},
-    {'x': 179.5, 'y': 154.1615288, 'z': '3rd'},
-    {'x': 179.5, 'y': 156.2174196, 'z': '5th'},
-    {'x': 179.5, 'y': 159.3217901, 'z': '10th'},
-    {'x': 179.5, 'y': 164.3547479, 'z': '25th'},
-    {'x': 179.5, 'y': 169.7405351, 'z': '50th'},
-    {'x': 179.5, 'y': 174.9309165, 'z': '75th'},
-    {'x': 179.5, 'y': 179.4510272, 'z': '90th'},
-    {'x': 179.5, 'y': 182.0927156, 'z': '95th'},
-    {'x': 179.5, 'y': 183.7842466, 'z': '97th'},
-    {'x': 180.5, 'y': 154.6055622, 'z': '3rd'},
-    {'x': 180.5, 'y': 156.6565818, 'z': '5th'},
-    {'x': 180.5, 'y': 159.7529343, 'z': '10th'},
-    {'x': 180.5, 'y': 164.7712603, 'z': '25th'},
-    {'x': 180.5, 'y': 170.139255, 'z': '50th'},
-    {'x': 180.5, 'y': 175.310506, 'z': '75th'},
-    {'x': 180.5, 'y': 179.8124447, 'z': '90th'},
-    {'x': 180.5, 'y': 182.4428851, 'z': '95th'},
-    {'x': 180.5, 'y': 184.1269767, 'z': '97th'},
-    {'x': 181.5, 'y': 155.0360175, 'z': '3rd'},
-    {'x': 181.5, 'y': 157.0810539, 'z': '5th'},
-    {'x': 181.5, 'y': 160.1679874, 'z': '10th'},
-    {'x': 181.5, 'y': 165.1700873, 'z': '25th'},
-    {'x': 181.5, 'y': 170.5194567, 'z': '50th'},
-    {'x': 181.5, 'y': 175.6715733, 'z': '75th'},
-    {'x': 181.5, 'y': 180.1559363, 'z': '90th'},
-    {'x': 181.5, 'y': 182.7757235, 'z': '95th'},
-    {'x': 181.5, 'y': 184.4528488, 'z': '97th'},
-    {'x': 182.5, 'y': 155.452628, 'z': '3rd'},
-    {'x': 182.5, 'y': 157.4906696, 'z': '5th'},
-    {'x': 182.5, 'y': 160.5669211, 'z': '10th'},
-    {'x': 182.5, 'y': 165.5513919, 'z': '25th'},
-    {'x': 182.5, 'y': 170.881464, 'z': '50th'},
-    {'x': 182.5, 'y': 176.0145556, 'z': '75th'},
-    {'x': 182.5, 'y': 180.4820061, 'z': '90th'},
-    {'x': 182.5, 'y': 183.09176, 'z': '95th'},
-    {'x': 182.5, 'y': 184.7624031, 'z': '97th'},
-    {'x': 183.5, 'y': 155.8551976, 'z': '3rd'},
-    {'x': 183.5, 'y': 157.8853369, 'z': '5th'},
-    {'x': 183.5, 'y': 160.9497852, 'z': '10th'},
-    {'x': 183.5, 'y': 165.9154147, 'z': '25th'},
-    {'x': 183.5, 'y': 171.2256717, 'z': '50th'},
-    {'x': 183.5, 'y': 176.3399504, 'z': '75th'},
-    {'x': 183.5, 'y': 180.791206, 'z': '90th'},
-    {'x': 183.5, 'y': 183.3915648, 'z': '95th'},
-    {'x': 183.5, 'y': 185.0562159, 'z': '97th'},
-    {'x': 184.5, 'y': 156.243598, 'z': '3rd'},
-    {'x': 184.5, 'y': 158.2650343, 'z': '5th'},
-    {'x': 184.5, 'y': 161.3167006, 'z': '10th'},
-    {'x': 184.5, 'y': 166.2624644, 'z': '25th'},
-    {'x': 184.5, 'y': 171.5525345, 'z': '50th'},
-    {'x': 184.5, 'y': 176.648304, 'z': '75th'},
-    {'x': 184.5, 'y': 181.0841263, 'z': '90th'},
-    {'x': 184.5, 'y': 183.6757386, 'z': '95th'},
-    {'x': 184.5, 'y': 185.3348893, 'z': '97th'},
-    {'x': 185.5, 'y': 156.6177662, 'z': '3rd'},
-    {'x': 185.5, 'y': 158.6298055, 'z': '5th'},
-    {'x': 185.5, 'y': 161.6678528, 'z': '10th'},
-    {'x': 185.5, 'y': 166.5929092, 'z': '25th'},
-    {'x': 185.5, 'y': 171.8625576, 'z': '50th'},
-    {'x': 185.5, 'y': 176.9402021, 'z': '75th'},
-    {'x': 185.5, 'y': 181.3613851, 'z': '90th'},
-    {'x': 185.5, 'y': 183.9449038, 'z': '95th'},
-    {'x': 185.5, 'y': 185.5990431, 'z': '97th'},
-    {'x': 186.5, 'y': 156.9777005, 'z': '3rd'},
-    {'x': 186.5, 'y': 158.9797544, 'z': '5th'},
-    {'x': 186.5, 'y': 162.0034846, 'z': '10th'},
-    {'x': 186.5, 'y': 166.9071674, 'z': '25th'},
-    {'x': 186.5, 'y': 172.1562865, 'z': '50th'},
-    {'x': 186.5, 'y': 177.2162598, 'z': '75th'},
-    {'x': 186.5, 'y': 181.6236202, 'z': '90th'},
-    {'x': 186.5, 'y': 184.1996965, 'z': '95th'},
-    {'x': 186.5, 'y': 185.8493063, 'z': '97th'},
-    {'x': 187.5, 'y': 157.3234565, 'z': '3rd'},
-    {'x': 187.5, 'y': 159.31504, 'z': '5th'},
-    {'x': 187.5, 'y': 162.3238889, 'z': '10th'},
-    {'x': 187.5, 'y': 167.2056993, 'z': '25th'},
-    {'x': 187.5, 'y': 172.4342983, 'z': '50th'},
-    {'x': 187.5, 'y': 177.4771134, 'z': '75th'},
-    {'x': 187.5, 'y': 181.871481, 'z': '90th'},
-    {'x': 187.5, 'y': 184.4407585, 'z': '95th'},
-    {'x': 187.5, 'y': 186.0863109, 'z': '97th'},
-    {'x': 188.5, 'y': 157.6551432, 'z': '3rd'},
-    {'x': 188.5, 'y': 159.6358703, 'z': '5th'},
-    {'x': 188.5, 'y': 162.6294022, 'z': '10th'},
-    {'x': 188.5, 'y': 167.4889986, 'z': '25th'},
-    {'x': 188.5, 'y': 172.6971935, 'z': '50th'},
-    {'x': 188.5, 'y': 177.7234122, 'z': '75th'},
-    {'x': 188.5, 'y': 182.1056218, 'z': '90th'},
-    {'x': 188.5, 'y': 184.6687321, 'z': '95th'},
-    {'x': 188.5, 'y': 186.3106859, 'z': '97th'},
-    {'x': 189.5, 'y': 157.9729166, 'z': '3rd'},
-    {'x': 189.5, 'y': 159.9424968, 'z': '5th'},
-    {'x': 189.5, 'y': 162.9203983, 'z': '10th'},
-    {'x': 189.5, 'y': 167.7575872, 'z': '25th'},
-    {'x': 189.5, 'y': 172.9455898, 'z': '50th'},
-    {'x': 189.5, 'y': 177.9558135, 'z': '75th'},
-    {'x': 189.5, 'y': 182.3266957, 'z': '90th'},
-    {'x': 189.5, 'y': 184.8842531, 'z': '95th'},
-    {'x': 189.5, 'y': 186.5230505, 'z': '97th'},
-    {'x': 190.5, 'y': 158.2769793, 'z': '3rd'},
-    {'x': 190.5, 'y': 160.2352102, 'z': '5th'},
-    {'x': 190.5, 'y': 163.1972811, 'z': '10th'},
-    {'x': 190.5, 'y': 168.012004, 'z': '25th'},
-    {'x': 190.5, 'y': 173.180112, 'z': '50th'},
-    {'x': 190.5, 'y': 178.174973, 'z': '75th'},
-    {'x': 190.5, 'y': 182.5353493, 'z': '90th'},
-    {'x': 190.5, 'y': 185.0879485, 'z': '95th'},
-    {'x': 190.5, 'y': 186.7240141, 'z': '97th'},
-    {'x': 191.5, 'y': 158.5675712, 'z': '3rd'},
-    {'x': 191.5, 'y': 160.5143338, 'z': '5th'},
-    {'x': 191.5, 'y': 163.4604795, 'z': '10th'},
-    {'x': 191.5, 'y': 168.2528029, 'z': '25th'},
-    {'x': 191.5, 'y': 173.4013896, 'z': '50th'},
-    {'x': 191.5, 'y': 178.381543, 'z': '75th'},
-    {'x': 191.5, 'y': 182.7322187, 'z': '90th'},
-    {'x': 191.5, 'y': 185.2804307, 'z': '95th'},
-    {'x': 191.5, 'y': 186.914169, 'z': '97th'},
-    {'x': 192.5, 'y': 158.8449655, 'z': '3rd'},
-    {'x': 192.5, 'y': 160.7802183, 'z': '5th'},
-    {'x': 192.5, 'y': 163.7104424, 'z': '10th'},
-    {'x': 192.5, 'y': 168.4805469, 'z': '25th'},
-    {'x': 192.5, 'y': 173.6100518, 'z': '50th'},
-    {'x': 192.5, 'y': 178.5761676, 'z': '75th'},
-    {'x': 192.5, 'y': 182.9179257, 'z': '90th'},
-    {'x': 192.5, 'y': 185.4622948, 'z': '95th'},
-    {'x': 192.5, 'y': 187.0940877, 'z': '97th'},
-    {'x': 193.5, 'y': 159.1094689, 'z': '3rd'},
-    {'x': 193.5, 'y': 161.0332391, 'z': '5th'},
-    {'x': 193.5, 'y': 163.9476322, 'z': '10th'},
-    {'x': 193.5, 'y': 168.6957988, 'z': '25th'},
-    {'x': 193.5, 'y': 173.8067179, 'z': '50th'},
-    {'x': 193.5, 'y': 178.7594756, 'z': '75th'},
-    {'x': 193.5, 'y': 183.093075, 'z': '90th'},
-    {'x': 193.5, 'y': 185.6341183, 'z': '95th'},
-    {'x': 193.5, 'y': 187.2643258, 'z': '97th'},
-    {'x': 194.5, 'y': 159.3614112, 'z': '3rd'},
-    {'x': 194.5, 'y': 161.2737894, 'z': '5th'},
-    {'x': 194.5, 'y': 164.1725219, 'z': '10th'},
-    {'x': 194.5, 'y': 168.8991222, 'z': '25th'},
-    {'x': 194.5, 'y': 173.9919998, 'z': '50th'},
-    {'x': 194.5, 'y': 178.9320817, 'z': '75th'},
-    {'x': 194.5, 'y': 183.2582518, 'z': '90th'},
-    {'x': 194.5, 'y': 185.7964565, 'z': '95th'},
-    {'x': 194.5, 'y': 187.4254148, 'z': '97th'},
-    {'x': 195.5, 'y': 159.6011441, 'z': '3rd'},
-    {'x': 195.5, 'y': 161.5022772, 'z': '5th'},
-    {'x': 195.5, 'y': 164.3855897, 'z': '10th'},
-    {'x': 195.5, 'y': 169.0910747, 'z': '25th'},
-    {'x': 195.5, 'y': 174.1664951, 'z': '50th'},
-    {'x': 195.5, 'y': 179.0945815, 'z': '75th'},
-    {'x': 195.5, 'y': 183.4140202, 'z': '90th'},
-    {'x': 195.5, 'y': 185.949843, 'z': '95th'},
-    {'x': 195.5, 'y': 187.5778643, 'z': '97th'},
-    {'x': 196.5, 'y': 159.8290369, 'z': '3rd'},
-    {'x': 196.5, 'y': 161.7191211, 'z': '5th'},
-    {'x': 196.5, 'y': 164.5873165, 'z': '10th'},
-    {'x': 196.5, 'y': 169.2722058, 'z': '25th'},
-    {'x': 196.5, 'y': 174.3307855, 'z': '50th'},
-    {'x': 196.5, 'y': 179.2475503, 'z': '75th'},
-    {'x': 196.5, 'y': 183.5609217, 'z': '90th'},
-    {'x': 196.5, 'y': 186.0947883, 'z': '95th'},
-    {'x': 196.5, 'y': 187.7221607, 'z': '97th'},
-    {'x': 197.5, 'y': 160.0454725, 'z': '3rd'},
-    {'x': 197.5, 'y': 161.9247473, 'z': '5th'},
-    {'x': 197.5, 'y': 164.7781818, 'z': '10th'},
-    {'x': 197.5, 'y': 169.4430536, 'z': '25th'},
-    {'x': 197.5, 'y': 174.4854344, 'z': '50th'},
-    {'x': 197.5, 'y': 179.3915415, 'z': '75th'},
-    {'x': 197.5, 'y': 183.6994748, 'z': '90th'},
-    {'x': 197.5, 'y': 186.2317794, 'z': '95th'},
-    {'x': 197.5, 'y': 187.8587671, 'z': '97th'},
-    {'x': 198.5, 'y': 160.2508441, 'z': '3rd'},
-    {'x': 198.5, 'y': 162.1195857, 'z': '5th'},
-    {'x': 198.5, 'y': 164.9586613, 'z': '10th'},
-    {'x': 198.5, 'y': 169.6041427, 'z': '25th'},
-    {'x': 198.5, 'y': 174.6309856, 'z': '50th'},
-    {'x': 198.5, 'y': 179.5270853, 'z': '75th'},
-    {'x': 198.5, 'y': 183.8301738, 'z': '90th'},
-    {'x': 198.5, 'y': 186.3612801, 'z': '95th'},
-    {'x': 198.5, 'y': 187.9881233, 'z': '97th'},
-    {'x': 199.5, 'y': 160.4455519, 'z': '3rd'},
-    {'x': 199.5, 'y': 162.3040676, 'z': '5th'},
-    {'x': 199.5, 'y': 165.1292244, 'z': '10th'},
-    {'x': 199.5, 'y': 169.7559826, 'z': '25th'},
-    {'x': 199.5, 'y': 174.7679617, 'z': '50th'},
-    {'x': 199.5, 'y': 179.6546885, 'z': '75th'},
-    {'x': 199.5, 'y': 183.9534894, 'z': '90th'},
-    {'x': 199.5, 'y': 186.4837302, 'z': '95th'},
-    {'x': 199.5, 'y': 188.1106465, 'z': '97th'},
-    {'x': 200.5, 'y': 160.6300005, 'z': '3rd'},
-    {'x': 200.5, 'y': 162.4786229, 'z': '5th'},
-    {'x': 200.5, 'y': 165.2903324, 'z': '10th'},
-    {'x': 200.5, 'y': 169.8990665, 'z': '25th'},
-    {'x': 200.5, 'y': 174.8968634, 'z': '50th'},
-    {'x': 200.5, 'y': 179.7748338, 'z': '75th'},
-    {'x': 200.5, 'y': 184.0698683, 'z': '90th'},
-    {'x': 200.5, 'y': 186.5995468, 'z': '95th'},
-    {'x': 200.5, 'y': 188.2267311, 'z': '97th'},
-    {'x': 201.5, 'y': 160.8045956, 'z': '3rd'},
-    {'x': 201.5, 'y': 162.643678, 'z': '5th'},
-    {'x': 201.5, 'y': 165.4424364, 'z': '10th'},
-    {'x': 201.5, 'y': 170.0338694, 'z': '25th'},
-    {'x': 201.5, 'y': 175.0181691, 'z': '50th'},
-    {'x': 201.5, 'y': 179.8879797, 'z': '75th'},
-    {'x': 201.5, 'y': 184.1797333, 'z': '90th'},
-    {'x': 201.5, 'y': 186.7091242, 'z': '95th'},
-    {'x': 201.5, 'y': 188.3367503, 'z': '97th'},
-    {'x': 202.5, 'y': 160.9697424, 'z': '3rd'},
-    {'x': 202.5, 'y': 162.7996536, 'z': '5th'},
-    {'x': 202.5, 'y': 165.5859761, 'z': '10th'},
-    {'x': 202.5, 'y': 170.1608483, 'z': '25th'},
-    {'x': 202.5, 'y': 175.1323345, 'z': '50th'},
-    {'x': 202.5, 'y': 179.9945609, 'z': '75th'},
-    {'x': 202.5, 'y': 184.2834844, 'z': '90th'},
-    {'x': 202.5, 'y': 186.8128348, 'z': '95th'},
-    {'x': 202.5, 'y': 188.4410559, 'z': '97th'},
-    {'x': 203.5, 'y': 161.1258433, 'z': '3rd'},
-    {'x': 203.5, 'y': 162.9469636, 'z': '5th'},
-    {'x': 203.5, 'y': 165.7213786, 'z': '10th'},
-    {'x': 203.5, 'y': 170.280441, 'z': '25th'},
-    {'x': 203.5, 'y': 175.2397926, 'z': '50th'},
-    {'x': 203.5, 'y': 180.0949883, 'z': '75th'},
-    {'x': 203.5, 'y': 184.3814989, 'z': '90th'},
-    {'x': 203.5, 'y': 186.9110296, 'z': '95th'},
-    {'x': 203.5, 'y': 188.5399798, 'z': '97th'},
-    {'x': 204.5, 'y': 161.2732955, 'z': '3rd'},
-    {'x': 204.5, 'y': 163.0860132, 'z': '5th'},
-    {'x': 204.5, 'y': 165.8490577, 'z': '10th'},
-    {'x': 204.5, 'y': 170.3930664, 'z': '25th'},
-    {'x': 204.5, 'y': 175.340954, 'z': '50th'},
-    {'x': 204.5, 'y': 180.1896498, 'z': '75th'},
-    {'x': 204.5, 'y': 184.4741322, 'z': '90th'},
-    {'x': 204.5, 'y': 187.0040394, 'z': '95th'},
-    {'x': 204.5, 'y': 188.6338345, 'z': '97th'},
-    {'x': 205.5, 'y': 161.4124903, 'z': '3rd'},
-    {'x': 205.5, 'y': 163.2171976, 'z': '5th'},
-    {'x': 205.5, 'y': 165.9694129, 'z': '10th'},
-    {'x': 205.5, 'y': 170.4991239, 'z': '25th'},
-    {'x': 205.5, 'y': 175.4362071, 'z': '50th'},
-    {'x': 205.5, 'y': 180.278911, 'z': '75th'},
-    {'x': 205.5, 'y': 184.5617185, 'z': '90th'},
-    {'x': 205.5, 'y': 187.0921753, 'z': '95th'},
-    {'x': 205.5, 'y': 188.7229142, 'z': '97th'},
-    {'x': 206.5, 'y': 161.5438112, 'z': '3rd'},
-    {'x': 206.5, 'y': 163.3409016, 'z': '5th'},
-    {'x': 206.5, 'y': 166.0828291, 'z': '10th'},
-    {'x': 206.5, 'y': 170.5989941, 'z': '25th'},
-    {'x': 206.5, 'y': 175.5259191, 'z': '50th'},
-    {'x': 206.5, 'y': 180.3631154, 'z': '75th'},
-    {'x': 206.5, 'y': 184.644572, 'z': '90th'},
-    {'x': 206.5, 'y': 187.1757295, 'z': '95th'},
-    {'x': 206.5, 'y': 188.8074955, 'z': '97th'},
-    {'x': 207.5, 'y': 161.6676329, 'z': '3rd'},
-    {'x': 207.5, 'y': 163.4574984, 'z': '5th'},
-    {'x': 207.5, 'y': 166.1896765, 'z': '10th'},
-    {'x': 207.5, 'y': 170.6930385, 'z': '25th'},
-    {'x': 207.5, 'y': 175.6104358, 'z': '50th'},
-    {'x': 207.5, 'y': 180.4425858, 'z': '75th'},
-    {'x': 207.5, 'y': 184.7229873, 'z': '90th'},
-    {'x': 207.5, 'y': 187.2549767, 'z': '95th'},
-    {'x': 207.5, 'y': 188.8878386, 'z': '97th'},
-    {'x': 208.5, 'y': 161.7843202, 'z': '3rd'},
-    {'x': 208.5, 'y': 163.5673489, 'z': '5th'},
-    {'x': 208.5, 'y': 166.29031, 'z': '10th'},
-    {'x': 208.5, 'y': 170.7816002, 'z': '25th'},
-    {'x': 208.5, 'y': 175.690083, 'z': '50th'},
-    {'x': 208.5, 'y': 180.5176249, 'z': '75th'},
-    {'x': 208.5, 'y': 184.7972407, 'z': '90th'},
-    {'x': 208.5, 'y': 187.3301745, 'z': '95th'},
-    {'x': 208.5, 'y': 188.9641878, 'z': '97th'},
-    {'x': 209.5, 'y': 161.8942273, 'z': '3rd'},
-    {'x': 209.5, 'y': 163.6708019, 'z': '5th'},
-    {'x': 209.5, 'y': 166.3850695, 'z': '10th'},
-    {'x': 209.5, 'y': 170.8650043, 'z': '25th'},
-    {'x': 209.5, 'y': 175.7651671, 'z': '50th'},
-    {'x': 209.5, 'y': 180.5885165, 'z': '75th'},
-    {'x': 209.5, 'y': 184.867591, 'z': '90th'},
-    {'x': 209.5, 'y': 187.4015645, 'z': '95th'},
-    {'x': 209.5, 'y': 189.0367727, 'z': '97th'},
-    {'x': 210.5, 'y': 161.9976976, 'z': '3rd'},
-    {'x': 210.5, 'y': 163.7681929, 'z': '5th'},
-    {'x': 210.5, 'y': 166.4742799, 'z': '10th'},
-    {'x': 210.5, 'y': 170.9435584, 'z': '25th'},
-    {'x': 210.5, 'y': 175.8359757, 'z': '50th'},
-    {'x': 210.5, 'y': 180.6555257, 'z': '75th'},
-    {'x': 210.5, 'y': 184.9342803, 'z': '90th'},
-    {'x': 210.5, 'y': 187.4693732, 'z': '95th'},
-    {'x': 210.5, 'y': 189.1058089, 'z': '97th'},
-    {'x': 211.5, 'y': 162.0950624, 'z': '3rd'},
-    {'x': 211.5, 'y': 163.8598446, 'z': '5th'},
-    {'x': 211.5, 'y': 166.5582511, 'z': '10th'},
-    {'x': 211.5, 'y': 171.0175531, 'z': '25th'},
-    {'x': 211.5, 'y': 175.9027788, 'z': '50th'},
-    {'x': 211.5, 'y': 180.7189006, 'z': '75th'},
-    {'x': 211.5, 'y': 184.9975349, 'z': '90th'},
-    {'x': 211.5, 'y': 187.5338128, 'z': '95th'},
-    {'x': 211.5, 'y': 189.1714988, 'z': '97th'},
-    {'x': 212.5, 'y': 162.1866414, 'z': '3rd'},
-    {'x': 212.5, 'y': 163.9460665, 'z': '5th'},
-    {'x': 212.5, 'y': 166.6372787, 'z': '10th'},
-    {'x': 212.5, 'y': 171.0872629, 'z': '25th'},
-    {'x': 212.5, 'y': 175.9658293, 'z': '50th'},
-    {'x': 212.5, 'y': 180.7788732, 'z': '75th'},
-    {'x': 212.5, 'y': 185.0575666, 'z': '90th'},
-    {'x': 212.5, 'y': 187.5950821, 'z': '95th'},
-    {'x': 212.5, 'y': 189.2340323, 'z': '97th'},
-    {'x': 213.5, 'y': 162.272742, 'z': '3rd'},
-    {'x': 213.5, 'y': 164.027155, 'z': '5th'},
-    {'x': 213.5, 'y': 166.7116437, 'z': '10th'},
-    {'x': 213.5, 'y': 171.1529465, 'z': '25th'},
-    {'x': 213.5, 'y': 176.0253641, 'z': '50th'},
-    {'x': 213.5, 'y': 180.8356596, 'z': '75th'},
-    {'x': 213.5, 'y': 185.114573, 'z': '90th'},
-    {'x': 213.5, 'y': 187.6533672, 'z': '95th'},
-    {'x': 213.5, 'y': 189.2935878, 'z': '97th'},
-    {'x': 214.5, 'y': 162.3536592, 'z': '3rd'},
-    {'x': 214.5, 'y': 164.1033935, 'z': '5th'},
-    {'x': 214.5, 'y': 166.7816133, 'z': '10th'},
-    {'x': 214.5, 'y': 171.2148477, 'z': '25th'},
-    {'x': 214.5, 'y': 176.081605, 'z': '50th'},
-    {'x': 214.5, 'y': 180.8894616, 'z': '75th'},
-    {'x': 214.5, 'y': 185.1687386, 'z': '90th'},
-    {'x': 214.5, 'y': 187.7088422, 'z': '95th'},
-    {'x': 214.5, 'y': 189.3503326, 'z': '97th'},
-    {'x': 215.5, 'y': 162.429676, 'z': '3rd'},
-    {'x': 215.5, 'y': 164.1750527, 'z': '5th'},
-    {'x': 215.5, 'y': 166.8474411, 'z': '10th'},
-    {'x': 215.5, 'y': 171.2731962, 'z': '25th'},
-    {'x': 215.5, 'y': 176.1347593, 'z': '50th'},
-    {'x': 215.5, 'y': 180.9404676, 'z': '75th'},
-    {'x': 215.5, 'y': 185.2202359, 'z': '90th'},
-    {'x': 215.5, 'y': 187.7616702, 'z': '95th'},
-    {'x': 215.5, 'y': 189.4044237, 'z': '97th'},
-    {'x': 216.5, 'y': 162.501063, 'z': '3rd'},
-    {'x': 216.5, 'y': 164.2423904, 'z': '5th'},
-    {'x': 216.5, 'y': 166.9093676, 'z': '10th'},
-    {'x': 216.5, 'y': 171.3282079, 'z': '25th'},
-    {'x': 216.5, 'y': 176.1850208, 'z': '50th'},
-    {'x': 216.5, 'y': 180.9888527, 'z': '75th'},
-    {'x': 216.5, 'y': 185.2692255, 'z': '90th'},
-    {'x': 216.5, 'y': 187.8120038, 'z': '95th'},
-    {'x': 216.5, 'y': 189.4560086, 'z': '97th'},
-    {'x': 217.5, 'y': 162.5680787, 'z': '3rd'},
-    {'x': 217.5, 'y': 164.3056523, 'z': '5th'},
-    {'x': 217.5, 'y': 166.9676208, 'z': '10th'},
-    {'x': 217.5, 'y': 171.3800858, 'z': '25th'},
-    {'x': 217.5, 'y': 176.2325707, 'z': '50th'},
-    {'x': 217.5, 'y': 181.0347806, 'z': '75th'},
-    {'x': 217.5, 'y': 185.3158575, 'z': '90th'},
-    {'x': 217.5, 'y': 187.8599859, 'z': '95th'},
-    {'x': 217.5, 'y': 189.5052256, 'z': '97th'},
-    {'x': 218.5, 'y': 162.6309697, 'z': '3rd'},
-    {'x': 218.5, 'y': 164.365072, 'z': '5th'},
-    {'x': 218.5, 'y': 167.0224162, 'z': '10th'},
-    {'x': 218.5, 'y': 171.4290208, 'z': '25th'},
-    {'x': 218.5, 'y': 176.2775781, 'z': '50th'},
-    {'x': 218.5, 'y': 181.0784033, 'z': '75th'},
-    {'x': 218.5, 'y': 185.3602719, 'z': '90th'},
-    {'x': 218.5, 'y': 187.9057499, 'z': '95th'},
-    {'x': 218.5, 'y': 189.5522044, 'z': '97th'},
-    {'x': 219.5, 'y': 162.689971, 'z': '3rd'},
-    {'x': 219.5, 'y': 164.4208714, 'z': '5th'},
-    {'x': 219.5, 'y': 167.0739579, 'z': '10th'},
-    {'x': 219.5, 'y': 171.4751921, 'z': '25th'},
-    {'x': 219.5, 'y': 176.3202008, 'z': '50th'},
-    {'x': 219.5, 'y': 181.1198626, 'z': '75th'},
-    {'x': 219.5, 'y': 185.4025992, 'z': '90th'},
-    {'x': 219.5, 'y': 187.9494211, 'z': '95th'},
-    {'x': 219.5, 'y': 189.5970671, 'z': '97th'},
-    {'x': 220.5, 'y': 162.7453061, 'z': '3rd'},
-    {'x': 220.5, 'y': 164.473261, 'z': '5th'},
-    {'x': 220.5, 'y': 167.1224387, 'z': '10th'},
-    {'x': 220.5, 'y': 171.5187679, 'z': '25th'},
-    {'x': 220.5, 'y': 176.3605864, 'z': '50th'},
-    {'x': 220.5, 'y': 181.1592906, 'z': '75th'},
-    {'x': 220.5, 'y': 185.4429613, 'z': '90th'},
-    {'x': 220.5, 'y': 187.9911165, 'z': '95th'},
-    {'x': 220.5, 'y': 189.6399279, 'z': '97th'},
-    {'x': 221.5, 'y': 162.7971876, 'z': '3rd'},
-    {'x': 221.5, 'y': 164.5224406, 'z': '5th'},
-    {'x': 221.5, 'y': 167.1680405, 'z': '10th'},
-    {'x': 221.5, 'y': 171.5599062, 'z': '25th'},
-    {'x': 221.5, 'y': 176.3988725, 'z': '50th'},
-    {'x': 221.5, 'y': 181.1968103, 'z': '75th'},
-    {'x': 221.5, 'y': 185.4814718, 'z': '90th'},
-    {'x': 221.5, 'y': 188.0309455, 'z': '95th'},
-    {'x': 221.5, 'y': 189.6808943, 'z': '97th'},
-    {'x': 222.5, 'y': 162.8458172, 'z': '3rd'},
-    {'x': 222.5, 'y': 164.5685992, 'z': '5th'},
-    {'x': 222.5, 'y': 167.2109353, 'z': '10th'},
-    {'x': 222.5, 'y': 171.598755, 'z': '25th'},
-    {'x': 222.5, 'y': 176.4351874, 'z': '50th'},
-    {'x': 222.5, 'y': 181.232536, 'z': '75th'},
-    {'x': 222.5, 'y': 185.5182368, 'z': '90th'},
-    {'x': 222.5, 'y': 188.0690108, 'z': '95th'},
-    {'x': 222.5, 'y': 189.7200672, 'z': '97th'},
-    {'x': 223.5, 'y': 162.8913862, 'z': '3rd'},
-    {'x': 223.5, 'y': 164.6119158, 'z': '5th'},
-    {'x': 223.5, 'y': 167.251285, 'z': '10th'},
-    {'x': 223.5, 'y': 171.6354533, 'z': '25th'},
-    {'x': 223.5, 'y': 176.469651, 'z': '50th'},
-    {'x': 223.5, 'y': 181.2665744, 'z': '75th'},
-    {'x': 223.5, 'y': 185.5533551, 'z': '90th'},
-    {'x': 223.5, 'y': 188.1054085, 'z': '95th'},
-    {'x': 223.5, 'y': 189.7575413, 'z': '97th'},
-    {'x': 224.5, 'y': 162.9340759, 'z': '3rd'},
-    {'x': 224.5, 'y': 164.6525596, 'z': '5th'},
-    {'x': 224.5, 'y': 167.2892424, 'z': '10th'},
-    {'x': 224.5, 'y': 171.6701314, 'z': '25th'},
-    {'x': 224.5, 'y': 176.5023751, 'z': '50th'},
-    {'x': 224.5, 'y': 181.2990249, 'z': '75th'},
-    {'x': 224.5, 'y': 185.5869193, 'z': '90th'},
-    {'x': 224.5, 'y': 188.1402284, 'z': '95th'},
-    {'x': 224.5, 'y': 189.7934056, 'z': '97th'},
-    {'x': 225.5, 'y': 162.9740581, 'z': '3rd'},
-    {'x': 225.5, 'y': 164.6906907, 'z': '5th'},
-    {'x': 225.5, 'y': 167.3249515, 'z': '10th'},
-    {'x': 225.5, 'y': 171.7029114, 'z': '25th'},
-    {'x': 225.5, 'y': 176.533464, 'z': '50th'},
-    {'x': 225.5, 'y': 181.3299799, 'z': '75th'},
-    {'x': 225.5, 'y': 185.6190155, 'z': '90th'},
-    {'x': 225.5, 'y': 188.1735549, 'z': '95th'},
-    {'x': 225.5, 'y': 189.8277438, 'z': '97th'},
-    {'x': 226.5, 'y': 163.0114951, 'z': '3rd'},
-    {'x': 226.5, 'y': 164.72646, 'z': '5th'},
-    {'x': 226.5, 'y': 167.3585477, 'z': '10th'},
-    {'x': 226.5, 'y': 171.7339076, 'z': '25th'},
-    {'x': 226.5, 'y': 176.5630153, 'z': '50th'},
-    {'x': 226.5, 'y': 181.3595256, 'z': '75th'},
-    {'x': 226.5, 'y': 185.6497244, 'z': '90th'},
-    {'x': 226.5, 'y': 188.2054669, 'z': '95th'},
-    {'x': 226.5, 'y': 189.8606344, 'z': '97th'},
-    {'x': 227.5, 'y': 163.0465405, 'z': '3rd'},
-    {'x': 227.5, 'y': 164.7600102, 'z': '5th'},
-    {'x': 227.5, 'y': 167.3901586, 'z': '10th'},
-    {'x': 227.5, 'y': 171.7632274, 'z': '25th'},
-    {'x': 227.5, 'y': 176.5911197, 'z': '50th'},
-    {'x': 227.5, 'y': 181.3877426, 'z': '75th'},
-    {'x': 227.5, 'y': 185.6791212, 'z': '90th'},
-    {'x': 227.5, 'y': 188.2360386, 'z': '95th'},
-    {'x': 227.5, 'y': 189.8921514, 'z': '97th'},
-    {'x': 228.5, 'y': 163.0793392, 'z': '3rd'},
-    {'x': 228.5, 'y': 164.7914756, 'z': '5th'},
-    {'x': 228.5, 'y': 167.4199044, 'z': '10th'},
-    {'x': 228.5, 'y': 171.7909712, 'z': '25th'},
-    {'x': 228.5, 'y': 176.6178621, 'z': '50th'},
-    {'x': 228.5, 'y': 181.4147056, 'z': '75th'},
-    {'x': 228.5, 'y': 185.7072763, 'z': '90th'},
-    {'x': 228.5, 'y': 188.2653392, 'z': '95th'},
-    {'x': 228.5, 'y': 189.9223642, 'z': '97th'},
-    {'x': 229.5, 'y': 163.1100283, 'z': '3rd'},
-    {'x': 229.5, 'y': 164.8209832, 'z': '5th'},
-    {'x': 229.5, 'y': 167.4478978, 'z': '10th'},
-    {'x': 229.5, 'y': 171.8172333, 'z': '25th'},
-    {'x': 229.5, 'y': 176.6433219, 'z': '50th'},
-    {'x': 229.5, 'y': 181.4404846, 'z': '75th'},
-    {'x': 229.5, 'y': 185.7342556, 'z': '90th'},
-    {'x': 229.5, 'y': 188.293434, 'z': '95th'},
-    {'x': 229.5, 'y': 189.9513383, 'z': '97th'},
-    {'x': 230.5, 'y': 163.1387368, 'z': '3rd'},
-    {'x': 230.5, 'y': 164.8486523, 'z': '5th'},
-    {'x': 230.5, 'y': 167.4742452, 'z': '10th'},
-    {'x': 230.5, 'y': 171.8421019, 'z': '25th'},
-    {'x': 230.5, 'y': 176.6675729, 'z': '50th'},
-    {'x': 230.5, 'y': 181.4651449, 'z': '75th'},
-    {'x': 230.5, 'y': 185.7601205, 'z': '90th'},
-    {'x': 230.5, 'y': 188.3203841, 'z': '95th'},
-    {'x': 230.5, 'y': 189.9791351, 'z': '97th'},
-    {'x': 231.5, 'y': 163.1655866, 'z': '3rd'},
-    {'x': 231.5, 'y': 164.8745955, 'z': '5th'},
-    {'x': 231.5, 'y': 167.4990462, 'z': '10th'},
-    {'x': 231.5, 'y': 171.8656596, 'z': '25th'},
-    {'x': 231.5, 'y': 176.6906844, 'z': '50th'},
-    {'x': 231.5, 'y': 181.4887473, 'z': '75th'},
-    {'x': 231.5, 'y': 185.7849287, 'z': '90th'},
-    {'x': 231.5, 'y': 188.3462469, 'z': '95th'},
-    {'x': 231.5, 'y': 190.0058126, 'z': '97th'},
-    {'x': 232.5, 'y': 163.1906925, 'z': '3rd'},
-    {'x': 232.5, 'y': 164.8989187, 'z': '5th'},
-    {'x': 232.5, 'y': 167.5223947, 'z': '10th'},
-    {'x': 232.5, 'y': 171.8879838, 'z': '25th'},
-    {'x': 232.5, 'y': 176.712721, 'z': '50th'},
-    {'x': 232.5, 'y': 181.5113488, 'z': '75th'},
-    {'x': 232.5, 'y': 185.8087343, 'z': '90th'},
-    {'x': 232.5, 'y': 188.3710763, 'z': '95th'},
-    {'x': 232.5, 'y': 190.0314253, 'z': '97th'},
-    {'x': 233.5, 'y': 163.2141625, 'z': '3rd'},
-    {'x': 233.5, 'y': 164.9217215, 'z': '5th'},
-    {'x': 233.5, 'y': 167.5443789, 'z': '10th'},
-    {'x': 233.5, 'y': 171.9091473, 'z': '25th'},
-    {'x': 233.5, 'y': 176.733743, 'z': '50th'},
-    {'x': 233.5, 'y': 181.5330026, 'z': '75th'},
-    {'x': 233.5, 'y': 185.8315877, 'z': '90th'},
-    {'x': 233.5, 'y': 188.394923, 'z': '95th'},
-    {'x': 233.5, 'y': 190.0560245, 'z': '97th'},
-    {'x': 234.5, 'y': 163.2360985, 'z': '3rd'},
-    {'x': 234.5, 'y': 164.9430978, 'z': '5th'},
-    {'x': 234.5, 'y': 167.5650814, 'z': '10th'},
-    {'x': 234.5, 'y': 171.9292179, 'z': '25th'},
-    {'x': 234.5, 'y': 176.753807, 'z': '50th'},
-    {'x': 234.5, 'y': 181.5537583, 'z': '75th'},
-    {'x': 234.5, 'y': 185.8535364, 'z': '90th'},
-    {'x': 234.5, 'y': 188.4178347, 'z': '95th'},
-    {'x': 234.5, 'y': 190.0796588, 'z': '97th'},
-    {'x': 235.5, 'y': 163.2565964, 'z': '3rd'},
-    {'x': 235.5, 'y': 164.9631357, 'z': '5th'},
-    {'x': 235.5, 'y': 167.5845802, 'z': '10th'},
-    {'x': 235.5, 'y': 171.9482593, 'z': '25th'},
-    {'x': 235.5, 'y': 176.7729657, 'z': '50th'},
-    {'x': 235.5, 'y': 181.5736625, 'z': '75th'},
-    {'x': 235.5, 'y': 185.874625, 'z': '90th'},
-    {'x': 235.5, 'y': 188.4398562, 'z': '95th'},
-    {'x': 235.5, 'y': 190.1023738, 'z': '97th'},
-    {'x': 236.5, 'y': 163.2757461, 'z': '3rd'},
-    {'x': 236.5, 'y': 164.9819181, 'z': '5th'},
-    {'x': 236.5, 'y': 167.602948, 'z': '10th'},
-    {'x': 236.5, 'y': 171.9663314, 'z': '25th'},
-    {'x': 236.5, 'y': 176.7912687, 'z': '50th'},
-    {'x': 236.5, 'y': 181.5927588, 'z': '75th'},
-    {'x': 236.5, 'y': 185.8948951, 'z': '90th'},
-    {'x': 236.5, 'y': 188.4610297, 'z': '95th'},
-    {'x': 236.5, 'y': 190.1242124, 'z': '97th'},
-    {'x': 237.5, 'y': 163.2936325, 'z': '3rd'},
-    {'x': 237.5, 'y': 164.9995229, 'z': '5th'},
-    {'x': 237.5, 'y': 167.6202536, 'z': '10th'},
-    {'x': 237.5, 'y': 171.9834901, 'z': '25th'},
-    {'x': 237.5, 'y': 176.8087622, 'z': '50th'},
-    {'x': 237.5, 'y': 181.6110879, 'z': '75th'},
-    {'x': 237.5, 'y': 185.914386, 'z': '90th'},
-    {'x': 237.5, 'y': 188.481395, 'z': '95th'},
-    {'x': 237.5, 'y': 190.1452154, 'z': '97th'},
-    {'x': 238.5, 'y': 163.3103353, 'z': '3rd'},
-    {'x': 238.5, 'y': 165.0160233, 'z': '5th'},
-    {'x': 238.5, 'y': 167.6365611, 'z': '10th'},
-    {'x': 238.5, 'y': 171.9997878, 'z': '25th'},
-    {'x': 238.5, 'y': 176.8254895, 'z': '50th'},
-    {'x': 238.5, 'y': 181.6286882, 'z': '75th'},
-    {'x': 238.5, 'y': 185.9331347, 'z': '90th'},
-    {'x': 238.5, 'y': 188.5009894, 'z': '95th'},
-    {'x': 238.5, 'y': 190.1654212, 'z': '97th'},
-    {'x': 239.5, 'y': 163.3259293, 'z': '3rd'},
-    {'x': 239.5, 'y': 165.031488, 'z': '5th'},
-    {'x': 239.5, 'y': 167.6519311, 'z': '10th'},
-    {'x': 239.5, 'y': 172.0152737, 'z': '25th'},
-    {'x': 239.5, 'y': 176.8414914, 'z': '50th'},
-    {'x': 239.5, 'y': 181.6455954, 'z': '75th'},
-    {'x': 239.5, 'y': 185.9511757, 'z': '90th'},
-    {'x': 239.5, 'y': 188.5198484, 'z': '95th'},
-    {'x': 239.5, 'y': 190.1848658, 'z': '97th'},
-    {'x': 240.0, 'y': 163.3333326, 'z': '3rd'},
-    {'x': 240.0, 'y': 165.0388523, 'z': '5th'},
-    {'x': 240.0, 'y': 167.6592824, 'z': '10th'},
-    {'x': 240.0, 'y': 172.0227268, 'z': '25th'},
-    {'x': 240.0, 'y': 176.8492322, 'z': '50th'},
-    {'x': 240.0, 'y': 181.6537998, 'z': '75th'},
-    {'x': 240.0, 'y': 185.9599411, 'z': '90th'},
-    {'x': 240.0, 'y': 188.5290125, 'z': '95th'},
-    {'x': 240.0, 'y': 190.1943135, 'z': '97th'}
-]
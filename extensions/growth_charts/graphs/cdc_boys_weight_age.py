@@ -1,344 +0,0 @@
-cdc_boys_weight_age = [
-    { "x": 0, "y": 2.355450986, "z": "3rd" },
-    { "x": 0.5, "y": 2.799548641, "z": "3rd" },
-    { "x": 1.5, "y": 3.614688072, "z": "3rd" },
-    { "x": 2.5, "y": 4.34234145, "z": "3rd" },
-    { "x": 3.5, "y": 4.992897896, "z": "3rd" },
-    { "x": 4.5, "y": 5.575169066, "z": "3rd" },
-    { "x": 5.5, "y": 6.096775274, "z": "3rd" },
-    { "x": 6.5, "y": 6.564430346, "z": "3rd" },
-    { "x": 7.5, "y": 6.984123338, "z": "3rd" },
-    { "x": 8.5, "y": 7.361236116, "z": "3rd" },
-    { "x": 9.5, "y": 7.700624405, "z": "3rd" },
-    { "x": 10.5, "y": 8.006677447, "z": "3rd" },
-    { "x": 11.5, "y": 8.283364855, "z": "3rd" },
-    { "x": 12.5, "y": 8.534275028, "z": "3rd" },
-    { "x": 13.5, "y": 8.762648582, "z": "3rd" },
-    { "x": 14.5, "y": 8.971407287, "z": "3rd" },
-    { "x": 15.5, "y": 9.163180317, "z": "3rd" },
-    { "x": 16.5, "y": 9.340328068, "z": "3rd" },
-    { "x": 17.5, "y": 9.504964014, "z": "3rd" },
-    { "x": 18.5, "y": 9.658974787, "z": "3rd" },
-    { "x": 19.5, "y": 9.804039109, "z": "3rd" },
-    { "x": 20.5, "y": 9.941644878, "z": "3rd" },
-    { "x": 21.5, "y": 10.07310549, "z": "3rd" },
-    { "x": 22.5, "y": 10.19957488, "z": "3rd" },
-    { "x": 23.5, "y": 10.32206165, "z": "3rd" },
-    { "x": 24.5, "y": 10.4414422, "z": "3rd" },
-    { "x": 25.5, "y": 10.55847309, "z": "3rd" },
-    { "x": 26.5, "y": 10.67380261, "z": "3rd" },
-    { "x": 27.5, "y": 10.78798156, "z": "3rd" },
-    { "x": 28.5, "y": 10.90147346, "z": "3rd" },
-    { "x": 29.5, "y": 11.01466395, "z": "3rd" },
-    { "x": 30.5, "y": 11.12786972, "z": "3rd" },
-    { "x": 31.5, "y": 11.24134752, "z": "3rd" },
-    { "x": 32.5, "y": 11.3552982, "z": "3rd" },
-    { "x": 33.5, "y": 11.46987977, "z": "3rd" },
-    { "x": 34.5, "y": 11.58520959, "z": "3rd" },
-    { "x": 35.5, "y": 11.70137143, "z": "3rd" },
-    { "x": 36, "y": 11.75978387, "z": "3rd" },
-    { "x": 0, "y": 2.52690402, "z": "5th"},
-    { "x": 0.5, "y": 2.964655655, "z": "5th" },
-    { "x": 1.5, "y": 3.774848862, "z": "5th" },
-    { "x": 2.5, "y": 4.503255345, "z": "5th" },
-    { "x": 3.5, "y": 5.157411653, "z": "5th" },
-    { "x": 4.5, "y": 5.744751566, "z": "5th" },
-    { "x": 5.5, "y": 6.272175299, "z": "5th" },
-    { "x": 6.5, "y": 6.745992665, "z": "5th" },
-    { "x": 7.5, "y": 7.171952393, "z": "5th" },
-    { "x": 8.5, "y": 7.555286752, "z": "5th" },
-    { "x": 9.5, "y": 7.90075516, "z": "5th" },
-    { "x": 10.5, "y": 8.212683538, "z": "5th" },
-    { "x": 11.5, "y": 8.494999555, "z": "5th" },
-    { "x": 12.5, "y": 8.751264252, "z": "5th" },
-    { "x": 13.5, "y": 8.984701111, "z": "5th" },
-    { "x": 14.5, "y": 9.198222429, "z": "5th" },
-    { "x": 15.5, "y": 9.394453831, "z": "5th" },
-    { "x": 16.5, "y": 9.575756968, "z": "5th" },
-    { "x": 17.5, "y": 9.744250626, "z": "5th" },
-    { "x": 18.5, "y": 9.901830339, "z": "5th" },
-    { "x": 19.5, "y": 10.05018686, "z": "5th" },
-    { "x": 20.5, "y": 10.19082308, "z": "5th" },
-    { "x": 21.5, "y": 10.32507004, "z": "5th" },
-    { "x": 22.5, "y": 10.45410181, "z": "5th" },
-    { "x": 23.5, "y": 10.57894925, "z": "5th" },
-    { "x": 24.5, "y": 10.70051298, "z": "5th" },
-    { "x": 25.5, "y": 10.81957536, "z": "5th" },
-    { "x": 26.5, "y": 10.93681171, "z": "5th" },
-    { "x": 27.5, "y": 11.05280067, "z": "5th" },
-    { "x": 28.5, "y": 11.168034, "z": "5th" },
-    { "x": 29.5, "y": 11.28292555, "z": "5th" },
-    { "x": 30.5, "y": 11.3978197, "z": "5th" },
-    { "x": 31.5, "y": 11.51299966, "z": "5th" },
-    { "x": 32.5, "y": 11.62869248, "z": "5th" },
-    { "x": 33.5, "y": 11.74507947, "z": "5th" },
-    { "x": 34.5, "y": 11.86229971, "z": "5th" },
-    { "x": 35.5, "y": 11.98045644, "z": "5th" },
-    { "x": 36, "y": 12.03991048, "z": "5th" },
-    { "x": 0, "y": 2.773801848, "z": "10th" },
-    { "x": 0.5, "y": 3.209510017, "z": "10th" },
-    { "x": 1.5, "y": 4.020561446, "z": "10th" },
-    { "x": 2.5, "y": 4.754479354, "z": "10th" },
-    { "x": 3.5, "y": 5.416802856, "z": "10th" },
-    { "x": 4.5, "y": 6.01371624, "z": "10th" },
-    { "x": 5.5, "y": 6.551379244, "z": "10th" },
-    { "x": 6.5, "y": 7.035656404, "z": "10th" },
-    { "x": 7.5, "y": 7.472021438, "z": "10th" },
-    { "x": 8.5, "y": 7.865532922, "z": "10th" },
-    { "x": 9.5, "y": 8.220839211, "z": "10th" },
-    { "x": 10.5, "y": 8.542195484, "z": "10th" },
-    { "x": 11.5, "y": 8.833485623, "z": "10th" },
-    { "x": 12.5, "y": 9.098245709, "z": "10th" },
-    { "x": 13.5, "y": 9.339687673, "z": "10th" },
-    { "x": 14.5, "y": 9.560722369, "z": "10th" },
-    { "x": 15.5, "y": 9.763981751, "z": "10th" },
-    { "x": 16.5, "y": 9.951839998, "z": "10th" },
-    { "x": 17.5, "y": 10.12643352, "z": "10th" },
-    { "x": 18.5, "y": 10.28967982, "z": "10th" },
-    { "x": 19.5, "y": 10.44329524, "z": "10th" },
-    { "x": 20.5, "y": 10.58881155, "z": "10th" },
-    { "x": 21.5, "y": 10.72759156, "z": "10th" },
-    { "x": 22.5, "y": 10.86084353, "z": "10th" },
-    { "x": 23.5, "y": 10.98963476, "z": "10th" },
-    { "x": 24.5, "y": 11.11490406, "z": "10th" },
-    { "x": 25.5, "y": 11.23747341, "z": "10th" },
-    { "x": 26.5, "y": 11.35805876, "z": "10th" },
-    { "x": 27.5, "y": 11.47727994, "z": "10th" },
-    { "x": 28.5, "y": 11.59566994, "z": "10th" },
-    { "x": 29.5, "y": 11.7136834, "z": "10th" },
-    { "x": 30.5, "y": 11.8317045, "z": "10th" },
-    { "x": 31.5, "y": 11.95005435, "z": "10th" },
-    { "x": 32.5, "y": 12.06899744, "z": "10th" },
-    { "x": 33.5, "y": 12.18874835, "z": "10th" },
-    { "x": 34.5, "y": 12.30947723, "z": "10th" },
-    { "x": 35.5, "y": 12.43131521, "z": "10th" },
-    { "x": 36, "y": 12.49268178, "z": "10th" },
-    { "x": 0, "y": 3.150611082, "z": "25th" },
-    { "x": 0.5, "y": 3.597395573, "z": "25th" },
-    { "x": 1.5, "y": 4.428872952, "z": "25th" },
-    { "x": 2.5, "y": 5.183377547, "z": "25th" },
-    { "x": 3.5, "y": 5.866806254, "z": "25th" },
-    { "x": 4.5, "y": 6.484969167, "z": "25th" },
-    { "x": 5.5, "y": 7.043626918, "z": "25th" },
-    { "x": 6.5, "y": 7.548345716, "z": "25th" },
-    { "x": 7.5, "y": 8.004398775, "z": "25th" },
-    { "x": 8.5, "y": 8.416718775, "z": "25th" },
-    { "x": 9.5, "y": 8.789881892, "z": "25th" },
-    { "x": 10.5, "y": 9.128109523, "z": "25th" },
-    { "x": 11.5, "y": 9.43527941, "z": "25th" },
-    { "x": 12.5, "y": 9.714941801, "z": "25th" },
-    { "x": 13.5, "y": 9.970337596, "z": "25th" },
-    { "x": 14.5, "y": 10.20441778, "z": "25th" },
-    { "x": 15.5, "y": 10.41986276, "z": "25th" },
-    { "x": 16.5, "y": 10.61910138, "z": "25th" },
-    { "x": 17.5, "y": 10.80432929, "z": "25th" },
-    { "x": 18.5, "y": 10.97752662, "z": "25th" },
-    { "x": 19.5, "y": 11.14047457, "z": "25th" },
-    { "x": 20.5, "y": 11.2947714, "z": "25th" },
-    { "x": 21.5, "y": 11.44184727, "z": "25th" },
-    { "x": 22.5, "y": 11.58297823, "z": "25th" },
-    { "x": 23.5, "y": 11.7192993, "z": "25th" },
-    { "x": 24.5, "y": 11.85181666, "z": "25th" },
-    { "x": 25.5, "y": 11.98141892, "z": "25th" },
-    { "x": 26.5, "y": 12.10888759, "z": "25th" },
-    { "x": 27.5, "y": 12.23490671, "z": "25th" },
-    { "x": 28.5, "y": 12.36007175, "z": "25th" },
-    { "x": 29.5, "y": 12.48489772, "z": "25th" },
-    { "x": 30.5, "y": 12.60982671, "z": "25th" },
-    { "x": 31.5, "y": 12.73523417, "z": "25th" },
-    { "x": 32.5, "y": 12.86143776, "z": "25th" },
-    { "x": 33.5, "y": 12.98869905, "z": "25th" },
-    { "x": 34.5, "y": 13.11723187, "z": "25th" },
-    { "x": 35.5, "y": 13.24720657, "z": "25th" },
-    { "x": 36, "y": 13.31277633, "z": "25th" },
-    { "x": 0, "y": 3.530203168, "z": "50th" },
-    { "x": 0.5, "y": 4.003106424, "z": "50th" },
-    { "x": 1.5, "y": 4.879525083, "z": "50th" },
-    { "x": 2.5, "y": 5.672888765, "z": "50th" },
-    { "x": 3.5, "y": 6.391391982, "z": "50th" },
-    { "x": 4.5, "y": 7.041836432, "z": "50th" },
-    { "x": 5.5, "y": 7.630425182, "z": "50th" },
-    { "x": 6.5, "y": 8.162951035, "z": "50th" },
-    { "x": 7.5, "y": 8.644832479, "z": "50th" },
-    { "x": 8.5, "y": 9.081119817, "z": "50th" },
-    { "x": 9.5, "y": 9.476500305, "z": "50th" },
-    { "x": 10.5, "y": 9.835307701, "z": "50th" },
-    { "x": 11.5, "y": 10.16153567, "z": "50th" },
-    { "x": 12.5, "y": 10.45885399, "z": "50th" },
-    { "x": 13.5, "y": 10.7306256, "z": "50th" },
-    { "x": 14.5, "y": 10.97992482, "z": "50th" },
-    { "x": 15.5, "y": 11.20955529, "z": "50th" },
-    { "x": 16.5, "y": 11.4220677, "z": "50th" },
-    { "x": 17.5, "y": 11.61977698, "z": "50th" },
-    { "x": 18.5, "y": 11.80477902, "z": "50th" },
-    { "x": 19.5, "y": 11.9789663, "z": "50th" },
-    { "x": 20.5, "y": 12.14404334, "z": "50th" },
-    { "x": 21.5, "y": 12.30154103, "z": "50th" },
-    { "x": 22.5, "y": 12.45283028, "z": "50th" },
-    { "x": 23.5, "y": 12.59913494, "z": "50th" },
-    { "x": 24.5, "y": 12.74154396, "z": "50th" },
-    { "x": 25.5, "y": 12.88102276, "z": "50th" },
-    { "x": 26.5, "y": 13.01842382, "z": "50th" },
-    { "x": 27.5, "y": 13.1544966, "z": "50th" },
-    { "x": 28.5, "y": 13.28989667, "z": "50th" },
-    { "x": 29.5, "y": 13.42519408, "z": "50th" },
-    { "x": 30.5, "y": 13.56088113, "z": "50th" },
-    { "x": 31.5, "y": 13.69737858, "z": "50th" },
-    { "x": 32.5, "y": 13.83504622, "z": "50th" },
-    { "x": 33.5, "y": 13.97418199, "z": "50th" },
-    { "x": 34.5, "y": 14.1150324, "z": "50th" },
-    { "x": 35.5, "y": 14.25779618, "z": "50th" },
-    { "x": 36, "y": 14.32994444, "z": "50th" },
-    { "x": 0, "y": 3.879076559, "z": "75th" },
-    { "x": 0.5, "y": 4.387422565, "z": "75th" },
-    { "x": 1.5, "y": 5.327327567, "z": "75th" },
-    { "x": 2.5, "y": 6.175598158, "z": "75th" },
-    { "x": 3.5, "y": 6.942217106, "z": "75th" },
-    { "x": 4.5, "y": 7.635323002, "z": "75th" },
-    { "x": 5.5, "y": 8.262032991, "z": "75th" },
-    { "x": 6.5, "y": 8.828786159, "z": "75th" },
-    { "x": 7.5, "y": 9.34149038, "z": "75th" },
-    { "x": 8.5, "y": 9.805593364, "z": "75th" },
-    { "x": 9.5, "y": 10.22612395, "z": "75th" },
-    { "x": 10.5, "y": 10.60772151, "z": "75th" },
-    { "x": 11.5, "y": 10.9546603, "z": "75th" },
-    { "x": 12.5, "y": 11.27087147, "z": "75th" },
-    { "x": 13.5, "y": 11.55996332, "z": "75th" },
-    { "x": 14.5, "y": 11.82524099, "z": "75th" },
-    { "x": 15.5, "y": 12.06972515, "z": "75th" },
-    { "x": 16.5, "y": 12.29616991, "z": "75th" },
-    { "x": 17.5, "y": 12.50708008, "z": "75th" },
-    { "x": 18.5, "y": 12.70472779, "z": "75th" },
-    { "x": 19.5, "y": 12.89116805, "z": "75th" },
-    { "x": 20.5, "y": 13.06825426, "z": "75th" },
-    { "x": 21.5, "y": 13.23765258, "z": "75th" },
-    { "x": 22.5, "y": 13.40085582, "z": "75th" },
-    { "x": 23.5, "y": 13.55919667, "z": "75th" },
-    { "x": 24.5, "y": 13.71386029, "z": "75th" },
-    { "x": 25.5, "y": 13.86589625, "z": "75th" },
-    { "x": 26.5, "y": 14.0162298, "z": "75th" },
-    { "x": 27.5, "y": 14.1656725, "z": "75th" },
-    { "x": 28.5, "y": 14.31493214, "z": "75th" },
-    { "x": 29.5, "y": 14.46462206, "z": "75th" },
-    { "x": 30.5, "y": 14.61526973, "z": "75th" },
-    { "x": 31.5, "y": 14.76732387, "z": "75th" },
-    { "x": 32.5, "y": 14.9211657, "z": "75th" },
-    { "x": 33.5, "y": 15.07710916, "z": "75th" },
-    { "x": 34.5, "y": 15.23541179, "z": "75th" },
-    { "x": 35.5, "y": 15.3962791, "z": "75th" },
-    { "x": 36, "y": 15.47772447, "z": "75th" },
-    { "x": 0, "y": 4.17249339, "z": "90th" },
-    { "x": 0.5, "y": 4.718161283, "z": "90th" },
-    { "x": 1.5, "y": 5.728152752, "z": "90th" },
-    { "x": 2.5, "y": 6.638979132, "z": "90th" },
-    { "x": 3.5, "y": 7.460702368, "z": "90th" },
-    { "x": 4.5, "y": 8.202193202, "z": "90th" },
-    { "x": 5.5, "y": 8.871384112, "z": "90th" },
-    { "x": 6.5, "y": 9.47546616, "z": "90th" },
-    { "x": 7.5, "y": 10.02101374, "z": "90th" },
-    { "x": 8.5, "y": 10.51406421, "z": "90th" },
-    { "x": 9.5, "y": 10.96017225, "z": "90th" },
-    { "x": 10.5, "y": 11.36445045, "z": "90th" },
-    { "x": 11.5, "y": 11.73160184, "z": "90th" },
-    { "x": 12.5, "y": 12.06594792, "z": "90th" },
-    { "x": 13.5, "y": 12.37145331, "z": "90th" },
-    { "x": 14.5, "y": 12.65174864, "z": "90th" },
-    { "x": 15.5, "y": 12.91015164, "z": "90th" },
-    { "x": 16.5, "y": 13.14968707, "z": "90th" },
-    { "x": 17.5, "y": 13.37310558, "z": "90th" },
-    { "x": 18.5, "y": 13.58290165, "z": "90th" },
-    { "x": 19.5, "y": 13.78133058, "z": "90th" },
-    { "x": 20.5, "y": 13.9704249, "z": "90th" },
-    { "x": 21.5, "y": 14.15200982, "z": "90th" },
-    { "x": 22.5, "y": 14.3277181, "z": "90th" },
-    { "x": 23.5, "y": 14.49900418, "z": "90th" },
-    { "x": 24.5, "y": 14.6671577, "z": "90th" },
-    { "x": 25.5, "y": 14.83331632, "z": "90th" },
-    { "x": 26.5, "y": 14.99847794, "z": "90th" },
-    { "x": 27.5, "y": 15.16351231, "z": "90th" },
-    { "x": 28.5, "y": 15.32917196, "z": "90th" },
-    { "x": 29.5, "y": 15.49610261, "z": "90th" },
-    { "x": 30.5, "y": 15.66485286, "z": "90th" },
-    { "x": 31.5, "y": 15.83588308, "z": "90th" },
-    { "x": 32.5, "y": 16.00957526, "z": "90th" },
-    { "x": 33.5, "y": 16.18623873, "z": "90th" },
-    { "x": 34.5, "y": 16.36611917, "z": "90th" },
-    { "x": 35.5, "y": 16.54940494, "z": "90th" },
-    { "x": 36, "y": 16.6423691, "z": "90th" },
-    { "x": 0, "y": 4.34029274, "z": "95th" },
-    { "x": 0.5, "y": 4.910130108, "z": "95th" },
-    { "x": 1.5, "y": 5.967101615, "z": "95th" },
-    { "x": 2.5, "y": 6.921119162, "z": "95th" },
-    { "x": 3.5, "y": 7.781401145, "z": "95th" },
-    { "x": 4.5, "y": 8.556813353, "z": "95th" },
-    { "x": 5.5, "y": 9.255614546, "z": "95th" },
-    { "x": 6.5, "y": 9.885435743, "z": "95th" },
-    { "x": 7.5, "y": 10.45331433, "z": "95th" },
-    { "x": 8.5, "y": 10.96573632, "z": "95th" },
-    { "x": 9.5, "y": 11.42867623, "z": "95th" },
-    { "x": 10.5, "y": 11.84763282, "z": "95th" },
-    { "x": 11.5, "y": 12.2276612, "z": "95th" },
-    { "x": 12.5, "y": 12.57340193, "z": "95th" },
-    { "x": 13.5, "y": 12.88910809, "z": "95th" },
-    { "x": 14.5, "y": 13.17867019, "z": "95th" },
-    { "x": 15.5, "y": 13.44563963, "z": "95th" },
-    { "x": 16.5, "y": 13.6932508, "z": "95th" },
-    { "x": 17.5, "y": 13.92444193, "z": "95th" },
-    { "x": 18.5, "y": 14.14187481, "z": "95th" },
-    { "x": 19.5, "y": 14.34795358, "z": "95th" },
-    { "x": 20.5, "y": 14.54484233, "z": "95th" },
-    { "x": 21.5, "y": 14.73448194, "z": "95th" },
-    { "x": 22.5, "y": 14.91860604, "z": "95th" },
-    { "x": 23.5, "y": 15.09875606, "z": "95th" },
-    { "x": 24.5, "y": 15.27629562, "z": "95th" },
-    { "x": 25.5, "y": 15.45242405, "z": "95th" },
-    { "x": 26.5, "y": 15.62818936, "z": "95th" },
-    { "x": 27.5, "y": 15.80450043, "z": "95th" },
-    { "x": 28.5, "y": 15.98213866, "z": "95th" },
-    { "x": 29.5, "y": 16.16176896, "z": "95th" },
-    { "x": 30.5, "y": 16.34395024, "z": "95th" },
-    { "x": 31.5, "y": 16.52914562, "z": "95th" },
-    { "x": 32.5, "y": 16.71773017, "z": "95th" },
-    { "x": 33.5, "y": 16.91000241, "z": "95th" },
-    { "x": 34.5, "y": 17.10619066, "z": "95th" },
-    { "x": 35.5, "y": 17.30646132, "z": "95th" },
-    { "x": 36, "y": 17.40816491, "z": "95th" },
-    { "x": 0, "y": 4.446488308, "z": "97th" },
-    { "x": 0.5, "y": 5.032624982, "z": "97th" },
-    { "x": 1.5, "y": 6.121929103, "z": "97th" },
-    { "x": 2.5, "y": 7.106250132, "z": "97th" },
-    { "x": 3.5, "y": 7.993878049, "z": "97th" },
-    { "x": 4.5, "y": 8.793443663, "z": "97th" },
-    { "x": 5.5, "y": 9.51330656, "z": "97th" },
-    { "x": 6.5, "y": 10.16135019, "z": "97th" },
-    { "x": 7.5, "y": 10.74492376, "z": "97th" },
-    { "x": 8.5, "y": 11.27083843, "z": "97th" },
-    { "x": 9.5, "y": 11.74538465, "z": "97th" },
-    { "x": 10.5, "y": 12.17435729, "z": "97th" },
-    { "x": 11.5, "y": 12.56308347, "z": "97th" },
-    { "x": 12.5, "y": 12.91645043, "z": "97th" },
-    { "x": 13.5, "y": 13.23893338, "z": "97th" },
-    { "x": 14.5, "y": 13.53462171, "z": "97th" },
-    { "x": 15.5, "y": 13.80724431, "z": "97th" },
-    { "x": 16.5, "y": 14.0601935, "z": "97th" },
-    { "x": 17.5, "y": 14.29654774, "z": "97th" },
-    { "x": 18.5, "y": 14.51909298, "z": "97th" },
-    { "x": 19.5, "y": 14.73034312, "z": "97th" },
-    { "x": 20.5, "y": 14.93255878, "z": "97th" },
-    { "x": 21.5, "y": 15.12776542, "z": "97th" },
-    { "x": 22.5, "y": 15.31777023, "z": "97th" },
-    { "x": 23.5, "y": 15.50417803, "z": "97th" },
-    { "x": 24.5, "y": 15.68840631, "z": "97th" },
-    { "x": 25.5, "y": 15.87169941, "z": "97th" },
-    { "x": 26.5, "y": 16.05514188, "z": "97th" },
-    { "x": 27.5, "y": 16.23967114, "z": "97th" },
-    { "x": 28.5, "y": 16.42608957, "z": "97th" },
-    { "x": 29.5, "y": 16.61507584, "z": "97th" },
-    { "x": 30.5, "y": 16.80719582, "z": "97th" },
-    { "x": 31.5, "y": 17.00291386, "z": "97th" },
-    { "x": 32.5, "y": 17.2025984, "z": "97th" },
-    { "x": 33.5, "y": 17.40653835, "z": "97th" },
-    { "x": 34.5, "y": 17.61494698, "z": "97th" },
-    { "x": 35.5, "y": 17.8279717, "z": "97th" },
-    { "x": 36, "y": 17.93624653, "z": "97th" }
-];
\ No newline at end of file
@@ -1,1965 +0,0 @@
-cdc_boys_weight_age_24_240 = [
-    { "x": 24, "y": 10.38209025, "z": "3th" },
-    { "x": 24.5, "y": 10.4414422, "z": "3th" },
-    { "x": 25.5, "y": 10.55847309, "z": "3th" },
-    { "x": 26.5, "y": 10.67380261, "z": "3th" },
-    { "x": 27.5, "y": 10.78798157, "z": "3th" },
-    { "x": 28.5, "y": 10.90147346, "z": "3th" },
-    { "x": 29.5, "y": 11.01466395, "z": "3th" },
-    { "x": 30.5, "y": 11.12786972, "z": "3th" },
-    { "x": 31.5, "y": 11.24134752, "z": "3th" },
-    { "x": 32.5, "y": 11.3552982, "z": "3th" },
-    { "x": 33.5, "y": 11.46987889, "z": "3th" },
-    { "x": 34.5, "y": 11.58520959, "z": "3th" },
-    { "x": 35.5, "y": 11.70137143, "z": "3th" },
-    { "x": 36.5, "y": 11.81842214, "z": "3th" },
-    { "x": 37.5, "y": 11.93639129, "z": "3th" },
-    { "x": 38.5, "y": 12.05529277, "z": "3th" },
-    { "x": 39.5, "y": 12.17512305, "z": "3th" },
-    { "x": 40.5, "y": 12.29587074, "z": "3th" },
-    { "x": 41.5, "y": 12.41751102, "z": "3th" },
-    { "x": 42.5, "y": 12.54001161, "z": "3th" },
-    { "x": 43.5, "y": 12.66334091, "z": "3th" },
-    { "x": 44.5, "y": 12.78746137, "z": "3th" },
-    { "x": 45.5, "y": 12.91233523, "z": "3th" },
-    { "x": 46.5, "y": 13.03792328, "z": "3th" },
-    { "x": 47.5, "y": 13.16419231, "z": "3th" },
-    { "x": 48.5, "y": 13.29110715, "z": "3th" },
-    { "x": 49.5, "y": 13.41863676, "z": "3th" },
-    { "x": 50.5, "y": 13.54675344, "z": "3th" },
-    { "x": 51.5, "y": 13.67543322, "z": "3th" },
-    { "x": 52.5, "y": 13.8046561, "z": "3th" },
-    { "x": 53.5, "y": 13.93440617, "z": "3th" },
-    { "x": 54.5, "y": 14.06467165, "z": "3th" },
-    { "x": 55.5, "y": 14.19544485, "z": "3th" },
-    { "x": 56.5, "y": 14.3267205, "z": "3th" },
-    { "x": 57.5, "y": 14.45850147, "z": "3th" },
-    { "x": 58.5, "y": 14.59079005, "z": "3th" },
-    { "x": 59.5, "y": 14.7235931, "z": "3th" },
-    { "x": 60.5, "y": 14.85692044, "z": "3th" },
-    { "x": 61.5, "y": 14.99078448, "z": "3th" },
-    { "x": 62.5, "y": 15.12519986, "z": "3th" },
-    { "x": 63.5, "y": 15.26018306, "z": "3th" },
-    { "x": 64.5, "y": 15.39575201, "z": "3th" },
-    { "x": 65.5, "y": 15.53192567, "z": "3th" },
-    { "x": 66.5, "y": 15.66872366, "z": "3th" },
-    { "x": 67.5, "y": 15.80616582, "z": "3th" },
-    { "x": 68.5, "y": 15.94427185, "z": "3th" },
-    { "x": 69.5, "y": 16.08306098, "z": "3th" },
-    { "x": 70.5, "y": 16.22255158, "z": "3th" },
-    { "x": 71.5, "y": 16.36275897, "z": "3th" },
-    { "x": 72.5, "y": 16.50370229, "z": "3th" },
-    { "x": 73.5, "y": 16.64539409, "z": "3th" },
-    { "x": 74.5, "y": 16.78784656, "z": "3th" },
-    { "x": 75.5, "y": 16.93106986, "z": "3th" },
-    { "x": 76.5, "y": 17.07507197, "z": "3th" },
-    { "x": 77.5, "y": 17.21985864, "z": "3th" },
-    { "x": 78.5, "y": 17.36543339, "z": "3th" },
-    { "x": 79.5, "y": 17.51179749, "z": "3th" },
-    { "x": 80.5, "y": 17.65894807, "z": "3th" },
-    { "x": 81.5, "y": 17.80688538, "z": "3th" },
-    { "x": 82.5, "y": 17.95560314, "z": "3th" },
-    { "x": 83.5, "y": 18.10509471, "z": "3th" },
-    { "x": 84.5, "y": 18.25535252, "z": "3th" },
-    { "x": 85.5, "y": 18.4063661, "z": "3th" },
-    { "x": 86.5, "y": 18.55812709, "z": "3th" },
-    { "x": 87.5, "y": 18.71062426, "z": "3th" },
-    { "x": 88.5, "y": 18.86384686, "z": "3th" },
-    { "x": 89.5, "y": 19.01778428, "z": "3th" },
-    { "x": 90.5, "y": 19.17242647, "z": "3th" },
-    { "x": 91.5, "y": 19.32776424, "z": "3th" },
-    { "x": 92.5, "y": 19.48378967, "z": "3th" },
-    { "x": 93.5, "y": 19.64049642, "z": "3th" },
-    { "x": 94.5, "y": 19.79787788, "z": "3th" },
-    { "x": 95.5, "y": 19.95593574, "z": "3th" },
-    { "x": 96.5, "y": 20.1146687, "z": "3th" },
-    { "x": 97.5, "y": 20.27408001, "z": "3th" },
-    { "x": 98.5, "y": 20.43417606, "z": "3th" },
-    { "x": 99.5, "y": 20.59496663, "z": "3th" },
-    { "x": 100.5, "y": 20.75646502, "z": "3th" },
-    { "x": 101.5, "y": 20.91868832, "z": "3th" },
-    { "x": 102.5, "y": 21.08165758, "z": "3th" },
-    { "x": 103.5, "y": 21.24539741, "z": "3th" },
-    { "x": 104.5, "y": 21.40993987, "z": "3th" },
-    { "x": 105.5, "y": 21.57531575, "z": "3th" },
-    { "x": 106.5, "y": 21.74156399, "z": "3th" },
-    { "x": 107.5, "y": 21.90872739, "z": "3th" },
-    { "x": 108.5, "y": 22.07685313, "z": "3th" },
-    { "x": 109.5, "y": 22.24599293, "z": "3th" },
-    { "x": 110.5, "y": 22.41620302, "z": "3th" },
-    { "x": 111.5, "y": 22.58754414, "z": "3th" },
-    { "x": 112.5, "y": 22.76008145, "z": "3th" },
-    { "x": 113.5, "y": 22.93388449, "z": "3th" },
-    { "x": 114.5, "y": 23.10902476, "z": "3th" },
-    { "x": 115.5, "y": 23.28558367, "z": "3th" },
-    { "x": 116.5, "y": 23.46364195, "z": "3th" },
-    { "x": 117.5, "y": 23.6432856, "z": "3th" },
-    { "x": 118.5, "y": 23.8246044, "z": "3th" },
-    { "x": 119.5, "y": 24.00769173, "z": "3th" },
-    { "x": 120.5, "y": 24.19264433, "z": "3th" },
-    { "x": 121.5, "y": 24.37956211, "z": "3th" },
-    { "x": 122.5, "y": 24.5685479, "z": "3th" },
-    { "x": 123.5, "y": 24.75970717, "z": "3th" },
-    { "x": 124.5, "y": 24.95314776, "z": "3th" },
-    { "x": 125.5, "y": 25.14897956, "z": "3th" },
-    { "x": 126.5, "y": 25.3473142, "z": "3th" },
-    { "x": 127.5, "y": 25.54826471, "z": "3th" },
-    { "x": 128.5, "y": 25.75194512, "z": "3th" },
-    { "x": 129.5, "y": 25.95847011, "z": "3th" },
-    { "x": 130.5, "y": 26.16795559, "z": "3th" },
-    { "x": 131.5, "y": 26.38051177, "z": "3th" },
-    { "x": 132.5, "y": 26.59626062, "z": "3th" },
-    { "x": 133.5, "y": 26.81530934, "z": "3th" },
-    { "x": 134.5, "y": 27.03777112, "z": "3th" },
-    { "x": 135.5, "y": 27.26375553, "z": "3th" },
-    { "x": 136.5, "y": 27.49336962, "z": "3th" },
-    { "x": 137.5, "y": 27.72671746, "z": "3th" },
-    { "x": 138.5, "y": 27.96389959, "z": "3th" },
-    { "x": 139.5, "y": 28.20501252, "z": "3th" },
-    { "x": 140.5, "y": 28.4501482, "z": "3th" },
-    { "x": 141.5, "y": 28.69939347, "z": "3th" },
-    { "x": 142.5, "y": 28.95282957, "z": "3th" },
-    { "x": 143.5, "y": 29.21053153, "z": "3th" },
-    { "x": 144.5, "y": 29.47256769, "z": "3th" },
-    { "x": 145.5, "y": 29.73899917, "z": "3th" },
-    { "x": 146.5, "y": 30.00987927, "z": "3th" },
-    { "x": 147.5, "y": 30.28525305, "z": "3th" },
-    { "x": 148.5, "y": 30.56515671, "z": "3th" },
-    { "x": 149.5, "y": 30.84961718, "z": "3th" },
-    { "x": 150.5, "y": 31.13865154, "z": "3th" },
-    { "x": 151.5, "y": 31.43226571, "z": "3th" },
-    { "x": 152.5, "y": 31.73045808, "z": "3th" },
-    { "x": 153.5, "y": 32.03321196, "z": "3th" },
-    { "x": 154.5, "y": 32.34050069, "z": "3th" },
-    { "x": 155.5, "y": 32.6522856, "z": "3th" },
-    { "x": 156.5, "y": 32.96851571, "z": "3th" },
-    { "x": 157.5, "y": 33.28912731, "z": "3th" },
-    { "x": 158.5, "y": 33.61404373, "z": "3th" },
-    { "x": 159.5, "y": 33.94317499, "z": "3th" },
-    { "x": 160.5, "y": 34.27641756, "z": "3th" },
-    { "x": 161.5, "y": 34.61365176, "z": "3th" },
-    { "x": 162.5, "y": 34.95474943, "z": "3th" },
-    { "x": 163.5, "y": 35.29956396, "z": "3th" },
-    { "x": 164.5, "y": 35.64793577, "z": "3th" },
-    { "x": 165.5, "y": 35.99969112, "z": "3th" },
-    { "x": 166.5, "y": 36.354642, "z": "3th" },
-    { "x": 167.5, "y": 36.71258626, "z": "3th" },
-    { "x": 168.5, "y": 37.07330766, "z": "3th" },
-    { "x": 169.5, "y": 37.43657601, "z": "3th" },
-    { "x": 170.5, "y": 37.80214741, "z": "3th" },
-    { "x": 171.5, "y": 38.16976444, "z": "3th" },
-    { "x": 172.5, "y": 38.53915657, "z": "3th" },
-    { "x": 173.5, "y": 38.91004046, "z": "3th" },
-    { "x": 174.5, "y": 39.28212045, "z": "3th" },
-    { "x": 175.5, "y": 39.65508906, "z": "3th" },
-    { "x": 176.5, "y": 40.02862762, "z": "3th" },
-    { "x": 177.5, "y": 40.40240687, "z": "3th" },
-    { "x": 178.5, "y": 40.77608405, "z": "3th" },
-    { "x": 179.5, "y": 41.14932239, "z": "3th" },
-    { "x": 180.5, "y": 41.52175462, "z": "3th" },
-    { "x": 181.5, "y": 41.89302144, "z": "3th" },
-    { "x": 182.5, "y": 42.26275389, "z": "3th" },
-    { "x": 183.5, "y": 42.63057829, "z": "3th" },
-    { "x": 184.5, "y": 42.99611758, "z": "3th" },
-    { "x": 185.5, "y": 43.3589927, "z": "3th" },
-    { "x": 186.5, "y": 43.71882106, "z": "3th" },
-    { "x": 187.5, "y": 44.07523324, "z": "3th" },
-    { "x": 188.5, "y": 44.42784452, "z": "3th" },
-    { "x": 189.5, "y": 44.77628678, "z": "3th" },
-    { "x": 190.5, "y": 45.1202019, "z": "3th" },
-    { "x": 191.5, "y": 45.45922209, "z": "3th" },
-    { "x": 192.5, "y": 45.79300591, "z": "3th" },
-    { "x": 193.5, "y": 46.12121938, "z": "3th" },
-    { "x": 194.5, "y": 46.4435428, "z": "3th" },
-    { "x": 195.5, "y": 46.75967279, "z": "3th" },
-    { "x": 196.5, "y": 47.06932426, "z": "3th" },
-    { "x": 197.5, "y": 47.37223239, "z": "3th" },
-    { "x": 198.5, "y": 47.66815456, "z": "3th" },
-    { "x": 199.5, "y": 47.9568721, "z": "3th" },
-    { "x": 200.5, "y": 48.23819204, "z": "3th" },
-    { "x": 201.5, "y": 48.5119486, "z": "3th" },
-    { "x": 202.5, "y": 48.77800463, "z": "3th" },
-    { "x": 203.5, "y": 49.03625275, "z": "3th" },
-    { "x": 204.5, "y": 49.28661635, "z": "3th" },
-    { "x": 205.5, "y": 49.52905029, "z": "3th" },
-    { "x": 206.5, "y": 49.76354136, "z": "3th" },
-    { "x": 207.5, "y": 49.99010333, "z": "3th" },
-    { "x": 208.5, "y": 50.2087994, "z": "3th" },
-    { "x": 209.5, "y": 50.41970456, "z": "3th" },
-    { "x": 210.5, "y": 50.62293176, "z": "3th" },
-    { "x": 211.5, "y": 50.81862346, "z": "3th" },
-    { "x": 212.5, "y": 51.00695001, "z": "3th" },
-    { "x": 213.5, "y": 51.18810764, "z": "3th" },
-    { "x": 214.5, "y": 51.36231608, "z": "3th" },
-    { "x": 215.5, "y": 51.52981582, "z": "3th" },
-    { "x": 216.5, "y": 51.69086489, "z": "3th" },
-    { "x": 217.5, "y": 51.8457352, "z": "3th" },
-    { "x": 218.5, "y": 51.99471665, "z": "3th" },
-    { "x": 219.5, "y": 52.13808124, "z": "3th" },
-    { "x": 220.5, "y": 52.27611902, "z": "3th" },
-    { "x": 221.5, "y": 52.4091082, "z": "3th" },
-    { "x": 222.5, "y": 52.53731392, "z": "3th" },
-    { "x": 223.5, "y": 52.66097508, "z": "3th" },
-    { "x": 224.5, "y": 52.78032448, "z": "3th" },
-    { "x": 225.5, "y": 52.89553346, "z": "3th" },
-    { "x": 226.5, "y": 53.00673755, "z": "3th" },
-    { "x": 227.5, "y": 53.11401756, "z": "3th" },
-    { "x": 228.5, "y": 53.21738885, "z": "3th" },
-    { "x": 229.5, "y": 53.31678976, "z": "3th" },
-    { "x": 230.5, "y": 53.41206904, "z": "3th" },
-    { "x": 231.5, "y": 53.50297229, "z": "3th" },
-    { "x": 232.5, "y": 53.58912711, "z": "3th" },
-    { "x": 233.5, "y": 53.67002691, "z": "3th" },
-    { "x": 234.5, "y": 53.74501298, "z": "3th" },
-    { "x": 235.5, "y": 53.8132547, "z": "3th" },
-    { "x": 236.5, "y": 53.87372737, "z": "3th" },
-    { "x": 237.5, "y": 53.92518731, "z": "3th" },
-    { "x": 238.5, "y": 53.96613658, "z": "3th" },
-    { "x": 239.5, "y": 53.99481762, "z": "3th" },
-    { "x": 240, "y": 54.00391729, "z": "3th" },
-    { "x": 24, "y": 10.64009004, "z": "5th" },
-    { "x": 24.5, "y": 10.70051298, "z": "5th" },
-    { "x": 25.5, "y": 10.81957536, "z": "5th" },
-    { "x": 26.5, "y": 10.93681171, "z": "5th" },
-    { "x": 27.5, "y": 11.05280067, "z": "5th" },
-    { "x": 28.5, "y": 11.168034, "z": "5th" },
-    { "x": 29.5, "y": 11.28292555, "z": "5th" },
-    { "x": 30.5, "y": 11.3978197, "z": "5th" },
-    { "x": 31.5, "y": 11.51299966, "z": "5th" },
-    { "x": 32.5, "y": 11.62869248, "z": "5th" },
-    { "x": 33.5, "y": 11.74507892, "z": "5th" },
-    { "x": 34.5, "y": 11.86229971, "z": "5th" },
-    { "x": 35.5, "y": 11.98045644, "z": "5th" },
-    { "x": 36.5, "y": 12.09962308, "z": "5th" },
-    { "x": 37.5, "y": 12.21984466, "z": "5th" },
-    { "x": 38.5, "y": 12.34114672, "z": "5th" },
-    { "x": 39.5, "y": 12.46353554, "z": "5th" },
-    { "x": 40.5, "y": 12.5870056, "z": "5th" },
-    { "x": 41.5, "y": 12.71153714, "z": "5th" },
-    { "x": 42.5, "y": 12.83710098, "z": "5th" },
-    { "x": 43.5, "y": 12.96366474, "z": "5th" },
-    { "x": 44.5, "y": 13.09118938, "z": "5th" },
-    { "x": 45.5, "y": 13.21963362, "z": "5th" },
-    { "x": 46.5, "y": 13.34895376, "z": "5th" },
-    { "x": 47.5, "y": 13.47910915, "z": "5th" },
-    { "x": 48.5, "y": 13.61005739, "z": "5th" },
-    { "x": 49.5, "y": 13.74175874, "z": "5th" },
-    { "x": 50.5, "y": 13.87417598, "z": "5th" },
-    { "x": 51.5, "y": 14.0072749, "z": "5th" },
-    { "x": 52.5, "y": 14.14102471, "z": "5th" },
-    { "x": 53.5, "y": 14.27539832, "z": "5th" },
-    { "x": 54.5, "y": 14.41037252, "z": "5th" },
-    { "x": 55.5, "y": 14.54592801, "z": "5th" },
-    { "x": 56.5, "y": 14.68204842, "z": "5th" },
-    { "x": 57.5, "y": 14.81872422, "z": "5th" },
-    { "x": 58.5, "y": 14.95594682, "z": "5th" },
-    { "x": 59.5, "y": 15.09371211, "z": "5th" },
-    { "x": 60.5, "y": 15.23201937, "z": "5th" },
-    { "x": 61.5, "y": 15.37087094, "z": "5th" },
-    { "x": 62.5, "y": 15.51027205, "z": "5th" },
-    { "x": 63.5, "y": 15.65023042, "z": "5th" },
-    { "x": 64.5, "y": 15.79075599, "z": "5th" },
-    { "x": 65.5, "y": 15.93186059, "z": "5th" },
-    { "x": 66.5, "y": 16.07355758, "z": "5th" },
-    { "x": 67.5, "y": 16.21586154, "z": "5th" },
-    { "x": 68.5, "y": 16.35878793, "z": "5th" },
-    { "x": 69.5, "y": 16.50235277, "z": "5th" },
-    { "x": 70.5, "y": 16.64657235, "z": "5th" },
-    { "x": 71.5, "y": 16.79146158, "z": "5th" },
-    { "x": 72.5, "y": 16.93703875, "z": "5th" },
-    { "x": 73.5, "y": 17.08331814, "z": "5th" },
-    { "x": 74.5, "y": 17.23031439, "z": "5th" },
-    { "x": 75.5, "y": 17.37804118, "z": "5th" },
-    { "x": 76.5, "y": 17.52651109, "z": "5th" },
-    { "x": 77.5, "y": 17.6757355, "z": "5th" },
-    { "x": 78.5, "y": 17.82572453, "z": "5th" },
-    { "x": 79.5, "y": 17.97648696, "z": "5th" },
-    { "x": 80.5, "y": 18.12802886, "z": "5th" },
-    { "x": 81.5, "y": 18.28035866, "z": "5th" },
-    { "x": 82.5, "y": 18.4334803, "z": "5th" },
-    { "x": 83.5, "y": 18.58739757, "z": "5th" },
-    { "x": 84.5, "y": 18.74211363, "z": "5th" },
-    { "x": 85.5, "y": 18.89762965, "z": "5th" },
-    { "x": 86.5, "y": 19.05394835, "z": "5th" },
-    { "x": 87.5, "y": 19.21107044, "z": "5th" },
-    { "x": 88.5, "y": 19.36899699, "z": "5th" },
-    { "x": 89.5, "y": 19.52772926, "z": "5th" },
-    { "x": 90.5, "y": 19.68726895, "z": "5th" },
-    { "x": 91.5, "y": 19.84761848, "z": "5th" },
-    { "x": 92.5, "y": 20.00878127, "z": "5th" },
-    { "x": 93.5, "y": 20.17076208, "z": "5th" },
-    { "x": 94.5, "y": 20.33356558, "z": "5th" },
-    { "x": 95.5, "y": 20.49720276, "z": "5th" },
-    { "x": 96.5, "y": 20.66168259, "z": "5th" },
-    { "x": 97.5, "y": 20.82701772, "z": "5th" },
-    { "x": 98.5, "y": 20.9932234, "z": "5th" },
-    { "x": 99.5, "y": 21.16031766, "z": "5th" },
-    { "x": 100.5, "y": 21.32832161, "z": "5th" },
-    { "x": 101.5, "y": 21.49725951, "z": "5th" },
-    { "x": 102.5, "y": 21.66715902, "z": "5th" },
-    { "x": 103.5, "y": 21.83805093, "z": "5th" },
-    { "x": 104.5, "y": 22.00997207, "z": "5th" },
-    { "x": 105.5, "y": 22.18295884, "z": "5th" },
-    { "x": 106.5, "y": 22.35705429, "z": "5th" },
-    { "x": 107.5, "y": 22.53230492, "z": "5th" },
-    { "x": 108.5, "y": 22.70876108, "z": "5th" },
-    { "x": 109.5, "y": 22.8864771, "z": "5th" },
-    { "x": 110.5, "y": 23.06551129, "z": "5th" },
-    { "x": 111.5, "y": 23.24592593, "z": "5th" },
-    { "x": 112.5, "y": 23.42778723, "z": "5th" },
-    { "x": 113.5, "y": 23.61116524, "z": "5th" },
-    { "x": 114.5, "y": 23.79613202, "z": "5th" },
-    { "x": 115.5, "y": 23.98276774, "z": "5th" },
-    { "x": 116.5, "y": 24.17115246, "z": "5th" },
-    { "x": 117.5, "y": 24.36137073, "z": "5th" },
-    { "x": 118.5, "y": 24.55351042, "z": "5th" },
-    { "x": 119.5, "y": 24.74766249, "z": "5th" },
-    { "x": 120.5, "y": 24.94392079, "z": "5th" },
-    { "x": 121.5, "y": 25.14238189, "z": "5th" },
-    { "x": 122.5, "y": 25.34314479, "z": "5th" },
-    { "x": 123.5, "y": 25.54631065, "z": "5th" },
-    { "x": 124.5, "y": 25.75198256, "z": "5th" },
-    { "x": 125.5, "y": 25.96026515, "z": "5th" },
-    { "x": 126.5, "y": 26.17126436, "z": "5th" },
-    { "x": 127.5, "y": 26.38508699, "z": "5th" },
-    { "x": 128.5, "y": 26.60184044, "z": "5th" },
-    { "x": 129.5, "y": 26.82163224, "z": "5th" },
-    { "x": 130.5, "y": 27.0445704, "z": "5th" },
-    { "x": 131.5, "y": 27.27075818, "z": "5th" },
-    { "x": 132.5, "y": 27.50030694, "z": "5th" },
-    { "x": 133.5, "y": 27.73331628, "z": "5th" },
-    { "x": 134.5, "y": 27.96988937, "z": "5th" },
-    { "x": 135.5, "y": 28.21012567, "z": "5th" },
-    { "x": 136.5, "y": 28.45412164, "z": "5th" },
-    { "x": 137.5, "y": 28.70197022, "z": "5th" },
-    { "x": 138.5, "y": 28.95376036, "z": "5th" },
-    { "x": 139.5, "y": 29.20957645, "z": "5th" },
-    { "x": 140.5, "y": 29.46949781, "z": "5th" },
-    { "x": 141.5, "y": 29.73359819, "z": "5th" },
-    { "x": 142.5, "y": 30.00194519, "z": "5th" },
-    { "x": 143.5, "y": 30.27459974, "z": "5th" },
-    { "x": 144.5, "y": 30.55161562, "z": "5th" },
-    { "x": 145.5, "y": 30.83303885, "z": "5th" },
-    { "x": 146.5, "y": 31.11890724, "z": "5th" },
-    { "x": 147.5, "y": 31.40924987, "z": "5th" },
-    { "x": 148.5, "y": 31.70408654, "z": "5th" },
-    { "x": 149.5, "y": 32.00342738, "z": "5th" },
-    { "x": 150.5, "y": 32.30727227, "z": "5th" },
-    { "x": 151.5, "y": 32.61560983, "z": "5th" },
-    { "x": 152.5, "y": 32.92841993, "z": "5th" },
-    { "x": 153.5, "y": 33.24566815, "z": "5th" },
-    { "x": 154.5, "y": 33.56730937, "z": "5th" },
-    { "x": 155.5, "y": 33.8932863, "z": "5th" },
-    { "x": 156.5, "y": 34.22352911, "z": "5th" },
-    { "x": 157.5, "y": 34.5579552, "z": "5th" },
-    { "x": 158.5, "y": 34.8964689, "z": "5th" },
-    { "x": 159.5, "y": 35.23896126, "z": "5th" },
-    { "x": 160.5, "y": 35.58530989, "z": "5th" },
-    { "x": 161.5, "y": 35.9353771, "z": "5th" },
-    { "x": 162.5, "y": 36.28901539, "z": "5th" },
-    { "x": 163.5, "y": 36.64606043, "z": "5th" },
-    { "x": 164.5, "y": 37.00633501, "z": "5th" },
-    { "x": 165.5, "y": 37.36964826, "z": "5th" },
-    { "x": 166.5, "y": 37.73579576, "z": "5th" },
-    { "x": 167.5, "y": 38.10455963, "z": "5th" },
-    { "x": 168.5, "y": 38.47570882, "z": "5th" },
-    { "x": 169.5, "y": 38.84899932, "z": "5th" },
-    { "x": 170.5, "y": 39.22417451, "z": "5th" },
-    { "x": 171.5, "y": 39.60096552, "z": "5th" },
-    { "x": 172.5, "y": 39.97909172, "z": "5th" },
-    { "x": 173.5, "y": 40.35826115, "z": "5th" },
-    { "x": 174.5, "y": 40.73817116, "z": "5th" },
-    { "x": 175.5, "y": 41.118509, "z": "5th" },
-    { "x": 176.5, "y": 41.49895256, "z": "5th" },
-    { "x": 177.5, "y": 41.8791711, "z": "5th" },
-    { "x": 178.5, "y": 42.25882349, "z": "5th" },
-    { "x": 179.5, "y": 42.63757221, "z": "5th" },
-    { "x": 180.5, "y": 43.01505816, "z": "5th" },
-    { "x": 181.5, "y": 43.39092788, "z": "5th" },
-    { "x": 182.5, "y": 43.76482163, "z": "5th" },
-    { "x": 183.5, "y": 44.13637714, "z": "5th" },
-    { "x": 184.5, "y": 44.50523096, "z": "5th" },
-    { "x": 185.5, "y": 44.87101979, "z": "5th" },
-    { "x": 186.5, "y": 45.23337973, "z": "5th" },
-    { "x": 187.5, "y": 45.59195858, "z": "5th" },
-    { "x": 188.5, "y": 45.94639581, "z": "5th" },
-    { "x": 189.5, "y": 46.29634576, "z": "5th" },
-    { "x": 190.5, "y": 46.64147321, "z": "5th" },
-    { "x": 191.5, "y": 46.98143987, "z": "5th" },
-    { "x": 192.5, "y": 47.31593016, "z": "5th" },
-    { "x": 193.5, "y": 47.64463827, "z": "5th" },
-    { "x": 194.5, "y": 47.96727332, "z": "5th" },
-    { "x": 195.5, "y": 48.2835611, "z": "5th" },
-    { "x": 196.5, "y": 48.59324591, "z": "5th" },
-    { "x": 197.5, "y": 48.89609218, "z": "5th" },
-    { "x": 198.5, "y": 49.1918862, "z": "5th" },
-    { "x": 199.5, "y": 49.4804377, "z": "5th" },
-    { "x": 200.5, "y": 49.76158125, "z": "5th" },
-    { "x": 201.5, "y": 50.03517772, "z": "5th" },
-    { "x": 202.5, "y": 50.30111539, "z": "5th" },
-    { "x": 203.5, "y": 50.55931105, "z": "5th" },
-    { "x": 204.5, "y": 50.8097108, "z": "5th" },
-    { "x": 205.5, "y": 51.05229071, "z": "5th" },
-    { "x": 206.5, "y": 51.28705716, "z": "5th" },
-    { "x": 207.5, "y": 51.51404335, "z": "5th" },
-    { "x": 208.5, "y": 51.73332523, "z": "5th" },
-    { "x": 209.5, "y": 51.94499451, "z": "5th" },
-    { "x": 210.5, "y": 52.14917717, "z": "5th" },
-    { "x": 211.5, "y": 52.34602709, "z": "5th" },
-    { "x": 212.5, "y": 52.53572455, "z": "5th" },
-    { "x": 213.5, "y": 52.71847428, "z": "5th" },
-    { "x": 214.5, "y": 52.89450319, "z": "5th" },
-    { "x": 215.5, "y": 53.06405769, "z": "5th" },
-    { "x": 216.5, "y": 53.22740059, "z": "5th" },
-    { "x": 217.5, "y": 53.38480749, "z": "5th" },
-    { "x": 218.5, "y": 53.53656883, "z": "5th" },
-    { "x": 219.5, "y": 53.68296205, "z": "5th" },
-    { "x": 220.5, "y": 53.82427723, "z": "5th" },
-    { "x": 221.5, "y": 53.96079321, "z": "5th" },
-    { "x": 222.5, "y": 54.09277512, "z": "5th" },
-    { "x": 223.5, "y": 54.22046291, "z": "5th" },
-    { "x": 224.5, "y": 54.34408388, "z": "5th" },
-    { "x": 225.5, "y": 54.46381004, "z": "5th" },
-    { "x": 226.5, "y": 54.57977424, "z": "5th" },
-    { "x": 227.5, "y": 54.69205355, "z": "5th" },
-    { "x": 228.5, "y": 54.80065842, "z": "5th" },
-    { "x": 229.5, "y": 54.90552089, "z": "5th" },
-    { "x": 230.5, "y": 55.00648181, "z": "5th" },
-    { "x": 231.5, "y": 55.10327703, "z": "5th" },
-    { "x": 232.5, "y": 55.19552245, "z": "5th" },
-    { "x": 233.5, "y": 55.28269761, "z": "5th" },
-    { "x": 234.5, "y": 55.36412796, "z": "5th" },
-    { "x": 235.5, "y": 55.43896526, "z": "5th" },
-    { "x": 236.5, "y": 55.50616614, "z": "5th" },
-    { "x": 237.5, "y": 55.56446839, "z": "5th" },
-    { "x": 238.5, "y": 55.61235958, "z": "5th" },
-    { "x": 239.5, "y": 55.64806673, "z": "5th" },
-    { "x": 240, "y": 55.66071006, "z": "5th" },
-    { "x": 24, "y": 11.05265567, "z": "10th" },
-    { "x": 24.5, "y": 11.11490406, "z": "10th" },
-    { "x": 25.5, "y": 11.23747341, "z": "10th" },
-    { "x": 26.5, "y": 11.35805876, "z": "10th" },
-    { "x": 27.5, "y": 11.47727994, "z": "10th" },
-    { "x": 28.5, "y": 11.59566994, "z": "10th" },
-    { "x": 29.5, "y": 11.7136834, "z": "10th" },
-    { "x": 30.5, "y": 11.83170451, "z": "10th" },
-    { "x": 31.5, "y": 11.95005435, "z": "10th" },
-    { "x": 32.5, "y": 12.06899744, "z": "10th" },
-    { "x": 33.5, "y": 12.18874828, "z": "10th" },
-    { "x": 34.5, "y": 12.30947723, "z": "10th" },
-    { "x": 35.5, "y": 12.43131521, "z": "10th" },
-    { "x": 36.5, "y": 12.55435953, "z": "10th" },
-    { "x": 37.5, "y": 12.67867752, "z": "10th" },
-    { "x": 38.5, "y": 12.80431149, "z": "10th" },
-    { "x": 39.5, "y": 12.93128204, "z": "10th" },
-    { "x": 40.5, "y": 13.05959214, "z": "10th" },
-    { "x": 41.5, "y": 13.18922941, "z": "10th" },
-    { "x": 42.5, "y": 13.32016918, "z": "10th" },
-    { "x": 43.5, "y": 13.45237788, "z": "10th" },
-    { "x": 44.5, "y": 13.5858142, "z": "10th" },
-    { "x": 45.5, "y": 13.72043155, "z": "10th" },
-    { "x": 46.5, "y": 13.85617947, "z": "10th" },
-    { "x": 47.5, "y": 13.99300607, "z": "10th" },
-    { "x": 48.5, "y": 14.13085804, "z": "10th" },
-    { "x": 49.5, "y": 14.26968247, "z": "10th" },
-    { "x": 50.5, "y": 14.40942768, "z": "10th" },
-    { "x": 51.5, "y": 14.55004391, "z": "10th" },
-    { "x": 52.5, "y": 14.69148397, "z": "10th" },
-    { "x": 53.5, "y": 14.83370375, "z": "10th" },
-    { "x": 54.5, "y": 14.97666256, "z": "10th" },
-    { "x": 55.5, "y": 15.12032345, "z": "10th" },
-    { "x": 56.5, "y": 15.26465308, "z": "10th" },
-    { "x": 57.5, "y": 15.40962296, "z": "10th" },
-    { "x": 58.5, "y": 15.55520788, "z": "10th" },
-    { "x": 59.5, "y": 15.70138696, "z": "10th" },
-    { "x": 60.5, "y": 15.8481433, "z": "10th" },
-    { "x": 61.5, "y": 15.9954639, "z": "10th" },
-    { "x": 62.5, "y": 16.14333947, "z": "10th" },
-    { "x": 63.5, "y": 16.29176433, "z": "10th" },
-    { "x": 64.5, "y": 16.44073615, "z": "10th" },
-    { "x": 65.5, "y": 16.59025577, "z": "10th" },
-    { "x": 66.5, "y": 16.74032694, "z": "10th" },
-    { "x": 67.5, "y": 16.8909561, "z": "10th" },
-    { "x": 68.5, "y": 17.04215212, "z": "10th" },
-    { "x": 69.5, "y": 17.19392605, "z": "10th" },
-    { "x": 70.5, "y": 17.34629087, "z": "10th" },
-    { "x": 71.5, "y": 17.49926081, "z": "10th" },
-    { "x": 72.5, "y": 17.65285271, "z": "10th" },
-    { "x": 73.5, "y": 17.80708353, "z": "10th" },
-    { "x": 74.5, "y": 17.96197153, "z": "10th" },
-    { "x": 75.5, "y": 18.11753578, "z": "10th" },
-    { "x": 76.5, "y": 18.2737959, "z": "10th" },
-    { "x": 77.5, "y": 18.43077195, "z": "10th" },
-    { "x": 78.5, "y": 18.58848423, "z": "10th" },
-    { "x": 79.5, "y": 18.74695318, "z": "10th" },
-    { "x": 80.5, "y": 18.90619877, "z": "10th" },
-    { "x": 81.5, "y": 19.06624222, "z": "10th" },
-    { "x": 82.5, "y": 19.22710346, "z": "10th" },
-    { "x": 83.5, "y": 19.38880264, "z": "10th" },
-    { "x": 84.5, "y": 19.55135989, "z": "10th" },
-    { "x": 85.5, "y": 19.71479476, "z": "10th" },
-    { "x": 86.5, "y": 19.87912757, "z": "10th" },
-    { "x": 87.5, "y": 20.044378, "z": "10th" },
-    { "x": 88.5, "y": 20.21056603, "z": "10th" },
-    { "x": 89.5, "y": 20.37771189, "z": "10th" },
-    { "x": 90.5, "y": 20.54583618, "z": "10th" },
-    { "x": 91.5, "y": 20.71496001, "z": "10th" },
-    { "x": 92.5, "y": 20.88510518, "z": "10th" },
-    { "x": 93.5, "y": 21.05629437, "z": "10th" },
-    { "x": 94.5, "y": 21.22855059, "z": "10th" },
-    { "x": 95.5, "y": 21.40189997, "z": "10th" },
-    { "x": 96.5, "y": 21.57636833, "z": "10th" },
-    { "x": 97.5, "y": 21.75198362, "z": "10th" },
-    { "x": 98.5, "y": 21.92877558, "z": "10th" },
-    { "x": 99.5, "y": 22.10677591, "z": "10th" },
-    { "x": 100.5, "y": 22.28601843, "z": "10th" },
-    { "x": 101.5, "y": 22.46653924, "z": "10th" },
-    { "x": 102.5, "y": 22.64837687, "z": "10th" },
-    { "x": 103.5, "y": 22.83157226, "z": "10th" },
-    { "x": 104.5, "y": 23.01617007, "z": "10th" },
-    { "x": 105.5, "y": 23.20221593, "z": "10th" },
-    { "x": 106.5, "y": 23.38975956, "z": "10th" },
-    { "x": 107.5, "y": 23.57885344, "z": "10th" },
-    { "x": 108.5, "y": 23.769553, "z": "10th" },
-    { "x": 109.5, "y": 23.96191672, "z": "10th" },
-    { "x": 110.5, "y": 24.15600612, "z": "10th" },
-    { "x": 111.5, "y": 24.35188577, "z": "10th" },
-    { "x": 112.5, "y": 24.54962324, "z": "10th" },
-    { "x": 113.5, "y": 24.74928911, "z": "10th" },
-    { "x": 114.5, "y": 24.95095592, "z": "10th" },
-    { "x": 115.5, "y": 25.15470129, "z": "10th" },
-    { "x": 116.5, "y": 25.36060368, "z": "10th" },
-    { "x": 117.5, "y": 25.56874466, "z": "10th" },
-    { "x": 118.5, "y": 25.77920825, "z": "10th" },
-    { "x": 119.5, "y": 25.99208072, "z": "10th" },
-    { "x": 120.5, "y": 26.20745042, "z": "10th" },
-    { "x": 121.5, "y": 26.42540754, "z": "10th" },
-    { "x": 122.5, "y": 26.64604388, "z": "10th" },
-    { "x": 123.5, "y": 26.86945259, "z": "10th" },
-    { "x": 124.5, "y": 27.09572788, "z": "10th" },
-    { "x": 125.5, "y": 27.32496472, "z": "10th" },
-    { "x": 126.5, "y": 27.55725852, "z": "10th" },
-    { "x": 127.5, "y": 27.79270478, "z": "10th" },
-    { "x": 128.5, "y": 28.03139872, "z": "10th" },
-    { "x": 129.5, "y": 28.27343489, "z": "10th" },
-    { "x": 130.5, "y": 28.51890714, "z": "10th" },
-    { "x": 131.5, "y": 28.76790586, "z": "10th" },
-    { "x": 132.5, "y": 29.02052392, "z": "10th" },
-    { "x": 133.5, "y": 29.27684696, "z": "10th" },
-    { "x": 134.5, "y": 29.53696045, "z": "10th" },
-    { "x": 135.5, "y": 29.80094595, "z": "10th" },
-    { "x": 136.5, "y": 30.06888124, "z": "10th" },
-    { "x": 137.5, "y": 30.34083979, "z": "10th" },
-    { "x": 138.5, "y": 30.61689027, "z": "10th" },
-    { "x": 139.5, "y": 30.89709604, "z": "10th" },
-    { "x": 140.5, "y": 31.18151463, "z": "10th" },
-    { "x": 141.5, "y": 31.47019723, "z": "10th" },
-    { "x": 142.5, "y": 31.76318818, "z": "10th" },
-    { "x": 143.5, "y": 32.06052445, "z": "10th" },
-    { "x": 144.5, "y": 32.36223514, "z": "10th" },
-    { "x": 145.5, "y": 32.66834099, "z": "10th" },
-    { "x": 146.5, "y": 32.97885387, "z": "10th" },
-    { "x": 147.5, "y": 33.29377635, "z": "10th" },
-    { "x": 148.5, "y": 33.61310119, "z": "10th" },
-    { "x": 149.5, "y": 33.93681092, "z": "10th" },
-    { "x": 150.5, "y": 34.26487746, "z": "10th" },
-    { "x": 151.5, "y": 34.59726137, "z": "10th" },
-    { "x": 152.5, "y": 34.9339128, "z": "10th" },
-    { "x": 153.5, "y": 35.27476898, "z": "10th" },
-    { "x": 154.5, "y": 35.61975555, "z": "10th" },
-    { "x": 155.5, "y": 35.96878581, "z": "10th" },
-    { "x": 156.5, "y": 36.32176053, "z": "10th" },
-    { "x": 157.5, "y": 36.67856768, "z": "10th" },
-    { "x": 158.5, "y": 37.03908232, "z": "10th" },
-    { "x": 159.5, "y": 37.40316649, "z": "10th" },
-    { "x": 160.5, "y": 37.7706691, "z": "10th" },
-    { "x": 161.5, "y": 38.14142532, "z": "10th" },
-    { "x": 162.5, "y": 38.51525867, "z": "10th" },
-    { "x": 163.5, "y": 38.89197851, "z": "10th" },
-    { "x": 164.5, "y": 39.27138168, "z": "10th" },
-    { "x": 165.5, "y": 39.65325233, "z": "10th" },
-    { "x": 166.5, "y": 40.03736224, "z": "10th" },
-    { "x": 167.5, "y": 40.42347105, "z": "10th" },
-    { "x": 168.5, "y": 40.81132672, "z": "10th" },
-    { "x": 169.5, "y": 41.20066588, "z": "10th" },
-    { "x": 170.5, "y": 41.5912144, "z": "10th" },
-    { "x": 171.5, "y": 41.98268787, "z": "10th" },
-    { "x": 172.5, "y": 42.37479226, "z": "10th" },
-    { "x": 173.5, "y": 42.76722456, "z": "10th" },
-    { "x": 174.5, "y": 43.15967355, "z": "10th" },
-    { "x": 175.5, "y": 43.55182054, "z": "10th" },
-    { "x": 176.5, "y": 43.94334028, "z": "10th" },
-    { "x": 177.5, "y": 44.33390178, "z": "10th" },
-    { "x": 178.5, "y": 44.72316843, "z": "10th" },
-    { "x": 179.5, "y": 45.1108035, "z": "10th" },
-    { "x": 180.5, "y": 45.49646217, "z": "10th" },
-    { "x": 181.5, "y": 45.87980164, "z": "10th" },
-    { "x": 182.5, "y": 46.26047782, "z": "10th" },
-    { "x": 183.5, "y": 46.63814737, "z": "10th" },
-    { "x": 184.5, "y": 47.01246901, "z": "10th" },
-    { "x": 185.5, "y": 47.3831047, "z": "10th" },
-    { "x": 186.5, "y": 47.74972019, "z": "10th" },
-    { "x": 187.5, "y": 48.11199053, "z": "10th" },
-    { "x": 188.5, "y": 48.46959303, "z": "10th" },
-    { "x": 189.5, "y": 48.82221709, "z": "10th" },
-    { "x": 190.5, "y": 49.16956302, "z": "10th" },
-    { "x": 191.5, "y": 49.51133821, "z": "10th" },
-    { "x": 192.5, "y": 49.84726703, "z": "10th" },
-    { "x": 193.5, "y": 50.17708708, "z": "10th" },
-    { "x": 194.5, "y": 50.5005518, "z": "10th" },
-    { "x": 195.5, "y": 50.81743186, "z": "10th" },
-    { "x": 196.5, "y": 51.12751661, "z": "10th" },
-    { "x": 197.5, "y": 51.43061537, "z": "10th" },
-    { "x": 198.5, "y": 51.72655874, "z": "10th" },
-    { "x": 199.5, "y": 52.01519982, "z": "10th" },
-    { "x": 200.5, "y": 52.29641539, "z": "10th" },
-    { "x": 201.5, "y": 52.57010692, "z": "10th" },
-    { "x": 202.5, "y": 52.83620153, "z": "10th" },
-    { "x": 203.5, "y": 53.09465275, "z": "10th" },
-    { "x": 204.5, "y": 53.34544121, "z": "10th" },
-    { "x": 205.5, "y": 53.58857507, "z": "10th" },
-    { "x": 206.5, "y": 53.82409032, "z": "10th" },
-    { "x": 207.5, "y": 54.05204939, "z": "10th" },
-    { "x": 208.5, "y": 54.27254708, "z": "10th" },
-    { "x": 209.5, "y": 54.48570012, "z": "10th" },
-    { "x": 210.5, "y": 54.69165364, "z": "10th" },
-    { "x": 211.5, "y": 54.89057819, "z": "10th" },
-    { "x": 212.5, "y": 55.08266832, "z": "10th" },
-    { "x": 213.5, "y": 55.26814081, "z": "10th" },
-    { "x": 214.5, "y": 55.44723255, "z": "10th" },
-    { "x": 215.5, "y": 55.62019799, "z": "10th" },
-    { "x": 216.5, "y": 55.78730622, "z": "10th" },
-    { "x": 217.5, "y": 55.94883747, "z": "10th" },
-    { "x": 218.5, "y": 56.10508206, "z": "10th" },
-    { "x": 219.5, "y": 56.25632509, "z": "10th" },
-    { "x": 220.5, "y": 56.402856, "z": "10th" },
-    { "x": 221.5, "y": 56.54495425, "z": "10th" },
-    { "x": 222.5, "y": 56.68288493, "z": "10th" },
-    { "x": 223.5, "y": 56.81689002, "z": "10th" },
-    { "x": 224.5, "y": 56.94718918, "z": "10th" },
-    { "x": 225.5, "y": 57.073957, "z": "10th" },
-    { "x": 226.5, "y": 57.19732448, "z": "10th" },
-    { "x": 227.5, "y": 57.31736613, "z": "10th" },
-    { "x": 228.5, "y": 57.43408908, "z": "10th" },
-    { "x": 229.5, "y": 57.54742113, "z": "10th" },
-    { "x": 230.5, "y": 57.6571979, "z": "10th" },
-    { "x": 231.5, "y": 57.7631489, "z": "10th" },
-    { "x": 232.5, "y": 57.86488244, "z": "10th" },
-    { "x": 233.5, "y": 57.96186944, "z": "10th" },
-    { "x": 234.5, "y": 58.05342591, "z": "10th" },
-    { "x": 235.5, "y": 58.13869414, "z": "10th" },
-    { "x": 236.5, "y": 58.2166225, "z": "10th" },
-    { "x": 237.5, "y": 58.28594368, "z": "10th" },
-    { "x": 238.5, "y": 58.34514946, "z": "10th" },
-    { "x": 239.5, "y": 58.39247268, "z": "10th" },
-    { "x": 240, "y": 58.41104572, "z": "10th" },
-    { "x": 24, "y": 11.78597528, "z": "25th" },
-    { "x": 24.5, "y": 11.85181666, "z": "25th" },
-    { "x": 25.5, "y": 11.98141892, "z": "25th" },
-    { "x": 26.5, "y": 12.10888759, "z": "25th" },
-    { "x": 27.5, "y": 12.23490671, "z": "25th" },
-    { "x": 28.5, "y": 12.36007175, "z": "25th" },
-    { "x": 29.5, "y": 12.48489772, "z": "25th" },
-    { "x": 30.5, "y": 12.60982671, "z": "25th" },
-    { "x": 31.5, "y": 12.73523417, "z": "25th" },
-    { "x": 32.5, "y": 12.86143776, "z": "25th" },
-    { "x": 33.5, "y": 12.98869962, "z": "25th" },
-    { "x": 34.5, "y": 13.11723187, "z": "25th" },
-    { "x": 35.5, "y": 13.24720657, "z": "25th" },
-    { "x": 36.5, "y": 13.37875374, "z": "25th" },
-    { "x": 37.5, "y": 13.51197197, "z": "25th" },
-    { "x": 38.5, "y": 13.64692711, "z": "25th" },
-    { "x": 39.5, "y": 13.78365965, "z": "25th" },
-    { "x": 40.5, "y": 13.92218431, "z": "25th" },
-    { "x": 41.5, "y": 14.06249859, "z": "25th" },
-    { "x": 42.5, "y": 14.2045836, "z": "25th" },
-    { "x": 43.5, "y": 14.34840318, "z": "25th" },
-    { "x": 44.5, "y": 14.49391163, "z": "25th" },
-    { "x": 45.5, "y": 14.64105343, "z": "25th" },
-    { "x": 46.5, "y": 14.78976688, "z": "25th" },
-    { "x": 47.5, "y": 14.93998212, "z": "25th" },
-    { "x": 48.5, "y": 15.0916281, "z": "25th" },
-    { "x": 49.5, "y": 15.24463077, "z": "25th" },
-    { "x": 50.5, "y": 15.39891519, "z": "25th" },
-    { "x": 51.5, "y": 15.55440665, "z": "25th" },
-    { "x": 52.5, "y": 15.71103166, "z": "25th" },
-    { "x": 53.5, "y": 15.86871877, "z": "25th" },
-    { "x": 54.5, "y": 16.0273993, "z": "25th" },
-    { "x": 55.5, "y": 16.18700795, "z": "25th" },
-    { "x": 56.5, "y": 16.34748412, "z": "25th" },
-    { "x": 57.5, "y": 16.50876909, "z": "25th" },
-    { "x": 58.5, "y": 16.670811, "z": "25th" },
-    { "x": 59.5, "y": 16.83356209, "z": "25th" },
-    { "x": 60.5, "y": 16.99697963, "z": "25th" },
-    { "x": 61.5, "y": 17.16102601, "z": "25th" },
-    { "x": 62.5, "y": 17.32566884, "z": "25th" },
-    { "x": 63.5, "y": 17.49088098, "z": "25th" },
-    { "x": 64.5, "y": 17.65664052, "z": "25th" },
-    { "x": 65.5, "y": 17.82293074, "z": "25th" },
-    { "x": 66.5, "y": 17.98974005, "z": "25th" },
-    { "x": 67.5, "y": 18.15706188, "z": "25th" },
-    { "x": 68.5, "y": 18.32489457, "z": "25th" },
-    { "x": 69.5, "y": 18.49324122, "z": "25th" },
-    { "x": 70.5, "y": 18.66210955, "z": "25th" },
-    { "x": 71.5, "y": 18.83151262, "z": "25th" },
-    { "x": 72.5, "y": 19.00146515, "z": "25th" },
-    { "x": 73.5, "y": 19.17198834, "z": "25th" },
-    { "x": 74.5, "y": 19.34310643, "z": "25th" },
-    { "x": 75.5, "y": 19.51484724, "z": "25th" },
-    { "x": 76.5, "y": 19.68724198, "z": "25th" },
-    { "x": 77.5, "y": 19.86032494, "z": "25th" },
-    { "x": 78.5, "y": 20.03413327, "z": "25th" },
-    { "x": 79.5, "y": 20.20870673, "z": "25th" },
-    { "x": 80.5, "y": 20.38408835, "z": "25th" },
-    { "x": 81.5, "y": 20.56032091, "z": "25th" },
-    { "x": 82.5, "y": 20.73745116, "z": "25th" },
-    { "x": 83.5, "y": 20.9155269, "z": "25th" },
-    { "x": 84.5, "y": 21.09459707, "z": "25th" },
-    { "x": 85.5, "y": 21.2747126, "z": "25th" },
-    { "x": 86.5, "y": 21.45592408, "z": "25th" },
-    { "x": 87.5, "y": 21.63828396, "z": "25th" },
-    { "x": 88.5, "y": 21.82184504, "z": "25th" },
-    { "x": 89.5, "y": 22.00666068, "z": "25th" },
-    { "x": 90.5, "y": 22.19278461, "z": "25th" },
-    { "x": 91.5, "y": 22.38027095, "z": "25th" },
-    { "x": 92.5, "y": 22.56917407, "z": "25th" },
-    { "x": 93.5, "y": 22.75954858, "z": "25th" },
-    { "x": 94.5, "y": 22.95145019, "z": "25th" },
-    { "x": 95.5, "y": 23.14493249, "z": "25th" },
-    { "x": 96.5, "y": 23.34005152, "z": "25th" },
-    { "x": 97.5, "y": 23.53686295, "z": "25th" },
-    { "x": 98.5, "y": 23.73542282, "z": "25th" },
-    { "x": 99.5, "y": 23.93578761, "z": "25th" },
-    { "x": 100.5, "y": 24.13801431, "z": "25th" },
-    { "x": 101.5, "y": 24.34216053, "z": "25th" },
-    { "x": 102.5, "y": 24.54828458, "z": "25th" },
-    { "x": 103.5, "y": 24.7564457, "z": "25th" },
-    { "x": 104.5, "y": 24.96670281, "z": "25th" },
-    { "x": 105.5, "y": 25.17911785, "z": "25th" },
-    { "x": 106.5, "y": 25.39375238, "z": "25th" },
-    { "x": 107.5, "y": 25.61066925, "z": "25th" },
-    { "x": 108.5, "y": 25.82993243, "z": "25th" },
-    { "x": 109.5, "y": 26.05160708, "z": "25th" },
-    { "x": 110.5, "y": 26.27575951, "z": "25th" },
-    { "x": 111.5, "y": 26.50245719, "z": "25th" },
-    { "x": 112.5, "y": 26.73176876, "z": "25th" },
-    { "x": 113.5, "y": 26.96376399, "z": "25th" },
-    { "x": 114.5, "y": 27.19851432, "z": "25th" },
-    { "x": 115.5, "y": 27.43609072, "z": "25th" },
-    { "x": 116.5, "y": 27.67656629, "z": "25th" },
-    { "x": 117.5, "y": 27.92001453, "z": "25th" },
-    { "x": 118.5, "y": 28.16650963, "z": "25th" },
-    { "x": 119.5, "y": 28.41612623, "z": "25th" },
-    { "x": 120.5, "y": 28.66893932, "z": "25th" },
-    { "x": 121.5, "y": 28.92502395, "z": "25th" },
-    { "x": 122.5, "y": 29.18445509, "z": "25th" },
-    { "x": 123.5, "y": 29.44730733, "z": "25th" },
-    { "x": 124.5, "y": 29.7136546, "z": "25th" },
-    { "x": 125.5, "y": 29.98356997, "z": "25th" },
-    { "x": 126.5, "y": 30.25712523, "z": "25th" },
-    { "x": 127.5, "y": 30.53439065, "z": "25th" },
-    { "x": 128.5, "y": 30.8154346, "z": "25th" },
-    { "x": 129.5, "y": 31.1003232, "z": "25th" },
-    { "x": 130.5, "y": 31.38911963, "z": "25th" },
-    { "x": 131.5, "y": 31.6818858, "z": "25th" },
-    { "x": 132.5, "y": 31.97867622, "z": "25th" },
-    { "x": 133.5, "y": 32.27954601, "z": "25th" },
-    { "x": 134.5, "y": 32.58454356, "z": "25th" },
-    { "x": 135.5, "y": 32.89371309, "z": "25th" },
-    { "x": 136.5, "y": 33.20709368, "z": "25th" },
-    { "x": 137.5, "y": 33.52471882, "z": "25th" },
-    { "x": 138.5, "y": 33.84661596, "z": "25th" },
-    { "x": 139.5, "y": 34.17280606, "z": "25th" },
-    { "x": 140.5, "y": 34.50330312, "z": "25th" },
-    { "x": 141.5, "y": 34.83811379, "z": "25th" },
-    { "x": 142.5, "y": 35.17723687, "z": "25th" },
-    { "x": 143.5, "y": 35.52066292, "z": "25th" },
-    { "x": 144.5, "y": 35.8683738, "z": "25th" },
-    { "x": 145.5, "y": 36.22034231, "z": "25th" },
-    { "x": 146.5, "y": 36.57653175, "z": "25th" },
-    { "x": 147.5, "y": 36.9368956, "z": "25th" },
-    { "x": 148.5, "y": 37.3013771, "z": "25th" },
-    { "x": 149.5, "y": 37.669909, "z": "25th" },
-    { "x": 150.5, "y": 38.04241318, "z": "25th" },
-    { "x": 151.5, "y": 38.4188008, "z": "25th" },
-    { "x": 152.5, "y": 38.79897039, "z": "25th" },
-    { "x": 153.5, "y": 39.18281045, "z": "25th" },
-    { "x": 154.5, "y": 39.57019714, "z": "25th" },
-    { "x": 155.5, "y": 39.96099475, "z": "25th" },
-    { "x": 156.5, "y": 40.35505561, "z": "25th" },
-    { "x": 157.5, "y": 40.75222006, "z": "25th" },
-    { "x": 158.5, "y": 41.15231646, "z": "25th" },
-    { "x": 159.5, "y": 41.55516124, "z": "25th" },
-    { "x": 160.5, "y": 41.96055897, "z": "25th" },
-    { "x": 161.5, "y": 42.36830371, "z": "25th" },
-    { "x": 162.5, "y": 42.77817554, "z": "25th" },
-    { "x": 163.5, "y": 43.1899454, "z": "25th" },
-    { "x": 164.5, "y": 43.6033728, "z": "25th" },
-    { "x": 165.5, "y": 44.01820683, "z": "25th" },
-    { "x": 166.5, "y": 44.43418656, "z": "25th" },
-    { "x": 167.5, "y": 44.8510416, "z": "25th" },
-    { "x": 168.5, "y": 45.26849262, "z": "25th" },
-    { "x": 169.5, "y": 45.68625203, "z": "25th" },
-    { "x": 170.5, "y": 46.10402466, "z": "25th" },
-    { "x": 171.5, "y": 46.5215085, "z": "25th" },
-    { "x": 172.5, "y": 46.93839552, "z": "25th" },
-    { "x": 173.5, "y": 47.35437254, "z": "25th" },
-    { "x": 174.5, "y": 47.76912213, "z": "25th" },
-    { "x": 175.5, "y": 48.18232356, "z": "25th" },
-    { "x": 176.5, "y": 48.59365384, "z": "25th" },
-    { "x": 177.5, "y": 49.00278873, "z": "25th" },
-    { "x": 178.5, "y": 49.40940563, "z": "25th" },
-    { "x": 179.5, "y": 49.81317566, "z": "25th" },
-    { "x": 180.5, "y": 50.21378283, "z": "25th"},
-    { "x": 181.5, "y": 50.61090716, "z": "25th" },
-    { "x": 182.5, "y": 51.0042348, "z": "25th" },
-    { "x": 183.5, "y": 51.39345743, "z": "25th" },
-    { "x": 184.5, "y": 51.77827341, "z": "25th" },
-    { "x": 185.5, "y": 52.15838887, "z": "25th" },
-    { "x": 186.5, "y": 52.53352018, "z": "25th" },
-    { "x": 187.5, "y": 52.90338872, "z": "25th" },
-    { "x": 188.5, "y": 53.26773454, "z": "25th" },
-    { "x": 189.5, "y": 53.62630488, "z": "25th" },
-    { "x": 190.5, "y": 53.97885832, "z": "25th" },
-    { "x": 191.5, "y": 54.32517625, "z": "25th" },
-    { "x": 192.5, "y": 54.66504759, "z": "25th" },
-    { "x": 193.5, "y": 54.9982797, "z": "25th" },
-    { "x": 194.5, "y": 55.32469696, "z": "25th" },
-    { "x": 195.5, "y": 55.64414166, "z": "25th" },
-    { "x": 196.5, "y": 55.95647478, "z": "25th" },
-    { "x": 197.5, "y": 56.26157681, "z": "25th" },
-    { "x": 198.5, "y": 56.55934839, "z": "25th" },
-    { "x": 199.5, "y": 56.8497111, "z": "25th" },
-    { "x": 200.5, "y": 57.13260799, "z": "25th" },
-    { "x": 201.5, "y": 57.40800416, "z": "25th" },
-    { "x": 202.5, "y": 57.67588728, "z": "25th" },
-    { "x": 203.5, "y": 57.93626794, "z": "25th" },
-    { "x": 204.5, "y": 58.18918, "z": "25th" },
-    { "x": 205.5, "y": 58.43468077, "z": "25th" },
-    { "x": 206.5, "y": 58.67285105, "z": "25th" },
-    { "x": 207.5, "y": 58.90379742, "z": "25th" },
-    { "x": 208.5, "y": 59.1276417, "z": "25th" },
-    { "x": 209.5, "y": 59.3445374, "z": "25th" },
-    { "x": 210.5, "y": 59.55465678, "z": "25th" },
-    { "x": 211.5, "y": 59.75819326, "z": "25th" },
-    { "x": 212.5, "y": 59.95536025, "z": "25th" },
-    { "x": 213.5, "y": 60.1463897, "z": "25th" },
-    { "x": 214.5, "y": 60.33153027, "z": "25th" },
-    { "x": 215.5, "y": 60.51104512, "z": "25th" },
-    { "x": 216.5, "y": 60.68520928, "z": "25th" },
-    { "x": 217.5, "y": 60.85430662, "z": "25th" },
-    { "x": 218.5, "y": 61.0186237, "z": "25th" },
-    { "x": 219.5, "y": 61.17845532, "z": "25th" },
-    { "x": 220.5, "y": 61.33408787, "z": "25th" },
-    { "x": 221.5, "y": 61.48580086, "z": "25th" },
-    { "x": 222.5, "y": 61.63385984, "z": "25th" },
-    { "x": 223.5, "y": 61.77851223, "z": "25th" },
-    { "x": 224.5, "y": 61.91996953, "z": "25th" },
-    { "x": 225.5, "y": 62.05841733, "z": "25th" },
-    { "x": 226.5, "y": 62.19399335, "z": "25th" },
-    { "x": 227.5, "y": 62.32678127, "z": "25th" },
-    { "x": 228.5, "y": 62.45680021, "z": "25th" },
-    { "x": 229.5, "y": 62.58399337, "z": "25th" },
-    { "x": 230.5, "y": 62.70821568, "z": "25th" },
-    { "x": 231.5, "y": 62.8292204, "z": "25th" },
-    { "x": 232.5, "y": 62.94664487, "z": "25th" },
-    { "x": 233.5, "y": 63.0599953, "z": "25th" },
-    { "x": 234.5, "y": 63.16863065, "z": "25th" },
-    { "x": 235.5, "y": 63.27174585, "z": "25th" },
-    { "x": 236.5, "y": 63.36835431, "z": "25th" },
-    { "x": 237.5, "y": 63.45727001, "z": "25th" },
-    { "x": 238.5, "y": 63.53709257, "z": "25th" },
-    { "x": 239.5, "y": 63.6061772, "z": "25th" },
-    { "x": 240, "y": 63.6361125, "z": "25th" },
-    { "x": 24, "y": 12.6707633, "z": "50th" },
-    { "x": 24.5, "y": 12.74154396, "z": "50th" },
-    { "x": 25.5, "y": 12.88102276, "z": "50th" },
-    { "x": 26.5, "y": 13.01842382, "z": "50th" },
-    { "x": 27.5, "y": 13.1544966, "z": "50th" },
-    { "x": 28.5, "y": 13.28989667, "z": "50th" },
-    { "x": 29.5, "y": 13.42519408, "z": "50th" },
-    { "x": 30.5, "y": 13.56088113, "z": "50th" },
-    { "x": 31.5, "y": 13.69737858, "z": "50th" },
-    { "x": 32.5, "y": 13.83504622, "z": "50th" },
-    { "x": 33.5, "y": 13.97418299, "z": "50th" },
-    { "x": 34.5, "y": 14.1150324, "z": "50th" },
-    { "x": 35.5, "y": 14.25779618, "z": "50th" },
-    { "x": 36.5, "y": 14.40262749, "z": "50th" },
-    { "x": 37.5, "y": 14.54964614, "z": "50th" },
-    { "x": 38.5, "y": 14.69893326, "z": "50th" },
-    { "x": 39.5, "y": 14.85054151, "z": "50th" },
-    { "x": 40.5, "y": 15.00449143, "z": "50th" },
-    { "x": 41.5, "y": 15.16078454, "z": "50th" },
-    { "x": 42.5, "y": 15.31940246, "z": "50th" },
-    { "x": 43.5, "y": 15.48030313, "z": "50th" },
-    { "x": 44.5, "y": 15.64343309, "z": "50th" },
-    { "x": 45.5, "y": 15.80872535, "z": "50th" },
-    { "x": 46.5, "y": 15.97610456, "z": "50th" },
-    { "x": 47.5, "y": 16.14548194, "z": "50th" },
-    { "x": 48.5, "y": 16.31676727, "z": "50th" },
-    { "x": 49.5, "y": 16.4898646, "z": "50th" },
-    { "x": 50.5, "y": 16.66467529, "z": "50th" },
-    { "x": 51.5, "y": 16.84109948, "z": "50th" },
-    { "x": 52.5, "y": 17.01903746, "z": "50th" },
-    { "x": 53.5, "y": 17.1983908, "z": "50th" },
-    { "x": 54.5, "y": 17.37906341, "z": "50th" },
-    { "x": 55.5, "y": 17.56096245, "z": "50th" },
-    { "x": 56.5, "y": 17.74400082, "z": "50th" },
-    { "x": 57.5, "y": 17.92809121, "z": "50th" },
-    { "x": 58.5, "y": 18.11315625, "z": "50th" },
-    { "x": 59.5, "y": 18.29912286, "z": "50th" },
-    { "x": 60.5, "y": 18.48592413, "z": "50th" },
-    { "x": 61.5, "y": 18.67349965, "z": "50th" },
-    { "x": 62.5, "y": 18.86179576, "z": "50th" },
-    { "x": 63.5, "y": 19.05076579, "z": "50th" },
-    { "x": 64.5, "y": 19.24037019, "z": "50th" },
-    { "x": 65.5, "y": 19.43057662, "z": "50th" },
-    { "x": 66.5, "y": 19.62136007, "z": "50th" },
-    { "x": 67.5, "y": 19.8127028, "z": "50th" },
-    { "x": 68.5, "y": 20.0045944, "z": "50th" },
-    { "x": 69.5, "y": 20.19703171, "z": "50th" },
-    { "x": 70.5, "y": 20.39001872, "z": "50th" },
-    { "x": 71.5, "y": 20.58356862, "z": "50th" },
-    { "x": 72.5, "y": 20.77769565, "z": "50th" },
-    { "x": 73.5, "y": 20.97242631, "z": "50th" },
-    { "x": 74.5, "y": 21.16779192, "z": "50th" },
-    { "x": 75.5, "y": 21.36383013, "z": "50th" },
-    { "x": 76.5, "y": 21.56058467, "z": "50th" },
-    { "x": 77.5, "y": 21.75810506, "z": "50th" },
-    { "x": 78.5, "y": 21.95644627, "z": "50th" },
-    { "x": 79.5, "y": 22.15566842, "z": "50th" },
-    { "x": 80.5, "y": 22.35583862, "z": "50th" },
-    { "x": 81.5, "y": 22.55702268, "z": "50th" },
-    { "x": 82.5, "y": 22.75929558, "z": "50th" },
-    { "x": 83.5, "y": 22.9627344, "z": "50th" },
-    { "x": 84.5, "y": 23.16741888, "z": "50th" },
-    { "x": 85.5, "y": 23.37343341, "z": "50th" },
-    { "x": 86.5, "y": 23.58086145, "z": "50th" },
-    { "x": 87.5, "y": 23.78979096, "z": "50th" },
-    { "x": 88.5, "y": 24.00031064, "z": "50th" },
-    { "x": 89.5, "y": 24.21251028, "z": "50th" },
-    { "x": 90.5, "y": 24.42648043, "z": "50th" },
-    { "x": 91.5, "y": 24.642312, "z": "50th" },
-    { "x": 92.5, "y": 24.86009596, "z": "50th" },
-    { "x": 93.5, "y": 25.07992303, "z": "50th" },
-    { "x": 94.5, "y": 25.30188584, "z": "50th" },
-    { "x": 95.5, "y": 25.52606977, "z": "50th" },
-    { "x": 96.5, "y": 25.75256528, "z": "50th" },
-    { "x": 97.5, "y": 25.9814599, "z": "50th" },
-    { "x": 98.5, "y": 26.2128399, "z": "50th" },
-    { "x": 99.5, "y": 26.44679027, "z": "50th" },
-    { "x": 100.5, "y": 26.68339457, "z": "50th" },
-    { "x": 101.5, "y": 26.92273494, "z": "50th" },
-    { "x": 102.5, "y": 27.16489199, "z": "50th" },
-    { "x": 103.5, "y": 27.40994539, "z": "50th" },
-    { "x": 104.5, "y": 27.65796978, "z": "50th" },
-    { "x": 105.5, "y": 27.90904433, "z": "50th" },
-    { "x": 106.5, "y": 28.16324264, "z": "50th" },
-    { "x": 107.5, "y": 28.42063744, "z": "50th" },
-    { "x": 108.5, "y": 28.68130005, "z": "50th" },
-    { "x": 109.5, "y": 28.94530029, "z": "50th" },
-    { "x": 110.5, "y": 29.21270645, "z": "50th" },
-    { "x": 111.5, "y": 29.48358527, "z": "50th" },
-    { "x": 112.5, "y": 29.75800198, "z": "50th" },
-    { "x": 113.5, "y": 30.03602021, "z": "50th" },
-    { "x": 114.5, "y": 30.31770417, "z": "50th" },
-    { "x": 115.5, "y": 30.60311107, "z": "50th" },
-    { "x": 116.5, "y": 30.89230072, "z": "50th" },
-    { "x": 117.5, "y": 31.18532984, "z": "50th" },
-    { "x": 118.5, "y": 31.48225315, "z": "50th" },
-    { "x": 119.5, "y": 31.78312329, "z": "50th" },
-    { "x": 120.5, "y": 32.08799062, "z": "50th" },
-    { "x": 121.5, "y": 32.39690313, "z": "50th" },
-    { "x": 122.5, "y": 32.7099062, "z": "50th" },
-    { "x": 123.5, "y": 33.02704244, "z": "50th" },
-    { "x": 124.5, "y": 33.34835148, "z": "50th" },
-    { "x": 125.5, "y": 33.67386973, "z": "50th" },
-    { "x": 126.5, "y": 34.00363017, "z": "50th" },
-    { "x": 127.5, "y": 34.33766207, "z": "50th" },
-    { "x": 128.5, "y": 34.67599076, "z": "50th" },
-    { "x": 129.5, "y": 35.01863732, "z": "50th" },
-    { "x": 130.5, "y": 35.36561737, "z": "50th" },
-    { "x": 131.5, "y": 35.71694723, "z": "50th" },
-    { "x": 132.5, "y": 36.07262569, "z": "50th" },
-    { "x": 133.5, "y": 36.43265996, "z": "50th" },
-    { "x": 134.5, "y": 36.79704392, "z": "50th" },
-    { "x": 135.5, "y": 37.1657671, "z": "50th" },
-    { "x": 136.5, "y": 37.53881268, "z": "50th" },
-    { "x": 137.5, "y": 37.91615721, "z": "50th" },
-    { "x": 138.5, "y": 38.2977703, "z": "50th" },
-    { "x": 139.5, "y": 38.6836143, "z": "50th" },
-    { "x": 140.5, "y": 39.07364401, "z": "50th" },
-    { "x": 141.5, "y": 39.46780643, "z": "50th" },
-    { "x": 142.5, "y": 39.86604044, "z": "50th" },
-    { "x": 143.5, "y": 40.26827652, "z": "50th" },
-    { "x": 144.5, "y": 40.67443658, "z": "50th" },
-    { "x": 145.5, "y": 41.08443363, "z": "50th" },
-    { "x": 146.5, "y": 41.49817164, "z": "50th" },
-    { "x": 147.5, "y": 41.91554528, "z": "50th" },
-    { "x": 148.5, "y": 42.33643978, "z": "50th" },
-    { "x": 149.5, "y": 42.76073078, "z": "50th" },
-    { "x": 150.5, "y": 43.18828419, "z": "50th" },
-    { "x": 151.5, "y": 43.61895703, "z": "50th" },
-    { "x": 152.5, "y": 44.0525931, "z": "50th" },
-    { "x": 153.5, "y": 44.48903027, "z": "50th" },
-    { "x": 154.5, "y": 44.92809483, "z": "50th" },
-    { "x": 155.5, "y": 45.36960315, "z": "50th" },
-    { "x": 156.5, "y": 45.81336172, "z": "50th" },
-    { "x": 157.5, "y": 46.25916729, "z": "50th" },
-    { "x": 158.5, "y": 46.70680701, "z": "50th" },
-    { "x": 159.5, "y": 47.15605863, "z": "50th" },
-    { "x": 160.5, "y": 47.60669074, "z": "50th" },
-    { "x": 161.5, "y": 48.05846572, "z": "50th" },
-    { "x": 162.5, "y": 48.51113138, "z": "50th" },
-    { "x": 163.5, "y": 48.96443224, "z": "50th" },
-    { "x": 164.5, "y": 49.41810374, "z": "50th" },
-    { "x": 165.5, "y": 49.87187409, "z": "50th" },
-    { "x": 166.5, "y": 50.32546478, "z": "50th" },
-    { "x": 167.5, "y": 50.77859121, "z": "50th" },
-    { "x": 168.5, "y": 51.23096332, "z": "50th" },
-    { "x": 169.5, "y": 51.68228625, "z": "50th" },
-    { "x": 170.5, "y": 52.13226113, "z": "50th" },
-    { "x": 171.5, "y": 52.58058583, "z": "50th" },
-    { "x": 172.5, "y": 53.02695588, "z": "50th" },
-    { "x": 173.5, "y": 53.47106525, "z": "50th" },
-    { "x": 174.5, "y": 53.91260737, "z": "50th" },
-    { "x": 175.5, "y": 54.35127608, "z": "50th" },
-    { "x": 176.5, "y": 54.78676659, "z": "50th" },
-    { "x": 177.5, "y": 55.21877657, "z": "50th" },
-    { "x": 178.5, "y": 55.64701131, "z": "50th" },
-    { "x": 179.5, "y": 56.07116407, "z": "50th" },
-    { "x": 180.5, "y": 56.49095862, "z": "50th" },
-    { "x": 181.5, "y": 56.90610886, "z": "50th" },
-    { "x": 182.5, "y": 57.31634059, "z": "50th" },
-    { "x": 183.5, "y": 57.72138846, "z": "50th" },
-    { "x": 184.5, "y": 58.12099696, "z": "50th" },
-    { "x": 185.5, "y": 58.51492143, "z": "50th" },
-    { "x": 186.5, "y": 58.90293208, "z": "50th" },
-    { "x": 187.5, "y": 59.28479948, "z": "50th" },
-    { "x": 188.5, "y": 59.66032626, "z": "50th" },
-    { "x": 189.5, "y": 60.02931704, "z": "50th" },
-    { "x": 190.5, "y": 60.39158721, "z": "50th" },
-    { "x": 191.5, "y": 60.74698785, "z": "50th" },
-    { "x": 192.5, "y": 61.09536847, "z": "50th" },
-    { "x": 193.5, "y": 61.43660077, "z": "50th" },
-    { "x": 194.5, "y": 61.77057372, "z": "50th" },
-    { "x": 195.5, "y": 62.09719399, "z": "50th" },
-    { "x": 196.5, "y": 62.41638628, "z": "50th" },
-    { "x": 197.5, "y": 62.72809362, "z": "50th" },
-    { "x": 198.5, "y": 63.03227756, "z": "50th" },
-    { "x": 199.5, "y": 63.32891841, "z": "50th" },
-    { "x": 200.5, "y": 63.61801537, "z": "50th" },
-    { "x": 201.5, "y": 63.89958662, "z": "50th" },
-    { "x": 202.5, "y": 64.17366943, "z": "50th" },
-    { "x": 203.5, "y": 64.44032016, "z": "50th" },
-    { "x": 204.5, "y": 64.69961427, "z": "50th" },
-    { "x": 205.5, "y": 64.95164625, "z": "50th" },
-    { "x": 206.5, "y": 65.1965295, "z": "50th" },
-    { "x": 207.5, "y": 65.43440186, "z": "50th" },
-    { "x": 208.5, "y": 65.66540015, "z": "50th" },
-    { "x": 209.5, "y": 65.88970117, "z": "50th" },
-    { "x": 210.5, "y": 66.10749114, "z": "50th" },
-    { "x": 211.5, "y": 66.31897311, "z": "50th" },
-    { "x": 212.5, "y": 66.52436618, "z": "50th" },
-    { "x": 213.5, "y": 66.72390443, "z": "50th" },
-    { "x": 214.5, "y": 66.91783563, "z": "50th" },
-    { "x": 215.5, "y": 67.10641956, "z": "50th" },
-    { "x": 216.5, "y": 67.28992603, "z": "50th" },
-    { "x": 217.5, "y": 67.46863255, "z": "50th" },
-    { "x": 218.5, "y": 67.64281378, "z": "50th" },
-    { "x": 219.5, "y": 67.8127675, "z": "50th" },
-    { "x": 220.5, "y": 67.97877331, "z": "50th" },
-    { "x": 221.5, "y": 68.14111022, "z": "50th" },
-    { "x": 222.5, "y": 68.30004741, "z": "50th" },
-    { "x": 223.5, "y": 68.4558454, "z": "50th" },
-    { "x": 224.5, "y": 68.60872174, "z": "50th" },
-    { "x": 225.5, "y": 68.75889263, "z": "50th" },
-    { "x": 226.5, "y": 68.90653028, "z": "50th" },
-    { "x": 227.5, "y": 69.05176427, "z": "50th" },
-    { "x": 228.5, "y": 69.19467288, "z": "50th" },
-    { "x": 229.5, "y": 69.33527376, "z": "50th" },
-    { "x": 230.5, "y": 69.47351373, "z": "50th" },
-    { "x": 231.5, "y": 69.60925782, "z": "50th" },
-    { "x": 232.5, "y": 69.74227758, "z": "50th" },
-    { "x": 233.5, "y": 69.87223885, "z": "50th" },
-    { "x": 234.5, "y": 69.99868896, "z": "50th" },
-    { "x": 235.5, "y": 70.12104381, "z": "50th" },
-    { "x": 236.5, "y": 70.23857482, "z": "50th" },
-    { "x": 237.5, "y": 70.35039626, "z": "50th" },
-    { "x": 238.5, "y": 70.45546105, "z": "50th" },
-    { "x": 239.5, "y": 70.55252127, "z": "50th" },
-    { "x": 240, "y": 70.59761453, "z": "50th" },
-    { "x": 24, "y": 13.63691949, "z": "75th" },
-    { "x": 24.5, "y": 13.71386029, "z": "75th" },
-    { "x": 25.5, "y": 13.86589625, "z": "75th" },
-    { "x": 26.5, "y": 14.0162298, "z": "75th" },
-    { "x": 27.5, "y": 14.1656725, "z": "75th" },
-    { "x": 28.5, "y": 14.31493214, "z": "75th" },
-    { "x": 29.5, "y": 14.46462206, "z": "75th" },
-    { "x": 30.5, "y": 14.61526973, "z": "75th" },
-    { "x": 31.5, "y": 14.76732387, "z": "75th" },
-    { "x": 32.5, "y": 14.9211657, "z": "75th" },
-    { "x": 33.5, "y": 15.07711012, "z": "75th" },
-    { "x": 34.5, "y": 15.23541179, "z": "75th" },
-    { "x": 35.5, "y": 15.3962791, "z": "75th" },
-    { "x": 36.5, "y": 15.5598683, "z": "75th" },
-    { "x": 37.5, "y": 15.72629889, "z": "75th" },
-    { "x": 38.5, "y": 15.89564892, "z": "75th" },
-    { "x": 39.5, "y": 16.06796532, "z": "75th" },
-    { "x": 40.5, "y": 16.24326063, "z": "75th" },
-    { "x": 41.5, "y": 16.4215262, "z": "75th" },
-    { "x": 42.5, "y": 16.60273167, "z": "75th" },
-    { "x": 43.5, "y": 16.78682117, "z": "75th" },
-    { "x": 44.5, "y": 16.97372594, "z": "75th" },
-    { "x": 45.5, "y": 17.16336229, "z": "75th" },
-    { "x": 46.5, "y": 17.3556371, "z": "75th" },
-    { "x": 47.5, "y": 17.55044259, "z": "75th" },
-    { "x": 48.5, "y": 17.74766896, "z": "75th" },
-    { "x": 49.5, "y": 17.94720007, "z": "75th" },
-    { "x": 50.5, "y": 18.14891672, "z": "75th" },
-    { "x": 51.5, "y": 18.35269841, "z": "75th" },
-    { "x": 52.5, "y": 18.55842485, "z": "75th" },
-    { "x": 53.5, "y": 18.76597736, "z": "75th" },
-    { "x": 54.5, "y": 18.9752401, "z": "75th" },
-    { "x": 55.5, "y": 19.18610119, "z": "75th" },
-    { "x": 56.5, "y": 19.39845556, "z": "75th" },
-    { "x": 57.5, "y": 19.61219848, "z": "75th" },
-    { "x": 58.5, "y": 19.82723683, "z": "75th" },
-    { "x": 59.5, "y": 20.04348292, "z": "75th" },
-    { "x": 60.5, "y": 20.26085668, "z": "75th" },
-    { "x": 61.5, "y": 20.47928605, "z": "75th" },
-    { "x": 62.5, "y": 20.69870731, "z": "75th" },
-    { "x": 63.5, "y": 20.9190654, "z": "75th" },
-    { "x": 64.5, "y": 21.14031403, "z": "75th" },
-    { "x": 65.5, "y": 21.36241588, "z": "75th" },
-    { "x": 66.5, "y": 21.58534268, "z": "75th" },
-    { "x": 67.5, "y": 21.80907518, "z": "75th" },
-    { "x": 68.5, "y": 22.03360322, "z": "75th" },
-    { "x": 69.5, "y": 22.25892561, "z": "75th" },
-    { "x": 70.5, "y": 22.48505007, "z": "75th" },
-    { "x": 71.5, "y": 22.71199557, "z": "75th" },
-    { "x": 72.5, "y": 22.93978291, "z": "75th" },
-    { "x": 73.5, "y": 23.16844769, "z": "75th" },
-    { "x": 74.5, "y": 23.39803173, "z": "75th" },
-    { "x": 75.5, "y": 23.62858485, "z": "75th" },
-    { "x": 76.5, "y": 23.86016456, "z": "75th" },
-    { "x": 77.5, "y": 24.09283575, "z": "75th" },
-    { "x": 78.5, "y": 24.32667035, "z": "75th" },
-    { "x": 79.5, "y": 24.56174697, "z": "75th" },
-    { "x": 80.5, "y": 24.79815314, "z": "75th" },
-    { "x": 81.5, "y": 25.03597537, "z": "75th" },
-    { "x": 82.5, "y": 25.27531174, "z": "75th" },
-    { "x": 83.5, "y": 25.51626345, "z": "75th" },
-    { "x": 84.5, "y": 25.75893543, "z": "75th" },
-    { "x": 85.5, "y": 26.00343881, "z": "75th" },
-    { "x": 86.5, "y": 26.24988395, "z": "75th" },
-    { "x": 87.5, "y": 26.49838713, "z": "75th" },
-    { "x": 88.5, "y": 26.74906587, "z": "75th" },
-    { "x": 89.5, "y": 27.00203925, "z": "75th" },
-    { "x": 90.5, "y": 27.25742737, "z": "75th" },
-    { "x": 91.5, "y": 27.51535075, "z": "75th" },
-    { "x": 92.5, "y": 27.77592982, "z": "75th" },
-    { "x": 93.5, "y": 28.03928438, "z": "75th" },
-    { "x": 94.5, "y": 28.30553622, "z": "75th" },
-    { "x": 95.5, "y": 28.57479705, "z": "75th" },
-    { "x": 96.5, "y": 28.84718437, "z": "75th" },
-    { "x": 97.5, "y": 29.12281085, "z": "75th" },
-    { "x": 98.5, "y": 29.40178631, "z": "75th" },
-    { "x": 99.5, "y": 29.68421748, "z": "75th" },
-    { "x": 100.5, "y": 29.97020767, "z": "75th" },
-    { "x": 101.5, "y": 30.25985653, "z": "75th" },
-    { "x": 102.5, "y": 30.5532598, "z": "75th" },
-    { "x": 103.5, "y": 30.85050986, "z": "75th" },
-    { "x": 104.5, "y": 31.15169009, "z": "75th" },
-    { "x": 105.5, "y": 31.45688766, "z": "75th" },
-    { "x": 106.5, "y": 31.76617973, "z": "75th" },
-    { "x": 107.5, "y": 32.07963965, "z": "75th" },
-    { "x": 108.5, "y": 32.39733625, "z": "75th" },
-    { "x": 109.5, "y": 32.71933351, "z": "75th" },
-    { "x": 110.5, "y": 33.04569055, "z": "75th" },
-    { "x": 111.5, "y": 33.37646157, "z": "75th" },
-    { "x": 112.5, "y": 33.7116958, "z": "75th" },
-    { "x": 113.5, "y": 34.05143747, "z": "75th" },
-    { "x": 114.5, "y": 34.39572894, "z": "75th" },
-    { "x": 115.5, "y": 34.74459982, "z": "75th" },
-    { "x": 116.5, "y": 35.09808092, "z": "75th" },
-    { "x": 117.5, "y": 35.45619608, "z": "75th" },
-    { "x": 118.5, "y": 35.81896391, "z": "75th" },
-    { "x": 119.5, "y": 36.18639776, "z": "75th" },
-    { "x": 120.5, "y": 36.55850564, "z": "75th" },
-    { "x": 121.5, "y": 36.9352902, "z": "75th" },
-    { "x": 122.5, "y": 37.31674867, "z": "75th" },
-    { "x": 123.5, "y": 37.70287276, "z": "75th" },
-    { "x": 124.5, "y": 38.09364865, "z": "75th" },
-    { "x": 125.5, "y": 38.48905687, "z": "75th" },
-    { "x": 126.5, "y": 38.88907228, "z": "75th" },
-    { "x": 127.5, "y": 39.29366396, "z": "75th" },
-    { "x": 128.5, "y": 39.70279517, "z": "75th" },
-    { "x": 129.5, "y": 40.11642323, "z": "75th" },
-    { "x": 130.5, "y": 40.53449819, "z": "75th" },
-    { "x": 131.5, "y": 40.95697152, "z": "75th" },
-    { "x": 132.5, "y": 41.38377162, "z": "75th" },
-    { "x": 133.5, "y": 41.81483955, "z": "75th" },
-    { "x": 134.5, "y": 42.25009969, "z": "75th" },
-    { "x": 135.5, "y": 42.68947235, "z": "75th" },
-    { "x": 136.5, "y": 43.13287143, "z": "75th" },
-    { "x": 137.5, "y": 43.58020437, "z": "75th" },
-    { "x": 138.5, "y": 44.03137211, "z": "75th" },
-    { "x": 139.5, "y": 44.48626901, "z": "75th" },
-    { "x": 140.5, "y": 44.94478284, "z": "75th" },
-    { "x": 141.5, "y": 45.40679475, "z": "75th" },
-    { "x": 142.5, "y": 45.8721792, "z": "75th" },
-    { "x": 143.5, "y": 46.34080401, "z": "75th" },
-    { "x": 144.5, "y": 46.81253029, "z": "75th" },
-    { "x": 145.5, "y": 47.28721249, "z": "75th" },
-    { "x": 146.5, "y": 47.76469837, "z": "75th" },
-    { "x": 147.5, "y": 48.24482905, "z": "75th" },
-    { "x": 148.5, "y": 48.72743903, "z": "75th" },
-    { "x": 149.5, "y": 49.21235624, "z": "75th" },
-    { "x": 150.5, "y": 49.6994021, "z": "75th" },
-    { "x": 151.5, "y": 50.1883928, "z": "75th" },
-    { "x": 152.5, "y": 50.67913392, "z": "75th" },
-    { "x": 153.5, "y": 51.17142989, "z": "75th" },
-    { "x": 154.5, "y": 51.66507694, "z": "75th" },
-    { "x": 155.5, "y": 52.15986523, "z": "75th" },
-    { "x": 156.5, "y": 52.65557906, "z": "75th" },
-    { "x": 157.5, "y": 53.15199704, "z": "75th" },
-    { "x": 158.5, "y": 53.64889226, "z": "75th" },
-    { "x": 159.5, "y": 54.14603254, "z": "75th" },
-    { "x": 160.5, "y": 54.64318067, "z": "75th" },
-    { "x": 161.5, "y": 55.14009784, "z": "75th" },
-    { "x": 162.5, "y": 55.63653354, "z": "75th" },
-    { "x": 163.5, "y": 56.13223889, "z": "75th" },
-    { "x": 164.5, "y": 56.62695959, "z": "75th" },
-    { "x": 165.5, "y": 57.12043787, "z": "75th" },
-    { "x": 166.5, "y": 57.61241293, "z": "75th" },
-    { "x": 167.5, "y": 58.10262135, "z": "75th" },
-    { "x": 168.5, "y": 58.59079757, "z": "75th" },
-    { "x": 169.5, "y": 59.07667438, "z": "75th" },
-    { "x": 170.5, "y": 59.55998349, "z": "75th" },
-    { "x": 171.5, "y": 60.04045606, "z": "75th" },
-    { "x": 172.5, "y": 60.51782332, "z": "75th" },
-    { "x": 173.5, "y": 60.99181722, "z": "75th" },
-    { "x": 174.5, "y": 61.4621711, "z": "75th" },
-    { "x": 175.5, "y": 61.92862037, "z": "75th" },
-    { "x": 176.5, "y": 62.3909033, "z": "75th" },
-    { "x": 177.5, "y": 62.84876169, "z": "75th" },
-    { "x": 178.5, "y": 63.30194659, "z": "75th" },
-    { "x": 179.5, "y": 63.75019486, "z": "75th" },
-    { "x": 180.5, "y": 64.19327833, "z": "75th" },
-    { "x": 181.5, "y": 64.63095632, "z": "75th" },
-    { "x": 182.5, "y": 65.06300059, "z": "75th" },
-    { "x": 183.5, "y": 65.48919135, "z": "75th" },
-    { "x": 184.5, "y": 65.90931806, "z": "75th" },
-    { "x": 185.5, "y": 66.32318017, "z": "75th" },
-    { "x": 186.5, "y": 66.73059164, "z": "75th" },
-    { "x": 187.5, "y": 67.13136309, "z": "75th" },
-    { "x": 188.5, "y": 67.52533948, "z": "75th" },
-    { "x": 189.5, "y": 67.91236375, "z": "75th" },
-    { "x": 190.5, "y": 68.29228717, "z": "75th" },
-    { "x": 191.5, "y": 68.66499835, "z": "75th" },
-    { "x": 192.5, "y": 69.03037911, "z": "75th" },
-    { "x": 193.5, "y": 69.38833214, "z": "75th" },
-    { "x": 194.5, "y": 69.73877506, "z": "75th" },
-    { "x": 195.5, "y": 70.08164061, "z": "75th" },
-    { "x": 196.5, "y": 70.41687682, "z": "75th" },
-    { "x": 197.5, "y": 70.74444713, "z": "75th" },
-    { "x": 198.5, "y": 71.06433046, "z": "75th" },
-    { "x": 199.5, "y": 71.3765212, "z": "75th" },
-    { "x": 200.5, "y": 71.68102918, "z": "75th" },
-    { "x": 201.5, "y": 71.97787966, "z": "75th" },
-    { "x": 202.5, "y": 72.26711325, "z": "75th" },
-    { "x": 203.5, "y": 72.54878582, "z": "75th" },
-    { "x": 204.5, "y": 72.82296841, "z": "75th" },
-    { "x": 205.5, "y": 73.08974718, "z": "75th" },
-    { "x": 206.5, "y": 73.34922324, "z": "75th" },
-    { "x": 207.5, "y": 73.60151968, "z": "75th" },
-    { "x": 208.5, "y": 73.84675041, "z": "75th" },
-    { "x": 209.5, "y": 74.08507097, "z": "75th" },
-    { "x": 210.5, "y": 74.31664141, "z": "75th" },
-    { "x": 211.5, "y": 74.54163604, "z": "75th" },
-    { "x": 212.5, "y": 74.76024322, "z": "75th" },
-    { "x": 213.5, "y": 74.97266503, "z": "75th" },
-    { "x": 214.5, "y": 75.17911684, "z": "75th" },
-    { "x": 215.5, "y": 75.37982657, "z": "75th" },
-    { "x": 216.5, "y": 75.57503388, "z": "75th" },
-    { "x": 217.5, "y": 75.76498909, "z": "75th" },
-    { "x": 218.5, "y": 75.94994171, "z": "75th" },
-    { "x": 219.5, "y": 76.13017744, "z": "75th" },
-    { "x": 220.5, "y": 76.30596623, "z": "75th" },
-    { "x": 221.5, "y": 76.47758936, "z": "75th" },
-    { "x": 222.5, "y": 76.64533092, "z": "75th" },
-    { "x": 223.5, "y": 76.80948323, "z": "75th" },
-    { "x": 224.5, "y": 76.97030781, "z": "75th" },
-    { "x": 225.5, "y": 77.12809294, "z": "75th" },
-    { "x": 226.5, "y": 77.28310484, "z": "75th" },
-    { "x": 227.5, "y": 77.43559533, "z": "75th" },
-    { "x": 228.5, "y": 77.58579719, "z": "75th" },
-    { "x": 229.5, "y": 77.73391919, "z": "75th" },
-    { "x": 230.5, "y": 77.88014066, "z": "75th" },
-    { "x": 231.5, "y": 78.02460556, "z": "75th" },
-    { "x": 232.5, "y": 78.16741625, "z": "75th" },
-    { "x": 233.5, "y": 78.30862691, "z": "75th" },
-    { "x": 234.5, "y": 78.44823694, "z": "75th" },
-    { "x": 235.5, "y": 78.58618425, "z": "75th" },
-    { "x": 236.5, "y": 78.72233893, "z": "75th" },
-    { "x": 237.5, "y": 78.85649725, "z": "75th" },
-    { "x": 238.5, "y": 78.98838596, "z": "75th" },
-    { "x": 239.5, "y": 79.11762417, "z": "75th" },
-    { "x": 240, "y": 79.18111482, "z": "75th" },
-    { "x": 24, "y": 14.58339799, "z": "90th"},
-    { "x": 24.5, "y": 14.6671577, "z": "90th" },
-    { "x": 25.5, "y": 14.83331632, "z": "90th" },
-    { "x": 26.5, "y": 14.99847794, "z": "90th" },
-    { "x": 27.5, "y": 15.16351231, "z": "90th" },
-    { "x": 28.5, "y": 15.32917196, "z": "90th" },
-    { "x": 29.5, "y": 15.49610261, "z": "90th" },
-    { "x": 30.5, "y": 15.66485286, "z": "90th" },
-    { "x": 31.5, "y": 15.83588309, "z": "90th" },
-    { "x": 32.5, "y": 16.00957526, "z": "90th" },
-    { "x": 33.5, "y": 16.18623907, "z": "90th" },
-    { "x": 34.5, "y": 16.36611917, "z": "90th" },
-    { "x": 35.5, "y": 16.54940494, "z": "90th" },
-    { "x": 36.5, "y": 16.73623287, "z": "90th" },
-    { "x": 37.5, "y": 16.92669619, "z": "90th" },
-    { "x": 38.5, "y": 17.12084685, "z": "90th" },
-    { "x": 39.5, "y": 17.31870281, "z": "90th" },
-    { "x": 40.5, "y": 17.52024974, "z": "90th" },
-    { "x": 41.5, "y": 17.72544898, "z": "90th" },
-    { "x": 42.5, "y": 17.93423997, "z": "90th" },
-    { "x": 43.5, "y": 18.14654091, "z": "90th" },
-    { "x": 44.5, "y": 18.36225594, "z": "90th" },
-    { "x": 45.5, "y": 18.58127627, "z": "90th" },
-    { "x": 46.5, "y": 18.80348418, "z": "90th" },
-    { "x": 47.5, "y": 19.02875229, "z": "90th" },
-    { "x": 48.5, "y": 19.25695041, "z": "90th" },
-    { "x": 49.5, "y": 19.48794495, "z": "90th" },
-    { "x": 50.5, "y": 19.72160147, "z": "90th" },
-    { "x": 51.5, "y": 19.95778649, "z": "90th" },
-    { "x": 52.5, "y": 20.19636905, "z": "90th" },
-    { "x": 53.5, "y": 20.43722215, "z": "90th" },
-    { "x": 54.5, "y": 20.68022399, "z": "90th" },
-    { "x": 55.5, "y": 20.92525904, "z": "90th" },
-    { "x": 56.5, "y": 21.17221993, "z": "90th" },
-    { "x": 57.5, "y": 21.42100482, "z": "90th" },
-    { "x": 58.5, "y": 21.67152294, "z": "90th" },
-    { "x": 59.5, "y": 21.92369204, "z": "90th" },
-    { "x": 60.5, "y": 22.17743954, "z": "90th" },
-    { "x": 61.5, "y": 22.43270288, "z": "90th" },
-    { "x": 62.5, "y": 22.6894297, "z": "90th" },
-    { "x": 63.5, "y": 22.94757799, "z": "90th" },
-    { "x": 64.5, "y": 23.20711615, "z": "90th" },
-    { "x": 65.5, "y": 23.46802293, "z": "90th" },
-    { "x": 66.5, "y": 23.73028735, "z": "90th" },
-    { "x": 67.5, "y": 23.99390857, "z": "90th" },
-    { "x": 68.5, "y": 24.25889565, "z": "90th" },
-    { "x": 69.5, "y": 24.52526733, "z": "90th" },
-    { "x": 70.5, "y": 24.79305175, "z": "90th" },
-    { "x": 71.5, "y": 25.06228739, "z": "90th" },
-    { "x": 72.5, "y": 25.33301794, "z": "90th" },
-    { "x": 73.5, "y": 25.60529875, "z": "90th" },
-    { "x": 74.5, "y": 25.87919213, "z": "90th" },
-    { "x": 75.5, "y": 26.15476795, "z": "90th" },
-    { "x": 76.5, "y": 26.43210324, "z": "90th" },
-    { "x": 77.5, "y": 26.71128177, "z": "90th" },
-    { "x": 78.5, "y": 26.99239357, "z": "90th" },
-    { "x": 79.5, "y": 27.27553447, "z": "90th" },
-    { "x": 80.5, "y": 27.56080718, "z": "90th" },
-    { "x": 81.5, "y": 27.84831538, "z": "90th" },
-    { "x": 82.5, "y": 28.13817063, "z": "90th" },
-    { "x": 83.5, "y": 28.43048732, "z": "90th" },
-    { "x": 84.5, "y": 28.72538282, "z": "90th" },
-    { "x": 85.5, "y": 29.02297867, "z": "90th" },
-    { "x": 86.5, "y": 29.32339625, "z": "90th" },
-    { "x": 87.5, "y": 29.62676053, "z": "90th" },
-    { "x": 88.5, "y": 29.93319702, "z": "90th" },
-    { "x": 89.5, "y": 30.24283177, "z": "90th" },
-    { "x": 90.5, "y": 30.55579074, "z": "90th" },
-    { "x": 91.5, "y": 30.87219924, "z": "90th" },
-    { "x": 92.5, "y": 31.19218135, "z": "90th" },
-    { "x": 93.5, "y": 31.51585929, "z": "90th" },
-    { "x": 94.5, "y": 31.8433549, "z": "90th" },
-    { "x": 95.5, "y": 32.17478161, "z": "90th" },
-    { "x": 96.5, "y": 32.51025437, "z": "90th" },
-    { "x": 97.5, "y": 32.84988252, "z": "90th" },
-    { "x": 98.5, "y": 33.19377093, "z": "90th" },
-    { "x": 99.5, "y": 33.54201944, "z": "90th" },
-    { "x": 100.5, "y": 33.8947225, "z": "90th" },
-    { "x": 101.5, "y": 34.25196875, "z": "90th" },
-    { "x": 102.5, "y": 34.61384061, "z": "90th" },
-    { "x": 103.5, "y": 34.98041447, "z": "90th" },
-    { "x": 104.5, "y": 35.35175676, "z": "90th" },
-    { "x": 105.5, "y": 35.72793225, "z": "90th" },
-    { "x": 106.5, "y": 36.10899472, "z": "90th" },
-    { "x": 107.5, "y": 36.49499102, "z": "90th" },
-    { "x": 108.5, "y": 36.8859604, "z": "90th" },
-    { "x": 109.5, "y": 37.28193426, "z": "90th" },
-    { "x": 110.5, "y": 37.68293608, "z": "90th" },
-    { "x": 111.5, "y": 38.08898133, "z": "90th" },
-    { "x": 112.5, "y": 38.50007744, "z": "90th" },
-    { "x": 113.5, "y": 38.9162238, "z": "90th" },
-    { "x": 114.5, "y": 39.33741401, "z": "90th" },
-    { "x": 115.5, "y": 39.76362815, "z": "90th" },
-    { "x": 116.5, "y": 40.19484291, "z": "90th" },
-    { "x": 117.5, "y": 40.63102576, "z": "90th" },
-    { "x": 118.5, "y": 41.07213642, "z": "90th" },
-    { "x": 119.5, "y": 41.51812687, "z": "90th" },
-    { "x": 120.5, "y": 41.96894158, "z": "90th" },
-    { "x": 121.5, "y": 42.42451755, "z": "90th" },
-    { "x": 122.5, "y": 42.88478457, "z": "90th" },
-    { "x": 123.5, "y": 43.34966531, "z": "90th" },
-    { "x": 124.5, "y": 43.81907554, "z": "90th" },
-    { "x": 125.5, "y": 44.29292431, "z": "90th" },
-    { "x": 126.5, "y": 44.77111415, "z": "90th" },
-    { "x": 127.5, "y": 45.2535413, "z": "90th" },
-    { "x": 128.5, "y": 45.74009589, "z": "90th" },
-    { "x": 129.5, "y": 46.23066219, "z": "90th" },
-    { "x": 130.5, "y": 46.72511793, "z": "90th" },
-    { "x": 131.5, "y": 47.22334049, "z": "90th" },
-    { "x": 132.5, "y": 47.72519072, "z": "90th" },
-    { "x": 133.5, "y": 48.23053714, "z": "90th" },
-    { "x": 134.5, "y": 48.73923662, "z": "90th" },
-    { "x": 135.5, "y": 49.25114312, "z": "90th" },
-    { "x": 136.5, "y": 49.76610635, "z": "90th" },
-    { "x": 137.5, "y": 50.28397203, "z": "90th" },
-    { "x": 138.5, "y": 50.80458216, "z": "90th" },
-    { "x": 139.5, "y": 51.32777521, "z": "90th" },
-    { "x": 140.5, "y": 51.85338637, "z": "90th" },
-    { "x": 141.5, "y": 52.38124777, "z": "90th" },
-    { "x": 142.5, "y": 52.91118868, "z": "90th" },
-    { "x": 143.5, "y": 53.44303574, "z": "90th" },
-    { "x": 144.5, "y": 53.97661318, "z": "90th" },
-    { "x": 145.5, "y": 54.51174297, "z": "90th" },
-    { "x": 146.5, "y": 55.04824506, "z": "90th" },
-    { "x": 147.5, "y": 55.58593751, "z": "90th" },
-    { "x": 148.5, "y": 56.1246367, "z": "90th" },
-    { "x": 149.5, "y": 56.66415748, "z": "90th" },
-    { "x": 150.5, "y": 57.20431332, "z": "90th" },
-    { "x": 151.5, "y": 57.74491716, "z": "90th" },
-    { "x": 152.5, "y": 58.2857783, "z": "90th" },
-    { "x": 153.5, "y": 58.82670813, "z": "90th" },
-    { "x": 154.5, "y": 59.36751587, "z": "90th" },
-    { "x": 155.5, "y": 59.90801, "z": "90th" },
-    { "x": 156.5, "y": 60.44799828, "z": "90th" },
-    { "x": 157.5, "y": 60.98728788, "z": "90th" },
-    { "x": 158.5, "y": 61.52568545, "z": "90th" },
-    { "x": 159.5, "y": 62.06299719, "z": "90th" },
-    { "x": 160.5, "y": 62.59902894, "z": "90th" },
-    { "x": 161.5, "y": 63.13358794, "z": "90th" },
-    { "x": 162.5, "y": 63.66647721, "z": "90th" },
-    { "x": 163.5, "y": 64.19750276, "z": "90th" },
-    { "x": 164.5, "y": 64.72646954, "z": "90th" },
-    { "x": 165.5, "y": 65.25318239, "z": "90th" },
-    { "x": 166.5, "y": 65.77744608, "z": "90th" },
-    { "x": 167.5, "y": 66.29906539, "z": "90th" },
-    { "x": 168.5, "y": 66.81784516, "z": "90th" },
-    { "x": 169.5, "y": 67.33359031, "z": "90th" },
-    { "x": 170.5, "y": 67.846106, "z": "90th" },
-    { "x": 171.5, "y": 68.35519765, "z": "90th" },
-    { "x": 172.5, "y": 68.86067105, "z": "90th" },
-    { "x": 173.5, "y": 69.36233252, "z": "90th" },
-    { "x": 174.5, "y": 69.85998897, "z": "90th" },
-    { "x": 175.5, "y": 70.35344811, "z": "90th" },
-    { "x": 176.5, "y": 70.8425186, "z": "90th" },
-    { "x": 177.5, "y": 71.32701026, "z": "90th" },
-    { "x": 178.5, "y": 71.80673678, "z": "90th" },
-    { "x": 179.5, "y": 72.2815034, "z": "90th" },
-    { "x": 180.5, "y": 72.75113236, "z": "90th" },
-    { "x": 181.5, "y": 73.21543801, "z": "90th" },
-    { "x": 182.5, "y": 73.6742397, "z": "90th" },
-    { "x": 183.5, "y": 74.12735965, "z": "90th" },
-    { "x": 184.5, "y": 74.57462329, "z": "90th" },
-    { "x": 185.5, "y": 75.01585966, "z": "90th" },
-    { "x": 186.5, "y": 75.45090384, "z": "90th" },
-    { "x": 187.5, "y": 75.87958721, "z": "90th" },
-    { "x": 188.5, "y": 76.30175821, "z": "90th" },
-    { "x": 189.5, "y": 76.71726244, "z": "90th" },
-    { "x": 190.5, "y": 77.12594864, "z": "90th" },
-    { "x": 191.5, "y": 77.5276843, "z": "90th" },
-    { "x": 192.5, "y": 77.92233231, "z": "90th" },
-    { "x": 193.5, "y": 78.30976593, "z": "90th" },
-    { "x": 194.5, "y": 78.68986591, "z": "90th" },
-    { "x": 195.5, "y": 79.0625209, "z": "90th" },
-    { "x": 196.5, "y": 79.42762779, "z": "90th" },
-    { "x": 197.5, "y": 79.78509216, "z": "90th" },
-    { "x": 198.5, "y": 80.13482859, "z": "90th" },
-    { "x": 199.5, "y": 80.47676112, "z": "90th" },
-    { "x": 200.5, "y": 80.81082354, "z": "90th" },
-    { "x": 201.5, "y": 81.1369598, "z": "90th" },
-    { "x": 202.5, "y": 81.45512442, "z": "90th" },
-    { "x": 203.5, "y": 81.76528289, "z": "90th" },
-    { "x": 204.5, "y": 82.06741212, "z": "90th" },
-    { "x": 205.5, "y": 82.3615009, "z": "90th" },
-    { "x": 206.5, "y": 82.64755047, "z": "90th" },
-    { "x": 207.5, "y": 82.92557908, "z": "90th" },
-    { "x": 208.5, "y": 83.19560496, "z": "90th" },
-    { "x": 209.5, "y": 83.45767612, "z": "90th" },
-    { "x": 210.5, "y": 83.71184998, "z": "90th" },
-    { "x": 211.5, "y": 83.95819995, "z": "90th" },
-    { "x": 212.5, "y": 84.19681638, "z": "90th" },
-    { "x": 213.5, "y": 84.42780754, "z": "90th" },
-    { "x": 214.5, "y": 84.6513007, "z": "90th" },
-    { "x": 215.5, "y": 84.86744322, "z": "90th" },
-    { "x": 216.5, "y": 85.07640364, "z": "90th" },
-    { "x": 217.5, "y": 85.27837286, "z": "90th" },
-    { "x": 218.5, "y": 85.47355853, "z": "90th" },
-    { "x": 219.5, "y": 85.66221241, "z": "90th" },
-    { "x": 220.5, "y": 85.84459728, "z": "90th" },
-    { "x": 221.5, "y": 86.02100855, "z": "90th" },
-    { "x": 222.5, "y": 86.1917714, "z": "90th" },
-    { "x": 223.5, "y": 86.35724712, "z": "90th" },
-    { "x": 224.5, "y": 86.51781277, "z": "90th" },
-    { "x": 225.5, "y": 86.6739, "z": "90th" },
-    { "x": 226.5, "y": 86.82596904, "z": "90th" },
-    { "x": 227.5, "y": 86.97451776, "z": "90th" },
-    { "x": 228.5, "y": 87.12008338, "z": "90th" },
-    { "x": 229.5, "y": 87.26324432, "z": "90th" },
-    { "x": 230.5, "y": 87.40462203, "z": "90th" },
-    { "x": 231.5, "y": 87.54488282, "z": "90th" },
-    { "x": 232.5, "y": 87.6847398, "z": "90th" },
-    { "x": 233.5, "y": 87.82495478, "z": "90th" },
-    { "x": 234.5, "y": 87.96634036, "z": "90th" },
-    { "x": 235.5, "y": 88.10976202, "z": "90th" },
-    { "x": 236.5, "y": 88.25614046, "z": "90th" },
-    { "x": 237.5, "y": 88.40645399, "z": "90th" },
-    { "x": 238.5, "y": 88.56174643, "z": "90th" },
-    { "x": 239.5, "y": 88.72311137, "z": "90th" },
-    { "x": 240, "y": 88.80643527, "z": "90th" },
-    { "x": 24, "y": 15.18777349, "z": "95th" },
-    { "x": 24.5, "y": 15.27629562, "z": "95th" },
-    { "x": 25.5, "y": 15.45242405, "z": "95th" },
-    { "x": 26.5, "y": 15.62818936, "z": "95th" },
-    { "x": 27.5, "y": 15.80450043, "z": "95th" },
-    { "x": 28.5, "y": 15.98213866, "z": "95th" },
-    { "x": 29.5, "y": 16.16176896, "z": "95th" },
-    { "x": 30.5, "y": 16.34395025, "z": "95th" },
-    { "x": 31.5, "y": 16.52914562, "z": "95th" },
-    { "x": 32.5, "y": 16.71773017, "z": "95th" },
-    { "x": 33.5, "y": 16.91000204, "z": "95th" },
-    { "x": 34.5, "y": 17.10619066, "z": "95th" },
-    { "x": 35.5, "y": 17.30646132, "z": "95th" },
-    { "x": 36.5, "y": 17.51092666, "z": "95th" },
-    { "x": 37.5, "y": 17.7196494, "z": "95th" },
-    { "x": 38.5, "y": 17.93265202, "z": "95th" },
-    { "x": 39.5, "y": 18.14992024, "z": "95th" },
-    { "x": 40.5, "y": 18.37141087, "z": "95th" },
-    { "x": 41.5, "y": 18.59705318, "z": "95th" },
-    { "x": 42.5, "y": 18.8267549, "z": "95th" },
-    { "x": 43.5, "y": 19.06040859, "z": "95th" },
-    { "x": 44.5, "y": 19.29789203, "z": "95th" },
-    { "x": 45.5, "y": 19.53907323, "z": "95th" },
-    { "x": 46.5, "y": 19.78381251, "z": "95th" },
-    { "x": 47.5, "y": 20.03196776, "z": "95th" },
-    { "x": 48.5, "y": 20.28339348, "z": "95th" },
-    { "x": 49.5, "y": 20.53794512, "z": "95th" },
-    { "x": 50.5, "y": 20.79548054, "z": "95th" },
-    { "x": 51.5, "y": 21.05586181, "z": "95th" },
-    { "x": 52.5, "y": 21.31895671, "z": "95th" },
-    { "x": 53.5, "y": 21.58464011, "z": "95th" },
-    { "x": 54.5, "y": 21.85279508, "z": "95th" },
-    { "x": 55.5, "y": 22.12331387, "z": "95th" },
-    { "x": 56.5, "y": 22.3960982, "z": "95th" },
-    { "x": 57.5, "y": 22.67106204, "z": "95th" },
-    { "x": 58.5, "y": 22.94812899, "z": "95th" },
-    { "x": 59.5, "y": 23.22723469, "z": "95th" },
-    { "x": 60.5, "y": 23.50832656, "z": "95th" },
-    { "x": 61.5, "y": 23.79136391, "z": "95th" },
-    { "x": 62.5, "y": 24.07631802, "z": "95th" },
-    { "x": 63.5, "y": 24.36317198, "z": "95th" },
-    { "x": 64.5, "y": 24.65192058, "z": "95th" },
-    { "x": 65.5, "y": 24.94257, "z": "95th" },
-    { "x": 66.5, "y": 25.23513755, "z": "95th" },
-    { "x": 67.5, "y": 25.52965118, "z": "95th" },
-    { "x": 68.5, "y": 25.82614911, "z": "95th" },
-    { "x": 69.5, "y": 26.12467926, "z": "95th" },
-    { "x": 70.5, "y": 26.42529873, "z": "95th" },
-    { "x": 71.5, "y": 26.72807261, "z": "95th" },
-    { "x": 72.5, "y": 27.03307565, "z": "95th" },
-    { "x": 73.5, "y": 27.34038832, "z": "95th" },
-    { "x": 74.5, "y": 27.6500983, "z": "95th" },
-    { "x": 75.5, "y": 27.96229925, "z": "95th" },
-    { "x": 76.5, "y": 28.27709021, "z": "95th" },
-    { "x": 77.5, "y": 28.59457486, "z": "95th" },
-    { "x": 78.5, "y": 28.91486092, "z": "95th" },
-    { "x": 79.5, "y": 29.23805946, "z": "95th" },
-    { "x": 80.5, "y": 29.56428369, "z": "95th" },
-    { "x": 81.5, "y": 29.89365038, "z": "95th" },
-    { "x": 82.5, "y": 30.2262764, "z": "95th" },
-    { "x": 83.5, "y": 30.56227989, "z": "95th" },
-    { "x": 84.5, "y": 30.90177938, "z": "95th" },
-    { "x": 85.5, "y": 31.24489263, "z": "95th" },
-    { "x": 86.5, "y": 31.59173734, "z": "95th" },
-    { "x": 87.5, "y": 31.94242919, "z": "95th" },
-    { "x": 88.5, "y": 32.29708214, "z": "95th" },
-    { "x": 89.5, "y": 32.65580771, "z": "95th" },
-    { "x": 90.5, "y": 33.01871449, "z": "95th" },
-    { "x": 91.5, "y": 33.38590769, "z": "95th" },
-    { "x": 92.5, "y": 33.75748861, "z": "95th" },
-    { "x": 93.5, "y": 34.13355425, "z": "95th" },
-    { "x": 94.5, "y": 34.51419632, "z": "95th" },
-    { "x": 95.5, "y": 34.89950266, "z": "95th" },
-    { "x": 96.5, "y": 35.28955426, "z": "95th" },
-    { "x": 97.5, "y": 35.68442647, "z": "95th" },
-    { "x": 98.5, "y": 36.08418823, "z": "95th" },
-    { "x": 99.5, "y": 36.48890176, "z": "95th" },
-    { "x": 100.5, "y": 36.89862215, "z": "95th" },
-    { "x": 101.5, "y": 37.31339712, "z": "95th" },
-    { "x": 102.5, "y": 37.73326669, "z": "95th" },
-    { "x": 103.5, "y": 38.15826287, "z": "95th" },
-    { "x": 104.5, "y": 38.5884101, "z": "95th" },
-    { "x": 105.5, "y": 39.02372343, "z": "95th" },
-    { "x": 106.5, "y": 39.46421007, "z": "95th" },
-    { "x": 107.5, "y": 39.90986854, "z": "95th" },
-    { "x": 108.5, "y": 40.36068858, "z": "95th" },
-    { "x": 109.5, "y": 40.81665117, "z": "95th" },
-    { "x": 110.5, "y": 41.27772848, "z": "95th" },
-    { "x": 111.5, "y": 41.74388392, "z": "95th" },
-    { "x": 112.5, "y": 42.21507216, "z": "95th" },
-    { "x": 113.5, "y": 42.69123922, "z": "95th" },
-    { "x": 114.5, "y": 43.17232241, "z": "95th" },
-    { "x": 115.5, "y": 43.65825106, "z": "95th" },
-    { "x": 116.5, "y": 44.14894598, "z": "95th" },
-    { "x": 117.5, "y": 44.64432008, "z": "95th" },
-    { "x": 118.5, "y": 45.1442785, "z": "95th" },
-    { "x": 119.5, "y": 45.64871885, "z": "95th" },
-    { "x": 120.5, "y": 46.15753154, "z": "95th" },
-    { "x": 121.5, "y": 46.67060006, "z": "95th" },
-    { "x": 122.5, "y": 47.18780128, "z": "95th" },
-    { "x": 123.5, "y": 47.70900582, "z": "95th" },
-    { "x": 124.5, "y": 48.23407839, "z": "95th" },
-    { "x": 125.5, "y": 48.76287816, "z": "95th" },
-    { "x": 126.5, "y": 49.29525914, "z": "95th" },
-    { "x": 127.5, "y": 49.83107058, "z": "95th" },
-    { "x": 128.5, "y": 50.37015732, "z": "95th" },
-    { "x": 129.5, "y": 50.91236024, "z": "95th" },
-    { "x": 130.5, "y": 51.45751679, "z": "95th" },
-    { "x": 131.5, "y": 52.00546039, "z": "95th" },
-    { "x": 132.5, "y": 52.55602363, "z": "95th" },
-    { "x": 133.5, "y": 53.10903452, "z": "95th" },
-    { "x": 134.5, "y": 53.66432034, "z": "95th" },
-    { "x": 135.5, "y": 54.22170647, "z": "95th" },
-    { "x": 136.5, "y": 54.7810171, "z": "95th" },
-    { "x": 137.5, "y": 55.34207557, "z": "95th" },
-    { "x": 138.5, "y": 55.90470472, "z": "95th" },
-    { "x": 139.5, "y": 56.46872726, "z": "95th" },
-    { "x": 140.5, "y": 57.03396609, "z": "95th" },
-    { "x": 141.5, "y": 57.6002446, "z": "95th" },
-    { "x": 142.5, "y": 58.167387, "z": "95th" },
-    { "x": 143.5, "y": 58.73521857, "z": "95th" },
-    { "x": 144.5, "y": 59.30356596, "z": "95th" },
-    { "x": 145.5, "y": 59.87225739, "z": "95th" },
-    { "x": 146.5, "y": 60.44112289, "z": "95th" },
-    { "x": 147.5, "y": 61.00999451, "z": "95th" },
-    { "x": 148.5, "y": 61.5787065, "z": "95th" },
-    { "x": 149.5, "y": 62.14709543, "z": "95th" },
-    { "x": 150.5, "y": 62.71500036, "z": "95th" },
-    { "x": 151.5, "y": 63.28226272, "z": "95th" },
-    { "x": 152.5, "y": 63.84872734, "z": "95th" },
-    { "x": 153.5, "y": 64.41424088, "z": "95th" },
-    { "x": 154.5, "y": 64.97865313, "z": "95th" },
-    { "x": 155.5, "y": 65.54181664, "z": "95th" },
-    { "x": 156.5, "y": 66.1035867, "z": "95th" },
-    { "x": 157.5, "y": 66.66382131, "z": "95th" },
-    { "x": 158.5, "y": 67.22238111, "z": "95th" },
-    { "x": 159.5, "y": 67.77912926, "z": "95th" },
-    { "x": 160.5, "y": 68.33393136, "z": "95th" },
-    { "x": 161.5, "y": 68.88665453, "z": "95th" },
-    { "x": 162.5, "y": 69.43716965, "z": "95th" },
-    { "x": 163.5, "y": 69.98534819, "z": "95th" },
-    { "x": 164.5, "y": 70.53106367, "z": "95th" },
-    { "x": 165.5, "y": 71.07419108, "z": "95th" },
-    { "x": 166.5, "y": 71.6146066, "z": "95th" },
-    { "x": 167.5, "y": 72.15218736, "z": "95th" },
-    { "x": 168.5, "y": 72.68681109, "z": "95th" },
-    { "x": 169.5, "y": 73.21835588, "z": "95th" },
-    { "x": 170.5, "y": 73.7466998, "z": "95th" },
-    { "x": 171.5, "y": 74.27172061, "z": "95th" },
-    { "x": 172.5, "y": 74.79329538, "z": "95th" },
-    { "x": 173.5, "y": 75.31130018, "z": "95th" },
-    { "x": 174.5, "y": 75.82560968, "z": "95th" },
-    { "x": 175.5, "y": 76.33609688, "z": "95th" },
-    { "x": 176.5, "y": 76.84263269, "z": "95th" },
-    { "x": 177.5, "y": 77.34508562, "z": "95th" },
-    { "x": 178.5, "y": 77.84332029, "z": "95th" },
-    { "x": 179.5, "y": 78.33720309, "z": "95th" },
-    { "x": 180.5, "y": 78.82658994, "z": "95th" },
-    { "x": 181.5, "y": 79.31133801, "z": "95th" },
-    { "x": 182.5, "y": 79.79129954, "z": "95th" },
-    { "x": 183.5, "y": 80.26632286, "z": "95th" },
-    { "x": 184.5, "y": 80.73625224, "z": "95th" },
-    { "x": 185.5, "y": 81.20092786, "z": "95th" },
-    { "x": 186.5, "y": 81.66018503, "z": "95th" },
-    { "x": 187.5, "y": 82.11385795, "z": "95th" },
-    { "x": 188.5, "y": 82.56177239, "z": "95th" },
-    { "x": 189.5, "y": 83.00375329, "z": "95th" },
-    { "x": 190.5, "y": 83.43962339, "z": "95th" },
-    { "x": 191.5, "y": 83.8691966, "z": "95th" },
-    { "x": 192.5, "y": 84.29228904, "z": "95th" },
-    { "x": 193.5, "y": 84.70871297, "z": "95th" },
-    { "x": 194.5, "y": 85.1182789, "z": "95th" },
-    { "x": 195.5, "y": 85.52079616, "z": "95th" },
-    { "x": 196.5, "y": 85.91607365, "z": "95th" },
-    { "x": 197.5, "y": 86.30392061, "z": "95th" },
-    { "x": 198.5, "y": 86.68414749, "z": "95th" },
-    { "x": 199.5, "y": 87.0565669, "z": "95th" },
-    { "x": 200.5, "y": 87.42099463, "z": "95th" },
-    { "x": 201.5, "y": 87.77725073, "z": "95th" },
-    { "x": 202.5, "y": 88.12516072, "z": "95th" },
-    { "x": 203.5, "y": 88.46455683, "z": "95th" },
-    { "x": 204.5, "y": 88.79527942, "z": "95th" },
-    { "x": 205.5, "y": 89.11717836, "z": "95th" },
-    { "x": 206.5, "y": 89.43011463, "z": "95th" },
-    { "x": 207.5, "y": 89.73396054, "z": "95th" },
-    { "x": 208.5, "y": 90.02860798, "z": "95th" },
-    { "x": 209.5, "y": 90.31395969, "z": "95th" },
-    { "x": 210.5, "y": 90.58993909, "z": "95th" },
-    { "x": 211.5, "y": 90.85649043, "z": "95th" },
-    { "x": 212.5, "y": 91.11358115, "z": "95th" },
-    { "x": 213.5, "y": 91.36120451, "z": "95th" },
-    { "x": 214.5, "y": 91.59938232, "z": "95th" },
-    { "x": 215.5, "y": 91.82816795, "z": "95th" },
-    { "x": 216.5, "y": 92.04764958, "z": "95th" },
-    { "x": 217.5, "y": 92.25795363, "z": "95th" },
-    { "x": 218.5, "y": 92.4592488, "z": "95th" },
-    { "x": 219.5, "y": 92.65174946, "z": "95th" },
-    { "x": 220.5, "y": 92.83571985, "z": "95th" },
-    { "x": 221.5, "y": 93.0114792, "z": "95th" },
-    { "x": 222.5, "y": 93.17940638, "z": "95th" },
-    { "x": 223.5, "y": 93.33994398, "z": "95th" },
-    { "x": 224.5, "y": 93.49360895, "z": "95th" },
-    { "x": 225.5, "y": 93.64099003, "z": "95th" },
-    { "x": 226.5, "y": 93.7827601, "z": "95th" },
-    { "x": 227.5, "y": 93.91968135, "z": "95th" },
-    { "x": 228.5, "y": 94.05261232, "z": "95th" },
-    { "x": 229.5, "y": 94.18251529, "z": "95th" },
-    { "x": 230.5, "y": 94.31046411, "z": "95th" },
-    { "x": 231.5, "y": 94.43765234, "z": "95th" },
-    { "x": 232.5, "y": 94.56540179, "z": "95th" },
-    { "x": 233.5, "y": 94.69517136, "z": "95th" },
-    { "x": 234.5, "y": 94.82856611, "z": "95th" },
-    { "x": 235.5, "y": 94.96734651, "z": "95th" },
-    { "x": 236.5, "y": 95.11343784, "z": "95th" },
-    { "x": 237.5, "y": 95.26893942, "z": "95th" },
-    { "x": 238.5, "y": 95.43613181, "z": "95th" },
-    { "x": 239.5, "y": 95.61749303, "z": "95th" },
-    { "x": 240, "y": 95.71431427, "z": "95th" },
-    { "x": 24, "y": 15.59648294, "z": "97th" },
-    { "x": 24.5, "y": 15.68840631, "z": "97th" },
-    { "x": 25.5, "y": 15.87169941, "z": "97th" },
-    { "x": 26.5, "y": 15.87169941, "z": "97th" },
-    { "x": 27.5, "y": 16.05514188, "z": "97th" },
-    { "x": 28.5, "y": 16.42608957, "z": "97th"},
-    { "x": 29.5, "y": 16.61507584, "z": "97th" },
-    { "x": 30.5, "y": 16.80719583, "z": "97th" },
-    { "x": 31.5, "y": 17.00291386, "z": "97th" },
-    { "x": 32.5, "y": 17.2025984, "z": "97th" },
-    { "x": 33.5, "y": 17.40653734, "z": "97th" },
-    { "x": 34.5, "y": 17.61494698, "z": "97th" },
-    { "x": 35.5, "y": 17.8279717, "z": "97th" },
-    { "x": 36.5, "y": 18.04570363, "z": "97th" },
-    { "x": 37.5, "y": 18.26817893, "z": "97th" },
-    { "x": 38.5, "y": 18.49539445, "z": "97th" },
-    { "x": 39.5, "y": 18.72730763, "z": "97th" },
-    { "x": 40.5, "y": 18.96385009, "z": "97th" },
-    { "x": 41.5, "y": 19.20492292, "z": "97th" },
-    { "x": 42.5, "y": 19.45040584, "z": "97th" },
-    { "x": 43.5, "y": 19.70016918, "z": "97th" },
-    { "x": 44.5, "y": 19.95406774, "z": "97th" },
-    { "x": 45.5, "y": 20.21194963, "z": "97th" },
-    { "x": 46.5, "y": 20.47365655, "z": "97th" },
-    { "x": 47.5, "y": 20.73903469, "z": "97th" },
-    { "x": 48.5, "y": 21.00792648, "z": "97th" },
-    { "x": 49.5, "y": 21.28017953, "z": "97th" },
-    { "x": 50.5, "y": 21.55564717, "z": "97th" },
-    { "x": 51.5, "y": 21.83419011, "z": "97th" },
-    { "x": 52.5, "y": 22.11567799, "z": "97th" },
-    { "x": 53.5, "y": 22.39999059, "z": "97th" },
-    { "x": 54.5, "y": 22.68701888, "z": "97th" },
-    { "x": 55.5, "y": 22.97666583, "z": "97th" },
-    { "x": 56.5, "y": 23.26884512, "z": "97th" },
-    { "x": 57.5, "y": 23.56348925, "z": "97th" },
-    { "x": 58.5, "y": 23.86053886, "z": "97th" },
-    { "x": 59.5, "y": 24.15995003, "z": "97th" },
-    { "x": 60.5, "y": 24.46169255, "z": "97th" },
-    { "x": 61.5, "y": 24.76574995, "z": "97th" },
-    { "x": 62.5, "y": 25.07211926, "z": "97th" },
-    { "x": 63.5, "y": 25.38081076, "z": "97th" },
-    { "x": 64.5, "y": 25.69184758, "z": "97th" },
-    { "x": 65.5, "y": 26.00526525, "z": "97th" },
-    { "x": 66.5, "y": 26.32111112, "z": "97th" },
-    { "x": 67.5, "y": 26.63944376, "z": "97th" },
-    { "x": 68.5, "y": 26.96033222, "z": "97th" },
-    { "x": 69.5, "y": 27.28385531, "z": "97th" },
-    { "x": 70.5, "y": 27.6101008, "z": "97th" },
-    { "x": 71.5, "y": 27.93916194, "z": "97th" },
-    { "x": 72.5, "y": 28.27114631, "z": "97th" },
-    { "x": 73.5, "y": 28.60616106, "z": "97th" },
-    { "x": 74.5, "y": 28.94432077, "z": "97th" },
-    { "x": 75.5, "y": 29.2857444, "z": "97th" },
-    { "x": 76.5, "y": 29.63055429, "z": "97th" },
-    { "x": 77.5, "y": 29.97887524, "z": "97th" },
-    { "x": 78.5, "y": 30.33083356, "z": "97th" },
-    { "x": 79.5, "y": 30.68655618, "z": "97th" },
-    { "x": 80.5, "y": 31.04616685, "z": "97th" },
-    { "x": 81.5, "y": 31.40979543, "z": "97th" },
-    { "x": 82.5, "y": 31.77756321, "z": "97th" },
-    { "x": 83.5, "y": 32.14959054, "z": "97th" },
-    { "x": 84.5, "y": 32.52599493, "z": "97th" },
-    { "x": 85.5, "y": 32.90688716, "z": "97th" },
-    { "x": 86.5, "y": 33.29237745, "z": "97th" },
-    { "x": 87.5, "y": 33.68256717, "z": "97th" },
-    { "x": 88.5, "y": 34.07755271, "z": "97th" },
-    { "x": 89.5, "y": 34.47742403, "z": "97th" },
-    { "x": 90.5, "y": 34.88226421, "z": "97th" },
-    { "x": 91.5, "y": 35.2921491, "z": "97th" },
-    { "x": 92.5, "y": 35.707147, "z": "97th" },
-    { "x": 93.5, "y": 36.12731836, "z": "97th" },
-    { "x": 94.5, "y": 36.55271218, "z": "97th" },
-    { "x": 95.5, "y": 36.98337837, "z": "97th" },
-    { "x": 96.5, "y": 37.41934991, "z": "97th" },
-    { "x": 97.5, "y": 37.86065382, "z": "97th" },
-    { "x": 98.5, "y": 38.30730842, "z": "97th" },
-    { "x": 99.5, "y": 38.75932329, "z": "97th" },
-    { "x": 100.5, "y": 39.21669915, "z": "97th" },
-    { "x": 101.5, "y": 39.67942783, "z": "97th" },
-    { "x": 102.5, "y": 40.14749235, "z": "97th" },
-    { "x": 103.5, "y": 40.62086606, "z": "97th" },
-    { "x": 104.5, "y": 41.09951874, "z": "97th" },
-    { "x": 105.5, "y": 41.58340237, "z": "97th" },
-    { "x": 106.5, "y": 42.07246636, "z": "97th" },
-    { "x": 107.5, "y": 42.56665066, "z": "97th" },
-    { "x": 108.5, "y": 43.06588662, "z": "97th" },
-    { "x": 109.5, "y": 43.57009739, "z": "97th" },
-    { "x": 110.5, "y": 44.07919809, "z": "97th" },
-    { "x": 111.5, "y": 44.59309597, "z": "97th" },
-    { "x": 112.5, "y": 45.11169064, "z": "97th" },
-    { "x": 113.5, "y": 45.63487433, "z": "97th" },
-    { "x": 114.5, "y": 46.16252884, "z": "97th" },
-    { "x": 115.5, "y": 46.69453697, "z": "97th" },
-    { "x": 116.5, "y": 47.23076853, "z": "97th" },
-    { "x": 117.5, "y": 47.77108893, "z": "97th" },
-    { "x": 118.5, "y": 48.31535768, "z": "97th" },
-    { "x": 119.5, "y": 48.86342877, "z": "97th" },
-    { "x": 120.5, "y": 49.41515104, "z": "97th" },
-    { "x": 121.5, "y": 49.97036852, "z": "97th" },
-    { "x": 122.5, "y": 50.52892088, "z": "97th" },
-    { "x": 123.5, "y": 51.09064381, "z": "97th" },
-    { "x": 124.5, "y": 51.65536941, "z": "97th" },
-    { "x": 125.5, "y": 52.22292668, "z": "97th" },
-    { "x": 126.5, "y": 52.79314187, "z": "97th" },
-    { "x": 127.5, "y": 53.36583897, "z": "97th" },
-    { "x": 128.5, "y": 53.94084012, "z": "97th" },
-    { "x": 129.5, "y": 54.51796605, "z": "97th" },
-    { "x": 130.5, "y": 55.09703793, "z": "97th" },
-    { "x": 131.5, "y": 55.67786843, "z": "97th" },
-    { "x": 132.5, "y": 56.26028801, "z": "97th" },
-    { "x": 133.5, "y": 56.84410756, "z": "97th" },
-    { "x": 134.5, "y": 57.42914961, "z": "97th" },
-    { "x": 135.5, "y": 58.01523548, "z": "97th" },
-    { "x": 136.5, "y": 58.60218796, "z": "97th" },
-    { "x": 137.5, "y": 59.18983178, "z": "97th" },
-    { "x": 138.5, "y": 59.77799389, "z": "97th" },
-    { "x": 139.5, "y": 60.36650388, "z": "97th" },
-    { "x": 140.5, "y": 60.95519425, "z": "97th" },
-    { "x": 141.5, "y": 61.54390076, "z": "97th" },
-    { "x": 142.5, "y": 62.13246268, "z": "97th" },
-    { "x": 143.5, "y": 62.72072311, "z": "97th" },
-    { "x": 144.5, "y": 63.30852916, "z": "97th" },
-    { "x": 145.5, "y": 63.89573222, "z": "97th" },
-    { "x": 146.5, "y": 64.48218816, "z": "97th" },
-    { "x": 147.5, "y": 65.06775743, "z": "97th" },
-    { "x": 148.5, "y": 65.65230527, "z": "97th" },
-    { "x": 149.5, "y": 66.23570179, "z": "97th" },
-    { "x": 150.5, "y": 66.81782206, "z": "97th" },
-    { "x": 151.5, "y": 67.39854494, "z": "97th" },
-    { "x": 152.5, "y": 67.97775861, "z": "97th" },
-    { "x": 153.5, "y": 68.5553511, "z": "97th" },
-    { "x": 154.5, "y": 69.13121752, "z": "97th" },
-    { "x": 155.5, "y": 69.70525793, "z": "97th" },
-    { "x": 156.5, "y": 70.27737718, "z": "97th" },
-    { "x": 157.5, "y": 70.8474848, "z": "97th" },
-    { "x": 158.5, "y": 71.41549477, "z": "97th" },
-    { "x": 159.5, "y": 71.98132532, "z": "97th" },
-    { "x": 160.5, "y": 72.54489869, "z": "97th" },
-    { "x": 161.5, "y": 73.10613746, "z": "97th" },
-    { "x": 162.5, "y": 73.66497514, "z": "97th" },
-    { "x": 163.5, "y": 74.22134215, "z": "97th" },
-    { "x": 164.5, "y": 74.77517319, "z": "97th" },
-    { "x": 165.5, "y": 75.32640513, "z": "97th" },
-    { "x": 166.5, "y": 75.87497649, "z": "97th" },
-    { "x": 167.5, "y": 76.42082697, "z": "97th" },
-    { "x": 168.5, "y": 76.96389688, "z": "97th" },
-    { "x": 169.5, "y": 77.50412655, "z": "97th" },
-    { "x": 170.5, "y": 78.04145573, "z": "97th" },
-    { "x": 171.5, "y": 78.57582294, "z": "97th" },
-    { "x": 172.5, "y": 79.10716478, "z": "97th" },
-    { "x": 173.5, "y": 79.63541524, "z": "97th" },
-    { "x": 174.5, "y": 80.16050495, "z": "97th" },
-    { "x": 175.5, "y": 80.68236046, "z": "97th" },
-    { "x": 176.5, "y": 81.20090348, "z": "97th" },
-    { "x": 177.5, "y": 81.71605007, "z": "97th" },
-    { "x": 178.5, "y": 82.22770492, "z": "97th" },
-    { "x": 179.5, "y": 82.73578555, "z": "97th" },
-    { "x": 180.5, "y": 83.24017154, "z": "97th" },
-    { "x": 181.5, "y": 83.74075385, "z": "97th" },
-    { "x": 182.5, "y": 84.23740907, "z": "97th" },
-    { "x": 183.5, "y": 84.73000377, "z": "97th" },
-    { "x": 184.5, "y": 85.21839391, "z": "97th" },
-    { "x": 185.5, "y": 85.70242429, "z": "97th" },
-    { "x": 186.5, "y": 86.18192445, "z": "97th" },
-    { "x": 187.5, "y": 86.65672655, "z": "97th" },
-    { "x": 188.5, "y": 87.12662858, "z": "97th" },
-    { "x": 189.5, "y": 87.59143077, "z": "97th" },
-    { "x": 190.5, "y": 88.05092631, "z": "97th" },
-    { "x": 191.5, "y": 88.50487158, "z": "97th" },
-    { "x": 192.5, "y": 88.95303286, "z": "97th" },
-    { "x": 193.5, "y": 89.39515827, "z": "97th" },
-    { "x": 194.5, "y": 89.83098491, "z": "97th" },
-    { "x": 195.5, "y": 90.26023965, "z": "97th" },
-    { "x": 196.5, "y": 90.68264001, "z": "97th" },
-    { "x": 197.5, "y": 91.09789536, "z": "97th" },
-    { "x": 198.5, "y": 91.50570814, "z": "97th" },
-    { "x": 199.5, "y": 91.90577541, "z": "97th" },
-    { "x": 200.5, "y": 92.29779046, "z": "97th" },
-    { "x": 201.5, "y": 92.6814447, "z": "97th" },
-    { "x": 202.5, "y": 93.05642962, "z": "97th" },
-    { "x": 203.5, "y": 93.42243904, "z": "97th" },
-    { "x": 204.5, "y": 93.77917145, "z": "97th" },
-    { "x": 205.5, "y": 94.12633257, "z": "97th" },
-    { "x": 206.5, "y": 94.46363806, "z": "97th" },
-    { "x": 207.5, "y": 94.79080897, "z": "97th" },
-    { "x": 208.5, "y": 95.10760779, "z": "97th" },
-    { "x": 209.5, "y": 95.41378755, "z": "97th" },
-    { "x": 210.5, "y": 95.70913474, "z": "97th" },
-    { "x": 211.5, "y": 95.99346235, "z": "97th" },
-    { "x": 212.5, "y": 96.26661385, "z": "97th" },
-    { "x": 213.5, "y": 96.52846743, "z": "97th" },
-    { "x": 214.5, "y": 96.77894046, "z": "97th" },
-    { "x": 215.5, "y": 97.01799447, "z": "97th" },
-    { "x": 216.5, "y": 97.24564034, "z": "97th" },
-    { "x": 217.5, "y": 97.46194398, "z": "97th" },
-    { "x": 218.5, "y": 97.66704065, "z": "97th" },
-    { "x": 219.5, "y": 97.8611107, "z": "97th" },
-    { "x": 220.5, "y": 98.04442516, "z": "97th" },
-    { "x": 221.5, "y": 98.21733128, "z": "97th" },
-    { "x": 222.5, "y": 98.38026471, "z": "97th" },
-    { "x": 223.5, "y": 98.53374986, "z": "97th" },
-    { "x": 224.5, "y": 98.67844376, "z": "97th" },
-    { "x": 225.5, "y": 98.8150862, "z": "97th" },
-    { "x": 226.5, "y": 98.94455298, "z": "97th" },
-    { "x": 227.5, "y": 99.06785516, "z": "97th" },
-    { "x": 228.5, "y": 99.18615007, "z": "97th" },
-    { "x": 229.5, "y": 99.30075287, "z": "97th" },
-    { "x": 230.5, "y": 99.41314881, "z": "97th" },
-    { "x": 231.5, "y": 99.5250061, "z": "97th" },
-    { "x": 232.5, "y": 99.63818945, "z": "97th" },
-    { "x": 233.5, "y": 99.75477412, "z": "97th" },
-    { "x": 234.5, "y": 99.87706036, "z": "97th" },
-    { "x": 235.5, "y": 100.0075883, "z": "97th" },
-    { "x": 236.5, "y": 100.1491529, "z": "97th" },
-    { "x": 237.5, "y": 100.3048189, "z": "97th" },
-    { "x": 238.5, "y": 100.477926, "z": "97th" },
-    { "x": 239.5, "y": 100.6721384, "z": "97th" },
-    { "x": 240, "y": 100.7783809, "z": "97th" }
-]
-        
\ No newline at end of file
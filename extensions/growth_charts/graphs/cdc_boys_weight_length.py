@@ -1,542 +0,0 @@
-cdc_boys_weight_length = [
-    {'x': 45.0, 'y': 1.597028518, 'z': '3rd'},
-    {'x': 45.0, 'y': 1.690593749, 'z': '5th'},
-    {'x': 45.0, 'y': 1.830303285, 'z': '10th'},
-    {'x': 45.0, 'y': 2.053702326, 'z': '25th'},
-    {'x': 45.0, 'y': 2.289757735, 'z': '50th'},
-    {'x': 45.0, 'y': 2.515338948, 'z': '75th'},
-    {'x': 45.0, 'y': 2.710846705, 'z': '90th'},
-    {'x': 45.0, 'y': 2.824861387, 'z': '95th'},
-    {'x': 45.0, 'y': 2.89780918, 'z': '97th'},
-    {'x': 45.5, 'y': 1.702957417, 'z': '3rd'},
-    {'x': 45.5, 'y': 1.792954672, 'z': '5th'},
-    {'x': 45.5, 'y': 1.928805392, 'z': '10th'},
-    {'x': 45.5, 'y': 2.149314246, 'z': '25th'},
-    {'x': 45.5, 'y': 2.38617219, 'z': '50th'},
-    {'x': 45.5, 'y': 2.615766477, 'z': '75th'},
-    {'x': 45.5, 'y': 2.817044967, 'z': '90th'},
-    {'x': 45.5, 'y': 2.935328776, 'z': '95th'},
-    {'x': 45.5, 'y': 3.011338317, 'z': '97th'},
-    {'x': 46.5, 'y': 1.918742401, 'z': '3rd'},
-    {'x': 46.5, 'y': 2.00306056, 'z': '5th'},
-    {'x': 46.5, 'y': 2.132607345, 'z': '10th'},
-    {'x': 46.5, 'y': 2.34835311, 'z': '25th'},
-    {'x': 46.5, 'y': 2.587097922, 'z': '50th'},
-    {'x': 46.5, 'y': 2.824925474, 'z': '75th'},
-    {'x': 46.5, 'y': 3.038262787, 'z': '90th'},
-    {'x': 46.5, 'y': 3.165635227, 'z': '95th'},
-    {'x': 46.5, 'y': 3.248240003, 'z': '97th'},
-    {'x': 47.5, 'y': 2.139283471, 'z': '3rd'},
-    {'x': 47.5, 'y': 2.219514291, 'z': '5th'},
-    {'x': 47.5, 'y': 2.344442385, 'z': '10th'},
-    {'x': 47.5, 'y': 2.556834051, 'z': '25th'},
-    {'x': 47.5, 'y': 2.797952593, 'z': '50th'},
-    {'x': 47.5, 'y': 3.044241159, 'z': '75th'},
-    {'x': 47.5, 'y': 3.270147404, 'z': '90th'},
-    {'x': 47.5, 'y': 3.407200737, 'z': '95th'},
-    {'x': 47.5, 'y': 3.49693518, 'z': '97th'},
-    {'x': 48.5, 'y': 2.364025965, 'z': '3rd'},
-    {'x': 48.5, 'y': 2.441421905, 'z': '5th'},
-    {'x': 48.5, 'y': 2.563170915, 'z': '10th'},
-    {'x': 48.5, 'y': 2.773593907, 'z': '25th'},
-    {'x': 48.5, 'y': 3.017679791, 'z': '50th'},
-    {'x': 48.5, 'y': 3.272646214, 'z': '75th'},
-    {'x': 48.5, 'y': 3.511467362, 'z': '90th'},
-    {'x': 48.5, 'y': 3.65864093, 'z': '95th'},
-    {'x': 48.5, 'y': 3.755928383, 'z': '97th'},
-    {'x': 49.5, 'y': 2.59243106, 'z': '3rd'},
-    {'x': 49.5, 'y': 2.667982282, 'z': '5th'},
-    {'x': 49.5, 'y': 2.78776291, 'z': '10th'},
-    {'x': 49.5, 'y': 2.997514515, 'z': '25th'},
-    {'x': 49.5, 'y': 3.245225583, 'z': '50th'},
-    {'x': 49.5, 'y': 3.509103506, 'z': '75th'},
-    {'x': 49.5, 'y': 3.761071952, 'z': '90th'},
-    {'x': 49.5, 'y': 3.918675144, 'z': '95th'},
-    {'x': 49.5, 'y': 4.023835077, 'z': '97th'},
-    {'x': 50.5, 'y': 2.823966844, 'z': '3rd'},
-    {'x': 50.5, 'y': 2.89846365, 'z': '5th'},
-    {'x': 50.5, 'y': 3.017289051, 'z': '10th'},
-    {'x': 50.5, 'y': 3.227549277, 'z': '25th'},
-    {'x': 50.5, 'y': 3.479567767, 'z': '50th'},
-    {'x': 50.5, 'y': 3.752613117, 'z': '75th'},
-    {'x': 50.5, 'y': 4.01788174, 'z': '90th'},
-    {'x': 50.5, 'y': 4.18611338, 'z': '95th'},
-    {'x': 50.5, 'y': 4.299368538, 'z': '97th'},
-    {'x': 51.5, 'y': 3.058104103, 'z': '3rd'},
-    {'x': 51.5, 'y': 3.132186651, 'z': '5th'},
-    {'x': 51.5, 'y': 3.250908274, 'z': '10th'},
-    {'x': 51.5, 'y': 3.462735881, 'z': '25th'},
-    {'x': 51.5, 'y': 3.719739648, 'z': '50th'},
-    {'x': 51.5, 'y': 4.002224198, 'z': '75th'},
-    {'x': 51.5, 'y': 4.280884515, 'z': '90th'},
-    {'x': 51.5, 'y': 4.459845507, 'z': '95th'},
-    {'x': 51.5, 'y': 4.581326217, 'z': '97th'},
-    {'x': 52.5, 'y': 3.294322225, 'z': '3rd'},
-    {'x': 52.5, 'y': 3.368517223, 'z': '5th'},
-    {'x': 52.5, 'y': 3.487856107, 'z': '10th'},
-    {'x': 52.5, 'y': 3.702195087, 'z': '25th'},
-    {'x': 52.5, 'y': 3.964838222, 'z': '50th'},
-    {'x': 52.5, 'y': 4.257039544, 'z': '75th'},
-    {'x': 52.5, 'y': 4.549132322, 'z': '90th'},
-    {'x': 52.5, 'y': 4.738836361, 'z': '95th'},
-    {'x': 52.5, 'y': 4.868585555, 'z': '97th'},
-    {'x': 53.5, 'y': 3.532109837, 'z': '3rd'},
-    {'x': 53.5, 'y': 3.606859589, 'z': '5th'},
-    {'x': 53.5, 'y': 3.727435106, 'z': '10th'},
-    {'x': 53.5, 'y': 3.94512977, 'z': '25th'},
-    {'x': 53.5, 'y': 4.214033476, 'z': '50th'},
-    {'x': 53.5, 'y': 4.516224426, 'z': '75th'},
-    {'x': 53.5, 'y': 4.821741654, 'z': '90th'},
-    {'x': 53.5, 'y': 5.022119957, 'z': '95th'},
-    {'x': 53.5, 'y': 5.160094928, 'z': '97th'},
-    {'x': 54.5, 'y': 3.770975175, 'z': '3rd'},
-    {'x': 54.5, 'y': 3.846657516, 'z': '5th'},
-    {'x': 54.5, 'y': 3.969008144, 'z': '10th'},
-    {'x': 54.5, 'y': 4.190815779, 'z': '25th'},
-    {'x': 54.5, 'y': 4.466562625, 'z': '50th'},
-    {'x': 54.5, 'y': 4.779002851, 'z': '75th'},
-    {'x': 54.5, 'y': 5.097890522, 'z': '90th'},
-    {'x': 54.5, 'y': 5.308799266, 'z': '95th'},
-    {'x': 54.5, 'y': 5.454877316, 'z': '97th'},
-    {'x': 55.5, 'y': 4.010448329, 'z': '3rd'},
-    {'x': 55.5, 'y': 4.087392272, 'z': '5th'},
-    {'x': 55.5, 'y': 4.211993219, 'z': '10th'},
-    {'x': 55.5, 'y': 4.43859789, 'z': '25th'},
-    {'x': 55.5, 'y': 4.721730669, 'z': '50th'},
-    {'x': 55.5, 'y': 5.044659815, 'z': '75th'},
-    {'x': 55.5, 'y': 5.376817878, 'z': '90th'},
-    {'x': 55.5, 'y': 5.598043337, 'z': '95th'},
-    {'x': 55.5, 'y': 5.752026649, 'z': '97th'},
-    {'x': 56.5, 'y': 4.250088071, 'z': '3rd'},
-    {'x': 56.5, 'y': 4.328584525, 'z': '5th'},
-    {'x': 56.5, 'y': 4.455860069, 'z': '10th'},
-    {'x': 56.5, 'y': 4.687882702, 'z': '25th'},
-    {'x': 56.5, 'y': 4.978903744, 'z': '50th'},
-    {'x': 56.5, 'y': 5.312536448, 'z': '75th'},
-    {'x': 56.5, 'y': 5.65782066, 'z': '90th'},
-    {'x': 56.5, 'y': 5.889087035, 'z': '95th'},
-    {'x': 56.5, 'y': 6.050711037, 'z': '97th'},
-    {'x': 57.5, 'y': 4.489485537, 'z': '3rd'},
-    {'x': 57.5, 'y': 4.569794994, 'z': '5th'},
-    {'x': 57.5, 'y': 4.700127546, 'z': '10th'},
-    {'x': 57.5, 'y': 4.938133749, 'z': '25th'},
-    {'x': 57.5, 'y': 5.237504753, 'z': '50th'},
-    {'x': 57.5, 'y': 5.582026947, 'z': '75th'},
-    {'x': 57.5, 'y': 5.940251499, 'z': '90th'},
-    {'x': 57.5, 'y': 6.181229894, 'z': '95th'},
-    {'x': 57.5, 'y': 6.350173518, 'z': '97th'},
-    {'x': 58.5, 'y': 4.728267233, 'z': '3rd'},
-    {'x': 58.5, 'y': 4.810625098, 'z': '5th'},
-    {'x': 58.5, 'y': 4.94436155, 'z': '10th'},
-    {'x': 58.5, 'y': 5.188867126, 'z': '25th'},
-    {'x': 58.5, 'y': 5.497008915, 'z': '50th'},
-    {'x': 58.5, 'y': 5.85257519, 'z': '75th'},
-    {'x': 58.5, 'y': 6.22351642, 'z': '90th'},
-    {'x': 58.5, 'y': 6.473835067, 'z': '95th'},
-    {'x': 58.5, 'y': 6.649732739, 'z': '97th'},
-    {'x': 59.5, 'y': 4.966096999, 'z': '3rd'},
-    {'x': 59.5, 'y': 5.050717205, 'z': '5th'},
-    {'x': 59.5, 'y': 5.188173227, 'z': '10th'},
-    {'x': 59.5, 'y': 5.439647821, 'z': '25th'},
-    {'x': 59.5, 'y': 5.756939907, 'z': '50th'},
-    {'x': 59.5, 'y': 6.123671792, 'z': '75th'},
-    {'x': 59.5, 'y': 6.507072866, 'z': '90th'},
-    {'x': 59.5, 'y': 6.766328167, 'z': '95th'},
-    {'x': 59.5, 'y': 6.94878282, 'z': '97th'},
-    {'x': 60.5, 'y': 5.202677038, 'z': '3rd'},
-    {'x': 60.5, 'y': 5.289754427, 'z': '5th'},
-    {'x': 60.5, 'y': 5.431217262, 'z': '10th'},
-    {'x': 60.5, 'y': 5.690086611, 'z': '25th'},
-    {'x': 60.5, 'y': 6.016866693, 'z': '50th'},
-    {'x': 60.5, 'y': 6.394851791, 'z': '75th'},
-    {'x': 60.5, 'y': 6.790428163, 'z': '90th'},
-    {'x': 60.5, 'y': 7.058196003, 'z': '95th'},
-    {'x': 60.5, 'y': 7.246792315, 'z': '97th'},
-    {'x': 61.5, 'y': 5.437748497, 'z': '3rd'},
-    {'x': 61.5, 'y': 5.527460202, 'z': '5th'},
-    {'x': 61.5, 'y': 5.673190232, 'z': '10th'},
-    {'x': 61.5, 'y': 5.939837222, 'z': '25th'},
-    {'x': 61.5, 'y': 6.276400575, 'z': '50th'},
-    {'x': 61.5, 'y': 6.66569255, 'z': '75th'},
-    {'x': 61.5, 'y': 7.073138226, 'z': '90th'},
-    {'x': 61.5, 'y': 7.348985362, 'z': '95th'},
-    {'x': 61.5, 'y': 7.543302768, 'z': '97th'},
-    {'x': 62.5, 'y': 5.671089001, 'z': '3rd'},
-    {'x': 62.5, 'y': 5.763595946, 'z': '5th'},
-    {'x': 62.5, 'y': 5.91382859, 'z': '10th'},
-    {'x': 62.5, 'y': 6.18859526, 'z': '25th'},
-    {'x': 62.5, 'y': 6.535195541, 'z': '50th'},
-    {'x': 62.5, 'y': 6.935815081, 'z': '75th'},
-    {'x': 62.5, 'y': 7.354807872, 'z': '90th'},
-    {'x': 62.5, 'y': 7.638300762, 'z': '95th'},
-    {'x': 62.5, 'y': 7.837923511, 'z': '97th'},
-    {'x': 63.5, 'y': 5.902515543, 'z': '3rd'},
-    {'x': 63.5, 'y': 5.997962236, 'z': '5th'},
-    {'x': 63.5, 'y': 6.152907479, 'z': '10th'},
-    {'x': 63.5, 'y': 6.436093976, 'z': '25th'},
-    {'x': 63.5, 'y': 6.792942366, 'z': '50th'},
-    {'x': 63.5, 'y': 7.204878803, 'z': '75th'},
-    {'x': 63.5, 'y': 7.635088323, 'z': '90th'},
-    {'x': 63.5, 'y': 7.925804423, 'z': '95th'},
-    {'x': 63.5, 'y': 8.130333399, 'z': '97th'},
-    {'x': 64.5, 'y': 6.131880558, 'z': '3rd'},
-    {'x': 64.5, 'y': 6.230395557, 'z': '5th'},
-    {'x': 64.5, 'y': 6.390238592, 'z': '10th'},
-    {'x': 64.5, 'y': 6.682104069, 'z': '25th'},
-    {'x': 64.5, 'y': 7.049370425, 'z': '50th'},
-    {'x': 64.5, 'y': 7.472584314, 'z': '75th'},
-    {'x': 64.5, 'y': 7.9136782, 'z': '90th'},
-    {'x': 64.5, 'y': 8.211213607, 'z': '95th'},
-    {'x': 64.5, 'y': 8.420274027, 'z': '97th'},
-    {'x': 65.5, 'y': 6.359068402, 'z': '3rd'},
-    {'x': 65.5, 'y': 6.460765369, 'z': '5th'},
-    {'x': 65.5, 'y': 6.625668165, 'z': '10th'},
-    {'x': 65.5, 'y': 6.926433317, 'z': '25th'},
-    {'x': 65.5, 'y': 7.304248994, 'z': '50th'},
-    {'x': 65.5, 'y': 7.738675499, 'z': '75th'},
-    {'x': 65.5, 'y': 8.190324128, 'z': '90th'},
-    {'x': 65.5, 'y': 8.494298133, 'z': '95th'},
-    {'x': 65.5, 'y': 8.707543698, 'z': '97th'},
-    {'x': 66.5, 'y': 6.583997561, 'z': '3rd'},
-    {'x': 66.5, 'y': 6.688974915, 'z': '5th'},
-    {'x': 66.5, 'y': 6.859075839, 'z': '10th'},
-    {'x': 66.5, 'y': 7.168922842, 'z': '25th'},
-    {'x': 66.5, 'y': 7.557381995, 'z': '50th'},
-    {'x': 66.5, 'y': 8.002934684, 'z': '75th'},
-    {'x': 66.5, 'y': 8.46481824, 'z': '90th'},
-    {'x': 66.5, 'y': 8.774880112, 'z': '95th'},
-    {'x': 66.5, 'y': 8.991998822, 'z': '97th'},
-    {'x': 67.5, 'y': 6.806616368, 'z': '3rd'},
-    {'x': 67.5, 'y': 6.914957848, 'z': '5th'},
-    {'x': 67.5, 'y': 7.090372671, 'z': '10th'},
-    {'x': 67.5, 'y': 7.409447317, 'z': '25th'},
-    {'x': 67.5, 'y': 7.808610136, 'z': '50th'},
-    {'x': 67.5, 'y': 8.26518536, 'z': '75th'},
-    {'x': 67.5, 'y': 8.736998815, 'z': '90th'},
-    {'x': 67.5, 'y': 9.052831095, 'z': '95th'},
-    {'x': 67.5, 'y': 9.27354736, 'z': '97th'},
-    {'x': 68.5, 'y': 7.026901165, 'z': '3rd'},
-    {'x': 68.5, 'y': 7.138676485, 'z': '5th'},
-    {'x': 68.5, 'y': 7.319499566, 'z': '10th'},
-    {'x': 68.5, 'y': 7.647913807, 'z': '25th'},
-    {'x': 68.5, 'y': 8.057810266, 'z': '50th'},
-    {'x': 68.5, 'y': 8.525291839, 'z': '75th'},
-    {'x': 68.5, 'y': 9.006749431, 'z': '90th'},
-    {'x': 68.5, 'y': 9.328070124, 'z': '95th'},
-    {'x': 68.5, 'y': 9.552145587, 'z': '97th'},
-    {'x': 69.5, 'y': 7.244856495, 'z': '3rd'},
-    {'x': 69.5, 'y': 7.360121388, 'z': '5th'},
-    {'x': 69.5, 'y': 7.54642602, 'z': '10th'},
-    {'x': 69.5, 'y': 7.884259416, 'z': '25th'},
-    {'x': 69.5, 'y': 8.304892397, 'z': '50th'},
-    {'x': 69.5, 'y': 8.783156413, 'z': '75th'},
-    {'x': 69.5, 'y': 9.273996989, 'z': '90th'},
-    {'x': 69.5, 'y': 9.600562566, 'z': '95th'},
-    {'x': 69.5, 'y': 9.827797569, 'z': '97th'},
-    {'x': 70.5, 'y': 7.460510099, 'z': '3rd'},
-    {'x': 70.5, 'y': 7.579307642, 'z': '5th'},
-    {'x': 70.5, 'y': 7.771148283, 'z': '10th'},
-    {'x': 70.5, 'y': 8.118452209, 'z': '25th'},
-    {'x': 70.5, 'y': 8.549802669, 'z': '50th'},
-    {'x': 70.5, 'y': 9.038722435, 'z': '75th'},
-    {'x': 70.5, 'y': 9.53871203, 'z': '90th'},
-    {'x': 70.5, 'y': 9.870316803, 'z': '95th'},
-    {'x': 70.5, 'y': 10.10054839, 'z': '97th'},
-    {'x': 71.5, 'y': 7.67391364, 'z': '3rd'},
-    {'x': 71.5, 'y': 7.796274848, 'z': '5th'},
-    {'x': 71.5, 'y': 7.993688292, 'z': '10th'},
-    {'x': 71.5, 'y': 8.350488663, 'z': '25th'},
-    {'x': 71.5, 'y': 8.792519752, 'z': '50th'},
-    {'x': 71.5, 'y': 9.291970609, 'z': '75th'},
-    {'x': 71.5, 'y': 9.800906186, 'z': '90th'},
-    {'x': 71.5, 'y': 10.13738322, 'z': '95th'},
-    {'x': 71.5, 'y': 10.37048464, 'z': '97th'},
-    {'x': 72.5, 'y': 7.885140184, 'z': '3rd'},
-    {'x': 72.5, 'y': 8.011085035, 'z': '5th'},
-    {'x': 72.5, 'y': 8.214092237, 'z': '10th'},
-    {'x': 72.5, 'y': 8.580393153, 'z': '25th'},
-    {'x': 72.5, 'y': 9.033054944, 'z': '50th'},
-    {'x': 72.5, 'y': 9.542918966, 'z': '75th'},
-    {'x': 72.5, 'y': 10.06063106, 'z': '90th'},
-    {'x': 72.5, 'y': 10.40185184, 'z': '95th'},
-    {'x': 72.5, 'y': 10.63773097, 'z': '97th'},
-    {'x': 73.5, 'y': 8.094284811, 'z': '3rd'},
-    {'x': 73.5, 'y': 8.223822595, 'z': '5th'},
-    {'x': 73.5, 'y': 8.432429492, 'z': '10th'},
-    {'x': 73.5, 'y': 8.808215482, 'z': '25th'},
-    {'x': 73.5, 'y': 9.271448675, 'z': '50th'},
-    {'x': 73.5, 'y': 9.791619211, 'z': '75th'},
-    {'x': 73.5, 'y': 10.31797568, 'z': '90th'},
-    {'x': 73.5, 'y': 10.66385133, 'z': '95th'},
-    {'x': 73.5, 'y': 10.90245061, 'z': '97th'},
-    {'x': 74.5, 'y': 8.301459453, 'z': '3rd'},
-    {'x': 74.5, 'y': 8.434590571, 'z': '5th'},
-    {'x': 74.5, 'y': 8.648791006, 'z': '10th'},
-    {'x': 74.5, 'y': 9.034032141, 'z': '25th'},
-    {'x': 74.5, 'y': 9.507773605, 'z': '50th'},
-    {'x': 74.5, 'y': 10.03815952, 'z': '75th'},
-    {'x': 74.5, 'y': 10.57306631, 'z': '90th'},
-    {'x': 74.5, 'y': 10.92354547, 'z': '95th'},
-    {'x': 74.5, 'y': 11.16483888, 'z': '97th'},
-    {'x': 75.5, 'y': 8.506795026, 'z': '3rd'},
-    {'x': 75.5, 'y': 8.643511567, 'z': '5th'},
-    {'x': 75.5, 'y': 8.863288423, 'z': '10th'},
-    {'x': 75.5, 'y': 9.257942887, 'z': '25th'},
-    {'x': 75.5, 'y': 9.742129356, 'z': '50th'},
-    {'x': 75.5, 'y': 10.28265908, 'z': '75th'},
-    {'x': 75.5, 'y': 10.82606321, 'z': '90th'},
-    {'x': 75.5, 'y': 11.18113275, 'z': '95th'},
-    {'x': 75.5, 'y': 11.42512564, 'z': '97th'},
-    {'x': 76.5, 'y': 8.710439238, 'z': '3rd'},
-    {'x': 76.5, 'y': 8.850725924, 'z': '5th'},
-    {'x': 76.5, 'y': 9.076052776, 'z': '10th'},
-    {'x': 76.5, 'y': 9.480070094, 'z': '25th'},
-    {'x': 76.5, 'y': 9.974642178, 'z': '50th'},
-    {'x': 76.5, 'y': 10.52526749, 'z': '75th'},
-    {'x': 76.5, 'y': 11.07715916, 'z': '90th'},
-    {'x': 76.5, 'y': 11.43684424, 'z': '95th'},
-    {'x': 76.5, 'y': 11.68357247, 'z': '97th'},
-    {'x': 77.5, 'y': 8.912555531, 'z': '3rd'},
-    {'x': 77.5, 'y': 9.056390619, 'z': '5th'},
-    {'x': 77.5, 'y': 9.287233301, 'z': '10th'},
-    {'x': 77.5, 'y': 9.700557381, 'z': '25th'},
-    {'x': 77.5, 'y': 10.20546331, 'z': '50th'},
-    {'x': 77.5, 'y': 10.76616287, 'z': '75th'},
-    {'x': 77.5, 'y': 11.32657755, 'z': '90th'},
-    {'x': 77.5, 'y': 11.69094178, 'z': '95th'},
-    {'x': 77.5, 'y': 11.94047127, 'z': '97th'},
-    {'x': 78.5, 'y': 9.113322086, 'z': '3rd'},
-    {'x': 78.5, 'y': 9.260678201, 'z': '5th'},
-    {'x': 78.5, 'y': 9.496996252, 'z': '10th'},
-    {'x': 78.5, 'y': 9.91956818, 'z': '25th'},
-    {'x': 78.5, 'y': 10.43476723, 'z': '50th'},
-    {'x': 78.5, 'y': 11.00554988, 'z': '75th'},
-    {'x': 78.5, 'y': 11.57457043, 'z': '90th'},
-    {'x': 78.5, 'y': 11.94371638, 'z': '95th'},
-    {'x': 78.5, 'y': 12.19614287, 'z': '97th'},
-    {'x': 79.5, 'y': 9.312930869, 'z': '3rd'},
-    {'x': 79.5, 'y': 9.463775754, 'z': '5th'},
-    {'x': 79.5, 'y': 9.705523721, 'z': '10th'},
-    {'x': 79.5, 'y': 10.13728428, 'z': '25th'},
-    {'x': 79.5, 'y': 10.66274993, 'z': '50th'},
-    {'x': 79.5, 'y': 11.24365775, 'z': '75th'},
-    {'x': 79.5, 'y': 11.8214166, 'z': '90th'},
-    {'x': 79.5, 'y': 12.19548652, 'z': '95th'},
-    {'x': 79.5, 'y': 12.45093578, 'z': '97th'},
-    {'x': 80.5, 'y': 9.511586717, 'z': '3rd'},
-    {'x': 80.5, 'y': 9.665883884, 'z': '5th'},
-    {'x': 80.5, 'y': 9.913012453, 'z': '10th'},
-    {'x': 80.5, 'y': 10.35390433, 'z': '25th'},
-    {'x': 80.5, 'y': 10.88962699, 'z': '50th'},
-    {'x': 80.5, 'y': 11.48073815, 'z': '75th'},
-    {'x': 80.5, 'y': 12.06741962, 'z': '90th'},
-    {'x': 80.5, 'y': 12.44659654, 'z': '95th'},
-    {'x': 80.5, 'y': 12.70522492, 'z': '97th'},
-    {'x': 81.5, 'y': 9.709506461, 'z': '3rd'},
-    {'x': 81.5, 'y': 9.867215725, 'z': '5th'},
-    {'x': 81.5, 'y': 10.11967266, 'z': '10th'},
-    {'x': 81.5, 'y': 10.5696423, 'z': '25th'},
-    {'x': 81.5, 'y': 11.11563177, 'z': '50th'},
-    {'x': 81.5, 'y': 11.71706321, 'z': '75th'},
-    {'x': 81.5, 'y': 12.31290587, 'z': '90th'},
-    {'x': 81.5, 'y': 12.69741505, 'z': '95th'},
-    {'x': 81.5, 'y': 12.9594104, 'z': '97th'},
-    {'x': 82.5, 'y': 9.90691806, 'z': '3rd'},
-    {'x': 82.5, 'y': 10.06799596, 'z': '5th'},
-    {'x': 82.5, 'y': 10.32572684, 'z': '10th'},
-    {'x': 82.5, 'y': 10.78472594, 'z': '25th'},
-    {'x': 82.5, 'y': 11.34101346, 'z': '50th'},
-    {'x': 82.5, 'y': 11.95292329, 'z': '75th'},
-    {'x': 82.5, 'y': 12.55822265, 'z': '90th'},
-    {'x': 82.5, 'y': 12.94833337, 'z': '95th'},
-    {'x': 82.5, 'y': 13.21391629, 'z': '97th'},
-    {'x': 83.5, 'y': 10.10405976, 'z': '3rd'},
-    {'x': 83.5, 'y': 10.26845983, 'z': '5th'},
-    {'x': 83.5, 'y': 10.53140858, 'z': '10th'},
-    {'x': 83.5, 'y': 10.99939524, 'z': '25th'},
-    {'x': 83.5, 'y': 11.56603512, 'z': '50th'},
-    {'x': 83.5, 'y': 12.18862496, 'z': '75th'},
-    {'x': 83.5, 'y': 12.8037362, 'z': '90th'},
-    {'x': 83.5, 'y': 13.19976391, 'z': '95th'},
-    {'x': 83.5, 'y': 13.46918953, 'z': '97th'},
-    {'x': 84.5, 'y': 10.30117927, 'z': '3rd'},
-    {'x': 84.5, 'y': 10.46885221, 'z': '5th'},
-    {'x': 84.5, 'y': 10.73696139, 'z': '10th'},
-    {'x': 84.5, 'y': 11.21390081, 'z': '25th'},
-    {'x': 84.5, 'y': 11.79097176, 'z': '50th'},
-    {'x': 84.5, 'y': 12.42448873, 'z': '75th'},
-    {'x': 84.5, 'y': 13.04982974, 'z': '90th'},
-    {'x': 84.5, 'y': 13.45213869, 'z': '95th'},
-    {'x': 84.5, 'y': 13.7256987, 'z': '97th'},
-    {'x': 85.5, 'y': 10.49853295, 'z': '3rd'},
-    {'x': 85.5, 'y': 10.66942663, 'z': '5th'},
-    {'x': 85.5, 'y': 10.94263752, 'z': '10th'},
-    {'x': 85.5, 'y': 11.42850232, 'z': '25th'},
-    {'x': 85.5, 'y': 12.01610828, 'z': '50th'},
-    {'x': 85.5, 'y': 12.66084697, 'z': '75th'},
-    {'x': 85.5, 'y': 13.29690152, 'z': '90th'},
-    {'x': 85.5, 'y': 13.70590772, 'z': '95th'},
-    {'x': 85.5, 'y': 13.98393299, 'z': '97th'},
-    {'x': 86.5, 'y': 10.69638497, 'z': '3rd'},
-    {'x': 86.5, 'y': 10.87044435, 'z': '5th'},
-    {'x': 86.5, 'y': 11.14869679, 'z': '10th'},
-    {'x': 86.5, 'y': 11.64346692, 'z': '25th'},
-    {'x': 86.5, 'y': 12.24173753, 'z': '50th'},
-    {'x': 86.5, 'y': 12.89804158, 'z': '75th'},
-    {'x': 86.5, 'y': 13.5453628, 'z': '90th'},
-    {'x': 86.5, 'y': 13.96153752, 'z': '95th'},
-    {'x': 86.5, 'y': 14.24440109, 'z': '97th'},
-    {'x': 87.5, 'y': 10.89500657, 'z': '3rd'},
-    {'x': 87.5, 'y': 11.07217344, 'z': '5th'},
-    {'x': 87.5, 'y': 11.35540546, 'z': '10th'},
-    {'x': 87.5, 'y': 11.85906768, 'z': '25th'},
-    {'x': 87.5, 'y': 12.46815824, 'z': '50th'},
-    {'x': 87.5, 'y': 13.13642183, 'z': '75th'},
-    {'x': 87.5, 'y': 13.79563586, 'z': '90th'},
-    {'x': 87.5, 'y': 14.21950956, 'z': '95th'},
-    {'x': 87.5, 'y': 14.50763019, 'z': '97th'},
-    {'x': 88.5, 'y': 11.0946752, 'z': '3rd'},
-    {'x': 88.5, 'y': 11.27488782, 'z': '5th'},
-    {'x': 88.5, 'y': 11.56303507, 'z': '10th'},
-    {'x': 88.5, 'y': 12.07558197, 'z': '25th'},
-    {'x': 88.5, 'y': 12.69567298, 'z': '50th'},
-    {'x': 88.5, 'y': 13.37634196, 'z': '75th'},
-    {'x': 88.5, 'y': 14.04815191, 'z': '90th'},
-    {'x': 88.5, 'y': 14.48031873, 'z': '95th'},
-    {'x': 88.5, 'y': 14.77416503, 'z': '97th'},
-    {'x': 89.5, 'y': 11.29567376, 'z': '3rd'},
-    {'x': 89.5, 'y': 11.47886643, 'z': '5th'},
-    {'x': 89.5, 'y': 11.77186133, 'z': '10th'},
-    {'x': 89.5, 'y': 12.29328999, 'z': '25th'},
-    {'x': 89.5, 'y': 12.92458613, 'z': '50th'},
-    {'x': 89.5, 'y': 13.6181589, 'z': '75th'},
-    {'x': 89.5, 'y': 14.30334895, 'z': '90th'},
-    {'x': 89.5, 'y': 14.74447181, 'z': '95th'},
-    {'x': 89.5, 'y': 15.044567, 'z': '97th'},
-    {'x': 90.5, 'y': 11.49828978, 'z': '3rd'},
-    {'x': 90.5, 'y': 11.68439228, 'z': '5th'},
-    {'x': 90.5, 'y': 11.98216306, 'z': '10th'},
-    {'x': 90.5, 'y': 12.51247319, 'z': '25th'},
-    {'x': 90.5, 'y': 13.15520182, 'z': '50th'},
-    {'x': 90.5, 'y': 13.86222981, 'z': '75th'},
-    {'x': 90.5, 'y': 14.56166964, 'z': '90th'},
-    {'x': 90.5, 'y': 15.01248591, 'z': '95th'},
-    {'x': 90.5, 'y': 15.31941326, 'z': '97th'},
-    {'x': 91.5, 'y': 11.70281463, 'z': '3rd'},
-    {'x': 91.5, 'y': 11.89175157, 'z': '5th'},
-    {'x': 91.5, 'y': 12.19422113, 'z': '10th'},
-    {'x': 91.5, 'y': 12.73341284, 'z': '25th'},
-    {'x': 91.5, 'y': 13.38782185, 'z': '50th'},
-    {'x': 91.5, 'y': 14.10890963, 'z': '75th'},
-    {'x': 91.5, 'y': 14.82355899, 'z': '90th'},
-    {'x': 91.5, 'y': 15.28488689, 'z': '95th'},
-    {'x': 91.5, 'y': 15.59929608, 'z': '97th'},
-    {'x': 92.5, 'y': 11.90954225, 'z': '3rd'},
-    {'x': 92.5, 'y': 12.10123261, 'z': '5th'},
-    {'x': 92.5, 'y': 12.4083174, 'z': '10th'},
-    {'x': 92.5, 'y': 12.95638887, 'z': '25th'},
-    {'x': 92.5, 'y': 13.6227442, 'z': '50th'},
-    {'x': 92.5, 'y': 14.35854899, 'z': '75th'},
-    {'x': 92.5, 'y': 15.08946216, 'z': '90th'},
-    {'x': 92.5, 'y': 15.5622076, 'z': '95th'},
-    {'x': 92.5, 'y': 15.88482163, 'z': '97th'},
-    {'x': 93.5, 'y': 12.1187693, 'z': '3rd'},
-    {'x': 93.5, 'y': 12.31312548, 'z': '5th'},
-    {'x': 93.5, 'y': 12.62473383, 'z': '10th'},
-    {'x': 93.5, 'y': 13.18167788, 'z': '25th'},
-    {'x': 93.5, 'y': 13.86025986, 'z': '50th'},
-    {'x': 93.5, 'y': 14.61149059, 'z': '75th'},
-    {'x': 93.5, 'y': 15.35982164, 'z': '90th'},
-    {'x': 93.5, 'y': 15.84498667, 'z': '95th'},
-    {'x': 93.5, 'y': 16.17661055, 'z': '97th'},
-    {'x': 94.5, 'y': 12.33079298, 'z': '3rd'},
-    {'x': 94.5, 'y': 12.52772045, 'z': '5th'},
-    {'x': 94.5, 'y': 12.84375146, 'z': '10th'},
-    {'x': 94.5, 'y': 13.40955269, 'z': '25th'},
-    {'x': 94.5, 'y': 14.10065234, 'z': '50th'},
-    {'x': 94.5, 'y': 14.86806787, 'z': '75th'},
-    {'x': 94.5, 'y': 15.63507513, 'z': '90th'},
-    {'x': 94.5, 'y': 16.13376622, 'z': '95th'},
-    {'x': 94.5, 'y': 16.47529604, 'z': '97th'},
-    {'x': 95.5, 'y': 12.54591071, 'z': '3rd'},
-    {'x': 95.5, 'y': 12.74530738, 'z': '5th'},
-    {'x': 95.5, 'y': 13.06564953, 'z': '10th'},
-    {'x': 95.5, 'y': 13.64028082, 'z': '25th'},
-    {'x': 95.5, 'y': 14.34419522, 'z': '50th'},
-    {'x': 95.5, 'y': 15.12860179, 'z': '75th'},
-    {'x': 95.5, 'y': 15.91565257, 'z': '90th'},
-    {'x': 95.5, 'y': 16.42909034, 'z': '95th'},
-    {'x': 95.5, 'y': 16.78152407, 'z': '97th'},
-    {'x': 96.5, 'y': 12.76441819, 'z': '3rd'},
-    {'x': 96.5, 'y': 12.9661743, 'z': '5th'},
-    {'x': 96.5, 'y': 13.29070461, 'z': '10th'},
-    {'x': 96.5, 'y': 13.87412402, 'z': '25th'},
-    {'x': 96.5, 'y': 14.59115139, 'z': '50th'},
-    {'x': 96.5, 'y': 15.39339911, 'z': '75th'},
-    {'x': 96.5, 'y': 16.20197359, 'z': '90th'},
-    {'x': 96.5, 'y': 16.73150285, 'z': '95th'},
-    {'x': 96.5, 'y': 17.09595206, 'z': '97th'},
-    {'x': 97.5, 'y': 12.98660961, 'z': '3rd'},
-    {'x': 97.5, 'y': 13.19060724, 'z': '5th'},
-    {'x': 97.5, 'y': 13.5191898, 'z': '10th'},
-    {'x': 97.5, 'y': 14.11133652, 'z': '25th'},
-    {'x': 97.5, 'y': 14.84177007, 'z': '50th'},
-    {'x': 97.5, 'y': 15.66274835, 'z': '75th'},
-    {'x': 97.5, 'y': 16.494444, 'z': '90th'},
-    {'x': 97.5, 'y': 17.04154573, 'z': '95th'},
-    {'x': 97.5, 'y': 17.41925008, 'z': '97th'},
-    {'x': 98.5, 'y': 13.21277431, 'z': '3rd'},
-    {'x': 98.5, 'y': 13.41888786, 'z': '5th'},
-    {'x': 98.5, 'y': 13.75137383, 'z': '10th'},
-    {'x': 98.5, 'y': 14.3521657, 'z': '25th'},
-    {'x': 98.5, 'y': 15.0962879, 'z': '50th'},
-    {'x': 98.5, 'y': 15.93691963, 'z': '75th'},
-    {'x': 98.5, 'y': 16.79345342, 'z': '90th'},
-    {'x': 98.5, 'y': 17.35975605, 'z': '95th'},
-    {'x': 98.5, 'y': 17.75209809, 'z': '97th'},
-    {'x': 99.5, 'y': 13.44319598, 'z': '3rd'},
-    {'x': 99.5, 'y': 13.65129272, 'z': '5th'},
-    {'x': 99.5, 'y': 13.98752021, 'z': '10th'},
-    {'x': 99.5, 'y': 14.59685108, 'z': '25th'},
-    {'x': 99.5, 'y': 15.35492729, 'z': '50th'},
-    {'x': 99.5, 'y': 16.21616173, 'z': '75th'},
-    {'x': 99.5, 'y': 17.09937174, 'z': '90th'},
-    {'x': 99.5, 'y': 17.68666374, 'z': '95th'},
-    {'x': 99.5, 'y': 18.09518631, 'z': '97th'},
-    {'x': 100.5, 'y': 13.67814897, 'z': '3rd'},
-    {'x': 100.5, 'y': 13.88809057, 'z': '5th'},
-    {'x': 100.5, 'y': 14.22788616, 'z': '10th'},
-    {'x': 100.5, 'y': 14.8456253, 'z': '25th'},
-    {'x': 100.5, 'y': 15.61789822, 'z': '50th'},
-    {'x': 100.5, 'y': 16.50070256, 'z': '75th'},
-    {'x': 100.5, 'y': 17.41254676, 'z': '90th'},
-    {'x': 100.5, 'y': 18.02278798, 'z': '95th'},
-    {'x': 100.5, 'y': 18.44921206, 'z': '97th'},
-    {'x': 101.5, 'y': 13.91789949, 'z': '3rd'},
-    {'x': 101.5, 'y': 14.12954284, 'z': '5th'},
-    {'x': 101.5, 'y': 14.47272193, 'z': '10th'},
-    {'x': 101.5, 'y': 15.09871195, 'z': '25th'},
-    {'x': 101.5, 'y': 15.88539464, 'z': '50th'},
-    {'x': 101.5, 'y': 16.79074422, 'z': '75th'},
-    {'x': 101.5, 'y': 17.73329941, 'z': '90th'},
-    {'x': 101.5, 'y': 18.36863542, 'z': '95th'},
-    {'x': 101.5, 'y': 18.81488277, 'z': '97th'},
-    {'x': 102.5, 'y': 14.16269719, 'z': '3rd'},
-    {'x': 102.5, 'y': 14.37589784, 'z': '5th'},
-    {'x': 102.5, 'y': 14.722269, 'z': '10th'},
-    {'x': 102.5, 'y': 15.35632936, 'z': '25th'},
-    {'x': 102.5, 'y': 16.15760201, 'z': '50th'},
-    {'x': 102.5, 'y': 17.08646948, 'z': '75th'},
-    {'x': 102.5, 'y': 18.06192364, 'z': '90th'},
-    {'x': 102.5, 'y': 18.72469422, 'z': '95th'},
-    {'x': 102.5, 'y': 19.19290687, 'z': '97th'},
-    {'x': 103.5, 'y': 14.41277633, 'z': '3rd'},
-    {'x': 103.5, 'y': 14.62739094, 'z': '5th'},
-    {'x': 103.5, 'y': 14.97675902, 'z': '10th'},
-    {'x': 103.5, 'y': 15.61868832, 'z': '25th'},
-    {'x': 103.5, 'y': 16.43469418, 'z': '50th'},
-    {'x': 103.5, 'y': 17.38803782, 'z': '75th'},
-    {'x': 103.5, 'y': 18.39868195, 'z': '90th'},
-    {'x': 103.5, 'y': 19.09143177, 'z': '95th'},
-    {'x': 103.5, 'y': 19.58399633, 'z': '97th'}
-]
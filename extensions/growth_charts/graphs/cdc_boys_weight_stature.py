@@ -1,462 +0,0 @@
-cdc_boys_weight_stature = [
- {'x': 77.0, 'y': 8.972918744, 'z': '3rd'},
- {'x': 77.0, 'y': 9.11781325, 'z': '5th'},
- {'x': 77.0, 'y': 9.350303042, 'z': '10th'},
- {'x': 77.0, 'y': 9.766407722, 'z': '25th'},
- {'x': 77.0, 'y': 10.27440527, 'z': '50th'},
- {'x': 77.0, 'y': 10.83812738, 'z': '75th'},
- {'x': 77.0, 'y': 11.16689855, 'z': '85th'},
- {'x': 77.0, 'y': 11.4011129, 'z': '90th'},
- {'x': 77.0, 'y': 11.7668991, 'z': '95th'},
- {'x': 77.0, 'y': 12.01728627, 'z': '97th'},
- {'x': 77.5, 'y': 9.073267731, 'z': '3rd'},
- {'x': 77.5, 'y': 9.219922075, 'z': '5th'},
- {'x': 77.5, 'y': 9.455148545, 'z': '10th'},
- {'x': 77.5, 'y': 9.875875665, 'z': '25th'},
- {'x': 77.5, 'y': 10.38901871, 'z': '50th'},
- {'x': 77.5, 'y': 10.95778248, 'z': '75th'},
- {'x': 77.5, 'y': 11.289158, 'z': '85th'},
- {'x': 77.5, 'y': 11.52507288, 'z': '90th'},
- {'x': 77.5, 'y': 11.8932524, 'z': '95th'},
- {'x': 77.5, 'y': 12.14509038, 'z': '97th'},
- {'x': 78.5, 'y': 9.27309208, 'z': '3rd'},
- {'x': 78.5, 'y': 9.423242003, 'z': '5th'},
- {'x': 78.5, 'y': 9.663907823, 'z': '10th'},
- {'x': 78.5, 'y': 10.09383533, 'z': '25th'},
- {'x': 78.5, 'y': 10.61724901, 'z': '50th'},
- {'x': 78.5, 'y': 11.19612673, 'z': '75th'},
- {'x': 78.5, 'y': 11.53275921, 'z': '85th'},
- {'x': 78.5, 'y': 11.77212488, 'z': '90th'},
- {'x': 78.5, 'y': 12.14519668, 'z': '95th'},
- {'x': 78.5, 'y': 12.40002986, 'z': '97th'},
- {'x': 79.5, 'y': 9.47192154, 'z': '3rd'},
- {'x': 79.5, 'y': 9.625531353, 'z': '5th'},
- {'x': 79.5, 'y': 9.871587899, 'z': '10th'},
- {'x': 79.5, 'y': 10.31065794, 'z': '25th'},
- {'x': 79.5, 'y': 10.84432907, 'z': '50th'},
- {'x': 79.5, 'y': 11.43339148, 'z': '75th'},
- {'x': 79.5, 'y': 11.77536897, 'z': '85th'},
- {'x': 79.5, 'y': 12.01827111, 'z': '90th'},
- {'x': 79.5, 'y': 12.39640999, 'z': '95th'},
- {'x': 79.5, 'y': 12.65438854, 'z': '97th'},
- {'x': 80.5, 'y': 9.669970612, 'z': '3rd'},
- {'x': 80.5, 'y': 9.827000834, 'z': '5th'},
- {'x': 80.5, 'y': 10.07839639, 'z': '10th'},
- {'x': 80.5, 'y': 10.52655452, 'z': '25th'},
- {'x': 80.5, 'y': 11.07048885, 'z': '50th'},
- {'x': 80.5, 'y': 11.66984493, 'z': '75th'},
- {'x': 80.5, 'y': 12.01728516, 'z': '85th'},
- {'x': 80.5, 'y': 12.26383357, 'z': '90th'},
- {'x': 80.5, 'y': 12.6472562, 'z': '95th'},
- {'x': 80.5, 'y': 12.90856157, 'z': '97th'},
- {'x': 81.5, 'y': 9.867465098, 'z': '3rd'},
- {'x': 81.5, 'y': 10.02787289, 'z': '5th'},
- {'x': 81.5, 'y': 10.28455342, 'z': '10th'},
- {'x': 81.5, 'y': 10.7417502, 'z': '25th'},
- {'x': 81.5, 'y': 11.29597453, 'z': '50th'},
- {'x': 81.5, 'y': 11.90577397, 'z': '75th'},
- {'x': 81.5, 'y': 12.25882589, 'z': '85th'},
- {'x': 81.5, 'y': 12.50915553, 'z': '90th'},
- {'x': 81.5, 'y': 12.89812222, 'z': '95th'},
- {'x': 81.5, 'y': 13.16296835, 'z': '97th'},
- {'x': 82.5, 'y': 10.06464125, 'z': '3rd'},
- {'x': 82.5, 'y': 10.22838074, 'z': '5th'},
- {'x': 82.5, 'y': 10.49029047, 'z': '10th'},
- {'x': 82.5, 'y': 10.95648264, 'z': '25th'},
- {'x': 82.5, 'y': 11.52104655, 'z': '50th'},
- {'x': 82.5, 'y': 12.14148209, 'z': '75th'},
- {'x': 82.5, 'y': 12.50032738, 'z': '85th'},
- {'x': 82.5, 'y': 12.75459958, 'z': '90th'},
- {'x': 82.5, 'y': 13.14941636, 'z': '95th'},
- {'x': 82.5, 'y': 13.41805131, 'z': '97th'},
- {'x': 83.5, 'y': 10.26174496, 'z': '3rd'},
- {'x': 83.5, 'y': 10.4287674, 'z': '5th'},
- {'x': 83.5, 'y': 10.69584915, 'z': '10th'},
- {'x': 83.5, 'y': 11.17100044, 'z': '25th'},
- {'x': 83.5, 'y': 11.74597768, 'z': '50th'},
- {'x': 83.5, 'y': 12.37728721, 'z': '75th'},
- {'x': 83.5, 'y': 12.7421419, 'z': '85th'},
- {'x': 83.5, 'y': 13.00054571, 'z': '90th'},
- {'x': 83.5, 'y': 13.40156684, 'z': '95th'},
- {'x': 83.5, 'y': 13.6742748, 'z': '97th'},
- {'x': 84.5, 'y': 10.45903091, 'z': '3rd'},
- {'x': 84.5, 'y': 10.62928475, 'z': '5th'},
- {'x': 84.5, 'y': 10.90148006, 'z': '10th'},
- {'x': 84.5, 'y': 11.38556161, 'z': '25th'},
- {'x': 84.5, 'y': 11.97105103, 'z': '50th'},
- {'x': 84.5, 'y': 12.61351947, 'z': '75th'},
- {'x': 84.5, 'y': 12.98463561, 'z': '85th'},
- {'x': 84.5, 'y': 13.24738933, 'z': '90th'},
- {'x': 84.5, 'y': 13.6550202, 'z': '95th'},
- {'x': 84.5, 'y': 13.93212398, 'z': '97th'},
- {'x': 85.5, 'y': 10.65676178, 'z': '3rd'},
- {'x': 85.5, 'y': 10.83019257, 'z': '5th'},
- {'x': 85.5, 'y': 11.10744159, 'z': '10th'},
- {'x': 85.5, 'y': 11.60043192, 'z': '25th'},
- {'x': 85.5, 'y': 12.19655799, 'z': '50th'},
- {'x': 85.5, 'y': 12.85051907, 'z': '75th'},
- {'x': 85.5, 'y': 13.22818647, 'z': '85th'},
- {'x': 85.5, 'y': 13.49553926, 'z': '90th'},
- {'x': 85.5, 'y': 13.91023979, 'z': '95th'},
- {'x': 85.5, 'y': 14.19210372, 'z': '97th'},
- {'x': 86.5, 'y': 10.85520745, 'z': '3rd'},
- {'x': 86.5, 'y': 11.03175764, 'z': '5th'},
- {'x': 86.5, 'y': 11.31399881, 'z': '10th'},
- {'x': 86.5, 'y': 11.81588337, 'z': '25th'},
- {'x': 86.5, 'y': 12.4227963, 'z': '50th'},
- {'x': 86.5, 'y': 13.08863398, 'z': '75th'},
- {'x': 86.5, 'y': 13.47318203, 'z': '85th'},
- {'x': 86.5, 'y': 13.74541572, 'z': '90th'},
- {'x': 86.5, 'y': 14.1677042, 'z': '95th'},
- {'x': 86.5, 'y': 14.45473759, 'z': '97th'},
- {'x': 87.5, 'y': 11.0546442, 'z': '3rd'},
- {'x': 87.5, 'y': 11.2342528, 'z': '5th'},
- {'x': 87.5, 'y': 11.52142229, 'z': '10th'},
- {'x': 87.5, 'y': 12.03219261, 'z': '25th'},
- {'x': 87.5, 'y': 12.65006791, 'z': '50th'},
- {'x': 87.5, 'y': 13.32821763, 'z': '75th'},
- {'x': 87.5, 'y': 13.72001718, 'z': '85th'},
- {'x': 87.5, 'y': 13.99744832, 'z': '90th'},
- {'x': 87.5, 'y': 14.42790576, 'z': '95th'},
- {'x': 87.5, 'y': 14.72056689, 'z': '97th'},
- {'x': 88.5, 'y': 11.25535391, 'z': '3rd'},
- {'x': 88.5, 'y': 11.43795604, 'z': '5th'},
- {'x': 88.5, 'y': 11.729987, 'z': '10th'},
- {'x': 88.5, 'y': 12.24963938, 'z': '25th'},
- {'x': 88.5, 'y': 12.87867701, 'z': '50th'},
- {'x': 88.5, 'y': 13.56962661, 'z': '75th'},
- {'x': 88.5, 'y': 13.96909189, 'z': '85th'},
- {'x': 88.5, 'y': 14.25207386, 'z': '90th'},
- {'x': 88.5, 'y': 14.691349, 'z': '95th'},
- {'x': 88.5, 'y': 14.99014975, 'z': '97th'},
- {'x': 89.5, 'y': 11.45762324, 'z': '3rd'},
- {'x': 89.5, 'y': 11.64314963, 'z': '5th'},
- {'x': 89.5, 'y': 11.93997121, 'z': '10th'},
- {'x': 89.5, 'y': 12.46850502, 'z': '25th'},
- {'x': 89.5, 'y': 13.10892794, 'z': '50th'},
- {'x': 89.5, 'y': 13.81321822, 'z': '75th'},
- {'x': 89.5, 'y': 14.22080884, 'z': '85th'},
- {'x': 89.5, 'y': 14.50973427, 'z': '90th'},
- {'x': 89.5, 'y': 14.95854908, 'z': '95th'},
- {'x': 89.5, 'y': 15.26406025, 'z': '97th'},
- {'x': 90.5, 'y': 11.66174286, 'z': '3rd'},
- {'x': 90.5, 'y': 11.85011921, 'z': '5th'},
- {'x': 90.5, 'y': 12.15165548, 'z': '10th'},
- {'x': 90.5, 'y': 12.68907093, 'z': '25th'},
- {'x': 90.5, 'y': 13.34112314, 'z': '50th'},
- {'x': 90.5, 'y': 14.05934806, 'z': '75th'},
- {'x': 90.5, 'y': 14.47557099, 'z': '85th'},
- {'x': 90.5, 'y': 14.77087425, 'z': '90th'},
- {'x': 90.5, 'y': 15.23003025, 'z': '95th'},
- {'x': 90.5, 'y': 15.54288768, 'z': '97th'},
- {'x': 91.5, 'y': 11.86800626, 'z': '3rd'},
- {'x': 91.5, 'y': 12.05915274, 'z': '5th'},
- {'x': 91.5, 'y': 12.36532155, 'z': '10th'},
- {'x': 91.5, 'y': 12.91161745, 'z': '25th'},
- {'x': 91.5, 'y': 13.5755615, 'z': '50th'},
- {'x': 91.5, 'y': 14.30836781, 'z': '75th'},
- {'x': 91.5, 'y': 14.73377926, 'z': '85th'},
- {'x': 91.5, 'y': 15.03593913, 'z': '90th'},
- {'x': 91.5, 'y': 15.50632408, 'z': '95th'},
- {'x': 91.5, 'y': 15.82723547, 'z': '97th'},
- {'x': 92.5, 'y': 12.07670968, 'z': '3rd'},
- {'x': 92.5, 'y': 12.27054003, 'z': '5th'},
- {'x': 92.5, 'y': 12.58125142, 'z': '10th'},
- {'x': 92.5, 'y': 13.13642188, 'z': '25th'},
- {'x': 92.5, 'y': 13.81253552, 'z': '50th'},
- {'x': 92.5, 'y': 14.56062192, 'z': '75th'},
- {'x': 92.5, 'y': 14.99582939, 'z': '85th'},
- {'x': 92.5, 'y': 15.30537214, 'z': '90th'},
- {'x': 92.5, 'y': 15.78796821, 'z': '95th'},
- {'x': 92.5, 'y': 16.11772149, 'z': '97th'},
- {'x': 93.5, 'y': 12.28815023, 'z': '3rd'},
- {'x': 93.5, 'y': 12.48457136, 'z': '5th'},
- {'x': 93.5, 'y': 12.7997264, 'z': '10th'},
- {'x': 93.5, 'y': 13.36375794, 'z': '25th'},
- {'x': 93.5, 'y': 14.05233041, 'z': '50th'},
- {'x': 93.5, 'y': 14.81644595, 'z': '75th'},
- {'x': 93.5, 'y': 15.2621099, 'z': '85th'},
- {'x': 93.5, 'y': 15.57961215, 'z': '90th'},
- {'x': 93.5, 'y': 16.07550416, 'z': '95th'},
- {'x': 93.5, 'y': 16.41497639, 'z': '97th'},
- {'x': 94.5, 'y': 12.50262539, 'z': '3rd'},
- {'x': 94.5, 'y': 12.70153676, 'z': '5th'},
- {'x': 94.5, 'y': 13.02102616, 'z': '10th'},
- {'x': 94.5, 'y': 13.59389429, 'z': '25th'},
- {'x': 94.5, 'y': 14.29522185, 'z': '50th'},
- {'x': 94.5, 'y': 15.07616355, 'z': '75th'},
- {'x': 94.5, 'y': 15.53299897, 'z': '85th'},
- {'x': 94.5, 'y': 15.85909086, 'z': '90th'},
- {'x': 94.5, 'y': 16.36947582, 'z': '95th'},
- {'x': 94.5, 'y': 16.71964365, 'z': '97th'},
- {'x': 95.5, 'y': 12.72043131, 'z': '3rd'},
- {'x': 95.5, 'y': 12.92172471, 'z': '5th'},
- {'x': 95.5, 'y': 13.24542786, 'z': '10th'},
- {'x': 95.5, 'y': 13.82709389, 'z': '25th'},
- {'x': 95.5, 'y': 14.54147499, 'z': '50th'},
- {'x': 95.5, 'y': 15.3400845, 'z': '75th'},
- {'x': 95.5, 'y': 15.80886196, 'z': '85th'},
- {'x': 95.5, 'y': 16.14423022, 'z': '90th'},
- {'x': 95.5, 'y': 16.6704272, 'z': '95th'},
- {'x': 95.5, 'y': 17.03237842, 'z': '97th'},
- {'x': 96.5, 'y': 12.94186266, 'z': '3rd'},
- {'x': 96.5, 'y': 13.14542179, 'z': '5th'},
- {'x': 96.5, 'y': 13.47320539, 'z': '10th'},
- {'x': 96.5, 'y': 14.06361249, 'z': '25th'},
- {'x': 96.5, 'y': 14.79134177, 'z': '50th'},
- {'x': 96.5, 'y': 15.60850108, 'z': '75th'},
- {'x': 96.5, 'y': 16.09004772, 'z': '85th'},
- {'x': 96.5, 'y': 16.435439, 'z': '90th'},
- {'x': 96.5, 'y': 16.97890086, 'z': '95th'},
- {'x': 96.5, 'y': 17.35384839, 'z': '97th'},
- {'x': 97.5, 'y': 13.16720979, 'z': '3rd'},
- {'x': 97.5, 'y': 13.37291056, 'z': '5th'},
- {'x': 97.5, 'y': 13.70462839, 'z': '10th'},
- {'x': 97.5, 'y': 14.30369892, 'z': '25th'},
- {'x': 97.5, 'y': 15.04506152, 'z': '50th'},
- {'x': 97.5, 'y': 15.88168735, 'z': '75th'},
- {'x': 97.5, 'y': 16.37688676, 'z': '85th'},
- {'x': 97.5, 'y': 16.73311035, 'z': '90th'},
- {'x': 97.5, 'y': 17.29543503, 'z': '95th'},
- {'x': 97.5, 'y': 17.6847315, 'z': '97th'},
- {'x': 98.5, 'y': 13.39675772, 'z': '3rd'},
- {'x': 98.5, 'y': 13.60446875, 'z': '5th'},
- {'x': 98.5, 'y': 13.9399615, 'z': '10th'},
- {'x': 98.5, 'y': 14.54759427, 'z': '25th'},
- {'x': 98.5, 'y': 15.30285949, 'z': '50th'},
- {'x': 98.5, 'y': 16.15989645, 'z': '75th'},
- {'x': 98.5, 'y': 16.6696879, 'z': '85th'},
- {'x': 98.5, 'y': 17.03761835, 'z': '90th'},
- {'x': 98.5, 'y': 17.62056129, 'z': '95th'},
- {'x': 98.5, 'y': 18.02571601, 'z': '97th'},
- {'x': 99.5, 'y': 13.6307828, 'z': '3rd'},
- {'x': 99.5, 'y': 13.84036679, 'z': '5th'},
- {'x': 99.5, 'y': 14.17946326, 'z': '10th'},
- {'x': 99.5, 'y': 14.79553258, 'z': '25th'},
- {'x': 99.5, 'y': 15.56494815, 'z': '50th'},
- {'x': 99.5, 'y': 16.4433606, 'z': '75th'},
- {'x': 99.5, 'y': 16.96873685, 'z': '85th'},
- {'x': 99.5, 'y': 17.34931547, 'z': '90th'},
- {'x': 99.5, 'y': 17.95480122, 'z': '95th'},
- {'x': 99.5, 'y': 18.3774979, 'z': '97th'},
- {'x': 100.5, 'y': 13.86955335, 'z': '3rd'},
- {'x': 100.5, 'y': 14.08086791, 'z': '5th'},
- {'x': 100.5, 'y': 14.42338546, 'z': '10th'},
- {'x': 100.5, 'y': 15.04773906, 'z': '25th'},
- {'x': 100.5, 'y': 15.83152429, 'z': '50th'},
- {'x': 100.5, 'y': 16.73228676, 'z': '75th'},
- {'x': 100.5, 'y': 17.27429143, 'z': '85th'},
- {'x': 100.5, 'y': 17.66852815, 'z': '90th'},
- {'x': 100.5, 'y': 18.29866436, 'z': '95th'},
- {'x': 100.5, 'y': 18.74078304, 'z': '97th'},
- {'x': 101.5, 'y': 14.11332298, 'z': '3rd'},
- {'x': 101.5, 'y': 14.3262235, 'z': '5th'},
- {'x': 101.5, 'y': 14.6719715, 'z': '10th'},
- {'x': 101.5, 'y': 15.30443284, 'z': '25th'},
- {'x': 101.5, 'y': 16.10277448, 'z': '50th'},
- {'x': 101.5, 'y': 17.02686105, 'z': '75th'},
- {'x': 101.5, 'y': 17.58658316, 'z': '85th'},
- {'x': 101.5, 'y': 17.99555569, 'z': '90th'},
- {'x': 101.5, 'y': 18.65264302, 'z': '95th'},
- {'x': 101.5, 'y': 19.11628039, 'z': '97th'},
- {'x': 102.5, 'y': 14.3623275, 'z': '3rd'},
- {'x': 102.5, 'y': 14.57667057, 'z': '5th'},
- {'x': 102.5, 'y': 14.92545486, 'z': '10th'},
- {'x': 102.5, 'y': 15.56582724, 'z': '25th'},
- {'x': 102.5, 'y': 16.37887678, 'z': '50th'},
- {'x': 102.5, 'y': 17.32724961, 'z': '75th'},
- {'x': 102.5, 'y': 17.90581651, 'z': '85th'},
- {'x': 102.5, 'y': 18.33066799, 'z': '90th'},
- {'x': 102.5, 'y': 19.01720839, 'z': '95th'},
- {'x': 102.5, 'y': 19.5046992, 'z': '97th'},
- {'x': 103.5, 'y': 14.61678517, 'z': '3rd'},
- {'x': 103.5, 'y': 14.83243136, 'z': '5th'},
- {'x': 103.5, 'y': 15.18405792, 'z': '10th'},
- {'x': 103.5, 'y': 15.83212792, 'z': '25th'},
- {'x': 103.5, 'y': 16.65999867, 'z': '50th'},
- {'x': 103.5, 'y': 17.63359604, 'z': '75th'},
- {'x': 103.5, 'y': 18.23216547, 'z': '85th'},
- {'x': 103.5, 'y': 18.67410169, 'z': '90th'},
- {'x': 103.5, 'y': 19.39280771, 'z': '95th'},
- {'x': 103.5, 'y': 19.90675015, 'z': '97th'},
- {'x': 104.5, 'y': 14.8768847, 'z': '3rd'},
- {'x': 104.5, 'y': 15.09370466, 'z': '5th'},
- {'x': 104.5, 'y': 15.44798851, 'z': '10th'},
- {'x': 104.5, 'y': 16.10353776, 'z': '25th'},
- {'x': 104.5, 'y': 16.94630912, 'z': '50th'},
- {'x': 104.5, 'y': 17.94603443, 'z': '75th'},
- {'x': 104.5, 'y': 18.56578254, 'z': '85th'},
- {'x': 104.5, 'y': 19.02606388, 'z': '90th'},
- {'x': 104.5, 'y': 19.77985667, 'z': '95th'},
- {'x': 104.5, 'y': 20.32312999, 'z': '97th'},
- {'x': 105.5, 'y': 15.14278742, 'z': '3rd'},
- {'x': 105.5, 'y': 15.36066627, 'z': '5th'},
- {'x': 105.5, 'y': 15.71743814, 'z': '10th'},
- {'x': 105.5, 'y': 16.38025293, 'z': '25th'},
- {'x': 105.5, 'y': 17.23797444, 'z': '50th'},
- {'x': 105.5, 'y': 18.26468632, 'z': '75th'},
- {'x': 105.5, 'y': 18.90679586, 'z': '85th'},
- {'x': 105.5, 'y': 19.38672911, 'z': '90th'},
- {'x': 105.5, 'y': 20.1787374, 'z': '95th'},
- {'x': 105.5, 'y': 20.75452347, 'z': '97th'},
- {'x': 106.5, 'y': 15.41461403, 'z': '3rd'},
- {'x': 106.5, 'y': 15.63345894, 'z': '5th'},
- {'x': 106.5, 'y': 15.99257708, 'z': '10th'},
- {'x': 106.5, 'y': 16.66246685, 'z': '25th'},
- {'x': 106.5, 'y': 17.53517134, 'z': '50th'},
- {'x': 106.5, 'y': 18.58967772, 'z': '75th'},
- {'x': 106.5, 'y': 19.25532299, 'z': '85th'},
- {'x': 106.5, 'y': 19.75624737, 'z': '90th'},
- {'x': 106.5, 'y': 20.58979116, 'z': '95th'},
- {'x': 106.5, 'y': 21.20158343, 'z': '97th'},
- {'x': 107.5, 'y': 15.69244676, 'z': '3rd'},
- {'x': 107.5, 'y': 15.91219242, 'z': '5th'},
- {'x': 107.5, 'y': 16.27355169, 'z': '10th'},
- {'x': 107.5, 'y': 16.95036489, 'z': '25th'},
- {'x': 107.5, 'y': 17.83808212, 'z': '50th'},
- {'x': 107.5, 'y': 18.92113785, 'z': '75th'},
- {'x': 107.5, 'y': 19.61147125, 'z': '85th'},
- {'x': 107.5, 'y': 20.13474455, 'z': '90th'},
- {'x': 107.5, 'y': 21.01331726, 'z': '95th'},
- {'x': 107.5, 'y': 21.66492986, 'z': '97th'},
- {'x': 108.5, 'y': 15.97631447, 'z': '3rd'},
- {'x': 108.5, 'y': 16.19693164, 'z': '5th'},
- {'x': 108.5, 'y': 16.56047764, 'z': '10th'},
- {'x': 108.5, 'y': 17.24412681, 'z': '25th'},
- {'x': 108.5, 'y': 18.14690821, 'z': '50th'},
- {'x': 108.5, 'y': 19.25922069, 'z': '75th'},
- {'x': 108.5, 'y': 19.97535804, 'z': '85th'},
- {'x': 108.5, 'y': 20.52233698, 'z': '90th'},
- {'x': 108.5, 'y': 21.44956767, 'z': '95th'},
- {'x': 108.5, 'y': 22.14512329, 'z': '97th'},
- {'x': 109.5, 'y': 16.26619982, 'z': '3rd'},
- {'x': 109.5, 'y': 16.48769998, 'z': '5th'},
- {'x': 109.5, 'y': 16.85343765, 'z': '10th'},
- {'x': 109.5, 'y': 17.54391749, 'z': '25th'},
- {'x': 109.5, 'y': 18.46185811, 'z': '50th'},
- {'x': 109.5, 'y': 19.60409781, 'z': '75th'},
- {'x': 109.5, 'y': 20.34710882, 'z': '85th'},
- {'x': 109.5, 'y': 20.91913269, 'z': '90th'},
- {'x': 109.5, 'y': 21.89875002, 'z': '95th'},
- {'x': 109.5, 'y': 22.64266738, 'z': '97th'},
- {'x': 110.5, 'y': 16.56202375, 'z': '3rd'},
- {'x': 110.5, 'y': 16.78446659, 'z': '5th'},
- {'x': 110.5, 'y': 17.15247356, 'z': '10th'},
- {'x': 110.5, 'y': 17.84988762, 'z': '25th'},
- {'x': 110.5, 'y': 18.78315936, 'z': '50th'},
- {'x': 110.5, 'y': 19.95598136, 'z': '75th'},
- {'x': 110.5, 'y': 20.72688185, 'z': '85th'},
- {'x': 110.5, 'y': 21.32525216, 'z': '90th'},
- {'x': 110.5, 'y': 22.36102622, 'z': '95th'},
- {'x': 110.5, 'y': 23.15797665, 'z': '97th'},
- {'x': 111.5, 'y': 16.86365693, 'z': '3rd'},
- {'x': 111.5, 'y': 17.08715301, 'z': '5th'},
- {'x': 111.5, 'y': 17.4575854, 'z': '10th'},
- {'x': 111.5, 'y': 18.16216193, 'z': '25th'},
- {'x': 111.5, 'y': 19.11103983, 'z': '50th'},
- {'x': 111.5, 'y': 20.31510927, 'z': '75th'},
- {'x': 111.5, 'y': 21.11486155, 'z': '85th'},
- {'x': 111.5, 'y': 21.74082861, 'z': '90th'},
- {'x': 111.5, 'y': 22.83652027, 'z': '95th'},
- {'x': 111.5, 'y': 23.69138309, 'z': '97th'},
- {'x': 112.5, 'y': 17.17091316, 'z': '3rd'},
- {'x': 112.5, 'y': 17.39562697, 'z': '5th'},
- {'x': 112.5, 'y': 17.76872619, 'z': '10th'},
- {'x': 112.5, 'y': 18.48083577, 'z': '25th'},
- {'x': 112.5, 'y': 19.44572803, 'z': '50th'},
- {'x': 112.5, 'y': 20.68175356, 'z': '75th'},
- {'x': 112.5, 'y': 21.51127205, 'z': '85th'},
- {'x': 112.5, 'y': 22.16602327, 'z': '90th'},
- {'x': 112.5, 'y': 23.32532325, 'z': '95th'},
- {'x': 112.5, 'y': 24.24311525, 'z': '97th'},
- {'x': 113.5, 'y': 17.48355487, 'z': '3rd'},
- {'x': 113.5, 'y': 17.70970539, 'z': '5th'},
- {'x': 113.5, 'y': 18.08580073, 'z': '10th'},
- {'x': 113.5, 'y': 18.80596716, 'z': '25th'},
- {'x': 113.5, 'y': 19.78744004, 'z': '50th'},
- {'x': 113.5, 'y': 21.05620975, 'z': '75th'},
- {'x': 113.5, 'y': 21.91637379, 'z': '85th'},
- {'x': 113.5, 'y': 22.60102871, 'z': '90th'},
- {'x': 113.5, 'y': 23.82750255, 'z': '95th'},
- {'x': 113.5, 'y': 24.81329664, 'z': '97th'},
- {'x': 114.5, 'y': 17.80130995, 'z': '3rd'},
- {'x': 114.5, 'y': 18.02916633, 'z': '5th'},
- {'x': 114.5, 'y': 18.40866976, 'z': '10th'},
- {'x': 114.5, 'y': 19.13756712, 'z': '25th'},
- {'x': 114.5, 'y': 20.13635563, 'z': '50th'},
- {'x': 114.5, 'y': 21.43876754, 'z': '75th'},
- {'x': 114.5, 'y': 22.3304406, 'z': '85th'},
- {'x': 114.5, 'y': 23.04605609, 'z': '90th'},
- {'x': 114.5, 'y': 24.34311131, 'z': '95th'},
- {'x': 114.5, 'y': 25.40196582, 'z': '97th'},
- {'x': 115.5, 'y': 18.12386353, 'z': '3rd'},
- {'x': 115.5, 'y': 18.35374284, 'z': '5th'},
- {'x': 115.5, 'y': 18.73714656, 'z': '10th'},
- {'x': 115.5, 'y': 19.47560008, 'z': '25th'},
- {'x': 115.5, 'y': 20.49262111, 'z': '50th'},
- {'x': 115.5, 'y': 21.8297156, 'z': '75th'},
- {'x': 115.5, 'y': 22.75376667, 'z': '85th'},
- {'x': 115.5, 'y': 23.50134403, 'z': '90th'},
- {'x': 115.5, 'y': 24.87219375, 'z': '95th'},
- {'x': 115.5, 'y': 26.00905839, 'z': '97th'},
- {'x': 116.5, 'y': 18.45087764, 'z': '3rd'},
- {'x': 116.5, 'y': 18.68313795, 'z': '5th'},
- {'x': 116.5, 'y': 19.0710044, 'z': '10th'},
- {'x': 116.5, 'y': 19.81997697, 'z': '25th'},
- {'x': 116.5, 'y': 20.85632542, 'z': '50th'},
- {'x': 116.5, 'y': 22.22930525, 'z': '75th'},
- {'x': 116.5, 'y': 23.18663214, 'z': '85th'},
- {'x': 116.5, 'y': 23.96713325, 'z': '90th'},
- {'x': 116.5, 'y': 25.41479043, 'z': '95th'},
- {'x': 116.5, 'y': 26.63443908, 'z': '97th'},
- {'x': 117.5, 'y': 18.78199002, 'z': '3rd'},
- {'x': 117.5, 'y': 19.01702441, 'z': '5th'},
- {'x': 117.5, 'y': 19.40997727, 'z': '10th'},
- {'x': 117.5, 'y': 20.17055644, 'z': '25th'},
- {'x': 117.5, 'y': 21.2274989, 'z': '50th'},
- {'x': 117.5, 'y': 22.63774393, 'z': '75th'},
- {'x': 117.5, 'y': 23.62929478, 'z': '85th'},
- {'x': 117.5, 'y': 24.44365939, 'z': '90th'},
- {'x': 117.5, 'y': 25.97093854, 'z': '95th'},
- {'x': 117.5, 'y': 27.27790257, 'z': '97th'},
- {'x': 118.5, 'y': 19.11682286, 'z': '3rd'},
- {'x': 118.5, 'y': 19.35505216, 'z': '5th'},
- {'x': 118.5, 'y': 19.75376486, 'z': '10th'},
- {'x': 118.5, 'y': 20.52714418, 'z': '25th'},
- {'x': 118.5, 'y': 21.60610366, 'z': '50th'},
- {'x': 118.5, 'y': 23.05517462, 'z': '75th'},
- {'x': 118.5, 'y': 24.08196605, 'z': '85th'},
- {'x': 118.5, 'y': 24.93113135, 'z': '90th'},
- {'x': 118.5, 'y': 26.54066898, 'z': '95th'},
- {'x': 118.5, 'y': 27.93919453, 'z': '97th'},
- {'x': 119.5, 'y': 19.45497491, 'z': '3rd'},
- {'x': 119.5, 'y': 19.69684281, 'z': '5th'},
- {'x': 119.5, 'y': 20.1020308, 'z': '10th'},
- {'x': 119.5, 'y': 20.88949663, 'z': '25th'},
- {'x': 119.5, 'y': 21.9920407, 'z': '50th'},
- {'x': 119.5, 'y': 23.48168087, 'z': '75th'},
- {'x': 119.5, 'y': 24.54481209, 'z': '85th'},
- {'x': 119.5, 'y': 25.42972912, 'z': '90th'},
- {'x': 119.5, 'y': 27.12400191, 'z': '95th'},
- {'x': 119.5, 'y': 28.61800412, 'z': '97th'},
- {'x': 120.5, 'y': 19.79603451, 'z': '3rd'},
- {'x': 120.5, 'y': 20.0420005, 'z': '5th'},
- {'x': 120.5, 'y': 20.45440956, 'z': '10th'},
- {'x': 120.5, 'y': 21.25732015, 'z': '25th'},
- {'x': 120.5, 'y': 22.3851382, 'z': '50th'},
- {'x': 120.5, 'y': 23.91726195, 'z': '75th'},
- {'x': 120.5, 'y': 25.01792347, 'z': '85th'},
- {'x': 120.5, 'y': 25.93957405, 'z': '90th'},
- {'x': 120.5, 'y': 27.72093757, 'z': '95th'},
- {'x': 120.5, 'y': 29.31399641, 'z': '97th'},
- {'x': 121.5, 'y': 20.13956381, 'z': '3rd'},
- {'x': 121.5, 'y': 20.3900999, 'z': '5th'},
- {'x': 121.5, 'y': 20.81050076, 'z': '10th'},
- {'x': 121.5, 'y': 21.63027567, 'z': '25th'},
- {'x': 121.5, 'y': 22.78516628, 'z': '50th'},
- {'x': 121.5, 'y': 24.36185175, 'z': '75th'},
- {'x': 121.5, 'y': 25.50133046, 'z': '85th'},
- {'x': 121.5, 'y': 26.46073804, 'z': '90th'},
- {'x': 121.5, 'y': 28.33145034, 'z': '95th'},
- {'x': 121.5, 'y': 30.02679082, 'z': '97th'}
-]
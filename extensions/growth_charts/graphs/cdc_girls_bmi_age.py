@@ -1,2192 +0,0 @@
-cdc_girls_bmi_age = [
- {'x': 24.0, 'y': 14.147346696, 'z': '3rd'},
- {'x': 24.0, 'y': 14.397870893, 'z': '5th'},
- {'x': 24.0, 'y': 14.801340537, 'z': '10th'},
- {'x': 24.0, 'y': 15.528075872, 'z': '25th'},
- {'x': 24.0, 'y': 16.423396643, 'z': '50th'},
- {'x': 24.0, 'y': 17.427456589, 'z': '75th'},
- {'x': 24.0, 'y': 18.018205792, 'z': '85th'},
- {'x': 24.0, 'y': 18.441393172, 'z': '90th'},
- {'x': 24.0, 'y': 19.10623522, 'z': '95th'},
- {'x': 24.0, 'y': 19.564109584, 'z': '97th'},
- {'x': 24.5, 'y': 14.132262709, 'z': '3rd'},
- {'x': 24.5, 'y': 14.380186596, 'z': '5th'},
- {'x': 24.5, 'y': 14.77964811, 'z': '10th'},
- {'x': 24.5, 'y': 15.49975639, 'z': '25th'},
- {'x': 24.5, 'y': 16.388040561, 'z': '50th'},
- {'x': 24.5, 'y': 17.38581552, 'z': '75th'},
- {'x': 24.5, 'y': 17.973714126, 'z': '85th'},
- {'x': 24.5, 'y': 18.395263724, 'z': '90th'},
- {'x': 24.5, 'y': 19.058238445, 'z': '95th'},
- {'x': 24.5, 'y': 19.515343333, 'z': '97th'},
- {'x': 25.5, 'y': 14.102408138, 'z': '3rd'},
- {'x': 25.5, 'y': 14.345272624, 'z': '5th'},
- {'x': 25.5, 'y': 14.736946277, 'z': '10th'},
- {'x': 25.5, 'y': 15.444219009, 'z': '25th'},
- {'x': 25.5, 'y': 16.318971901, 'z': '50th'},
- {'x': 25.5, 'y': 17.304848111, 'z': '75th'},
- {'x': 25.5, 'y': 17.887488124, 'z': '85th'},
- {'x': 25.5, 'y': 18.306107823, 'z': '90th'},
- {'x': 25.5, 'y': 18.965949897, 'z': '95th'},
- {'x': 25.5, 'y': 19.421979887, 'z': '97th'},
- {'x': 26.5, 'y': 14.072973937, 'z': '3rd'},
- {'x': 26.5, 'y': 14.310968062, 'z': '5th'},
- {'x': 26.5, 'y': 14.695158096, 'z': '10th'},
- {'x': 26.5, 'y': 15.390148458, 'z': '25th'},
- {'x': 26.5, 'y': 16.252079845, 'z': '50th'},
- {'x': 26.5, 'y': 17.226931896, 'z': '75th'},
- {'x': 26.5, 'y': 17.804890513, 'z': '85th'},
- {'x': 26.5, 'y': 18.22103253, 'z': '90th'},
- {'x': 26.5, 'y': 18.878533884, 'z': '95th'},
- {'x': 26.5, 'y': 19.334103823, 'z': '97th'},
- {'x': 27.5, 'y': 14.043963369, 'z': '3rd'},
- {'x': 27.5, 'y': 14.277276856, 'z': '5th'},
- {'x': 27.5, 'y': 14.65428696, 'z': '10th'},
- {'x': 27.5, 'y': 15.337542177, 'z': '25th'},
- {'x': 27.5, 'y': 16.187346686, 'z': '50th'},
- {'x': 27.5, 'y': 17.152024977, 'z': '75th'},
- {'x': 27.5, 'y': 17.725863959, 'z': '85th'},
- {'x': 27.5, 'y': 18.139970156, 'z': '90th'},
- {'x': 27.5, 'y': 18.795909992, 'z': '95th'},
- {'x': 27.5, 'y': 19.251630386, 'z': '97th'},
- {'x': 28.5, 'y': 14.015380079, 'z': '3rd'},
- {'x': 28.5, 'y': 14.244203026, 'z': '5th'},
- {'x': 28.5, 'y': 14.614336009, 'z': '10th'},
- {'x': 28.5, 'y': 15.28639717, 'z': '25th'},
- {'x': 28.5, 'y': 16.124754481, 'z': '50th'},
- {'x': 28.5, 'y': 17.080085563, 'z': '75th'},
- {'x': 28.5, 'y': 17.650351371, 'z': '85th'},
- {'x': 28.5, 'y': 18.062853342, 'z': '90th'},
- {'x': 28.5, 'y': 18.717998385, 'z': '95th'},
- {'x': 28.5, 'y': 19.17447582, 'z': '97th'},
- {'x': 29.5, 'y': 13.987225686, 'z': '3rd'},
- {'x': 29.5, 'y': 14.211749089, 'z': '5th'},
- {'x': 29.5, 'y': 14.57530775, 'z': '10th'},
- {'x': 29.5, 'y': 15.236711339, 'z': '25th'},
- {'x': 29.5, 'y': 16.064287623, 'z': '50th'},
- {'x': 29.5, 'y': 17.011074569, 'z': '75th'},
- {'x': 29.5, 'y': 17.578297744, 'z': '85th'},
- {'x': 29.5, 'y': 17.98961595, 'z': '90th'},
- {'x': 29.5, 'y': 18.644718454, 'z': '95th'},
- {'x': 29.5, 'y': 19.102553916, 'z': '97th'},
- {'x': 30.5, 'y': 13.959502456, 'z': '3rd'},
- {'x': 30.5, 'y': 14.179917754, 'z': '5th'},
- {'x': 30.5, 'y': 14.537204368, 'z': '10th'},
- {'x': 30.5, 'y': 15.188481892, 'z': '25th'},
- {'x': 30.5, 'y': 16.005930007, 'z': '50th'},
- {'x': 30.5, 'y': 16.944952957, 'z': '75th'},
- {'x': 30.5, 'y': 17.509648394, 'z': '85th'},
- {'x': 30.5, 'y': 17.920192311, 'z': '90th'},
- {'x': 30.5, 'y': 18.575990295, 'z': '95th'},
- {'x': 30.5, 'y': 19.035779479, 'z': '97th'},
- {'x': 31.5, 'y': 13.932212067, 'z': '3rd'},
- {'x': 31.5, 'y': 14.148711114, 'z': '5th'},
- {'x': 31.5, 'y': 14.500027518, 'z': '10th'},
- {'x': 31.5, 'y': 15.141705982, 'z': '25th'},
- {'x': 31.5, 'y': 15.94966631, 'z': '50th'},
- {'x': 31.5, 'y': 16.881683082, 'z': '75th'},
- {'x': 31.5, 'y': 17.44434994, 'z': '85th'},
- {'x': 31.5, 'y': 17.854517726, 'z': '90th'},
- {'x': 31.5, 'y': 18.511734023, 'z': '95th'},
- {'x': 31.5, 'y': 18.974066505, 'z': '97th'},
- {'x': 32.5, 'y': 13.905355619, 'z': '3rd'},
- {'x': 32.5, 'y': 14.118130621, 'z': '5th'},
- {'x': 32.5, 'y': 14.463778266, 'z': '10th'},
- {'x': 32.5, 'y': 15.09638064, 'z': '25th'},
- {'x': 32.5, 'y': 15.895481969, 'z': '50th'},
- {'x': 32.5, 'y': 16.821228771, 'z': '75th'},
- {'x': 32.5, 'y': 17.38235043, 'z': '85th'},
- {'x': 32.5, 'y': 17.79252859, 'z': '90th'},
- {'x': 32.5, 'y': 18.451869784, 'z': '95th'},
- {'x': 32.5, 'y': 18.917328006, 'z': '97th'},
- {'x': 33.5, 'y': 13.878934916, 'z': '3rd'},
- {'x': 33.5, 'y': 14.088177926, 'z': '5th'},
- {'x': 33.5, 'y': 14.428457281, 'z': '10th'},
- {'x': 33.5, 'y': 15.052502026, 'z': '25th'},
- {'x': 33.5, 'y': 15.843361791, 'z': '50th'},
- {'x': 33.5, 'y': 16.763553999, 'z': '75th'},
- {'x': 33.5, 'y': 17.323598458, 'z': '85th'},
- {'x': 33.5, 'y': 17.734162013, 'z': '90th'},
- {'x': 33.5, 'y': 18.396318479, 'z': '95th'},
- {'x': 33.5, 'y': 18.865477706, 'z': '97th'},
- {'x': 34.5, 'y': 13.852951, 'z': '3rd'},
- {'x': 34.5, 'y': 14.058853902, 'z': '5th'},
- {'x': 34.5, 'y': 14.394064562, 'z': '10th'},
- {'x': 34.5, 'y': 15.01006617, 'z': '25th'},
- {'x': 34.5, 'y': 15.793291456, 'z': '50th'},
- {'x': 34.5, 'y': 16.708624489, 'z': '75th'},
- {'x': 34.5, 'y': 17.268044363, 'z': '85th'},
- {'x': 34.5, 'y': 17.679356461, 'z': '90th'},
- {'x': 34.5, 'y': 18.345000987, 'z': '95th'},
- {'x': 34.5, 'y': 18.818427839, 'z': '97th'},
- {'x': 35.5, 'y': 13.827405171, 'z': '3rd'},
- {'x': 35.5, 'y': 14.030159316, 'z': '5th'},
- {'x': 35.5, 'y': 14.360599593, 'z': '10th'},
- {'x': 35.5, 'y': 14.969068383, 'z': '25th'},
- {'x': 35.5, 'y': 15.7452564, 'z': '50th'},
- {'x': 35.5, 'y': 16.656406634, 'z': '75th'},
- {'x': 35.5, 'y': 17.215639512, 'z': '85th'},
- {'x': 35.5, 'y': 17.62805146, 'z': '90th'},
- {'x': 35.5, 'y': 18.29783876, 'z': '95th'},
- {'x': 35.5, 'y': 18.776090501, 'z': '97th'},
- {'x': 36.5, 'y': 13.80229888, 'z': '3rd'},
- {'x': 36.5, 'y': 14.002094761, 'z': '5th'},
- {'x': 36.5, 'y': 14.328061331, 'z': '10th'},
- {'x': 36.5, 'y': 14.929503293, 'z': '25th'},
- {'x': 36.5, 'y': 15.699241878, 'z': '50th'},
- {'x': 36.5, 'y': 16.606867606, 'z': '75th'},
- {'x': 36.5, 'y': 17.166336426, 'z': '85th'},
- {'x': 36.5, 'y': 17.580187701, 'z': '90th'},
- {'x': 36.5, 'y': 18.254753806, 'z': '95th'},
- {'x': 36.5, 'y': 18.738377432, 'z': '97th'},
- {'x': 37.5, 'y': 13.777633819, 'z': '3rd'},
- {'x': 37.5, 'y': 13.974660728, 'z': '5th'},
- {'x': 37.5, 'y': 14.296448228, 'z': '10th'},
- {'x': 37.5, 'y': 14.891364776, 'z': '25th'},
- {'x': 37.5, 'y': 15.655232823, 'z': '50th'},
- {'x': 37.5, 'y': 16.559975226, 'z': '75th'},
- {'x': 37.5, 'y': 17.120088721, 'z': '85th'},
- {'x': 37.5, 'y': 17.535707053, 'z': '90th'},
- {'x': 37.5, 'y': 18.215668786, 'z': '95th'},
- {'x': 37.5, 'y': 18.705200107, 'z': '97th'},
- {'x': 38.5, 'y': 13.753412006, 'z': '3rd'},
- {'x': 38.5, 'y': 13.947857672, 'z': '5th'},
- {'x': 38.5, 'y': 14.26575827, 'z': '10th'},
- {'x': 38.5, 'y': 14.854645913, 'z': '25th'},
- {'x': 38.5, 'y': 15.613213709, 'z': '50th'},
- {'x': 38.5, 'y': 16.515697825, 'z': '75th'},
- {'x': 38.5, 'y': 17.076851036, 'z': '85th'},
- {'x': 38.5, 'y': 17.494552559, 'z': '90th'},
- {'x': 38.5, 'y': 18.180507113, 'z': '95th'},
- {'x': 38.5, 'y': 18.67646985, 'z': '97th'},
- {'x': 39.5, 'y': 13.729635856, 'z': '3rd'},
- {'x': 39.5, 'y': 13.921686084, 'z': '5th'},
- {'x': 39.5, 'y': 14.235989016, 'z': '10th'},
- {'x': 39.5, 'y': 14.819338961, 'z': '25th'},
- {'x': 39.5, 'y': 15.573168427, 'z': '50th'},
- {'x': 39.5, 'y': 16.474004103, 'z': '75th'},
- {'x': 39.5, 'y': 17.036578944, 'z': '85th'},
- {'x': 39.5, 'y': 17.456668415, 'z': '90th'},
- {'x': 39.5, 'y': 18.149193044, 'z': '95th'},
- {'x': 39.5, 'y': 18.65209796, 'z': '97th'},
- {'x': 40.5, 'y': 13.706308243, 'z': '3rd'},
- {'x': 40.5, 'y': 13.89614655, 'z': '5th'},
- {'x': 40.5, 'y': 14.207137655, 'z': '10th'},
- {'x': 40.5, 'y': 14.785435347, 'z': '25th'},
- {'x': 40.5, 'y': 15.53508019, 'z': '50th'},
- {'x': 40.5, 'y': 16.43486298, 'z': '75th'},
- {'x': 40.5, 'y': 16.99922885, 'z': '85th'},
- {'x': 40.5, 'y': 17.421999927, 'z': '90th'},
- {'x': 40.5, 'y': 18.121651762, 'z': '95th'},
- {'x': 40.5, 'y': 18.631995848, 'z': '97th'},
- {'x': 41.5, 'y': 13.683432543, 'z': '3rd'},
- {'x': 41.5, 'y': 13.871239805, 'z': '5th'},
- {'x': 41.5, 'y': 14.179201053, 'z': '10th'},
- {'x': 41.5, 'y': 14.752925677, 'z': '25th'},
- {'x': 41.5, 'y': 15.498931449, 'z': '50th'},
- {'x': 41.5, 'y': 16.398243466, 'z': '75th'},
- {'x': 41.5, 'y': 16.964757881, 'z': '85th'},
- {'x': 41.5, 'y': 17.390493465, 'z': '90th'},
- {'x': 41.5, 'y': 18.097809453, 'z': '95th'},
- {'x': 41.5, 'y': 18.616075182, 'z': '97th'},
- {'x': 42.5, 'y': 13.661012663, 'z': '3rd'},
- {'x': 42.5, 'y': 13.846966782, 'z': '5th'},
- {'x': 42.5, 'y': 14.152175814, 'z': '10th'},
- {'x': 42.5, 'y': 14.721799767, 'z': '25th'},
- {'x': 42.5, 'y': 15.464703844, 'z': '50th'},
- {'x': 42.5, 'y': 16.364114526, 'z': '75th'},
- {'x': 42.5, 'y': 16.933123775, 'z': '85th'},
- {'x': 42.5, 'y': 17.362096391, 'z': '90th'},
- {'x': 42.5, 'y': 18.077593361, 'z': '95th'},
- {'x': 42.5, 'y': 18.604248022, 'z': '97th'},
- {'x': 43.5, 'y': 13.639053056, 'z': '3rd'},
- {'x': 43.5, 'y': 13.823328646, 'z': '5th'},
- {'x': 43.5, 'y': 14.126058333, 'z': '10th'},
- {'x': 43.5, 'y': 14.692046682, 'z': '25th'},
- {'x': 43.5, 'y': 15.432378168, 'z': '50th'},
- {'x': 43.5, 'y': 16.33244497, 'z': '75th'},
- {'x': 43.5, 'y': 16.904284765, 'z': '85th'},
- {'x': 43.5, 'y': 17.336756988, 'z': '90th'},
- {'x': 43.5, 'y': 18.06093184, 'z': '95th'},
- {'x': 43.5, 'y': 18.596426962, 'z': '97th'},
- {'x': 44.5, 'y': 13.61755872, 'z': '3rd'},
- {'x': 44.5, 'y': 13.800326818, 'z': '5th'},
- {'x': 44.5, 'y': 14.100844852, 'z': '10th'},
- {'x': 44.5, 'y': 14.663654798, 'z': '25th'},
- {'x': 44.5, 'y': 15.401934364, 'z': '50th'},
- {'x': 44.5, 'y': 16.303203361, 'z': '75th'},
- {'x': 44.5, 'y': 16.878199474, 'z': '85th'},
- {'x': 44.5, 'y': 17.314424377, 'z': '90th'},
- {'x': 44.5, 'y': 18.047754376, 'z': '95th'},
- {'x': 44.5, 'y': 18.592525257, 'z': '97th'},
- {'x': 45.5, 'y': 13.596535179, 'z': '3rd'},
- {'x': 45.5, 'y': 13.777962994, 'z': '5th'},
- {'x': 45.5, 'y': 14.076531506, 'z': '10th'},
- {'x': 45.5, 'y': 14.636611864, 'z': '25th'},
- {'x': 45.5, 'y': 15.373351541, 'z': '50th'},
- {'x': 45.5, 'y': 16.276357932, 'z': '75th'},
- {'x': 45.5, 'y': 16.85482681, 'z': '85th'},
- {'x': 45.5, 'y': 17.295048432, 'z': '90th'},
- {'x': 45.5, 'y': 18.037991607, 'z': '95th'},
- {'x': 45.5, 'y': 18.592456941, 'z': '97th'},
- {'x': 46.5, 'y': 13.575988043, 'z': '3rd'},
- {'x': 46.5, 'y': 13.756238848, 'z': '5th'},
- {'x': 46.5, 'y': 14.053114249, 'z': '10th'},
- {'x': 46.5, 'y': 14.610905234, 'z': '25th'},
- {'x': 46.5, 'y': 15.346608415, 'z': '50th'},
- {'x': 46.5, 'y': 16.251877027, 'z': '75th'},
- {'x': 46.5, 'y': 16.834126282, 'z': '85th'},
- {'x': 46.5, 'y': 17.278579949, 'z': '90th'},
- {'x': 46.5, 'y': 18.03157513, 'z': '95th'},
- {'x': 46.5, 'y': 18.596136244, 'z': '97th'},
- {'x': 47.5, 'y': 13.555924551, 'z': '3rd'},
- {'x': 47.5, 'y': 13.735157169, 'z': '5th'},
- {'x': 47.5, 'y': 14.030589356, 'z': '10th'},
- {'x': 47.5, 'y': 14.586521343, 'z': '25th'},
- {'x': 47.5, 'y': 15.321681814, 'z': '50th'},
- {'x': 47.5, 'y': 16.229727186, 'z': '75th'},
- {'x': 47.5, 'y': 16.816056377, 'z': '85th'},
- {'x': 47.5, 'y': 17.264969598, 'z': '90th'},
- {'x': 47.5, 'y': 18.028438215, 'z': '95th'},
- {'x': 47.5, 'y': 18.603480298, 'z': '97th'},
- {'x': 48.5, 'y': 13.536351244, 'z': '3rd'},
- {'x': 48.5, 'y': 13.714720207, 'z': '5th'},
- {'x': 48.5, 'y': 14.008952792, 'z': '10th'},
- {'x': 48.5, 'y': 14.563446653, 'z': '25th'},
- {'x': 48.5, 'y': 15.298548972, 'z': '50th'},
- {'x': 48.5, 'y': 16.209875826, 'z': '75th'},
- {'x': 48.5, 'y': 16.800576707, 'z': '85th'},
- {'x': 48.5, 'y': 17.25416922, 'z': '90th'},
- {'x': 48.5, 'y': 18.028514727, 'z': '95th'},
- {'x': 48.5, 'y': 18.614405449, 'z': '97th'},
- {'x': 49.5, 'y': 13.517275373, 'z': '3rd'},
- {'x': 49.5, 'y': 13.694930704, 'z': '5th'},
- {'x': 49.5, 'y': 13.988200661, 'z': '10th'},
- {'x': 49.5, 'y': 14.541667175, 'z': '25th'},
- {'x': 49.5, 'y': 15.277186179, 'z': '50th'},
- {'x': 49.5, 'y': 16.192289515, 'z': '75th'},
- {'x': 49.5, 'y': 16.787646543, 'z': '85th'},
- {'x': 49.5, 'y': 17.24613088, 'z': '90th'},
- {'x': 49.5, 'y': 18.031739765, 'z': '95th'},
- {'x': 49.5, 'y': 18.628829714, 'z': '97th'},
- {'x': 50.5, 'y': 13.498704486, 'z': '3rd'},
- {'x': 50.5, 'y': 13.675791616, 'z': '5th'},
- {'x': 50.5, 'y': 13.968329123, 'z': '10th'},
- {'x': 50.5, 'y': 14.521168674, 'z': '25th'},
- {'x': 50.5, 'y': 15.257569204, 'z': '50th'},
- {'x': 50.5, 'y': 16.176934406, 'z': '75th'},
- {'x': 50.5, 'y': 16.777225115, 'z': '85th'},
- {'x': 50.5, 'y': 17.240807008, 'z': '90th'},
- {'x': 50.5, 'y': 18.038049459, 'z': '95th'},
- {'x': 50.5, 'y': 18.646672252, 'z': '97th'},
- {'x': 51.5, 'y': 13.480646369, 'z': '3rd'},
- {'x': 51.5, 'y': 13.657306081, 'z': '5th'},
- {'x': 51.5, 'y': 13.949334411, 'z': '10th'},
- {'x': 51.5, 'y': 14.501936743, 'z': '25th'},
- {'x': 51.5, 'y': 15.239673384, 'z': '50th'},
- {'x': 51.5, 'y': 16.163776261, 'z': '75th'},
- {'x': 51.5, 'y': 16.769271588, 'z': '85th'},
- {'x': 51.5, 'y': 17.238150343, 'z': '90th'},
- {'x': 51.5, 'y': 18.047380913, 'z': '95th'},
- {'x': 51.5, 'y': 18.667853383, 'z': '97th'},
- {'x': 52.5, 'y': 13.463108985, 'z': '3rd'},
- {'x': 52.5, 'y': 13.639477387, 'z': '5th'},
- {'x': 52.5, 'y': 13.931212834, 'z': '10th'},
- {'x': 52.5, 'y': 14.48395686, 'z': '25th'},
- {'x': 52.5, 'y': 15.22347371, 'z': '50th'},
- {'x': 52.5, 'y': 16.152780494, 'z': '75th'},
- {'x': 52.5, 'y': 16.763745045, 'z': '85th'},
- {'x': 52.5, 'y': 17.238113886, 'z': '90th'},
- {'x': 52.5, 'y': 18.059672159, 'z': '95th'},
- {'x': 52.5, 'y': 18.692294602, 'z': '97th'},
- {'x': 53.5, 'y': 13.446100408, 'z': '3rd'},
- {'x': 53.5, 'y': 13.622308935, 'z': '5th'},
- {'x': 53.5, 'y': 13.913960785, 'z': '10th'},
- {'x': 53.5, 'y': 14.467214453, 'z': '25th'},
- {'x': 53.5, 'y': 15.208944907, 'z': '50th'},
- {'x': 53.5, 'y': 16.143912214, 'z': '75th'},
- {'x': 53.5, 'y': 16.760604487, 'z': '85th'},
- {'x': 53.5, 'y': 17.240650859, 'z': '90th'},
- {'x': 53.5, 'y': 18.074862097, 'z': '95th'},
- {'x': 53.5, 'y': 18.719918588, 'z': '97th'},
- {'x': 54.5, 'y': 13.429628773, 'z': '3rd'},
- {'x': 54.5, 'y': 13.605804206, 'z': '5th'},
- {'x': 54.5, 'y': 13.897574735, 'z': '10th'},
- {'x': 54.5, 'y': 14.451694946, 'z': '25th'},
- {'x': 54.5, 'y': 15.19606152, 'z': '50th'},
- {'x': 54.5, 'y': 16.137136281, 'z': '75th'},
- {'x': 54.5, 'y': 16.759808835, 'z': '85th'},
- {'x': 54.5, 'y': 17.245714673, 'z': '90th'},
- {'x': 54.5, 'y': 18.092890445, 'z': '95th'},
- {'x': 54.5, 'y': 18.75064919, 'z': '97th'},
- {'x': 55.5, 'y': 13.413702215, 'z': '3rd'},
- {'x': 55.5, 'y': 13.589966725, 'z': '5th'},
- {'x': 55.5, 'y': 13.882051234, 'z': '10th'},
- {'x': 55.5, 'y': 14.437383801, 'z': '25th'},
- {'x': 55.5, 'y': 15.184797987, 'z': '50th'},
- {'x': 55.5, 'y': 16.132417356, 'z': '75th'},
- {'x': 55.5, 'y': 16.761316945, 'z': '85th'},
- {'x': 55.5, 'y': 17.25325891, 'z': '90th'},
- {'x': 55.5, 'y': 18.11369768, 'z': '95th'},
- {'x': 55.5, 'y': 18.784411416, 'z': '97th'},
- {'x': 56.5, 'y': 13.39832882, 'z': '3rd'},
- {'x': 56.5, 'y': 13.574800023, 'z': '5th'},
- {'x': 56.5, 'y': 13.867386898, 'z': '10th'},
- {'x': 56.5, 'y': 14.424266556, 'z': '25th'},
- {'x': 56.5, 'y': 15.175128708, 'z': '50th'},
- {'x': 56.5, 'y': 16.129719963, 'z': '75th'},
- {'x': 56.5, 'y': 16.765087627, 'z': '85th'},
- {'x': 56.5, 'y': 17.263237299, 'z': '90th'},
- {'x': 56.5, 'y': 18.137224989, 'z': '95th'},
- {'x': 56.5, 'y': 18.821131412, 'z': '97th'},
- {'x': 57.5, 'y': 13.383516577, 'z': '3rd'},
- {'x': 57.5, 'y': 13.560307612, 'z': '5th'},
- {'x': 57.5, 'y': 13.853578403, 'z': '10th'},
- {'x': 57.5, 'y': 14.412328855, 'z': '25th'},
- {'x': 57.5, 'y': 15.167028107, 'z': '50th'},
- {'x': 57.5, 'y': 16.129008536, 'z': '75th'},
- {'x': 57.5, 'y': 16.771079664, 'z': '85th'},
- {'x': 57.5, 'y': 17.275603717, 'z': '90th'},
- {'x': 57.5, 'y': 18.163414224, 'z': '95th'},
- {'x': 57.5, 'y': 18.86073644, 'z': '97th'},
- {'x': 58.5, 'y': 13.36927334, 'z': '3rd'},
- {'x': 58.5, 'y': 13.546492949, 'z': '5th'},
- {'x': 58.5, 'y': 13.840622473, 'z': '10th'},
- {'x': 58.5, 'y': 14.40155647, 'z': '25th'},
- {'x': 58.5, 'y': 15.160470684, 'z': '50th'},
- {'x': 58.5, 'y': 16.130247479, 'z': '75th'},
- {'x': 58.5, 'y': 16.779251844, 'z': '85th'},
- {'x': 58.5, 'y': 17.290312174, 'z': '90th'},
- {'x': 58.5, 'y': 18.192207855, 'z': '95th'},
- {'x': 58.5, 'y': 18.903154848, 'z': '97th'},
- {'x': 59.5, 'y': 13.355606788, 'z': '3rd'},
- {'x': 59.5, 'y': 13.53335941, 'z': '5th'},
- {'x': 59.5, 'y': 13.828515869, 'z': '10th'},
- {'x': 59.5, 'y': 14.391935319, 'z': '25th'},
- {'x': 59.5, 'y': 15.155431067, 'z': '50th'},
- {'x': 59.5, 'y': 16.133401214, 'z': '75th'},
- {'x': 59.5, 'y': 16.789562983, 'z': '85th'},
- {'x': 59.5, 'y': 17.307316823, 'z': '90th'},
- {'x': 59.5, 'y': 18.223548932, 'z': '95th'},
- {'x': 59.5, 'y': 18.948316041, 'z': '97th'},
- {'x': 60.5, 'y': 13.342524394, 'z': '3rd'},
- {'x': 60.5, 'y': 13.520910267, 'z': '5th'},
- {'x': 60.5, 'y': 13.817255378, 'z': '10th'},
- {'x': 60.5, 'y': 14.383451481, 'z': '25th'},
- {'x': 60.5, 'y': 15.15188405, 'z': '50th'},
- {'x': 60.5, 'y': 16.138434225, 'z': '75th'},
- {'x': 60.5, 'y': 16.801971953, 'z': '85th'},
- {'x': 60.5, 'y': 17.326571961, 'z': '90th'},
- {'x': 60.5, 'y': 18.257381051, 'z': '95th'},
- {'x': 60.5, 'y': 18.996150455, 'z': '97th'},
- {'x': 61.5, 'y': 13.330033218, 'z': '3rd'},
- {'x': 61.5, 'y': 13.509148527, 'z': '5th'},
- {'x': 61.5, 'y': 13.806837729, 'z': '10th'},
- {'x': 61.5, 'y': 14.376091247, 'z': '25th'},
- {'x': 61.5, 'y': 15.149804788, 'z': '50th'},
- {'x': 61.5, 'y': 16.145311331, 'z': '75th'},
- {'x': 61.5, 'y': 16.816437922, 'z': '85th'},
- {'x': 61.5, 'y': 17.348032183, 'z': '90th'},
- {'x': 61.5, 'y': 18.293648259, 'z': '95th'},
- {'x': 61.5, 'y': 19.04658918, 'z': '97th'},
- {'x': 62.5, 'y': 13.318140526, 'z': '3rd'},
- {'x': 62.5, 'y': 13.498077398, 'z': '5th'},
- {'x': 62.5, 'y': 13.797259824, 'z': '10th'},
- {'x': 62.5, 'y': 14.369840963, 'z': '25th'},
- {'x': 62.5, 'y': 15.14916825, 'z': '50th'},
- {'x': 62.5, 'y': 16.15399692, 'z': '75th'},
- {'x': 62.5, 'y': 16.832919646, 'z': '85th'},
- {'x': 62.5, 'y': 17.371651874, 'z': '90th'},
- {'x': 62.5, 'y': 18.332295253, 'z': '95th'},
- {'x': 62.5, 'y': 19.099565142, 'z': '97th'},
- {'x': 63.5, 'y': 13.306853097, 'z': '3rd'},
- {'x': 63.5, 'y': 13.487699767, 'z': '5th'},
- {'x': 63.5, 'y': 13.788518477, 'z': '10th'},
- {'x': 63.5, 'y': 14.364687203, 'z': '25th'},
- {'x': 63.5, 'y': 15.149949835, 'z': '50th'},
- {'x': 63.5, 'y': 16.164455811, 'z': '75th'},
- {'x': 63.5, 'y': 16.85137625, 'z': '85th'},
- {'x': 63.5, 'y': 17.397385753, 'z': '90th'},
- {'x': 63.5, 'y': 18.373267126, 'z': '95th'},
- {'x': 63.5, 'y': 19.15501183, 'z': '97th'},
- {'x': 64.5, 'y': 13.296176731, 'z': '3rd'},
- {'x': 64.5, 'y': 13.47801782, 'z': '5th'},
- {'x': 64.5, 'y': 13.78061022, 'z': '10th'},
- {'x': 64.5, 'y': 14.360616901, 'z': '25th'},
- {'x': 64.5, 'y': 15.152125852, 'z': '50th'},
- {'x': 64.5, 'y': 16.176653938, 'z': '75th'},
- {'x': 64.5, 'y': 16.871767854, 'z': '85th'},
- {'x': 64.5, 'y': 17.425189324, 'z': '90th'},
- {'x': 64.5, 'y': 18.41650918, 'z': '95th'},
- {'x': 64.5, 'y': 19.212862288, 'z': '97th'},
- {'x': 65.5, 'y': 13.286118046, 'z': '3rd'},
- {'x': 65.5, 'y': 13.469034401, 'z': '5th'},
- {'x': 65.5, 'y': 13.773531971, 'z': '10th'},
- {'x': 65.5, 'y': 14.357616867, 'z': '25th'},
- {'x': 65.5, 'y': 15.155671862, 'z': '50th'},
- {'x': 65.5, 'y': 16.190556027, 'z': '75th'},
- {'x': 65.5, 'y': 16.894053448, 'z': '85th'},
- {'x': 65.5, 'y': 17.455017345, 'z': '90th'},
- {'x': 65.5, 'y': 18.461967542, 'z': '95th'},
- {'x': 65.5, 'y': 19.273052614, 'z': '97th'},
- {'x': 66.5, 'y': 13.276682823, 'z': '3rd'},
- {'x': 66.5, 'y': 13.460751754, 'z': '5th'},
- {'x': 66.5, 'y': 13.76728041, 'z': '10th'},
- {'x': 66.5, 'y': 14.355674218, 'z': '25th'},
- {'x': 66.5, 'y': 15.160564192, 'z': '50th'},
- {'x': 66.5, 'y': 16.206127738, 'z': '75th'},
- {'x': 66.5, 'y': 16.918192851, 'z': '85th'},
- {'x': 66.5, 'y': 17.486825227, 'z': '90th'},
- {'x': 66.5, 'y': 18.509588576, 'z': '95th'},
- {'x': 66.5, 'y': 19.335518754, 'z': '97th'},
- {'x': 67.5, 'y': 13.267876512, 'z': '3rd'},
- {'x': 67.5, 'y': 13.453171909, 'z': '5th'},
- {'x': 67.5, 'y': 13.76185216, 'z': '10th'},
- {'x': 67.5, 'y': 14.354776232, 'z': '25th'},
- {'x': 67.5, 'y': 15.166779473, 'z': '50th'},
- {'x': 67.5, 'y': 16.223335021, 'z': '75th'},
- {'x': 67.5, 'y': 16.94414613, 'z': '85th'},
- {'x': 67.5, 'y': 17.520568625, 'z': '90th'},
- {'x': 67.5, 'y': 18.559319065, 'z': '95th'},
- {'x': 67.5, 'y': 19.400197469, 'z': '97th'},
- {'x': 68.5, 'y': 13.259704231, 'z': '3rd'},
- {'x': 68.5, 'y': 13.44629667, 'z': '5th'},
- {'x': 68.5, 'y': 13.757243777, 'z': '10th'},
- {'x': 68.5, 'y': 14.354910348, 'z': '25th'},
- {'x': 68.5, 'y': 15.174294641, 'z': '50th'},
- {'x': 68.5, 'y': 16.242144139, 'z': '75th'},
- {'x': 68.5, 'y': 16.971873618, 'z': '85th'},
- {'x': 68.5, 'y': 17.556203454, 'z': '90th'},
- {'x': 68.5, 'y': 18.611106202, 'z': '95th'},
- {'x': 68.5, 'y': 19.46702632, 'z': '97th'},
- {'x': 69.5, 'y': 13.252170761, 'z': '3rd'},
- {'x': 69.5, 'y': 13.440127612, 'z': '5th'},
- {'x': 69.5, 'y': 13.753451746, 'z': '10th'},
- {'x': 69.5, 'y': 14.356064151, 'z': '25th'},
- {'x': 69.5, 'y': 15.183086936, 'z': '50th'},
- {'x': 69.5, 'y': 16.262521673, 'z': '75th'},
- {'x': 69.5, 'y': 17.001335934, 'z': '85th'},
- {'x': 69.5, 'y': 17.593685902, 'z': '90th'},
- {'x': 69.5, 'y': 18.664897596, 'z': '95th'},
- {'x': 69.5, 'y': 19.535943651, 'z': '97th'},
- {'x': 70.5, 'y': 13.245280553, 'z': '3rd'},
- {'x': 70.5, 'y': 13.434666084, 'z': '5th'},
- {'x': 70.5, 'y': 13.750472476, 'z': '10th'},
- {'x': 70.5, 'y': 14.358225367, 'z': '25th'},
- {'x': 70.5, 'y': 15.193133896, 'z': '50th'},
- {'x': 70.5, 'y': 16.284434531, 'z': '75th'},
- {'x': 70.5, 'y': 17.032493991, 'z': '85th'},
- {'x': 70.5, 'y': 17.632972441, 'z': '90th'},
- {'x': 70.5, 'y': 18.72064127, 'z': '95th'},
- {'x': 70.5, 'y': 19.606888588, 'z': '97th'},
- {'x': 71.5, 'y': 13.239037732, 'z': '3rd'},
- {'x': 71.5, 'y': 13.429913207, 'z': '5th'},
- {'x': 71.5, 'y': 13.748302292, 'z': '10th'},
- {'x': 71.5, 'y': 14.361381855, 'z': '25th'},
- {'x': 71.5, 'y': 15.204413348, 'z': '50th'},
- {'x': 71.5, 'y': 16.307849949, 'z': '75th'},
- {'x': 71.5, 'y': 17.065309004, 'z': '85th'},
- {'x': 71.5, 'y': 17.674019838, 'z': '90th'},
- {'x': 71.5, 'y': 18.778285671, 'z': '95th'},
- {'x': 71.5, 'y': 19.679801033, 'z': '97th'},
- {'x': 72.5, 'y': 13.233446775, 'z': '3rd'},
- {'x': 72.5, 'y': 13.425870418, 'z': '5th'},
- {'x': 72.5, 'y': 13.746937764, 'z': '10th'},
- {'x': 72.5, 'y': 14.365521553, 'z': '25th'},
- {'x': 72.5, 'y': 15.216902957, 'z': '50th'},
- {'x': 72.5, 'y': 16.33273474, 'z': '75th'},
- {'x': 72.5, 'y': 17.099741723, 'z': '85th'},
- {'x': 72.5, 'y': 17.716784498, 'z': '90th'},
- {'x': 72.5, 'y': 18.837779538, 'z': '95th'},
- {'x': 72.5, 'y': 19.754622335, 'z': '97th'},
- {'x': 73.5, 'y': 13.228510536, 'z': '3rd'},
- {'x': 73.5, 'y': 13.422537877, 'z': '5th'},
- {'x': 73.5, 'y': 13.746374729, 'z': '10th'},
- {'x': 73.5, 'y': 14.370632576, 'z': '25th'},
- {'x': 73.5, 'y': 15.230581504, 'z': '50th'},
- {'x': 73.5, 'y': 16.35905747, 'z': '75th'},
- {'x': 73.5, 'y': 17.135754682, 'z': '85th'},
- {'x': 73.5, 'y': 17.761224399, 'z': '90th'},
- {'x': 73.5, 'y': 18.899072288, 'z': '95th'},
- {'x': 73.5, 'y': 19.83129333, 'z': '97th'},
- {'x': 74.5, 'y': 13.22423251, 'z': '3rd'},
- {'x': 74.5, 'y': 13.419916293, 'z': '5th'},
- {'x': 74.5, 'y': 13.746609412, 'z': '10th'},
- {'x': 74.5, 'y': 14.37670312, 'z': '25th'},
- {'x': 74.5, 'y': 15.245427448, 'z': '50th'},
- {'x': 74.5, 'y': 16.386786021, 'z': '75th'},
- {'x': 74.5, 'y': 17.173309679, 'z': '85th'},
- {'x': 74.5, 'y': 17.807296917, 'z': '90th'},
- {'x': 74.5, 'y': 18.962113544, 'z': '95th'},
- {'x': 74.5, 'y': 19.90975644, 'z': '97th'},
- {'x': 75.5, 'y': 13.220615639, 'z': '3rd'},
- {'x': 75.5, 'y': 13.41800595, 'z': '5th'},
- {'x': 75.5, 'y': 13.747637818, 'z': '10th'},
- {'x': 75.5, 'y': 14.383721483, 'z': '25th'},
- {'x': 75.5, 'y': 15.261419664, 'z': '50th'},
- {'x': 75.5, 'y': 16.415888868, 'z': '75th'},
- {'x': 75.5, 'y': 17.212369113, 'z': '85th'},
- {'x': 75.5, 'y': 17.854959996, 'z': '90th'},
- {'x': 75.5, 'y': 19.026853412, 'z': '95th'},
- {'x': 75.5, 'y': 19.989954599, 'z': '97th'},
- {'x': 76.5, 'y': 13.217662564, 'z': '3rd'},
- {'x': 76.5, 'y': 13.416806916, 'z': '5th'},
- {'x': 76.5, 'y': 13.749455857, 'z': '10th'},
- {'x': 76.5, 'y': 14.391676059, 'z': '25th'},
- {'x': 76.5, 'y': 15.278537278, 'z': '50th'},
- {'x': 76.5, 'y': 16.446334816, 'z': '75th'},
- {'x': 76.5, 'y': 17.252895716, 'z': '85th'},
- {'x': 76.5, 'y': 17.904171912, 'z': '90th'},
- {'x': 76.5, 'y': 19.093242432, 'z': '95th'},
- {'x': 76.5, 'y': 20.071831456, 'z': '97th'},
- {'x': 77.5, 'y': 13.215375632, 'z': '3rd'},
- {'x': 77.5, 'y': 13.416319045, 'z': '5th'},
- {'x': 77.5, 'y': 13.752059342, 'z': '10th'},
- {'x': 77.5, 'y': 14.400555326, 'z': '25th'},
- {'x': 77.5, 'y': 15.296759667, 'z': '50th'},
- {'x': 77.5, 'y': 16.478093, 'z': '75th'},
- {'x': 77.5, 'y': 17.294852556, 'z': '85th'},
- {'x': 77.5, 'y': 17.954891282, 'z': '90th'},
- {'x': 77.5, 'y': 19.161231581, 'z': '95th'},
- {'x': 77.5, 'y': 20.155331371, 'z': '97th'},
- {'x': 78.5, 'y': 13.2137569, 'z': '3rd'},
- {'x': 78.5, 'y': 13.416541975, 'z': '5th'},
- {'x': 78.5, 'y': 13.755443986, 'z': '10th'},
- {'x': 78.5, 'y': 14.410347841, 'z': '25th'},
- {'x': 78.5, 'y': 15.316066442, 'z': '50th'},
- {'x': 78.5, 'y': 16.51113288, 'z': '75th'},
- {'x': 78.5, 'y': 17.338203042, 'z': '85th'},
- {'x': 78.5, 'y': 18.007077074, 'z': '90th'},
- {'x': 78.5, 'y': 19.230772276, 'z': '95th'},
- {'x': 78.5, 'y': 20.240399405, 'z': '97th'},
- {'x': 79.5, 'y': 13.212808146, 'z': '3rd'},
- {'x': 79.5, 'y': 13.417475136, 'z': '5th'},
- {'x': 79.5, 'y': 13.759605404, 'z': '10th'},
- {'x': 79.5, 'y': 14.421042231, 'z': '25th'},
- {'x': 79.5, 'y': 15.336437447, 'z': '50th'},
- {'x': 79.5, 'y': 16.545424242, 'z': '75th'},
- {'x': 79.5, 'y': 17.382910923, 'z': '85th'},
- {'x': 79.5, 'y': 18.06068861, 'z': '90th'},
- {'x': 79.5, 'y': 19.301816386, 'z': '95th'},
- {'x': 79.5, 'y': 20.32698132, 'z': '97th'},
- {'x': 80.5, 'y': 13.21253087, 'z': '3rd'},
- {'x': 80.5, 'y': 13.419117751, 'z': '5th'},
- {'x': 80.5, 'y': 13.764539106, 'z': '10th'},
- {'x': 80.5, 'y': 14.432627193, 'z': '25th'},
- {'x': 80.5, 'y': 15.357852744, 'z': '50th'},
- {'x': 80.5, 'y': 16.580937187, 'z': '75th'},
- {'x': 80.5, 'y': 17.428940294, 'z': '85th'},
- {'x': 80.5, 'y': 18.115685573, 'z': '90th'},
- {'x': 80.5, 'y': 19.374316236, 'z': '95th'},
- {'x': 80.5, 'y': 20.41502357, 'z': '97th'},
- {'x': 81.5, 'y': 13.212926303, 'z': '3rd'},
- {'x': 81.5, 'y': 13.421468839, 'z': '5th'},
- {'x': 81.5, 'y': 13.770240504, 'z': '10th'},
- {'x': 81.5, 'y': 14.445091478, 'z': '25th'},
- {'x': 81.5, 'y': 15.380292613, 'z': '50th'},
- {'x': 81.5, 'y': 16.617642137, 'z': '75th'},
- {'x': 81.5, 'y': 17.476255597, 'z': '85th'},
- {'x': 81.5, 'y': 18.172028013, 'z': '90th'},
- {'x': 81.5, 'y': 19.448224611, 'z': '95th'},
- {'x': 81.5, 'y': 20.504473299, 'z': '97th'},
- {'x': 82.5, 'y': 13.21399541, 'z': '3rd'},
- {'x': 82.5, 'y': 13.424527221, 'z': '5th'},
- {'x': 82.5, 'y': 13.776704905, 'z': '10th'},
- {'x': 82.5, 'y': 14.458423895, 'z': '25th'},
- {'x': 82.5, 'y': 15.403737535, 'z': '50th'},
- {'x': 82.5, 'y': 16.655509821, 'z': '75th'},
- {'x': 82.5, 'y': 17.524821619, 'z': '85th'},
- {'x': 82.5, 'y': 18.22967635, 'z': '90th'},
- {'x': 82.5, 'y': 19.523494768, 'z': '95th'},
- {'x': 82.5, 'y': 20.59527834, 'z': '97th'},
- {'x': 83.5, 'y': 13.215738902, 'z': '3rd'},
- {'x': 83.5, 'y': 13.428291519, 'z': '5th'},
- {'x': 83.5, 'y': 13.783927513, 'z': '10th'},
- {'x': 83.5, 'y': 14.4726133, 'z': '25th'},
- {'x': 83.5, 'y': 15.428168191, 'z': '50th'},
- {'x': 83.5, 'y': 16.69451128, 'z': '75th'},
- {'x': 83.5, 'y': 17.574603494, 'z': '85th'},
- {'x': 83.5, 'y': 18.288591379, 'z': '90th'},
- {'x': 83.5, 'y': 19.600080436, 'z': '95th'},
- {'x': 83.5, 'y': 20.687387209, 'z': '97th'},
- {'x': 84.5, 'y': 13.218157234, 'z': '3rd'},
- {'x': 84.5, 'y': 13.432760162, 'z': '5th'},
- {'x': 84.5, 'y': 13.79190343, 'z': '10th'},
- {'x': 84.5, 'y': 14.487648591, 'z': '25th'},
- {'x': 84.5, 'y': 15.453565452, 'z': '50th'},
- {'x': 84.5, 'y': 16.734617854, 'z': '75th'},
- {'x': 84.5, 'y': 17.625566704, 'z': '85th'},
- {'x': 84.5, 'y': 18.348734276, 'z': '90th'},
- {'x': 84.5, 'y': 19.677935827, 'z': '95th'},
- {'x': 84.5, 'y': 20.780749104, 'z': '97th'},
- {'x': 85.5, 'y': 13.221250616, 'z': '3rd'},
- {'x': 85.5, 'y': 13.43793139, 'z': '5th'},
- {'x': 85.5, 'y': 13.800627653, 'z': '10th'},
- {'x': 85.5, 'y': 14.503518707, 'z': '25th'},
- {'x': 85.5, 'y': 15.479910374, 'z': '50th'},
- {'x': 85.5, 'y': 16.775801186, 'z': '75th'},
- {'x': 85.5, 'y': 17.67767708, 'z': '85th'},
- {'x': 85.5, 'y': 18.410066599, 'z': '90th'},
- {'x': 85.5, 'y': 19.757015637, 'z': '95th'},
- {'x': 85.5, 'y': 20.875313902, 'z': '97th'},
- {'x': 86.5, 'y': 13.225019018, 'z': '3rd'},
- {'x': 86.5, 'y': 13.443803253, 'z': '5th'},
- {'x': 86.5, 'y': 13.810095076, 'z': '10th'},
- {'x': 86.5, 'y': 14.520212619, 'z': '25th'},
- {'x': 86.5, 'y': 15.507184187, 'z': '50th'},
- {'x': 86.5, 'y': 16.818033212, 'z': '75th'},
- {'x': 86.5, 'y': 17.730900798, 'z': '85th'},
- {'x': 86.5, 'y': 18.472550289, 'z': '90th'},
- {'x': 86.5, 'y': 19.837275057, 'z': '95th'},
- {'x': 86.5, 'y': 20.971032159, 'z': '97th'},
- {'x': 87.5, 'y': 13.229462172, 'z': '3rd'},
- {'x': 87.5, 'y': 13.450373621, 'z': '5th'},
- {'x': 87.5, 'y': 13.820300489, 'z': '10th'},
- {'x': 87.5, 'y': 14.537719329, 'z': '25th'},
- {'x': 87.5, 'y': 15.535368293, 'z': '50th'},
- {'x': 87.5, 'y': 16.861286158, 'z': '75th'},
- {'x': 87.5, 'y': 17.785204382, 'z': '85th'},
- {'x': 87.5, 'y': 18.53614768, 'z': '90th'},
- {'x': 87.5, 'y': 19.918669774, 'z': '95th'},
- {'x': 87.5, 'y': 21.067855109, 'z': '97th'},
- {'x': 88.5, 'y': 13.234579579, 'z': '3rd'},
- {'x': 88.5, 'y': 13.45764018, 'z': '5th'},
- {'x': 88.5, 'y': 13.83123858, 'z': '10th'},
- {'x': 88.5, 'y': 14.556027866, 'z': '25th'},
- {'x': 88.5, 'y': 15.564444257, 'z': '50th'},
- {'x': 88.5, 'y': 16.905532539, 'z': '75th'},
- {'x': 88.5, 'y': 17.840554704, 'z': '85th'},
- {'x': 88.5, 'y': 18.600821494, 'z': '90th'},
- {'x': 88.5, 'y': 20.001155979, 'z': '95th'},
- {'x': 88.5, 'y': 21.16573466, 'z': '97th'},
- {'x': 89.5, 'y': 13.240370519, 'z': '3rd'},
- {'x': 89.5, 'y': 13.46560044, 'z': '5th'},
- {'x': 89.5, 'y': 13.842903932, 'z': '10th'},
- {'x': 89.5, 'y': 14.575127278, 'z': '25th'},
- {'x': 89.5, 'y': 15.594393802, 'z': '50th'},
- {'x': 89.5, 'y': 16.950745147, 'z': '75th'},
- {'x': 89.5, 'y': 17.896918975, 'z': '85th'},
- {'x': 89.5, 'y': 18.666534846, 'z': '90th'},
- {'x': 89.5, 'y': 20.08469037, 'z': '95th'},
- {'x': 89.5, 'y': 21.2646234, 'z': '97th'},
- {'x': 90.5, 'y': 13.246834051, 'z': '3rd'},
- {'x': 90.5, 'y': 13.47425174, 'z': '5th'},
- {'x': 90.5, 'y': 13.855291029, 'z': '10th'},
- {'x': 90.5, 'y': 14.595006635, 'z': '25th'},
- {'x': 90.5, 'y': 15.625198798, 'z': '50th'},
- {'x': 90.5, 'y': 16.996897049, 'z': '75th'},
- {'x': 90.5, 'y': 17.95426475, 'z': '85th'},
- {'x': 90.5, 'y': 18.733251243, 'z': '90th'},
- {'x': 90.5, 'y': 20.169230159, 'z': '95th'},
- {'x': 90.5, 'y': 21.364474598, 'z': '97th'},
- {'x': 91.5, 'y': 13.253969024, 'z': '3rd'},
- {'x': 91.5, 'y': 13.483591251, 'z': '5th'},
- {'x': 91.5, 'y': 13.868394255, 'z': '10th'},
- {'x': 91.5, 'y': 14.615655019, 'z': '25th'},
- {'x': 91.5, 'y': 15.656841259, 'z': '50th'},
- {'x': 91.5, 'y': 17.04396158, 'z': '75th'},
- {'x': 91.5, 'y': 18.01255992, 'z': '85th'},
- {'x': 91.5, 'y': 18.800934582, 'z': '90th'},
- {'x': 91.5, 'y': 20.254733074, 'z': '95th'},
- {'x': 91.5, 'y': 21.46524221, 'z': '97th'},
- {'x': 92.5, 'y': 13.261774085, 'z': '3rd'},
- {'x': 92.5, 'y': 13.493615981, 'z': '5th'},
- {'x': 92.5, 'y': 13.882207895, 'z': '10th'},
- {'x': 92.5, 'y': 14.637061525, 'z': '25th'},
- {'x': 92.5, 'y': 15.689303334, 'z': '50th'},
- {'x': 92.5, 'y': 17.091912333, 'z': '75th'},
- {'x': 92.5, 'y': 18.071772705, 'z': '85th'},
- {'x': 92.5, 'y': 18.869549152, 'z': '90th'},
- {'x': 92.5, 'y': 20.341157368, 'z': '95th'},
- {'x': 92.5, 'y': 21.56688088, 'z': '97th'},
- {'x': 93.5, 'y': 13.270247686, 'z': '3rd'},
- {'x': 93.5, 'y': 13.504322782, 'z': '5th'},
- {'x': 93.5, 'y': 13.896726137, 'z': '10th'},
- {'x': 93.5, 'y': 14.659215255, 'z': '25th'},
- {'x': 93.5, 'y': 15.722567299, 'z': '50th'},
- {'x': 93.5, 'y': 17.140723155, 'z': '75th'},
- {'x': 93.5, 'y': 18.131871655, 'z': '85th'},
- {'x': 93.5, 'y': 18.93905963, 'z': '90th'},
- {'x': 93.5, 'y': 20.428461818, 'z': '95th'},
- {'x': 93.5, 'y': 21.669345954, 'z': '97th'},
- {'x': 94.5, 'y': 13.279388083, 'z': '3rd'},
- {'x': 94.5, 'y': 13.515708349, 'z': '5th'},
- {'x': 94.5, 'y': 13.911943075, 'z': '10th'},
- {'x': 94.5, 'y': 14.682105318, 'z': '25th'},
- {'x': 94.5, 'y': 15.756615553, 'z': '50th'},
- {'x': 94.5, 'y': 17.190368141, 'z': '75th'},
- {'x': 94.5, 'y': 18.192825645, 'z': '85th'},
- {'x': 94.5, 'y': 19.00943108, 'z': '90th'},
- {'x': 94.5, 'y': 20.516605734, 'z': '95th'},
- {'x': 94.5, 'y': 21.77259347, 'z': '97th'},
- {'x': 95.5, 'y': 13.289193339, 'z': '3rd'},
- {'x': 95.5, 'y': 13.527769222, 'z': '5th'},
- {'x': 95.5, 'y': 13.927852702, 'z': '10th'},
- {'x': 95.5, 'y': 14.705720826, 'z': '25th'},
- {'x': 95.5, 'y': 15.791430622, 'z': '50th'},
- {'x': 95.5, 'y': 17.240821639, 'z': '75th'},
- {'x': 95.5, 'y': 18.254603884, 'z': '85th'},
- {'x': 95.5, 'y': 19.080628967, 'z': '90th'},
- {'x': 95.5, 'y': 20.605548956, 'z': '95th'},
- {'x': 95.5, 'y': 21.87658015, 'z': '97th'},
- {'x': 96.5, 'y': 13.2996613, 'z': '3rd'},
- {'x': 96.5, 'y': 13.540501762, 'z': '5th'},
- {'x': 96.5, 'y': 13.9444489, 'z': '10th'},
- {'x': 96.5, 'y': 14.730050895, 'z': '25th'},
- {'x': 96.5, 'y': 15.826995169, 'z': '50th'},
- {'x': 96.5, 'y': 17.292058281, 'z': '75th'},
- {'x': 96.5, 'y': 18.317175943, 'z': '85th'},
- {'x': 96.5, 'y': 19.152619179, 'z': '90th'},
- {'x': 96.5, 'y': 20.695251857, 'z': '95th'},
- {'x': 96.5, 'y': 21.981263357, 'z': '97th'},
- {'x': 97.5, 'y': 13.310789044, 'z': '3rd'},
- {'x': 97.5, 'y': 13.553901719, 'z': '5th'},
- {'x': 97.5, 'y': 13.96172519, 'z': '10th'},
- {'x': 97.5, 'y': 14.755084709, 'z': '25th'},
- {'x': 97.5, 'y': 15.863292407, 'z': '50th'},
- {'x': 97.5, 'y': 17.344053641, 'z': '75th'},
- {'x': 97.5, 'y': 18.380512412, 'z': '85th'},
- {'x': 97.5, 'y': 19.225368543, 'z': '90th'},
- {'x': 97.5, 'y': 20.785675251, 'z': '95th'},
- {'x': 97.5, 'y': 22.086600078, 'z': '97th'},
- {'x': 98.5, 'y': 13.322574558, 'z': '3rd'},
- {'x': 98.5, 'y': 13.567965559, 'z': '5th'},
- {'x': 98.5, 'y': 13.979675493, 'z': '10th'},
- {'x': 98.5, 'y': 14.780811321, 'z': '25th'},
- {'x': 98.5, 'y': 15.900304841, 'z': '50th'},
- {'x': 98.5, 'y': 17.396782223, 'z': '75th'},
- {'x': 98.5, 'y': 18.444582911, 'z': '85th'},
- {'x': 98.5, 'y': 19.298843262, 'z': '90th'},
- {'x': 98.5, 'y': 20.876780679, 'z': '95th'},
- {'x': 98.5, 'y': 22.192549986, 'z': '97th'},
- {'x': 99.5, 'y': 13.335015119, 'z': '3rd'},
- {'x': 99.5, 'y': 13.582689175, 'z': '5th'},
- {'x': 99.5, 'y': 13.998293384, 'z': '10th'},
- {'x': 99.5, 'y': 14.807219814, 'z': '25th'},
- {'x': 99.5, 'y': 15.938015446, 'z': '50th'},
- {'x': 99.5, 'y': 17.450219363, 'z': '75th'},
- {'x': 99.5, 'y': 18.509357979, 'z': '85th'},
- {'x': 99.5, 'y': 19.373010404, 'z': '90th'},
- {'x': 99.5, 'y': 20.968530139, 'z': '95th'},
- {'x': 99.5, 'y': 22.29907253, 'z': '97th'},
- {'x': 100.5, 'y': 13.348107261, 'z': '3rd'},
- {'x': 100.5, 'y': 13.598067882, 'z': '5th'},
- {'x': 100.5, 'y': 14.017572122, 'z': '10th'},
- {'x': 100.5, 'y': 14.83429943, 'z': '25th'},
- {'x': 100.5, 'y': 15.976407871, 'z': '50th'},
- {'x': 100.5, 'y': 17.504341492, 'z': '75th'},
- {'x': 100.5, 'y': 18.574809309, 'z': '85th'},
- {'x': 100.5, 'y': 19.447838088, 'z': '90th'},
- {'x': 100.5, 'y': 21.060886065, 'z': '95th'},
- {'x': 100.5, 'y': 22.406126596, 'z': '97th'},
- {'x': 101.5, 'y': 13.361848425, 'z': '3rd'},
- {'x': 101.5, 'y': 13.614097684, 'z': '5th'},
- {'x': 101.5, 'y': 14.037505301, 'z': '10th'},
- {'x': 101.5, 'y': 14.86203913, 'z': '25th'},
- {'x': 101.5, 'y': 16.015464834, 'z': '50th'},
- {'x': 101.5, 'y': 17.55912371, 'z': '75th'},
- {'x': 101.5, 'y': 18.640907397, 'z': '85th'},
- {'x': 101.5, 'y': 19.523293637, 'z': '90th'},
- {'x': 101.5, 'y': 21.153811648, 'z': '95th'},
- {'x': 101.5, 'y': 22.513674066, 'z': '97th'},
- {'x': 102.5, 'y': 13.376235158, 'z': '3rd'},
- {'x': 102.5, 'y': 13.630773884, 'z': '5th'},
- {'x': 102.5, 'y': 14.058086134, 'z': '10th'},
- {'x': 102.5, 'y': 14.890428045, 'z': '25th'},
- {'x': 102.5, 'y': 16.055169844, 'z': '50th'},
- {'x': 102.5, 'y': 17.614542394, 'z': '75th'},
- {'x': 102.5, 'y': 18.70762408, 'z': '85th'},
- {'x': 102.5, 'y': 19.599345573, 'z': '90th'},
- {'x': 102.5, 'y': 21.247270492, 'z': '95th'},
- {'x': 102.5, 'y': 22.621675973, 'z': '97th'},
- {'x': 103.5, 'y': 13.391263286, 'z': '3rd'},
- {'x': 103.5, 'y': 13.648091204, 'z': '5th'},
- {'x': 103.5, 'y': 14.079307468, 'z': '10th'},
- {'x': 103.5, 'y': 14.919455334, 'z': '25th'},
- {'x': 103.5, 'y': 16.09550688, 'z': '50th'},
- {'x': 103.5, 'y': 17.670574776, 'z': '75th'},
- {'x': 103.5, 'y': 18.774932139, 'z': '85th'},
- {'x': 103.5, 'y': 19.675963312, 'z': '90th'},
- {'x': 103.5, 'y': 21.341226663, 'z': '95th'},
- {'x': 103.5, 'y': 22.730093079, 'z': '97th'},
- {'x': 104.5, 'y': 13.406930074, 'z': '3rd'},
- {'x': 104.5, 'y': 13.666045501, 'z': '5th'},
- {'x': 104.5, 'y': 14.101162802, 'z': '10th'},
- {'x': 104.5, 'y': 14.949109957, 'z': '25th'},
- {'x': 104.5, 'y': 16.136458809, 'z': '50th'},
- {'x': 104.5, 'y': 17.727196375, 'z': '75th'},
- {'x': 104.5, 'y': 18.842802758, 'z': '85th'},
- {'x': 104.5, 'y': 19.75311515, 'z': '90th'},
- {'x': 104.5, 'y': 21.435645054, 'z': '95th'},
- {'x': 104.5, 'y': 22.838889796, 'z': '97th'},
- {'x': 105.5, 'y': 13.423231342, 'z': '3rd'},
- {'x': 105.5, 'y': 13.684631476, 'z': '5th'},
- {'x': 105.5, 'y': 14.123644944, 'z': '10th'},
- {'x': 105.5, 'y': 14.979381008, 'z': '25th'},
- {'x': 105.5, 'y': 16.178009551, 'z': '50th'},
- {'x': 105.5, 'y': 17.784384485, 'z': '75th'},
- {'x': 105.5, 'y': 18.911208974, 'z': '85th'},
- {'x': 105.5, 'y': 19.830770998, 'z': '90th'},
- {'x': 105.5, 'y': 21.530490897, 'z': '95th'},
- {'x': 105.5, 'y': 22.94802887, 'z': '97th'},
- {'x': 106.5, 'y': 13.440163147, 'z': '3rd'},
- {'x': 106.5, 'y': 13.703844013, 'z': '5th'},
- {'x': 106.5, 'y': 14.146746795, 'z': '10th'},
- {'x': 106.5, 'y': 15.010257517, 'z': '25th'},
- {'x': 106.5, 'y': 16.220142813, 'z': '50th'},
- {'x': 106.5, 'y': 17.842116135, 'z': '75th'},
- {'x': 106.5, 'y': 18.980123661, 'z': '85th'},
- {'x': 106.5, 'y': 19.908900787, 'z': '90th'},
- {'x': 106.5, 'y': 21.625730052, 'z': '95th'},
- {'x': 106.5, 'y': 23.057474482, 'z': '97th'},
- {'x': 107.5, 'y': 13.457720878, 'z': '3rd'},
- {'x': 107.5, 'y': 13.723677453, 'z': '5th'},
- {'x': 107.5, 'y': 14.170460924, 'z': '10th'},
- {'x': 107.5, 'y': 15.041728556, 'z': '25th'},
- {'x': 107.5, 'y': 16.262842771, 'z': '50th'},
- {'x': 107.5, 'y': 17.900369199, 'z': '75th'},
- {'x': 107.5, 'y': 19.049520628, 'z': '85th'},
- {'x': 107.5, 'y': 19.987475333, 'z': '90th'},
- {'x': 107.5, 'y': 21.721328849, 'z': '95th'},
- {'x': 107.5, 'y': 23.167190567, 'z': '97th'},
- {'x': 108.5, 'y': 13.475900463, 'z': '3rd'},
- {'x': 108.5, 'y': 13.744126561, 'z': '5th'},
- {'x': 108.5, 'y': 14.194780131, 'z': '10th'},
- {'x': 108.5, 'y': 15.073783099, 'z': '25th'},
- {'x': 108.5, 'y': 16.306093162, 'z': '50th'},
- {'x': 108.5, 'y': 17.959120924, 'z': '75th'},
- {'x': 108.5, 'y': 19.119373164, 'z': '85th'},
- {'x': 108.5, 'y': 20.066465192, 'z': '90th'},
- {'x': 108.5, 'y': 21.817254297, 'z': '95th'},
- {'x': 108.5, 'y': 23.277143044, 'z': '97th'},
- {'x': 109.5, 'y': 13.494697965, 'z': '3rd'},
- {'x': 109.5, 'y': 13.765186202, 'z': '5th'},
- {'x': 109.5, 'y': 14.21969726, 'z': '10th'},
- {'x': 109.5, 'y': 15.10641007, 'z': '25th'},
- {'x': 109.5, 'y': 16.349877586, 'z': '50th'},
- {'x': 109.5, 'y': 18.018348425, 'z': '75th'},
- {'x': 109.5, 'y': 19.189654528, 'z': '85th'},
- {'x': 109.5, 'y': 20.145841044, 'z': '90th'},
- {'x': 109.5, 'y': 21.913474016, 'z': '95th'},
- {'x': 109.5, 'y': 23.38729906, 'z': '97th'},
- {'x': 110.5, 'y': 13.51410735, 'z': '3rd'},
- {'x': 110.5, 'y': 13.78684956, 'z': '5th'},
- {'x': 110.5, 'y': 14.245204152, 'z': '10th'},
- {'x': 110.5, 'y': 15.139598587, 'z': '25th'},
- {'x': 110.5, 'y': 16.39418118, 'z': '50th'},
- {'x': 110.5, 'y': 18.078031381, 'z': '75th'},
- {'x': 110.5, 'y': 19.260340621, 'z': '85th'},
- {'x': 110.5, 'y': 20.225575811, 'z': '90th'},
- {'x': 110.5, 'y': 22.00995586, 'z': '95th'},
- {'x': 110.5, 'y': 23.497622894, 'z': '97th'},
- {'x': 111.5, 'y': 13.534124762, 'z': '3rd'},
- {'x': 111.5, 'y': 13.809111546, 'z': '5th'},
- {'x': 111.5, 'y': 14.271293647, 'z': '10th'},
- {'x': 111.5, 'y': 15.173337489, 'z': '25th'},
- {'x': 111.5, 'y': 16.438987413, 'z': '50th'},
- {'x': 111.5, 'y': 18.13814687, 'z': '75th'},
- {'x': 111.5, 'y': 19.331404869, 'z': '85th'},
- {'x': 111.5, 'y': 20.305640609, 'z': '90th'},
- {'x': 111.5, 'y': 22.106668641, 'z': '95th'},
- {'x': 111.5, 'y': 23.608083807, 'z': '97th'},
- {'x': 112.5, 'y': 13.554744872, 'z': '3rd'},
- {'x': 112.5, 'y': 13.83196589, 'z': '5th'},
- {'x': 112.5, 'y': 14.297957871, 'z': '10th'},
- {'x': 112.5, 'y': 15.207615739, 'z': '25th'},
- {'x': 112.5, 'y': 16.484280823, 'z': '50th'},
- {'x': 112.5, 'y': 18.198673786, 'z': '75th'},
- {'x': 112.5, 'y': 19.402822598, 'z': '85th'},
- {'x': 112.5, 'y': 20.386008206, 'z': '90th'},
- {'x': 112.5, 'y': 22.203581509, 'z': '95th'},
- {'x': 112.5, 'y': 23.718649328, 'z': '97th'},
- {'x': 113.5, 'y': 13.575962802, 'z': '3rd'},
- {'x': 113.5, 'y': 13.855406666, 'z': '5th'},
- {'x': 113.5, 'y': 14.325189131, 'z': '10th'},
- {'x': 113.5, 'y': 15.242422189, 'z': '25th'},
- {'x': 113.5, 'y': 16.530045538, 'z': '50th'},
- {'x': 113.5, 'y': 18.259590465, 'z': '75th'},
- {'x': 113.5, 'y': 19.474568694, 'z': '85th'},
- {'x': 113.5, 'y': 20.466651174, 'z': '90th'},
- {'x': 113.5, 'y': 22.300664287, 'z': '95th'},
- {'x': 113.5, 'y': 23.829288837, 'z': '97th'},
- {'x': 114.5, 'y': 13.59777181, 'z': '3rd'},
- {'x': 114.5, 'y': 13.879426466, 'z': '5th'},
- {'x': 114.5, 'y': 14.35297886, 'z': '10th'},
- {'x': 114.5, 'y': 15.277745907, 'z': '25th'},
- {'x': 114.5, 'y': 16.57626713, 'z': '50th'},
- {'x': 114.5, 'y': 18.320877637, 'z': '75th'},
- {'x': 114.5, 'y': 19.546620507, 'z': '85th'},
- {'x': 114.5, 'y': 20.547544196, 'z': '90th'},
- {'x': 114.5, 'y': 22.397887094, 'z': '95th'},
- {'x': 114.5, 'y': 23.939969204, 'z': '97th'},
- {'x': 115.5, 'y': 13.620168486, 'z': '3rd'},
- {'x': 115.5, 'y': 13.904020526, 'z': '5th'},
- {'x': 115.5, 'y': 14.381320038, 'z': '10th'},
- {'x': 115.5, 'y': 15.313575565, 'z': '25th'},
- {'x': 115.5, 'y': 16.62292864, 'z': '50th'},
- {'x': 115.5, 'y': 18.382512016, 'z': '75th'},
- {'x': 115.5, 'y': 19.618951499, 'z': '85th'},
- {'x': 115.5, 'y': 20.628658996, 'z': '90th'},
- {'x': 115.5, 'y': 22.495221076, 'z': '95th'},
- {'x': 115.5, 'y': 24.050664182, 'z': '97th'},
- {'x': 116.5, 'y': 13.643145665, 'z': '3rd'},
- {'x': 116.5, 'y': 13.92918106, 'z': '5th'},
- {'x': 116.5, 'y': 14.410203797, 'z': '10th'},
- {'x': 116.5, 'y': 15.349900084, 'z': '25th'},
- {'x': 116.5, 'y': 16.670015716, 'z': '50th'},
- {'x': 116.5, 'y': 18.444474723, 'z': '75th'},
- {'x': 116.5, 'y': 19.691539649, 'z': '85th'},
- {'x': 116.5, 'y': 20.709971078, 'z': '90th'},
- {'x': 116.5, 'y': 22.592637546, 'z': '95th'},
- {'x': 116.5, 'y': 24.161342137, 'z': '97th'},
- {'x': 117.5, 'y': 13.66669786, 'z': '3rd'},
- {'x': 117.5, 'y': 13.954901632, 'z': '5th'},
- {'x': 117.5, 'y': 14.439622092, 'z': '10th'},
- {'x': 117.5, 'y': 15.386708276, 'z': '25th'},
- {'x': 117.5, 'y': 16.717512877, 'z': '50th'},
- {'x': 117.5, 'y': 18.50674506, 'z': '75th'},
- {'x': 117.5, 'y': 19.764361199, 'z': '85th'},
- {'x': 117.5, 'y': 20.791454688, 'z': '90th'},
- {'x': 117.5, 'y': 22.690108545, 'z': '95th'},
- {'x': 117.5, 'y': 24.271975057, 'z': '97th'},
- {'x': 118.5, 'y': 13.690819049, 'z': '3rd'},
- {'x': 118.5, 'y': 13.981175358, 'z': '5th'},
- {'x': 118.5, 'y': 14.469566585, 'z': '10th'},
- {'x': 118.5, 'y': 15.423988935, 'z': '25th'},
- {'x': 118.5, 'y': 16.765404961, 'z': '50th'},
- {'x': 118.5, 'y': 18.56930296, 'z': '75th'},
- {'x': 118.5, 'y': 19.837393135, 'z': '85th'},
- {'x': 118.5, 'y': 20.873084823, 'z': '90th'},
- {'x': 118.5, 'y': 22.787606652, 'z': '95th'},
- {'x': 118.5, 'y': 24.382535024, 'z': '97th'},
- {'x': 119.5, 'y': 13.715503044, 'z': '3rd'},
- {'x': 119.5, 'y': 14.007995218, 'z': '5th'},
- {'x': 119.5, 'y': 14.500028834, 'z': '10th'},
- {'x': 119.5, 'y': 15.461730832, 'z': '25th'},
- {'x': 119.5, 'y': 16.813676886, 'z': '50th'},
- {'x': 119.5, 'y': 18.632128591, 'z': '75th'},
- {'x': 119.5, 'y': 19.91061278, 'z': '85th'},
- {'x': 119.5, 'y': 20.954836899, 'z': '90th'},
- {'x': 119.5, 'y': 22.88510501, 'z': '95th'},
- {'x': 119.5, 'y': 24.492994793, 'z': '97th'},
- {'x': 120.5, 'y': 13.740743496, 'z': '3rd'},
- {'x': 120.5, 'y': 14.035354051, 'z': '5th'},
- {'x': 120.5, 'y': 14.531000299, 'z': '10th'},
- {'x': 120.5, 'y': 15.499922711, 'z': '25th'},
- {'x': 120.5, 'y': 16.862313656, 'z': '50th'},
- {'x': 120.5, 'y': 18.695202348, 'z': '75th'},
- {'x': 120.5, 'y': 19.983997788, 'z': '85th'},
- {'x': 120.5, 'y': 21.03668675, 'z': '90th'},
- {'x': 120.5, 'y': 22.982577328, 'z': '95th'},
- {'x': 120.5, 'y': 24.603327787, 'z': '97th'},
- {'x': 121.5, 'y': 13.766533898, 'z': '3rd'},
- {'x': 121.5, 'y': 14.063244558, 'z': '5th'},
- {'x': 121.5, 'y': 14.562472338, 'z': '10th'},
- {'x': 121.5, 'y': 15.538553291, 'z': '25th'},
- {'x': 121.5, 'y': 16.911300357, 'z': '50th'},
- {'x': 121.5, 'y': 18.758504859, 'z': '75th'},
- {'x': 121.5, 'y': 20.05752615, 'z': '85th'},
- {'x': 121.5, 'y': 21.118610629, 'z': '90th'},
- {'x': 121.5, 'y': 23.079997876, 'z': '95th'},
- {'x': 121.5, 'y': 24.713508102, 'z': '97th'},
- {'x': 122.5, 'y': 13.792867581, 'z': '3rd'},
- {'x': 122.5, 'y': 14.091659301, 'z': '5th'},
- {'x': 122.5, 'y': 14.594436211, 'z': '10th'},
- {'x': 122.5, 'y': 15.577611268, 'z': '25th'},
- {'x': 122.5, 'y': 16.960622156, 'z': '50th'},
- {'x': 122.5, 'y': 18.822016982, 'z': '75th'},
- {'x': 122.5, 'y': 20.131176192, 'z': '85th'},
- {'x': 122.5, 'y': 21.200585205, 'z': '90th'},
- {'x': 122.5, 'y': 23.177341493, 'z': '95th'},
- {'x': 122.5, 'y': 24.823510501, 'z': '97th'},
- {'x': 123.5, 'y': 13.819737715, 'z': '3rd'},
- {'x': 123.5, 'y': 14.120590705, 'z': '5th'},
- {'x': 123.5, 'y': 14.626883073, 'z': '10th'},
- {'x': 123.5, 'y': 15.617085307, 'z': '25th'},
- {'x': 123.5, 'y': 17.010264304, 'z': '50th'},
- {'x': 123.5, 'y': 18.885719804, 'z': '75th'},
- {'x': 123.5, 'y': 20.204926574, 'z': '85th'},
- {'x': 123.5, 'y': 21.282587568, 'z': '90th'},
- {'x': 123.5, 'y': 23.274583578, 'z': '95th'},
- {'x': 123.5, 'y': 24.933310419, 'z': '97th'},
- {'x': 124.5, 'y': 13.847137311, 'z': '3rd'},
- {'x': 124.5, 'y': 14.150031057, 'z': '5th'},
- {'x': 124.5, 'y': 14.659803981, 'z': '10th'},
- {'x': 124.5, 'y': 15.65696405, 'z': '25th'},
- {'x': 124.5, 'y': 17.060212133, 'z': '50th'},
- {'x': 124.5, 'y': 18.949594645, 'z': '75th'},
- {'x': 124.5, 'y': 20.278756292, 'z': '85th'},
- {'x': 124.5, 'y': 21.364595227, 'z': '90th'},
- {'x': 124.5, 'y': 23.371700099, 'z': '95th'},
- {'x': 124.5, 'y': 25.04288396, 'z': '97th'},
- {'x': 125.5, 'y': 13.875059221, 'z': '3rd'},
- {'x': 125.5, 'y': 14.179972506, 'z': '5th'},
- {'x': 125.5, 'y': 14.69318989, 'z': '10th'},
- {'x': 125.5, 'y': 15.697236113, 'z': '25th'},
- {'x': 125.5, 'y': 17.110451055, 'z': '50th'},
- {'x': 125.5, 'y': 19.013623053, 'z': '75th'},
- {'x': 125.5, 'y': 20.352644676, 'z': '85th'},
- {'x': 125.5, 'y': 21.446586109, 'z': '90th'},
- {'x': 125.5, 'y': 23.468667584, 'z': '95th'},
- {'x': 125.5, 'y': 25.1522079, 'z': '97th'},
- {'x': 126.5, 'y': 13.903496139, 'z': '3rd'},
- {'x': 126.5, 'y': 14.210407062, 'z': '5th'},
- {'x': 126.5, 'y': 14.727031656, 'z': '10th'},
- {'x': 126.5, 'y': 15.737890083, 'z': '25th'},
- {'x': 126.5, 'y': 17.160966564, 'z': '50th'},
- {'x': 126.5, 'y': 19.077786808, 'z': '75th'},
- {'x': 126.5, 'y': 20.426571391, 'z': '85th'},
- {'x': 126.5, 'y': 21.528538558, 'z': '90th'},
- {'x': 126.5, 'y': 23.56546313, 'z': '95th'},
- {'x': 126.5, 'y': 25.261259684, 'z': '97th'},
- {'x': 127.5, 'y': 13.932440598, 'z': '3rd'},
- {'x': 127.5, 'y': 14.2413266, 'z': '5th'},
- {'x': 127.5, 'y': 14.761320031, 'z': '10th'},
- {'x': 127.5, 'y': 15.778914521, 'z': '25th'},
- {'x': 127.5, 'y': 17.211744236, 'z': '50th'},
- {'x': 127.5, 'y': 19.142067919, 'z': '75th'},
- {'x': 127.5, 'y': 20.500516439, 'z': '85th'},
- {'x': 127.5, 'y': 21.610431341, 'z': '90th'},
- {'x': 127.5, 'y': 23.662064395, 'z': '95th'},
- {'x': 127.5, 'y': 25.370017427, 'z': '97th'},
- {'x': 128.5, 'y': 13.961884973, 'z': '3rd'},
- {'x': 128.5, 'y': 14.272722855, 'z': '5th'},
- {'x': 128.5, 'y': 14.796045668, 'z': '10th'},
- {'x': 128.5, 'y': 15.82029796, 'z': '25th'},
- {'x': 128.5, 'y': 17.262769728, 'z': '50th'},
- {'x': 128.5, 'y': 19.206448627, 'z': '75th'},
- {'x': 128.5, 'y': 20.574460154, 'z': '85th'},
- {'x': 128.5, 'y': 21.692243641, 'z': '90th'},
- {'x': 128.5, 'y': 23.758449602, 'z': '95th'},
- {'x': 128.5, 'y': 25.478459916, 'z': '97th'},
- {'x': 129.5, 'y': 13.991821482, 'z': '3rd'},
- {'x': 129.5, 'y': 14.304587427, 'z': '5th'},
- {'x': 129.5, 'y': 14.831199119, 'z': '10th'},
- {'x': 129.5, 'y': 15.862028908, 'z': '25th'},
- {'x': 129.5, 'y': 17.314028776, 'z': '50th'},
- {'x': 129.5, 'y': 19.270911401, 'z': '75th'},
- {'x': 129.5, 'y': 20.648383208, 'z': '85th'},
- {'x': 129.5, 'y': 21.773955058, 'z': '90th'},
- {'x': 129.5, 'y': 23.854597539, 'z': '95th'},
- {'x': 129.5, 'y': 25.586566609, 'z': '97th'},
- {'x': 130.5, 'y': 14.022242183, 'z': '3rd'},
- {'x': 130.5, 'y': 14.336911777, 'z': '5th'},
- {'x': 130.5, 'y': 14.866770835, 'z': '10th'},
- {'x': 130.5, 'y': 15.904095844, 'z': '25th'},
- {'x': 130.5, 'y': 17.365507199, 'z': '50th'},
- {'x': 130.5, 'y': 19.335438943, 'z': '75th'},
- {'x': 130.5, 'y': 20.722266606, 'z': '85th'},
- {'x': 130.5, 'y': 21.855545616, 'z': '90th'},
- {'x': 130.5, 'y': 23.950487558, 'z': '95th'},
- {'x': 130.5, 'y': 25.694317634, 'z': '97th'},
- {'x': 131.5, 'y': 14.053138976, 'z': '3rd'},
- {'x': 131.5, 'y': 14.369687229, 'z': '5th'},
- {'x': 131.5, 'y': 14.902751164, 'z': '10th'},
- {'x': 131.5, 'y': 15.946487218, 'z': '25th'},
- {'x': 131.5, 'y': 17.417190895, 'z': '50th'},
- {'x': 131.5, 'y': 19.400014184, 'z': '75th'},
- {'x': 131.5, 'y': 20.79609169, 'z': '85th'},
- {'x': 131.5, 'y': 21.936995752, 'z': '90th'},
- {'x': 131.5, 'y': 24.046099573, 'z': '95th'},
- {'x': 131.5, 'y': 25.801693793, 'z': '97th'},
- {'x': 132.5, 'y': 14.084503604, 'z': '3rd'},
- {'x': 132.5, 'y': 14.402904971, 'z': '5th'},
- {'x': 132.5, 'y': 14.939130356, 'z': '10th'},
- {'x': 132.5, 'y': 15.989191457, 'z': '25th'},
- {'x': 132.5, 'y': 17.469065845, 'z': '50th'},
- {'x': 132.5, 'y': 19.464620284, 'z': '75th'},
- {'x': 132.5, 'y': 20.869840136, 'z': '85th'},
- {'x': 132.5, 'y': 22.018286325, 'z': '90th'},
- {'x': 132.5, 'y': 24.141414065, 'z': '95th'},
- {'x': 132.5, 'y': 25.908676558, 'z': '97th'},
- {'x': 133.5, 'y': 14.116327651, 'z': '3rd'},
- {'x': 133.5, 'y': 14.436556052, 'z': '5th'},
- {'x': 133.5, 'y': 14.975898557, 'z': '10th'},
- {'x': 133.5, 'y': 16.032196956, 'z': '25th'},
- {'x': 133.5, 'y': 17.52111811, 'z': '50th'},
- {'x': 133.5, 'y': 19.529240638, 'z': '75th'},
- {'x': 133.5, 'y': 20.943493956, 'z': '85th'},
- {'x': 133.5, 'y': 22.099398612, 'z': '90th'},
- {'x': 133.5, 'y': 24.236412075, 'z': '95th'},
- {'x': 133.5, 'y': 26.015248074, 'z': '97th'},
- {'x': 134.5, 'y': 14.148603066, 'z': '3rd'},
- {'x': 134.5, 'y': 14.470631805, 'z': '5th'},
- {'x': 134.5, 'y': 15.013046071, 'z': '10th'},
- {'x': 134.5, 'y': 16.075492051, 'z': '25th'},
- {'x': 134.5, 'y': 17.573333469, 'z': '50th'},
- {'x': 134.5, 'y': 19.593858264, 'z': '75th'},
- {'x': 134.5, 'y': 21.017034888, 'z': '85th'},
- {'x': 134.5, 'y': 22.180313815, 'z': '90th'},
- {'x': 134.5, 'y': 24.331075256, 'z': '95th'},
- {'x': 134.5, 'y': 26.121392012, 'z': '97th'},
- {'x': 135.5, 'y': 14.181320323, 'z': '3rd'},
- {'x': 135.5, 'y': 14.505122367, 'z': '5th'},
- {'x': 135.5, 'y': 15.050562451, 'z': '10th'},
- {'x': 135.5, 'y': 16.119065133, 'z': '25th'},
- {'x': 135.5, 'y': 17.625698688, 'z': '50th'},
- {'x': 135.5, 'y': 19.658457924, 'z': '75th'},
- {'x': 135.5, 'y': 21.090446529, 'z': '85th'},
- {'x': 135.5, 'y': 22.261014785, 'z': '90th'},
- {'x': 135.5, 'y': 24.4253857, 'z': '95th'},
- {'x': 135.5, 'y': 26.227090562, 'z': '97th'},
- {'x': 136.5, 'y': 14.214470838, 'z': '3rd'},
- {'x': 136.5, 'y': 14.540018622, 'z': '5th'},
- {'x': 136.5, 'y': 15.088437692, 'z': '10th'},
- {'x': 136.5, 'y': 16.162904499, 'z': '25th'},
- {'x': 136.5, 'y': 17.678199868, 'z': '50th'},
- {'x': 136.5, 'y': 19.723023361, 'z': '75th'},
- {'x': 136.5, 'y': 21.163711548, 'z': '85th'},
- {'x': 136.5, 'y': 22.341483772, 'z': '90th'},
- {'x': 136.5, 'y': 24.519326162, 'z': '95th'},
- {'x': 136.5, 'y': 26.332328374, 'z': '97th'},
- {'x': 137.5, 'y': 14.248045559, 'z': '3rd'},
- {'x': 137.5, 'y': 14.575311069, 'z': '5th'},
- {'x': 137.5, 'y': 15.126661536, 'z': '10th'},
- {'x': 137.5, 'y': 16.206998438, 'z': '25th'},
- {'x': 137.5, 'y': 17.730823397, 'z': '50th'},
- {'x': 137.5, 'y': 19.787538893, 'z': '75th'},
- {'x': 137.5, 'y': 21.2368133, 'z': '85th'},
- {'x': 137.5, 'y': 22.421703726, 'z': '90th'},
- {'x': 137.5, 'y': 24.612879933, 'z': '95th'},
- {'x': 137.5, 'y': 26.437090271, 'z': '97th'},
- {'x': 138.5, 'y': 14.282035277, 'z': '3rd'},
- {'x': 138.5, 'y': 14.610990067, 'z': '5th'},
- {'x': 138.5, 'y': 15.165223623, 'z': '10th'},
- {'x': 138.5, 'y': 16.251335212, 'z': '25th'},
- {'x': 138.5, 'y': 17.783555746, 'z': '50th'},
- {'x': 138.5, 'y': 19.851989073, 'z': '75th'},
- {'x': 138.5, 'y': 21.309735477, 'z': '85th'},
- {'x': 138.5, 'y': 22.501658014, 'z': '90th'},
- {'x': 138.5, 'y': 24.706030862, 'z': '95th'},
- {'x': 138.5, 'y': 26.54136175, 'z': '97th'},
- {'x': 139.5, 'y': 14.31643062, 'z': '3rd'},
- {'x': 139.5, 'y': 14.647045838, 'z': '5th'},
- {'x': 139.5, 'y': 15.204113491, 'z': '10th'},
- {'x': 139.5, 'y': 16.295903054, 'z': '25th'},
- {'x': 139.5, 'y': 17.836383471, 'z': '50th'},
- {'x': 139.5, 'y': 19.916358689, 'z': '75th'},
- {'x': 139.5, 'y': 21.38246211, 'z': '85th'},
- {'x': 139.5, 'y': 22.581330425, 'z': '90th'},
- {'x': 139.5, 'y': 24.798763363, 'z': '95th'},
- {'x': 139.5, 'y': 26.645128974, 'z': '97th'},
- {'x': 140.5, 'y': 14.351222058, 'z': '3rd'},
- {'x': 140.5, 'y': 14.683468464, 'z': '5th'},
- {'x': 140.5, 'y': 15.243320574, 'z': '10th'},
- {'x': 140.5, 'y': 16.340690171, 'z': '25th'},
- {'x': 140.5, 'y': 17.889293209, 'z': '50th'},
- {'x': 140.5, 'y': 19.980632762, 'z': '75th'},
- {'x': 140.5, 'y': 21.454977564, 'z': '85th'},
- {'x': 140.5, 'y': 22.660705166, 'z': '90th'},
- {'x': 140.5, 'y': 24.891062407, 'z': '95th'},
- {'x': 140.5, 'y': 26.748378778, 'z': '97th'},
- {'x': 141.5, 'y': 14.386399899, 'z': '3rd'},
- {'x': 141.5, 'y': 14.720247888, 'z': '5th'},
- {'x': 141.5, 'y': 15.282834206, 'z': '10th'},
- {'x': 141.5, 'y': 16.385684746, 'z': '25th'},
- {'x': 141.5, 'y': 17.942271684, 'z': '50th'},
- {'x': 141.5, 'y': 20.044796548, 'z': '75th'},
- {'x': 141.5, 'y': 21.527266545, 'z': '85th'},
- {'x': 141.5, 'y': 22.739766862, 'z': '90th'},
- {'x': 141.5, 'y': 24.982913526, 'z': '95th'},
- {'x': 141.5, 'y': 26.851098665, 'z': '97th'},
- {'x': 142.5, 'y': 14.42195429, 'z': '3rd'},
- {'x': 142.5, 'y': 14.757373914, 'z': '5th'},
- {'x': 142.5, 'y': 15.322643618, 'z': '10th'},
- {'x': 142.5, 'y': 16.430874933, 'z': '25th'},
- {'x': 142.5, 'y': 17.995305704, 'z': '50th'},
- {'x': 142.5, 'y': 20.108835539, 'z': '75th'},
- {'x': 142.5, 'y': 21.599314096, 'z': '85th'},
- {'x': 142.5, 'y': 22.818500558, 'z': '90th'},
- {'x': 142.5, 'y': 25.074302811, 'z': '95th'},
- {'x': 142.5, 'y': 26.953276807, 'z': '97th'},
- {'x': 143.5, 'y': 14.457875217, 'z': '3rd'},
- {'x': 143.5, 'y': 14.794836204, 'z': '5th'},
- {'x': 143.5, 'y': 15.362737939, 'z': '10th'},
- {'x': 143.5, 'y': 16.476248861, 'z': '25th'},
- {'x': 143.5, 'y': 18.048382162, 'z': '50th'},
- {'x': 143.5, 'y': 20.172735461, 'z': '75th'},
- {'x': 143.5, 'y': 21.671105598, 'z': '85th'},
- {'x': 143.5, 'y': 22.896891716, 'z': '90th'},
- {'x': 143.5, 'y': 25.165216914, 'z': '95th'},
- {'x': 143.5, 'y': 27.054902046, 'z': '97th'},
- {'x': 144.5, 'y': 14.494152502, 'z': '3rd'},
- {'x': 144.5, 'y': 14.832624281, 'z': '5th'},
- {'x': 144.5, 'y': 15.403106193, 'z': '10th'},
- {'x': 144.5, 'y': 16.521794632, 'z': '25th'},
- {'x': 144.5, 'y': 18.101488036, 'z': '50th'},
- {'x': 144.5, 'y': 20.236482278, 'z': '75th'},
- {'x': 144.5, 'y': 21.742626772, 'z': '85th'},
- {'x': 144.5, 'y': 22.974926221, 'z': '90th'},
- {'x': 144.5, 'y': 25.255643043, 'z': '95th'},
- {'x': 144.5, 'y': 27.155963891, 'z': '97th'},
- {'x': 145.5, 'y': 14.530775807, 'z': '3rd'},
- {'x': 145.5, 'y': 14.870727527, 'z': '5th'},
- {'x': 145.5, 'y': 15.443737306, 'z': '10th'},
- {'x': 145.5, 'y': 16.567500325, 'z': '25th'},
- {'x': 145.5, 'y': 18.154610394, 'z': '50th'},
- {'x': 145.5, 'y': 20.300062191, 'z': '75th'},
- {'x': 145.5, 'y': 21.813863676, 'z': '85th'},
- {'x': 145.5, 'y': 23.052590371, 'z': '90th'},
- {'x': 145.5, 'y': 25.345568966, 'z': '95th'},
- {'x': 145.5, 'y': 27.256452521, 'z': '97th'},
- {'x': 146.5, 'y': 14.567734629, 'z': '3rd'},
- {'x': 146.5, 'y': 14.909135184, 'z': '5th'},
- {'x': 146.5, 'y': 15.484620095, 'z': '10th'},
- {'x': 146.5, 'y': 16.61335399, 'z': '25th'},
- {'x': 146.5, 'y': 18.207736386, 'z': '50th'},
- {'x': 146.5, 'y': 20.363461637, 'z': '75th'},
- {'x': 146.5, 'y': 21.884802708, 'z': '85th'},
- {'x': 146.5, 'y': 23.129870888, 'z': '90th'},
- {'x': 146.5, 'y': 25.434983007, 'z': '95th'},
- {'x': 146.5, 'y': 27.356358781, 'z': '97th'},
- {'x': 147.5, 'y': 14.605018301, 'z': '3rd'},
- {'x': 147.5, 'y': 14.947836351, 'z': '5th'},
- {'x': 147.5, 'y': 15.52574328, 'z': '10th'},
- {'x': 147.5, 'y': 16.659343656, 'z': '25th'},
- {'x': 147.5, 'y': 18.260853253, 'z': '50th'},
- {'x': 147.5, 'y': 20.426667293, 'z': '75th'},
- {'x': 147.5, 'y': 21.955430607, 'z': '85th'},
- {'x': 147.5, 'y': 23.20675491, 'z': '90th'},
- {'x': 147.5, 'y': 25.523874049, 'z': '95th'},
- {'x': 147.5, 'y': 27.455674187, 'z': '97th'},
- {'x': 148.5, 'y': 14.642615994, 'z': '3rd'},
- {'x': 148.5, 'y': 14.986819986, 'z': '5th'},
- {'x': 148.5, 'y': 15.567095474, 'z': '10th'},
- {'x': 148.5, 'y': 16.705457324, 'z': '25th'},
- {'x': 148.5, 'y': 18.313948324, 'z': '50th'},
- {'x': 148.5, 'y': 20.489666074, 'z': '75th'},
- {'x': 148.5, 'y': 22.02573445, 'z': '85th'},
- {'x': 148.5, 'y': 23.283229994, 'z': '90th'},
- {'x': 148.5, 'y': 25.612231528, 'z': '95th'},
- {'x': 148.5, 'y': 27.55439092, 'z': '97th'},
- {'x': 149.5, 'y': 14.680516712, 'z': '3rd'},
- {'x': 149.5, 'y': 15.026074904, 'z': '5th'},
- {'x': 149.5, 'y': 15.608665187, 'z': '10th'},
- {'x': 149.5, 'y': 16.751682972, 'z': '25th'},
- {'x': 149.5, 'y': 18.367009017, 'z': '50th'},
- {'x': 149.5, 'y': 20.552445135, 'z': '75th'},
- {'x': 149.5, 'y': 22.095701657, 'z': '85th'},
- {'x': 149.5, 'y': 23.359284118, 'z': '90th'},
- {'x': 149.5, 'y': 25.700045441, 'z': '95th'},
- {'x': 149.5, 'y': 27.652501829, 'z': '97th'},
- {'x': 150.5, 'y': 14.718709295, 'z': '3rd'},
- {'x': 150.5, 'y': 15.065589778, 'z': '5th'},
- {'x': 150.5, 'y': 15.650440826, 'z': '10th'},
- {'x': 150.5, 'y': 16.798008553, 'z': '25th'},
- {'x': 150.5, 'y': 18.420022839, 'z': '50th'},
- {'x': 150.5, 'y': 20.61499187, 'z': '75th'},
- {'x': 150.5, 'y': 22.165319987, 'z': '85th'},
- {'x': 150.5, 'y': 23.434905677, 'z': '90th'},
- {'x': 150.5, 'y': 25.787306336, 'z': '95th'},
- {'x': 150.5, 'y': 27.750000429, 'z': '97th'},
- {'x': 151.5, 'y': 14.757182414, 'z': '3rd'},
- {'x': 151.5, 'y': 15.105353137, 'z': '5th'},
- {'x': 151.5, 'y': 15.692410697, 'z': '10th'},
- {'x': 151.5, 'y': 16.844421999, 'z': '25th'},
- {'x': 151.5, 'y': 18.472977388, 'z': '50th'},
- {'x': 151.5, 'y': 20.677293916, 'z': '75th'},
- {'x': 151.5, 'y': 22.23457754, 'z': '85th'},
- {'x': 151.5, 'y': 23.510083486, 'z': '90th'},
- {'x': 151.5, 'y': 25.874005319, 'z': '95th'},
- {'x': 151.5, 'y': 27.846880903, 'z': '97th'},
- {'x': 152.5, 'y': 14.795924576, 'z': '3rd'},
- {'x': 152.5, 'y': 15.145353366, 'z': '5th'},
- {'x': 152.5, 'y': 15.734562997, 'z': '10th'},
- {'x': 152.5, 'y': 16.890911214, 'z': '25th'},
- {'x': 152.5, 'y': 18.525860352, 'z': '50th'},
- {'x': 152.5, 'y': 20.739339151, 'z': '75th'},
- {'x': 152.5, 'y': 22.303462758, 'z': '85th'},
- {'x': 152.5, 'y': 23.584806779, 'z': '90th'},
- {'x': 152.5, 'y': 25.960134049, 'z': '95th'},
- {'x': 152.5, 'y': 27.943138099, 'z': '97th'},
- {'x': 153.5, 'y': 14.83492412, 'z': '3rd'},
- {'x': 153.5, 'y': 15.185578709, 'z': '5th'},
- {'x': 153.5, 'y': 15.776885824, 'z': '10th'},
- {'x': 153.5, 'y': 16.937464082, 'z': '25th'},
- {'x': 153.5, 'y': 18.578659513, 'z': '50th'},
- {'x': 153.5, 'y': 20.801115694, 'z': '75th'},
- {'x': 153.5, 'y': 22.371964427, 'z': '85th'},
- {'x': 153.5, 'y': 23.659065209, 'z': '90th'},
- {'x': 153.5, 'y': 26.045684738, 'z': '95th'},
- {'x': 153.5, 'y': 28.03876753, 'z': '97th'},
- {'x': 154.5, 'y': 14.874169215, 'z': '3rd'},
- {'x': 154.5, 'y': 15.22601726, 'z': '5th'},
- {'x': 154.5, 'y': 15.819367168, 'z': '10th'},
- {'x': 154.5, 'y': 16.984068463, 'z': '25th'},
- {'x': 154.5, 'y': 18.631362745, 'z': '50th'},
- {'x': 154.5, 'y': 20.862611908, 'z': '75th'},
- {'x': 154.5, 'y': 22.440071674, 'z': '85th'},
- {'x': 154.5, 'y': 23.732848848, 'z': '90th'},
- {'x': 154.5, 'y': 26.130650155, 'z': '95th'},
- {'x': 154.5, 'y': 28.133765375, 'z': '97th'},
- {'x': 155.5, 'y': 14.913647861, 'z': '3rd'},
- {'x': 155.5, 'y': 15.266656971, 'z': '5th'},
- {'x': 155.5, 'y': 15.861994917, 'z': '10th'},
- {'x': 155.5, 'y': 17.030712195, 'z': '25th'},
- {'x': 155.5, 'y': 18.683958013, 'z': '50th'},
- {'x': 155.5, 'y': 20.923816402, 'z': '75th'},
- {'x': 155.5, 'y': 22.507773969, 'z': '85th'},
- {'x': 155.5, 'y': 23.806148189, 'z': '90th'},
- {'x': 155.5, 'y': 26.215023617, 'z': '95th'},
- {'x': 155.5, 'y': 28.228128478, 'z': '97th'},
- {'x': 156.5, 'y': 14.953347891, 'z': '3rd'},
- {'x': 156.5, 'y': 15.307485648, 'z': '5th'},
- {'x': 156.5, 'y': 15.904756854, 'z': '10th'},
- {'x': 156.5, 'y': 17.077383093, 'z': '25th'},
- {'x': 156.5, 'y': 18.736433381, 'z': '50th'},
- {'x': 156.5, 'y': 20.984718028, 'z': '75th'},
- {'x': 156.5, 'y': 22.575061126, 'z': '85th'},
- {'x': 156.5, 'y': 23.878954143, 'z': '90th'},
- {'x': 156.5, 'y': 26.298798997, 'z': '95th'},
- {'x': 156.5, 'y': 28.321854345, 'z': '97th'},
- {'x': 157.5, 'y': 14.993256963, 'z': '3rd'},
- {'x': 157.5, 'y': 15.34849095, 'z': '5th'},
- {'x': 157.5, 'y': 15.947640656, 'z': '10th'},
- {'x': 157.5, 'y': 17.124068951, 'z': '25th'},
- {'x': 157.5, 'y': 18.788777004, 'z': '50th'},
- {'x': 157.5, 'y': 21.045305885, 'z': '75th'},
- {'x': 157.5, 'y': 22.641923303, 'z': '85th'},
- {'x': 157.5, 'y': 23.951258042, 'z': '90th'},
- {'x': 157.5, 'y': 26.381970718, 'z': '95th'},
- {'x': 157.5, 'y': 28.414941148, 'z': '97th'},
- {'x': 158.5, 'y': 15.033362567, 'z': '3rd'},
- {'x': 158.5, 'y': 15.389660389, 'z': '5th'},
- {'x': 158.5, 'y': 15.990633897, 'z': '10th'},
- {'x': 158.5, 'y': 17.170757542, 'z': '25th'},
- {'x': 158.5, 'y': 18.840977134, 'z': '50th'},
- {'x': 158.5, 'y': 21.105569316, 'z': '75th'},
- {'x': 158.5, 'y': 22.708351005, 'z': '85th'},
- {'x': 158.5, 'y': 24.023051637, 'z': '90th'},
- {'x': 158.5, 'y': 26.464533755, 'z': '95th'},
- {'x': 158.5, 'y': 28.507387718, 'z': '97th'},
- {'x': 159.5, 'y': 15.073652017, 'z': '3rd'},
- {'x': 159.5, 'y': 15.430981329, 'z': '5th'},
- {'x': 159.5, 'y': 16.033724043, 'z': '10th'},
- {'x': 159.5, 'y': 17.217436616, 'z': '25th'},
- {'x': 159.5, 'y': 18.893022121, 'z': '50th'},
- {'x': 159.5, 'y': 21.165497916, 'z': '75th'},
- {'x': 159.5, 'y': 22.774335079, 'z': '85th'},
- {'x': 159.5, 'y': 24.0943271, 'z': '90th'},
- {'x': 159.5, 'y': 26.546483632, 'z': '95th'},
- {'x': 159.5, 'y': 28.599193552, 'z': '97th'},
- {'x': 160.5, 'y': 15.114112458, 'z': '3rd'},
- {'x': 160.5, 'y': 15.472440986, 'z': '5th'},
- {'x': 160.5, 'y': 16.076898457, 'z': '10th'},
- {'x': 160.5, 'y': 17.264093904, 'z': '25th'},
- {'x': 160.5, 'y': 18.944900411, 'z': '50th'},
- {'x': 160.5, 'y': 21.225081524, 'z': '75th'},
- {'x': 160.5, 'y': 22.839866721, 'z': '85th'},
- {'x': 160.5, 'y': 24.165077024, 'z': '90th'},
- {'x': 160.5, 'y': 26.627816426, 'z': '95th'},
- {'x': 160.5, 'y': 28.690358805, 'z': '97th'},
- {'x': 161.5, 'y': 15.154730857, 'z': '3rd'},
- {'x': 161.5, 'y': 15.514026427, 'z': '5th'},
- {'x': 161.5, 'y': 16.120144395, 'z': '10th'},
- {'x': 161.5, 'y': 17.310717115, 'z': '25th'},
- {'x': 161.5, 'y': 18.996600549, 'z': '50th'},
- {'x': 161.5, 'y': 21.284310233, 'z': '75th'},
- {'x': 161.5, 'y': 22.904937473, 'z': '85th'},
- {'x': 161.5, 'y': 24.235294421, 'z': '90th'},
- {'x': 161.5, 'y': 26.70852876, 'z': '95th'},
- {'x': 161.5, 'y': 28.780884296, 'z': '97th'},
- {'x': 162.5, 'y': 15.195494007, 'z': '3rd'},
- {'x': 162.5, 'y': 15.555724571, 'z': '5th'},
- {'x': 162.5, 'y': 16.163449007, 'z': '10th'},
- {'x': 162.5, 'y': 17.35729394, 'z': '25th'},
- {'x': 162.5, 'y': 19.048111179, 'z': '50th'},
- {'x': 162.5, 'y': 21.343174381, 'z': '75th'},
- {'x': 162.5, 'y': 22.969539223, 'z': '85th'},
- {'x': 162.5, 'y': 24.304972725, 'z': '90th'},
- {'x': 162.5, 'y': 26.788617809, 'z': '95th'},
- {'x': 162.5, 'y': 28.870771501, 'z': '97th'},
- {'x': 163.5, 'y': 15.236388527, 'z': '3rd'},
- {'x': 163.5, 'y': 15.597522183, 'z': '5th'},
- {'x': 163.5, 'y': 16.206799337, 'z': '10th'},
- {'x': 163.5, 'y': 17.403812048, 'z': '25th'},
- {'x': 163.5, 'y': 19.099421046, 'z': '50th'},
- {'x': 163.5, 'y': 21.401664563, 'z': '75th'},
- {'x': 163.5, 'y': 23.033664209, 'z': '85th'},
- {'x': 163.5, 'y': 24.374105793, 'z': '90th'},
- {'x': 163.5, 'y': 26.868081296, 'z': '95th'},
- {'x': 163.5, 'y': 28.960022556, 'z': '97th'},
- {'x': 164.5, 'y': 15.277400855, 'z': '3rd'},
- {'x': 164.5, 'y': 15.639405882, 'z': '5th'},
- {'x': 164.5, 'y': 16.250182323, 'z': '10th'},
- {'x': 164.5, 'y': 17.45025909, 'z': '25th'},
- {'x': 164.5, 'y': 19.150518994, 'z': '50th'},
- {'x': 164.5, 'y': 21.459771622, 'z': '75th'},
- {'x': 164.5, 'y': 23.097305018, 'z': '85th'},
- {'x': 164.5, 'y': 24.442687902, 'z': '90th'},
- {'x': 164.5, 'y': 26.94691749, 'z': '95th'},
- {'x': 164.5, 'y': 29.048640254, 'z': '97th'},
- {'x': 165.5, 'y': 15.318517255, 'z': '3rd'},
- {'x': 165.5, 'y': 15.681362131, 'z': '5th'},
- {'x': 165.5, 'y': 16.293584795, 'z': '10th'},
- {'x': 165.5, 'y': 17.496622696, 'z': '25th'},
- {'x': 165.5, 'y': 19.201393971, 'z': '50th'},
- {'x': 165.5, 'y': 21.517486656, 'z': '75th'},
- {'x': 165.5, 'y': 23.160454584, 'z': '85th'},
- {'x': 165.5, 'y': 24.510713751, 'z': '90th'},
- {'x': 165.5, 'y': 27.025125211, 'z': '95th'},
- {'x': 165.5, 'y': 29.136628048, 'z': '97th'},
- {'x': 166.5, 'y': 15.359723809, 'z': '3rd'},
- {'x': 166.5, 'y': 15.723377243, 'z': '5th'},
- {'x': 166.5, 'y': 16.336993476, 'z': '10th'},
- {'x': 166.5, 'y': 17.54289048, 'z': '25th'},
- {'x': 166.5, 'y': 19.252035026, 'z': '50th'},
- {'x': 166.5, 'y': 21.574801018, 'z': '75th'},
- {'x': 166.5, 'y': 23.223106195, 'z': '85th'},
- {'x': 166.5, 'y': 24.578178463, 'z': '90th'},
- {'x': 166.5, 'y': 27.102703824, 'z': '95th'},
- {'x': 166.5, 'y': 29.223990044, 'z': '97th'},
- {'x': 167.5, 'y': 15.401006423, 'z': '3rd'},
- {'x': 167.5, 'y': 15.765437378, 'z': '5th'},
- {'x': 167.5, 'y': 16.380394981, 'z': '10th'},
- {'x': 167.5, 'y': 17.589050034, 'z': '25th'},
- {'x': 167.5, 'y': 19.302431312, 'z': '50th'},
- {'x': 167.5, 'y': 21.631706315, 'z': '75th'},
- {'x': 167.5, 'y': 23.285253487, 'z': '85th'},
- {'x': 167.5, 'y': 24.645077582, 'z': '90th'},
- {'x': 167.5, 'y': 27.17965324, 'z': '95th'},
- {'x': 167.5, 'y': 29.310731006, 'z': '97th'},
- {'x': 168.5, 'y': 15.442350817, 'z': '3rd'},
- {'x': 168.5, 'y': 15.807528542, 'z': '5th'},
- {'x': 168.5, 'y': 16.423775819, 'z': '10th'},
- {'x': 168.5, 'y': 17.635088935, 'z': '25th'},
- {'x': 168.5, 'y': 19.352572085, 'z': '50th'},
- {'x': 168.5, 'y': 21.688194411, 'z': '75th'},
- {'x': 168.5, 'y': 23.346890452, 'z': '85th'},
- {'x': 168.5, 'y': 24.711407079, 'z': '90th'},
- {'x': 168.5, 'y': 27.255973919, 'z': '95th'},
- {'x': 168.5, 'y': 29.396856349, 'z': '97th'},
- {'x': 169.5, 'y': 15.483742535, 'z': '3rd'},
- {'x': 169.5, 'y': 15.849636587, 'z': '5th'},
- {'x': 169.5, 'y': 16.467122389, 'z': '10th'},
- {'x': 169.5, 'y': 17.680994739, 'z': '25th'},
- {'x': 169.5, 'y': 19.402446707, 'z': '50th'},
- {'x': 169.5, 'y': 21.744257427, 'z': '75th'},
- {'x': 169.5, 'y': 23.408011431, 'z': '85th'},
- {'x': 169.5, 'y': 24.777163347, 'z': '90th'},
- {'x': 169.5, 'y': 27.331666865, 'z': '95th'},
- {'x': 169.5, 'y': 29.482372143, 'z': '97th'},
- {'x': 170.5, 'y': 15.525166933, 'z': '3rd'},
- {'x': 170.5, 'y': 15.891747208, 'z': '5th'},
- {'x': 170.5, 'y': 16.510420982, 'z': '10th'},
- {'x': 170.5, 'y': 17.726754985, 'z': '25th'},
- {'x': 170.5, 'y': 19.452044646, 'z': '50th'},
- {'x': 170.5, 'y': 21.799887744, 'z': '75th'},
- {'x': 170.5, 'y': 23.468611122, 'z': '85th'},
- {'x': 170.5, 'y': 24.842343203, 'z': '90th'},
- {'x': 170.5, 'y': 27.406733627, 'z': '95th'},
- {'x': 170.5, 'y': 29.567285111, 'z': '97th'},
- {'x': 171.5, 'y': 15.566609187, 'z': '3rd'},
- {'x': 171.5, 'y': 15.933845947, 'z': '5th'},
- {'x': 171.5, 'y': 16.55365778, 'z': '10th'},
- {'x': 171.5, 'y': 17.772357195, 'z': '25th'},
- {'x': 171.5, 'y': 19.501355476, 'z': '50th'},
- {'x': 171.5, 'y': 21.855078, 'z': '75th'},
- {'x': 171.5, 'y': 23.528684575, 'z': '85th'},
- {'x': 171.5, 'y': 24.90694389, 'z': '90th'},
- {'x': 171.5, 'y': 27.481176301, 'z': '95th'},
- {'x': 171.5, 'y': 29.651602625, 'z': '97th'},
- {'x': 172.5, 'y': 15.608054288, 'z': '3rd'},
- {'x': 172.5, 'y': 15.975918187, 'z': '5th'},
- {'x': 172.5, 'y': 16.596818856, 'z': '10th'},
- {'x': 172.5, 'y': 17.817788873, 'z': '25th'},
- {'x': 172.5, 'y': 19.550368876, 'z': '50th'},
- {'x': 172.5, 'y': 21.909821094, 'z': '75th'},
- {'x': 172.5, 'y': 23.588227198, 'z': '85th'},
- {'x': 172.5, 'y': 24.970963079, 'z': '90th'},
- {'x': 172.5, 'y': 27.554997527, 'z': '95th'},
- {'x': 172.5, 'y': 29.735332707, 'z': '97th'},
- {'x': 173.5, 'y': 15.649487039, 'z': '3rd'},
- {'x': 173.5, 'y': 16.017949155, 'z': '5th'},
- {'x': 173.5, 'y': 16.639890174, 'z': '10th'},
- {'x': 173.5, 'y': 17.863037506, 'z': '25th'},
- {'x': 173.5, 'y': 19.599074637, 'z': '50th'},
- {'x': 173.5, 'y': 21.964110189, 'z': '75th'},
- {'x': 173.5, 'y': 23.647234755, 'z': '85th'},
- {'x': 173.5, 'y': 25.034398866, 'z': '90th'},
- {'x': 173.5, 'y': 27.62820049, 'z': '95th'},
- {'x': 173.5, 'y': 29.818484028, 'z': '97th'},
- {'x': 174.5, 'y': 15.690892059, 'z': '3rd'},
- {'x': 174.5, 'y': 16.059923921, 'z': '5th'},
- {'x': 174.5, 'y': 16.682857585, 'z': '10th'},
- {'x': 174.5, 'y': 17.908090562, 'z': '25th'},
- {'x': 174.5, 'y': 19.647462655, 'z': '50th'},
- {'x': 174.5, 'y': 22.017938706, 'z': '75th'},
- {'x': 174.5, 'y': 23.705703367, 'z': '85th'},
- {'x': 174.5, 'y': 25.097249774, 'z': '90th'},
- {'x': 174.5, 'y': 27.700788918, 'z': '95th'},
- {'x': 174.5, 'y': 29.901065905, 'z': '97th'},
- {'x': 175.5, 'y': 15.732253779, 'z': '3rd'},
- {'x': 175.5, 'y': 16.101827393, 'z': '5th'},
- {'x': 175.5, 'y': 16.725706833, 'z': '10th'},
- {'x': 175.5, 'y': 17.952935494, 'z': '25th'},
- {'x': 175.5, 'y': 19.695522937, 'z': '50th'},
- {'x': 175.5, 'y': 22.071300334, 'z': '75th'},
- {'x': 175.5, 'y': 23.763629515, 'z': '85th'},
- {'x': 175.5, 'y': 25.159514755, 'z': '90th'},
- {'x': 175.5, 'y': 27.772767087, 'z': '95th'},
- {'x': 175.5, 'y': 29.9830883, 'z': '97th'},
- {'x': 176.5, 'y': 15.773556441, 'z': '3rd'},
- {'x': 176.5, 'y': 16.143644323, 'z': '5th'},
- {'x': 176.5, 'y': 16.76842355, 'z': '10th'},
- {'x': 176.5, 'y': 17.997559737, 'z': '25th'},
- {'x': 176.5, 'y': 19.743245597, 'z': '50th'},
- {'x': 176.5, 'y': 22.124189022, 'z': '75th'},
- {'x': 176.5, 'y': 23.821010038, 'z': '85th'},
- {'x': 176.5, 'y': 25.22119319, 'z': '90th'},
- {'x': 176.5, 'y': 27.844139812, 'z': '95th'},
- {'x': 176.5, 'y': 30.064561822, 'z': '97th'},
- {'x': 177.5, 'y': 15.814784099, 'z': '3rd'},
- {'x': 177.5, 'y': 16.185359301, 'z': '5th'},
- {'x': 177.5, 'y': 16.810993255, 'z': '10th'},
- {'x': 177.5, 'y': 18.041950709, 'z': '25th'},
- {'x': 177.5, 'y': 19.790620862, 'z': '50th'},
- {'x': 177.5, 'y': 22.176598989, 'z': '75th'},
- {'x': 177.5, 'y': 23.877842138, 'z': '85th'},
- {'x': 177.5, 'y': 25.282284892, 'z': '90th'},
- {'x': 177.5, 'y': 27.914912457, 'z': '95th'},
- {'x': 177.5, 'y': 30.145497721, 'z': '97th'},
- {'x': 178.5, 'y': 15.855920616, 'z': '3rd'},
- {'x': 178.5, 'y': 16.226956758, 'z': '5th'},
- {'x': 178.5, 'y': 16.853401357, 'z': '10th'},
- {'x': 178.5, 'y': 18.08609581, 'z': '25th'},
- {'x': 178.5, 'y': 19.837639068, 'z': '50th'},
- {'x': 178.5, 'y': 22.228524716, 'z': '75th'},
- {'x': 178.5, 'y': 23.934123376, 'z': '85th'},
- {'x': 178.5, 'y': 25.342790101, 'z': '90th'},
- {'x': 178.5, 'y': 27.985090927, 'z': '95th'},
- {'x': 178.5, 'y': 30.225907888, 'z': '97th'},
- {'x': 179.5, 'y': 15.896949665, 'z': '3rd'},
- {'x': 179.5, 'y': 16.268420961, 'z': '5th'},
- {'x': 179.5, 'y': 16.895633153, 'z': '10th'},
- {'x': 179.5, 'y': 18.129982423, 'z': '25th'},
- {'x': 179.5, 'y': 19.884290662, 'z': '50th'},
- {'x': 179.5, 'y': 22.279960954, 'z': '75th'},
- {'x': 179.5, 'y': 23.989851678, 'z': '85th'},
- {'x': 179.5, 'y': 25.402709492, 'z': '90th'},
- {'x': 179.5, 'y': 28.054681672, 'z': '95th'},
- {'x': 179.5, 'y': 30.305804856, 'z': '97th'},
- {'x': 180.5, 'y': 15.937854728, 'z': '3rd'},
- {'x': 180.5, 'y': 16.309736017, 'z': '5th'},
- {'x': 180.5, 'y': 16.937673827, 'z': '10th'},
- {'x': 180.5, 'y': 18.173597916, 'z': '25th'},
- {'x': 180.5, 'y': 19.930566203, 'z': '50th'},
- {'x': 180.5, 'y': 22.33090272, 'z': '75th'},
- {'x': 180.5, 'y': 24.045025332, 'z': '85th'},
- {'x': 180.5, 'y': 25.462044172, 'z': '90th'},
- {'x': 180.5, 'y': 28.123691687, 'z': '95th'},
- {'x': 180.5, 'y': 30.385201795, 'z': '97th'},
- {'x': 181.5, 'y': 15.978619092, 'z': '3rd'},
- {'x': 181.5, 'y': 16.350885869, 'z': '5th'},
- {'x': 181.5, 'y': 16.979508448, 'z': '10th'},
- {'x': 181.5, 'y': 18.216929637, 'z': '25th'},
- {'x': 181.5, 'y': 19.976456361, 'z': '50th'},
- {'x': 181.5, 'y': 22.381345301, 'z': '75th'},
- {'x': 181.5, 'y': 24.099642992, 'z': '85th'},
- {'x': 181.5, 'y': 25.520795682, 'z': '90th'},
- {'x': 181.5, 'y': 28.192128511, 'z': '95th'},
- {'x': 181.5, 'y': 30.464112511, 'z': '97th'},
- {'x': 182.5, 'y': 16.019225855, 'z': '3rd'},
- {'x': 182.5, 'y': 16.391854299, 'z': '5th'},
- {'x': 182.5, 'y': 17.021121976, 'z': '10th'},
- {'x': 182.5, 'y': 18.259964917, 'z': '25th'},
- {'x': 182.5, 'y': 20.021951917, 'z': '50th'},
- {'x': 182.5, 'y': 22.431284252, 'z': '75th'},
- {'x': 182.5, 'y': 24.153703678, 'z': '85th'},
- {'x': 182.5, 'y': 25.578965997, 'z': '90th'},
- {'x': 182.5, 'y': 28.260000228, 'z': '95th'},
- {'x': 182.5, 'y': 30.542551449, 'z': '97th'},
- {'x': 183.5, 'y': 16.059657919, 'z': '3rd'},
- {'x': 183.5, 'y': 16.432624923, 'z': '5th'},
- {'x': 183.5, 'y': 17.062499252, 'z': '10th'},
- {'x': 183.5, 'y': 18.302691069, 'z': '25th'},
- {'x': 183.5, 'y': 20.067043765, 'z': '50th'},
- {'x': 183.5, 'y': 22.480715401, 'z': '75th'},
- {'x': 183.5, 'y': 24.207206776, 'z': '85th'},
- {'x': 183.5, 'y': 25.63655753, 'z': '90th'},
- {'x': 183.5, 'y': 28.327315465, 'z': '95th'},
- {'x': 183.5, 'y': 30.620533684, 'z': '97th'},
- {'x': 184.5, 'y': 16.099897993, 'z': '3rd'},
- {'x': 184.5, 'y': 16.473181193, 'z': '5th'},
- {'x': 184.5, 'y': 17.103625006, 'z': '10th'},
- {'x': 184.5, 'y': 18.345095389, 'z': '25th'},
- {'x': 184.5, 'y': 20.11172291, 'z': '50th'},
- {'x': 184.5, 'y': 22.529634844, 'z': '75th'},
- {'x': 184.5, 'y': 24.260152041, 'z': '85th'},
- {'x': 184.5, 'y': 25.693573128, 'z': '90th'},
- {'x': 184.5, 'y': 28.394083399, 'z': '95th'},
- {'x': 184.5, 'y': 30.698074926, 'z': '97th'},
- {'x': 185.5, 'y': 16.13992859, 'z': '3rd'},
- {'x': 185.5, 'y': 16.513506398, 'z': '5th'},
- {'x': 185.5, 'y': 17.144483853, 'z': '10th'},
- {'x': 185.5, 'y': 18.387165154, 'z': '25th'},
- {'x': 185.5, 'y': 20.155980469, 'z': '50th'},
- {'x': 185.5, 'y': 22.578038948, 'z': '75th'},
- {'x': 185.5, 'y': 24.312539595, 'z': '85th'},
- {'x': 185.5, 'y': 25.750016081, 'z': '90th'},
- {'x': 185.5, 'y': 28.460313748, 'z': '95th'},
- {'x': 185.5, 'y': 30.775191517, 'z': '97th'},
- {'x': 186.5, 'y': 16.179732029, 'z': '3rd'},
- {'x': 186.5, 'y': 16.55358366, 'z': '5th'},
- {'x': 186.5, 'y': 17.185060291, 'z': '10th'},
- {'x': 186.5, 'y': 18.428887622, 'z': '25th'},
- {'x': 186.5, 'y': 20.199807672, 'z': '50th'},
- {'x': 186.5, 'y': 22.625924354, 'z': '75th'},
- {'x': 186.5, 'y': 24.364369931, 'z': '85th'},
- {'x': 186.5, 'y': 25.805890113, 'z': '90th'},
- {'x': 186.5, 'y': 28.52601678, 'z': '95th'},
- {'x': 186.5, 'y': 30.851900424, 'z': '97th'},
- {'x': 187.5, 'y': 16.219290434, 'z': '3rd'},
- {'x': 187.5, 'y': 16.593395935, 'z': '5th'},
- {'x': 187.5, 'y': 17.225338705, 'z': '10th'},
- {'x': 187.5, 'y': 18.470250032, 'z': '25th'},
- {'x': 187.5, 'y': 20.243195857, 'z': '50th'},
- {'x': 187.5, 'y': 22.673287974, 'z': '75th'},
- {'x': 187.5, 'y': 24.415643913, 'z': '85th'},
- {'x': 187.5, 'y': 25.861199394, 'z': '90th'},
- {'x': 187.5, 'y': 28.591203309, 'z': '95th'},
- {'x': 187.5, 'y': 30.928219248, 'z': '97th'},
- {'x': 188.5, 'y': 16.258585734, 'z': '3rd'},
- {'x': 188.5, 'y': 16.632926016, 'z': '5th'},
- {'x': 188.5, 'y': 17.265303362, 'z': '10th'},
- {'x': 188.5, 'y': 18.511239603, 'z': '25th'},
- {'x': 188.5, 'y': 20.286136477, 'z': '50th'},
- {'x': 188.5, 'y': 22.720126992, 'z': '75th'},
- {'x': 188.5, 'y': 24.466362775, 'z': '85th'},
- {'x': 188.5, 'y': 25.915948531, 'z': '90th'},
- {'x': 188.5, 'y': 28.655884697, 'z': '95th'},
- {'x': 188.5, 'y': 31.004166211, 'z': '97th'},
- {'x': 189.5, 'y': 16.297599662, 'z': '3rd'},
- {'x': 189.5, 'y': 16.672156529, 'z': '5th'},
- {'x': 189.5, 'y': 17.304938412, 'z': '10th'},
- {'x': 189.5, 'y': 18.551843534, 'z': '25th'},
- {'x': 189.5, 'y': 20.328621093, 'z': '50th'},
- {'x': 189.5, 'y': 22.766438863, 'z': '75th'},
- {'x': 189.5, 'y': 24.516528123, 'z': '85th'},
- {'x': 189.5, 'y': 25.970142578, 'z': '90th'},
- {'x': 189.5, 'y': 28.720072857, 'z': '95th'},
- {'x': 189.5, 'y': 31.079760165, 'z': '97th'},
- {'x': 190.5, 'y': 16.336313753, 'z': '3rd'},
- {'x': 190.5, 'y': 16.711069932, 'z': '5th'},
- {'x': 190.5, 'y': 17.344227892, 'z': '10th'},
- {'x': 190.5, 'y': 18.592049003, 'z': '25th'},
- {'x': 190.5, 'y': 20.370641376, 'z': '50th'},
- {'x': 190.5, 'y': 22.812221316, 'z': '75th'},
- {'x': 190.5, 'y': 24.566141937, 'z': '85th'},
- {'x': 190.5, 'y': 26.02378703, 'z': '90th'},
- {'x': 190.5, 'y': 28.783780248, 'z': '95th'},
- {'x': 190.5, 'y': 31.155020583, 'z': '97th'},
- {'x': 191.5, 'y': 16.374709351, 'z': '3rd'},
- {'x': 191.5, 'y': 16.749648518, 'z': '5th'},
- {'x': 191.5, 'y': 17.38315572, 'z': '10th'},
- {'x': 191.5, 'y': 18.631843167, 'z': '25th'},
- {'x': 191.5, 'y': 20.412189106, 'z': '50th'},
- {'x': 191.5, 'y': 22.857472353, 'z': '75th'},
- {'x': 191.5, 'y': 24.61520657, 'z': '85th'},
- {'x': 191.5, 'y': 26.076887829, 'z': '90th'},
- {'x': 191.5, 'y': 28.847019885, 'z': '95th'},
- {'x': 191.5, 'y': 31.229967564, 'z': '97th'},
- {'x': 192.5, 'y': 16.412767601, 'z': '3rd'},
- {'x': 192.5, 'y': 16.787874416, 'z': '5th'},
- {'x': 192.5, 'y': 17.421705695, 'z': '10th'},
- {'x': 192.5, 'y': 18.671213161, 'z': '25th'},
- {'x': 192.5, 'y': 20.453256172, 'z': '50th'},
- {'x': 192.5, 'y': 22.902190244, 'z': '75th'},
- {'x': 192.5, 'y': 24.663724748, 'z': '85th'},
- {'x': 192.5, 'y': 26.129451362, 'z': '90th'},
- {'x': 192.5, 'y': 28.909805333, 'z': '95th'},
- {'x': 192.5, 'y': 31.304621825, 'z': '97th'},
- {'x': 193.5, 'y': 16.450469457, 'z': '3rd'},
- {'x': 193.5, 'y': 16.825729586, 'z': '5th'},
- {'x': 193.5, 'y': 17.459861502, 'z': '10th'},
- {'x': 193.5, 'y': 18.710146096, 'z': '25th'},
- {'x': 193.5, 'y': 20.49383457, 'z': '50th'},
- {'x': 193.5, 'y': 22.946373535, 'z': '75th'},
- {'x': 193.5, 'y': 24.711699572, 'z': '85th'},
- {'x': 193.5, 'y': 26.181484465, 'z': '90th'},
- {'x': 193.5, 'y': 28.972150709, 'z': '95th'},
- {'x': 193.5, 'y': 31.379004708, 'z': '97th'},
- {'x': 194.5, 'y': 16.487795674, 'z': '3rd'},
- {'x': 194.5, 'y': 16.863195825, 'z': '5th'},
- {'x': 194.5, 'y': 17.497606707, 'z': '10th'},
- {'x': 194.5, 'y': 18.74862906, 'z': '25th'},
- {'x': 194.5, 'y': 20.5339164, 'z': '50th'},
- {'x': 194.5, 'y': 22.990021037, 'z': '75th'},
- {'x': 194.5, 'y': 24.759134514, 'z': '85th'},
- {'x': 194.5, 'y': 26.232994421, 'z': '90th'},
- {'x': 194.5, 'y': 29.034070689, 'z': '95th'},
- {'x': 194.5, 'y': 31.453138174, 'z': '97th'},
- {'x': 195.5, 'y': 16.524726818, 'z': '3rd'},
- {'x': 195.5, 'y': 16.900254764, 'z': '5th'},
- {'x': 195.5, 'y': 17.534924759, 'z': '10th'},
- {'x': 195.5, 'y': 18.786649117, 'z': '25th'},
- {'x': 195.5, 'y': 20.573493869, 'z': '50th'},
- {'x': 195.5, 'y': 23.033131835, 'z': '75th'},
- {'x': 195.5, 'y': 24.806033424, 'z': '85th'},
- {'x': 195.5, 'y': 26.283988963, 'z': '90th'},
- {'x': 195.5, 'y': 29.095580504, 'z': '95th'},
- {'x': 195.5, 'y': 31.527044804, 'z': '97th'},
- {'x': 196.5, 'y': 16.561243261, 'z': '3rd'},
- {'x': 196.5, 'y': 16.936887868, 'z': '5th'},
- {'x': 196.5, 'y': 17.571798989, 'z': '10th'},
- {'x': 196.5, 'y': 18.824193305, 'z': '25th'},
- {'x': 196.5, 'y': 20.612559285, 'z': '50th'},
- {'x': 196.5, 'y': 23.075705279, 'z': '75th'},
- {'x': 196.5, 'y': 24.852400525, 'z': '85th'},
- {'x': 196.5, 'y': 26.334476271, 'z': '90th'},
- {'x': 196.5, 'y': 29.156695943, 'z': '95th'},
- {'x': 196.5, 'y': 31.600747798, 'z': '97th'},
- {'x': 197.5, 'y': 16.597325183, 'z': '3rd'},
- {'x': 197.5, 'y': 16.97307644, 'z': '5th'},
- {'x': 197.5, 'y': 17.608212609, 'z': '10th'},
- {'x': 197.5, 'y': 18.861248634, 'z': '25th'},
- {'x': 197.5, 'y': 20.651105058, 'z': '50th'},
- {'x': 197.5, 'y': 23.117740989, 'z': '75th'},
- {'x': 197.5, 'y': 24.898240411, 'z': '85th'},
- {'x': 197.5, 'y': 26.38446498, 'z': '90th'},
- {'x': 197.5, 'y': 29.217433356, 'z': '95th'},
- {'x': 197.5, 'y': 31.674270975, 'z': '97th'},
- {'x': 198.5, 'y': 16.632952572, 'z': '3rd'},
- {'x': 198.5, 'y': 17.008801618, 'z': '5th'},
- {'x': 198.5, 'y': 17.644148717, 'z': '10th'},
- {'x': 198.5, 'y': 18.897802089, 'z': '25th'},
- {'x': 198.5, 'y': 20.689123698, 'z': '50th'},
- {'x': 198.5, 'y': 23.159238849, 'z': '75th'},
- {'x': 198.5, 'y': 24.943558054, 'z': '85th'},
- {'x': 198.5, 'y': 26.433964175, 'z': '90th'},
- {'x': 198.5, 'y': 29.277809657, 'z': '95th'},
- {'x': 198.5, 'y': 31.747638774, 'z': '97th'},
- {'x': 199.5, 'y': 16.668105899, 'z': '3rd'},
- {'x': 199.5, 'y': 17.044044915, 'z': '5th'},
- {'x': 199.5, 'y': 17.679590611, 'z': '10th'},
- {'x': 199.5, 'y': 18.933840555, 'z': '25th'},
- {'x': 199.5, 'y': 20.726607282, 'z': '50th'},
- {'x': 199.5, 'y': 23.200198098, 'z': '75th'},
- {'x': 199.5, 'y': 24.988357847, 'z': '85th'},
- {'x': 199.5, 'y': 26.482982588, 'z': '90th'},
- {'x': 199.5, 'y': 29.33784232, 'z': '95th'},
- {'x': 199.5, 'y': 31.8208776, 'z': '97th'},
- {'x': 200.5, 'y': 16.702762768, 'z': '3rd'},
- {'x': 200.5, 'y': 17.078785534, 'z': '5th'},
- {'x': 200.5, 'y': 17.714520188, 'z': '10th'},
- {'x': 200.5, 'y': 18.96935117, 'z': '25th'},
- {'x': 200.5, 'y': 20.763550105, 'z': '50th'},
- {'x': 200.5, 'y': 23.240621879, 'z': '75th'},
- {'x': 200.5, 'y': 25.032648356, 'z': '85th'},
- {'x': 200.5, 'y': 26.531532626, 'z': '90th'},
- {'x': 200.5, 'y': 29.397549393, 'z': '95th'},
- {'x': 200.5, 'y': 31.894009075, 'z': '97th'},
- {'x': 201.5, 'y': 16.736904608, 'z': '3rd'},
- {'x': 201.5, 'y': 17.113005736, 'z': '5th'},
- {'x': 201.5, 'y': 17.748921154, 'z': '10th'},
- {'x': 201.5, 'y': 19.004320616, 'z': '25th'},
- {'x': 201.5, 'y': 20.799943374, 'z': '50th'},
- {'x': 201.5, 'y': 23.280508137, 'z': '75th'},
- {'x': 201.5, 'y': 25.076432823, 'z': '85th'},
- {'x': 201.5, 'y': 26.57962232, 'z': '90th'},
- {'x': 201.5, 'y': 29.456949484, 'z': '95th'},
- {'x': 201.5, 'y': 31.96706354, 'z': '97th'},
- {'x': 202.5, 'y': 16.770509988, 'z': '3rd'},
- {'x': 202.5, 'y': 17.146685474, 'z': '5th'},
- {'x': 202.5, 'y': 17.782775811, 'z': '10th'},
- {'x': 202.5, 'y': 19.038735828, 'z': '25th'},
- {'x': 202.5, 'y': 20.83578051, 'z': '50th'},
- {'x': 202.5, 'y': 23.319858717, 'z': '75th'},
- {'x': 202.5, 'y': 25.11971866, 'z': '85th'},
- {'x': 202.5, 'y': 26.627263379, 'z': '90th'},
- {'x': 202.5, 'y': 29.51606178, 'z': '95th'},
- {'x': 202.5, 'y': 32.040066547, 'z': '97th'},
- {'x': 203.5, 'y': 16.803557958, 'z': '3rd'},
- {'x': 203.5, 'y': 17.179805079, 'z': '5th'},
- {'x': 203.5, 'y': 17.816066665, 'z': '10th'},
- {'x': 203.5, 'y': 19.072583635, 'z': '25th'},
- {'x': 203.5, 'y': 20.871054493, 'z': '50th'},
- {'x': 203.5, 'y': 23.358674816, 'z': '75th'},
- {'x': 203.5, 'y': 25.162512708, 'z': '85th'},
- {'x': 203.5, 'y': 26.674467165, 'z': '90th'},
- {'x': 203.5, 'y': 29.574906037, 'z': '95th'},
- {'x': 203.5, 'y': 32.113045614, 'z': '97th'},
- {'x': 204.5, 'y': 16.836027385, 'z': '3rd'},
- {'x': 204.5, 'y': 17.212344716, 'z': '5th'},
- {'x': 204.5, 'y': 17.848776102, 'z': '10th'},
- {'x': 204.5, 'y': 19.105850832, 'z': '25th'},
- {'x': 204.5, 'y': 20.905758394, 'z': '50th'},
- {'x': 204.5, 'y': 23.396957889, 'z': '75th'},
- {'x': 204.5, 'y': 25.204822177, 'z': '85th'},
- {'x': 204.5, 'y': 26.721245498, 'z': '90th'},
- {'x': 204.5, 'y': 29.633502591, 'z': '95th'},
- {'x': 204.5, 'y': 32.18602887, 'z': '97th'},
- {'x': 205.5, 'y': 16.867897888, 'z': '3rd'},
- {'x': 205.5, 'y': 17.244285168, 'z': '5th'},
- {'x': 205.5, 'y': 17.880886888, 'z': '10th'},
- {'x': 205.5, 'y': 19.138524174, 'z': '25th'},
- {'x': 205.5, 'y': 20.939884769, 'z': '50th'},
- {'x': 205.5, 'y': 23.43470854, 'z': '75th'},
- {'x': 205.5, 'y': 25.246653477, 'z': '85th'},
- {'x': 205.5, 'y': 26.767609651, 'z': '90th'},
- {'x': 205.5, 'y': 29.691872359, 'z': '95th'},
- {'x': 205.5, 'y': 32.259046823, 'z': '97th'},
- {'x': 206.5, 'y': 16.899145277, 'z': '3rd'},
- {'x': 206.5, 'y': 17.275604072, 'z': '5th'},
- {'x': 206.5, 'y': 17.912379748, 'z': '10th'},
- {'x': 206.5, 'y': 19.170590397, 'z': '25th'},
- {'x': 206.5, 'y': 20.973428578, 'z': '50th'},
- {'x': 206.5, 'y': 23.471931904, 'z': '75th'},
- {'x': 206.5, 'y': 25.28801794, 'z': '85th'},
- {'x': 206.5, 'y': 26.813575259, 'z': '90th'},
- {'x': 206.5, 'y': 29.750036824, 'z': '95th'},
- {'x': 206.5, 'y': 32.33212376, 'z': '97th'},
- {'x': 207.5, 'y': 16.929750116, 'z': '3rd'},
- {'x': 207.5, 'y': 17.306282966, 'z': '5th'},
- {'x': 207.5, 'y': 17.9432379, 'z': '10th'},
- {'x': 207.5, 'y': 19.202036172, 'z': '25th'},
- {'x': 207.5, 'y': 21.006381705, 'z': '50th'},
- {'x': 207.5, 'y': 23.508627555, 'z': '75th'},
- {'x': 207.5, 'y': 25.328921084, 'z': '85th'},
- {'x': 207.5, 'y': 26.859153118, 'z': '90th'},
- {'x': 207.5, 'y': 29.808018082, 'z': '95th'},
- {'x': 207.5, 'y': 32.405293867, 'z': '97th'},
- {'x': 208.5, 'y': 16.959690789, 'z': '3rd'},
- {'x': 208.5, 'y': 17.336301585, 'z': '5th'},
- {'x': 208.5, 'y': 17.973443388, 'z': '10th'},
- {'x': 208.5, 'y': 19.232848145, 'z': '25th'},
- {'x': 208.5, 'y': 21.038737402, 'z': '50th'},
- {'x': 208.5, 'y': 23.54479768, 'z': '75th'},
- {'x': 208.5, 'y': 25.369371303, 'z': '85th'},
- {'x': 208.5, 'y': 26.904356628, 'z': '90th'},
- {'x': 208.5, 'y': 29.865838796, 'z': '95th'},
- {'x': 208.5, 'y': 32.478588179, 'z': '97th'},
- {'x': 209.5, 'y': 16.988943973, 'z': '3rd'},
- {'x': 209.5, 'y': 17.365638249, 'z': '5th'},
- {'x': 209.5, 'y': 18.002977319, 'z': '10th'},
- {'x': 209.5, 'y': 19.263012919, 'z': '25th'},
- {'x': 209.5, 'y': 21.070489959, 'z': '50th'},
- {'x': 209.5, 'y': 23.580446509, 'z': '75th'},
- {'x': 209.5, 'y': 25.409379292, 'z': '85th'},
- {'x': 209.5, 'y': 26.949201319, 'z': '90th'},
- {'x': 209.5, 'y': 29.923522234, 'z': '95th'},
- {'x': 209.5, 'y': 32.552035445, 'z': '97th'},
- {'x': 210.5, 'y': 17.017488281, 'z': '3rd'},
- {'x': 210.5, 'y': 17.394272864, 'z': '5th'},
- {'x': 210.5, 'y': 18.031821809, 'z': '10th'},
- {'x': 210.5, 'y': 19.292517053, 'z': '25th'},
- {'x': 210.5, 'y': 21.101632407, 'z': '50th'},
- {'x': 210.5, 'y': 23.615576034, 'z': '75th'},
- {'x': 210.5, 'y': 25.448953455, 'z': '85th'},
- {'x': 210.5, 'y': 26.993700896, 'z': '90th'},
- {'x': 210.5, 'y': 29.981092247, 'z': '95th'},
- {'x': 210.5, 'y': 32.625669016, 'z': '97th'},
- {'x': 211.5, 'y': 17.045301197, 'z': '3rd'},
- {'x': 211.5, 'y': 17.422184393, 'z': '5th'},
- {'x': 211.5, 'y': 18.059958346, 'z': '10th'},
- {'x': 211.5, 'y': 19.321347062, 'z': '25th'},
- {'x': 211.5, 'y': 21.132158447, 'z': '50th'},
- {'x': 211.5, 'y': 23.650189616, 'z': '75th'},
- {'x': 211.5, 'y': 25.488103769, 'z': '85th'},
- {'x': 211.5, 'y': 27.037870563, 'z': '90th'},
- {'x': 211.5, 'y': 30.038573291, 'z': '95th'},
- {'x': 211.5, 'y': 32.69952105, 'z': '97th'},
- {'x': 212.5, 'y': 17.072360264, 'z': '3rd'},
- {'x': 212.5, 'y': 17.449351838, 'z': '5th'},
- {'x': 212.5, 'y': 18.087368421, 'z': '10th'},
- {'x': 212.5, 'y': 19.349489415, 'z': '25th'},
- {'x': 212.5, 'y': 21.162061708, 'z': '50th'},
- {'x': 212.5, 'y': 23.684290587, 'z': '75th'},
- {'x': 212.5, 'y': 25.526840293, 'z': '85th'},
- {'x': 212.5, 'y': 27.081725748, 'z': '90th'},
- {'x': 212.5, 'y': 30.095990421, 'z': '95th'},
- {'x': 212.5, 'y': 32.773624739, 'z': '97th'},
- {'x': 213.5, 'y': 17.098644118, 'z': '3rd'},
- {'x': 213.5, 'y': 17.475755094, 'z': '5th'},
- {'x': 213.5, 'y': 18.114034091, 'z': '10th'},
- {'x': 213.5, 'y': 19.376930549, 'z': '25th'},
- {'x': 213.5, 'y': 21.191335097, 'z': '50th'},
- {'x': 213.5, 'y': 23.71788103, 'z': '75th'},
- {'x': 213.5, 'y': 25.56517184, 'z': '85th'},
- {'x': 213.5, 'y': 27.125280941, 'z': '90th'},
- {'x': 213.5, 'y': 30.153369256, 'z': '95th'},
- {'x': 213.5, 'y': 32.848016316, 'z': '97th'},
- {'x': 214.5, 'y': 17.124126191, 'z': '3rd'},
- {'x': 214.5, 'y': 17.501369744, 'z': '5th'},
- {'x': 214.5, 'y': 18.139934578, 'z': '10th'},
- {'x': 214.5, 'y': 19.403656795, 'z': '25th'},
- {'x': 214.5, 'y': 21.219974716, 'z': '50th'},
- {'x': 214.5, 'y': 23.75096919, 'z': '75th'},
- {'x': 214.5, 'y': 25.603114, 'z': '85th'},
- {'x': 214.5, 'y': 27.168556681, 'z': '90th'},
- {'x': 214.5, 'y': 30.210736178, 'z': '95th'},
- {'x': 214.5, 'y': 32.922722962, 'z': '97th'},
- {'x': 215.5, 'y': 17.148786341, 'z': '3rd'},
- {'x': 215.5, 'y': 17.526176669, 'z': '5th'},
- {'x': 215.5, 'y': 18.165052539, 'z': '10th'},
- {'x': 215.5, 'y': 19.429654504, 'z': '25th'},
- {'x': 215.5, 'y': 21.247972623, 'z': '50th'},
- {'x': 215.5, 'y': 23.783555789, 'z': '75th'},
- {'x': 215.5, 'y': 25.640674345, 'z': '85th'},
- {'x': 215.5, 'y': 27.211566682, 'z': '90th'},
- {'x': 215.5, 'y': 30.268117989, 'z': '95th'},
- {'x': 215.5, 'y': 32.997785097, 'z': '97th'},
- {'x': 216.5, 'y': 17.172601938, 'z': '3rd'},
- {'x': 216.5, 'y': 17.550154683, 'z': '5th'},
- {'x': 216.5, 'y': 18.189369265, 'z': '10th'},
- {'x': 216.5, 'y': 19.454909959, 'z': '25th'},
- {'x': 216.5, 'y': 21.275322389, 'z': '50th'},
- {'x': 216.5, 'y': 23.815644518, 'z': '75th'},
- {'x': 216.5, 'y': 25.67786376, 'z': '85th'},
- {'x': 216.5, 'y': 27.254327686, 'z': '90th'},
- {'x': 216.5, 'y': 30.325542155, 'z': '95th'},
- {'x': 216.5, 'y': 33.07323931, 'z': '97th'},
- {'x': 217.5, 'y': 17.195547442, 'z': '3rd'},
- {'x': 217.5, 'y': 17.573280181, 'z': '5th'},
- {'x': 217.5, 'y': 18.212864439, 'z': '10th'},
- {'x': 217.5, 'y': 19.479409337, 'z': '25th'},
- {'x': 217.5, 'y': 21.302019325, 'z': '50th'},
- {'x': 217.5, 'y': 23.847242521, 'z': '75th'},
- {'x': 217.5, 'y': 25.714697004, 'z': '85th'},
- {'x': 217.5, 'y': 27.296859987, 'z': '90th'},
- {'x': 217.5, 'y': 30.38303689, 'z': '95th'},
- {'x': 217.5, 'y': 33.149117493, 'z': '97th'},
- {'x': 218.5, 'y': 17.217603518, 'z': '3rd'},
- {'x': 218.5, 'y': 17.595534679, 'z': '5th'},
- {'x': 218.5, 'y': 18.235521081, 'z': '10th'},
- {'x': 218.5, 'y': 19.503138885, 'z': '25th'},
- {'x': 218.5, 'y': 21.328054894, 'z': '50th'},
- {'x': 218.5, 'y': 23.8783497, 'z': '75th'},
- {'x': 218.5, 'y': 25.751181066, 'z': '85th'},
- {'x': 218.5, 'y': 27.339177208, 'z': '90th'},
- {'x': 218.5, 'y': 30.440630728, 'z': '95th'},
- {'x': 218.5, 'y': 33.225464433, 'z': '97th'},
- {'x': 219.5, 'y': 17.238742459, 'z': '3rd'},
- {'x': 219.5, 'y': 17.616892752, 'z': '5th'},
- {'x': 219.5, 'y': 18.257317631, 'z': '10th'},
- {'x': 219.5, 'y': 19.526084623, 'z': '25th'},
- {'x': 219.5, 'y': 21.353425629, 'z': '50th'},
- {'x': 219.5, 'y': 23.908975815, 'z': '75th'},
- {'x': 219.5, 'y': 25.787333798, 'z': '85th'},
- {'x': 219.5, 'y': 27.381302678, 'z': '90th'},
- {'x': 219.5, 'y': 30.498353237, 'z': '95th'},
- {'x': 219.5, 'y': 33.30230965, 'z': '97th'},
- {'x': 220.5, 'y': 17.258942113, 'z': '3rd'},
- {'x': 220.5, 'y': 17.637333562, 'z': '5th'},
- {'x': 220.5, 'y': 18.278235517, 'z': '10th'},
- {'x': 220.5, 'y': 19.548232633, 'z': '25th'},
- {'x': 220.5, 'y': 21.378124616, 'z': '50th'},
- {'x': 220.5, 'y': 23.939124145, 'z': '75th'},
- {'x': 220.5, 'y': 25.823166106, 'z': '85th'},
- {'x': 220.5, 'y': 27.423253776, 'z': '90th'},
- {'x': 220.5, 'y': 30.556234331, 'z': '95th'},
- {'x': 220.5, 'y': 33.379694311, 'z': '97th'},
- {'x': 221.5, 'y': 17.278178695, 'z': '3rd'},
- {'x': 221.5, 'y': 17.656834899, 'z': '5th'},
- {'x': 221.5, 'y': 18.298255244, 'z': '10th'},
- {'x': 221.5, 'y': 19.569568904, 'z': '25th'},
- {'x': 221.5, 'y': 21.402145892, 'z': '50th'},
- {'x': 221.5, 'y': 23.968799926, 'z': '75th'},
- {'x': 221.5, 'y': 25.858691151, 'z': '85th'},
- {'x': 221.5, 'y': 27.465050023, 'z': '90th'},
- {'x': 221.5, 'y': 30.614304629, 'z': '95th'},
- {'x': 221.5, 'y': 33.457657324, 'z': '97th'},
- {'x': 222.5, 'y': 17.296428294, 'z': '3rd'},
- {'x': 222.5, 'y': 17.675374442, 'z': '5th'},
- {'x': 222.5, 'y': 18.317357218, 'z': '10th'},
- {'x': 222.5, 'y': 19.590079368, 'z': '25th'},
- {'x': 222.5, 'y': 21.425483514, 'z': '50th'},
- {'x': 222.5, 'y': 23.998008576, 'z': '75th'},
- {'x': 222.5, 'y': 25.893922413, 'z': '85th'},
- {'x': 222.5, 'y': 27.506711377, 'z': '90th'},
- {'x': 222.5, 'y': 30.672595385, 'z': '95th'},
- {'x': 222.5, 'y': 33.53623826, 'z': '97th'},
- {'x': 223.5, 'y': 17.313666882, 'z': '3rd'},
- {'x': 223.5, 'y': 17.692929755, 'z': '5th'},
- {'x': 223.5, 'y': 18.335521745, 'z': '10th'},
- {'x': 223.5, 'y': 19.609749894, 'z': '25th'},
- {'x': 223.5, 'y': 21.448131558, 'z': '50th'},
- {'x': 223.5, 'y': 24.026755688, 'z': '75th'},
- {'x': 223.5, 'y': 25.928873687, 'z': '85th'},
- {'x': 223.5, 'y': 27.548258238, 'z': '90th'},
- {'x': 223.5, 'y': 30.731138492, 'z': '95th'},
- {'x': 223.5, 'y': 33.615477358, 'z': '97th'},
- {'x': 224.5, 'y': 17.329870318, 'z': '3rd'},
- {'x': 224.5, 'y': 17.709478294, 'z': '5th'},
- {'x': 224.5, 'y': 18.352729033, 'z': '10th'},
- {'x': 224.5, 'y': 19.628566287, 'z': '25th'},
- {'x': 224.5, 'y': 21.470084116, 'z': '50th'},
- {'x': 224.5, 'y': 24.055047023, 'z': '75th'},
- {'x': 224.5, 'y': 25.963559081, 'z': '85th'},
- {'x': 224.5, 'y': 27.589711442, 'z': '90th'},
- {'x': 224.5, 'y': 30.789966483, 'z': '95th'},
- {'x': 224.5, 'y': 33.695415527, 'z': '97th'},
- {'x': 225.5, 'y': 17.34501435, 'z': '3rd'},
- {'x': 225.5, 'y': 17.724997408, 'z': '5th'},
- {'x': 225.5, 'y': 18.368959194, 'z': '10th'},
- {'x': 225.5, 'y': 19.64651429, 'z': '25th'},
- {'x': 225.5, 'y': 21.491335286, 'z': '50th'},
- {'x': 225.5, 'y': 24.082888512, 'z': '75th'},
- {'x': 225.5, 'y': 25.997993009, 'z': '85th'},
- {'x': 225.5, 'y': 27.631092257, 'z': '90th'},
- {'x': 225.5, 'y': 30.849112534, 'z': '95th'},
- {'x': 225.5, 'y': 33.776094353, 'z': '97th'},
- {'x': 226.5, 'y': 17.359074619, 'z': '3rd'},
- {'x': 226.5, 'y': 17.739464345, 'z': '5th'},
- {'x': 226.5, 'y': 18.384192245, 'z': '10th'},
- {'x': 226.5, 'y': 19.663579579, 'z': '25th'},
- {'x': 226.5, 'y': 21.511879176, 'z': '50th'},
- {'x': 226.5, 'y': 24.110286241, 'z': '75th'},
- {'x': 226.5, 'y': 26.032190187, 'z': '85th'},
- {'x': 226.5, 'y': 27.672422386, 'z': '90th'},
- {'x': 226.5, 'y': 30.908610469, 'z': '95th'},
- {'x': 226.5, 'y': 33.857556101, 'z': '97th'},
- {'x': 227.5, 'y': 17.372026667, 'z': '3rd'},
- {'x': 227.5, 'y': 17.752856251, 'z': '5th'},
- {'x': 227.5, 'y': 18.398408112, 'z': '10th'},
- {'x': 227.5, 'y': 19.679747762, 'z': '25th'},
- {'x': 227.5, 'y': 21.531709894, 'z': '50th'},
- {'x': 227.5, 'y': 24.137246456, 'z': '75th'},
- {'x': 227.5, 'y': 26.06616563, 'z': '85th'},
- {'x': 227.5, 'y': 27.71372396, 'z': '90th'},
- {'x': 227.5, 'y': 30.968494761, 'z': '95th'},
- {'x': 227.5, 'y': 33.939843723, 'z': '97th'},
- {'x': 228.5, 'y': 17.383845936, 'z': '3rd'},
- {'x': 228.5, 'y': 17.765150176, 'z': '5th'},
- {'x': 228.5, 'y': 18.411586625, 'z': '10th'},
- {'x': 228.5, 'y': 19.695004381, 'z': '25th'},
- {'x': 228.5, 'y': 21.550821547, 'z': '50th'},
- {'x': 228.5, 'y': 24.16377555, 'z': '75th'},
- {'x': 228.5, 'y': 26.099934651, 'z': '85th'},
- {'x': 228.5, 'y': 27.755019537, 'z': '90th'},
- {'x': 228.5, 'y': 31.028800535, 'z': '95th'},
- {'x': 228.5, 'y': 34.023000858, 'z': '97th'},
- {'x': 229.5, 'y': 17.394507776, 'z': '3rd'},
- {'x': 229.5, 'y': 17.776323076, 'z': '5th'},
- {'x': 229.5, 'y': 18.423707526, 'z': '10th'},
- {'x': 229.5, 'y': 19.709334907, 'z': '25th'},
- {'x': 229.5, 'y': 21.569208237, 'z': '50th'},
- {'x': 229.5, 'y': 24.189880061, 'z': '75th'},
- {'x': 229.5, 'y': 26.133512849, 'z': '85th'},
- {'x': 229.5, 'y': 27.7963321, 'z': '90th'},
- {'x': 229.5, 'y': 31.089563569, 'z': '95th'},
- {'x': 229.5, 'y': 34.107071839, 'z': '97th'},
- {'x': 230.5, 'y': 17.403987449, 'z': '3rd'},
- {'x': 230.5, 'y': 17.786351816, 'z': '5th'},
- {'x': 230.5, 'y': 18.434750468, 'z': '10th'},
- {'x': 230.5, 'y': 19.72272474, 'z': '25th'},
- {'x': 230.5, 'y': 21.586864057, 'z': '50th'},
- {'x': 230.5, 'y': 24.215566671, 'z': '75th'},
- {'x': 230.5, 'y': 26.166916112, 'z': '85th'},
- {'x': 230.5, 'y': 27.837685054, 'z': '90th'},
- {'x': 230.5, 'y': 31.150820299, 'z': '95th'},
- {'x': 230.5, 'y': 34.192101699, 'z': '97th'},
- {'x': 231.5, 'y': 17.412260129, 'z': '3rd'},
- {'x': 231.5, 'y': 17.795213175, 'z': '5th'},
- {'x': 231.5, 'y': 18.444695014, 'z': '10th'},
- {'x': 231.5, 'y': 19.735159209, 'z': '25th'},
- {'x': 231.5, 'y': 21.603783087, 'z': '50th'},
- {'x': 231.5, 'y': 24.240842192, 'z': '75th'},
- {'x': 231.5, 'y': 26.20016061, 'z': '85th'},
- {'x': 231.5, 'y': 27.879102226, 'z': '90th'},
- {'x': 231.5, 'y': 31.212607819, 'z': '95th'},
- {'x': 231.5, 'y': 34.278136171, 'z': '97th'},
- {'x': 232.5, 'y': 17.419300913, 'z': '3rd'},
- {'x': 232.5, 'y': 17.802883845, 'z': '5th'},
- {'x': 232.5, 'y': 18.453520643, 'z': '10th'},
- {'x': 232.5, 'y': 19.746623568, 'z': '25th'},
- {'x': 232.5, 'y': 21.619959388, 'z': '50th'},
- {'x': 232.5, 'y': 24.265713571, 'z': '75th'},
- {'x': 232.5, 'y': 26.23326279, 'z': '85th'},
- {'x': 232.5, 'y': 27.920607856, 'z': '90th'},
- {'x': 232.5, 'y': 31.274963885, 'z': '95th'},
- {'x': 232.5, 'y': 34.3652217, 'z': '97th'},
- {'x': 233.5, 'y': 17.425084819, 'z': '3rd'},
- {'x': 233.5, 'y': 17.809340439, 'z': '5th'},
- {'x': 233.5, 'y': 18.461206749, 'z': '10th'},
- {'x': 233.5, 'y': 19.757102998, 'z': '25th'},
- {'x': 233.5, 'y': 21.635387002, 'z': '50th'},
- {'x': 233.5, 'y': 24.290187877, 'z': '75th'},
- {'x': 233.5, 'y': 26.266239373, 'z': '85th'},
- {'x': 233.5, 'y': 27.9622266, 'z': '90th'},
- {'x': 233.5, 'y': 31.337926913, 'z': '95th'},
- {'x': 233.5, 'y': 34.453405443, 'z': '97th'},
- {'x': 234.5, 'y': 17.429584477, 'z': '3rd'},
- {'x': 234.5, 'y': 17.814557553, 'z': '5th'},
- {'x': 234.5, 'y': 18.467731328, 'z': '10th'},
- {'x': 234.5, 'y': 19.766582461, 'z': '25th'},
- {'x': 234.5, 'y': 21.650061262, 'z': '50th'},
- {'x': 234.5, 'y': 24.314274992, 'z': '75th'},
- {'x': 234.5, 'y': 26.299110386, 'z': '85th'},
- {'x': 234.5, 'y': 28.003986289, 'z': '90th'},
- {'x': 234.5, 'y': 31.401536312, 'z': '95th'},
- {'x': 234.5, 'y': 34.542730659, 'z': '97th'},
- {'x': 235.5, 'y': 17.432780866, 'z': '3rd'},
- {'x': 235.5, 'y': 17.818516749, 'z': '5th'},
- {'x': 235.5, 'y': 18.473077063, 'z': '10th'},
- {'x': 235.5, 'y': 19.775047356, 'z': '25th'},
- {'x': 235.5, 'y': 21.663972695, 'z': '50th'},
- {'x': 235.5, 'y': 24.337975135, 'z': '75th'},
- {'x': 235.5, 'y': 26.331885089, 'z': '85th'},
- {'x': 235.5, 'y': 28.045905123, 'z': '90th'},
- {'x': 235.5, 'y': 31.465830973, 'z': '95th'},
- {'x': 235.5, 'y': 34.633258104, 'z': '97th'},
- {'x': 236.5, 'y': 17.434645126, 'z': '3rd'},
- {'x': 236.5, 'y': 17.821191341, 'z': '5th'},
- {'x': 236.5, 'y': 18.477221024, 'z': '10th'},
- {'x': 236.5, 'y': 19.782482417, 'z': '25th'},
- {'x': 236.5, 'y': 21.677117355, 'z': '50th'},
- {'x': 236.5, 'y': 24.3613, 'z': '75th'},
- {'x': 236.5, 'y': 26.364585813, 'z': '85th'},
- {'x': 236.5, 'y': 28.088013354, 'z': '90th'},
- {'x': 236.5, 'y': 31.530851807, 'z': '95th'},
- {'x': 236.5, 'y': 34.725029791, 'z': '97th'},
- {'x': 237.5, 'y': 17.435151678, 'z': '3rd'},
- {'x': 237.5, 'y': 17.822557366, 'z': '5th'},
- {'x': 237.5, 'y': 18.480142088, 'z': '10th'},
- {'x': 237.5, 'y': 19.788872489, 'z': '25th'},
- {'x': 237.5, 'y': 21.689489352, 'z': '50th'},
- {'x': 237.5, 'y': 24.384257496, 'z': '75th'},
- {'x': 237.5, 'y': 26.397230769, 'z': '85th'},
- {'x': 237.5, 'y': 28.130337667, 'z': '90th'},
- {'x': 237.5, 'y': 31.596639946, 'z': '95th'},
- {'x': 237.5, 'y': 34.818095114, 'z': '97th'},
- {'x': 238.5, 'y': 17.434274654, 'z': '3rd'},
- {'x': 238.5, 'y': 17.822590601, 'z': '5th'},
- {'x': 238.5, 'y': 18.48181892, 'z': '10th'},
- {'x': 238.5, 'y': 19.79420232, 'z': '25th'},
- {'x': 238.5, 'y': 21.701082884, 'z': '50th'},
- {'x': 238.5, 'y': 24.406855907, 'z': '75th'},
- {'x': 238.5, 'y': 26.429838734, 'z': '85th'},
- {'x': 238.5, 'y': 28.172905434, 'z': '90th'},
- {'x': 238.5, 'y': 31.663237236, 'z': '95th'},
- {'x': 238.5, 'y': 34.91250374, 'z': '97th'},
- {'x': 239.5, 'y': 17.431987863, 'z': '3rd'},
- {'x': 239.5, 'y': 17.821266527, 'z': '5th'},
- {'x': 239.5, 'y': 18.482229947, 'z': '10th'},
- {'x': 239.5, 'y': 19.798456547, 'z': '25th'},
- {'x': 239.5, 'y': 21.711892252, 'z': '50th'},
- {'x': 239.5, 'y': 24.429103928, 'z': '75th'},
- {'x': 239.5, 'y': 26.462429098, 'z': '85th'},
- {'x': 239.5, 'y': 28.215744764, 'z': '90th'},
- {'x': 239.5, 'y': 31.730686253, 'z': '95th'},
- {'x': 239.5, 'y': 35.008305519, 'z': '97th'},
- {'x': 240.0, 'y': 17.430310748, 'z': '3rd'},
- {'x': 240.0, 'y': 17.820090457, 'z': '5th'},
- {'x': 240.0, 'y': 18.481955822, 'z': '10th'},
- {'x': 240.0, 'y': 19.800175716, 'z': '25th'},
- {'x': 240.0, 'y': 21.716999342, 'z': '50th'},
- {'x': 240.0, 'y': 24.44009565, 'z': '75th'},
- {'x': 240.0, 'y': 26.478719662, 'z': '85th'},
- {'x': 240.0, 'y': 28.237271346, 'z': '90th'},
- {'x': 240.0, 'y': 31.764743113, 'z': '95th'},
- {'x': 240.0, 'y': 35.056750932, 'z': '97th'},
- {'x': 240.5, 'y': 17.428268634, 'z': '3rd'},
- {'x': 240.5, 'y': 17.818563561, 'z': '5th'},
- {'x': 240.5, 'y': 18.481355567, 'z': '10th'},
- {'x': 240.5, 'y': 19.801619986, 'z': '25th'},
- {'x': 240.5, 'y': 21.721909734, 'z': '50th'},
- {'x': 240.5, 'y': 24.451006217, 'z': '75th'},
- {'x': 240.5, 'y': 26.495016788, 'z': '85th'},
- {'x': 240.5, 'y': 28.258879832, 'z': '90th'},
- {'x': 240.5, 'y': 31.799029637, 'z': '95th'},
- {'x': 240.5, 'y': 35.10555822, 'z': '97th'}
-]
@@ -1,344 +0,0 @@
-cdc_girls_head_age = [
-    { "x": 0, "y": 31.93019666, "z": "3rd" },
-    { "x": 0.5, "y": 33.38070525, "z": "3rd" },
-    { "x": 1.5, "y": 35.48627093, "z": "3rd" },
-    { "x": 2.5, "y": 36.98550023, "z": "3rd" },
-    { "x": 3.5, "y": 38.13114313, "z": "3rd" },
-    { "x": 4.5, "y": 39.04619196, "z": "3rd" },
-    { "x": 5.5, "y": 39.79959574, "z": "3rd" },
-    { "x": 6.5, "y": 40.43379494, "z": "3rd" },
-    { "x": 7.5, "y": 40.97671526, "z": "3rd" },
-    { "x": 8.5, "y": 41.44767738, "z": "3rd" },
-    { "x": 9.5, "y": 41.86058302, "z": "3rd" },
-    { "x": 10.5, "y": 42.22575305, "z": "3rd" },
-    { "x": 11.5, "y": 42.55105219, "z": "3rd" },
-    { "x": 12.5, "y": 42.84260355, "z": "3rd" },
-    { "x": 13.5, "y": 43.10526272, "z": "3rd" },
-    { "x": 14.5, "y": 43.34294145, "z": "3rd" },
-    { "x": 15.5, "y": 43.55883459, "z": "3rd" },
-    { "x": 16.5, "y": 43.75558315, "z": "3rd" },
-    { "x": 17.5, "y": 43.93539362, "z": "3rd" },
-    { "x": 18.5, "y": 44.10012707, "z": "3rd" },
-    { "x": 19.5, "y": 44.25136665, "z": "3rd" },
-    { "x": 20.5, "y": 44.39046947, "z": "3rd" },
-    { "x": 21.5, "y": 44.51860703, "z": "3rd" },
-    { "x": 22.5, "y": 44.63679702, "z": "3rd" },
-    { "x": 23.5, "y": 44.74592866, "z": "3rd" },
-    { "x": 24.5, "y": 44.8467831, "z": "3rd" },
-    { "x": 25.5, "y": 44.94004992, "z": "3rd" },
-    { "x": 26.5, "y": 45.02634065, "z": "3rd" },
-    { "x": 27.5, "y": 45.10619989, "z": "3rd" },
-    { "x": 28.5, "y": 45.18011452, "z": "3rd" },
-    { "x": 29.5, "y": 45.24852146, "z": "3rd" },
-    { "x": 30.5, "y": 45.31181411, "z": "3rd" },
-    { "x": 31.5, "y": 45.37034782, "z": "3rd" },
-    { "x": 32.5, "y": 45.42444455, "z": "3rd" },
-    { "x": 33.5, "y": 45.47439662, "z": "3rd" },
-    { "x": 34.5, "y": 45.52047097, "z": "3rd" },
-    { "x": 35.5, "y": 45.56291074, "z": "3rd" },
-    { "x": 36, "y": 45.58283802, "z": "3rd" },
-    { "x": 0, "y": 32.25089861, "z": "5th" },
-    { "x": 0.5, "y": 33.68743507, "z": "5th" },
-    { "x": 1.5, "y": 35.77560367, "z": "5th" },
-    { "x": 2.5, "y": 37.26521982, "z": "5th" },
-    { "x": 3.5, "y": 38.40560987, "z": "5th" },
-    { "x": 4.5, "y": 39.31813786, "z": "5th" },
-    { "x": 5.5, "y": 40.07085921, "z": "5th" },
-    { "x": 6.5, "y": 40.70567458, "z": "5th" },
-    { "x": 7.5, "y": 41.25016088, "z": "5th" },
-    { "x": 8.5, "y": 41.72340175, "z": "5th" },
-    { "x": 9.5, "y": 42.1391311, "z": "5th" },
-    { "x": 10.5, "y": 42.50754798, "z": "5th" },
-    { "x": 11.5, "y": 42.83642568, "z": "5th" },
-    { "x": 12.5, "y": 43.13181766, "z": "5th" },
-    { "x": 13.5, "y": 43.39852553, "z": "5th" },
-    { "x": 14.5, "y": 43.64041855, "z": "5th" },
-    { "x": 15.5, "y": 43.86065785, "z": "5th" },
-    { "x": 16.5, "y": 44.06185727, "z": "5th" },
-    { "x": 17.5, "y": 44.24620133, "z": "5th" },
-    { "x": 18.5, "y": 44.4155332, "z": "5th" },
-    { "x": 19.5, "y": 44.57142131, "z": "5th" },
-    { "x": 20.5, "y": 44.71521065, "z": "5th" },
-    { "x": 21.5, "y": 44.84806267, "z": "5th" },
-    { "x": 22.5, "y": 44.9709867, "z": "5th" },
-    { "x": 23.5, "y": 45.08486501, "z": "5th" },
-    { "x": 24.5, "y": 45.19047292, "z": "5th" },
-    { "x": 25.5, "y": 45.28849516, "z": "5th" },
-    { "x": 26.5, "y": 45.37953915, "z": "5th" },
-    { "x": 27.5, "y": 45.46414607, "z": "5th" },
-    { "x": 28.5, "y": 45.54279995, "z": "5th" },
-    { "x": 29.5, "y": 45.61593528, "z": "5th" },
-    { "x": 30.5, "y": 45.68394345, "z": "5th" },
-    { "x": 31.5, "y": 45.74717813, "z": "5th" },
-    { "x": 32.5, "y": 45.80595987, "z": "5th" },
-    { "x": 33.5, "y": 45.86057993, "z": "5th" },
-    { "x": 34.5, "y": 45.91130407, "z": "5th" },
-    { "x": 35.5, "y": 45.95837475, "z": "5th" },
-    { "x": 36, "y": 45.98061022, "z": "5th" },
-    { "x": 0, "y": 32.75948527, "z": "10th" },
-    { "x": 0.5, "y": 34.17345861, "z": "10th" },
-    { "x": 1.5, "y": 36.23325692, "z": "10th" },
-    { "x": 2.5, "y": 37.70685493, "z": "10th" },
-    { "x": 3.5, "y": 38.83813686, "z": "10th" },
-    { "x": 4.5, "y": 39.74588078, "z": "10th" },
-    { "x": 5.5, "y": 40.49672423, "z": "10th" },
-    { "x": 6.5, "y": 41.13171253, "z": "10th" },
-    { "x": 7.5, "y": 41.67787092, "z": "10th" },
-    { "x": 8.5, "y": 42.15390873, "z": "10th" },
-    { "x": 9.5, "y": 42.57329563, "z": "10th" },
-    { "x": 10.5, "y": 42.94603917, "z": "10th" },
-    { "x": 11.5, "y": 43.27976931, "z": "10th" },
-    { "x": 12.5, "y": 43.58043062, "z": "10th" },
-    { "x": 13.5, "y": 43.85274045, "z": "10th" },
-    { "x": 14.5, "y": 44.10050201, "z": "10th" },
-    { "x": 15.5, "y": 44.32682391, "z": "10th" },
-    { "x": 16.5, "y": 44.53427792, "z": "10th" },
-    { "x": 17.5, "y": 44.72501451, "z": "10th" },
-    { "x": 18.5, "y": 44.90084908, "z": "10th" },
-    { "x": 19.5, "y": 45.06332728, "z": "10th" },
-    { "x": 20.5, "y": 45.21377531, "z": "10th" },
-    { "x": 21.5, "y": 45.35333901, "z": "10th" },
-    { "x": 22.5, "y": 45.48301476, "z": "10th" },
-    { "x": 23.5, "y": 45.60367396, "z": "10th" },
-    { "x": 24.5, "y": 45.71608285, "z": "10th" },
-    { "x": 25.5, "y": 45.82091847, "z": "10th" },
-    { "x": 26.5, "y": 45.91878183, "z": "10th" },
-    { "x": 27.5, "y": 46.01020865, "z": "10th" },
-    { "x": 28.5, "y": 46.09567835, "z": "10th" },
-    { "x": 29.5, "y": 46.17562155, "z": "10th" },
-    { "x": 30.5, "y": 46.25042633, "z": "10th" },
-    { "x": 31.5, "y": 46.32044357, "z": "10th" },
-    { "x": 32.5, "y": 46.38599146, "z": "10th" },
-    { "x": 33.5, "y": 46.44735943, "z": "10th" },
-    { "x": 34.5, "y": 46.50481123, "z": "10th" },
-    { "x": 35.5, "y": 46.55858812, "z": "10th" },
-    { "x": 36, "y": 46.58416826, "z": "10th" },
-    { "x": 0, "y": 33.65186554, "z": "25th" },
-    { "x": 0.5, "y": 35.02508397, "z": "25th" },
-    { "x": 1.5, "y": 37.03281566, "z": "25th" },
-    { "x": 2.5, "y": 38.47603153, "z": "25th" },
-    { "x": 3.5, "y": 39.58904997, "z": "25th" },
-    { "x": 4.5, "y": 40.4861083, "z": "25th" },
-    { "x": 5.5, "y": 41.23135738, "z": "25th" },
-    { "x": 6.5, "y": 41.86434514, "z": "25th" },
-    { "x": 7.5, "y": 42.41113299, "z": "25th" },
-    { "x": 8.5, "y": 42.88977797, "z": "25th" },
-    { "x": 9.5, "y": 43.31329057, "z": "25th" },
-    { "x": 10.5, "y": 43.69134604, "z": "25th" },
-    { "x": 11.5, "y": 44.03132658, "z": "25th" },
-    { "x": 12.5, "y": 44.33898883, "z": "25th" },
-    { "x": 13.5, "y": 44.61890505, "z": "25th" },
-    { "x": 14.5, "y": 44.87476468, "z": "25th" },
-    { "x": 15.5, "y": 45.10958609, "z": "25th" },
-    { "x": 16.5, "y": 45.32586864, "z": "25th" },
-    { "x": 17.5, "y": 45.52570414, "z": "25th" },
-    { "x": 18.5, "y": 45.71086007, "z": "25th" },
-    { "x": 19.5, "y": 45.88284266, "z": "25th" },
-    { "x": 20.5, "y": 46.04294544, "z": "25th" },
-    { "x": 21.5, "y": 46.19228703, "z": "25th" },
-    { "x": 22.5, "y": 46.33184096, "z": "25th" },
-    { "x": 23.5, "y": 46.46245944, "z": "25th" },
-    { "x": 24.5, "y": 46.58489242, "z": "25th" },
-    { "x": 25.5, "y": 46.69980317, "z": "25th" },
-    { "x": 26.5, "y": 46.80778091, "z": "25th" },
-    { "x": 27.5, "y": 46.90935129, "z": "25th" },
-    { "x": 28.5, "y": 47.00498513, "z": "25th" },
-    { "x": 29.5, "y": 47.0951056, "z": "25th" },
-    { "x": 30.5, "y": 47.18009439, "z": "25th" },
-    { "x": 31.5, "y": 47.26029687, "z": "25th" },
-    { "x": 32.5, "y": 47.33602646, "z": "25th" },
-    { "x": 33.5, "y": 47.40756856, "z": "25th" },
-    { "x": 34.5, "y": 47.47518307, "z": "25th" },
-    { "x": 35.5, "y": 47.53910827, "z": "25th" },
-    { "x": 36, "y": 47.56975632, "z": "25th" },
-    { "x": 0, "y": 34.7115617, "z": "50th" },
-    { "x": 0.5, "y": 36.03453876, "z": "50th" },
-    { "x": 1.5, "y": 37.97671987, "z": "50th" },
-    { "x": 2.5, "y": 39.3801263, "z": "50th" },
-    { "x": 3.5, "y": 40.46773733, "z": "50th" },
-    { "x": 4.5, "y": 41.34841008, "z": "50th" },
-    { "x": 5.5, "y": 42.0833507, "z": "50th" },
-    { "x": 6.5, "y": 42.71033603, "z": "50th" },
-    { "x": 7.5, "y": 43.25428882, "z": "50th" },
-    { "x": 8.5, "y": 43.73249646, "z": "50th" },
-    { "x": 9.5, "y": 44.15742837, "z": "50th" },
-    { "x": 10.5, "y": 44.53836794, "z": "50th" },
-    { "x": 11.5, "y": 44.88240562, "z": "50th" },
-    { "x": 12.5, "y": 45.19507651, "z": "50th" },
-    { "x": 13.5, "y": 45.48078147, "z": "50th" },
-    { "x": 14.5, "y": 45.74307527, "z": "50th" },
-    { "x": 15.5, "y": 45.98486901, "z": "50th" },
-    { "x": 16.5, "y": 46.20857558, "z": "50th" },
-    { "x": 17.5, "y": 46.41621635, "z": "50th" },
-    { "x": 18.5, "y": 46.60950084, "z": "50th" },
-    { "x": 19.5, "y": 46.78988722, "z": "50th" },
-    { "x": 20.5, "y": 46.95862881, "z": "50th" },
-    { "x": 21.5, "y": 47.11681039, "z": "50th" },
-    { "x": 22.5, "y": 47.26537682, "z": "50th" },
-    { "x": 23.5, "y": 47.40515585, "z": "50th" },
-    { "x": 24.5, "y": 47.53687649, "z": "50th" },
-    { "x": 25.5, "y": 47.66118396, "z": "50th" },
-    { "x": 26.5, "y": 47.77865186, "z": "50th" },
-    { "x": 27.5, "y": 47.8897923, "z": "50th" },
-    { "x": 28.5, "y": 47.99506422, "z": "50th" },
-    { "x": 29.5, "y": 48.09488048, "z": "50th" },
-    { "x": 30.5, "y": 48.18961365, "z": "50th" },
-    { "x": 31.5, "y": 48.2796011, "z": "50th" },
-    { "x": 32.5, "y": 48.36514917, "z": "50th" },
-    { "x": 33.5, "y": 48.44653703, "z": "50th" },
-    { "x": 34.5, "y": 48.52401894, "z": "50th" },
-    { "x": 35.5, "y": 48.59782828, "z": "50th" },
-    { "x": 36, "y": 48.63342328, "z": "50th" },
-    { "x": 0, "y": 35.85124044, "z": "75th" },
-    { "x": 0.5, "y": 37.11806755, "z": "75th" },
-    { "x": 1.5, "y": 38.9853304, "z": "75th" },
-    { "x": 2.5, "y": 40.34145495, "z": "75th" },
-    { "x": 3.5, "y": 41.39732095, "z": "75th" },
-    { "x": 4.5, "y": 42.2560375, "z": "75th" },
-    { "x": 5.5, "y": 42.97566066, "z": "75th" },
-    { "x": 6.5, "y": 43.59207071, "z": "75th" },
-    { "x": 7.5, "y": 44.1289691, "z": "75th" },
-    { "x": 8.5, "y": 44.60281599, "z": "75th" },
-    { "x": 9.5, "y": 45.025498, "z": "75th" },
-    { "x": 10.5, "y": 45.40587424, "z": "75th" },
-    { "x": 11.5, "y": 45.75071845, "z": "75th" },
-    { "x": 12.5, "y": 46.06532374, "z": "75th" },
-    { "x": 13.5, "y": 46.3539026, "z": "75th" },
-    { "x": 14.5, "y": 46.61986076, "z": "75th" },
-    { "x": 15.5, "y": 46.86598965, "z": "75th" },
-    { "x": 16.5, "y": 47.09460485, "z": "75th" },
-    { "x": 17.5, "y": 47.30764771, "z": "75th" },
-    { "x": 18.5, "y": 47.50676129, "z": "75th" },
-    { "x": 19.5, "y": 47.69334806, "z": "75th" },
-    { "x": 20.5, "y": 47.86861428, "z": "75th" },
-    { "x": 21.5, "y": 48.03360465, "z": "75th" },
-    { "x": 22.5, "y": 48.18922971, "z": "75th" },
-    { "x": 23.5, "y": 48.3362876, "z": "75th" },
-    { "x": 24.5, "y": 48.47548169, "z": "75th" },
-    { "x": 25.5, "y": 48.60743482, "z": "75th" },
-    { "x": 26.5, "y": 48.73270105, "z": "75th" },
-    { "x": 27.5, "y": 48.85177527, "z": "75th" },
-    { "x": 28.5, "y": 48.96510128, "z": "75th" },
-    { "x": 29.5, "y": 49.07307846, "z": "75th" },
-    { "x": 30.5, "y": 49.17606748, "z": "75th" },
-    { "x": 31.5, "y": 49.27439505, "z": "75th" },
-    { "x": 32.5, "y": 49.36835799, "z": "75th" },
-    { "x": 33.5, "y": 49.45822692, "z": "75th" },
-    { "x": 34.5, "y": 49.54424855, "z": "75th" },
-    { "x": 35.5, "y": 49.62664932, "z": "75th" },
-    { "x": 36, "y": 49.66655746, "z": "75th" },
-    { "x": 0, "y": 36.9534983, "z": "90th" },
-    { "x": 0.5, "y": 38.16405088, "z": "90th" },
-    { "x": 1.5, "y": 39.95458524, "z": "90th" },
-    { "x": 2.5, "y": 41.2606303, "z": "90th" },
-    { "x": 3.5, "y": 42.28152907, "z": "90th" },
-    { "x": 4.5, "y": 43.11489105, "z": "90th" },
-    { "x": 5.5, "y": 43.81574641, "z": "90th" },
-    { "x": 6.5, "y": 44.41814599, "z": "90th" },
-    { "x": 7.5, "y": 44.94460711, "z": "90th" },
-    { "x": 8.5, "y": 45.41078317, "z": "90th" },
-    { "x": 9.5, "y": 45.82798881, "z": "90th" },
-    { "x": 10.5, "y": 46.2046631, "z": "90th" },
-    { "x": 11.5, "y": 46.54726413, "z": "90th" },
-    { "x": 12.5, "y": 46.86084173, "z": "90th" },
-    { "x": 13.5, "y": 47.14941728, "z": "90th" },
-    { "x": 14.5, "y": 47.41624393, "z": "90th" },
-    { "x": 15.5, "y": 47.66398946, "z": "90th" },
-    { "x": 16.5, "y": 47.89486804, "z": "90th" },
-    { "x": 17.5, "y": 48.11073684, "z": "90th" },
-    { "x": 18.5, "y": 48.31316842, "z": "90th" },
-    { "x": 19.5, "y": 48.50350565, "z": "90th" },
-    { "x": 20.5, "y": 48.68290399, "z": "90th" },
-    { "x": 21.5, "y": 48.85236462, "z": "90th" },
-    { "x": 22.5, "y": 49.01276045, "z": "90th" },
-    { "x": 23.5, "y": 49.16485698, "z": "90th" },
-    { "x": 24.5, "y": 49.30932908, "z": "90th" },
-    { "x": 25.5, "y": 49.44677462, "z": "90th" },
-    { "x": 26.5, "y": 49.57772565, "z": "90th" },
-    { "x": 27.5, "y": 49.70265762, "z": "90th" },
-    { "x": 28.5, "y": 49.82199704, "z": "90th" },
-    { "x": 29.5, "y": 49.93612795, "z": "90th" },
-    { "x": 30.5, "y": 50.04539729, "z": "90th" },
-    { "x": 31.5, "y": 50.15011948, "z": "90th" },
-    { "x": 32.5, "y": 50.25058031, "z": "90th" },
-    { "x": 33.5, "y": 50.34704031, "z": "90th" },
-    { "x": 34.5, "y": 50.43973755, "z": "90th" },
-    { "x": 35.5, "y": 50.52889019, "z": "90th" },
-    { "x": 36, "y": 50.57220052, "z": "90th" },
-    { "x": 0, "y": 37.65137722, "z": "95th" },
-    { "x": 0.5, "y": 38.82535049, "z": "95th" },
-    { "x": 1.5, "y": 40.56517149, "z": "95th" },
-    { "x": 2.5, "y": 41.83732218, "z": "95th" },
-    { "x": 3.5, "y": 42.83395649, "z": "95th" },
-    { "x": 4.5, "y": 43.64924082, "z": "95th" },
-    { "x": 5.5, "y": 44.33630066, "z": "95th" },
-    { "x": 6.5, "y": 44.92802856, "z": "95th" },
-    { "x": 7.5, "y": 45.44618705, "z": "95th" },
-    { "x": 8.5, "y": 45.90591158, "z": "95th" },
-    { "x": 9.5, "y": 46.31814685, "z": "95th" },
-    { "x": 10.5, "y": 46.69105794, "z": "95th" },
-    { "x": 11.5, "y": 47.0308956, "z": "95th" },
-    { "x": 12.5, "y": 47.34254856, "z": "95th" },
-    { "x": 13.5, "y": 47.62991078, "z": "95th" },
-    { "x": 14.5, "y": 47.89613288, "z": "95th" },
-    { "x": 15.5, "y": 48.14379909, "z": "95th" },
-    { "x": 16.5, "y": 48.37505457, "z": "95th" },
-    { "x": 17.5, "y": 48.59169895, "z": "95th" },
-    { "x": 18.5, "y": 48.79525631, "z": "95th" },
-    { "x": 19.5, "y": 48.98702837, "z": "95th" },
-    { "x": 20.5, "y": 49.16813538, "z": "95th" },
-    { "x": 21.5, "y": 49.33954821, "z": "95th" },
-    { "x": 22.5, "y": 49.50211352, "z": "95th" },
-    { "x": 23.5, "y": 49.65657394, "z": "95th" },
-    { "x": 24.5, "y": 49.80358436, "z": "95th" },
-    { "x": 25.5, "y": 49.94372506, "z": "95th" },
-    { "x": 26.5, "y": 50.07751255, "z": "95th" },
-    { "x": 27.5, "y": 50.20540857, "z": "95th" },
-    { "x": 28.5, "y": 50.32782741, "z": "95th" },
-    { "x": 29.5, "y": 50.44514221, "z": "95th" },
-    { "x": 30.5, "y": 50.55769018, "z": "95th" },
-    { "x": 31.5, "y": 50.66577699, "z": "95th" },
-    { "x": 32.5, "y": 50.7696806, "z": "95th" },
-    { "x": 33.5, "y": 50.86965434, "z": "95th" },
-    { "x": 34.5, "y": 50.96593013, "z": "95th" },
-    { "x": 35.5, "y": 51.05872021, "z": "95th" },
-    { "x": 36, "y": 51.1038697, "z": "95th" },
-    { "x": 0, "y": 38.12110271, "z": "97th" },
-    { "x": 0.5, "y": 39.27005698, "z": "97th" },
-    { "x": 1.5, "y": 40.97482424, "z": "97th" },
-    { "x": 2.5, "y": 42.22321458, "z": "97th" },
-    { "x": 3.5, "y": 43.20260356, "z": "97th" },
-    { "x": 4.5, "y": 44.00485959, "z": "97th" },
-    { "x": 5.5, "y": 44.68183088, "z": "97th" },
-    { "x": 6.5, "y": 45.26562921, "z": "97th" },
-    { "x": 7.5, "y": 45.77750554, "z": "97th" },
-    { "x": 8.5, "y": 46.23224218, "z": "97th" },
-    { "x": 9.5, "y": 46.64053024, "z": "97th" },
-    { "x": 10.5, "y": 47.01034581, "z": "97th" },
-    { "x": 11.5, "y": 47.34779597, "z": "97th" },
-    { "x": 12.5, "y": 47.65765724, "z": "97th" },
-    { "x": 13.5, "y": 47.9437344, "z": "97th" },
-    { "x": 14.5, "y": 48.20910612, "z": "97th" },
-    { "x": 15.5, "y": 48.45629769, "z": "97th" },
-    { "x": 16.5, "y": 48.68740549, "z": "97th" },
-    { "x": 17.5, "y": 48.90418837, "z": "97th" },
-    { "x": 18.5, "y": 49.10813597, "z": "97th" },
-    { "x": 19.5, "y": 49.30052069, "z": "97th" },
-    { "x": 20.5, "y": 49.48243771, "z": "97th" },
-    { "x": 21.5, "y": 49.65483625, "z": "97th" },
-    { "x": 22.5, "y": 49.81854421, "z": "97th" },
-    { "x": 23.5, "y": 49.97428788, "z": "97th" },
-    { "x": 24.5, "y": 50.12270782, "z": "97th" },
-    { "x": 25.5, "y": 50.26437172, "z": "97th" },
-    { "x": 26.5, "y": 50.39978499, "z": "97th" },
-    { "x": 27.5, "y": 50.52939951, "z": "97th" },
-    { "x": 28.5, "y": 50.65362082, "z": "97th" },
-    { "x": 29.5, "y": 50.77281425, "z": "97th" },
-    { "x": 30.5, "y": 50.88731003, "z": "97th" },
-    { "x": 31.5, "y": 50.99740757, "z": "97th" },
-    { "x": 32.5, "y": 51.10337919, "z": "97th" },
-    { "x": 33.5, "y": 51.20547307, "z": "97th" },
-    { "x": 34.5, "y": 51.30391674, "z": "97th" },
-    { "x": 35.5, "y": 51.39891816, "z": "97th" },
-    { "x": 36, "y": 51.44518843, "z": "97th" }
-]
\ No newline at end of file
@@ -1,335 +0,0 @@
-cdc_girls_length_age = [
-    {"x": 0, "y": 45.0948826086757, "z": "3rd" },
-    {"x": 0.5, "y": 47.4691579210798, "z": "3rd" },
-    {"x": 1.5, "y": 50.9570056178233, "z": "3rd" },
-    {"x": 2.5, "y": 53.6292529172354, "z": "3rd" },
-    {"x": 3.5, "y": 55.8593993638303, "z": "3rd" },
-    {"x": 4.5, "y": 57.8047010891317, "z": "3rd" },
-    {"x": 5.5, "y": 59.5479929662389, "z": "3rd" },
-    {"x": 6.5, "y": 61.1389312239288, "z": "3rd" },
-    {"x": 7.5, "y": 62.6099317860152, "z": "3rd" },
-    {"x": 8.5, "y": 63.9834808678867, "z": "3rd" },
-    {"x": 9.5, "y": 65.275903473378, "z": "3rd" },
-    {"x": 10.5, "y": 66.4994793475434, "z": "3rd" },
-    {"x": 11.5, "y": 67.6637114610333, "z": "3rd" },
-    {"x": 12.5, "y": 68.7761269376622, "z": "3rd" },
-    {"x": 13.5, "y": 69.8428047380368, "z": "3rd" },
-    {"x": 14.5, "y": 70.8687355489754, "z": "3rd" },
-    {"x": 15.5, "y": 71.8580748144161, "z": "3rd" },
-    {"x": 16.5, "y": 72.8143250204203, "z": "3rd" },
-    {"x": 17.5, "y": 73.7404700649121, "z": "3rd" },
-    {"x": 18.5, "y": 74.6390761233502, "z": "3rd" },
-    {"x": 19.5, "y": 75.5123687493777, "z": "3rd" },
-    {"x": 20.5, "y": 76.3622926251531, "z": "3rd" },
-    {"x": 21.5, "y": 77.1905585396518, "z": "3rd" },
-    {"x": 22.5, "y": 77.9986807194647, "z": "3rd" },
-    {"x": 23.5, "y": 78.7880078334209, "z": "3rd" },
-    {"x": 24.5, "y": 79.5597432560035, "z": "3rd" },
-    {"x": 25.5, "y": 80.3399836447861, "z": "3rd" },
-    {"x": 26.5, "y": 81.1133152483163, "z": "3rd" },
-    {"x": 27.5, "y": 81.873342777578, "z": "3rd" },
-    {"x": 28.5, "y": 82.6150644716935, "z": "3rd" },
-    {"x": 29.5, "y": 83.3347329303371, "z": "3rd" },
-    {"x": 30.5, "y": 84.0297181712464, "z": "3rd" },
-    {"x": 31.5, "y": 84.698367159698, "z": "3rd" },
-    {"x": 32.5, "y": 85.339869204126, "z": "3rd" },
-    {"x": 33.5, "y": 85.9541339909327, "z": "3rd" },
-    {"x": 34.5, "y": 86.5416687989135, "z": "3rd" },
-    {"x": 35.5, "y": 87.1034887423911, "z": "3rd" },
-    {"x": 0, "y": 45.5756074032262, "z": "5th" },
-    {"x": 0.5, "y": 47.9632397723035, "z": "5th" },
-    {"x": 1.5, "y": 51.4799569019402, "z": "5th" },
-    {"x": 2.5, "y": 54.1790736390626, "z": "5th" },
-    {"x": 3.5, "y": 56.4333494737886, "z": "5th" },
-    {"x": 4.5, "y": 58.4003243697912, "z": "5th" },
-    {"x": 5.5, "y": 60.1632307548084, "z": "5th" },
-    {"x": 6.5, "y": 61.7720801452771, "z": "5th" },
-    {"x": 7.5, "y": 63.2595795382136, "z": "5th" },
-    {"x": 8.5, "y": 64.648448283892, "z": "5th" },
-    {"x": 9.5, "y": 65.9551975697399, "z": "5th" },
-    {"x": 10.5, "y": 67.1922564646481, "z": "5th" },
-    {"x": 11.5, "y": 68.3692485504204, "z": "5th" },
-    {"x": 12.5, "y": 69.4937991670582, "z": "5th" },
-    {"x": 13.5, "y": 70.5720679121745, "z": "5th" },
-    {"x": 14.5, "y": 71.6091122237936, "z": "5th" },
-    {"x": 15.5, "y": 72.6091432273851, "z": "5th" },
-    {"x": 16.5, "y": 73.5757102067571, "z": "5th" },
-    {"x": 17.5, "y": 74.5118366642775, "z": "5th" },
-    {"x": 18.5, "y": 75.4201225170942, "z": "5th" },
-    {"x": 19.5, "y": 76.3028222430392, "z": "5th" },
-    {"x": 20.5, "y": 77.161905465163, "z": "5th" },
-    {"x": 21.5, "y": 77.9991045975868, "z": "5th" },
-    {"x": 22.5, "y": 78.8159527193617, "z": "5th" },
-    {"x": 23.5, "y": 79.6138145644373, "z": "5th" },
-    {"x": 24.5, "y": 80.3939091825267, "z": "5th" },
-    {"x": 25.5, "y": 81.1880425327028, "z": "5th" },
-    {"x": 26.5, "y": 81.9722292694881, "z": "5th" },
-    {"x": 27.5, "y": 82.7408446834455, "z": "5th" },
-    {"x": 28.5, "y": 83.489507360581, "z": "5th" },
-    {"x": 29.5, "y": 84.214958896625, "z": "5th" },
-    {"x": 30.5, "y": 84.9149438923273, "z": "5th" },
-    {"x": 31.5, "y": 85.5880888605943, "z": "5th" },
-    {"x": 32.5, "y": 86.2337857228041, "z": "5th" },
-    {"x": 33.5, "y": 86.8520842736115, "z": "5th" },
-    {"x": 34.5, "y": 87.4435872314188, "z": "5th" },
-    {"x": 35.5, "y": 88.0093655358739, "z": "5th" },
-    {"x": 0, "y": 46.33933651097, "z": "10th" },
-    {"x": 0.5, "y": 48.7424816756963, "z": "10th" },
-    {"x": 1.5, "y": 52.2962687115733, "z": "10th" },
-    {"x": 2.5, "y": 55.0314430575534, "z": "10th" },
-    {"x": 3.5, "y": 57.3189243814216, "z": "10th" },
-    {"x": 4.5, "y": 59.3163276815511, "z": "10th" },
-    {"x": 5.5, "y": 61.1072583629727, "z": "10th" },
-    {"x": 6.5, "y": 62.7421028311681, "z": "10th" },
-    {"x": 7.5, "y": 64.2538878034357, "z": "10th" },
-    {"x": 8.5, "y": 65.6655938984631, "z": "10th" },
-    {"x": 9.5, "y": 66.9939437112267, "z": "10th" },
-    {"x": 10.5, "y": 68.2515376575953, "z": "10th" },
-    {"x": 11.5, "y": 69.4481390536453, "z": "10th" },
-    {"x": 12.5, "y": 70.591488102113, "z": "10th" },
-    {"x": 13.5, "y": 71.6878395982049, "z": "10th" },
-    {"x": 14.5, "y": 72.742330546318, "z": "10th" },
-    {"x": 15.5, "y": 73.7592390943967, "z": "10th" },
-    {"x": 16.5, "y": 74.7421714181467, "z": "10th" },
-    {"x": 17.5, "y": 75.6941996522115, "z": "10th" },
-    {"x": 18.5, "y": 76.6179655680007, "z": "10th" },
-    {"x": 19.5, "y": 77.5157598866749, "z": "10th" },
-    {"x": 20.5, "y": 78.3895838006527, "z": "10th" },
-    {"x": 21.5, "y": 79.2411973726709, "z": "10th" },
-    {"x": 22.5, "y": 80.0721580274065, "z": "10th" },
-    {"x": 23.5, "y": 80.8838514673423, "z": "10th" },
-    {"x": 24.5, "y": 81.6775173224022, "z": "10th" },
-    {"x": 25.5, "y": 82.4931841293221, "z": "10th" },
-    {"x": 26.5, "y": 83.2945896917198, "z": "10th" },
-    {"x": 27.5, "y": 84.0771733221153, "z": "10th" },
-    {"x": 28.5, "y": 84.8374122236475, "z": "10th" },
-    {"x": 29.5, "y": 85.5727280648047, "z": "10th" },
-    {"x": 30.5, "y": 86.2813902686523, "z": "10th" },
-    {"x": 31.5, "y": 86.9624207755768, "z": "10th" },
-    {"x": 32.5, "y": 87.6155015785346, "z": "10th" },
-    {"x": 33.5, "y": 88.2408864772002, "z": "10th" },
-    {"x": 34.5, "y": 88.8393197753093, "z": "10th" },
-    {"x": 35.5, "y": 89.4119588419568, "z": "10th" },
-    { "x": 0, "y": 47.6834546897351, "z": "25th" },
-    { "x": 0.5, "y": 50.0968551349334, "z": "25th" },
-    { "x": 1.5, "y": 53.6907813798356, "z": "25th" },
-    { "x": 2.5, "y": 56.471252168873, "z": "25th" },
-    { "x": 3.5, "y": 58.803462078233, "z": "25th" },
-    { "x": 4.5, "y": 60.843862287441, "z": "25th" },
-    { "x": 5.5, "y": 62.6758970949149, "z": "25th" },
-    { "x": 6.5, "y": 64.3500534414942, "z": "25th" },
-    { "x": 7.5, "y": 65.8995209587227, "z": "25th" },
-    { "x": 8.5, "y": 67.3474459293245, "z": "25th" },
-    { "x": 9.5, "y": 68.710701883648, "z": "25th" },
-    { "x": 10.5, "y": 70.0020216928785, "z": "25th" },
-    { "x": 11.5, "y": 71.2312834164726, "z": "25th" },
-    { "x": 12.5, "y": 72.4063263933377, "z": "25th" },
-    { "x": 13.5, "y": 73.5334911968798, "z": "25th" },
-    { "x": 14.5, "y": 74.6179893515629, "z": "25th" },
-    { "x": 15.5, "y": 75.6641640294465, "z": "25th" },
-    { "x": 16.5, "y": 76.6756784417595, "z": "25th" },
-    { "x": 17.5, "y": 77.6556549949202, "z": "25th" },
-    { "x": 18.5, "y": 78.6067799947587, "z": "25th" },
-    { "x": 19.5, "y": 79.5313837937216, "z": "25th" },
-    { "x": 20.5, "y": 80.4315030102563, "z": "25th" },
-    { "x": 21.5, "y": 81.3089295059433, "z": "25th" },
-    { "x": 22.5, "y": 82.1652493713631, "z": "25th" },
-    { "x": 23.5, "y": 83.0018736150738, "z": "25th" },
-    { "x": 24.5, "y": 83.8200669785362, "z": "25th" },
-    { "x": 25.5, "y": 84.6720881213213, "z": "25th" },
-    { "x": 26.5, "y": 85.5036023508396, "z": "25th" },
-    { "x": 27.5, "y": 86.3115062063632, "z": "25th" },
-    { "x": 28.5, "y": 87.0934589510975, "z": "25th" },
-    { "x": 29.5, "y": 87.8478269972245, "z": "25th" },
-    { "x": 30.5, "y": 88.5736188166775, "z": "25th" },
-    { "x": 31.5, "y": 89.2704228999176, "z": "25th" },
-    { "x": 32.5, "y": 89.9383458987549, "z": "25th" },
-    { "x": 33.5, "y": 90.5779493515219, "z": "25th" },
-    { "x": 34.5, "y": 91.1901980158248, "z": "25th" },
-    { "x": 35.5, "y": 91.7763934746218, "z": "25th" },
-    { "x": 0, "y": 49.286396118, "z": "50th" },
-    { "x": 0.5, "y": 51.683580573, "z": "50th" },
-    { "x": 1.5, "y": 55.286128126, "z": "50th" },
-    { "x": 2.5, "y": 58.093819061, "z": "50th" },
-    { "x": 3.5, "y": 60.459807634, "z": "50th" },
-    { "x": 4.5, "y": 62.536696555, "z": "50th" },
-    { "x": 5.5, "y": 64.406327624, "z": "50th" },
-    { "x": 6.5, "y": 66.118415533, "z": "50th" },
-    { "x": 7.5, "y": 67.705744192, "z": "50th" },
-    { "x": 8.5, "y": 69.191236138, "z": "50th" },
-    { "x": 9.5, "y": 70.591639237, "z": "50th" },
-    { "x": 10.5, "y": 71.919616727, "z": "50th" },
-    { "x": 11.5, "y": 73.185010399, "z": "50th" },
-    { "x": 12.5, "y": 74.395643786, "z": "50th" },
-    { "x": 13.5, "y": 75.557854397, "z": "50th" },
-    { "x": 14.5, "y": 76.676858713, "z": "50th" },
-    { "x": 15.5, "y": 77.757009856, "z": "50th" },
-    { "x": 16.5, "y": 78.801984056, "z": "50th" },
-    { "x": 17.5, "y": 79.814918523, "z": "50th" },
-    { "x": 18.5, "y": 80.798515316, "z": "50th" },
-    { "x": 19.5, "y": 81.755120921, "z": "50th" },
-    { "x": 20.5, "y": 82.686788098, "z": "50th" },
-    { "x": 21.5, "y": 83.59532461, "z": "50th" },
-    { "x": 22.5, "y": 84.48233206, "z": "50th" },
-    { "x": 23.5, "y": 85.349236238, "z": "50th" },
-    { "x": 24.5, "y": 86.197316902, "z": "50th" },
-    { "x": 25.5, "y": 87.090263184, "z": "50th" },
-    { "x": 26.5, "y": 87.957141816, "z": "50th" },
-    { "x": 27.5, "y": 88.796018399, "z": "50th" },
-    { "x": 28.5, "y": 89.605511504, "z": "50th" },
-    { "x": 29.5, "y": 90.38476689, "z": "50th" },
-    { "x": 30.5, "y": 91.133417221, "z": "50th" },
-    { "x": 31.5, "y": 91.851543603, "z": "50th" },
-    { "x": 32.5, "y": 92.539635196, "z": "50th" },
-    { "x": 33.5, "y": 93.198544285, "z": "50th" },
-    { "x": 34.5, "y": 93.829453915, "z": "50th" },
-    { "x": 35.5, "y": 94.433822779, "z": "50th" },
-    { "x": 0, "y": 51.0186957374673, "z": "75th" },
-    { "x": 0.5, "y": 53.3636233876347, "z": "75th" },
-    { "x": 1.5, "y": 56.9313607669117, "z": "75th" },
-    { "x": 2.5, "y": 59.7404469372429, "z": "75th" },
-    { "x": 3.5, "y": 62.1232951300098, "z": "75th" },
-    { "x": 4.5, "y": 64.2250712719925, "z": "75th" },
-    { "x": 5.5, "y": 66.1241785195238, "z": "75th" },
-    { "x": 6.5, "y": 67.8684993704711, "z": "75th" },
-    { "x": 7.5, "y": 69.4897495002519, "z": "75th" },
-    { "x": 8.5, "y": 71.0101890533948, "z": "75th" },
-    { "x": 9.5, "y": 72.4461366949443, "z": "75th" },
-    { "x": 10.5, "y": 73.8099684773972, "z": "75th" },
-    { "x": 11.5, "y": 75.1113294629031, "z": "75th" },
-    { "x": 12.5, "y": 76.3579061719386, "z": "75th" },
-    { "x": 13.5, "y": 77.5559396350042, "z": "75th" },
-    { "x": 14.5, "y": 78.7105780499221, "z": "75th" },
-    { "x": 15.5, "y": 79.8261262130668, "z": "75th" },
-    { "x": 16.5, "y": 80.9062264064347, "z": "75th" },
-    { "x": 17.5, "y": 81.9539923653731, "z": "75th" },
-    { "x": 18.5, "y": 82.9721103965001, "z": "75th" },
-    { "x": 19.5, "y": 83.9629169618863, "z": "75th" },
-    { "x": 20.5, "y": 84.9284590774354, "z": "75th" },
-    { "x": 21.5, "y": 85.8705419695333, "z": "75th" },
-    { "x": 22.5, "y": 86.7907671238583, "z": "75th" },
-    { "x": 23.5, "y": 87.6905622578691, "z": "75th" },
-    { "x": 24.5, "y": 88.5712095309212, "z": "75th" },
-    { "x": 25.5, "y": 89.5056243790664, "z": "75th" },
-    { "x": 26.5, "y": 90.409819647466, "z": "75th" },
-    { "x": 27.5, "y": 91.2825803646764, "z": "75th" },
-    { "x": 28.5, "y": 92.1231313812475, "z": "75th" },
-    { "x": 29.5, "y": 92.9311262420439, "z": "75th" },
-    { "x": 30.5, "y": 93.7066211970039, "z": "75th" },
-    { "x": 31.5, "y": 94.4500478190715, "z": "75th" },
-    { "x": 32.5, "y": 95.1621825659166, "z": "75th" },
-    { "x": 33.5, "y": 95.8441117544952, "z": "75th" },
-    { "x": 34.5, "y": 96.4972051892791, "z": "75th" },
-    { "x": 35.5, "y": 97.1230720411817, "z": "75th" },
-    { "x": 0, "y": 52.7025011515363, "z": "90th" },
-    { "x": 0.5, "y": 54.9622227613846, "z": "90th" },
-    { "x": 1.5, "y": 58.4561236882012, "z": "90th" },
-    { "x": 2.5, "y": 61.2430575079682, "z": "90th" },
-    { "x": 3.5, "y": 63.6264785034804, "z": "90th" },
-    { "x": 4.5, "y": 65.7409589481044, "z": "90th" },
-    { "x": 5.5, "y": 67.6599521762148, "z": "90th" },
-    { "x": 6.5, "y": 69.4286842451886, "z": "90th" },
-    { "x": 7.5, "y": 71.077310633283, "z": "90th" },
-    { "x": 8.5, "y": 72.6271149509581, "z": "90th" },
-    { "x": 9.5, "y": 74.0937751240296, "z": "90th" },
-    { "x": 10.5, "y": 75.4895542263663, "z": "90th" },
-    { "x": 11.5, "y": 76.8236415863035, "z": "90th" },
-    { "x": 12.5, "y": 78.1034220733925, "z": "90th" },
-    { "x": 13.5, "y": 79.3355972953145, "z": "90th" },
-    { "x": 14.5, "y": 80.5253727013444, "z": "90th" },
-    { "x": 15.5, "y": 81.6771799476171, "z": "90th" },
-    { "x": 16.5, "y": 82.782075541617, "z": "90th" },
-    { "x": 17.5, "y": 83.8626908671008, "z": "90th" },
-    { "x": 18.5, "y": 84.9135276607395, "z": "90th" },
-    { "x": 19.5, "y": 85.9368934784343, "z": "90th" },
-    { "x": 20.5, "y": 86.9348134608792, "z": "90th" },
-    { "x": 21.5, "y": 87.9090763999459, "z": "90th" },
-    { "x": 22.5, "y": 88.861271598425, "z": "90th" },
-    { "x": 23.5, "y": 89.7928185194043, "z": "90th" },
-    { "x": 24.5, "y": 90.7049915253405, "z": "90th" },
-    { "x": 25.5, "y": 91.6771799476171, "z": "90th" },
-    { "x": 26.5, "y": 92.6165822490131, "z": "90th" },
-    { "x": 27.5, "y": 93.5222656486659, "z": "90th" },
-    { "x": 28.5, "y": 94.3937145442226, "z": "90th" },
-    { "x": 29.5, "y": 95.2308178950554, "z": "90th" },
-    { "x": 30.5, "y": 96.0338473177221, "z": "90th" },
-    { "x": 31.5, "y": 96.8034300986108, "z": "90th" },
-    { "x": 32.5, "y": 97.5405191361178, "z": "90th" },
-    { "x": 33.5, "y": 98.2463607452525, "z": "90th" },
-    { "x": 34.5, "y": 98.9224631324983, "z": "90th" },
-    { "x": 35.5, "y": 99.5705625418812, "z": "90th" },
-    { "x": 0, "y": 53.7729087781385, "z": "95th" },
-    { "x": 0.5, "y": 55.9609422583569, "z": "95th" },
-    { "x": 1.5, "y": 59.3891073401307, "z": "95th" },
-    { "x": 2.5, "y": 62.1516557869816, "z": "95th" },
-    { "x": 3.5, "y": 64.5287532586929, "z": "95th" },
-    { "x": 4.5, "y": 66.6465255567482, "z": "95th" },
-    { "x": 5.5, "y": 68.5745160669867, "z": "95th" },
-    { "x": 6.5, "y": 70.3558690749937, "z": "95th" },
-    { "x": 7.5, "y": 72.0195245465041, "z": "95th" },
-    { "x": 8.5, "y": 73.5860080640044, "z": "95th" },
-    { "x": 9.5, "y": 75.0705008752525, "z": "95th" },
-    { "x": 10.5, "y": 76.4846049480161, "z": "95th" },
-    { "x": 11.5, "y": 77.8374228517723, "z": "95th" },
-    { "x": 12.5, "y": 79.1362519137182, "z": "95th" },
-    { "x": 13.5, "y": 80.3870485957959, "z": "95th" },
-    { "x": 14.5, "y": 81.5947498562919, "z": "95th" },
-    { "x": 15.5, "y": 82.7635017421482, "z": "95th" },
-    { "x": 16.5, "y": 83.8968261114336, "z": "95th" },
-    { "x": 17.5, "y": 84.9977446900603, "z": "95th" },
-    { "x": 18.5, "y": 86.0688731589567, "z": "95th" },
-    { "x": 19.5, "y": 87.1124936280132, "z": "95th" },
-    { "x": 20.5, "y": 88.1306112849774, "z": "95th" },
-    { "x": 21.5, "y": 89.1249992524607, "z": "95th" },
-    { "x": 22.5, "y": 90.0972345401269, "z": "95th" },
-    { "x": 23.5, "y": 91.0487275197954, "z": "95th" },
-    { "x": 24.5, "y": 91.980743693395, "z": "95th" },
-    { "x": 25.5, "y": 92.9757373133401, "z": "95th" },
-    { "x": 26.5, "y": 93.9369267310196, "z": "95th" },
-    { "x": 27.5, "y": 94.8633893451586, "z": "95th" },
-    { "x": 28.5, "y": 95.754640882198, "z": "95th" },
-    { "x": 29.5, "y": 96.6106146313602, "z": "95th" },
-    { "x": 30.5, "y": 97.4316380574577, "z": "95th" },
-    { "x": 31.5, "y": 98.2184020761176, "z": "95th" },
-    { "x": 32.5, "y": 98.971927774104, "z": "95th" },
-    { "x": 33.5, "y": 99.693533549472, "z": "95th" },
-    { "x": 34.5, "y": 100.384796022932, "z": "95th" },
-    { "x": 35.5, "y": 101.047522729371, "z": "95th" },
-    { "x": 0, "y": 54.4952736403688, "z": "97th" },
-    { "x": 0.5, "y": 56.6272806300056, "z": "97th" },
-    { "x": 1.5, "y": 60.0033777126647, "z": "97th" },
-    { "x": 2.5, "y": 62.7454699723747, "z": "97th" },
-    { "x": 3.5, "y": 65.115773002808, "z": "97th" },
-    { "x": 4.5, "y": 67.2339774121665, "z": "97th" },
-    { "x": 5.5, "y": 69.1666761894822, "z": "97th" },
-    { "x": 6.5, "y": 70.9554545925054, "z": "97th" },
-    { "x": 7.5, "y": 72.6283474980047, "z": "97th" },
-    { "x": 8.5, "y": 74.2053183684792, "z": "97th" },
-    { "x": 9.5, "y": 75.701181126368, "z": "97th" },
-    { "x": 10.5, "y": 77.1272879859039, "z": "97th" },
-    { "x": 11.5, "y": 78.4925662247927, "z": "97th" },
-    { "x": 12.5, "y": 79.8041869250981, "z": "97th" },
-    { "x": 13.5, "y": 81.0680136645635, "z": "97th" },
-    { "x": 14.5, "y": 82.2889138487065, "z": "97th" },
-    { "x": 15.5, "y": 83.4709806623838, "z": "97th" },
-    { "x": 16.5, "y": 84.6176952930965, "z": "97th" },
-    { "x": 17.5, "y": 85.7320478519033, "z": "97th" },
-    { "x": 18.5, "y": 86.8166292394802, "z": "97th" },
-    { "x": 19.5, "y": 87.8737020094713, "z": "97th" },
-    { "x": 20.5, "y": 88.9052558357328, "z": "97th" },
-    { "x": 21.5, "y": 89.9130514871924, "z": "97th" },
-    { "x": 22.5, "y": 90.8986561175583, "z": "97th" },
-    { "x": 23.5, "y": 91.8634726380307, "z": "97th" },
-    { "x": 24.5, "y": 92.8087592076702, "z": "97th" },
-    { "x": 25.5, "y": 93.818641483058, "z": "97th" },
-    { "x": 26.5, "y": 94.7942625783029, "z": "97th" },
-    { "x": 27.5, "y": 95.7346447679359, "z": "97th" },
-    { "x": 28.5, "y": 96.6392759813587, "z": "97th" },
-    { "x": 29.5, "y": 97.5080806700992, "z": "97th" },
-    { "x": 30.5, "y": 98.3413938922658, "z": "97th" },
-    { "x": 31.5, "y": 99.1399266631111, "z": "97th" },
-    { "x": 32.5, "y": 99.9047293169157, "z": "97th" },
-    { "x": 33.5, "y": 100.637157379525, "z": "97th" },
-    { "x": 34.5, "y": 101.338825855668, "z": "97th" },
-    { "x": 35.5, "y": 102.011586398342, "z": "97th" }
-]
\ No newline at end of file
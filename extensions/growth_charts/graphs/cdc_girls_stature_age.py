@@ -1,983 +0,0 @@
-cdc_girls_stature_age = [
-    {'x': 24.0, 'y': 78.43754166, 'z': '3rd'}, {'x': 24.0, 'y': 79.25981989, 'z': '5th'},
-    {'x': 24.0, 'y': 80.52476467, 'z': '10th'}, {'x': 24.0, 'y': 82.63523563, 'z': '25th'},
-    {'x': 24.0, 'y': 84.97555512, 'z': '50th'}, {'x': 24.0, 'y': 87.31121356, 'z': '75th'},
-    {'x': 24.0, 'y': 89.40951159, 'z': '90th'}, {'x': 24.0, 'y': 90.66354871, 'z': '95th'},
-    {'x': 24.0, 'y': 91.47728689, 'z': '97th'}, {'x': 24.5, 'y': 78.82133263, 'z': '3rd'},
-    {'x': 24.5, 'y': 79.64776859, 'z': '5th'}, {'x': 24.5, 'y': 80.91946302, 'z': '10th'},
-    {'x': 24.5, 'y': 83.04213246, 'z': '25th'}, {'x': 24.5, 'y': 85.3973169, 'z': '50th'},
-    {'x': 24.5, 'y': 87.74917522, 'z': '75th'}, {'x': 24.5, 'y': 89.86315834, 'z': '90th'},
-    {'x': 24.5, 'y': 91.12706971, 'z': '95th'}, {'x': 24.5, 'y': 91.94741225, 'z': '97th'},
-    {'x': 25.5, 'y': 79.60197647, 'z': '3rd'}, {'x': 25.5, 'y': 80.44225735, 'z': '5th'},
-    {'x': 25.5, 'y': 81.73540957, 'z': '10th'}, {'x': 25.5, 'y': 83.89430336, 'z': '25th'},
-    {'x': 25.5, 'y': 86.29026318, 'z': '50th'}, {'x': 25.5, 'y': 88.683435, 'z': '75th'},
-    {'x': 25.5, 'y': 90.83504785, 'z': '90th'}, {'x': 25.5, 'y': 92.12167631, 'z': '95th'},
-    {'x': 25.5, 'y': 92.95684975, 'z': '97th'}, {'x': 26.5, 'y': 80.37554759, 'z': '3rd'},
-    {'x': 26.5, 'y': 81.22666181, 'z': '5th'}, {'x': 26.5, 'y': 82.5369944, 'z': '10th'},
-    {'x': 26.5, 'y': 84.72592034, 'z': '25th'}, {'x': 26.5, 'y': 87.15714182, 'z': '50th'},
-    {'x': 26.5, 'y': 89.5875095, 'z': '75th'}, {'x': 26.5, 'y': 91.77420584, 'z': '90th'},
-    {'x': 26.5, 'y': 93.08254082, 'z': '95th'}, {'x': 26.5, 'y': 93.9320912, 'z': '97th'},
-    {'x': 27.5, 'y': 81.1356973, 'z': '3rd'}, {'x': 27.5, 'y': 81.99539596, 'z': '5th'},
-    {'x': 27.5, 'y': 83.31968453, 'z': '10th'}, {'x': 27.5, 'y': 85.53389245, 'z': '25th'},
-    {'x': 27.5, 'y': 87.9960184, 'z': '50th'}, {'x': 27.5, 'y': 90.46017565, 'z': '75th'},
-    {'x': 27.5, 'y': 92.67968776, 'z': '90th'}, {'x': 27.5, 'y': 94.00872819, 'z': '95th'},
-    {'x': 27.5, 'y': 94.87214661, 'z': '97th'}, {'x': 28.5, 'y': 81.87746051, 'z': '3rd'},
-    {'x': 28.5, 'y': 82.74410888, 'z': '5th'}, {'x': 28.5, 'y': 84.07997909, 'z': '10th'},
-    {'x': 28.5, 'y': 86.31588888, 'z': '25th'}, {'x': 28.5, 'y': 88.8055115, 'z': '50th'},
-    {'x': 28.5, 'y': 91.30065173, 'z': '75th'}, {'x': 28.5, 'y': 93.55096822, 'z': '90th'},
-    {'x': 28.5, 'y': 94.89974364, 'z': '95th'}, {'x': 28.5, 'y': 95.77649339, 'z': '97th'},
-    {'x': 29.5, 'y': 82.59711819, 'z': '3rd'}, {'x': 29.5, 'y': 83.46956585, 'z': '5th'},
-    {'x': 29.5, 'y': 84.81531679, 'z': '10th'}, {'x': 29.5, 'y': 87.07028387, 'z': '25th'},
-    {'x': 29.5, 'y': 89.58476689, 'z': '50th'}, {'x': 29.5, 'y': 92.10858598, 'z': '75th'},
-    {'x': 29.5, 'y': 94.38792816, 'z': '90th'}, {'x': 29.5, 'y': 95.75551171, 'z': '95th'},
-    {'x': 29.5, 'y': 96.64504712, 'z': '97th'}, {'x': 30.5, 'y': 83.29206184, 'z': '3rd'},
-    {'x': 30.5, 'y': 84.16952943, 'z': '5th'}, {'x': 30.5, 'y': 85.52398013, 'z': '10th'},
-    {'x': 30.5, 'y': 87.7960919, 'z': '25th'}, {'x': 30.5, 'y': 90.33341722, 'z': '50th'},
-    {'x': 30.5, 'y': 92.88403041, 'z': '75th'}, {'x': 30.5, 'y': 95.19083262, 'z': '90th'},
-    {'x': 30.5, 'y': 96.57635253, 'z': '95th'}, {'x': 30.5, 'y': 97.47813528, 'z': '97th'},
-    {'x': 31.5, 'y': 83.96065415, 'z': '3rd'}, {'x': 31.5, 'y': 84.84263937, 'z': '5th'},
-    {'x': 31.5, 'y': 86.20500071, 'z': '10th'}, {'x': 31.5, 'y': 88.49290603, 'z': '25th'},
-    {'x': 31.5, 'y': 91.0515436, 'z': '50th'}, {'x': 31.5, 'y': 93.62741325, 'z': '75th'},
-    {'x': 31.5, 'y': 95.96030359, 'z': '90th'}, {'x': 31.5, 'y': 97.36295103, 'z': '95th'},
-    {'x': 31.5, 'y': 98.27646264, 'z': '97th'}, {'x': 32.5, 'y': 84.60209562, 'z': '3rd'},
-    {'x': 32.5, 'y': 85.48829708, 'z': '5th'}, {'x': 32.5, 'y': 86.85806752, 'z': '10th'},
-    {'x': 32.5, 'y': 89.16083624, 'z': '25th'}, {'x': 32.5, 'y': 91.7396352, 'z': '50th'},
-    {'x': 32.5, 'y': 94.33950841, 'z': '75th'}, {'x': 32.5, 'y': 96.69728978, 'z': '90th'},
-    {'x': 32.5, 'y': 98.11632342, 'z': '95th'}, {'x': 32.5, 'y': 99.04107435, 'z': '97th'},
-    {'x': 33.5, 'y': 85.21630353, 'z': '3rd'}, {'x': 33.5, 'y': 86.10655881, 'z': '5th'},
-    {'x': 33.5, 'y': 87.48343922, 'z': '10th'}, {'x': 33.5, 'y': 89.80044644, 'z': '25th'},
-    {'x': 33.5, 'y': 92.39854429, 'z': '50th'}, {'x': 33.5, 'y': 95.02140026, 'z': '75th'},
-    {'x': 33.5, 'y': 97.40303421, 'z': '90th'}, {'x': 33.5, 'y': 98.83778417, 'z': '95th'},
-    {'x': 33.5, 'y': 99.77332166, 'z': '97th'}, {'x': 34.5, 'y': 85.80378996, 'z': '3rd'},
-    {'x': 34.5, 'y': 86.69803144, 'z': '5th'}, {'x': 34.5, 'y': 88.08186325, 'z': '10th'},
-    {'x': 34.5, 'y': 90.41270297, 'z': '25th'}, {'x': 34.5, 'y': 93.02945392, 'z': '50th'},
-    {'x': 34.5, 'y': 95.67445723, 'z': '75th'}, {'x': 34.5, 'y': 98.07904266, 'z': '90th'},
-    {'x': 34.5, 'y': 99.52890698, 'z': '95th'}, {'x': 34.5, 'y': 100.4748164, 'z': '97th'},
-    {'x': 35.5, 'y': 86.36557262, 'z': '3rd'}, {'x': 35.5, 'y': 87.26378819, 'z': '5th'},
-    {'x': 35.5, 'y': 88.6544988, 'z': '10th'}, {'x': 35.5, 'y': 90.99890839, 'z': '25th'},
-    {'x': 35.5, 'y': 93.63382278, 'z': '50th'}, {'x': 35.5, 'y': 96.30028751, 'z': '75th'},
-    {'x': 35.5, 'y': 98.72704954, 'z': '90th'}, {'x': 35.5, 'y': 100.191497, 'z': '95th'},
-    {'x': 35.5, 'y': 101.1474075, 'z': '97th'}, {'x': 36.5, 'y': 86.90307328, 'z': '3rd'},
-    {'x': 36.5, 'y': 87.80528157, 'z': '5th'}, {'x': 36.5, 'y': 89.20284893, 'z': '10th'},
-    {'x': 36.5, 'y': 91.56065781, 'z': '25th'}, {'x': 36.5, 'y': 94.21335709, 'z': '50th'},
-    {'x': 36.5, 'y': 96.9007148, 'z': '75th'}, {'x': 36.5, 'y': 99.34898744, 'z': '90th'},
-    {'x': 36.5, 'y': 100.8275527, 'z': '95th'}, {'x': 36.5, 'y': 101.7931359, 'z': '97th'},
-    {'x': 37.5, 'y': 87.43482018, 'z': '3rd'}, {'x': 37.5, 'y': 88.34236213, 'z': '5th'},
-    {'x': 37.5, 'y': 89.74875322, 'z': '10th'}, {'x': 37.5, 'y': 92.12298263, 'z': '25th'},
-    {'x': 37.5, 'y': 94.79643239, 'z': '50th'}, {'x': 37.5, 'y': 97.50723533, 'z': '75th'},
-    {'x': 37.5, 'y': 99.97896123, 'z': '90th'}, {'x': 37.5, 'y': 101.4726459, 'z': '95th'},
-    {'x': 37.5, 'y': 102.448488, 'z': '97th'}, {'x': 38.5, 'y': 87.95945137, 'z': '3rd'},
-    {'x': 38.5, 'y': 88.87255864, 'z': '5th'}, {'x': 38.5, 'y': 90.28810699, 'z': '10th'},
-    {'x': 38.5, 'y': 92.67925322, 'z': '25th'}, {'x': 38.5, 'y': 95.37391918, 'z': '50th'},
-    {'x': 38.5, 'y': 98.10854769, 'z': '75th'}, {'x': 38.5, 'y': 100.6040005, 'z': '90th'},
-    {'x': 38.5, 'y': 102.112939, 'z': '95th'}, {'x': 38.5, 'y': 103.0991159, 'z': '97th'},
-    {'x': 39.5, 'y': 88.47849954, 'z': '3rd'}, {'x': 39.5, 'y': 89.39733426, 'z': '5th'},
-    {'x': 39.5, 'y': 90.82227549, 'z': '10th'}, {'x': 39.5, 'y': 93.23069622, 'z': '25th'},
-    {'x': 39.5, 'y': 95.94692677, 'z': '50th'}, {'x': 39.5, 'y': 98.70568284, 'z': '75th'},
-    {'x': 39.5, 'y': 101.2250993, 'z': '90th'}, {'x': 39.5, 'y': 102.7494191, 'z': '95th'},
-    {'x': 39.5, 'y': 103.7460086, 'z': '97th'}, {'x': 40.5, 'y': 88.99330218, 'z': '3rd'},
-    {'x': 40.5, 'y': 89.91797078, 'z': '5th'}, {'x': 40.5, 'y': 91.35246174, 'z': '10th'},
-    {'x': 40.5, 'y': 93.77840211, 'z': '25th'}, {'x': 40.5, 'y': 96.51644912, 'z': '50th'},
-    {'x': 40.5, 'y': 99.2995686, 'z': '75th'}, {'x': 40.5, 'y': 101.8431523, 'z': '90th'},
-    {'x': 40.5, 'y': 103.3829734, 'z': '95th'}, {'x': 40.5, 'y': 104.3900531, 'z': '97th'},
-    {'x': 41.5, 'y': 89.50502066, 'z': '3rd'}, {'x': 41.5, 'y': 90.43558554, 'z': '5th'},
-    {'x': 41.5, 'y': 91.87972051, 'z': '10th'}, {'x': 41.5, 'y': 94.3233355, 'z': '25th'},
-    {'x': 41.5, 'y': 97.08337211, 'z': '50th'}, {'x': 41.5, 'y': 99.89103539, 'z': '75th'},
-    {'x': 41.5, 'y': 102.4589604, 'z': '90th'}, {'x': 41.5, 'y': 104.0143944, 'z': '95th'},
-    {'x': 41.5, 'y': 105.0320405, 'z': '97th'}, {'x': 42.5, 'y': 90.01465759, 'z': '3rd'},
-    {'x': 42.5, 'y': 90.95114701, 'z': '5th'}, {'x': 42.5, 'y': 92.40497144, 'z': '10th'},
-    {'x': 42.5, 'y': 94.86634477, 'z': '25th'}, {'x': 42.5, 'y': 97.6484807, 'z': '50th'},
-    {'x': 42.5, 'y': 100.4808219, 'z': '75th'}, {'x': 42.5, 'y': 103.0732359, 'z': '90th'},
-    {'x': 42.5, 'y': 104.6443859, 'z': '95th'}, {'x': 42.5, 'y': 105.6726719, 'z': '97th'},
-    {'x': 43.5, 'y': 90.52307278, 'z': '3rd'}, {'x': 43.5, 'y': 91.4654891, 'z': '5th'},
-    {'x': 43.5, 'y': 92.92901112, 'z': '10th'}, {'x': 43.5, 'y': 95.40817129, 'z': '25th'},
-    {'x': 43.5, 'y': 98.21246579, 'z': '50th'}, {'x': 43.5, 'y': 101.0695807, 'z': '75th'},
-    {'x': 43.5, 'y': 103.6866076, 'z': '90th'}, {'x': 43.5, 'y': 105.2735676, 'z': '95th'},
-    {'x': 43.5, 'y': 106.3125633, 'z': '97th'}, {'x': 44.5, 'y': 91.03099757, 'z': '3rd'},
-    {'x': 44.5, 'y': 91.97932415, 'z': '5th'}, {'x': 44.5, 'y': 93.45252422, 'z': '10th'},
-    {'x': 44.5, 'y': 95.94945793, 'z': '25th'}, {'x': 44.5, 'y': 98.77593069, 'z': '50th'},
-    {'x': 44.5, 'y': 101.6578832, 'z': '75th'}, {'x': 44.5, 'y': 104.2996257, 'z': '90th'},
-    {'x': 44.5, 'y': 105.9024803, 'z': '95th'}, {'x': 44.5, 'y': 106.9522508, 'z': '97th'},
-    {'x': 45.5, 'y': 91.5390479, 'z': '3rd'}, {'x': 45.5, 'y': 92.49325483, 'z': '5th'},
-    {'x': 45.5, 'y': 93.97609374, 'z': '10th'}, {'x': 45.5, 'y': 96.49075704, 'z': '25th'},
-    {'x': 45.5, 'y': 99.33939735, 'z': '50th'}, {'x': 45.5, 'y': 102.2462253, 'z': '75th'},
-    {'x': 45.5, 'y': 104.9127666, 'z': '90th'}, {'x': 45.5, 'y': 106.5315907, 'z': '95th'},
-    {'x': 45.5, 'y': 107.5921959, 'z': '97th'}, {'x': 46.5, 'y': 92.04773605, 'z': '3rd'},
-    {'x': 46.5, 'y': 93.00778484, 'z': '5th'}, {'x': 46.5, 'y': 94.50021028, 'z': '10th'},
-    {'x': 46.5, 'y': 97.03253788, 'z': '25th'}, {'x': 46.5, 'y': 99.9033122, 'z': '50th'},
-    {'x': 46.5, 'y': 102.8350319, 'z': '75th'}, {'x': 46.5, 'y': 105.5264371, 'z': '90th'},
-    {'x': 46.5, 'y': 107.161296, 'z': '95th'}, {'x': 46.5, 'y': 108.2327896, 'z': '97th'},
-    {'x': 47.5, 'y': 92.55748123, 'z': '3rd'}, {'x': 47.5, 'y': 93.52332863, 'z': '5th'},
-    {'x': 47.5, 'y': 95.02528063, 'z': '10th'}, {'x': 47.5, 'y': 97.57519341, 'z': '25th'},
-    {'x': 47.5, 'y': 100.4680516, 'z': '50th'}, {'x': 47.5, 'y': 103.4246616, 'z': '75th'},
-    {'x': 47.5, 'y': 106.1409795, 'z': '90th'}, {'x': 47.5, 'y': 107.7919282, 'z': '95th'},
-    {'x': 47.5, 'y': 108.8743573, 'z': '97th'}, {'x': 48.5, 'y': 93.06861913, 'z': '3rd'},
-    {'x': 48.5, 'y': 94.04022021, 'z': '5th'}, {'x': 48.5, 'y': 95.55163545, 'z': '10th'},
-    {'x': 48.5, 'y': 98.11904662, 'z': '25th'}, {'x': 48.5, 'y': 101.033927, 'z': '50th'},
-    {'x': 48.5, 'y': 104.0154114, 'z': '75th'}, {'x': 48.5, 'y': 106.7566748, 'z': '90th'},
-    {'x': 48.5, 'y': 108.4237579, 'z': '95th'}, {'x': 48.5, 'y': 109.5171624, 'z': '97th'},
-    {'x': 49.5, 'y': 93.58141046, 'z': '3rd'}, {'x': 49.5, 'y': 94.55872109, 'z': '5th'},
-    {'x': 49.5, 'y': 96.07953634, 'z': '10th'}, {'x': 49.5, 'y': 98.66435637, 'z': '25th'},
-    {'x': 49.5, 'y': 101.6011898, 'z': '50th'}, {'x': 49.5, 'y': 104.6075204, 'z': '75th'},
-    {'x': 49.5, 'y': 107.3737475, 'z': '90th'}, {'x': 49.5, 'y': 109.0569988, 'z': '95th'},
-    {'x': 49.5, 'y': 110.1614111, 'z': '97th'}, {'x': 50.5, 'y': 94.09604867, 'z': '3rd'},
-    {'x': 50.5, 'y': 95.07902737, 'z': '5th'}, {'x': 50.5, 'y': 96.60918226, 'z': '10th'},
-    {'x': 50.5, 'y': 99.2113227, 'z': '25th'}, {'x': 50.5, 'y': 102.1700358, 'z': '50th'},
-    {'x': 50.5, 'y': 105.2011743, 'z': '75th'}, {'x': 50.5, 'y': 107.9923687, 'z': '90th'},
-    {'x': 50.5, 'y': 109.6918111, 'z': '95th'}, {'x': 50.5, 'y': 110.8072554, 'z': '97th'},
-    {'x': 51.5, 'y': 94.61266684, 'z': '3rd'}, {'x': 51.5, 'y': 95.60127628, 'z': '5th'},
-    {'x': 51.5, 'y': 97.14071535, 'z': '10th'}, {'x': 51.5, 'y': 99.76009185, 'z': '25th'},
-    {'x': 51.5, 'y': 102.7406094, 'z': '50th'}, {'x': 51.5, 'y': 105.7965086, 'z': '75th'},
-    {'x': 51.5, 'y': 108.6126601, 'z': '90th'}, {'x': 51.5, 'y': 110.3283052, 'z': '95th'},
-    {'x': 51.5, 'y': 111.4547971, 'z': '97th'}, {'x': 52.5, 'y': 95.13134395, 'z': '3rd'},
-    {'x': 52.5, 'y': 96.12555202, 'z': '5th'}, {'x': 52.5, 'y': 97.67422621, 'z': '10th'},
-    {'x': 52.5, 'y': 100.3107608, 'z': '25th'}, {'x': 52.5, 'y': 103.3130077, 'z': '50th'},
-    {'x': 52.5, 'y': 106.3936129, 'z': '75th'}, {'x': 52.5, 'y': 109.2346972, 'z': '90th'},
-    {'x': 52.5, 'y': 110.9665451, 'z': '95th'}, {'x': 52.5, 'y': 112.1040915, 'z': '97th'},
-    {'x': 53.5, 'y': 95.65211042, 'z': '3rd'}, {'x': 53.5, 'y': 96.65189097, 'z': '5th'},
-    {'x': 53.5, 'y': 98.20975881, 'z': '10th'}, {'x': 53.5, 'y': 100.8633813, 'z': '25th'},
-    {'x': 53.5, 'y': 103.8872839, 'z': '50th'}, {'x': 53.5, 'y': 106.9925336, 'z': '75th'},
-    {'x': 53.5, 'y': 109.8585126, 'z': '90th'}, {'x': 53.5, 'y': 111.6065515, 'z': '95th'},
-    {'x': 53.5, 'y': 112.7551501, 'z': '97th'}, {'x': 54.5, 'y': 96.17495324, 'z': '3rd'},
-    {'x': 54.5, 'y': 97.18028656, 'z': '5th'}, {'x': 54.5, 'y': 98.74731484, 'z': '10th'},
-    {'x': 54.5, 'y': 101.4179641, 'z': '25th'}, {'x': 54.5, 'y': 104.4634511, 'z': '50th'},
-    {'x': 54.5, 'y': 107.5932772, 'z': '75th'}, {'x': 54.5, 'y': 110.4840992, 'z': '90th'},
-    {'x': 54.5, 'y': 112.2483051, 'z': '95th'}, {'x': 54.5, 'y': 113.4079442, 'z': '97th'},
-    {'x': 55.5, 'y': 96.69982047, 'z': '3rd'}, {'x': 55.5, 'y': 97.7106936, 'z': '5th'},
-    {'x': 55.5, 'y': 99.28685775, 'z': '10th'}, {'x': 55.5, 'y': 101.9744822, 'z': '25th'},
-    {'x': 55.5, 'y': 105.0414853, 'z': '50th'}, {'x': 55.5, 'y': 108.1958137, 'z': '75th'},
-    {'x': 55.5, 'y': 111.1114131, 'z': '90th'}, {'x': 55.5, 'y': 112.8917498, 'z': '95th'},
-    {'x': 55.5, 'y': 114.0624076, 'z': '97th'}, {'x': 56.5, 'y': 97.2266254, 'z': '3rd'},
-    {'x': 56.5, 'y': 98.24303219, 'z': '5th'}, {'x': 56.5, 'y': 99.82831652, 'z': '10th'},
-    {'x': 56.5, 'y': 102.5328747, 'z': '25th'}, {'x': 56.5, 'y': 105.6213287, 'z': '50th'},
-    {'x': 56.5, 'y': 108.8000793, 'z': '75th'}, {'x': 56.5, 'y': 111.7403765, 'z': '90th'},
-    {'x': 56.5, 'y': 113.536795, 'z': '95th'}, {'x': 56.5, 'y': 114.7184401, 'z': '97th'},
-    {'x': 57.5, 'y': 97.75525036, 'z': '3rd'}, {'x': 57.5, 'y': 98.77719141, 'z': '5th'},
-    {'x': 57.5, 'y': 100.371589, 'z': '10th'}, {'x': 57.5, 'y': 103.0930492, 'z': '25th'},
-    {'x': 57.5, 'y': 106.2028921, 'z': '50th'}, {'x': 57.5, 'y': 109.405979, 'z': '75th'},
-    {'x': 57.5, 'y': 112.3708801, 'z': '90th'}, {'x': 57.5, 'y': 114.1833188, 'z': '95th'},
-    {'x': 57.5, 'y': 115.3759096, 'z': '97th'}, {'x': 58.5, 'y': 98.28555005, 'z': '3rd'},
-    {'x': 58.5, 'y': 99.31303257, 'z': '5th'}, {'x': 58.5, 'y': 100.9165451, 'z': '10th'},
-    {'x': 58.5, 'y': 103.6548853, 'z': '25th'}, {'x': 58.5, 'y': 106.7860583, 'z': '50th'},
-    {'x': 58.5, 'y': 110.0133894, 'z': '75th'}, {'x': 58.5, 'y': 113.0027865, 'z': '90th'},
-    {'x': 58.5, 'y': 114.8311708, 'z': '95th'}, {'x': 58.5, 'y': 116.0346553, 'z': '97th'},
-    {'x': 59.5, 'y': 98.81735475, 'z': '3rd'}, {'x': 59.5, 'y': 99.85039229, 'z': '5th'},
-    {'x': 59.5, 'y': 101.4630296, 'z': '10th'}, {'x': 59.5, 'y': 104.2182371, 'z': '25th'},
-    {'x': 59.5, 'y': 107.3706841, 'z': '50th'}, {'x': 59.5, 'y': 110.6221611, 'z': '75th'},
-    {'x': 59.5, 'y': 113.6359317, 'z': '90th'}, {'x': 59.5, 'y': 115.4801741, 'z': '95th'},
-    {'x': 59.5, 'y': 116.6944901, 'z': '97th'}, {'x': 60.5, 'y': 99.35047319, 'z': '3rd'},
-    {'x': 60.5, 'y': 100.3890853, 'z': '5th'}, {'x': 60.5, 'y': 102.0108651, 'z': '10th'},
-    {'x': 60.5, 'y': 104.7829358, 'z': '25th'}, {'x': 60.5, 'y': 107.9566031, 'z': '50th'},
-    {'x': 60.5, 'y': 111.2321213, 'z': '75th'}, {'x': 60.5, 'y': 114.2701285, 'z': '90th'},
-    {'x': 60.5, 'y': 116.1301284, 'z': '95th'}, {'x': 60.5, 'y': 117.3552032, 'z': '97th'},
-    {'x': 61.5, 'y': 99.88469514, 'z': '3rd'}, {'x': 61.5, 'y': 100.9289069, 'z': '5th'},
-    {'x': 61.5, 'y': 102.5598541, 'z': '10th'}, {'x': 61.5, 'y': 105.348792, 'z': '25th'},
-    {'x': 61.5, 'y': 108.5436278, 'z': '50th'}, {'x': 61.5, 'y': 111.8430758, 'z': '75th'},
-    {'x': 61.5, 'y': 114.9051683, 'z': '90th'}, {'x': 61.5, 'y': 116.780812, 'z': '95th'},
-    {'x': 61.5, 'y': 118.0165629, 'z': '97th'}, {'x': 62.5, 'y': 100.4197939, 'z': '3rd'},
-    {'x': 62.5, 'y': 101.4696357, 'z': '5th'}, {'x': 62.5, 'y': 103.1097819, 'z': '10th'},
-    {'x': 62.5, 'y': 105.9155982, 'z': '25th'}, {'x': 62.5, 'y': 109.1315521, 'z': '50th'},
-    {'x': 62.5, 'y': 112.4548114, 'z': '75th'}, {'x': 62.5, 'y': 115.5408235, 'z': '90th'},
-    {'x': 62.5, 'y': 117.4319846, 'z': '95th'}, {'x': 62.5, 'y': 118.6783183, 'z': '97th'},
-    {'x': 63.5, 'y': 100.9555286, 'z': '3rd'}, {'x': 63.5, 'y': 102.0110354, 'z': '5th'},
-    {'x': 63.5, 'y': 103.6604184, 'z': '10th'}, {'x': 63.5, 'y': 106.4831306, 'z': '25th'},
-    {'x': 63.5, 'y': 109.7201531, 'z': '50th'}, {'x': 63.5, 'y': 113.0670984, 'z': '75th'},
-    {'x': 63.5, 'y': 116.1768496, 'z': '90th'}, {'x': 63.5, 'y': 118.0833889, 'z': '95th'},
-    {'x': 63.5, 'y': 119.3402023, 'z': '97th'}, {'x': 64.5, 'y': 101.4916463, 'z': '3rd'},
-    {'x': 64.5, 'y': 102.5528574, 'z': '5th'}, {'x': 64.5, 'y': 104.2115203, 'z': '10th'},
-    {'x': 64.5, 'y': 107.0511517, 'z': '25th'}, {'x': 64.5, 'y': 110.3091934, 'z': '50th'},
-    {'x': 64.5, 'y': 113.6796918, 'z': '75th'}, {'x': 64.5, 'y': 116.8129879, 'z': '90th'},
-    {'x': 64.5, 'y': 118.7347537, 'z': '95th'}, {'x': 64.5, 'y': 120.0019338, 'z': '97th'},
-    {'x': 65.5, 'y': 102.0278838, 'z': '3rd'}, {'x': 65.5, 'y': 103.0948423, 'z': '5th'},
-    {'x': 65.5, 'y': 104.762833, 'z': '10th'}, {'x': 65.5, 'y': 107.6194116, 'z': '25th'},
-    {'x': 65.5, 'y': 110.8984228, 'z': '50th'}, {'x': 65.5, 'y': 114.2923342, 'z': '75th'},
-    {'x': 65.5, 'y': 117.4489667, 'z': '90th'}, {'x': 65.5, 'y': 119.3857953, 'z': '95th'},
-    {'x': 65.5, 'y': 120.6632194, 'z': '97th'}, {'x': 66.5, 'y': 102.5639698, 'z': '3rd'},
-    {'x': 66.5, 'y': 103.6367221, 'z': '5th'}, {'x': 66.5, 'y': 105.3140925, 'z': '10th'},
-    {'x': 66.5, 'y': 108.1876502, 'z': '25th'}, {'x': 66.5, 'y': 111.4875806, 'z': '50th'},
-    {'x': 66.5, 'y': 114.9047572, 'z': '75th'}, {'x': 66.5, 'y': 118.0845041, 'z': '90th'},
-    {'x': 66.5, 'y': 120.03622, 'z': '95th'}, {'x': 66.5, 'y': 121.3237564, 'z': '97th'},
-    {'x': 67.5, 'y': 103.0996264, 'z': '3rd'}, {'x': 67.5, 'y': 104.1782217, 'z': '5th'},
-    {'x': 67.5, 'y': 105.8650274, 'z': '10th'}, {'x': 67.5, 'y': 108.7555991, 'z': '25th'},
-    {'x': 67.5, 'y': 112.0763967, 'z': '50th'}, {'x': 67.5, 'y': 115.5166834, 'z': '75th'},
-    {'x': 67.5, 'y': 118.7193096, 'z': '90th'}, {'x': 67.5, 'y': 120.685726, 'z': '95th'},
-    {'x': 67.5, 'y': 121.9832342, 'z': '97th'}, {'x': 68.5, 'y': 103.6345709, 'z': '3rd'},
-    {'x': 68.5, 'y': 104.7190606, 'z': '5th'}, {'x': 68.5, 'y': 106.4153599, 'z': '10th'},
-    {'x': 68.5, 'y': 109.3229831, 'z': '25th'}, {'x': 68.5, 'y': 112.6645943, 'z': '50th'},
-    {'x': 68.5, 'y': 116.1278283, 'z': '75th'}, {'x': 68.5, 'y': 119.3530862, 'z': '90th'},
-    {'x': 68.5, 'y': 121.3340057, 'z': '95th'}, {'x': 68.5, 'y': 122.6413368, 'z': '97th'},
-    {'x': 69.5, 'y': 104.1685175, 'z': '3rd'}, {'x': 69.5, 'y': 105.258955, 'z': '5th'},
-    {'x': 69.5, 'y': 106.9648081, 'z': '10th'}, {'x': 69.5, 'y': 109.8895213, 'z': '25th'},
-    {'x': 69.5, 'y': 113.2518902, 'z': '50th'}, {'x': 69.5, 'y': 116.7379017, 'z': '75th'},
-    {'x': 69.5, 'y': 119.9855318, 'z': '90th'}, {'x': 69.5, 'y': 121.9807474, 'z': '95th'},
-    {'x': 69.5, 'y': 123.297745, 'z': '97th'}, {'x': 70.5, 'y': 104.7011761, 'z': '3rd'},
-    {'x': 70.5, 'y': 105.797617, 'z': '5th'}, {'x': 70.5, 'y': 107.5130874, 'z': '10th'},
-    {'x': 70.5, 'y': 110.4549317, 'z': '25th'}, {'x': 70.5, 'y': 113.8380006, 'z': '50th'},
-    {'x': 70.5, 'y': 117.3466121, 'z': '75th'}, {'x': 70.5, 'y': 120.6163423, 'z': '90th'},
-    {'x': 70.5, 'y': 122.6256361, 'z': '95th'}, {'x': 70.5, 'y': 123.9521353, 'z': '97th'},
-    {'x': 71.5, 'y': 105.2322625, 'z': '3rd'}, {'x': 71.5, 'y': 106.3347618, 'z': '5th'},
-    {'x': 71.5, 'y': 108.0599112, 'z': '10th'}, {'x': 71.5, 'y': 111.0189247, 'z': '25th'},
-    {'x': 71.5, 'y': 114.4226317, 'z': '50th'}, {'x': 71.5, 'y': 117.9536599, 'z': '75th'},
-    {'x': 71.5, 'y': 121.2452109, 'z': '90th'}, {'x': 71.5, 'y': 123.2683596, 'z': '95th'},
-    {'x': 71.5, 'y': 124.6041916, 'z': '97th'}, {'x': 72.5, 'y': 105.7614857, 'z': '3rd'},
-    {'x': 72.5, 'y': 106.8701003, 'z': '5th'}, {'x': 72.5, 'y': 108.6049935, 'z': '10th'},
-    {'x': 72.5, 'y': 111.5812164, 'z': '25th'}, {'x': 72.5, 'y': 115.0054978, 'z': '50th'},
-    {'x': 72.5, 'y': 118.5587525, 'z': '75th'}, {'x': 72.5, 'y': 121.8718331, 'z': '90th'},
-    {'x': 72.5, 'y': 123.9086035, 'z': '95th'}, {'x': 72.5, 'y': 125.2535916, 'z': '97th'},
-    {'x': 73.5, 'y': 106.2885612, 'z': '3rd'}, {'x': 73.5, 'y': 107.4033481, 'z': '5th'},
-    {'x': 73.5, 'y': 109.148049, 'z': '10th'}, {'x': 73.5, 'y': 112.1415202, 'z': '25th'},
-    {'x': 73.5, 'y': 115.5863089, 'z': '50th'}, {'x': 73.5, 'y': 119.1615941, 'z': '75th'},
-    {'x': 73.5, 'y': 122.4959057, 'z': '90th'}, {'x': 73.5, 'y': 124.5460585, 'z': '95th'},
-    {'x': 73.5, 'y': 125.9000218, 'z': '97th'}, {'x': 74.5, 'y': 106.8132066, 'z': '3rd'},
-    {'x': 74.5, 'y': 107.9342229, 'z': '5th'}, {'x': 74.5, 'y': 109.6887954, 'z': '10th'},
-    {'x': 74.5, 'y': 112.6995522, 'z': '25th'}, {'x': 74.5, 'y': 116.1647782, 'z': '50th'},
-    {'x': 74.5, 'y': 119.7618926, 'z': '75th'}, {'x': 74.5, 'y': 123.1171295, 'z': '90th'},
-    {'x': 74.5, 'y': 125.1804203, 'z': '95th'}, {'x': 74.5, 'y': 126.5431735, 'z': '97th'},
-    {'x': 75.5, 'y': 107.3351443, 'z': '3rd'}, {'x': 75.5, 'y': 108.4624465, 'z': '5th'},
-    {'x': 75.5, 'y': 110.2269537, 'z': '10th'}, {'x': 75.5, 'y': 113.2550319, 'z': '25th'},
-    {'x': 75.5, 'y': 116.7406221, 'z': '50th'}, {'x': 75.5, 'y': 120.3593603, 'z': '75th'},
-    {'x': 75.5, 'y': 123.7352109, 'z': '90th'}, {'x': 75.5, 'y': 125.8113907, 'z': '95th'},
-    {'x': 75.5, 'y': 127.1827453, 'z': '97th'}, {'x': 76.5, 'y': 107.8541019, 'z': '3rd'},
-    {'x': 76.5, 'y': 108.987746, 'z': '5th'}, {'x': 76.5, 'y': 110.7622502, 'z': '10th'},
-    {'x': 76.5, 'y': 113.8076835, 'z': '25th'}, {'x': 76.5, 'y': 117.3135622, 'z': '50th'},
-    {'x': 76.5, 'y': 120.9537147, 'z': '75th'}, {'x': 76.5, 'y': 124.3498634, 'z': '90th'},
-    {'x': 76.5, 'y': 126.4386798, 'z': '95th'}, {'x': 76.5, 'y': 127.8184451, 'z': '97th'},
-    {'x': 77.5, 'y': 108.3698135, 'z': '3rd'}, {'x': 77.5, 'y': 109.5098548, 'z': '5th'},
-    {'x': 77.5, 'y': 111.2944168, 'z': '10th'}, {'x': 77.5, 'y': 114.3572371, 'z': '25th'},
-    {'x': 77.5, 'y': 117.8833259, 'z': '50th'}, {'x': 77.5, 'y': 121.5446807, 'z': '75th'},
-    {'x': 77.5, 'y': 124.9608087, 'z': '90th'}, {'x': 77.5, 'y': 127.0620077, 'z': '95th'},
-    {'x': 77.5, 'y': 128.4499914, 'z': '97th'}, {'x': 78.5, 'y': 108.8820206, 'z': '3rd'},
-    {'x': 78.5, 'y': 110.0285133, 'z': '5th'}, {'x': 78.5, 'y': 111.8231928, 'z': '10th'},
-    {'x': 78.5, 'y': 114.9034294, 'z': '25th'}, {'x': 78.5, 'y': 118.4496481, 'z': '50th'},
-    {'x': 78.5, 'y': 122.1319914, 'z': '75th'}, {'x': 78.5, 'y': 125.5677788, 'z': '90th'},
-    {'x': 78.5, 'y': 127.6811055, 'z': '95th'}, {'x': 78.5, 'y': 129.0771148, 'z': '97th'},
-    {'x': 79.5, 'y': 109.3904733, 'z': '3rd'}, {'x': 79.5, 'y': 110.5434704, 'z': '5th'},
-    {'x': 79.5, 'y': 112.3483251, 'z': '10th'}, {'x': 79.5, 'y': 115.4460056, 'z': '25th'},
-    {'x': 79.5, 'y': 119.0122722, 'z': '50th'}, {'x': 79.5, 'y': 122.7153896, 'z': '75th'},
-    {'x': 79.5, 'y': 126.1705167, 'z': '90th'}, {'x': 79.5, 'y': 128.2957169, 'z': '95th'},
-    {'x': 79.5, 'y': 129.69956, 'z': '97th'}, {'x': 80.5, 'y': 109.8949308, 'z': '3rd'},
-    {'x': 80.5, 'y': 111.0544841, 'z': '5th'}, {'x': 80.5, 'y': 112.8695701, 'z': '10th'},
-    {'x': 80.5, 'y': 115.9847196, 'z': '25th'}, {'x': 80.5, 'y': 119.5709513, 'z': '50th'},
-    {'x': 80.5, 'y': 123.2946291, 'z': '75th'}, {'x': 80.5, 'y': 126.7687784, 'z': '90th'},
-    {'x': 80.5, 'y': 128.9056, 'z': '95th'}, {'x': 80.5, 'y': 130.3170863, 'z': '97th'},
-    {'x': 81.5, 'y': 110.3951624, 'z': '3rd'}, {'x': 81.5, 'y': 111.5613221, 'z': '5th'},
-    {'x': 81.5, 'y': 113.3866939, 'z': '10th'}, {'x': 81.5, 'y': 116.5193358, 'z': '25th'},
-    {'x': 81.5, 'y': 120.1254495, 'z': '50th'}, {'x': 81.5, 'y': 123.8694758, 'z': '75th'},
-    {'x': 81.5, 'y': 127.3623338, 'z': '90th'}, {'x': 81.5, 'y': 129.5105281, 'z': '95th'},
-    {'x': 81.5, 'y': 130.9294701, 'z': '97th'}, {'x': 82.5, 'y': 110.890948, 'z': '3rd'},
-    {'x': 82.5, 'y': 112.0637632, 'z': '5th'}, {'x': 82.5, 'y': 113.8994733, 'z': '10th'},
-    {'x': 82.5, 'y': 117.0496296, 'z': '25th'}, {'x': 82.5, 'y': 120.6755427, 'z': '50th'},
-    {'x': 82.5, 'y': 124.4397092, 'z': '75th'}, {'x': 82.5, 'y': 127.9509681, 'z': '90th'},
-    {'x': 82.5, 'y': 130.1102914, 'z': '95th'}, {'x': 82.5, 'y': 131.5365053, 'z': '97th'},
-    {'x': 83.5, 'y': 111.3820796, 'z': '3rd'}, {'x': 83.5, 'y': 112.5615976, 'z': '5th'},
-    {'x': 83.5, 'y': 114.407697, 'z': '10th'}, {'x': 83.5, 'y': 117.5753884, 'z': '25th'},
-    {'x': 83.5, 'y': 121.22102, 'z': '50th'}, {'x': 83.5, 'y': 125.0051231, 'z': '75th'},
-    {'x': 83.5, 'y': 128.5344832, 'z': '90th'}, {'x': 83.5, 'y': 130.7046982, 'z': '95th'},
-    {'x': 83.5, 'y': 132.1380052, 'z': '97th'}, {'x': 84.5, 'y': 111.868361, 'z': '3rd'},
-    {'x': 84.5, 'y': 113.054628, 'z': '5th'}, {'x': 84.5, 'y': 114.9111662, 'z': '10th'},
-    {'x': 84.5, 'y': 118.0964128, 'z': '25th'}, {'x': 84.5, 'y': 121.7616844, 'z': '50th'},
-    {'x': 84.5, 'y': 125.5655273, 'z': '75th'}, {'x': 84.5, 'y': 129.1126986, 'z': '90th'},
-    {'x': 84.5, 'y': 131.2935761, 'z': '95th'}, {'x': 84.5, 'y': 132.7338033, 'z': '97th'},
-    {'x': 85.5, 'y': 112.3496093, 'z': '3rd'}, {'x': 85.5, 'y': 113.54267, 'z': '5th'},
-    {'x': 85.5, 'y': 115.4096953, 'z': '10th'}, {'x': 85.5, 'y': 118.6125173, 'z': '25th'},
-    {'x': 85.5, 'y': 122.2973542, 'z': '50th'}, {'x': 85.5, 'y': 126.1207484, 'z': '75th'},
-    {'x': 85.5, 'y': 129.6854529, 'z': '90th'}, {'x': 85.5, 'y': 131.876773, 'z': '95th'},
-    {'x': 85.5, 'y': 133.323755, 'z': '97th'}, {'x': 86.5, 'y': 112.825655, 'z': '3rd'},
-    {'x': 86.5, 'y': 114.0255532, 'z': '5th'}, {'x': 86.5, 'y': 115.9031127, 'z': '10th'},
-    {'x': 86.5, 'y': 119.1235313, 'z': '25th'}, {'x': 86.5, 'y': 122.827864, 'z': '50th'},
-    {'x': 86.5, 'y': 126.6706308, 'z': '75th'}, {'x': 86.5, 'y': 130.2526047, 'z': '90th'},
-    {'x': 86.5, 'y': 132.4541587, 'z': '95th'}, {'x': 86.5, 'y': 133.9077383, 'z': '97th'},
-    {'x': 87.5, 'y': 113.2963432, 'z': '3rd'}, {'x': 87.5, 'y': 114.5031216, 'z': '5th'},
-    {'x': 87.5, 'y': 116.391262, 'z': '10th'}, {'x': 87.5, 'y': 119.6293, 'z': '25th'},
-    {'x': 87.5, 'y': 123.3530652, 'z': '50th'}, {'x': 87.5, 'y': 127.2150383, 'z': '75th'},
-    {'x': 87.5, 'y': 130.8140342, 'z': '90th'}, {'x': 87.5, 'y': 133.025626, 'z': '95th'},
-    {'x': 87.5, 'y': 134.4856552, 'z': '97th'}, {'x': 88.5, 'y': 113.7615336, 'z': '3rd'},
-    {'x': 88.5, 'y': 114.9752341, 'z': '5th'}, {'x': 88.5, 'y': 116.874002, 'z': '10th'},
-    {'x': 88.5, 'y': 120.1296849, 'z': '25th'}, {'x': 88.5, 'y': 123.8728276, 'z': '50th'},
-    {'x': 88.5, 'y': 127.7538545, 'z': '75th'}, {'x': 88.5, 'y': 131.3696436, 'z': '90th'},
-    {'x': 88.5, 'y': 133.5910912, 'z': '95th'}, {'x': 88.5, 'y': 135.0574328, 'z': '97th'},
-    {'x': 89.5, 'y': 114.2211014, 'z': '3rd'}, {'x': 89.5, 'y': 115.4417656, 'z': '5th'},
-    {'x': 89.5, 'y': 117.351208, 'z': '10th'}, {'x': 89.5, 'y': 120.6245654, 'z': '25th'},
-    {'x': 89.5, 'y': 124.38704, 'z': '50th'}, {'x': 89.5, 'y': 128.2869845, 'z': '75th'},
-    {'x': 89.5, 'y': 131.9193587, 'z': '90th'}, {'x': 89.5, 'y': 134.150496, 'z': '95th'},
-    {'x': 89.5, 'y': 135.6230245, 'z': '97th'}, {'x': 90.5, 'y': 114.674938, 'z': '3rd'},
-    {'x': 90.5, 'y': 115.9026074, 'z': '5th'}, {'x': 90.5, 'y': 117.8227724, 'z': '10th'},
-    {'x': 90.5, 'y': 121.113839, 'z': '25th'}, {'x': 90.5, 'y': 124.8956114, 'z': '50th'},
-    {'x': 90.5, 'y': 128.8143555, 'z': '75th'}, {'x': 90.5, 'y': 132.4631302, 'z': '90th'},
-    {'x': 90.5, 'y': 134.7038082, 'z': '95th'}, {'x': 90.5, 'y': 136.1824107, 'z': '97th'},
-    {'x': 91.5, 'y': 115.1229513, 'z': '3rd'}, {'x': 91.5, 'y': 116.3576679, 'z': '5th'},
-    {'x': 91.5, 'y': 118.2886054, 'z': '10th'}, {'x': 91.5, 'y': 121.5974226, 'z': '25th'},
-    {'x': 91.5, 'y': 125.398472, 'z': '50th'}, {'x': 91.5, 'y': 129.3359181, 'z': '75th'},
-    {'x': 91.5, 'y': 133.000934, 'z': '90th'}, {'x': 91.5, 'y': 135.2510227, 'z': '95th'},
-    {'x': 91.5, 'y': 136.7356, 'z': '97th'}, {'x': 92.5, 'y': 115.5650666, 'z': '3rd'},
-    {'x': 92.5, 'y': 116.8068731, 'z': '5th'}, {'x': 92.5, 'y': 118.7486357, 'z': '10th'},
-    {'x': 92.5, 'y': 122.0752529, 'z': '25th'}, {'x': 92.5, 'y': 125.895574, 'z': '50th'},
-    {'x': 92.5, 'y': 129.8516474, 'z': '75th'}, {'x': 92.5, 'y': 133.5327731, 'z': '90th'},
-    {'x': 92.5, 'y': 135.7921628, 'z': '95th'}, {'x': 92.5, 'y': 137.2826306, 'z': '97th'},
-    {'x': 93.5, 'y': 116.001227, 'z': '3rd'}, {'x': 93.5, 'y': 117.2501678, 'z': '5th'},
-    {'x': 93.5, 'y': 119.2028114, 'z': '10th'}, {'x': 93.5, 'y': 122.5472882, 'z': '25th'},
-    {'x': 93.5, 'y': 126.3868929, 'z': '50th'}, {'x': 93.5, 'y': 130.3615441, 'z': '75th'},
-    {'x': 93.5, 'y': 134.0586782, 'z': '90th'}, {'x': 93.5, 'y': 136.3272809, 'z': '95th'},
-    {'x': 93.5, 'y': 137.8235707, 'z': '97th'}, {'x': 94.5, 'y': 116.4313942, 'z': '3rd'},
-    {'x': 94.5, 'y': 117.6875155, 'z': '5th'}, {'x': 94.5, 'y': 119.651101, 'z': '10th'},
-    {'x': 94.5, 'y': 123.0135084, 'z': '25th'}, {'x': 94.5, 'y': 126.8724284, 'z': '50th'},
-    {'x': 94.5, 'y': 130.8656354, 'z': '75th'}, {'x': 94.5, 'y': 134.5787089, 'z': '90th'},
-    {'x': 94.5, 'y': 136.8564598, 'z': '95th'}, {'x': 94.5, 'y': 138.3585197, 'z': '97th'},
-    {'x': 95.5, 'y': 116.8555488, 'z': '3rd'}, {'x': 95.5, 'y': 118.1188998, 'z': '5th'},
-    {'x': 95.5, 'y': 120.0934937, 'z': '10th'}, {'x': 95.5, 'y': 123.4739166, 'z': '25th'},
-    {'x': 95.5, 'y': 127.3522056, 'z': '50th'}, {'x': 95.5, 'y': 131.3639763, 'z': '75th'},
-    {'x': 95.5, 'y': 135.0929548, 'z': '90th'}, {'x': 95.5, 'y': 137.3798137, 'z': '95th'},
-    {'x': 95.5, 'y': 138.8876092, 'z': '97th'}, {'x': 96.5, 'y': 117.2736916, 'z': '3rd'},
-    {'x': 96.5, 'y': 118.5443251, 'z': '5th'}, {'x': 96.5, 'y': 120.5300007, 'z': '10th'},
-    {'x': 96.5, 'y': 123.92854, 'z': '25th'}, {'x': 96.5, 'y': 127.8262759, 'z': '50th'},
-    {'x': 96.5, 'y': 131.8566506, 'z': '75th'}, {'x': 96.5, 'y': 135.6015364, 'z': '90th'},
-    {'x': 96.5, 'y': 137.8974887, 'z': '95th'}, {'x': 96.5, 'y': 139.411004, 'z': '97th'},
-    {'x': 97.5, 'y': 117.6858437, 'z': '3rd'}, {'x': 97.5, 'y': 118.9638171, 'z': '5th'},
-    {'x': 97.5, 'y': 120.9606563, 'z': '10th'}, {'x': 97.5, 'y': 124.3774309, 'z': '25th'},
-    {'x': 97.5, 'y': 128.2947187, 'z': '50th'}, {'x': 97.5, 'y': 132.3437724, 'z': '75th'},
-    {'x': 97.5, 'y': 136.1046066, 'z': '90th'}, {'x': 97.5, 'y': 138.4096645, 'z': '95th'},
-    {'x': 97.5, 'y': 139.9289024, 'z': '97th'}, {'x': 98.5, 'y': 118.092048, 'z': '3rd'},
-    {'x': 98.5, 'y': 119.3774239, 'z': '5th'}, {'x': 98.5, 'y': 121.3855185, 'z': '10th'},
-    {'x': 98.5, 'y': 124.8206679, 'z': '25th'}, {'x': 98.5, 'y': 128.757642, 'z': '50th'},
-    {'x': 98.5, 'y': 132.8254867, 'z': '75th'}, {'x': 98.5, 'y': 136.602351, 'z': '90th'},
-    {'x': 98.5, 'y': 138.9165546, 'z': '95th'}, {'x': 98.5, 'y': 140.4415378, 'z': '97th'},
-    {'x': 99.5, 'y': 118.4923693, 'z': '3rd'}, {'x': 99.5, 'y': 119.7852171, 'z': '5th'},
-    {'x': 99.5, 'y': 121.8046703, 'z': '10th'}, {'x': 99.5, 'y': 125.2583572, 'z': '25th'},
-    {'x': 99.5, 'y': 129.2151839, 'z': '50th'}, {'x': 99.5, 'y': 133.3019713, 'z': '75th'},
-    {'x': 99.5, 'y': 137.0949894, 'z': '90th'}, {'x': 99.5, 'y': 139.4184075, 'z': '95th'},
-    {'x': 99.5, 'y': 140.9491785, 'z': '97th'}, {'x': 100.5, 'y': 118.8868959, 'z': '3rd'},
-    {'x': 100.5, 'y': 120.1872927, 'z': '5th'}, {'x': 100.5, 'y': 122.2182208, 'z': '10th'},
-    {'x': 100.5, 'y': 125.6906338, 'z': '25th'}, {'x': 100.5, 'y': 129.6675143, 'z': '50th'},
-    {'x': 100.5, 'y': 133.7734371, 'z': '75th'}, {'x': 100.5, 'y': 137.5827768, 'z': '90th'},
-    {'x': 100.5, 'y': 139.9155075, 'z': '95th'}, {'x': 100.5, 'y': 141.4521292, 'z': '97th'},
-    {'x': 101.5, 'y': 119.2757403, 'z': '3rd'}, {'x': 101.5, 'y': 120.5837721, 'z': '5th'},
-    {'x': 101.5, 'y': 122.6263066, 'z': '10th'}, {'x': 101.5, 'y': 126.1176628, 'z': '25th'},
-    {'x': 101.5, 'y': 130.1148354, 'z': '50th'}, {'x': 101.5, 'y': 134.2401302, 'z': '75th'},
-    {'x': 101.5, 'y': 138.0660041, 'z': '90th'}, {'x': 101.5, 'y': 140.4081749, 'z': '95th'},
-    {'x': 101.5, 'y': 141.9507308, 'z': '97th'}, {'x': 102.5, 'y': 119.6590402, 'z': '3rd'},
-    {'x': 102.5, 'y': 120.9748035, 'z': '5th'}, {'x': 102.5, 'y': 123.029093, 'z': '10th'},
-    {'x': 102.5, 'y': 126.5396411, 'z': '25th'}, {'x': 102.5, 'y': 130.5573839, 'z': '50th'},
-    {'x': 102.5, 'y': 134.7023324, 'z': '75th'}, {'x': 102.5, 'y': 138.5449986, 'z': '90th'},
-    {'x': 102.5, 'y': 140.8967672, 'z': '95th'}, {'x': 102.5, 'y': 142.4453609, 'z': '97th'},
-    {'x': 103.5, 'y': 120.0369603, 'z': '3rd'}, {'x': 103.5, 'y': 121.3605632, 'z': '5th'},
-    {'x': 103.5, 'y': 123.4267753, 'z': '10th'}, {'x': 103.5, 'y': 126.9567984, 'z': '25th'},
-    {'x': 103.5, 'y': 130.995432, 'z': '50th'}, {'x': 103.5, 'y': 135.1603626, 'z': '75th'},
-    {'x': 103.5, 'y': 139.0201256, 'z': '90th'}, {'x': 103.5, 'y': 141.3816789, 'z': '95th'},
-    {'x': 103.5, 'y': 142.936434, 'z': '97th'}, {'x': 104.5, 'y': 120.4096928, 'z': '3rd'},
-    {'x': 104.5, 'y': 121.7412571, 'z': '5th'}, {'x': 104.5, 'y': 123.8195805, 'z': '10th'},
-    {'x': 104.5, 'y': 127.3693994, 'z': '25th'}, {'x': 104.5, 'y': 131.4292887, 'z': '50th'},
-    {'x': 104.5, 'y': 135.6145777, 'z': '75th'}, {'x': 104.5, 'y': 139.4917879, 'z': '90th'},
-    {'x': 104.5, 'y': 141.8633417, 'z': '95th'}, {'x': 104.5, 'y': 143.4244013, 'z': '97th'},
-    {'x': 105.5, 'y': 120.7774598, 'z': '3rd'}, {'x': 105.5, 'y': 122.1171219, 'z': '5th'},
-    {'x': 105.5, 'y': 124.2077692, 'z': '10th'}, {'x': 105.5, 'y': 127.7777448, 'z': '25th'},
-    {'x': 105.5, 'y': 131.8593015, 'z': '50th'}, {'x': 105.5, 'y': 136.0653737, 'z': '75th'},
-    {'x': 105.5, 'y': 139.9604267, 'z': '90th'}, {'x': 105.5, 'y': 142.3422248, 'z': '95th'},
-    {'x': 105.5, 'y': 143.9097502, 'z': '97th'}, {'x': 106.5, 'y': 121.140514, 'z': '3rd'},
-    {'x': 106.5, 'y': 122.4884272, 'z': '5th'}, {'x': 106.5, 'y': 124.5916364, 'z': '10th'},
-    {'x': 106.5, 'y': 128.1821733, 'z': '25th'}, {'x': 106.5, 'y': 132.2858574, 'z': '50th'},
-    {'x': 106.5, 'y': 136.5131864, 'z': '75th'}, {'x': 106.5, 'y': 140.4265216, 'z': '90th'},
-    {'x': 106.5, 'y': 142.818834, 'z': '95th'}, {'x': 106.5, 'y': 144.3930034, 'z': '97th'},
-    {'x': 107.5, 'y': 121.4991408, 'z': '3rd'}, {'x': 107.5, 'y': 122.8554769, 'z': '5th'},
-    {'x': 107.5, 'y': 124.9715143, 'z': '10th'}, {'x': 107.5, 'y': 128.5830629, 'z': '25th'},
-    {'x': 107.5, 'y': 132.7093845, 'z': '50th'}, {'x': 107.5, 'y': 136.9584917, 'z': '75th'},
-    {'x': 107.5, 'y': 140.8905903, 'z': '90th'}, {'x': 107.5, 'y': 143.2937108, 'z': '95th'},
-    {'x': 107.5, 'y': 144.8747179, 'z': '97th'}, {'x': 108.5, 'y': 121.8536605, 'z': '3rd'},
-    {'x': 108.5, 'y': 123.2186111, 'z': '5th'}, {'x': 108.5, 'y': 125.3477734, 'z': '10th'},
-    {'x': 108.5, 'y': 128.9808329, 'z': '25th'}, {'x': 108.5, 'y': 133.1303527, 'z': '50th'},
-    {'x': 108.5, 'y': 137.4018066, 'z': '75th'}, {'x': 108.5, 'y': 141.3531879, 'z': '90th'},
-    {'x': 108.5, 'y': 143.7674316, 'z': '95th'}, {'x': 108.5, 'y': 145.3554829, 'z': '97th'},
-    {'x': 109.5, 'y': 122.2044292, 'z': '3rd'}, {'x': 109.5, 'y': 123.5782083, 'z': '5th'},
-    {'x': 109.5, 'y': 125.7208245, 'z': '10th'}, {'x': 109.5, 'y': 129.3759451, 'z': '25th'},
-    {'x': 109.5, 'y': 133.5492749, 'z': '50th'}, {'x': 109.5, 'y': 137.8436884, 'z': '75th'},
-    {'x': 109.5, 'y': 141.8149059, 'z': '90th'}, {'x': 109.5, 'y': 144.2406053, 'z': '95th'},
-    {'x': 109.5, 'y': 145.8359173, 'z': '97th'}, {'x': 110.5, 'y': 122.551842, 'z': '3rd'},
-    {'x': 110.5, 'y': 123.9346869, 'z': '5th'}, {'x': 110.5, 'y': 126.0911208, 'z': '10th'},
-    {'x': 110.5, 'y': 129.7689053, 'z': '25th'}, {'x': 110.5, 'y': 133.9667073, 'z': '50th'},
-    {'x': 110.5, 'y': 138.2847346, 'z': '75th'}, {'x': 110.5, 'y': 142.2763706, 'z': '90th'},
-    {'x': 110.5, 'y': 144.7138712, 'z': '95th'}, {'x': 110.5, 'y': 146.3166671, 'z': '97th'},
-    {'x': 111.5, 'y': 122.8963342, 'z': '3rd'}, {'x': 111.5, 'y': 124.2885075, 'z': '5th'},
-    {'x': 111.5, 'y': 126.4591593, 'z': '10th'}, {'x': 111.5, 'y': 130.1602643, 'z': '25th'},
-    {'x': 111.5, 'y': 134.3832499, 'z': '50th'}, {'x': 111.5, 'y': 138.7255822, 'z': '75th'},
-    {'x': 111.5, 'y': 142.7382405, 'z': '90th'}, {'x': 111.5, 'y': 145.1878952, 'z': '95th'},
-    {'x': 111.5, 'y': 146.798401, 'z': '97th'}, {'x': 112.5, 'y': 123.2383839, 'z': '3rd'},
-    {'x': 112.5, 'y': 124.6401749, 'z': '5th'}, {'x': 112.5, 'y': 126.8254825, 'z': '10th'},
-    {'x': 112.5, 'y': 130.5506193, 'z': '25th'}, {'x': 112.5, 'y': 134.7995463, 'z': '50th'},
-    {'x': 112.5, 'y': 139.1669053, 'z': '75th'}, {'x': 112.5, 'y': 143.2012034, 'z': '90th'},
-    {'x': 112.5, 'y': 145.6633664, 'z': '95th'}, {'x': 112.5, 'y': 147.2818057, 'z': '97th'},
-    {'x': 113.5, 'y': 123.5785142, 'z': '3rd'}, {'x': 113.5, 'y': 124.9902397, 'z': '5th'},
-    {'x': 113.5, 'y': 127.1906801, 'z': '10th'}, {'x': 113.5, 'y': 130.9406135, 'z': '25th'},
-    {'x': 113.5, 'y': 135.2162826, 'z': '50th'}, {'x': 113.5, 'y': 139.6094137, 'z': '75th'},
-    {'x': 113.5, 'y': 143.6659721, 'z': '90th'}, {'x': 113.5, 'y': 146.1409913, 'z': '95th'},
-    {'x': 113.5, 'y': 147.7675803, 'z': '97th'}, {'x': 114.5, 'y': 123.9172948, 'z': '3rd'},
-    {'x': 114.5, 'y': 125.3393004, 'z': '5th'}, {'x': 114.5, 'y': 127.5553896, 'z': '10th'},
-    {'x': 114.5, 'y': 131.330937, 'z': '25th'}, {'x': 114.5, 'y': 135.634186, 'z': '50th'},
-    {'x': 114.5, 'y': 140.0538485, 'z': '75th'}, {'x': 114.5, 'y': 144.1332799, 'z': '90th'},
-    {'x': 114.5, 'y': 146.6214882, 'z': '95th'}, {'x': 114.5, 'y': 148.2564292, 'z': '97th'},
-    {'x': 115.5, 'y': 124.2553446, 'z': '3rd'}, {'x': 115.5, 'y': 125.6880049, 'z': '5th'},
-    {'x': 115.5, 'y': 127.9202978, 'z': '10th'}, {'x': 115.5, 'y': 131.7223254, 'z': '25th'},
-    {'x': 115.5, 'y': 136.0540223, 'z': '50th'}, {'x': 115.5, 'y': 140.5009788, 'z': '75th'},
-    {'x': 115.5, 'y': 144.6038739, 'z': '90th'}, {'x': 115.5, 'y': 147.1055797, 'z': '95th'},
-    {'x': 115.5, 'y': 148.7490543, 'z': '97th'}, {'x': 116.5, 'y': 124.5933332, 'z': '3rd'},
-    {'x': 116.5, 'y': 126.0370512, 'z': '5th'}, {'x': 116.5, 'y': 128.2861404, 'z': '10th'},
-    {'x': 116.5, 'y': 132.1155587, 'z': '25th'}, {'x': 116.5, 'y': 136.4765925, 'z': '50th'},
-    {'x': 116.5, 'y': 140.9515953, 'z': '75th'}, {'x': 116.5, 'y': 145.0785079, 'z': '90th'},
-    {'x': 116.5, 'y': 147.5939843, 'z': '95th'}, {'x': 116.5, 'y': 149.2461456, 'z': '97th'},
-    {'x': 117.5, 'y': 124.9319822, 'z': '3rd'}, {'x': 117.5, 'y': 126.3871885, 'z': '5th'},
-    {'x': 117.5, 'y': 128.6537014, 'z': '10th'}, {'x': 117.5, 'y': 132.5114586, 'z': '25th'},
-    {'x': 117.5, 'y': 136.9027281, 'z': '50th'}, {'x': 117.5, 'y': 141.406504, 'z': '75th'},
-    {'x': 117.5, 'y': 145.5579335, 'z': '90th'}, {'x': 117.5, 'y': 148.0874065, 'z': '95th'},
-    {'x': 117.5, 'y': 149.7483713, 'z': '97th'}, {'x': 118.5, 'y': 125.2720662, 'z': '3rd'},
-    {'x': 118.5, 'y': 126.7392174, 'z': '5th'}, {'x': 118.5, 'y': 129.0238124, 'z': '10th'},
-    {'x': 118.5, 'y': 132.9108849, 'z': '25th'}, {'x': 118.5, 'y': 137.3332846, 'z': '50th'},
-    {'x': 118.5, 'y': 141.8665172, 'z': '75th'}, {'x': 118.5, 'y': 146.0428902, 'z': '90th'},
-    {'x': 118.5, 'y': 148.586526, 'z': '95th'}, {'x': 118.5, 'y': 150.2563656, 'z': '97th'},
-    {'x': 119.5, 'y': 125.6144133, 'z': '3rd'}, {'x': 119.5, 'y': 127.0939883, 'z': '5th'},
-    {'x': 119.5, 'y': 129.3973496, 'z': '10th'}, {'x': 119.5, 'y': 133.3147302, 'z': '25th'},
-    {'x': 119.5, 'y': 137.7691339, 'z': '50th'}, {'x': 119.5, 'y': 142.3324443, 'z': '75th'},
-    {'x': 119.5, 'y': 146.5340936, 'z': '90th'}, {'x': 119.5, 'y': 149.0919854, 'z': '95th'},
-    {'x': 119.5, 'y': 150.7707169, 'z': '97th'}, {'x': 120.5, 'y': 125.9599043, 'z': '3rd'},
-    {'x': 120.5, 'y': 127.4524005, 'z': '5th'}, {'x': 120.5, 'y': 129.7752299, 'z': '10th'},
-    {'x': 120.5, 'y': 133.7239135, 'z': '25th'}, {'x': 120.5, 'y': 138.2111552, 'z': '50th'},
-    {'x': 120.5, 'y': 142.8050794, 'z': '75th'}, {'x': 120.5, 'y': 147.0322225, 'z': '90th'},
-    {'x': 120.5, 'y': 149.6043767, 'z': '95th'}, {'x': 120.5, 'y': 151.2919534, 'z': '97th'},
-    {'x': 121.5, 'y': 126.3094709, 'z': '3rd'}, {'x': 121.5, 'y': 127.8153983, 'z': '5th'},
-    {'x': 121.5, 'y': 130.1584061, 'z': '10th'}, {'x': 121.5, 'y': 134.1393714, 'z': '25th'},
-    {'x': 121.5, 'y': 138.6602228, 'z': '50th'}, {'x': 121.5, 'y': 143.2851879, 'z': '75th'},
-    {'x': 121.5, 'y': 147.5379045, 'z': '90th'}, {'x': 121.5, 'y': 150.1242269, 'z': '95th'},
-    {'x': 121.5, 'y': 151.8205297, 'z': '97th'}, {'x': 122.5, 'y': 126.6640931, 'z': '3rd'},
-    {'x': 122.5, 'y': 128.1839668, 'z': '5th'}, {'x': 122.5, 'y': 130.5478595, 'z': '10th'},
-    {'x': 122.5, 'y': 134.5620476, 'z': '25th'}, {'x': 122.5, 'y': 139.1171933, 'z': '50th'},
-    {'x': 122.5, 'y': 143.7734919, 'z': '75th'}, {'x': 122.5, 'y': 148.0517004, 'z': '90th'},
-    {'x': 122.5, 'y': 150.6519828, 'z': '95th'}, {'x': 122.5, 'y': 152.3568114, 'z': '97th'},
-    {'x': 123.5, 'y': 127.0247941, 'z': '3rd'}, {'x': 123.5, 'y': 128.5591249, 'z': '5th'},
-    {'x': 123.5, 'y': 130.9445907, 'z': '10th'}, {'x': 123.5, 'y': 134.9928804, 'z': '25th'},
-    {'x': 123.5, 'y': 139.5828898, 'z': '50th'}, {'x': 123.5, 'y': 144.2706527, 'z': '75th'},
-    {'x': 123.5, 'y': 148.5740881, 'z': '90th'}, {'x': 123.5, 'y': 151.1879951, 'z': '95th'},
-    {'x': 123.5, 'y': 152.9010603, 'z': '97th'}, {'x': 124.5, 'y': 127.3926332, 'z': '3rd'},
-    {'x': 124.5, 'y': 128.9419168, 'z': '5th'}, {'x': 124.5, 'y': 131.3496084, 'z': '10th'},
-    {'x': 124.5, 'y': 135.4327874, 'z': '25th'}, {'x': 124.5, 'y': 140.0580848, 'z': '50th'},
-    {'x': 124.5, 'y': 144.7772534, 'z': '75th'}, {'x': 124.5, 'y': 149.1054445, 'z': '90th'},
-    {'x': 124.5, 'y': 151.7325029, 'z': '95th'}, {'x': 124.5, 'y': 153.4534201, 'z': '97th'},
-    {'x': 125.5, 'y': 127.7686986, 'z': '3rd'}, {'x': 125.5, 'y': 129.3334014, 'z': '5th'},
-    {'x': 125.5, 'y': 131.7639151, 'z': '10th'}, {'x': 125.5, 'y': 135.8826474, 'z': '25th'},
-    {'x': 125.5, 'y': 140.5434787, 'z': '50th'}, {'x': 125.5, 'y': 145.2937779, 'z': '75th'},
-    {'x': 125.5, 'y': 149.6460289, 'z': '90th'}, {'x': 125.5, 'y': 152.2856189, 'z': '95th'},
-    {'x': 125.5, 'y': 154.0139039, 'z': '97th'}, {'x': 126.5, 'y': 128.1540923, 'z': '3rd'},
-    {'x': 126.5, 'y': 129.7346372, 'z': '5th'}, {'x': 126.5, 'y': 132.1884911, 'z': '10th'},
-    {'x': 126.5, 'y': 136.3432832, 'z': '25th'}, {'x': 126.5, 'y': 141.0396832, 'z': '50th'},
-    {'x': 126.5, 'y': 145.8205935, 'z': '75th'}, {'x': 126.5, 'y': 150.1959657, 'z': '90th'},
-    {'x': 126.5, 'y': 152.8473131, 'z': '95th'}, {'x': 126.5, 'y': 154.5823786, 'z': '97th'},
-    {'x': 127.5, 'y': 128.5499184, 'z': '3rd'}, {'x': 127.5, 'y': 130.1466666, 'z': '5th'},
-    {'x': 127.5, 'y': 132.6242751, 'z': '10th'}, {'x': 127.5, 'y': 136.8154369, 'z': '25th'},
-    {'x': 127.5, 'y': 141.5471945, 'z': '50th'}, {'x': 127.5, 'y': 146.3579283, 'z': '75th'},
-    {'x': 127.5, 'y': 150.7552278, 'z': '90th'}, {'x': 127.5, 'y': 153.4174019, 'z': '95th'},
-    {'x': 127.5, 'y': 155.1585578, 'z': '97th'}, {'x': 128.5, 'y': 128.9572634, 'z': '3rd'},
-    {'x': 128.5, 'y': 130.5704957, 'z': '5th'}, {'x': 128.5, 'y': 133.072142, 'z': '10th'},
-    {'x': 128.5, 'y': 137.299748, 'z': '25th'}, {'x': 128.5, 'y': 142.0663731, 'z': '50th'},
-    {'x': 128.5, 'y': 146.9058529, 'z': '75th'}, {'x': 128.5, 'y': 151.3236226, 'z': '90th'},
-    {'x': 128.5, 'y': 153.9955367, 'z': '95th'}, {'x': 128.5, 'y': 155.741993, 'z': '97th'},
-    {'x': 129.5, 'y': 129.3771753, 'z': '3rd'}, {'x': 129.5, 'y': 131.0070717, 'z': '5th'},
-    {'x': 129.5, 'y': 133.5328789, 'z': '10th'}, {'x': 129.5, 'y': 137.7967284, 'z': '25th'},
-    {'x': 129.5, 'y': 142.59742, 'z': '50th'}, {'x': 129.5, 'y': 147.4642617, 'z': '75th'},
-    {'x': 129.5, 'y': 151.9007796, 'z': '90th'}, {'x': 129.5, 'y': 154.581196, 'z': '95th'},
-    {'x': 129.5, 'y': 156.3320686, 'z': '97th'}, {'x': 130.5, 'y': 129.8106385, 'z': '3rd'},
-    {'x': 130.5, 'y': 131.4572565, 'z': '5th'}, {'x': 130.5, 'y': 134.0071586, 'z': '10th'},
-    {'x': 130.5, 'y': 138.3067365, 'z': '25th'}, {'x': 130.5, 'y': 143.1403553, 'z': '50th'},
-    {'x': 130.5, 'y': 148.0328573, 'z': '75th'}, {'x': 130.5, 'y': 152.4861414, 'z': '90th'},
-    {'x': 130.5, 'y': 155.1736815, 'z': '95th'}, {'x': 130.5, 'y': 156.9280012, 'z': '97th'},
-    {'x': 131.5, 'y': 130.2585454, 'z': '3rd'}, {'x': 131.5, 'y': 131.9217986, 'z': '5th'},
-    {'x': 131.5, 'y': 134.4955119, 'z': '10th'}, {'x': 131.5, 'y': 138.8299523, 'z': '25th'},
-    {'x': 131.5, 'y': 143.6949981, 'z': '50th'}, {'x': 131.5, 'y': 148.6111378, 'z': '75th'},
-    {'x': 131.5, 'y': 153.0789588, 'z': '90th'}, {'x': 131.5, 'y': 155.7721177, 'z': '95th'},
-    {'x': 131.5, 'y': 157.5288429, 'z': '97th'}, {'x': 132.5, 'y': 130.7216652, 'z': '3rd'},
-    {'x': 132.5, 'y': 132.4013028, 'z': '5th'}, {'x': 132.5, 'y': 134.9982982, 'z': '10th'},
-    {'x': 132.5, 'y': 139.3663536, 'z': '25th'}, {'x': 132.5, 'y': 144.2609497, 'z': '50th'},
-    {'x': 132.5, 'y': 149.1983881, 'z': '75th'}, {'x': 132.5, 'y': 153.6782905, 'z': '90th'},
-    {'x': 132.5, 'y': 156.3754566, 'z': '95th'}, {'x': 132.5, 'y': 158.1334886, 'z': '97th'},
-    {'x': 133.5, 'y': 131.2006102, 'z': '3rd'}, {'x': 133.5, 'y': 132.8961979, 'z': '5th'},
-    {'x': 133.5, 'y': 135.5156778, 'z': '10th'}, {'x': 133.5, 'y': 139.9156938, 'z': '25th'},
-    {'x': 133.5, 'y': 144.8375809, 'z': '50th'}, {'x': 133.5, 'y': 149.7936767, 'z': '75th'},
-    {'x': 133.5, 'y': 154.2830074, 'z': '90th'}, {'x': 133.5, 'y': 156.9824866, 'z': '95th'},
-    {'x': 133.5, 'y': 158.740688, 'z': '97th'}, {'x': 134.5, 'y': 131.6958014, 'z': '3rd'},
-    {'x': 134.5, 'y': 133.4067049, 'z': '5th'}, {'x': 134.5, 'y': 136.0475846, 'z': '10th'},
-    {'x': 134.5, 'y': 140.4774848, 'z': '25th'}, {'x': 134.5, 'y': 145.4240246, 'z': '50th'},
-    {'x': 134.5, 'y': 150.3958583, 'z': '75th'}, {'x': 134.5, 'y': 154.8918033, 'z': '90th'},
-    {'x': 134.5, 'y': 157.591847, 'z': '95th'}, {'x': 134.5, 'y': 159.3490618, 'z': '97th'},
-    {'x': 135.5, 'y': 132.2074327, 'z': '3rd'}, {'x': 135.5, 'y': 133.9328066, 'z': '5th'},
-    {'x': 135.5, 'y': 136.5937022, 'z': '10th'}, {'x': 135.5, 'y': 141.0509836, 'z': '25th'},
-    {'x': 135.5, 'y': 146.0191748, 'z': '50th'}, {'x': 135.5, 'y': 151.0035823, 'z': '75th'},
-    {'x': 135.5, 'y': 155.5032105, 'z': '90th'}, {'x': 135.5, 'y': 158.2020466, 'z': '95th'},
-    {'x': 135.5, 'y': 159.9571223, 'z': '97th'}, {'x': 136.5, 'y': 132.7354383, 'z': '3rd'},
-    {'x': 136.5, 'y': 134.4742195, 'z': '5th'}, {'x': 136.5, 'y': 137.1534445, 'z': '10th'},
-    {'x': 136.5, 'y': 141.6351863, 'z': '25th'}, {'x': 136.5, 'y': 146.621692, 'z': '50th'},
-    {'x': 136.5, 'y': 151.6153083, 'z': '75th'}, {'x': 136.5, 'y': 156.1156207, 'z': '90th'},
-    {'x': 136.5, 'y': 158.8114866, 'z': '95th'}, {'x': 136.5, 'y': 160.5632969, 'z': '97th'},
-    {'x': 137.5, 'y': 133.2794613, 'z': '3rd'}, {'x': 137.5, 'y': 135.0303699, 'z': '5th'},
-    {'x': 137.5, 'y': 137.7259419, 'z': '10th'}, {'x': 137.5, 'y': 142.228829, 'z': '25th'},
-    {'x': 137.5, 'y': 147.2300177, 'z': '50th'}, {'x': 137.5, 'y': 152.2293288, 'z': '75th'},
-    {'x': 137.5, 'y': 156.7273114, 'z': '90th'}, {'x': 137.5, 'y': 159.4184879, 'z': '95th'},
-    {'x': 137.5, 'y': 161.1659545, 'z': '97th'}, {'x': 138.5, 'y': 133.8388331, 'z': '3rd'},
-    {'x': 138.5, 'y': 135.6003795, 'z': '5th'}, {'x': 138.5, 'y': 138.3100351, 'z': '10th'},
-    {'x': 138.5, 'y': 142.8303943, 'z': '25th'}, {'x': 138.5, 'y': 147.8423918, 'z': '50th'},
-    {'x': 138.5, 'y': 152.8437944, 'z': '75th'}, {'x': 138.5, 'y': 157.336476, 'z': '90th'},
-    {'x': 138.5, 'y': 160.0213216, 'z': '95th'}, {'x': 138.5, 'y': 161.7634371, 'z': '97th'},
-    {'x': 139.5, 'y': 134.4125492, 'z': '3rd'}, {'x': 139.5, 'y': 136.1830524, 'z': '5th'},
-    {'x': 139.5, 'y': 138.9042785, 'z': '10th'}, {'x': 139.5, 'y': 143.4381342, 'z': '25th'},
-    {'x': 139.5, 'y': 148.4568879, 'z': '50th'}, {'x': 139.5, 'y': 153.4567526, 'z': '75th'},
-    {'x': 139.5, 'y': 157.9412574, 'z': '90th'}, {'x': 139.5, 'y': 160.6182378, 'z': '95th'},
-    {'x': 139.5, 'y': 162.3540831, 'z': '97th'}, {'x': 140.5, 'y': 134.9992687, 'z': '3rd'},
-    {'x': 140.5, 'y': 136.7768804, 'z': '5th'}, {'x': 140.5, 'y': 139.5069517, 'z': '10th'},
-    {'x': 140.5, 'y': 144.0500909, 'z': '25th'}, {'x': 140.5, 'y': 149.0714413, 'z': '50th'},
-    {'x': 140.5, 'y': 154.0661803, 'z': '75th'}, {'x': 140.5, 'y': 158.5397832, 'z': '90th'},
-    {'x': 140.5, 'y': 161.2075007, 'z': '95th'}, {'x': 140.5, 'y': 162.9362629, 'z': '97th'},
-    {'x': 141.5, 'y': 135.5973139, 'z': '3rd'}, {'x': 141.5, 'y': 137.3800519, 'z': '5th'},
-    {'x': 141.5, 'y': 140.1160824, 'z': '10th'}, {'x': 141.5, 'y': 144.6641345, 'z': '25th'},
-    {'x': 141.5, 'y': 149.6838943, 'z': '50th'}, {'x': 141.5, 'y': 154.6700274, 'z': '75th'},
-    {'x': 141.5, 'y': 159.1302018, 'z': '90th'}, {'x': 141.5, 'y': 161.7874182, 'z': '95th'},
-    {'x': 141.5, 'y': 163.5084028, 'z': '97th'}, {'x': 142.5, 'y': 136.2046931, 'z': '3rd'},
-    {'x': 142.5, 'y': 137.9904798, 'z': '5th'}, {'x': 142.5, 'y': 140.7294775, 'z': '10th'},
-    {'x': 142.5, 'y': 145.2779986, 'z': '25th'}, {'x': 142.5, 'y': 150.2920328, 'z': '50th'},
-    {'x': 142.5, 'y': 155.2662534, 'z': '75th'}, {'x': 142.5, 'y': 159.710717, 'z': '90th'},
-    {'x': 142.5, 'y': 162.3563754, 'z': '95th'}, {'x': 142.5, 'y': 164.0690181, 'z': '97th'},
-    {'x': 143.5, 'y': 136.8191174, 'z': '3rd'}, {'x': 143.5, 'y': 138.6058289, 'z': '5th'},
-    {'x': 143.5, 'y': 141.3447662, 'z': '10th'}, {'x': 143.5, 'y': 145.8893375, 'z': '25th'},
-    {'x': 143.5, 'y': 150.8936469, 'z': '50th'}, {'x': 143.5, 'y': 155.8528786, 'z': '75th'},
-    {'x': 143.5, 'y': 160.2796226, 'z': '90th'}, {'x': 143.5, 'y': 162.9128551, 'z': '95th'},
-    {'x': 143.5, 'y': 164.6167234, 'z': '97th'}, {'x': 144.5, 'y': 137.4380555, 'z': '3rd'},
-    {'x': 144.5, 'y': 139.2235689, 'z': '5th'}, {'x': 144.5, 'y': 141.9594471, 'z': '10th'},
-    {'x': 144.5, 'y': 146.4957662, 'z': '25th'}, {'x': 144.5, 'y': 151.4865636, 'z': '50th'},
-    {'x': 144.5, 'y': 156.4280126, 'z': '75th'}, {'x': 144.5, 'y': 160.8353311, 'z': '90th'},
-    {'x': 144.5, 'y': 163.4554684, 'z': '95th'}, {'x': 144.5, 'y': 165.1502647, 'z': '97th'},
-    {'x': 145.5, 'y': 138.0587804, 'z': '3rd'}, {'x': 145.5, 'y': 139.8410247, 'z': '5th'},
-    {'x': 145.5, 'y': 142.5709442, 'z': '10th'}, {'x': 145.5, 'y': 147.0949169, 'z': '25th'},
-    {'x': 145.5, 'y': 152.0686985, 'z': '50th'}, {'x': 145.5, 'y': 156.9898953, 'z': '75th'},
-    {'x': 145.5, 'y': 161.3763995, 'z': '90th'}, {'x': 145.5, 'y': 163.9829705, 'z': '95th'},
-    {'x': 145.5, 'y': 165.6685285, 'z': '97th'}, {'x': 146.5, 'y': 138.6784334, 'z': '3rd'},
-    {'x': 146.5, 'y': 140.4554388, 'z': '5th'}, {'x': 146.5, 'y': 143.1766639, 'z': '10th'},
-    {'x': 146.5, 'y': 147.6844892, 'z': '25th'}, {'x': 146.5, 'y': 152.6380955, 'z': '50th'},
-    {'x': 146.5, 'y': 157.5369262, 'z': '75th'}, {'x': 146.5, 'y': 161.9015501, 'z': '90th'},
-    {'x': 146.5, 'y': 164.4942764, 'z': '95th'}, {'x': 146.5, 'y': 166.1705539, 'z': '97th'},
-    {'x': 147.5, 'y': 139.2940935, 'z': '3rd'}, {'x': 147.5, 'y': 141.064036, 'z': '5th'},
-    {'x': 147.5, 'y': 143.7740547, 'z': '10th'}, {'x': 147.5, 'y': 148.2622979, 'z': '25th'},
-    {'x': 147.5, 'y': 153.1929631, 'z': '50th'}, {'x': 147.5, 'y': 158.0676887, 'z': '75th'},
-    {'x': 147.5, 'y': 162.4096857, 'z': '90th'}, {'x': 147.5, 'y': 164.9884705, 'z': '95th'},
-    {'x': 147.5, 'y': 166.6555396, 'z': '97th'}, {'x': 148.5, 'y': 139.902849, 'z': '3rd'},
-    {'x': 148.5, 'y': 141.6640898, 'z': '5th'}, {'x': 148.5, 'y': 144.3606631, 'z': '10th'},
-    {'x': 148.5, 'y': 148.8263158, 'z': '25th'}, {'x': 148.5, 'y': 153.7317031, 'z': '50th'},
-    {'x': 148.5, 'y': 158.5809683, 'z': '75th'}, {'x': 148.5, 'y': 162.8998985, 'z': '90th'},
-    {'x': 148.5, 'y': 165.4648118, 'z': '95th'}, {'x': 148.5, 'y': 167.1228459, 'z': '97th'},
-    {'x': 149.5, 'y': 140.5018697, 'z': '3rd'}, {'x': 149.5, 'y': 142.2529855, 'z': '5th'},
-    {'x': 149.5, 'y': 144.9341866, 'z': '10th'}, {'x': 149.5, 'y': 149.3747099, 'z': '25th'},
-    {'x': 149.5, 'y': 154.2529332, 'z': '50th'}, {'x': 149.5, 'y': 159.0757636, 'z': '75th'},
-    {'x': 149.5, 'y': 163.3714746, 'z': '90th'}, {'x': 149.5, 'y': 165.9227345, 'z': '95th'},
-    {'x': 149.5, 'y': 167.5719943, 'z': '97th'}, {'x': 150.5, 'y': 141.0884738, 'z': '3rd'},
-    {'x': 150.5, 'y': 142.8282787, 'z': '5th'}, {'x': 150.5, 'y': 145.4925187, 'z': '10th'},
-    {'x': 150.5, 'y': 149.9058698, 'z': '25th'}, {'x': 150.5, 'y': 154.755501, 'z': '50th'},
-    {'x': 150.5, 'y': 159.5512908, 'z': '75th'}, {'x': 150.5, 'y': 163.8238923, 'z': '90th'},
-    {'x': 150.5, 'y': 166.3618445, 'z': '95th'}, {'x': 150.5, 'y': 168.0026622, 'z': '97th'},
-    {'x': 151.5, 'y': 141.6601883, 'z': '3rd'}, {'x': 151.5, 'y': 143.3877452, 'z': '5th'},
-    {'x': 151.5, 'y': 146.0337866, 'z': '10th'}, {'x': 151.5, 'y': 150.4184277, 'z': '25th'},
-    {'x': 151.5, 'y': 155.2384904, 'z': '50th'}, {'x': 151.5, 'y': 160.006982, 'z': '75th'},
-    {'x': 151.5, 'y': 164.2568163, 'z': '90th'}, {'x': 151.5, 'y': 166.7819123, 'z': '95th'},
-    {'x': 151.5, 'y': 168.4146759, 'z': '97th'}, {'x': 152.5, 'y': 142.2147984, 'z': '3rd'},
-    {'x': 152.5, 'y': 143.9294218, 'z': '5th'}, {'x': 152.5, 'y': 146.5563788, 'z': '10th'},
-    {'x': 152.5, 'y': 150.9112703, 'z': '25th'}, {'x': 152.5, 'y': 155.7012216, 'z': '50th'},
-    {'x': 152.5, 'y': 160.4424774, 'z': '75th'}, {'x': 152.5, 'y': 164.6700879, 'z': '90th'},
-    {'x': 152.5, 'y': 167.1828627, 'z': '95th'}, {'x': 152.5, 'y': 168.8080012, 'z': '97th'},
-    {'x': 153.5, 'y': 142.7503859, 'z': '3rd'}, {'x': 153.5, 'y': 144.4516354, 'z': '5th'},
-    {'x': 153.5, 'y': 147.0589626, 'z': '10th'}, {'x': 153.5, 'y': 151.3835413, 'z': '25th'},
-    {'x': 153.5, 'y': 156.1432438, 'z': '50th'}, {'x': 153.5, 'y': 160.8576139, 'z': '75th'},
-    {'x': 153.5, 'y': 165.0637118, 'z': '90th'}, {'x': 153.5, 'y': 167.5647631, 'z': '95th'},
-    {'x': 153.5, 'y': 169.1827317, 'z': '97th'}, {'x': 154.5, 'y': 143.2653544, 'z': '3rd'},
-    {'x': 154.5, 'y': 144.9530205, 'z': '5th'}, {'x': 154.5, 'y': 147.5404925, 'z': '10th'},
-    {'x': 154.5, 'y': 151.8346381, 'z': '25th'}, {'x': 154.5, 'y': 156.564323, 'z': '50th'},
-    {'x': 154.5, 'y': 161.252409, 'z': '75th'}, {'x': 154.5, 'y': 165.4378408, 'z': '90th'},
-    {'x': 154.5, 'y': 167.9278093, 'z': '95th'}, {'x': 154.5, 'y': 169.5390766, 'z': '97th'},
-    {'x': 155.5, 'y': 143.7584411, 'z': '3rd'}, {'x': 155.5, 'y': 145.4325259, 'z': '5th'},
-    {'x': 155.5, 'y': 148.0002085, 'z': '10th'}, {'x': 155.5, 'y': 152.2642007, 'z': '25th'},
-    {'x': 155.5, 'y': 156.9644258, 'z': '50th'}, {'x': 155.5, 'y': 161.6270427, 'z': '75th'},
-    {'x': 155.5, 'y': 165.7927589, 'z': '90th'}, {'x': 155.5, 'y': 168.2723104, 'z': '95th'},
-    {'x': 155.5, 'y': 169.8773471, 'z': '97th'}, {'x': 156.5, 'y': 144.2287179, 'z': '3rd'},
-    {'x': 156.5, 'y': 145.8894106, 'z': '5th'}, {'x': 156.5, 'y': 148.437627, 'z': '10th'},
-    {'x': 156.5, 'y': 152.6720956, 'z': '25th'}, {'x': 156.5, 'y': 157.3436995, 'z': '50th'},
-    {'x': 156.5, 'y': 161.9818377, 'z': '75th'}, {'x': 156.5, 'y': 166.1288638, 'z': '90th'},
-    {'x': 156.5, 'y': 168.5986736, 'z': '95th'}, {'x': 156.5, 'y': 170.1979436, 'z': '97th'},
-    {'x': 157.5, 'y': 144.6755805, 'z': '3rd'}, {'x': 157.5, 'y': 146.3232308, 'z': '5th'},
-    {'x': 157.5, 'y': 148.8525242, 'z': '10th'}, {'x': 157.5, 'y': 153.0583966, 'z': '25th'},
-    {'x': 157.5, 'y': 157.7024507, 'z': '50th'}, {'x': 157.5, 'y': 162.317239, 'z': '75th'},
-    {'x': 157.5, 'y': 166.4466488, 'z': '90th'}, {'x': 157.5, 'y': 168.9073892, 'z': '95th'},
-    {'x': 157.5, 'y': 170.5013414, 'z': '97th'}, {'x': 158.5, 'y': 145.0987292, 'z': '3rd'},
-    {'x': 158.5, 'y': 146.7338197, 'z': '5th'}, {'x': 158.5, 'y': 149.2449147, 'z': '10th'},
-    {'x': 158.5, 'y': 153.4233611, 'z': '25th'}, {'x': 158.5, 'y': 158.0411233, 'z': '50th'},
-    {'x': 158.5, 'y': 162.633793, 'z': '75th'}, {'x': 158.5, 'y': 166.7466859, 'z': '90th'},
-    {'x': 158.5, 'y': 169.1990151, 'z': '95th'}, {'x': 158.5, 'y': 170.7880784, 'z': '97th'},
-    {'x': 159.5, 'y': 145.4981426, 'z': '3rd'}, {'x': 159.5, 'y': 147.1212613, 'z': '5th'},
-    {'x': 159.5, 'y': 149.6150259, 'z': '10th'}, {'x': 159.5, 'y': 153.7674066, 'z': '25th'},
-    {'x': 159.5, 'y': 158.3602756, 'z': '50th'}, {'x': 159.5, 'y': 162.9321282, 'z': '75th'},
-    {'x': 159.5, 'y': 167.0296087, 'z': '90th'}, {'x': 159.5, 'y': 169.474163, 'z': '95th'},
-    {'x': 159.5, 'y': 171.0587419, 'z': '97th'}, {'x': 160.5, 'y': 145.8740473, 'z': '3rd'},
-    {'x': 160.5, 'y': 147.4858611, 'z': '5th'}, {'x': 160.5, 'y': 149.9632704, 'z': '10th'},
-    {'x': 160.5, 'y': 154.0910856, 'z': '25th'}, {'x': 160.5, 'y': 158.6605588, 'z': '50th'},
-    {'x': 160.5, 'y': 163.2129368, 'z': '75th'}, {'x': 160.5, 'y': 167.2960978, 'z': '90th'},
-    {'x': 160.5, 'y': 169.7334849, 'z': '95th'}, {'x': 160.5, 'y': 171.3139575, 'z': '97th'},
-    {'x': 161.5, 'y': 146.2268836, 'z': '3rd'}, {'x': 161.5, 'y': 147.8281145, 'z': '5th'},
-    {'x': 161.5, 'y': 150.2902174, 'z': '10th'}, {'x': 161.5, 'y': 154.3950608, 'z': '25th'},
-    {'x': 161.5, 'y': 158.9426964, 'z': '50th'}, {'x': 161.5, 'y': 163.476957, 'z': '75th'},
-    {'x': 161.5, 'y': 167.5468664, 'z': '90th'}, {'x': 161.5, 'y': 169.9776618, 'z': '95th'},
-    {'x': 161.5, 'y': 171.5543778, 'z': '97th'}, {'x': 162.5, 'y': 146.5572714, 'z': '3rd'},
-    {'x': 162.5, 'y': 148.148675, 'z': '5th'}, {'x': 162.5, 'y': 150.5965645, 'z': '10th'},
-    {'x': 162.5, 'y': 154.6800825, 'z': '25th'}, {'x': 162.5, 'y': 159.2074654, 'z': '50th'},
-    {'x': 162.5, 'y': 163.7249588, 'z': '75th'}, {'x': 162.5, 'y': 167.7826481, 'z': '90th'},
-    {'x': 162.5, 'y': 170.207392, 'z': '95th'}, {'x': 162.5, 'y': 171.780673, 'z': '97th'},
-    {'x': 163.5, 'y': 146.8659759, 'z': '3rd'}, {'x': 163.5, 'y': 148.4483225, 'z': '5th'},
-    {'x': 163.5, 'y': 150.8831097, 'z': '10th'}, {'x': 163.5, 'y': 154.9469659, 'z': '25th'},
-    {'x': 163.5, 'y': 159.455679, 'z': '50th'}, {'x': 163.5, 'y': 163.9577297, 'z': '75th'},
-    {'x': 163.5, 'y': 168.0041861, 'z': '90th'}, {'x': 163.5, 'y': 170.4233822, 'z': '95th'},
-    {'x': 163.5, 'y': 171.9935219, 'z': '97th'}, {'x': 164.5, 'y': 147.1538752, 'z': '3rd'},
-    {'x': 164.5, 'y': 148.7279342, 'z': '5th'}, {'x': 164.5, 'y': 151.1507267, 'z': '10th'},
-    {'x': 164.5, 'y': 155.1965718, 'z': '25th'}, {'x': 164.5, 'y': 159.688172, 'z': '50th'},
-    {'x': 164.5, 'y': 164.1760637, 'z': '75th'}, {'x': 164.5, 'y': 168.2122241, 'z': '90th'},
-    {'x': 164.5, 'y': 170.6263392, 'z': '95th'}, {'x': 164.5, 'y': 172.1936047, 'z': '97th'},
-    {'x': 165.5, 'y': 147.4219304, 'z': '3rd'}, {'x': 165.5, 'y': 148.9884574, 'z': '5th'},
-    {'x': 165.5, 'y': 151.4003414, 'z': '10th'}, {'x': 165.5, 'y': 155.4297888, 'z': '25th'},
-    {'x': 165.5, 'y': 159.9057871, 'z': '50th'}, {'x': 165.5, 'y': 164.3807514, 'z': '75th'},
-    {'x': 165.5, 'y': 168.4074983, 'z': '90th'}, {'x': 165.5, 'y': 170.8169629, 'z': '95th'},
-    {'x': 165.5, 'y': 172.3815959, 'z': '97th'}, {'x': 166.5, 'y': 147.6711585, 'z': '3rd'},
-    {'x': 166.5, 'y': 149.2308852, 'z': '5th'}, {'x': 166.5, 'y': 151.6329115, 'z': '10th'},
-    {'x': 166.5, 'y': 155.6475179, 'z': '25th'}, {'x': 166.5, 'y': 160.1093647, 'z': '50th'},
-    {'x': 166.5, 'y': 164.572572, 'z': '75th'}, {'x': 166.5, 'y': 168.5907313, 'z': '90th'},
-    {'x': 166.5, 'y': 170.9959407, 'z': '95th'}, {'x': 166.5, 'y': 172.5581591, 'z': '97th'},
-    {'x': 167.5, 'y': 147.902609, 'z': '3rd'}, {'x': 167.5, 'y': 149.4562355, 'z': '5th'},
-    {'x': 167.5, 'y': 151.8494087, 'z': '10th'}, {'x': 167.5, 'y': 155.8506598, 'z': '25th'},
-    {'x': 167.5, 'y': 160.299733, 'z': '50th'}, {'x': 167.5, 'y': 164.7522868, 'z': '75th'},
-    {'x': 167.5, 'y': 168.7626268, 'z': '90th'}, {'x': 167.5, 'y': 171.1639423, 'z': '95th'},
-    {'x': 167.5, 'y': 172.7239426, 'z': '97th'}, {'x': 168.5, 'y': 148.1173446, 'z': '3rd'},
-    {'x': 168.5, 'y': 149.6655332, 'z': '5th'}, {'x': 168.5, 'y': 152.0508033, 'z': '10th'},
-    {'x': 168.5, 'y': 156.0401024, 'z': '25th'}, {'x': 168.5, 'y': 160.4776996, 'z': '50th'},
-    {'x': 168.5, 'y': 164.920633, 'z': '75th'}, {'x': 168.5, 'y': 168.9238654, 'z': '90th'},
-    {'x': 168.5, 'y': 171.3216174, 'z': '95th'}, {'x': 168.5, 'y': 172.8795764, 'z': '97th'},
-    {'x': 169.5, 'y': 148.3164186, 'z': '3rd'}, {'x': 169.5, 'y': 149.8597926, 'z': '5th'},
-    {'x': 169.5, 'y': 152.238053, 'z': '10th'}, {'x': 169.5, 'y': 156.2167175, 'z': '25th'},
-    {'x': 169.5, 'y': 160.6440526, 'z': '50th'}, {'x': 169.5, 'y': 165.0783248, 'z': '75th'},
-    {'x': 169.5, 'y': 169.0751026, 'z': '90th'}, {'x': 169.5, 'y': 171.469589, 'z': '95th'},
-    {'x': 169.5, 'y': 173.0256638, 'z': '97th'}, {'x': 170.5, 'y': 148.5008727, 'z': '3rd'},
-    {'x': 170.5, 'y': 150.0400107, 'z': '5th'}, {'x': 170.5, 'y': 152.4120911, 'z': '10th'},
-    {'x': 170.5, 'y': 156.3813442, 'z': '25th'}, {'x': 170.5, 'y': 160.7995428, 'z': '50th'},
-    {'x': 170.5, 'y': 165.2260411, 'z': '75th'}, {'x': 170.5, 'y': 169.2169651, 'z': '90th'},
-    {'x': 170.5, 'y': 171.6084579, 'z': '95th'}, {'x': 170.5, 'y': 173.1627906, 'z': '97th'},
-    {'x': 171.5, 'y': 148.6717163, 'z': '3rd'}, {'x': 171.5, 'y': 150.2071532, 'z': '5th'},
-    {'x': 171.5, 'y': 152.5738202, 'z': '10th'}, {'x': 171.5, 'y': 156.5347914, 'z': '25th'},
-    {'x': 171.5, 'y': 160.9448916, 'z': '50th'}, {'x': 171.5, 'y': 165.3644316, 'z': '75th'},
-    {'x': 171.5, 'y': 169.3500504, 'z': '90th'}, {'x': 171.5, 'y': 171.7387957, 'z': '95th'},
-    {'x': 171.5, 'y': 173.2915138, 'z': '97th'}, {'x': 172.5, 'y': 148.8299213, 'z': '3rd'},
-    {'x': 172.5, 'y': 150.3621482, 'z': '5th'}, {'x': 172.5, 'y': 152.7241057, 'z': '10th'},
-    {'x': 172.5, 'y': 156.6778321, 'z': '25th'}, {'x': 172.5, 'y': 161.0807857, 'z': '50th'},
-    {'x': 172.5, 'y': 165.4941133, 'z': '75th'}, {'x': 172.5, 'y': 169.4749261, 'z': '90th'},
-    {'x': 172.5, 'y': 171.8611461, 'z': '95th'}, {'x': 172.5, 'y': 173.4123635, 'z': '97th'},
-    {'x': 173.5, 'y': 148.976416, 'z': '3rd'}, {'x': 173.5, 'y': 150.5058813, 'z': '5th'},
-    {'x': 173.5, 'y': 152.8637721, 'z': '10th'}, {'x': 173.5, 'y': 156.8112003, 'z': '25th'},
-    {'x': 173.5, 'y': 161.2078755, 'z': '50th'}, {'x': 173.5, 'y': 165.6156697, 'z': '75th'},
-    {'x': 173.5, 'y': 169.5921291, 'z': '90th'}, {'x': 173.5, 'y': 171.9760242, 'z': '95th'},
-    {'x': 173.5, 'y': 173.5258431, 'z': '97th'}, {'x': 174.5, 'y': 149.1120814, 'z': '3rd'},
-    {'x': 174.5, 'y': 150.6391923, 'z': '5th'}, {'x': 174.5, 'y': 152.9936001, 'z': '10th'},
-    {'x': 174.5, 'y': 156.9355896, 'z': '25th'}, {'x': 174.5, 'y': 161.3267744, 'z': '50th'},
-    {'x': 174.5, 'y': 165.7296508, 'z': '75th'}, {'x': 174.5, 'y': 169.7021662, 'z': '90th'},
-    {'x': 174.5, 'y': 172.0839168, 'z': '95th'}, {'x': 174.5, 'y': 173.6324287, 'z': '97th'},
-    {'x': 175.5, 'y': 149.2377485, 'z': '3rd'}, {'x': 175.5, 'y': 150.7628729, 'z': '5th'},
-    {'x': 175.5, 'y': 153.1143251, 'z': '10th'}, {'x': 175.5, 'y': 157.0516529, 'z': '25th'},
-    {'x': 175.5, 'y': 161.4380593, 'z': '50th'}, {'x': 175.5, 'y': 165.8365737, 'z': '75th'},
-    {'x': 175.5, 'y': 169.8055142, 'z': '90th'}, {'x': 175.5, 'y': 172.1852824, 'z': '95th'},
-    {'x': 175.5, 'y': 173.7325694, 'z': '97th'}, {'x': 176.5, 'y': 149.3541954, 'z': '3rd'},
-    {'x': 176.5, 'y': 150.877665, 'z': '5th'}, {'x': 176.5, 'y': 153.2266371, 'z': '10th'},
-    {'x': 176.5, 'y': 157.1600033, 'z': '25th'}, {'x': 176.5, 'y': 161.5422726, 'z': '50th'},
-    {'x': 176.5, 'y': 165.9369248, 'z': '75th'}, {'x': 176.5, 'y': 169.9026209, 'z': '90th'},
-    {'x': 176.5, 'y': 172.2805514, 'z': '95th'}, {'x': 176.5, 'y': 173.8266863, 'z': '97th'},
-    {'x': 177.5, 'y': 149.4621532, 'z': '3rd'}, {'x': 177.5, 'y': 150.9842639, 'z': '5th'},
-    {'x': 177.5, 'y': 153.3311804, 'z': '10th'}, {'x': 177.5, 'y': 157.2612106, 'z': '25th'},
-    {'x': 177.5, 'y': 161.639917, 'z': '50th'}, {'x': 177.5, 'y': 166.0311556, 'z': '75th'},
-    {'x': 177.5, 'y': 169.9939056, 'z': '90th'}, {'x': 177.5, 'y': 172.3701297, 'z': '95th'},
-    {'x': 177.5, 'y': 173.9151788, 'z': '97th'}, {'x': 178.5, 'y': 149.5622993, 'z': '3rd'},
-    {'x': 178.5, 'y': 151.0833153, 'z': '5th'}, {'x': 178.5, 'y': 153.4285552, 'z': '10th'},
-    {'x': 178.5, 'y': 157.3558081, 'z': '25th'}, {'x': 178.5, 'y': 161.7314645, 'z': '50th'},
-    {'x': 178.5, 'y': 166.1196904, 'z': '75th'}, {'x': 178.5, 'y': 170.0797608, 'z': '90th'},
-    {'x': 178.5, 'y': 172.4543957, 'z': '95th'}, {'x': 178.5, 'y': 173.9984185, 'z': '97th'},
-    {'x': 179.5, 'y': 149.6552628, 'z': '3rd'}, {'x': 179.5, 'y': 151.1754186, 'z': '5th'},
-    {'x': 179.5, 'y': 153.5193185, 'z': '10th'}, {'x': 179.5, 'y': 157.4442908, 'z': '25th'},
-    {'x': 179.5, 'y': 161.8173534, 'z': '50th'}, {'x': 179.5, 'y': 166.202924, 'z': '75th'},
-    {'x': 179.5, 'y': 170.160553, 'z': '90th'}, {'x': 179.5, 'y': 172.5337038, 'z': '95th'},
-    {'x': 179.5, 'y': 174.0767538, 'z': '97th'}, {'x': 180.5, 'y': 149.7416255, 'z': '3rd'},
-    {'x': 180.5, 'y': 151.2611287, 'z': '5th'}, {'x': 180.5, 'y': 153.6039864, 'z': '10th'},
-    {'x': 180.5, 'y': 157.5271178, 'z': '25th'}, {'x': 180.5, 'y': 161.8979913, 'z': '50th'},
-    {'x': 180.5, 'y': 166.281224, 'z': '75th'}, {'x': 180.5, 'y': 170.236624, 'z': '90th'},
-    {'x': 180.5, 'y': 172.6083849, 'z': '95th'}, {'x': 180.5, 'y': 174.1505102, 'z': '97th'},
-    {'x': 181.5, 'y': 149.8219242, 'z': '3rd'}, {'x': 181.5, 'y': 151.3409575, 'z': '5th'},
-    {'x': 181.5, 'y': 153.6830356, 'z': '10th'}, {'x': 181.5, 'y': 157.6047139, 'z': '25th'},
-    {'x': 181.5, 'y': 161.9737558, 'z': '50th'}, {'x': 181.5, 'y': 166.3549321, 'z': '75th'},
-    {'x': 181.5, 'y': 170.3082921, 'z': '90th'}, {'x': 181.5, 'y': 172.6787478, 'z': '95th'},
-    {'x': 181.5, 'y': 174.2199918, 'z': '97th'}, {'x': 182.5, 'y': 149.8966533, 'z': '3rd'},
-    {'x': 182.5, 'y': 151.415377, 'z': '5th'}, {'x': 182.5, 'y': 153.7569057, 'z': '10th'},
-    {'x': 182.5, 'y': 157.6774719, 'z': '25th'}, {'x': 182.5, 'y': 162.0449969, 'z': '50th'},
-    {'x': 182.5, 'y': 166.4243655, 'z': '75th'}, {'x': 182.5, 'y': 170.3758539, 'z': '90th'},
-    {'x': 182.5, 'y': 172.7450799, 'z': '95th'}, {'x': 182.5, 'y': 174.2854819, 'z': '97th'},
-    {'x': 183.5, 'y': 149.9662668, 'z': '3rd'}, {'x': 183.5, 'y': 151.4848208, 'z': '5th'},
-    {'x': 183.5, 'y': 153.8260015, 'z': '10th'}, {'x': 183.5, 'y': 157.7457539, 'z': '25th'},
-    {'x': 183.5, 'y': 162.1120386, 'z': '50th'}, {'x': 183.5, 'y': 166.4898188, 'z': '75th'},
-    {'x': 183.5, 'y': 170.4395847, 'z': '90th'}, {'x': 183.5, 'y': 172.8076491, 'z': '95th'},
-    {'x': 183.5, 'y': 174.3472447, 'z': '97th'}, {'x': 184.5, 'y': 150.0311812, 'z': '3rd'},
-    {'x': 184.5, 'y': 151.5496874, 'z': '5th'}, {'x': 184.5, 'y': 153.8906954, 'z': '10th'},
-    {'x': 184.5, 'y': 157.809894, 'z': '25th'}, {'x': 184.5, 'y': 162.17518, 'z': '50th'},
-    {'x': 184.5, 'y': 166.5515647, 'z': '75th'}, {'x': 184.5, 'y': 170.4997408, 'z': '90th'},
-    {'x': 184.5, 'y': 172.8667045, 'z': '95th'}, {'x': 184.5, 'y': 174.405526, 'z': '97th'},
-    {'x': 185.5, 'y': 150.0917784, 'z': '3rd'}, {'x': 185.5, 'y': 151.610342, 'z': '5th'},
-    {'x': 185.5, 'y': 153.951329, 'z': '10th'}, {'x': 185.5, 'y': 157.8701998, 'z': '25th'},
-    {'x': 185.5, 'y': 162.2346979, 'z': '50th'}, {'x': 185.5, 'y': 166.6098562, 'z': '75th'},
-    {'x': 185.5, 'y': 170.5565599, 'z': '90th'}, {'x': 185.5, 'y': 172.9224777, 'z': '95th'},
-    {'x': 185.5, 'y': 174.4605545, 'z': '97th'}, {'x': 186.5, 'y': 150.1484074, 'z': '3rd'},
-    {'x': 186.5, 'y': 151.6671193, 'z': '5th'}, {'x': 186.5, 'y': 154.0082162, 'z': '10th'},
-    {'x': 186.5, 'y': 157.9269542, 'z': '25th'}, {'x': 186.5, 'y': 162.2908474, 'z': '50th'},
-    {'x': 186.5, 'y': 166.6649274, 'z': '75th'}, {'x': 186.5, 'y': 170.6102627, 'z': '90th'},
-    {'x': 186.5, 'y': 172.9751838, 'z': '95th'}, {'x': 186.5, 'y': 174.5125428, 'z': '97th'},
-    {'x': 187.5, 'y': 150.2013879, 'z': '3rd'}, {'x': 187.5, 'y': 151.7203255, 'z': '5th'},
-    {'x': 187.5, 'y': 154.0616446, 'z': '10th'}, {'x': 187.5, 'y': 157.9804176, 'z': '25th'},
-    {'x': 187.5, 'y': 162.343864, 'z': '50th'}, {'x': 187.5, 'y': 166.7169951, 'z': '75th'},
-    {'x': 187.5, 'y': 170.6610542, 'z': '90th'}, {'x': 187.5, 'y': 173.025023, 'z': '95th'},
-    {'x': 187.5, 'y': 174.5616886, 'z': '97th'}, {'x': 188.5, 'y': 150.2510113, 'z': '3rd'},
-    {'x': 188.5, 'y': 151.7702407, 'z': '5th'}, {'x': 188.5, 'y': 154.1118775, 'z': '10th'},
-    {'x': 188.5, 'y': 158.0308292, 'z': '25th'}, {'x': 188.5, 'y': 162.3939652, 'z': '50th'},
-    {'x': 188.5, 'y': 166.7662599, 'z': '75th'}, {'x': 188.5, 'y': 170.7091243, 'z': '90th'},
-    {'x': 188.5, 'y': 173.0721808, 'z': '95th'}, {'x': 188.5, 'y': 174.6081757, 'z': '97th'},
-    {'x': 189.5, 'y': 150.2975443, 'z': '3rd'}, {'x': 189.5, 'y': 151.8171212, 'z': '5th'},
-    {'x': 189.5, 'y': 154.1591564, 'z': '10th'}, {'x': 189.5, 'y': 158.0784088, 'z': '25th'},
-    {'x': 189.5, 'y': 162.4413513, 'z': '50th'}, {'x': 189.5, 'y': 166.8129074, 'z': '75th'},
-    {'x': 189.5, 'y': 170.7546494, 'z': '90th'}, {'x': 189.5, 'y': 173.1168298, 'z': '95th'},
-    {'x': 189.5, 'y': 174.6521747, 'z': '97th'}, {'x': 190.5, 'y': 150.3412298, 'z': '3rd'},
-    {'x': 190.5, 'y': 151.8612008, 'z': '5th'}, {'x': 190.5, 'y': 154.2037023, 'z': '10th'},
-    {'x': 190.5, 'y': 158.1233583, 'z': '25th'}, {'x': 190.5, 'y': 162.4862071, 'z': '50th'},
-    {'x': 190.5, 'y': 166.8571093, 'z': '75th'}, {'x': 190.5, 'y': 170.7977929, 'z': '90th'},
-    {'x': 190.5, 'y': 173.1591301, 'z': '95th'}, {'x': 190.5, 'y': 174.6938442, 'z': '97th'},
-    {'x': 191.5, 'y': 150.3822898, 'z': '3rd'}, {'x': 191.5, 'y': 151.9026934, 'z': '5th'},
-    {'x': 191.5, 'y': 154.2457175, 'z': '10th'}, {'x': 191.5, 'y': 158.1658633, 'z': '25th'},
-    {'x': 191.5, 'y': 162.5287029, 'z': '50th'}, {'x': 191.5, 'y': 166.8990246, 'z': '75th'},
-    {'x': 191.5, 'y': 170.8387064, 'z': '90th'}, {'x': 191.5, 'y': 173.1992303, 'z': '95th'},
-    {'x': 191.5, 'y': 174.7333314, 'z': '97th'}, {'x': 192.5, 'y': 150.4209266, 'z': '3rd'},
-    {'x': 192.5, 'y': 151.9417942, 'z': '5th'}, {'x': 192.5, 'y': 154.2853872, 'z': '10th'},
-    {'x': 192.5, 'y': 158.2060942, 'z': '25th'}, {'x': 192.5, 'y': 162.5689958, 'z': '50th'},
-    {'x': 192.5, 'y': 166.9388003, 'z': '75th'}, {'x': 192.5, 'y': 170.8775306, 'z': '90th'},
-    {'x': 192.5, 'y': 173.2372685, 'z': '95th'}, {'x': 192.5, 'y': 174.7707732, 'z': '97th'},
-    {'x': 193.5, 'y': 150.4573249, 'z': '3rd'}, {'x': 193.5, 'y': 151.9786817, 'z': '5th'},
-    {'x': 193.5, 'y': 154.3228809, 'z': '10th'}, {'x': 193.5, 'y': 158.2442076, 'z': '25th'},
-    {'x': 193.5, 'y': 162.6072309, 'z': '50th'}, {'x': 193.5, 'y': 166.9765723, 'z': '75th'},
-    {'x': 193.5, 'y': 170.914396, 'z': '90th'}, {'x': 193.5, 'y': 173.2733728, 'z': '95th'},
-    {'x': 193.5, 'y': 174.8062967, 'z': '97th'}, {'x': 194.5, 'y': 150.4916531, 'z': '3rd'},
-    {'x': 194.5, 'y': 152.013519, 'z': '5th'}, {'x': 194.5, 'y': 154.3583538, 'z': '10th'},
-    {'x': 194.5, 'y': 158.2803474, 'z': '25th'}, {'x': 194.5, 'y': 162.6435418, 'z': '50th'},
-    {'x': 194.5, 'y': 167.0124668, 'z': '75th'}, {'x': 194.5, 'y': 170.9494236, 'z': '90th'},
-    {'x': 194.5, 'y': 173.3076624, 'z': '95th'}, {'x': 194.5, 'y': 174.8400201, 'z': '97th'},
-    {'x': 195.5, 'y': 150.524065, 'z': '3rd'}, {'x': 195.5, 'y': 152.0464549, 'z': '5th'},
-    {'x': 195.5, 'y': 154.3919483, 'z': '10th'}, {'x': 195.5, 'y': 158.3146459, 'z': '25th'},
-    {'x': 195.5, 'y': 162.6780519, 'z': '50th'}, {'x': 195.5, 'y': 167.0466004, 'z': '75th'},
-    {'x': 195.5, 'y': 170.9827258, 'z': '90th'}, {'x': 195.5, 'y': 173.3402478, 'z': '95th'},
-    {'x': 195.5, 'y': 174.8720532, 'z': '97th'}, {'x': 196.5, 'y': 150.5547008, 'z': '3rd'},
-    {'x': 196.5, 'y': 152.0776257, 'z': '5th'}, {'x': 196.5, 'y': 154.4237944, 'z': '10th'},
-    {'x': 196.5, 'y': 158.3472249, 'z': '25th'}, {'x': 196.5, 'y': 162.7108751, 'z': '50th'},
-    {'x': 196.5, 'y': 167.0790811, 'z': '75th'}, {'x': 196.5, 'y': 171.014407, 'z': '90th'},
-    {'x': 196.5, 'y': 173.3712319, 'z': '95th'}, {'x': 196.5, 'y': 174.902498, 'z': '97th'},
-    {'x': 197.5, 'y': 150.5836887, 'z': '3rd'}, {'x': 197.5, 'y': 152.1071558, 'z': '5th'},
-    {'x': 197.5, 'y': 154.4540118, 'z': '10th'}, {'x': 197.5, 'y': 158.3781962, 'z': '25th'},
-    {'x': 197.5, 'y': 162.7421168, 'z': '50th'}, {'x': 197.5, 'y': 167.110009, 'z': '75th'},
-    {'x': 197.5, 'y': 171.0445641, 'z': '90th'}, {'x': 197.5, 'y': 173.4007102, 'z': '95th'},
-    {'x': 197.5, 'y': 174.9314494, 'z': '97th'}, {'x': 198.5, 'y': 150.6111457, 'z': '3rd'},
-    {'x': 198.5, 'y': 152.1351593, 'z': '5th'}, {'x': 198.5, 'y': 154.4827098, 'z': '10th'},
-    {'x': 198.5, 'y': 158.407663, 'z': '25th'}, {'x': 198.5, 'y': 162.7718741, 'z': '50th'},
-    {'x': 198.5, 'y': 167.1394771, 'z': '75th'}, {'x': 198.5, 'y': 171.0732871, 'z': '90th'},
-    {'x': 198.5, 'y': 173.4287717, 'z': '95th'}, {'x': 198.5, 'y': 174.9589959, 'z': '97th'},
-    {'x': 199.5, 'y': 150.6371789, 'z': '3rd'}, {'x': 199.5, 'y': 152.1617405, 'z': '5th'},
-    {'x': 199.5, 'y': 154.509989, 'z': '10th'}, {'x': 199.5, 'y': 158.4357202, 'z': '25th'},
-    {'x': 199.5, 'y': 162.8002371, 'z': '50th'}, {'x': 199.5, 'y': 167.1675715, 'z': '75th'},
-    {'x': 199.5, 'y': 171.1006598, 'z': '90th'}, {'x': 199.5, 'y': 173.455499, 'z': '95th'},
-    {'x': 199.5, 'y': 174.9852197, 'z': '97th'}, {'x': 200.5, 'y': 150.661886, 'z': '3rd'},
-    {'x': 200.5, 'y': 152.1869949, 'z': '5th'}, {'x': 200.5, 'y': 154.5359417, 'z': '10th'},
-    {'x': 200.5, 'y': 158.4624554, 'z': '25th'}, {'x': 200.5, 'y': 162.8272889, 'z': '50th'},
-    {'x': 200.5, 'y': 167.1943721, 'z': '75th'}, {'x': 200.5, 'y': 171.1267599, 'z': '90th'},
-    {'x': 200.5, 'y': 173.4809691, 'z': '95th'}, {'x': 200.5, 'y': 175.0101973, 'z': '97th'},
-    {'x': 201.5, 'y': 150.6853568, 'z': '3rd'}, {'x': 201.5, 'y': 152.2110102, 'z': '5th'},
-    {'x': 201.5, 'y': 154.5606528, 'z': '10th'}, {'x': 201.5, 'y': 158.4879492, 'z': '25th'},
-    {'x': 201.5, 'y': 162.8531067, 'z': '50th'}, {'x': 201.5, 'y': 167.2199532, 'z': '75th'},
-    {'x': 201.5, 'y': 171.1516601, 'z': '90th'}, {'x': 201.5, 'y': 173.5052538, 'z': '95th'},
-    {'x': 201.5, 'y': 175.034, 'z': '97th'}, {'x': 202.5, 'y': 150.7076733, 'z': '3rd'},
-    {'x': 202.5, 'y': 152.2338667, 'z': '5th'}, {'x': 202.5, 'y': 154.5842002, 'z': '10th'},
-    {'x': 202.5, 'y': 158.5122763, 'z': '25th'}, {'x': 202.5, 'y': 162.8777619, 'z': '50th'},
-    {'x': 202.5, 'y': 167.244384, 'z': '75th'}, {'x': 202.5, 'y': 171.1754277, 'z': '90th'},
-    {'x': 202.5, 'y': 173.5284198, 'z': '95th'}, {'x': 202.5, 'y': 175.0566944, 'z': '97th'},
-    {'x': 203.5, 'y': 150.7289106, 'z': '3rd'}, {'x': 203.5, 'y': 152.2556383, 'z': '5th'},
-    {'x': 203.5, 'y': 154.6066558, 'z': '10th'}, {'x': 203.5, 'y': 158.5355056, 'z': '25th'},
-    {'x': 203.5, 'y': 162.9013208, 'z': '50th'}, {'x': 203.5, 'y': 167.2677286, 'z': '75th'},
-    {'x': 203.5, 'y': 171.1981258, 'z': '90th'}, {'x': 203.5, 'y': 173.5505296, 'z': '95th'},
-    {'x': 203.5, 'y': 175.0783424, 'z': '97th'}, {'x': 204.5, 'y': 150.749138, 'z': '3rd'},
-    {'x': 204.5, 'y': 152.2763929, 'z': '5th'}, {'x': 204.5, 'y': 154.6280858, 'z': '10th'},
-    {'x': 204.5, 'y': 158.5577008, 'z': '25th'}, {'x': 204.5, 'y': 162.9238449, 'z': '50th'},
-    {'x': 204.5, 'y': 167.2900467, 'z': '75th'}, {'x': 204.5, 'y': 171.2198128, 'z': '90th'},
-    {'x': 204.5, 'y': 173.5716411, 'z': '95th'}, {'x': 204.5, 'y': 175.099002, 'z': '97th'},
-    {'x': 205.5, 'y': 150.7684187, 'z': '3rd'}, {'x': 205.5, 'y': 152.296193, 'z': '5th'},
-    {'x': 205.5, 'y': 154.6485512, 'z': '10th'}, {'x': 205.5, 'y': 158.578921, 'z': '25th'},
-    {'x': 205.5, 'y': 162.9453912, 'z': '50th'}, {'x': 205.5, 'y': 167.3113942, 'z': '75th'},
-    {'x': 205.5, 'y': 171.2405436, 'z': '90th'}, {'x': 205.5, 'y': 173.5918087, 'z': '95th'},
-    {'x': 205.5, 'y': 175.1187272, 'z': '97th'}, {'x': 206.5, 'y': 150.7868111, 'z': '3rd'},
-    {'x': 206.5, 'y': 152.3150959, 'z': '5th'}, {'x': 206.5, 'y': 154.6681084, 'z': '10th'},
-    {'x': 206.5, 'y': 158.5992207, 'z': '25th'}, {'x': 206.5, 'y': 162.9660131, 'z': '50th'},
-    {'x': 206.5, 'y': 167.3318229, 'z': '75th'}, {'x': 206.5, 'y': 171.2603693, 'z': '90th'},
-    {'x': 206.5, 'y': 173.6110831, 'z': '95th'}, {'x': 206.5, 'y': 175.1375685, 'z': '97th'},
-    {'x': 207.5, 'y': 150.8043689, 'z': '3rd'}, {'x': 207.5, 'y': 152.3331548, 'z': '5th'},
-    {'x': 207.5, 'y': 154.6868095, 'z': '10th'}, {'x': 207.5, 'y': 158.6186507, 'z': '25th'},
-    {'x': 207.5, 'y': 162.9857599, 'z': '50th'}, {'x': 207.5, 'y': 167.3513812, 'z': '75th'},
-    {'x': 207.5, 'y': 171.2793375, 'z': '90th'}, {'x': 207.5, 'y': 173.6295117, 'z': '95th'},
-    {'x': 207.5, 'y': 175.155573, 'z': '97th'}, {'x': 208.5, 'y': 150.8211416, 'z': '3rd'},
-    {'x': 208.5, 'y': 152.3504187, 'z': '5th'}, {'x': 208.5, 'y': 154.7047027, 'z': '10th'},
-    {'x': 208.5, 'y': 158.6372582, 'z': '25th'}, {'x': 208.5, 'y': 163.0046776, 'z': '50th'},
-    {'x': 208.5, 'y': 167.3701145, 'z': '75th'}, {'x': 208.5, 'y': 171.2974929, 'z': '90th'},
-    {'x': 208.5, 'y': 173.6471389, 'z': '95th'}, {'x': 208.5, 'y': 175.1727851, 'z': '97th'},
-    {'x': 209.5, 'y': 150.8371748, 'z': '3rd'}, {'x': 209.5, 'y': 152.3669327, 'z': '5th'},
-    {'x': 209.5, 'y': 154.7218327, 'z': '10th'}, {'x': 209.5, 'y': 158.6550869, 'z': '25th'},
-    {'x': 209.5, 'y': 163.0228094, 'z': '50th'}, {'x': 209.5, 'y': 167.388065, 'z': '75th'},
-    {'x': 209.5, 'y': 171.3148774, 'z': '90th'}, {'x': 209.5, 'y': 173.6640061, 'z': '95th'},
-    {'x': 209.5, 'y': 175.1892459, 'z': '97th'}, {'x': 210.5, 'y': 150.8525106, 'z': '3rd'},
-    {'x': 210.5, 'y': 152.3827387, 'z': '5th'}, {'x': 210.5, 'y': 154.7382408, 'z': '10th'},
-    {'x': 210.5, 'y': 158.6721776, 'z': '25th'}, {'x': 210.5, 'y': 163.0401953, 'z': '50th'},
-    {'x': 210.5, 'y': 167.4052723, 'z': '75th'}, {'x': 210.5, 'y': 171.33153, 'z': '90th'},
-    {'x': 210.5, 'y': 173.6801522, 'z': '95th'}, {'x': 210.5, 'y': 175.2049944, 'z': '97th'},
-    {'x': 211.5, 'y': 150.8671882, 'z': '3rd'}, {'x': 211.5, 'y': 152.3978755, 'z': '5th'},
-    {'x': 211.5, 'y': 154.7539655, 'z': '10th'}, {'x': 211.5, 'y': 158.6885682, 'z': '25th'},
-    {'x': 211.5, 'y': 163.0568727, 'z': '50th'}, {'x': 211.5, 'y': 167.4217734, 'z': '75th'},
-    {'x': 211.5, 'y': 171.3474874, 'z': '90th'}, {'x': 211.5, 'y': 173.6956138, 'z': '95th'},
-    {'x': 211.5, 'y': 175.2200667, 'z': '97th'}, {'x': 212.5, 'y': 150.8812435, 'z': '3rd'},
-    {'x': 212.5, 'y': 152.412379, 'z': '5th'}, {'x': 212.5, 'y': 154.7690427, 'z': '10th'},
-    {'x': 212.5, 'y': 158.7042942, 'z': '25th'}, {'x': 212.5, 'y': 163.0728768, 'z': '50th'},
-    {'x': 212.5, 'y': 167.437603, 'z': '75th'}, {'x': 212.5, 'y': 171.362784, 'z': '90th'},
-    {'x': 212.5, 'y': 173.710425, 'z': '95th'}, {'x': 212.5, 'y': 175.2344971, 'z': '97th'},
-    {'x': 213.5, 'y': 150.8947102, 'z': '3rd'}, {'x': 213.5, 'y': 152.4262827, 'z': '5th'},
-    {'x': 213.5, 'y': 154.7835054, 'z': '10th'}, {'x': 213.5, 'y': 158.7193886, 'z': '25th'},
-    {'x': 213.5, 'y': 163.0882404, 'z': '50th'}, {'x': 213.5, 'y': 167.4527938, 'z': '75th'},
-    {'x': 213.5, 'y': 171.3774521, 'z': '90th'}, {'x': 213.5, 'y': 173.7246179, 'z': '95th'},
-    {'x': 213.5, 'y': 175.2483174, 'z': '97th'}, {'x': 214.5, 'y': 150.9076191, 'z': '3rd'},
-    {'x': 214.5, 'y': 152.4396177, 'z': '5th'}, {'x': 214.5, 'y': 154.7973849, 'z': '10th'},
-    {'x': 214.5, 'y': 158.7338824, 'z': '25th'}, {'x': 214.5, 'y': 163.1029943, 'z': '50th'},
-    {'x': 214.5, 'y': 167.4673763, 'z': '75th'}, {'x': 214.5, 'y': 171.3915221, 'z': '90th'},
-    {'x': 214.5, 'y': 173.7382228, 'z': '95th'}, {'x': 214.5, 'y': 175.2615577, 'z': '97th'},
-    {'x': 215.5, 'y': 150.9199994, 'z': '3rd'}, {'x': 215.5, 'y': 152.4524128, 'z': '5th'},
-    {'x': 215.5, 'y': 154.81071, 'z': '10th'}, {'x': 215.5, 'y': 158.7478045, 'z': '25th'},
-    {'x': 215.5, 'y': 163.1171673, 'z': '50th'}, {'x': 215.5, 'y': 167.4813792, 'z': '75th'},
-    {'x': 215.5, 'y': 171.4050225, 'z': '90th'}, {'x': 215.5, 'y': 173.751268, 'z': '95th'},
-    {'x': 215.5, 'y': 175.2742464, 'z': '97th'}, {'x': 216.5, 'y': 150.9318778, 'z': '3rd'},
-    {'x': 216.5, 'y': 152.464695, 'z': '5th'}, {'x': 216.5, 'y': 154.8235077, 'z': '10th'},
-    {'x': 216.5, 'y': 158.7611821, 'z': '25th'}, {'x': 216.5, 'y': 163.1307866, 'z': '50th'},
-    {'x': 216.5, 'y': 167.4948296, 'z': '75th'}, {'x': 216.5, 'y': 171.4179802, 'z': '90th'},
-    {'x': 216.5, 'y': 173.7637802, 'z': '95th'}, {'x': 216.5, 'y': 175.2864101, 'z': '97th'},
-    {'x': 217.5, 'y': 150.9432795, 'z': '3rd'}, {'x': 217.5, 'y': 152.4764895, 'z': '5th'},
-    {'x': 217.5, 'y': 154.8358035, 'z': '10th'}, {'x': 217.5, 'y': 158.7740404, 'z': '25th'},
-    {'x': 217.5, 'y': 163.1438776, 'z': '50th'}, {'x': 217.5, 'y': 167.5077529, 'z': '75th'},
-    {'x': 217.5, 'y': 171.4304205, 'z': '90th'}, {'x': 217.5, 'y': 173.7757847, 'z': '95th'},
-    {'x': 217.5, 'y': 175.2980736, 'z': '97th'}, {'x': 218.5, 'y': 150.9542279, 'z': '3rd'},
-    {'x': 218.5, 'y': 152.4878198, 'z': '5th'}, {'x': 218.5, 'y': 154.8476208, 'z': '10th'},
-    {'x': 218.5, 'y': 158.7864036, 'z': '25th'}, {'x': 218.5, 'y': 163.1564644, 'z': '50th'},
-    {'x': 218.5, 'y': 167.520173, 'z': '75th'}, {'x': 218.5, 'y': 171.4423671, 'z': '90th'},
-    {'x': 218.5, 'y': 173.787305, 'z': '95th'}, {'x': 218.5, 'y': 175.3092608, 'z': '97th'},
-    {'x': 219.5, 'y': 150.9647448, 'z': '3rd'}, {'x': 219.5, 'y': 152.498708, 'z': '5th'},
-    {'x': 219.5, 'y': 154.8589821, 'z': '10th'}, {'x': 219.5, 'y': 158.798294, 'z': '25th'},
-    {'x': 219.5, 'y': 163.1685697, 'z': '50th'}, {'x': 219.5, 'y': 167.5321128, 'z': '75th'},
-    {'x': 219.5, 'y': 171.4538427, 'z': '90th'}, {'x': 219.5, 'y': 173.7983636, 'z': '95th'},
-    {'x': 219.5, 'y': 175.3199938, 'z': '97th'}, {'x': 220.5, 'y': 150.9748507, 'z': '3rd'},
-    {'x': 220.5, 'y': 152.5091747, 'z': '5th'}, {'x': 220.5, 'y': 154.8699082, 'z': '10th'},
-    {'x': 220.5, 'y': 158.8097328, 'z': '25th'}, {'x': 220.5, 'y': 163.1802146, 'z': '50th'},
-    {'x': 220.5, 'y': 167.5435933, 'z': '75th'}, {'x': 220.5, 'y': 171.4648684, 'z': '90th'},
-    {'x': 220.5, 'y': 173.8089816, 'z': '95th'}, {'x': 220.5, 'y': 175.3302936, 'z': '97th'},
-    {'x': 221.5, 'y': 150.9845649, 'z': '3rd'}, {'x': 221.5, 'y': 152.5192393, 'z': '5th'},
-    {'x': 221.5, 'y': 154.8804186, 'z': '10th'}, {'x': 221.5, 'y': 158.8207399, 'z': '25th'},
-    {'x': 221.5, 'y': 163.1914194, 'z': '50th'}, {'x': 221.5, 'y': 167.554635, 'z': '75th'},
-    {'x': 221.5, 'y': 171.4754644, 'z': '90th'}, {'x': 221.5, 'y': 173.8191789, 'z': '95th'},
-    {'x': 221.5, 'y': 175.3401801, 'z': '97th'}, {'x': 222.5, 'y': 150.9939053, 'z': '3rd'},
-    {'x': 222.5, 'y': 152.52892, 'z': '5th'}, {'x': 222.5, 'y': 154.8905318, 'z': '10th'},
-    {'x': 222.5, 'y': 158.8313341, 'z': '25th'}, {'x': 222.5, 'y': 163.202203, 'z': '50th'},
-    {'x': 222.5, 'y': 167.5652567, 'z': '75th'}, {'x': 222.5, 'y': 171.4856495, 'z': '90th'},
-    {'x': 222.5, 'y': 173.8289744, 'z': '95th'}, {'x': 222.5, 'y': 175.349672, 'z': '97th'},
-    {'x': 223.5, 'y': 151.0028889, 'z': '3rd'}, {'x': 223.5, 'y': 152.5382338, 'z': '5th'},
-    {'x': 223.5, 'y': 154.9002654, 'z': '10th'}, {'x': 223.5, 'y': 158.8415332, 'z': '25th'},
-    {'x': 223.5, 'y': 163.2125835, 'z': '50th'}, {'x': 223.5, 'y': 167.5754766, 'z': '75th'},
-    {'x': 223.5, 'y': 171.4954418, 'z': '90th'}, {'x': 223.5, 'y': 173.8383858, 'z': '95th'},
-    {'x': 223.5, 'y': 175.358787, 'z': '97th'}, {'x': 224.5, 'y': 151.0115315, 'z': '3rd'},
-    {'x': 224.5, 'y': 152.5471971, 'z': '5th'}, {'x': 224.5, 'y': 154.9096356, 'z': '10th'},
-    {'x': 224.5, 'y': 158.851354, 'z': '25th'}, {'x': 224.5, 'y': 163.2225779, 'z': '50th'},
-    {'x': 224.5, 'y': 167.5853118, 'z': '75th'}, {'x': 224.5, 'y': 171.5048583, 'z': '90th'},
-    {'x': 224.5, 'y': 173.8474302, 'z': '95th'}, {'x': 224.5, 'y': 175.367542, 'z': '97th'},
-    {'x': 225.5, 'y': 151.0198482, 'z': '3rd'}, {'x': 225.5, 'y': 152.5558248, 'z': '5th'},
-    {'x': 225.5, 'y': 154.9186579, 'z': '10th'}, {'x': 225.5, 'y': 158.8608124, 'z': '25th'},
-    {'x': 225.5, 'y': 163.2322024, 'z': '50th'}, {'x': 225.5, 'y': 167.5947785, 'z': '75th'},
-    {'x': 225.5, 'y': 171.5139151, 'z': '90th'}, {'x': 225.5, 'y': 173.8561235, 'z': '95th'},
-    {'x': 225.5, 'y': 175.3759527, 'z': '97th'}, {'x': 226.5, 'y': 151.0278532, 'z': '3rd'},
-    {'x': 226.5, 'y': 152.5641315, 'z': '5th'}, {'x': 226.5, 'y': 154.9273472, 'z': '10th'},
-    {'x': 226.5, 'y': 158.8699234, 'z': '25th'}, {'x': 226.5, 'y': 163.2414722, 'z': '50th'},
-    {'x': 226.5, 'y': 167.6038921, 'z': '75th'}, {'x': 226.5, 'y': 171.5226274, 'z': '90th'},
-    {'x': 226.5, 'y': 173.8644808, 'z': '95th'}, {'x': 226.5, 'y': 175.3840343, 'z': '97th'},
-    {'x': 227.5, 'y': 151.0355596, 'z': '3rd'}, {'x': 227.5, 'y': 152.5721307, 'z': '5th'},
-    {'x': 227.5, 'y': 154.9357171, 'z': '10th'}, {'x': 227.5, 'y': 158.8787012, 'z': '25th'},
-    {'x': 227.5, 'y': 163.2504019, 'z': '50th'}, {'x': 227.5, 'y': 167.6126671, 'z': '75th'},
-    {'x': 227.5, 'y': 171.5310098, 'z': '90th'}, {'x': 227.5, 'y': 173.8725166, 'z': '95th'},
-    {'x': 227.5, 'y': 175.391801, 'z': '97th'}, {'x': 228.5, 'y': 151.0429803, 'z': '3rd'},
-    {'x': 228.5, 'y': 152.5798353, 'z': '5th'}, {'x': 228.5, 'y': 154.9437809, 'z': '10th'},
-    {'x': 228.5, 'y': 158.8871595, 'z': '25th'}, {'x': 228.5, 'y': 163.2590052, 'z': '50th'},
-    {'x': 228.5, 'y': 167.6211174, 'z': '75th'}, {'x': 228.5, 'y': 171.5390761, 'z': '90th'},
-    {'x': 228.5, 'y': 173.8802445, 'z': '95th'}, {'x': 228.5, 'y': 175.3992664, 'z': '97th'},
-    {'x': 229.5, 'y': 151.0501271, 'z': '3rd'}, {'x': 229.5, 'y': 152.5872574, 'z': '5th'},
-    {'x': 229.5, 'y': 154.9515511, 'z': '10th'}, {'x': 229.5, 'y': 158.8953111, 'z': '25th'},
-    {'x': 229.5, 'y': 163.2672954, 'z': '50th'}, {'x': 229.5, 'y': 167.6292563, 'z': '75th'},
-    {'x': 229.5, 'y': 171.5468394, 'z': '90th'}, {'x': 229.5, 'y': 173.8876774, 'z': '95th'},
-    {'x': 229.5, 'y': 175.4064433, 'z': '97th'}, {'x': 230.5, 'y': 151.0570114, 'z': '3rd'},
-    {'x': 230.5, 'y': 152.5944085, 'z': '5th'}, {'x': 230.5, 'y': 154.9590395, 'z': '10th'},
-    {'x': 230.5, 'y': 158.9031682, 'z': '25th'}, {'x': 230.5, 'y': 163.2752848, 'z': '50th'},
-    {'x': 230.5, 'y': 167.6370963, 'z': '75th'}, {'x': 230.5, 'y': 171.5543121, 'z': '90th'},
-    {'x': 230.5, 'y': 173.8948277, 'z': '95th'}, {'x': 230.5, 'y': 175.4133439, 'z': '97th'},
-    {'x': 231.5, 'y': 151.0636438, 'z': '3rd'}, {'x': 231.5, 'y': 152.6012996, 'z': '5th'},
-    {'x': 231.5, 'y': 154.9662574, 'z': '10th'}, {'x': 231.5, 'y': 158.9107425, 'z': '25th'},
-    {'x': 231.5, 'y': 163.2829854, 'z': '50th'}, {'x': 231.5, 'y': 167.6446494, 'z': '75th'},
-    {'x': 231.5, 'y': 171.561506, 'z': '90th'}, {'x': 231.5, 'y': 173.9017071, 'z': '95th'},
-    {'x': 231.5, 'y': 175.4199799, 'z': '97th'}, {'x': 232.5, 'y': 151.0700346, 'z': '3rd'},
-    {'x': 232.5, 'y': 152.6079412, 'z': '5th'}, {'x': 232.5, 'y': 154.9732154, 'z': '10th'},
-    {'x': 232.5, 'y': 158.918045, 'z': '25th'}, {'x': 232.5, 'y': 163.2904086, 'z': '50th'},
-    {'x': 232.5, 'y': 167.6519269, 'z': '75th'}, {'x': 232.5, 'y': 171.5684326, 'z': '90th'},
-    {'x': 232.5, 'y': 173.9083268, 'z': '95th'}, {'x': 232.5, 'y': 175.4263623, 'z': '97th'},
-    {'x': 233.5, 'y': 151.0761934, 'z': '3rd'}, {'x': 233.5, 'y': 152.6143431, 'z': '5th'},
-    {'x': 233.5, 'y': 154.9799237, 'z': '10th'}, {'x': 233.5, 'y': 158.9250863, 'z': '25th'},
-    {'x': 233.5, 'y': 163.297565, 'z': '50th'}, {'x': 233.5, 'y': 167.6589397, 'z': '75th'},
-    {'x': 233.5, 'y': 171.5751024, 'z': '90th'}, {'x': 233.5, 'y': 173.9146973, 'z': '95th'},
-    {'x': 233.5, 'y': 175.4325015, 'z': '97th'}, {'x': 234.5, 'y': 151.0821295, 'z': '3rd'},
-    {'x': 234.5, 'y': 152.6205147, 'z': '5th'}, {'x': 234.5, 'y': 154.9863922, 'z': '10th'},
-    {'x': 234.5, 'y': 158.9318765, 'z': '25th'}, {'x': 234.5, 'y': 163.304465, 'z': '50th'},
-    {'x': 234.5, 'y': 167.6656981, 'z': '75th'}, {'x': 234.5, 'y': 171.5815258, 'z': '90th'},
-    {'x': 234.5, 'y': 173.9208289, 'z': '95th'}, {'x': 234.5, 'y': 175.4384076, 'z': '97th'},
-    {'x': 235.5, 'y': 151.0878515, 'z': '3rd'}, {'x': 235.5, 'y': 152.626465, 'z': '5th'},
-    {'x': 235.5, 'y': 154.9926299, 'z': '10th'}, {'x': 235.5, 'y': 158.9384252, 'z': '25th'},
-    {'x': 235.5, 'y': 163.3111185, 'z': '50th'}, {'x': 235.5, 'y': 167.6722121, 'z': '75th'},
-    {'x': 235.5, 'y': 171.5877126, 'z': '90th'}, {'x': 235.5, 'y': 173.9267311, 'z': '95th'},
-    {'x': 235.5, 'y': 175.4440902, 'z': '97th'}, {'x': 236.5, 'y': 151.0933679, 'z': '3rd'},
-    {'x': 236.5, 'y': 152.6322026, 'z': '5th'}, {'x': 236.5, 'y': 154.9986458, 'z': '10th'},
-    {'x': 236.5, 'y': 158.9447416, 'z': '25th'}, {'x': 236.5, 'y': 163.3175349, 'z': '50th'},
-    {'x': 236.5, 'y': 167.678491, 'z': '75th'}, {'x': 236.5, 'y': 171.5936721, 'z': '90th'},
-    {'x': 236.5, 'y': 173.9324132, 'z': '95th'}, {'x': 236.5, 'y': 175.4495583, 'z': '97th'},
-    {'x': 237.5, 'y': 151.0986866, 'z': '3rd'}, {'x': 237.5, 'y': 152.6377356, 'z': '5th'},
-    {'x': 237.5, 'y': 155.0044483, 'z': '10th'}, {'x': 237.5, 'y': 158.9508345, 'z': '25th'},
-    {'x': 237.5, 'y': 163.3237231, 'z': '50th'}, {'x': 237.5, 'y': 167.684544, 'z': '75th'},
-    {'x': 237.5, 'y': 171.5994132, 'z': '90th'}, {'x': 237.5, 'y': 173.9378839, 'z': '95th'},
-    {'x': 237.5, 'y': 175.4548206, 'z': '97th'}, {'x': 238.5, 'y': 151.1038152, 'z': '3rd'},
-    {'x': 238.5, 'y': 152.6430718, 'z': '5th'}, {'x': 238.5, 'y': 155.0100454, 'z': '10th'},
-    {'x': 238.5, 'y': 158.9567122, 'z': '25th'}, {'x': 238.5, 'y': 163.3296918, 'z': '50th'},
-    {'x': 238.5, 'y': 167.6903797, 'z': '75th'}, {'x': 238.5, 'y': 171.6049444, 'z': '90th'},
-    {'x': 238.5, 'y': 173.9431517, 'z': '95th'}, {'x': 238.5, 'y': 175.4598853, 'z': '97th'},
-    {'x': 239.5, 'y': 151.1087609, 'z': '3rd'}, {'x': 239.5, 'y': 152.6482187, 'z': '5th'},
-    {'x': 239.5, 'y': 155.0154449, 'z': '10th'}, {'x': 239.5, 'y': 158.9623829, 'z': '25th'},
-    {'x': 239.5, 'y': 163.3354491, 'z': '50th'}, {'x': 239.5, 'y': 167.6960062, 'z': '75th'},
-    {'x': 239.5, 'y': 171.6102738, 'z': '90th'}, {'x': 239.5, 'y': 173.9482244, 'z': '95th'},
-    {'x': 239.5, 'y': 175.4647604, 'z': '97th'}, {'x': 240.0, 'y': 151.1111674, 'z': '3rd'},
-    {'x': 240.0, 'y': 152.6507234, 'z': '5th'}, {'x': 240.0, 'y': 155.0180729, 'z': '10th'},
-    {'x': 240.0, 'y': 158.9651429, 'z': '25th'}, {'x': 240.0, 'y': 163.338251, 'z': '50th'},
-    {'x': 240.0, 'y': 167.6987436, 'z': '75th'}, {'x': 240.0, 'y': 171.6128653, 'z': '90th'},
-    {'x': 240.0, 'y': 173.9506901, 'z': '95th'}, {'x': 240.0, 'y': 175.4671292, 'z': '97th'}
-]
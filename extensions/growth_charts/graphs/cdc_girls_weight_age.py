@@ -1,344 +0,0 @@
-cdc_girls_weight_age = [
-    { "x": 0, "y": 2.414111983, "z": "3rd" },
-    { "x": 0.5, "y": 2.756916984, "z": "3rd" },
-    { "x": 1.5, "y": 3.402293298, "z": "3rd" },
-    { "x": 2.5, "y": 3.997805608, "z": "3rd" },
-    { "x": 3.5, "y": 4.54738333, "z": "3rd" },
-    { "x": 4.5, "y": 5.054538727, "z": "3rd" },
-    { "x": 5.5, "y": 5.522500226, "z": "3rd" },
-    { "x": 6.5, "y": 5.954272494, "z": "3rd" },
-    { "x": 7.5, "y": 6.352668277, "z": "3rd" },
-    { "x": 8.5, "y": 6.720327734, "z": "3rd" },
-    { "x": 9.5, "y": 7.059731719, "z": "3rd" },
-    { "x": 10.5, "y": 7.373211901, "z": "3rd" },
-    { "x": 11.5, "y": 7.662959063, "z": "3rd" },
-    { "x": 12.5, "y": 7.93103031, "z": "3rd" },
-    { "x": 13.5, "y": 8.179355552, "z": "3rd" },
-    { "x": 14.5, "y": 8.409743555, "z": "3rd" },
-    { "x": 15.5, "y": 8.62388725, "z": "3rd" },
-    { "x": 16.5, "y": 8.82336957, "z": "3rd" },
-    { "x": 17.5, "y": 9.00966812, "z": "3rd" },
-    { "x": 18.5, "y": 9.184160166, "z": "3rd" },
-    { "x": 19.5, "y": 9.348127323, "z": "3rd" },
-    { "x": 20.5, "y": 9.502760074, "z": "3rd" },
-    { "x": 21.5, "y": 9.649162144, "z": "3rd" },
-    { "x": 22.5, "y": 9.788354721, "z": "3rd" },
-    { "x": 23.5, "y": 9.921280547, "z": "3rd" },
-    { "x": 24.5, "y": 10.04880788, "z": "3rd" },
-    { "x": 25.5, "y": 10.17173431, "z": "3rd" },
-    { "x": 26.5, "y": 10.29079052, "z": "3rd" },
-    { "x": 27.5, "y": 10.40664383, "z": "3rd" },
-    { "x": 28.5, "y": 10.51990171, "z": "3rd" },
-    { "x": 29.5, "y": 10.63111516, "z": "3rd" },
-    { "x": 30.5, "y": 10.74078194, "z": "3rd" },
-    { "x": 31.5, "y": 10.84934975, "z": "3rd" },
-    { "x": 32.5, "y": 10.95721927, "z": "3rd" },
-    { "x": 33.5, "y": 11.06474677, "z": "3rd" },
-    { "x": 34.5, "y": 11.17224778, "z": "3rd" },
-    { "x": 35.5, "y": 11.27999893, "z": "3rd" },
-    { "x": 36, "y": 11.33404488, "z": "3rd" },
-    { "x": 0, "y": 2.54790518, "z": "5th" },
-    { "x": 0.5, "y": 2.894442278, "z": "5th" },
-    { "x": 1.5, "y": 3.547610305, "z": "5th" },
-    { "x": 2.5, "y": 4.150638506, "z": "5th" },
-    { "x": 3.5, "y": 4.70712251, "z": "5th" },
-    { "x": 4.5, "y": 5.220487543, "z": "5th" },
-    { "x": 5.5, "y": 5.693974176, "z": "5th" },
-    { "x": 6.5, "y": 6.130641295, "z": "5th" },
-    { "x": 7.5, "y": 6.533372908, "z": "5th" },
-    { "x": 8.5, "y": 6.904885578, "z": "5th" },
-    { "x": 9.5, "y": 7.247735767, "z": "5th" },
-    { "x": 10.5, "y": 7.564326904, "z": "5th" },
-    { "x": 11.5, "y": 7.856916169, "z": "5th" },
-    { "x": 12.5, "y": 8.127621012, "z": "5th" },
-    { "x": 13.5, "y": 8.378425424, "z": "5th" },
-    { "x": 14.5, "y": 8.611186014, "z": "5th" },
-    { "x": 15.5, "y": 8.827637666, "z": "5th" },
-    { "x": 16.5, "y": 9.029399482, "z": "5th" },
-    { "x": 17.5, "y": 9.217979979, "z": "5th" },
-    { "x": 18.5, "y": 9.394782429, "z": "5th" },
-    { "x": 19.5, "y": 9.561109949, "z": "5th" },
-    { "x": 20.5, "y": 9.718170424, "z": "5th" },
-    { "x": 21.5, "y": 9.867081272, "z": "5th" },
-    { "x": 22.5, "y": 10.00887405, "z": "5th" },
-    { "x": 23.5, "y": 10.14449891, "z": "5th" },
-    { "x": 24.5, "y": 10.27482891, "z": "5th" },
-    { "x": 25.5, "y": 10.40066414, "z": "5th" },
-    { "x": 26.5, "y": 10.52273581, "z": "5th" },
-    { "x": 27.5, "y": 10.64171007, "z": "5th" },
-    { "x": 28.5, "y": 10.7581918, "z": "5th" },
-    { "x": 29.5, "y": 10.8727282, "z": "5th" },
-    { "x": 30.5, "y": 10.98581228, "z": "5th" },
-    { "x": 31.5, "y": 11.09788625, "z": "5th" },
-    { "x": 32.5, "y": 11.2093447, "z": "5th" },
-    { "x": 33.5, "y": 11.32053756, "z": "5th" },
-    { "x": 34.5, "y": 11.43177357, "z": "5th" },
-    { "x": 35.5, "y": 11.54332263, "z": "5th" },
-    { "x": 36, "y": 11.59928903, "z": "5th" },
-    { "x": 0, "y": 2.747222257, "z": "10th" },
-    { "x": 0.5, "y": 3.101767067, "z": "10th" },
-    { "x": 1.5, "y": 3.770157472, "z": "10th" },
-    { "x": 2.5, "y": 4.387041982, "z": "10th" },
-    { "x": 3.5, "y": 4.95592631, "z": "10th" },
-    { "x": 4.5, "y": 5.480295205, "z": "10th" },
-    { "x": 5.5, "y": 5.963510428, "z": "10th" },
-    { "x": 6.5, "y": 6.408775097, "z": "10th" },
-    { "x": 7.5, "y": 6.819122283, "z": "10th" },
-    { "x": 8.5, "y": 7.197413532, "z": "10th" },
-    { "x": 9.5, "y": 7.546341788, "z": "10th" },
-    { "x": 10.5, "y": 7.868436369, "z": "10th" },
-    { "x": 11.5, "y": 8.166068895, "z": "10th" },
-    { "x": 12.5, "y": 8.441459662, "z": "10th" },
-    { "x": 13.5, "y": 8.696684147, "z": "10th" },
-    { "x": 14.5, "y": 8.933679535, "z": "10th" },
-    { "x": 15.5, "y": 9.154251142, "z": "10th" },
-    { "x": 16.5, "y": 9.360078736, "z": "10th" },
-    { "x": 17.5, "y": 9.55272268, "z": "10th" },
-    { "x": 18.5, "y": 9.733629905, "z": "10th" },
-    { "x": 19.5, "y": 9.904139709, "z": "10th" },
-    { "x": 20.5, "y": 10.06548937, "z": "10th" },
-    { "x": 21.5, "y": 10.21881956, "z": "10th" },
-    { "x": 22.5, "y": 10.3651796, "z": "10th" },
-    { "x": 23.5, "y": 10.50553251, "z": "10th" },
-    { "x": 24.5, "y": 10.64075987, "z": "10th" },
-    { "x": 25.5, "y": 10.77166654, "z": "10th" },
-    { "x": 26.5, "y": 10.89898515, "z": "10th" },
-    { "x": 27.5, "y": 11.02338047, "z": "10th" },
-    { "x": 28.5, "y": 11.14545358, "z": "10th" },
-    { "x": 29.5, "y": 11.26574591, "z": "10th" },
-    { "x": 30.5, "y": 11.38474303, "z": "10th" },
-    { "x": 31.5, "y": 11.50287842, "z": "10th" },
-    { "x": 32.5, "y": 11.62053697, "z": "10th" },
-    { "x": 33.5, "y": 11.73805834, "z": "10th" },
-    { "x": 34.5, "y": 11.85574032, "z": "10th" },
-    { "x": 35.5, "y": 11.9738418, "z": "10th" },
-    { "x": 36, "y": 12.03312087, "z": "10th" },
-    { "x": 0, "y": 3.06486465, "z": "25th" },
-    { "x": 0.5, "y": 3.437628263, "z": "25th" },
-    { "x": 1.5, "y": 4.13899376, "z": "25th" },
-    { "x": 2.5, "y": 4.784820426, "z": "25th" },
-    { "x": 3.5, "y": 5.379141034, "z": "25th" },
-    { "x": 4.5, "y": 5.92588831, "z": "25th" },
-    { "x": 5.5, "y": 6.428828208, "z": "25th" },
-    { "x": 6.5, "y": 6.891533095, "z": "25th" },
-    { "x": 7.5, "y": 7.317373091, "z": "25th" },
-    { "x": 8.5, "y": 7.709516114, "z": "25th" },
-    { "x": 9.5, "y": 8.070932165, "z": "25th" },
-    { "x": 10.5, "y": 8.404399764, "z": "25th" },
-    { "x": 11.5, "y": 8.712513432, "z": "25th" },
-    { "x": 12.5, "y": 8.997691667, "z": "25th" },
-    { "x": 13.5, "y": 9.262185089, "z": "25th" },
-    { "x": 14.5, "y": 9.508084539, "z": "25th" },
-    { "x": 15.5, "y": 9.737329319, "z": "25th" },
-    { "x": 16.5, "y": 9.951714686, "z": "25th" },
-    { "x": 17.5, "y": 10.15289979, "z": "25th" },
-    { "x": 18.5, "y": 10.34241498, "z": "25th" },
-    { "x": 19.5, "y": 10.52166904, "z": "25th" },
-    { "x": 20.5, "y": 10.69195601, "z": "25th" },
-    { "x": 21.5, "y": 10.85446195, "z": "25th" },
-    { "x": 22.5, "y": 11.01027128, "z": "25th" },
-    { "x": 23.5, "y": 11.16037297, "z": "25th" },
-    { "x": 24.5, "y": 11.30566645, "z": "25th" },
-    { "x": 25.5, "y": 11.44696728, "z": "25th" },
-    { "x": 26.5, "y": 11.58501256, "z": "25th" },
-    { "x": 27.5, "y": 11.72046615, "z": "25th" },
-    { "x": 28.5, "y": 11.8539236, "z": "25th" },
-    { "x": 29.5, "y": 11.98591692, "z": "25th" },
-    { "x": 30.5, "y": 12.11691911, "z": "25th" },
-    { "x": 31.5, "y": 12.24734843, "z": "25th" },
-    { "x": 32.5, "y": 12.37757256, "z": "25th" },
-    { "x": 33.5, "y": 12.50791269, "z": "25th" },
-    { "x": 34.5, "y": 12.63864672, "z": "25th" },
-    { "x": 35.5, "y": 12.77001339, "z": "25th" },
-    { "x": 36, "y": 12.83599859, "z": "25th" },
-    { "x": 0, "y": 3.39918645, "z": "50th" },
-    { "x": 0.5, "y": 3.79752846, "z": "50th" },
-    { "x": 1.5, "y": 4.544776513, "z": "50th" },
-    { "x": 2.5, "y": 5.230584214, "z": "50th" },
-    { "x": 3.5, "y": 5.859960798, "z": "50th" },
-    { "x": 4.5, "y": 6.437587751, "z": "50th" },
-    { "x": 5.5, "y": 6.967850457, "z": "50th" },
-    { "x": 6.5, "y": 7.454854109, "z": "50th" },
-    { "x": 7.5, "y": 7.902436186, "z": "50th" },
-    { "x": 8.5, "y": 8.314178377, "z": "50th" },
-    { "x": 9.5, "y": 8.693418423, "z": "50th" },
-    { "x": 10.5, "y": 9.043261854, "z": "50th" },
-    { "x": 11.5, "y": 9.366593571, "z": "50th" },
-    { "x": 12.5, "y": 9.666089185, "z": "50th" },
-    { "x": 13.5, "y": 9.944226063, "z": "50th" },
-    { "x": 14.5, "y": 10.20329397, "z": "50th" },
-    { "x": 15.5, "y": 10.4454058, "z": "50th" },
-    { "x": 16.5, "y": 10.67250698, "z": "50th" },
-    { "x": 17.5, "y": 10.88638558, "z": "50th" },
-    { "x": 18.5, "y": 11.08868151, "z": "50th" },
-    { "x": 19.5, "y": 11.28089537, "z": "50th" },
-    { "x": 20.5, "y": 11.46439708, "z": "50th" },
-    { "x": 21.5, "y": 11.64043402, "z": "50th" },
-    { "x": 22.5, "y": 11.81013895, "z": "50th" },
-    { "x": 23.5, "y": 11.97453748, "z": "50th" },
-    { "x": 24.5, "y": 12.13455528, "z": "50th" },
-    { "x": 25.5, "y": 12.2910249, "z": "50th" },
-    { "x": 26.5, "y": 12.44469237, "z": "50th" },
-    { "x": 27.5, "y": 12.59622335, "z": "50th" },
-    { "x": 28.5, "y": 12.74620911, "z": "50th" },
-    { "x": 29.5, "y": 12.89517218, "z": "50th" },
-    { "x": 30.5, "y": 13.04357164, "z": "50th" },
-    { "x": 31.5, "y": 13.19180827, "z": "50th" },
-    { "x": 32.5, "y": 13.34022934, "z": "50th" },
-    { "x": 33.5, "y": 13.48913357, "z": "50th" },
-    { "x": 34.5, "y": 13.63877446, "z": "50th" },
-    { "x": 35.5, "y": 13.78936547, "z": "50th" },
-    { "x": 36, "y": 13.86507382, "z": "50th" },
-    { "x": 0, "y": 3.717519384, "z": "75th" },
-    { "x": 0.5, "y": 4.145593668, "z": "75th" },
-    { "x": 1.5, "y": 4.946765504, "z": "75th" },
-    { "x": 2.5, "y": 5.680083196, "z": "75th" },
-    { "x": 3.5, "y": 6.351511983, "z": "75th" },
-    { "x": 4.5, "y": 6.966523789, "z": "75th" },
-    { "x": 5.5, "y": 7.53018045, "z": "75th" },
-    { "x": 6.5, "y": 8.047178246, "z": "75th" },
-    { "x": 7.5, "y": 8.52187726, "z": "75th" },
-    { "x": 8.5, "y": 8.958324062, "z": "75th" },
-    { "x": 9.5, "y": 9.360270982, "z": "75th" },
-    { "x": 10.5, "y": 9.7311934, "z": "75th" },
-    { "x": 11.5, "y": 10.07430572, "z": "75th" },
-    { "x": 12.5, "y": 10.39257636, "z": "75th" },
-    { "x": 13.5, "y": 10.68874201, "z": "75th" },
-    { "x": 14.5, "y": 10.96532105, "z": "75th" },
-    { "x": 15.5, "y": 11.2246268, "z": "75th" },
-    { "x": 16.5, "y": 11.46877937, "z": "75th" },
-    { "x": 17.5, "y": 11.69971783, "z": "75th" },
-    { "x": 18.5, "y": 11.91921144, "z": "75th" },
-    { "x": 19.5, "y": 12.1288704, "z": "75th" },
-    { "x": 20.5, "y": 12.3301562, "z": "75th" },
-    { "x": 21.5, "y": 12.52439148, "z": "75th" },
-    { "x": 22.5, "y": 12.71276942, "z": "75th" },
-    { "x": 23.5, "y": 12.89636272, "z": "75th" },
-    { "x": 24.5, "y": 13.07613212, "z": "75th" },
-    { "x": 25.5, "y": 13.25293459, "z": "75th" },
-    { "x": 26.5, "y": 13.42753102, "z": "75th" },
-    { "x": 27.5, "y": 13.60059358, "z": "75th" },
-    { "x": 28.5, "y": 13.77271274, "z": "75th" },
-    { "x": 29.5, "y": 13.94440383, "z": "75th" },
-    { "x": 30.5, "y": 14.11611337, "z": "75th" },
-    { "x": 31.5, "y": 14.28822496, "z": "75th" },
-    { "x": 32.5, "y": 14.46106492, "z": "75th" },
-    { "x": 33.5, "y": 14.634908, "z": "75th" },
-    { "x": 34.5, "y": 14.80998135, "z": "75th" },
-    { "x": 35.5, "y": 14.98647034, "z": "75th" },
-    { "x": 36, "y": 15.07529315, "z": "75th" },
-    { "x": 0, "y": 3.992572231, "z": "90th" },
-    { "x": 0.5, "y": 4.450125603, "z": "90th" },
-    { "x": 1.5, "y": 5.305632496, "z": "90th" },
-    { "x": 2.5, "y": 6.08764077, "z": "90th" },
-    { "x": 3.5, "y": 6.802769825, "z": "90th" },
-    { "x": 4.5, "y": 7.45711879, "z": "90th" },
-    { "x": 5.5, "y": 8.056331004, "z": "90th" },
-    { "x": 6.5, "y": 8.605635546, "z": "90th" },
-    { "x": 7.5, "y": 9.109878097, "z": "90th" },
-    { "x": 8.5, "y": 9.573546299, "z": "90th" },
-    { "x": 9.5, "y": 10.00079194, "z": "90th" },
-    { "x": 10.5, "y": 10.3954511, "z": "90th" },
-    { "x": 11.5, "y": 10.76106284, "z": "90th" },
-    { "x": 12.5, "y": 11.10088678, "z": "90th" },
-    { "x": 13.5, "y": 11.4179197, "z": "90th" },
-    { "x": 14.5, "y": 11.7149113, "z": "90th" },
-    { "x": 15.5, "y": 11.99437938, "z": "90th" },
-    { "x": 16.5, "y": 12.258624, "z": "90th" },
-    { "x": 17.5, "y": 12.50974133, "z": "90th" },
-    { "x": 18.5, "y": 12.74963667, "z": "90th" },
-    { "x": 19.5, "y": 12.98003694, "z": "90th" },
-    { "x": 20.5, "y": 13.20250263, "z": "90th" },
-    { "x": 21.5, "y": 13.41843913, "z": "90th" },
-    { "x": 22.5, "y": 13.62910755, "z": "90th" },
-    { "x": 23.5, "y": 13.8356351, "z": "90th" },
-    { "x": 24.5, "y": 14.03902484, "z": "90th" },
-    { "x": 25.5, "y": 14.24016506, "z": "90th" },
-    { "x": 26.5, "y": 14.43983817, "z": "90th" },
-    { "x": 27.5, "y": 14.63872906, "z": "90th" },
-    { "x": 28.5, "y": 14.83743314, "z": "90th" },
-    { "x": 29.5, "y": 15.03646393, "z": "90th" },
-    { "x": 30.5, "y": 15.23626013, "z": "90th" },
-    { "x": 31.5, "y": 15.43719248, "z": "90th" },
-    { "x": 32.5, "y": 15.63957012, "z": "90th" },
-    { "x": 33.5, "y": 15.84364677, "z": "90th" },
-    { "x": 34.5, "y": 16.04962601, "z": "90th" },
-    { "x": 35.5, "y": 16.25766706, "z": "90th" },
-    { "x": 36, "y": 16.36249956, "z": "90th" },
-    { "x": 0, "y": 4.152636594, "z": "95th" },
-    { "x": 0.5, "y": 4.628836382, "z": "95th" },
-    { "x": 1.5, "y": 5.51916925, "z": "95th" },
-    { "x": 2.5, "y": 6.332837055, "z": "95th" },
-    { "x": 3.5, "y": 7.076722522, "z": "95th" },
-    { "x": 4.5, "y": 7.757233948, "z": "95th" },
-    { "x": 5.5, "y": 8.380329759, "z": "95th" },
-    { "x": 6.5, "y": 8.951543685, "z": "95th" },
-    { "x": 7.5, "y": 9.476008728, "z": "95th" },
-    { "x": 8.5, "y": 9.958479736, "z": "95th" },
-    { "x": 9.5, "y": 10.40335475, "z": "95th" },
-    { "x": 10.5, "y": 10.81469528, "z": "95th" },
-    { "x": 11.5, "y": 11.19624565, "z": "95th" },
-    { "x": 12.5, "y": 11.5514514, "z": "95th" },
-    { "x": 13.5, "y": 11.88347697, "z": "95th" },
-    { "x": 14.5, "y": 12.19522253, "z": "95th" },
-    { "x": 15.5, "y": 12.48934, "z": "95th" },
-    { "x": 16.5, "y": 12.76824867, "z": "95th" },
-    { "x": 17.5, "y": 13.03414978, "z": "95th" },
-    { "x": 18.5, "y": 13.28904061, "z": "95th" },
-    { "x": 19.5, "y": 13.53472797, "z": "95th" },
-    { "x": 20.5, "y": 13.77284102, "z": "95th" },
-    { "x": 21.5, "y": 14.00484351, "z": "95th" },
-    { "x": 22.5, "y": 14.23204547, "z": "95th" },
-    { "x": 23.5, "y": 14.45561433, "z": "95th" },
-    { "x": 24.5, "y": 14.67658549, "z": "95th" },
-    { "x": 25.5, "y": 14.89587242, "z": "95th" },
-    { "x": 26.5, "y": 15.11427618, "z": "95th" },
-    { "x": 27.5, "y": 15.33249457, "z": "95th" },
-    { "x": 28.5, "y": 15.55113065, "z": "95th" },
-    { "x": 29.5, "y": 15.770701, "z": "95th" },
-    { "x": 30.5, "y": 15.99164336, "z": "95th" },
-    { "x": 31.5, "y": 16.21432393, "z": "95th" },
-    { "x": 32.5, "y": 16.43904429, "z": "95th" },
-    { "x": 33.5, "y": 16.66604772, "z": "95th" },
-    { "x": 34.5, "y": 16.89552564, "z": "95th" },
-    { "x": 35.5, "y": 17.12762297, "z": "95th" },
-    { "x": 36, "y": 17.24468787, "z": "95th" },
-    { "x": 0, "y": 4.254922004, "z": "97th" },
-    { "x": 0.5, "y": 4.743581789, "z": "97th" },
-    { "x": 1.5, "y": 5.657379108, "z": "97th" },
-    { "x": 2.5, "y": 6.492574414, "z": "97th" },
-    { "x": 3.5, "y": 7.256165568, "z": "97th" },
-    { "x": 4.5, "y": 7.954730061, "z": "97th" },
-    { "x": 5.5, "y": 8.59441348, "z": "97th" },
-    { "x": 6.5, "y": 9.180938407, "z": "97th" },
-    { "x": 7.5, "y": 9.719620693, "z": "97th" },
-    { "x": 8.5, "y": 10.2153883, "z": "97th" },
-    { "x": 9.5, "y": 10.67280092, "z": "97th" },
-    { "x": 10.5, "y": 11.0960696, "z": "97th" },
-    { "x": 11.5, "y": 11.48907597, "z": "97th" },
-    { "x": 12.5, "y": 11.85539095, "z": "97th" },
-    { "x": 13.5, "y": 12.19829279, "z": "97th" },
-    { "x": 14.5, "y": 12.52078451, "z": "97th" },
-    { "x": 15.5, "y": 12.82561033, "z": "97th" },
-    { "x": 16.5, "y": 13.11527219, "z": "97th" },
-    { "x": 17.5, "y": 13.39204468, "z": "97th" },
-    { "x": 18.5, "y": 13.65798985, "z": "97th" },
-    { "x": 19.5, "y": 13.91497124, "z": "97th" },
-    { "x": 20.5, "y": 14.1646673, "z": "97th" },
-    { "x": 21.5, "y": 14.40858419, "z": "97th" },
-    { "x": 22.5, "y": 14.64806798, "z": "97th" },
-    { "x": 23.5, "y": 14.88431632, "z": "97th" },
-    { "x": 24.5, "y": 15.11838945, "z": "97th" },
-    { "x": 25.5, "y": 15.35122083, "z": "97th" },
-    { "x": 26.5, "y": 15.5836271, "z": "97th" },
-    { "x": 27.5, "y": 15.8163176, "z": "97th" },
-    { "x": 28.5, "y": 16.0499034, "z": "97th" },
-    { "x": 29.5, "y": 16.28490586, "z": "97th" },
-    { "x": 30.5, "y": 16.52176469, "z": "97th" },
-    { "x": 31.5, "y": 16.7608456, "z": "97th" },
-    { "x": 32.5, "y": 17.00244749, "z": "97th" },
-    { "x": 33.5, "y": 17.24680884, "z": "97th" },
-    { "x": 34.5, "y": 17.49411514, "z": "97th" },
-    { "x": 35.5, "y": 17.74450372, "z": "97th" },
-    { "x": 36, "y": 17.87088515, "z": "97th" }
-]
@@ -1,1964 +0,0 @@
-cdc_girls_weight_age_24_240 = [
-    {'x': 24.0, 'y': 9.985667562, 'z': '3rd'},
-{'x': 24.0, 'y': 10.2102741, 'z': '5th'},
-{'x': 24.0, 'y': 10.57373483, 'z': '10th'},
-{'x': 24.0, 'y': 11.23356786, 'z': '25th'},
-{'x': 24.0, 'y': 12.05503983, 'z': '50th'},
-{'x': 24.0, 'y': 12.98666951, 'z': '75th'},
-{'x': 24.0, 'y': 13.93766409, 'z': '90th'},
-{'x': 24.0, 'y': 14.56636479, 'z': '95th'},
-{'x': 24.0, 'y': 15.00156359, 'z': '97th'},
-{'x': 24.5, 'y': 10.04880792, 'z': '3rd'},
-{'x': 24.5, 'y': 10.27482893, 'z': '5th'},
-{'x': 24.5, 'y': 10.64075988, 'z': '10th'},
-{'x': 24.5, 'y': 11.30566642, 'z': '25th'},
-{'x': 24.5, 'y': 12.13455523, 'z': '50th'},
-{'x': 24.5, 'y': 13.07613207, 'z': '75th'},
-{'x': 24.5, 'y': 14.03902482, 'z': '90th'},
-{'x': 24.5, 'y': 14.67658551, 'z': '95th'},
-{'x': 24.5, 'y': 15.1183895, 'z': '97th'},
-{'x': 25.5, 'y': 10.17173432, 'z': '3rd'},
-{'x': 25.5, 'y': 10.40066415, 'z': '5th'},
-{'x': 25.5, 'y': 10.77166654, 'z': '10th'},
-{'x': 25.5, 'y': 11.44696728, 'z': '25th'},
-{'x': 25.5, 'y': 12.2910249, 'z': '50th'},
-{'x': 25.5, 'y': 13.25293458, 'z': '75th'},
-{'x': 25.5, 'y': 14.24016506, 'z': '90th'},
-{'x': 25.5, 'y': 14.89587242, 'z': '95th'},
-{'x': 25.5, 'y': 15.35122084, 'z': '97th'},
-{'x': 26.5, 'y': 10.29079033, 'z': '3rd'},
-{'x': 26.5, 'y': 10.52273569, 'z': '5th'},
-{'x': 26.5, 'y': 10.89898512, 'z': '10th'},
-{'x': 26.5, 'y': 11.58501268, 'z': '25th'},
-{'x': 26.5, 'y': 12.44469258, 'z': '50th'},
-{'x': 26.5, 'y': 13.42753123, 'z': '75th'},
-{'x': 26.5, 'y': 14.43983825, 'z': '90th'},
-{'x': 26.5, 'y': 15.1142761, 'z': '95th'},
-{'x': 26.5, 'y': 15.58362686, 'z': '97th'},
-{'x': 27.5, 'y': 10.40664383, 'z': '3rd'},
-{'x': 27.5, 'y': 10.64171007, 'z': '5th'},
-{'x': 27.5, 'y': 11.02338047, 'z': '10th'},
-{'x': 27.5, 'y': 11.72046615, 'z': '25th'},
-{'x': 27.5, 'y': 12.59622335, 'z': '50th'},
-{'x': 27.5, 'y': 13.60059358, 'z': '75th'},
-{'x': 27.5, 'y': 14.63872906, 'z': '90th'},
-{'x': 27.5, 'y': 15.33249457, 'z': '95th'},
-{'x': 27.5, 'y': 15.8163176, 'z': '97th'},
-{'x': 28.5, 'y': 10.51990171, 'z': '3rd'},
-{'x': 28.5, 'y': 10.7581918, 'z': '5th'},
-{'x': 28.5, 'y': 11.14545358, 'z': '10th'},
-{'x': 28.5, 'y': 11.8539236, 'z': '25th'},
-{'x': 28.5, 'y': 12.74620911, 'z': '50th'},
-{'x': 28.5, 'y': 13.77271274, 'z': '75th'},
-{'x': 28.5, 'y': 14.83743315, 'z': '90th'},
-{'x': 28.5, 'y': 15.55113065, 'z': '95th'},
-{'x': 28.5, 'y': 16.0499034, 'z': '97th'},
-{'x': 29.5, 'y': 10.63111516, 'z': '3rd'},
-{'x': 29.5, 'y': 10.8727282, 'z': '5th'},
-{'x': 29.5, 'y': 11.26574591, 'z': '10th'},
-{'x': 29.5, 'y': 11.98591692, 'z': '25th'},
-{'x': 29.5, 'y': 12.89517218, 'z': '50th'},
-{'x': 29.5, 'y': 13.94440383, 'z': '75th'},
-{'x': 29.5, 'y': 15.03646393, 'z': '90th'},
-{'x': 29.5, 'y': 15.770701, 'z': '95th'},
-{'x': 29.5, 'y': 16.28490586, 'z': '97th'},
-{'x': 30.5, 'y': 10.74078194, 'z': '3rd'},
-{'x': 30.5, 'y': 10.98581228, 'z': '5th'},
-{'x': 30.5, 'y': 11.38474303, 'z': '10th'},
-{'x': 30.5, 'y': 12.11691911, 'z': '25th'},
-{'x': 30.5, 'y': 13.04357164, 'z': '50th'},
-{'x': 30.5, 'y': 14.11611337, 'z': '75th'},
-{'x': 30.5, 'y': 15.23626013, 'z': '90th'},
-{'x': 30.5, 'y': 15.99164336, 'z': '95th'},
-{'x': 30.5, 'y': 16.52176469, 'z': '97th'},
-{'x': 31.5, 'y': 10.84934933, 'z': '3rd'},
-{'x': 31.5, 'y': 11.09788597, 'z': '5th'},
-{'x': 31.5, 'y': 11.50287836, 'z': '10th'},
-{'x': 31.5, 'y': 12.24734867, 'z': '25th'},
-{'x': 31.5, 'y': 13.19180874, 'z': '50th'},
-{'x': 31.5, 'y': 14.28822545, 'z': '75th'},
-{'x': 31.5, 'y': 15.43719269, 'z': '90th'},
-{'x': 31.5, 'y': 16.21432377, 'z': '95th'},
-{'x': 31.5, 'y': 16.76084508, 'z': '97th'},
-{'x': 32.5, 'y': 10.95721927, 'z': '3rd'},
-{'x': 32.5, 'y': 11.2093447, 'z': '5th'},
-{'x': 32.5, 'y': 11.62053698, 'z': '10th'},
-{'x': 32.5, 'y': 12.37757256, 'z': '25th'},
-{'x': 32.5, 'y': 13.34022934, 'z': '50th'},
-{'x': 32.5, 'y': 14.46106492, 'z': '75th'},
-{'x': 32.5, 'y': 15.63957012, 'z': '90th'},
-{'x': 32.5, 'y': 16.43904429, 'z': '95th'},
-{'x': 32.5, 'y': 17.00244749, 'z': '97th'},
-{'x': 33.5, 'y': 11.0647471, 'z': '3rd'},
-{'x': 33.5, 'y': 11.32053778, 'z': '5th'},
-{'x': 33.5, 'y': 11.7380584, 'z': '10th'},
-{'x': 33.5, 'y': 12.50791249, 'z': '25th'},
-{'x': 33.5, 'y': 13.48913319, 'z': '50th'},
-{'x': 33.5, 'y': 14.6349076, 'z': '75th'},
-{'x': 33.5, 'y': 15.8436466, 'z': '90th'},
-{'x': 33.5, 'y': 16.66604785, 'z': '95th'},
-{'x': 33.5, 'y': 17.24680927, 'z': '97th'},
-{'x': 34.5, 'y': 11.17224778, 'z': '3rd'},
-{'x': 34.5, 'y': 11.43177357, 'z': '5th'},
-{'x': 34.5, 'y': 11.85574032, 'z': '10th'},
-{'x': 34.5, 'y': 12.63864672, 'z': '25th'},
-{'x': 34.5, 'y': 13.63877446, 'z': '50th'},
-{'x': 34.5, 'y': 14.80998135, 'z': '75th'},
-{'x': 34.5, 'y': 16.04962601, 'z': '90th'},
-{'x': 34.5, 'y': 16.89552564, 'z': '95th'},
-{'x': 34.5, 'y': 17.49411514, 'z': '97th'},
-{'x': 35.5, 'y': 11.27999893, 'z': '3rd'},
-{'x': 35.5, 'y': 11.54332263, 'z': '5th'},
-{'x': 35.5, 'y': 11.9738418, 'z': '10th'},
-{'x': 35.5, 'y': 12.77001339, 'z': '25th'},
-{'x': 35.5, 'y': 13.78936547, 'z': '50th'},
-{'x': 35.5, 'y': 14.98647034, 'z': '75th'},
-{'x': 35.5, 'y': 16.25766706, 'z': '90th'},
-{'x': 35.5, 'y': 17.12762297, 'z': '95th'},
-{'x': 35.5, 'y': 17.74450372, 'z': '97th'},
-{'x': 36.5, 'y': 11.38824099, 'z': '3rd'},
-{'x': 36.5, 'y': 11.65541879, 'z': '5th'},
-{'x': 36.5, 'y': 12.0925858, 'z': '10th'},
-{'x': 36.5, 'y': 12.90221529, 'z': '25th'},
-{'x': 36.5, 'y': 13.94108332, 'z': '50th'},
-{'x': 36.5, 'y': 15.16452247, 'z': '75th'},
-{'x': 36.5, 'y': 16.46788956, 'z': '90th'},
-{'x': 36.5, 'y': 17.3624437, 'z': '95th'},
-{'x': 36.5, 'y': 17.9980699, 'z': '97th'},
-{'x': 37.5, 'y': 11.49718137, 'z': '3rd'},
-{'x': 37.5, 'y': 11.76826286, 'z': '5th'},
-{'x': 37.5, 'y': 12.21216229, 'z': '10th'},
-{'x': 37.5, 'y': 13.03542218, 'z': '25th'},
-{'x': 37.5, 'y': 14.09407175, 'z': '50th'},
-{'x': 37.5, 'y': 15.34425164, 'z': '75th'},
-{'x': 37.5, 'y': 16.68037834, 'z': '90th'},
-{'x': 37.5, 'y': 17.60005585, 'z': '95th'},
-{'x': 37.5, 'y': 18.25487219, 'z': '97th'},
-{'x': 38.5, 'y': 11.60699649, 'z': '3rd'},
-{'x': 38.5, 'y': 11.88202491, 'z': '5th'},
-{'x': 38.5, 'y': 12.33273088, 'z': '10th'},
-{'x': 38.5, 'y': 13.16977393, 'z': '25th'},
-{'x': 38.5, 'y': 14.24844498, 'z': '50th'},
-{'x': 38.5, 'y': 15.52574208, 'z': '75th'},
-{'x': 38.5, 'y': 16.89518784, 'z': '90th'},
-{'x': 38.5, 'y': 17.84049621, 'z': '95th'},
-{'x': 38.5, 'y': 18.51493707, 'z': '97th'},
-{'x': 39.5, 'y': 11.71783343, 'z': '3rd'},
-{'x': 39.5, 'y': 11.99684628, 'z': '5th'},
-{'x': 39.5, 'y': 12.45442324, 'z': '10th'},
-{'x': 39.5, 'y': 13.3053838, 'z': '25th'},
-{'x': 39.5, 'y': 14.40429169, 'z': '50th'},
-{'x': 39.5, 'y': 15.7090529, 'z': '75th'},
-{'x': 39.5, 'y': 17.11234657, 'z': '90th'},
-{'x': 39.5, 'y': 18.08377443, 'z': '95th'},
-{'x': 39.5, 'y': 18.77826268, 'z': '97th'},
-{'x': 40.5, 'y': 11.82981465, 'z': '3rd'},
-{'x': 40.5, 'y': 12.11284345, 'z': '5th'},
-{'x': 40.5, 'y': 12.57734604, 'z': '10th'},
-{'x': 40.5, 'y': 13.44233976, 'z': '25th'},
-{'x': 40.5, 'y': 14.56167529, 'z': '50th'},
-{'x': 40.5, 'y': 15.89421842, 'z': '75th'},
-{'x': 40.5, 'y': 17.33185956, 'z': '90th'},
-{'x': 40.5, 'y': 18.329878, 'z': '95th'},
-{'x': 40.5, 'y': 19.04482627, 'z': '97th'},
-{'x': 41.5, 'y': 11.94303682, 'z': '3rd'},
-{'x': 41.5, 'y': 12.23010816, 'z': '5th'},
-{'x': 41.5, 'y': 12.7015826, 'z': '10th'},
-{'x': 41.5, 'y': 13.58070885, 'z': '25th'},
-{'x': 41.5, 'y': 14.72064045, 'z': '50th'},
-{'x': 41.5, 'y': 16.08125551, 'z': '75th'},
-{'x': 41.5, 'y': 17.55371382, 'z': '90th'},
-{'x': 41.5, 'y': 18.57877485, 'z': '95th'},
-{'x': 41.5, 'y': 19.31458378, 'z': '97th'},
-{'x': 42.5, 'y': 12.05757491, 'z': '3rd'},
-{'x': 42.5, 'y': 12.34871076, 'z': '5th'},
-{'x': 42.5, 'y': 12.82719552, 'z': '10th'},
-{'x': 42.5, 'y': 13.72053844, 'z': '25th'},
-{'x': 42.5, 'y': 14.88121352, 'z': '50th'},
-{'x': 42.5, 'y': 16.27016402, 'z': '75th'},
-{'x': 42.5, 'y': 17.77788046, 'z': '90th'},
-{'x': 42.5, 'y': 18.83041754, 'z': '95th'},
-{'x': 42.5, 'y': 19.58747608, 'z': '97th'},
-{'x': 43.5, 'y': 12.17348363, 'z': '3rd'},
-{'x': 43.5, 'y': 12.46870194, 'z': '5th'},
-{'x': 43.5, 'y': 12.95422865, 'z': '10th'},
-{'x': 43.5, 'y': 13.86185877, 'z': '25th'},
-{'x': 43.5, 'y': 15.04340553, 'z': '50th'},
-{'x': 43.5, 'y': 16.4609302, 'z': '75th'},
-{'x': 43.5, 'y': 18.00431807, 'z': '90th'},
-{'x': 43.5, 'y': 19.08474635, 'z': '95th'},
-{'x': 43.5, 'y': 19.86343169, 'z': '97th'},
-{'x': 44.5, 'y': 12.29079939, 'z': '3rd'},
-{'x': 44.5, 'y': 12.59011469, 'z': '5th'},
-{'x': 44.5, 'y': 13.08270906, 'z': '10th'},
-{'x': 44.5, 'y': 14.00468502, 'z': '25th'},
-{'x': 44.5, 'y': 15.20721443, 'z': '50th'},
-{'x': 44.5, 'y': 16.65352914, 'z': '75th'},
-{'x': 44.5, 'y': 18.23297548, 'z': '90th'},
-{'x': 44.5, 'y': 19.34169227, 'z': '95th'},
-{'x': 44.5, 'y': 20.14236985, 'z': '97th'},
-{'x': 45.5, 'y': 12.40954207, 'z': '3rd'},
-{'x': 45.5, 'y': 12.71296607, 'z': '5th'},
-{'x': 45.5, 'y': 13.21264896, 'z': '10th'},
-{'x': 45.5, 'y': 14.14901929, 'z': '25th'},
-{'x': 45.5, 'y': 15.37262729, 'z': '50th'},
-{'x': 45.5, 'y': 16.84792719, 'z': '75th'},
-{'x': 45.5, 'y': 18.46379435, 'z': '90th'},
-{'x': 45.5, 'y': 19.60117968, 'z': '95th'},
-{'x': 45.5, 'y': 20.42420335, 'z': '97th'},
-{'x': 46.5, 'y': 12.52971675, 'z': '3rd'},
-{'x': 46.5, 'y': 12.837259, 'z': '5th'},
-{'x': 46.5, 'y': 13.3440474, 'z': '10th'},
-{'x': 46.5, 'y': 14.29485248, 'z': '25th'},
-{'x': 46.5, 'y': 15.53962221, 'z': '50th'},
-{'x': 46.5, 'y': 17.04408407, 'z': '75th'},
-{'x': 46.5, 'y': 18.69671155, 'z': '90th'},
-{'x': 46.5, 'y': 19.86312888, 'z': '95th'},
-{'x': 46.5, 'y': 20.70884106, 'z': '97th'},
-{'x': 47.5, 'y': 12.65131534, 'z': '3rd'},
-{'x': 47.5, 'y': 12.96298387, 'z': '5th'},
-{'x': 47.5, 'y': 13.47689199, 'z': '10th'},
-{'x': 47.5, 'y': 14.44216593, 'z': '25th'},
-{'x': 47.5, 'y': 15.70817017, 'z': '50th'},
-{'x': 47.5, 'y': 17.24195488, 'z': '75th'},
-{'x': 47.5, 'y': 18.9316613, 'z': '90th'},
-{'x': 47.5, 'y': 20.12745836, 'z': '95th'},
-{'x': 47.5, 'y': 20.99619028, 'z': '97th'},
-{'x': 48.5, 'y': 12.77431816, 'z': '3rd'},
-{'x': 48.5, 'y': 13.09012012, 'z': '5th'},
-{'x': 48.5, 'y': 13.61116044, 'z': '10th'},
-{'x': 48.5, 'y': 14.59093307, 'z': '25th'},
-{'x': 48.5, 'y': 15.87823668, 'z': '50th'},
-{'x': 48.5, 'y': 17.44149184, 'z': '75th'},
-{'x': 48.5, 'y': 19.16857713, 'z': '90th'},
-{'x': 48.5, 'y': 20.3940868, 'z': '95th'},
-{'x': 48.5, 'y': 21.28615884, 'z': '97th'},
-{'x': 49.5, 'y': 12.89869431, 'z': '3rd'},
-{'x': 49.5, 'y': 13.21863694, 'z': '5th'},
-{'x': 49.5, 'y': 13.74682181, 'z': '10th'},
-{'x': 49.5, 'y': 14.74112146, 'z': '25th'},
-{'x': 49.5, 'y': 16.04978452, 'z': '50th'},
-{'x': 49.5, 'y': 17.64264736, 'z': '75th'},
-{'x': 49.5, 'y': 19.40739437, 'z': '90th'},
-{'x': 49.5, 'y': 20.66293462, 'z': '95th'},
-{'x': 49.5, 'y': 21.57865549, 'z': '97th'},
-{'x': 50.5, 'y': 13.0244072, 'z': '3rd'},
-{'x': 50.5, 'y': 13.34849756, 'z': '5th'},
-{'x': 50.5, 'y': 13.88383882, 'z': '10th'},
-{'x': 50.5, 'y': 14.89269209, 'z': '25th'},
-{'x': 50.5, 'y': 16.2227706, 'z': '50th'},
-{'x': 50.5, 'y': 17.84537017, 'z': '75th'},
-{'x': 50.5, 'y': 19.64804889, 'z': '90th'},
-{'x': 50.5, 'y': 20.93392691, 'z': '95th'},
-{'x': 50.5, 'y': 21.8735972, 'z': '97th'},
-{'x': 51.5, 'y': 13.15141009, 'z': '3rd'},
-{'x': 51.5, 'y': 13.47965651, 'z': '5th'},
-{'x': 51.5, 'y': 14.02216781, 'z': '10th'},
-{'x': 51.5, 'y': 15.04560355, 'z': '25th'},
-{'x': 51.5, 'y': 16.39715363, 'z': '50th'},
-{'x': 51.5, 'y': 18.04961414, 'z': '75th'},
-{'x': 51.5, 'y': 19.8904825, 'z': '90th'},
-{'x': 51.5, 'y': 21.20699305, 'z': '95th'},
-{'x': 51.5, 'y': 22.17090276, 'z': '97th'},
-{'x': 52.5, 'y': 13.279651, 'z': '3rd'},
-{'x': 52.5, 'y': 13.61206342, 'z': '5th'},
-{'x': 52.5, 'y': 14.16176079, 'z': '10th'},
-{'x': 52.5, 'y': 15.19981137, 'z': '25th'},
-{'x': 52.5, 'y': 16.57289122, 'z': '50th'},
-{'x': 52.5, 'y': 18.25533469, 'z': '75th'},
-{'x': 52.5, 'y': 20.13464164, 'z': '90th'},
-{'x': 52.5, 'y': 21.48206912, 'z': '95th'},
-{'x': 52.5, 'y': 22.47049907, 'z': '97th'},
-{'x': 53.5, 'y': 13.40907302, 'z': '3rd'},
-{'x': 53.5, 'y': 13.74566354, 'z': '5th'},
-{'x': 53.5, 'y': 14.30256641, 'z': '10th'},
-{'x': 53.5, 'y': 15.35526953, 'z': '25th'},
-{'x': 53.5, 'y': 16.74994187, 'z': '50th'},
-{'x': 53.5, 'y': 18.46249096, 'z': '75th'},
-{'x': 53.5, 'y': 20.38047905, 'z': '90th'},
-{'x': 53.5, 'y': 21.75909881, 'z': '95th'},
-{'x': 53.5, 'y': 22.7723211, 'z': '97th'},
-{'x': 54.5, 'y': 13.53961547, 'z': '3rd'},
-{'x': 54.5, 'y': 13.88039891, 'z': '5th'},
-{'x': 54.5, 'y': 14.44453095, 'z': '10th'},
-{'x': 54.5, 'y': 15.51193144, 'z': '25th'},
-{'x': 54.5, 'y': 16.92826587, 'z': '50th'},
-{'x': 54.5, 'y': 18.67104666, 'z': '75th'},
-{'x': 54.5, 'y': 20.62795467, 'z': '90th'},
-{'x': 54.5, 'y': 22.0380343, 'z': '95th'},
-{'x': 54.5, 'y': 23.07631287, 'z': '97th'},
-{'x': 55.5, 'y': 13.67121491, 'z': '3rd'},
-{'x': 55.5, 'y': 14.0162093, 'z': '5th'},
-{'x': 55.5, 'y': 14.58759933, 'z': '10th'},
-{'x': 55.5, 'y': 15.66975084, 'z': '25th'},
-{'x': 55.5, 'y': 17.10782615, 'z': '50th'},
-{'x': 55.5, 'y': 18.88097086, 'z': '75th'},
-{'x': 55.5, 'y': 20.87703643, 'z': '90th'},
-{'x': 55.5, 'y': 22.31883709, 'z': '95th'},
-{'x': 55.5, 'y': 23.3824283, 'z': '97th'},
-{'x': 56.5, 'y': 13.80380614, 'z': '3rd'},
-{'x': 56.5, 'y': 14.15303322, 'z': '5th'},
-{'x': 56.5, 'y': 14.731716, 'z': '10th'},
-{'x': 56.5, 'y': 15.82868259, 'z': '25th'},
-{'x': 56.5, 'y': 17.28858894, 'z': '50th'},
-{'x': 56.5, 'y': 19.09223862, 'z': '75th'},
-{'x': 56.5, 'y': 21.12770084, 'z': '90th'},
-{'x': 56.5, 'y': 22.60147865, 'z': '95th'},
-{'x': 56.5, 'y': 23.69063187, 'z': '97th'},
-{'x': 57.5, 'y': 13.9373231, 'z': '3rd'},
-{'x': 57.5, 'y': 14.29080875, 'z': '5th'},
-{'x': 57.5, 'y': 14.87682577, 'z': '10th'},
-{'x': 57.5, 'y': 15.9886834, 'z': '25th'},
-{'x': 57.5, 'y': 17.47052444, 'z': '50th'},
-{'x': 57.5, 'y': 19.30483153, 'z': '75th'},
-{'x': 57.5, 'y': 21.37993353, 'z': '90th'},
-{'x': 57.5, 'y': 22.88594093, 'z': '95th'},
-{'x': 57.5, 'y': 24.00089913, 'z': '97th'},
-{'x': 58.5, 'y': 14.07169977, 'z': '3rd'},
-{'x': 58.5, 'y': 14.42947441, 'z': '5th'},
-{'x': 58.5, 'y': 15.02287453, 'z': '10th'},
-{'x': 58.5, 'y': 16.14971251, 'z': '25th'},
-{'x': 58.5, 'y': 17.65360733, 'z': '50th'},
-{'x': 58.5, 'y': 19.51873814, 'z': '75th'},
-{'x': 58.5, 'y': 21.63372961, 'z': '90th'},
-{'x': 58.5, 'y': 23.17221677, 'z': '95th'},
-{'x': 58.5, 'y': 24.31321719, 'z': '97th'},
-{'x': 59.5, 'y': 14.20687088, 'z': '3rd'},
-{'x': 59.5, 'y': 14.56896986, 'z': '5th'},
-{'x': 59.5, 'y': 15.16981002, 'z': '10th'},
-{'x': 59.5, 'y': 16.31173224, 'z': '25th'},
-{'x': 59.5, 'y': 17.83781722, 'z': '50th'},
-{'x': 59.5, 'y': 19.73395429, 'z': '75th'},
-{'x': 59.5, 'y': 21.88909396, 'z': '90th'},
-{'x': 59.5, 'y': 23.46031012, 'z': '95th'},
-{'x': 59.5, 'y': 24.62758492, 'z': '97th'},
-{'x': 60.5, 'y': 14.34277271, 'z': '3rd'},
-{'x': 60.5, 'y': 14.70923661, 'z': '5th'},
-{'x': 60.5, 'y': 15.31758235, 'z': '10th'},
-{'x': 60.5, 'y': 16.47470852, 'z': '25th'},
-{'x': 60.5, 'y': 18.02313904, 'z': '50th'},
-{'x': 60.5, 'y': 19.95048336, 'z': '75th'},
-{'x': 60.5, 'y': 22.14604136, 'z': '90th'},
-{'x': 60.5, 'y': 23.75023626, 'z': '95th'},
-{'x': 60.5, 'y': 24.94401317, 'z': '97th'},
-{'x': 61.5, 'y': 14.47934293, 'z': '3rd'},
-{'x': 61.5, 'y': 14.85021811, 'z': '5th'},
-{'x': 61.5, 'y': 15.46614444, 'z': '10th'},
-{'x': 61.5, 'y': 16.63861163, 'z': '25th'},
-{'x': 61.5, 'y': 18.20956418, 'z': '50th'},
-{'x': 61.5, 'y': 20.16833747, 'z': '75th'},
-{'x': 61.5, 'y': 22.40459718, 'z': '90th'},
-{'x': 61.5, 'y': 24.04202158, 'z': '95th'},
-{'x': 61.5, 'y': 25.26252369, 'z': '97th'},
-{'x': 62.5, 'y': 14.61652406, 'z': '3rd'},
-{'x': 62.5, 'y': 14.9918623, 'z': '5th'},
-{'x': 62.5, 'y': 15.61545325, 'z': '10th'},
-{'x': 62.5, 'y': 16.80341543, 'z': '25th'},
-{'x': 62.5, 'y': 18.3970876, 'z': '50th'},
-{'x': 62.5, 'y': 20.38753372, 'z': '75th'},
-{'x': 62.5, 'y': 22.66479513, 'z': '90th'},
-{'x': 62.5, 'y': 24.33570429, 'z': '95th'},
-{'x': 62.5, 'y': 25.5831532, 'z': '97th'},
-{'x': 63.5, 'y': 14.75426001, 'z': '3rd'},
-{'x': 63.5, 'y': 15.13411929, 'z': '5th'},
-{'x': 63.5, 'y': 15.76546914, 'z': '10th'},
-{'x': 63.5, 'y': 16.96909934, 'z': '25th'},
-{'x': 63.5, 'y': 18.58571243, 'z': '50th'},
-{'x': 63.5, 'y': 20.60809964, 'z': '75th'},
-{'x': 63.5, 'y': 22.92668027, 'z': '90th'},
-{'x': 63.5, 'y': 24.63133325, 'z': '95th'},
-{'x': 63.5, 'y': 25.90594748, 'z': '97th'},
-{'x': 64.5, 'y': 14.89249907, 'z': '3rd'},
-{'x': 64.5, 'y': 15.27694359, 'z': '5th'},
-{'x': 64.5, 'y': 15.91615695, 'z': '10th'},
-{'x': 64.5, 'y': 17.13564756, 'z': '25th'},
-{'x': 64.5, 'y': 18.77544728, 'z': '50th'},
-{'x': 64.5, 'y': 20.83006969, 'z': '75th'},
-{'x': 64.5, 'y': 23.19030686, 'z': '90th'},
-{'x': 64.5, 'y': 24.92896835, 'z': '95th'},
-{'x': 64.5, 'y': 26.23096473, 'z': '97th'},
-{'x': 65.5, 'y': 15.03119376, 'z': '3rd'},
-{'x': 65.5, 'y': 15.42029408, 'z': '5th'},
-{'x': 65.5, 'y': 16.06748615, 'z': '10th'},
-{'x': 65.5, 'y': 17.30304956, 'z': '25th'},
-{'x': 65.5, 'y': 18.966307, 'z': '50th'},
-{'x': 65.5, 'y': 21.05348599, 'z': '75th'},
-{'x': 65.5, 'y': 23.45573857, 'z': '90th'},
-{'x': 65.5, 'y': 25.22868007, 'z': '95th'},
-{'x': 65.5, 'y': 26.55827443, 'z': '97th'},
-{'x': 66.5, 'y': 15.17030121, 'z': '3rd'},
-{'x': 66.5, 'y': 15.56413437, 'z': '5th'},
-{'x': 66.5, 'y': 16.21943117, 'z': '10th'},
-{'x': 66.5, 'y': 17.4713002, 'z': '25th'},
-{'x': 66.5, 'y': 19.15831267, 'z': '50th'},
-{'x': 66.5, 'y': 21.27839816, 'z': '75th'},
-{'x': 66.5, 'y': 23.72304816, 'z': '90th'},
-{'x': 66.5, 'y': 25.5305491, 'z': '95th'},
-{'x': 66.5, 'y': 26.88795694, 'z': '97th'},
-{'x': 67.5, 'y': 15.30978338, 'z': '3rd'},
-{'x': 67.5, 'y': 15.70843301, 'z': '5th'},
-{'x': 67.5, 'y': 16.37197155, 'z': '10th'},
-{'x': 67.5, 'y': 17.64039992, 'z': '25th'},
-{'x': 67.5, 'y': 19.35149163, 'z': '50th'},
-{'x': 67.5, 'y': 21.50486316, 'z': '75th'},
-{'x': 67.5, 'y': 23.99231712, 'z': '90th'},
-{'x': 67.5, 'y': 25.83466581, 'z': '95th'},
-{'x': 67.5, 'y': 27.2201029, 'z': '97th'},
-{'x': 68.5, 'y': 15.4496077, 'z': '3rd'},
-{'x': 68.5, 'y': 15.85316397, 'z': '5th'},
-{'x': 68.5, 'y': 16.52509225, 'z': '10th'},
-{'x': 68.5, 'y': 17.81035463, 'z': '25th'},
-{'x': 68.5, 'y': 19.54587708, 'z': '50th'},
-{'x': 68.5, 'y': 21.7329446, 'z': '75th'},
-{'x': 68.5, 'y': 24.263635, 'z': '90th'},
-{'x': 68.5, 'y': 26.14112991, 'z': '95th'},
-{'x': 68.5, 'y': 27.55481321, 'z': '97th'},
-{'x': 69.5, 'y': 15.5897467, 'z': '3rd'},
-{'x': 69.5, 'y': 15.99830645, 'z': '5th'},
-{'x': 69.5, 'y': 16.67878363, 'z': '10th'},
-{'x': 69.5, 'y': 17.98117606, 'z': '25th'},
-{'x': 69.5, 'y': 19.74150854, 'z': '50th'},
-{'x': 69.5, 'y': 21.96271325, 'z': '75th'},
-{'x': 69.5, 'y': 24.53709941, 'z': '90th'},
-{'x': 69.5, 'y': 26.45004964, 'z': '95th'},
-{'x': 69.5, 'y': 27.89219758, 'z': '97th'},
-{'x': 70.5, 'y': 15.73017845, 'z': '3rd'},
-{'x': 70.5, 'y': 16.1438452, 'z': '5th'},
-{'x': 70.5, 'y': 16.83304163, 'z': '10th'},
-{'x': 70.5, 'y': 18.15288153, 'z': '25th'},
-{'x': 70.5, 'y': 19.93843145, 'z': '50th'},
-{'x': 70.5, 'y': 22.19424627, 'z': '75th'},
-{'x': 70.5, 'y': 24.8128152, 'z': '90th'},
-{'x': 70.5, 'y': 26.76154129, 'z': '95th'},
-{'x': 70.5, 'y': 28.2323743, 'z': '97th'},
-{'x': 71.5, 'y': 15.87088741, 'z': '3rd'},
-{'x': 71.5, 'y': 16.28977109, 'z': '5th'},
-{'x': 71.5, 'y': 16.98786798, 'z': '10th'},
-{'x': 71.5, 'y': 18.32549376, 'z': '25th'},
-{'x': 71.5, 'y': 20.13669623, 'z': '50th'},
-{'x': 71.5, 'y': 22.42762598, 'z': '75th'},
-{'x': 71.5, 'y': 25.09089343, 'z': '90th'},
-{'x': 71.5, 'y': 27.07572865, 'z': '95th'},
-{'x': 71.5, 'y': 28.57547042, 'z': '97th'},
-{'x': 72.5, 'y': 16.01186303, 'z': '3rd'},
-{'x': 72.5, 'y': 16.43608019, 'z': '5th'},
-{'x': 72.5, 'y': 17.14326985, 'z': '10th'},
-{'x': 72.5, 'y': 18.49904125, 'z': '25th'},
-{'x': 72.5, 'y': 20.33635961, 'z': '50th'},
-{'x': 72.5, 'y': 22.66294138, 'z': '75th'},
-{'x': 72.5, 'y': 25.3714519, 'z': '90th'},
-{'x': 72.5, 'y': 27.39274198, 'z': '95th'},
-{'x': 72.5, 'y': 28.92161906, 'z': '97th'},
-{'x': 73.5, 'y': 16.15310112, 'z': '3rd'},
-{'x': 73.5, 'y': 16.58277468, 'z': '5th'},
-{'x': 73.5, 'y': 17.29926017, 'z': '10th'},
-{'x': 73.5, 'y': 18.67355775, 'z': '25th'},
-{'x': 73.5, 'y': 20.53748298, 'z': '50th'},
-{'x': 73.5, 'y': 22.90028597, 'z': '75th'},
-{'x': 73.5, 'y': 25.65461346, 'z': '90th'},
-{'x': 73.5, 'y': 27.71271759, 'z': '95th'},
-{'x': 73.5, 'y': 29.27096042, 'z': '97th'},
-{'x': 74.5, 'y': 16.29460329, 'z': '3rd'},
-{'x': 74.5, 'y': 16.72986243, 'z': '5th'},
-{'x': 74.5, 'y': 17.4558574, 'z': '10th'},
-{'x': 74.5, 'y': 18.84908224, 'z': '25th'},
-{'x': 74.5, 'y': 20.74013277, 'z': '50th'},
-{'x': 74.5, 'y': 23.13975807, 'z': '75th'},
-{'x': 74.5, 'y': 25.94050589, 'z': '90th'},
-{'x': 74.5, 'y': 28.03579694, 'z': '95th'},
-{'x': 74.5, 'y': 29.62364011, 'z': '97th'},
-{'x': 75.5, 'y': 16.43637669, 'z': '3rd'},
-{'x': 75.5, 'y': 16.87735682, 'z': '5th'},
-{'x': 75.5, 'y': 17.61308542, 'z': '10th'},
-{'x': 75.5, 'y': 19.02565892, 'z': '25th'},
-{'x': 75.5, 'y': 20.94438028, 'z': '50th'},
-{'x': 75.5, 'y': 23.38146064, 'z': '75th'},
-{'x': 75.5, 'y': 26.22926131, 'z': '90th'},
-{'x': 75.5, 'y': 28.36212579, 'z': '95th'},
-{'x': 75.5, 'y': 29.97980811, 'z': '97th'},
-{'x': 76.5, 'y': 16.57843458, 'z': '3rd'},
-{'x': 76.5, 'y': 17.02527707, 'z': '5th'},
-{'x': 76.5, 'y': 17.77097356, 'z': '10th'},
-{'x': 76.5, 'y': 19.20333679, 'z': '25th'},
-{'x': 76.5, 'y': 21.15030093, 'z': '50th'},
-{'x': 76.5, 'y': 23.62550009, 'z': '75th'},
-{'x': 76.5, 'y': 26.52101516, 'z': '90th'},
-{'x': 76.5, 'y': 28.69185351, 'z': '95th'},
-{'x': 76.5, 'y': 30.33961853, 'z': '97th'},
-{'x': 77.5, 'y': 16.72079656, 'z': '3rd'},
-{'x': 77.5, 'y': 17.17364841, 'z': '5th'},
-{'x': 77.5, 'y': 17.92955656, 'z': '10th'},
-{'x': 77.5, 'y': 19.38216922, 'z': '25th'},
-{'x': 77.5, 'y': 21.35797332, 'z': '50th'},
-{'x': 77.5, 'y': 23.87198507, 'z': '75th'},
-{'x': 77.5, 'y': 26.815905, 'z': '90th'},
-{'x': 77.5, 'y': 29.02513239, 'z': '95th'},
-{'x': 77.5, 'y': 30.70322948, 'z': '97th'},
-{'x': 78.5, 'y': 16.86348713, 'z': '3rd'},
-{'x': 78.5, 'y': 17.32250091, 'z': '5th'},
-{'x': 78.5, 'y': 18.08887399, 'z': '10th'},
-{'x': 78.5, 'y': 19.56221428, 'z': '25th'},
-{'x': 78.5, 'y': 21.56748045, 'z': '50th'},
-{'x': 78.5, 'y': 24.12102802, 'z': '75th'},
-{'x': 78.5, 'y': 27.11407112, 'z': '90th'},
-{'x': 78.5, 'y': 29.36211644, 'z': '95th'},
-{'x': 78.5, 'y': 31.07080008, 'z': '97th'},
-{'x': 79.5, 'y': 17.00653572, 'z': '3rd'},
-{'x': 79.5, 'y': 17.47186953, 'z': '5th'},
-{'x': 79.5, 'y': 18.24897012, 'z': '10th'},
-{'x': 79.5, 'y': 19.74353436, 'z': '25th'},
-{'x': 79.5, 'y': 21.77890902, 'z': '50th'},
-{'x': 79.5, 'y': 24.37274421, 'z': '75th'},
-{'x': 79.5, 'y': 27.41565556, 'z': '90th'},
-{'x': 79.5, 'y': 29.70296069, 'z': '95th'},
-{'x': 79.5, 'y': 31.44248988, 'z': '97th'},
-{'x': 80.5, 'y': 17.14997871, 'z': '3rd'},
-{'x': 80.5, 'y': 17.62179544, 'z': '5th'},
-{'x': 80.5, 'y': 18.40989435, 'z': '10th'},
-{'x': 80.5, 'y': 19.92619507, 'z': '25th'},
-{'x': 80.5, 'y': 21.99234686, 'z': '50th'},
-{'x': 80.5, 'y': 24.62724833, 'z': '75th'},
-{'x': 80.5, 'y': 27.72079958, 'z': '90th'},
-{'x': 80.5, 'y': 30.04782073, 'z': '95th'},
-{'x': 80.5, 'y': 31.81846107, 'z': '97th'},
-{'x': 81.5, 'y': 17.2938564, 'z': '3rd'},
-{'x': 81.5, 'y': 17.77232382, 'z': '5th'},
-{'x': 81.5, 'y': 18.57170012, 'z': '10th'},
-{'x': 81.5, 'y': 20.110266, 'z': '25th'},
-{'x': 81.5, 'y': 22.20788541, 'z': '50th'},
-{'x': 81.5, 'y': 24.88465774, 'z': '75th'},
-{'x': 81.5, 'y': 28.02964533, 'z': '90th'},
-{'x': 81.5, 'y': 30.39685131, 'z': '95th'},
-{'x': 81.5, 'y': 32.19887352, 'z': '97th'},
-{'x': 82.5, 'y': 17.43821437, 'z': '3rd'},
-{'x': 82.5, 'y': 17.92350474, 'z': '5th'},
-{'x': 82.5, 'y': 18.73444512, 'z': '10th'},
-{'x': 82.5, 'y': 20.29581981, 'z': '25th'},
-{'x': 82.5, 'y': 22.4256177, 'z': '50th'},
-{'x': 82.5, 'y': 25.14508981, 'z': '75th'},
-{'x': 82.5, 'y': 28.3423338, 'z': '90th'},
-{'x': 82.5, 'y': 30.75020585, 'z': '95th'},
-{'x': 82.5, 'y': 32.58388611, 'z': '97th'},
-{'x': 83.5, 'y': 17.58310295, 'z': '3rd'},
-{'x': 83.5, 'y': 18.07539265, 'z': '5th'},
-{'x': 83.5, 'y': 18.89819089, 'z': '10th'},
-{'x': 83.5, 'y': 20.48293203, 'z': '25th'},
-{'x': 83.5, 'y': 22.64563824, 'z': '50th'},
-{'x': 83.5, 'y': 25.40866182, 'z': '75th'},
-{'x': 83.5, 'y': 28.65900443, 'z': '90th'},
-{'x': 83.5, 'y': 31.10803553, 'z': '95th'},
-{'x': 83.5, 'y': 32.97365535, 'z': '97th'},
-{'x': 84.5, 'y': 17.72857693, 'z': '3rd'},
-{'x': 84.5, 'y': 18.2280462, 'z': '5th'},
-{'x': 84.5, 'y': 19.06300261, 'z': '10th'},
-{'x': 84.5, 'y': 20.67168066, 'z': '25th'},
-{'x': 84.5, 'y': 22.86804258, 'z': '50th'},
-{'x': 84.5, 'y': 25.67549032, 'z': '75th'},
-{'x': 84.5, 'y': 28.97979428, 'z': '90th'},
-{'x': 84.5, 'y': 31.47048848, 'z': '95th'},
-{'x': 84.5, 'y': 33.3683346, 'z': '97th'},
-{'x': 85.5, 'y': 17.87469542, 'z': '3rd'},
-{'x': 85.5, 'y': 18.38152794, 'z': '5th'},
-{'x': 85.5, 'y': 19.22894873, 'z': '10th'},
-{'x': 85.5, 'y': 20.86214582, 'z': '25th'},
-{'x': 85.5, 'y': 23.09292679, 'z': '50th'},
-{'x': 85.5, 'y': 25.94569055, 'z': '75th'},
-{'x': 85.5, 'y': 29.30483741, 'z': '90th'},
-{'x': 85.5, 'y': 31.83770901, 'z': '95th'},
-{'x': 85.5, 'y': 33.76807319, 'z': '97th'},
-{'x': 86.5, 'y': 18.02152302, 'z': '3rd'},
-{'x': 86.5, 'y': 18.53590513, 'z': '5th'},
-{'x': 86.5, 'y': 19.39610118, 'z': '10th'},
-{'x': 86.5, 'y': 21.05440884, 'z': '25th'},
-{'x': 86.5, 'y': 23.32038549, 'z': '50th'},
-{'x': 86.5, 'y': 26.21937378, 'z': '75th'},
-{'x': 86.5, 'y': 29.63426278, 'z': '90th'},
-{'x': 86.5, 'y': 32.2098371, 'z': '95th'},
-{'x': 86.5, 'y': 34.17301785, 'z': '97th'},
-{'x': 87.5, 'y': 18.16912246, 'z': '3rd'},
-{'x': 87.5, 'y': 18.69124428, 'z': '5th'},
-{'x': 87.5, 'y': 19.56453273, 'z': '10th'},
-{'x': 87.5, 'y': 21.24855446, 'z': '25th'},
-{'x': 87.5, 'y': 23.55051871, 'z': '50th'},
-{'x': 87.5, 'y': 26.49665657, 'z': '75th'},
-{'x': 87.5, 'y': 29.96819988, 'z': '90th'},
-{'x': 87.5, 'y': 32.58700628, 'z': '95th'},
-{'x': 87.5, 'y': 34.5833014, 'z': '97th'},
-{'x': 88.5, 'y': 18.31756871, 'z': '3rd'},
-{'x': 88.5, 'y': 18.84762137, 'z': '5th'},
-{'x': 88.5, 'y': 19.73432134, 'z': '10th'},
-{'x': 88.5, 'y': 21.44466518, 'z': '25th'},
-{'x': 88.5, 'y': 23.78341652, 'z': '50th'},
-{'x': 88.5, 'y': 26.77764034, 'z': '75th'},
-{'x': 88.5, 'y': 30.30676532, 'z': '90th'},
-{'x': 88.5, 'y': 32.96934568, 'z': '95th'},
-{'x': 88.5, 'y': 34.99906317, 'z': '97th'},
-{'x': 89.5, 'y': 18.46693089, 'z': '3rd'},
-{'x': 89.5, 'y': 19.00510849, 'z': '5th'},
-{'x': 89.5, 'y': 19.90554403, 'z': '10th'},
-{'x': 89.5, 'y': 21.64282737, 'z': '25th'},
-{'x': 89.5, 'y': 24.01917703, 'z': '50th'},
-{'x': 89.5, 'y': 27.06243533, 'z': '75th'},
-{'x': 89.5, 'y': 30.65007797, 'z': '90th'},
-{'x': 89.5, 'y': 33.35697585, 'z': '95th'},
-{'x': 89.5, 'y': 35.42042208, 'z': '97th'},
-{'x': 90.5, 'y': 18.61728653, 'z': '3rd'},
-{'x': 90.5, 'y': 19.16378421, 'z': '5th'},
-{'x': 90.5, 'y': 20.07828129, 'z': '10th'},
-{'x': 90.5, 'y': 21.84312554, 'z': '25th'},
-{'x': 90.5, 'y': 24.25789074, 'z': '50th'},
-{'x': 90.5, 'y': 27.35113996, 'z': '75th'},
-{'x': 90.5, 'y': 30.99824532, 'z': '90th'},
-{'x': 90.5, 'y': 33.75001097, 'z': '95th'},
-{'x': 90.5, 'y': 35.84749737, 'z': '97th'},
-{'x': 91.5, 'y': 18.76871394, 'z': '3rd'},
-{'x': 91.5, 'y': 19.32372789, 'z': '5th'},
-{'x': 91.5, 'y': 20.25261432, 'z': '10th'},
-{'x': 91.5, 'y': 22.04564463, 'z': '25th'},
-{'x': 91.5, 'y': 24.49964778, 'z': '50th'},
-{'x': 91.5, 'y': 27.64385046, 'z': '75th'},
-{'x': 91.5, 'y': 31.3513695, 'z': '90th'},
-{'x': 91.5, 'y': 34.14855665, 'z': '95th'},
-{'x': 91.5, 'y': 36.28039703, 'z': '97th'},
-{'x': 92.5, 'y': 18.92129383, 'z': '3rd'},
-{'x': 92.5, 'y': 19.48502077, 'z': '5th'},
-{'x': 92.5, 'y': 20.42862531, 'z': '10th'},
-{'x': 92.5, 'y': 22.25046892, 'z': '25th'},
-{'x': 92.5, 'y': 24.74453536, 'z': '50th'},
-{'x': 92.5, 'y': 27.94065757, 'z': '75th'},
-{'x': 92.5, 'y': 31.70954484, 'z': '90th'},
-{'x': 92.5, 'y': 34.55270981, 'z': '95th'},
-{'x': 92.5, 'y': 36.71922013, 'z': '97th'},
-{'x': 93.5, 'y': 19.07510898, 'z': '3rd'},
-{'x': 93.5, 'y': 19.64774563, 'z': '5th'},
-{'x': 93.5, 'y': 20.60639712, 'z': '10th'},
-{'x': 93.5, 'y': 22.45768158, 'z': '25th'},
-{'x': 93.5, 'y': 24.99263735, 'z': '50th'},
-{'x': 93.5, 'y': 28.24164611, 'z': '75th'},
-{'x': 93.5, 'y': 32.07285742, 'z': '90th'},
-{'x': 93.5, 'y': 34.96255799, 'z': '95th'},
-{'x': 93.5, 'y': 37.16405609, 'z': '97th'},
-{'x': 94.5, 'y': 19.23024402, 'z': '3rd'},
-{'x': 94.5, 'y': 19.8119865, 'z': '5th'},
-{'x': 94.5, 'y': 20.7860129, 'z': '10th'},
-{'x': 94.5, 'y': 22.6673643, 'z': '25th'},
-{'x': 94.5, 'y': 25.24403371, 'z': '50th'},
-{'x': 94.5, 'y': 28.54689431, 'z': '75th'},
-{'x': 94.5, 'y': 32.44138436, 'z': '90th'},
-{'x': 94.5, 'y': 35.37817885, 'z': '95th'},
-{'x': 94.5, 'y': 37.61498429, 'z': '97th'},
-{'x': 95.5, 'y': 19.38678267, 'z': '3rd'},
-{'x': 95.5, 'y': 19.9778266, 'z': '5th'},
-{'x': 95.5, 'y': 20.96755499, 'z': '10th'},
-{'x': 95.5, 'y': 22.87959773, 'z': '25th'},
-{'x': 95.5, 'y': 25.49880264, 'z': '50th'},
-{'x': 95.5, 'y': 28.85647669, 'z': '75th'},
-{'x': 95.5, 'y': 32.81519554, 'z': '90th'},
-{'x': 95.5, 'y': 35.79963916, 'z': '95th'},
-{'x': 95.5, 'y': 38.07206991, 'z': '97th'},
-{'x': 96.5, 'y': 19.54481057, 'z': '3rd'},
-{'x': 96.5, 'y': 20.14535023, 'z': '5th'},
-{'x': 96.5, 'y': 21.15110555, 'z': '10th'},
-{'x': 96.5, 'y': 23.09445998, 'z': '25th'},
-{'x': 96.5, 'y': 25.7570168, 'z': '50th'},
-{'x': 96.5, 'y': 29.17045929, 'z': '75th'},
-{'x': 96.5, 'y': 33.19435025, 'z': '90th'},
-{'x': 96.5, 'y': 36.2269949, 'z': '95th'},
-{'x': 96.5, 'y': 38.53536809, 'z': '97th'},
-{'x': 97.5, 'y': 19.70441527, 'z': '3rd'},
-{'x': 97.5, 'y': 20.31464276, 'z': '5th'},
-{'x': 97.5, 'y': 21.33674635, 'z': '10th'},
-{'x': 97.5, 'y': 23.31202608, 'z': '25th'},
-{'x': 97.5, 'y': 26.01874261, 'z': '50th'},
-{'x': 97.5, 'y': 29.4888987, 'z': '75th'},
-{'x': 97.5, 'y': 33.5788965, 'z': '90th'},
-{'x': 97.5, 'y': 36.66029091, 'z': '95th'},
-{'x': 97.5, 'y': 39.00492396, 'z': '97th'},
-{'x': 98.5, 'y': 19.86568272, 'z': '3rd'},
-{'x': 98.5, 'y': 20.48578791, 'z': '5th'},
-{'x': 98.5, 'y': 21.52455736, 'z': '10th'},
-{'x': 98.5, 'y': 23.53236883, 'z': '25th'},
-{'x': 98.5, 'y': 26.28404312, 'z': '50th'},
-{'x': 98.5, 'y': 29.8118461, 'z': '75th'},
-{'x': 98.5, 'y': 33.9688734, 'z': '90th'},
-{'x': 98.5, 'y': 37.09955982, 'z': '95th'},
-{'x': 98.5, 'y': 39.48076746, 'z': '97th'},
-{'x': 99.5, 'y': 20.02869944, 'z': '3rd'},
-{'x': 99.5, 'y': 20.65886924, 'z': '5th'},
-{'x': 99.5, 'y': 21.71461721, 'z': '10th'},
-{'x': 99.5, 'y': 23.75555744, 'z': '25th'},
-{'x': 99.5, 'y': 26.55297507, 'z': '50th'},
-{'x': 99.5, 'y': 30.13934341, 'z': '75th'},
-{'x': 99.5, 'y': 34.3643086, 'z': '90th'},
-{'x': 99.5, 'y': 37.54482215, 'z': '95th'},
-{'x': 99.5, 'y': 39.96291669, 'z': '97th'},
-{'x': 100.5, 'y': 20.19355165, 'z': '3rd'},
-{'x': 100.5, 'y': 20.83396942, 'z': '5th'},
-{'x': 100.5, 'y': 21.90700268, 'z': '10th'},
-{'x': 100.5, 'y': 23.98165745, 'z': '25th'},
-{'x': 100.5, 'y': 26.82558904, 'z': '50th'},
-{'x': 100.5, 'y': 30.47142364, 'z': '75th'},
-{'x': 100.5, 'y': 34.76521834, 'z': '90th'},
-{'x': 100.5, 'y': 37.99608589, 'z': '95th'},
-{'x': 100.5, 'y': 40.45137672, 'z': '97th'},
-{'x': 101.5, 'y': 20.36032458, 'z': '3rd'},
-{'x': 101.5, 'y': 21.01116968, 'z': '5th'},
-{'x': 101.5, 'y': 22.10178826, 'z': '10th'},
-{'x': 101.5, 'y': 24.21073043, 'z': '25th'},
-{'x': 101.5, 'y': 27.1019295, 'z': '50th'},
-{'x': 101.5, 'y': 30.80811106, 'z': '75th'},
-{'x': 101.5, 'y': 35.17160751, 'z': '90th'},
-{'x': 101.5, 'y': 38.45334608, 'z': '95th'},
-{'x': 101.5, 'y': 40.94613881, 'z': '97th'},
-{'x': 102.5, 'y': 20.52910239, 'z': '3rd'},
-{'x': 102.5, 'y': 21.19054959, 'z': '5th'},
-{'x': 102.5, 'y': 22.29904589, 'z': '10th'},
-{'x': 102.5, 'y': 24.44283365, 'z': '25th'},
-{'x': 102.5, 'y': 27.38203422, 'z': '50th'},
-{'x': 102.5, 'y': 31.14942058, 'z': '75th'},
-{'x': 102.5, 'y': 35.58346914, 'z': '90th'},
-{'x': 102.5, 'y': 38.91658465, 'z': '95th'},
-{'x': 102.5, 'y': 41.44718044, 'z': '97th'},
-{'x': 103.5, 'y': 20.6999678, 'z': '3rd'},
-{'x': 103.5, 'y': 21.37218677, 'z': '5th'},
-{'x': 103.5, 'y': 22.49884459, 'z': '10th'},
-{'x': 103.5, 'y': 24.67801969, 'z': '25th'},
-{'x': 103.5, 'y': 27.66593402, 'z': '50th'},
-{'x': 103.5, 'y': 31.49535747, 'z': '75th'},
-{'x': 103.5, 'y': 36.00078421, 'z': '90th'},
-{'x': 103.5, 'y': 39.38577014, 'z': '95th'},
-{'x': 103.5, 'y': 41.95446506, 'z': '97th'},
-{'x': 104.5, 'y': 20.8730018, 'z': '3rd'},
-{'x': 104.5, 'y': 21.55615653, 'z': '5th'},
-{'x': 104.5, 'y': 22.7012502, 'z': '10th'},
-{'x': 104.5, 'y': 24.9163362, 'z': '25th'},
-{'x': 104.5, 'y': 27.9536524, 'z': '50th'},
-{'x': 104.5, 'y': 31.8459171, 'z': '75th'},
-{'x': 104.5, 'y': 36.42352136, 'z': '90th'},
-{'x': 104.5, 'y': 39.86085756, 'z': '95th'},
-{'x': 104.5, 'y': 42.46794195, 'z': '97th'},
-{'x': 105.5, 'y': 21.04828336, 'z': '3rd'},
-{'x': 105.5, 'y': 21.74253164, 'z': '5th'},
-{'x': 105.5, 'y': 22.90632506, 'z': '10th'},
-{'x': 105.5, 'y': 25.15782551, 'z': '25th'},
-{'x': 105.5, 'y': 28.24520531, 'z': '50th'},
-{'x': 105.5, 'y': 32.20108468, 'z': '75th'},
-{'x': 105.5, 'y': 36.85163675, 'z': '90th'},
-{'x': 105.5, 'y': 40.3417882, 'z': '95th'},
-{'x': 105.5, 'y': 42.98754609, 'z': '97th'},
-{'x': 106.5, 'y': 21.22588911, 'z': '3rd'},
-{'x': 106.5, 'y': 21.93138197, 'z': '5th'},
-{'x': 106.5, 'y': 23.1141277, 'z': '10th'},
-{'x': 106.5, 'y': 25.40252443, 'z': '25th'},
-{'x': 106.5, 'y': 28.54060085, 'z': '50th'},
-{'x': 106.5, 'y': 32.56083507, 'z': '75th'},
-{'x': 106.5, 'y': 37.28507392, 'z': '90th'},
-{'x': 106.5, 'y': 40.82848957, 'z': '95th'},
-{'x': 106.5, 'y': 43.51319807, 'z': '97th'},
-{'x': 107.5, 'y': 21.40589307, 'z': '3rd'},
-{'x': 107.5, 'y': 22.12277423, 'z': '5th'},
-{'x': 107.5, 'y': 23.32471257, 'z': '10th'},
-{'x': 107.5, 'y': 25.65046392, 'z': '25th'},
-{'x': 107.5, 'y': 28.83983907, 'z': '50th'},
-{'x': 107.5, 'y': 32.92513255, 'z': '75th'},
-{'x': 107.5, 'y': 37.72376365, 'z': '90th'},
-{'x': 107.5, 'y': 41.32087531, 'z': '95th'},
-{'x': 107.5, 'y': 44.04480409, 'z': '97th'},
-{'x': 108.5, 'y': 21.58836636, 'z': '3rd'},
-{'x': 108.5, 'y': 22.31677169, 'z': '5th'},
-{'x': 108.5, 'y': 23.53812979, 'z': '10th'},
-{'x': 108.5, 'y': 25.90166889, 'z': '25th'},
-{'x': 108.5, 'y': 29.14291171, 'z': '50th'},
-{'x': 108.5, 'y': 33.29393074, 'z': '75th'},
-{'x': 108.5, 'y': 38.16762389, 'z': '90th'},
-{'x': 108.5, 'y': 41.8188452, 'z': '95th'},
-{'x': 108.5, 'y': 44.58225593, 'z': '97th'},
-{'x': 109.5, 'y': 21.77337689, 'z': '3rd'},
-{'x': 109.5, 'y': 22.51343388, 'z': '5th'},
-{'x': 109.5, 'y': 23.75442484, 'z': '10th'},
-{'x': 109.5, 'y': 26.15615792, 'z': '25th'},
-{'x': 109.5, 'y': 29.44980208, 'z': '50th'},
-{'x': 109.5, 'y': 33.66717239, 'z': '75th'},
-{'x': 109.5, 'y': 38.61655976, 'z': '90th'},
-{'x': 109.5, 'y': 42.32228515, 'z': '95th'},
-{'x': 109.5, 'y': 45.12543098, 'z': '97th'},
-{'x': 110.5, 'y': 21.96098914, 'z': '3rd'},
-{'x': 110.5, 'y': 22.71281638, 'z': '5th'},
-{'x': 110.5, 'y': 23.97363834, 'z': '10th'},
-{'x': 110.5, 'y': 26.41394306, 'z': '25th'},
-{'x': 110.5, 'y': 29.76048479, 'z': '50th'},
-{'x': 110.5, 'y': 34.04478937, 'z': '75th'},
-{'x': 110.5, 'y': 39.0704635, 'z': '90th'},
-{'x': 110.5, 'y': 42.83106725, 'z': '95th'},
-{'x': 110.5, 'y': 45.67419242, 'z': '97th'},
-{'x': 111.5, 'y': 22.15126389, 'z': '3rd'},
-{'x': 111.5, 'y': 22.91497052, 'z': '5th'},
-{'x': 111.5, 'y': 24.19580583, 'z': '10th'},
-{'x': 111.5, 'y': 26.67502964, 'z': '25th'},
-{'x': 111.5, 'y': 30.0749257, 'z': '50th'},
-{'x': 111.5, 'y': 34.42670255, 'z': '75th'},
-{'x': 111.5, 'y': 39.52921454, 'z': '90th'},
-{'x': 111.5, 'y': 43.34504991, 'z': '95th'},
-{'x': 111.5, 'y': 46.22838923, 'z': '97th'},
-{'x': 112.5, 'y': 22.34425792, 'z': '3rd'},
-{'x': 112.5, 'y': 23.11994316, 'z': '5th'},
-{'x': 112.5, 'y': 24.4209575, 'z': '10th'},
-{'x': 112.5, 'y': 26.93941607, 'z': '25th'},
-{'x': 112.5, 'y': 30.39308176, 'z': '50th'},
-{'x': 112.5, 'y': 34.8128218, 'z': '75th'},
-{'x': 112.5, 'y': 39.99267955, 'z': '90th'},
-{'x': 112.5, 'y': 43.86407795, 'z': '95th'},
-{'x': 112.5, 'y': 46.78785646, 'z': '97th'},
-{'x': 113.5, 'y': 22.54002382, 'z': '3rd'},
-{'x': 113.5, 'y': 23.32777646, 'z': '5th'},
-{'x': 113.5, 'y': 24.64911804, 'z': '10th'},
-{'x': 113.5, 'y': 27.20709368, 'z': '25th'},
-{'x': 113.5, 'y': 30.71490093, 'z': '50th'},
-{'x': 113.5, 'y': 35.20304599, 'z': '75th'},
-{'x': 113.5, 'y': 40.46071256, 'z': '90th'},
-{'x': 113.5, 'y': 44.38798278, 'z': '95th'},
-{'x': 113.5, 'y': 47.3524154, 'z': '97th'},
-{'x': 114.5, 'y': 22.73860975, 'z': '3rd'},
-{'x': 114.5, 'y': 23.53850764, 'z': '5th'},
-{'x': 114.5, 'y': 24.88030638, 'z': '10th'},
-{'x': 114.5, 'y': 27.47804659, 'z': '25th'},
-{'x': 114.5, 'y': 31.0403221, 'z': '50th'},
-{'x': 114.5, 'y': 35.59726302, 'z': '75th'},
-{'x': 114.5, 'y': 40.9331551, 'z': '90th'},
-{'x': 114.5, 'y': 44.91658265, 'z': '95th'},
-{'x': 114.5, 'y': 47.92187383, 'z': '97th'},
-{'x': 115.5, 'y': 22.94005917, 'z': '3rd'},
-{'x': 115.5, 'y': 23.7521688, 'z': '5th'},
-{'x': 115.5, 'y': 25.11453557, 'z': '10th'},
-{'x': 115.5, 'y': 27.75225159, 'z': '25th'},
-{'x': 115.5, 'y': 31.36927506, 'z': '50th'},
-{'x': 115.5, 'y': 35.99534989, 'z': '75th'},
-{'x': 115.5, 'y': 41.40983639, 'z': '90th'},
-{'x': 115.5, 'y': 45.44968284, 'z': '95th'},
-{'x': 115.5, 'y': 48.49602631, 'z': '97th'},
-{'x': 116.5, 'y': 23.14441069, 'z': '3rd'},
-{'x': 116.5, 'y': 23.96878672, 'z': '5th'},
-{'x': 116.5, 'y': 25.35181259, 'z': '10th'},
-{'x': 116.5, 'y': 28.029678, 'z': '25th'},
-{'x': 116.5, 'y': 31.7016805, 'z': '50th'},
-{'x': 116.5, 'y': 36.3971728, 'z': '75th'},
-{'x': 116.5, 'y': 41.89057352, 'z': '90th'},
-{'x': 116.5, 'y': 45.98707597, 'z': '95th'},
-{'x': 116.5, 'y': 49.07465451, 'z': '97th'},
-{'x': 117.5, 'y': 23.35169781, 'z': '3rd'},
-{'x': 117.5, 'y': 24.18838263, 'z': '5th'},
-{'x': 117.5, 'y': 25.59213818, 'z': '10th'},
-{'x': 117.5, 'y': 28.31028765, 'z': '25th'},
-{'x': 117.5, 'y': 32.03744999, 'z': '50th'},
-{'x': 117.5, 'y': 36.80258726, 'z': '75th'},
-{'x': 117.5, 'y': 42.37517172, 'z': '90th'},
-{'x': 117.5, 'y': 46.52854232, 'z': '95th'},
-{'x': 117.5, 'y': 49.65752758, 'z': '97th'},
-{'x': 118.5, 'y': 23.56194878, 'z': '3rd'},
-{'x': 118.5, 'y': 24.4109721, 'z': '5th'},
-{'x': 118.5, 'y': 25.83550673, 'z': '10th'},
-{'x': 118.5, 'y': 28.59403476, 'z': '25th'},
-{'x': 118.5, 'y': 32.37648607, 'z': '50th'},
-{'x': 118.5, 'y': 37.21143829, 'z': '75th'},
-{'x': 118.5, 'y': 42.86342465, 'z': '90th'},
-{'x': 118.5, 'y': 47.07385017, 'z': '95th'},
-{'x': 118.5, 'y': 50.24440253, 'z': '97th'},
-{'x': 119.5, 'y': 23.77518637, 'z': '3rd'},
-{'x': 119.5, 'y': 24.63656488, 'z': '5th'},
-{'x': 119.5, 'y': 26.08190616, 'z': '10th'},
-{'x': 119.5, 'y': 28.88086594, 'z': '25th'},
-{'x': 119.5, 'y': 32.71868225, 'z': '50th'},
-{'x': 119.5, 'y': 37.62356058, 'z': '75th'},
-{'x': 119.5, 'y': 43.35511467, 'z': '90th'},
-{'x': 119.5, 'y': 47.62275619, 'z': '95th'},
-{'x': 119.5, 'y': 50.83502464, 'z': '97th'},
-{'x': 120.5, 'y': 23.99142774, 'z': '3rd'},
-{'x': 120.5, 'y': 24.86516468, 'z': '5th'},
-{'x': 120.5, 'y': 26.33131782, 'z': '10th'},
-{'x': 120.5, 'y': 29.17072015, 'z': '25th'},
-{'x': 120.5, 'y': 33.06392318, 'z': '50th'},
-{'x': 120.5, 'y': 38.03877869, 'z': '75th'},
-{'x': 120.5, 'y': 43.85001322, 'z': '90th'},
-{'x': 120.5, 'y': 48.17500585, 'z': '95th'},
-{'x': 120.5, 'y': 51.42912799, 'z': '97th'},
-{'x': 121.5, 'y': 24.21068424, 'z': '3rd'},
-{'x': 121.5, 'y': 25.09676913, 'z': '5th'},
-{'x': 121.5, 'y': 26.58371638, 'z': '10th'},
-{'x': 121.5, 'y': 29.4635287, 'z': '25th'},
-{'x': 121.5, 'y': 33.4120847, 'z': '50th'},
-{'x': 121.5, 'y': 38.45690737, 'z': '75th'},
-{'x': 121.5, 'y': 44.34788119, 'z': '90th'},
-{'x': 121.5, 'y': 48.73033386, 'z': '95th'},
-{'x': 121.5, 'y': 52.02643587, 'z': '97th'},
-{'x': 122.5, 'y': 24.43296131, 'z': '3rd'},
-{'x': 122.5, 'y': 25.33136962, 'z': '5th'},
-{'x': 122.5, 'y': 26.8390698, 'z': '10th'},
-{'x': 122.5, 'y': 29.7592153, 'z': '25th'},
-{'x': 122.5, 'y': 33.76303402, 'z': '50th'},
-{'x': 122.5, 'y': 38.87775177, 'z': '75th'},
-{'x': 122.5, 'y': 44.84846931, 'z': '90th'},
-{'x': 122.5, 'y': 49.28846466, 'z': '95th'},
-{'x': 122.5, 'y': 52.62666135, 'z': '97th'},
-{'x': 123.5, 'y': 24.65825833, 'z': '3rd'},
-{'x': 123.5, 'y': 25.56895119, 'z': '5th'},
-{'x': 123.5, 'y': 27.09733925, 'z': '10th'},
-{'x': 123.5, 'y': 30.05769609, 'z': '25th'},
-{'x': 123.5, 'y': 34.1166299, 'z': '50th'},
-{'x': 123.5, 'y': 39.30110778, 'z': '75th'},
-{'x': 123.5, 'y': 45.35151857, 'z': '90th'},
-{'x': 123.5, 'y': 49.84911291, 'z': '95th'},
-{'x': 123.5, 'y': 53.22950783, 'z': '97th'},
-{'x': 124.5, 'y': 24.88656847, 'z': '3rd'},
-{'x': 124.5, 'y': 25.80949245, 'z': '5th'},
-{'x': 124.5, 'y': 27.35847906, 'z': '10th'},
-{'x': 124.5, 'y': 30.35887971, 'z': '25th'},
-{'x': 124.5, 'y': 34.47272283, 'z': '50th'},
-{'x': 124.5, 'y': 39.72676238, 'z': '75th'},
-{'x': 124.5, 'y': 45.8567607, 'z': '90th'},
-{'x': 124.5, 'y': 50.41198402, 'z': '95th'},
-{'x': 124.5, 'y': 53.8346696, 'z': '97th'},
-{'x': 125.5, 'y': 25.11787864, 'z': '3rd'},
-{'x': 125.5, 'y': 26.05296553, 'z': '5th'},
-{'x': 125.5, 'y': 27.62243677, 'z': '10th'},
-{'x': 125.5, 'y': 30.66266737, 'z': '25th'},
-{'x': 125.5, 'y': 34.83115524, 'z': '50th'},
-{'x': 125.5, 'y': 40.15449395, 'z': '75th'},
-{'x': 125.5, 'y': 46.36391866, 'z': '90th'},
-{'x': 125.5, 'y': 50.9767747, 'z': '95th'},
-{'x': 125.5, 'y': 54.44183245, 'z': '97th'},
-{'x': 126.5, 'y': 25.35216934, 'z': '3rd'},
-{'x': 126.5, 'y': 26.29933598, 'z': '5th'},
-{'x': 126.5, 'y': 27.88915304, 'z': '10th'},
-{'x': 126.5, 'y': 30.96895298, 'z': '25th'},
-{'x': 126.5, 'y': 35.19176177, 'z': '50th'},
-{'x': 126.5, 'y': 40.58407272, 'z': '75th'},
-{'x': 126.5, 'y': 46.87270712, 'z': '90th'},
-{'x': 126.5, 'y': 51.54317357, 'z': '95th'},
-{'x': 126.5, 'y': 55.0506743, 'z': '97th'},
-{'x': 127.5, 'y': 25.58941249, 'z': '3rd'},
-{'x': 127.5, 'y': 26.5485612, 'z': '5th'},
-{'x': 127.5, 'y': 28.15856107, 'z': '10th'},
-{'x': 127.5, 'y': 31.27762411, 'z': '25th'},
-{'x': 127.5, 'y': 35.55437176, 'z': '50th'},
-{'x': 127.5, 'y': 41.01526401, 'z': '75th'},
-{'x': 127.5, 'y': 47.38283479, 'z': '90th'},
-{'x': 127.5, 'y': 52.11086123, 'z': '95th'},
-{'x': 127.5, 'y': 55.66086287, 'z': '97th'},
-{'x': 128.5, 'y': 25.82958069, 'z': '3rd'},
-{'x': 128.5, 'y': 26.80059725, 'z': '5th'},
-{'x': 128.5, 'y': 28.43058954, 'z': '10th'},
-{'x': 128.5, 'y': 31.58855853, 'z': '25th'},
-{'x': 128.5, 'y': 35.91879976, 'z': '50th'},
-{'x': 128.5, 'y': 41.44781609, 'z': '75th'},
-{'x': 128.5, 'y': 47.89399722, 'z': '90th'},
-{'x': 128.5, 'y': 52.67951305, 'z': '95th'},
-{'x': 128.5, 'y': 56.27206944, 'z': '97th'},
-{'x': 129.5, 'y': 26.0726318, 'z': '3rd'},
-{'x': 129.5, 'y': 27.05538753, 'z': '5th'},
-{'x': 129.5, 'y': 28.70515783, 'z': '10th'},
-{'x': 129.5, 'y': 31.90163028, 'z': '25th'},
-{'x': 129.5, 'y': 36.28486194, 'z': '50th'},
-{'x': 129.5, 'y': 41.88148136, 'z': '75th'},
-{'x': 129.5, 'y': 48.40589011, 'z': '90th'},
-{'x': 129.5, 'y': 53.2487963, 'z': '95th'},
-{'x': 129.5, 'y': 56.88394797, 'z': '97th'},
-{'x': 130.5, 'y': 26.31852113, 'z': '3rd'},
-{'x': 130.5, 'y': 27.31287184, 'z': '5th'},
-{'x': 130.5, 'y': 28.98217994, 'z': '10th'},
-{'x': 130.5, 'y': 32.21670522, 'z': '25th'},
-{'x': 130.5, 'y': 36.65236365, 'z': '50th'},
-{'x': 130.5, 'y': 42.31600037, 'z': '75th'},
-{'x': 130.5, 'y': 48.91819978, 'z': '90th'},
-{'x': 130.5, 'y': 53.81837358, 'z': '95th'},
-{'x': 130.5, 'y': 57.49615297, 'z': '97th'},
-{'x': 131.5, 'y': 26.56719327, 'z': '3rd'},
-{'x': 131.5, 'y': 27.57298031, 'z': '5th'},
-{'x': 131.5, 'y': 29.26156199, 'z': '10th'},
-{'x': 131.5, 'y': 32.5336442, 'z': '25th'},
-{'x': 131.5, 'y': 37.02110818, 'z': '50th'},
-{'x': 131.5, 'y': 42.75111318, 'z': '75th'},
-{'x': 131.5, 'y': 49.43061053, 'z': '90th'},
-{'x': 131.5, 'y': 54.38790173, 'z': '95th'},
-{'x': 131.5, 'y': 58.10832895, 'z': '97th'},
-{'x': 132.5, 'y': 26.81859231, 'z': '3rd'},
-{'x': 132.5, 'y': 27.83564104, 'z': '5th'},
-{'x': 132.5, 'y': 29.5432056, 'z': '10th'},
-{'x': 132.5, 'y': 32.85229967, 'z': '25th'},
-{'x': 132.5, 'y': 37.39088668, 'z': '50th'},
-{'x': 132.5, 'y': 43.18654635, 'z': '75th'},
-{'x': 132.5, 'y': 49.94279684, 'z': '90th'},
-{'x': 132.5, 'y': 54.95703466, 'z': '95th'},
-{'x': 132.5, 'y': 58.72012509, 'z': '97th'},
-{'x': 133.5, 'y': 27.0726516, 'z': '3rd'},
-{'x': 133.5, 'y': 28.10077256, 'z': '5th'},
-{'x': 133.5, 'y': 29.82700474, 'z': '10th'},
-{'x': 133.5, 'y': 33.17251956, 'z': '25th'},
-{'x': 133.5, 'y': 37.76148905, 'z': '50th'},
-{'x': 133.5, 'y': 43.62202704, 'z': '75th'},
-{'x': 133.5, 'y': 50.45443246, 'z': '90th'},
-{'x': 133.5, 'y': 55.52542195, 'z': '95th'},
-{'x': 133.5, 'y': 59.33118206, 'z': '97th'},
-{'x': 134.5, 'y': 27.3292989, 'z': '3rd'},
-{'x': 134.5, 'y': 28.3682877, 'z': '5th'},
-{'x': 134.5, 'y': 30.11284746, 'z': '10th'},
-{'x': 134.5, 'y': 33.49414573, 'z': '25th'},
-{'x': 134.5, 'y': 38.1326991, 'z': '50th'},
-{'x': 134.5, 'y': 44.05727678, 'z': '75th'},
-{'x': 134.5, 'y': 50.96518685, 'z': '90th'},
-{'x': 134.5, 'y': 56.0927106, 'z': '95th'},
-{'x': 134.5, 'y': 59.94113978, 'z': '97th'},
-{'x': 135.5, 'y': 27.5884554, 'z': '3rd'},
-{'x': 135.5, 'y': 28.63809288, 'z': '5th'},
-{'x': 135.5, 'y': 30.4006158, 'z': '10th'},
-{'x': 135.5, 'y': 33.81701463, 'z': '25th'},
-{'x': 135.5, 'y': 38.50429603, 'z': '50th'},
-{'x': 135.5, 'y': 44.49201341, 'z': '75th'},
-{'x': 135.5, 'y': 51.47472671, 'z': '90th'},
-{'x': 135.5, 'y': 56.65854557, 'z': '95th'},
-{'x': 135.5, 'y': 60.54963673, 'z': '97th'},
-{'x': 136.5, 'y': 27.85003573, 'z': '3rd'},
-{'x': 136.5, 'y': 28.91008824, 'z': '5th'},
-{'x': 136.5, 'y': 30.69018587, 'z': '10th'},
-{'x': 136.5, 'y': 34.14095759, 'z': '25th'},
-{'x': 136.5, 'y': 38.87605489, 'z': '50th'},
-{'x': 136.5, 'y': 44.92595166, 'z': '75th'},
-{'x': 136.5, 'y': 51.98271665, 'z': '90th'},
-{'x': 136.5, 'y': 57.22257051, 'z': '95th'},
-{'x': 136.5, 'y': 61.15631078, 'z': '97th'},
-{'x': 137.5, 'y': 28.11394809, 'z': '3rd'},
-{'x': 137.5, 'y': 29.18416775, 'z': '5th'},
-{'x': 137.5, 'y': 30.98142809, 'z': '10th'},
-{'x': 137.5, 'y': 34.46580111, 'z': '25th'},
-{'x': 137.5, 'y': 39.24774707, 'z': '50th'},
-{'x': 137.5, 'y': 45.35880379, 'z': '75th'},
-{'x': 137.5, 'y': 52.48881992, 'z': '90th'},
-{'x': 137.5, 'y': 57.78442851, 'z': '95th'},
-{'x': 137.5, 'y': 61.76079992, 'z': '97th'},
-{'x': 138.5, 'y': 28.38009427, 'z': '3rd'},
-{'x': 138.5, 'y': 29.46021931, 'z': '5th'},
-{'x': 138.5, 'y': 31.27420739, 'z': '10th'},
-{'x': 138.5, 'y': 34.79136727, 'z': '25th'},
-{'x': 138.5, 'y': 39.61914076, 'z': '50th'},
-{'x': 138.5, 'y': 45.79028017, 'z': '75th'},
-{'x': 138.5, 'y': 52.99269914, 'z': '90th'},
-{'x': 138.5, 'y': 58.34376285, 'z': '95th'},
-{'x': 138.5, 'y': 62.36274309, 'z': '97th'},
-{'x': 139.5, 'y': 28.64837137, 'z': '3rd'},
-{'x': 139.5, 'y': 29.73812611, 'z': '5th'},
-{'x': 139.5, 'y': 31.56838398, 'z': '10th'},
-{'x': 139.5, 'y': 35.11747352, 'z': '25th'},
-{'x': 139.5, 'y': 39.98999994, 'z': '50th'},
-{'x': 139.5, 'y': 46.22008796, 'z': '75th'},
-{'x': 139.5, 'y': 53.49401569, 'z': '90th'},
-{'x': 139.5, 'y': 58.90021802, 'z': '95th'},
-{'x': 139.5, 'y': 62.96178288, 'z': '97th'},
-{'x': 140.5, 'y': 28.91866389, 'z': '3rd'},
-{'x': 140.5, 'y': 30.01776074, 'z': '5th'},
-{'x': 140.5, 'y': 31.8638107, 'z': '10th'},
-{'x': 140.5, 'y': 35.44393549, 'z': '25th'},
-{'x': 140.5, 'y': 40.36009244, 'z': '50th'},
-{'x': 140.5, 'y': 46.64794172, 'z': '75th'},
-{'x': 140.5, 'y': 53.99243685, 'z': '90th'},
-{'x': 140.5, 'y': 59.45343918, 'z': '95th'},
-{'x': 140.5, 'y': 63.55755646, 'z': '97th'},
-{'x': 141.5, 'y': 29.1908599, 'z': '3rd'},
-{'x': 141.5, 'y': 30.29899746, 'z': '5th'},
-{'x': 141.5, 'y': 32.16033905, 'z': '10th'},
-{'x': 141.5, 'y': 35.77056256, 'z': '25th'},
-{'x': 141.5, 'y': 40.72917544, 'z': '50th'},
-{'x': 141.5, 'y': 47.07354407, 'z': '75th'},
-{'x': 141.5, 'y': 54.48762378, 'z': '90th'},
-{'x': 141.5, 'y': 60.00307549, 'z': '95th'},
-{'x': 141.5, 'y': 64.14971608, 'z': '97th'},
-{'x': 142.5, 'y': 29.46483511, 'z': '3rd'},
-{'x': 142.5, 'y': 30.58170029, 'z': '5th'},
-{'x': 142.5, 'y': 32.45781366, 'z': '10th'},
-{'x': 142.5, 'y': 36.09716305, 'z': '25th'},
-{'x': 142.5, 'y': 41.09701099, 'z': '50th'},
-{'x': 142.5, 'y': 47.4966064, 'z': '75th'},
-{'x': 142.5, 'y': 54.97924502, 'z': '90th'},
-{'x': 142.5, 'y': 60.5487783, 'z': '95th'},
-{'x': 142.5, 'y': 64.73791012, 'z': '97th'},
-{'x': 143.5, 'y': 29.74046108, 'z': '3rd'},
-{'x': 143.5, 'y': 30.86572924, 'z': '5th'},
-{'x': 143.5, 'y': 32.75607548, 'z': '10th'},
-{'x': 143.5, 'y': 36.4235422, 'z': '25th'},
-{'x': 143.5, 'y': 41.46335907, 'z': '50th'},
-{'x': 143.5, 'y': 47.91683947, 'z': '75th'},
-{'x': 143.5, 'y': 55.4669708, 'z': '90th'},
-{'x': 143.5, 'y': 61.09020319, 'z': '95th'},
-{'x': 143.5, 'y': 65.32179369, 'z': '97th'},
-{'x': 144.5, 'y': 30.01760377, 'z': '3rd'},
-{'x': 144.5, 'y': 31.15093935, 'z': '5th'},
-{'x': 144.5, 'y': 33.05496144, 'z': '10th'},
-{'x': 144.5, 'y': 36.7495031, 'z': '25th'},
-{'x': 144.5, 'y': 41.82797963, 'z': '50th'},
-{'x': 144.5, 'y': 48.33395608, 'z': '75th'},
-{'x': 144.5, 'y': 55.9504751, 'z': '90th'},
-{'x': 144.5, 'y': 61.62701045, 'z': '95th'},
-{'x': 144.5, 'y': 65.90102746, 'z': '97th'},
-{'x': 145.5, 'y': 30.29612378, 'z': '3rd'},
-{'x': 145.5, 'y': 31.43718091, 'z': '5th'},
-{'x': 145.5, 'y': 33.35430482, 'z': '10th'},
-{'x': 145.5, 'y': 37.07484703, 'z': '25th'},
-{'x': 145.5, 'y': 42.19063313, 'z': '50th'},
-{'x': 145.5, 'y': 48.74767177, 'z': '75th'},
-{'x': 145.5, 'y': 56.42943635, 'z': '90th'},
-{'x': 145.5, 'y': 62.15886584, 'z': '95th'},
-{'x': 145.5, 'y': 66.47527837, 'z': '97th'},
-{'x': 146.5, 'y': 30.57587654, 'z': '3rd'},
-{'x': 146.5, 'y': 31.72429973, 'z': '5th'},
-{'x': 146.5, 'y': 33.6539355, 'z': '10th'},
-{'x': 146.5, 'y': 37.39937399, 'z': '25th'},
-{'x': 146.5, 'y': 42.55108107, 'z': '50th'},
-{'x': 146.5, 'y': 49.15770541, 'z': '75th'},
-{'x': 146.5, 'y': 56.90353811, 'z': '90th'},
-{'x': 146.5, 'y': 62.68544133, 'z': '95th'},
-{'x': 146.5, 'y': 67.04422046, 'z': '97th'},
-{'x': 147.5, 'y': 30.85671255, 'z': '3rd'},
-{'x': 147.5, 'y': 32.01213742, 'z': '5th'},
-{'x': 147.5, 'y': 33.95368036, 'z': '10th'},
-{'x': 147.5, 'y': 37.72288302, 'z': '25th'},
-{'x': 147.5, 'y': 42.90908653, 'z': '50th'},
-{'x': 147.5, 'y': 49.56377988, 'z': '75th'},
-{'x': 147.5, 'y': 57.37246984, 'z': '90th'},
-{'x': 147.5, 'y': 63.20641583, 'z': '95th'},
-{'x': 147.5, 'y': 67.60753554, 'z': '97th'},
-{'x': 148.5, 'y': 31.13847695, 'z': '3rd'},
-{'x': 148.5, 'y': 32.30053116, 'z': '5th'},
-{'x': 148.5, 'y': 34.25336333, 'z': '10th'},
-{'x': 148.5, 'y': 38.04517298, 'z': '25th'},
-{'x': 148.5, 'y': 43.2644155, 'z': '50th'},
-{'x': 148.5, 'y': 49.96562365, 'z': '75th'},
-{'x': 148.5, 'y': 57.83592807, 'z': '90th'},
-{'x': 148.5, 'y': 63.72147556, 'z': '95th'},
-{'x': 148.5, 'y': 68.16491273, 'z': '97th'},
-{'x': 149.5, 'y': 31.42101289, 'z': '3rd'},
-{'x': 149.5, 'y': 32.58931625, 'z': '5th'},
-{'x': 149.5, 'y': 34.55280676, 'z': '10th'},
-{'x': 149.5, 'y': 38.36604173, 'z': '25th'},
-{'x': 149.5, 'y': 43.61683402, 'z': '50th'},
-{'x': 149.5, 'y': 50.36296721, 'z': '75th'},
-{'x': 149.5, 'y': 58.29361488, 'z': '90th'},
-{'x': 149.5, 'y': 64.2303163, 'z': '95th'},
-{'x': 149.5, 'y': 68.7160548, 'z': '97th'},
-{'x': 150.5, 'y': 31.70415418, 'z': '3rd'},
-{'x': 150.5, 'y': 32.87832086, 'z': '5th'},
-{'x': 150.5, 'y': 34.85182934, 'z': '10th'},
-{'x': 150.5, 'y': 38.68528952, 'z': '25th'},
-{'x': 150.5, 'y': 43.9661169, 'z': '50th'},
-{'x': 150.5, 'y': 50.75555403, 'z': '75th'},
-{'x': 150.5, 'y': 58.74524431, 'z': '90th'},
-{'x': 150.5, 'y': 64.73264089, 'z': '95th'},
-{'x': 150.5, 'y': 69.26066574, 'z': '97th'},
-{'x': 151.5, 'y': 31.98773757, 'z': '3rd'},
-{'x': 151.5, 'y': 33.16737518, 'z': '5th'},
-{'x': 151.5, 'y': 35.15025041, 'z': '10th'},
-{'x': 151.5, 'y': 39.0027151, 'z': '25th'},
-{'x': 151.5, 'y': 44.31203579, 'z': '50th'},
-{'x': 151.5, 'y': 51.14312509, 'z': '75th'},
-{'x': 151.5, 'y': 59.19053344, 'z': '90th'},
-{'x': 151.5, 'y': 65.22816347, 'z': '95th'},
-{'x': 151.5, 'y': 69.7984699, 'z': '97th'},
-{'x': 152.5, 'y': 32.27158972, 'z': '3rd'},
-{'x': 152.5, 'y': 33.45630184, 'z': '5th'},
-{'x': 152.5, 'y': 35.44788577, 'z': '10th'},
-{'x': 152.5, 'y': 39.31812066, 'z': '25th'},
-{'x': 152.5, 'y': 44.65437319, 'z': '50th'},
-{'x': 152.5, 'y': 51.52543729, 'z': '75th'},
-{'x': 152.5, 'y': 59.62921442, 'z': '90th'},
-{'x': 152.5, 'y': 65.7166078, 'z': '95th'},
-{'x': 152.5, 'y': 70.32919455, 'z': '97th'},
-{'x': 153.5, 'y': 32.55553716, 'z': '3rd'},
-{'x': 153.5, 'y': 33.74492348, 'z': '5th'},
-{'x': 153.5, 'y': 35.74455149, 'z': '10th'},
-{'x': 153.5, 'y': 39.63130927, 'z': '25th'},
-{'x': 153.5, 'y': 44.99291356, 'z': '50th'},
-{'x': 153.5, 'y': 51.90225139, 'z': '75th'},
-{'x': 153.5, 'y': 60.06102656, 'z': '90th'},
-{'x': 153.5, 'y': 66.19770861, 'z': '95th'},
-{'x': 153.5, 'y': 70.85258197, 'z': '97th'},
-{'x': 154.5, 'y': 32.83940314, 'z': '3rd'},
-{'x': 154.5, 'y': 34.03306041, 'z': '5th'},
-{'x': 154.5, 'y': 36.04006296, 'z': '10th'},
-{'x': 154.5, 'y': 39.94208624, 'z': '25th'},
-{'x': 154.5, 'y': 45.32744704, 'z': '50th'},
-{'x': 154.5, 'y': 52.273337, 'z': '75th'},
-{'x': 154.5, 'y': 60.48572025, 'z': '90th'},
-{'x': 154.5, 'y': 66.67121259, 'z': '95th'},
-{'x': 154.5, 'y': 71.36838696, 'z': '97th'},
-{'x': 155.5, 'y': 33.12300797, 'z': '3rd'},
-{'x': 155.5, 'y': 34.3205311, 'z': '5th'},
-{'x': 155.5, 'y': 36.33423538, 'z': '10th'},
-{'x': 155.5, 'y': 40.25025974, 'z': '25th'},
-{'x': 155.5, 'y': 45.65777013, 'z': '50th'},
-{'x': 155.5, 'y': 52.63847339, 'z': '75th'},
-{'x': 155.5, 'y': 60.90305741, 'z': '90th'},
-{'x': 155.5, 'y': 67.13687835, 'z': '95th'},
-{'x': 155.5, 'y': 71.87637634, 'z': '97th'},
-{'x': 156.5, 'y': 33.40616909, 'z': '3rd'},
-{'x': 156.5, 'y': 34.60715224, 'z': '5th'},
-{'x': 156.5, 'y': 36.62688403, 'z': '10th'},
-{'x': 156.5, 'y': 40.55564134, 'z': '25th'},
-{'x': 156.5, 'y': 45.98368656, 'z': '50th'},
-{'x': 156.5, 'y': 52.99745045, 'z': '75th'},
-{'x': 156.5, 'y': 61.31281247, 'z': '90th'},
-{'x': 156.5, 'y': 67.59447719, 'z': '95th'},
-{'x': 156.5, 'y': 72.37632936, 'z': '97th'},
-{'x': 157.5, 'y': 33.68870064, 'z': '3rd'},
-{'x': 157.5, 'y': 34.89273857, 'z': '5th'},
-{'x': 157.5, 'y': 36.91782442, 'z': '10th'},
-{'x': 157.5, 'y': 40.85804669, 'z': '25th'},
-{'x': 157.5, 'y': 46.30500858, 'z': '50th'},
-{'x': 157.5, 'y': 53.35007037, 'z': '75th'},
-{'x': 157.5, 'y': 61.71477365, 'z': '90th'},
-{'x': 157.5, 'y': 68.04379345, 'z': '95th'},
-{'x': 157.5, 'y': 72.86803693, 'z': '97th'},
-{'x': 158.5, 'y': 33.97041915, 'z': '3rd'},
-{'x': 158.5, 'y': 35.17710718, 'z': '5th'},
-{'x': 158.5, 'y': 37.20687443, 'z': '10th'},
-{'x': 158.5, 'y': 41.15729406, 'z': '25th'},
-{'x': 158.5, 'y': 46.62155183, 'z': '50th'},
-{'x': 158.5, 'y': 53.69614073, 'z': '75th'},
-{'x': 158.5, 'y': 62.10873877, 'z': '90th'},
-{'x': 158.5, 'y': 68.4846261, 'z': '95th'},
-{'x': 158.5, 'y': 73.35131006, 'z': '97th'},
-{'x': 159.5, 'y': 34.25113618, 'z': '3rd'},
-{'x': 159.5, 'y': 35.46007223, 'z': '5th'},
-{'x': 159.5, 'y': 37.49385217, 'z': '10th'},
-{'x': 159.5, 'y': 41.45320759, 'z': '25th'},
-{'x': 159.5, 'y': 46.93314404, 'z': '50th'},
-{'x': 159.5, 'y': 54.03548596, 'z': '75th'},
-{'x': 159.5, 'y': 62.49452276, 'z': '90th'},
-{'x': 159.5, 'y': 68.91678763, 'z': '95th'},
-{'x': 159.5, 'y': 73.82596855, 'z': '97th'},
-{'x': 160.5, 'y': 34.5306634, 'z': '3rd'},
-{'x': 160.5, 'y': 35.74144871, 'z': '5th'},
-{'x': 160.5, 'y': 37.77857793, 'z': '10th'},
-{'x': 160.5, 'y': 41.74561603, 'z': '25th'},
-{'x': 160.5, 'y': 47.23962058, 'z': '50th'},
-{'x': 160.5, 'y': 54.36794129, 'z': '75th'},
-{'x': 160.5, 'y': 62.87195405, 'z': '90th'},
-{'x': 160.5, 'y': 69.34010551, 'z': '95th'},
-{'x': 160.5, 'y': 74.2918484, 'z': '97th'},
-{'x': 161.5, 'y': 34.80881186, 'z': '3rd'},
-{'x': 161.5, 'y': 36.0210521, 'z': '5th'},
-{'x': 161.5, 'y': 38.06087423, 'z': '10th'},
-{'x': 161.5, 'y': 42.03435353, 'z': '25th'},
-{'x': 161.5, 'y': 47.54082604, 'z': '50th'},
-{'x': 161.5, 'y': 54.69335479, 'z': '75th'},
-{'x': 161.5, 'y': 63.24087599, 'z': '90th'},
-{'x': 161.5, 'y': 69.75442235, 'z': '95th'},
-{'x': 161.5, 'y': 74.74880046, 'z': '97th'},
-{'x': 162.5, 'y': 35.08539244, 'z': '3rd'},
-{'x': 162.5, 'y': 36.29869877, 'z': '5th'},
-{'x': 162.5, 'y': 38.34056621, 'z': '10th'},
-{'x': 162.5, 'y': 42.31926009, 'z': '25th'},
-{'x': 162.5, 'y': 47.83661466, 'z': '50th'},
-{'x': 162.5, 'y': 55.01158787, 'z': '75th'},
-{'x': 162.5, 'y': 63.60114743, 'z': '90th'},
-{'x': 162.5, 'y': 70.15959636, 'z': '95th'},
-{'x': 162.5, 'y': 75.19669066, 'z': '97th'},
-{'x': 163.5, 'y': 35.36021624, 'z': '3rd'},
-{'x': 163.5, 'y': 36.57420636, 'z': '5th'},
-{'x': 163.5, 'y': 38.61748204, 'z': '10th'},
-{'x': 163.5, 'y': 42.60018191, 'z': '25th'},
-{'x': 163.5, 'y': 48.12685082, 'z': '50th'},
-{'x': 163.5, 'y': 55.32251577, 'z': '75th'},
-{'x': 163.5, 'y': 63.95264314, 'z': '90th'},
-{'x': 163.5, 'y': 70.55550168, 'z': '95th'},
-{'x': 163.5, 'y': 75.63540025, 'z': '97th'},
-{'x': 164.5, 'y': 35.63309497, 'z': '3rd'},
-{'x': 164.5, 'y': 36.84739419, 'z': '5th'},
-{'x': 164.5, 'y': 38.89145331, 'z': '10th'},
-{'x': 164.5, 'y': 42.87697183, 'z': '25th'},
-{'x': 164.5, 'y': 48.41140938, 'z': '50th'},
-{'x': 164.5, 'y': 55.62602801, 'z': '75th'},
-{'x': 164.5, 'y': 64.29525433, 'z': '90th'},
-{'x': 164.5, 'y': 70.94202872, 'z': '95th'},
-{'x': 164.5, 'y': 76.0648259, 'z': '97th'},
-{'x': 165.5, 'y': 35.90384139, 'z': '3rd'},
-{'x': 165.5, 'y': 37.11808367, 'z': '5th'},
-{'x': 165.5, 'y': 39.16231542, 'z': '10th'},
-{'x': 165.5, 'y': 43.14948969, 'z': '25th'},
-{'x': 165.5, 'y': 48.69017613, 'z': '50th'},
-{'x': 165.5, 'y': 55.9220288, 'z': '75th'},
-{'x': 165.5, 'y': 64.62888901, 'z': '90th'},
-{'x': 165.5, 'y': 71.31908448, 'z': '95th'},
-{'x': 165.5, 'y': 76.48487978, 'z': '97th'},
-{'x': 166.5, 'y': 36.17226975, 'z': '3rd'},
-{'x': 166.5, 'y': 37.38609874, 'z': '5th'},
-{'x': 166.5, 'y': 39.42990799, 'z': '10th'},
-{'x': 166.5, 'y': 43.4176027, 'z': '25th'},
-{'x': 166.5, 'y': 48.9630481, 'z': '50th'},
-{'x': 166.5, 'y': 56.21043748, 'z': '75th'},
-{'x': 166.5, 'y': 64.95347244, 'z': '90th'},
-{'x': 166.5, 'y': 71.68659282, 'z': '95th'},
-{'x': 166.5, 'y': 76.8954897, 'z': '97th'},
-{'x': 167.5, 'y': 36.43819618, 'z': '3rd'},
-{'x': 167.5, 'y': 37.65126622, 'z': '5th'},
-{'x': 167.5, 'y': 39.69407521, 'z': '10th'},
-{'x': 167.5, 'y': 43.68118578, 'z': '25th'},
-{'x': 167.5, 'y': 49.22993391, 'z': '50th'},
-{'x': 167.5, 'y': 56.49118881, 'z': '75th'},
-{'x': 167.5, 'y': 65.26894746, 'z': '90th'},
-{'x': 167.5, 'y': 72.04449469, 'z': '95th'},
-{'x': 167.5, 'y': 77.29659902, 'z': '97th'},
-{'x': 168.5, 'y': 36.70143915, 'z': '3rd'},
-{'x': 168.5, 'y': 37.91341628, 'z': '5th'},
-{'x': 168.5, 'y': 39.95466626, 'z': '10th'},
-{'x': 168.5, 'y': 43.94012186, 'z': '25th'},
-{'x': 168.5, 'y': 49.49075409, 'z': '50th'},
-{'x': 168.5, 'y': 56.76423337, 'z': '75th'},
-{'x': 168.5, 'y': 65.57527484, 'z': '90th'},
-{'x': 168.5, 'y': 72.39274832, 'z': '95th'},
-{'x': 168.5, 'y': 77.68816668, 'z': '97th'},
-{'x': 169.5, 'y': 36.96181994, 'z': '3rd'},
-{'x': 169.5, 'y': 38.17238283, 'z': '5th'},
-{'x': 169.5, 'y': 40.21153565, 'z': '10th'},
-{'x': 169.5, 'y': 44.19430225, 'z': '25th'},
-{'x': 169.5, 'y': 49.74544132, 'z': '50th'},
-{'x': 169.5, 'y': 57.02953776, 'z': '75th'},
-{'x': 169.5, 'y': 65.87243353, 'z': '90th'},
-{'x': 169.5, 'y': 72.73132942, 'z': '95th'},
-{'x': 169.5, 'y': 78.0701671, 'z': '97th'},
-{'x': 170.5, 'y': 37.21916305, 'z': '3rd'},
-{'x': 170.5, 'y': 38.42800396, 'z': '5th'},
-{'x': 170.5, 'y': 40.4645436, 'z': '10th'},
-{'x': 170.5, 'y': 44.4436269, 'z': '25th'},
-{'x': 170.5, 'y': 49.99394068, 'z': '50th'},
-{'x': 170.5, 'y': 57.2870849, 'z': '75th'},
-{'x': 170.5, 'y': 66.16042095, 'z': '90th'},
-{'x': 170.5, 'y': 73.06023127, 'z': '95th'},
-{'x': 170.5, 'y': 78.44259001, 'z': '97th'},
-{'x': 171.5, 'y': 37.47329665, 'z': '3rd'},
-{'x': 171.5, 'y': 38.68012233, 'z': '5th'},
-{'x': 171.5, 'y': 40.71355642, 'z': '10th'},
-{'x': 171.5, 'y': 44.68800466, 'z': '25th'},
-{'x': 171.5, 'y': 50.23620985, 'z': '50th'},
-{'x': 171.5, 'y': 57.53687418, 'z': '75th'},
-{'x': 171.5, 'y': 66.43925318, 'z': '90th'},
-{'x': 171.5, 'y': 73.37946482, 'z': '95th'},
-{'x': 171.5, 'y': 78.80544037, 'z': '97th'},
-{'x': 172.5, 'y': 37.72405025, 'z': '3rd'},
-{'x': 172.5, 'y': 38.92858345, 'z': '5th'},
-{'x': 172.5, 'y': 40.95844577, 'z': '10th'},
-{'x': 172.5, 'y': 44.92735442, 'z': '25th'},
-{'x': 172.5, 'y': 50.47222213, 'z': '50th'},
-{'x': 172.5, 'y': 57.77892568, 'z': '75th'},
-{'x': 172.5, 'y': 66.70896797, 'z': '90th'},
-{'x': 172.5, 'y': 73.68905842, 'z': '95th'},
-{'x': 172.5, 'y': 79.15873364, 'z': '97th'},
-{'x': 173.5, 'y': 37.97126574, 'z': '3rd'},
-{'x': 173.5, 'y': 39.17324412, 'z': '5th'},
-{'x': 173.5, 'y': 41.19909297, 'z': '10th'},
-{'x': 173.5, 'y': 45.16160204, 'z': '25th'},
-{'x': 173.5, 'y': 50.70195581, 'z': '50th'},
-{'x': 173.5, 'y': 58.01326503, 'z': '75th'},
-{'x': 173.5, 'y': 66.96961412, 'z': '90th'},
-{'x': 173.5, 'y': 73.98905915, 'z': '95th'},
-{'x': 173.5, 'y': 79.5025122, 'z': '97th'},
-{'x': 174.5, 'y': 38.2147829, 'z': '3rd'},
-{'x': 174.5, 'y': 39.41396159, 'z': '5th'},
-{'x': 174.5, 'y': 41.4353838, 'z': '10th'},
-{'x': 174.5, 'y': 45.39068521, 'z': '25th'},
-{'x': 174.5, 'y': 50.92540942, 'z': '50th'},
-{'x': 174.5, 'y': 58.23994486, 'z': '75th'},
-{'x': 174.5, 'y': 67.22126661, 'z': '90th'},
-{'x': 174.5, 'y': 74.27953085, 'z': '95th'},
-{'x': 174.5, 'y': 79.83682168, 'z': '97th'},
-{'x': 175.5, 'y': 38.45444923, 'z': '3rd'},
-{'x': 175.5, 'y': 39.65060094, 'z': '5th'},
-{'x': 175.5, 'y': 41.66721226, 'z': '10th'},
-{'x': 175.5, 'y': 45.61455072, 'z': '25th'},
-{'x': 175.5, 'y': 51.14259229, 'z': '50th'},
-{'x': 175.5, 'y': 58.45903143, 'z': '75th'},
-{'x': 175.5, 'y': 67.46401722, 'z': '90th'},
-{'x': 175.5, 'y': 74.5605553, 'z': '95th'},
-{'x': 175.5, 'y': 80.16172522, 'z': '97th'},
-{'x': 176.5, 'y': 38.69011819, 'z': '3rd'},
-{'x': 176.5, 'y': 39.8830339, 'z': '5th'},
-{'x': 176.5, 'y': 41.89448008, 'z': '10th'},
-{'x': 176.5, 'y': 45.83315528, 'z': '25th'},
-{'x': 176.5, 'y': 51.3535268, 'z': '50th'},
-{'x': 176.5, 'y': 58.67060766, 'z': '75th'},
-{'x': 176.5, 'y': 67.69797665, 'z': '90th'},
-{'x': 176.5, 'y': 74.83223179, 'z': '95th'},
-{'x': 176.5, 'y': 80.47729968, 'z': '97th'},
-{'x': 177.5, 'y': 38.92164966, 'z': '3rd'},
-{'x': 177.5, 'y': 40.11113919, 'z': '5th'},
-{'x': 177.5, 'y': 42.11709702, 'z': '10th'},
-{'x': 177.5, 'y': 46.0464657, 'z': '25th'},
-{'x': 177.5, 'y': 51.55824831, 'z': '50th'},
-{'x': 177.5, 'y': 58.87477302, 'z': '75th'},
-{'x': 177.5, 'y': 67.92327441, 'z': '90th'},
-{'x': 177.5, 'y': 75.09467698, 'z': '95th'},
-{'x': 177.5, 'y': 80.78363524, 'z': '97th'},
-{'x': 178.5, 'y': 39.14891037, 'z': '3rd'},
-{'x': 178.5, 'y': 40.33480295, 'z': '5th'},
-{'x': 178.5, 'y': 42.33498116, 'z': '10th'},
-{'x': 178.5, 'y': 46.25445894, 'z': '25th'},
-{'x': 178.5, 'y': 51.75680513, 'z': '50th'},
-{'x': 178.5, 'y': 59.07164337, 'z': '75th'},
-{'x': 178.5, 'y': 68.14005866, 'z': '90th'},
-{'x': 178.5, 'y': 75.34802466, 'z': '95th'},
-{'x': 178.5, 'y': 81.08083497, 'z': '97th'},
-{'x': 179.5, 'y': 39.37177435, 'z': '3rd'},
-{'x': 179.5, 'y': 40.55391906, 'z': '5th'},
-{'x': 179.5, 'y': 42.54805916, 'z': '10th'},
-{'x': 179.5, 'y': 46.45712228, 'z': '25th'},
-{'x': 179.5, 'y': 51.94925841, 'z': '50th'},
-{'x': 179.5, 'y': 59.26135066, 'z': '75th'},
-{'x': 179.5, 'y': 68.34849595, 'z': '90th'},
-{'x': 179.5, 'y': 75.5924255, 'z': '95th'},
-{'x': 179.5, 'y': 81.36901438, 'z': '97th'},
-{'x': 180.5, 'y': 39.59012338, 'z': '3rd'},
-{'x': 180.5, 'y': 40.76838955, 'z': '5th'},
-{'x': 180.5, 'y': 42.7562665, 'z': '10th'},
-{'x': 180.5, 'y': 46.65445329, 'z': '25th'},
-{'x': 180.5, 'y': 52.13568193, 'z': '50th'},
-{'x': 180.5, 'y': 59.44404265, 'z': '75th'},
-{'x': 180.5, 'y': 68.5487709, 'z': '90th'},
-{'x': 180.5, 'y': 75.82804673, 'z': '95th'},
-{'x': 180.5, 'y': 81.64830091, 'z': '97th'},
-{'x': 181.5, 'y': 39.80384736, 'z': '3rd'},
-{'x': 181.5, 'y': 40.97812493, 'z': '5th'},
-{'x': 181.5, 'y': 42.95954776, 'z': '10th'},
-{'x': 181.5, 'y': 46.84645992, 'z': '25th'},
-{'x': 181.5, 'y': 52.31616197, 'z': '50th'},
-{'x': 181.5, 'y': 59.61988254, 'z': '75th'},
-{'x': 181.5, 'y': 68.74108582, 'z': '90th'},
-{'x': 181.5, 'y': 76.05507182, 'z': '95th'},
-{'x': 181.5, 'y': 81.91883344, 'z': '97th'},
-{'x': 182.5, 'y': 40.01284477, 'z': '3rd'},
-{'x': 182.5, 'y': 41.18304453, 'z': '5th'},
-{'x': 182.5, 'y': 43.1578568, 'z': '10th'},
-{'x': 182.5, 'y': 47.03316051, 'z': '25th'},
-{'x': 182.5, 'y': 52.49079703, 'z': '50th'},
-{'x': 182.5, 'y': 59.78904852, 'z': '75th'},
-{'x': 182.5, 'y': 68.92566027, 'z': '90th'},
-{'x': 182.5, 'y': 76.27369999, 'z': '95th'},
-{'x': 182.5, 'y': 82.18076174, 'z': '97th'},
-{'x': 183.5, 'y': 40.21702302, 'z': '3rd'},
-{'x': 183.5, 'y': 41.3830768, 'z': '5th'},
-{'x': 183.5, 'y': 43.35115698, 'z': '10th'},
-{'x': 183.5, 'y': 47.21458375, 'z': '25th'},
-{'x': 183.5, 'y': 52.65969757, 'z': '50th'},
-{'x': 183.5, 'y': 59.95173329, 'z': '75th'},
-{'x': 183.5, 'y': 69.10273048, 'z': '90th'},
-{'x': 183.5, 'y': 76.48414576, 'z': '95th'},
-{'x': 183.5, 'y': 82.43424593, 'z': '97th'},
-{'x': 184.5, 'y': 40.41629881, 'z': '3rd'},
-{'x': 184.5, 'y': 41.57815964, 'z': '5th'},
-{'x': 184.5, 'y': 43.53942133, 'z': '10th'},
-{'x': 184.5, 'y': 47.39076866, 'z': '25th'},
-{'x': 184.5, 'y': 52.82298572, 'z': '50th'},
-{'x': 184.5, 'y': 60.10814351, 'z': '75th'},
-{'x': 184.5, 'y': 69.27254876, 'z': '90th'},
-{'x': 184.5, 'y': 76.68663841, 'z': '95th'},
-{'x': 184.5, 'y': 82.67945587, 'z': '97th'},
-{'x': 185.5, 'y': 40.61059851, 'z': '3rd'},
-{'x': 185.5, 'y': 41.76824065, 'z': '5th'},
-{'x': 185.5, 'y': 43.72263271, 'z': '10th'},
-{'x': 185.5, 'y': 47.56176451, 'z': '25th'},
-{'x': 185.5, 'y': 52.9807949, 'z': '50th'},
-{'x': 185.5, 'y': 60.25849917, 'z': '75th'},
-{'x': 185.5, 'y': 69.43538282, 'z': '90th'},
-{'x': 185.5, 'y': 76.88142138, 'z': '95th'},
-{'x': 185.5, 'y': 82.91657062, 'z': '97th'},
-{'x': 186.5, 'y': 40.79985847, 'z': '3rd'},
-{'x': 186.5, 'y': 41.95327736, 'z': '5th'},
-{'x': 186.5, 'y': 43.90078396, 'z': '10th'},
-{'x': 186.5, 'y': 47.72763073, 'z': '25th'},
-{'x': 186.5, 'y': 53.13326946, 'z': '50th'},
-{'x': 186.5, 'y': 60.40303292, 'z': '75th'},
-{'x': 186.5, 'y': 69.59151495, 'z': '90th'},
-{'x': 186.5, 'y': 77.06875157, 'z': '95th'},
-{'x': 186.5, 'y': 83.1457778, 'z': '97th'},
-{'x': 187.5, 'y': 40.98402528, 'z': '3rd'},
-{'x': 187.5, 'y': 42.1332375, 'z': '5th'},
-{'x': 187.5, 'y': 44.07387796, 'z': '10th'},
-{'x': 187.5, 'y': 47.8884368, 'z': '25th'},
-{'x': 187.5, 'y': 53.28056425, 'z': '50th'},
-{'x': 187.5, 'y': 60.54198938, 'z': '75th'},
-{'x': 187.5, 'y': 69.74124122, 'z': '90th'},
-{'x': 187.5, 'y': 77.24889863, 'z': '95th'},
-{'x': 187.5, 'y': 83.36727297, 'z': '97th'},
-{'x': 188.5, 'y': 41.16305606, 'z': '3rd'},
-{'x': 188.5, 'y': 42.30809914, 'z': '5th'},
-{'x': 188.5, 'y': 44.24192774, 'z': '10th'},
-{'x': 188.5, 'y': 48.04426208, 'z': '25th'},
-{'x': 188.5, 'y': 53.42284417, 'z': '50th'},
-{'x': 188.5, 'y': 60.67562433, 'z': '75th'},
-{'x': 188.5, 'y': 69.8848705, 'z': '90th'},
-{'x': 188.5, 'y': 77.42214413, 'z': '95th'},
-{'x': 188.5, 'y': 83.581259, 'z': '97th'},
-{'x': 189.5, 'y': 41.33691866, 'z': '3rd'},
-{'x': 189.5, 'y': 42.4778509, 'z': '5th'},
-{'x': 189.5, 'y': 44.40495652, 'z': '10th'},
-{'x': 189.5, 'y': 48.19519564, 'z': '25th'},
-{'x': 189.5, 'y': 53.5602837, 'z': '50th'},
-{'x': 189.5, 'y': 60.80420388, 'z': '75th'},
-{'x': 189.5, 'y': 70.0227235, 'z': '90th'},
-{'x': 189.5, 'y': 77.58878071, 'z': '95th'},
-{'x': 189.5, 'y': 83.78794544, 'z': '97th'},
-{'x': 190.5, 'y': 41.50559186, 'z': '3rd'},
-{'x': 190.5, 'y': 42.642492, 'z': '5th'},
-{'x': 190.5, 'y': 44.5629977, 'z': '10th'},
-{'x': 190.5, 'y': 48.34133606, 'z': '25th'},
-{'x': 190.5, 'y': 53.69306637, 'z': '50th'},
-{'x': 190.5, 'y': 60.92800363, 'z': '75th'},
-{'x': 190.5, 'y': 70.15513163, 'z': '90th'},
-{'x': 190.5, 'y': 77.74911109, 'z': '95th'},
-{'x': 190.5, 'y': 83.98754779, 'z': '97th'},
-{'x': 191.5, 'y': 41.66906547, 'z': '3rd'},
-{'x': 191.5, 'y': 42.80203238, 'z': '5th'},
-{'x': 191.5, 'y': 44.71609485, 'z': '10th'},
-{'x': 191.5, 'y': 48.4827912, 'z': '25th'},
-{'x': 191.5, 'y': 53.82138422, 'z': '50th'},
-{'x': 191.5, 'y': 61.04730771, 'z': '75th'},
-{'x': 191.5, 'y': 70.28243588, 'z': '90th'},
-{'x': 191.5, 'y': 77.90344707, 'z': '95th'},
-{'x': 191.5, 'y': 84.18028693, 'z': '97th'},
-{'x': 192.5, 'y': 41.82734048, 'z': '3rd'},
-{'x': 192.5, 'y': 42.95649273, 'z': '5th'},
-{'x': 192.5, 'y': 44.86430165, 'z': '10th'},
-{'x': 192.5, 'y': 48.6196779, 'z': '25th'},
-{'x': 192.5, 'y': 53.94543725, 'z': '50th'},
-{'x': 192.5, 'y': 61.16240788, 'z': '75th'},
-{'x': 192.5, 'y': 70.40498554, 'z': '90th'},
-{'x': 192.5, 'y': 78.05210841, 'z': '95th'},
-{'x': 192.5, 'y': 84.36638832, 'z': '97th'},
-{'x': 193.5, 'y': 41.98042905, 'z': '3rd'},
-{'x': 193.5, 'y': 43.10590449, 'z': '5th'},
-{'x': 193.5, 'y': 45.00768175, 'z': '10th'},
-{'x': 193.5, 'y': 48.7521217, 'z': '25th'},
-{'x': 193.5, 'y': 54.06543278, 'z': '50th'},
-{'x': 193.5, 'y': 61.27360245, 'z': '75th'},
-{'x': 193.5, 'y': 70.52313696, 'z': '90th'},
-{'x': 193.5, 'y': 78.19542171, 'z': '95th'},
-{'x': 193.5, 'y': 84.54608137, 'z': '97th'},
-{'x': 194.5, 'y': 42.12835452, 'z': '3rd'},
-{'x': 194.5, 'y': 43.25030973, 'z': '5th'},
-{'x': 194.5, 'y': 45.14630867, 'z': '10th'},
-{'x': 194.5, 'y': 48.88025651, 'z': '25th'},
-{'x': 194.5, 'y': 54.18158486, 'z': '50th'},
-{'x': 194.5, 'y': 61.38119533, 'z': '75th'},
-{'x': 194.5, 'y': 70.63725215, 'z': '90th'},
-{'x': 194.5, 'y': 78.33371911, 'z': '95th'},
-{'x': 194.5, 'y': 84.71959869, 'z': '97th'},
-{'x': 195.5, 'y': 42.27115134, 'z': '3rd'},
-{'x': 195.5, 'y': 43.38976112, 'z': '5th'},
-{'x': 195.5, 'y': 45.28026556, 'z': '10th'},
-{'x': 195.5, 'y': 49.0042242, 'z': '25th'},
-{'x': 195.5, 'y': 54.29411356, 'z': '50th'},
-{'x': 195.5, 'y': 61.48549489, 'z': '75th'},
-{'x': 195.5, 'y': 70.74769732, 'z': '90th'},
-{'x': 195.5, 'y': 78.46733702, 'z': '95th'},
-{'x': 195.5, 'y': 84.88717537, 'z': '97th'},
-{'x': 196.5, 'y': 42.40886495, 'z': '3rd'},
-{'x': 196.5, 'y': 43.52432169, 'z': '5th'},
-{'x': 196.5, 'y': 45.40964499, 'z': '10th'},
-{'x': 196.5, 'y': 49.12417422, 'z': '25th'},
-{'x': 196.5, 'y': 54.40324431, 'z': '50th'},
-{'x': 196.5, 'y': 61.58681291, 'z': '75th'},
-{'x': 196.5, 'y': 70.85484146, 'z': '90th'},
-{'x': 196.5, 'y': 78.59661472, 'z': '95th'},
-{'x': 196.5, 'y': 85.04904822, 'z': '97th'},
-{'x': 197.5, 'y': 42.54155162, 'z': '3rd'},
-{'x': 197.5, 'y': 43.65406467, 'z': '5th'},
-{'x': 197.5, 'y': 45.5345486, 'z': '10th'},
-{'x': 197.5, 'y': 49.24026312, 'z': '25th'},
-{'x': 197.5, 'y': 54.50920717, 'z': '50th'},
-{'x': 197.5, 'y': 61.68546339, 'z': '75th'},
-{'x': 197.5, 'y': 70.95905471, 'z': '90th'},
-{'x': 197.5, 'y': 78.72189292, 'z': '95th'},
-{'x': 197.5, 'y': 85.205455, 'z': '97th'},
-{'x': 198.5, 'y': 42.66927817, 'z': '3rd'},
-{'x': 198.5, 'y': 43.77907316, 'z': '5th'},
-{'x': 198.5, 'y': 45.65508683, 'z': '10th'},
-{'x': 198.5, 'y': 49.35265405, 'z': '25th'},
-{'x': 198.5, 'y': 54.61223603, 'z': '50th'},
-{'x': 198.5, 'y': 61.7817614, 'z': '75th'},
-{'x': 198.5, 'y': 71.06070688, 'z': '90th'},
-{'x': 198.5, 'y': 78.84351231, 'z': '95th'},
-{'x': 198.5, 'y': 85.35663368, 'z': '97th'},
-{'x': 199.5, 'y': 42.79212167, 'z': '3rd'},
-{'x': 199.5, 'y': 43.89943983, 'z': '5th'},
-{'x': 199.5, 'y': 45.77137845, 'z': '10th'},
-{'x': 199.5, 'y': 49.46151622, 'z': '25th'},
-{'x': 199.5, 'y': 54.71256787, 'z': '50th'},
-{'x': 199.5, 'y': 61.87602186, 'z': '75th'},
-{'x': 199.5, 'y': 71.16016568, 'z': '90th'},
-{'x': 199.5, 'y': 78.96181194, 'z': '95th'},
-{'x': 199.5, 'y': 85.50282159, 'z': '97th'},
-{'x': 200.5, 'y': 42.91016914, 'z': '3rd'},
-{'x': 200.5, 'y': 44.01526649, 'z': '5th'},
-{'x': 200.5, 'y': 45.88355015, 'z': '10th'},
-{'x': 200.5, 'y': 49.5670243, 'z': '25th'},
-{'x': 200.5, 'y': 54.81044184, 'z': '50th'},
-{'x': 200.5, 'y': 61.96855832, 'z': '75th'},
-{'x': 200.5, 'y': 71.25779513, 'z': '90th'},
-{'x': 200.5, 'y': 79.07712765, 'z': '95th'},
-{'x': 200.5, 'y': 85.64425466, 'z': '97th'},
-{'x': 201.5, 'y': 43.02351704, 'z': '3rd'},
-{'x': 201.5, 'y': 44.12666366, 'z': '5th'},
-{'x': 201.5, 'y': 45.99173597, 'z': '10th'},
-{'x': 201.5, 'y': 49.66935776, 'z': '25th'},
-{'x': 201.5, 'y': 54.90609842, 'z': '50th'},
-{'x': 201.5, 'y': 62.05968162, 'z': '75th'},
-{'x': 201.5, 'y': 71.35395381, 'z': '90th'},
-{'x': 201.5, 'y': 79.18979044, 'z': '95th'},
-{'x': 201.5, 'y': 85.78116658, 'z': '97th'},
-{'x': 202.5, 'y': 43.13227083, 'z': '3rd'},
-{'x': 202.5, 'y': 44.23375003, 'z': '5th'},
-{'x': 202.5, 'y': 46.09607679, 'z': '10th'},
-{'x': 202.5, 'y': 49.76870017, 'z': '25th'},
-{'x': 202.5, 'y': 54.99977846, 'z': '50th'},
-{'x': 202.5, 'y': 62.14969862, 'z': '75th'},
-{'x': 202.5, 'y': 71.44899305, 'z': '90th'},
-{'x': 202.5, 'y': 79.30012477, 'z': '95th'},
-{'x': 202.5, 'y': 85.91378798, 'z': '97th'},
-{'x': 203.5, 'y': 43.23654442, 'z': '3rd'},
-{'x': 203.5, 'y': 44.33665192, 'z': '5th'},
-{'x': 203.5, 'y': 46.19671962, 'z': '10th'},
-{'x': 203.5, 'y': 49.86523842, 'z': '25th'},
-{'x': 203.5, 'y': 55.09172217, 'z': '50th'},
-{'x': 203.5, 'y': 62.23891075, 'z': '75th'},
-{'x': 203.5, 'y': 71.54325519, 'z': '90th'},
-{'x': 203.5, 'y': 79.40844685, 'z': '95th'},
-{'x': 203.5, 'y': 86.04234557, 'z': '97th'},
-{'x': 204.5, 'y': 43.33645956, 'z': '3rd'},
-{'x': 204.5, 'y': 44.43550259, 'z': '5th'},
-{'x': 204.5, 'y': 46.29381699, 'z': '10th'},
-{'x': 204.5, 'y': 49.95916191, 'z': '25th'},
-{'x': 204.5, 'y': 55.18216811, 'z': '50th'},
-{'x': 204.5, 'y': 62.32761268, 'z': '75th'},
-{'x': 204.5, 'y': 71.63707172, 'z': '90th'},
-{'x': 204.5, 'y': 79.51506292, 'z': '95th'},
-{'x': 204.5, 'y': 86.16706131, 'z': '97th'},
-{'x': 205.5, 'y': 43.43214518, 'z': '3rd'},
-{'x': 205.5, 'y': 44.53044156, 'z': '5th'},
-{'x': 205.5, 'y': 46.38752609, 'z': '10th'},
-{'x': 205.5, 'y': 50.05066163, 'z': '25th'},
-{'x': 205.5, 'y': 55.271352, 'z': '50th'},
-{'x': 205.5, 'y': 62.41609075, 'z': '75th'},
-{'x': 205.5, 'y': 71.73076142, 'z': '90th'},
-{'x': 205.5, 'y': 79.62026752, 'z': '95th'},
-{'x': 205.5, 'y': 86.28815157, 'z': '97th'},
-{'x': 206.5, 'y': 43.52373663, 'z': '3rd'},
-{'x': 206.5, 'y': 44.62161386, 'z': '5th'},
-{'x': 206.5, 'y': 46.47800802, 'z': '10th'},
-{'x': 206.5, 'y': 50.13992923, 'z': '25th'},
-{'x': 206.5, 'y': 55.35950558, 'z': '50th'},
-{'x': 206.5, 'y': 62.50462147, 'z': '75th'},
-{'x': 206.5, 'y': 71.82462845, 'z': '90th'},
-{'x': 206.5, 'y': 79.72434173, 'z': '95th'},
-{'x': 206.5, 'y': 86.40582627, 'z': '97th'},
-{'x': 207.5, 'y': 43.61137495, 'z': '3rd'},
-{'x': 207.5, 'y': 44.70916923, 'z': '5th'},
-{'x': 207.5, 'y': 46.56542689, 'z': '10th'},
-{'x': 207.5, 'y': 50.22715595, 'z': '25th'},
-{'x': 207.5, 'y': 55.44685531, 'z': '50th'},
-{'x': 207.5, 'y': 62.59346994, 'z': '75th'},
-{'x': 207.5, 'y': 71.91896047, 'z': '90th'},
-{'x': 207.5, 'y': 79.82755144, 'z': '95th'},
-{'x': 207.5, 'y': 86.52028803, 'z': '97th'},
-{'x': 208.5, 'y': 43.69520604, 'z': '3rd'},
-{'x': 208.5, 'y': 44.79326117, 'z': '5th'},
-{'x': 208.5, 'y': 46.64994883, 'z': '10th'},
-{'x': 208.5, 'y': 50.31253151, 'z': '25th'},
-{'x': 208.5, 'y': 55.53362107, 'z': '50th'},
-{'x': 208.5, 'y': 62.68288814, 'z': '75th'},
-{'x': 208.5, 'y': 72.01402668, 'z': '90th'},
-{'x': 208.5, 'y': 79.9301456, 'z': '95th'},
-{'x': 208.5, 'y': 86.63173131, 'z': '97th'},
-{'x': 209.5, 'y': 43.77537971, 'z': '3rd'},
-{'x': 209.5, 'y': 44.8740461, 'z': '5th'},
-{'x': 209.5, 'y': 46.73174101, 'z': '10th'},
-{'x': 209.5, 'y': 50.39624297, 'z': '25th'},
-{'x': 209.5, 'y': 55.62001464, 'z': '50th'},
-{'x': 209.5, 'y': 62.77311319, 'z': '75th'},
-{'x': 209.5, 'y': 72.11007585, 'z': '90th'},
-{'x': 209.5, 'y': 80.03235456, 'z': '95th'},
-{'x': 209.5, 'y': 86.74034162, 'z': '97th'},
-{'x': 210.5, 'y': 43.85204883, 'z': '3rd'},
-{'x': 210.5, 'y': 44.95168231, 'z': '5th'},
-{'x': 210.5, 'y': 46.81097052, 'z': '10th'},
-{'x': 210.5, 'y': 50.47847336, 'z': '25th'},
-{'x': 210.5, 'y': 55.70623826, 'z': '50th'},
-{'x': 210.5, 'y': 62.86436555, 'z': '75th'},
-{'x': 210.5, 'y': 72.20733438, 'z': '90th'},
-{'x': 210.5, 'y': 80.13438837, 'z': '95th'},
-{'x': 210.5, 'y': 86.84629466, 'z': '97th'},
-{'x': 211.5, 'y': 43.9253721, 'z': '3rd'},
-{'x': 211.5, 'y': 45.02633189, 'z': '5th'},
-{'x': 211.5, 'y': 46.88780489, 'z': '10th'},
-{'x': 211.5, 'y': 50.55939966, 'z': '25th'},
-{'x': 211.5, 'y': 55.79247939, 'z': '50th'},
-{'x': 211.5, 'y': 62.95684135, 'z': '75th'},
-{'x': 211.5, 'y': 72.3059993, 'z': '90th'},
-{'x': 211.5, 'y': 80.23643485, 'z': '95th'},
-{'x': 211.5, 'y': 86.9497625, 'z': '97th'},
-{'x': 212.5, 'y': 43.99549743, 'z': '3rd'},
-{'x': 212.5, 'y': 45.09814744, 'z': '5th'},
-{'x': 212.5, 'y': 46.96240411, 'z': '10th'},
-{'x': 212.5, 'y': 50.6391944, 'z': '25th'},
-{'x': 212.5, 'y': 55.87892356, 'z': '50th'},
-{'x': 212.5, 'y': 63.05073398, 'z': '75th'},
-{'x': 212.5, 'y': 72.40625667, 'z': '90th'},
-{'x': 212.5, 'y': 80.33865934, 'z': '95th'},
-{'x': 212.5, 'y': 87.05088422, 'z': '97th'},
-{'x': 213.5, 'y': 44.06258481, 'z': '3rd'},
-{'x': 213.5, 'y': 45.16728964, 'z': '5th'},
-{'x': 213.5, 'y': 47.03492965, 'z': '10th'},
-{'x': 213.5, 'y': 50.71801935, 'z': '25th'},
-{'x': 213.5, 'y': 55.96573022, 'z': '50th'},
-{'x': 213.5, 'y': 63.14619584, 'z': '75th'},
-{'x': 213.5, 'y': 72.50824833, 'z': '90th'},
-{'x': 213.5, 'y': 80.44120111, 'z': '95th'},
-{'x': 213.5, 'y': 87.14980899, 'z': '97th'},
-{'x': 214.5, 'y': 44.12678882, 'z': '3rd'},
-{'x': 214.5, 'y': 45.23391322, 'z': '5th'},
-{'x': 214.5, 'y': 47.10553608, 'z': '10th'},
-{'x': 214.5, 'y': 50.79602716, 'z': '25th'},
-{'x': 214.5, 'y': 56.05304601, 'z': '50th'},
-{'x': 214.5, 'y': 63.24336091, 'z': '75th'},
-{'x': 214.5, 'y': 72.61209121, 'z': '90th'},
-{'x': 214.5, 'y': 80.54417335, 'z': '95th'},
-{'x': 214.5, 'y': 87.24666536, 'z': '97th'},
-{'x': 215.5, 'y': 44.18826162, 'z': '3rd'},
-{'x': 215.5, 'y': 45.29816896, 'z': '5th'},
-{'x': 215.5, 'y': 47.17437139, 'z': '10th'},
-{'x': 215.5, 'y': 50.87335876, 'z': '25th'},
-{'x': 215.5, 'y': 56.14099882, 'z': '50th'},
-{'x': 215.5, 'y': 63.34233618, 'z': '75th'},
-{'x': 215.5, 'y': 72.71786996, 'z': '90th'},
-{'x': 215.5, 'y': 80.64766146, 'z': '95th'},
-{'x': 215.5, 'y': 87.34156823, 'z': '97th'},
-{'x': 216.5, 'y': 44.24715174, 'z': '3rd'},
-{'x': 216.5, 'y': 45.36020233, 'z': '5th'},
-{'x': 216.5, 'y': 47.24157543, 'z': '10th'},
-{'x': 216.5, 'y': 50.95014153, 'z': '25th'},
-{'x': 216.5, 'y': 56.22969564, 'z': '50th'},
-{'x': 216.5, 'y': 63.44319934, 'z': '75th'},
-{'x': 216.5, 'y': 72.82563495, 'z': '90th'},
-{'x': 216.5, 'y': 80.75172168, 'z': '95th'},
-{'x': 216.5, 'y': 87.43461808, 'z': '97th'},
-{'x': 217.5, 'y': 44.30360275, 'z': '3rd'},
-{'x': 217.5, 'y': 45.42015206, 'z': '5th'},
-{'x': 217.5, 'y': 47.30727836, 'z': '10th'},
-{'x': 217.5, 'y': 51.02648735, 'z': '25th'},
-{'x': 217.5, 'y': 56.3192203, 'z': '50th'},
-{'x': 217.5, 'y': 63.54599643, 'z': '75th'},
-{'x': 217.5, 'y': 72.93540037, 'z': '90th'},
-{'x': 217.5, 'y': 80.85638, 'z': '95th'},
-{'x': 217.5, 'y': 87.52590032, 'z': '97th'},
-{'x': 218.5, 'y': 44.35775192, 'z': '3rd'},
-{'x': 218.5, 'y': 45.47814866, 'z': '5th'},
-{'x': 218.5, 'y': 47.37159889, 'z': '10th'},
-{'x': 218.5, 'y': 51.10249055, 'z': '25th'},
-{'x': 218.5, 'y': 56.40963105, 'z': '50th'},
-{'x': 218.5, 'y': 63.65073939, 'z': '75th'},
-{'x': 218.5, 'y': 73.04714239, 'z': '90th'},
-{'x': 218.5, 'y': 80.96163098, 'z': '95th'},
-{'x': 218.5, 'y': 87.61548453, 'z': '97th'},
-{'x': 219.5, 'y': 44.40972877, 'z': '3rd'},
-{'x': 219.5, 'y': 45.53431283, 'z': '5th'},
-{'x': 219.5, 'y': 47.43464251, 'z': '10th'},
-{'x': 219.5, 'y': 51.17822572, 'z': '25th'},
-{'x': 219.5, 'y': 56.50095811, 'z': '50th'},
-{'x': 219.5, 'y': 63.75740358, 'z': '75th'},
-{'x': 219.5, 'y': 73.16079731, 'z': '90th'},
-{'x': 219.5, 'y': 81.06743678, 'z': '95th'},
-{'x': 219.5, 'y': 87.70342388, 'z': '97th'},
-{'x': 220.5, 'y': 44.45965358, 'z': '3rd'},
-{'x': 220.5, 'y': 45.58875384, 'z': '5th'},
-{'x': 220.5, 'y': 47.49649958, 'z': '10th'},
-{'x': 220.5, 'y': 51.25374544, 'z': '25th'},
-{'x': 220.5, 'y': 56.59320107, 'z': '50th'},
-{'x': 220.5, 'y': 63.86592525, 'z': '75th'},
-{'x': 220.5, 'y': 73.27625982, 'z': '90th'},
-{'x': 220.5, 'y': 81.17372627, 'z': '95th'},
-{'x': 220.5, 'y': 87.78975439, 'z': '97th'},
-{'x': 221.5, 'y': 44.50763581, 'z': '3rd'},
-{'x': 221.5, 'y': 45.64156773, 'z': '5th'},
-{'x': 221.5, 'y': 47.55724333, 'z': '10th'},
-{'x': 221.5, 'y': 51.32907793, 'z': '25th'},
-{'x': 221.5, 'y': 56.68632619, 'z': '50th'},
-{'x': 221.5, 'y': 63.97619897, 'z': '75th'},
-{'x': 221.5, 'y': 73.39338138, 'z': '90th'},
-{'x': 221.5, 'y': 81.28039424, 'z': '95th'},
-{'x': 221.5, 'y': 87.87449436, 'z': '97th'},
-{'x': 222.5, 'y': 44.5537724, 'z': '3rd'},
-{'x': 222.5, 'y': 45.69283549, 'z': '5th'},
-{'x': 222.5, 'y': 47.61692775, 'z': '10th'},
-{'x': 222.5, 'y': 51.40422448, 'z': '25th'},
-{'x': 222.5, 'y': 56.78026364, 'z': '50th'},
-{'x': 222.5, 'y': 64.08807505, 'z': '75th'},
-{'x': 222.5, 'y': 73.51196857, 'z': '90th'},
-{'x': 222.5, 'y': 81.38730069, 'z': '95th'},
-{'x': 222.5, 'y': 87.95764367, 'z': '97th'},
-{'x': 223.5, 'y': 44.598146, 'z': '3rd'},
-{'x': 223.5, 'y': 45.74262109, 'z': '5th'},
-{'x': 223.5, 'y': 47.6755854, 'z': '10th'},
-{'x': 223.5, 'y': 51.47915686, 'z': '25th'},
-{'x': 223.5, 'y': 56.87490465, 'z': '50th'},
-{'x': 223.5, 'y': 64.20135697, 'z': '75th'},
-{'x': 223.5, 'y': 73.63178167, 'z': '90th'},
-{'x': 223.5, 'y': 81.49427023, 'z': '95th'},
-{'x': 223.5, 'y': 88.03918325, 'z': '97th'},
-{'x': 224.5, 'y': 44.64082307, 'z': '3rd'},
-{'x': 224.5, 'y': 45.79096943, 'z': '5th'},
-{'x': 224.5, 'y': 47.733225, 'z': '10th'},
-{'x': 224.5, 'y': 51.55381463, 'z': '25th'},
-{'x': 224.5, 'y': 56.97009856, 'z': '50th'},
-{'x': 224.5, 'y': 64.31579883, 'z': '75th'},
-{'x': 224.5, 'y': 73.75253327, 'z': '90th'},
-{'x': 224.5, 'y': 81.60109165, 'z': '95th'},
-{'x': 224.5, 'y': 88.11907438, 'z': '97th'},
-{'x': 225.5, 'y': 44.68185184, 'z': '3rd'},
-{'x': 225.5, 'y': 45.83790409, 'z': '5th'},
-{'x': 225.5, 'y': 47.78982906, 'z': '10th'},
-{'x': 225.5, 'y': 51.62810228, 'z': '25th'},
-{'x': 225.5, 'y': 57.06564989, 'z': '50th'},
-{'x': 225.5, 'y': 64.43110284, 'z': '75th'},
-{'x': 225.5, 'y': 73.87388701, 'z': '90th'},
-{'x': 225.5, 'y': 81.70751748, 'z': '95th'},
-{'x': 225.5, 'y': 88.19725823, 'z': '97th'},
-{'x': 226.5, 'y': 44.72126019, 'z': '3rd'},
-{'x': 226.5, 'y': 45.88342504, 'z': '5th'},
-{'x': 226.5, 'y': 47.84535121, 'z': '10th'},
-{'x': 226.5, 'y': 51.70188628, 'z': '25th'},
-{'x': 226.5, 'y': 57.16131528, 'z': '50th'},
-{'x': 226.5, 'y': 64.54691678, 'z': '75th'},
-{'x': 226.5, 'y': 73.99545642, 'z': '90th'},
-{'x': 226.5, 'y': 81.8132637, 'z': '95th'},
-{'x': 226.5, 'y': 88.27365525, 'z': '97th'},
-{'x': 227.5, 'y': 44.75905693, 'z': '3rd'},
-{'x': 227.5, 'y': 45.92750914, 'z': '5th'},
-{'x': 227.5, 'y': 47.89971542, 'z': '10th'},
-{'x': 227.5, 'y': 51.7749921, 'z': '25th'},
-{'x': 227.5, 'y': 57.25679821, 'z': '50th'},
-{'x': 227.5, 'y': 64.66282755, 'z': '75th'},
-{'x': 227.5, 'y': 74.11679995, 'z': '90th'},
-{'x': 227.5, 'y': 81.91800816, 'z': '95th'},
-{'x': 227.5, 'y': 88.34816753, 'z': '97th'},
-{'x': 228.5, 'y': 44.79521204, 'z': '3rd'},
-{'x': 228.5, 'y': 45.97009344, 'z': '5th'},
-{'x': 228.5, 'y': 47.9528045, 'z': '10th'},
-{'x': 228.5, 'y': 51.84720202, 'z': '25th'},
-{'x': 228.5, 'y': 57.35175792, 'z': '50th'},
-{'x': 228.5, 'y': 64.77837954, 'z': '75th'},
-{'x': 228.5, 'y': 74.23743894, 'z': '90th'},
-{'x': 228.5, 'y': 82.02139464, 'z': '95th'},
-{'x': 228.5, 'y': 88.42066003, 'z': '97th'},
-{'x': 229.5, 'y': 44.82968627, 'z': '3rd'},
-{'x': 229.5, 'y': 46.01109826, 'z': '5th'},
-{'x': 229.5, 'y': 48.00447244, 'z': '10th'},
-{'x': 229.5, 'y': 51.91824859, 'z': '25th'},
-{'x': 229.5, 'y': 57.44578172, 'z': '50th'},
-{'x': 229.5, 'y': 64.89303137, 'z': '75th'},
-{'x': 229.5, 'y': 74.35682105, 'z': '90th'},
-{'x': 229.5, 'y': 82.12302792, 'z': '95th'},
-{'x': 229.5, 'y': 88.49100174, 'z': '97th'},
-{'x': 230.5, 'y': 44.86239882, 'z': '3rd'},
-{'x': 230.5, 'y': 46.05040055, 'z': '5th'},
-{'x': 230.5, 'y': 48.05452712, 'z': '10th'},
-{'x': 230.5, 'y': 51.98781418, 'z': '25th'},
-{'x': 230.5, 'y': 57.53840429, 'z': '50th'},
-{'x': 230.5, 'y': 65.00619161, 'z': '75th'},
-{'x': 230.5, 'y': 74.47435424, 'z': '90th'},
-{'x': 230.5, 'y': 82.22248225, 'z': '95th'},
-{'x': 230.5, 'y': 88.55903385, 'z': '97th'},
-{'x': 231.5, 'y': 44.89323794, 'z': '3rd'},
-{'x': 231.5, 'y': 46.08784264, 'z': '5th'},
-{'x': 231.5, 'y': 48.10273611, 'z': '10th'},
-{'x': 231.5, 'y': 52.05553129, 'z': '25th'},
-{'x': 231.5, 'y': 57.62910094, 'z': '50th'},
-{'x': 231.5, 'y': 65.11720439, 'z': '75th'},
-{'x': 231.5, 'y': 74.58938617, 'z': '90th'},
-{'x': 231.5, 'y': 82.3192791, 'z': '95th'},
-{'x': 231.5, 'y': 88.62454872, 'z': '97th'},
-{'x': 232.5, 'y': 44.92205384, 'z': '3rd'},
-{'x': 232.5, 'y': 46.12322421, 'z': '5th'},
-{'x': 232.5, 'y': 48.14881709, 'z': '10th'},
-{'x': 232.5, 'y': 52.12097097, 'z': '25th'},
-{'x': 232.5, 'y': 57.7172758, 'z': '50th'},
-{'x': 232.5, 'y': 65.22534243, 'z': '75th'},
-{'x': 232.5, 'y': 74.70121281, 'z': '90th'},
-{'x': 232.5, 'y': 82.41291688, 'z': '95th'},
-{'x': 232.5, 'y': 88.68734305, 'z': '97th'},
-{'x': 233.5, 'y': 44.94865678, 'z': '3rd'},
-{'x': 233.5, 'y': 46.15630107, 'z': '5th'},
-{'x': 233.5, 'y': 48.1924379, 'z': '10th'},
-{'x': 233.5, 'y': 52.1836449, 'z': '25th'},
-{'x': 233.5, 'y': 57.80226553, 'z': '50th'},
-{'x': 233.5, 'y': 65.32980994, 'z': '75th'},
-{'x': 233.5, 'y': 74.80907365, 'z': '90th'},
-{'x': 233.5, 'y': 82.50285304, 'z': '95th'},
-{'x': 233.5, 'y': 88.74718402, 'z': '97th'},
-{'x': 234.5, 'y': 44.97281279, 'z': '3rd'},
-{'x': 234.5, 'y': 46.18678082, 'z': '5th'},
-{'x': 234.5, 'y': 48.23321202, 'z': '10th'},
-{'x': 234.5, 'y': 52.24300075, 'z': '25th'},
-{'x': 234.5, 'y': 57.88333502, 'z': '50th'},
-{'x': 234.5, 'y': 65.42973979, 'z': '75th'},
-{'x': 234.5, 'y': 74.91215216, 'z': '90th'},
-{'x': 234.5, 'y': 82.58850833, 'z': '95th'},
-{'x': 234.5, 'y': 88.80381758, 'z': '97th'},
-{'x': 235.5, 'y': 44.99423978, 'z': '3rd'},
-{'x': 235.5, 'y': 46.21431895, 'z': '5th'},
-{'x': 235.5, 'y': 48.27069475, 'z': '10th'},
-{'x': 235.5, 'y': 52.2984187, 'z': '25th'},
-{'x': 235.5, 'y': 57.95967458, 'z': '50th'},
-{'x': 235.5, 'y': 65.52419173, 'z': '75th'},
-{'x': 235.5, 'y': 75.00957518, 'z': '90th'},
-{'x': 235.5, 'y': 82.66926695, 'z': '95th'},
-{'x': 235.5, 'y': 88.85696942, 'z': '97th'},
-{'x': 236.5, 'y': 45.01260329, 'z': '3rd'},
-{'x': 236.5, 'y': 46.23851477, 'z': '5th'},
-{'x': 236.5, 'y': 48.3043794, 'z': '10th'},
-{'x': 236.5, 'y': 52.34920805, 'z': '25th'},
-{'x': 236.5, 'y': 58.0303973, 'z': '50th'},
-{'x': 236.5, 'y': 65.61215061, 'z': '75th'},
-{'x': 236.5, 'y': 75.10041216, 'z': '90th'},
-{'x': 236.5, 'y': 82.74447678, 'z': '95th'},
-{'x': 236.5, 'y': 88.90634626, 'z': '97th'},
-{'x': 237.5, 'y': 45.02751676, 'z': '3rd'},
-{'x': 237.5, 'y': 46.2589107, 'z': '5th'},
-{'x': 237.5, 'y': 48.33369518, 'z': '10th'},
-{'x': 237.5, 'y': 52.39460282, 'z': '25th'},
-{'x': 237.5, 'y': 58.09453209, 'z': '50th'},
-{'x': 237.5, 'y': 65.69251821, 'z': '75th'},
-{'x': 237.5, 'y': 75.18366937, 'z': '90th'},
-{'x': 237.5, 'y': 82.81344962, 'z': '95th'},
-{'x': 237.5, 'y': 88.95164479, 'z': '97th'},
-{'x': 238.5, 'y': 45.03852094, 'z': '3rd'},
-{'x': 238.5, 'y': 46.27497563, 'z': '5th'},
-{'x': 238.5, 'y': 48.35799667, 'z': '10th'},
-{'x': 238.5, 'y': 52.4337619, 'z': '25th'},
-{'x': 238.5, 'y': 58.15103575, 'z': '50th'},
-{'x': 238.5, 'y': 65.76413346, 'z': '75th'},
-{'x': 238.5, 'y': 75.25830602, 'z': '90th'},
-{'x': 238.5, 'y': 82.87546122, 'z': '95th'},
-{'x': 238.5, 'y': 88.99252982, 'z': '97th'},
-{'x': 239.5, 'y': 45.04509979, 'z': '3rd'},
-{'x': 239.5, 'y': 46.28611635, 'z': '5th'},
-{'x': 239.5, 'y': 48.37656825, 'z': '10th'},
-{'x': 239.5, 'y': 52.46576117, 'z': '25th'},
-{'x': 239.5, 'y': 58.1987714, 'z': '50th'},
-{'x': 239.5, 'y': 65.8257417, 'z': '75th'},
-{'x': 239.5, 'y': 75.32321054, 'z': '90th'},
-{'x': 239.5, 'y': 82.92975179, 'z': '95th'},
-{'x': 239.5, 'y': 89.02866893, 'z': '97th'},
-{'x': 240.0, 'y': 45.04654822, 'z': '3rd'},
-{'x': 240.0, 'y': 46.28963394, 'z': '5th'},
-{'x': 240.0, 'y': 48.38346004, 'z': '10th'},
-{'x': 240.0, 'y': 52.47876433, 'z': '25th'},
-{'x': 240.0, 'y': 58.21897289, 'z': '50th'},
-{'x': 240.0, 'y': 65.85237979, 'z': '75th'},
-{'x': 240.0, 'y': 75.35164989, 'z': '90th'},
-{'x': 240.0, 'y': 82.95375457, 'z': '95th'},
-{'x': 240.0, 'y': 89.04485133, 'z': '97th'}
-]
\ No newline at end of file
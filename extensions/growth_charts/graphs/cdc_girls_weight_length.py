@@ -1,542 +0,0 @@
-cdc_girls_weight_length = [
- {'x': 45.0, 'y': 1.61302626, 'z': '3rd'},
- {'x': 45.0, 'y': 1.69530853, 'z': '5th'},
- {'x': 45.0, 'y': 1.824644762, 'z': '10th'},
- {'x': 45.0, 'y': 2.047707671, 'z': '25th'},
- {'x': 45.0, 'y': 2.305396985, 'z': '50th'},
- {'x': 45.0, 'y': 2.573066177, 'z': '75th'},
- {'x': 45.0, 'y': 2.822211988, 'z': '90th'},
- {'x': 45.0, 'y': 2.974943903, 'z': '95th'},
- {'x': 45.0, 'y': 3.075559629, 'z': '97th'},
- {'x': 45.5, 'y': 1.723754478, 'z': '3rd'},
- {'x': 45.5, 'y': 1.805222631, 'z': '5th'},
- {'x': 45.5, 'y': 1.932850514, 'z': '10th'},
- {'x': 45.5, 'y': 2.151843669, 'z': '25th'},
- {'x': 45.5, 'y': 2.403256702, 'z': '50th'},
- {'x': 45.5, 'y': 2.662835955, 'z': '75th'},
- {'x': 45.5, 'y': 2.90317596, 'z': '90th'},
- {'x': 45.5, 'y': 3.049956403, 'z': '95th'},
- {'x': 45.5, 'y': 3.146436315, 'z': '97th'},
- {'x': 46.5, 'y': 1.946460733, 'z': '3rd'},
- {'x': 46.5, 'y': 2.026496007, 'z': '5th'},
- {'x': 46.5, 'y': 2.151303478, 'z': '10th'},
- {'x': 46.5, 'y': 2.363960397, 'z': '25th'},
- {'x': 46.5, 'y': 2.606020484, 'z': '50th'},
- {'x': 46.5, 'y': 2.853889995, 'z': '75th'},
- {'x': 46.5, 'y': 3.081735239, 'z': '90th'},
- {'x': 46.5, 'y': 3.220172553, 'z': '95th'},
- {'x': 46.5, 'y': 3.310892709, 'z': '97th'},
- {'x': 47.5, 'y': 2.170805299, 'z': '3rd'},
- {'x': 47.5, 'y': 2.249554961, 'z': '5th'},
- {'x': 47.5, 'y': 2.37216013, 'z': '10th'},
- {'x': 47.5, 'y': 2.580564792, 'z': '25th'},
- {'x': 47.5, 'y': 2.817114082, 'z': '50th'},
- {'x': 47.5, 'y': 3.058703241, 'z': '75th'},
- {'x': 47.5, 'y': 3.280280685, 'z': '90th'},
- {'x': 47.5, 'y': 3.414702479, 'z': '95th'},
- {'x': 47.5, 'y': 3.502712567, 'z': '97th'},
- {'x': 48.5, 'y': 2.396673878, 'z': '3rd'},
- {'x': 48.5, 'y': 2.474214132, 'z': '5th'},
- {'x': 48.5, 'y': 2.595089193, 'z': '10th'},
- {'x': 48.5, 'y': 2.80098615, 'z': '25th'},
- {'x': 48.5, 'y': 3.035356101, 'z': '50th'},
- {'x': 48.5, 'y': 3.275451769, 'z': '75th'},
- {'x': 48.5, 'y': 3.496304856, 'z': '90th'},
- {'x': 48.5, 'y': 3.630584823, 'z': '95th'},
- {'x': 48.5, 'y': 3.718622563, 'z': '97th'},
- {'x': 49.5, 'y': 2.623845869, 'z': '3rd'},
- {'x': 49.5, 'y': 2.700266794, 'z': '5th'},
- {'x': 49.5, 'y': 2.819827425, 'z': '10th'},
- {'x': 49.5, 'y': 3.024685576, 'z': '25th'},
- {'x': 49.5, 'y': 3.259693318, 'z': '50th'},
- {'x': 49.5, 'y': 3.502419401, 'z': '75th'},
- {'x': 49.5, 'y': 3.72742595, 'z': '90th'},
- {'x': 49.5, 'y': 3.865029598, 'z': '95th'},
- {'x': 49.5, 'y': 3.955569802, 'z': '97th'},
- {'x': 50.5, 'y': 2.852008338, 'z': '3rd'},
- {'x': 50.5, 'y': 2.92747924, 'z': '5th'},
- {'x': 50.5, 'y': 3.046162798, 'z': '10th'},
- {'x': 50.5, 'y': 3.251250865, 'z': '25th'},
- {'x': 50.5, 'y': 3.48922017, 'z': '50th'},
- {'x': 50.5, 'y': 3.738025406, 'z': '75th'},
- {'x': 50.5, 'y': 3.971395567, 'z': '90th'},
- {'x': 50.5, 'y': 4.115400222, 'z': '95th'},
- {'x': 50.5, 'y': 4.210681986, 'z': '97th'},
- {'x': 51.5, 'y': 3.08077988, 'z': '3rd'},
- {'x': 51.5, 'y': 3.155581427, 'z': '5th'},
- {'x': 51.5, 'y': 3.273900839, 'z': '10th'},
- {'x': 51.5, 'y': 3.480372197, 'z': '25th'},
- {'x': 51.5, 'y': 3.723195489, 'z': '50th'},
- {'x': 51.5, 'y': 3.980867931, 'z': '75th'},
- {'x': 51.5, 'y': 4.2261236, 'z': '90th'},
- {'x': 51.5, 'y': 4.37920066, 'z': '95th'},
- {'x': 51.5, 'y': 4.481218409, 'z': '97th'},
- {'x': 52.5, 'y': 3.309743456, 'z': '3rd'},
- {'x': 52.5, 'y': 3.384266533, 'z': '5th'},
- {'x': 52.5, 'y': 3.502832371, 'z': '10th'},
- {'x': 52.5, 'y': 3.71180166, 'z': '25th'},
- {'x': 52.5, 'y': 3.961034945, 'z': '50th'},
- {'x': 52.5, 'y': 4.229754129, 'z': '75th'},
- {'x': 52.5, 'y': 4.489708217, 'z': '90th'},
- {'x': 52.5, 'y': 4.654076004, 'z': '95th'},
- {'x': 52.5, 'y': 4.76453627, 'z': '97th'},
- {'x': 53.5, 'y': 3.538486235, 'z': '3rd'},
- {'x': 53.5, 'y': 3.613206007, 'z': '5th'},
- {'x': 53.5, 'y': 3.732716377, 'z': '10th'},
- {'x': 53.5, 'y': 3.945306087, 'z': '25th'},
- {'x': 53.5, 'y': 4.202270022, 'z': '50th'},
- {'x': 53.5, 'y': 4.483693775, 'z': '75th'},
- {'x': 53.5, 'y': 4.760455514, 'z': '90th'},
- {'x': 53.5, 'y': 4.937828528, 'z': '95th'},
- {'x': 53.5, 'y': 5.058090815, 'z': '97th'},
- {'x': 54.5, 'y': 3.766648425, 'z': '3rd'},
- {'x': 54.5, 'y': 3.842082114, 'z': '5th'},
- {'x': 54.5, 'y': 3.963283111, 'z': '10th'},
- {'x': 54.5, 'y': 4.180622529, 'z': '25th'},
- {'x': 54.5, 'y': 4.446476028, 'z': '50th'},
- {'x': 54.5, 'y': 4.741844038, 'z': '75th'},
- {'x': 54.5, 'y': 5.036873117, 'z': '90th'},
- {'x': 54.5, 'y': 5.228445091, 'z': '95th'},
- {'x': 54.5, 'y': 5.359480791, 'z': '97th'},
- {'x': 55.5, 'y': 3.99394852, 'z': '3rd'},
- {'x': 55.5, 'y': 4.070613878, 'z': '5th'},
- {'x': 55.5, 'y': 4.194251416, 'z': '10th'},
- {'x': 55.5, 'y': 4.417443974, 'z': '25th'},
- {'x': 55.5, 'y': 4.693220151, 'z': '50th'},
- {'x': 55.5, 'y': 5.003447846, 'z': '75th'},
- {'x': 55.5, 'y': 5.317643817, 'z': '90th'},
- {'x': 55.5, 'y': 5.524112903, 'z': '95th'},
- {'x': 55.5, 'y': 5.666497508, 'z': '97th'},
- {'x': 56.5, 'y': 4.22019582, 'z': '3rd'},
- {'x': 56.5, 'y': 4.298576091, 'z': '5th'},
- {'x': 56.5, 'y': 4.425349217, 'z': '10th'},
- {'x': 56.5, 'y': 4.65542253, 'z': '25th'},
- {'x': 56.5, 'y': 4.942029343, 'z': '50th'},
- {'x': 56.5, 'y': 5.267777008, 'z': '75th'},
- {'x': 56.5, 'y': 5.601587401, 'z': '90th'},
- {'x': 56.5, 'y': 5.823223715, 'z': '95th'},
- {'x': 56.5, 'y': 5.977171656, 'z': '97th'},
- {'x': 57.5, 'y': 4.445271101, 'z': '3rd'},
- {'x': 57.5, 'y': 4.525795306, 'z': '5th'},
- {'x': 57.5, 'y': 4.656327074, 'z': '10th'},
- {'x': 57.5, 'y': 4.894194501, 'z': '25th'},
- {'x': 57.5, 'y': 5.192403337, 'z': '50th'},
- {'x': 57.5, 'y': 5.534118638, 'z': '75th'},
- {'x': 57.5, 'y': 5.887634175, 'z': '90th'},
- {'x': 57.5, 'y': 6.124358847, 'z': '95th'},
- {'x': 57.5, 'y': 6.289778737, 'z': '97th'},
- {'x': 58.5, 'y': 4.669110719, 'z': '3rd'},
- {'x': 58.5, 'y': 4.75214371, 'z': '5th'},
- {'x': 58.5, 'y': 4.886964606, 'z': '10th'},
- {'x': 58.5, 'y': 5.133398784, 'z': '25th'},
- {'x': 58.5, 'y': 5.443830096, 'z': '50th'},
- {'x': 58.5, 'y': 5.801772695, 'z': '75th'},
- {'x': 58.5, 'y': 6.174806785, 'z': '90th'},
- {'x': 58.5, 'y': 6.426273604, 'z': '95th'},
- {'x': 58.5, 'y': 6.602835746, 'z': '97th'},
- {'x': 59.5, 'y': 4.891682562, 'z': '3rd'},
- {'x': 59.5, 'y': 4.977524782, 'z': '5th'},
- {'x': 59.5, 'y': 5.117070202, 'z': '10th'},
- {'x': 59.5, 'y': 5.372695342, 'z': '25th'},
- {'x': 59.5, 'y': 5.69581328, 'z': '50th'},
- {'x': 59.5, 'y': 6.070070759, 'z': '75th'},
- {'x': 59.5, 'y': 6.462216757, 'z': '90th'},
- {'x': 59.5, 'y': 6.72787876, 'z': '95th'},
- {'x': 59.5, 'y': 6.91507564, 'z': '97th'},
- {'x': 60.5, 'y': 5.112971092, 'z': '3rd'},
- {'x': 60.5, 'y': 5.201863101, 'z': '5th'},
- {'x': 60.5, 'y': 5.34647836, 'z': '10th'},
- {'x': 60.5, 'y': 5.611774363, 'z': '25th'},
- {'x': 60.5, 'y': 5.947889759, 'z': '50th'},
- {'x': 60.5, 'y': 6.33839139, 'z': '75th'},
- {'x': 60.5, 'y': 6.749065162, 'z': '90th'},
- {'x': 60.5, 'y': 7.028227249, 'z': '95th'},
- {'x': 60.5, 'y': 7.225424353, 'z': '97th'},
- {'x': 61.5, 'y': 5.332968047, 'z': '3rd'},
- {'x': 61.5, 'y': 5.42509726, 'z': '5th'},
- {'x': 61.5, 'y': 5.57504651, 'z': '10th'},
- {'x': 61.5, 'y': 5.850360248, 'z': '25th'},
- {'x': 61.5, 'y': 6.199640267, 'z': '50th'},
- {'x': 61.5, 'y': 6.606171625, 'z': '75th'},
- {'x': 61.5, 'y': 7.034644746, 'z': '90th'},
- {'x': 61.5, 'y': 7.326504329, 'z': '95th'},
- {'x': 61.5, 'y': 7.532980555, 'z': '97th'},
- {'x': 62.5, 'y': 5.551666409, 'z': '3rd'},
- {'x': 62.5, 'y': 5.64717487, 'z': '5th'},
- {'x': 62.5, 'y': 5.80265208, 'z': '10th'},
- {'x': 62.5, 'y': 6.088213081, 'z': '25th'},
- {'x': 62.5, 'y': 6.450695818, 'z': '50th'},
- {'x': 62.5, 'y': 6.872915135, 'z': '75th'},
- {'x': 62.5, 'y': 7.318342, 'z': '90th'},
- {'x': 62.5, 'y': 7.622019771, 'z': '95th'},
- {'x': 62.5, 'y': 7.836997958, 'z': '97th'},
- {'x': 63.5, 'y': 5.769060531, 'z': '3rd'},
- {'x': 63.5, 'y': 5.868051772, 'z': '5th'},
- {'x': 63.5, 'y': 6.029190763, 'z': '10th'},
- {'x': 63.5, 'y': 6.325126546, 'z': '25th'},
- {'x': 63.5, 'y': 6.700736725, 'z': '50th'},
- {'x': 63.5, 'y': 7.138192567, 'z': '75th'},
- {'x': 63.5, 'y': 7.59963607, 'z': '90th'},
- {'x': 63.5, 'y': 7.914202723, 'z': '95th'},
- {'x': 63.5, 'y': 8.136875366, 'z': '97th'},
- {'x': 64.5, 'y': 5.985144406, 'z': '3rd'},
- {'x': 64.5, 'y': 6.08769022, 'z': '5th'},
- {'x': 64.5, 'y': 6.254574837, 'z': '10th'},
- {'x': 64.5, 'y': 6.560927184, 'z': '25th'},
- {'x': 64.5, 'y': 6.949493534, 'z': '50th'},
- {'x': 64.5, 'y': 7.401643498, 'z': '75th'},
- {'x': 64.5, 'y': 7.878098236, 'z': '90th'},
- {'x': 64.5, 'y': 8.202595917, 'z': '95th'},
- {'x': 64.5, 'y': 8.432144771, 'z': '97th'},
- {'x': 65.5, 'y': 6.199912645, 'z': '3rd'},
- {'x': 65.5, 'y': 6.306059022, 'z': '5th'},
- {'x': 65.5, 'y': 6.478732239, 'z': '10th'},
- {'x': 65.5, 'y': 6.795472337, 'z': '25th'},
- {'x': 65.5, 'y': 7.196744733, 'z': '50th'},
- {'x': 65.5, 'y': 7.662974516, 'z': '75th'},
- {'x': 65.5, 'y': 8.15338936, 'z': '90th'},
- {'x': 65.5, 'y': 8.486850867, 'z': '95th'},
- {'x': 65.5, 'y': 8.722463522, 'z': '97th'},
- {'x': 66.5, 'y': 6.413361985, 'z': '3rd'},
- {'x': 66.5, 'y': 6.523134146, 'z': '5th'},
- {'x': 66.5, 'y': 6.701605945, 'z': '10th'},
- {'x': 66.5, 'y': 7.028648027, 'z': '25th'},
- {'x': 66.5, 'y': 7.442313819, 'z': '50th'},
- {'x': 66.5, 'y': 7.921956215, 'z': '75th'},
- {'x': 66.5, 'y': 8.425256531, 'z': '90th'},
- {'x': 66.5, 'y': 8.766723181, 'z': '95th'},
- {'x': 66.5, 'y': 9.00760766, 'z': '97th'},
- {'x': 67.5, 'y': 6.625492182, 'z': '3rd'},
- {'x': 67.5, 'y': 6.738899009, 'z': '5th'},
- {'x': 67.5, 'y': 6.923153436, 'z': '10th'},
- {'x': 67.5, 'y': 7.260367355, 'z': '25th'},
- {'x': 67.5, 'y': 7.686067039, 'z': '50th'},
- {'x': 67.5, 'y': 8.17842062, 'z': '75th'},
- {'x': 67.5, 'y': 8.693529674, 'z': '90th'},
- {'x': 67.5, 'y': 9.04206755, 'z': '95th'},
- {'x': 67.5, 'y': 9.287464886, 'z': '97th'},
- {'x': 68.5, 'y': 6.836308446, 'z': '3rd'},
- {'x': 68.5, 'y': 6.953345818, 'z': '5th'},
- {'x': 68.5, 'y': 7.143346471, 'z': '10th'},
- {'x': 68.5, 'y': 7.49056809, 'z': '25th'},
- {'x': 68.5, 'y': 7.92790936, 'z': '50th'},
- {'x': 68.5, 'y': 8.432256562, 'z': '75th'},
- {'x': 68.5, 'y': 8.958117069, 'z': '90th'},
- {'x': 68.5, 'y': 9.312833279, 'z': '95th'},
- {'x': 68.5, 'y': 9.562029761, 'z': '97th'},
- {'x': 69.5, 'y': 7.045821054, 'z': '3rd'},
- {'x': 69.5, 'y': 7.166475096, 'z': '5th'},
- {'x': 69.5, 'y': 7.362170518, 'z': '10th'},
- {'x': 69.5, 'y': 7.719212002, 'z': '25th'},
- {'x': 69.5, 'y': 8.167783677, 'z': '50th'},
- {'x': 69.5, 'y': 8.683408324, 'z': '75th'},
- {'x': 69.5, 'y': 9.219002186, 'z': '90th'},
- {'x': 69.5, 'y': 9.579058661, 'z': '95th'},
- {'x': 69.5, 'y': 9.831395513, 'z': '97th'},
- {'x': 70.5, 'y': 7.254047943, 'z': '3rd'},
- {'x': 70.5, 'y': 7.378297165, 'z': '5th'},
- {'x': 70.5, 'y': 7.579624634, 'z': '10th'},
- {'x': 70.5, 'y': 7.946282454, 'z': '25th'},
- {'x': 70.5, 'y': 8.405666621, 'z': '50th'},
- {'x': 70.5, 'y': 8.931870645, 'z': '75th'},
- {'x': 70.5, 'y': 9.47623884, 'z': '90th'},
- {'x': 70.5, 'y': 9.840866488, 'z': '95th'},
- {'x': 70.5, 'y': 10.09574977, 'z': '97th'},
- {'x': 71.5, 'y': 7.461015613, 'z': '3rd'},
- {'x': 71.5, 'y': 7.588832522, 'z': '5th'},
- {'x': 71.5, 'y': 7.795721098, 'z': '10th'},
- {'x': 71.5, 'y': 8.171783008, 'z': '25th'},
- {'x': 71.5, 'y': 8.641566305, 'z': '50th'},
- {'x': 71.5, 'y': 9.177685743, 'z': '75th'},
- {'x': 71.5, 'y': 9.729947188, 'z': '90th'},
- {'x': 71.5, 'y': 10.09845888, 'z': '95th'},
- {'x': 71.5, 'y': 10.35536822, 'z': '97th'},
- {'x': 72.5, 'y': 7.666760352, 'z': '3rd'},
- {'x': 72.5, 'y': 7.798112411, 'z': '5th'},
- {'x': 72.5, 'y': 8.010485082, 'z': '10th'},
- {'x': 72.5, 'y': 8.395735838, 'z': '25th'},
- {'x': 72.5, 'y': 8.875519723, 'z': '50th'},
- {'x': 72.5, 'y': 9.420939935, 'z': '75th'},
- {'x': 72.5, 'y': 9.980309503, 'z': '90th'},
- {'x': 72.5, 'y': 10.3521122, 'z': '95th'},
- {'x': 72.5, 'y': 10.61060874, 'z': '97th'},
- {'x': 73.5, 'y': 7.871329398, 'z': '3rd'},
- {'x': 73.5, 'y': 8.006179356, 'z': '5th'},
- {'x': 73.5, 'y': 8.223954294, 'z': '10th'},
- {'x': 73.5, 'y': 8.61818018, 'z': '25th'},
- {'x': 73.5, 'y': 9.107590221, 'z': '50th'},
- {'x': 73.5, 'y': 9.661760324, 'z': '75th'},
- {'x': 73.5, 'y': 10.22756595, 'z': '90th'},
- {'x': 73.5, 'y': 10.60217203, 'z': '95th'},
- {'x': 73.5, 'y': 10.86190554, 'z': '97th'},
- {'x': 74.5, 'y': 8.07478203, 'z': '3rd'},
- {'x': 74.5, 'y': 8.213087629, 'z': '5th'},
- {'x': 74.5, 'y': 8.436178609, 'z': '10th'},
- {'x': 74.5, 'y': 8.839170822, 'z': '25th'},
- {'x': 74.5, 'y': 9.337865054, 'z': '50th'},
- {'x': 74.5, 'y': 9.900311537, 'z': '75th'},
- {'x': 74.5, 'y': 10.47201035, 'z': '90th'},
- {'x': 74.5, 'y': 10.84904795, 'z': '95th'},
- {'x': 74.5, 'y': 11.10976332, 'z': '97th'},
- {'x': 75.5, 'y': 8.277190538, 'z': '3rd'},
- {'x': 75.5, 'y': 8.418903651, 'z': '5th'},
- {'x': 75.5, 'y': 8.647219687, 'z': '10th'},
- {'x': 75.5, 'y': 9.05877667, 'z': '25th'},
- {'x': 75.5, 'y': 9.566453061, 'z': '50th'},
- {'x': 75.5, 'y': 10.13679255, 'z': '75th'},
- {'x': 75.5, 'y': 10.7139859, 'z': '90th'},
- {'x': 75.5, 'y': 11.09320847, 'z': '95th'},
- {'x': 75.5, 'y': 11.35475136, 'z': '97th'},
- {'x': 76.5, 'y': 8.478641037, 'z': '3rd'},
- {'x': 76.5, 'y': 8.623706299, 'z': '5th'},
- {'x': 76.5, 'y': 8.857150596, 'z': '10th'},
- {'x': 76.5, 'y': 9.277079452, 'z': '25th'},
- {'x': 76.5, 'y': 9.793482492, 'z': '50th'},
- {'x': 76.5, 'y': 10.37143354, 'z': '75th'},
- {'x': 76.5, 'y': 10.95388092, 'z': '90th'},
- {'x': 76.5, 'y': 11.33517576, 'z': '95th'},
- {'x': 76.5, 'y': 11.59749766, 'z': '97th'},
- {'x': 77.5, 'y': 8.679234065, 'z': '3rd'},
- {'x': 77.5, 'y': 8.82758712, 'z': '5th'},
- {'x': 77.5, 'y': 9.066055489, 'z': '10th'},
- {'x': 77.5, 'y': 9.494172583, 'z': '25th'},
- {'x': 77.5, 'y': 10.01909902, 'z': '50th'},
- {'x': 77.5, 'y': 10.60449286, 'z': '75th'},
- {'x': 77.5, 'y': 11.19212443, 'z': '90th'},
- {'x': 77.5, 'y': 11.57552036, 'z': '95th'},
- {'x': 77.5, 'y': 11.83868308, 'z': '97th'},
- {'x': 78.5, 'y': 8.879084281, 'z': '3rd'},
- {'x': 78.5, 'y': 9.03065003, 'z': '5th'},
- {'x': 78.5, 'y': 9.274029292, 'z': '10th'},
- {'x': 78.5, 'y': 9.710160711, 'z': '25th'},
- {'x': 78.5, 'y': 10.24346467, 'z': '50th'},
- {'x': 78.5, 'y': 10.83625465, 'z': '75th'},
- {'x': 78.5, 'y': 11.42918192, 'z': '90th'},
- {'x': 78.5, 'y': 11.81485555, 'z': '95th'},
- {'x': 78.5, 'y': 12.07903468, 'z': '97th'},
- {'x': 79.5, 'y': 9.078322619, 'z': '3rd'},
- {'x': 79.5, 'y': 9.233012616, 'z': '5th'},
- {'x': 79.5, 'y': 9.481177715, 'z': '10th'},
- {'x': 79.5, 'y': 9.925157686, 'z': '25th'},
- {'x': 79.5, 'y': 10.46675386, 'z': '50th'},
- {'x': 79.5, 'y': 11.06702353, 'z': '75th'},
- {'x': 79.5, 'y': 11.66554993, 'z': '90th'},
- {'x': 79.5, 'y': 12.05383282, 'z': '95th'},
- {'x': 79.5, 'y': 12.3193224, 'z': '97th'},
- {'x': 80.5, 'y': 9.277093118, 'z': '3rd'},
- {'x': 80.5, 'y': 9.434804244, 'z': '5th'},
- {'x': 80.5, 'y': 9.68761705, 'z': '10th'},
- {'x': 80.5, 'y': 10.13928821, 'z': '25th'},
- {'x': 80.5, 'y': 10.6891553, 'z': '50th'},
- {'x': 80.5, 'y': 11.29712459, 'z': '75th'},
- {'x': 80.5, 'y': 11.90175234, 'z': '90th'},
- {'x': 80.5, 'y': 12.29313502, 'z': '95th'},
- {'x': 80.5, 'y': 12.56034996, 'z': '97th'},
- {'x': 81.5, 'y': 9.475553729, 'z': '3rd'},
- {'x': 81.5, 'y': 9.636166759, 'z': '5th'},
- {'x': 81.5, 'y': 9.893474476, 'z': '10th'},
- {'x': 81.5, 'y': 10.35268693, 'z': '25th'},
- {'x': 81.5, 'y': 10.91086924, 'z': '50th'},
- {'x': 81.5, 'y': 11.52689868, 'z': '75th'},
- {'x': 81.5, 'y': 12.13833477, 'z': '90th'},
- {'x': 81.5, 'y': 12.53347134, 'z': '95th'},
- {'x': 81.5, 'y': 12.80295084, 'z': '97th'},
- {'x': 82.5, 'y': 9.673874713, 'z': '3rd'},
- {'x': 82.5, 'y': 9.837253816, 'z': '5th'},
- {'x': 82.5, 'y': 10.0988884, 'z': '10th'},
- {'x': 82.5, 'y': 10.56549933, 'z': '25th'},
- {'x': 82.5, 'y': 11.13210717, 'z': '50th'},
- {'x': 82.5, 'y': 11.75669976, 'z': '75th'},
- {'x': 82.5, 'y': 12.37585953, 'z': '90th'},
- {'x': 82.5, 'y': 12.77557129, 'z': '95th'},
- {'x': 82.5, 'y': 13.04798203, 'z': '97th'},
- {'x': 83.5, 'y': 9.872236954, 'z': '3rd'},
- {'x': 83.5, 'y': 10.03823028, 'z': '5th'},
- {'x': 83.5, 'y': 10.30400903, 'z': '10th'},
- {'x': 83.5, 'y': 10.77788274, 'z': '25th'},
- {'x': 83.5, 'y': 11.35309164, 'z': '50th'},
- {'x': 83.5, 'y': 11.98689198, 'z': '75th'},
- {'x': 83.5, 'y': 12.61490029, 'z': '90th'},
- {'x': 83.5, 'y': 13.02017859, 'z': '95th'},
- {'x': 83.5, 'y': 13.29631805, 'z': '97th'},
- {'x': 84.5, 'y': 10.07082987, 'z': '3rd'},
- {'x': 84.5, 'y': 10.2392715, 'z': '5th'},
- {'x': 84.5, 'y': 10.50899902, 'z': '10th'},
- {'x': 84.5, 'y': 10.9900078, 'z': '25th'},
- {'x': 84.5, 'y': 11.57405623, 'z': '50th'},
- {'x': 84.5, 'y': 12.21784683, 'z': '75th'},
- {'x': 84.5, 'y': 12.85603662, 'z': '90th'},
- {'x': 84.5, 'y': 13.26804494, 'z': '95th'},
- {'x': 84.5, 'y': 13.54884494, 'z': '97th'},
- {'x': 85.5, 'y': 10.26984825, 'z': '3rd'},
- {'x': 85.5, 'y': 10.44056188, 'z': '5th'},
- {'x': 85.5, 'y': 10.71403421, 'z': '10th'},
- {'x': 85.5, 'y': 11.20206069, 'z': '25th'},
- {'x': 85.5, 'y': 11.79524697, 'z': '50th'},
- {'x': 85.5, 'y': 12.44994139, 'z': '75th'},
- {'x': 85.5, 'y': 13.0998487, 'z': '90th'},
- {'x': 85.5, 'y': 13.51992325, 'z': '95th'},
- {'x': 85.5, 'y': 13.80645301, 'z': '97th'},
- {'x': 86.5, 'y': 10.46949211, 'z': '3rd'},
- {'x': 86.5, 'y': 10.64229536, 'z': '5th'},
- {'x': 86.5, 'y': 10.9193044, 'z': '10th'},
- {'x': 86.5, 'y': 11.41424337, 'z': '25th'},
- {'x': 86.5, 'y': 12.0169203, 'z': '50th'},
- {'x': 86.5, 'y': 12.68355339, 'z': '75th'},
- {'x': 86.5, 'y': 13.346911, 'z': '90th'},
- {'x': 86.5, 'y': 13.77656207, 'z': '95th'},
- {'x': 86.5, 'y': 14.07003317, 'z': '97th'},
- {'x': 87.5, 'y': 10.66996042, 'z': '3rd'},
- {'x': 87.5, 'y': 10.84467191, 'z': '5th'},
- {'x': 87.5, 'y': 11.12501362, 'z': '10th'},
- {'x': 87.5, 'y': 11.62677789, 'z': '25th'},
- {'x': 87.5, 'y': 12.23934838, 'z': '50th'},
- {'x': 87.5, 'y': 12.91906338, 'z': '75th'},
- {'x': 87.5, 'y': 13.59778826, 'z': '90th'},
- {'x': 87.5, 'y': 14.03869722, 'z': '95th'},
- {'x': 87.5, 'y': 14.3404656, 'z': '97th'},
- {'x': 88.5, 'y': 10.87145032, 'z': '3rd'},
- {'x': 88.5, 'y': 11.04789724, 'z': '5th'},
- {'x': 88.5, 'y': 11.33138025, 'z': '10th'},
- {'x': 88.5, 'y': 11.83990685, 'z': '25th'},
- {'x': 88.5, 'y': 12.46281861, 'z': '50th'},
- {'x': 88.5, 'y': 13.15685175, 'z': '75th'},
- {'x': 88.5, 'y': 13.85303006, 'z': '90th'},
- {'x': 88.5, 'y': 14.3070456, 'z': '95th'},
- {'x': 88.5, 'y': 14.61861423, 'z': '97th'},
- {'x': 89.5, 'y': 11.07415394, 'z': '3rd'},
- {'x': 89.5, 'y': 11.25218061, 'z': '5th'},
- {'x': 89.5, 'y': 11.53863663, 'z': '10th'},
- {'x': 89.5, 'y': 12.05389519, 'z': '25th'},
- {'x': 89.5, 'y': 12.68763627, 'z': '50th'},
- {'x': 89.5, 'y': 13.39729953, 'z': '75th'},
- {'x': 89.5, 'y': 14.1131669, 'z': '90th'},
- {'x': 89.5, 'y': 14.5822978, 'z': '95th'},
- {'x': 89.5, 'y': 14.90531723, 'z': '97th'},
- {'x': 90.5, 'y': 11.27825609, 'z': '3rd'},
- {'x': 90.5, 'y': 11.45773296, 'z': '5th'},
- {'x': 90.5, 'y': 11.74702786, 'z': '10th'},
- {'x': 90.5, 'y': 12.26903094, 'z': '25th'},
- {'x': 90.5, 'y': 12.9141268, 'z': '50th'},
- {'x': 90.5, 'y': 13.64078954, 'z': '75th'},
- {'x': 90.5, 'y': 14.37870706, 'z': '90th'},
- {'x': 90.5, 'y': 14.86511095, 'z': '95th'},
- {'x': 90.5, 'y': 15.20137719, 'z': '97th'},
- {'x': 91.5, 'y': 11.48393116, 'z': '3rd'},
- {'x': 91.5, 'y': 11.66476403, 'z': '5th'},
- {'x': 91.5, 'y': 11.95681, 'z': '10th'},
- {'x': 91.5, 'y': 12.48562589, 'z': '25th'},
- {'x': 91.5, 'y': 13.1426393, 'z': '50th'},
- {'x': 91.5, 'y': 13.88771008, 'z': '75th'},
- {'x': 91.5, 'y': 14.65013514, 'z': '90th'},
- {'x': 91.5, 'y': 15.1561012, 'z': '95th'},
- {'x': 91.5, 'y': 15.50754879, 'z': '97th'},
- {'x': 92.5, 'y': 11.69134669, 'z': '3rd'},
- {'x': 92.5, 'y': 11.87348344, 'z': '5th'},
- {'x': 92.5, 'y': 12.16824818, 'z': '10th'},
- {'x': 92.5, 'y': 12.70401141, 'z': '25th'},
- {'x': 92.5, 'y': 13.37354263, 'z': '50th'},
- {'x': 92.5, 'y': 14.13845236, 'z': '75th'},
- {'x': 92.5, 'y': 14.92790917, 'z': '90th'},
- {'x': 92.5, 'y': 15.45583919, 'z': '95th'},
- {'x': 92.5, 'y': 15.82453284, 'z': '97th'},
- {'x': 93.5, 'y': 11.9006578, 'z': '3rd'},
- {'x': 93.5, 'y': 12.08409573, 'z': '5th'},
- {'x': 93.5, 'y': 12.38161332, 'z': '10th'},
- {'x': 93.5, 'y': 12.92453941, 'z': '25th'},
- {'x': 93.5, 'y': 13.60723197, 'z': '50th'},
- {'x': 93.5, 'y': 14.39341959, 'z': '75th'},
- {'x': 93.5, 'y': 15.21246325, 'z': '90th'},
- {'x': 93.5, 'y': 15.76484189, 'z': '95th'},
- {'x': 93.5, 'y': 16.1529576, 'z': '97th'},
- {'x': 94.5, 'y': 12.11201227, 'z': '3rd'},
- {'x': 94.5, 'y': 12.29680209, 'z': '5th'},
- {'x': 94.5, 'y': 12.5971797, 'z': '10th'},
- {'x': 94.5, 'y': 13.14757603, 'z': '25th'},
- {'x': 94.5, 'y': 13.84412275, 'z': '50th'},
- {'x': 94.5, 'y': 14.65302443, 'z': '75th'},
- {'x': 94.5, 'y': 15.5042068, 'z': '90th'},
- {'x': 94.5, 'y': 16.08356951, 'z': '95th'},
- {'x': 94.5, 'y': 16.49337198, 'z': '97th'},
- {'x': 95.5, 'y': 12.32555163, 'z': '3rd'},
- {'x': 95.5, 'y': 12.51179974, 'z': '5th'},
- {'x': 95.5, 'y': 12.81522219, 'z': '10th'},
- {'x': 95.5, 'y': 13.37349756, 'z': '25th'},
- {'x': 95.5, 'y': 14.08464853, 'z': '50th'},
- {'x': 95.5, 'y': 14.91769089, 'z': '75th'},
- {'x': 95.5, 'y': 15.80352641, 'z': '90th'},
- {'x': 95.5, 'y': 16.41242128, 'z': '95th'},
- {'x': 95.5, 'y': 16.84623319, 'z': '97th'},
- {'x': 96.5, 'y': 12.54141939, 'z': '3rd'},
- {'x': 96.5, 'y': 12.72928607, 'z': '5th'},
- {'x': 96.5, 'y': 13.03601505, 'z': '10th'},
- {'x': 96.5, 'y': 13.60268237, 'z': '25th'},
- {'x': 96.5, 'y': 14.32925018, 'z': '50th'},
- {'x': 96.5, 'y': 15.1878468, 'z': '75th'},
- {'x': 96.5, 'y': 16.11078394, 'z': '90th'},
- {'x': 96.5, 'y': 16.75173457, 'z': '95th'},
- {'x': 96.5, 'y': 17.21190355, 'z': '97th'},
- {'x': 97.5, 'y': 12.75976132, 'z': '3rd'},
- {'x': 97.5, 'y': 12.9494582, 'z': '5th'},
- {'x': 97.5, 'y': 13.25983009, 'z': '10th'},
- {'x': 97.5, 'y': 13.83550775, 'z': '25th'},
- {'x': 97.5, 'y': 14.57837334, 'z': '50th'},
- {'x': 97.5, 'y': 15.4639243, 'z': '75th'},
- {'x': 97.5, 'y': 16.42631821, 'z': '90th'},
- {'x': 97.5, 'y': 17.10178143, 'z': '95th'},
- {'x': 97.5, 'y': 17.59063809, 'z': '97th'},
- {'x': 98.5, 'y': 12.98073439, 'z': '3rd'},
- {'x': 98.5, 'y': 13.17251854, 'z': '5th'},
- {'x': 98.5, 'y': 13.48693728, 'z': '10th'},
- {'x': 98.5, 'y': 14.07234276, 'z': '25th'},
- {'x': 98.5, 'y': 14.8324557, 'z': '50th'},
- {'x': 98.5, 'y': 15.74634796, 'z': '75th'},
- {'x': 98.5, 'y': 16.7504403, 'z': '90th'},
- {'x': 98.5, 'y': 17.46276845, 'z': '95th'},
- {'x': 98.5, 'y': 17.9825849, 'z': '97th'},
- {'x': 99.5, 'y': 13.20451042, 'z': '3rd'},
- {'x': 99.5, 'y': 13.39867734, 'z': '5th'},
- {'x': 99.5, 'y': 13.71760521, 'z': '10th'},
- {'x': 99.5, 'y': 14.31354493, 'z': '25th'},
- {'x': 99.5, 'y': 15.09192012, 'z': '50th'},
- {'x': 99.5, 'y': 16.03552754, 'z': '75th'},
- {'x': 99.5, 'y': 17.08342993, 'z': '90th'},
- {'x': 99.5, 'y': 17.83483458, 'z': '95th'},
- {'x': 99.5, 'y': 18.38778042, 'z': '97th'},
- {'x': 100.5, 'y': 13.43128538, 'z': '3rd'},
- {'x': 100.5, 'y': 13.62815947, 'z': '5th'},
- {'x': 100.5, 'y': 13.95210374, 'z': '10th'},
- {'x': 100.5, 'y': 14.55945515, 'z': '25th'},
- {'x': 100.5, 'y': 15.35716167, 'z': '50th'},
- {'x': 100.5, 'y': 16.33184172, 'z': '75th'},
- {'x': 100.5, 'y': 17.42552542, 'z': '90th'},
- {'x': 100.5, 'y': 18.21805007, 'z': '95th'},
- {'x': 100.5, 'y': 18.80615497, 'z': '97th'},
- {'x': 101.5, 'y': 13.66127661, 'z': '3rd'},
- {'x': 101.5, 'y': 13.86120318, 'z': '5th'},
- {'x': 101.5, 'y': 14.19070443, 'z': '10th'},
- {'x': 101.5, 'y': 14.81039951, 'z': '25th'},
- {'x': 101.5, 'y': 15.62854849, 'z': '50th'},
- {'x': 101.5, 'y': 16.63563645, 'z': '75th'},
- {'x': 101.5, 'y': 17.77692011, 'z': '90th'},
- {'x': 101.5, 'y': 18.61241094, 'z': '95th'},
- {'x': 101.5, 'y': 19.23752318, 'z': '97th'},
- {'x': 102.5, 'y': 13.89473275, 'z': '3rd'},
- {'x': 102.5, 'y': 14.09806774, 'z': '5th'},
- {'x': 102.5, 'y': 14.43368432, 'z': '10th'},
- {'x': 102.5, 'y': 15.06668553, 'z': '25th'},
- {'x': 102.5, 'y': 15.90640903, 'z': '50th'},
- {'x': 102.5, 'y': 16.94720609, 'z': '75th'},
- {'x': 102.5, 'y': 18.13774777, 'z': '90th'},
- {'x': 102.5, 'y': 19.01783635, 'z': '95th'},
- {'x': 102.5, 'y': 19.68159413, 'z': '97th'},
- {'x': 103.5, 'y': 14.13192569, 'z': '3rd'},
- {'x': 103.5, 'y': 14.33902847, 'z': '5th'},
- {'x': 103.5, 'y': 14.68132531, 'z': '10th'},
- {'x': 103.5, 'y': 15.32860703, 'z': '25th'},
- {'x': 103.5, 'y': 16.19103966, 'z': '50th'},
- {'x': 103.5, 'y': 17.2667985, 'z': '75th'},
- {'x': 103.5, 'y': 18.50808075, 'z': '90th'},
- {'x': 103.5, 'y': 19.43416015, 'z': '95th'},
- {'x': 103.5, 'y': 20.13795636, 'z': '97th'}
-]
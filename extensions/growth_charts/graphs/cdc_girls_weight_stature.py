@@ -1,462 +0,0 @@
-cdc_girls_weight_stature = [
- {'x': 77.0, 'y': 8.739261615, 'z': '3rd'},
- {'x': 77.0, 'y': 8.888586869, 'z': '5th'},
- {'x': 77.0, 'y': 9.128540802, 'z': '10th'},
- {'x': 77.0, 'y': 9.55907995, 'z': '25th'},
- {'x': 77.0, 'y': 10.08653219, 'z': '50th'},
- {'x': 77.0, 'y': 10.674144, 'z': '75th'},
- {'x': 77.0, 'y': 11.01794159, 'z': '85th'},
- {'x': 77.0, 'y': 11.26334412, 'z': '90th'},
- {'x': 77.0, 'y': 11.64739801, 'z': '95th'},
- {'x': 77.0, 'y': 11.91084201, 'z': '97th'},
- {'x': 77.5, 'y': 8.839167516, 'z': '3rd'},
- {'x': 77.5, 'y': 8.990097375, 'z': '5th'},
- {'x': 77.5, 'y': 9.232504092, 'z': '10th'},
- {'x': 77.5, 'y': 9.667046213, 'z': '25th'},
- {'x': 77.5, 'y': 10.19868351, 'z': '50th'},
- {'x': 77.5, 'y': 10.78999185, 'z': '75th'},
- {'x': 77.5, 'y': 11.13546634, 'z': '85th'},
- {'x': 77.5, 'y': 11.38184191, 'z': '90th'},
- {'x': 77.5, 'y': 11.76703846, 'z': '95th'},
- {'x': 77.5, 'y': 12.03099456, 'z': '97th'},
- {'x': 78.5, 'y': 9.038517201, 'z': '3rd'},
- {'x': 78.5, 'y': 9.192590101, 'z': '5th'},
- {'x': 78.5, 'y': 9.439808634, 'z': '10th'},
- {'x': 78.5, 'y': 9.882231734, 'z': '25th'},
- {'x': 78.5, 'y': 10.42217324, 'z': '50th'},
- {'x': 78.5, 'y': 11.02093382, 'z': '75th'},
- {'x': 78.5, 'y': 11.36987072, 'z': '85th'},
- {'x': 78.5, 'y': 11.61830668, 'z': '90th'},
- {'x': 78.5, 'y': 12.00603364, 'z': '95th'},
- {'x': 78.5, 'y': 12.27123186, 'z': '97th'},
- {'x': 79.5, 'y': 9.23736905, 'z': '3rd'},
- {'x': 79.5, 'y': 9.39448496, 'z': '5th'},
- {'x': 79.5, 'y': 9.646379965, 'z': '10th'},
- {'x': 79.5, 'y': 10.09652511, 'z': '25th'},
- {'x': 79.5, 'y': 10.64473659, 'z': '50th'},
- {'x': 79.5, 'y': 11.25114165, 'z': '75th'},
- {'x': 79.5, 'y': 11.60377608, 'z': '85th'},
- {'x': 79.5, 'y': 11.85449919, 'z': '90th'},
- {'x': 79.5, 'y': 12.24521487, 'z': '95th'},
- {'x': 79.5, 'y': 12.51204563, 'z': '97th'},
- {'x': 80.5, 'y': 9.43587839, 'z': '3rd'},
- {'x': 80.5, 'y': 9.595921376, 'z': '5th'},
- {'x': 80.5, 'y': 9.852343066, 'z': '10th'},
- {'x': 80.5, 'y': 10.31005891, 'z': '25th'},
- {'x': 80.5, 'y': 10.86657146, 'z': '50th'},
- {'x': 80.5, 'y': 11.4809532, 'z': '75th'},
- {'x': 80.5, 'y': 11.837632, 'z': '85th'},
- {'x': 80.5, 'y': 12.09096109, 'z': '90th'},
- {'x': 80.5, 'y': 12.48528658, 'z': '95th'},
- {'x': 80.5, 'y': 12.75426396, 'z': '97th'},
- {'x': 81.5, 'y': 9.634213141, 'z': '3rd'},
- {'x': 81.5, 'y': 9.797050683, 'z': '5th'},
- {'x': 81.5, 'y': 10.05783406, 'z': '10th'},
- {'x': 81.5, 'y': 10.52297639, 'z': '25th'},
- {'x': 81.5, 'y': 11.08788714, 'z': '50th'},
- {'x': 81.5, 'y': 11.71072003, 'z': '75th'},
- {'x': 81.5, 'y': 12.07190393, 'z': '85th'},
- {'x': 81.5, 'y': 12.32825177, 'z': '90th'},
- {'x': 81.5, 'y': 12.72697467, 'z': '95th'},
- {'x': 81.5, 'y': 12.99873959, 'z': '97th'},
- {'x': 82.5, 'y': 9.832552217, 'z': '3rd'},
- {'x': 82.5, 'y': 9.998035565, 'z': '5th'},
- {'x': 82.5, 'y': 10.26300074, 'z': '10th'},
- {'x': 82.5, 'y': 10.73543239, 'z': '25th'},
- {'x': 82.5, 'y': 11.30890397, 'z': '50th'},
- {'x': 82.5, 'y': 11.94080449, 'z': '75th'},
- {'x': 82.5, 'y': 12.30706872, 'z': '85th'},
- {'x': 82.5, 'y': 12.56694308, 'z': '90th'},
- {'x': 82.5, 'y': 12.97102053, 'z': '95th'},
- {'x': 82.5, 'y': 13.24634405, 'z': '97th'},
- {'x': 83.5, 'y': 10.03108351, 'z': '3rd'},
- {'x': 83.5, 'y': 10.19904933, 'z': '5th'},
- {'x': 83.5, 'y': 10.46800322, 'z': '10th'},
- {'x': 83.5, 'y': 10.94759478, 'z': '25th'},
- {'x': 83.5, 'y': 11.52985331, 'z': '50th'},
- {'x': 83.5, 'y': 12.17157684, 'z': '75th'},
- {'x': 83.5, 'y': 12.54361009, 'z': '85th'},
- {'x': 83.5, 'y': 12.80761383, 'z': '90th'},
- {'x': 83.5, 'y': 13.21817476, 'z': '95th'},
- {'x': 83.5, 'y': 13.49796154, 'z': '97th'},
- {'x': 84.5, 'y': 10.23000087, 'z': '3rd'},
- {'x': 84.5, 'y': 10.40027462, 'z': '5th'},
- {'x': 84.5, 'y': 10.67301464, 'z': '10th'},
- {'x': 84.5, 'y': 11.15964652, 'z': '25th'},
- {'x': 84.5, 'y': 11.75097872, 'z': '50th'},
- {'x': 84.5, 'y': 12.40341329, 'z': '75th'},
- {'x': 84.5, 'y': 12.78201467, 'z': '85th'},
- {'x': 84.5, 'y': 13.05084457, 'z': '90th'},
- {'x': 84.5, 'y': 13.46919053, 'z': '95th'},
- {'x': 84.5, 'y': 13.75448195, 'z': '97th'},
- {'x': 85.5, 'y': 10.42950375, 'z': '3rd'},
- {'x': 85.5, 'y': 10.60190372, 'z': '5th'},
- {'x': 85.5, 'y': 10.87822198, 'z': '10th'},
- {'x': 85.5, 'y': 11.37178607, 'z': '25th'},
- {'x': 85.5, 'y': 11.97253416, 'z': '50th'},
- {'x': 85.5, 'y': 12.63669132, 'z': '75th'},
- {'x': 85.5, 'y': 13.02276601, 'z': '85th'},
- {'x': 85.5, 'y': 13.29721122, 'z': '90th'},
- {'x': 85.5, 'y': 13.72481792, 'z': '95th'},
- {'x': 85.5, 'y': 14.01679695, 'z': '97th'},
- {'x': 86.5, 'y': 10.62979128, 'z': '3rd'},
- {'x': 86.5, 'y': 10.80413535, 'z': '5th'},
- {'x': 86.5, 'y': 11.08382637, 'z': '10th'},
- {'x': 86.5, 'y': 11.5842315, 'z': '25th'},
- {'x': 86.5, 'y': 12.19478883, 'z': '50th'},
- {'x': 86.5, 'y': 12.87179128, 'z': '75th'},
- {'x': 86.5, 'y': 13.26634311, 'z': '85th'},
- {'x': 86.5, 'y': 13.54728098, 'z': '90th'},
- {'x': 86.5, 'y': 13.98579574, 'z': '95th'},
- {'x': 86.5, 'y': 14.28578915, 'z': '97th'},
- {'x': 87.5, 'y': 10.83106129, 'z': '3rd'},
- {'x': 87.5, 'y': 11.00717426, 'z': '5th'},
- {'x': 87.5, 'y': 11.29004337, 'z': '10th'},
- {'x': 87.5, 'y': 11.79722112, 'z': '25th'},
- {'x': 87.5, 'y': 12.41802682, 'z': '50th'},
- {'x': 87.5, 'y': 13.10909353, 'z': '75th'},
- {'x': 87.5, 'y': 13.51321579, 'z': '85th'},
- {'x': 87.5, 'y': 13.80160677, 'z': '90th'},
- {'x': 87.5, 'y': 14.25284528, 'z': '95th'},
- {'x': 87.5, 'y': 14.56232653, 'z': '97th'},
- {'x': 88.5, 'y': 11.03350713, 'z': '3rd'},
- {'x': 88.5, 'y': 11.21122918, 'z': '5th'},
- {'x': 88.5, 'y': 11.49710258, 'z': '10th'},
- {'x': 88.5, 'y': 12.01101528, 'z': '25th'},
- {'x': 88.5, 'y': 12.64254963, 'z': '50th'},
- {'x': 88.5, 'y': 13.34897889, 'z': '75th'},
- {'x': 88.5, 'y': 13.76384274, 'z': '85th'},
- {'x': 88.5, 'y': 14.06072319, 'z': '90th'},
- {'x': 88.5, 'y': 14.52666298, 'z': '95th'},
- {'x': 88.5, 'y': 14.84725316, 'z': '97th'},
- {'x': 89.5, 'y': 11.23731521, 'z': '3rd'},
- {'x': 89.5, 'y': 11.41651085, 'z': '5th'},
- {'x': 89.5, 'y': 11.70524667, 'z': '10th'},
- {'x': 89.5, 'y': 12.22589739, 'z': '25th'},
- {'x': 89.5, 'y': 12.86867851, 'z': '50th'},
- {'x': 89.5, 'y': 13.59182967, 'z': '75th'},
- {'x': 89.5, 'y': 14.01867037, 'z': '85th'},
- {'x': 89.5, 'y': 14.32514317, 'z': '90th'},
- {'x': 89.5, 'y': 14.80791321, 'z': '95th'},
- {'x': 89.5, 'y': 15.14137958, 'z': '97th'},
- {'x': 90.5, 'y': 11.44266196, 'z': '3rd'},
- {'x': 90.5, 'y': 11.62322932, 'z': '5th'},
- {'x': 90.5, 'y': 11.91472966, 'z': '10th'},
- {'x': 90.5, 'y': 12.44217465, 'z': '25th'},
- {'x': 90.5, 'y': 13.09675786, 'z': '50th'},
- {'x': 90.5, 'y': 13.83803305, 'z': '75th'},
- {'x': 90.5, 'y': 14.27813372, 'z': '85th'},
- {'x': 90.5, 'y': 14.59535621, 'z': '90th'},
- {'x': 90.5, 'y': 15.0972208, 'z': '95th'},
- {'x': 90.5, 'y': 15.44547079, 'z': '97th'},
- {'x': 91.5, 'y': 11.64971679, 'z': '3rd'},
- {'x': 91.5, 'y': 11.83159463, 'z': '5th'},
- {'x': 91.5, 'y': 12.12581512, 'z': '10th'},
- {'x': 91.5, 'y': 12.66017439, 'z': '25th'},
- {'x': 91.5, 'y': 13.32715202, 'z': '50th'},
- {'x': 91.5, 'y': 14.08797892, 'z': '75th'},
- {'x': 91.5, 'y': 14.54265433, 'z': '85th'},
- {'x': 91.5, 'y': 14.87182549, 'z': '90th'},
- {'x': 91.5, 'y': 15.39516617, 'z': '95th'},
- {'x': 91.5, 'y': 15.76023982, 'z': '97th'},
- {'x': 92.5, 'y': 11.85863674, 'z': '3rd'},
- {'x': 92.5, 'y': 12.04181213, 'z': '5th'},
- {'x': 92.5, 'y': 12.33877299, 'z': '10th'},
- {'x': 92.5, 'y': 12.88024501, 'z': '25th'},
- {'x': 92.5, 'y': 13.56025156, 'z': '50th'},
- {'x': 92.5, 'y': 14.34206849, 'z': '75th'},
- {'x': 92.5, 'y': 14.81264629, 'z': '85th'},
- {'x': 92.5, 'y': 15.15499004, 'z': '90th'},
- {'x': 92.5, 'y': 15.70227723, 'z': '95th'},
- {'x': 92.5, 'y': 16.0863298, 'z': '97th'},
- {'x': 93.5, 'y': 12.06957102, 'z': '3rd'},
- {'x': 93.5, 'y': 12.25408376, 'z': '5th'},
- {'x': 93.5, 'y': 12.55387711, 'z': '10th'},
- {'x': 93.5, 'y': 13.10275007, 'z': '25th'},
- {'x': 93.5, 'y': 13.79646793, 'z': '50th'},
- {'x': 93.5, 'y': 14.6007123, 'z': '75th'},
- {'x': 93.5, 'y': 15.08851573, 'z': '85th'},
- {'x': 93.5, 'y': 15.44526407, 'z': '90th'},
- {'x': 93.5, 'y': 16.01902591, 'z': '95th'},
- {'x': 93.5, 'y': 16.42430655, 'z': '97th'},
- {'x': 94.5, 'y': 12.28266198, 'z': '3rd'},
- {'x': 94.5, 'y': 12.46860734, 'z': '5th'},
- {'x': 94.5, 'y': 12.77140239, 'z': '10th'},
- {'x': 94.5, 'y': 13.32806438, 'z': '25th'},
- {'x': 94.5, 'y': 14.03623165, 'z': '50th'},
- {'x': 94.5, 'y': 14.86433237, 'z': '75th'},
- {'x': 94.5, 'y': 15.37066369, 'z': '85th'},
- {'x': 94.5, 'y': 15.74303877, 'z': '90th'},
- {'x': 94.5, 'y': 16.34582383, 'z': '95th'},
- {'x': 94.5, 'y': 16.77464616, 'z': '97th'},
- {'x': 95.5, 'y': 12.49805271, 'z': '3rd'},
- {'x': 95.5, 'y': 12.68558031, 'z': '5th'},
- {'x': 95.5, 'y': 12.99162337, 'z': '10th'},
- {'x': 95.5, 'y': 13.55656614, 'z': '25th'},
- {'x': 95.5, 'y': 14.27998232, 'z': '50th'},
- {'x': 95.5, 'y': 15.13335566, 'z': '75th'},
- {'x': 95.5, 'y': 15.65948286, 'z': '85th'},
- {'x': 95.5, 'y': 16.04868075, 'z': '90th'},
- {'x': 95.5, 'y': 16.68302101, 'z': '95th'},
- {'x': 95.5, 'y': 17.13773099, 'z': '97th'},
- {'x': 96.5, 'y': 12.71588767, 'z': '3rd'},
- {'x': 96.5, 'y': 12.9051993, 'z': '5th'},
- {'x': 96.5, 'y': 13.21481233, 'z': '10th'},
- {'x': 96.5, 'y': 13.78863356, 'z': '25th'},
- {'x': 96.5, 'y': 14.5281658, 'z': '50th'},
- {'x': 96.5, 'y': 15.40821452, 'z': '75th'},
- {'x': 96.5, 'y': 15.95535951, 'z': '85th'},
- {'x': 96.5, 'y': 16.36253385, 'z': '90th'},
- {'x': 96.5, 'y': 17.0309025, 'z': '95th'},
- {'x': 96.5, 'y': 17.51383737, 'z': '97th'},
- {'x': 97.5, 'y': 12.93632124, 'z': '3rd'},
- {'x': 97.5, 'y': 13.12766544, 'z': '5th'},
- {'x': 97.5, 'y': 13.44123956, 'z': '10th'},
- {'x': 97.5, 'y': 14.02463766, 'z': '25th'},
- {'x': 97.5, 'y': 14.78122196, 'z': '50th'},
- {'x': 97.5, 'y': 15.68933564, 'z': '75th'},
- {'x': 97.5, 'y': 16.25866615, 'z': '85th'},
- {'x': 97.5, 'y': 16.68491497, 'z': '90th'},
- {'x': 97.5, 'y': 17.38968816, 'z': '95th'},
- {'x': 97.5, 'y': 17.90313512, 'z': '97th'},
- {'x': 98.5, 'y': 13.15952176, 'z': '3rd'},
- {'x': 98.5, 'y': 13.35318702, 'z': '5th'},
- {'x': 98.5, 'y': 13.67117381, 'z': '10th'},
- {'x': 98.5, 'y': 14.2649386, 'z': '25th'},
- {'x': 98.5, 'y': 15.03957746, 'z': '50th'},
- {'x': 98.5, 'y': 15.97713269, 'z': '75th'},
- {'x': 98.5, 'y': 16.56975626, 'z': '85th'},
- {'x': 98.5, 'y': 17.01611063, 'z': '90th'},
- {'x': 98.5, 'y': 17.75953058, 'z': '95th'},
- {'x': 98.5, 'y': 18.30568297, 'z': '97th'},
- {'x': 99.5, 'y': 13.38568043, 'z': '3rd'},
- {'x': 99.5, 'y': 13.58198599, 'z': '5th'},
- {'x': 99.5, 'y': 13.9048846, 'z': '10th'},
- {'x': 99.5, 'y': 14.50988056, 'z': '25th'},
- {'x': 99.5, 'y': 15.30363303, 'z': '50th'},
- {'x': 99.5, 'y': 16.2719909, 'z': '75th'},
- {'x': 99.5, 'y': 16.88895128, 'z': '85th'},
- {'x': 99.5, 'y': 17.35636782, 'z': '90th'},
- {'x': 99.5, 'y': 18.14051413, 'z': '95th'},
- {'x': 99.5, 'y': 18.72143304, 'z': '97th'},
- {'x': 100.5, 'y': 13.61500935, 'z': '3rd'},
- {'x': 100.5, 'y': 13.81429721, 'z': '5th'},
- {'x': 100.5, 'y': 14.14264285, 'z': '10th'},
- {'x': 100.5, 'y': 14.759793, 'z': '25th'},
- {'x': 100.5, 'y': 15.5737634, 'z': '50th'},
- {'x': 100.5, 'y': 16.57426445, 'z': '75th'},
- {'x': 100.5, 'y': 17.21653714, 'z': '85th'},
- {'x': 100.5, 'y': 17.70589007, 'z': '90th'},
- {'x': 100.5, 'y': 18.5326498, 'z': '95th'},
- {'x': 100.5, 'y': 19.15022213, 'z': '97th'},
- {'x': 101.5, 'y': 13.84775164, 'z': '3rd'},
- {'x': 101.5, 'y': 14.05037619, 'z': '5th'},
- {'x': 101.5, 'y': 14.38472456, 'z': '10th'},
- {'x': 101.5, 'y': 15.01498669, 'z': '25th'},
- {'x': 101.5, 'y': 15.8503043, 'z': '50th'},
- {'x': 101.5, 'y': 16.88425753, 'z': '75th'},
- {'x': 101.5, 'y': 17.55274622, 'z': '85th'},
- {'x': 101.5, 'y': 18.06482316, 'z': '90th'},
- {'x': 101.5, 'y': 18.93587281, 'z': '95th'},
- {'x': 101.5, 'y': 19.59178174, 'z': '97th'},
- {'x': 102.5, 'y': 14.08417388, 'z': '3rd'},
- {'x': 102.5, 'y': 14.29049454, 'z': '5th'},
- {'x': 102.5, 'y': 14.63141037, 'z': '10th'},
- {'x': 102.5, 'y': 15.27575841, 'z': '25th'},
- {'x': 102.5, 'y': 16.1335593, 'z': '50th'},
- {'x': 102.5, 'y': 17.20222861, 'z': '75th'},
- {'x': 102.5, 'y': 17.89775821, 'z': '85th'},
- {'x': 102.5, 'y': 18.4332529, 'z': '90th'},
- {'x': 102.5, 'y': 19.35003441, 'z': '95th'},
- {'x': 102.5, 'y': 20.04572382, 'z': '97th'},
- {'x': 103.5, 'y': 14.32457385, 'z': '3rd'},
- {'x': 103.5, 'y': 14.53494603, 'z': '5th'},
- {'x': 103.5, 'y': 14.88298893, 'z': '10th'},
- {'x': 103.5, 'y': 15.54238872, 'z': '25th'},
- {'x': 103.5, 'y': 16.42379037, 'z': '50th'},
- {'x': 103.5, 'y': 17.52837462, 'z': '75th'},
- {'x': 103.5, 'y': 18.2516835, 'z': '85th'},
- {'x': 103.5, 'y': 18.8111906, 'z': '90th'},
- {'x': 103.5, 'y': 19.77489735, 'z': '95th'},
- {'x': 103.5, 'y': 20.51154925, 'z': '97th'},
- {'x': 104.5, 'y': 14.56927503, 'z': '3rd'},
- {'x': 104.5, 'y': 14.78404331, 'z': '5th'},
- {'x': 104.5, 'y': 15.13975644, 'z': '10th'},
- {'x': 104.5, 'y': 15.8151455, 'z': '25th'},
- {'x': 104.5, 'y': 16.72122308, 'z': '50th'},
- {'x': 104.5, 'y': 17.86283343, 'z': '75th'},
- {'x': 104.5, 'y': 18.61456222, 'z': '85th'},
- {'x': 104.5, 'y': 19.1985691, 'z': '90th'},
- {'x': 104.5, 'y': 20.21012731, 'z': '95th'},
- {'x': 104.5, 'y': 20.98863696, 'z': '97th'},
- {'x': 105.5, 'y': 14.81862634, 'z': '3rd'},
- {'x': 105.5, 'y': 15.03811803, 'z': '5th'},
- {'x': 105.5, 'y': 15.40201748, 'z': '10th'},
- {'x': 105.5, 'y': 16.09428485, 'z': '25th'},
- {'x': 105.5, 'y': 17.02604617, 'z': '50th'},
- {'x': 105.5, 'y': 18.20567994, 'z': '75th'},
- {'x': 105.5, 'y': 18.98635782, 'z': '85th'},
- {'x': 105.5, 'y': 19.5952351, 'z': '90th'},
- {'x': 105.5, 'y': 20.65528582, 'z': '95th'},
- {'x': 105.5, 'y': 21.47624048, 'z': '97th'},
- {'x': 106.5, 'y': 15.07299942, 'z': '3rd'},
- {'x': 106.5, 'y': 15.29751915, 'z': '5th'},
- {'x': 106.5, 'y': 15.67008464, 'z': '10th'},
- {'x': 106.5, 'y': 16.38005272, 'z': '25th'},
- {'x': 106.5, 'y': 17.33841369, 'z': '50th'},
- {'x': 106.5, 'y': 18.55692603, 'z': '75th'},
- {'x': 106.5, 'y': 19.3669544, 'z': '85th'},
- {'x': 106.5, 'y': 20.00094429, 'z': '90th'},
- {'x': 106.5, 'y': 21.10982248, 'z': '95th'},
- {'x': 106.5, 'y': 21.97348019, 'z': '97th'},
- {'x': 107.5, 'y': 15.33278813, 'z': '3rd'},
- {'x': 107.5, 'y': 15.56261274, 'z': '5th'},
- {'x': 107.5, 'y': 15.94427872, 'z': '10th'},
- {'x': 107.5, 'y': 16.67268526, 'z': '25th'},
- {'x': 107.5, 'y': 17.65844486, 'z': '50th'},
- {'x': 107.5, 'y': 18.91651802, 'z': '75th'},
- {'x': 107.5, 'y': 19.75615211, 'z': '85th'},
- {'x': 107.5, 'y': 20.41535516, 'z': '90th'},
- {'x': 107.5, 'y': 21.57306793, 'z': '95th'},
- {'x': 107.5, 'y': 22.47933846, 'z': '97th'},
- {'x': 108.5, 'y': 15.59840399, 'z': '3rd'},
- {'x': 108.5, 'y': 15.83377861, 'z': '5th'},
- {'x': 108.5, 'y': 16.2249273, 'z': '10th'},
- {'x': 108.5, 'y': 16.97241047, 'z': '25th'},
- {'x': 108.5, 'y': 17.98622785, 'z': '50th'},
- {'x': 108.5, 'y': 19.28434006, 'z': '75th'},
- {'x': 108.5, 'y': 20.15366815, 'z': '85th'},
- {'x': 108.5, 'y': 20.83802746, 'z': '90th'},
- {'x': 108.5, 'y': 22.04422649, 'z': '95th'},
- {'x': 108.5, 'y': 22.99264818, 'z': '97th'},
- {'x': 109.5, 'y': 15.87027673, 'z': '3rd'},
- {'x': 109.5, 'y': 16.11141079, 'z': '5th'},
- {'x': 109.5, 'y': 16.5123649, 'z': '10th'},
- {'x': 109.5, 'y': 17.27944769, 'z': '25th'},
- {'x': 109.5, 'y': 18.32181829, 'z': '50th'},
- {'x': 109.5, 'y': 19.66021061, 'z': '75th'},
- {'x': 109.5, 'y': 20.55913174, 'z': '85th'},
- {'x': 109.5, 'y': 21.2684158, 'z': '90th'},
- {'x': 109.5, 'y': 22.5223689, 'z': '95th'},
- {'x': 109.5, 'y': 23.51208703, 'z': '97th'},
- {'x': 110.5, 'y': 16.14885045, 'z': '3rd'},
- {'x': 110.5, 'y': 16.39591448, 'z': '5th'},
- {'x': 110.5, 'y': 16.80693136, 'z': '10th'},
- {'x': 110.5, 'y': 17.5940083, 'z': '25th'},
- {'x': 110.5, 'y': 18.66524194, 'z': '50th'},
- {'x': 110.5, 'y': 20.04388538, 'z': '75th'},
- {'x': 110.5, 'y': 20.97208562, 'z': '85th'},
- {'x': 110.5, 'y': 21.7058694, 'z': '90th'},
- {'x': 110.5, 'y': 23.00642737, 'z': '95th'},
- {'x': 110.5, 'y': 24.03616881, 'z': '97th'},
- {'x': 111.5, 'y': 16.43458256, 'z': '3rd'},
- {'x': 111.5, 'y': 16.6877053, 'z': '5th'},
- {'x': 111.5, 'y': 17.10897135, 'z': '10th'},
- {'x': 111.5, 'y': 17.91629559, 'z': '25th'},
- {'x': 111.5, 'y': 19.01649457, 'z': '50th'},
- {'x': 111.5, 'y': 20.43505617, 'z': '75th'},
- {'x': 111.5, 'y': 21.39198329, 'z': '85th'},
- {'x': 111.5, 'y': 22.14962753, 'z': '90th'},
- {'x': 111.5, 'y': 23.49518765, 'z': '95th'},
- {'x': 111.5, 'y': 24.56323314, 'z': '97th'},
- {'x': 112.5, 'y': 16.72794483, 'z': '3rd'},
- {'x': 112.5, 'y': 16.98720984, 'z': '5th'},
- {'x': 112.5, 'y': 17.41883434, 'z': '10th'},
- {'x': 112.5, 'y': 18.24650364, 'z': '25th'},
- {'x': 112.5, 'y': 19.37553957, 'z': '50th'},
- {'x': 112.5, 'y': 20.8333469, 'z': '75th'},
- {'x': 112.5, 'y': 21.81818429, 'z': '85th'},
- {'x': 112.5, 'y': 22.59881442, 'z': '90th'},
- {'x': 112.5, 'y': 23.98728419, 'z': '95th'},
- {'x': 112.5, 'y': 25.09144275, 'z': '97th'},
- {'x': 113.5, 'y': 17.02941648, 'z': '3rd'},
- {'x': 113.5, 'y': 17.29486046, 'z': '5th'},
- {'x': 113.5, 'y': 17.73687191, 'z': '10th'},
- {'x': 113.5, 'y': 18.58481884, 'z': '25th'},
- {'x': 113.5, 'y': 19.74231348, 'z': '50th'},
- {'x': 113.5, 'y': 21.23832075, 'z': '75th'},
- {'x': 113.5, 'y': 22.24995962, 'z': '85th'},
- {'x': 113.5, 'y': 23.05244169, 'z': '90th'},
- {'x': 113.5, 'y': 24.48119347, 'z': '95th'},
- {'x': 113.5, 'y': 25.61876629, 'z': '97th'},
- {'x': 114.5, 'y': 17.33948852, 'z': '3rd'},
- {'x': 114.5, 'y': 17.61109835, 'z': '5th'},
- {'x': 114.5, 'y': 18.06343891, 'z': '10th'},
- {'x': 114.5, 'y': 18.93141779, 'z': '25th'},
- {'x': 114.5, 'y': 20.11672014, 'z': '50th'},
- {'x': 114.5, 'y': 21.64947133, 'z': '75th'},
- {'x': 114.5, 'y': 22.6864823, 'z': '85th'},
- {'x': 114.5, 'y': 23.50939939, 'z': '90th'},
- {'x': 114.5, 'y': 24.97522873, 'z': '95th'},
- {'x': 114.5, 'y': 26.14297963, 'z': '97th'},
- {'x': 115.5, 'y': 17.65865664, 'z': '3rd'},
- {'x': 115.5, 'y': 17.93636825, 'z': '5th'},
- {'x': 115.5, 'y': 18.39889081, 'z': '10th'},
- {'x': 115.5, 'y': 19.28646882, 'z': '25th'},
- {'x': 115.5, 'y': 20.4986363, 'z': '50th'},
- {'x': 115.5, 'y': 22.06622967, 'z': '75th'},
- {'x': 115.5, 'y': 23.12683271, 'z': '85th'},
- {'x': 115.5, 'y': 23.96845835, 'z': '90th'},
- {'x': 115.5, 'y': 25.46753358, 'z': '95th'},
- {'x': 115.5, 'y': 26.66164921, 'z': '97th'},
- {'x': 116.5, 'y': 17.98742223, 'z': '3rd'},
- {'x': 116.5, 'y': 18.27111906, 'z': '5th'},
- {'x': 116.5, 'y': 18.74358385, 'z': '10th'},
- {'x': 116.5, 'y': 19.65013122, 'z': '25th'},
- {'x': 116.5, 'y': 20.88790914, 'z': '50th'},
- {'x': 116.5, 'y': 22.48795967, 'z': '75th'},
- {'x': 116.5, 'y': 23.56999284, 'z': '85th'},
- {'x': 116.5, 'y': 24.42826397, 'z': '90th'},
- {'x': 116.5, 'y': 25.95607618, 'z': '95th'},
- {'x': 116.5, 'y': 27.17212889, 'z': '97th'},
- {'x': 117.5, 'y': 18.32628747, 'z': '3rd'},
- {'x': 117.5, 'y': 18.61580027, 'z': '5th'},
- {'x': 117.5, 'y': 19.09787338, 'z': '10th'},
- {'x': 117.5, 'y': 20.02255635, 'z': '25th'},
- {'x': 117.5, 'y': 21.28435965, 'z': '50th'},
- {'x': 117.5, 'y': 22.91396132, 'z': '75th'},
- {'x': 117.5, 'y': 24.01484769, 'z': '85th'},
- {'x': 117.5, 'y': 24.8873352, 'z': '90th'},
- {'x': 117.5, 'y': 26.43864271, 'z': '95th'},
- {'x': 117.5, 'y': 27.67154822, 'z': '97th'},
- {'x': 118.5, 'y': 18.67575115, 'z': '3rd'},
- {'x': 118.5, 'y': 18.97085907, 'z': '5th'},
- {'x': 118.5, 'y': 19.46211272, 'z': '10th'},
- {'x': 118.5, 'y': 20.40388907, 'z': '25th'},
- {'x': 118.5, 'y': 21.6877854, 'z': '50th'},
- {'x': 118.5, 'y': 23.34347238, 'z': '75th'},
- {'x': 118.5, 'y': 24.46018471, 'z': '85th'},
- {'x': 118.5, 'y': 25.34406179, 'z': '90th'},
- {'x': 118.5, 'y': 26.91283039, 'z': '95th'},
- {'x': 118.5, 'y': 28.15680318, 'z': '97th'},
- {'x': 119.5, 'y': 19.03630228, 'z': '3rd'},
- {'x': 119.5, 'y': 19.33673586, 'z': '5th'},
- {'x': 119.5, 'y': 19.83665164, 'z': '10th'},
- {'x': 119.5, 'y': 20.79427025, 'z': '25th'},
- {'x': 119.5, 'y': 22.09796571, 'z': '50th'},
- {'x': 119.5, 'y': 23.77567219, 'z': '75th'},
- {'x': 119.5, 'y': 24.90469458, 'z': '85th'},
- {'x': 119.5, 'y': 25.79670194, 'z': '90th'},
- {'x': 119.5, 'y': 27.37603973, 'z': '95th'},
- {'x': 119.5, 'y': 28.62454542, 'z': '97th'},
- {'x': 120.5, 'y': 19.4084109, 'z': '3rd'},
- {'x': 120.5, 'y': 19.71385824, 'z': '5th'},
- {'x': 120.5, 'y': 20.22183471, 'z': '10th'},
- {'x': 120.5, 'y': 21.19384134, 'z': '25th'},
- {'x': 120.5, 'y': 22.51466977, 'z': '50th'},
- {'x': 120.5, 'y': 24.20968794, 'z': '75th'},
- {'x': 120.5, 'y': 25.34697329, 'z': '85th'},
- {'x': 120.5, 'y': 26.24338024, 'z': '90th'},
- {'x': 120.5, 'y': 27.82546527, 'z': '95th'},
- {'x': 120.5, 'y': 29.07117005, 'z': '97th'},
- {'x': 121.5, 'y': 19.79251446, 'z': '3rd'},
- {'x': 121.5, 'y': 20.10263208, 'z': '5th'},
- {'x': 121.5, 'y': 20.61799935, 'z': '10th'},
- {'x': 121.5, 'y': 21.6027518, 'z': '25th'},
- {'x': 121.5, 'y': 22.93766971, 'z': '50th'},
- {'x': 121.5, 'y': 24.64460473, 'z': '75th'},
- {'x': 121.5, 'y': 25.78552592, 'z': '85th'},
- {'x': 121.5, 'y': 26.68208549, 'z': '90th'},
- {'x': 121.5, 'y': 28.25808429, 'z': '95th'},
- {'x': 121.5, 'y': 29.49280125, 'z': '97th'}
-]
@@ -0,0 +1,96 @@
+"""WHO and CDC growth references as LMS parameter tables.
+
+Each reference gives, at every age (or length/stature), the L (Box-Cox power),
+M (median) and S (coefficient of variation) of the measurement. The value at
+z-score z is M * (1 + L*S*z) ** (1/L), so any percentile curve can be drawn from
+three numbers per point. Tables are parsed the first time a chart needs them
+and kept for the life of the process; adding a reference set is adding its
+LMS rows to `cdc.py` or `who.py`.
+"""
+
+from typing import NamedTuple
+
+_E = 2.718281828459045
+
+# z-scores of the percentiles the charts draw
+PERCENTILE_Z = {
+    3: -1.8807936081512509,
+    5: -1.6448536269514726,
+    10: -1.2815515655446008,
+    25: -0.6744897501960817,
+    50: 0.0,
+    75: 0.6744897501960817,
+    85: 1.0364333894937894,
+    90: 1.2815515655446008,
+    95: 1.6448536269514715,
+    97: 1.8807936081512504,
+    98: 2.053748910631822,
+}
+
+# The CDC's charts of the WHO standards draw their top curve at z = 2 (the
+# 97.7th percentile) and label it "98th"; the WHO tables keep that line.
+WHO_PERCENTILE_Z = {**PERCENTILE_Z, 98: 2.0}
+
+
+class LmsTable(NamedTuple):
+    percentiles: tuple
+    x: tuple
+    l: tuple
+    m: tuple
+    s: tuple
+
+
+_SUFFIXES = {1: "st", 2: "nd", 3: "rd"}
+
+_tables = {}
+_curves = {}
+
+
+def get_table(name: str) -> LmsTable:
+    """The LMS table of a reference, e.g. "cdc_boys_bmi_age"."""
+    table = _tables.get(name)
+    if table is None:
+        table = _tables[name] = _parse(_source(name))
+    return table
+
+
+def value_at(l: float, m: float, s: float, z: float) -> float:
+    """The measurement at z-score `z` for the LMS parameters of one point."""
+    if l == 0:
+        return m * _E ** (s * z)
+    return m * (1 + l * s * z) ** (1 / l)
+
+
+def percentile_curves(name: str) -> list[dict]:
+    """Chart data of a reference: {x, y, z} points, one curve per percentile."""
+    curves = _curves.get(name)
+    if curves is None:
+        table = get_table(name)
+        zs = WHO_PERCENTILE_Z if name.startswith("who_") else PERCENTILE_Z
+        curves = _curves[name] = [
+            {"x": x, "y": round(value_at(l, m, s, zs[percentile]), 6), "z": _ordinal(percentile)}
+            for percentile in table.percentiles
+            for x, l, m, s in zip(table.x, table.l, table.m, table.s)
+        ]
+    return curves
+
+
+def _source(name: str) -> str:
+    if name.startswith("cdc_"):
+        from growth_charts.graphs.cdc import TABLES
+    elif name.startswith("who_"):
+        from growth_charts.graphs.who import TABLES
+    else:
+        raise KeyError(name)
+    return TABLES[name]
+
+
+def _parse(text: str) -> LmsTable:
+    header, *rows = text.strip().splitlines()
+    columns = list(zip(*(map(float, row.split()) for row in rows)))
+    return LmsTable(tuple(int(p) for p in header.split()), *columns)
+
+
+def _ordinal(n: int) -> str:
+    suffix = "th" if n % 100 in (11, 12, 13) else _SUFFIXES.get(n % 10, "th")
+    return f"{n}{suffix}"
@@ -1,202 +0,0 @@
-who_boys_circumference_age = [
-    { "x": 0, "y": 32.37241, "z": "5th" },
-    { "x": 1, "y": 35.35495, "z": "5th" },
-    { "x": 2, "y": 37.19961, "z": "5th" },
-    { "x": 3, "y": 38.56898, "z": "5th" },
-    { "x": 4, "y": 39.66775, "z": "5th" },
-    { "x": 5, "y": 40.57167, "z": "5th" },
-    { "x": 6, "y": 41.32285, "z": "5th" },
-    { "x": 7, "y": 41.95185, "z": "5th" },
-    { "x": 8, "y": 42.48206, "z": "5th" },
-    { "x": 9, "y": 42.93322, "z": "5th" },
-    { "x": 10, "y": 43.3214, "z": "5th" },
-    { "x": 11, "y": 43.65819, "z": "5th" },
-    { "x": 12, "y": 43.95282, "z": "5th" },
-    { "x": 13, "y": 44.21368, "z": "5th" },
-    { "x": 14, "y": 44.44581, "z": "5th" },
-    { "x": 15, "y": 44.65647, "z": "5th" },
-    { "x": 16, "y": 44.84763, "z": "5th" },
-    { "x": 17, "y": 45.02487, "z": "5th" },
-    { "x": 18, "y": 45.18938, "z": "5th" },
-    { "x": 19, "y": 45.34405, "z": "5th" },
-    { "x": 20, "y": 45.4907, "z": "5th" },
-    { "x": 21, "y": 45.62958, "z": "5th" },
-    { "x": 22, "y": 45.76313, "z": "5th" },
-    { "x": 23, "y": 45.89043, "z": "5th" },
-    { "x": 24, "y": 46.01257, "z": "5th" },
-    { "x": 0, "y": 32.83389, "z": "10th" },
-    { "x": 1, "y": 35.77923, "z": "10th" },
-    { "x": 2, "y": 37.62565, "z": "10th" },
-    { "x": 3, "y": 38.99847, "z": "10th" },
-    { "x": 4, "y": 40.10153, "z": "10th" },
-    { "x": 5, "y": 41.01031, "z": "10th" },
-    { "x": 6, "y": 41.76631, "z": "10th" },
-    { "x": 7, "y": 42.39988, "z": "10th" },
-    { "x": 8, "y": 42.93439, "z": "10th" },
-    { "x": 9, "y": 43.38967, "z": "10th" },
-    { "x": 10, "y": 43.78163, "z": "10th" },
-    { "x": 11, "y": 44.12182, "z": "10th" },
-    { "x": 12, "y": 44.41958, "z": "10th" },
-    { "x": 13, "y": 44.68321, "z": "10th" },
-    { "x": 14, "y": 44.91816, "z": "10th" },
-    { "x": 15, "y": 45.13124, "z": "10th" },
-    { "x": 16, "y": 45.32497, "z": "10th" },
-    { "x": 17, "y": 45.50445, "z": "10th" },
-    { "x": 18, "y": 45.67126, "z": "10th" },
-    { "x": 19, "y": 45.82813, "z": "10th" },
-    { "x": 20, "y": 45.97688, "z": "10th" },
-    { "x": 21, "y": 46.11798, "z": "10th" },
-    { "x": 22, "y": 46.2535, "z": "10th" },
-    { "x": 23, "y": 46.3829, "z": "10th" },
-    { "x": 24, "y": 46.50708, "z": "10th" },
-    { "x": 0, "y": 33.60502, "z": "25th" },
-    { "x": 1, "y": 36.48819, "z": "25th" },
-    { "x": 2, "y": 38.33754, "z": "25th" },
-    { "x": 3, "y": 39.71613, "z": "25th" },
-    { "x": 4, "y": 40.82636, "z": "25th" },
-    { "x": 5, "y": 41.74325, "z": "25th" },
-    { "x": 6, "y": 42.5073, "z": "25th" },
-    { "x": 7, "y": 43.14851, "z": "25th" },
-    { "x": 8, "y": 43.69022, "z": "25th" },
-    { "x": 9, "y": 44.15237, "z": "25th" },
-    { "x": 10, "y": 44.55065, "z": "25th" },
-    { "x": 11, "y": 44.89654, "z": "25th" },
-    { "x": 12, "y": 45.19953, "z": "25th" },
-    { "x": 13, "y": 45.46778, "z": "25th" },
-    { "x": 14, "y": 45.70745, "z": "25th" },
-    { "x": 15, "y": 45.92456, "z": "25th" },
-    { "x": 16, "y": 46.12259, "z": "25th" },
-    { "x": 17, "y": 46.30582, "z": "25th" },
-    { "x": 18, "y": 46.47646, "z": "25th" },
-    { "x": 19, "y": 46.63699, "z": "25th" },
-    { "x": 20, "y": 46.78927, "z": "25th" },
-    { "x": 21, "y": 46.93407, "z": "25th" },
-    { "x": 22, "y": 47.07289, "z": "25th" },
-    { "x": 23, "y": 47.2058, "z": "25th" },
-    { "x": 24, "y": 47.3334, "z": "25th" },
-    { "x": 0, "y": 34.4618, "z": "50th" },
-    { "x": 1, "y": 37.2759, "z": "50th" },
-    { "x": 2, "y": 39.1285, "z": "50th" },
-    { "x": 3, "y": 40.5135, "z": "50th" },
-    { "x": 4, "y": 41.6317, "z": "50th" },
-    { "x": 5, "y": 42.5576, "z": "50th" },
-    { "x": 6, "y": 43.3306, "z": "50th" },
-    { "x": 7, "y": 43.9803, "z": "50th" },
-    { "x": 8, "y": 44.53, "z": "50th" },
-    { "x": 9, "y": 44.9998, "z": "50th" },
-    { "x": 10, "y": 45.4051, "z": "50th" },
-    { "x": 11, "y": 45.7573, "z": "50th" },
-    { "x": 12, "y": 46.0661, "z": "50th" },
-    { "x": 13, "y": 46.3395, "z": "50th" },
-    { "x": 14, "y": 46.5844, "z": "50th" },
-    { "x": 15, "y": 46.806, "z": "50th" },
-    { "x": 16, "y": 47.0088, "z": "50th" },
-    { "x": 17, "y": 47.1962, "z": "50th" },
-    { "x": 18, "y": 47.3711, "z": "50th" },
-    { "x": 19, "y": 47.5357, "z": "50th" },
-    { "x": 20, "y": 47.6919, "z": "50th" },
-    { "x": 21, "y": 47.8408, "z": "50th" },
-    { "x": 22, "y": 47.9833, "z": "50th" },
-    { "x": 23, "y": 48.1201, "z": "50th" },
-    { "x": 24, "y": 48.2515, "z": "50th" },
-    { "x": 0, "y": 35.31858, "z": "75th" },
-    { "x": 1, "y": 38.06361, "z": "75th" },
-    { "x": 2, "y": 39.91946, "z": "75th" },
-    { "x": 3, "y": 41.31087, "z": "75th" },
-    { "x": 4, "y": 42.43704, "z": "75th" },
-    { "x": 5, "y": 43.37195, "z": "75th" },
-    { "x": 6, "y": 44.1539, "z": "75th" },
-    { "x": 7, "y": 44.81209, "z": "75th" },
-    { "x": 8, "y": 45.36978, "z": "75th" },
-    { "x": 9, "y": 45.84723, "z": "75th" },
-    { "x": 10, "y": 46.25955, "z": "75th" },
-    { "x": 11, "y": 46.61806, "z": "75th" },
-    { "x": 12, "y": 46.93267, "z": "75th" },
-    { "x": 13, "y": 47.21122, "z": "75th" },
-    { "x": 14, "y": 47.46135, "z": "75th" },
-    { "x": 15, "y": 47.68744, "z": "75th" },
-    { "x": 16, "y": 47.89501, "z": "75th" },
-    { "x": 17, "y": 48.08658, "z": "75th" },
-    { "x": 18, "y": 48.26574, "z": "75th" },
-    { "x": 19, "y": 48.43441, "z": "75th" },
-    { "x": 20, "y": 48.59453, "z": "75th" },
-    { "x": 21, "y": 48.74753, "z": "75th" },
-    { "x": 22, "y": 48.89371, "z": "75th" },
-    { "x": 23, "y": 49.0344, "z": "75th" },
-    { "x": 24, "y": 49.1696, "z": "75th" },
-    { "x": 0, "y": 36.08971, "z": "90th" },
-    { "x": 1, "y": 38.77257, "z": "90th" },
-    { "x": 2, "y": 40.63135, "z": "90th" },
-    { "x": 3, "y": 42.02853, "z": "90th" },
-    { "x": 4, "y": 43.16187, "z": "90th" },
-    { "x": 5, "y": 44.10489, "z": "90th" },
-    { "x": 6, "y": 44.89489, "z": "90th" },
-    { "x": 7, "y": 45.56072, "z": "90th" },
-    { "x": 8, "y": 46.12561, "z": "90th" },
-    { "x": 9, "y": 46.60993, "z": "90th" },
-    { "x": 10, "y": 47.02857, "z": "90th" },
-    { "x": 11, "y": 47.39278, "z": "90th" },
-    { "x": 12, "y": 47.71262, "z": "90th" },
-    { "x": 13, "y": 47.99579, "z": "90th" },
-    { "x": 14, "y": 48.25064, "z": "90th" },
-    { "x": 15, "y": 48.48076, "z": "90th" },
-    { "x": 16, "y": 48.69263, "z": "90th" },
-    { "x": 17, "y": 48.88795, "z": "90th" },
-    { "x": 18, "y": 49.07094, "z": "90th" },
-    { "x": 19, "y": 49.24327, "z": "90th" },
-    { "x": 20, "y": 49.40692, "z": "90th" },
-    { "x": 21, "y": 49.56362, "z": "90th" },
-    { "x": 22, "y": 49.7131, "z": "90th" },
-    { "x": 23, "y": 49.8573, "z": "90th" },
-    { "x": 24, "y": 49.99592, "z": "90th" },
-    { "x": 0, "y": 36.55119, "z": "95th" },
-    { "x": 1, "y": 39.19685, "z": "95th" },
-    { "x": 2, "y": 41.05739, "z": "95th" },
-    { "x": 3, "y": 42.45802, "z": "95th" },
-    { "x": 4, "y": 43.59565, "z": "95th" },
-    { "x": 5, "y": 44.54353, "z": "95th" },
-    { "x": 6, "y": 45.33835, "z": "95th" },
-    { "x": 7, "y": 46.00875, "z": "95th" },
-    { "x": 8, "y": 46.57794, "z": "95th" },
-    { "x": 9, "y": 47.06638, "z": "95th" },
-    { "x": 10, "y": 47.4888, "z": "95th" },
-    { "x": 11, "y": 47.85641, "z": "95th" },
-    { "x": 12, "y": 48.17938, "z": "95th" },
-    { "x": 13, "y": 48.46532, "z": "95th" },
-    { "x": 14, "y": 48.72299, "z": "95th" },
-    { "x": 15, "y": 48.95553, "z": "95th" },
-    { "x": 16, "y": 49.16997, "z": "95th" },
-    { "x": 17, "y": 49.36753, "z": "95th" },
-    { "x": 18, "y": 49.55282, "z": "95th" },
-    { "x": 19, "y": 49.72735, "z": "95th" },
-    { "x": 20, "y": 49.8931, "z": "95th" },
-    { "x": 21, "y": 50.05202, "z": "95th" },
-    { "x": 22, "y": 50.20347, "z": "95th" },
-    { "x": 23, "y": 50.34977, "z": "95th" },
-    { "x": 24, "y": 50.49043, "z": "95th" },
-    { "x": 0, "y": 37.0023239, "z": "98th" },
-    { "x": 1, "y": 39.6116079, "z": "98th" },
-    { "x": 2, "y": 41.4738623, "z": "98th" },
-    { "x": 3, "y": 42.8778679, "z": "98th" },
-    { "x": 4, "y": 44.0196943, "z": "98th" },
-    { "x": 5, "y": 44.9723182, "z": "98th" },
-    { "x": 6, "y": 45.771846, "z": "98th" },
-    { "x": 7, "y": 46.4467152, "z": "98th" },
-    { "x": 8, "y": 47.0201176, "z": "98th" },
-    { "x": 9, "y": 47.5125888, "z": "98th" },
-    { "x": 10, "y": 47.9387046, "z": "98th" },
-    { "x": 11, "y": 48.3096422, "z": "98th" },
-    { "x": 12, "y": 48.6356671, "z": "98th" },
-    { "x": 13, "y": 48.9243173, "z": "98th" },
-    { "x": 14, "y": 49.1847412, "z": "98th" },
-    { "x": 15, "y": 49.419647, "z": "98th" },
-    { "x": 16, "y": 49.6365919, "z": "98th" },
-    { "x": 17, "y": 49.8363554, "z": "98th" },
-    { "x": 18, "y": 50.0238816, "z": "98th" },
-    { "x": 19, "y": 50.2005513, "z": "98th" },
-    { "x": 20, "y": 50.3683694, "z": "98th" },
-    { "x": 21, "y": 50.529453, "z": "98th" },
-    { "x": 22, "y": 50.6828405, "z": "98th" },
-    { "x": 23, "y": 50.8311864, "z": "98th" },
-    { "x": 24, "y": 50.9738496, "z": "98th" }
-]
\ No newline at end of file
@@ -1,202 +0,0 @@
-who_boys_length_age = [
-    { "x": 0, "y": 46.77032, "z": "5th" },
-    { "x": 1, "y": 51.52262, "z": "5th" },
-    { "x": 2, "y": 55.13442, "z": "5th" },
-    { "x": 3, "y": 58.06652, "z": "5th" },
-    { "x": 4, "y": 60.46344, "z": "5th" },
-    { "x": 5, "y": 62.42946, "z": "5th" },
-    { "x": 6, "y": 64.10314, "z": "5th" },
-    { "x": 7, "y": 65.5934, "z": "5th" },
-    { "x": 8, "y": 66.97163, "z": "5th" },
-    { "x": 9, "y": 68.27886, "z": "5th" },
-    { "x": 10, "y": 69.52286, "z": "5th" },
-    { "x": 11, "y": 70.70738, "z": "5th" },
-    { "x": 12, "y": 71.84023, "z": "5th" },
-    { "x": 13, "y": 72.92816, "z": "5th" },
-    { "x": 14, "y": 73.97491, "z": "5th" },
-    { "x": 15, "y": 74.98384, "z": "5th" },
-    { "x": 16, "y": 75.96033, "z": "5th" },
-    { "x": 17, "y": 76.90533, "z": "5th" },
-    { "x": 18, "y": 77.8221, "z": "5th" },
-    { "x": 19, "y": 78.70973, "z": "5th" },
-    { "x": 20, "y": 79.57106, "z": "5th" },
-    { "x": 21, "y": 80.40724, "z": "5th" },
-    { "x": 22, "y": 81.22133, "z": "5th" },
-    { "x": 23, "y": 82.01447, "z": "5th" },
-    { "x": 24, "y": 82.79087, "z": "5th" },
-    { "x": 0, "y": 47.45809, "z": "10th" },
-    { "x": 1, "y": 52.2298, "z": "10th" },
-    { "x": 2, "y": 55.8612, "z": "10th" },
-    { "x": 3, "y": 58.80924, "z": "10th" },
-    { "x": 4, "y": 61.21939, "z": "10th" },
-    { "x": 5, "y": 63.19658, "z": "10th" },
-    { "x": 6, "y": 64.88071, "z": "10th" },
-    { "x": 7, "y": 66.38216, "z": "10th" },
-    { "x": 8, "y": 67.77291, "z": "10th" },
-    { "x": 9, "y": 69.09384, "z": "10th" },
-    { "x": 10, "y": 70.35297, "z": "10th" },
-    { "x": 11, "y": 71.55363, "z": "10th" },
-    { "x": 12, "y": 72.70353, "z": "10th" },
-    { "x": 13, "y": 73.80954, "z": "10th" },
-    { "x": 14, "y": 74.87492, "z": "10th" },
-    { "x": 15, "y": 75.9031, "z": "10th" },
-    { "x": 16, "y": 76.89925, "z": "10th" },
-    { "x": 17, "y": 77.86466, "z": "10th" },
-    { "x": 18, "y": 78.80202, "z": "10th" },
-    { "x": 19, "y": 79.71074, "z": "10th" },
-    { "x": 20, "y": 80.59338, "z": "10th" },
-    { "x": 21, "y": 81.45143, "z": "10th" },
-    { "x": 22, "y": 82.28734, "z": "10th" },
-    { "x": 23, "y": 83.1026, "z": "10th" },
-    { "x": 24, "y": 83.9008, "z": "10th" },
-    { "x": 0, "y": 48.60732, "z": "25th" },
-    { "x": 1, "y": 53.41147, "z": "25th" },
-    { "x": 2, "y": 57.0756, "z": "25th" },
-    { "x": 3, "y": 60.0503, "z": "25th" },
-    { "x": 4, "y": 62.48254, "z": "25th" },
-    { "x": 5, "y": 64.4784, "z": "25th" },
-    { "x": 6, "y": 66.18, "z": "25th" },
-    { "x": 7, "y": 67.70013, "z": "25th" },
-    { "x": 8, "y": 69.1118, "z": "25th" },
-    { "x": 9, "y": 70.45564, "z": "25th" },
-    { "x": 10, "y": 71.74005, "z": "25th" },
-    { "x": 11, "y": 72.96769, "z": "25th" },
-    { "x": 12, "y": 74.14605, "z": "25th" },
-    { "x": 13, "y": 75.28228, "z": "25th" },
-    { "x": 14, "y": 76.37879, "z": "25th" },
-    { "x": 15, "y": 77.43914, "z": "25th" },
-    { "x": 16, "y": 78.46814, "z": "25th" },
-    { "x": 17, "y": 79.46765, "z": "25th" },
-    { "x": 18, "y": 80.43942, "z": "25th" },
-    { "x": 19, "y": 81.38338, "z": "25th" },
-    { "x": 20, "y": 82.30162, "z": "25th" },
-    { "x": 21, "y": 83.19621, "z": "25th" },
-    { "x": 22, "y": 84.06859, "z": "25th" },
-    { "x": 23, "y": 84.92082, "z": "25th" },
-    { "x": 24, "y": 85.75545, "z": "25th" },
-    { "x": 0, "y": 49.8842, "z": "50th" },
-    { "x": 1, "y": 54.7244, "z": "50th" },
-    { "x": 2, "y": 58.4249, "z": "50th" },
-    { "x": 3, "y": 61.4292, "z": "50th" },
-    { "x": 4, "y": 63.886, "z": "50th" },
-    { "x": 5, "y": 65.9026, "z": "50th" },
-    { "x": 6, "y": 67.6236, "z": "50th" },
-    { "x": 7, "y": 69.1645, "z": "50th" },
-    { "x": 8, "y": 70.5994, "z": "50th" },
-    { "x": 9, "y": 71.9687, "z": "50th" },
-    { "x": 10, "y": 73.2812, "z": "50th" },
-    { "x": 11, "y": 74.5388, "z": "50th" },
-    { "x": 12, "y": 75.7488, "z": "50th" },
-    { "x": 13, "y": 76.9186, "z": "50th" },
-    { "x": 14, "y": 78.0497, "z": "50th" },
-    { "x": 15, "y": 79.1458, "z": "50th" },
-    { "x": 16, "y": 80.2113, "z": "50th" },
-    { "x": 17, "y": 81.2487, "z": "50th" },
-    { "x": 18, "y": 82.2587, "z": "50th" },
-    { "x": 19, "y": 83.2418, "z": "50th" },
-    { "x": 20, "y": 84.1996, "z": "50th" },
-    { "x": 21, "y": 85.1348, "z": "50th" },
-    { "x": 22, "y": 86.0477, "z": "50th" },
-    { "x": 23, "y": 86.941, "z": "50th" },
-    { "x": 24, "y": 87.8161, "z": "50th" },
-    { "x": 0, "y": 51.16108, "z": "75th" },
-    { "x": 1, "y": 56.03733, "z": "75th" },
-    { "x": 2, "y": 59.7742, "z": "75th" },
-    { "x": 3, "y": 62.8081, "z": "75th" },
-    { "x": 4, "y": 65.28946, "z": "75th" },
-    { "x": 5, "y": 67.3268, "z": "75th" },
-    { "x": 6, "y": 69.0672, "z": "75th" },
-    { "x": 7, "y": 70.62887, "z": "75th" },
-    { "x": 8, "y": 72.087, "z": "75th" },
-    { "x": 9, "y": 73.48176, "z": "75th" },
-    { "x": 10, "y": 74.82235, "z": "75th" },
-    { "x": 11, "y": 76.10991, "z": "75th" },
-    { "x": 12, "y": 77.35155, "z": "75th" },
-    { "x": 13, "y": 78.55492, "z": "75th" },
-    { "x": 14, "y": 79.72061, "z": "75th" },
-    { "x": 15, "y": 80.85246, "z": "75th" },
-    { "x": 16, "y": 81.95446, "z": "75th" },
-    { "x": 17, "y": 83.02975, "z": "75th" },
-    { "x": 18, "y": 84.07798, "z": "75th" },
-    { "x": 19, "y": 85.10022, "z": "75th" },
-    { "x": 20, "y": 86.09758, "z": "75th" },
-    { "x": 21, "y": 87.07339, "z": "75th" },
-    { "x": 22, "y": 88.02681, "z": "75th" },
-    { "x": 23, "y": 88.96118, "z": "75th" },
-    { "x": 24, "y": 89.87675, "z": "75th" },
-    { "x": 0, "y": 52.31031, "z": "90th" },
-    { "x": 1, "y": 57.219, "z": "90th" },
-    { "x": 2, "y": 60.9886, "z": "90th" },
-    { "x": 3, "y": 64.04916, "z": "90th" },
-    { "x": 4, "y": 66.55261, "z": "90th" },
-    { "x": 5, "y": 68.60862, "z": "90th" },
-    { "x": 6, "y": 70.36649, "z": "90th" },
-    { "x": 7, "y": 71.94684, "z": "90th" },
-    { "x": 8, "y": 73.42589, "z": "90th" },
-    { "x": 9, "y": 74.84356, "z": "90th" },
-    { "x": 10, "y": 76.20943, "z": "90th" },
-    { "x": 11, "y": 77.52397, "z": "90th" },
-    { "x": 12, "y": 78.79407, "z": "90th" },
-    { "x": 13, "y": 80.02766, "z": "90th" },
-    { "x": 14, "y": 81.22448, "z": "90th" },
-    { "x": 15, "y": 82.3885, "z": "90th" },
-    { "x": 16, "y": 83.52335, "z": "90th" },
-    { "x": 17, "y": 84.63274, "z": "90th" },
-    { "x": 18, "y": 85.71538, "z": "90th" },
-    { "x": 19, "y": 86.77286, "z": "90th" },
-    { "x": 20, "y": 87.80582, "z": "90th" },
-    { "x": 21, "y": 88.81817, "z": "90th" },
-    { "x": 22, "y": 89.80806, "z": "90th" },
-    { "x": 23, "y": 90.7794, "z": "90th" },
-    { "x": 24, "y": 91.7314, "z": "90th" },
-    { "x": 0, "y": 52.99808, "z": "95th" },
-    { "x": 1, "y": 57.92618, "z": "95th" },
-    { "x": 2, "y": 61.71538, "z": "95th" },
-    { "x": 3, "y": 64.79188, "z": "95th" },
-    { "x": 4, "y": 67.30856, "z": "95th" },
-    { "x": 5, "y": 69.37574, "z": "95th" },
-    { "x": 6, "y": 71.14406, "z": "95th" },
-    { "x": 7, "y": 72.7356, "z": "95th" },
-    { "x": 8, "y": 74.22717, "z": "95th" },
-    { "x": 9, "y": 75.65854, "z": "95th" },
-    { "x": 10, "y": 77.03954, "z": "95th" },
-    { "x": 11, "y": 78.37022, "z": "95th" },
-    { "x": 12, "y": 79.65737, "z": "95th" },
-    { "x": 13, "y": 80.90904, "z": "95th" },
-    { "x": 14, "y": 82.12449, "z": "95th" },
-    { "x": 15, "y": 83.30776, "z": "95th" },
-    { "x": 16, "y": 84.46227, "z": "95th" },
-    { "x": 17, "y": 85.59207, "z": "95th" },
-    { "x": 18, "y": 86.6953, "z": "95th" },
-    { "x": 19, "y": 87.77387, "z": "95th" },
-    { "x": 20, "y": 88.82814, "z": "95th" },
-    { "x": 21, "y": 89.86236, "z": "95th" },
-    { "x": 22, "y": 90.87407, "z": "95th" },
-    { "x": 23, "y": 91.86753, "z": "95th" },
-    { "x": 24, "y": 92.84133, "z": "95th" },
-    { "x": 0, "y": 53.67041, "z": "98th" },
-    { "x": 1, "y": 58.61749, "z": "98th" },
-    { "x": 2, "y": 62.42584, "z": "98th" },
-    { "x": 3, "y": 65.51793, "z": "98th" },
-    { "x": 4, "y": 68.04753, "z": "98th" },
-    { "x": 5, "y": 70.12564, "z": "98th" },
-    { "x": 6, "y": 71.90417, "z": "98th" },
-    { "x": 7, "y": 73.50665, "z": "98th" },
-    { "x": 8, "y": 75.01045, "z": "98th" },
-    { "x": 9, "y": 76.45523, "z": "98th" },
-    { "x": 10, "y": 77.85102, "z": "98th" },
-    { "x": 11, "y": 79.19748, "z": "98th" },
-    { "x": 12, "y": 80.50128, "z": "98th" },
-    { "x": 13, "y": 81.77063, "z": "98th" },
-    { "x": 14, "y": 83.0043, "z": "98th" },
-    { "x": 15, "y": 84.20638, "z": "98th" },
-    { "x": 16, "y": 85.38012, "z": "98th" },
-    { "x": 17, "y": 86.52987, "z": "98th" },
-    { "x": 18, "y": 87.65323, "z": "98th" },
-    { "x": 19, "y": 88.75241, "z": "98th" },
-    { "x": 20, "y": 89.8275, "z": "98th" },
-    { "x": 21, "y": 90.8831, "z": "98th" },
-    { "x": 22, "y": 91.91615, "z": "98th" },
-    { "x": 23, "y": 92.93123, "z": "98th" },
-    { "x": 24, "y": 93.92634, "z": "98th" }
-]
\ No newline at end of file
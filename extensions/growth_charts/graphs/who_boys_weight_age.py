@@ -1,202 +0,0 @@
-who_boys_weight_age = [
-    { "x": 0, "y": 2.603994, "z": "5th" },
-    { "x": 1, "y": 3.566165, "z": "5th" },
-    { "x": 2, "y": 4.522344, "z": "5th" },
-    { "x": 3, "y": 5.240269, "z": "5th" },
-    { "x": 4, "y": 5.797135, "z": "5th" },
-    { "x": 5, "y": 6.244465, "z": "5th" },
-    { "x": 6, "y": 6.611702, "z": "5th" },
-    { "x": 7, "y": 6.922131, "z": "5th" },
-    { "x": 8, "y": 7.19127, "z": "5th" },
-    { "x": 9, "y": 7.431644, "z": "5th" },
-    { "x": 10, "y": 7.651572, "z": "5th" },
-    { "x": 11, "y": 7.857229, "z": "5th" },
-    { "x": 12, "y": 8.052577, "z": "5th" },
-    { "x": 13, "y": 8.239848, "z": "5th" },
-    { "x": 14, "y": 8.421033, "z": "5th" },
-    { "x": 15, "y": 8.597424, "z": "5th" },
-    { "x": 16, "y": 8.770274, "z": "5th" },
-    { "x": 17, "y": 8.939942, "z": "5th" },
-    { "x": 18, "y": 9.107002, "z": "5th" },
-    { "x": 19, "y": 9.27136, "z": "5th" },
-    { "x": 20, "y": 9.434095, "z": "5th" },
-    { "x": 21, "y": 9.595435, "z": "5th" },
-    { "x": 22, "y": 9.755556, "z": "5th" },
-    { "x": 23, "y": 9.914417, "z": "5th" },
-    { "x": 24, "y": 10.07194, "z": "5th" },
-    { "x": 0, "y": 2.757621, "z": "10th" },
-    { "x": 1, "y": 3.752603, "z": "10th" },
-    { "x": 2, "y": 4.738362, "z": "10th" },
-    { "x": 3, "y": 5.475519, "z": "10th" },
-    { "x": 4, "y": 6.046988, "z": "10th" },
-    { "x": 5, "y": 6.507016, "z": "10th" },
-    { "x": 6, "y": 6.885864, "z": "10th" },
-    { "x": 7, "y": 7.207057, "z": "10th" },
-    { "x": 8, "y": 7.486158, "z": "10th" },
-    { "x": 9, "y": 7.735837, "z": "10th" },
-    { "x": 10, "y": 7.964565, "z": "10th" },
-    { "x": 11, "y": 8.178615, "z": "10th" },
-    { "x": 12, "y": 8.382077, "z": "10th" },
-    { "x": 13, "y": 8.577324, "z": "10th" },
-    { "x": 14, "y": 8.76637, "z": "10th" },
-    { "x": 15, "y": 8.950586, "z": "10th" },
-    { "x": 16, "y": 9.13126, "z": "10th" },
-    { "x": 17, "y": 9.308795, "z": "10th" },
-    { "x": 18, "y": 9.483736, "z": "10th" },
-    { "x": 19, "y": 9.656076, "z": "10th" },
-    { "x": 20, "y": 9.826848, "z": "10th" },
-    { "x": 21, "y": 9.996335, "z": "10th" },
-    { "x": 22, "y": 10.16471, "z": "10th" },
-    { "x": 23, "y": 10.33191, "z": "10th" },
-    { "x": 24, "y": 10.49784, "z": "10th" },
-    { "x": 0, "y": 3.027282, "z": "25th" },
-    { "x": 1, "y": 4.080792, "z": "25th" },
-    { "x": 2, "y": 5.117754, "z": "25th" },
-    { "x": 3, "y": 5.888058, "z": "25th" },
-    { "x": 4, "y": 6.484777, "z": "25th" },
-    { "x": 5, "y": 6.966941, "z": "25th" },
-    { "x": 6, "y": 7.366195, "z": "25th" },
-    { "x": 7, "y": 7.706413, "z": "25th" },
-    { "x": 8, "y": 8.003205, "z": "25th" },
-    { "x": 9, "y": 8.26946, "z": "25th" },
-    { "x": 10, "y": 8.5139, "z": "25th" },
-    { "x": 11, "y": 8.742959, "z": "25th" },
-    { "x": 12, "y": 8.960956, "z": "25th" },
-    { "x": 13, "y": 9.170505, "z": "25th" },
-    { "x": 14, "y": 9.373665, "z": "25th" },
-    { "x": 15, "y": 9.571948, "z": "25th" },
-    { "x": 16, "y": 9.7667, "z": "25th" },
-    { "x": 17, "y": 9.958406, "z": "25th" },
-    { "x": 18, "y": 10.14755, "z": "25th" },
-    { "x": 19, "y": 10.33431, "z": "25th" },
-    { "x": 20, "y": 10.51961, "z": "25th" },
-    { "x": 21, "y": 10.70383, "z": "25th" },
-    { "x": 22, "y": 10.88716, "z": "25th" },
-    { "x": 23, "y": 11.06946, "z": "25th" },
-    { "x": 24, "y": 11.25065, "z": "25th" },
-    { "x": 0, "y": 3.3464, "z": "50th" },
-    { "x": 1, "y": 4.4709, "z": "50th" },
-    { "x": 2, "y": 5.5675, "z": "50th" },
-    { "x": 3, "y": 6.3762, "z": "50th" },
-    { "x": 4, "y": 7.0023, "z": "50th" },
-    { "x": 5, "y": 7.5105, "z": "50th" },
-    { "x": 6, "y": 7.934, "z": "50th" },
-    { "x": 7, "y": 8.297, "z": "50th" },
-    { "x": 8, "y": 8.6151, "z": "50th" },
-    { "x": 9, "y": 8.9014, "z": "50th" },
-    { "x": 10, "y": 9.1649, "z": "50th" },
-    { "x": 11, "y": 9.4122, "z": "50th" },
-    { "x": 12, "y": 9.6479, "z": "50th" },
-    { "x": 13, "y": 9.8749, "z": "50th" },
-    { "x": 14, "y": 10.0953, "z": "50th" },
-    { "x": 15, "y": 10.3108, "z": "50th" },
-    { "x": 16, "y": 10.5228, "z": "50th" },
-    { "x": 17, "y": 10.7319, "z": "50th" },
-    { "x": 18, "y": 10.9385, "z": "50th" },
-    { "x": 19, "y": 11.143, "z": "50th" },
-    { "x": 20, "y": 11.3462, "z": "50th" },
-    { "x": 21, "y": 11.5486, "z": "50th" },
-    { "x": 22, "y": 11.7504, "z": "50th" },
-    { "x": 23, "y": 11.9514, "z": "50th" },
-    { "x": 24, "y": 12.1515, "z": "50th" },
-    { "x": 0, "y": 3.686659, "z": "75th" },
-    { "x": 1, "y": 4.889123, "z": "75th" },
-    { "x": 2, "y": 6.048448, "z": "75th" },
-    { "x": 3, "y": 6.897306, "z": "75th" },
-    { "x": 4, "y": 7.554286, "z": "75th" },
-    { "x": 5, "y": 8.090161, "z": "75th" },
-    { "x": 6, "y": 8.539707, "z": "75th" },
-    { "x": 7, "y": 8.927371, "z": "75th" },
-    { "x": 8, "y": 9.268678, "z": "75th" },
-    { "x": 9, "y": 9.5769, "z": "75th" },
-    { "x": 10, "y": 9.861313, "z": "75th" },
-    { "x": 11, "y": 10.12867, "z": "75th" },
-    { "x": 12, "y": 10.38387, "z": "75th" },
-    { "x": 13, "y": 10.63014, "z": "75th" },
-    { "x": 14, "y": 10.86959, "z": "75th" },
-    { "x": 15, "y": 11.10416, "z": "75th" },
-    { "x": 16, "y": 11.33528, "z": "75th" },
-    { "x": 17, "y": 11.5637, "z": "75th" },
-    { "x": 18, "y": 11.7897, "z": "75th" },
-    { "x": 19, "y": 12.01396, "z": "75th" },
-    { "x": 20, "y": 12.23713, "z": "75th" },
-    { "x": 21, "y": 12.45983, "z": "75th" },
-    { "x": 22, "y": 12.6823, "z": "75th" },
-    { "x": 23, "y": 12.90424, "z": "75th" },
-    { "x": 24, "y": 13.12555, "z": "75th" },
-    { "x": 0, "y": 4.011499, "z": "90th" },
-    { "x": 1, "y": 5.290726, "z": "90th" },
-    { "x": 2, "y": 6.509323, "z": "90th" },
-    { "x": 3, "y": 7.395936, "z": "90th" },
-    { "x": 4, "y": 8.082087, "z": "90th" },
-    { "x": 5, "y": 8.644384, "z": "90th" },
-    { "x": 6, "y": 9.119041, "z": "90th" },
-    { "x": 7, "y": 9.530656, "z": "90th" },
-    { "x": 8, "y": 9.894622, "z": "90th" },
-    { "x": 9, "y": 10.22433, "z": "90th" },
-    { "x": 10, "y": 10.5293, "z": "90th" },
-    { "x": 11, "y": 10.81641, "z": "90th" },
-    { "x": 12, "y": 11.09087, "z": "90th" },
-    { "x": 13, "y": 11.35618, "z": "90th" },
-    { "x": 14, "y": 11.61449, "z": "90th" },
-    { "x": 15, "y": 11.86797, "z": "90th" },
-    { "x": 16, "y": 12.11808, "z": "90th" },
-    { "x": 17, "y": 12.36571, "z": "90th" },
-    { "x": 18, "y": 12.61101, "z": "90th" },
-    { "x": 19, "y": 12.855, "z": "90th" },
-    { "x": 20, "y": 13.09811, "z": "90th" },
-    { "x": 21, "y": 13.3411, "z": "90th" },
-    { "x": 22, "y": 13.58426, "z": "90th" },
-    { "x": 23, "y": 13.82718, "z": "90th" },
-    { "x": 24, "y": 14.06979, "z": "90th" },
-    { "x": 0, "y": 4.214527, "z": "95th" },
-    { "x": 1, "y": 5.542933, "z": "95th" },
-    { "x": 2, "y": 6.798348, "z": "95th" },
-    { "x": 3, "y": 7.708329, "z": "95th" },
-    { "x": 4, "y": 8.412602, "z": "95th" },
-    { "x": 5, "y": 8.991445, "z": "95th" },
-    { "x": 6, "y": 9.481939, "z": "95th" },
-    { "x": 7, "y": 9.908738, "z": "95th" },
-    { "x": 8, "y": 10.28713, "z": "95th" },
-    { "x": 9, "y": 10.63055, "z": "95th" },
-    { "x": 10, "y": 10.94868, "z": "95th" },
-    { "x": 11, "y": 11.24845, "z": "95th" },
-    { "x": 12, "y": 11.53526, "z": "95th" },
-    { "x": 13, "y": 11.81281, "z": "95th" },
-    { "x": 14, "y": 12.08325, "z": "95th" },
-    { "x": 15, "y": 12.34891, "z": "95th" },
-    { "x": 16, "y": 12.61125, "z": "95th" },
-    { "x": 17, "y": 12.87128, "z": "95th" },
-    { "x": 18, "y": 13.12906, "z": "95th" },
-    { "x": 19, "y": 13.38579, "z": "95th" },
-    { "x": 20, "y": 13.64181, "z": "95th" },
-    { "x": 21, "y": 13.89795, "z": "95th" },
-    { "x": 22, "y": 14.15453, "z": "95th" },
-    { "x": 23, "y": 14.41108, "z": "95th" },
-    { "x": 24, "y": 14.66753, "z": "95th" },
-    { "x": 0, "y": 4.419354, "z": "98th" },
-    { "x": 1, "y": 5.798331, "z": "98th" },
-    { "x": 2, "y": 7.090758, "z": "98th" },
-    { "x": 3, "y": 8.024169, "z": "98th" },
-    { "x": 4, "y": 8.746662, "z": "98th" },
-    { "x": 5, "y": 9.342238, "z": "98th" },
-    { "x": 6, "y": 9.848832, "z": "98th" },
-    { "x": 7, "y": 10.29113, "z": "98th" },
-    { "x": 8, "y": 10.68428, "z": "98th" },
-    { "x": 9, "y": 11.04177, "z": "98th" },
-    { "x": 10, "y": 11.37341, "z": "98th" },
-    { "x": 11, "y": 11.6862, "z": "98th" },
-    { "x": 12, "y": 11.98574, "z": "98th" },
-    { "x": 13, "y": 12.27589, "z": "98th" },
-    { "x": 14, "y": 12.55884, "z": "98th" },
-    { "x": 15, "y": 12.83707, "z": "98th" },
-    { "x": 16, "y": 13.11206, "z": "98th" },
-    { "x": 17, "y": 13.38491, "z": "98th" },
-    { "x": 18, "y": 13.65558, "z": "98th" },
-    { "x": 19, "y": 13.92552, "z": "98th" },
-    { "x": 20, "y": 14.19492, "z": "98th" },
-    { "x": 21, "y": 14.46469, "z": "98th" },
-    { "x": 22, "y": 14.7352, "z": "98th" },
-    { "x": 23, "y": 15.0059, "z": "98th" },
-    { "x": 24, "y": 15.27674, "z": "98th"}
-]
\ No newline at end of file
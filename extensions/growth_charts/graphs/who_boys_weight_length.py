@@ -1,1050 +0,0 @@
-who_boys_weight_length = [
-    { "x": 45, "y": 2.106981, "z": "5th"},
-    { "x": 45.5, "y": 2.179956, "z": "5th" },
-    { "x": 46, "y": 2.252911, "z": "5th" },
-    { "x": 46.5, "y": 2.326226, "z": "5th" },
-    { "x": 47, "y": 2.400092, "z": "5th" },
-    { "x": 47.5, "y": 2.475063, "z": "5th" },
-    { "x": 48, "y": 2.551572, "z": "5th" },
-    { "x": 48.5, "y": 2.630444, "z": "5th" },
-    { "x": 49, "y": 2.712292, "z": "5th" },
-    { "x": 49.5, "y": 2.79742, "z": "5th" },
-    { "x": 50, "y": 2.885574, "z": "5th" },
-    { "x": 50.5, "y": 2.976497, "z": "5th" },
-    { "x": 51, "y": 3.070327, "z": "5th" },
-    { "x": 51.5, "y": 3.167371, "z": "5th" },
-    { "x": 52, "y": 3.268154, "z": "5th" },
-    { "x": 52.5, "y": 3.373464, "z": "5th" },
-    { "x": 53, "y": 3.483394, "z": "5th" },
-    { "x": 53.5, "y": 3.597603, "z": "5th" },
-    { "x": 54, "y": 3.715835, "z": "5th" },
-    { "x": 54.5, "y": 3.837139, "z": "5th" },
-    { "x": 55, "y": 3.960933, "z": "5th" },
-    { "x": 55.5, "y": 4.086931, "z": "5th" },
-    { "x": 56, "y": 4.214808, "z": "5th" },
-    { "x": 56.5, "y": 4.343844, "z": "5th" },
-    { "x": 57, "y": 4.473289, "z": "5th" },
-    { "x": 57.5, "y": 4.602751, "z": "5th" },
-    { "x": 58, "y": 4.731982, "z": "5th" },
-    { "x": 58.5, "y": 4.860627, "z": "5th" },
-    { "x": 59, "y": 4.988415, "z": "5th" },
-    { "x": 59.5, "y": 5.114823, "z": "5th" },
-    { "x": 60, "y": 5.239396, "z": "5th" },
-    { "x": 60.5, "y": 5.36134, "z": "5th" },
-    { "x": 61, "y": 5.480644, "z": "5th" },
-    { "x": 61.5, "y": 5.597732, "z": "5th" },
-    { "x": 62, "y": 5.71242, "z": "5th" },
-    { "x": 62.5, "y": 5.825317, "z": "5th" },
-    { "x": 63, "y": 5.936584, "z": "5th" },
-    { "x": 63.5, "y": 6.046305, "z": "5th" },
-    { "x": 64, "y": 6.15465, "z": "5th" },
-    { "x": 64.5, "y": 6.261515, "z": "5th" },
-    { "x": 65, "y": 6.367164, "z": "5th" },
-    { "x": 65.5, "y": 6.471767, "z": "5th" },
-    { "x": 66, "y": 6.57548, "z": "5th" },
-    { "x": 66.5, "y": 6.678396, "z": "5th" },
-    { "x": 67, "y": 6.78051, "z": "5th" },
-    { "x": 67.5, "y": 6.881819, "z": "5th" },
-    { "x": 68, "y": 6.982208, "z": "5th" },
-    { "x": 68.5, "y": 7.082064, "z": "5th" },
-    { "x": 69, "y": 7.181539, "z": "5th" },
-    { "x": 69.5, "y": 7.2806, "z": "5th" },
-    { "x": 70, "y": 7.379471, "z": "5th" },
-    { "x": 70.5, "y": 7.477858, "z": "5th" },
-    { "x": 71, "y": 7.575438, "z": "5th" },
-    { "x": 71.5, "y": 7.672178, "z": "5th" },
-    { "x": 72, "y": 7.768056, "z": "5th" },
-    { "x": 72.5, "y": 7.862618, "z": "5th" },
-    { "x": 73, "y": 7.956055, "z": "5th" },
-    { "x": 73.5, "y": 8.048159, "z": "5th" },
-    { "x": 74, "y": 8.138929, "z": "5th" },
-    { "x": 74.5, "y": 8.228845, "z": "5th" },
-    { "x": 75, "y": 8.317519, "z": "5th" },
-    { "x": 75.5, "y": 8.405039, "z": "5th" },
-    { "x": 76, "y": 8.491054, "z": "5th" },
-    { "x": 76.5, "y": 8.575747, "z": "5th" },
-    { "x": 77, "y": 8.658991, "z": "5th" },
-    { "x": 77.5, "y": 8.740739, "z": "5th" },
-    { "x": 78, "y": 8.821532, "z": "5th" },
-    { "x": 78.5, "y": 8.9015, "z": "5th" },
-    { "x": 79, "y": 8.981224, "z": "5th" },
-    { "x": 79.5, "y": 9.061183, "z": "5th" },
-    { "x": 80, "y": 9.142137, "z": "5th" },
-    { "x": 80.5, "y": 9.22453, "z": "5th" },
-    { "x": 81, "y": 9.308575, "z": "5th" },
-    { "x": 81.5, "y": 9.394803, "z": "5th" },
-    { "x": 82, "y": 9.483891, "z": "5th" },
-    { "x": 82.5, "y": 9.575937, "z": "5th" },
-    { "x": 83, "y": 9.671326, "z": "5th" },
-    { "x": 83.5, "y": 9.770064, "z": "5th" },
-    { "x": 84, "y": 9.871983, "z": "5th" },
-    { "x": 84.5, "y": 9.976826, "z": "5th" },
-    { "x": 85, "y": 10.08383, "z": "5th" },
-    { "x": 85.5, "y": 10.19289, "z": "5th" },
-    { "x": 86, "y": 10.30333, "z": "5th" },
-    { "x": 86.5, "y": 10.41437, "z": "5th" },
-    { "x": 87, "y": 10.52582, "z": "5th" },
-    { "x": 87.5, "y": 10.63682, "z": "5th" },
-    { "x": 88, "y": 10.74717, "z": "5th" },
-    { "x": 88.5, "y": 10.85661, "z": "5th" },
-    { "x": 89, "y": 10.96496, "z": "5th" },
-    { "x": 89.5, "y": 11.0723, "z": "5th" },
-    { "x": 90, "y": 11.17826, "z": "5th" },
-    { "x": 90.5, "y": 11.28346, "z": "5th" },
-    { "x": 91, "y": 11.38761, "z": "5th" },
-    { "x": 91.5, "y": 11.49143, "z": "5th" },
-    { "x": 92, "y": 11.59427, "z": "5th" },
-    { "x": 92.5, "y": 11.69667, "z": "5th" },
-    { "x": 93, "y": 11.79879, "z": "5th" },
-    { "x": 93.5, "y": 11.90063, "z": "5th" },
-    { "x": 94, "y": 12.00234, "z": "5th" },
-    { "x": 94.5, "y": 12.10437, "z": "5th" },
-    { "x": 95, "y": 12.2069, "z": "5th" },
-    { "x": 95.5, "y": 12.30989, "z": "5th" },
-    { "x": 96, "y": 12.41361, "z": "5th" },
-    { "x": 96.5, "y": 12.51852, "z": "5th" },
-    { "x": 97, "y": 12.62446, "z": "5th" },
-    { "x": 97.5, "y": 12.73194, "z": "5th" },
-    { "x": 98, "y": 12.8409, "z": "5th" },
-    { "x": 98.5, "y": 12.95136, "z": "5th" },
-    { "x": 99, "y": 13.06348, "z": "5th" },
-    { "x": 99.5, "y": 13.17696, "z": "5th" },
-    { "x": 100, "y": 13.292, "z": "5th" },
-    { "x": 100.5, "y": 13.40842, "z": "5th" },
-    { "x": 101, "y": 13.5263, "z": "5th" },
-    { "x": 101.5, "y": 13.64546, "z": "5th" },
-    { "x": 102, "y": 13.76597, "z": "5th" },
-    { "x": 102.5, "y": 13.88796, "z": "5th" },
-    { "x": 103, "y": 14.01121, "z": "5th" },
-    { "x": 103.5, "y": 14.13562, "z": "5th" },
-    { "x": 104, "y": 14.26132, "z": "5th" },
-    { "x": 104.5, "y": 14.38817, "z": "5th" },
-    { "x": 105, "y": 14.51631, "z": "5th" },
-    { "x": 105.5, "y": 14.6459, "z": "5th" },
-    { "x": 106, "y": 14.77663, "z": "5th" },
-    { "x": 106.5, "y": 14.90889, "z": "5th" },
-    { "x": 107, "y": 15.0426, "z": "5th" },
-    { "x": 107.5, "y": 15.17728, "z": "5th" },
-    { "x": 108, "y": 15.31363, "z": "5th" },
-    { "x": 108.5, "y": 15.45136, "z": "5th" },
-    { "x": 109, "y": 15.59077, "z": "5th" },
-    { "x": 109.5, "y": 15.7318, "z": "5th" },
-    { "x": 110, "y": 15.87468, "z": "5th" },
-    { "x": 45, "y": 2.175173, "z": "10th"},
-    { "x": 45.5, "y": 2.250293, "z": "10th" },
-    { "x": 46, "y": 2.325378, "z": "10th" },
-    { "x": 46.5, "y": 2.400814, "z": "10th" },
-    { "x": 47, "y": 2.47681, "z": "10th" },
-    { "x": 47.5, "y": 2.553931, "z": "10th" },
-    { "x": 48, "y": 2.632625, "z": "10th" },
-    { "x": 48.5, "y": 2.713732, "z": "10th" },
-    { "x": 49, "y": 2.797902, "z": "10th" },
-    { "x": 49.5, "y": 2.88544, "z": "10th" },
-    { "x": 50, "y": 2.976081, "z": "10th" },
-    { "x": 50.5, "y": 3.06956, "z": "10th" },
-    { "x": 51, "y": 3.166008, "z": "10th" },
-    { "x": 51.5, "y": 3.26575, "z": "10th" },
-    { "x": 52, "y": 3.369328, "z": "10th" },
-    { "x": 52.5, "y": 3.477551, "z": "10th" },
-    { "x": 53, "y": 3.590514, "z": "10th" },
-    { "x": 53.5, "y": 3.707865, "z": "10th" },
-    { "x": 54, "y": 3.829338, "z": "10th" },
-    { "x": 54.5, "y": 3.953952, "z": "10th" },
-    { "x": 55, "y": 4.081121, "z": "10th" },
-    { "x": 55.5, "y": 4.210535, "z": "10th" },
-    { "x": 56, "y": 4.341875, "z": "10th" },
-    { "x": 56.5, "y": 4.474383, "z": "10th" },
-    { "x": 57, "y": 4.607318, "z": "10th" },
-    { "x": 57.5, "y": 4.740248, "z": "10th" },
-    { "x": 58, "y": 4.872933, "z": "10th" },
-    { "x": 58.5, "y": 5.005008, "z": "10th" },
-    { "x": 59, "y": 5.136198, "z": "10th" },
-    { "x": 59.5, "y": 5.265982, "z": "10th" },
-    { "x": 60, "y": 5.393876, "z": "10th" },
-    { "x": 60.5, "y": 5.519084, "z": "10th" },
-    { "x": 61, "y": 5.641597, "z": "10th" },
-    { "x": 61.5, "y": 5.761815, "z": "10th" },
-    { "x": 62, "y": 5.87961, "z": "10th" },
-    { "x": 62.5, "y": 5.99555, "z": "10th" },
-    { "x": 63, "y": 6.109844, "z": "10th" },
-    { "x": 63.5, "y": 6.22256, "z": "10th" },
-    { "x": 64, "y": 6.333872, "z": "10th" },
-    { "x": 64.5, "y": 6.443698, "z": "10th" },
-    { "x": 65, "y": 6.55229, "z": "10th" },
-    { "x": 65.5, "y": 6.659823, "z": "10th" },
-    { "x": 66, "y": 6.766481, "z": "10th" },
-    { "x": 66.5, "y": 6.872341, "z": "10th" },
-    { "x": 67, "y": 6.977398, "z": "10th" },
-    { "x": 67.5, "y": 7.081648, "z": "10th" },
-    { "x": 68, "y": 7.185, "z": "10th" },
-    { "x": 68.5, "y": 7.287805, "z": "10th" },
-    { "x": 69, "y": 7.390244, "z": "10th" },
-    { "x": 69.5, "y": 7.492309, "z": "10th" },
-    { "x": 70, "y": 7.594181, "z": "10th" },
-    { "x": 70.5, "y": 7.695586, "z": "10th" },
-    { "x": 71, "y": 7.796163, "z": "10th" },
-    { "x": 71.5, "y": 7.895907, "z": "10th" },
-    { "x": 72, "y": 7.994741, "z": "10th" },
-    { "x": 72.5, "y": 8.092279, "z": "10th" },
-    { "x": 73, "y": 8.188637, "z": "10th" },
-    { "x": 73.5, "y": 8.283627, "z": "10th" },
-    { "x": 74, "y": 8.377249, "z": "10th" },
-    { "x": 74.5, "y": 8.469968, "z": "10th" },
-    { "x": 75, "y": 8.561412, "z": "10th" },
-    { "x": 75.5, "y": 8.651671, "z": "10th" },
-    { "x": 76, "y": 8.740385, "z": "10th" },
-    { "x": 76.5, "y": 8.827684, "z": "10th" },
-    { "x": 77, "y": 8.913462, "z": "10th" },
-    { "x": 77.5, "y": 8.997703, "z": "10th" },
-    { "x": 78, "y": 9.080901, "z": "10th" },
-    { "x": 78.5, "y": 9.16322, "z": "10th" },
-    { "x": 79, "y": 9.245227, "z": "10th" },
-    { "x": 79.5, "y": 9.327443, "z": "10th" },
-    { "x": 80, "y": 9.410618, "z": "10th" },
-    { "x": 80.5, "y": 9.495209, "z": "10th" },
-    { "x": 81, "y": 9.581465, "z": "10th" },
-    { "x": 81.5, "y": 9.669929, "z": "10th" },
-    { "x": 82, "y": 9.761267, "z": "10th" },
-    { "x": 82.5, "y": 9.855578, "z": "10th" },
-    { "x": 83, "y": 9.953286, "z": "10th" },
-    { "x": 83.5, "y": 10.0544, "z": "10th" },
-    { "x": 84, "y": 10.15874, "z": "10th" },
-    { "x": 84.5, "y": 10.26604, "z": "10th" },
-    { "x": 85, "y": 10.37556, "z": "10th" },
-    { "x": 85.5, "y": 10.48714, "z": "10th" },
-    { "x": 86, "y": 10.60013, "z": "10th" },
-    { "x": 86.5, "y": 10.71376, "z": "10th" },
-    { "x": 87, "y": 10.8278, "z": "10th" },
-    { "x": 87.5, "y": 10.94143, "z": "10th" },
-    { "x": 88, "y": 11.05443, "z": "10th" },
-    { "x": 88.5, "y": 11.16651, "z": "10th" },
-    { "x": 89, "y": 11.27754, "z": "10th" },
-    { "x": 89.5, "y": 11.38755, "z": "10th" },
-    { "x": 90, "y": 11.49627, "z": "10th" },
-    { "x": 90.5, "y": 11.60418, "z": "10th" },
-    { "x": 91, "y": 11.71114, "z": "10th" },
-    { "x": 91.5, "y": 11.81775, "z": "10th" },
-    { "x": 92, "y": 11.92347, "z": "10th" },
-    { "x": 92.5, "y": 12.02877, "z": "10th" },
-    { "x": 93, "y": 12.13384, "z": "10th" },
-    { "x": 93.5, "y": 12.23869, "z": "10th" },
-    { "x": 94, "y": 12.3435, "z": "10th" },
-    { "x": 94.5, "y": 12.44868, "z": "10th" },
-    { "x": 95, "y": 12.55442, "z": "10th" },
-    { "x": 95.5, "y": 12.66072, "z": "10th" },
-    { "x": 96, "y": 12.76787, "z": "10th" },
-    { "x": 96.5, "y": 12.87624, "z": "10th" },
-    { "x": 97, "y": 12.98583, "z": "10th" },
-    { "x": 97.5, "y": 13.097, "z": "10th" },
-    { "x": 98, "y": 13.20979, "z": "10th" },
-    { "x": 98.5, "y": 13.32417, "z": "10th" },
-    { "x": 99, "y": 13.44033, "z": "10th" },
-    { "x": 99.5, "y": 13.55799, "z": "10th" },
-    { "x": 100, "y": 13.67733, "z": "10th" },
-    { "x": 100.5, "y": 13.79814, "z": "10th" },
-    { "x": 101, "y": 13.92051, "z": "10th" },
-    { "x": 101.5, "y": 14.04427, "z": "10th" },
-    { "x": 102, "y": 14.16948, "z": "10th" },
-    { "x": 102.5, "y": 14.29624, "z": "10th" },
-    { "x": 103, "y": 14.42437, "z": "10th" },
-    { "x": 103.5, "y": 14.55376, "z": "10th" },
-    { "x": 104, "y": 14.6845, "z": "10th" },
-    { "x": 104.5, "y": 14.8165, "z": "10th" },
-    { "x": 105, "y": 14.94985, "z": "10th" },
-    { "x": 105.5, "y": 15.08472, "z": "10th" },
-    { "x": 106, "y": 15.22084, "z": "10th" },
-    { "x": 106.5, "y": 15.35856, "z": "10th" },
-    { "x": 107, "y": 15.4978, "z": "10th" },
-    { "x": 107.5, "y": 15.63817, "z": "10th" },
-    { "x": 108, "y": 15.78024, "z": "10th" },
-    { "x": 108.5, "y": 15.92381, "z": "10th" },
-    { "x": 109, "y": 16.06914, "z": "10th" },
-    { "x": 109.5, "y": 16.21622, "z": "10th" },
-    { "x": 110, "y": 16.36525, "z": "10th" },
-    { "x": 45, "y": 2.295939, "z": "25th"},
-    { "x": 45.5, "y": 2.374837, "z": "25th" },
-    { "x": 46, "y": 2.453671, "z": "25th" },
-    { "x": 46.5, "y": 2.532835, "z": "25th" },
-    { "x": 47, "y": 2.612577, "z": "25th" },
-    { "x": 47.5, "y": 2.69348, "z": "25th" },
-    { "x": 48, "y": 2.776015, "z": "25th" },
-    { "x": 48.5, "y": 2.861048, "z": "25th" },
-    { "x": 49, "y": 2.949299, "z": "25th" },
-    { "x": 49.5, "y": 3.04107, "z": "25th" },
-    { "x": 50, "y": 3.13608, "z": "25th" },
-    { "x": 50.5, "y": 3.234048, "z": "25th" },
-    { "x": 51, "y": 3.335092, "z": "25th" },
-    { "x": 51.5, "y": 3.439571, "z": "25th" },
-    { "x": 52, "y": 3.548053, "z": "25th" },
-    { "x": 52.5, "y": 3.661388, "z": "25th" },
-    { "x": 53, "y": 3.779675, "z": "25th" },
-    { "x": 53.5, "y": 3.902538, "z": "25th" },
-    { "x": 54, "y": 4.029697, "z": "25th" },
-    { "x": 54.5, "y": 4.160116, "z": "25th" },
-    { "x": 55, "y": 4.293202, "z": "25th" },
-    { "x": 55.5, "y": 4.428606, "z": "25th" },
-    { "x": 56, "y": 4.566015, "z": "25th" },
-    { "x": 56.5, "y": 4.704609, "z": "25th" },
-    { "x": 57, "y": 4.843662, "z": "25th" },
-    { "x": 57.5, "y": 4.982669, "z": "25th" },
-    { "x": 58, "y": 5.121406, "z": "25th" },
-    { "x": 58.5, "y": 5.259492, "z": "25th" },
-    { "x": 59, "y": 5.39664, "z": "25th" },
-    { "x": 59.5, "y": 5.532339, "z": "25th" },
-    { "x": 60, "y": 5.666051, "z": "25th" },
-    { "x": 60.5, "y": 5.796979, "z": "25th" },
-    { "x": 61, "y": 5.925116, "z": "25th" },
-    { "x": 61.5, "y": 6.05082, "z": "25th" },
-    { "x": 62, "y": 6.174063, "z": "25th" },
-    { "x": 62.5, "y": 6.29534, "z": "25th" },
-    { "x": 63, "y": 6.414944, "z": "25th" },
-    { "x": 63.5, "y": 6.532913, "z": "25th" },
-    { "x": 64, "y": 6.649434, "z": "25th" },
-    { "x": 64.5, "y": 6.764459, "z": "25th" },
-    { "x": 65, "y": 6.87822, "z": "25th" },
-    { "x": 65.5, "y": 6.990901, "z": "25th" },
-    { "x": 66, "y": 7.102739, "z": "25th" },
-    { "x": 66.5, "y": 7.213776, "z": "25th" },
-    { "x": 67, "y": 7.324011, "z": "25th" },
-    { "x": 67.5, "y": 7.43344, "z": "25th" },
-    { "x": 68, "y": 7.542013, "z": "25th" },
-    { "x": 68.5, "y": 7.650014, "z": "25th" },
-    { "x": 69, "y": 7.757678, "z": "25th" },
-    { "x": 69.5, "y": 7.865043, "z": "25th" },
-    { "x": 70, "y": 7.972213, "z": "25th" },
-    { "x": 70.5, "y": 8.078943, "z": "25th" },
-    { "x": 71, "y": 8.184813, "z": "25th" },
-    { "x": 71.5, "y": 8.289862, "z": "25th" },
-    { "x": 72, "y": 8.393916, "z": "25th" },
-    { "x": 72.5, "y": 8.496715, "z": "25th" },
-    { "x": 73, "y": 8.598234, "z": "25th" },
-    { "x": 73.5, "y": 8.698324, "z": "25th" },
-    { "x": 74, "y": 8.796986, "z": "25th" },
-    { "x": 74.5, "y": 8.894657, "z": "25th" },
-    { "x": 75, "y": 8.990996, "z": "25th" },
-    { "x": 75.5, "y": 9.086097, "z": "25th" },
-    { "x": 76, "y": 9.179582, "z": "25th" },
-    { "x": 76.5, "y": 9.27148, "z": "25th" },
-    { "x": 77, "y": 9.361732, "z": "25th" },
-    { "x": 77.5, "y": 9.450372, "z": "25th" },
-    { "x": 78, "y": 9.537811, "z": "25th" },
-    { "x": 78.5, "y": 9.624271, "z": "25th" },
-    { "x": 79, "y": 9.710293, "z": "25th" },
-    { "x": 79.5, "y": 9.796476, "z": "25th" },
-    { "x": 80, "y": 9.88355, "z": "25th" },
-    { "x": 80.5, "y": 9.971992, "z": "25th" },
-    { "x": 81, "y": 10.06212, "z": "25th" },
-    { "x": 81.5, "y": 10.15449, "z": "25th" },
-    { "x": 82, "y": 10.24976, "z": "25th" },
-    { "x": 82.5, "y": 10.34802, "z": "25th" },
-    { "x": 83, "y": 10.44977, "z": "25th" },
-    { "x": 83.5, "y": 10.55502, "z": "25th" },
-    { "x": 84, "y": 10.66357, "z": "25th" },
-    { "x": 84.5, "y": 10.77516, "z": "25th" },
-    { "x": 85, "y": 10.88904, "z": "25th" },
-    { "x": 85.5, "y": 11.00501, "z": "25th" },
-    { "x": 86, "y": 11.12243, "z": "25th" },
-    { "x": 86.5, "y": 11.24056, "z": "25th" },
-    { "x": 87, "y": 11.3591, "z": "25th" },
-    { "x": 87.5, "y": 11.47732, "z": "25th" },
-    { "x": 88, "y": 11.59491, "z": "25th" },
-    { "x": 88.5, "y": 11.7116, "z": "25th" },
-    { "x": 89, "y": 11.8273, "z": "25th" },
-    { "x": 89.5, "y": 11.94199, "z": "25th" },
-    { "x": 90, "y": 12.05551, "z": "25th" },
-    { "x": 90.5, "y": 12.16819, "z": "25th" },
-    { "x": 91, "y": 12.28006, "z": "25th" },
-    { "x": 91.5, "y": 12.39156, "z": "25th" },
-    { "x": 92, "y": 12.50235, "z": "25th" },
-    { "x": 92.5, "y": 12.61276, "z": "25th" },
-    { "x": 93, "y": 12.723, "z": "25th" },
-    { "x": 93.5, "y": 12.83317, "z": "25th" },
-    { "x": 94, "y": 12.94344, "z": "25th" },
-    { "x": 94.5, "y": 13.05418, "z": "25th" },
-    { "x": 95, "y": 13.16559, "z": "25th" },
-    { "x": 95.5, "y": 13.27776, "z": "25th" },
-    { "x": 96, "y": 13.39097, "z": "25th" },
-    { "x": 96.5, "y": 13.50549, "z": "25th" },
-    { "x": 97, "y": 13.62153, "z": "25th" },
-    { "x": 97.5, "y": 13.73924, "z": "25th" },
-    { "x": 98, "y": 13.85884, "z": "25th" },
-    { "x": 98.5, "y": 13.98021, "z": "25th" },
-    { "x": 99, "y": 14.10354, "z": "25th" },
-    { "x": 99.5, "y": 14.22865, "z": "25th" },
-    { "x": 100, "y": 14.35561, "z": "25th" },
-    { "x": 100.5, "y": 14.48425, "z": "25th" },
-    { "x": 101, "y": 14.61464, "z": "25th" },
-    { "x": 101.5, "y": 14.74659, "z": "25th" },
-    { "x": 102, "y": 14.88021, "z": "25th" },
-    { "x": 102.5, "y": 15.01548, "z": "25th" },
-    { "x": 103, "y": 15.15231, "z": "25th" },
-    { "x": 103.5, "y": 15.2906, "z": "25th" },
-    { "x": 104, "y": 15.43035, "z": "25th" },
-    { "x": 104.5, "y": 15.57155, "z": "25th" },
-    { "x": 105, "y": 15.71422, "z": "25th" },
-    { "x": 105.5, "y": 15.85853, "z": "25th" },
-    { "x": 106, "y": 16.00429, "z": "25th" },
-    { "x": 106.5, "y": 16.15179, "z": "25th" },
-    { "x": 107, "y": 16.30093, "z": "25th" },
-    { "x": 107.5, "y": 16.45149, "z": "25th" },
-    { "x": 108, "y": 16.60381, "z": "25th" },
-    { "x": 108.5, "y": 16.75783, "z": "25th" },
-    { "x": 109, "y": 16.91378, "z": "25th" },
-    { "x": 109.5, "y": 17.07172, "z": "25th" },
-    { "x": 110, "y": 17.23176, "z": "25th" },
-    { "x": 45, "y": 2.441, "z": "50th"},
-    { "x": 45.5, "y": 2.5244, "z": "50th" },
-    { "x": 46, "y": 2.6077, "z": "50th" },
-    { "x": 46.5, "y": 2.6913, "z": "50th" },
-    { "x": 47, "y": 2.7755, "z": "50th" },
-    { "x": 47.5, "y": 2.8609, "z": "50th" },
-    { "x": 48, "y": 2.948, "z": "50th" },
-    { "x": 48.5, "y": 3.0377, "z": "50th" },
-    { "x": 49, "y": 3.1308, "z": "50th" },
-    { "x": 49.5, "y": 3.2276, "z": "50th" },
-    { "x": 50, "y": 3.3278, "z": "50th" },
-    { "x": 50.5, "y": 3.4311, "z": "50th" },
-    { "x": 51, "y": 3.5376, "z": "50th" },
-    { "x": 51.5, "y": 3.6477, "z": "50th" },
-    { "x": 52, "y": 3.762, "z": "50th" },
-    { "x": 52.5, "y": 3.8814, "z": "50th" },
-    { "x": 53, "y": 4.006, "z": "50th" },
-    { "x": 53.5, "y": 4.1354, "z": "50th" },
-    { "x": 54, "y": 4.2693, "z": "50th" },
-    { "x": 54.5, "y": 4.4066, "z": "50th" },
-    { "x": 55, "y": 4.5467, "z": "50th" },
-    { "x": 55.5, "y": 4.6892, "z": "50th" },
-    { "x": 56, "y": 4.8338, "z": "50th" },
-    { "x": 56.5, "y": 4.9796, "z": "50th" },
-    { "x": 57, "y": 5.1259, "z": "50th" },
-    { "x": 57.5, "y": 5.2721, "z": "50th" },
-    { "x": 58, "y": 5.418, "z": "50th" },
-    { "x": 58.5, "y": 5.5632, "z": "50th" },
-    { "x": 59, "y": 5.7074, "z": "50th" },
-    { "x": 59.5, "y": 5.8501, "z": "50th" },
-    { "x": 60, "y": 5.9907, "z": "50th" },
-    { "x": 60.5, "y": 6.1284, "z": "50th" },
-    { "x": 61, "y": 6.2632, "z": "50th" },
-    { "x": 61.5, "y": 6.3954, "z": "50th" },
-    { "x": 62, "y": 6.5251, "z": "50th" },
-    { "x": 62.5, "y": 6.6527, "z": "50th" },
-    { "x": 63, "y": 6.7786, "z": "50th" },
-    { "x": 63.5, "y": 6.9028, "z": "50th" },
-    { "x": 64, "y": 7.0255, "z": "50th" },
-    { "x": 64.5, "y": 7.1467, "z": "50th" },
-    { "x": 65, "y": 7.2666, "z": "50th" },
-    { "x": 65.5, "y": 7.3854, "z": "50th" },
-    { "x": 66, "y": 7.5034, "z": "50th" },
-    { "x": 66.5, "y": 7.6206, "z": "50th" },
-    { "x": 67, "y": 7.737, "z": "50th" },
-    { "x": 67.5, "y": 7.8526, "z": "50th" },
-    { "x": 68, "y": 7.9674, "z": "50th" },
-    { "x": 68.5, "y": 8.0816, "z": "50th" },
-    { "x": 69, "y": 8.1955, "z": "50th" },
-    { "x": 69.5, "y": 8.3092, "z": "50th" },
-    { "x": 70, "y": 8.4227, "z": "50th" },
-    { "x": 70.5, "y": 8.5358, "z": "50th" },
-    { "x": 71, "y": 8.648, "z": "50th" },
-    { "x": 71.5, "y": 8.7594, "z": "50th" },
-    { "x": 72, "y": 8.8697, "z": "50th" },
-    { "x": 72.5, "y": 8.9788, "z": "50th" },
-    { "x": 73, "y": 9.0865, "z": "50th" },
-    { "x": 73.5, "y": 9.1927, "z": "50th" },
-    { "x": 74, "y": 9.2974, "z": "50th" },
-    { "x": 74.5, "y": 9.401, "z": "50th" },
-    { "x": 75, "y": 9.5032, "z": "50th" },
-    { "x": 75.5, "y": 9.6041, "z": "50th" },
-    { "x": 76, "y": 9.7033, "z": "50th" },
-    { "x": 76.5, "y": 9.8007, "z": "50th" },
-    { "x": 77, "y": 9.8963, "z": "50th" },
-    { "x": 77.5, "y": 9.9902, "z": "50th" },
-    { "x": 78, "y": 10.0827, "z": "50th" },
-    { "x": 78.5, "y": 10.1741, "z": "50th" },
-    { "x": 79, "y": 10.2649, "z": "50th" },
-    { "x": 79.5, "y": 10.3558, "z": "50th" },
-    { "x": 80, "y": 10.4475, "z": "50th" },
-    { "x": 80.5, "y": 10.5405, "z": "50th" },
-    { "x": 81, "y": 10.6352, "z": "50th" },
-    { "x": 81.5, "y": 10.7322, "z": "50th" },
-    { "x": 82, "y": 10.8321, "z": "50th" },
-    { "x": 82.5, "y": 10.935, "z": "50th" },
-    { "x": 83, "y": 11.0415, "z": "50th" },
-    { "x": 83.5, "y": 11.1516, "z": "50th" },
-    { "x": 84, "y": 11.2651, "z": "50th" },
-    { "x": 84.5, "y": 11.3817, "z": "50th" },
-    { "x": 85, "y": 11.5007, "z": "50th" },
-    { "x": 85.5, "y": 11.6218, "z": "50th" },
-    { "x": 86, "y": 11.7444, "z": "50th" },
-    { "x": 86.5, "y": 11.8678, "z": "50th" },
-    { "x": 87, "y": 11.9916, "z": "50th" },
-    { "x": 87.5, "y": 12.1152, "z": "50th" },
-    { "x": 88, "y": 12.2382, "z": "50th" },
-    { "x": 88.5, "y": 12.3603, "z": "50th" },
-    { "x": 89, "y": 12.4815, "z": "50th" },
-    { "x": 89.5, "y": 12.6017, "z": "50th" },
-    { "x": 90, "y": 12.7209, "z": "50th" },
-    { "x": 90.5, "y": 12.8392, "z": "50th" },
-    { "x": 91, "y": 12.9569, "z": "50th" },
-    { "x": 91.5, "y": 13.0742, "z": "50th" },
-    { "x": 92, "y": 13.191, "z": "50th" },
-    { "x": 92.5, "y": 13.3075, "z": "50th" },
-    { "x": 93, "y": 13.4239, "z": "50th" },
-    { "x": 93.5, "y": 13.5404, "z": "50th" },
-    { "x": 94, "y": 13.6572, "z": "50th" },
-    { "x": 94.5, "y": 13.7746, "z": "50th" },
-    { "x": 95, "y": 13.8928, "z": "50th" },
-    { "x": 95.5, "y": 14.012, "z": "50th" },
-    { "x": 96, "y": 14.1325, "z": "50th" },
-    { "x": 96.5, "y": 14.2544, "z": "50th" },
-    { "x": 97, "y": 14.3782, "z": "50th" },
-    { "x": 97.5, "y": 14.5038, "z": "50th" },
-    { "x": 98, "y": 14.6316, "z": "50th" },
-    { "x": 98.5, "y": 14.7614, "z": "50th" },
-    { "x": 99, "y": 14.8934, "z": "50th" },
-    { "x": 99.5, "y": 15.0275, "z": "50th" },
-    { "x": 100, "y": 15.1637, "z": "50th" },
-    { "x": 100.5, "y": 15.3018, "z": "50th" },
-    { "x": 101, "y": 15.4419, "z": "50th" },
-    { "x": 101.5, "y": 15.5838, "z": "50th" },
-    { "x": 102, "y": 15.7276, "z": "50th" },
-    { "x": 102.5, "y": 15.8732, "z": "50th" },
-    { "x": 103, "y": 16.0206, "z": "50th" },
-    { "x": 103.5, "y": 16.1697, "z": "50th" },
-    { "x": 104, "y": 16.3204, "z": "50th" },
-    { "x": 104.5, "y": 16.4728, "z": "50th" },
-    { "x": 105, "y": 16.6268, "z": "50th" },
-    { "x": 105.5, "y": 16.7826, "z": "50th" },
-    { "x": 106, "y": 16.9401, "z": "50th" },
-    { "x": 106.5, "y": 17.0995, "z": "50th" },
-    { "x": 107, "y": 17.2607, "z": "50th" },
-    { "x": 107.5, "y": 17.4237, "z": "50th" },
-    { "x": 108, "y": 17.5885, "z": "50th" },
-    { "x": 108.5, "y": 17.7553, "z": "50th" },
-    { "x": 109, "y": 17.9242, "z": "50th" },
-    { "x": 109.5, "y": 18.0954, "z": "50th" },
-    { "x": 110, "y": 18.2689, "z": "50th" },
-    { "x": 45, "y": 2.598735, "z": "75th"},
-    { "x": 45.5, "y": 2.686987, "z": "75th" },
-    { "x": 46, "y": 2.775097, "z": "75th" },
-    { "x": 46.5, "y": 2.863471, "z": "75th" },
-    { "x": 47, "y": 2.952467, "z": "75th" },
-    { "x": 47.5, "y": 3.042704, "z": "75th" },
-    { "x": 48, "y": 3.134712, "z": "75th" },
-    { "x": 48.5, "y": 3.229426, "z": "75th" },
-    { "x": 49, "y": 3.327737, "z": "75th" },
-    { "x": 49.5, "y": 3.42994, "z": "75th" },
-    { "x": 50, "y": 3.535715, "z": "75th" },
-    { "x": 50.5, "y": 3.644741, "z": "75th" },
-    { "x": 51, "y": 3.757096, "z": "75th" },
-    { "x": 51.5, "y": 3.873226, "z": "75th" },
-    { "x": 52, "y": 3.993768, "z": "75th" },
-    { "x": 52.5, "y": 4.119672, "z": "75th" },
-    { "x": 53, "y": 4.251043, "z": "75th" },
-    { "x": 53.5, "y": 4.387451, "z": "75th" },
-    { "x": 54, "y": 4.528577, "z": "75th" },
-    { "x": 54.5, "y": 4.67325, "z": "75th" },
-    { "x": 55, "y": 4.820865, "z": "75th" },
-    { "x": 55.5, "y": 4.970965, "z": "75th" },
-    { "x": 56, "y": 5.123266, "z": "75th" },
-    { "x": 56.5, "y": 5.276779, "z": "75th" },
-    { "x": 57, "y": 5.430838, "z": "75th" },
-    { "x": 57.5, "y": 5.584736, "z": "75th" },
-    { "x": 58, "y": 5.738301, "z": "75th" },
-    { "x": 58.5, "y": 5.891111, "z": "75th" },
-    { "x": 59, "y": 6.042854, "z": "75th" },
-    { "x": 59.5, "y": 6.193047, "z": "75th" },
-    { "x": 60, "y": 6.341016, "z": "75th" },
-    { "x": 60.5, "y": 6.485965, "z": "75th" },
-    { "x": 61, "y": 6.6279, "z": "75th" },
-    { "x": 61.5, "y": 6.767053, "z": "75th" },
-    { "x": 62, "y": 6.903673, "z": "75th" },
-    { "x": 62.5, "y": 7.038046, "z": "75th" },
-    { "x": 63, "y": 7.170696, "z": "75th" },
-    { "x": 63.5, "y": 7.301578, "z": "75th" },
-    { "x": 64, "y": 7.430906, "z": "75th" },
-    { "x": 64.5, "y": 7.558736, "z": "75th" },
-    { "x": 65, "y": 7.685232, "z": "75th" },
-    { "x": 65.5, "y": 7.810607, "z": "75th" },
-    { "x": 66, "y": 7.935237, "z": "75th" },
-    { "x": 66.5, "y": 8.059071, "z": "75th" },
-    { "x": 67, "y": 8.182112, "z": "75th" },
-    { "x": 67.5, "y": 8.304363, "z": "75th" },
-    { "x": 68, "y": 8.425883, "z": "75th" },
-    { "x": 68.5, "y": 8.546773, "z": "75th" },
-    { "x": 69, "y": 8.667407, "z": "75th" },
-    { "x": 69.5, "y": 8.787957, "z": "75th" },
-    { "x": 70, "y": 8.908303, "z": "75th" },
-    { "x": 70.5, "y": 9.028296, "z": "75th" },
-    { "x": 71, "y": 9.147347, "z": "75th" },
-    { "x": 71.5, "y": 9.265626, "z": "75th" },
-    { "x": 72, "y": 9.382688, "z": "75th" },
-    { "x": 72.5, "y": 9.49862, "z": "75th" },
-    { "x": 73, "y": 9.613018, "z": "75th" },
-    { "x": 73.5, "y": 9.725841, "z": "75th" },
-    { "x": 74, "y": 9.837087, "z": "75th" },
-    { "x": 74.5, "y": 9.947111, "z": "75th" },
-    { "x": 75, "y": 10.05566, "z": "75th" },
-    { "x": 75.5, "y": 10.16285, "z": "75th" },
-    { "x": 76, "y": 10.26824, "z": "75th" },
-    { "x": 76.5, "y": 10.3716, "z": "75th" },
-    { "x": 77, "y": 10.47298, "z": "75th" },
-    { "x": 77.5, "y": 10.57257, "z": "75th" },
-    { "x": 78, "y": 10.67054, "z": "75th" },
-    { "x": 78.5, "y": 10.76727, "z": "75th" },
-    { "x": 79, "y": 10.86321, "z": "75th" },
-    { "x": 79.5, "y": 10.95919, "z": "75th" },
-    { "x": 80, "y": 11.05585, "z": "75th" },
-    { "x": 80.5, "y": 11.15373, "z": "75th" },
-    { "x": 81, "y": 11.25332, "z": "75th" },
-    { "x": 81.5, "y": 11.35525, "z": "75th" },
-    { "x": 82, "y": 11.46008, "z": "75th" },
-    { "x": 82.5, "y": 11.56791, "z": "75th" },
-    { "x": 83, "y": 11.67945, "z": "75th" },
-    { "x": 83.5, "y": 11.7947, "z": "75th" },
-    { "x": 84, "y": 11.91343, "z": "75th" },
-    { "x": 84.5, "y": 12.03533, "z": "75th" },
-    { "x": 85, "y": 12.15975, "z": "75th" },
-    { "x": 85.5, "y": 12.28626, "z": "75th" },
-    { "x": 86, "y": 12.41434, "z": "75th" },
-    { "x": 86.5, "y": 12.54331, "z": "75th" },
-    { "x": 87, "y": 12.67267, "z": "75th" },
-    { "x": 87.5, "y": 12.80197, "z": "75th" },
-    { "x": 88, "y": 12.9307, "z": "75th" },
-    { "x": 88.5, "y": 13.05854, "z": "75th" },
-    { "x": 89, "y": 13.18559, "z": "75th" },
-    { "x": 89.5, "y": 13.31166, "z": "75th" },
-    { "x": 90, "y": 13.43693, "z": "75th" },
-    { "x": 90.5, "y": 13.56123, "z": "75th" },
-    { "x": 91, "y": 13.68517, "z": "75th" },
-    { "x": 91.5, "y": 13.80869, "z": "75th" },
-    { "x": 92, "y": 13.93195, "z": "75th" },
-    { "x": 92.5, "y": 14.055, "z": "75th" },
-    { "x": 93, "y": 14.17803, "z": "75th" },
-    { "x": 93.5, "y": 14.30137, "z": "75th" },
-    { "x": 94, "y": 14.42523, "z": "75th" },
-    { "x": 94.5, "y": 14.54984, "z": "75th" },
-    { "x": 95, "y": 14.67539, "z": "75th" },
-    { "x": 95.5, "y": 14.80223, "z": "75th" },
-    { "x": 96, "y": 14.93065, "z": "75th" },
-    { "x": 96.5, "y": 15.06057, "z": "75th" },
-    { "x": 97, "y": 15.19284, "z": "75th" },
-    { "x": 97.5, "y": 15.32703, "z": "75th" },
-    { "x": 98, "y": 15.46379, "z": "75th" },
-    { "x": 98.5, "y": 15.60279, "z": "75th" },
-    { "x": 99, "y": 15.74427, "z": "75th" },
-    { "x": 99.5, "y": 15.88821, "z": "75th" },
-    { "x": 100, "y": 16.03453, "z": "75th" },
-    { "x": 100.5, "y": 16.18301, "z": "75th" },
-    { "x": 101, "y": 16.33376, "z": "75th" },
-    { "x": 101.5, "y": 16.48658, "z": "75th" },
-    { "x": 102, "y": 16.64157, "z": "75th" },
-    { "x": 102.5, "y": 16.79852, "z": "75th" },
-    { "x": 103, "y": 16.95755, "z": "75th" },
-    { "x": 103.5, "y": 17.11855, "z": "75th" },
-    { "x": 104, "y": 17.2813, "z": "75th" },
-    { "x": 104.5, "y": 17.44604, "z": "75th" },
-    { "x": 105, "y": 17.61253, "z": "75th" },
-    { "x": 105.5, "y": 17.78099, "z": "75th" },
-    { "x": 106, "y": 17.95145, "z": "75th" },
-    { "x": 106.5, "y": 18.12398, "z": "75th" },
-    { "x": 107, "y": 18.29849, "z": "75th" },
-    { "x": 107.5, "y": 18.47523, "z": "75th" },
-    { "x": 108, "y": 18.65383, "z": "75th" },
-    { "x": 108.5, "y": 18.83476, "z": "75th" },
-    { "x": 109, "y": 19.01798, "z": "75th" },
-    { "x": 109.5, "y": 19.20386, "z": "75th" },
-    { "x": 110, "y": 19.39227, "z": "75th" },
-    { "x": 45, "y": 2.752713, "z": "90th"},
-    { "x": 45.5, "y": 2.84566, "z": "90th" },
-    { "x": 46, "y": 2.938422, "z": "90th" },
-    { "x": 46.5, "y": 3.031408, "z": "90th" },
-    { "x": 47, "y": 3.125038, "z": "90th" },
-    { "x": 47.5, "y": 3.219945, "z": "90th" },
-    { "x": 48, "y": 3.316691, "z": "90th" },
-    { "x": 48.5, "y": 3.41624, "z": "90th" },
-    { "x": 49, "y": 3.519578, "z": "90th" },
-    { "x": 49.5, "y": 3.626994, "z": "90th" },
-    { "x": 50, "y": 3.738145, "z": "90th" },
-    { "x": 50.5, "y": 3.852691, "z": "90th" },
-    { "x": 51, "y": 3.970687, "z": "90th" },
-    { "x": 51.5, "y": 4.092626, "z": "90th" },
-    { "x": 52, "y": 4.219179, "z": "90th" },
-    { "x": 52.5, "y": 4.351347, "z": "90th" },
-    { "x": 53, "y": 4.489236, "z": "90th" },
-    { "x": 53.5, "y": 4.632391, "z": "90th" },
-    { "x": 54, "y": 4.78047, "z": "90th" },
-    { "x": 54.5, "y": 4.932235, "z": "90th" },
-    { "x": 55, "y": 5.08708, "z": "90th" },
-    { "x": 55.5, "y": 5.244488, "z": "90th" },
-    { "x": 56, "y": 5.404194, "z": "90th" },
-    { "x": 56.5, "y": 5.565121, "z": "90th" },
-    { "x": 57, "y": 5.726639, "z": "90th" },
-    { "x": 57.5, "y": 5.887933, "z": "90th" },
-    { "x": 58, "y": 6.048861, "z": "90th" },
-    { "x": 58.5, "y": 6.208982, "z": "90th" },
-    { "x": 59, "y": 6.36797, "z": "90th" },
-    { "x": 59.5, "y": 6.52536, "z": "90th" },
-    { "x": 60, "y": 6.68041, "z": "90th" },
-    { "x": 60.5, "y": 6.832326, "z": "90th" },
-    { "x": 61, "y": 6.981122, "z": "90th" },
-    { "x": 61.5, "y": 7.126957, "z": "90th" },
-    { "x": 62, "y": 7.270234, "z": "90th" },
-    { "x": 62.5, "y": 7.411123, "z": "90th" },
-    { "x": 63, "y": 7.55027, "z": "90th" },
-    { "x": 63.5, "y": 7.687586, "z": "90th" },
-    { "x": 64, "y": 7.823298, "z": "90th" },
-    { "x": 64.5, "y": 7.95752, "z": "90th" },
-    { "x": 65, "y": 8.090377, "z": "90th" },
-    { "x": 65.5, "y": 8.222098, "z": "90th" },
-    { "x": 66, "y": 8.353132, "z": "90th" },
-    { "x": 66.5, "y": 8.483379, "z": "90th" },
-    { "x": 67, "y": 8.612843, "z": "90th" },
-    { "x": 67.5, "y": 8.741529, "z": "90th" },
-    { "x": 68, "y": 8.869561, "z": "90th" },
-    { "x": 68.5, "y": 8.996931, "z": "90th" },
-    { "x": 69, "y": 9.124096, "z": "90th" },
-    { "x": 69.5, "y": 9.251294, "z": "90th" },
-    { "x": 70, "y": 9.378287, "z": "90th" },
-    { "x": 70.5, "y": 9.504978, "z": "90th" },
-    { "x": 71, "y": 9.630686, "z": "90th" },
-    { "x": 71.5, "y": 9.755654, "z": "90th" },
-    { "x": 72, "y": 9.879288, "z": "90th" },
-    { "x": 72.5, "y": 10.00187, "z": "90th" },
-    { "x": 73, "y": 10.12279, "z": "90th" },
-    { "x": 73.5, "y": 10.24205, "z": "90th" },
-    { "x": 74, "y": 10.35967, "z": "90th" },
-    { "x": 74.5, "y": 10.47594, "z": "90th" },
-    { "x": 75, "y": 10.59067, "z": "90th" },
-    { "x": 75.5, "y": 10.70398, "z": "90th" },
-    { "x": 76, "y": 10.8154, "z": "90th" },
-    { "x": 76.5, "y": 10.92455, "z": "90th" },
-    { "x": 77, "y": 11.03155, "z": "90th" },
-    { "x": 77.5, "y": 11.13666, "z": "90th" },
-    { "x": 78, "y": 11.23993, "z": "90th" },
-    { "x": 78.5, "y": 11.34182, "z": "90th" },
-    { "x": 79, "y": 11.44274, "z": "90th" },
-    { "x": 79.5, "y": 11.54361, "z": "90th" },
-    { "x": 80, "y": 11.64505, "z": "90th" },
-    { "x": 80.5, "y": 11.74761, "z": "90th" },
-    { "x": 81, "y": 11.8519, "z": "90th" },
-    { "x": 81.5, "y": 11.95856, "z": "90th" },
-    { "x": 82, "y": 12.06811, "z": "90th" },
-    { "x": 82.5, "y": 12.18064, "z": "90th" },
-    { "x": 83, "y": 12.29698, "z": "90th" },
-    { "x": 83.5, "y": 12.41712, "z": "90th" },
-    { "x": 84, "y": 12.54083, "z": "90th" },
-    { "x": 84.5, "y": 12.66777, "z": "90th" },
-    { "x": 85, "y": 12.79732, "z": "90th" },
-    { "x": 85.5, "y": 12.92898, "z": "90th" },
-    { "x": 86, "y": 13.06224, "z": "90th" },
-    { "x": 86.5, "y": 13.1965, "z": "90th" },
-    { "x": 87, "y": 13.33114, "z": "90th" },
-    { "x": 87.5, "y": 13.46586, "z": "90th" },
-    { "x": 88, "y": 13.60004, "z": "90th" },
-    { "x": 88.5, "y": 13.73336, "z": "90th" },
-    { "x": 89, "y": 13.86599, "z": "90th" },
-    { "x": 89.5, "y": 13.99766, "z": "90th" },
-    { "x": 90, "y": 14.12875, "z": "90th" },
-    { "x": 90.5, "y": 14.25882, "z": "90th" },
-    { "x": 91, "y": 14.38877, "z": "90th" },
-    { "x": 91.5, "y": 14.51826, "z": "90th" },
-    { "x": 92, "y": 14.64776, "z": "90th" },
-    { "x": 92.5, "y": 14.77713, "z": "90th" },
-    { "x": 93, "y": 14.90658, "z": "90th" },
-    { "x": 93.5, "y": 15.03655, "z": "90th" },
-    { "x": 94, "y": 15.16726, "z": "90th" },
-    { "x": 94.5, "y": 15.29886, "z": "90th" },
-    { "x": 95, "y": 15.43158, "z": "90th" },
-    { "x": 95.5, "y": 15.56585, "z": "90th" },
-    { "x": 96, "y": 15.70201, "z": "90th" },
-    { "x": 96.5, "y": 15.83976, "z": "90th" },
-    { "x": 97, "y": 15.9803, "z": "90th" },
-    { "x": 97.5, "y": 16.1229, "z": "90th" },
-    { "x": 98, "y": 16.26843, "z": "90th" },
-    { "x": 98.5, "y": 16.41646, "z": "90th" },
-    { "x": 99, "y": 16.56723, "z": "90th" },
-    { "x": 99.5, "y": 16.72085, "z": "90th" },
-    { "x": 100, "y": 16.87711, "z": "90th" },
-    { "x": 100.5, "y": 17.03581, "z": "90th" },
-    { "x": 101, "y": 17.19705, "z": "90th" },
-    { "x": 101.5, "y": 17.36062, "z": "90th" },
-    { "x": 102, "y": 17.52665, "z": "90th" },
-    { "x": 102.5, "y": 17.69479, "z": "90th" },
-    { "x": 103, "y": 17.86529, "z": "90th" },
-    { "x": 103.5, "y": 18.03804, "z": "90th" },
-    { "x": 104, "y": 18.21271, "z": "90th" },
-    { "x": 104.5, "y": 18.38963, "z": "90th" },
-    { "x": 105, "y": 18.56848, "z": "90th" },
-    { "x": 105.5, "y": 18.74947, "z": "90th" },
-    { "x": 106, "y": 18.93274, "z": "90th" },
-    { "x": 106.5, "y": 19.11828, "z": "90th" },
-    { "x": 107, "y": 19.30597, "z": "90th" },
-    { "x": 107.5, "y": 19.49634, "z": "90th" },
-    { "x": 108, "y": 19.68862, "z": "90th" },
-    { "x": 108.5, "y": 19.88356, "z": "90th" },
-    { "x": 109, "y": 20.081, "z": "90th" },
-    { "x": 109.5, "y": 20.28146, "z": "90th" },
-    { "x": 110, "y": 20.48466, "z": "90th" },
-    { "x": 45, "y": 2.850807, "z": "95th"},
-    { "x": 45.5, "y": 2.946724, "z": "95th" },
-    { "x": 46, "y": 3.042427, "z": "95th" },
-    { "x": 46.5, "y": 3.138329, "z": "95th" },
-    { "x": 47, "y": 3.234886, "z": "95th" },
-    { "x": 47.5, "y": 3.332742, "z": "95th" },
-    { "x": 48, "y": 3.43248, "z": "95th" },
-    { "x": 48.5, "y": 3.53508, "z": "95th" },
-    { "x": 49, "y": 3.641592, "z": "95th" },
-    { "x": 49.5, "y": 3.752297, "z": "95th" },
-    { "x": 50, "y": 3.86684, "z": "95th" },
-    { "x": 50.5, "y": 3.984869, "z": "95th" },
-    { "x": 51, "y": 4.106421, "z": "95th" },
-    { "x": 51.5, "y": 4.232023, "z": "95th" },
-    { "x": 52, "y": 4.362364, "z": "95th" },
-    { "x": 52.5, "y": 4.49848, "z": "95th" },
-    { "x": 53, "y": 4.640477, "z": "95th" },
-    { "x": 53.5, "y": 4.787883, "z": "95th" },
-    { "x": 54, "y": 4.940342, "z": "95th" },
-    { "x": 54.5, "y": 5.096575, "z": "95th" },
-    { "x": 55, "y": 5.255972, "z": "95th" },
-    { "x": 55.5, "y": 5.417981, "z": "95th" },
-    { "x": 56, "y": 5.582349, "z": "95th" },
-    { "x": 56.5, "y": 5.747942, "z": "95th" },
-    { "x": 57, "y": 5.914155, "z": "95th" },
-    { "x": 57.5, "y": 6.080102, "z": "95th" },
-    { "x": 58, "y": 6.245662, "z": "95th" },
-    { "x": 58.5, "y": 6.410382, "z": "95th" },
-    { "x": 59, "y": 6.573927, "z": "95th" },
-    { "x": 59.5, "y": 6.735847, "z": "95th" },
-    { "x": 60, "y": 6.89535, "z": "95th" },
-    { "x": 60.5, "y": 7.05165, "z": "95th" },
-    { "x": 61, "y": 7.204766, "z": "95th" },
-    { "x": 61.5, "y": 7.354806, "z": "95th" },
-    { "x": 62, "y": 7.502278, "z": "95th" },
-    { "x": 62.5, "y": 7.647269, "z": "95th" },
-    { "x": 63, "y": 7.79051, "z": "95th" },
-    { "x": 63.5, "y": 7.931881, "z": "95th" },
-    { "x": 64, "y": 8.071618, "z": "95th" },
-    { "x": 64.5, "y": 8.209873, "z": "95th" },
-    { "x": 65, "y": 8.346744, "z": "95th" },
-    { "x": 65.5, "y": 8.482471, "z": "95th" },
-    { "x": 66, "y": 8.617553, "z": "95th" },
-    { "x": 66.5, "y": 8.751853, "z": "95th" },
-    { "x": 67, "y": 8.885379, "z": "95th" },
-    { "x": 67.5, "y": 9.018137, "z": "95th" },
-    { "x": 68, "y": 9.150293, "z": "95th" },
-    { "x": 68.5, "y": 9.281768, "z": "95th" },
-    { "x": 69, "y": 9.413071, "z": "95th" },
-    { "x": 69.5, "y": 9.544487, "z": "95th" },
-    { "x": 70, "y": 9.675696, "z": "95th" },
-    { "x": 70.5, "y": 9.806637, "z": "95th" },
-    { "x": 71, "y": 9.936572, "z": "95th" },
-    { "x": 71.5, "y": 10.06579, "z": "95th" },
-    { "x": 72, "y": 10.19359, "z": "95th" },
-    { "x": 72.5, "y": 10.3204, "z": "95th" },
-    { "x": 73, "y": 10.44546, "z": "95th" },
-    { "x": 73.5, "y": 10.56882, "z": "95th" },
-    { "x": 74, "y": 10.69049, "z": "95th" },
-    { "x": 74.5, "y": 10.81073, "z": "95th" },
-    { "x": 75, "y": 10.92939, "z": "95th" },
-    { "x": 75.5, "y": 11.04658, "z": "95th" },
-    { "x": 76, "y": 11.16183, "z": "95th" },
-    { "x": 76.5, "y": 11.27465, "z": "95th" },
-    { "x": 77, "y": 11.38522, "z": "95th" },
-    { "x": 77.5, "y": 11.49384, "z": "95th" },
-    { "x": 78, "y": 11.60047, "z": "95th" },
-    { "x": 78.5, "y": 11.70563, "z": "95th" },
-    { "x": 79, "y": 11.80969, "z": "95th" },
-    { "x": 79.5, "y": 11.91365, "z": "95th" },
-    { "x": 80, "y": 12.0181, "z": "95th" },
-    { "x": 80.5, "y": 12.12362, "z": "95th" },
-    { "x": 81, "y": 12.23085, "z": "95th" },
-    { "x": 81.5, "y": 12.34049, "z": "95th" },
-    { "x": 82, "y": 12.45299, "z": "95th" },
-    { "x": 82.5, "y": 12.56846, "z": "95th" },
-    { "x": 83, "y": 12.6878, "z": "95th" },
-    { "x": 83.5, "y": 12.811, "z": "95th" },
-    { "x": 84, "y": 12.93781, "z": "95th" },
-    { "x": 84.5, "y": 13.06789, "z": "95th" },
-    { "x": 85, "y": 13.20064, "z": "95th" },
-    { "x": 85.5, "y": 13.3355, "z": "95th" },
-    { "x": 86, "y": 13.47199, "z": "95th" },
-    { "x": 86.5, "y": 13.60955, "z": "95th" },
-    { "x": 87, "y": 13.74748, "z": "95th" },
-    { "x": 87.5, "y": 13.88559, "z": "95th" },
-    { "x": 88, "y": 14.02317, "z": "95th" },
-    { "x": 88.5, "y": 14.1599, "z": "95th" },
-    { "x": 89, "y": 14.29604, "z": "95th" },
-    { "x": 89.5, "y": 14.43122, "z": "95th" },
-    { "x": 90, "y": 14.56597, "z": "95th" },
-    { "x": 90.5, "y": 14.69965, "z": "95th" },
-    { "x": 91, "y": 14.83338, "z": "95th" },
-    { "x": 91.5, "y": 14.96664, "z": "95th" },
-    { "x": 92, "y": 15.10008, "z": "95th" },
-    { "x": 92.5, "y": 15.23344, "z": "95th" },
-    { "x": 93, "y": 15.36695, "z": "95th" },
-    { "x": 93.5, "y": 15.50112, "z": "95th" },
-    { "x": 94, "y": 15.63618, "z": "95th" },
-    { "x": 94.5, "y": 15.77223, "z": "95th" },
-    { "x": 95, "y": 15.90949, "z": "95th" },
-    { "x": 95.5, "y": 16.04848, "z": "95th" },
-    { "x": 96, "y": 16.18957, "z": "95th" },
-    { "x": 96.5, "y": 16.33231, "z": "95th" },
-    { "x": 97, "y": 16.47814, "z": "95th" },
-    { "x": 97.5, "y": 16.6261, "z": "95th" },
-    { "x": 98, "y": 16.77723, "z": "95th" },
-    { "x": 98.5, "y": 16.93104, "z": "95th" },
-    { "x": 99, "y": 17.08775, "z": "95th" },
-    { "x": 99.5, "y": 17.24756, "z": "95th" },
-    { "x": 100, "y": 17.41019, "z": "95th" },
-    { "x": 100.5, "y": 17.57543, "z": "95th" },
-    { "x": 101, "y": 17.74339, "z": "95th" },
-    { "x": 101.5, "y": 17.91387, "z": "95th" },
-    { "x": 102, "y": 18.08698, "z": "95th" },
-    { "x": 102.5, "y": 18.26231, "z": "95th" },
-    { "x": 103, "y": 18.44018, "z": "95th" },
-    { "x": 103.5, "y": 18.62048, "z": "95th" },
-    { "x": 104, "y": 18.8028, "z": "95th" },
-    { "x": 104.5, "y": 18.98757, "z": "95th" },
-    { "x": 105, "y": 19.17436, "z": "95th" },
-    { "x": 105.5, "y": 19.36341, "z": "95th" },
-    { "x": 106, "y": 19.55494, "z": "95th" },
-    { "x": 106.5, "y": 19.74885, "z": "95th" },
-    { "x": 107, "y": 19.94503, "z": "95th" },
-    { "x": 107.5, "y": 20.14419, "z": "95th" },
-    { "x": 108, "y": 20.34528, "z": "95th" },
-    { "x": 108.5, "y": 20.54925, "z": "95th" },
-    { "x": 109, "y": 20.75587, "z": "95th" },
-    { "x": 109.5, "y": 20.96574, "z": "95th" },
-    { "x": 110, "y": 21.1785, "z": "95th" },
-    { "x": 45, "y": 2.951324, "z": "98th"},
-    { "x": 45.5, "y": 3.050268, "z": "98th" },
-    { "x": 46, "y": 3.148968, "z": "98th" },
-    { "x": 46.5, "y": 3.247837, "z": "98th" },
-    { "x": 47, "y": 3.347375, "z": "98th" },
-    { "x": 47.5, "y": 3.448234, "z": "98th" },
-    { "x": 48, "y": 3.551015, "z": "98th" },
-    { "x": 48.5, "y": 3.65672, "z": "98th" },
-    { "x": 49, "y": 3.76646, "z": "98th" },
-    { "x": 49.5, "y": 3.880511, "z": "98th" },
-    { "x": 50, "y": 3.998505, "z": "98th" },
-    { "x": 50.5, "y": 4.120075, "z": "98th" },
-    { "x": 51, "y": 4.245244, "z": "98th" },
-    { "x": 51.5, "y": 4.374568, "z": "98th" },
-    { "x": 52, "y": 4.50876, "z": "98th" },
-    { "x": 52.5, "y": 4.648887, "z": "98th" },
-    { "x": 53, "y": 4.795059, "z": "98th" },
-    { "x": 53.5, "y": 4.946784, "z": "98th" },
-    { "x": 54, "y": 5.103693, "z": "98th" },
-    { "x": 54.5, "y": 5.264463, "z": "98th" },
-    { "x": 55, "y": 5.428484, "z": "98th" },
-    { "x": 55.5, "y": 5.595166, "z": "98th" },
-    { "x": 56, "y": 5.764267, "z": "98th" },
-    { "x": 56.5, "y": 5.934596, "z": "98th" },
-    { "x": 57, "y": 6.105576, "z": "98th" },
-    { "x": 57.5, "y": 6.276246, "z": "98th" },
-    { "x": 58, "y": 6.446507, "z": "98th" },
-    { "x": 58.5, "y": 6.615894, "z": "98th" },
-    { "x": 59, "y": 6.784063, "z": "98th" },
-    { "x": 59.5, "y": 6.950579, "z": "98th" },
-    { "x": 60, "y": 7.114604, "z": "98th" },
-    { "x": 60.5, "y": 7.275354, "z": "98th" },
-    { "x": 61, "y": 7.432856, "z": "98th" },
-    { "x": 61.5, "y": 7.587165, "z": "98th" },
-    { "x": 62, "y": 7.738897, "z": "98th" },
-    { "x": 62.5, "y": 7.888055, "z": "98th" },
-    { "x": 63, "y": 8.035457, "z": "98th" },
-    { "x": 63.5, "y": 8.180948, "z": "98th" },
-    { "x": 64, "y": 8.324777, "z": "98th" },
-    { "x": 64.5, "y": 8.467133, "z": "98th" },
-    { "x": 65, "y": 8.608089, "z": "98th" },
-    { "x": 65.5, "y": 8.747892, "z": "98th" },
-    { "x": 66, "y": 8.887095, "z": "98th" },
-    { "x": 66.5, "y": 9.025525, "z": "98th" },
-    { "x": 67, "y": 9.16319, "z": "98th" },
-    { "x": 67.5, "y": 9.300099, "z": "98th" },
-    { "x": 68, "y": 9.436461, "z": "98th" },
-    { "x": 68.5, "y": 9.572124, "z": "98th" },
-    { "x": 69, "y": 9.707649, "z": "98th" },
-    { "x": 69.5, "y": 9.843373, "z": "98th" },
-    { "x": 70, "y": 9.978888, "z": "98th" },
-    { "x": 70.5, "y": 10.11417, "z": "98th" },
-    { "x": 71, "y": 10.24843, "z": "98th" },
-    { "x": 71.5, "y": 10.38198, "z": "98th" },
-    { "x": 72, "y": 10.51406, "z": "98th" },
-    { "x": 72.5, "y": 10.64519, "z": "98th" },
-    { "x": 73, "y": 10.77448, "z": "98th" },
-    { "x": 73.5, "y": 10.90203, "z": "98th" },
-    { "x": 74, "y": 11.02784, "z": "98th" },
-    { "x": 74.5, "y": 11.15214, "z": "98th" },
-    { "x": 75, "y": 11.27481, "z": "98th" },
-    { "x": 75.5, "y": 11.39598, "z": "98th" },
-    { "x": 76, "y": 11.51515, "z": "98th" },
-    { "x": 76.5, "y": 11.63173, "z": "98th" },
-    { "x": 77, "y": 11.74594, "z": "98th" },
-    { "x": 77.5, "y": 11.85814, "z": "98th" },
-    { "x": 78, "y": 11.96819, "z": "98th" },
-    { "x": 78.5, "y": 12.07668, "z": "98th" },
-    { "x": 79, "y": 12.18395, "z": "98th" },
-    { "x": 79.5, "y": 12.29106, "z": "98th" },
-    { "x": 80, "y": 12.39858, "z": "98th" },
-    { "x": 80.5, "y": 12.50708, "z": "98th" },
-    { "x": 81, "y": 12.61731, "z": "98th" },
-    { "x": 81.5, "y": 12.72995, "z": "98th" },
-    { "x": 82, "y": 12.84545, "z": "98th" },
-    { "x": 82.5, "y": 12.96389, "z": "98th" },
-    { "x": 83, "y": 13.08626, "z": "98th" },
-    { "x": 83.5, "y": 13.21254, "z": "98th" },
-    { "x": 84, "y": 13.34249, "z": "98th" },
-    { "x": 84.5, "y": 13.47573, "z": "98th" },
-    { "x": 85, "y": 13.61171, "z": "98th" },
-    { "x": 85.5, "y": 13.74978, "z": "98th" },
-    { "x": 86, "y": 13.88953, "z": "98th" },
-    { "x": 86.5, "y": 14.0304, "z": "98th" },
-    { "x": 87, "y": 14.17165, "z": "98th" },
-    { "x": 87.5, "y": 14.31317, "z": "98th" },
-    { "x": 88, "y": 14.45419, "z": "98th" },
-    { "x": 88.5, "y": 14.59437, "z": "98th" },
-    { "x": 89, "y": 14.73404, "z": "98th" },
-    { "x": 89.5, "y": 14.87278, "z": "98th" },
-    { "x": 90, "y": 15.01124, "z": "98th" },
-    { "x": 90.5, "y": 15.14859, "z": "98th" },
-    { "x": 91, "y": 15.28616, "z": "98th" },
-    { "x": 91.5, "y": 15.42324, "z": "98th" },
-    { "x": 92, "y": 15.5607, "z": "98th" },
-    { "x": 92.5, "y": 15.69813, "z": "98th" },
-    { "x": 93, "y": 15.83577, "z": "98th" },
-    { "x": 93.5, "y": 15.97422, "z": "98th" },
-    { "x": 94, "y": 16.11372, "z": "98th" },
-    { "x": 94.5, "y": 16.25431, "z": "98th" },
-    { "x": 95, "y": 16.39622, "z": "98th" },
-    { "x": 95.5, "y": 16.54005, "z": "98th" },
-    { "x": 96, "y": 16.68618, "z": "98th" },
-    { "x": 96.5, "y": 16.83404, "z": "98th" },
-    { "x": 97, "y": 16.98528, "z": "98th" },
-    { "x": 97.5, "y": 17.13875, "z": "98th" },
-    { "x": 98, "y": 17.29563, "z": "98th" },
-    { "x": 98.5, "y": 17.45536, "z": "98th" },
-    { "x": 99, "y": 17.61818, "z": "98th" },
-    { "x": 99.5, "y": 17.78436, "z": "98th" },
-    { "x": 100, "y": 17.95354, "z": "98th" },
-    { "x": 100.5, "y": 18.12551, "z": "98th" },
-    { "x": 101, "y": 18.3004, "z": "98th" },
-    { "x": 101.5, "y": 18.47798, "z": "98th" },
-    { "x": 102, "y": 18.65839, "z": "98th" },
-    { "x": 102.5, "y": 18.84113, "z": "98th" },
-    { "x": 103, "y": 19.0266, "z": "98th" },
-    { "x": 103.5, "y": 19.2147, "z": "98th" },
-    { "x": 104, "y": 19.40491, "z": "98th" },
-    { "x": 104.5, "y": 19.59777, "z": "98th" },
-    { "x": 105, "y": 19.79277, "z": "98th" },
-    { "x": 105.5, "y": 19.99014, "z": "98th" },
-    { "x": 106, "y": 20.19019, "z": "98th" },
-    { "x": 106.5, "y": 20.39275, "z": "98th" },
-    { "x": 107, "y": 20.5977, "z": "98th" },
-    { "x": 107.5, "y": 20.80594, "z": "98th" },
-    { "x": 108, "y": 21.01615, "z": "98th" },
-    { "x": 108.5, "y": 21.22947, "z": "98th" },
-    { "x": 109, "y": 21.44557, "z": "98th" },
-    { "x": 109.5, "y": 21.66518, "z": "98th" },
-    { "x": 110, "y": 21.88782, "z": "98th" }
-]
\ No newline at end of file
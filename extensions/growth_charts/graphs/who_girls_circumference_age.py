@@ -1,202 +0,0 @@
-who_girls_circumference_age = [
-    { "x": 0, "y": 31.93054, "z": "5th" },
-    { "x": 1, "y": 34.61666, "z": "5th" },
-    { "x": 2, "y": 36.25882, "z": "5th" },
-    { "x": 3, "y": 37.49099, "z": "5th" },
-    { "x": 4, "y": 38.49974, "z": "5th" },
-    { "x": 5, "y": 39.34362, "z": "5th" },
-    { "x": 6, "y": 40.05675, "z": "5th" },
-    { "x": 7, "y": 40.66274, "z": "5th" },
-    { "x": 8, "y": 41.18218, "z": "5th" },
-    { "x": 9, "y": 41.62897, "z": "5th" },
-    { "x": 10, "y": 42.01724, "z": "5th" },
-    { "x": 11, "y": 42.35869, "z": "5th" },
-    { "x": 12, "y": 42.66112, "z": "5th" },
-    { "x": 13, "y": 42.93188, "z": "5th" },
-    { "x": 14, "y": 43.17594, "z": "5th" },
-    { "x": 15, "y": 43.39772, "z": "5th" },
-    { "x": 16, "y": 43.60252, "z": "5th" },
-    { "x": 17, "y": 43.79225, "z": "5th" },
-    { "x": 18, "y": 43.97043, "z": "5th" },
-    { "x": 19, "y": 44.13856, "z": "5th" },
-    { "x": 20, "y": 44.2992, "z": "5th" },
-    { "x": 21, "y": 44.45359, "z": "5th" },
-    { "x": 22, "y": 44.60287, "z": "5th" },
-    { "x": 23, "y": 44.74733, "z": "5th" },
-    { "x": 24, "y": 44.88734, "z": "5th" },
-    { "x": 0, "y": 32.36083, "z": "10th" },
-    { "x": 1, "y": 35.04287, "z": "10th" },
-    { "x": 2, "y": 36.69908, "z": "10th" },
-    { "x": 3, "y": 37.94197, "z": "10th" },
-    { "x": 4, "y": 38.95958, "z": "10th" },
-    { "x": 5, "y": 39.81085, "z": "10th" },
-    { "x": 6, "y": 40.53002, "z": "10th" },
-    { "x": 7, "y": 41.14121, "z": "10th" },
-    { "x": 8, "y": 41.66477, "z": "10th" },
-    { "x": 9, "y": 42.11512, "z": "10th" },
-    { "x": 10, "y": 42.50639, "z": "10th" },
-    { "x": 11, "y": 42.85029, "z": "10th" },
-    { "x": 12, "y": 43.15485, "z": "10th" },
-    { "x": 13, "y": 43.42737, "z": "10th" },
-    { "x": 14, "y": 43.67302, "z": "10th" },
-    { "x": 15, "y": 43.89631, "z": "10th" },
-    { "x": 16, "y": 44.10224, "z": "10th" },
-    { "x": 17, "y": 44.29309, "z": "10th" },
-    { "x": 18, "y": 44.47224, "z": "10th" },
-    { "x": 19, "y": 44.6414, "z": "10th" },
-    { "x": 20, "y": 44.80299, "z": "10th" },
-    { "x": 21, "y": 44.95824, "z": "10th" },
-    { "x": 22, "y": 45.10832, "z": "10th" },
-    { "x": 23, "y": 45.25352, "z": "10th" },
-    { "x": 24, "y": 45.39421, "z": "10th" },
-    { "x": 0, "y": 33.07983, "z": "25th" },
-    { "x": 1, "y": 35.75503, "z": "25th" },
-    { "x": 2, "y": 37.43474, "z": "25th" },
-    { "x": 3, "y": 38.69554, "z": "25th" },
-    { "x": 4, "y": 39.72797, "z": "25th" },
-    { "x": 5, "y": 40.59157, "z": "25th" },
-    { "x": 6, "y": 41.32084, "z": "25th" },
-    { "x": 7, "y": 41.9407, "z": "25th" },
-    { "x": 8, "y": 42.47115, "z": "25th" },
-    { "x": 9, "y": 42.92745, "z": "25th" },
-    { "x": 10, "y": 43.32375, "z": "25th" },
-    { "x": 11, "y": 43.67172, "z": "25th" },
-    { "x": 12, "y": 43.97986, "z": "25th" },
-    { "x": 13, "y": 44.2553, "z": "25th" },
-    { "x": 14, "y": 44.50363, "z": "25th" },
-    { "x": 15, "y": 44.72944, "z": "25th" },
-    { "x": 16, "y": 44.93725, "z": "25th" },
-    { "x": 17, "y": 45.12997, "z": "25th" },
-    { "x": 18, "y": 45.31075, "z": "25th" },
-    { "x": 19, "y": 45.48164, "z": "25th" },
-    { "x": 20, "y": 45.64479, "z": "25th" },
-    { "x": 21, "y": 45.80149, "z": "25th" },
-    { "x": 22, "y": 45.95291, "z": "25th" },
-    { "x": 23, "y": 46.09933, "z": "25th" },
-    { "x": 24, "y": 46.24117, "z": "25th" },
-    { "x": 0, "y": 33.8787, "z": "50th" },
-    { "x": 1, "y": 36.5463, "z": "50th" },
-    { "x": 2, "y": 38.2521, "z": "50th" },
-    { "x": 3, "y": 39.5328, "z": "50th" },
-    { "x": 4, "y": 40.5817, "z": "50th" },
-    { "x": 5, "y": 41.459, "z": "50th" },
-    { "x": 6, "y": 42.1995, "z": "50th" },
-    { "x": 7, "y": 42.829, "z": "50th" },
-    { "x": 8, "y": 43.3671, "z": "50th" },
-    { "x": 9, "y": 43.83, "z": "50th" },
-    { "x": 10, "y": 44.2319, "z": "50th" },
-    { "x": 11, "y": 44.5844, "z": "50th" },
-    { "x": 12, "y": 44.8965, "z": "50th" },
-    { "x": 13, "y": 45.1752, "z": "50th" },
-    { "x": 14, "y": 45.4265, "z": "50th" },
-    { "x": 15, "y": 45.6551, "z": "50th" },
-    { "x": 16, "y": 45.865, "z": "50th" },
-    { "x": 17, "y": 46.0598, "z": "50th" },
-    { "x": 18, "y": 46.2424, "z": "50th" },
-    { "x": 19, "y": 46.4152, "z": "50th" },
-    { "x": 20, "y": 46.5801, "z": "50th" },
-    { "x": 21, "y": 46.7384, "z": "50th" },
-    { "x": 22, "y": 46.8913, "z": "50th" },
-    { "x": 23, "y": 47.0391, "z": "50th" },
-    { "x": 24, "y": 47.1822, "z": "50th" },
-    { "x": 0, "y": 34.67757, "z": "75th" },
-    { "x": 1, "y": 37.33757, "z": "75th" },
-    { "x": 2, "y": 39.06946, "z": "75th" },
-    { "x": 3, "y": 40.37006, "z": "75th" },
-    { "x": 4, "y": 41.43543, "z": "75th" },
-    { "x": 5, "y": 42.32643, "z": "75th" },
-    { "x": 6, "y": 43.07816, "z": "75th" },
-    { "x": 7, "y": 43.7173, "z": "75th" },
-    { "x": 8, "y": 44.26305, "z": "75th" },
-    { "x": 9, "y": 44.73255, "z": "75th" },
-    { "x": 10, "y": 45.14005, "z": "75th" },
-    { "x": 11, "y": 45.49708, "z": "75th" },
-    { "x": 12, "y": 45.81314, "z": "75th" },
-    { "x": 13, "y": 46.0951, "z": "75th" },
-    { "x": 14, "y": 46.34937, "z": "75th" },
-    { "x": 15, "y": 46.58076, "z": "75th" },
-    { "x": 16, "y": 46.79275, "z": "75th" },
-    { "x": 17, "y": 46.98963, "z": "75th" },
-    { "x": 18, "y": 47.17405, "z": "75th" },
-    { "x": 19, "y": 47.34876, "z": "75th" },
-    { "x": 20, "y": 47.51541, "z": "75th" },
-    { "x": 21, "y": 47.67531, "z": "75th" },
-    { "x": 22, "y": 47.82969, "z": "75th" },
-    { "x": 23, "y": 47.97887, "z": "75th" },
-    { "x": 24, "y": 48.12323, "z": "75th" },
-    { "x": 0, "y": 35.39657, "z": "90th" },
-    { "x": 1, "y": 38.04973, "z": "90th" },
-    { "x": 2, "y": 39.80512, "z": "90th" },
-    { "x": 3, "y": 41.12363, "z": "90th" },
-    { "x": 4, "y": 42.20382, "z": "90th" },
-    { "x": 5, "y": 43.10715, "z": "90th" },
-    { "x": 6, "y": 43.86898, "z": "90th" },
-    { "x": 7, "y": 44.51679, "z": "90th" },
-    { "x": 8, "y": 45.06943, "z": "90th" },
-    { "x": 9, "y": 45.54488, "z": "90th" },
-    { "x": 10, "y": 45.95741, "z": "90th" },
-    { "x": 11, "y": 46.31851, "z": "90th" },
-    { "x": 12, "y": 46.63815, "z": "90th" },
-    { "x": 13, "y": 46.92303, "z": "90th" },
-    { "x": 14, "y": 47.17998, "z": "90th" },
-    { "x": 15, "y": 47.41389, "z": "90th" },
-    { "x": 16, "y": 47.62776, "z": "90th" },
-    { "x": 17, "y": 47.82651, "z": "90th" },
-    { "x": 18, "y": 48.01256, "z": "90th" },
-    { "x": 19, "y": 48.189, "z": "90th" },
-    { "x": 20, "y": 48.35721, "z": "90th" },
-    { "x": 21, "y": 48.51856, "z": "90th" },
-    { "x": 22, "y": 48.67428, "z": "90th" },
-    { "x": 23, "y": 48.82468, "z": "90th" },
-    { "x": 24, "y": 48.97019, "z": "90th" },
-    { "x": 0, "y": 35.82686, "z": "95th" },
-    { "x": 1, "y": 38.47594, "z": "95th" },
-    { "x": 2, "y": 40.24538, "z": "95th" },
-    { "x": 3, "y": 41.57461, "z": "95th" },
-    { "x": 4, "y": 42.66366, "z": "95th" },
-    { "x": 5, "y": 43.57438, "z": "95th" },
-    { "x": 6, "y": 44.34225, "z": "95th" },
-    { "x": 7, "y": 44.99526, "z": "95th" },
-    { "x": 8, "y": 45.55202, "z": "95th" },
-    { "x": 9, "y": 46.03103, "z": "95th" },
-    { "x": 10, "y": 46.44656, "z": "95th" },
-    { "x": 11, "y": 46.81011, "z": "95th" },
-    { "x": 12, "y": 47.13188, "z": "95th" },
-    { "x": 13, "y": 47.41852, "z": "95th" },
-    { "x": 14, "y": 47.67706, "z": "95th" },
-    { "x": 15, "y": 47.91248, "z": "95th" },
-    { "x": 16, "y": 48.12748, "z": "95th" },
-    { "x": 17, "y": 48.32735, "z": "95th" },
-    { "x": 18, "y": 48.51437, "z": "95th" },
-    { "x": 19, "y": 48.69184, "z": "95th" },
-    { "x": 20, "y": 48.861, "z": "95th" },
-    { "x": 21, "y": 49.02321, "z": "95th" },
-    { "x": 22, "y": 49.17973, "z": "95th" },
-    { "x": 23, "y": 49.33087, "z": "95th" },
-    { "x": 24, "y": 49.47706, "z": "95th" },
-    { "x": 0, "y": 36.2474987, "z": "98th" },
-    { "x": 1, "y": 38.8925725, "z": "98th" },
-    { "x": 2, "y": 40.6757531, "z": "98th" },
-    { "x": 3, "y": 42.0154598, "z": "98th" },
-    { "x": 4, "y": 43.1131864, "z": "98th" },
-    { "x": 5, "y": 44.0311164, "z": "98th" },
-    { "x": 6, "y": 44.8048971, "z": "98th" },
-    { "x": 7, "y": 45.4629835, "z": "98th" },
-    { "x": 8, "y": 46.0237685, "z": "98th" },
-    { "x": 9, "y": 46.5062598, "z": "98th" },
-    { "x": 10, "y": 46.9247381, "z": "98th" },
-    { "x": 11, "y": 47.2906731, "z": "98th" },
-    { "x": 12, "y": 47.6145341, "z": "98th" },
-    { "x": 13, "y": 47.9028786, "z": "98th" },
-    { "x": 14, "y": 48.1629924, "z": "98th" },
-    { "x": 15, "y": 48.3998846, "z": "98th" },
-    { "x": 16, "y": 48.6159827, "z": "98th" },
-    { "x": 17, "y": 48.8169396, "z": "98th" },
-    { "x": 18, "y": 49.004921, "z": "98th" },
-    { "x": 19, "y": 49.1834025, "z": "98th" },
-    { "x": 20, "y": 49.3534792, "z": "98th" },
-    { "x": 21, "y": 49.5165305, "z": "98th" },
-    { "x": 22, "y": 49.6738297, "z": "98th" },
-    { "x": 23, "y": 49.8256963, "z": "98th" },
-    { "x": 24, "y": 49.9725553, "z": "98th" }
-]
\ No newline at end of file
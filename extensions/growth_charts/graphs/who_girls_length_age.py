@@ -1,202 +0,0 @@
-who_girls_length_age = [
-    { "x": 0, "y": 46.08383, "z": "5th" },
-    { "x": 1, "y": 50.4728, "z": "5th" },
-    { "x": 2, "y": 53.71811, "z": "5th" },
-    { "x": 3, "y": 56.34038, "z": "5th" },
-    { "x": 4, "y": 58.52969, "z": "5th" },
-    { "x": 5, "y": 60.38286, "z": "5th" },
-    { "x": 6, "y": 62.00319, "z": "5th" },
-    { "x": 7, "y": 63.47888, "z": "5th" },
-    { "x": 8, "y": 64.85973, "z": "5th" },
-    { "x": 9, "y": 66.16996, "z": "5th" },
-    { "x": 10, "y": 67.42304, "z": "5th" },
-    { "x": 11, "y": 68.62467, "z": "5th" },
-    { "x": 12, "y": 69.77953, "z": "5th" },
-    { "x": 13, "y": 70.89228, "z": "5th" },
-    { "x": 14, "y": 71.96683, "z": "5th" },
-    { "x": 15, "y": 73.00432, "z": "5th" },
-    { "x": 16, "y": 74.00908, "z": "5th" },
-    { "x": 17, "y": 74.98475, "z": "5th" },
-    { "x": 18, "y": 75.93146, "z": "5th" },
-    { "x": 19, "y": 76.8524, "z": "5th" },
-    { "x": 20, "y": 77.74783, "z": "5th" },
-    { "x": 21, "y": 78.62035, "z": "5th" },
-    { "x": 22, "y": 79.47174, "z": "5th" },
-    { "x": 23, "y": 80.3, "z": "5th" },
-    { "x": 24, "y": 81.10777, "z": "5th" },
-    { "x": 0, "y": 46.76056, "z": "10th" },
-    { "x": 1, "y": 51.18277, "z": "10th" },
-    { "x": 2, "y": 54.45785, "z": "10th" },
-    { "x": 3, "y": 57.10515, "z": "10th" },
-    { "x": 4, "y": 59.31604, "z": "10th" },
-    { "x": 5, "y": 61.18844, "z": "10th" },
-    { "x": 6, "y": 62.82658, "z": "10th" },
-    { "x": 7, "y": 64.32005, "z": "10th" },
-    { "x": 8, "y": 65.71894, "z": "10th" },
-    { "x": 9, "y": 67.0476, "z": "10th" },
-    { "x": 10, "y": 68.31951, "z": "10th" },
-    { "x": 11, "y": 69.54048, "z": "10th" },
-    { "x": 12, "y": 70.71503, "z": "10th" },
-    { "x": 13, "y": 71.84762, "z": "10th" },
-    { "x": 14, "y": 72.94195, "z": "10th" },
-    { "x": 15, "y": 73.99947, "z": "10th" },
-    { "x": 16, "y": 75.0243, "z": "10th" },
-    { "x": 17, "y": 76.01981, "z": "10th" },
-    { "x": 18, "y": 76.98644, "z": "10th" },
-    { "x": 19, "y": 77.92712, "z": "10th" },
-    { "x": 20, "y": 78.84242, "z": "10th" },
-    { "x": 21, "y": 79.73466, "z": "10th" },
-    { "x": 22, "y": 80.60531, "z": "10th" },
-    { "x": 23, "y": 81.453, "z": "10th" },
-    { "x": 24, "y": 82.28006, "z": "10th" },
-    { "x": 0, "y": 47.89133, "z": "25th" },
-    { "x": 1, "y": 52.3691, "z": "25th" },
-    { "x": 2, "y": 55.69393, "z": "25th" },
-    { "x": 3, "y": 58.38306, "z": "25th" },
-    { "x": 4, "y": 60.63, "z": "25th" },
-    { "x": 5, "y": 62.53451, "z": "25th" },
-    { "x": 6, "y": 64.20243, "z": "25th" },
-    { "x": 7, "y": 65.72562, "z": "25th" },
-    { "x": 8, "y": 67.15464, "z": "25th" },
-    { "x": 9, "y": 68.51411, "z": "25th" },
-    { "x": 10, "y": 69.81746, "z": "25th" },
-    { "x": 11, "y": 71.07075, "z": "25th" },
-    { "x": 12, "y": 72.2782, "z": "25th" },
-    { "x": 13, "y": 73.44396, "z": "25th" },
-    { "x": 14, "y": 74.57133, "z": "25th" },
-    { "x": 15, "y": 75.66234, "z": "25th" },
-    { "x": 16, "y": 76.72069, "z": "25th" },
-    { "x": 17, "y": 77.74936, "z": "25th" },
-    { "x": 18, "y": 78.74927, "z": "25th" },
-    { "x": 19, "y": 79.72293, "z": "25th" },
-    { "x": 20, "y": 80.67144, "z": "25th" },
-    { "x": 21, "y": 81.59662, "z": "25th" },
-    { "x": 22, "y": 82.49946, "z": "25th" },
-    { "x": 23, "y": 83.3796, "z": "25th" },
-    { "x": 24, "y": 84.23889, "z": "25th" },
-    { "x": 0, "y": 49.1477, "z": "50th" },
-    { "x": 1, "y": 53.6872, "z": "50th" },
-    { "x": 2, "y": 57.0673, "z": "50th" },
-    { "x": 3, "y": 59.8029, "z": "50th" },
-    { "x": 4, "y": 62.0899, "z": "50th" },
-    { "x": 5, "y": 64.0301, "z": "50th" },
-    { "x": 6, "y": 65.7311, "z": "50th" },
-    { "x": 7, "y": 67.2873, "z": "50th" },
-    { "x": 8, "y": 68.7498, "z": "50th" },
-    { "x": 9, "y": 70.1435, "z": "50th" },
-    { "x": 10, "y": 71.4818, "z": "50th" },
-    { "x": 11, "y": 72.771, "z": "50th" },
-    { "x": 12, "y": 74.015, "z": "50th" },
-    { "x": 13, "y": 75.2176, "z": "50th" },
-    { "x": 14, "y": 76.3817, "z": "50th" },
-    { "x": 15, "y": 77.5099, "z": "50th" },
-    { "x": 16, "y": 78.6055, "z": "50th" },
-    { "x": 17, "y": 79.671, "z": "50th" },
-    { "x": 18, "y": 80.7079, "z": "50th" },
-    { "x": 19, "y": 81.7182, "z": "50th" },
-    { "x": 20, "y": 82.7036, "z": "50th" },
-    { "x": 21, "y": 83.6654, "z": "50th" },
-    { "x": 22, "y": 84.604, "z": "50th" },
-    { "x": 23, "y": 85.5202, "z": "50th" },
-    { "x": 24, "y": 86.4153, "z": "50th" },
-    { "x": 0, "y": 50.40407, "z": "75th" },
-    { "x": 1, "y": 55.0053, "z": "75th" },
-    { "x": 2, "y": 58.44067, "z": "75th" },
-    { "x": 3, "y": 61.22274, "z": "75th" },
-    { "x": 4, "y": 63.5498, "z": "75th" },
-    { "x": 5, "y": 65.52569, "z": "75th" },
-    { "x": 6, "y": 67.25977, "z": "75th" },
-    { "x": 7, "y": 68.84898, "z": "75th" },
-    { "x": 8, "y": 70.34496, "z": "75th" },
-    { "x": 9, "y": 71.77289, "z": "75th" },
-    { "x": 10, "y": 73.14614, "z": "75th" },
-    { "x": 11, "y": 74.47125, "z": "75th" },
-    { "x": 12, "y": 75.7518, "z": "75th" },
-    { "x": 13, "y": 76.99124, "z": "75th" },
-    { "x": 14, "y": 78.19207, "z": "75th" },
-    { "x": 15, "y": 79.35746, "z": "75th" },
-    { "x": 16, "y": 80.49031, "z": "75th" },
-    { "x": 17, "y": 81.59264, "z": "75th" },
-    { "x": 18, "y": 82.66653, "z": "75th" },
-    { "x": 19, "y": 83.71347, "z": "75th" },
-    { "x": 20, "y": 84.73576, "z": "75th" },
-    { "x": 21, "y": 85.73418, "z": "75th" },
-    { "x": 22, "y": 86.70854, "z": "75th" },
-    { "x": 23, "y": 87.6608, "z": "75th" },
-    { "x": 24, "y": 88.59171, "z": "75th" },
-    { "x": 0, "y": 51.53484, "z": "90th" },
-    { "x": 1, "y": 56.19163, "z": "90th" },
-    { "x": 2, "y": 59.67675, "z": "90th" },
-    { "x": 3, "y": 62.50065, "z": "90th" },
-    { "x": 4, "y": 64.86376, "z": "90th" },
-    { "x": 5, "y": 66.87176, "z": "90th" },
-    { "x": 6, "y": 68.63562, "z": "90th" },
-    { "x": 7, "y": 70.25455, "z": "90th" },
-    { "x": 8, "y": 71.78066, "z": "90th" },
-    { "x": 9, "y": 73.2394, "z": "90th" },
-    { "x": 10, "y": 74.64409, "z": "90th" },
-    { "x": 11, "y": 76.00152, "z": "90th" },
-    { "x": 12, "y": 77.31497, "z": "90th" },
-    { "x": 13, "y": 78.58758, "z": "90th" },
-    { "x": 14, "y": 79.82145, "z": "90th" },
-    { "x": 15, "y": 81.02033, "z": "90th" },
-    { "x": 16, "y": 82.1867, "z": "90th" },
-    { "x": 17, "y": 83.32219, "z": "90th" },
-    { "x": 18, "y": 84.42936, "z": "90th" },
-    { "x": 19, "y": 85.50928, "z": "90th" },
-    { "x": 20, "y": 86.56478, "z": "90th" },
-    { "x": 21, "y": 87.59614, "z": "90th" },
-    { "x": 22, "y": 88.60269, "z": "90th" },
-    { "x": 23, "y": 89.5874, "z": "90th" },
-    { "x": 24, "y": 90.55054, "z": "90th" },
-    { "x": 0, "y": 52.21157, "z": "95th" },
-    { "x": 1, "y": 56.9016, "z": "95th" },
-    { "x": 2, "y": 60.41649, "z": "95th" },
-    { "x": 3, "y": 63.26542, "z": "95th" },
-    { "x": 4, "y": 65.65011, "z": "95th" },
-    { "x": 5, "y": 67.67734, "z": "95th" },
-    { "x": 6, "y": 69.45901, "z": "95th" },
-    { "x": 7, "y": 71.09572, "z": "95th" },
-    { "x": 8, "y": 72.63987, "z": "95th" },
-    { "x": 9, "y": 74.11704, "z": "95th" },
-    { "x": 10, "y": 75.54056, "z": "95th" },
-    { "x": 11, "y": 76.91733, "z": "95th" },
-    { "x": 12, "y": 78.25047, "z": "95th" },
-    { "x": 13, "y": 79.54292, "z": "95th" },
-    { "x": 14, "y": 80.79657, "z": "95th" },
-    { "x": 15, "y": 82.01548, "z": "95th" },
-    { "x": 16, "y": 83.20192, "z": "95th" },
-    { "x": 17, "y": 84.35725, "z": "95th" },
-    { "x": 18, "y": 85.48434, "z": "95th" },
-    { "x": 19, "y": 86.584, "z": "95th" },
-    { "x": 20, "y": 87.65937, "z": "95th" },
-    { "x": 21, "y": 88.71045, "z": "95th" },
-    { "x": 22, "y": 89.73626, "z": "95th" },
-    { "x": 23, "y": 90.7404, "z": "95th" },
-    { "x": 24, "y": 91.72283, "z": "95th" },
-    { "x": 0, "y": 52.8730957, "z": "98th" },
-    { "x": 1, "y": 57.5956282, "z": "98th" },
-    { "x": 2, "y": 61.1396225, "z": "98th" },
-    { "x": 3, "y": 64.0130242, "z": "98th" },
-    { "x": 4, "y": 66.4188078, "z": "98th" },
-    { "x": 5, "y": 68.4648247, "z": "98th" },
-    { "x": 6, "y": 70.2639167, "z": "98th" },
-    { "x": 7, "y": 71.918012, "z": "98th" },
-    { "x": 8, "y": 73.4797862, "z": "98th" },
-    { "x": 9, "y": 74.9749843, "z": "98th" },
-    { "x": 10, "y": 76.4169035, "z": "98th" },
-    { "x": 11, "y": 77.8125749, "z": "98th" },
-    { "x": 12, "y": 79.1649637, "z": "98th" },
-    { "x": 13, "y": 80.4768146, "z": "98th" },
-    { "x": 14, "y": 81.7498059, "z": "98th" },
-    { "x": 15, "y": 82.9882997, "z": "98th" },
-    { "x": 16, "y": 84.1943511, "z": "98th" },
-    { "x": 17, "y": 85.3690699, "z": "98th" },
-    { "x": 18, "y": 86.5156405, "z": "98th" },
-    { "x": 19, "y": 87.6345977, "z": "98th" },
-    { "x": 20, "y": 88.7293843, "z": "98th" },
-    { "x": 21, "y": 89.7997471, "z": "98th" },
-    { "x": 22, "y": 90.844391, "z": "98th" },
-    { "x": 23, "y": 91.8675092, "z": "98th" },
-    { "x": 24, "y": 92.8687946, "z": "98th" }
-]
\ No newline at end of file
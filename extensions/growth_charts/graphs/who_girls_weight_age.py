@@ -1,202 +0,0 @@
-who_girls_weight_age = [
-    { "x": 0, "y": 2.532145, "z": "5th" },
-    { "x": 1, "y": 3.326209, "z": "5th" },
-    { "x": 2, "y": 4.13172, "z": "5th" },
-    { "x": 3, "y": 4.745935, "z": "5th" },
-    { "x": 4, "y": 5.238858, "z": "5th" },
-    { "x": 5, "y": 5.642267, "z": "5th" },
-    { "x": 6, "y": 5.97888, "z": "5th" },
-    { "x": 7, "y": 6.267836, "z": "5th" },
-    { "x": 8, "y": 6.522061, "z": "5th" },
-    { "x": 9, "y": 6.750018, "z": "5th" },
-    { "x": 10, "y": 6.958886, "z": "5th" },
-    { "x": 11, "y": 7.15483, "z": "5th" },
-    { "x": 12, "y": 7.342376, "z": "5th" },
-    { "x": 13, "y": 7.524538, "z": "5th" },
-    { "x": 14, "y": 7.70313, "z": "5th" },
-    { "x": 15, "y": 7.879566, "z": "5th" },
-    { "x": 16, "y": 8.054179, "z": "5th" },
-    { "x": 17, "y": 8.227652, "z": "5th" },
-    { "x": 18, "y": 8.399952, "z": "5th" },
-    { "x": 19, "y": 8.570832, "z": "5th" },
-    { "x": 20, "y": 8.74076, "z": "5th" },
-    { "x": 21, "y": 8.909946, "z": "5th" },
-    { "x": 22, "y": 9.078906, "z": "5th" },
-    { "x": 23, "y": 9.247632, "z": "5th" },
-    { "x": 24, "y": 9.416516, "z": "5th" },
-    { "x": 0, "y": 2.677725, "z": "10th" },
-    { "x": 1, "y": 3.502477, "z": "10th" },
-    { "x": 2, "y": 4.335355, "z": "10th" },
-    { "x": 3, "y": 4.970282, "z": "10th" },
-    { "x": 4, "y": 5.480078, "z": "10th" },
-    { "x": 5, "y": 5.897544, "z": "10th" },
-    { "x": 6, "y": 6.246243, "z": "10th" },
-    { "x": 7, "y": 6.546104, "z": "10th" },
-    { "x": 8, "y": 6.810403, "z": "10th" },
-    { "x": 9, "y": 7.047717, "z": "10th" },
-    { "x": 10, "y": 7.265345, "z": "10th" },
-    { "x": 11, "y": 7.46957, "z": "10th" },
-    { "x": 12, "y": 7.665043, "z": "10th" },
-    { "x": 13, "y": 7.854825, "z": "10th" },
-    { "x": 14, "y": 8.040838, "z": "10th" },
-    { "x": 15, "y": 8.224501, "z": "10th" },
-    { "x": 16, "y": 8.406286, "z": "10th" },
-    { "x": 17, "y": 8.586898, "z": "10th" },
-    { "x": 18, "y": 8.766325, "z": "10th" },
-    { "x": 19, "y": 8.944403, "z": "10th" },
-    { "x": 20, "y": 9.121584, "z": "10th" },
-    { "x": 21, "y": 9.298148, "z": "10th" },
-    { "x": 22, "y": 9.474611, "z": "10th" },
-    { "x": 23, "y": 9.651002, "z": "10th" },
-    { "x": 24, "y": 9.827655, "z": "10th" },
-    { "x": 0, "y": 2.932331, "z": "25th" },
-    { "x": 1, "y": 3.814261, "z": "25th" },
-    { "x": 2, "y": 4.695944, "z": "25th" },
-    { "x": 3, "y": 5.368044, "z": "25th" },
-    { "x": 4, "y": 5.90832, "z": "25th" },
-    { "x": 5, "y": 6.351329, "z": "25th" },
-    { "x": 6, "y": 6.72212, "z": "25th" },
-    { "x": 7, "y": 7.042017, "z": "25th" },
-    { "x": 8, "y": 7.324907, "z": "25th" },
-    { "x": 9, "y": 7.579535, "z": "25th" },
-    { "x": 10, "y": 7.813398, "z": "25th" },
-    { "x": 11, "y": 8.032975, "z": "25th" },
-    { "x": 12, "y": 8.24313, "z": "25th" },
-    { "x": 13, "y": 8.446994, "z": "25th" },
-    { "x": 14, "y": 8.646697, "z": "25th" },
-    { "x": 15, "y": 8.843658, "z": "25th" },
-    { "x": 16, "y": 9.038616, "z": "25th" },
-    { "x": 17, "y": 9.232317, "z": "25th" },
-    { "x": 18, "y": 9.424795, "z": "25th" },
-    { "x": 19, "y": 9.616043, "z": "25th" },
-    { "x": 20, "y": 9.806487, "z": "25th" },
-    { "x": 21, "y": 9.996544, "z": "25th" },
-    { "x": 22, "y": 10.18672, "z": "25th" },
-    { "x": 23, "y": 10.37713, "z": "25th" },
-    { "x": 24, "y": 10.56799, "z": "25th" },
-    { "x": 0, "y": 3.2322, "z": "50th" },
-    { "x": 1, "y": 4.1873, "z": "50th" },
-    { "x": 2, "y": 5.1282, "z": "50th" },
-    { "x": 3, "y": 5.8458, "z": "50th" },
-    { "x": 4, "y": 6.4237, "z": "50th" },
-    { "x": 5, "y": 6.8985, "z": "50th" },
-    { "x": 6, "y": 7.297, "z": "50th" },
-    { "x": 7, "y": 7.6422, "z": "50th" },
-    { "x": 8, "y": 7.9487, "z": "50th" },
-    { "x": 9, "y": 8.2254, "z": "50th" },
-    { "x": 10, "y": 8.48, "z": "50th" },
-    { "x": 11, "y": 8.7192, "z": "50th" },
-    { "x": 12, "y": 8.9481, "z": "50th" },
-    { "x": 13, "y": 9.1699, "z": "50th" },
-    { "x": 14, "y": 9.387, "z": "50th" },
-    { "x": 15, "y": 9.6008, "z": "50th" },
-    { "x": 16, "y": 9.8124, "z": "50th" },
-    { "x": 17, "y": 10.0226, "z": "50th" },
-    { "x": 18, "y": 10.2315, "z": "50th" },
-    { "x": 19, "y": 10.4393, "z": "50th" },
-    { "x": 20, "y": 10.6464, "z": "50th" },
-    { "x": 21, "y": 10.8534, "z": "50th" },
-    { "x": 22, "y": 11.0608, "z": "50th" },
-    { "x": 23, "y": 11.2688, "z": "50th" },
-    { "x": 24, "y": 11.4775, "z": "50th" },
-    { "x": 0, "y": 3.55035, "z": "75th" },
-    { "x": 1, "y": 4.590075, "z": "75th" },
-    { "x": 2, "y": 5.596104, "z": "75th" },
-    { "x": 3, "y": 6.364222, "z": "75th" },
-    { "x": 4, "y": 6.984281, "z": "75th" },
-    { "x": 5, "y": 7.495018, "z": "75th" },
-    { "x": 6, "y": 7.925102, "z": "75th" },
-    { "x": 7, "y": 8.299352, "z": "75th" },
-    { "x": 8, "y": 8.633118, "z": "75th" },
-    { "x": 9, "y": 8.935413, "z": "75th" },
-    { "x": 10, "y": 9.214115, "z": "75th" },
-    { "x": 11, "y": 9.476145, "z": "75th" },
-    { "x": 12, "y": 9.726833, "z": "75th" },
-    { "x": 13, "y": 9.969431, "z": "75th" },
-    { "x": 14, "y": 10.20666, "z": "75th" },
-    { "x": 15, "y": 10.43988, "z": "75th" },
-    { "x": 16, "y": 10.67062, "z": "75th" },
-    { "x": 17, "y": 10.89976, "z": "75th" },
-    { "x": 18, "y": 11.12747, "z": "75th" },
-    { "x": 19, "y": 11.3542, "z": "75th" },
-    { "x": 20, "y": 11.58033, "z": "75th" },
-    { "x": 21, "y": 11.80669, "z": "75th" },
-    { "x": 22, "y": 12.03376, "z": "75th" },
-    { "x": 23, "y": 12.26184, "z": "75th" },
-    { "x": 24, "y": 12.49092, "z": "75th" },
-    { "x": 0, "y": 3.852667, "z": "90th" },
-    { "x": 1, "y": 4.979539, "z": "90th" },
-    { "x": 2, "y": 6.049862, "z": "90th" },
-    { "x": 3, "y": 6.868317, "z": "90th" },
-    { "x": 4, "y": 7.530756, "z": "90th" },
-    { "x": 5, "y": 8.077933, "z": "90th" },
-    { "x": 6, "y": 8.540297, "z": "90th" },
-    { "x": 7, "y": 8.94444, "z": "90th" },
-    { "x": 8, "y": 9.306424, "z": "90th" },
-    { "x": 9, "y": 9.63531, "z": "90th" },
-    { "x": 10, "y": 9.939115, "z": "90th" },
-    { "x": 11, "y": 10.22495, "z": "90th" },
-    { "x": 12, "y": 10.49835, "z": "90th" },
-    { "x": 13, "y": 10.76258, "z": "90th" },
-    { "x": 14, "y": 11.02071, "z": "90th" },
-    { "x": 15, "y": 11.27403, "z": "90th" },
-    { "x": 16, "y": 11.52454, "z": "90th" },
-    { "x": 17, "y": 11.77319, "z": "90th" },
-    { "x": 18, "y": 12.02024, "z": "90th" },
-    { "x": 19, "y": 12.26642, "z": "90th" },
-    { "x": 20, "y": 12.51209, "z": "90th" },
-    { "x": 21, "y": 12.75831, "z": "90th" },
-    { "x": 22, "y": 13.00554, "z": "90th" },
-    { "x": 23, "y": 13.25422, "z": "90th" },
-    { "x": 24, "y": 13.50419, "z": "90th" },
-    { "x": 0, "y": 4.040959, "z": "95th" },
-    { "x": 1, "y": 5.225436, "z": "95th" },
-    { "x": 2, "y": 6.337067, "z": "95th" },
-    { "x": 3, "y": 7.188096, "z": "95th" },
-    { "x": 4, "y": 7.87815, "z": "95th" },
-    { "x": 5, "y": 8.449225, "z": "95th" },
-    { "x": 6, "y": 8.93289, "z": "95th" },
-    { "x": 7, "y": 9.356859, "z": "95th" },
-    { "x": 8, "y": 9.737639, "z": "95th" },
-    { "x": 9, "y": 10.08429, "z": "95th" },
-    { "x": 10, "y": 10.4049, "z": "95th" },
-    { "x": 11, "y": 10.7067, "z": "95th" },
-    { "x": 12, "y": 10.99531, "z": "95th" },
-    { "x": 13, "y": 11.27401, "z": "95th" },
-    { "x": 14, "y": 11.54612, "z": "95th" },
-    { "x": 15, "y": 11.81285, "z": "95th" },
-    { "x": 16, "y": 12.07652, "z": "95th" },
-    { "x": 17, "y": 12.33814, "z": "95th" },
-    { "x": 18, "y": 12.59804, "z": "95th" },
-    { "x": 19, "y": 12.85712, "z": "95th" },
-    { "x": 20, "y": 13.11573, "z": "95th" },
-    { "x": 21, "y": 13.37511, "z": "95th" },
-    { "x": 22, "y": 13.6357, "z": "95th" },
-    { "x": 23, "y": 13.89801, "z": "95th" },
-    { "x": 24, "y": 14.16181, "z": "95th" },
-    { "x": 0, "y": 4.23043, "z": "98th" },
-    { "x": 1, "y": 5.475454, "z": "98th" },
-    { "x": 2, "y": 6.629679, "z": "98th" },
-    { "x": 3, "y": 7.51448, "z": "98th" },
-    { "x": 4, "y": 8.233311, "z": "98th" },
-    { "x": 5, "y": 8.829415, "z": "98th" },
-    { "x": 6, "y": 9.335491, "z": "98th" },
-    { "x": 7, "y": 9.780399, "z": "98th" },
-    { "x": 8, "y": 10.181094, "z": "98th" },
-    { "x": 9, "y": 10.546619, "z": "98th" },
-    { "x": 10, "y": 10.885105, "z": "98th" },
-    { "x": 11, "y": 11.203888, "z": "98th" },
-    { "x": 12, "y": 11.508699, "z": "98th" },
-    { "x": 13, "y": 11.802811, "z": "98th" },
-    { "x": 14, "y": 12.089777, "z": "98th" },
-    { "x": 15, "y": 12.370737, "z": "98th" },
-    { "x": 16, "y": 12.648367, "z": "98th" },
-    { "x": 17, "y": 12.923724, "z": "98th" },
-    { "x": 18, "y": 13.197211, "z": "98th" },
-    { "x": 19, "y": 13.469923, "z": "98th" },
-    { "x": 20, "y": 13.742203, "z": "98th" },
-    { "x": 21, "y": 14.015488, "z": "98th" },
-    { "x": 22, "y": 14.290176, "z": "98th" },
-    { "x": 23, "y": 14.566876, "z": "98th" },
-    { "x": 24, "y": 14.845286, "z": "98th" }
-]
\ No newline at end of file
@@ -1,1050 +0,0 @@
-who_girls_weight_length = [
-    { "x": 45, "y": 2.129751, "z": "5th"},
-    { "x": 45.5, "y": 2.203182, "z": "5th" },
-    { "x": 46, "y": 2.276517, "z": "5th" },
-    { "x": 46.5, "y": 2.34988, "z": "5th" },
-    { "x": 47, "y": 2.423458, "z": "5th" },
-    { "x": 47.5, "y": 2.497718, "z": "5th" },
-    { "x": 48, "y": 2.573181, "z": "5th" },
-    { "x": 48.5, "y": 2.650451, "z": "5th" },
-    { "x": 49, "y": 2.730221, "z": "5th" },
-    { "x": 49.5, "y": 2.813094, "z": "5th" },
-    { "x": 50, "y": 2.899244, "z": "5th" },
-    { "x": 50.5, "y": 2.98893, "z": "5th" },
-    { "x": 51, "y": 3.082063, "z": "5th" },
-    { "x": 51.5, "y": 3.178559, "z": "5th" },
-    { "x": 52, "y": 3.278363, "z": "5th" },
-    { "x": 52.5, "y": 3.381404, "z": "5th" },
-    { "x": 53, "y": 3.487286, "z": "5th" },
-    { "x": 53.5, "y": 3.595865, "z": "5th" },
-    { "x": 54, "y": 3.706646, "z": "5th" },
-    { "x": 54.5, "y": 3.819142, "z": "5th" },
-    { "x": 55, "y": 3.932921, "z": "5th" },
-    { "x": 55.5, "y": 4.04755, "z": "5th" },
-    { "x": 56, "y": 4.162683, "z": "5th" },
-    { "x": 56.5, "y": 4.278128, "z": "5th" },
-    { "x": 57, "y": 4.393408, "z": "5th" },
-    { "x": 57.5, "y": 4.508656, "z": "5th" },
-    { "x": 58, "y": 4.623793, "z": "5th" },
-    { "x": 58.5, "y": 4.738318, "z": "5th" },
-    { "x": 59, "y": 4.851972, "z": "5th" },
-    { "x": 59.5, "y": 4.964486, "z": "5th" },
-    { "x": 60, "y": 5.075701, "z": "5th" },
-    { "x": 60.5, "y": 5.185529, "z": "5th" },
-    { "x": 61, "y": 5.294055, "z": "5th" },
-    { "x": 61.5, "y": 5.401368, "z": "5th" },
-    { "x": 62, "y": 5.507474, "z": "5th" },
-    { "x": 62.5, "y": 5.612202, "z": "5th" },
-    { "x": 63, "y": 5.715727, "z": "5th" },
-    { "x": 63.5, "y": 5.818222, "z": "5th" },
-    { "x": 64, "y": 5.919864, "z": "5th" },
-    { "x": 64.5, "y": 6.020479, "z": "5th" },
-    { "x": 65, "y": 6.120247, "z": "5th" },
-    { "x": 65.5, "y": 6.218991, "z": "5th" },
-    { "x": 66, "y": 6.316808, "z": "5th" },
-    { "x": 66.5, "y": 6.413417, "z": "5th" },
-    { "x": 67, "y": 6.508928, "z": "5th" },
-    { "x": 67.5, "y": 6.603417, "z": "5th" },
-    { "x": 68, "y": 6.696814, "z": "5th" },
-    { "x": 68.5, "y": 6.789085, "z": "5th" },
-    { "x": 69, "y": 6.880527, "z": "5th" },
-    { "x": 69.5, "y": 6.971011, "z": "5th" },
-    { "x": 70, "y": 7.060842, "z": "5th" },
-    { "x": 70.5, "y": 7.149824, "z": "5th" },
-    { "x": 71, "y": 7.238303, "z": "5th" },
-    { "x": 71.5, "y": 7.326367, "z": "5th" },
-    { "x": 72, "y": 7.413956, "z": "5th" },
-    { "x": 72.5, "y": 7.500756, "z": "5th" },
-    { "x": 73, "y": 7.586879, "z": "5th" },
-    { "x": 73.5, "y": 7.672153, "z": "5th" },
-    { "x": 74, "y": 7.756351, "z": "5th" },
-    { "x": 74.5, "y": 7.839407, "z": "5th" },
-    { "x": 75, "y": 7.921476, "z": "5th" },
-    { "x": 75.5, "y": 8.002572, "z": "5th" },
-    { "x": 76, "y": 8.08303, "z": "5th" },
-    { "x": 76.5, "y": 8.163159, "z": "5th" },
-    { "x": 77, "y": 8.24309, "z": "5th" },
-    { "x": 77.5, "y": 8.323686, "z": "5th" },
-    { "x": 78, "y": 8.405079, "z": "5th" },
-    { "x": 78.5, "y": 8.487483, "z": "5th" },
-    { "x": 79, "y": 8.571423, "z": "5th" },
-    { "x": 79.5, "y": 8.656893, "z": "5th" },
-    { "x": 80, "y": 8.744286, "z": "5th" },
-    { "x": 80.5, "y": 8.833949, "z": "5th" },
-    { "x": 81, "y": 8.925709, "z": "5th" },
-    { "x": 81.5, "y": 9.019686, "z": "5th" },
-    { "x": 82, "y": 9.115672, "z": "5th" },
-    { "x": 82.5, "y": 9.21361, "z": "5th" },
-    { "x": 83, "y": 9.313642, "z": "5th" },
-    { "x": 83.5, "y": 9.415507, "z": "5th" },
-    { "x": 84, "y": 9.519058, "z": "5th" },
-    { "x": 84.5, "y": 9.624179, "z": "5th" },
-    { "x": 85, "y": 9.730633, "z": "5th" },
-    { "x": 85.5, "y": 9.838068, "z": "5th" },
-    { "x": 86, "y": 9.946702, "z": "5th" },
-    { "x": 86.5, "y": 10.05564, "z": "5th" },
-    { "x": 87, "y": 10.16501, "z": "5th" },
-    { "x": 87.5, "y": 10.27429, "z": "5th" },
-    { "x": 88, "y": 10.38332, "z": "5th" },
-    { "x": 88.5, "y": 10.49193, "z": "5th" },
-    { "x": 89, "y": 10.60026, "z": "5th" },
-    { "x": 89.5, "y": 10.708, "z": "5th" },
-    { "x": 90, "y": 10.81555, "z": "5th" },
-    { "x": 90.5, "y": 10.92274, "z": "5th" },
-    { "x": 91, "y": 11.02957, "z": "5th" },
-    { "x": 91.5, "y": 11.13605, "z": "5th" },
-    { "x": 92, "y": 11.24251, "z": "5th" },
-    { "x": 92.5, "y": 11.34904, "z": "5th" },
-    { "x": 93, "y": 11.45529, "z": "5th" },
-    { "x": 93.5, "y": 11.56159, "z": "5th" },
-    { "x": 94, "y": 11.66814, "z": "5th" },
-    { "x": 94.5, "y": 11.77509, "z": "5th" },
-    { "x": 95, "y": 11.88227, "z": "5th" },
-    { "x": 95.5, "y": 11.98993, "z": "5th" },
-    { "x": 96, "y": 12.09808, "z": "5th" },
-    { "x": 96.5, "y": 12.20698, "z": "5th" },
-    { "x": 97, "y": 12.31643, "z": "5th" },
-    { "x": 97.5, "y": 12.42689, "z": "5th" },
-    { "x": 98, "y": 12.53825, "z": "5th" },
-    { "x": 98.5, "y": 12.65066, "z": "5th" },
-    { "x": 99, "y": 12.76488, "z": "5th" },
-    { "x": 99.5, "y": 12.88022, "z": "5th" },
-    { "x": 100, "y": 12.99761, "z": "5th" },
-    { "x": 100.5, "y": 13.11663, "z": "5th" },
-    { "x": 101, "y": 13.23779, "z": "5th" },
-    { "x": 101.5, "y": 13.36076, "z": "5th" },
-    { "x": 102, "y": 13.48572, "z": "5th" },
-    { "x": 102.5, "y": 13.613, "z": "5th" },
-    { "x": 103, "y": 13.74212, "z": "5th" },
-    { "x": 103.5, "y": 13.87346, "z": "5th" },
-    { "x": 104, "y": 14.00677, "z": "5th" },
-    { "x": 104.5, "y": 14.14187, "z": "5th" },
-    { "x": 105, "y": 14.27927, "z": "5th" },
-    { "x": 105.5, "y": 14.41863, "z": "5th" },
-    { "x": 106, "y": 14.55992, "z": "5th" },
-    { "x": 106.5, "y": 14.70378, "z": "5th" },
-    { "x": 107, "y": 14.84983, "z": "5th" },
-    { "x": 107.5, "y": 14.99821, "z": "5th" },
-    { "x": 108, "y": 15.14886, "z": "5th" },
-    { "x": 108.5, "y": 15.30215, "z": "5th" },
-    { "x": 109, "y": 15.45761, "z": "5th" },
-    { "x": 109.5, "y": 15.61539, "z": "5th" },
-    { "x": 110, "y": 15.77532, "z": "5th" },
-    { "x": 45, "y": 2.197295 , "z": "10th"},
-    { "x": 45.5, "y": 2.273085, "z": "10th" },
-    { "x": 46, "y": 2.348778, "z": "10th" },
-    { "x": 46.5, "y": 2.424493, "z": "10th" },
-    { "x": 47, "y": 2.50044, "z": "10th" },
-    { "x": 47.5, "y": 2.577093, "z": "10th" },
-    { "x": 48, "y": 2.654989, "z": "10th" },
-    { "x": 48.5, "y": 2.734752, "z": "10th" },
-    { "x": 49, "y": 2.817095, "z": "10th" },
-    { "x": 49.5, "y": 2.902644, "z": "10th" },
-    { "x": 50, "y": 2.991576, "z": "10th" },
-    { "x": 50.5, "y": 3.084158, "z": "10th" },
-    { "x": 51, "y": 3.180301, "z": "10th" },
-    { "x": 51.5, "y": 3.279915, "z": "10th" },
-    { "x": 52, "y": 3.382958, "z": "10th" },
-    { "x": 52.5, "y": 3.489332, "z": "10th" },
-    { "x": 53, "y": 3.598641, "z": "10th" },
-    { "x": 53.5, "y": 3.710748, "z": "10th" },
-    { "x": 54, "y": 3.825119, "z": "10th" },
-    { "x": 54.5, "y": 3.941262, "z": "10th" },
-    { "x": 55, "y": 4.058733, "z": "10th" },
-    { "x": 55.5, "y": 4.177084, "z": "10th" },
-    { "x": 56, "y": 4.295958, "z": "10th" },
-    { "x": 56.5, "y": 4.415143, "z": "10th" },
-    { "x": 57, "y": 4.534174, "z": "10th" },
-    { "x": 57.5, "y": 4.653161, "z": "10th" },
-    { "x": 58, "y": 4.772019, "z": "10th" },
-    { "x": 58.5, "y": 4.890248, "z": "10th" },
-    { "x": 59, "y": 5.007579, "z": "10th" },
-    { "x": 59.5, "y": 5.123718, "z": "10th" },
-    { "x": 60, "y": 5.238517, "z": "10th" },
-    { "x": 60.5, "y": 5.351886, "z": "10th" },
-    { "x": 61, "y": 5.463893, "z": "10th" },
-    { "x": 61.5, "y": 5.574631, "z": "10th" },
-    { "x": 62, "y": 5.684122, "z": "10th" },
-    { "x": 62.5, "y": 5.792171, "z": "10th" },
-    { "x": 63, "y": 5.898977, "z": "10th" },
-    { "x": 63.5, "y": 6.004718, "z": "10th" },
-    { "x": 64, "y": 6.109558, "z": "10th" },
-    { "x": 64.5, "y": 6.213336, "z": "10th" },
-    { "x": 65, "y": 6.316217, "z": "10th" },
-    { "x": 65.5, "y": 6.418038, "z": "10th" },
-    { "x": 66, "y": 6.518879, "z": "10th" },
-    { "x": 66.5, "y": 6.618491, "z": "10th" },
-    { "x": 67, "y": 6.716946, "z": "10th" },
-    { "x": 67.5, "y": 6.814342, "z": "10th" },
-    { "x": 68, "y": 6.910586, "z": "10th" },
-    { "x": 68.5, "y": 7.005688, "z": "10th" },
-    { "x": 69, "y": 7.099906, "z": "10th" },
-    { "x": 69.5, "y": 7.193158, "z": "10th" },
-    { "x": 70, "y": 7.285707, "z": "10th" },
-    { "x": 70.5, "y": 7.377377, "z": "10th" },
-    { "x": 71, "y": 7.468525, "z": "10th" },
-    { "x": 71.5, "y": 7.559241, "z": "10th" },
-    { "x": 72, "y": 7.649438, "z": "10th" },
-    { "x": 72.5, "y": 7.738841, "z": "10th" },
-    { "x": 73, "y": 7.827544, "z": "10th" },
-    { "x": 73.5, "y": 7.915366, "z": "10th" },
-    { "x": 74, "y": 8.002049, "z": "10th" },
-    { "x": 74.5, "y": 8.087576, "z": "10th" },
-    { "x": 75, "y": 8.172055, "z": "10th" },
-    { "x": 75.5, "y": 8.255554, "z": "10th" },
-    { "x": 76, "y": 8.338363, "z": "10th" },
-    { "x": 76.5, "y": 8.420829, "z": "10th" },
-    { "x": 77, "y": 8.503115, "z": "10th" },
-    { "x": 77.5, "y": 8.586055, "z": "10th" },
-    { "x": 78, "y": 8.669814, "z": "10th" },
-    { "x": 78.5, "y": 8.754641, "z": "10th" },
-    { "x": 79, "y": 8.841019, "z": "10th" },
-    { "x": 79.5, "y": 8.929001, "z": "10th" },
-    { "x": 80, "y": 9.018962, "z": "10th" },
-    { "x": 80.5, "y": 9.111262, "z": "10th" },
-    { "x": 81, "y": 9.20572, "z": "10th" },
-    { "x": 81.5, "y": 9.302492, "z": "10th" },
-    { "x": 82, "y": 9.401333, "z": "10th" },
-    { "x": 82.5, "y": 9.502215, "z": "10th" },
-    { "x": 83, "y": 9.605253, "z": "10th" },
-    { "x": 83.5, "y": 9.71018, "z": "10th" },
-    { "x": 84, "y": 9.816874, "z": "10th" },
-    { "x": 84.5, "y": 9.925186, "z": "10th" },
-    { "x": 85, "y": 10.0349, "z": "10th" },
-    { "x": 85.5, "y": 10.14566, "z": "10th" },
-    { "x": 86, "y": 10.25763, "z": "10th" },
-    { "x": 86.5, "y": 10.36997, "z": "10th" },
-    { "x": 87, "y": 10.48275, "z": "10th" },
-    { "x": 87.5, "y": 10.59545, "z": "10th" },
-    { "x": 88, "y": 10.70793, "z": "10th" },
-    { "x": 88.5, "y": 10.82, "z": "10th" },
-    { "x": 89, "y": 10.9318, "z": "10th" },
-    { "x": 89.5, "y": 11.04301, "z": "10th" },
-    { "x": 90, "y": 11.15403, "z": "10th" },
-    { "x": 90.5, "y": 11.26469, "z": "10th" },
-    { "x": 91, "y": 11.37502, "z": "10th" },
-    { "x": 91.5, "y": 11.48502, "z": "10th" },
-    { "x": 92, "y": 11.59501, "z": "10th" },
-    { "x": 92.5, "y": 11.70507, "z": "10th" },
-    { "x": 93, "y": 11.81489, "z": "10th" },
-    { "x": 93.5, "y": 11.92481, "z": "10th" },
-    { "x": 94, "y": 12.03498, "z": "10th" },
-    { "x": 94.5, "y": 12.14557, "z": "10th" },
-    { "x": 95, "y": 12.25645, "z": "10th" },
-    { "x": 95.5, "y": 12.36787, "z": "10th" },
-    { "x": 96, "y": 12.47979, "z": "10th" },
-    { "x": 96.5, "y": 12.5925, "z": "10th" },
-    { "x": 97, "y": 12.70583, "z": "10th" },
-    { "x": 97.5, "y": 12.8202, "z": "10th" },
-    { "x": 98, "y": 12.93555, "z": "10th" },
-    { "x": 98.5, "y": 13.05204, "z": "10th" },
-    { "x": 99, "y": 13.17036, "z": "10th" },
-    { "x": 99.5, "y": 13.28993, "z": "10th" },
-    { "x": 100, "y": 13.41159, "z": "10th" },
-    { "x": 100.5, "y": 13.53502, "z": "10th" },
-    { "x": 101, "y": 13.66063, "z": "10th" },
-    { "x": 101.5, "y": 13.78817, "z": "10th" },
-    { "x": 102, "y": 13.91781, "z": "10th" },
-    { "x": 102.5, "y": 14.04981, "z": "10th" },
-    { "x": 103, "y": 14.18382, "z": "10th" },
-    { "x": 103.5, "y": 14.32009, "z": "10th" },
-    { "x": 104, "y": 14.45845, "z": "10th" },
-    { "x": 104.5, "y": 14.59872, "z": "10th" },
-    { "x": 105, "y": 14.74134, "z": "10th" },
-    { "x": 105.5, "y": 14.88603, "z": "10th" },
-    { "x": 106, "y": 15.03279, "z": "10th" },
-    { "x": 106.5, "y": 15.18217, "z": "10th" },
-    { "x": 107, "y": 15.33388, "z": "10th" },
-    { "x": 107.5, "y": 15.48801, "z": "10th" },
-    { "x": 108, "y": 15.64456, "z": "10th" },
-    { "x": 108.5, "y": 15.8038, "z": "10th" },
-    { "x": 109, "y": 15.96535, "z": "10th" },
-    { "x": 109.5, "y": 16.12932, "z": "10th" },
-    { "x": 110, "y": 16.29552, "z": "10th" },
-    {"x": 45, "y": 2.316937, "z": "25th"},
-    {"x": 45.5, "y": 2.396908, "z": "25th"},
-    {"x": 46, "y": 2.47678, "z": "25th"},
-    {"x": 46.5, "y": 2.556665, "z": "25th"},
-    {"x": 47, "y": 2.636812, "z": "25th"},
-    {"x": 47.5, "y": 2.717708, "z": "25th"},
-    {"x": 48, "y": 2.799918, "z": "25th"},
-    {"x": 48.5, "y": 2.8841, "z": "25th"},
-    {"x": 49, "y": 2.971008, "z": "25th"},
-    {"x": 49.5, "y": 3.0613, "z": "25th"},
-    {"x": 50, "y": 3.155165, "z": "25th"},
-    {"x": 50.5, "y": 3.252884, "z": "25th"},
-    {"x": 51, "y": 3.354363, "z": "25th"},
-    {"x": 51.5, "y": 3.459507, "z": "25th"},
-    {"x": 52, "y": 3.568293, "z": "25th"},
-    {"x": 52.5, "y": 3.680579, "z": "25th"},
-    {"x": 53, "y": 3.795965, "z": "25th"},
-    {"x": 53.5, "y": 3.91433, "z": "25th"},
-    {"x": 54, "y": 4.035067, "z": "25th"},
-    {"x": 54.5, "y": 4.15768, "z": "25th"},
-    {"x": 55, "y": 4.281698, "z": "25th"},
-    {"x": 55.5, "y": 4.406651, "z": "25th"},
-    {"x": 56, "y": 4.532161, "z": "25th"},
-    {"x": 56.5, "y": 4.657978, "z": "25th"},
-    {"x": 57, "y": 4.783665, "z": "25th"},
-    {"x": 57.5, "y": 4.909283, "z": "25th"},
-    {"x": 58, "y": 5.034741, "z": "25th"},
-    {"x": 58.5, "y": 5.159537, "z": "25th"},
-    {"x": 59, "y": 5.283389, "z": "25th"},
-    {"x": 59.5, "y": 5.405955, "z": "25th"},
-    {"x": 60, "y": 5.527109, "z": "25th"},
-    {"x": 60.5, "y": 5.646756, "z": "25th"},
-    {"x": 61, "y": 5.764934, "z": "25th"},
-    {"x": 61.5, "y": 5.881739, "z": "25th"},
-    {"x": 62, "y": 5.997229, "z": "25th"},
-    {"x": 62.5, "y": 6.111161, "z": "25th"},
-    {"x": 63, "y": 6.223778, "z": "25th"},
-    {"x": 63.5, "y": 6.335269, "z": "25th"},
-    {"x": 64, "y": 6.445771, "z": "25th"},
-    {"x": 64.5, "y": 6.555148, "z": "25th"},
-    {"x": 65, "y": 6.663537, "z": "25th"},
-    {"x": 65.5, "y": 6.770804, "z": "25th"},
-    {"x": 66, "y": 6.876992, "z": "25th"},
-    {"x": 66.5, "y": 6.981917, "z": "25th"},
-    {"x": 67, "y": 7.085578, "z": "25th"},
-    {"x": 67.5, "y": 7.188115, "z": "25th"},
-    {"x": 68, "y": 7.28939, "z": "25th"},
-    {"x": 68.5, "y": 7.389495, "z": "25th"},
-    {"x": 69, "y": 7.48862, "z": "25th"},
-    {"x": 69.5, "y": 7.586761, "z": "25th"},
-    {"x": 70, "y": 7.684113, "z": "25th"},
-    {"x": 70.5, "y": 7.780531, "z": "25th"},
-    {"x": 71, "y": 7.876392, "z": "25th"},
-    {"x": 71.5, "y": 7.971789, "z": "25th"},
-    {"x": 72, "y": 8.066588, "z": "25th"},
-    {"x": 72.5, "y": 8.160589, "z": "25th"},
-    {"x": 73, "y": 8.253844, "z": "25th"},
-    {"x": 73.5, "y": 8.346165, "z": "25th"},
-    {"x": 74, "y": 8.437231, "z": "25th"},
-    {"x": 74.5, "y": 8.527118, "z": "25th"},
-    {"x": 75, "y": 8.615846, "z": "25th"},
-    {"x": 75.5, "y": 8.703582, "z": "25th"},
-    {"x": 76, "y": 8.790535, "z": "25th"},
-    {"x": 76.5, "y": 8.87712, "z": "25th"},
-    {"x": 77, "y": 8.96356, "z": "25th"},
-    {"x": 77.5, "y": 9.050631, "z": "25th"},
-    {"x": 78, "y": 9.138558, "z": "25th"},
-    {"x": 78.5, "y": 9.227657, "z": "25th"},
-    {"x": 79, "y": 9.318332, "z": "25th"},
-    {"x": 79.5, "y": 9.410743, "z": "25th"},
-    {"x": 80, "y": 9.505233, "z": "25th"},
-    {"x": 80.5, "y": 9.602181, "z": "25th"},
-    {"x": 81, "y": 9.701398, "z": "25th"},
-    {"x": 81.5, "y": 9.803103, "z": "25th"},
-    {"x": 82, "y": 9.906981, "z": "25th"},
-    {"x": 82.5, "y": 10.01306, "z": "25th"},
-    {"x": 83, "y": 10.12141, "z": "25th"},
-    {"x": 83.5, "y": 10.23174, "z": "25th"},
-    {"x": 84, "y": 10.34399, "z": "25th"},
-    {"x": 84.5, "y": 10.45794, "z": "25th"},
-    {"x": 85, "y": 10.57343, "z": "25th"},
-    {"x": 85.5, "y": 10.69007, "z": "25th"},
-    {"x": 86, "y": 10.80792, "z": "25th"},
-    {"x": 86.5, "y": 10.92628, "z": "25th"},
-    {"x": 87, "y": 11.04512, "z": "25th"},
-    {"x": 87.5, "y": 11.16387, "z": "25th"},
-    {"x": 88, "y": 11.28244, "z": "25th"},
-    {"x": 88.5, "y": 11.40066, "z": "25th"},
-    {"x": 89, "y": 11.51859, "z": "25th"},
-    {"x": 89.5, "y": 11.63596, "z": "25th"},
-    {"x": 90, "y": 11.75315, "z": "25th"},
-    {"x": 90.5, "y": 11.86995, "z": "25th"},
-    {"x": 91, "y": 11.98649, "z": "25th"},
-    {"x": 91.5, "y": 12.10274, "z": "25th"},
-    {"x": 92, "y": 12.21899, "z": "25th"},
-    {"x": 92.5, "y": 12.33533, "z": "25th"},
-    {"x": 93, "y": 12.45148, "z": "25th"},
-    {"x": 93.5, "y": 12.56782, "z": "25th"},
-    {"x": 94, "y": 12.68444, "z": "25th"},
-    {"x": 94.5, "y": 12.80151, "z": "25th"},
-    {"x": 95, "y": 12.91896, "z": "25th"},
-    {"x": 95.5, "y": 13.03707, "z": "25th"},
-    {"x": 96, "y": 13.15572, "z": "25th"},
-    {"x": 96.5, "y": 13.27521, "z": "25th"},
-    {"x": 97, "y": 13.39545, "z": "25th"},
-    {"x": 97.5, "y": 13.5168, "z": "25th"},
-    {"x": 98, "y": 13.63927, "z": "25th"},
-    {"x": 98.5, "y": 13.76304, "z": "25th"},
-    {"x": 99, "y": 13.88867, "z": "25th"},
-    {"x": 99.5, "y": 14.01579, "z": "25th"},
-    {"x": 100, "y": 14.14506, "z": "25th"},
-    {"x": 100.5, "y": 14.27637, "z": "25th"},
-    {"x": 101, "y": 14.40992, "z": "25th"},
-    {"x": 101.5, "y": 14.54561, "z": "25th"},
-    {"x": 102, "y": 14.68363, "z": "25th"},
-    {"x": 102.5, "y": 14.82407, "z": "25th"},
-    {"x": 103, "y": 14.96682, "z": "25th"},
-    {"x": 103.5, "y": 15.11191, "z": "25th"},
-    {"x": 104, "y": 15.2593, "z": "25th"},
-    {"x": 104.5, "y": 15.40883, "z": "25th"},
-    {"x": 105, "y": 15.56077, "z": "25th"},
-    {"x": 105.5, "y": 15.71502, "z": "25th"},
-    {"x": 106, "y": 15.87158, "z": "25th"},
-    {"x": 106.5, "y": 16.03084, "z": "25th"},
-    {"x": 107, "y": 16.19268, "z": "25th"},
-    {"x": 107.5, "y": 16.35711, "z": "25th"},
-    {"x": 108, "y": 16.52422, "z": "25th"},
-    {"x": 108.5, "y": 16.69412, "z": "25th"},
-    {"x": 109, "y": 16.86659, "z": "25th"},
-    {"x": 109.5, "y": 17.04165, "z": "25th"},
-    {"x": 110, "y": 17.2191, "z": "25th"},
-    { "x": 45, "y": 2.4607, "z": "50th"},
-    { "x": 45.5, "y": 2.5457, "z": "50th" },
-    { "x": 46, "y": 2.6306, "z": "50th" },
-    { "x": 46.5, "y": 2.7155, "z": "50th" },
-    { "x": 47, "y": 2.8007, "z": "50th" },
-    { "x": 47.5, "y": 2.8867, "z": "50th" },
-    { "x": 48, "y": 2.9741, "z": "50th" },
-    { "x": 48.5, "y": 3.0636, "z": "50th" },
-    { "x": 49, "y": 3.156, "z": "50th" },
-    { "x": 49.5, "y": 3.252, "z": "50th" },
-    { "x": 50, "y": 3.3518, "z": "50th" },
-    { "x": 50.5, "y": 3.4557, "z": "50th" },
-    { "x": 51, "y": 3.5636, "z": "50th" },
-    { "x": 51.5, "y": 3.6754, "z": "50th" },
-    { "x": 52, "y": 3.7911, "z": "50th" },
-    { "x": 52.5, "y": 3.9105, "z": "50th" },
-    { "x": 53, "y": 4.0332, "z": "50th" },
-    { "x": 53.5, "y": 4.1591, "z": "50th" },
-    { "x": 54, "y": 4.2875, "z": "50th" },
-    { "x": 54.5, "y": 4.4179, "z": "50th" },
-    { "x": 55, "y": 4.5498, "z": "50th" },
-    { "x": 55.5, "y": 4.6827, "z": "50th" },
-    { "x": 56, "y": 4.8162, "z": "50th" },
-    { "x": 56.5, "y": 4.95, "z": "50th" },
-    { "x": 57, "y": 5.0837, "z": "50th" },
-    { "x": 57.5, "y": 5.2173, "z": "50th" },
-    { "x": 58, "y": 5.3507, "z": "50th" },
-    { "x": 58.5, "y": 5.4834, "z": "50th" },
-    { "x": 59, "y": 5.6151, "z": "50th" },
-    { "x": 59.5, "y": 5.7454, "z": "50th" },
-    { "x": 60, "y": 5.8742, "z": "50th" },
-    { "x": 60.5, "y": 6.0014, "z": "50th" },
-    { "x": 61, "y": 6.127, "z": "50th" },
-    { "x": 61.5, "y": 6.2511, "z": "50th" },
-    { "x": 62, "y": 6.3738, "z": "50th" },
-    { "x": 62.5, "y": 6.4948, "z": "50th" },
-    { "x": 63, "y": 6.6144, "z": "50th" },
-    { "x": 63.5, "y": 6.7328, "z": "50th" },
-    { "x": 64, "y": 6.8501, "z": "50th" },
-    { "x": 64.5, "y": 6.9662, "z": "50th" },
-    { "x": 65, "y": 7.0812, "z": "50th" },
-    { "x": 65.5, "y": 7.195, "z": "50th" },
-    { "x": 66, "y": 7.3076, "z": "50th" },
-    { "x": 66.5, "y": 7.4189, "z": "50th" },
-    { "x": 67, "y": 7.5288, "z": "50th" },
-    { "x": 67.5, "y": 7.6375, "z": "50th" },
-    { "x": 68, "y": 7.7448, "z": "50th" },
-    { "x": 68.5, "y": 7.8509, "z": "50th" },
-    { "x": 69, "y": 7.9559, "z": "50th" },
-    { "x": 69.5, "y": 8.0599, "z": "50th" },
-    { "x": 70, "y": 8.163, "z": "50th" },
-    { "x": 70.5, "y": 8.2651, "z": "50th" },
-    { "x": 71, "y": 8.3666, "z": "50th" },
-    { "x": 71.5, "y": 8.4676, "z": "50th" },
-    { "x": 72, "y": 8.5679, "z": "50th" },
-    { "x": 72.5, "y": 8.6674, "z": "50th" },
-    { "x": 73, "y": 8.7661, "z": "50th" },
-    { "x": 73.5, "y": 8.8638, "z": "50th" },
-    { "x": 74, "y": 8.9601, "z": "50th" },
-    { "x": 74.5, "y": 9.0552, "z": "50th" },
-    { "x": 75, "y": 9.149, "z": "50th" },
-    { "x": 75.5, "y": 9.2418, "z": "50th" },
-    { "x": 76, "y": 9.3337, "z": "50th" },
-    { "x": 76.5, "y": 9.4252, "z": "50th" },
-    { "x": 77, "y": 9.5166, "z": "50th" },
-    { "x": 77.5, "y": 9.6086, "z": "50th" },
-    { "x": 78, "y": 9.7015, "z": "50th" },
-    { "x": 78.5, "y": 9.7957, "z": "50th" },
-    { "x": 79, "y": 9.8915, "z": "50th" },
-    { "x": 79.5, "y": 9.9892, "z": "50th" },
-    { "x": 80, "y": 10.0891, "z": "50th" },
-    { "x": 80.5, "y": 10.1916, "z": "50th" },
-    { "x": 81, "y": 10.2965, "z": "50th" },
-    { "x": 81.5, "y": 10.4041, "z": "50th" },
-    { "x": 82, "y": 10.514, "z": "50th" },
-    { "x": 82.5, "y": 10.6263, "z": "50th" },
-    { "x": 83, "y": 10.741, "z": "50th" },
-    { "x": 83.5, "y": 10.8578, "z": "50th" },
-    { "x": 84, "y": 10.9767, "z": "50th" },
-    { "x": 84.5, "y": 11.0974, "z": "50th" },
-    { "x": 85, "y": 11.2198, "z": "50th" },
-    { "x": 85.5, "y": 11.3435, "z": "50th" },
-    { "x": 86, "y": 11.4684, "z": "50th" },
-    { "x": 86.5, "y": 11.594, "z": "50th" },
-    { "x": 87, "y": 11.7201, "z": "50th" },
-    { "x": 87.5, "y": 11.8461, "z": "50th" },
-    { "x": 88, "y": 11.972, "z": "50th" },
-    { "x": 88.5, "y": 12.0976, "z": "50th" },
-    { "x": 89, "y": 12.2229, "z": "50th" },
-    { "x": 89.5, "y": 12.3477, "z": "50th" },
-    { "x": 90, "y": 12.4723, "z": "50th" },
-    { "x": 90.5, "y": 12.5965, "z": "50th" },
-    { "x": 91, "y": 12.7205, "z": "50th" },
-    { "x": 91.5, "y": 12.8443, "z": "50th" },
-    { "x": 92, "y": 12.9681, "z": "50th" },
-    { "x": 92.5, "y": 13.092, "z": "50th" },
-    { "x": 93, "y": 13.2158, "z": "50th" },
-    { "x": 93.5, "y": 13.3399, "z": "50th" },
-    { "x": 94, "y": 13.4643, "z": "50th" },
-    { "x": 94.5, "y": 13.5892, "z": "50th" },
-    { "x": 95, "y": 13.7146, "z": "50th" },
-    { "x": 95.5, "y": 13.8408, "z": "50th" },
-    { "x": 96, "y": 13.9676, "z": "50th" },
-    { "x": 96.5, "y": 14.0953, "z": "50th" },
-    { "x": 97, "y": 14.2239, "z": "50th" },
-    { "x": 97.5, "y": 14.3537, "z": "50th" },
-    { "x": 98, "y": 14.4848, "z": "50th" },
-    { "x": 98.5, "y": 14.6174, "z": "50th" },
-    { "x": 99, "y": 14.7519, "z": "50th" },
-    { "x": 99.5, "y": 14.8882, "z": "50th" },
-    { "x": 100, "y": 15.0267, "z": "50th" },
-    { "x": 100.5, "y": 15.1676, "z": "50th" },
-    { "x": 101, "y": 15.3108, "z": "50th" },
-    { "x": 101.5, "y": 15.4564, "z": "50th" },
-    { "x": 102, "y": 15.6046, "z": "50th" },
-    { "x": 102.5, "y": 15.7553, "z": "50th" },
-    { "x": 103, "y": 15.9087, "z": "50th" },
-    { "x": 103.5, "y": 16.0645, "z": "50th" },
-    { "x": 104, "y": 16.2229, "z": "50th" },
-    { "x": 104.5, "y": 16.3837, "z": "50th" },
-    { "x": 105, "y": 16.547, "z": "50th" },
-    { "x": 105.5, "y": 16.7129, "z": "50th" },
-    { "x": 106, "y": 16.8814, "z": "50th" },
-    { "x": 106.5, "y": 17.0527, "z": "50th" },
-    { "x": 107, "y": 17.2269, "z": "50th" },
-    { "x": 107.5, "y": 17.4039, "z": "50th" },
-    { "x": 108, "y": 17.5839, "z": "50th" },
-    { "x": 108.5, "y": 17.7668, "z": "50th" },
-    { "x": 109, "y": 17.9526, "z": "50th" },
-    { "x": 109.5, "y": 18.1412, "z": "50th" },
-    { "x": 110, "y": 18.3324, "z": "50th" },
-    { "x": 45, "y": 2.617102, "z": "75th"},
-    { "x": 45.5, "y": 2.707579, "z": "75th" },
-    { "x": 46, "y": 2.797955, "z": "75th" },
-    { "x": 46.5, "y": 2.888316, "z": "75th" },
-    { "x": 47, "y": 2.979021, "z": "75th" },
-    { "x": 47.5, "y": 3.070581, "z": "75th" },
-    { "x": 48, "y": 3.163636, "z": "75th" },
-    { "x": 48.5, "y": 3.25893, "z": "75th" },
-    { "x": 49, "y": 3.357314, "z": "75th" },
-    { "x": 49.5, "y": 3.459533, "z": "75th" },
-    { "x": 50, "y": 3.565801, "z": "75th" },
-    { "x": 50.5, "y": 3.676436, "z": "75th" },
-    { "x": 51, "y": 3.791333, "z": "75th" },
-    { "x": 51.5, "y": 3.910385, "z": "75th" },
-    { "x": 52, "y": 4.033622, "z": "75th" },
-    { "x": 52.5, "y": 4.160775, "z": "75th" },
-    { "x": 53, "y": 4.291447, "z": "75th" },
-    { "x": 53.5, "y": 4.425561, "z": "75th" },
-    { "x": 54, "y": 4.562313, "z": "75th" },
-    { "x": 54.5, "y": 4.701201, "z": "75th" },
-    { "x": 55, "y": 4.841693, "z": "75th" },
-    { "x": 55.5, "y": 4.983257, "z": "75th" },
-    { "x": 56, "y": 5.125467, "z": "75th" },
-    { "x": 56.5, "y": 5.267968, "z": "75th" },
-    { "x": 57, "y": 5.410406, "z": "75th" },
-    { "x": 57.5, "y": 5.552707, "z": "75th" },
-    { "x": 58, "y": 5.694762, "z": "75th" },
-    { "x": 58.5, "y": 5.836075, "z": "75th" },
-    { "x": 59, "y": 5.976328, "z": "75th" },
-    { "x": 59.5, "y": 6.115053, "z": "75th" },
-    { "x": 60, "y": 6.252183, "z": "75th" },
-    { "x": 60.5, "y": 6.387612, "z": "75th" },
-    { "x": 61, "y": 6.521295, "z": "75th" },
-    { "x": 61.5, "y": 6.653335, "z": "75th" },
-    { "x": 62, "y": 6.783883, "z": "75th" },
-    { "x": 62.5, "y": 6.912573, "z": "75th" },
-    { "x": 63, "y": 7.039769, "z": "75th" },
-    { "x": 63.5, "y": 7.165684, "z": "75th" },
-    { "x": 64, "y": 7.290375, "z": "75th" },
-    { "x": 64.5, "y": 7.413783, "z": "75th" },
-    { "x": 65, "y": 7.535964, "z": "75th" },
-    { "x": 65.5, "y": 7.656861, "z": "75th" },
-    { "x": 66, "y": 7.77642, "z": "75th" },
-    { "x": 66.5, "y": 7.894642, "z": "75th" },
-    { "x": 67, "y": 8.011313, "z": "75th" },
-    { "x": 67.5, "y": 8.126699, "z": "75th" },
-    { "x": 68, "y": 8.24053, "z": "75th" },
-    { "x": 68.5, "y": 8.353133, "z": "75th" },
-    { "x": 69, "y": 8.464499, "z": "75th" },
-    { "x": 69.5, "y": 8.574851, "z": "75th" },
-    { "x": 70, "y": 8.684179, "z": "75th" },
-    { "x": 70.5, "y": 8.792433, "z": "75th" },
-    { "x": 71, "y": 8.90004, "z": "75th" },
-    { "x": 71.5, "y": 9.007106, "z": "75th" },
-    { "x": 72, "y": 9.113356, "z": "75th" },
-    { "x": 72.5, "y": 9.218809, "z": "75th" },
-    { "x": 73, "y": 9.323402, "z": "75th" },
-    { "x": 73.5, "y": 9.426922, "z": "75th" },
-    { "x": 74, "y": 9.52888, "z": "75th" },
-    { "x": 74.5, "y": 9.629617, "z": "75th" },
-    { "x": 75, "y": 9.728897, "z": "75th" },
-    { "x": 75.5, "y": 9.827172, "z": "75th" },
-    { "x": 76, "y": 9.924413, "z": "75th" },
-    { "x": 76.5, "y": 10.02122, "z": "75th" },
-    { "x": 77, "y": 10.11798, "z": "75th" },
-    { "x": 77.5, "y": 10.2153, "z": "75th" },
-    { "x": 78, "y": 10.31357, "z": "75th" },
-    { "x": 78.5, "y": 10.41328, "z": "75th" },
-    { "x": 79, "y": 10.51461, "z": "75th" },
-    { "x": 79.5, "y": 10.61803, "z": "75th" },
-    { "x": 80, "y": 10.72377, "z": "75th" },
-    { "x": 80.5, "y": 10.83227, "z": "75th" },
-    { "x": 81, "y": 10.94331, "z": "75th" },
-    { "x": 81.5, "y": 11.05729, "z": "75th" },
-    { "x": 82, "y": 11.1737, "z": "75th" },
-    { "x": 82.5, "y": 11.29274, "z": "75th" },
-    { "x": 83, "y": 11.41431, "z": "75th" },
-    { "x": 83.5, "y": 11.53812, "z": "75th" },
-    { "x": 84, "y": 11.66423, "z": "75th" },
-    { "x": 84.5, "y": 11.79224, "z": "75th" },
-    { "x": 85, "y": 11.92214, "z": "75th" },
-    { "x": 85.5, "y": 12.0535, "z": "75th" },
-    { "x": 86, "y": 12.18605, "z": "75th" },
-    { "x": 86.5, "y": 12.31951, "z": "75th" },
-    { "x": 87, "y": 12.4535, "z": "75th" },
-    { "x": 87.5, "y": 12.58739, "z": "75th" },
-    { "x": 88, "y": 12.72125, "z": "75th" },
-    { "x": 88.5, "y": 12.85489, "z": "75th" },
-    { "x": 89, "y": 12.98821, "z": "75th" },
-    { "x": 89.5, "y": 13.1211, "z": "75th" },
-    { "x": 90, "y": 13.25378, "z": "75th" },
-    { "x": 90.5, "y": 13.38604, "z": "75th" },
-    { "x": 91, "y": 13.51818, "z": "75th" },
-    { "x": 91.5, "y": 13.65022, "z": "75th" },
-    { "x": 92, "y": 13.78226, "z": "75th" },
-    { "x": 92.5, "y": 13.91442, "z": "75th" },
-    { "x": 93, "y": 14.04658, "z": "75th" },
-    { "x": 93.5, "y": 14.17916, "z": "75th" },
-    { "x": 94, "y": 14.31208, "z": "75th" },
-    { "x": 94.5, "y": 14.44555, "z": "75th" },
-    { "x": 95, "y": 14.57965, "z": "75th" },
-    { "x": 95.5, "y": 14.71473, "z": "75th" },
-    { "x": 96, "y": 14.85046, "z": "75th" },
-    { "x": 96.5, "y": 14.98716, "z": "75th" },
-    { "x": 97, "y": 15.12494, "z": "75th" },
-    { "x": 97.5, "y": 15.26402, "z": "75th" },
-    { "x": 98, "y": 15.4046, "z": "75th" },
-    { "x": 98.5, "y": 15.54691, "z": "75th" },
-    { "x": 99, "y": 15.69116, "z": "75th" },
-    { "x": 99.5, "y": 15.83756, "z": "75th" },
-    { "x": 100, "y": 15.98621, "z": "75th" },
-    { "x": 100.5, "y": 16.13767, "z": "75th" },
-    { "x": 101, "y": 16.29149, "z": "75th" },
-    { "x": 101.5, "y": 16.44801, "z": "75th" },
-    { "x": 102, "y": 16.60744, "z": "75th" },
-    { "x": 102.5, "y": 16.76944, "z": "75th" },
-    { "x": 103, "y": 16.93459, "z": "75th" },
-    { "x": 103.5, "y": 17.10221, "z": "75th" },
-    { "x": 104, "y": 17.27275, "z": "75th" },
-    { "x": 104.5, "y": 17.446, "z": "75th" },
-    { "x": 105, "y": 17.62184, "z": "75th" },
-    { "x": 105.5, "y": 17.80061, "z": "75th" },
-    { "x": 106, "y": 17.98231, "z": "75th" },
-    { "x": 106.5, "y": 18.16692, "z": "75th" },
-    { "x": 107, "y": 18.35478, "z": "75th" },
-    { "x": 107.5, "y": 18.54568, "z": "75th" },
-    { "x": 108, "y": 18.73995, "z": "75th" },
-    { "x": 108.5, "y": 18.93723, "z": "75th" },
-    { "x": 109, "y": 19.13778, "z": "75th" },
-    { "x": 109.5, "y": 19.34137, "z": "75th" },
-    { "x": 110, "y": 19.54779, "z": "75th" },
-    { "x": 45, "y": 2.769874, "z": "90th"},
-    { "x": 45.5, "y": 2.865707, "z": "90th" },
-    { "x": 46, "y": 2.961438, "z": "90th" },
-    { "x": 46.5, "y": 3.057139, "z": "90th" },
-    { "x": 47, "y": 3.153227, "z": "90th" },
-    { "x": 47.5, "y": 3.250226, "z": "90th" },
-    { "x": 48, "y": 3.348812, "z": "90th" },
-    { "x": 48.5, "y": 3.449774, "z": "90th" },
-    { "x": 49, "y": 3.554011, "z": "90th" },
-    { "x": 49.5, "y": 3.662315, "z": "90th" },
-    { "x": 50, "y": 3.774909, "z": "90th" },
-    { "x": 50.5, "y": 3.892134, "z": "90th" },
-    { "x": 51, "y": 4.013876, "z": "90th" },
-    { "x": 51.5, "y": 4.140025, "z": "90th" },
-    { "x": 52, "y": 4.270637, "z": "90th" },
-    { "x": 52.5, "y": 4.405377, "z": "90th" },
-    { "x": 53, "y": 4.543848, "z": "90th" },
-    { "x": 53.5, "y": 4.686003, "z": "90th" },
-    { "x": 54, "y": 4.830929, "z": "90th" },
-    { "x": 54.5, "y": 4.978124, "z": "90th" },
-    { "x": 55, "y": 5.127025, "z": "90th" },
-    { "x": 55.5, "y": 5.277069, "z": "90th" },
-    { "x": 56, "y": 5.427805, "z": "90th" },
-    { "x": 56.5, "y": 5.578821, "z": "90th" },
-    { "x": 57, "y": 5.729813, "z": "90th" },
-    { "x": 57.5, "y": 5.880629, "z": "90th" },
-    { "x": 58, "y": 6.031152, "z": "90th" },
-    { "x": 58.5, "y": 6.180893, "z": "90th" },
-    { "x": 59, "y": 6.329515, "z": "90th" },
-    { "x": 59.5, "y": 6.47648, "z": "90th" },
-    { "x": 60, "y": 6.621759, "z": "90th" },
-    { "x": 60.5, "y": 6.765237, "z": "90th" },
-    { "x": 61, "y": 6.906823, "z": "90th" },
-    { "x": 61.5, "y": 7.046623, "z": "90th" },
-    { "x": 62, "y": 7.184842, "z": "90th" },
-    { "x": 62.5, "y": 7.321042, "z": "90th" },
-    { "x": 63, "y": 7.455657, "z": "90th" },
-    { "x": 63.5, "y": 7.588912, "z": "90th" },
-    { "x": 64, "y": 7.720817, "z": "90th" },
-    { "x": 64.5, "y": 7.851358, "z": "90th" },
-    { "x": 65, "y": 7.980543, "z": "90th" },
-    { "x": 65.5, "y": 8.10836, "z": "90th" },
-    { "x": 66, "y": 8.234702, "z": "90th" },
-    { "x": 66.5, "y": 8.359674, "z": "90th" },
-    { "x": 67, "y": 8.482941, "z": "90th" },
-    { "x": 67.5, "y": 8.604839, "z": "90th" },
-    { "x": 68, "y": 8.725027, "z": "90th" },
-    { "x": 68.5, "y": 8.843963, "z": "90th" },
-    { "x": 69, "y": 8.961523, "z": "90th" },
-    { "x": 69.5, "y": 9.07806, "z": "90th" },
-    { "x": 70, "y": 9.193444, "z": "90th" },
-    { "x": 70.5, "y": 9.307683, "z": "90th" },
-    { "x": 71, "y": 9.421228, "z": "90th" },
-    { "x": 71.5, "y": 9.534193, "z": "90th" },
-    { "x": 72, "y": 9.646221, "z": "90th" },
-    { "x": 72.5, "y": 9.757458, "z": "90th" },
-    { "x": 73, "y": 9.867777, "z": "90th" },
-    { "x": 73.5, "y": 9.976953, "z": "90th" },
-    { "x": 74, "y": 10.0844, "z": "90th" },
-    { "x": 74.5, "y": 10.19061, "z": "90th" },
-    { "x": 75, "y": 10.29521, "z": "90th" },
-    { "x": 75.5, "y": 10.3988, "z": "90th" },
-    { "x": 76, "y": 10.50122, "z": "90th" },
-    { "x": 76.5, "y": 10.60317, "z": "90th" },
-    { "x": 77, "y": 10.70513, "z": "90th" },
-    { "x": 77.5, "y": 10.80761, "z": "90th" },
-    { "x": 78, "y": 10.91107, "z": "90th" },
-    { "x": 78.5, "y": 11.01613, "z": "90th" },
-    { "x": 79, "y": 11.12282, "z": "90th" },
-    { "x": 79.5, "y": 11.23178, "z": "90th" },
-    { "x": 80, "y": 11.3432, "z": "90th" },
-    { "x": 80.5, "y": 11.45752, "z": "90th" },
-    { "x": 81, "y": 11.57452, "z": "90th" },
-    { "x": 81.5, "y": 11.69469, "z": "90th" },
-    { "x": 82, "y": 11.81743, "z": "90th" },
-    { "x": 82.5, "y": 11.94301, "z": "90th" },
-    { "x": 83, "y": 12.07127, "z": "90th" },
-    { "x": 83.5, "y": 12.20189, "z": "90th" },
-    { "x": 84, "y": 12.33501, "z": "90th" },
-    { "x": 84.5, "y": 12.47014, "z": "90th" },
-    { "x": 85, "y": 12.60735, "z": "90th" },
-    { "x": 85.5, "y": 12.74617, "z": "90th" },
-    { "x": 86, "y": 12.88617, "z": "90th" },
-    { "x": 86.5, "y": 13.0273, "z": "90th" },
-    { "x": 87, "y": 13.16899, "z": "90th" },
-    { "x": 87.5, "y": 13.31057, "z": "90th" },
-    { "x": 88, "y": 13.45221, "z": "90th" },
-    { "x": 88.5, "y": 13.5937, "z": "90th" },
-    { "x": 89, "y": 13.73487, "z": "90th" },
-    { "x": 89.5, "y": 13.87566, "z": "90th" },
-    { "x": 90, "y": 14.01625, "z": "90th" },
-    { "x": 90.5, "y": 14.15639, "z": "90th" },
-    { "x": 91, "y": 14.29651, "z": "90th" },
-    { "x": 91.5, "y": 14.43662, "z": "90th" },
-    { "x": 92, "y": 14.57674, "z": "90th" },
-    { "x": 92.5, "y": 14.717, "z": "90th" },
-    { "x": 93, "y": 14.85736, "z": "90th" },
-    { "x": 93.5, "y": 14.99828, "z": "90th" },
-    { "x": 94, "y": 15.13957, "z": "90th" },
-    { "x": 94.5, "y": 15.28144, "z": "90th" },
-    { "x": 95, "y": 15.42411, "z": "90th" },
-    { "x": 95.5, "y": 15.56792, "z": "90th" },
-    { "x": 96, "y": 15.71244, "z": "90th" },
-    { "x": 96.5, "y": 15.858, "z": "90th" },
-    { "x": 97, "y": 16.00483, "z": "90th" },
-    { "x": 97.5, "y": 16.15305, "z": "90th" },
-    { "x": 98, "y": 16.30299, "z": "90th" },
-    { "x": 98.5, "y": 16.45488, "z": "90th" },
-    { "x": 99, "y": 16.60874, "z": "90th" },
-    { "x": 99.5, "y": 16.76512, "z": "90th" },
-    { "x": 100, "y": 16.9238, "z": "90th" },
-    { "x": 100.5, "y": 17.0857, "z": "90th" },
-    { "x": 101, "y": 17.25001, "z": "90th" },
-    { "x": 101.5, "y": 17.41733, "z": "90th" },
-    { "x": 102, "y": 17.58787, "z": "90th" },
-    { "x": 102.5, "y": 17.76106, "z": "90th" },
-    { "x": 103, "y": 17.93784, "z": "90th" },
-    { "x": 103.5, "y": 18.11715, "z": "90th" },
-    { "x": 104, "y": 18.29972, "z": "90th" },
-    { "x": 104.5, "y": 18.48533, "z": "90th" },
-    { "x": 105, "y": 18.67358, "z": "90th" },
-    { "x": 105.5, "y": 18.86511, "z": "90th" },
-    { "x": 106, "y": 19.05991, "z": "90th" },
-    { "x": 106.5, "y": 19.25771, "z": "90th" },
-    { "x": 107, "y": 19.45914, "z": "90th" },
-    { "x": 107.5, "y": 19.66383, "z": "90th" },
-    { "x": 108, "y": 19.87227, "z": "90th" },
-    { "x": 108.5, "y": 20.08383, "z": "90th" },
-    { "x": 109, "y": 20.29904, "z": "90th" },
-    { "x": 109.5, "y": 20.51753, "z": "90th" },
-    { "x": 110, "y": 20.73907, "z": "90th" },
-    { "x": 45, "y": 2.867253, "z": "95th"},
-    { "x": 45.5, "y": 2.966503, "z": "95th" },
-    { "x": 46, "y": 3.065651, "z": "95th" },
-    { "x": 46.5, "y": 3.164758, "z": "95th" },
-    { "x": 47, "y": 3.264281, "z": "95th" },
-    { "x": 47.5, "y": 3.364751, "z": "95th" },
-    { "x": 48, "y": 3.466867, "z": "95th" },
-    { "x": 48.5, "y": 3.571445, "z": "95th" },
-    { "x": 49, "y": 3.679418, "z": "95th" },
-    { "x": 49.5, "y": 3.791604, "z": "95th" },
-    { "x": 50, "y": 3.908237, "z": "95th" },
-    { "x": 50.5, "y": 4.029667, "z": "95th" },
-    { "x": 51, "y": 4.155778, "z": "95th" },
-    { "x": 51.5, "y": 4.286455, "z": "95th" },
-    { "x": 52, "y": 4.421777, "z": "95th" },
-    { "x": 52.5, "y": 4.561358, "z": "95th" },
-    { "x": 53, "y": 4.704809, "z": "95th" },
-    { "x": 53.5, "y": 4.852097, "z": "95th" },
-    { "x": 54, "y": 5.00224, "z": "95th" },
-    { "x": 54.5, "y": 5.154738, "z": "95th" },
-    { "x": 55, "y": 5.309008, "z": "95th" },
-    { "x": 55.5, "y": 5.464466, "z": "95th" },
-    { "x": 56, "y": 5.620645, "z": "95th" },
-    { "x": 56.5, "y": 5.777096, "z": "95th" },
-    { "x": 57, "y": 5.933551, "z": "95th" },
-    { "x": 57.5, "y": 6.089804, "z": "95th" },
-    { "x": 58, "y": 6.24573, "z": "95th" },
-    { "x": 58.5, "y": 6.400851, "z": "95th" },
-    { "x": 59, "y": 6.554815, "z": "95th" },
-    { "x": 59.5, "y": 6.707039, "z": "95th" },
-    { "x": 60, "y": 6.857516, "z": "95th" },
-    { "x": 60.5, "y": 7.006131, "z": "95th" },
-    { "x": 61, "y": 7.152759, "z": "95th" },
-    { "x": 61.5, "y": 7.297508, "z": "95th" },
-    { "x": 62, "y": 7.440617, "z": "95th" },
-    { "x": 62.5, "y": 7.581605, "z": "95th" },
-    { "x": 63, "y": 7.720949, "z": "95th" },
-    { "x": 63.5, "y": 7.858882, "z": "95th" },
-    { "x": 64, "y": 7.995382, "z": "95th" },
-    { "x": 64.5, "y": 8.130467, "z": "95th" },
-    { "x": 65, "y": 8.264111, "z": "95th" },
-    { "x": 65.5, "y": 8.396335, "z": "95th" },
-    { "x": 66, "y": 8.526991, "z": "95th" },
-    { "x": 66.5, "y": 8.656259, "z": "95th" },
-    { "x": 67, "y": 8.783722, "z": "95th" },
-    { "x": 67.5, "y": 8.909763, "z": "95th" },
-    { "x": 68, "y": 9.033992, "z": "95th" },
-    { "x": 68.5, "y": 9.156954, "z": "95th" },
-    { "x": 69, "y": 9.27845, "z": "95th" },
-    { "x": 69.5, "y": 9.398919, "z": "95th" },
-    { "x": 70, "y": 9.518151, "z": "95th" },
-    { "x": 70.5, "y": 9.636192, "z": "95th" },
-    { "x": 71, "y": 9.753509, "z": "95th" },
-    { "x": 71.5, "y": 9.870218, "z": "95th" },
-    { "x": 72, "y": 9.985913, "z": "95th" },
-    { "x": 72.5, "y": 10.10082, "z": "95th" },
-    { "x": 73, "y": 10.21478, "z": "95th" },
-    { "x": 73.5, "y": 10.32754, "z": "95th" },
-    { "x": 74, "y": 10.43847, "z": "95th" },
-    { "x": 74.5, "y": 10.54816, "z": "95th" },
-    { "x": 75, "y": 10.65612, "z": "95th" },
-    { "x": 75.5, "y": 10.76308, "z": "95th" },
-    { "x": 76, "y": 10.86878, "z": "95th" },
-    { "x": 76.5, "y": 10.97399, "z": "95th" },
-    { "x": 77, "y": 11.07925, "z": "95th" },
-    { "x": 77.5, "y": 11.18499, "z": "95th" },
-    { "x": 78, "y": 11.29176, "z": "95th" },
-    { "x": 78.5, "y": 11.40021, "z": "95th" },
-    { "x": 79, "y": 11.51029, "z": "95th" },
-    { "x": 79.5, "y": 11.62277, "z": "95th" },
-    { "x": 80, "y": 11.73778, "z": "95th" },
-    { "x": 80.5, "y": 11.85579, "z": "95th" },
-    { "x": 81, "y": 11.97656, "z": "95th" },
-    { "x": 81.5, "y": 12.10066, "z": "95th" },
-    { "x": 82, "y": 12.22742, "z": "95th" },
-    { "x": 82.5, "y": 12.35716, "z": "95th" },
-    { "x": 83, "y": 12.48967, "z": "95th" },
-    { "x": 83.5, "y": 12.62461, "z": "95th" },
-    { "x": 84, "y": 12.76219, "z": "95th" },
-    { "x": 84.5, "y": 12.90185, "z": "95th" },
-    { "x": 85, "y": 13.04369, "z": "95th" },
-    { "x": 85.5, "y": 13.18727, "z": "95th" },
-    { "x": 86, "y": 13.33201, "z": "95th" },
-    { "x": 86.5, "y": 13.47802, "z": "95th" },
-    { "x": 87, "y": 13.62461, "z": "95th" },
-    { "x": 87.5, "y": 13.77109, "z": "95th" },
-    { "x": 88, "y": 13.91769, "z": "95th" },
-    { "x": 88.5, "y": 14.06419, "z": "95th" },
-    { "x": 89, "y": 14.21035, "z": "95th" },
-    { "x": 89.5, "y": 14.3562, "z": "95th" },
-    { "x": 90, "y": 14.50182, "z": "95th" },
-    { "x": 90.5, "y": 14.647, "z": "95th" },
-    { "x": 91, "y": 14.79221, "z": "95th" },
-    { "x": 91.5, "y": 14.93748, "z": "95th" },
-    { "x": 92, "y": 15.08277, "z": "95th" },
-    { "x": 92.5, "y": 15.2282, "z": "95th" },
-    { "x": 93, "y": 15.37381, "z": "95th" },
-    { "x": 93.5, "y": 15.52006, "z": "95th" },
-    { "x": 94, "y": 15.66671, "z": "95th" },
-    { "x": 94.5, "y": 15.81397, "z": "95th" },
-    { "x": 95, "y": 15.96212, "z": "95th" },
-    { "x": 95.5, "y": 16.11153, "z": "95th" },
-    { "x": 96, "y": 16.26169, "z": "95th" },
-    { "x": 96.5, "y": 16.41294, "z": "95th" },
-    { "x": 97, "y": 16.56557, "z": "95th" },
-    { "x": 97.5, "y": 16.71965, "z": "95th" },
-    { "x": 98, "y": 16.8756, "z": "95th" },
-    { "x": 98.5, "y": 17.03365, "z": "95th" },
-    { "x": 99, "y": 17.19368, "z": "95th" },
-    { "x": 99.5, "y": 17.35648, "z": "95th" },
-    { "x": 100, "y": 17.52161, "z": "95th" },
-    { "x": 100.5, "y": 17.69022, "z": "95th" },
-    { "x": 101, "y": 17.86129, "z": "95th" },
-    { "x": 101.5, "y": 18.03555, "z": "95th" },
-    { "x": 102, "y": 18.21325, "z": "95th" },
-    { "x": 102.5, "y": 18.39363, "z": "95th" },
-    { "x": 103, "y": 18.57791, "z": "95th" },
-    { "x": 103.5, "y": 18.76476, "z": "95th" },
-    { "x": 104, "y": 18.95508, "z": "95th" },
-    { "x": 104.5, "y": 19.14865, "z": "95th" },
-    { "x": 105, "y": 19.34491, "z": "95th" },
-    { "x": 105.5, "y": 19.54466, "z": "95th" },
-    { "x": 106, "y": 19.74792, "z": "95th" },
-    { "x": 106.5, "y": 19.95423, "z": "95th" },
-    { "x": 107, "y": 20.16441, "z": "95th" },
-    { "x": 107.5, "y": 20.378, "z": "95th" },
-    { "x": 108, "y": 20.5956, "z": "95th" },
-    { "x": 108.5, "y": 20.81637, "z": "95th" },
-    { "x": 109, "y": 21.04105, "z": "95th" },
-    { "x": 109.5, "y": 21.26916, "z": "95th" },
-    { "x": 110, "y": 21.50047, "z": "95th" },
-    { "x": 45, "y": 2.967084, "z": "98th" },
-    { "x": 45.5, "y": 3.06984, "z": "98th" },
-    { "x": 46, "y": 3.172493, "z": "98th" },
-    { "x": 46.5, "y": 3.275093, "z": "98th" },
-    { "x": 47, "y": 3.378141, "z": "98th" },
-    { "x": 47.5, "y": 3.482171, "z": "98th" },
-    { "x": 48, "y": 3.587909, "z": "98th" },
-    { "x": 48.5, "y": 3.696198, "z": "98th" },
-    { "x": 49, "y": 3.808005, "z": "98th" },
-    { "x": 49.5, "y": 3.924175, "z": "98th" },
-    { "x": 50, "y": 4.044951, "z": "98th" },
-    { "x": 50.5, "y": 4.170696, "z": "98th" },
-    { "x": 51, "y": 4.301291, "z": "98th" },
-    { "x": 51.5, "y": 4.436616, "z": "98th" },
-    { "x": 52, "y": 4.57677, "z": "98th" },
-    { "x": 52.5, "y": 4.721321, "z": "98th" },
-    { "x": 53, "y": 4.869881, "z": "98th" },
-    { "x": 53.5, "y": 5.022438, "z": "98th" },
-    { "x": 54, "y": 5.177937, "z": "98th" },
-    { "x": 54.5, "y": 5.335877, "z": "98th" },
-    { "x": 55, "y": 5.495657, "z": "98th" },
-    { "x": 55.5, "y": 5.656672, "z": "98th" },
-    { "x": 56, "y": 5.818439, "z": "98th" },
-    { "x": 56.5, "y": 5.980469, "z": "98th" },
-    { "x": 57, "y": 6.14253, "z": "98th" },
-    { "x": 57.5, "y": 6.304363, "z": "98th" },
-    { "x": 58, "y": 6.465836, "z": "98th" },
-    { "x": 58.5, "y": 6.626477, "z": "98th" },
-    { "x": 59, "y": 6.785923, "z": "98th" },
-    { "x": 59.5, "y": 6.943542, "z": "98th" },
-    { "x": 60, "y": 7.099354, "z": "98th" },
-    { "x": 60.5, "y": 7.25324, "z": "98th" },
-    { "x": 61, "y": 7.405039, "z": "98th" },
-    { "x": 61.5, "y": 7.554862, "z": "98th" },
-    { "x": 62, "y": 7.702988, "z": "98th" },
-    { "x": 62.5, "y": 7.848883, "z": "98th" },
-    { "x": 63, "y": 7.993075, "z": "98th" },
-    { "x": 63.5, "y": 8.135803, "z": "98th" },
-    { "x": 64, "y": 8.277013, "z": "98th" },
-    { "x": 64.5, "y": 8.416754, "z": "98th" },
-    { "x": 65, "y": 8.554964, "z": "98th" },
-    { "x": 65.5, "y": 8.691701, "z": "98th" },
-    { "x": 66, "y": 8.826775, "z": "98th" },
-    { "x": 66.5, "y": 8.960443, "z": "98th" },
-    { "x": 67, "y": 9.092201, "z": "98th" },
-    { "x": 67.5, "y": 9.222481, "z": "98th" },
-    { "x": 68, "y": 9.350843, "z": "98th" },
-    { "x": 68.5, "y": 9.477926, "z": "98th" },
-    { "x": 69, "y": 9.603447, "z": "98th" },
-    { "x": 69.5, "y": 9.727939, "z": "98th" },
-    { "x": 70, "y": 9.851105, "z": "98th" },
-    { "x": 70.5, "y": 9.973033, "z": "98th" },
-    { "x": 71, "y": 10.09421, "z": "98th" },
-    { "x": 71.5, "y": 10.21474, "z": "98th" },
-    { "x": 72, "y": 10.33418, "z": "98th" },
-    { "x": 72.5, "y": 10.45285, "z": "98th" },
-    { "x": 73, "y": 10.57052, "z": "98th" },
-    { "x": 73.5, "y": 10.68695, "z": "98th" },
-    { "x": 74, "y": 10.80143, "z": "98th" },
-    { "x": 74.5, "y": 10.91467, "z": "98th" },
-    { "x": 75, "y": 11.02607, "z": "98th" },
-    { "x": 75.5, "y": 11.13648, "z": "98th" },
-    { "x": 76, "y": 11.24553, "z": "98th" },
-    { "x": 76.5, "y": 11.35406, "z": "98th" },
-    { "x": 77, "y": 11.46269, "z": "98th" },
-    { "x": 77.5, "y": 11.57176, "z": "98th" },
-    { "x": 78, "y": 11.68189, "z": "98th" },
-    { "x": 78.5, "y": 11.7938, "z": "98th" },
-    { "x": 79, "y": 11.90735, "z": "98th" },
-    { "x": 79.5, "y": 12.02341, "z": "98th" },
-    { "x": 80, "y": 12.14209, "z": "98th" },
-    { "x": 80.5, "y": 12.26386, "z": "98th" },
-    { "x": 81, "y": 12.3885, "z": "98th" },
-    { "x": 81.5, "y": 12.51662, "z": "98th" },
-    { "x": 82, "y": 12.64747, "z": "98th" },
-    { "x": 82.5, "y": 12.78146, "z": "98th" },
-    { "x": 83, "y": 12.91832, "z": "98th" },
-    { "x": 83.5, "y": 13.05767, "z": "98th" },
-    { "x": 84, "y": 13.19981, "z": "98th" },
-    { "x": 84.5, "y": 13.3441, "z": "98th" },
-    { "x": 85, "y": 13.4907, "z": "98th" },
-    { "x": 85.5, "y": 13.63914, "z": "98th" },
-    { "x": 86, "y": 13.78873, "z": "98th" },
-    { "x": 86.5, "y": 13.93974, "z": "98th" },
-    { "x": 87, "y": 14.09135, "z": "98th" },
-    { "x": 87.5, "y": 14.24285, "z": "98th" },
-    { "x": 88, "y": 14.39453, "z": "98th" },
-    { "x": 88.5, "y": 14.54617, "z": "98th" },
-    { "x": 89, "y": 14.69746, "z": "98th" },
-    { "x": 89.5, "y": 14.84848, "z": "98th" },
-    { "x": 90, "y": 14.99928, "z": "98th" },
-    { "x": 90.5, "y": 15.14962, "z": "98th" },
-    { "x": 91, "y": 15.30007, "z": "98th" },
-    { "x": 91.5, "y": 15.45063, "z": "98th" },
-    { "x": 92, "y": 15.60123, "z": "98th" },
-    { "x": 92.5, "y": 15.75198, "z": "98th" },
-    { "x": 93, "y": 15.90298, "z": "98th" },
-    { "x": 93.5, "y": 16.05472, "z": "98th" },
-    { "x": 94, "y": 16.20688, "z": "98th" },
-    { "x": 94.5, "y": 16.35968, "z": "98th" },
-    { "x": 95, "y": 16.51348, "z": "98th" },
-    { "x": 95.5, "y": 16.66866, "z": "98th" },
-    { "x": 96, "y": 16.82461, "z": "98th" },
-    { "x": 96.5, "y": 16.98172, "z": "98th" },
-    { "x": 97, "y": 17.14033, "z": "98th" },
-    { "x": 97.5, "y": 17.30046, "z": "98th" },
-    { "x": 98, "y": 17.4626, "z": "98th" },
-    { "x": 98.5, "y": 17.62701, "z": "98th" },
-    { "x": 99, "y": 17.79341, "z": "98th" },
-    { "x": 99.5, "y": 17.96283, "z": "98th" },
-    { "x": 100, "y": 18.13461, "z": "98th" },
-    { "x": 100.5, "y": 18.31016, "z": "98th" },
-    { "x": 101, "y": 18.48819, "z": "98th" },
-    { "x": 101.5, "y": 18.66963, "z": "98th" },
-    { "x": 102, "y": 18.85472, "z": "98th" },
-    { "x": 102.5, "y": 19.04254, "z": "98th" },
-    { "x": 103, "y": 19.23456, "z": "98th" },
-    { "x": 103.5, "y": 19.4292, "z": "98th" },
-    { "x": 104, "y": 19.62753, "z": "98th" },
-    { "x": 104.5, "y": 19.82933, "z": "98th" },
-    { "x": 105, "y": 20.03387, "z": "98th" },
-    { "x": 105.5, "y": 20.24213, "z": "98th" },
-    { "x": 106, "y": 20.45414, "z": "98th" },
-    { "x": 106.5, "y": 20.66926, "z": "98th" },
-    { "x": 107, "y": 20.8885, "z": "98th" },
-    { "x": 107.5, "y": 21.1113, "z": "98th" },
-    { "x": 108, "y": 21.33837, "z": "98th" },
-    { "x": 108.5, "y": 21.56869, "z": "98th" },
-    { "x": 109, "y": 21.80317, "z": "98th" },
-    { "x": 109.5, "y": 22.04124, "z": "98th" },
-    { "x": 110, "y": 22.28267, "z": "98th" }
-]
\ No newline at end of file
@@ -0,0 +1,129 @@
+"""Z-scores and percentiles of growth measurements against the LMS references.
+
+For a measurement y at x (age in months, or length/stature in cm) the
+reference's L, M and S are interpolated at x, and
+
+    z = ((y / M) ** L - 1) / (L * S)        (ln(y / M) / S when L is 0)
+
+`score` takes any number of measurements, for one patient or a whole panel:
+they are grouped by reference so each table is loaded once, and, given a
+cache, each result is stored under the measurement's key (an observation id)
+so percentile alerts and panel reports don't recompute it.
+"""
+
+from bisect import bisect_left
+from decimal import Decimal
+from typing import Iterable, NamedTuple, Optional
+
+from growth_charts.graphs.reference import LmsTable, get_table
+
+CACHE_KEY_PREFIX = "growth_zscore:v1"
+CACHE_TIMEOUT_SECONDS = 14 * 24 * 60 * 60
+
+_E = 2.718281828459045
+_SQRT_2 = 1.4142135623730951
+
+
+class Measurement(NamedTuple):
+    key: str  # identifies the measurement for caching, e.g. the observation id
+    reference: str  # reference table name, e.g. "cdc_boys_bmi_age"
+    x: float  # age in months, or length/stature in cm
+    y: float  # value in the reference's units (kg, cm, kg/m2)
+
+
+class Score(NamedTuple):
+    z: Optional[float]  # None when x is outside the reference's range
+    percentile: Optional[float]
+
+
+def score(measurements: Iterable[Measurement], cache=None) -> list:
+    """The Score of each measurement, in order."""
+    measurements = list(measurements)
+    scores: list = [None] * len(measurements)
+
+    cached = {}
+    if cache is not None and measurements:
+        cached = _get_many(cache, [_cache_key(m) for m in measurements])
+
+    by_reference = {}
+    for i, measurement in enumerate(measurements):
+        hit = cached.get(_cache_key(measurement))
+        if hit is not None and list(hit[:2]) == [measurement.x, measurement.y]:
+            scores[i] = Score(*hit[2:])
+        else:
+            by_reference.setdefault(measurement.reference, []).append(i)
+
+    fresh = {}
+    for reference, indexes in by_reference.items():
+        table = get_table(reference)
+        for i in indexes:
+            measurement = measurements[i]
+            scores[i] = _score_one(table, measurement.x, measurement.y)
+            fresh[_cache_key(measurement)] = [measurement.x, measurement.y, *scores[i]]
+
+    if cache is not None and fresh:
+        cache.set_many(fresh, timeout_seconds=CACHE_TIMEOUT_SECONDS)
+    return scores
+
+
+def z_to_percentile(z: float) -> float:
+    """Percentile (0-100) of a standard normal z-score."""
+    return 50 * (1 + _erf(z / _SQRT_2))
+
+
+def _score_one(table: LmsTable, x: float, y: float) -> Score:
+    lms = _lms_at(table, x)
+    if lms is None or y <= 0:
+        return Score(None, None)
+    l, m, s = lms
+    if l == 0:
+        z = float(Decimal(y / m).ln()) / s
+    else:
+        z = ((y / m) ** l - 1) / (l * s)
+    return Score(round(z, 4), round(z_to_percentile(z), 2))
+
+
+def _lms_at(table: LmsTable, x: float):
+    """L, M and S at x, interpolated linearly between the table's rows."""
+    xs = table.x
+    if not xs or x < xs[0] or x > xs[-1]:
+        return None
+    i = bisect_left(xs, x)
+    if xs[i] == x:
+        return table.l[i], table.m[i], table.s[i]
+    x0, x1 = xs[i - 1], xs[i]
+    t = (x - x0) / (x1 - x0)
+    return tuple(
+        column[i - 1] + t * (column[i] - column[i - 1])
+        for column in (table.l, table.m, table.s)
+    )
+
+
+def _erf(x: float) -> float:
+    # Abramowitz & Stegun 7.1.26, absolute error below 1.5e-7
+    sign = 1 if x >= 0 else -1
+    x = abs(x)
+    t = 1 / (1 + 0.3275911 * x)
+    poly = t * (0.254829592 + t * (-0.284496736 + t * (1.421413741 + t * (-1.453152027 + t * 1.061405429))))
+    return sign * (1 - poly * _E ** (-x * x))
+
+
+def _get_many(cache, keys: list) -> dict:
+    """cache.get_many keyed by the keys asked for.
+
+    The plugin cache returns its own prefixed keys (`<prefix>:<key>`), which
+    would otherwise never match, so every measurement would be a miss.
+    """
+    requested = set(keys)
+    result = {}
+    for full_key, value in (cache.get_many(keys) or {}).items():
+        key = full_key
+        while key not in requested and ":" in key:
+            key = key.split(":", 1)[1]
+        if key in requested:
+            result[key] = value
+    return result
+
+
+def _cache_key(measurement: Measurement) -> str:
+    return f"{CACHE_KEY_PREFIX}:{measurement.reference}:{measurement.key}"
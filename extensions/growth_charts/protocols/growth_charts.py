@@ -4,34 +4,15 @@ import arrow
 from canvas_sdk.effects import Effect
 from canvas_sdk.effects.launch_modal import LaunchModalEffect
 from canvas_sdk.handlers.action_button import ActionButton
+from canvas_sdk.caching.plugins import get_cache
 from canvas_sdk.templates import render_to_string
 
 from canvas_sdk.v1.data import Patient, Observation, Note
+from django.db.models import OuterRef, Subquery
+
+from growth_charts.graphs.reference import percentile_curves
+from growth_charts.graphs.zscore import Measurement, score
 
-from growth_charts.graphs.who_boys_weight_age import who_boys_weight_age
-from growth_charts.graphs.who_boys_length_age import who_boys_length_age
-from growth_charts.graphs.who_boys_weight_length import who_boys_weight_length
-from growth_charts.graphs.who_girls_weight_age import who_girls_weight_age
-from growth_charts.graphs.who_girls_length_age import who_girls_length_age
-from growth_charts.graphs.who_girls_weight_length import who_girls_weight_length
-from growth_charts.graphs.who_boys_circumference_age import who_boys_circumference_age
-from growth_charts.graphs.who_girls_circumference_age import who_girls_circumference_age
-from growth_charts.graphs.cdc_boys_weight_age_24_240 import cdc_boys_weight_age_24_240
-from growth_charts.graphs.cdc_boys_weight_age import cdc_boys_weight_age
-from growth_charts.graphs.cdc_boys_length_age import cdc_boys_length_age
-from growth_charts.graphs.cdc_boys_weight_length import cdc_boys_weight_length
-from growth_charts.graphs.cdc_boys_head_age import cdc_boys_head_age
-from growth_charts.graphs.cdc_boys_weight_stature import cdc_boys_weight_stature
-from growth_charts.graphs.cdc_boys_stature_age import cdc_boys_stature_age
-from growth_charts.graphs.cdc_boys_bmi_age import cdc_boys_bmi_age
-from growth_charts.graphs.cdc_girls_weight_age import cdc_girls_weight_age
-from growth_charts.graphs.cdc_girls_length_age import cdc_girls_length_age
-from growth_charts.graphs.cdc_girls_weight_length import cdc_girls_weight_length
-from growth_charts.graphs.cdc_girls_head_age import cdc_girls_head_age
-from growth_charts.graphs.cdc_girls_weight_stature import cdc_girls_weight_stature
-from growth_charts.graphs.cdc_girls_weight_age_24_240 import cdc_girls_weight_age_24_240
-from growth_charts.graphs.cdc_girls_stature_age import cdc_girls_stature_age
-from growth_charts.graphs.cdc_girls_bmi_age import cdc_girls_bmi_age
 
 def convert_in_to_cm(inches: str) -> float:
     return float(inches) * 2.54
@@ -47,8 +28,58 @@ def get_age_in_months(birth_date: datetime.date, date: datetime.date = datetime.
 
     return year_difference * 12 + month_difference
 
+def get_exact_age_in_months(birth_date: datetime.date, date: datetime.date) -> float:
+    """Age in average-length months (365.25 / 12 days), as the WHO and CDC references use."""
+    return (arrow.get(date).date() - arrow.get(birth_date).date()).days / 30.4375
+
 def generate_layer_data(data: dict) -> list[dict]:
-    return [{"x": key, "y": data[key]} for key in sorted(data.keys())]
+    return [
+        {"x": key, "y": data[key][0], "observation": data[key][1], "score_x": data[key][2]}
+        for key in sorted(data.keys())
+    ]
+
+def add_percentiles(graphs: list[dict], cache) -> None:
+    """Label each plotted point with its percentile on its graph's reference.
+
+    Points are plotted at whole months but scored at their exact age (or
+    length), since a month's difference moves infant percentiles a lot. The
+    points of all graphs are scored in one batch; scores are cached per observation.
+    """
+    points = [(graph, point) for graph in graphs for point in graph["layerData"]]
+    scores = score(
+        (
+            Measurement(point.pop("observation"), graph["reference"], point.pop("score_x"), float(point["y"]))
+            for graph, point in points
+        ),
+        cache,
+    )
+    for (_, point), result in zip(points, scores):
+        if result.percentile is not None:
+            point["p"] = result.percentile
+
+VITAL_NAMES = ("weight", "height", "length", "bmi", "head_circumference")
+
+def get_vitals_by_name(patient_id: str) -> dict[str, list[tuple[datetime.datetime, str, str]]]:
+    """(visit time, value, observation id) of every recorded growth vital, by name, oldest visit first.
+
+    Loaded in one query, with each observation's note date of service joined in.
+    Uncommitted and entered-in-error observations are left out.
+    """
+    date_of_service = Note.objects.filter(dbid=OuterRef("note_id")).values("datetime_of_service")[:1]
+    observations = (
+        Observation.objects.for_patient(patient_id)
+        .committed()
+        .filter(name__in=VITAL_NAMES)
+        .annotate(date_of_service=Subquery(date_of_service))
+        .order_by("date_of_service", "dbid")
+        .values_list("name", "value", "date_of_service", "id")
+    )
+
+    vitals = {name: [] for name in VITAL_NAMES}
+    for name, value, date_of_service, observation_id in observations:
+        if value and date_of_service:
+            vitals[name].append((date_of_service, value, str(observation_id)))
+    return vitals
 
 class GenerateVitalsGraphs(ActionButton):
     BUTTON_TITLE = "Growth Charts"
@@ -65,11 +96,7 @@ class GenerateVitalsGraphs(ActionButton):
         is_less_than_24_months_old = age_in_months < 24
         is_less_than_36_months_old = age_in_months < 36
 
-        observation_weight = Observation.objects.for_patient(self.target).filter(name="weight")
-        observation_height = Observation.objects.for_patient(self.target).filter(name="height")
-        observation_length = Observation.objects.for_patient(self.target).filter(name="length")
-        observation_bmi = Observation.objects.for_patient(self.target).filter(name="bmi")
-        observation_head_circumference = Observation.objects.for_patient(self.target).filter(name="head_circumference")
+        vitals = get_vitals_by_name(self.target)
 
         weight_for_age = {}
         length_for_age = {}
@@ -77,56 +104,52 @@ class GenerateVitalsGraphs(ActionButton):
         head_for_age = {}
         bmi_for_age = {}
 
-        for obs in observation_weight:
-            if obs.value:
-                note = Note.objects.get(dbid=obs.note_id)
-                age_in_months = get_age_in_months(birth_date, note.datetime_of_service)
-                weight_in_kg = convert_oz_to_kg(obs.value)
-                weight_for_age[age_in_months] = weight_in_kg
-
-        for obs in observation_length:
-            if obs.value:
-                note = Note.objects.get(dbid=obs.note_id)
-                age_in_months = get_age_in_months(birth_date, note.datetime_of_service)
-                length_in_cm = convert_in_to_cm(obs.value)
-                length_for_age[age_in_months] = length_in_cm
-
-        for obs in observation_height:
-            if obs.value:
-                note = Note.objects.get(dbid=obs.note_id)
-                age_in_months = get_age_in_months(birth_date, note.datetime_of_service)
-                height_in_cm = convert_in_to_cm(obs.value)
-                length_for_age[age_in_months] = height_in_cm
-
-        for obs in observation_head_circumference:
-            if obs.value:
-                note = Note.objects.get(dbid=obs.note_id)
-                age_in_months = get_age_in_months(birth_date, note.datetime_of_service)
-                head_in_cm = convert_in_to_cm(obs.value)
-                head_for_age[age_in_months] = head_in_cm
-
-        for obs in observation_bmi:
-            if obs.value:
-                note = Note.objects.get(dbid=obs.note_id)
-                age_in_months = get_age_in_months(birth_date, note.datetime_of_service)
-                bmi_for_age[age_in_months] = obs.value
-
-        for obs_weight in observation_weight:
-            note_weight = Note.objects.get(dbid=obs_weight.note_id)
-            for obs_length in observation_length:
-                note_length = Note.objects.get(dbid=obs_length.note_id)
-                if note_length.datetime_of_service == note_weight.datetime_of_service:
-                    if obs_weight.value and obs_length.value:
-                        weight_in_kg = convert_oz_to_kg(obs_weight.value)
-                        length_in_cm = convert_in_to_cm(obs_length.value)
-                        weight_for_length[length_in_cm] = weight_in_kg
+        # Each series maps the plotted x to (y, observation id, x the point is scored at)
+        for visit, value, obs_id in vitals["weight"]:
+            weight_for_age[get_age_in_months(birth_date, visit)] = (
+                convert_oz_to_kg(value), obs_id, get_exact_age_in_months(birth_date, visit),
+            )
+
+        for visit, value, obs_id in vitals["length"]:
+            length_for_age[get_age_in_months(birth_date, visit)] = (
+                convert_in_to_cm(value), obs_id, get_exact_age_in_months(birth_date, visit),
+            )
+
+        for visit, value, obs_id in vitals["height"]:
+            length_for_age[get_age_in_months(birth_date, visit)] = (
+                convert_in_to_cm(value), obs_id, get_exact_age_in_months(birth_date, visit),
+            )
+
+        for visit, value, obs_id in vitals["head_circumference"]:
+            head_for_age[get_age_in_months(birth_date, visit)] = (
+                convert_in_to_cm(value), obs_id, get_exact_age_in_months(birth_date, visit),
+            )
+
+        for visit, value, obs_id in vitals["bmi"]:
+            bmi_for_age[get_age_in_months(birth_date, visit)] = (
+                value, obs_id, get_exact_age_in_months(birth_date, visit),
+            )
+
+        # Pair each weight with the lengths taken at the same visit
+        lengths_by_visit = {}
+        for visit, value, obs_id in vitals["length"]:
+            lengths_by_visit.setdefault(visit, []).append((value, obs_id))
+
+        for visit, weight, weight_id in vitals["weight"]:
+            for length, length_id in lengths_by_visit.get(visit, []):
+                weight_for_length[convert_in_to_cm(length)] = (
+                    convert_oz_to_kg(weight),
+                    f"{weight_id}:{length_id}",
+                    convert_in_to_cm(length),
+                )
 
 
         if sex_at_birth == "M":
             if is_less_than_24_months_old:
                 graphs.append(
                     {
-                        "data": who_boys_weight_age,
+                        "reference": "who_boys_weight_age",
+                        "data": percentile_curves("who_boys_weight_age"),
                         "title": 'Weight for age (Boys 0 - 2 years)',
                         "xType": 'Generic',
                         "yType": 'Weight',
@@ -140,7 +163,8 @@ class GenerateVitalsGraphs(ActionButton):
 
                 graphs.append(
                     {
-                        "data": who_boys_length_age,
+                        "reference": "who_boys_length_age",
+                        "data": percentile_curves("who_boys_length_age"),
                         "title": 'Length for age (Boys 0 - 2 years)',
                         "xType": 'Generic',
                         "yType": 'Length',
@@ -154,7 +178,8 @@ class GenerateVitalsGraphs(ActionButton):
 
                 graphs.append(
                     {
-                        "data": who_boys_weight_length,
+                        "reference": "who_boys_weight_length",
+                        "data": percentile_curves("who_boys_weight_length"),
                         "title": 'Weight for Length (Boys)',
                         "xType": 'Length',
                         "yType": 'Weight',
@@ -168,7 +193,8 @@ class GenerateVitalsGraphs(ActionButton):
 
                 graphs.append(
                     {
-                        "data": who_boys_circumference_age,
+                        "reference": "who_boys_circumference_age",
+                        "data": percentile_curves("who_boys_circumference_age"),
                         "title": 'Head Circumference for age (Boys 0 - 2 years)',
                         "xType": 'Generic',
                         "yType": 'Length',
@@ -183,7 +209,8 @@ class GenerateVitalsGraphs(ActionButton):
             if is_less_than_36_months_old:
                 graphs.append(
                     {
-                        "data": cdc_boys_weight_age,
+                        "reference": "cdc_boys_weight_age",
+                        "data": percentile_curves("cdc_boys_weight_age"),
                         "title": 'Weight for age (Boys 0 - 36 months)',
                         "xType": 'Generic',
                         "yType": 'Weight',
@@ -197,7 +224,8 @@ class GenerateVitalsGraphs(ActionButton):
 
                 graphs.append(
                     {
-                        "data": cdc_boys_length_age,
+                        "reference": "cdc_boys_length_age",
+                        "data": percentile_curves("cdc_boys_length_age"),
                         "title": 'Length for age (Boys 0 - 36 months)',
                         "xType": 'Generic',
                         "yType": 'Length',
@@ -211,7 +239,8 @@ class GenerateVitalsGraphs(ActionButton):
 
                 graphs.append(
                     {
-                        "data": cdc_boys_weight_length,
+                        "reference": "cdc_boys_weight_length",
+                        "data": percentile_curves("cdc_boys_weight_length"),
                         "title": 'Weight for recumbent length (Boys)',
                         "xType": 'Length',
                         "yType": 'Weight',
@@ -225,7 +254,8 @@ class GenerateVitalsGraphs(ActionButton):
 
                 graphs.append(
                     {
-                        "data": cdc_boys_head_age,
+                        "reference": "cdc_boys_head_age",
+                        "data": percentile_curves("cdc_boys_head_age"),
                         "title": 'Head Circumference for age (Boys 0 - 36 months)',
                         "xType": 'Generic',
                         "yType": 'Length',
@@ -239,7 +269,8 @@ class GenerateVitalsGraphs(ActionButton):
 
                 graphs.append(
                     {
-                        "data": cdc_boys_weight_stature,
+                        "reference": "cdc_boys_weight_stature",
+                        "data": percentile_curves("cdc_boys_weight_stature"),
                         "title": 'Weight for stature (Boys)',
                         "xType": 'Length',
                         "yType": 'Weight',
@@ -254,7 +285,8 @@ class GenerateVitalsGraphs(ActionButton):
             if 24 <= age_in_months <= 240:
                 graphs.append(
                     {
-                        "data": cdc_boys_weight_age_24_240,
+                        "reference": "cdc_boys_weight_age_24_240",
+                        "data": percentile_curves("cdc_boys_weight_age_24_240"),
                         "title": 'Weight for age (Boys 2 - 20 years)',
                         "xType": 'Generic',
                         "yType": 'Weight',
@@ -268,7 +300,8 @@ class GenerateVitalsGraphs(ActionButton):
 
                 graphs.append(
                     {
-                        "data": cdc_boys_stature_age,
+                        "reference": "cdc_boys_stature_age",
+                        "data": percentile_curves("cdc_boys_stature_age"),
                         "title": 'Stature for age (Boys 2 - 20 years)',
                         "xType": 'Generic',
                         "yType": 'Length',
@@ -282,7 +315,8 @@ class GenerateVitalsGraphs(ActionButton):
 
                 graphs.append(
                     {
-                        "data": cdc_boys_bmi_age,
+                        "reference": "cdc_boys_bmi_age",
+                        "data": percentile_curves("cdc_boys_bmi_age"),
                         "title": 'Bmi for age (Boys 2 - 20 years)',
                         "xType": 'Generic',
                         "yType": 'Generic',
@@ -298,7 +332,8 @@ class GenerateVitalsGraphs(ActionButton):
             if is_less_than_24_months_old:
                 graphs.append(
                     {
-                        "data": who_girls_weight_age,
+                        "reference": "who_girls_weight_age",
+                        "data": percentile_curves("who_girls_weight_age"),
                         "title": 'Weight for age (Girls 0 - 2 years)',
                         "xType": 'Generic',
                         "yType": 'Weight',
@@ -312,7 +347,8 @@ class GenerateVitalsGraphs(ActionButton):
 
                 graphs.append(
                     {
-                        "data": who_girls_length_age,
+                        "reference": "who_girls_length_age",
+                        "data": percentile_curves("who_girls_length_age"),
                         "title": 'Length for age (Girls 0 - 2 years)',
                         "xType": 'Generic',
                         "yType": 'Length',
@@ -326,7 +362,8 @@ class GenerateVitalsGraphs(ActionButton):
 
                 graphs.append(
                     {
-                        "data": who_girls_weight_length,
+                        "reference": "who_girls_weight_length",
+                        "data": percentile_curves("who_girls_weight_length"),
                         "title": 'Weight for Length (Girls)',
                         "xType": 'Length',
                         "yType": 'Weight',
@@ -340,7 +377,8 @@ class GenerateVitalsGraphs(ActionButton):
 
                 graphs.append(
                     {
-                        "data": who_girls_circumference_age,
+                        "reference": "who_girls_circumference_age",
+                        "data": percentile_curves("who_girls_circumference_age"),
                         "title": 'Head Circumference for age (Girls 0 - 2 years)',
                         "xType": 'Generic',
                         "yType": 'Length',
@@ -354,7 +392,8 @@ class GenerateVitalsGraphs(ActionButton):
             if is_less_than_36_months_old:
                 graphs.append(
                     {
-                        "data": cdc_girls_weight_age,
+                        "reference": "cdc_girls_weight_age",
+                        "data": percentile_curves("cdc_girls_weight_age"),
                         "title": 'Weight for age (Girls 0 - 36 months)',
                         "xType": 'Generic',
                         "yType": 'Weight',
@@ -368,7 +407,8 @@ class GenerateVitalsGraphs(ActionButton):
 
                 graphs.append(
                     {
-                        "data": cdc_girls_length_age,
+                        "reference": "cdc_girls_length_age",
+                        "data": percentile_curves("cdc_girls_length_age"),
                         "title": 'Length for age (Girls 0 - 36 months)',
                         "xType": 'Generic',
                         "yType": 'Length',
@@ -382,7 +422,8 @@ class GenerateVitalsGraphs(ActionButton):
 
                 graphs.append(
                     {
-                        "data": cdc_girls_weight_length,
+                        "reference": "cdc_girls_weight_length",
+                        "data": percentile_curves("cdc_girls_weight_length"),
                         "title": 'Weight for recumbent length (Girls)',
                         "xType": 'Length',
                         "yType": 'Weight',
@@ -396,7 +437,8 @@ class GenerateVitalsGraphs(ActionButton):
 
                 graphs.append(
                     {
-                        "data": cdc_girls_head_age,
+                        "reference": "cdc_girls_head_age",
+                        "data": percentile_curves("cdc_girls_head_age"),
                         "title": 'Head Circumference for age (Girls 0 - 36 months)',
                         "xType": 'Generic',
                         "yType": 'Length',
@@ -410,7 +452,8 @@ class GenerateVitalsGraphs(ActionButton):
 
                 graphs.append(
                     {
-                        "data": cdc_girls_weight_stature,
+                        "reference": "cdc_girls_weight_stature",
+                        "data": percentile_curves("cdc_girls_weight_stature"),
                         "title": 'Weight for stature (Girls)',
                         "xType": 'Length',
                         "yType": 'Weight',
@@ -425,7 +468,8 @@ class GenerateVitalsGraphs(ActionButton):
             if 24 <= age_in_months <= 240:
                 graphs.append(
                     {
-                        "data": cdc_girls_weight_age_24_240,
+                        "reference": "cdc_girls_weight_age_24_240",
+                        "data": percentile_curves("cdc_girls_weight_age_24_240"),
                         "title": 'Weight for age (Girls 2 - 20 years)',
                         "xType": 'Generic',
                         "yType": 'Weight',
@@ -439,7 +483,8 @@ class GenerateVitalsGraphs(ActionButton):
 
                 graphs.append(
                     {
-                        "data": cdc_girls_stature_age,
+                        "reference": "cdc_girls_stature_age",
+                        "data": percentile_curves("cdc_girls_stature_age"),
                         "title": 'Stature for age (Girls 2 - 20 years)',
                         "xType": 'Generic',
                         "yType": 'Length',
@@ -453,7 +498,8 @@ class GenerateVitalsGraphs(ActionButton):
 
                 graphs.append(
                     {
-                        "data": cdc_girls_bmi_age,
+                        "reference": "cdc_girls_bmi_age",
+                        "data": percentile_curves("cdc_girls_bmi_age"),
                         "title": 'Bmi for age (Girls 2 - 20 years)',
                         "xType": 'Generic',
                         "yType": 'Generic',
@@ -467,6 +513,8 @@ class GenerateVitalsGraphs(ActionButton):
         else:
             return []
 
+        add_percentiles(graphs, get_cache())
+
         launch_modal = LaunchModalEffect(
             content=render_to_string("templates/chart.html", {"graphs": graphs}),
         )
@@ -0,0 +1,32 @@
+"""Tests for growth_charts/graphs/reference.py."""
+
+import pytest
+
+from growth_charts.graphs.reference import percentile_curves
+
+
+def _curve_value(reference, label, x):
+    (point,) = [p for p in percentile_curves(reference) if p["z"] == label and p["x"] == x]
+    return point["y"]
+
+
+@pytest.mark.parametrize("reference, label, x, y", [
+    # CDC charts of the WHO standards; their "98th" curve is z = 2
+    ("who_boys_weight_age", "98th", 0, 4.419354),
+    ("who_boys_weight_age", "98th", 1, 5.798331),
+    ("who_boys_length_age", "98th", 12, 80.50128),
+    ("who_girls_weight_age", "98th", 6, 9.335491),
+    ("who_boys_weight_age", "5th", 0, 2.603994),
+])
+def test_who_curves_match_the_published_charts(reference, label, x, y):
+    assert _curve_value(reference, label, x) == pytest.approx(y, abs=1e-5)
+
+
+@pytest.mark.parametrize("reference, label, x, y", [
+    # CDC LMS data files, percentile columns
+    ("cdc_boys_weight_age", "3rd", 0, 2.355450986),
+    ("cdc_boys_weight_age", "97th", 0, 4.446488308),
+    ("cdc_boys_stature_age", "97th", 24, 93.02265441),
+])
+def test_cdc_curves_match_the_published_percentiles(reference, label, x, y):
+    assert _curve_value(reference, label, x) == pytest.approx(y, abs=1e-5)
@@ -0,0 +1,176 @@
+"""Tests for growth_charts/graphs/zscore.py."""
+
+from unittest.mock import patch
+
+import pytest
+
+from growth_charts.graphs.reference import PERCENTILE_Z, LmsTable, get_table, value_at
+from growth_charts.graphs.zscore import (
+    CACHE_KEY_PREFIX,
+    Measurement,
+    Score,
+    score,
+    z_to_percentile,
+)
+
+MODULE = "growth_charts.graphs.zscore"
+
+
+def _table(x, l, m, s):
+    return LmsTable(percentiles=(50,), x=tuple(x), l=tuple(l), m=tuple(m), s=tuple(s))
+
+
+def _score(table, x, y):
+    with patch(f"{MODULE}.get_table", return_value=table):
+        return score([Measurement("obs-1", "test", x, y)])[0]
+
+
+class _FakeCache:
+    """Stores under prefixed keys and returns them from get_many, like the plugin cache."""
+
+    PREFIX = "plugin:growth_charts"
+
+    def __init__(self):
+        self.data = {}
+
+    def _make_key(self, key):
+        return f"{self.PREFIX}:{key}"
+
+    def get_many(self, keys):
+        full_keys = [self._make_key(k) for k in keys]
+        return {k: self.data[k] for k in full_keys if k in self.data}
+
+    def set_many(self, data, timeout_seconds=None):
+        self.data.update({self._make_key(k): v for k, v in data.items()})
+        return []
+
+
+class TestScoreOne:
+    """z from the LMS formula, on both of its branches."""
+
+    def test_box_cox_branch_inverts_the_percentile_curve(self):
+        table = _table([0, 1], [0.3487, 0.3487], [3.3464, 3.3464], [0.14602, 0.14602])
+        for percentile, z in PERCENTILE_Z.items():
+            y = value_at(0.3487, 3.3464, 0.14602, z)
+            result = _score(table, 0, y)
+            assert result.z == pytest.approx(z, abs=1e-4)
+            assert result.percentile == pytest.approx(percentile, abs=0.01)
+
+    def test_linear_when_l_is_one(self):
+        table = _table([0, 1], [1, 1], [50, 50], [0.04, 0.04])
+        assert _score(table, 0, 52) == Score(1.0, 84.13)
+
+    def test_log_branch_when_l_is_zero(self):
+        table = _table([0, 1], [0.0, 0.0], [10.0, 10.0], [0.1, 0.1])
+        y = 10 * 2.718281828459045 ** 0.15
+        assert _score(table, 0, y).z == pytest.approx(1.5, abs=1e-4)
+        assert _score(table, 0, 10).z == 0
+
+    def test_median_is_the_50th_percentile(self):
+        table = _table([0, 1], [-1.2, -1.2], [16.5, 16.5], [0.08, 0.08])
+        assert _score(table, 1, 16.5) == Score(0.0, 50.0)
+
+
+class TestInterpolation:
+    """L, M and S are interpolated linearly between the table's rows."""
+
+    def test_between_rows(self):
+        table = _table([1, 2], [1, 1], [10, 20], [0.1, 0.1])
+        assert _score(table, 1.5, 15).z == 0
+        assert _score(table, 1.5, 16.5).z == pytest.approx(1.0)
+        assert _score(table, 1.25, 12.5).z == 0
+
+    def test_on_a_row_uses_it_unchanged(self):
+        table = _table([1, 2, 3], [1, 1, 1], [10, 20, 40], [0.1, 0.1, 0.1])
+        assert _score(table, 2, 22).z == pytest.approx(1.0)
+
+    def test_interpolates_l_and_s(self):
+        table = _table([0, 2], [0.0, 2.0], [10, 10], [0.1, 0.3])
+        y = value_at(1.0, 10, 0.2, 1.0)
+        assert _score(table, 1, y).z == pytest.approx(1.0, abs=1e-4)
+
+
+class TestOutOfRange:
+    """Measurements the reference cannot score get no score, not an extrapolated one."""
+
+    @pytest.mark.parametrize("x", [-0.5, 36.5, 1000])
+    def test_x_outside_the_table(self, x):
+        assert score([Measurement("obs-1", "cdc_boys_weight_age", x, 10)]) == [Score(None, None)]
+
+    def test_table_edges_are_in_range(self):
+        table = get_table("cdc_boys_weight_age")
+        first, last = score([
+            Measurement("a", "cdc_boys_weight_age", table.x[0], table.m[0]),
+            Measurement("b", "cdc_boys_weight_age", table.x[-1], table.m[-1]),
+        ])
+        assert first.z == 0 and last.z == 0
+
+    @pytest.mark.parametrize("y", [0, -1])
+    def test_non_positive_value(self, y):
+        assert score([Measurement("obs-1", "cdc_boys_weight_age", 12, y)]) == [Score(None, None)]
+
+
+class TestPublishedValues:
+    """Scores agree with the z-scores and percentiles the CDC and WHO publish."""
+
+    @pytest.mark.parametrize("reference, x, y, z", [
+        # CDC zwtage: boys weight-for-age at 24 months
+        ("cdc_boys_weight_age_24_240", 24, 10.25460951, -2),
+        ("cdc_boys_weight_age_24_240", 24, 12.6707633, 0),
+        ("cdc_boys_weight_age_24_240", 24, 15.80802031, 2),
+    ])
+    def test_cdc_z_scores(self, reference, x, y, z):
+        assert score([Measurement("obs-1", reference, x, y)])[0].z == pytest.approx(z, abs=1e-4)
+
+    @pytest.mark.parametrize("reference, x, y, percentile", [
+        # CDC LMS data files, percentile columns
+        ("cdc_boys_weight_age", 0, 2.355450986, 3),
+        ("cdc_boys_weight_age", 0, 4.446488308, 97),
+        ("cdc_boys_head_age", 0, 33.08389492, 10),
+        ("cdc_boys_length_age", 0.5, 54.44054313, 75),
+        ("cdc_boys_weight_length", 45, 1.690593749, 5),
+        ("cdc_boys_bmi_age", 24, 18.16219473, 85),
+        ("cdc_boys_stature_age", 24, 93.02265441, 97),
+    ])
+    def test_cdc_percentiles(self, reference, x, y, percentile):
+        assert score([Measurement("obs-1", reference, x, y)])[0].percentile == pytest.approx(percentile, abs=0.01)
+
+    @pytest.mark.parametrize("reference, x, y, z", [
+        # WHO z-score tables, which print values to 0.1 kg or cm
+        ("who_boys_weight_age", 0, 3.3, 0),
+        ("who_boys_weight_age", 0, 4.4, 2),
+        ("who_boys_weight_age", 12, 7.7, -2),
+        ("who_girls_weight_age", 0, 2.4, -2),
+        ("who_boys_circumference_age", 0, 37.0, 2),
+        ("who_boys_length_age", 12, 71.0, -2),
+        ("who_boys_weight_length", 80, 12.4, 2),
+    ])
+    def test_who_z_scores(self, reference, x, y, z):
+        assert score([Measurement("obs-1", reference, x, y)])[0].z == pytest.approx(z, abs=0.1)
+
+
+class TestCache:
+    def test_repeat_scores_are_served_from_the_cache(self):
+        cache = _FakeCache()
+        measurements = [
+            Measurement("obs-1", "cdc_boys_weight_age", 12, 10),
+            Measurement("obs-2", "who_girls_length_age", 6, 66),
+        ]
+        first = score(measurements, cache)
+        assert cache._make_key(f"{CACHE_KEY_PREFIX}:cdc_boys_weight_age:obs-1") in cache.data
+
+        with patch(f"{MODULE}.get_table") as mock_get_table:
+            assert score(measurements, cache) == first
+        mock_get_table.assert_not_called()
+
+    def test_changed_measurement_is_rescored(self):
+        cache = _FakeCache()
+        score([Measurement("obs-1", "cdc_boys_weight_age", 12, 10)], cache)
+        again = score([Measurement("obs-1", "cdc_boys_weight_age", 12, 11)], cache)
+        assert again == score([Measurement("obs-1", "cdc_boys_weight_age", 12, 11)])
+
+
+def test_z_to_percentile():
+    assert z_to_percentile(0) == pytest.approx(50)
+    assert z_to_percentile(1.959963984540054) == pytest.approx(97.5, abs=1e-4)
+    assert z_to_percentile(-1.959963984540054) == pytest.approx(2.5, abs=1e-4)
@@ -0,0 +1,62 @@
+"""Tests for growth_charts/protocols/growth_charts.py."""
+
+import datetime
+from unittest.mock import patch
+
+import pytest
+
+from growth_charts.protocols.growth_charts import (
+    VITAL_NAMES,
+    add_percentiles,
+    generate_layer_data,
+    get_age_in_months,
+    get_exact_age_in_months,
+    get_vitals_by_name,
+)
+
+MODULE = "growth_charts.protocols.growth_charts"
+
+
+class TestAge:
+    def test_exact_age_counts_days(self):
+        birth = datetime.date(2025, 1, 31)
+        assert get_exact_age_in_months(birth, datetime.date(2025, 2, 1)) == pytest.approx(1 / 30.4375)
+        assert get_exact_age_in_months(birth, datetime.datetime(2026, 1, 31, 15, 30)) == pytest.approx(365 / 30.4375)
+
+    def test_plotted_age_counts_calendar_months(self):
+        assert get_age_in_months(datetime.date(2025, 1, 31), datetime.date(2025, 2, 1)) == 1
+
+
+class TestAddPercentiles:
+    def _graph(self, reference, series):
+        return {"reference": reference, "layerData": generate_layer_data(series)}
+
+    def test_first_month_measurement_is_scored_at_its_exact_age(self):
+        """A median-weight boy weighed the day after birth, across a month boundary."""
+        birth, visit = datetime.date(2025, 1, 31), datetime.date(2025, 2, 1)
+        graph = self._graph("who_boys_weight_age", {
+            get_age_in_months(birth, visit): (3.4, "obs-1", get_exact_age_in_months(birth, visit)),
+        })
+
+        add_percentiles([graph], None)
+
+        assert graph["layerData"] == [{"x": 1, "y": 3.4, "p": pytest.approx(51, abs=3)}]
+
+    def test_weight_for_length_is_scored_at_the_length(self):
+        graph = self._graph("who_boys_weight_length", {80.0: (10.4475, "w:l", 80.0)})
+        add_percentiles([graph], None)
+        assert graph["layerData"][0]["p"] == 50.0
+
+
+class TestGetVitalsByName:
+    def test_only_committed_observations_are_loaded(self):
+        with patch(f"{MODULE}.Observation.objects.for_patient") as for_patient:
+            queryset = for_patient.return_value.committed.return_value
+            queryset.filter.return_value.annotate.return_value.order_by.return_value.values_list.return_value = [
+                ("weight", "120", datetime.datetime(2025, 2, 1), "obs-1"),
+            ]
+            vitals = get_vitals_by_name("patient-1")
+
+        for_patient.return_value.committed.assert_called_once_with()
+        queryset.filter.assert_called_once_with(name__in=VITAL_NAMES)
+        assert vitals["weight"] == [(datetime.datetime(2025, 2, 1), "120", "obs-1")]
@@ -0,0 +1,27 @@
+from hcc_capture.hcc.code_set import (
+    HCC,
+    ICD10,
+    ICD10_SYSTEMS,
+    HccCodeSet,
+    get_code_set,
+    has_hcc,
+    icd10_code,
+    is_hcc,
+    normalize,
+)
+from hcc_capture.hcc.raf import RafScore, panel_raf_scores, raf_scores
+
+__all__ = (
+    "HCC",
+    "ICD10",
+    "ICD10_SYSTEMS",
+    "HccCodeSet",
+    "RafScore",
+    "get_code_set",
+    "has_hcc",
+    "icd10_code",
+    "is_hcc",
+    "normalize",
+    "panel_raf_scores",
+    "raf_scores",
+)
@@ -0,0 +1,168 @@
+"""The HCC code set shared by the annotation protocols and RAF scoring.
+
+The ICD-10 codes that carry an HCC come from `icd10.py`; the HCC category of
+each code and the category's community RAF coefficient come from the SDK's
+HCC value set. Both are compiled into one `HccCodeSet` the first time it is
+needed and kept for the life of the process.
+"""
+
+from typing import NamedTuple, Optional
+
+from hcc_capture.hcc import icd10
+
+HCC = "HCC"
+
+ICD10 = "ICD-10"
+
+ICD10_SYSTEMS = ("http://hl7.org/fhir/sid/icd-10", ICD10)
+
+# HCC category -> the categories it supersedes when both are present
+HIERARCHIES = {
+    "Metastatic Cancer and Acute Leukemia": (
+        "Lung and Other Severe Cancers",
+        "Lymphoma and Other Cancers",
+        "Colorectal, Bladder, and Other Cancers",
+        "Breast, Prostate, and Other Cancers and Tumors",
+    ),
+    "Lung and Other Severe Cancers": (
+        "Lymphoma and Other Cancers",
+        "Colorectal, Bladder, and Other Cancers",
+        "Breast, Prostate, and Other Cancers and Tumors",
+    ),
+    "Lymphoma and Other Cancers": (
+        "Colorectal, Bladder, and Other Cancers",
+        "Breast, Prostate, and Other Cancers and Tumors",
+    ),
+    "Colorectal, Bladder, and Other Cancers": (
+        "Breast, Prostate, and Other Cancers and Tumors",
+    ),
+    "Diabetes with Acute Complications": (
+        "Diabetes with Chronic Complications",
+        "Diabetes without Complication",
+    ),
+    "Diabetes with Chronic Complications": ("Diabetes without Complication",),
+    "End-Stage Liver Disease": ("Cirrhosis of Liver", "Chronic Hepatitis"),
+    "Cirrhosis of Liver": ("Chronic Hepatitis",),
+    "Severe Hematological Disorders": (
+        "Coagulation Defects and Other Specified Hematological Disorders",
+    ),
+    "Drug/Alcohol Psychosis": ("Drug/Alcohol Dependence",),
+    "Schizophrenia": ("Major Depressive, Bipolar, and Paranoid Disorders",),
+    "Quadriplegia": (
+        "Paraplegia",
+        "Spinal Cord Disorders/Injuries",
+        "Hemiplegia/Hemiparesis",
+        "Monoplegia, Other Paralytic Syndromes",
+        "Vertebral Fractures without Spinal Cord Injury",
+    ),
+    "Paraplegia": (
+        "Spinal Cord Disorders/Injuries",
+        "Monoplegia, Other Paralytic Syndromes",
+        "Vertebral Fractures without Spinal Cord Injury",
+    ),
+    "Spinal Cord Disorders/Injuries": ("Vertebral Fractures without Spinal Cord Injury",),
+    "Acute Myocardial Infarction": (
+        "Unstable Angina and Other Acute Ischemic Heart Disease",
+        "Angina Pectoris",
+    ),
+    "Unstable Angina and Other Acute Ischemic Heart Disease": ("Angina Pectoris",),
+    "Cerebral Hemorrhage": ("Ischemic or Unspecified Stroke",),
+    "Hemiplegia/Hemiparesis": ("Monoplegia, Other Paralytic Syndromes",),
+    "Atherosclerosis of the Extremities with Ulceration or Gangrene": (
+        "Vascular Disease with Complications",
+        "Vascular Disease",
+        "Chronic Ulcer of Skin, Except Pressure",
+        "Amputation Status, Lower Limb/Amputation Complications",
+    ),
+    "Vascular Disease with Complications": ("Vascular Disease",),
+    "Cystic Fibrosis": (
+        "Chronic Obstructive Pulmonary Disease",
+        "Fibrosis of Lung and Other Chronic Lung Disorder",
+    ),
+    "Chronic Obstructive Pulmonary Disease": ("Fibrosis of Lung and Other Chronic Lung Disorder",),
+    "Aspiration and Specified Bacterial Pneumonias": (
+        "Pneumococcal Pneumonia, Empyema, Lung Abscess",
+    ),
+    "Dialysis Status": (
+        "Acute Renal Failure",
+        "Chronic Kidney Disease (Stage 5)",
+        "Chronic Kidney Disease, Severe (Stage 4)",
+    ),
+    "Acute Renal Failure": (
+        "Chronic Kidney Disease (Stage 5)",
+        "Chronic Kidney Disease, Severe (Stage 4)",
+    ),
+    "Chronic Kidney Disease (Stage 5)": ("Chronic Kidney Disease, Severe (Stage 4)",),
+    "Pressure Ulcer of Skin with Necrosis Through to Muscle, Tendon, or Bone": (
+        "Pressure Ulcer of Skin with Full Thickness Skin Loss",
+        "Chronic Ulcer of Skin, Except Pressure",
+    ),
+    "Pressure Ulcer of Skin with Full Thickness Skin Loss": (
+        "Chronic Ulcer of Skin, Except Pressure",
+    ),
+    "Severe Head Injury": ("Major Head Injury",),
+}
+
+
+class HccCodeSet(NamedTuple):
+    version: str
+    codes: frozenset  # ICD-10 codes that carry an HCC tag
+    categories: dict  # ICD-10 code -> HCC category, for codes the model maps
+    coefficients: dict  # HCC category -> community RAF coefficient
+    hierarchies: dict  # HCC category -> categories it supersedes
+
+
+_code_sets: dict = {}
+
+
+def get_code_set() -> HccCodeSet:
+    """The compiled HCC code set."""
+    code_set = _code_sets.get(icd10.VERSION)
+    if code_set is None:
+        code_set = _code_sets[icd10.VERSION] = _compile()
+    return code_set
+
+
+def normalize(code: str) -> str:
+    """An ICD-10 code as the code set stores it: upper case, without the dot."""
+    return code.replace(".", "").strip().upper()
+
+
+def icd10_code(codings: list, systems: tuple = (ICD10,)) -> Optional[str]:
+    """The first ICD-10 code among `codings`, normalized, if any."""
+    for coding in codings:
+        if coding.get("system") in systems and coding.get("code"):
+            return normalize(coding["code"])
+    return None
+
+
+def is_hcc(code: Optional[str]) -> bool:
+    """Whether an ICD-10 code carries an HCC."""
+    if not code:
+        return False
+    return normalize(code) in get_code_set().codes
+
+
+def has_hcc(codings: list, systems: tuple = ICD10_SYSTEMS) -> bool:
+    """Whether any ICD-10 coding among `codings` carries an HCC."""
+    return any(coding.get("system") in systems and is_hcc(coding.get("code")) for coding in codings)
+
+
+def _compile() -> HccCodeSet:
+    from canvas_sdk.value_set.hcc2018 import HCCConditions
+
+    codes = frozenset(icd10.ICD_CODES.split())
+    categories = {}
+    coefficients = {}
+    for code, labels in HCCConditions.LABELS.items():
+        category = labels["HCC"]
+        if code in codes and category:
+            categories[code] = category
+            coefficients[category] = labels["CommunityRAF"]
+    return HccCodeSet(
+        version=f"{icd10.VERSION}/{HCCConditions.EXPANSION_VERSION}",
+        codes=codes,
+        categories=categories,
+        coefficients=coefficients,
+        hierarchies={category: frozenset(lower) for category, lower in HIERARCHIES.items()},
+    )
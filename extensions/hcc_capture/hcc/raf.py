@@ -0,0 +1,65 @@
+"""Risk adjustment factor (RAF) scores from patients' ICD-10 conditions.
+
+A patient's score is the sum of the community coefficients of their HCC
+categories, after dropping each category a more severe one in its hierarchy
+supersedes. `raf_scores` scores any number of patients against the code set
+compiled once; `panel_raf_scores` loads a panel's active conditions in one
+query first.
+"""
+
+from typing import Iterable, NamedTuple
+
+from canvas_sdk.v1.data import Condition
+
+from hcc_capture.hcc.code_set import get_code_set, normalize
+
+
+class RafScore(NamedTuple):
+    score: float
+    categories: tuple  # HCC categories counted, highest coefficient first
+    unmapped: tuple  # HCC-tagged codes the model has no category for
+
+
+def raf_scores(conditions: dict) -> dict:
+    """RafScore of each patient, from {patient id: ICD-10 codes}."""
+    code_set = get_code_set()
+    scores = {}
+    for patient_id, codes in conditions.items():
+        categories = set()
+        unmapped = set()
+        for code in codes:
+            code = normalize(code)
+            if code not in code_set.codes:
+                continue
+            category = code_set.categories.get(code)
+            if category:
+                categories.add(category)
+            else:
+                unmapped.add(code)
+
+        superseded = set()
+        for category in categories:
+            superseded.update(code_set.hierarchies.get(category, ()))
+        counted = sorted(categories - superseded, key=lambda c: (-code_set.coefficients[c], c))
+
+        scores[patient_id] = RafScore(
+            score=round(sum((code_set.coefficients[c] for c in counted), 0.0), 3),
+            categories=tuple(counted),
+            unmapped=tuple(sorted(unmapped)),
+        )
+    return scores
+
+
+def panel_raf_scores(patient_ids: Iterable[str]) -> dict:
+    """RafScore of each patient from their active, committed conditions."""
+    patient_ids = [str(patient_id) for patient_id in patient_ids]
+    conditions = {patient_id: [] for patient_id in patient_ids}
+    codings = (
+        Condition.objects.active()
+        .filter(patient__id__in=patient_ids, codings__system__in=("ICD-10", "ICD10CM"))
+        .values_list("patient__id", "codings__code")
+    )
+    for patient_id, code in codings:
+        if code:
+            conditions[str(patient_id)].append(code)
+    return raf_scores(conditions)
@@ -0,0 +1,51 @@
+"""Tests for hcc_capture/hcc/code_set.py."""
+
+import pytest
+
+from hcc_capture.hcc import icd10
+from hcc_capture.hcc.code_set import ICD10, get_code_set, has_hcc, icd10_code, is_hcc, normalize
+
+
+class TestCodeSet:
+    def test_every_code_is_an_icd10_code(self):
+        codes = icd10.ICD_CODES.split()
+        assert len(codes) == len(set(codes))
+        assert get_code_set().codes == frozenset(codes)
+        assert all(code[0].isalpha() and any(c.isdigit() for c in code) for code in codes)
+
+    def test_categories_and_coefficients(self):
+        code_set = get_code_set()
+        assert code_set.categories["E119"] == "Diabetes without Complication"
+        assert code_set.coefficients["Diabetes without Complication"] == 0.118
+        assert set(code_set.categories) <= code_set.codes
+        assert set(code_set.categories.values()) == set(code_set.coefficients)
+
+    def test_compiled_once(self):
+        assert get_code_set() is get_code_set()
+
+
+class TestLookups:
+    @pytest.mark.parametrize("code", ["E119", "E11.9", "e11.9", " E11.9 "])
+    def test_is_hcc_normalizes(self, code):
+        assert is_hcc(code)
+
+    @pytest.mark.parametrize("code", ["Z0000", "HCC", "", None])
+    def test_not_hcc(self, code):
+        assert not is_hcc(code)
+
+    def test_normalize(self):
+        assert normalize(" i21.a1 ") == "I21A1"
+
+    def test_icd10_code_takes_the_first_icd10_coding(self):
+        codings = [
+            {"system": "http://snomed.info/sct", "code": "44054006"},
+            {"system": ICD10, "code": "e11.65"},
+            {"system": ICD10, "code": "I10"},
+        ]
+        assert icd10_code(codings) == "E1165"
+        assert icd10_code(codings[:1]) is None
+
+    def test_has_hcc_accepts_either_system(self):
+        assert has_hcc([{"system": "http://hl7.org/fhir/sid/icd-10", "code": "E11.9"}])
+        assert has_hcc([{"system": ICD10, "code": "E11.9"}])
+        assert not has_hcc([{"system": "http://snomed.info/sct", "code": "E11.9"}])
@@ -0,0 +1,63 @@
+"""Tests for hcc_capture/hcc/raf.py."""
+
+from unittest.mock import patch
+
+import pytest
+
+from hcc_capture.hcc.raf import RafScore, panel_raf_scores, raf_scores
+
+MODULE = "hcc_capture.hcc.raf"
+
+
+class TestRafScores:
+    def test_sums_the_category_coefficients(self):
+        (score,) = raf_scores({"p1": ["E119", "B20"]}).values()
+        assert score == RafScore(0.588, ("HIV/AIDS", "Diabetes without Complication"), ())
+
+    def test_hierarchy_drops_superseded_categories(self):
+        scores = raf_scores({
+            "diabetes": ["E1100", "E1165", "E119"],
+            "kidney": ["Z992", "N186", "N184"],
+        })
+        assert scores["diabetes"].categories == ("Diabetes with Acute Complications",)
+        assert scores["diabetes"].score == 0.368
+        assert scores["kidney"].categories == ("Dialysis Status",)
+        assert scores["kidney"].score == 0.476
+
+    def test_unrelated_categories_are_both_counted(self):
+        score = raf_scores({"p1": ["E119", "N184"]})["p1"]
+        assert set(score.categories) == {"Diabetes without Complication", "Chronic Kidney Disease, Severe (Stage 4)"}
+        assert score.score == pytest.approx(0.342)
+
+    def test_codes_without_a_category_are_unmapped(self):
+        score = raf_scores({"p1": ["A81.00", "E119"]})["p1"]
+        assert score.unmapped == ("A8100",)
+        assert score.categories == ("Diabetes without Complication",)
+
+    def test_codes_without_an_hcc_are_ignored(self):
+        assert raf_scores({"p1": ["I10", "HCC"], "p2": []}) == {
+            "p1": RafScore(0.0, (), ()),
+            "p2": RafScore(0.0, (), ()),
+        }
+
+    def test_dotted_and_lowercase_codes(self):
+        assert raf_scores({"p1": ["e11.9"]}) == raf_scores({"p1": ["E119"]})
+
+    def test_repeated_category_counts_once(self):
+        assert raf_scores({"p1": ["E119", "E119", "E11.9"]})["p1"].score == 0.118
+
+
+class TestPanelRafScores:
+    def test_scores_each_patient_from_one_query(self):
+        with patch(f"{MODULE}.Condition.objects.active") as active:
+            query = active.return_value.filter.return_value.values_list
+            query.return_value = [("p1", "E11.9"), ("p1", None), ("p2", "N184")]
+            scores = panel_raf_scores(["p1", "p2", "p3"])
+
+        active.return_value.filter.assert_called_once_with(
+            patient__id__in=["p1", "p2", "p3"], codings__system__in=("ICD-10", "ICD10CM"),
+        )
+        assert query.call_count == 1
+        assert scores["p1"].categories == ("Diabetes without Complication",)
+        assert scores["p2"].categories == ("Chronic Kidney Disease, Severe (Stage 4)",)
+        assert scores["p3"] == RafScore(0.0, (), ())
@@ -70,6 +70,10 @@ from patient_panel.services.observations import (
 from patient_panel.services.pagination import (
     build_page_numbers,
     create_paginated_url_multi,
+    filter_signature,
+    get_page_anchor,
+    get_total_count,
+    save_page_anchor,
 )
 from patient_panel.services.patient_query import (
     annotate_sort_key,
@@ -80,6 +84,8 @@ from patient_panel.services.patient_query import (
     build_decoration_queryset,
     build_spine_queryset,
     decorate_columns_with_filter_state,
+    keyset_filter,
+    keyset_ordering,
     load_visit_stats,
     read_metadata_filter_params,
     STATS_SORT_FIELDS,
@@ -324,15 +330,55 @@ class PatientPanelAPI(StaffSessionAuthMixin, SimpleAPI):
         spine = apply_metadata_filters(spine, selected_metadata_filters, columns_for_sort)
 
         # COUNT on the lean, un-annotated spine → cheap COUNT(*) over the full
-        # filtered population (identical for both sort paths).
-        total_count = spine.count()
+        # filtered population (identical for both sort paths). Served from a
+        # short-TTL cache keyed by the filters; only page 1 recounts a stale
+        # entry, deeper pages show it as "about N" (see services.pagination).
+        count_signature = filter_signature(
+            facility_ids=selected_facility_ids,
+            protocols=selected_protocols,
+            patient_search=patient_search,
+            staff_ids=selected_staff_ids,
+            insurances=selected_insurances,
+            flagged_only=arrow.now().format("YYYY-MM-DD") if flagged_only else "",
+            metadata_filters=selected_metadata_filters,
+        )
+        total_count, count_is_estimate = get_total_count(
+            dropdown_cache, count_signature, spine, refresh=page == 1
+        )
 
         if stats_sort:
             spine = apply_stats_sort(spine, sort_by, sort_dir)
         else:
             spine = annotate_sort_key(spine, sort_by, self.LAST_VISIT_EXCLUDED_NOTE_TYPES)
             spine = apply_sorting(spine, sort_by, sort_dir, columns_for_sort)
-        page_ids = list(spine[offset : offset + page_size].values_list("id", flat=True))
+
+        # Keyset pagination: seek past the last row of the nearest page already
+        # rendered with this filter + sort (page anchors), then skip only the
+        # pages in between. Sequential paging costs the same on page 300 as on
+        # page 1; a cold deep link falls back to OFFSET from the top.
+        spine, sort_terms = keyset_ordering(spine)
+        anchor_signature = filter_signature(
+            filters=count_signature, sort_by=sort_by, sort_dir=sort_dir, page_size=page_size
+        )
+        anchor_page, cursor = get_page_anchor(dropdown_cache, anchor_signature, page)
+        if cursor is not None:
+            spine = keyset_filter(spine, sort_terms, cursor)
+        skip = (page - anchor_page) * page_size
+        page_rows = list(
+            spine[skip : skip + page_size].values_list(
+                "id", *[name for name, _, _ in sort_terms]
+            )
+        )
+        page_ids = [row[0] for row in page_rows]
+        if len(page_rows) == page_size:
+            save_page_anchor(dropdown_cache, anchor_signature, page + 1, list(page_rows[-1][1:]))
+
+        # A short page is the last one, so the total is known exactly; a full
+        # page means the total reaches at least this far.
+        if len(page_rows) < page_size and (page_rows or page == 1):
+            total_count, count_is_estimate = offset + len(page_rows), False
+        else:
+            total_count = max(total_count, offset + len(page_rows))
 
         # ── Phase 2: decorate ONLY the page's patients ─────────────────
         if page_ids:
@@ -468,6 +514,7 @@ class PatientPanelAPI(StaffSessionAuthMixin, SimpleAPI):
                 "current_page": page,
                 "total_pages": total_pages,
                 "total_count": total_count,
+                "count_is_estimate": count_is_estimate,
                 "has_next": has_next,
                 "has_previous": has_previous,
                 "next_page": next_page,
@@ -970,10 +1017,11 @@ class PatientPanelAPI(StaffSessionAuthMixin, SimpleAPI):
         (instead of waiting for the reconcile cron), and repair drift on demand.
         Inherits the plugin's org-wide StaffSessionAuthMixin auth (consistent with the
         dashboard's documented access model); the operation is non-destructive
-        (it upserts correct values) and runs synchronously (~seconds at 35k)."""
+        (it writes only rows whose values changed) and runs synchronously
+        (~seconds at 35k). Also resets the incremental reconcile's high-water mark."""
         staff_id = self.request.headers.get("canvas-logged-in-user-id", "")
-        count = reconcile_all_stats()
-        log.info("[panel_stats] manual backfill by staff=%s upserted %s rows", staff_id, count)
+        count = reconcile_all_stats(get_cache())
+        log.info("[panel_stats] manual backfill by staff=%s wrote %s rows", staff_id, count)
         return [
             Response(
                 content=json.dumps({"status": "ok", "patients": count}).encode(),
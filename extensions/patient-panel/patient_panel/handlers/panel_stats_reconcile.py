@@ -1,40 +1,56 @@
-"""Periodic (every 15 min) reconciliation + backfill for PatientPanelStats.
-
-The cron is the SOURCE OF TRUTH: it recomputes every patient's row, repairing
-drift from missed/failed events and creating rows for patients that never fired
-one. reconcile_all_stats() is also the backfill routine (idempotent).
-
-Set-based implementation: ~5 aggregate GROUP BY queries to collect all stats,
-then a chunked bulk-upsert over every patient — ~40 DB ops for 35k patients
-instead of ~175k. Each bulk_create call is capped at _CHUNK (1,000) records,
-well inside the Canvas 10,000-record bulk-operation limit.
+"""Periodic reconciliation + backfill for PatientPanelStats.
+
+The crons are the SOURCE OF TRUTH: they recompute rows, repairing drift from
+missed/failed events and creating rows for patients that never fired one.
+reconcile_all_stats() is also the backfill routine (idempotent).
+
+Two cadences:
+- every 15 min, incremental: only patients whose notes/tasks/care gaps/
+  addresses changed since the previous pass's high-water mark are recomputed,
+  and only rows whose values differ are written — at steady state a handful
+  of writes per tick instead of one per patient;
+- nightly, full: every patient, set-based (~5 aggregate GROUP BY queries, then
+  a chunked diff-and-upsert), as the backstop for changes the high-water mark
+  cannot see (deleted source rows). Each bulk_create call is capped at _CHUNK
+  (1,000) records, well inside the Canvas 10,000-record bulk-operation limit.
 """
 
+from canvas_sdk.caching.plugins import get_cache
 from canvas_sdk.effects import Effect
 from canvas_sdk.handlers.cron_task import CronTask
 
-from patient_panel.services.stats_recompute import reconcile_all_stats
+from patient_panel.services.stats_recompute import reconcile_all_stats, reconcile_changed_stats
 
-__all__ = ["PanelStatsReconcile", "reconcile_all_stats"]
+__all__ = ["PanelStatsFullReconcile", "PanelStatsReconcile", "reconcile_all_stats"]
 
 
 class PanelStatsReconcile(CronTask):
-    """Full reconciliation of the stats table, every 15 minutes.
+    """Incremental reconciliation of the stats table, every 15 minutes.
 
-    Set-based (~5 aggregates + chunked upsert; seconds even at 35k patients), so
-    a 15-min cadence is cheap (<~1% duty cycle). NOTE: this cron is NOT the
-    freshness source for last_visit/next_visit/room/tasks — those are updated in
-    real time by the panel_stats_sync event handlers (NOTE_*, TASK_*,
-    PATIENT_ADDRESS_*). The cadence only governs:
+    NOTE: this cron is NOT the freshness source for last_visit/next_visit/room/
+    tasks — those are updated in real time by the panel_stats_sync event
+    handlers (NOTE_*, TASK_*, PATIENT_ADDRESS_*). The cadence only governs:
       (1) gaps_due_count — derived from ProtocolCurrent, which has NO event-sync
-          handler, so the cron is its ONLY refresh source;
-      (2) cold-start — an empty/incomplete table self-heals within <=15 min
-          (paired with the LEFT-JOIN-equivalent sort, the panel stays correct
-          and fast even before the table is populated);
+          handler, so the crons are its ONLY refresh source;
+      (2) cold-start — with no high-water mark in the cache the pass runs in
+          full, so an empty/incomplete table self-heals within <=15 min (paired
+          with the LEFT-JOIN-equivalent sort, the panel stays correct and fast
+          even before the table is populated);
       (3) drift repair for missed/failed sync events."""
 
     SCHEDULE = "*/15 * * * *"  # every 15 minutes
 
     def execute(self) -> list[Effect]:
-        reconcile_all_stats()
+        reconcile_changed_stats(get_cache())
+        return []
+
+
+class PanelStatsFullReconcile(CronTask):
+    """Full reconciliation of the stats table, nightly (also resets the
+    incremental pass's high-water mark)."""
+
+    SCHEDULE = "30 7 * * *"  # 07:30 UTC — overnight in US time zones
+
+    def execute(self) -> list[Effect]:
+        reconcile_all_stats(get_cache())
         return []
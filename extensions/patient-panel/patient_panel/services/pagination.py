@@ -1,11 +1,34 @@
-"""Pagination URL + page-number helpers for the patient panel table.
+"""Pagination helpers for the patient panel table.
 
-Pure functions: callers pass the API's BASE_PATH/PREFIX explicitly so these
-have no dependency on the SimpleAPI instance.
+URL/page-number helpers are pure functions: callers pass the API's
+BASE_PATH/PREFIX explicitly so these have no dependency on the SimpleAPI
+instance.
+
+The total count and the page anchors are kept in the plugin cache, keyed by a
+signature of the filters. Like services.lookups, each reader takes the cache
+as an argument.
 """
 
+import json
+from hashlib import sha256
+from time import time
+from typing import Any
 from urllib.parse import urlencode
 
+# A cached count younger than this is shown as exact. Page 1 (any new filter,
+# sort or page size lands there) recounts once it is older; deeper pages keep
+# showing the cached number as "about N" until the entry expires.
+_COUNT_FRESH_SECONDS = 60
+_COUNT_TTL_SECONDS = 600
+
+# Page anchors: the sort values of the last row of each page already rendered,
+# so the next page seeks past them instead of OFFSET-ing from the top.
+_ANCHORS_TTL_SECONDS = 600
+_MAX_PAGE_ANCHORS = 100
+
+_COUNT_KEY_PREFIX = "panel_count:"
+_ANCHORS_KEY_PREFIX = "panel_anchors:"
+
 
 def create_paginated_url_multi(
     base_path: str,
@@ -79,3 +102,59 @@ def build_page_numbers(
         }
         for p in range(start_page, end_page + 1)
     ]
+
+
+def filter_signature(**params: Any) -> str:
+    """Stable cache-key fragment for a set of table parameters."""
+    normalized = {
+        key: sorted(value) if isinstance(value, list) else value
+        for key, value in params.items()
+    }
+    payload = json.dumps(normalized, sort_keys=True, default=str)
+    return sha256(payload.encode()).hexdigest()[:32]
+
+
+def get_total_count(cache: Any, signature: str, queryset: Any, *, refresh: bool) -> tuple[int, bool]:
+    """Return (count, is_estimate) for the filtered spine.
+
+    A cached count younger than _COUNT_FRESH_SECONDS is returned as exact.
+    An older one is returned as an estimate unless `refresh` is set, in which
+    case the spine is counted again.
+    """
+    key = _COUNT_KEY_PREFIX + signature
+    cached: dict[str, Any] | None = cache.get(key)
+    if cached is not None:
+        if time() - cached["at"] < _COUNT_FRESH_SECONDS:
+            return cached["count"], False
+        if not refresh:
+            return cached["count"], True
+    count: int = queryset.count()
+    cache.set(key, {"count": count, "at": time()}, timeout_seconds=_COUNT_TTL_SECONDS)
+    return count, False
+
+
+def get_page_anchor(cache: Any, signature: str, page: int) -> tuple[int, list[Any] | None]:
+    """Return the closest known (anchor_page, cursor) at or before `page`.
+
+    The cursor is the sort values of the row just before `anchor_page`.
+    (1, None) means no anchor is known and the page is read from the top.
+    """
+    anchors: dict[int, list[Any]] = cache.get(_ANCHORS_KEY_PREFIX + signature) or {}
+    known = [p for p in anchors if p <= page]
+    if not known:
+        return 1, None
+    anchor_page = max(known)
+    return anchor_page, anchors[anchor_page]
+
+
+def save_page_anchor(cache: Any, signature: str, page: int, cursor: list[Any]) -> None:
+    """Remember where `page` starts, keeping the anchors closest to it."""
+    key = _ANCHORS_KEY_PREFIX + signature
+    anchors: dict[int, list[Any]] = cache.get(key) or {}
+    if anchors.get(page) == cursor:
+        return
+    anchors[page] = cursor
+    if len(anchors) > _MAX_PAGE_ANCHORS:
+        nearest = sorted(anchors, key=lambda p: abs(p - page))[:_MAX_PAGE_ANCHORS]
+        anchors = {p: anchors[p] for p in nearest}
+    cache.set(key, anchors, timeout_seconds=_ANCHORS_TTL_SECONDS)
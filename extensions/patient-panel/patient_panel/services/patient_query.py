@@ -661,3 +661,75 @@ def apply_sorting(
                 F("next_visit_ann").asc(nulls_last=True), "last_name"
             )
     return patients_query
+
+
+# One term of a total table ordering: (field or annotation name, descending,
+# nulls_first). Plain assignment for the same sandbox reason as VisitStatsMap.
+SortTerm = tuple[str, bool, bool]
+
+
+def keyset_ordering(qs: Any) -> tuple[Any, list[SortTerm]]:
+    """Make the queryset's ordering total and describe it for keyset seeks.
+
+    Every sort above ends on a non-unique tie-breaker (last_name), and an
+    unsorted table has no ordering at all, so rows that tie could be returned
+    on either side of a page boundary. The primary key is appended as the final
+    tie-breaker. NULL placement is made explicit on every term (default: NULLs
+    sort as the largest value, as on Postgres) so the seek predicate built by
+    keyset_filter agrees with ORDER BY on any backend.
+    """
+    terms: list[SortTerm] = []
+    for item in qs.query.order_by:
+        if isinstance(item, str):
+            descending = item.startswith("-")
+            terms.append((item.lstrip("-"), descending, descending))
+            continue
+        descending = bool(item.descending)
+        if item.nulls_first:
+            nulls_first = True
+        elif item.nulls_last:
+            nulls_first = False
+        else:
+            nulls_first = descending
+        terms.append((item.expression.name, descending, nulls_first))
+    if not any(name in ("dbid", "pk") for name, _, _ in terms):
+        terms.append(("dbid", False, False))
+
+    ordering = [
+        F(name).desc(nulls_first=True) if descending and nulls_first
+        else F(name).desc(nulls_last=True) if descending
+        else F(name).asc(nulls_first=True) if nulls_first
+        else F(name).asc(nulls_last=True)
+        for name, descending, nulls_first in terms
+    ]
+    return qs.order_by(*ordering), terms
+
+
+def keyset_filter(qs: Any, terms: list[SortTerm], cursor: list[Any]) -> Any:
+    """Restrict a keyset-ordered queryset to the rows strictly after `cursor`.
+
+    `cursor` holds the `terms` values of the last row already shown (see
+    keyset_ordering). The predicate is the usual row-value seek expanded term
+    by term — equal on every earlier term and past the cursor on this one —
+    with NULLs placed where ORDER BY puts them. Rendering a deep page then
+    costs an index seek instead of reading and discarding OFFSET rows.
+    """
+    disjuncts: list[Q] = []
+    equal_so_far = Q()
+    for (name, descending, nulls_first), value in zip(terms, cursor):
+        if value is None:
+            if nulls_first:
+                disjuncts.append(equal_so_far & Q(**{f"{name}__isnull": False}))
+            equal_so_far &= Q(**{f"{name}__isnull": True})
+            continue
+        past = Q(**{f"{name}__{'lt' if descending else 'gt'}": value})
+        if not nulls_first:
+            past |= Q(**{f"{name}__isnull": True})
+        disjuncts.append(equal_so_far & past)
+        equal_so_far &= Q(**{name: value})
+    if not disjuncts:
+        return qs.none()
+    condition = disjuncts[0]
+    for disjunct in disjuncts[1:]:
+        condition |= disjunct
+    return qs.filter(condition)
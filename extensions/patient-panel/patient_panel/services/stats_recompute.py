@@ -1,16 +1,16 @@
 """Derive and upsert one patient's PatientPanelStats row.
 
 The single source of truth for stats values. Reused by event handlers, the
-reconciliation cron, and backfill. Query semantics mirror the decoration
+reconciliation crons, and backfill. Query semantics mirror the decoration
 subqueries in services.patient_query so sort order matches displayed values.
 """
 
-from datetime import datetime
-from typing import TypedDict
+from datetime import datetime, timedelta
+from typing import Any, Iterable, Sequence, TypedDict
 
 import arrow
 from canvas_sdk.v1.data import Patient
-from canvas_sdk.v1.data.note import Note, NoteStates
+from canvas_sdk.v1.data.note import Note, NoteStateChangeEvent, NoteStates
 from canvas_sdk.v1.data.patient import PatientFacilityAddress
 from canvas_sdk.v1.data.protocol_current import ProtocolCurrent
 from canvas_sdk.v1.data.protocol_result import ProtocolResultStatus
@@ -99,15 +99,18 @@ def recompute_stats_for_patient_uuid(patient_uuid: str) -> None:
         recompute_stats_for_patient(dbid)
 
 
-def compute_all_stat_values() -> dict[int, StatValues]:
+def compute_all_stat_values(patient_ids: Sequence[int] | None = None) -> dict[int, StatValues]:
     """Set-based stats for every patient that has at least one relevant record,
     in ~5 aggregate GROUP BY queries (vs ~5 per patient). Keys are patient dbids.
     Patients with no relevant records are absent — callers default them. Filter
-    semantics mirror compute_stat_values() exactly."""
+    semantics mirror compute_stat_values() exactly. `patient_ids` restricts every
+    query to those patients (incremental reconcile)."""
     now = arrow.utcnow().datetime
+    scope = Q() if patient_ids is None else Q(patient_id__in=patient_ids)
 
     last_visits: dict[int, datetime] = dict(
         Note.objects.filter(
+            scope,
             note_type_version__is_billable=True,
             datetime_of_service__lte=now,
         )
@@ -118,20 +121,20 @@ def compute_all_stat_values() -> dict[int, StatValues]:
         .values_list("patient_id", "v")
     )
     next_visits: dict[int, datetime] = dict(
-        Note.objects.filter(datetime_of_service__gt=now)
+        Note.objects.filter(scope, datetime_of_service__gt=now)
         .exclude(Q(current_state__state=NoteStates.DELETED) | Q(current_state__state=NoteStates.CANCELLED))
         .values("patient_id")
         .annotate(v=Min("datetime_of_service"))
         .values_list("patient_id", "v")
     )
     tasks_open: dict[int, int] = dict(
-        Task.objects.filter(status=TaskStatus.OPEN)
+        Task.objects.filter(scope, status=TaskStatus.OPEN)
         .values("patient_id")
         .annotate(c=Count("id"))
         .values_list("patient_id", "c")
     )
     gaps_due: dict[int, int] = dict(
-        ProtocolCurrent.objects.filter(status=ProtocolResultStatus.STATUS_DUE)
+        ProtocolCurrent.objects.filter(scope, status=ProtocolResultStatus.STATUS_DUE)
         .values("patient_id")
         .annotate(c=Count("id"))
         .values_list("patient_id", "c")
@@ -140,7 +143,9 @@ def compute_all_stat_values() -> dict[int, StatValues]:
     # First-seen room per patient — iterator keeps memory flat for large tables.
     rooms: dict[int, str | None] = {}
     for pid, room in (
-        PatientFacilityAddress.objects.values_list("patient_id", "room_number").iterator(chunk_size=2000)
+        PatientFacilityAddress.objects.filter(scope)
+        .values_list("patient_id", "room_number")
+        .iterator(chunk_size=2000)
     ):
         if pid not in rooms:
             rooms[pid] = room
@@ -171,14 +176,25 @@ _DEFAULT: StatValues = StatValues(
     gaps_due_count=0,
 )
 
-_UPDATE_FIELDS: list[str] = [
+_VALUE_FIELDS: tuple[str, ...] = (
     "last_visit_dt",
     "next_visit_dt",
     "room_number",
     "tasks_open_count",
     "gaps_due_count",
-    "updated",
-]
+)
+
+_UPDATE_FIELDS: list[str] = [*_VALUE_FIELDS, "updated"]
+
+# High-water mark of the last reconcile: the incremental pass only recomputes
+# patients whose inputs were modified after it. Expiry (or a cold cache) makes
+# the next pass a full one.
+_HWM_KEY: str = "panel_stats:reconcile_hwm"
+_HWM_TTL_SECONDS: int = 2 * 24 * 60 * 60
+
+# Rows committed slightly after the previous pass read the clock (app-server
+# skew, in-flight transactions) still land inside the next window.
+_HWM_OVERLAP: timedelta = timedelta(minutes=2)
 
 
 def _bulk_upsert(rows: list[PatientPanelStats]) -> None:
@@ -192,25 +208,108 @@ def _bulk_upsert(rows: list[PatientPanelStats]) -> None:
     )
 
 
-def reconcile_all_stats() -> int:
-    """Full reconciliation as ~5 aggregate queries + chunked bulk-upsert.
-    Source of truth / drift repair; safe to run repeatedly (idempotent upsert)."""
-    stats = compute_all_stat_values()
+def _upsert_changed(stats: dict[int, StatValues], dbids: list[int], now: datetime) -> int:
+    """Upsert the rows of `dbids` whose stored values differ from `stats`.
+    Returns the number of rows written; identical rows cost no write."""
+    stored: dict[int, tuple[Any, ...]] = {
+        pid: tuple(values)
+        for pid, *values in PatientPanelStats.objects.filter(patient_id__in=dbids).values_list(
+            "patient_id", *_VALUE_FIELDS
+        )
+    }
+    rows: list[PatientPanelStats] = []
+    for dbid in dbids:
+        vals = stats.get(dbid, _DEFAULT)
+        if stored.get(dbid) != tuple(vals[field] for field in _VALUE_FIELDS):  # type: ignore[literal-required]
+            rows.append(PatientPanelStats(patient_id=dbid, updated=now, **vals))
+    if rows:
+        _bulk_upsert(rows)
+    return len(rows)
+
+
+def _reconcile(stats: dict[int, StatValues], dbids: Iterable[int]) -> tuple[int, int]:
+    """Diff-and-upsert `dbids` in _CHUNK batches. Returns (checked, written)."""
     now = arrow.utcnow().datetime
-    processed = 0
-    chunk: list[PatientPanelStats] = []
+    checked = written = 0
+    chunk: list[int] = []
 
-    for dbid in Patient.objects.values_list("dbid", flat=True).iterator(chunk_size=2_000):
-        vals = stats.get(dbid, _DEFAULT)
-        chunk.append(PatientPanelStats(patient_id=dbid, updated=now, **vals))
+    for dbid in dbids:
+        chunk.append(dbid)
         if len(chunk) >= _CHUNK:
-            _bulk_upsert(chunk)
-            processed += len(chunk)
+            written += _upsert_changed(stats, chunk, now)
+            checked += len(chunk)
             chunk = []
 
     if chunk:
-        _bulk_upsert(chunk)
-        processed += len(chunk)
+        written += _upsert_changed(stats, chunk, now)
+        checked += len(chunk)
+
+    return checked, written
 
-    log.info("[panel_stats] reconcile upserted %s patient rows", processed)
-    return processed
+
+def reconcile_all_stats(cache: Any | None = None) -> int:
+    """Full reconciliation as ~5 aggregate queries + chunked diff-and-upsert.
+    Source of truth / drift repair; safe to run repeatedly. Only rows whose
+    values changed are written. With a cache, also advances the high-water mark
+    so the incremental pass picks up from here. Returns the rows written."""
+    started = arrow.utcnow().datetime
+    stats = compute_all_stat_values()
+    checked, written = _reconcile(
+        stats, Patient.objects.values_list("dbid", flat=True).iterator(chunk_size=2_000)
+    )
+    if cache is not None:
+        cache.set(_HWM_KEY, started, timeout_seconds=_HWM_TTL_SECONDS)
+
+    log.info("[panel_stats] full reconcile checked %s patients, wrote %s rows", checked, written)
+    return written
+
+
+def changed_patient_ids(since: datetime, until: datetime) -> set[int]:
+    """dbids of patients whose stats inputs may have changed in (since, until].
+
+    Modification times of the source rows (notes, note state changes, tasks,
+    care gaps, facility addresses), new patients, and visits whose time of
+    service passed — those move from next_visit to last_visit without any row
+    changing. Deleted source rows leave no trace here; the full reconcile
+    repairs them."""
+    sources = (
+        Note.objects.filter(modified__gt=since),
+        Note.objects.filter(datetime_of_service__gt=since, datetime_of_service__lte=until),
+        Task.objects.filter(modified__gt=since),
+        ProtocolCurrent.objects.filter(modified__gt=since),
+        PatientFacilityAddress.objects.filter(modified__gt=since),
+    )
+    pids: set[int] = set()
+    for qs in sources:
+        pids.update(qs.values_list("patient_id", flat=True).distinct())
+    pids.update(
+        NoteStateChangeEvent.objects.filter(created__gt=since)
+        .values_list("note__patient_id", flat=True)
+        .distinct()
+    )
+    pids.update(Patient.objects.filter(created__gt=since).values_list("dbid", flat=True))
+    pids.discard(None)  # type: ignore[arg-type]
+    return pids
+
+
+def reconcile_changed_stats(cache: Any) -> int:
+    """Incremental reconciliation: recompute only the patients whose inputs
+    changed since the high-water mark, and write only rows that differ.
+    Falls back to a full reconcile when there is no mark. Returns the rows written."""
+    since: datetime | None = cache.get(_HWM_KEY)
+    if since is None:
+        return reconcile_all_stats(cache)
+
+    started = arrow.utcnow().datetime
+    pids = sorted(changed_patient_ids(since - _HWM_OVERLAP, started))
+    written = 0
+    if pids:
+        _, written = _reconcile(compute_all_stat_values(pids), pids)
+    cache.set(_HWM_KEY, started, timeout_seconds=_HWM_TTL_SECONDS)
+
+    log.info(
+        "[panel_stats] incremental reconcile checked %s changed patients, wrote %s rows",
+        len(pids),
+        written,
+    )
+    return written
@@ -151,3 +151,38 @@ def test_decoration_sources_visits_from_stats_when_enabled() -> None:
     html = _render_stats(no_auto_filter="1", page_size="50", sort_by="patient", sort_dir="asc")
     assert "Source" in html
     assert "03.15.2024" in html
+
+
+def _page(page: int, **qp: str) -> str:
+    return _render(no_auto_filter="1", page=str(page), **qp)
+
+
+def test_table_sequential_pages_cover_ties_exactly_once() -> None:
+    # Every patient ties on the sort value and the name tiebreak; the primary
+    # key tiebreak appended for keyset paging keeps page boundaries stable.
+    for i in range(7):
+        PatientFactory.create(first_name=f"Twin{i}x", last_name="Tied")
+    seen: list[int] = []
+    for page in range(1, 8):
+        html = _page(page, page_size="1", sort_by="gaps", sort_dir="asc")
+        seen.extend(i for i in range(7) if f"Twin{i}x" in html)
+    assert sorted(seen) == list(range(7))
+
+
+def test_table_page_after_anchor_matches_cold_offset_read() -> None:
+    for i in range(25):
+        PatientFactory.create(last_name=f"Seek{i:02d}")
+    qp = dict(page_size="10", sort_by="patient", sort_dir="desc")
+    _page(1, **qp)
+    via_anchor = _page(2, **qp)
+    assert "Seek14" in via_anchor and "Seek05" in via_anchor
+    assert "Seek15" not in via_anchor and "Seek04" not in via_anchor
+
+
+def test_table_last_page_reports_exact_total() -> None:
+    for i in range(12):
+        PatientFactory.create(last_name=f"Count{i:02d}")
+    assert "12 patients — Page 1 of 2" in _page(1, page_size="10", sort_by="patient")
+    PatientFactory.create(last_name="Count12")
+    # Page 1's cached count (12) is stale; the short last page knows the total.
+    assert "13 patients — Page 2 of 2" in _page(2, page_size="10", sort_by="patient")
@@ -11,6 +11,7 @@ from __future__ import annotations
 
 import sys
 import types
+import uuid
 from pathlib import Path
 from typing import Any, Callable
 
@@ -89,22 +90,39 @@ def _reset_class_caches() -> None:
     _panel_api_module.PatientPanelAPI._fhir_token_cache = {}
 
     # The dropdown lookups (services.lookups) cache population-wide filter
-    # options under fixed global keys. Clear them so cached facilities/staff/
+    # options under fixed global keys (as does the stats reconcile's
+    # high-water mark). Clear them so cached facilities/staff/
     # insurances/protocols from one test never leak into the next. Routed
     # through tests._helpers.cache_delete so get_cache() resolves the plugin
     # context (it cannot be called directly from conftest).
     from tests._helpers import cache_delete
-    from patient_panel.services import lookups
+    from patient_panel.services import lookups, stats_recompute
 
     for key in (
         lookups._FACILITIES_KEY,
         lookups._PROTOCOL_TITLES_KEY,
         lookups._STAFF_KEY,
         lookups._INSURANCES_KEY,
+        stats_recompute._HWM_KEY,
     ):
         cache_delete(key)
 
 
+@pytest.fixture(autouse=True)
+def _isolate_table_caches(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Give each test its own namespace for the /table count and page-anchor keys.
+
+    Those keys embed a hash of the filters, so unlike the dropdown keys above
+    they can't be listed and deleted; an unfiltered table in one test would
+    otherwise reuse the count cached by another.
+    """
+    from patient_panel.services import pagination
+
+    namespace = uuid.uuid4().hex
+    monkeypatch.setattr(pagination, "_COUNT_KEY_PREFIX", f"panel_count:{namespace}:")
+    monkeypatch.setattr(pagination, "_ANCHORS_KEY_PREFIX", f"panel_anchors:{namespace}:")
+
+
 @pytest.fixture
 def make_api() -> Callable[..., Any]:
     """Factory fixture returning a fresh PatientPanelAPI per call."""
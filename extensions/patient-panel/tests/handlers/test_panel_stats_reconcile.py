@@ -4,6 +4,7 @@ import arrow
 import pytest
 
 from canvas_sdk.test_utils.factories import PatientFactory, TaskFactory
+from canvas_sdk.v1.data import Patient
 
 from tests.factories import PatientPanelStatsFactory
 from patient_panel.models import PatientPanelStats
@@ -63,3 +64,79 @@ def test_reconcile_bulk_matches_per_patient() -> None:
         assert row.last_visit_dt == expected["last_visit_dt"]
         assert row.next_visit_dt == expected["next_visit_dt"]
         assert (row.room_number or None) == (expected["room_number"] or None)
+
+
+# ── Incremental reconcile ─────────────────────────────────────────────────
+
+
+def test_incremental_without_high_water_mark_runs_full() -> None:
+    from patient_panel.services.stats_recompute import _HWM_KEY, reconcile_changed_stats
+    from tests._helpers import plugin_cache
+
+    p = PatientFactory.create()
+    assert reconcile_changed_stats(plugin_cache()) == 1
+    assert PatientPanelStats.objects.filter(patient_id=p.dbid).exists()
+    assert plugin_cache().get(_HWM_KEY) is not None
+
+
+def test_incremental_recomputes_only_changed_patients() -> None:
+    from patient_panel.services.stats_recompute import reconcile_changed_stats
+    from tests._helpers import plugin_cache
+
+    p1 = PatientFactory.create()
+    p2 = PatientFactory.create()
+    # Created well before the high-water mark (and its overlap window).
+    Patient.objects.filter(dbid=p2.dbid).update(created=arrow.utcnow().shift(days=-1).datetime)
+    reconcile_all_stats(plugin_cache())
+    # Drift the incremental pass can't see: nothing of p2's changed.
+    PatientPanelStats.objects.filter(patient_id=p2.dbid).update(tasks_open_count=99)
+    TaskFactory.create(patient=p1, status="OPEN")
+
+    assert reconcile_changed_stats(plugin_cache()) == 1
+    assert PatientPanelStats.objects.get(patient_id=p1.dbid).tasks_open_count == 1
+    assert PatientPanelStats.objects.get(patient_id=p2.dbid).tasks_open_count == 99
+
+    # The full (nightly) pass is the backstop.
+    assert reconcile_all_stats(plugin_cache()) == 1
+    assert PatientPanelStats.objects.get(patient_id=p2.dbid).tasks_open_count == 0
+
+
+def test_incremental_picks_up_care_gaps_and_new_patients() -> None:
+    from canvas_sdk.test_utils.factories import ProtocolCurrentFactory
+
+    from patient_panel.services.stats_recompute import reconcile_changed_stats
+    from tests._helpers import plugin_cache
+
+    p1 = PatientFactory.create()
+    reconcile_all_stats(plugin_cache())
+    ProtocolCurrentFactory.create(patient=p1, status="due")
+    p2 = PatientFactory.create()
+
+    assert reconcile_changed_stats(plugin_cache()) == 2
+    assert PatientPanelStats.objects.get(patient_id=p1.dbid).gaps_due_count == 1
+    assert PatientPanelStats.objects.filter(patient_id=p2.dbid).exists()
+
+
+def test_reconcile_skips_unchanged_rows() -> None:
+    p = PatientFactory.create()
+    TaskFactory.create(patient=p, status="OPEN")
+    assert reconcile_all_stats() == 1
+    written_at = PatientPanelStats.objects.get(patient_id=p.dbid).updated
+
+    assert reconcile_all_stats() == 0
+    assert PatientPanelStats.objects.get(patient_id=p.dbid).updated == written_at
+
+
+def test_changed_patients_include_visits_that_moved_into_the_past() -> None:
+    from canvas_sdk.test_utils.factories import NoteFactory
+
+    from patient_panel.services.stats_recompute import changed_patient_ids
+
+    now = arrow.utcnow()
+    p = PatientFactory.create()
+    NoteFactory.create(patient=p, datetime_of_service=now.shift(hours=1).datetime)
+
+    # The note itself was modified before `since`; only its time of service is in the window.
+    since = now.shift(minutes=30).datetime
+    assert p.dbid in changed_patient_ids(since, now.shift(hours=2).datetime)
+    assert p.dbid not in changed_patient_ids(since, now.shift(minutes=45).datetime)
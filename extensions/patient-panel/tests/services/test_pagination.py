@@ -1,12 +1,23 @@
-"""Tests for patient_panel.services.pagination (pure URL/page-number helpers)."""
+"""Tests for patient_panel.services.pagination (URL/page-number helpers,
+cached counts and page anchors)."""
 
 __is_plugin__ = True
 
 from urllib.parse import parse_qs, urlparse
 
+import pytest
+
+from canvas_sdk.test_utils.factories import PatientFactory
+from canvas_sdk.v1.data.patient import Patient
+
+from patient_panel.services import pagination
 from patient_panel.services.pagination import (
     build_page_numbers,
     create_paginated_url_multi,
+    filter_signature,
+    get_page_anchor,
+    get_total_count,
+    save_page_anchor,
 )
 
 BASE_PATH = "/plugin-io/api/patient_panel"
@@ -64,3 +75,79 @@ class TestBuildPageNumbers:
         pages = build_page_numbers(BASE_PATH, PREFIX, 20, 20, {})
         numbers = [p["number"] for p in pages]
         assert numbers == [16, 17, 18, 19, 20]
+
+
+class FakeCache:
+    """Dict-backed cache with the get/set surface the pagination helpers use."""
+
+    def __init__(self) -> None:
+        self.store: dict[str, object] = {}
+
+    def get(self, key: str, default: object = None) -> object:
+        return self.store.get(key, default)
+
+    def set(self, key: str, value: object, timeout_seconds: int | None = None) -> None:
+        self.store[key] = value
+
+
+class TestFilterSignature:
+    def test_list_order_does_not_matter(self) -> None:
+        assert filter_signature(staff_ids=["a", "b"], search="x") == filter_signature(
+            search="x", staff_ids=["b", "a"]
+        )
+
+    def test_differs_per_filter(self) -> None:
+        assert filter_signature(search="x") != filter_signature(search="y")
+
+
+@pytest.mark.django_db
+class TestGetTotalCount:
+    def test_fresh_count_served_from_cache(self) -> None:
+        cache = FakeCache()
+        PatientFactory.create()
+        assert get_total_count(cache, "sig", Patient.objects.all(), refresh=True) == (1, False)
+
+        PatientFactory.create()
+        assert get_total_count(cache, "sig", Patient.objects.all(), refresh=True) == (1, False)
+
+    def test_stale_count_is_an_estimate_on_deep_pages(self) -> None:
+        cache = FakeCache()
+        PatientFactory.create()
+        get_total_count(cache, "sig", Patient.objects.all(), refresh=True)
+        entry = cache.store[pagination._COUNT_KEY_PREFIX + "sig"]
+        entry["at"] -= pagination._COUNT_FRESH_SECONDS + 1  # type: ignore[index]
+
+        PatientFactory.create()
+        assert get_total_count(cache, "sig", Patient.objects.all(), refresh=False) == (1, True)
+        assert get_total_count(cache, "sig", Patient.objects.all(), refresh=True) == (2, False)
+
+    def test_signatures_are_independent(self) -> None:
+        cache = FakeCache()
+        PatientFactory.create()
+        get_total_count(cache, "all", Patient.objects.all(), refresh=True)
+        assert get_total_count(cache, "none", Patient.objects.none(), refresh=False) == (0, False)
+
+
+class TestPageAnchors:
+    def test_no_anchor_reads_from_top(self) -> None:
+        assert get_page_anchor(FakeCache(), "sig", 5) == (1, None)
+
+    def test_nearest_anchor_at_or_before_page(self) -> None:
+        cache = FakeCache()
+        save_page_anchor(cache, "sig", 2, ["Adams", 10])
+        save_page_anchor(cache, "sig", 4, ["Baker", 20])
+        save_page_anchor(cache, "sig", 9, ["Young", 90])
+
+        assert get_page_anchor(cache, "sig", 4) == (4, ["Baker", 20])
+        assert get_page_anchor(cache, "sig", 6) == (4, ["Baker", 20])
+        assert get_page_anchor(cache, "sig", 1) == (1, None)
+
+    def test_keeps_anchors_nearest_the_latest_page(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(pagination, "_MAX_PAGE_ANCHORS", 3)
+        cache = FakeCache()
+        for page in (2, 3, 4, 5):
+            save_page_anchor(cache, "sig", page, [page])
+
+        anchors = cache.store[pagination._ANCHORS_KEY_PREFIX + "sig"]
+        assert isinstance(anchors, dict)
+        assert sorted(anchors) == [3, 4, 5]
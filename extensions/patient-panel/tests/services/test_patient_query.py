@@ -21,6 +21,8 @@ from patient_panel.services.patient_query import (
     build_base_queryset,
     build_decoration_queryset,
     build_spine_queryset,
+    keyset_filter,
+    keyset_ordering,
     STATS_SORT_FIELDS,
 )
 
@@ -423,3 +425,81 @@ def test_apply_stats_sort_keeps_patient_without_stats_row() -> None:
     ids = list(apply_stats_sort(Patient.objects.all(), "last_visit", "desc").values_list("dbid", flat=True))
     assert norow.dbid in ids  # kept despite having no stats row
     assert has.patient_id in ids
+
+
+# ── keyset pagination ─────────────────────────────────────────────────────
+
+
+def _walk_pages(qs: object, page_size: int) -> list[object]:
+    """Read every page by seeking past the previous page's last row."""
+    ordered, terms = keyset_ordering(qs)
+    names = [name for name, _, _ in terms]
+    seen: list[object] = []
+    cursor = None
+    while True:
+        page = ordered if cursor is None else keyset_filter(ordered, terms, cursor)
+        rows = list(page[:page_size].values_list("dbid", *names))
+        seen.extend(row[0] for row in rows)
+        if len(rows) < page_size:
+            return seen
+        cursor = list(rows[-1][1:])
+
+
+class TestKeysetPagination:
+    def test_ordering_appends_primary_key_tiebreaker(self) -> None:
+        qs = apply_sorting(Patient.objects.all(), "patient", "asc")
+        _, terms = keyset_ordering(qs)
+        assert terms == [
+            ("last_name", False, False),
+            ("first_name", False, False),
+            ("dbid", False, False),
+        ]
+
+    def test_unsorted_table_orders_by_primary_key(self) -> None:
+        patients = [PatientFactory.create() for _ in range(3)]
+        ordered, terms = keyset_ordering(build_spine_queryset())
+        assert terms == [("dbid", False, False)]
+        assert list(ordered.values_list("dbid", flat=True)) == [p.dbid for p in patients]
+
+    @pytest.mark.parametrize("sort_dir", ["asc", "desc"])
+    def test_name_sort_pages_match_full_ordering_with_ties(self, sort_dir: str) -> None:
+        for i in range(7):
+            PatientFactory.create(last_name="Tie" if i % 2 else f"Name{i}", first_name="Same")
+        qs = apply_sorting(Patient.objects.all(), "patient", sort_dir)
+        ordered, _ = keyset_ordering(qs)
+        assert _walk_pages(qs, 2) == list(ordered.values_list("dbid", flat=True))
+
+    @pytest.mark.parametrize("sort_by,sort_dir", [
+        ("last_visit", "asc"),
+        ("last_visit", "desc"),
+        ("room", "asc"),
+    ])
+    def test_stats_sort_pages_cross_nulls(self, sort_by: str, sort_dir: str) -> None:
+        from tests.factories import PatientPanelStatsFactory
+
+        for year in (2020, 2022, 2022, 2024):
+            PatientPanelStatsFactory.create(
+                last_visit_dt=arrow.get(f"{year}-01-01").datetime, room_number=f"R{year}"
+            )
+        for _ in range(3):
+            PatientPanelStatsFactory.create(last_visit_dt=None, room_number=None)
+        PatientFactory.create()  # no stats row at all
+
+        qs = apply_stats_sort(Patient.objects.all(), sort_by, sort_dir)
+        ordered, _ = keyset_ordering(qs)
+        expected = list(ordered.values_list("dbid", flat=True))
+        assert len(expected) == 8
+        for page_size in (1, 3):
+            assert _walk_pages(qs, page_size) == expected
+
+    def test_metadata_ordinal_sort_pages(self) -> None:
+        for value in ("High", "Low", None, "Medium", "Low", "Unknown", None):
+            _seed_risk(value)
+        qs = apply_sorting(Patient.objects.all(), "risk_score", "desc", [RISK_COLUMN])
+        ordered, _ = keyset_ordering(qs)
+        assert _walk_pages(qs, 2) == list(ordered.values_list("dbid", flat=True))
+
+    def test_cursor_past_last_row_is_empty(self) -> None:
+        patient = PatientFactory.create()
+        ordered, terms = keyset_ordering(build_spine_queryset())
+        assert list(keyset_filter(ordered, terms, [patient.dbid])) == []
@@ -14,10 +14,6 @@ from canvas_sdk.effects.simple_api import HTMLResponse, JSONResponse, Response
 from canvas_sdk.handlers.simple_api import SimpleAPI, StaffSessionAuthMixin, api
 from canvas_sdk.templates import render_to_string
 
-from provider_availability.engine.calculator import (
-    calculate_available_slots,
-    get_available_slots_for_provider,
-)
 from provider_availability.engine.csv_import import generate_template_csv
 from provider_availability.engine.event_sync import (
     build_block_event_effects,
@@ -44,6 +40,7 @@ from provider_availability.engine.models import (
     TimeWindow,
 )
 from provider_availability.engine.overlap import check_rule_overlap
+from provider_availability.engine.slot_cache import get_precomputed_slots_for_providers
 from provider_availability.engine.storage import (
     delete_block,
     delete_recurring_block,
@@ -375,9 +372,9 @@ class AvailabilityAPI(StaffSessionAuthMixin, SimpleAPI):
         if not rules:
             return [JSONResponse({"slots": [], "count": 0})]
 
-        slots = get_available_slots_for_provider(
+        slots = get_precomputed_slots_for_providers(
             rules, start_date, end_date, location_id, visit_type
-        )
+        ).get(provider_id, [])
         log.info("available-slots: returning %d slots", len(slots))
 
         return [
@@ -414,24 +411,15 @@ class AvailabilityAPI(StaffSessionAuthMixin, SimpleAPI):
 
         all_rules = get_all_rules()
 
-        # Group by provider
-        providers_with_slots: dict[str, int] = {}
-        for rule in all_rules:
-            if location_id:
-                if rule.location_ids and location_id not in rule.location_ids:
-                    continue
-            if visit_type:
-                if rule.visit_types and visit_type not in rule.visit_types:
-                    continue
-
-            slots = calculate_available_slots(rule, start_date, end_date)
-            if slots:
-                pid = rule.provider_id
-                providers_with_slots[pid] = providers_with_slots.get(pid, 0) + len(slots)
+        # Read precomputed days; only missing ones are computed, in one batched pass
+        slots_by_provider = get_precomputed_slots_for_providers(
+            all_rules, start_date, end_date, location_id, visit_type
+        )
 
         providers = [
-            {"provider_id": pid, "available_slot_count": count}
-            for pid, count in providers_with_slots.items()
+            {"provider_id": pid, "available_slot_count": len(slots)}
+            for pid, slots in slots_by_provider.items()
+            if slots
         ]
 
         return [
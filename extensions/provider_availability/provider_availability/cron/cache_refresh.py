@@ -1,4 +1,4 @@
-"""CronTask to refresh cache TTLs, re-sync daily, and maintain lead-time blocks."""
+"""CronTask to refresh cache TTLs, re-sync daily, maintain lead-time blocks and precompute slots."""
 
 from __future__ import annotations
 
@@ -19,6 +19,7 @@ from provider_availability.engine.event_sync import (
     build_lead_time_block_effects,
     sync_provider_availability,
 )
+from provider_availability.engine.slot_cache import refresh_slot_cache
 from provider_availability.engine.storage import (
     get_all_recurring_blocks,
     get_all_rules,
@@ -35,8 +36,8 @@ class CacheRefreshTask(CronTask):
     """Refresh TTLs on all cached availability rules and admin blocks.
 
     Also ensures Clinic calendars exist for all active providers,
-    performs a daily re-sync of availability events, and refreshes
-    lead-time blocks.
+    performs a daily re-sync of availability events, refreshes
+    lead-time blocks, and recomputes dirty precomputed slot days.
     """
 
     SCHEDULE = "*/5 * * * *"
@@ -60,6 +61,9 @@ class CacheRefreshTask(CronTask):
         # Refresh hold-type blocks daily (same schedule as daily resync)
         effects.extend(_refresh_hold_blocks())
 
+        # Recompute only the precomputed slot days that were invalidated or expired
+        _refresh_slot_cache()
+
         return effects
 
 
@@ -134,6 +138,16 @@ def _refresh_hold_blocks() -> list[Effect]:
     return effects
 
 
+def _refresh_slot_cache() -> None:
+    """Recompute missing or stale precomputed slot days for every provider with rules."""
+    try:
+        computed = refresh_slot_cache(get_all_rules())
+        if computed:
+            log.info("refresh_slot_cache: recomputed %d provider days", computed)
+    except Exception:
+        log.exception("refresh_slot_cache: error precomputing slots")
+
+
 def _ensure_provider_calendars() -> list[Effect]:
     """Create Clinic calendars for any active providers missing one."""
     effects: list[Effect] = []
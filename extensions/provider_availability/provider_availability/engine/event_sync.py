@@ -27,7 +27,13 @@ from provider_availability.engine.models import (
     DateOverride,
     ProviderAvailabilityRule,
     RecurringBlock,
-    date_in_pattern,
+)
+from provider_availability.engine.recurrence import (
+    first_daily_occurrence,
+    first_weekday_occurrence,
+    occurrence_dates,
+    recurring_segments,
+    windows_on,
 )
 from provider_availability.engine.storage import get_event_ids, get_rules_for_provider
 from provider_availability.engine.tz_utils import localize_naive, provider_tz, to_utc
@@ -172,14 +178,7 @@ def _build_rule_events(rule: ProviderAvailabilityRule) -> list[Effect]:
         if is_daily:
             # Daily: emit one recurring event per time_window covering the full range.
             # Daily anchor is the first in-pattern date >= range_start.
-            anchor = rule.effective_start or range_start
-            if anchor < range_start:
-                # advance to first in-pattern date >= range_start
-                offset = (range_start - anchor).days
-                if offset % interval != 0:
-                    anchor = range_start + dt.timedelta(days=interval - (offset % interval))
-                else:
-                    anchor = range_start
+            anchor = first_daily_occurrence(range_start, rule.effective_start, interval)
             if anchor > range_end:
                 continue
 
@@ -231,8 +230,10 @@ def _build_rule_events(rule: ProviderAvailabilityRule) -> list[Effect]:
             if weekday_int is None or dow is None:
                 continue
 
-            # Find first occurrence of this weekday in the range
-            first_date = _next_weekday(range_start, weekday_int)
+            # Find first in-pattern occurrence of this weekday in the range
+            first_date = first_weekday_occurrence(
+                range_start, weekday_int, rule.effective_start, interval, rule.weekly_schedule,
+            )
             if first_date > range_end:
                 continue
 
@@ -266,7 +267,7 @@ def _build_rule_events(rule: ProviderAvailabilityRule) -> list[Effect]:
                     event_count += 1
                 else:
                     # Split recurring event into segments that skip override dates
-                    segments = _compute_recurring_segments(
+                    segments = recurring_segments(
                         first_date, range_end, override_dates, step_days=step_days,
                     )
                     for seg_start, seg_end in segments:
@@ -312,37 +313,6 @@ def _build_rule_events(rule: ProviderAvailabilityRule) -> list[Effect]:
     return effects
 
 
-def _compute_recurring_segments(
-    first_date: date,
-    range_end: date,
-    override_dates: list[date],
-    step_days: int = 7,
-) -> list[tuple[date, date]]:
-    """Split a recurring range into segments that skip override dates.
-
-    Each segment is a (start_date, end_date) pair representing consecutive
-    in-pattern occurrences spaced `step_days` apart. Override dates that
-    don't fall on an in-pattern occurrence are ignored (they're already
-    skipped by the recurrence). For overrides that do fall on the pattern,
-    the segment before ends `step_days` prior, and the segment after starts
-    `step_days` later.
-
-    step_days = 7 for weekly interval=1, 14 for bi-weekly, N for daily/N.
-    """
-    segments: list[tuple[date, date]] = []
-    current_start = first_date
-    for ovr_date in sorted(override_dates):
-        if ovr_date < first_date or (ovr_date - first_date).days % step_days != 0:
-            continue  # not on pattern — recurrence already skips it
-        seg_end = ovr_date - dt.timedelta(days=step_days)
-        if seg_end >= current_start:
-            segments.append((current_start, seg_end))
-        current_start = ovr_date + dt.timedelta(days=step_days)
-    if current_start <= range_end:
-        segments.append((current_start, range_end))
-    return segments
-
-
 def build_delete_effects(provider_id: str) -> list[Effect]:
     """Delete all 'Available' events on the provider's Clinic calendars.
 
@@ -390,25 +360,6 @@ def build_delete_effects(provider_id: str) -> list[Effect]:
     return effects
 
 
-def _weekday_occurrences(start: date, end: date, weekday_int: int) -> list[date]:
-    """Return all occurrences of a weekday (0=Mon, 6=Sun) between start and end inclusive."""
-    first = _next_weekday(start, weekday_int)
-    result: list[date] = []
-    current = first
-    while current <= end:
-        result.append(current)
-        current += dt.timedelta(days=7)
-    return result
-
-
-def _next_weekday(from_date: date, weekday_int: int) -> date:
-    """Find the next occurrence of a weekday (0=Mon, 6=Sun) on or after from_date."""
-    days_ahead = weekday_int - from_date.weekday()
-    if days_ahead < 0:
-        days_ahead += 7
-    return from_date + dt.timedelta(days=days_ahead)
-
-
 def _get_calendar_id(
     provider_id: str, location_id: str | None
 ) -> tuple[str, list[Effect]]:
@@ -645,32 +596,25 @@ def build_lead_time_block_effects(rule: ProviderAvailabilityRule) -> list[Effect
     # Build the list of (start, end) intervals where lead-time blocks are needed:
     # the intersection of [now, now+lead] with the provider's availability windows.
     lead_intervals: list[tuple[datetime, datetime]] = []
-    current_date = now_local.date()
+    start_date = now_local.date()
     end_date = lead_end_local.date()
 
     # Check date overrides — use override windows instead of weekly schedule
-    override_lookup = {o.date: o for o in rule.date_overrides}
-
-    rule_is_daily = rule.recurrence_frequency == "daily"
-    rule_interval = max(1, rule.recurrence_interval)
-    while current_date <= end_date:
+    override_lookup = {
+        o.date: o for o in rule.date_overrides if start_date <= o.date <= end_date
+    }
+    schedule_dates = occurrence_dates(
+        start_date, end_date, rule.effective_start, rule.recurrence_frequency,
+        max(1, rule.recurrence_interval), rule.weekly_schedule,
+    )
+    for current_date in sorted(set(schedule_dates).union(override_lookup)):
         override = override_lookup.get(current_date)
         if override is not None:
             if override.is_closed:
-                current_date += dt.timedelta(days=1)
                 continue
             windows = override.time_windows
-        elif not date_in_pattern(
-            current_date, rule.effective_start, rule.recurrence_frequency,
-            rule_interval, rule.weekly_schedule,
-        ):
-            current_date += dt.timedelta(days=1)
-            continue
-        elif rule_is_daily:
-            windows = rule.time_windows
         else:
-            day_name = current_date.strftime("%A").lower()
-            windows = rule.weekly_schedule.get(day_name, [])
+            windows = windows_on(current_date, rule.recurrence_frequency, rule.time_windows, rule.weekly_schedule)
         for window in windows:
             win_start = datetime.combine(current_date, window.start).replace(tzinfo=tz)
             win_end = datetime.combine(current_date, window.end).replace(tzinfo=tz)
@@ -679,7 +623,6 @@ def build_lead_time_block_effects(rule: ProviderAvailabilityRule) -> list[Effect
             block_end = min(win_end, lead_end_local)
             if block_start < block_end:
                 lead_intervals.append((block_start, block_end))
-        current_date += dt.timedelta(days=1)
 
     if not lead_intervals:
         # No availability windows overlap with the lead-time range — still
@@ -833,13 +776,7 @@ def build_recurring_block_sync_effects(block: RecurringBlock) -> list[Effect]:
         effects.extend(cal_effects)
 
         if is_daily:
-            anchor = block.effective_start or range_start
-            if anchor < range_start:
-                offset = (range_start - anchor).days
-                if offset % interval != 0:
-                    anchor = range_start + dt.timedelta(days=interval - (offset % interval))
-                else:
-                    anchor = range_start
+            anchor = first_daily_occurrence(range_start, block.effective_start, interval)
             if anchor > range_end:
                 continue
             for window in block.time_windows:
@@ -867,7 +804,9 @@ def build_recurring_block_sync_effects(block: RecurringBlock) -> list[Effect]:
             if weekday_int is None or dow is None:
                 continue
 
-            first_date = _next_weekday(range_start, weekday_int)
+            first_date = first_weekday_occurrence(
+                range_start, weekday_int, block.effective_start, interval, block.weekly_schedule,
+            )
             if first_date > range_end:
                 continue
 
@@ -900,7 +839,7 @@ def build_recurring_block_sync_effects(block: RecurringBlock) -> list[Effect]:
                     event_count += 1
                 else:
                     # Split recurring event around override dates
-                    segments = _compute_recurring_segments(
+                    segments = recurring_segments(
                         first_date, range_end, skip_dates, step_days=step_days,
                     )
                     for seg_start, seg_end in segments:
@@ -966,6 +905,15 @@ def _build_hold_block_events(block: RecurringBlock) -> list[Effect]:
     else:
         location_ids = [None]  # provider-level (no location)
 
+    hold_dates = occurrence_dates(
+        max(range_start, block_after + dt.timedelta(days=1)),
+        range_end,
+        block.effective_start,
+        block.recurrence_frequency,
+        max(1, block.recurrence_interval),
+        block.weekly_schedule,
+    )
+
     event_count = 0
     for loc_id in location_ids:
         calendar_id, cal_effects = get_admin_calendar_id(block.provider_id, loc_id)
@@ -975,34 +923,13 @@ def _build_hold_block_events(block: RecurringBlock) -> list[Effect]:
 
         effects.extend(cal_effects)
 
-        is_daily = block.recurrence_frequency == "daily"
-        current_date = range_start
-        while current_date <= range_end:
-            if current_date <= block_after:
-                current_date += dt.timedelta(days=1)
-                continue
-
-            if not date_in_pattern(
-                current_date,
-                block.effective_start,
-                block.recurrence_frequency,
-                max(1, block.recurrence_interval),
-                block.weekly_schedule,
-            ):
-                current_date += dt.timedelta(days=1)
-                continue
-
-            if is_daily:
-                windows = block.time_windows
-            else:
-                day_name = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"][current_date.weekday()]
-                windows = block.weekly_schedule.get(day_name, [])
+        for current_date in hold_dates:
+            windows = windows_on(current_date, block.recurrence_frequency, block.time_windows, block.weekly_schedule)
 
             # Skip this date if an override narrows availability and hold is outside it
             if current_date in override_map:
                 ovr_windows = override_map[current_date]
                 if _block_outside_override(windows, ovr_windows):
-                    current_date += dt.timedelta(days=1)
                     continue
 
             for window in windows:
@@ -1018,8 +945,6 @@ def _build_hold_block_events(block: RecurringBlock) -> list[Effect]:
                 effects.append(event)
                 event_count += 1
 
-            current_date += dt.timedelta(days=1)
-
     log.info(
         "_build_hold_block_events: provider=%s hold_type=%s events=%d range=%s..%s locations=%s",
         block.provider_id, block.hold_type, event_count, range_start, range_end, block.location_ids,
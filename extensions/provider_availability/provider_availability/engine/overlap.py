@@ -7,8 +7,8 @@ from datetime import date, timedelta
 from provider_availability.engine.models import (
     ProviderAvailabilityRule,
     TimeWindow,
-    date_in_pattern,
 )
+from provider_availability.engine.recurrence import occurrence_dates
 from provider_availability.engine.storage import get_rules_for_provider
 
 
@@ -37,7 +37,7 @@ def _shared_active_date(
 ) -> date | None:
     """Return any single date on which both rules are in-pattern, or None.
 
-    Walks at most _OVERLAP_PROBE_HORIZON_DAYS from the later effective_start.
+    Looks at most _OVERLAP_PROBE_HORIZON_DAYS past the later effective_start.
     Used to verify that two rules whose date ranges overlap actually have
     a common occurrence under their respective recurrence intervals.
     """
@@ -59,25 +59,16 @@ def _shared_active_date(
     if horizon < probe_end:
         probe_end = horizon
 
-    candidate = probe_start
-    while candidate <= probe_end:
-        in_a = date_in_pattern(
-            candidate,
-            rule_a.effective_start,
-            rule_a.recurrence_frequency,
-            rule_a.recurrence_interval,
-            rule_a.weekly_schedule,
-        )
-        in_b = date_in_pattern(
-            candidate,
-            rule_b.effective_start,
-            rule_b.recurrence_frequency,
-            rule_b.recurrence_interval,
-            rule_b.weekly_schedule,
-        )
-        if in_a and in_b:
+    dates_b = set(occurrence_dates(
+        probe_start, probe_end, rule_b.effective_start,
+        rule_b.recurrence_frequency, rule_b.recurrence_interval, rule_b.weekly_schedule,
+    ))
+    for candidate in occurrence_dates(
+        probe_start, probe_end, rule_a.effective_start,
+        rule_a.recurrence_frequency, rule_a.recurrence_interval, rule_a.weekly_schedule,
+    ):
+        if candidate in dates_b:
             return candidate
-        candidate += timedelta(days=1)
     return None
 
 
@@ -0,0 +1,157 @@
+"""Recurrence expansion shared by the slot calculator and calendar sync.
+
+Rules and recurring blocks repeat every N days (daily) or on selected weekdays
+every N weeks (weekly); models.date_in_pattern is the reference definition.
+Every weekday of a weekly pattern, and a daily pattern as a whole, is an
+arithmetic progression of dates, so instead of testing each day of a range
+against the pattern the helpers here jump from one occurrence to the next.
+"""
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+from typing import Any, Optional
+
+from provider_availability.engine.models import (
+    DAYS_OF_WEEK,
+    TimeWindow,
+    _selected_weekdays,
+    recurrence_anchor,
+)
+
+
+def occurrence_dates(
+    start: date,
+    end: date,
+    effective_start: Optional[date],
+    frequency: str,
+    interval: int,
+    weekly_schedule: dict[str, Any],
+) -> list[date]:
+    """All dates in [start, end] for which date_in_pattern is true, in order."""
+    dates: list[date] = []
+    for first, step_days in _progressions(start, effective_start, frequency, interval, weekly_schedule):
+        if first > end:
+            continue
+        count = (end - first).days // step_days + 1
+        dates.extend(first + timedelta(days=step_days * n) for n in range(count))
+    dates.sort()
+    return dates
+
+
+def windows_on(
+    day: date,
+    frequency: str,
+    time_windows: list[TimeWindow],
+    weekly_schedule: dict[str, list[TimeWindow]],
+) -> list[TimeWindow]:
+    """Time windows of an in-pattern day."""
+    if frequency == "daily":
+        return time_windows
+    return weekly_schedule.get(DAYS_OF_WEEK[day.weekday()], [])
+
+
+def first_daily_occurrence(start: date, effective_start: Optional[date], interval: int) -> date:
+    """First date on/after `start` of a daily pattern anchored at effective_start.
+
+    Without an effective_start the pattern is anchored at `start` itself, which
+    is how the recurring calendar events are laid out.
+    """
+    return _first_on_or_after(effective_start or start, start, interval)
+
+
+def first_weekday_occurrence(
+    start: date,
+    weekday_int: int,
+    effective_start: Optional[date],
+    interval: int,
+    weekly_schedule: dict[str, Any],
+) -> date:
+    """First date on/after `start` that falls on `weekday_int` in an in-pattern week.
+
+    Every-other-week (and longer) patterns count weeks from the recurrence
+    anchor, so the first occurrence can be more than a week after `start`.
+    """
+    anchor = None
+    if interval > 1 and effective_start is not None:
+        anchor = recurrence_anchor(effective_start, "weekly", weekly_schedule)
+    if anchor is None:
+        return next_weekday(start, weekday_int)
+    first = anchor + timedelta(days=(weekday_int - anchor.weekday()) % 7)
+    return _first_on_or_after(first, start, 7 * interval)
+
+
+def next_weekday(from_date: date, weekday_int: int) -> date:
+    """Find the next occurrence of a weekday (0=Mon, 6=Sun) on or after from_date."""
+    return from_date + timedelta(days=(weekday_int - from_date.weekday()) % 7)
+
+
+def weekday_occurrences(start: date, end: date, weekday_int: int) -> list[date]:
+    """Return all occurrences of a weekday (0=Mon, 6=Sun) between start and end inclusive."""
+    first = next_weekday(start, weekday_int)
+    if first > end:
+        return []
+    return [first + timedelta(days=7 * n) for n in range((end - first).days // 7 + 1)]
+
+
+def recurring_segments(
+    first_date: date,
+    range_end: date,
+    override_dates: list[date],
+    step_days: int = 7,
+) -> list[tuple[date, date]]:
+    """Split a recurring range into segments that skip override dates.
+
+    Each segment is a (start_date, end_date) pair representing consecutive
+    in-pattern occurrences spaced `step_days` apart. Override dates that
+    don't fall on an in-pattern occurrence are ignored (they're already
+    skipped by the recurrence). For overrides that do fall on the pattern,
+    the segment before ends `step_days` prior, and the segment after starts
+    `step_days` later.
+
+    step_days = 7 for weekly interval=1, 14 for bi-weekly, N for daily/N.
+    """
+    segments: list[tuple[date, date]] = []
+    current_start = first_date
+    for ovr_date in sorted(override_dates):
+        if ovr_date < first_date or (ovr_date - first_date).days % step_days != 0:
+            continue  # not on pattern — recurrence already skips it
+        seg_end = ovr_date - timedelta(days=step_days)
+        if seg_end >= current_start:
+            segments.append((current_start, seg_end))
+        current_start = ovr_date + timedelta(days=step_days)
+    if current_start <= range_end:
+        segments.append((current_start, range_end))
+    return segments
+
+
+def _progressions(
+    start: date,
+    effective_start: Optional[date],
+    frequency: str,
+    interval: int,
+    weekly_schedule: dict[str, Any],
+) -> list[tuple[date, int]]:
+    """(first occurrence on/after start, step in days) of each progression in the pattern."""
+    if interval < 1:
+        return []
+    if effective_start is not None and start < effective_start:
+        start = effective_start
+    if frequency == "daily":
+        if effective_start is None:
+            return [(start, 1)]  # date_in_pattern has no anchor to count the interval from
+        return [(_first_on_or_after(effective_start, start, interval), interval)]
+    # Like daily, weeks are only skipped when there is an anchor to count them from
+    step_days = 7 * interval if effective_start is not None else 7
+    return [
+        (first_weekday_occurrence(start, weekday_int, effective_start, interval, weekly_schedule), step_days)
+        for weekday_int in _selected_weekdays(weekly_schedule)
+    ]
+
+
+def _first_on_or_after(first: date, start: date, step_days: int) -> date:
+    """The first date of first, first + step_days, ... that is on/after start."""
+    if first >= start:
+        return first
+    steps = -(-(start - first).days // step_days)
+    return first + timedelta(days=steps * step_days)
@@ -0,0 +1,243 @@
+"""Precomputed per-provider, per-day availability.
+
+Patient-facing slot searches read free slots from the plugin cache instead of
+recomputing them from appointments, calendar events and blocks on every call.
+
+Each cached day holds, for every active rule of the provider, a bitmap of the
+minutes of the day at which one of the rule's slots starts and is free. Days
+are computed without the rule's lead time so one entry serves the whole day;
+lead time is applied when the bitmap is read back.
+
+A day entry is reused while:
+- the generation counters it was computed under are current (rule, recurring
+  block and timezone edits bump them; see storage.py), and
+- it was computed today, or the day is at least two days out. Hold-type
+  recurring blocks only change for today and tomorrow as the date rolls over.
+
+Appointment and admin block changes delete the affected days outright. Missing
+or stale days are recomputed on read (and cached), and CacheRefreshTask
+recomputes them ahead of time across PRECOMPUTE_DAYS. A provider whose days
+were deleted while they were being recomputed doesn't get them cached; the
+next read computes them again.
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime, time, timedelta
+from zoneinfo import ZoneInfo
+
+from provider_availability.engine.calculator import _compute_windows, _effective_range, _rule_matches
+from provider_availability.engine.models import AvailableSlot, ProviderAvailabilityRule
+from provider_availability.engine.storage import (
+    get_slot_cache,
+    get_slot_day_generations,
+    save_slot_days,
+)
+from provider_availability.engine.tz_utils import provider_tzs
+
+PRECOMPUTE_DAYS = 30  # days from today kept warm by CacheRefreshTask
+
+
+def get_precomputed_slots_for_providers(
+    rules: list[ProviderAvailabilityRule],
+    start_date: date,
+    end_date: date,
+    location_id: str = "",
+    visit_type: str = "",
+    now: datetime | None = None,
+) -> dict[str, list[AvailableSlot]]:
+    """Same result as calculator.get_available_slots_for_providers, read from the slot cache.
+
+    Days missing from the cache are computed in one batched pass and cached
+    when they fall within the precompute horizon.
+    """
+    matching = [
+        rule for rule in rules
+        if rule.is_active and _rule_matches(rule, location_id, visit_type)
+    ]
+    provider_ids = sorted({rule.provider_id for rule in matching})
+    results: dict[str, list[AvailableSlot]] = {pid: [] for pid in provider_ids}
+    if not provider_ids or start_date > end_date:
+        return results
+
+    tzs = provider_tzs(provider_ids)
+    nows = _provider_nows(provider_ids, tzs, now)
+    days = _date_range(start_date, end_date)
+    active_rules = _active_rules_by_provider(rules, provider_ids)
+
+    entries = _load_days(active_rules, {pid: days for pid in provider_ids}, tzs, nows)
+
+    for rule in matching:
+        earliest = nows[rule.provider_id] + timedelta(hours=rule.booking_interval.min_lead_hours)
+        for day in days:
+            entry = entries.get((rule.provider_id, day))
+            if entry is None:
+                continue
+            results[rule.provider_id].extend(
+                slot for slot in _decode_slots(rule, day, entry["rules"].get(rule.id, "0"))
+                if slot.start >= earliest
+            )
+
+    for slots in results.values():
+        slots.sort(key=lambda s: s.start)
+    return results
+
+
+def refresh_slot_cache(rules: list[ProviderAvailabilityRule], now: datetime | None = None) -> int:
+    """Recompute missing or stale days within the horizon. Returns the number of days computed."""
+    provider_ids = sorted({rule.provider_id for rule in rules if rule.is_active})
+    if not provider_ids:
+        return 0
+
+    tzs = provider_tzs(provider_ids)
+    nows = _provider_nows(provider_ids, tzs, now)
+    days_by_provider = {
+        pid: _date_range(nows[pid].date(), nows[pid].date() + timedelta(days=PRECOMPUTE_DAYS - 1))
+        for pid in provider_ids
+    }
+    active_rules = _active_rules_by_provider(rules, provider_ids)
+    computed: list[tuple[str, date]] = []
+    _load_days(active_rules, days_by_provider, tzs, nows, computed=computed)
+    return len(computed)
+
+
+def _load_days(
+    rules_by_provider: dict[str, list[ProviderAvailabilityRule]],
+    days_by_provider: dict[str, list[date]],
+    tzs: dict[str, ZoneInfo],
+    nows: dict[str, datetime],
+    computed: list[tuple[str, date]] | None = None,
+) -> dict[tuple[str, date], dict]:
+    """Return an entry for every requested day, recomputing the ones that are missing or stale."""
+    provider_ids = sorted(rules_by_provider)
+    gens, entries = get_slot_cache(provider_ids, days_by_provider)
+
+    stale: dict[str, list[date]] = {}
+    for pid in provider_ids:
+        today = nows[pid].date()
+        rule_ids = {rule.id for rule in rules_by_provider[pid]}
+        for day in days_by_provider.get(pid, []):
+            entry = entries.get((pid, day))
+            if entry is None or not _is_fresh(entry, gens[pid], today, day, rule_ids):
+                entries.pop((pid, day), None)
+                stale.setdefault(pid, []).append(day)
+
+    if not stale:
+        return entries
+
+    day_gens = get_slot_day_generations(sorted(stale))
+    fresh = _compute_days(rules_by_provider, stale, tzs, nows, gens)
+    entries.update(fresh)
+    # Days an appointment or block change dropped mid-computation may predate it
+    dropped = {
+        pid for pid, gen in get_slot_day_generations(sorted(stale)).items()
+        if gen != day_gens[pid]
+    }
+    save_slot_days({
+        (pid, day): entry
+        for (pid, day), entry in fresh.items()
+        if pid not in dropped
+        and nows[pid].date() <= day < nows[pid].date() + timedelta(days=PRECOMPUTE_DAYS)
+    })
+    if computed is not None:
+        computed.extend(fresh)
+    return entries
+
+
+def _is_fresh(entry: dict, gen: list[int], today: date, day: date, rule_ids: set[str]) -> bool:
+    if list(entry.get("gen", [])) != gen:
+        return False
+    if entry.get("on") != today.isoformat() and day < today + timedelta(days=2):
+        return False
+    return rule_ids <= set(entry.get("rules", {}))
+
+
+def _compute_days(
+    rules_by_provider: dict[str, list[ProviderAvailabilityRule]],
+    stale: dict[str, list[date]],
+    tzs: dict[str, ZoneInfo],
+    nows: dict[str, datetime],
+    gens: dict[str, list[int]],
+) -> dict[tuple[str, date], dict]:
+    """Compute full-day bitmaps for the stale days of each provider in one batched pass."""
+    windows: list[tuple[ProviderAvailabilityRule, datetime, datetime, datetime]] = []
+    for pid, days in stale.items():
+        for rule in rules_by_provider[pid]:
+            # datetime.min as "now" leaves out lead time; it's applied on read
+            effective_range = _effective_range(rule, min(days), max(days), datetime.min)
+            if effective_range is not None:
+                windows.append((rule, nows[pid], *effective_range))
+
+    bitmaps: dict[tuple[str, date], dict[str, int]] = {
+        (pid, day): {rule.id: 0 for rule in rules_by_provider[pid]}
+        for pid, days in stale.items()
+        for day in days
+    }
+    for rule, slots in _compute_windows(windows, sorted(stale), tzs):
+        for slot in slots:
+            day_bitmaps = bitmaps.get((rule.provider_id, slot.start.date()))
+            if day_bitmaps is not None:
+                minute = slot.start.hour * 60 + slot.start.minute
+                day_bitmaps[rule.id] |= 1 << minute
+
+    return {
+        (pid, day): {
+            "gen": gens[pid],
+            "on": nows[pid].date().isoformat(),
+            "rules": {rule_id: format(bits, "x") for rule_id, bits in rule_bitmaps.items()},
+        }
+        for (pid, day), rule_bitmaps in bitmaps.items()
+    }
+
+
+def _decode_slots(rule: ProviderAvailabilityRule, day: date, bitmap: str) -> list[AvailableSlot]:
+    granularity = timedelta(minutes=rule.booking_interval.slot_granularity_minutes)
+    midnight = datetime.combine(day, time.min)
+    location_id = rule.location_ids[0] if rule.location_ids else ""
+    visit_type = rule.visit_types[0] if rule.visit_types else ""
+
+    slots = []
+    bits = int(bitmap, 16)
+    while bits:
+        lowest = bits & -bits
+        start = midnight + timedelta(minutes=lowest.bit_length() - 1)
+        slots.append(AvailableSlot(
+            start=start,
+            end=start + granularity,
+            provider_id=rule.provider_id,
+            location_id=location_id,
+            visit_type=visit_type,
+        ))
+        bits ^= lowest
+    return slots
+
+
+def _provider_nows(
+    provider_ids: list[str],
+    tzs: dict[str, ZoneInfo],
+    now: datetime | None,
+) -> dict[str, datetime]:
+    """Naive provider-local "now" of each provider."""
+    if now is not None:
+        return {pid: now for pid in provider_ids}
+    return {pid: datetime.now(tzs[pid]).replace(tzinfo=None) for pid in provider_ids}
+
+
+def _active_rules_by_provider(
+    rules: list[ProviderAvailabilityRule],
+    provider_ids: list[str],
+) -> dict[str, list[ProviderAvailabilityRule]]:
+    """Every active rule of the given providers, whatever the query filters.
+
+    Cached days cover all of a provider's rules so any location or visit type
+    filter can be served from the same entry.
+    """
+    by_provider: dict[str, list[ProviderAvailabilityRule]] = {pid: [] for pid in provider_ids}
+    for rule in rules:
+        if rule.is_active and rule.provider_id in by_provider:
+            by_provider[rule.provider_id].append(rule)
+    return by_provider
+
+
+def _date_range(start: date, end: date) -> list[date]:
+    return [start + timedelta(days=offset) for offset in range((end - start).days + 1)]
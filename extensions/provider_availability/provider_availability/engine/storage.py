@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+from datetime import date, datetime, timedelta
 from typing import Any
 
 from canvas_sdk.caching.plugins import get_cache
@@ -10,16 +11,31 @@ from logger import log
 
 from provider_availability.engine.models import AdminBlock, ProviderAvailabilityRule, RecurringBlock
 
-INDEX_KEY = "pa:rules:index"
-BLOCK_INDEX_KEY = "pa:blocks:index"
-RECURRING_BLOCK_INDEX_KEY = "pa:recurring_blocks:index"
+RULES = "rules"
+BLOCKS = "blocks"
+RECURRING_BLOCKS = "recurring_blocks"
+INDEX_PREFIX = "pa:index:"
+# Single global indexes used before per-provider sharding; read once to migrate
+LEGACY_INDEX_KEYS = {
+    RULES: "pa:rules:index",
+    BLOCKS: "pa:blocks:index",
+    RECURRING_BLOCKS: "pa:recurring_blocks:index",
+}
 EVENT_IDS_PREFIX = "pa:event_ids:"
 PRACTICE_TZ_KEY = "pa:practice_timezone"
 PROVIDER_TZ_PREFIX = "pa:provider_tz:"
 PROVIDER_TZ_INDEX_KEY = "pa:provider_tz:index"
 INSTALL_SENTINEL_KEY = "pa:installed"
 LAST_TTL_REFRESH_KEY = "pa:last_ttl_refresh"
+SLOT_DAY_PREFIX = "pa:slots:day:"
+SLOT_GEN_PREFIX = "pa:slots:gen:"
+SLOT_GLOBAL_GEN_KEY = "pa:slots:gen"
+SLOT_DAY_GEN_PREFIX = "pa:slots:daygen:"
 CACHE_TTL_SECONDS = 14 * 24 * 60 * 60 - 3600  # 14 days minus 1 hour buffer
+# Precomputed days also expire on their own, which bounds how long calendar
+# changes made outside the plugin (no invalidation event) can go unseen.
+SLOT_CACHE_TTL_SECONDS = 30 * 60
+SLOT_INVALIDATE_MAX_DAYS = 31  # longer spans bump the provider generation instead
 TTL_REFRESH_INTERVAL_SECONDS = 6 * 60 * 60  # 6 hours between full TTL refreshes
 
 
@@ -27,14 +43,32 @@ def _get_cache() -> Any:
     return get_cache()
 
 
+def _get_many(keys: list[str]) -> dict[str, Any]:
+    """``cache.get_many`` keyed by the keys we asked for.
+
+    The plugin cache returns its keys with the plugin prefix prepended, so
+    strip leading segments until each one matches a requested key.
+    """
+    if not keys:
+        return {}
+    requested = set(keys)
+    result: dict[str, Any] = {}
+    for full_key, value in _get_cache().get_many(keys).items():
+        key = full_key
+        while key not in requested and ":" in key:
+            key = key.split(":", 1)[1]
+        if key in requested:
+            result[key] = value
+    return result
+
+
 # ── Rule CRUD ──────────────────────────────────────────────────────────
 
 
 def save_rule(rule: ProviderAvailabilityRule) -> None:
-    """Save a rule to cache and update the index."""
-    cache = _get_cache()
-    cache.set(rule.cache_key, rule.to_dict(), timeout_seconds=CACHE_TTL_SECONDS)
-    _add_to_index(rule.cache_key)
+    """Save a rule to cache and add it to its provider's index."""
+    _save_indexed(RULES, rule.provider_id, rule.cache_key, rule.to_dict())
+    invalidate_provider_slots(rule.provider_id)
 
 
 def get_rule_by_id(provider_id: str, rule_id: str) -> ProviderAvailabilityRule | None:
@@ -49,90 +83,32 @@ def get_rule_by_id(provider_id: str, rule_id: str) -> ProviderAvailabilityRule |
 
 def get_rules_for_provider(provider_id: str) -> list[ProviderAvailabilityRule]:
     """Get all rules for a specific provider."""
-    all_keys = _get_index()
-    prefix = f"pa:rules:{provider_id}:"
-    provider_keys = [k for k in all_keys if k.startswith(prefix)]
-
-    if not provider_keys:
-        return []
-
-    cache = _get_cache()
-    data_map = cache.get_many(provider_keys)
-    rules = []
-    for data in data_map.values():
-        if data is not None:
-            rules.append(ProviderAvailabilityRule.from_dict(data))
-    return rules
+    data_map = _get_many(_get_provider_index(RULES, provider_id))
+    return [ProviderAvailabilityRule.from_dict(data) for data in data_map.values() if data is not None]
 
 
 def get_all_rules() -> list[ProviderAvailabilityRule]:
     """Get all rules from cache."""
-    all_keys = _get_index()
-    if not all_keys:
-        return []
-
-    cache = _get_cache()
-    data_map = cache.get_many(all_keys)
-    rules = []
-    for data in data_map.values():
-        if data is not None:
-            rules.append(ProviderAvailabilityRule.from_dict(data))
-    return rules
+    data_map = _get_many(_get_all_index_keys(RULES))
+    return [ProviderAvailabilityRule.from_dict(data) for data in data_map.values() if data is not None]
 
 
 def delete_rule_by_id(provider_id: str, rule_id: str) -> bool:
     """Delete a specific rule by provider ID and rule UUID."""
-    cache = _get_cache()
-    key = f"pa:rules:{provider_id}:{rule_id}"
-    cache.delete(key)
-    _remove_from_index(key)
+    _delete_indexed(RULES, provider_id, [f"pa:rules:{provider_id}:{rule_id}"])
+    invalidate_provider_slots(provider_id)
     return True
 
 
 def delete_rules_for_provider(provider_id: str) -> int:
     """Delete all rules for a provider. Returns count of deleted rules."""
-    all_keys = _get_index()
-    prefix = f"pa:rules:{provider_id}:"
-    provider_keys = [k for k in all_keys if k.startswith(prefix)]
-
-    cache = _get_cache()
-    for key in provider_keys:
-        cache.delete(key)
-        _remove_from_index(key)
-
+    provider_keys = _get_provider_index(RULES, provider_id)
+    if provider_keys:
+        _delete_indexed(RULES, provider_id, provider_keys)
+        invalidate_provider_slots(provider_id)
     return len(provider_keys)
 
 
-# ── Rule index helpers ─────────────────────────────────────────────────
-
-
-def _get_index() -> list[str]:
-    """Get the list of all rule cache keys."""
-    cache = _get_cache()
-    index = cache.get(INDEX_KEY)
-    if index is None:
-        return []
-    return list(index)
-
-
-def _add_to_index(key: str) -> None:
-    """Add a key to the rule index."""
-    cache = _get_cache()
-    index = _get_index()
-    if key not in index:
-        index.append(key)
-    cache.set(INDEX_KEY, index, timeout_seconds=CACHE_TTL_SECONDS)
-
-
-def _remove_from_index(key: str) -> None:
-    """Remove a key from the rule index."""
-    cache = _get_cache()
-    index = _get_index()
-    if key in index:
-        index.remove(key)
-        cache.set(INDEX_KEY, index, timeout_seconds=CACHE_TTL_SECONDS)
-
-
 # ── Event ID mapping (rule → Canvas Event UUIDs) ─────────────────────
 
 
@@ -159,28 +135,28 @@ def delete_event_ids(rule_id: str) -> None:
 
 
 def save_block(block: AdminBlock) -> None:
-    """Save an admin block to cache and update the block index."""
-    cache = _get_cache()
-    cache.set(block.cache_key, block.to_dict(), timeout_seconds=CACHE_TTL_SECONDS)
-    _add_to_block_index(block.cache_key)
+    """Save an admin block to cache and add it to its provider's index."""
+    previous = _save_indexed(BLOCKS, block.provider_id, block.cache_key, block.to_dict())
+    if previous is not None:
+        _invalidate_block_days(AdminBlock.from_dict(previous))
+    _invalidate_block_days(block)
 
 
 def get_blocks_for_provider(provider_id: str) -> list[AdminBlock]:
     """Get all admin blocks for a specific provider."""
-    all_keys = _get_block_index()
-    prefix = f"pa:blocks:{provider_id}:"
-    provider_keys = [k for k in all_keys if k.startswith(prefix)]
+    data_map = _get_many(_get_provider_index(BLOCKS, provider_id))
+    return [AdminBlock.from_dict(data) for data in data_map.values() if data is not None]
 
-    if not provider_keys:
-        return []
 
-    cache = _get_cache()
-    data_map = cache.get_many(provider_keys)
-    blocks = []
+def get_blocks_for_providers(provider_ids: list[str]) -> dict[str, list[AdminBlock]]:
+    """Get the admin blocks of several providers with two ``get_many`` calls."""
+    result: dict[str, list[AdminBlock]] = {pid: [] for pid in provider_ids}
+    data_map = _get_many(_get_providers_index(BLOCKS, list(result)))
     for data in data_map.values():
         if data is not None:
-            blocks.append(AdminBlock.from_dict(data))
-    return blocks
+            block = AdminBlock.from_dict(data)
+            result.setdefault(block.provider_id, []).append(block)
+    return result
 
 
 def get_block_by_id(provider_id: str, block_id: str) -> AdminBlock | None:
@@ -195,99 +171,49 @@ def get_block_by_id(provider_id: str, block_id: str) -> AdminBlock | None:
 
 def get_all_blocks() -> list[AdminBlock]:
     """Get all admin blocks from cache."""
-    all_keys = _get_block_index()
-    if not all_keys:
-        return []
-
-    cache = _get_cache()
-    data_map = cache.get_many(all_keys)
-    blocks = []
-    for data in data_map.values():
-        if data is not None:
-            blocks.append(AdminBlock.from_dict(data))
-    return blocks
+    data_map = _get_many(_get_all_index_keys(BLOCKS))
+    return [AdminBlock.from_dict(data) for data in data_map.values() if data is not None]
 
 
 def delete_block(provider_id: str, block_id: str) -> bool:
     """Delete a specific admin block from cache."""
-    cache = _get_cache()
     key = f"pa:blocks:{provider_id}:{block_id}"
-    cache.delete(key)
-    _remove_from_block_index(key)
+    previous = _delete_indexed(BLOCKS, provider_id, [key]).get(key)
+    if previous is not None:
+        _invalidate_block_days(AdminBlock.from_dict(previous))
     return True
 
 
-# ── Block index helpers ────────────────────────────────────────────────
-
-
-def _get_block_index() -> list[str]:
-    """Get the list of all block cache keys."""
-    cache = _get_cache()
-    index = cache.get(BLOCK_INDEX_KEY)
-    if index is None:
-        return []
-    return list(index)
-
-
-def _add_to_block_index(key: str) -> None:
-    """Add a key to the block index."""
-    cache = _get_cache()
-    index = _get_block_index()
-    if key not in index:
-        index.append(key)
-    cache.set(BLOCK_INDEX_KEY, index, timeout_seconds=CACHE_TTL_SECONDS)
-
-
-def _remove_from_block_index(key: str) -> None:
-    """Remove a key from the block index."""
-    cache = _get_cache()
-    index = _get_block_index()
-    if key in index:
-        index.remove(key)
-        cache.set(BLOCK_INDEX_KEY, index, timeout_seconds=CACHE_TTL_SECONDS)
-
-
 # ── Recurring Block CRUD ───────────────────────────────────────────────
 
 
 def save_recurring_block(block: RecurringBlock) -> None:
-    """Save a recurring block to cache and update the index."""
-    cache = _get_cache()
-    cache.set(block.cache_key, block.to_dict(), timeout_seconds=CACHE_TTL_SECONDS)
-    _add_to_recurring_block_index(block.cache_key)
+    """Save a recurring block to cache and add it to its provider's index."""
+    _save_indexed(RECURRING_BLOCKS, block.provider_id, block.cache_key, block.to_dict())
+    invalidate_provider_slots(block.provider_id)
 
 
 def get_recurring_blocks_for_provider(provider_id: str) -> list[RecurringBlock]:
     """Get all recurring blocks for a specific provider."""
-    all_keys = _get_recurring_block_index()
-    prefix = f"pa:recurring_blocks:{provider_id}:"
-    provider_keys = [k for k in all_keys if k.startswith(prefix)]
+    data_map = _get_many(_get_provider_index(RECURRING_BLOCKS, provider_id))
+    return [RecurringBlock.from_dict(data) for data in data_map.values() if data is not None]
 
-    if not provider_keys:
-        return []
 
-    cache = _get_cache()
-    data_map = cache.get_many(provider_keys)
-    blocks = []
+def get_recurring_blocks_for_providers(provider_ids: list[str]) -> dict[str, list[RecurringBlock]]:
+    """Get the recurring blocks of several providers with two ``get_many`` calls."""
+    result: dict[str, list[RecurringBlock]] = {pid: [] for pid in provider_ids}
+    data_map = _get_many(_get_providers_index(RECURRING_BLOCKS, list(result)))
     for data in data_map.values():
         if data is not None:
-            blocks.append(RecurringBlock.from_dict(data))
-    return blocks
+            block = RecurringBlock.from_dict(data)
+            result.setdefault(block.provider_id, []).append(block)
+    return result
 
 
 def get_all_recurring_blocks() -> list[RecurringBlock]:
     """Get all recurring blocks from cache."""
-    all_keys = _get_recurring_block_index()
-    if not all_keys:
-        return []
-
-    cache = _get_cache()
-    data_map = cache.get_many(all_keys)
-    blocks = []
-    for data in data_map.values():
-        if data is not None:
-            blocks.append(RecurringBlock.from_dict(data))
-    return blocks
+    data_map = _get_many(_get_all_index_keys(RECURRING_BLOCKS))
+    return [RecurringBlock.from_dict(data) for data in data_map.values() if data is not None]
 
 
 def get_recurring_block_by_id(provider_id: str, block_id: str) -> RecurringBlock | None:
@@ -302,41 +228,241 @@ def get_recurring_block_by_id(provider_id: str, block_id: str) -> RecurringBlock
 
 def delete_recurring_block(provider_id: str, block_id: str) -> bool:
     """Delete a specific recurring block from cache."""
-    cache = _get_cache()
-    key = f"pa:recurring_blocks:{provider_id}:{block_id}"
-    cache.delete(key)
-    _remove_from_recurring_block_index(key)
+    _delete_indexed(RECURRING_BLOCKS, provider_id, [f"pa:recurring_blocks:{provider_id}:{block_id}"])
+    invalidate_provider_slots(provider_id)
     return True
 
 
-# ── Recurring block index helpers ─────────────────────────────────────
+# ── Sharded index helpers ──────────────────────────────────────────────
+#
+# Each kind of record ("rules", "blocks", "recurring_blocks") keeps one index
+# per provider under ``pa:index:{kind}:{provider_id}`` listing that provider's
+# record keys, plus ``pa:index:{kind}`` listing the providers that have any.
+# Lookups for one provider only read that provider's index, and writers to
+# different providers never touch the same key.
 
 
-def _get_recurring_block_index() -> list[str]:
-    """Get the list of all recurring block cache keys."""
-    cache = _get_cache()
-    index = cache.get(RECURRING_BLOCK_INDEX_KEY)
-    if index is None:
+def _index_key(kind: str, provider_id: str) -> str:
+    return f"{INDEX_PREFIX}{kind}:{provider_id}"
+
+
+def _registry_key(kind: str) -> str:
+    return f"{INDEX_PREFIX}{kind}"
+
+
+def _read_indexes(kind: str, keys: list[str]) -> dict[str, Any]:
+    """``_get_many`` of index keys, sharding the legacy global index first if it still exists.
+
+    The legacy key rides along in the same ``get_many``, so once it is gone
+    this costs nothing extra.
+    """
+    legacy_key = LEGACY_INDEX_KEYS[kind]
+    data = _get_many([*keys, legacy_key])
+    if legacy_key in data:
+        _shard_legacy_index(kind, list(data[legacy_key] or []))
+        data = _get_many(keys)
+    return data
+
+
+def _get_provider_index(kind: str, provider_id: str) -> list[str]:
+    """Record keys of one provider."""
+    index_key = _index_key(kind, provider_id)
+    return list(_read_indexes(kind, [index_key]).get(index_key) or [])
+
+
+def _get_providers_index(kind: str, provider_ids: list[str]) -> list[str]:
+    """Record keys of several providers, read with one ``get_many``."""
+    if not provider_ids:
         return []
-    return list(index)
+    data = _read_indexes(kind, [_index_key(kind, pid) for pid in provider_ids])
+    return [key for index in data.values() for key in (index or [])]
 
 
-def _add_to_recurring_block_index(key: str) -> None:
-    """Add a key to the recurring block index."""
-    cache = _get_cache()
-    index = _get_recurring_block_index()
+def _get_registry(kind: str) -> list[str]:
+    """Providers that have at least one record of this kind."""
+    registry_key = _registry_key(kind)
+    return list(_read_indexes(kind, [registry_key]).get(registry_key) or [])
+
+
+def _get_all_index_keys(kind: str) -> list[str]:
+    """Record keys of every provider."""
+    return _get_providers_index(kind, _get_registry(kind))
+
+
+def _save_indexed(kind: str, provider_id: str, key: str, value: Any) -> Any:
+    """Write a record and its provider's index in one ``set_many``.
+
+    The provider is (re-)added to the registry whenever it is missing, not
+    only with its first record, so a registry that expired or lost a racing
+    write heals on the provider's next save.
+
+    Returns the value the write replaced, or None.
+    """
+    index_key = _index_key(kind, provider_id)
+    registry_key = _registry_key(kind)
+    current = _read_indexes(kind, [key, index_key, registry_key])
+    index = set(current.get(index_key) or [])
+    registry = set(current.get(registry_key) or [])
+
+    writes = {key: value}
     if key not in index:
-        index.append(key)
-    cache.set(RECURRING_BLOCK_INDEX_KEY, index, timeout_seconds=CACHE_TTL_SECONDS)
+        index.add(key)
+        writes[index_key] = sorted(index)
+    if provider_id not in registry:
+        registry.add(provider_id)
+        writes[registry_key] = sorted(registry)
+    _get_cache().set_many(writes, timeout_seconds=CACHE_TTL_SECONDS)
+    return current.get(key)
+
+
+def _delete_indexed(kind: str, provider_id: str, keys: list[str]) -> dict[str, Any]:
+    """Delete records of one provider and drop them from its index.
+
+    Returns the deleted values by key.
+    """
+    index_key = _index_key(kind, provider_id)
+    current = _read_indexes(kind, [*keys, index_key])
+
+    cache = _get_cache()
+    for key in keys:
+        cache.delete(key)
+
+    index = set(current.get(index_key) or [])
+    if index & set(keys):
+        index -= set(keys)
+        if index:
+            cache.set(index_key, sorted(index), timeout_seconds=CACHE_TTL_SECONDS)
+        else:
+            cache.delete(index_key)
+            _update_registry(kind, remove=(provider_id,))
+    return {key: current[key] for key in keys if key in current}
+
+
+def _update_registry(kind: str, add: tuple[str, ...] = (), remove: tuple[str, ...] = ()) -> None:
+    """Add/remove providers in the registry of ``kind``."""
+    cache = _get_cache()
+    registry = set(_get_registry(kind))
+    updated = (registry | set(add)) - set(remove)
+    if updated != registry:
+        cache.set(_registry_key(kind), sorted(updated), timeout_seconds=CACHE_TTL_SECONDS)
 
 
-def _remove_from_recurring_block_index(key: str) -> None:
-    """Remove a key from the recurring block index."""
+def _shard_legacy_index(kind: str, legacy_keys: list[str]) -> None:
+    """Move the keys of a pre-sharding global index into per-provider indexes."""
     cache = _get_cache()
-    index = _get_recurring_block_index()
-    if key in index:
-        index.remove(key)
-        cache.set(RECURRING_BLOCK_INDEX_KEY, index, timeout_seconds=CACHE_TTL_SECONDS)
+    by_provider: dict[str, set[str]] = {}
+    for key in legacy_keys:
+        parts = key.split(":")
+        if len(parts) == 4:
+            by_provider.setdefault(parts[2], set()).add(key)
+
+    if by_provider:
+        registry_key = _registry_key(kind)
+        existing = _get_many([registry_key] + [_index_key(kind, pid) for pid in by_provider])
+        writes: dict[str, Any] = {
+            _index_key(kind, pid): sorted(keys | set(existing.get(_index_key(kind, pid)) or []))
+            for pid, keys in by_provider.items()
+        }
+        writes[registry_key] = sorted(set(existing.get(registry_key) or []) | set(by_provider))
+        cache.set_many(writes, timeout_seconds=CACHE_TTL_SECONDS)
+
+    cache.delete(LEGACY_INDEX_KEYS[kind])
+    log.info("storage: sharded legacy %s index (%d keys, %d providers)", kind, len(legacy_keys), len(by_provider))
+
+
+# ── Precomputed slot cache ─────────────────────────────────────────────
+#
+# Free slots are precomputed per provider per day (see engine/slot_cache.py).
+# Each day entry records the generation counters it was computed under, so
+# edits that can touch any day (rules, recurring blocks, timezones) just bump
+# a counter, while admin blocks and appointments delete only their own days.
+
+
+def slot_day_key(provider_id: str, day: date) -> str:
+    """Cache key of a provider's precomputed day."""
+    return f"{SLOT_DAY_PREFIX}{provider_id}:{day.isoformat()}"
+
+
+def get_slot_cache(
+    provider_ids: list[str],
+    days_by_provider: dict[str, list[date]],
+) -> tuple[dict[str, list[int]], dict[tuple[str, date], dict]]:
+    """Read generations and precomputed days for several providers in one ``get_many``.
+
+    Returns ``({provider_id: [global_gen, provider_gen]}, {(provider_id, day): entry})``.
+    """
+    keys = [SLOT_GLOBAL_GEN_KEY] + [f"{SLOT_GEN_PREFIX}{pid}" for pid in provider_ids]
+    day_keys = {
+        slot_day_key(pid, day): (pid, day)
+        for pid in provider_ids
+        for day in days_by_provider.get(pid, [])
+    }
+    data = _get_many(keys + list(day_keys))
+
+    global_gen = int(data.get(SLOT_GLOBAL_GEN_KEY) or 0)
+    gens = {pid: [global_gen, int(data.get(f"{SLOT_GEN_PREFIX}{pid}") or 0)] for pid in provider_ids}
+    entries = {day_keys[key]: value for key, value in data.items() if key in day_keys and value}
+    return gens, entries
+
+
+def get_slot_day_generations(provider_ids: list[str]) -> dict[str, int]:
+    """Read how many times each provider's days have been dropped, in one ``get_many``.
+
+    A change between two reads means an ``invalidate_slot_days`` ran in
+    between, so days computed in that window may already be out of date.
+    """
+    data = _get_many([f"{SLOT_DAY_GEN_PREFIX}{pid}" for pid in provider_ids])
+    return {pid: int(data.get(f"{SLOT_DAY_GEN_PREFIX}{pid}") or 0) for pid in provider_ids}
+
+
+def save_slot_days(entries: dict[tuple[str, date], dict]) -> None:
+    """Store precomputed days in one ``set_many``."""
+    if not entries:
+        return
+    cache = _get_cache()
+    cache.set_many(
+        {slot_day_key(pid, day): entry for (pid, day), entry in entries.items()},
+        timeout_seconds=SLOT_CACHE_TTL_SECONDS,
+    )
+
+
+def invalidate_provider_slots(provider_id: str) -> None:
+    """Mark every precomputed day of a provider stale."""
+    _bump_generation(f"{SLOT_GEN_PREFIX}{provider_id}")
+
+
+def invalidate_all_slots() -> None:
+    """Mark every precomputed day of every provider stale."""
+    _bump_generation(SLOT_GLOBAL_GEN_KEY)
+
+
+def invalidate_slot_days(provider_id: str, start: datetime, end: datetime) -> None:
+    """Drop the precomputed days a ``start``–``end`` change can affect.
+
+    The span is widened by a day on each side since it may be in a different
+    timezone than the provider's days. The provider's day generation is bumped
+    first so a read computing these days concurrently doesn't store them back.
+    """
+    first = start.date() - timedelta(days=1)
+    last = end.date() + timedelta(days=1)
+    if (last - first).days > SLOT_INVALIDATE_MAX_DAYS:
+        invalidate_provider_slots(provider_id)
+        return
+    _bump_generation(f"{SLOT_DAY_GEN_PREFIX}{provider_id}")
+    cache = _get_cache()
+    day = first
+    while day <= last:
+        cache.delete(slot_day_key(provider_id, day))
+        day += timedelta(days=1)
+
+
+def _invalidate_block_days(block: AdminBlock) -> None:
+    invalidate_slot_days(block.provider_id, block.start, block.end)
+
+
+def _bump_generation(key: str) -> None:
+    cache = _get_cache()
+    cache.set(key, int(cache.get(key) or 0) + 1, timeout_seconds=CACHE_TTL_SECONDS)
 
 
 # ── Group lookups ──────────────────────────────────────────────────────
@@ -408,71 +534,17 @@ def refresh_all_ttls() -> int:
     """Refresh TTLs on all cached rules and blocks. Returns count of refreshed rules."""
     cache = _get_cache()
 
-    # Refresh rules (use individual get() calls — get_many returns prefixed keys)
-    all_keys = _get_index()
-    refreshed = 0
-    if all_keys:
-        stale_keys = []
-        for key in all_keys:
-            data = cache.get(key)
-            if data is not None:
-                cache.set(key, data, timeout_seconds=CACHE_TTL_SECONDS)
-                refreshed += 1
-            else:
-                stale_keys.append(key)
-
-        for key in stale_keys:
-            _remove_from_index(key)
-
-        current_index = _get_index()
-        if current_index:
-            cache.set(INDEX_KEY, current_index, timeout_seconds=CACHE_TTL_SECONDS)
+    # Refresh rules, blocks and recurring blocks along with their indexes
+    rule_keys = _refresh_indexed(RULES)
+    _refresh_indexed(BLOCKS)
+    _refresh_indexed(RECURRING_BLOCKS)
+    refreshed = len(rule_keys)
 
     # Refresh event_id mappings for all active rules
-    for key in all_keys:
-        parts = key.split(":")
-        if len(parts) == 4:
-            rule_id = parts[3]
-            eid_key = f"{EVENT_IDS_PREFIX}{rule_id}"
-            eid_data = cache.get(eid_key)
-            if eid_data is not None:
-                cache.set(eid_key, eid_data, timeout_seconds=CACHE_TTL_SECONDS)
-
-    # Refresh blocks
-    block_keys = _get_block_index()
-    if block_keys:
-        stale_block_keys = []
-        for key in block_keys:
-            data = cache.get(key)
-            if data is not None:
-                cache.set(key, data, timeout_seconds=CACHE_TTL_SECONDS)
-            else:
-                stale_block_keys.append(key)
-
-        for key in stale_block_keys:
-            _remove_from_block_index(key)
-
-        current_block_index = _get_block_index()
-        if current_block_index:
-            cache.set(BLOCK_INDEX_KEY, current_block_index, timeout_seconds=CACHE_TTL_SECONDS)
-
-    # Refresh recurring blocks
-    recurring_keys = _get_recurring_block_index()
-    if recurring_keys:
-        stale_recurring_keys = []
-        for key in recurring_keys:
-            data = cache.get(key)
-            if data is not None:
-                cache.set(key, data, timeout_seconds=CACHE_TTL_SECONDS)
-            else:
-                stale_recurring_keys.append(key)
-
-        for key in stale_recurring_keys:
-            _remove_from_recurring_block_index(key)
-
-        current_recurring_index = _get_recurring_block_index()
-        if current_recurring_index:
-            cache.set(RECURRING_BLOCK_INDEX_KEY, current_recurring_index, timeout_seconds=CACHE_TTL_SECONDS)
+    eid_keys = [f"{EVENT_IDS_PREFIX}{key.split(':')[3]}" for key in rule_keys if len(key.split(":")) == 4]
+    eid_data = _get_many(eid_keys)
+    if eid_data:
+        cache.set_many(eid_data, timeout_seconds=CACHE_TTL_SECONDS)
 
     # Refresh practice timezone
     tz_val = cache.get(PRACTICE_TZ_KEY)
@@ -500,6 +572,42 @@ def refresh_all_ttls() -> int:
     return refreshed
 
 
+def _refresh_indexed(kind: str) -> list[str]:
+    """Re-set every record of ``kind`` and its indexes with a fresh TTL, dropping expired keys.
+
+    Returns the keys of the records that are still cached.
+    """
+    registry = _get_registry(kind)
+    if not registry:
+        return []
+
+    cache = _get_cache()
+    index_keys = {pid: _index_key(kind, pid) for pid in registry}
+    indexes = _get_many(list(index_keys.values()))
+    records = {
+        key: data
+        for key, data in _get_many([key for index in indexes.values() for key in (index or [])]).items()
+        if data is not None
+    }
+
+    writes: dict[str, Any] = dict(records)
+    live_providers = []
+    for pid, index_key in index_keys.items():
+        live_keys = sorted(key for key in indexes.get(index_key) or [] if key in records)
+        if live_keys:
+            writes[index_key] = live_keys
+            live_providers.append(pid)
+        else:
+            cache.delete(index_key)
+
+    if live_providers:
+        writes[_registry_key(kind)] = sorted(live_providers)
+    else:
+        cache.delete(_registry_key(kind))
+    cache.set_many(writes, timeout_seconds=CACHE_TTL_SECONDS)
+    return list(records)
+
+
 # ── Practice timezone ─────────────────────────────────────────────────
 
 
@@ -514,6 +622,7 @@ def set_practice_timezone(tz_name: str) -> None:
     """Store the practice timezone name."""
     cache = _get_cache()
     cache.set(PRACTICE_TZ_KEY, tz_name, timeout_seconds=CACHE_TTL_SECONDS)
+    invalidate_all_slots()
 
 
 # ── Per-provider timezone ────────────────────────────────────────────
@@ -526,11 +635,24 @@ def get_provider_timezone(provider_id: str) -> str | None:
     return str(val) if val else None
 
 
+def get_provider_timezones(provider_ids: list[str]) -> dict[str, str | None]:
+    """Get the explicit timezone of several providers in one ``get_many``."""
+    if not provider_ids:
+        return {}
+    data_map = _get_many([f"{PROVIDER_TZ_PREFIX}{pid}" for pid in provider_ids])
+    result: dict[str, str | None] = {}
+    for pid in provider_ids:
+        val = data_map.get(f"{PROVIDER_TZ_PREFIX}{pid}")
+        result[pid] = str(val) if val else None
+    return result
+
+
 def set_provider_timezone(provider_id: str, tz_name: str) -> None:
     """Store a provider's timezone and update the provider TZ index."""
     cache = _get_cache()
     cache.set(f"{PROVIDER_TZ_PREFIX}{provider_id}", tz_name, timeout_seconds=CACHE_TTL_SECONDS)
     _add_to_provider_tz_index(provider_id)
+    invalidate_provider_slots(provider_id)
 
 
 def clear_provider_timezone(provider_id: str) -> None:
@@ -538,6 +660,7 @@ def clear_provider_timezone(provider_id: str) -> None:
     cache = _get_cache()
     cache.delete(f"{PROVIDER_TZ_PREFIX}{provider_id}")
     _remove_from_provider_tz_index(provider_id)
+    invalidate_provider_slots(provider_id)
 
 
 def get_all_provider_timezones() -> dict[str, str]:
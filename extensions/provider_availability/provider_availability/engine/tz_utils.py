@@ -9,7 +9,11 @@ from __future__ import annotations
 from datetime import UTC, datetime, timedelta
 from zoneinfo import ZoneInfo
 
-from provider_availability.engine.storage import get_practice_timezone, get_provider_timezone
+from provider_availability.engine.storage import (
+    get_practice_timezone,
+    get_provider_timezone,
+    get_provider_timezones,
+)
 
 
 COMMON_TIMEZONES: list[str] = [
@@ -41,6 +45,17 @@ def provider_tz(provider_id: str) -> ZoneInfo:
     return practice_tz()
 
 
+def provider_tzs(provider_ids: list[str]) -> dict[str, ZoneInfo]:
+    """Return the timezone of each provider, reading the cache once for all of them."""
+    if not provider_ids:
+        return {}
+    fallback = practice_tz()
+    return {
+        pid: ZoneInfo(tz_name) if tz_name else fallback
+        for pid, tz_name in get_provider_timezones(provider_ids).items()
+    }
+
+
 def practice_now() -> datetime:
     """Return the current time in the practice timezone."""
     return datetime.now(practice_tz())
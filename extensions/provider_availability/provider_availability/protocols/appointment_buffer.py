@@ -1,7 +1,8 @@
 """Create blocking calendar events for appointment buffers.
 
 When an appointment is created, rescheduled, or canceled, this handler
-reconciles "Buffer" events on the provider's Administrative calendar.
+reconciles "Buffer" events on the provider's Administrative calendar and
+drops the precomputed availability for the days the appointment touches.
 
 Clinic calendars = open availability (provider IS available).
 Administrative calendars = calendar blocks (provider is NOT available).
@@ -21,7 +22,7 @@ from logger import log
 
 from provider_availability.engine.admin_calendar import get_admin_calendar_id, get_admin_calendars
 from provider_availability.engine.event_sync import DEFAULT_HORIZON_YEARS
-from provider_availability.engine.storage import get_rules_for_provider
+from provider_availability.engine.storage import get_rules_for_provider, invalidate_slot_days
 
 BUFFER_TITLE = "Buffer"
 
@@ -62,6 +63,21 @@ class OnAppointmentCanceled(BaseProtocol):
         return _reconcile_buffers(self.event.target.id, "canceled")
 
 
+def _invalidate_appointment_slots(appt: Appointment, provider_id: str, action: str) -> None:
+    """Drop the precomputed days of this appointment, and of the one it replaced on reschedule."""
+    try:
+        changed = [appt]
+        if action == "rescheduled" and appt.appointment_rescheduled_from:
+            changed.append(appt.appointment_rescheduled_from)
+        for apt in changed:
+            if apt.start_time is None:
+                continue
+            apt_end = apt.start_time + timedelta(minutes=apt.duration_minutes or 0)
+            invalidate_slot_days(provider_id, apt.start_time, apt_end)
+    except Exception:
+        log.exception("BUFFER: could not invalidate slot cache for appt %s", appt.id)
+
+
 def _reconcile_buffers(appointment_id: str, action: str) -> list[Effect]:
     """Delete all Buffer events for this provider, then recreate for active appointments."""
     try:
@@ -74,6 +90,8 @@ def _reconcile_buffers(appointment_id: str, action: str) -> list[Effect]:
         return []
     provider_id = str(appt.provider.id)
 
+    _invalidate_appointment_slots(appt, provider_id, action)
+
     rules = get_rules_for_provider(provider_id)
     if not rules:
         log.info("BUFFER: no rules for provider %s, skipping", provider_id)
@@ -547,7 +547,7 @@ class TestGetAvailableSlots:
         assert mock_resolve.mock_calls == [call(PROVIDER_ID, "")]
         assert mock_rules.mock_calls == [call(PROVIDER_ID)]
 
-    @patch(f"{MODULE}.get_available_slots_for_provider")
+    @patch(f"{MODULE}.get_precomputed_slots_for_providers")
     @patch(f"{MODULE}.get_rules_for_provider")
     @patch(f"{MODULE}.resolve_provider_id", return_value=PROVIDER_ID)
     def test_success_with_slots(self, mock_resolve, mock_rules, mock_slots):
@@ -558,7 +558,7 @@ class TestGetAvailableSlots:
             end=datetime(2026, 3, 3, 9, 15),
             provider_id=PROVIDER_ID,
         )
-        mock_slots.return_value = [slot]
+        mock_slots.return_value = {PROVIDER_ID: [slot]}
         handler = _make_handler(
             query_params={
                 "provider_id": PROVIDER_ID,
@@ -597,7 +597,7 @@ class TestGetAvailableProviders:
         assert code == HTTPStatus.BAD_REQUEST
         assert "start_date and end_date are required" in data["error"]
 
-    @patch(f"{MODULE}.calculate_available_slots", return_value=[])
+    @patch(f"{MODULE}.get_precomputed_slots_for_providers", return_value={})
     @patch(f"{MODULE}.get_all_rules", return_value=[])
     def test_no_rules(self, mock_rules, mock_calc):
         handler = _make_handler(
@@ -608,14 +608,14 @@ class TestGetAvailableProviders:
         assert code == HTTPStatus.OK
         assert body["count"] == 0
         assert mock_rules.mock_calls == [call()]
-        assert mock_calc.mock_calls == []
+        assert mock_calc.mock_calls == [call([], date(2026, 3, 1), date(2026, 3, 7), "", "")]
 
-    @patch(f"{MODULE}.calculate_available_slots")
+    @patch(f"{MODULE}.get_precomputed_slots_for_providers")
     @patch(f"{MODULE}.get_all_rules")
     def test_with_providers(self, mock_rules, mock_calc):
         rule = ProviderAvailabilityRule(id="r1", provider_id=PROVIDER_ID)
         mock_rules.return_value = [rule]
-        mock_calc.return_value = [MagicMock()]  # 1 slot
+        mock_calc.return_value = {PROVIDER_ID: [MagicMock()]}  # 1 slot
         handler = _make_handler(
             query_params={"start_date": "2026-03-01", "end_date": "2026-03-07"}
         )
@@ -626,70 +626,39 @@ class TestGetAvailableProviders:
         assert body["providers"][0]["provider_id"] == PROVIDER_ID
         assert body["providers"][0]["available_slot_count"] == 1
         assert mock_rules.mock_calls == [call()]
-        assert mock_calc.mock_calls == [call(rule, date(2026, 3, 1), date(2026, 3, 7))]
+        assert mock_calc.mock_calls == [call([rule], date(2026, 3, 1), date(2026, 3, 7), "", "")]
 
-    @patch(f"{MODULE}.calculate_available_slots")
+    @patch(f"{MODULE}.get_precomputed_slots_for_providers")
     @patch(f"{MODULE}.get_all_rules")
-    def test_location_filter_skips_non_matching(self, mock_rules, mock_calc):
-        """Rules with non-matching location_ids are skipped."""
-        rule = ProviderAvailabilityRule(
-            id="r1", provider_id=PROVIDER_ID, location_ids=["other-loc"]
-        )
-        mock_rules.return_value = [rule]
-        handler = _make_handler(
-            query_params={
-                "start_date": "2026-03-01",
-                "end_date": "2026-03-07",
-                "location_id": LOCATION_ID,
-            }
-        )
-        result = handler.get_available_providers()
-        body, code = _parse(result[0])
-        assert code == HTTPStatus.OK
-        assert body["count"] == 0
-        assert mock_calc.mock_calls == []
-
-    @patch(f"{MODULE}.calculate_available_slots")
-    @patch(f"{MODULE}.get_all_rules")
-    def test_visit_type_filter_skips_non_matching(self, mock_rules, mock_calc):
-        """Rules with non-matching visit_types are skipped."""
-        rule = ProviderAvailabilityRule(
-            id="r1", provider_id=PROVIDER_ID, visit_types=["other-vt"]
-        )
+    def test_providers_without_slots_are_omitted(self, mock_rules, mock_calc):
+        rule = ProviderAvailabilityRule(id="r1", provider_id=PROVIDER_ID)
         mock_rules.return_value = [rule]
+        mock_calc.return_value = {PROVIDER_ID: []}
         handler = _make_handler(
-            query_params={
-                "start_date": "2026-03-01",
-                "end_date": "2026-03-07",
-                "visit_type": VISIT_TYPE_ID,
-            }
+            query_params={"start_date": "2026-03-01", "end_date": "2026-03-07"}
         )
         result = handler.get_available_providers()
         body, code = _parse(result[0])
         assert code == HTTPStatus.OK
         assert body["count"] == 0
-        assert mock_calc.mock_calls == []
 
-    @patch(f"{MODULE}.calculate_available_slots")
+    @patch(f"{MODULE}.get_precomputed_slots_for_providers", return_value={})
     @patch(f"{MODULE}.get_all_rules")
-    def test_empty_location_ids_passes_filter(self, mock_rules, mock_calc):
-        """Rules with empty location_ids pass the location filter."""
-        rule = ProviderAvailabilityRule(
-            id="r1", provider_id=PROVIDER_ID, location_ids=[]
-        )
+    def test_passes_location_and_visit_type_filters(self, mock_rules, mock_calc):
+        rule = ProviderAvailabilityRule(id="r1", provider_id=PROVIDER_ID)
         mock_rules.return_value = [rule]
-        mock_calc.return_value = [MagicMock()]
         handler = _make_handler(
             query_params={
                 "start_date": "2026-03-01",
                 "end_date": "2026-03-07",
                 "location_id": LOCATION_ID,
+                "visit_type": VISIT_TYPE_ID,
             }
         )
-        result = handler.get_available_providers()
-        body, code = _parse(result[0])
-        assert body["count"] == 1
-        assert mock_calc.mock_calls == [call(rule, date(2026, 3, 1), date(2026, 3, 7))]
+        handler.get_available_providers()
+        assert mock_calc.mock_calls == [
+            call([rule], date(2026, 3, 1), date(2026, 3, 7), LOCATION_ID, VISIT_TYPE_ID)
+        ]
 
 
 # ── Rule CRUD ────────────────────────────────────────────────────────────
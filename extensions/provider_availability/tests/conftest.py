@@ -37,6 +37,7 @@ def mock_cache():
         return {k: store[k] for k in keys if k in store}
 
     cache.get_many.side_effect = get_many
+    cache.set_many.side_effect = lambda data, timeout_seconds=None: store.update(data) or []
     cache._store = store
     return cache
 
@@ -10,6 +10,7 @@ from provider_availability.cron.cache_refresh import (
     _ensure_provider_calendars,
     _refresh_hold_blocks,
     _refresh_lead_time_blocks,
+    _refresh_slot_cache,
 )
 from provider_availability.engine.models import (
     BookingInterval,
@@ -371,3 +372,35 @@ class TestRefreshHoldBlocks:
 
             mock_build.assert_not_called()
             assert result == []
+
+
+class TestRefreshSlotCache:
+    def test_execute_refreshes_slot_cache(self):
+        handler = CacheRefreshTask(MagicMock())
+
+        with patch(f"{CR_MODULE}.should_refresh_ttls", return_value=False), \
+             patch(f"{CR_MODULE}._ensure_provider_calendars", return_value=[]), \
+             patch(f"{CR_MODULE}._daily_resync", return_value=[]), \
+             patch(f"{CR_MODULE}._refresh_lead_time_blocks", return_value=[]), \
+             patch(f"{CR_MODULE}._refresh_hold_blocks", return_value=[]), \
+             patch(f"{CR_MODULE}._refresh_slot_cache") as mock_slots:
+
+            assert handler.execute() == []
+            assert mock_slots.mock_calls == [call()]
+
+    def test_recomputes_from_all_rules(self):
+        rules = [MagicMock()]
+
+        with patch(f"{CR_MODULE}.get_all_rules", return_value=rules), \
+             patch(f"{CR_MODULE}.refresh_slot_cache", return_value=4) as mock_refresh:
+            _refresh_slot_cache()
+
+            assert mock_refresh.mock_calls == [call(rules)]
+
+    def test_errors_are_logged(self):
+        with patch(f"{CR_MODULE}.get_all_rules", return_value=[]), \
+             patch(f"{CR_MODULE}.refresh_slot_cache", side_effect=RuntimeError("boom")), \
+             patch(f"{CR_MODULE}.log") as mock_log:
+            _refresh_slot_cache()
+
+            assert len(mock_log.exception.mock_calls) == 1
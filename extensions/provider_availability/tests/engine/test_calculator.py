@@ -1,8 +1,10 @@
 """Tests for provider_availability.engine.calculator."""
 
 import datetime as dt
+from contextlib import ExitStack
 from datetime import date, datetime, timedelta
 from unittest.mock import MagicMock, call, patch
+from zoneinfo import ZoneInfo
 
 from provider_availability.engine.models import (
     AdminBlock,
@@ -18,6 +20,7 @@ from provider_availability.engine.calculator import (
     _is_blocked,
     calculate_available_slots,
     get_available_slots_for_provider,
+    get_available_slots_for_providers,
 )
 
 
@@ -668,3 +671,151 @@ class TestGetAvailableSlotsForProvider:
                 now=datetime(2026, 3, 1, 0, 0),
             )
             assert slots[0].start < slots[1].start
+
+
+# ── get_available_slots_for_providers ─────────────────────────────────
+
+
+def _batch_patches(appointments=(), events=(), blocks=None, recurring=None, names=None, tzs=None):
+    """Patches for the batched path; rows are the raw values_list tuples."""
+    names = names if names is not None else {"p1": "Dr. One", "p2": "Dr. Two"}
+    return {
+        f"{CALC_MODULE}.Appointment.objects.filter": MagicMock(
+            return_value=MagicMock(values_list=MagicMock(return_value=list(appointments)))
+        ),
+        f"{CALC_MODULE}.Event.objects.filter": MagicMock(
+            return_value=MagicMock(values_list=MagicMock(return_value=list(events)))
+        ),
+        f"{CALC_MODULE}.get_provider_displays": MagicMock(
+            side_effect=lambda pids: {pid: {"name": names.get(pid, ""), "npi_number": ""} for pid in pids}
+        ),
+        f"{CALC_MODULE}.get_blocks_for_providers": MagicMock(
+            side_effect=lambda pids: {pid: (blocks or {}).get(pid, []) for pid in pids}
+        ),
+        f"{CALC_MODULE}.get_recurring_blocks_for_providers": MagicMock(
+            side_effect=lambda pids: {pid: (recurring or {}).get(pid, []) for pid in pids}
+        ),
+        f"{CALC_MODULE}.provider_tzs": MagicMock(
+            side_effect=lambda pids: {pid: (tzs or {}).get(pid, ZoneInfo("UTC")) for pid in pids}
+        ),
+    }
+
+
+def _run_batch(rules, patches, start=date(2026, 3, 9), end=date(2026, 3, 9), **kwargs):
+    with ExitStack() as stack:
+        mocks = {target: stack.enter_context(patch(target, new)) for target, new in patches.items()}
+        result = get_available_slots_for_providers(
+            rules, start, end, now=datetime(2026, 3, 1, 0, 0), **kwargs
+        )
+    return result, mocks
+
+
+class TestGetAvailableSlotsForProviders:
+    def test_no_rules(self):
+        result, mocks = _run_batch([], _batch_patches())
+        assert result == {}
+        mocks[f"{CALC_MODULE}.Appointment.objects.filter"].assert_not_called()
+
+    def test_single_query_per_source_for_many_providers(self):
+        rules = [_make_rule(id="r1", provider_id="p1"), _make_rule(id="r2", provider_id="p2")]
+        result, mocks = _run_batch(rules, _batch_patches())
+
+        assert sorted(result) == ["p1", "p2"]
+        assert [s.start.hour for s in result["p1"]] == [9, 10, 11]
+        assert [s.start.hour for s in result["p2"]] == [9, 10, 11]
+        assert mocks[f"{CALC_MODULE}.Appointment.objects.filter"].call_count == 1
+        assert mocks[f"{CALC_MODULE}.Event.objects.filter"].call_count == 1
+        assert mocks[f"{CALC_MODULE}.get_provider_displays"].call_count == 1
+        assert mocks[f"{CALC_MODULE}.get_blocks_for_providers"].call_count == 1
+        assert mocks[f"{CALC_MODULE}.get_recurring_blocks_for_providers"].call_count == 1
+        assert mocks[f"{CALC_MODULE}.provider_tzs"].call_count == 1
+
+    def test_appointments_grouped_by_provider_and_location(self):
+        rules = [_make_rule(id="r1", provider_id="p1"), _make_rule(id="r2", provider_id="p2")]
+        appointments = [
+            ("p1", "loc-1", datetime(2026, 3, 9, 10, 0, tzinfo=ZoneInfo("UTC")), 60),
+            ("p2", "loc-other", datetime(2026, 3, 9, 9, 0, tzinfo=ZoneInfo("UTC")), 60),
+        ]
+        result, _ = _run_batch(rules, _batch_patches(appointments=appointments))
+
+        assert [s.start.hour for s in result["p1"]] == [9, 11]
+        # p2's appointment is at a different location than the rule's first one
+        assert [s.start.hour for s in result["p2"]] == [9, 10, 11]
+
+    def test_appointments_converted_to_provider_timezone(self):
+        rules = [_make_rule(provider_id="p1")]
+        appointments = [("p1", "loc-1", datetime(2026, 3, 9, 14, 0, tzinfo=ZoneInfo("UTC")), 60)]
+        patches = _batch_patches(appointments=appointments, tzs={"p1": ZoneInfo("America/New_York")})
+        result, _ = _run_batch(rules, patches)
+
+        # 14:00 UTC is 10:00 EDT
+        assert [s.start.hour for s in result["p1"]] == [9, 11]
+
+    def test_schedule_events_matched_by_calendar_name(self):
+        rules = [_make_rule(id="r1", provider_id="p1"), _make_rule(id="r2", provider_id="p2")]
+        utc = ZoneInfo("UTC")
+        events = [
+            ("Dr. One: Clinic", "Available", datetime(2026, 3, 9, 9, 0, tzinfo=utc), datetime(2026, 3, 9, 12, 0, tzinfo=utc)),
+            ("Dr. One: Clinic", "Staff meeting", datetime(2026, 3, 9, 9, 0, tzinfo=utc), datetime(2026, 3, 9, 10, 0, tzinfo=utc)),
+            ("Dr. Two: Admin", "Available", datetime(2026, 3, 9, 11, 0, tzinfo=utc), datetime(2026, 3, 9, 12, 0, tzinfo=utc)),
+        ]
+        result, _ = _run_batch(rules, _batch_patches(events=events))
+
+        assert [s.start.hour for s in result["p1"]] == [10, 11]
+        assert [s.start.hour for s in result["p2"]] == [9, 10]
+
+    def test_provider_name_containing_colon(self):
+        rules = [_make_rule(provider_id="p1")]
+        utc = ZoneInfo("UTC")
+        events = [("Dr. A: B: Admin", "Lunch", datetime(2026, 3, 9, 10, 0, tzinfo=utc), datetime(2026, 3, 9, 11, 0, tzinfo=utc))]
+        result, _ = _run_batch(rules, _batch_patches(events=events, names={"p1": "Dr. A: B"}))
+        assert [s.start.hour for s in result["p1"]] == [9, 11]
+
+    def test_admin_blocks_per_provider(self):
+        rules = [_make_rule(id="r1", provider_id="p1"), _make_rule(id="r2", provider_id="p2")]
+        blocks = {"p2": [AdminBlock(id="b1", provider_id="p2", start=datetime(2026, 3, 9, 9, 0), end=datetime(2026, 3, 9, 11, 0))]}
+        result, _ = _run_batch(rules, _batch_patches(blocks=blocks))
+
+        assert [s.start.hour for s in result["p1"]] == [9, 10, 11]
+        assert [s.start.hour for s in result["p2"]] == [11]
+
+    def test_filters_and_inactive_rules(self):
+        rules = [
+            _make_rule(id="r1", provider_id="p1", location_ids=["loc-2"]),
+            _make_rule(id="r2", provider_id="p2", visit_types=["vt-2"]),
+            _make_rule(id="r3", provider_id="p3", is_active=False),
+            _make_rule(id="r4", provider_id="p4"),
+        ]
+        result, _ = _run_batch(rules, _batch_patches(), location_id="loc-1", visit_type="vt-1")
+        assert list(result) == ["p4"]
+
+    def test_matches_per_rule_calculation(self):
+        rule = _make_rule(
+            weekly_schedule={
+                "monday": [TimeWindow(start=dt.time(8, 0), end=dt.time(17, 0))],
+                "tuesday": [TimeWindow(start=dt.time(8, 0), end=dt.time(17, 0))],
+            },
+            booking_interval=BookingInterval(min_lead_hours=0, slot_granularity_minutes=30),
+            buffer_minutes=BufferTime(pre=5, post=10),
+        )
+        naive_appointments = [(datetime(2026, 3, 9, 10, 0), 30), (datetime(2026, 3, 10, 14, 30), 45)]
+        block = AdminBlock(id="b1", provider_id="p1", start=datetime(2026, 3, 10, 8, 0), end=datetime(2026, 3, 10, 9, 0))
+
+        with ExitStack() as stack:
+            for target, new in _standard_patches(**{
+                f"{CALC_MODULE}.Appointment.objects.filter": MagicMock(
+                    return_value=MagicMock(values_list=MagicMock(return_value=naive_appointments))
+                ),
+                f"{CALC_MODULE}.get_blocks_for_provider": MagicMock(return_value=[block]),
+            }).items():
+                stack.enter_context(patch(target, new))
+            expected = calculate_available_slots(
+                rule, date(2026, 3, 9), date(2026, 3, 10), now=datetime(2026, 3, 1, 0, 0)
+            )
+
+        appointments = [("p1", "loc-1", start, duration) for start, duration in naive_appointments]
+        result, _ = _run_batch(
+            [rule], _batch_patches(appointments=appointments, blocks={"p1": [block]}),
+            start=date(2026, 3, 9), end=date(2026, 3, 10),
+        )
+        assert result["p1"] == expected
@@ -0,0 +1,232 @@
+"""Equivalence checks and benchmarks for the calculator's blocked-interval index.
+
+The equivalence tests always run and compare ``BlockedIntervals`` against the
+original linear ``_is_blocked`` scan over generated schedules.
+
+The timing benchmarks are opt-in since they take a few seconds:
+
+    RUN_BENCHMARKS=1 uv run pytest tests/engine/test_calculator_benchmark.py -s
+"""
+
+import datetime as dt
+import os
+import random
+import time
+from contextlib import ExitStack
+from datetime import date, datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from provider_availability.engine.models import (
+    AdminBlock,
+    BookingInterval,
+    BufferTime,
+    ProviderAvailabilityRule,
+    TimeWindow,
+)
+from provider_availability.engine.calculator import (
+    BlockedIntervals,
+    _is_blocked,
+    _merge_intervals,
+    calculate_available_slots,
+)
+
+
+CALC_MODULE = "provider_availability.engine.calculator"
+
+START = date(2026, 3, 2)  # a Monday
+NOW = datetime(2026, 3, 1, 8, 0)
+
+WEEKDAYS = ["monday", "tuesday", "wednesday", "thursday", "friday"]
+
+
+class LinearBlockedIntervals:
+    """The original O(slots x blocks) check, kept as the benchmark baseline."""
+
+    def __init__(self, intervals):
+        self.intervals = list(intervals)
+
+    def overlaps(self, slot_start, slot_end):
+        return _is_blocked(slot_start, slot_end, self.intervals)
+
+
+def _busy_rule(granularity=15):
+    windows = [
+        TimeWindow(start=dt.time(8, 0), end=dt.time(12, 0)),
+        TimeWindow(start=dt.time(13, 0), end=dt.time(17, 30)),
+    ]
+    return ProviderAvailabilityRule(
+        id="rule-bench",
+        provider_id="p1",
+        location_ids=["loc-1"],
+        visit_types=["vt-1"],
+        weekly_schedule={day: windows for day in WEEKDAYS},
+        buffer_minutes=BufferTime(pre=5, post=10),
+        booking_interval=BookingInterval(min_lead_hours=0, slot_granularity_minutes=granularity),
+        is_active=True,
+    )
+
+
+def _busy_schedule(days, seed=7, appointments_per_day=18):
+    """Appointments, calendar events and admin blocks for a busy provider."""
+    rng = random.Random(seed)
+    appointments = []
+    events = []
+    blocks = []
+    for offset in range(days):
+        day = START + timedelta(days=offset)
+        if day.weekday() >= 5:
+            continue
+        for _ in range(appointments_per_day):
+            start = datetime.combine(day, dt.time(8, 0)) + timedelta(minutes=15 * rng.randrange(0, 38))
+            appointments.append((start, rng.choice([15, 20, 30, 45, 60])))
+        if rng.random() < 0.3:
+            start = datetime.combine(day, dt.time(rng.randrange(8, 16), 0))
+            events.append(MagicMock(starts_at=start, ends_at=start + timedelta(minutes=rng.choice([30, 60, 90]))))
+        if rng.random() < 0.05:
+            blocks.append(AdminBlock(
+                id=f"block-{offset}",
+                provider_id="p1",
+                start=datetime.combine(day, dt.time(0, 0)),
+                end=datetime.combine(day, dt.time(23, 59)),
+            ))
+    return appointments, events, blocks
+
+
+def _patches(appointments, events, blocks):
+    return {
+        f"{CALC_MODULE}.Appointment.objects.filter": MagicMock(
+            return_value=MagicMock(values_list=MagicMock(return_value=appointments))
+        ),
+        f"{CALC_MODULE}.get_provider_display": MagicMock(return_value={"name": "Dr. Bench", "npi_number": ""}),
+        f"{CALC_MODULE}.Event.objects.filter": MagicMock(
+            return_value=MagicMock(exclude=MagicMock(return_value=events))
+        ),
+        f"{CALC_MODULE}.get_blocks_for_provider": MagicMock(return_value=blocks),
+        f"{CALC_MODULE}.get_recurring_blocks_for_provider": MagicMock(return_value=[]),
+        f"{CALC_MODULE}.to_provider_naive": lambda value, provider_id: value,
+    }
+
+
+def _calculate(rule, days, schedule, index_cls=None):
+    patches = _patches(*schedule)
+    if index_cls is not None:
+        patches[f"{CALC_MODULE}.BlockedIntervals"] = index_cls
+    with ExitStack() as stack:
+        for target, new in patches.items():
+            stack.enter_context(patch(target, new))
+        return calculate_available_slots(rule, START, START + timedelta(days=days - 1), now=NOW)
+
+
+# ── _merge_intervals ──────────────────────────────────────────────────
+
+
+class TestMergeIntervals:
+    def test_empty(self):
+        assert _merge_intervals([]) == []
+
+    def test_sorts_and_merges_overlapping(self):
+        result = _merge_intervals([
+            (datetime(2026, 3, 2, 11, 0), datetime(2026, 3, 2, 12, 0)),
+            (datetime(2026, 3, 2, 9, 0), datetime(2026, 3, 2, 10, 0)),
+            (datetime(2026, 3, 2, 9, 30), datetime(2026, 3, 2, 10, 30)),
+        ])
+        assert result == [
+            (datetime(2026, 3, 2, 9, 0), datetime(2026, 3, 2, 10, 30)),
+            (datetime(2026, 3, 2, 11, 0), datetime(2026, 3, 2, 12, 0)),
+        ]
+
+    def test_contained_interval_does_not_shrink(self):
+        result = _merge_intervals([
+            (datetime(2026, 3, 2, 9, 0), datetime(2026, 3, 2, 12, 0)),
+            (datetime(2026, 3, 2, 10, 0), datetime(2026, 3, 2, 11, 0)),
+        ])
+        assert result == [(datetime(2026, 3, 2, 9, 0), datetime(2026, 3, 2, 12, 0))]
+
+    def test_touching_intervals_merge(self):
+        result = _merge_intervals([
+            (datetime(2026, 3, 2, 9, 0), datetime(2026, 3, 2, 10, 0)),
+            (datetime(2026, 3, 2, 10, 0), datetime(2026, 3, 2, 11, 0)),
+        ])
+        assert result == [(datetime(2026, 3, 2, 9, 0), datetime(2026, 3, 2, 11, 0))]
+
+
+# ── BlockedIntervals ──────────────────────────────────────────────────
+
+
+class TestBlockedIntervals:
+    def test_empty_never_blocks(self):
+        assert not BlockedIntervals([]).overlaps(datetime(2026, 3, 2, 9, 0), datetime(2026, 3, 2, 10, 0))
+
+    def test_adjacent_not_blocked(self):
+        blocked = BlockedIntervals([(datetime(2026, 3, 2, 9, 0), datetime(2026, 3, 2, 10, 0))])
+        assert not blocked.overlaps(datetime(2026, 3, 2, 10, 0), datetime(2026, 3, 2, 11, 0))
+        assert not blocked.overlaps(datetime(2026, 3, 2, 8, 0), datetime(2026, 3, 2, 9, 0))
+
+    def test_zero_length_block_inside_slot(self):
+        point = datetime(2026, 3, 2, 9, 30)
+        blocked = BlockedIntervals([(point, point)])
+        assert blocked.overlaps(datetime(2026, 3, 2, 9, 0), datetime(2026, 3, 2, 10, 0))
+
+    def test_matches_linear_scan(self):
+        rng = random.Random(42)
+        base = datetime(2026, 3, 2, 0, 0)
+        intervals = []
+        for _ in range(300):
+            start = base + timedelta(minutes=5 * rng.randrange(0, 2000))
+            intervals.append((start, start + timedelta(minutes=5 * rng.randrange(0, 24))))
+        blocked = BlockedIntervals(intervals)
+
+        for _ in range(2000):
+            slot_start = base + timedelta(minutes=5 * rng.randrange(0, 2000))
+            slot_end = slot_start + timedelta(minutes=5 * rng.randrange(1, 12))
+            assert blocked.overlaps(slot_start, slot_end) == _is_blocked(slot_start, slot_end, intervals)
+
+
+# ── calculate_available_slots old vs new ──────────────────────────────
+
+
+class TestCalculatorEquivalence:
+    @pytest.mark.parametrize("seed", [1, 2, 3])
+    def test_same_slots_as_linear_scan(self, seed):
+        rule = _busy_rule()
+        schedule = _busy_schedule(days=30, seed=seed)
+
+        expected = _calculate(rule, 30, schedule, index_cls=LinearBlockedIntervals)
+        actual = _calculate(rule, 30, schedule)
+
+        assert actual == expected
+        assert actual  # the generated schedule still leaves open slots
+
+
+# ── Benchmarks ────────────────────────────────────────────────────────
+
+
+@pytest.mark.skipif(not os.getenv("RUN_BENCHMARKS"), reason="set RUN_BENCHMARKS=1 to run benchmarks")
+class TestCalculatorBenchmark:
+    @pytest.mark.parametrize(
+        "days,appointments_per_day,granularity",
+        [
+            (30, 12, 15),
+            (90, 18, 15),
+            (90, 30, 5),
+        ],
+    )
+    def test_benchmark(self, days, appointments_per_day, granularity):
+        rule = _busy_rule(granularity=granularity)
+        schedule = _busy_schedule(days=days, appointments_per_day=appointments_per_day)
+
+        timings = {}
+        for name, index_cls in (("linear", LinearBlockedIntervals), ("indexed", None)):
+            started = time.perf_counter()
+            slots = _calculate(rule, days, schedule, index_cls=index_cls)
+            timings[name] = time.perf_counter() - started
+
+        print(
+            f"\n{days} days, {appointments_per_day} appts/day, {granularity}-min slots, "
+            f"{len(slots)} open slots: linear {timings['linear'] * 1000:.1f}ms, "
+            f"indexed {timings['indexed'] * 1000:.1f}ms "
+            f"({timings['linear'] / timings['indexed']:.1f}x)"
+        )
+        assert timings["indexed"] < timings["linear"]
@@ -25,9 +25,6 @@ from provider_availability.engine.event_sync import (
     HOLD_BLOCK_TITLE,
     OVERRIDE_BLOCK_TITLE,
     RECURRING_BLOCK_TITLE,
-    _compute_recurring_segments,
-    _next_weekday,
-    _weekday_occurrences,
     _build_hold_block_events,
     _build_rule_events,
     _get_calendar_id,
@@ -48,85 +45,6 @@ PROVIDER_ID = "provider-uuid-123"
 LOCATION_ID = "location-uuid-456"
 
 
-# ── _next_weekday ─────────────────────────────────────────────────────
-
-
-class TestNextWeekday:
-    def test_same_day(self):
-        # 2026-03-02 is a Monday (weekday 0)
-        result = _next_weekday(date(2026, 3, 2), 0)
-        assert result == date(2026, 3, 2)
-
-    def test_next_day(self):
-        # From Monday, find Tuesday (weekday 1)
-        result = _next_weekday(date(2026, 3, 2), 1)
-        assert result == date(2026, 3, 3)
-
-    def test_wraps_around(self):
-        # From Wednesday (2026-03-04), find Monday (weekday 0)
-        result = _next_weekday(date(2026, 3, 4), 0)
-        assert result == date(2026, 3, 9)
-
-    def test_friday_from_monday(self):
-        result = _next_weekday(date(2026, 3, 2), 4)
-        assert result == date(2026, 3, 6)
-
-    def test_sunday_from_saturday(self):
-        # 2026-03-07 is Saturday (weekday 5), find Sunday (weekday 6)
-        result = _next_weekday(date(2026, 3, 7), 6)
-        assert result == date(2026, 3, 8)
-
-    def test_same_weekday_returns_same_date(self):
-        # 2026-03-06 is Friday (weekday 4)
-        result = _next_weekday(date(2026, 3, 6), 4)
-        assert result == date(2026, 3, 6)
-
-    def test_sunday_wraps_to_next_week(self):
-        # From Sunday (weekday 6), find Saturday (weekday 5) = next Sat
-        result = _next_weekday(date(2026, 3, 8), 5)  # 2026-03-08 is Sunday
-        assert result == date(2026, 3, 14)
-
-
-# ── _weekday_occurrences ──────────────────────────────────────────────
-
-
-class TestWeekdayOccurrences:
-    def test_full_month_mondays(self):
-        result = _weekday_occurrences(date(2026, 3, 1), date(2026, 3, 31), 0)
-        assert result == [
-            date(2026, 3, 2),
-            date(2026, 3, 9),
-            date(2026, 3, 16),
-            date(2026, 3, 23),
-            date(2026, 3, 30),
-        ]
-
-    def test_no_occurrences(self):
-        # Range too short to contain Friday (weekday 4)
-        # 2026-03-02 is Monday, 2026-03-05 is Thursday
-        result = _weekday_occurrences(date(2026, 3, 2), date(2026, 3, 5), 4)
-        assert result == []
-
-    def test_single_day_match(self):
-        # 2026-03-02 is Monday
-        result = _weekday_occurrences(date(2026, 3, 2), date(2026, 3, 2), 0)
-        assert result == [date(2026, 3, 2)]
-
-    def test_single_day_no_match(self):
-        result = _weekday_occurrences(date(2026, 3, 2), date(2026, 3, 2), 1)
-        assert result == []
-
-    def test_two_week_span(self):
-        # Two Wednesdays in a two-week span starting on a Monday
-        result = _weekday_occurrences(date(2026, 3, 2), date(2026, 3, 15), 2)
-        assert result == [date(2026, 3, 4), date(2026, 3, 11)]
-
-    def test_start_equals_end_on_matching_day(self):
-        # 2026-03-06 is a Friday
-        result = _weekday_occurrences(date(2026, 3, 6), date(2026, 3, 6), 4)
-        assert result == [date(2026, 3, 6)]
-
-
 # ── sync_provider_availability ────────────────────────────────────────
 
 
@@ -2480,6 +2398,30 @@ class TestOverrideEventSync:
         # Single recurring event for Thursday
         assert len(effects) == 1
 
+    @patch(f"{MODULE}.to_utc", side_effect=lambda x: x)
+    @patch(f"{MODULE}.localize_naive", side_effect=lambda dt_val, tz: dt_val)
+    @patch(f"{MODULE}.provider_tz")
+    @patch(f"{MODULE}._get_calendar_id", return_value=("clinic-cal-1", []))
+    def test_biweekly_starts_on_in_pattern_week(
+        self, mock_get_cal, mock_tz, mock_localize, mock_utc
+    ):
+        """A bi-weekly series that started in the past resumes on its own weeks, not the next Thursday."""
+        mock_tz.return_value = ZoneInfo("US/Eastern")
+
+        rule = self._make_rule()
+        rule.effective_start = date(2026, 2, 26)  # Thursday; 03-05 is an off week
+        rule.recurrence_interval = 2
+
+        with patch(f"{MODULE}.date") as mock_date, \
+             patch(f"{MODULE}.EventEffect") as mock_event_effect:
+            mock_date.today.return_value = date(2026, 3, 2)
+            mock_date.side_effect = lambda *a, **kw: date(*a, **kw)
+            _build_rule_events(rule)
+
+        kwargs = mock_event_effect.call_args.kwargs
+        assert kwargs["starts_at"] == datetime(2026, 3, 12, 9, 0)
+        assert kwargs["recurrence_interval"] == 2
+
     @patch(f"{MODULE}.to_utc", side_effect=lambda x: x)
     @patch(f"{MODULE}.localize_naive", side_effect=lambda dt_val, tz: dt_val)
     @patch(f"{MODULE}.provider_tz")
@@ -2563,60 +2505,6 @@ class TestOverrideEventSync:
         assert len(effects) == 5
 
 
-class TestComputeRecurringSegments:
-    """Tests for _compute_recurring_segments helper."""
-
-    def test_no_overrides(self):
-        """No override dates returns the full range as a single segment."""
-        segments = _compute_recurring_segments(date(2026, 3, 5), date(2051, 3, 5), [])
-        assert segments == [(date(2026, 3, 5), date(2051, 3, 5))]
-
-    def test_single_override_middle(self):
-        """An override in the middle produces two segments."""
-        segments = _compute_recurring_segments(
-            date(2026, 3, 5), date(2026, 5, 28),
-            [date(2026, 4, 9)],
-        )
-        assert segments == [
-            (date(2026, 3, 5), date(2026, 4, 2)),   # ends week before override
-            (date(2026, 4, 16), date(2026, 5, 28)),  # starts week after override
-        ]
-
-    def test_override_on_first_date(self):
-        """Override on the very first occurrence skips it, starts one week later."""
-        segments = _compute_recurring_segments(
-            date(2026, 3, 5), date(2026, 4, 30),
-            [date(2026, 3, 5)],
-        )
-        # seg_end = 3/5 - 7 = 2/26 < 3/5, so no first segment
-        # current_start = 3/12
-        assert segments == [(date(2026, 3, 12), date(2026, 4, 30))]
-
-    def test_override_on_last_date(self):
-        """Override on the last possible occurrence."""
-        segments = _compute_recurring_segments(
-            date(2026, 3, 5), date(2026, 3, 19),
-            [date(2026, 3, 19)],
-        )
-        # seg before: 3/5 to 3/12
-        # after: 3/26 > 3/19, no second segment
-        assert segments == [(date(2026, 3, 5), date(2026, 3, 12))]
-
-    def test_consecutive_overrides(self):
-        """Two consecutive weekly overrides — no segment between them."""
-        segments = _compute_recurring_segments(
-            date(2026, 3, 5), date(2026, 4, 30),
-            [date(2026, 3, 19), date(2026, 3, 26)],
-        )
-        # Before first: 3/5 to 3/12
-        # Between: 3/26+7=4/2 but 3/26-7=3/19 — no gap (3/26 is also an override)
-        # After second: 4/2 to 4/30
-        assert segments == [
-            (date(2026, 3, 5), date(2026, 3, 12)),
-            (date(2026, 4, 2), date(2026, 4, 30)),
-        ]
-
-
 # ── _build_rule_events: daily recurrence path ─────────────────────────
 
 
@@ -32,7 +32,6 @@ from provider_availability.engine.event_sync import (
     _block_outside_override,
     _build_hold_block_events,
     _build_rule_events,
-    _compute_recurring_segments,
     _get_provider_override_map,
     build_block_event_effects,
     build_delete_block_effects,
@@ -262,30 +261,6 @@ class TestBuildRuleEventsDaily:
         assert oneoff_call.kwargs["starts_at"].hour == 14
 
 
-# ── _compute_recurring_segments: off-pattern override (line 333) ──────
-
-
-class TestComputeRecurringSegmentsOffPattern:
-    def test_override_before_first_date_ignored(self):
-        """Override before first_date is skipped (line 332-333)."""
-        segments = _compute_recurring_segments(
-            date(2026, 3, 5), date(2026, 4, 30),
-            [date(2026, 2, 26)],  # before first_date
-        )
-        assert segments == [(date(2026, 3, 5), date(2026, 4, 30))]
-
-    def test_override_not_on_step_pattern_ignored(self):
-        """Override that isn't on the step_days pattern is skipped (line 333)."""
-        # first_date 2026-03-05 (Thu), step 7. 2026-03-08 is +3 days, not on pattern.
-        segments = _compute_recurring_segments(
-            date(2026, 3, 5), date(2026, 4, 30),
-            [date(2026, 3, 8)],
-            step_days=7,
-        )
-        # Off-pattern override ignored -> single full-range segment
-        assert segments == [(date(2026, 3, 5), date(2026, 4, 30))]
-
-
 # ── build_block_event_effects: location_ids (line 479) ────────────────
 
 
@@ -489,11 +464,10 @@ class TestBuildLeadTimeOverrideBranches:
 
     @patch(f"{MODULE}.to_utc", side_effect=lambda x: x)
     @patch(f"{MODULE}.get_admin_calendars")
-    @patch(f"{MODULE}.date_in_pattern", return_value=True)
     @patch(f"{MODULE}.provider_tz")
     @patch(f"{MODULE}.get_admin_calendar_id")
     def test_daily_rule_uses_time_windows(
-        self, mock_get_admin_cal, mock_tz, mock_pattern, mock_get_admin_cals, mock_to_utc
+        self, mock_get_admin_cal, mock_tz, mock_get_admin_cals, mock_to_utc
     ):
         """A daily rule uses rule.time_windows in the lead-time loop (line 671)."""
         tz = ZoneInfo("US/Eastern")
@@ -812,11 +786,10 @@ class TestBuildHoldBlockEvents:
 
     @patch(f"{MODULE}.to_utc", side_effect=lambda x: x)
     @patch(f"{MODULE}.localize_naive", side_effect=lambda x, tz: x.replace(tzinfo=UTC))
-    @patch(f"{MODULE}.date_in_pattern", return_value=True)
     @patch(f"{MODULE}.provider_tz")
     @patch(f"{MODULE}.get_admin_calendar_id")
     def test_same_day_hold_blocks_future_dates(
-        self, mock_get_admin_cal, mock_tz, mock_pattern, mock_localize, mock_to_utc
+        self, mock_get_admin_cal, mock_tz, mock_localize, mock_to_utc
     ):
         """same_day hold blocks dates strictly after today (lines 943-944, 1007-1018)."""
         mock_tz.return_value = ZoneInfo("US/Eastern")
@@ -850,11 +823,10 @@ class TestBuildHoldBlockEvents:
 
     @patch(f"{MODULE}.to_utc", side_effect=lambda x: x)
     @patch(f"{MODULE}.localize_naive", side_effect=lambda x, tz: x.replace(tzinfo=UTC))
-    @patch(f"{MODULE}.date_in_pattern", return_value=True)
     @patch(f"{MODULE}.provider_tz")
     @patch(f"{MODULE}.get_admin_calendar_id")
     def test_next_day_hold_skips_tomorrow(
-        self, mock_get_admin_cal, mock_tz, mock_pattern, mock_localize, mock_to_utc
+        self, mock_get_admin_cal, mock_tz, mock_localize, mock_to_utc
     ):
         """next_day hold blocks dates after today+1 (lines 945-946)."""
         mock_tz.return_value = ZoneInfo("US/Eastern")
@@ -888,11 +860,10 @@ class TestBuildHoldBlockEvents:
 
     @patch(f"{MODULE}.to_utc", side_effect=lambda x: x)
     @patch(f"{MODULE}.localize_naive", side_effect=lambda x, tz: x.replace(tzinfo=UTC))
-    @patch(f"{MODULE}.date_in_pattern", return_value=True)
     @patch(f"{MODULE}.provider_tz")
     @patch(f"{MODULE}.get_admin_calendar_id")
     def test_no_admin_calendar_skips_location(
-        self, mock_get_admin_cal, mock_tz, mock_pattern, mock_localize, mock_to_utc
+        self, mock_get_admin_cal, mock_tz, mock_localize, mock_to_utc
     ):
         """No admin calendar for the location skips it (lines 971-973)."""
         mock_tz.return_value = ZoneInfo("US/Eastern")
@@ -957,11 +928,10 @@ class TestBuildHoldBlockEvents:
 
     @patch(f"{MODULE}.to_utc", side_effect=lambda x: x)
     @patch(f"{MODULE}.localize_naive", side_effect=lambda x, tz: x.replace(tzinfo=UTC))
-    @patch(f"{MODULE}.date_in_pattern", return_value=True)
     @patch(f"{MODULE}.provider_tz")
     @patch(f"{MODULE}.get_admin_calendar_id")
     def test_override_suppresses_hold_date(
-        self, mock_get_admin_cal, mock_tz, mock_pattern, mock_localize, mock_to_utc
+        self, mock_get_admin_cal, mock_tz, mock_localize, mock_to_utc
     ):
         """A date override where the hold falls outside its window suppresses that date (lines 1000-1005)."""
         mock_tz.return_value = ZoneInfo("US/Eastern")
@@ -1013,12 +983,11 @@ class TestRecurringBlockSyncHoldRoute:
     @patch(f"{MODULE}.get_rules_for_provider", return_value=[])
     @patch(f"{MODULE}.to_utc", side_effect=lambda x: x)
     @patch(f"{MODULE}.localize_naive", side_effect=lambda x, tz: x.replace(tzinfo=UTC))
-    @patch(f"{MODULE}.date_in_pattern", return_value=True)
     @patch(f"{MODULE}.provider_tz")
     @patch(f"{MODULE}.get_admin_calendar_id")
     @patch(f"{MODULE}.build_delete_recurring_block_effects")
     def test_hold_type_routes_to_hold_events(
-        self, mock_delete, mock_get_admin_cal, mock_tz, mock_pattern,
+        self, mock_delete, mock_get_admin_cal, mock_tz,
         mock_localize, mock_to_utc, mock_rules
     ):
         """A hold_type block routes to _build_hold_block_events (lines 797-798)."""
@@ -1061,12 +1030,11 @@ class TestBuildHoldBlockRefreshEffects:
     @patch(f"{MODULE}.get_rules_for_provider", return_value=[])
     @patch(f"{MODULE}.to_utc", side_effect=lambda x: x)
     @patch(f"{MODULE}.localize_naive", side_effect=lambda x, tz: x.replace(tzinfo=UTC))
-    @patch(f"{MODULE}.date_in_pattern", return_value=True)
     @patch(f"{MODULE}.provider_tz")
     @patch(f"{MODULE}.get_admin_calendar_id")
     @patch(f"{MODULE}.get_admin_calendars")
     def test_deletes_existing_then_recreates(
-        self, mock_get_admin_cals, mock_get_admin_cal, mock_tz, mock_pattern,
+        self, mock_get_admin_cals, mock_get_admin_cal, mock_tz,
         mock_localize, mock_to_utc, mock_rules
     ):
         """Refresh deletes existing hold events (all prefixes) then recreates (lines 1038-1048)."""
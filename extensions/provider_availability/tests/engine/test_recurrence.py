@@ -0,0 +1,255 @@
+"""Tests for provider_availability.engine.recurrence."""
+
+import datetime as dt
+from datetime import date, timedelta
+
+import pytest
+
+from provider_availability.engine.models import TimeWindow, date_in_pattern
+from provider_availability.engine.recurrence import (
+    first_daily_occurrence,
+    first_weekday_occurrence,
+    next_weekday,
+    occurrence_dates,
+    recurring_segments,
+    weekday_occurrences,
+    windows_on,
+)
+
+MON = [TimeWindow(start=dt.time(9, 0), end=dt.time(12, 0))]
+WED = [TimeWindow(start=dt.time(13, 0), end=dt.time(17, 0))]
+
+
+def _brute_force(start, end, effective_start, frequency, interval, weekly_schedule):
+    days = (end - start).days + 1
+    return [
+        start + timedelta(days=n) for n in range(days)
+        if date_in_pattern(start + timedelta(days=n), effective_start, frequency, interval, weekly_schedule)
+    ]
+
+
+# ── occurrence_dates ──────────────────────────────────────────────────
+
+
+class TestOccurrenceDates:
+    @pytest.mark.parametrize("frequency", ["daily", "weekly"])
+    @pytest.mark.parametrize("interval", [0, 1, 2, 3, 17])
+    @pytest.mark.parametrize("effective_start", [None, date(2025, 12, 31), date(2026, 3, 4), date(2026, 4, 2)])
+    @pytest.mark.parametrize("schedule", [
+        {"monday": MON},
+        {"monday": MON, "wednesday": WED},
+        {"monday": MON, "tuesday": [], "sunday": WED},
+        {},
+    ])
+    def test_matches_date_in_pattern(self, frequency, interval, effective_start, schedule):
+        start, end = date(2026, 3, 1), date(2026, 6, 30)
+        assert occurrence_dates(start, end, effective_start, frequency, interval, schedule) == _brute_force(
+            start, end, effective_start, frequency, interval, schedule,
+        )
+
+    def test_biweekly_counts_weeks_from_anchor(self):
+        # anchor is Wed 2026-03-04; Mondays fall in the anchor-relative week that starts there
+        result = occurrence_dates(
+            date(2026, 3, 1), date(2026, 3, 31), date(2026, 3, 4), "weekly", 2,
+            {"monday": MON, "wednesday": WED},
+        )
+        assert result == [
+            date(2026, 3, 4), date(2026, 3, 9), date(2026, 3, 18), date(2026, 3, 23),
+        ]
+
+    def test_every_third_day(self):
+        result = occurrence_dates(date(2026, 3, 5), date(2026, 3, 14), date(2026, 3, 1), "daily", 3, {})
+        assert result == [date(2026, 3, 7), date(2026, 3, 10), date(2026, 3, 13)]
+
+    def test_empty_range(self):
+        assert occurrence_dates(date(2026, 3, 5), date(2026, 3, 4), None, "daily", 1, {}) == []
+
+
+# ── first occurrences ─────────────────────────────────────────────────
+
+
+class TestFirstOccurrence:
+    def test_daily_aligned_to_effective_start(self):
+        assert first_daily_occurrence(date(2026, 3, 5), date(2026, 3, 1), 3) == date(2026, 3, 7)
+        assert first_daily_occurrence(date(2026, 3, 7), date(2026, 3, 1), 3) == date(2026, 3, 7)
+
+    def test_daily_without_effective_start_starts_at_range(self):
+        assert first_daily_occurrence(date(2026, 3, 5), None, 3) == date(2026, 3, 5)
+
+    def test_weekly_interval_one_is_next_weekday(self):
+        assert first_weekday_occurrence(date(2026, 3, 4), 0, date(2026, 1, 1), 1, {"monday": MON}) == date(2026, 3, 9)
+
+    def test_biweekly_skips_off_week(self):
+        # anchor Mon 2026-03-02; Mon 2026-03-09 is an off week
+        assert first_weekday_occurrence(
+            date(2026, 3, 4), 0, date(2026, 3, 2), 2, {"monday": MON},
+        ) == date(2026, 3, 16)
+        assert first_weekday_occurrence(
+            date(2026, 3, 4), 2, date(2026, 3, 2), 2, {"monday": MON, "wednesday": WED},
+        ) == date(2026, 3, 4)
+
+
+# ── windows_on ────────────────────────────────────────────────────────
+
+
+class TestWindowsOn:
+    def test_daily_uses_time_windows(self):
+        assert windows_on(date(2026, 3, 4), "daily", MON, {"wednesday": WED}) == MON
+
+    def test_weekly_uses_weekday_schedule(self):
+        assert windows_on(date(2026, 3, 4), "weekly", MON, {"wednesday": WED}) == WED
+        assert windows_on(date(2026, 3, 5), "weekly", MON, {"wednesday": WED}) == []
+
+
+# ── next_weekday ──────────────────────────────────────────────────────
+
+
+class TestNextWeekday:
+    def test_same_day(self):
+        # 2026-03-02 is a Monday (weekday 0)
+        result = next_weekday(date(2026, 3, 2), 0)
+        assert result == date(2026, 3, 2)
+
+    def test_next_day(self):
+        # From Monday, find Tuesday (weekday 1)
+        result = next_weekday(date(2026, 3, 2), 1)
+        assert result == date(2026, 3, 3)
+
+    def test_wraps_around(self):
+        # From Wednesday (2026-03-04), find Monday (weekday 0)
+        result = next_weekday(date(2026, 3, 4), 0)
+        assert result == date(2026, 3, 9)
+
+    def test_friday_from_monday(self):
+        result = next_weekday(date(2026, 3, 2), 4)
+        assert result == date(2026, 3, 6)
+
+    def test_sunday_from_saturday(self):
+        # 2026-03-07 is Saturday (weekday 5), find Sunday (weekday 6)
+        result = next_weekday(date(2026, 3, 7), 6)
+        assert result == date(2026, 3, 8)
+
+    def test_same_weekday_returns_same_date(self):
+        # 2026-03-06 is Friday (weekday 4)
+        result = next_weekday(date(2026, 3, 6), 4)
+        assert result == date(2026, 3, 6)
+
+    def test_sunday_wraps_to_next_week(self):
+        # From Sunday (weekday 6), find Saturday (weekday 5) = next Sat
+        result = next_weekday(date(2026, 3, 8), 5)  # 2026-03-08 is Sunday
+        assert result == date(2026, 3, 14)
+
+
+# ── weekday_occurrences ───────────────────────────────────────────────
+
+
+class TestWeekdayOccurrences:
+    def test_full_month_mondays(self):
+        result = weekday_occurrences(date(2026, 3, 1), date(2026, 3, 31), 0)
+        assert result == [
+            date(2026, 3, 2),
+            date(2026, 3, 9),
+            date(2026, 3, 16),
+            date(2026, 3, 23),
+            date(2026, 3, 30),
+        ]
+
+    def test_no_occurrences(self):
+        # Range too short to contain Friday (weekday 4)
+        # 2026-03-02 is Monday, 2026-03-05 is Thursday
+        result = weekday_occurrences(date(2026, 3, 2), date(2026, 3, 5), 4)
+        assert result == []
+
+    def test_single_day_match(self):
+        # 2026-03-02 is Monday
+        result = weekday_occurrences(date(2026, 3, 2), date(2026, 3, 2), 0)
+        assert result == [date(2026, 3, 2)]
+
+    def test_single_day_no_match(self):
+        result = weekday_occurrences(date(2026, 3, 2), date(2026, 3, 2), 1)
+        assert result == []
+
+    def test_two_week_span(self):
+        # Two Wednesdays in a two-week span starting on a Monday
+        result = weekday_occurrences(date(2026, 3, 2), date(2026, 3, 15), 2)
+        assert result == [date(2026, 3, 4), date(2026, 3, 11)]
+
+    def test_start_equals_end_on_matching_day(self):
+        # 2026-03-06 is a Friday
+        result = weekday_occurrences(date(2026, 3, 6), date(2026, 3, 6), 4)
+        assert result == [date(2026, 3, 6)]
+
+
+# ── recurring_segments ────────────────────────────────────────────────
+
+
+class TestRecurringSegments:
+
+    def test_no_overrides(self):
+        """No override dates returns the full range as a single segment."""
+        segments = recurring_segments(date(2026, 3, 5), date(2051, 3, 5), [])
+        assert segments == [(date(2026, 3, 5), date(2051, 3, 5))]
+
+    def test_single_override_middle(self):
+        """An override in the middle produces two segments."""
+        segments = recurring_segments(
+            date(2026, 3, 5), date(2026, 5, 28),
+            [date(2026, 4, 9)],
+        )
+        assert segments == [
+            (date(2026, 3, 5), date(2026, 4, 2)),   # ends week before override
+            (date(2026, 4, 16), date(2026, 5, 28)),  # starts week after override
+        ]
+
+    def test_override_on_first_date(self):
+        """Override on the very first occurrence skips it, starts one week later."""
+        segments = recurring_segments(
+            date(2026, 3, 5), date(2026, 4, 30),
+            [date(2026, 3, 5)],
+        )
+        # seg_end = 3/5 - 7 = 2/26 < 3/5, so no first segment
+        # current_start = 3/12
+        assert segments == [(date(2026, 3, 12), date(2026, 4, 30))]
+
+    def test_override_on_last_date(self):
+        """Override on the last possible occurrence."""
+        segments = recurring_segments(
+            date(2026, 3, 5), date(2026, 3, 19),
+            [date(2026, 3, 19)],
+        )
+        # seg before: 3/5 to 3/12
+        # after: 3/26 > 3/19, no second segment
+        assert segments == [(date(2026, 3, 5), date(2026, 3, 12))]
+
+    def test_consecutive_overrides(self):
+        """Two consecutive weekly overrides — no segment between them."""
+        segments = recurring_segments(
+            date(2026, 3, 5), date(2026, 4, 30),
+            [date(2026, 3, 19), date(2026, 3, 26)],
+        )
+        # Before first: 3/5 to 3/12
+        # Between: 3/26+7=4/2 but 3/26-7=3/19 — no gap (3/26 is also an override)
+        # After second: 4/2 to 4/30
+        assert segments == [
+            (date(2026, 3, 5), date(2026, 3, 12)),
+            (date(2026, 4, 2), date(2026, 4, 30)),
+        ]
+
+    def test_override_before_first_date_ignored(self):
+        """Override before first_date is skipped."""
+        segments = recurring_segments(
+            date(2026, 3, 5), date(2026, 4, 30),
+            [date(2026, 2, 26)],  # before first_date
+        )
+        assert segments == [(date(2026, 3, 5), date(2026, 4, 30))]
+
+    def test_override_not_on_step_pattern_ignored(self):
+        """Override that isn't on the step_days pattern is skipped."""
+        # first_date 2026-03-05 (Thu), step 7. 2026-03-08 is +3 days, not on pattern.
+        segments = recurring_segments(
+            date(2026, 3, 5), date(2026, 4, 30),
+            [date(2026, 3, 8)],
+            step_days=7,
+        )
+        # Off-pattern override ignored -> single full-range segment
+        assert segments == [(date(2026, 3, 5), date(2026, 4, 30))]
@@ -0,0 +1,237 @@
+"""Tests for provider_availability.engine.slot_cache."""
+
+import datetime as dt
+from contextlib import ExitStack
+from datetime import date, datetime, timedelta
+from unittest.mock import MagicMock, patch
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from provider_availability.engine.calculator import get_available_slots_for_providers
+from provider_availability.engine.models import (
+    AdminBlock,
+    BookingInterval,
+    BufferTime,
+    ProviderAvailabilityRule,
+    RecurringBlock,
+    TimeWindow,
+)
+from provider_availability.engine.slot_cache import (
+    PRECOMPUTE_DAYS,
+    get_precomputed_slots_for_providers,
+    refresh_slot_cache,
+)
+from provider_availability.engine.storage import (
+    invalidate_slot_days,
+    save_block,
+    save_rule,
+    slot_day_key,
+)
+
+
+CALC_MODULE = "provider_availability.engine.calculator"
+SLOT_MODULE = "provider_availability.engine.slot_cache"
+
+MONDAY = date(2026, 3, 9)
+NOW = datetime(2026, 3, 9, 7, 0)  # Monday morning
+
+
+def _make_rule(**overrides):
+    defaults = {
+        "id": "rule-1",
+        "provider_id": "p1",
+        "location_ids": ["loc-1"],
+        "visit_types": ["vt-1"],
+        "weekly_schedule": {
+            day: [TimeWindow(start=dt.time(9, 0), end=dt.time(12, 0))]
+            for day in ("monday", "tuesday", "wednesday", "thursday", "friday")
+        },
+        "buffer_minutes": BufferTime(pre=0, post=0),
+        "booking_interval": BookingInterval(min_lead_hours=3, slot_granularity_minutes=30),
+        "is_active": True,
+    }
+    defaults.update(overrides)
+    return ProviderAvailabilityRule(**defaults)  # type: ignore[arg-type]
+
+
+@pytest.fixture
+def sources(patch_cache):
+    """Patch the database reads behind the calculator; admin blocks come from the mock cache."""
+    appointments = MagicMock(return_value=MagicMock(values_list=MagicMock(return_value=[])))
+    events = MagicMock(return_value=MagicMock(values_list=MagicMock(return_value=[])))
+    with ExitStack() as stack:
+        stack.enter_context(patch(f"{CALC_MODULE}.Appointment.objects.filter", appointments))
+        stack.enter_context(patch(f"{CALC_MODULE}.Event.objects.filter", events))
+        stack.enter_context(patch(
+            f"{CALC_MODULE}.get_provider_displays",
+            side_effect=lambda pids: {pid: {"name": f"Dr. {pid}", "npi_number": ""} for pid in pids},
+        ))
+        for module in (CALC_MODULE, SLOT_MODULE):
+            stack.enter_context(patch(
+                f"{module}.provider_tzs",
+                side_effect=lambda pids: {pid: ZoneInfo("UTC") for pid in pids},
+            ))
+        yield appointments
+
+
+def _hours(slots):
+    return [(s.start.day, s.start.hour, s.start.minute) for s in slots]
+
+
+# ── get_precomputed_slots_for_providers ───────────────────────────────
+
+
+class TestGetPrecomputedSlots:
+    def test_matches_live_calculation(self, sources):
+        rules = [
+            _make_rule(id="r1", provider_id="p1", buffer_minutes=BufferTime(pre=10, post=10)),
+            _make_rule(id="r2", provider_id="p2", location_ids=["loc-2"]),
+        ]
+        sources.return_value.values_list.return_value = [
+            ("p1", "loc-1", datetime(2026, 3, 9, 10, 30), 30),
+            ("p1", "loc-1", datetime(2026, 3, 10, 9, 0), 60),
+            ("p2", "loc-2", datetime(2026, 3, 11, 11, 0), 30),
+        ]
+        save_block(AdminBlock(id="b1", provider_id="p2", start=datetime(2026, 3, 12, 9, 0), end=datetime(2026, 3, 12, 10, 0)))
+
+        expected = get_available_slots_for_providers(rules, MONDAY, MONDAY + timedelta(days=6), now=NOW)
+        actual = get_precomputed_slots_for_providers(rules, MONDAY, MONDAY + timedelta(days=6), now=NOW)
+
+        assert actual == expected
+        assert actual["p2"][0].start == datetime(2026, 3, 9, 10, 0)  # lead time applied on read
+        assert actual["p1"][0].start == datetime(2026, 3, 9, 11, 30)  # 10:30 visit plus buffers
+
+    def test_second_read_served_from_cache(self, sources, patch_cache):
+        rules = [_make_rule()]
+        first = get_precomputed_slots_for_providers(rules, MONDAY, MONDAY + timedelta(days=2), now=NOW)
+        assert sources.call_count == 1
+        assert slot_day_key("p1", MONDAY) in patch_cache._store
+
+        second = get_precomputed_slots_for_providers(rules, MONDAY, MONDAY + timedelta(days=2), now=NOW)
+        assert second == first
+        assert sources.call_count == 1
+
+    def test_lead_time_applied_at_read_time(self, sources):
+        rules = [_make_rule()]
+        early = get_precomputed_slots_for_providers(rules, MONDAY, MONDAY, now=NOW)
+        later = get_precomputed_slots_for_providers(rules, MONDAY, MONDAY, now=NOW + timedelta(hours=1))
+
+        assert _hours(early["p1"]) == [(9, 10, 0), (9, 10, 30), (9, 11, 0), (9, 11, 30)]
+        assert _hours(later["p1"]) == [(9, 11, 0), (9, 11, 30)]
+        assert sources.call_count == 1
+
+    def test_filters_served_from_same_entry(self, sources):
+        rules = [
+            _make_rule(id="r1", location_ids=["loc-1"]),
+            _make_rule(id="r2", location_ids=["loc-2"], weekly_schedule={
+                "monday": [TimeWindow(start=dt.time(14, 0), end=dt.time(15, 0))],
+            }),
+        ]
+        get_precomputed_slots_for_providers(rules, MONDAY, MONDAY, now=NOW)
+        loc_2 = get_precomputed_slots_for_providers(rules, MONDAY, MONDAY, location_id="loc-2", now=NOW)
+
+        assert _hours(loc_2["p1"]) == [(9, 14, 0), (9, 14, 30)]
+        assert {s.location_id for s in loc_2["p1"]} == {"loc-2"}
+        assert sources.call_count == 1
+
+    def test_rule_edit_recomputes(self, sources):
+        rule = _make_rule()
+        save_rule(rule)
+        get_precomputed_slots_for_providers([rule], MONDAY, MONDAY, now=NOW)
+
+        rule.booking_interval = BookingInterval(min_lead_hours=3, slot_granularity_minutes=60)
+        save_rule(rule)
+        result = get_precomputed_slots_for_providers([rule], MONDAY, MONDAY, now=NOW)
+
+        assert _hours(result["p1"]) == [(9, 10, 0), (9, 11, 0)]
+        assert sources.call_count == 2
+
+    def test_new_rule_without_invalidation_is_a_miss(self, sources):
+        get_precomputed_slots_for_providers([_make_rule(id="r1")], MONDAY, MONDAY, now=NOW)
+        get_precomputed_slots_for_providers(
+            [_make_rule(id="r1"), _make_rule(id="r2")], MONDAY, MONDAY, now=NOW,
+        )
+        assert sources.call_count == 2
+
+    def test_block_edit_recomputes_only_its_days(self, sources):
+        rules = [_make_rule(booking_interval=BookingInterval(min_lead_hours=0, slot_granularity_minutes=60))]
+        get_precomputed_slots_for_providers(rules, MONDAY, MONDAY + timedelta(days=13), now=NOW)
+
+        save_block(AdminBlock(id="b1", provider_id="p1", start=datetime(2026, 3, 18, 9, 0), end=datetime(2026, 3, 18, 12, 0)))
+        result = get_precomputed_slots_for_providers(rules, MONDAY, MONDAY + timedelta(days=13), now=NOW)
+
+        assert sources.call_count == 2
+        query = sources.call_args.kwargs
+        # days 17-19 were dropped; the query window adds a day either side
+        assert query["start_time__gte"] == datetime(2026, 3, 16, 0, 0)
+        assert query["start_time__lte"] == datetime(2026, 3, 20, 23, 59, 59)
+        assert not [s for s in result["p1"] if s.start.date() == date(2026, 3, 18)]
+
+    def test_near_days_recomputed_after_date_rollover(self, sources):
+        """Hold-type recurring blocks change as the date rolls over, so today and tomorrow are redone."""
+        hold = RecurringBlock(
+            id="hold-1",
+            provider_id="p1",
+            recurrence_frequency="daily",
+            time_windows=[TimeWindow(start=dt.time(9, 0), end=dt.time(12, 0))],
+            hold_type="next_day",
+            is_active=True,
+        )
+        rules = [_make_rule(booking_interval=BookingInterval(min_lead_hours=0, slot_granularity_minutes=60))]
+        with patch(f"{CALC_MODULE}.get_recurring_blocks_for_providers", return_value={"p1": [hold]}):
+            monday = get_precomputed_slots_for_providers(rules, MONDAY, MONDAY + timedelta(days=3), now=NOW)
+            tuesday = get_precomputed_slots_for_providers(
+                rules, MONDAY, MONDAY + timedelta(days=3), now=NOW + timedelta(days=1),
+            )
+
+        assert {s.start.day for s in monday["p1"]} == {9, 10}
+        assert {s.start.day for s in tuesday["p1"]} == {10, 11}
+        assert sources.call_count == 2
+        # Monday through Wednesday were recomputed (Thursday was still fresh), plus a day either side
+        assert sources.call_args.kwargs["start_time__gte"] == datetime(2026, 3, 8, 0, 0)
+        assert sources.call_args.kwargs["start_time__lte"] == datetime(2026, 3, 12, 23, 59, 59)
+
+    def test_days_dropped_during_computation_are_not_cached(self, sources, patch_cache):
+        def _book_during_read(*args, **kwargs):
+            invalidate_slot_days("p1", datetime(2026, 3, 9, 10, 0), datetime(2026, 3, 9, 10, 30))
+            return MagicMock(values_list=MagicMock(return_value=[]))
+
+        sources.side_effect = _book_during_read
+        result = get_precomputed_slots_for_providers([_make_rule()], MONDAY, MONDAY, now=NOW)
+
+        assert result["p1"]
+        assert slot_day_key("p1", MONDAY) not in patch_cache._store
+
+        sources.side_effect = None
+        get_precomputed_slots_for_providers([_make_rule()], MONDAY, MONDAY, now=NOW)
+        assert slot_day_key("p1", MONDAY) in patch_cache._store
+
+    def test_days_beyond_horizon_are_not_cached(self, sources, patch_cache):
+        rules = [_make_rule()]
+        far = NOW.date() + timedelta(days=PRECOMPUTE_DAYS + 5)
+        get_precomputed_slots_for_providers(rules, far, far, now=NOW)
+        assert slot_day_key("p1", far) not in patch_cache._store
+
+    def test_no_matching_rules(self, sources):
+        assert get_precomputed_slots_for_providers([_make_rule(is_active=False)], MONDAY, MONDAY, now=NOW) == {}
+        assert sources.call_count == 0
+
+
+# ── refresh_slot_cache ────────────────────────────────────────────────
+
+
+class TestRefreshSlotCache:
+    def test_recomputes_only_dirty_days(self, sources, patch_cache):
+        rules = [_make_rule(id="r1", provider_id="p1"), _make_rule(id="r2", provider_id="p2")]
+
+        assert refresh_slot_cache(rules, now=NOW) == 2 * PRECOMPUTE_DAYS
+        assert refresh_slot_cache(rules, now=NOW) == 0
+
+        save_block(AdminBlock(id="b1", provider_id="p2", start=datetime(2026, 3, 18, 9, 0), end=datetime(2026, 3, 18, 12, 0)))
+        assert refresh_slot_cache(rules, now=NOW) == 3
+        assert sources.call_count == 2
+
+    def test_no_active_rules(self, sources):
+        assert refresh_slot_cache([_make_rule(is_active=False)], now=NOW) == 0
+        assert sources.call_count == 0
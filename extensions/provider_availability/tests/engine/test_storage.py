@@ -14,12 +14,13 @@ from provider_availability.engine.models import (
 )
 from provider_availability.engine.storage import (
     CACHE_TTL_SECONDS,
-    INDEX_KEY,
-    BLOCK_INDEX_KEY,
-    RECURRING_BLOCK_INDEX_KEY,
+    INDEX_PREFIX,
+    LEGACY_INDEX_KEYS,
     EVENT_IDS_PREFIX,
     PRACTICE_TZ_KEY,
     INSTALL_SENTINEL_KEY,
+    SLOT_GEN_PREFIX,
+    SLOT_GLOBAL_GEN_KEY,
     save_rule,
     get_rule_by_id,
     get_rules_for_provider,
@@ -31,11 +32,13 @@ from provider_availability.engine.storage import (
     delete_event_ids,
     save_block,
     get_blocks_for_provider,
+    get_blocks_for_providers,
     get_block_by_id,
     get_all_blocks,
     delete_block,
     save_recurring_block,
     get_recurring_blocks_for_provider,
+    get_recurring_blocks_for_providers,
     get_all_recurring_blocks,
     get_recurring_block_by_id,
     delete_recurring_block,
@@ -50,11 +53,18 @@ from provider_availability.engine.storage import (
     set_provider_timezone,
     clear_provider_timezone,
     get_all_provider_timezones,
+    get_provider_timezones,
     is_first_install,
     mark_installed,
     should_refresh_ttls,
     mark_ttl_refresh_done,
     refresh_all_ttls,
+    slot_day_key,
+    get_slot_cache,
+    get_slot_day_generations,
+    save_slot_days,
+    invalidate_provider_slots,
+    invalidate_slot_days,
 )
 
 
@@ -109,6 +119,97 @@ class TestRuleCRUD:
         assert count == 0
 
 
+# ── Sharded index ─────────────────────────────────────────────────────
+
+
+class TestShardedIndex:
+    def test_index_per_provider(self, patch_cache):
+        save_rule(ProviderAvailabilityRule(id="r1", provider_id="p1"))
+        save_rule(ProviderAvailabilityRule(id="r2", provider_id="p1"))
+        save_rule(ProviderAvailabilityRule(id="r3", provider_id="p2"))
+
+        assert patch_cache._store[f"{INDEX_PREFIX}rules:p1"] == ["pa:rules:p1:r1", "pa:rules:p1:r2"]
+        assert patch_cache._store[f"{INDEX_PREFIX}rules:p2"] == ["pa:rules:p2:r3"]
+        assert patch_cache._store[f"{INDEX_PREFIX}rules"] == ["p1", "p2"]
+        assert LEGACY_INDEX_KEYS["rules"] not in patch_cache._store
+
+    def test_provider_lookup_reads_only_its_index(self, patch_cache):
+        save_rule(ProviderAvailabilityRule(id="r1", provider_id="p1"))
+        save_rule(ProviderAvailabilityRule(id="r2", provider_id="p2"))
+        patch_cache.get_many.reset_mock()
+
+        rules = get_rules_for_provider("p1")
+
+        assert [r.id for r in rules] == ["r1"]
+        requested = [key for c in patch_cache.get_many.mock_calls for key in c.args[0]]
+        assert f"{INDEX_PREFIX}rules:p2" not in requested
+        assert f"{INDEX_PREFIX}rules" not in requested
+
+    def test_resave_does_not_duplicate_or_rewrite_index(self, patch_cache, sample_rule):
+        save_rule(sample_rule)
+        patch_cache.set_many.reset_mock()
+
+        save_rule(sample_rule)
+
+        index_key = f"{INDEX_PREFIX}rules:{sample_rule.provider_id}"
+        assert patch_cache._store[index_key] == [sample_rule.cache_key]
+        assert patch_cache.set_many.mock_calls == [
+            call({sample_rule.cache_key: sample_rule.to_dict()}, timeout_seconds=CACHE_TTL_SECONDS),
+        ]
+
+    def test_record_and_index_written_together(self, patch_cache, sample_block):
+        save_block(sample_block)
+
+        written = patch_cache.set_many.mock_calls[0].args[0]
+        assert set(written) == {
+            sample_block.cache_key,
+            f"{INDEX_PREFIX}blocks:{sample_block.provider_id}",
+            f"{INDEX_PREFIX}blocks",
+        }
+
+    def test_save_re_adds_provider_missing_from_registry(self, patch_cache):
+        save_rule(ProviderAvailabilityRule(id="r1", provider_id="p1"))
+        save_rule(ProviderAvailabilityRule(id="r2", provider_id="p2"))
+        # registry expired (or lost a racing write) while the indexes survived
+        del patch_cache._store[f"{INDEX_PREFIX}rules"]
+
+        save_rule(ProviderAvailabilityRule(id="r1", provider_id="p1"))
+
+        assert patch_cache._store[f"{INDEX_PREFIX}rules"] == ["p1"]
+        assert [r.id for r in get_all_rules()] == ["r1"]
+
+    def test_last_delete_drops_index_and_registry_entry(self, patch_cache):
+        save_recurring_block(RecurringBlock(id="rb1", provider_id="p1"))
+        save_recurring_block(RecurringBlock(id="rb2", provider_id="p2"))
+
+        delete_recurring_block("p1", "rb1")
+
+        assert f"{INDEX_PREFIX}recurring_blocks:p1" not in patch_cache._store
+        assert patch_cache._store[f"{INDEX_PREFIX}recurring_blocks"] == ["p2"]
+        assert [b.id for b in get_all_recurring_blocks()] == ["rb2"]
+
+    def test_legacy_global_index_is_sharded_on_first_read(self, patch_cache):
+        rule_1 = ProviderAvailabilityRule(id="r1", provider_id="p1")
+        rule_2 = ProviderAvailabilityRule(id="r2", provider_id="p2")
+        patch_cache._store[rule_1.cache_key] = rule_1.to_dict()
+        patch_cache._store[rule_2.cache_key] = rule_2.to_dict()
+        patch_cache._store[LEGACY_INDEX_KEYS["rules"]] = [rule_1.cache_key, rule_2.cache_key]
+
+        assert [r.id for r in get_rules_for_provider("p2")] == ["r2"]
+
+        assert LEGACY_INDEX_KEYS["rules"] not in patch_cache._store
+        assert patch_cache._store[f"{INDEX_PREFIX}rules"] == ["p1", "p2"]
+        assert sorted(r.id for r in get_all_rules()) == ["r1", "r2"]
+
+    def test_legacy_index_merges_with_existing_shards(self, patch_cache):
+        save_block(AdminBlock(id="new", provider_id="p1", start=datetime(2026, 3, 10, 9), end=datetime(2026, 3, 10, 10)))
+        old = AdminBlock(id="old", provider_id="p1", start=datetime(2026, 3, 11, 9), end=datetime(2026, 3, 11, 10))
+        patch_cache._store[old.cache_key] = old.to_dict()
+        patch_cache._store[LEGACY_INDEX_KEYS["blocks"]] = [old.cache_key]
+
+        assert sorted(b.id for b in get_blocks_for_provider("p1")) == ["new", "old"]
+
+
 # ── Event ID mapping ──────────────────────────────────────────────────
 
 
@@ -151,6 +252,38 @@ class TestBlockCRUD:
         blocks = get_blocks_for_provider("nonexistent")
         assert blocks == []
 
+    def test_get_blocks_for_providers(self, patch_cache, sample_block):
+        other = AdminBlock(
+            id="block-uuid-002",
+            provider_id="other-provider",
+            start=datetime(2026, 3, 11, 9, 0),
+            end=datetime(2026, 3, 11, 10, 0),
+        )
+        unrelated = AdminBlock(
+            id="block-uuid-003",
+            provider_id="unrelated-provider",
+            start=datetime(2026, 3, 11, 9, 0),
+            end=datetime(2026, 3, 11, 10, 0),
+        )
+        for block in (sample_block, other, unrelated):
+            save_block(block)
+        patch_cache.get_many.reset_mock()
+        patch_cache.get.reset_mock()
+
+        result = get_blocks_for_providers([sample_block.provider_id, "other-provider", "empty-provider"])
+
+        assert [b.id for b in result[sample_block.provider_id]] == [sample_block.id]
+        assert [b.id for b in result["other-provider"]] == ["block-uuid-002"]
+        assert result["empty-provider"] == []
+        assert "unrelated-provider" not in result
+        # one read for the providers' indexes, one for their blocks
+        assert len(patch_cache.get_many.mock_calls) == 2
+        assert patch_cache.get.mock_calls == []
+
+    def test_get_blocks_for_providers_empty(self, patch_cache):
+        assert get_blocks_for_providers([]) == {}
+        assert get_blocks_for_providers(["p1"]) == {"p1": []}
+
     def test_get_all_blocks(self, patch_cache, sample_block):
         save_block(sample_block)
         all_blocks = get_all_blocks()
@@ -192,6 +325,12 @@ class TestRecurringBlockCRUD:
         blocks = get_recurring_blocks_for_provider("nonexistent")
         assert blocks == []
 
+    def test_get_for_providers(self, patch_cache, sample_recurring_block):
+        save_recurring_block(sample_recurring_block)
+        result = get_recurring_blocks_for_providers([sample_recurring_block.provider_id, "p2"])
+        assert [b.id for b in result[sample_recurring_block.provider_id]] == [sample_recurring_block.id]
+        assert result["p2"] == []
+
     def test_get_all(self, patch_cache, sample_recurring_block):
         save_recurring_block(sample_recurring_block)
         all_blocks = get_all_recurring_blocks()
@@ -275,6 +414,83 @@ class TestPracticeTimezone:
         assert get_practice_timezone() == "US/Eastern"
 
 
+# ── Precomputed slot cache ────────────────────────────────────────────
+
+
+class TestSlotCache:
+    def test_save_and_read_days(self, patch_cache):
+        entry = {"gen": [0, 0], "on": "2026-03-09", "rules": {"r1": "0"}}
+        save_slot_days({("p1", date(2026, 3, 9)): entry})
+
+        gens, entries = get_slot_cache(["p1", "p2"], {"p1": [date(2026, 3, 9), date(2026, 3, 10)]})
+
+        assert gens == {"p1": [0, 0], "p2": [0, 0]}
+        assert entries == {("p1", date(2026, 3, 9)): entry}
+        assert len(patch_cache.get_many.mock_calls) == 1
+
+    def test_generations(self, patch_cache):
+        invalidate_provider_slots("p1")
+        invalidate_provider_slots("p1")
+        set_practice_timezone("US/Eastern")
+
+        gens, _ = get_slot_cache(["p1", "p2"], {})
+        assert gens == {"p1": [1, 2], "p2": [1, 0]}
+
+    def test_rule_and_recurring_block_edits_bump_provider_generation(
+        self, patch_cache, sample_rule, sample_recurring_block,
+    ):
+        key = f"{SLOT_GEN_PREFIX}{sample_rule.provider_id}"
+        save_rule(sample_rule)
+        assert patch_cache._store[key] == 1
+        delete_rule_by_id(sample_rule.provider_id, sample_rule.id)
+        assert patch_cache._store[key] == 2
+        save_recurring_block(sample_recurring_block)
+        assert patch_cache._store[key] == 3
+        set_provider_timezone(sample_rule.provider_id, "US/Pacific")
+        assert patch_cache._store[key] == 4
+        assert SLOT_GLOBAL_GEN_KEY not in patch_cache._store
+
+    def test_delete_rules_for_provider_without_rules_keeps_generation(self, patch_cache):
+        delete_rules_for_provider("p1")
+        assert f"{SLOT_GEN_PREFIX}p1" not in patch_cache._store
+
+    def test_invalidate_slot_days_drops_span_plus_a_day(self, patch_cache):
+        days = [date(2026, 3, d) for d in range(7, 14)]
+        save_slot_days({("p1", day): {"rules": {}} for day in days})
+
+        invalidate_slot_days("p1", datetime(2026, 3, 10, 9, 0), datetime(2026, 3, 10, 10, 0))
+
+        remaining = [day for day in days if slot_day_key("p1", day) in patch_cache._store]
+        assert remaining == [date(2026, 3, 7), date(2026, 3, 8), date(2026, 3, 12), date(2026, 3, 13)]
+
+    def test_invalidate_slot_days_bumps_day_generation(self, patch_cache):
+        assert get_slot_day_generations(["p1", "p2"]) == {"p1": 0, "p2": 0}
+        invalidate_slot_days("p1", datetime(2026, 3, 10, 9, 0), datetime(2026, 3, 10, 10, 0))
+        assert get_slot_day_generations(["p1", "p2"]) == {"p1": 1, "p2": 0}
+        assert f"{SLOT_GEN_PREFIX}p1" not in patch_cache._store
+
+    def test_long_span_bumps_generation(self, patch_cache):
+        invalidate_slot_days("p1", datetime(2026, 3, 1), datetime(2026, 6, 1))
+        assert patch_cache._store[f"{SLOT_GEN_PREFIX}p1"] == 1
+        assert patch_cache.delete.mock_calls == []
+
+    def test_block_edits_drop_old_and_new_days(self, patch_cache, sample_block):
+        pid = sample_block.provider_id
+        save_block(sample_block)  # 2026-03-10
+        save_slot_days({(pid, date(2026, 3, d)): {"rules": {}} for d in range(8, 20)})
+
+        moved = AdminBlock.from_dict({**sample_block.to_dict(), "start": "2026-03-17T09:00:00", "end": "2026-03-17T12:00:00"})
+        save_block(moved)
+
+        cached = sorted(d for d in range(8, 20) if slot_day_key(pid, date(2026, 3, d)) in patch_cache._store)
+        assert cached == [8, 12, 13, 14, 15, 19]
+
+        save_slot_days({(pid, date(2026, 3, d)): {"rules": {}} for d in range(8, 20)})
+        delete_block(pid, moved.id)
+        cached = sorted(d for d in range(8, 20) if slot_day_key(pid, date(2026, 3, d)) in patch_cache._store)
+        assert cached == [8, 9, 10, 11, 12, 13, 14, 15, 19]
+
+
 # ── Install sentinel ──────────────────────────────────────────────────
 
 
@@ -328,14 +544,16 @@ class TestTTLRefresh:
     def test_refresh_cleans_stale_keys(self, patch_cache):
         """If a cached rule has expired (returns None), it should be removed from the index."""
         # Manually set up a stale index entry
-        patch_cache._store[INDEX_KEY] = ["pa:rules:p1:stale"]
+        patch_cache._store[f"{INDEX_PREFIX}rules"] = ["p1"]
+        patch_cache._store[f"{INDEX_PREFIX}rules:p1"] = ["pa:rules:p1:stale"]
         # Don't set the actual key — it's "expired"
 
         result = refresh_all_ttls()
         assert result == 0
         # Stale key should be removed from index
-        index = patch_cache._store.get(INDEX_KEY, [])
+        index = patch_cache._store.get(f"{INDEX_PREFIX}rules:p1", [])
         assert "pa:rules:p1:stale" not in index
+        assert f"{INDEX_PREFIX}rules" not in patch_cache._store
 
     def test_refresh_all_ttls_with_blocks(self, patch_cache, sample_block):
         """Refresh should also refresh block TTLs."""
@@ -360,19 +578,21 @@ class TestTTLRefresh:
 
     def test_refresh_all_ttls_cleans_stale_blocks(self, patch_cache):
         """Stale block keys should be cleaned from the block index."""
-        patch_cache._store[BLOCK_INDEX_KEY] = ["pa:blocks:p1:stale-block"]
+        patch_cache._store[f"{INDEX_PREFIX}blocks"] = ["p1"]
+        patch_cache._store[f"{INDEX_PREFIX}blocks:p1"] = ["pa:blocks:p1:stale-block"]
         result = refresh_all_ttls()
         assert result == 0
-        index = patch_cache._store.get(BLOCK_INDEX_KEY, [])
+        index = patch_cache._store.get(f"{INDEX_PREFIX}blocks:p1", [])
         assert "pa:blocks:p1:stale-block" not in index
 
     def test_refresh_all_ttls_cleans_stale_recurring_blocks(self, patch_cache):
         """Stale recurring block keys should be cleaned from the recurring block index."""
-        patch_cache._store[RECURRING_BLOCK_INDEX_KEY] = ["pa:recurring:p1:stale-rb"]
+        patch_cache._store[f"{INDEX_PREFIX}recurring_blocks"] = ["p1"]
+        patch_cache._store[f"{INDEX_PREFIX}recurring_blocks:p1"] = ["pa:recurring_blocks:p1:stale-rb"]
         result = refresh_all_ttls()
         assert result == 0
-        index = patch_cache._store.get(RECURRING_BLOCK_INDEX_KEY, [])
-        assert "pa:recurring:p1:stale-rb" not in index
+        index = patch_cache._store.get(f"{INDEX_PREFIX}recurring_blocks:p1", [])
+        assert "pa:recurring_blocks:p1:stale-rb" not in index
 
     def test_refresh_all_ttls_with_practice_timezone(self, patch_cache):
         """Refresh should also refresh practice timezone TTL."""
@@ -435,6 +655,21 @@ class TestProviderTimezone:
         result = get_all_provider_timezones()
         assert result == {"p1": "US/Pacific", "p2": "US/Eastern"}
 
+    def test_get_provider_timezones(self, patch_cache):
+        set_provider_timezone("p1", "US/Pacific")
+        result = get_provider_timezones(["p1", "p2"])
+        assert result == {"p1": "US/Pacific", "p2": None}
+
+    def test_get_provider_timezones_prefixed_keys(self, patch_cache):
+        """The plugin cache returns get_many keys with its own prefix."""
+        patch_cache.get_many.side_effect = lambda keys: {
+            f"provider_availability:{k}": "US/Central" for k in keys if k.endswith("p1")
+        }
+        assert get_provider_timezones(["p1", "p2"]) == {"p1": "US/Central", "p2": None}
+
+    def test_get_provider_timezones_empty(self, patch_cache):
+        assert get_provider_timezones([]) == {}
+
     def test_set_same_provider_twice_no_duplicate_index(self, patch_cache):
         set_provider_timezone("p1", "US/Pacific")
         set_provider_timezone("p1", "US/Eastern")
@@ -9,6 +9,7 @@ from provider_availability.engine.tz_utils import (
     practice_now,
     practice_tz,
     provider_tz,
+    provider_tzs,
     to_practice_naive,
     to_utc,
 )
@@ -37,6 +38,18 @@ class TestProviderTz:
             assert result == ZoneInfo("US/Eastern")
 
 
+class TestProviderTzs:
+    def test_resolves_each_provider_with_practice_fallback(self):
+        with patch(f"{TZ_MODULE}.get_provider_timezones", return_value={"p1": "US/Pacific", "p2": None}) as mock_tzs, \
+             patch(f"{TZ_MODULE}.get_practice_timezone", return_value="US/Eastern"):
+            result = provider_tzs(["p1", "p2"])
+            assert result == {"p1": ZoneInfo("US/Pacific"), "p2": ZoneInfo("US/Eastern")}
+            assert mock_tzs.mock_calls == [call(["p1", "p2"])]
+
+    def test_empty(self):
+        assert provider_tzs([]) == {}
+
+
 class TestPracticeNow:
     def test_returns_aware_datetime(self):
         with patch(f"{TZ_MODULE}.get_practice_timezone", return_value="US/Eastern"):
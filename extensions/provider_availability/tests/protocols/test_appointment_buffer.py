@@ -10,6 +10,7 @@ from provider_availability.protocols.appointment_buffer import (
     OnAppointmentCanceled,
     OnAppointmentCreated,
     OnAppointmentRescheduled,
+    _invalidate_appointment_slots,
     _reconcile_buffers,
 )
 
@@ -150,6 +151,57 @@ class TestReconcileBuffers:
             assert upper > lower
 
 
+class TestInvalidateAppointmentSlots:
+    def _appt(self, start, duration=30):
+        appt = MagicMock()
+        appt.start_time = start
+        appt.duration_minutes = duration
+        appt.appointment_rescheduled_from = None
+        return appt
+
+    def test_invalidates_appointment_span(self):
+        appt = self._appt(datetime(2026, 3, 10, 23, 45, tzinfo=UTC), duration=30)
+
+        with patch(f"{BUFFER_MODULE}.invalidate_slot_days") as mock_invalidate:
+            _invalidate_appointment_slots(appt, "p1", "created")
+
+        assert mock_invalidate.mock_calls == [
+            call("p1", datetime(2026, 3, 10, 23, 45, tzinfo=UTC), datetime(2026, 3, 11, 0, 15, tzinfo=UTC)),
+        ]
+
+    def test_reschedule_also_invalidates_previous_slot(self):
+        previous = self._appt(datetime(2026, 3, 10, 9, 0, tzinfo=UTC))
+        appt = self._appt(datetime(2026, 3, 20, 9, 0, tzinfo=UTC))
+        appt.appointment_rescheduled_from = previous
+
+        with patch(f"{BUFFER_MODULE}.invalidate_slot_days") as mock_invalidate:
+            _invalidate_appointment_slots(appt, "p1", "rescheduled")
+
+        assert [c.args[1] for c in mock_invalidate.mock_calls] == [
+            datetime(2026, 3, 20, 9, 0, tzinfo=UTC),
+            datetime(2026, 3, 10, 9, 0, tzinfo=UTC),
+        ]
+
+    def test_invalidates_before_rule_checks(self):
+        """Availability changes even for providers without buffers configured."""
+        mock_appt = self._appt(datetime(2026, 3, 10, 9, 0, tzinfo=UTC))
+        mock_appt.provider.id = "p1"
+
+        with patch(f"{BUFFER_MODULE}.Appointment.objects") as mock_objects, \
+             patch(f"{BUFFER_MODULE}.get_rules_for_provider", return_value=[]), \
+             patch(f"{BUFFER_MODULE}.invalidate_slot_days") as mock_invalidate:
+            mock_objects.get.return_value = mock_appt
+
+            assert _reconcile_buffers("appt-1", "canceled") == []
+            assert len(mock_invalidate.mock_calls) == 1
+
+    def test_cache_errors_do_not_block_buffers(self):
+        appt = self._appt(datetime(2026, 3, 10, 9, 0, tzinfo=UTC))
+
+        with patch(f"{BUFFER_MODULE}.invalidate_slot_days", side_effect=RuntimeError("cache down")):
+            _invalidate_appointment_slots(appt, "p1", "created")
+
+
 class TestProtocolHandlers:
     def test_on_appointment_created_delegates(self):
         mock_event = MagicMock()